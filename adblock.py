@@ -0,0 +1,350 @@
+import glob
+import hashlib
+import os
+import pickle
+import re
+import threading
+
+from PyQt5.QtWebEngineCore import (
+    QWebEngineUrlRequestInfo,
+    QWebEngineUrlRequestInterceptor,
+)
+
+# Bump when the compiled format changes so old caches are rebuilt
+CACHE_VERSION = 1
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+# Tokens in nearly every URL make useless index keys
+COMMON_TOKENS = {"http", "https", "www", "com", "net", "org", "html", "js"}
+
+RESOURCE_TYPES = {
+    "script": 1 << 0,
+    "image": 1 << 1,
+    "stylesheet": 1 << 2,
+    "object": 1 << 3,
+    "xmlhttprequest": 1 << 4,
+    "subdocument": 1 << 5,
+    "ping": 1 << 6,
+    "font": 1 << 7,
+    "media": 1 << 8,
+    "websocket": 1 << 9,
+    "other": 1 << 10,
+}
+ALL_TYPES = (1 << 11) - 1
+
+MAIN_FRAME = QWebEngineUrlRequestInfo.ResourceTypeMainFrame
+SUB_FRAME = QWebEngineUrlRequestInfo.ResourceTypeSubFrame
+
+QT_RESOURCE_TYPES = {
+    QWebEngineUrlRequestInfo.ResourceTypeSubFrame: RESOURCE_TYPES["subdocument"],
+    QWebEngineUrlRequestInfo.ResourceTypeStylesheet: RESOURCE_TYPES["stylesheet"],
+    QWebEngineUrlRequestInfo.ResourceTypeScript: RESOURCE_TYPES["script"],
+    QWebEngineUrlRequestInfo.ResourceTypeImage: RESOURCE_TYPES["image"],
+    QWebEngineUrlRequestInfo.ResourceTypeFontResource: RESOURCE_TYPES["font"],
+    QWebEngineUrlRequestInfo.ResourceTypeObject: RESOURCE_TYPES["object"],
+    QWebEngineUrlRequestInfo.ResourceTypeMedia: RESOURCE_TYPES["media"],
+    QWebEngineUrlRequestInfo.ResourceTypeXhr: RESOURCE_TYPES["xmlhttprequest"],
+    QWebEngineUrlRequestInfo.ResourceTypePing: RESOURCE_TYPES["ping"],
+    QWebEngineUrlRequestInfo.ResourceTypeFavicon: RESOURCE_TYPES["image"],
+}
+
+# Second level labels under which sites register their names (approximation
+# of the public suffix list, good enough for third-party checks)
+SECOND_LEVEL = {"co", "com", "net", "org", "gov", "edu", "ac", "ne", "or", "go"}
+
+ANY_PARTY = 0
+THIRD_PARTY = 1
+FIRST_PARTY = 2
+
+# Compiled rule patterns, filled the first time a rule is checked
+_regexes = {}
+
+
+def site_of(host):
+    labels = host.split(".")
+    if len(labels) > 2 and labels[-2] in SECOND_LEVEL and len(labels[-1]) == 2:
+        return ".".join(labels[-3:])
+    return ".".join(labels[-2:])
+
+
+def host_suffixes(host):
+    # a.b.example.com -> a.b.example.com, b.example.com, example.com, com
+    labels = host.split(".")
+    return [".".join(labels[i:]) for i in range(len(labels))]
+
+
+def pattern_to_regex(pattern):
+    regex = []
+    if pattern.startswith("||"):
+        regex.append(r"^[a-z][a-z0-9+.-]*://(?:[^/?#]*\.)?")
+        pattern = pattern[2:]
+    elif pattern.startswith("|"):
+        regex.append("^")
+        pattern = pattern[1:]
+    end_anchor = pattern.endswith("|")
+    if end_anchor:
+        pattern = pattern[:-1]
+    for char in pattern:
+        if char == "*":
+            regex.append(".*")
+        elif char == "^":
+            regex.append(r"(?:[^\w\-.%]|$)")
+        else:
+            regex.append(re.escape(char))
+    if end_anchor:
+        regex.append("$")
+    return "".join(regex)
+
+
+def pattern_tokens(pattern):
+    # Tokens that any URL matching the pattern must contain as a whole token:
+    # literal alphanumeric runs with a separator (not a wildcard) on each side
+    tokens = []
+    body = pattern.lstrip("|")
+    anchored = pattern.startswith("|")
+    for match in TOKEN_RE.finditer(body):
+        start, end = match.span()
+        before = body[start - 1] if start else ("|" if anchored else "*")
+        after = body[end] if end < len(body) else ("|" if pattern.endswith("|") else "*")
+        if before != "*" and after != "*":
+            tokens.append(match.group())
+    return tokens
+
+
+def parse_options(text):
+    # -> (type mask, party, include domains, exclude domains), or None when
+    # the rule relies on an option this blocker can't honour
+    types = 0
+    excluded_types = 0
+    party = ANY_PARTY
+    include = set()
+    exclude = set()
+    for option in text.split(","):
+        option = option.strip().lower()
+        negated = option.startswith("~")
+        name = option.lstrip("~")
+        if not name:
+            continue
+        if name in RESOURCE_TYPES:
+            if negated:
+                excluded_types |= RESOURCE_TYPES[name]
+            else:
+                types |= RESOURCE_TYPES[name]
+        elif name == "third-party":
+            party = FIRST_PARTY if negated else THIRD_PARTY
+        elif name.startswith("domain="):
+            for domain in name[len("domain=") :].split("|"):
+                if domain.startswith("~"):
+                    exclude.add(domain[1:])
+                elif domain:
+                    include.add(domain)
+        elif name in ("match-case", "important"):
+            continue
+        else:
+            return None
+    mask = (types or ALL_TYPES) & ~excluded_types
+    return mask, party, frozenset(include), frozenset(exclude)
+
+
+class RuleIndex:
+    # One side (blocking or exception) of a compiled filter list
+    def __init__(self):
+        # "||host^" without options: a plain set lookup per host suffix
+        self.hosts = set()
+        self.host_rules = {}
+        self.token_rules = {}
+        self.generic_rules = []
+        self.token_counts = {}
+
+    def add(self, pattern, options):
+        host_only = re.fullmatch(r"\|\|([a-z0-9.-]+)\^?", pattern)
+        if host_only:
+            if options == (ALL_TYPES, ANY_PARTY, frozenset(), frozenset()):
+                self.hosts.add(host_only.group(1))
+            else:
+                self.host_rules.setdefault(host_only.group(1), []).append(
+                    (None,) + options
+                )
+            return
+
+        rule = (pattern_to_regex(pattern),) + options
+        tokens = [t for t in pattern_tokens(pattern) if t not in COMMON_TOKENS]
+        if not tokens:
+            self.generic_rules.append(rule)
+            return
+        # Prefer the token shared with the fewest rules so far
+        token = min(tokens, key=lambda t: (self.token_counts.get(t, 0), -len(t)))
+        self.token_counts[token] = self.token_counts.get(token, 0) + 1
+        self.token_rules.setdefault(token, []).append(rule)
+
+    def rule_matches(self, rule, url, resource_type, third_party, page_suffixes):
+        regex, mask, party, include, exclude = rule
+        if not mask & resource_type:
+            return False
+        if party == THIRD_PARTY and not third_party:
+            return False
+        if party == FIRST_PARTY and third_party:
+            return False
+        if include and not include.intersection(page_suffixes):
+            return False
+        if exclude and exclude.intersection(page_suffixes):
+            return False
+        if regex is None:
+            return True
+        compiled = _regexes.get(regex)
+        if compiled is None:
+            compiled = _regexes[regex] = re.compile(regex)
+        return compiled.search(url) is not None
+
+    def match(self, url, tokens, suffixes, resource_type, third_party, page_suffixes):
+        for suffix in suffixes:
+            if suffix in self.hosts:
+                return True
+            for rule in self.host_rules.get(suffix, ()):
+                if self.rule_matches(rule, url, resource_type, third_party, page_suffixes):
+                    return True
+        for token in tokens:
+            for rule in self.token_rules.get(token, ()):
+                if self.rule_matches(rule, url, resource_type, third_party, page_suffixes):
+                    return True
+        for rule in self.generic_rules:
+            if self.rule_matches(rule, url, resource_type, third_party, page_suffixes):
+                return True
+        return False
+
+
+class FilterEngine:
+    # EasyList style network rules compiled into host sets and a token index,
+    # so a request only looks at rules sharing a host suffix or a token
+    def __init__(self):
+        self.block = RuleIndex()
+        self.allow = RuleIndex()
+        self.rule_count = 0
+
+    def add_rule(self, line):
+        line = line.strip()
+        # Comments, headers and element hiding rules
+        if not line or line.startswith(("!", "[")) or "##" in line or "#@#" in line:
+            return
+        if "#?#" in line or "#$#" in line:
+            return
+        index = self.block
+        if line.startswith("@@"):
+            index = self.allow
+            line = line[2:]
+        pattern, _, option_text = line.partition("$")
+        options = parse_options(option_text)
+        # Regex rules (/.../) are skipped, they can't be indexed
+        if options is None or (pattern.startswith("/") and pattern.endswith("/")):
+            return
+        index.add(pattern.lower(), options)
+        self.rule_count += 1
+
+    def add_file(self, path):
+        with open(path, encoding="utf-8", errors="replace") as rules:
+            for line in rules:
+                self.add_rule(line)
+
+    def match(self, url, host, page_host, resource_type):
+        url = url.lower()
+        host = host.lower()
+        page_host = page_host.lower()
+        suffixes = host_suffixes(host)
+        page_suffixes = host_suffixes(page_host) if page_host else []
+        third_party = bool(page_host) and site_of(host) != site_of(page_host)
+        tokens = set(TOKEN_RE.findall(url))
+        args = (url, tokens, suffixes, resource_type, third_party, page_suffixes)
+        return self.block.match(*args) and not self.allow.match(*args)
+
+
+def cache_key(paths):
+    digest = hashlib.sha1(str(CACHE_VERSION).encode())
+    for path in paths:
+        stat = os.stat(path)
+        digest.update(("%s %d %d" % (path, stat.st_size, stat.st_mtime_ns)).encode())
+    return digest.hexdigest()
+
+
+def load_filters(filter_dir, cache_path):
+    # Compiled engine for every *.txt list in filter_dir, from the on-disk
+    # cache when the lists haven't changed. None when there are no lists.
+    paths = sorted(glob.glob(os.path.join(filter_dir, "*.txt")))
+    if not paths:
+        return None
+    key = cache_key(paths)
+    try:
+        with open(cache_path, "rb") as cache:
+            cached = pickle.load(cache)
+        if cached["key"] == key:
+            return cached["engine"]
+    except (OSError, pickle.PickleError, EOFError, KeyError, AttributeError):
+        pass
+
+    engine = FilterEngine()
+    for path in paths:
+        engine.add_file(path)
+    temp_path = cache_path + ".tmp"
+    with open(temp_path, "wb") as cache:
+        pickle.dump({"key": key, "engine": engine}, cache, pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, cache_path)
+    return engine
+
+
+class ContentBlocker:
+    # Loads the filter lists on a background thread; until they are ready
+    # nothing is blocked
+    def __init__(self, filter_dir, cache_path):
+        self.engine = None
+        self.total_blocked = 0
+        os.makedirs(filter_dir, exist_ok=True)
+        self.thread = threading.Thread(
+            target=self.load, args=(filter_dir, cache_path), daemon=True
+        )
+        self.thread.start()
+
+    def load(self, filter_dir, cache_path):
+        self.engine = load_filters(filter_dir, cache_path)
+
+
+class TabRequestInterceptor(QWebEngineUrlRequestInterceptor):
+    # Installed per page so blocked requests can be counted per tab. Images
+    # that aren't blocked may be rewritten by images.rewrite (retro.py).
+    # Frame navigations that aren't GETs (form posts) are reported to
+    # downloads.form_posted, a download they lead to can't be fetched again.
+    def __init__(self, blocker, parent=None, images=None, downloads=None):
+        super().__init__(parent)
+        self.blocker = blocker
+        self.images = images
+        self.downloads = downloads
+        self.blocked = 0
+
+    def interceptRequest(self, info):
+        engine = self.blocker.engine
+        resource_type = info.resourceType()
+        if (
+            self.downloads is not None
+            and resource_type in (MAIN_FRAME, SUB_FRAME)
+            and bytes(info.requestMethod()) != b"GET"
+        ):
+            self.downloads.form_posted(info.requestUrl())
+        # Navigations the user asked for are never blocked
+        if resource_type == MAIN_FRAME:
+            return
+        url = info.requestUrl()
+        if engine is not None and engine.match(
+            url.toString(),
+            url.host(),
+            info.firstPartyUrl().host(),
+            QT_RESOURCE_TYPES.get(resource_type, RESOURCE_TYPES["other"]),
+        ):
+            info.block(True)
+            self.blocked += 1
+            self.blocker.total_blocked += 1
+            return
+        if (
+            self.images is not None
+            and resource_type == QWebEngineUrlRequestInfo.ResourceTypeImage
+        ):
+            rewritten = self.images.rewrite(url, info.firstPartyUrl().host())
+            if rewritten is not None:
+                info.redirect(rewritten)
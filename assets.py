@@ -0,0 +1,85 @@
+from PyQt5.QtCore import QFile, QIODevice, Qt
+from PyQt5.QtGui import QGuiApplication, QIcon, QImage, QPixmap
+
+# Registers the :/ resources compiled from assets.qrc. After changing a file
+# listed there, rebuild it with: pyrcc5 assets.qrc -o assets_rc.py
+import assets_rc  # noqa: F401
+
+
+class AssetCache:
+    # Images, fonts and stylesheets of the UI come from the compiled bundle,
+    # one read and one decode per asset. Pixmaps are scaled once per size
+    # and device pixel ratio and shared by every widget that shows them.
+    def __init__(self):
+        self.files = {}
+        self.images = {}
+        # (name, width, height, ratio) -> QPixmap / QIcon
+        self.pixmaps = {}
+        self.icons = {}
+        self.stats = {"reads": 0, "missing": 0, "decodes": 0, "scales": 0, "hits": 0}
+
+    def data(self, name):
+        # The bytes of a bundled file ("images/logo.png"), None if missing
+        if name in self.files:
+            return self.files[name]
+        resource = QFile(":/" + name)
+        if resource.open(QIODevice.ReadOnly):
+            self.files[name] = bytes(resource.readAll())
+            resource.close()
+            self.stats["reads"] += 1
+        else:
+            self.files[name] = None
+            self.stats["missing"] += 1
+        return self.files[name]
+
+    def text(self, name):
+        data = self.data(name)
+        return data.decode("utf-8") if data is not None else ""
+
+    def image(self, name):
+        image = self.images.get(name)
+        if image is None:
+            image = QImage()
+            data = self.data(name)
+            if data is not None:
+                image.loadFromData(data)
+                self.stats["decodes"] += 1
+            self.images[name] = image
+        return image
+
+    def pixmap(self, name, size, ratio=None):
+        # name scaled to fit size (in device independent pixels), sharp at
+        # the screen's pixel ratio
+        if ratio is None:
+            ratio = QGuiApplication.primaryScreen().devicePixelRatio()
+        key = (name, size.width(), size.height(), ratio)
+        pixmap = self.pixmaps.get(key)
+        if pixmap is not None:
+            self.stats["hits"] += 1
+            return pixmap
+        image = self.image(name)
+        if not image.isNull():
+            image = image.scaled(
+                size * ratio, Qt.KeepAspectRatio, Qt.SmoothTransformation
+            )
+            self.stats["scales"] += 1
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(ratio)
+        self.pixmaps[key] = pixmap
+        return pixmap
+
+    def icon(self, name, size, ratio=None):
+        if ratio is None:
+            ratio = QGuiApplication.primaryScreen().devicePixelRatio()
+        key = (name, size.width(), size.height(), ratio)
+        icon = self.icons.get(key)
+        if icon is None:
+            icon = QIcon(self.pixmap(name, size, ratio))
+            self.icons[key] = icon
+        else:
+            self.stats["hits"] += 1
+        return icon
+
+
+# Shared by every window and widget of the process
+cache = AssetCache()
@@ -0,0 +1,11636 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x04\x20\
+\x2f\
+\x2a\x20\x4d\x61\x69\x6e\x20\x77\x69\x6e\x64\x6f\x77\x20\x73\x74\
+\x79\x6c\x65\x2c\x20\x63\x6f\x6d\x70\x69\x6c\x65\x64\x20\x69\x6e\
+\x74\x6f\x20\x61\x73\x73\x65\x74\x73\x5f\x72\x63\x2e\x70\x79\x20\
+\x77\x69\x74\x68\x20\x74\x68\x65\x20\x6f\x74\x68\x65\x72\x20\x61\
+\x73\x73\x65\x74\x73\x20\x2a\x2f\x0a\x0a\x51\x57\x69\x64\x67\x65\
+\x74\x20\x7b\x0a\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x66\x61\x6d\
+\x69\x6c\x79\x3a\x20\x22\x50\x72\x65\x73\x73\x20\x53\x74\x61\x72\
+\x74\x20\x32\x50\x22\x2c\x20\x63\x75\x72\x73\x69\x76\x65\x3b\x0a\
+\x20\x20\x20\x20\x62\x61\x63\x6b\x67\x72\x6f\x75\x6e\x64\x2d\x63\
+\x6f\x6c\x6f\x72\x3a\x20\x23\x30\x30\x30\x3b\x20\x20\x2f\x2a\x20\
+\x42\x61\x63\x6b\x67\x72\x6f\x75\x6e\x64\x20\x63\x6f\x6c\x6f\x72\
+\x20\x62\x6c\x61\x63\x6b\x20\x2a\x2f\x0a\x20\x20\x20\x20\x63\x6f\
+\x6c\x6f\x72\x3a\x20\x23\x30\x66\x30\x3b\x20\x20\x2f\x2a\x20\x47\
+\x72\x65\x65\x6e\x20\x74\x65\x78\x74\x20\x2a\x2f\x0a\x7d\x0a\x0a\
+\x51\x50\x75\x73\x68\x42\x75\x74\x74\x6f\x6e\x20\x7b\x0a\x20\x20\
+\x20\x20\x62\x61\x63\x6b\x67\x72\x6f\x75\x6e\x64\x2d\x63\x6f\x6c\
+\x6f\x72\x3a\x20\x67\x72\x61\x79\x3b\x0a\x20\x20\x20\x20\x62\x6f\
+\x72\x64\x65\x72\x3a\x20\x32\x70\x78\x20\x73\x6f\x6c\x69\x64\x20\
+\x23\x30\x66\x30\x3b\x20\x20\x2f\x2a\x20\x47\x72\x65\x65\x6e\x20\
+\x62\x6f\x72\x64\x65\x72\x20\x2a\x2f\x0a\x20\x20\x20\x20\x63\x6f\
+\x6c\x6f\x72\x3a\x20\x23\x66\x66\x66\x3b\x20\x20\x2f\x2a\x20\x57\
+\x68\x69\x74\x65\x20\x74\x65\x78\x74\x20\x2a\x2f\x0a\x20\x20\x20\
+\x20\x62\x6f\x72\x64\x65\x72\x2d\x72\x61\x64\x69\x75\x73\x3a\x20\
+\x35\x70\x78\x3b\x0a\x20\x20\x20\x20\x70\x61\x64\x64\x69\x6e\x67\
+\x3a\x20\x30\x70\x78\x3b\x0a\x7d\x0a\x51\x50\x75\x73\x68\x42\x75\
+\x74\x74\x6f\x6e\x3a\x68\x6f\x76\x65\x72\x20\x7b\x0a\x20\x20\x20\
+\x20\x62\x61\x63\x6b\x67\x72\x6f\x75\x6e\x64\x2d\x63\x6f\x6c\x6f\
+\x72\x3a\x20\x23\x31\x31\x31\x3b\x0a\x7d\x0a\x0a\x51\x4c\x69\x6e\
+\x65\x45\x64\x69\x74\x20\x7b\x0a\x20\x20\x20\x20\x62\x61\x63\x6b\
+\x67\x72\x6f\x75\x6e\x64\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x31\
+\x31\x31\x3b\x20\x20\x2f\x2a\x20\x44\x61\x72\x6b\x65\x72\x20\x69\
+\x6e\x70\x75\x74\x20\x66\x69\x65\x6c\x64\x20\x62\x61\x63\x6b\x67\
+\x72\x6f\x75\x6e\x64\x20\x2a\x2f\x0a\x20\x20\x20\x20\x62\x6f\x72\
+\x64\x65\x72\x3a\x20\x32\x70\x78\x20\x73\x6f\x6c\x69\x64\x20\x23\
+\x30\x66\x30\x3b\x20\x20\x2f\x2a\x20\x47\x72\x65\x65\x6e\x20\x62\
+\x6f\x72\x64\x65\x72\x20\x2a\x2f\x0a\x20\x20\x20\x20\x63\x6f\x6c\
+\x6f\x72\x3a\x20\x23\x30\x66\x30\x3b\x20\x20\x2f\x2a\x20\x47\x72\
+\x65\x65\x6e\x20\x74\x65\x78\x74\x20\x2a\x2f\x0a\x20\x20\x20\x20\
+\x68\x65\x69\x67\x68\x74\x3a\x20\x33\x30\x70\x78\x3b\x20\x20\x2f\
+\x2a\x20\x46\x69\x78\x65\x64\x20\x68\x65\x69\x67\x68\x74\x20\x2a\
+\x2f\x0a\x7d\x0a\x0a\x51\x54\x61\x62\x57\x69\x64\x67\x65\x74\x3a\
+\x3a\x70\x61\x6e\x65\x20\x7b\x20\x62\x6f\x72\x64\x65\x72\x3a\x20\
+\x32\x70\x78\x20\x73\x6f\x6c\x69\x64\x20\x23\x30\x66\x30\x3b\x20\
+\x7d\x0a\x51\x54\x61\x62\x57\x69\x64\x67\x65\x74\x3a\x3a\x74\x61\
+\x62\x2d\x62\x61\x72\x20\x7b\x20\x6c\x65\x66\x74\x3a\x20\x31\x30\
+\x70\x78\x3b\x20\x7d\x0a\x0a\x51\x54\x61\x62\x42\x61\x72\x3a\x3a\
+\x74\x61\x62\x20\x7b\x0a\x20\x20\x20\x20\x62\x61\x63\x6b\x67\x72\
+\x6f\x75\x6e\x64\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x30\x30\x30\
+\x3b\x0a\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x30\x66\
+\x30\x3b\x0a\x20\x20\x20\x20\x70\x61\x64\x64\x69\x6e\x67\x3a\x20\
+\x31\x30\x70\x78\x3b\x0a\x20\x20\x20\x20\x6d\x61\x72\x67\x69\x6e\
+\x2d\x72\x69\x67\x68\x74\x3a\x20\x35\x70\x78\x3b\x20\x20\x2f\x2a\
+\x20\x53\x70\x61\x63\x65\x20\x62\x65\x74\x77\x65\x65\x6e\x20\x74\
+\x61\x62\x73\x20\x2a\x2f\x0a\x20\x20\x20\x20\x62\x6f\x72\x64\x65\
+\x72\x2d\x72\x69\x67\x68\x74\x3a\x20\x31\x70\x78\x20\x73\x6f\x6c\
+\x69\x64\x20\x23\x30\x66\x30\x3b\x20\x20\x2f\x2a\x20\x52\x69\x67\
+\x68\x74\x20\x62\x6f\x72\x64\x65\x72\x20\x66\x6f\x72\x20\x73\x65\
+\x70\x61\x72\x61\x74\x69\x6f\x6e\x20\x2a\x2f\x0a\x7d\x0a\x0a\x51\
+\x54\x61\x62\x42\x61\x72\x3a\x3a\x74\x61\x62\x3a\x73\x65\x6c\x65\
+\x63\x74\x65\x64\x20\x7b\x20\x62\x61\x63\x6b\x67\x72\x6f\x75\x6e\
+\x64\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x31\x31\x31\x3b\x20\x7d\
+\x0a\x51\x54\x61\x62\x42\x61\x72\x3a\x3a\x74\x61\x62\x3a\x6c\x61\
+\x73\x74\x20\x7b\x20\x62\x6f\x72\x64\x65\x72\x2d\x72\x69\x67\x68\
+\x74\x3a\x20\x6e\x6f\x6e\x65\x3b\x20\x7d\x20\x20\x2f\x2a\x20\x4e\
+\x6f\x20\x62\x6f\x72\x64\x65\x72\x20\x61\x66\x74\x65\x72\x20\x74\
+\x68\x65\x20\x6c\x61\x73\x74\x20\x74\x61\x62\x20\x2a\x2f\x0a\
+\x00\x00\x06\x5f\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x03\x00\x00\x00\xc3\xa6\x24\xc8\
+\x00\x00\x00\x03\x73\x42\x49\x54\x08\x08\x08\xdb\xe1\x4f\xe0\x00\
+\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0d\xd7\x00\x00\x0d\xd7\x01\
+\x42\x28\x9b\x78\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\
+\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\
+\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\x93\x50\x4c\x54\
+\x45\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x2b\x15\x2d\xdc\x00\x00\x00\x30\x74\x52\x4e\x53\
+\x00\x04\x06\x07\x08\x0c\x0e\x15\x1b\x1c\x1f\x20\x27\x2b\x30\x38\
+\x39\x40\x42\x44\x4b\x58\x61\x68\x6a\x6b\x6c\x70\x7b\x8b\x8e\x90\
+\x94\x98\xa1\xa5\xa6\xa8\xac\xb6\xc0\xc1\xc8\xc9\xcf\xd0\xd9\xf8\
+\x4d\x5e\x70\x18\x00\x00\x05\x02\x49\x44\x41\x54\x78\xda\xed\xdc\
+\x6f\x4b\x93\x51\x1c\xc7\x61\x9d\x53\xd8\x4c\x4d\x61\x46\xd6\x90\
+\x04\x9f\x94\x52\xef\xff\x5d\x84\x11\x49\x90\x94\x66\x9a\xd5\xb0\
+\xf2\xdf\xa6\x33\x84\xea\xe9\x37\x76\xa6\x74\x6f\xd7\xf5\x02\x7e\
+\xe7\x3e\xe7\xfe\x6c\xc7\x27\xae\x36\x31\x86\x66\x5f\xf0\x47\x6d\
+\x82\xb1\x26\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\
+\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\
+\x00\x10\x00\x02\x40\x00\xd5\xf5\xed\xd3\x68\xf8\x21\x80\xc1\xfc\
+\x38\x1c\x0d\x3f\x05\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\
+\x00\x04\x80\x00\x10\x00\x02\x10\x00\x02\x40\x00\x08\x00\x01\x20\
+\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\
+\x00\x10\x00\x02\x40\x00\x08\xe0\xb7\xe9\x85\x62\x4d\x2f\x62\x20\
+\x73\xe9\x60\x27\xba\xc9\x10\x02\x68\x3e\x29\xd6\xf2\x2e\x07\xd2\
+\x4e\x07\xdb\x7c\x9d\xb8\x02\x5c\x01\x08\x00\x01\x20\x00\x04\x80\
+\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\xa3\x10\xc0\xe3\xcd\xa0\
+\xf5\x2e\xe9\x3b\xe7\x41\xdc\x4b\x27\xbf\xf9\x39\x9d\xfc\xc1\x10\
+\x02\x98\x9e\x0a\x66\xbe\x27\xd7\x5e\xe6\x40\x1f\xce\x74\xf2\x53\
+\xbd\x74\xf2\x67\xae\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\
+\x01\x20\x00\x04\x80\x00\x10\x80\x00\x10\x00\x02\x40\x00\x08\x00\
+\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\
+\x04\x80\x00\x10\x00\x02\x40\x00\xdc\xae\x6e\x27\x69\x3e\x0a\x96\
+\x04\x50\x61\xe7\xef\x93\xc5\x56\xb0\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x60\x44\x02\xa8\x27\
+\xd7\x51\x1c\xd1\x4f\x13\xfa\x23\x78\xb2\x53\xf5\x52\x77\xf2\xe1\
+\xac\x6d\x24\x67\x2f\x83\xfd\x38\x62\x37\x8d\xd8\x1d\xc1\x00\x36\
+\x8a\x3d\x73\x05\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\
+\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\
+\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x0c\xee\xfe\x7a\xb2\xff\x31\x38\
+\x2b\x7f\x8a\xc3\xb8\x46\x7c\x4c\x01\x0c\x66\x7a\x36\xe9\x1c\x05\
+\xe7\xe5\x4f\xf1\x35\xad\x71\x1d\x1f\x53\x00\xae\x00\x04\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\xa0\xba\x9a\
+\x8b\xc1\xe4\x79\xd2\x4f\x6b\xf4\xd2\x84\x93\xf4\x10\x8b\x33\x02\
+\xb8\x25\xad\xd5\x60\xe1\x4d\x12\x03\xd8\x4f\x13\xbe\xa4\x87\x58\
+\x6d\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\
+\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\
+\x04\x80\x00\x10\x00\x02\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\
+\x04\x80\x00\x10\x00\x02\x18\x51\xa7\x6f\x8b\x7d\x10\x40\x85\x5d\
+\x9f\x14\xbb\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\
+\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\
+\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x02\x70\x04\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x63\x12\xc0\xab\xa4\xf1\x3c\x58\x89\x23\xda\x69\x44\x7b\x1c\x8f\
+\x3e\x9f\x4a\x3c\xd8\x95\x34\xa2\x11\x47\xd4\x2e\x93\xc9\x28\x8e\
+\xa8\xa5\x09\x63\xf9\x3d\x94\x4f\xe5\x4e\xde\x8d\x2f\x41\x7f\x03\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\
+\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\
+\x00\xff\x6a\x6e\x35\xa8\xe0\x2f\x48\xb4\xd3\x9e\xe6\x04\xf0\x57\
+\x7d\x31\x58\xaa\x5e\x00\x4b\x69\x4f\x75\x01\x20\x00\x04\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x0c\x2f\x80\xde\
+\x55\xd0\x9d\x4f\x2e\xae\x4a\x5d\xce\x57\xce\x65\xf1\xa6\x2f\xe2\
+\x1a\xdd\x34\xa2\x37\x84\x00\xf6\xb6\x82\xa3\xb5\xe4\x60\xab\xd4\
+\xf6\x5a\xe5\x6c\x17\x6f\xfa\x20\xae\x71\x94\x46\xec\xb9\x02\x10\
+\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\
+\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\
+\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\
+\x01\x20\x80\x1b\xa7\x3b\xc9\xf2\xd3\x52\xeb\x3b\x95\xb3\x5e\xbc\
+\xe9\xe5\xb8\xc6\xe9\x7f\x11\x40\xef\x38\x69\xcc\x14\x3b\xae\x9c\
+\xf2\x3d\x37\xe2\x1a\x3d\x57\x00\x02\x40\x00\x08\x00\x01\x20\x00\
+\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x20\x00\x04\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x80\xe1\xe9\x94\xff\xb7\xfd\
+\x83\xca\x29\xdf\x73\x67\x64\x02\xd8\x2b\xfe\xb9\x8d\xbd\x87\x95\
+\x33\x84\x4d\xbb\x02\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\
+\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\
+\x00\x08\x00\x01\x20\x00\x04\xc0\x8d\x5f\xc9\x1d\x79\xff\x74\xc4\
+\x1c\xd4\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x02\x35\x1e\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x01\xc3\x00\x00\x01\xc3\x08\x06\x00\x00\x00\x58\x86\x71\xde\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x20\
+\x00\x49\x44\x41\x54\x78\x5e\xec\x5d\x07\x98\x54\xd5\xd9\xfe\xa6\
+\xec\x2e\xbb\x0b\x02\x36\x34\x89\x49\x8c\x3d\xc6\x18\x6b\x62\x7e\
+\x4b\x62\xec\x11\x2b\x8a\xbd\x52\xec\xa8\xb1\x60\xef\x02\xb6\x48\
+\x50\x62\xef\x35\x36\xa2\xd1\x18\x91\x26\x02\xa2\x80\x01\x01\x51\
+\x8a\x4a\xef\x6c\x6f\x53\xee\x9f\xf7\x9c\x79\x67\xbf\xbd\x4c\xdb\
+\x9d\xd9\xdd\xd9\xe5\xde\xe7\xd9\x67\x77\x67\xee\x3d\xf7\x9c\xef\
+\x9c\xf3\xbd\x5f\x3f\x3e\xf1\x2e\x8f\x02\x1e\x05\x32\xa6\xc0\xec\
+\xd9\xb3\x0b\x1d\xc7\xe9\xd5\xd0\xd0\xb0\x75\x4d\x4d\xcd\x56\x6b\
+\xd6\xac\xd9\x62\xdd\xba\xb2\x2d\x96\x2d\x5b\xb2\x79\x75\x75\x4d\
+\x8f\x8a\x8a\xf2\xee\x55\x55\xd5\x9b\x55\x56\x56\x76\x2b\x2f\x2f\
+\xeb\x5a\x5d\x5d\x53\x1a\x0a\x85\x4a\x7e\x58\xbc\xb8\x4b\x34\x1a\
+\xc5\x4f\x61\x38\x1c\x2e\x88\x44\x22\xc1\x68\x34\x1a\x70\x1c\xc7\
+\x87\x1f\x11\x71\x62\x3f\x11\x11\x09\x8b\x48\x48\x44\x1a\x44\xa4\
+\xce\xe7\xf3\xd5\x05\x83\xc1\x9a\x60\x41\xb0\xba\xb0\xb0\x4b\x55\
+\x69\x49\x97\xca\xd2\xae\xdd\x2a\x7a\xf6\xec\x51\xde\xbd\xdb\x66\
+\x65\xc5\xc5\xc5\xeb\xbb\x94\x16\xaf\xeb\x5a\xdc\x6d\x5d\x8f\x1e\
+\x5d\xd7\xf4\xec\xd9\x73\xf5\xce\x3b\xef\xbc\xea\xd4\x53\x4f\xc5\
+\xf3\xde\xe5\x51\xc0\xa3\x40\x06\x14\xc0\x26\xf4\x2e\x8f\x02\x1e\
+\x05\x62\x14\x98\x37\x73\xde\xf6\x2b\xd7\xac\xfd\xf9\x9a\xb5\xab\
+\x7f\xbe\x7a\xcd\x9a\x9f\x2e\x5b\xb1\xfc\x27\x1b\x36\xac\xff\x49\
+\x59\x79\xf9\x8f\x57\xac\x58\xb1\xed\xa2\x45\x8b\xb6\x5c\xbd\x7a\
+\xb5\x34\x34\x58\x9c\x71\x1c\x47\x9c\x68\x54\x0a\x0a\x0b\x25\x14\
+\xfb\x0c\x9f\xfb\x03\x81\xf8\xf7\x3e\x9f\x4f\x0a\x0b\x0b\xcd\xbd\
+\xd1\x68\x34\xfe\x83\xff\x05\x3f\x22\x12\x2c\x28\x68\x32\x07\xe6\
+\x3b\x75\xa1\x0d\x3e\x8f\xf7\x35\xf9\xce\xef\x37\x7d\xd8\xe8\xf2\
+\xf9\xd6\xfa\x7c\xbe\x15\x4e\x34\xb4\xec\x27\x3f\xd9\x6e\x69\xd7\
+\xae\x5d\x97\xf6\xea\xb5\xcd\xe2\x5e\xbd\xb6\xf9\x7e\xeb\xad\x7f\
+\xf4\xfd\x23\x8f\x3c\xf0\x9d\x37\xf1\x1e\x05\x3c\x0a\x58\x0a\x78\
+\x60\xe8\xad\x84\x4d\x8e\x02\x0b\x16\x2c\xdb\x6e\xe5\xd2\x25\xbb\
+\x2e\x5d\xb9\x74\x97\xa5\x8b\x97\xec\xbc\x72\xd5\xaa\x1d\x57\xae\
+\x5c\xb9\xe3\xf2\xe5\xcb\x77\xf8\xee\xbb\xef\xfc\x1a\xec\x00\x5e\
+\x91\x28\x94\x35\x7b\x01\xe4\x00\x4c\xbc\x02\x81\x80\xf8\xfd\x7e\
+\xc1\xef\xfa\xfa\x7a\x09\x87\xc3\xf1\xff\x09\x96\xb8\x5f\x03\xa5\
+\xdd\x79\x3e\x73\x1f\xbe\xc3\x0f\xde\xa3\x01\x30\xfe\x37\x41\x31\
+\x76\x1f\x9e\x61\xbb\xf1\x3e\xc5\x3e\x43\x1f\x70\x45\x22\x11\xd3\
+\x26\xfe\x67\xdb\xf5\x75\x35\xe6\x7d\xb8\xf0\xae\xd8\x15\xf5\xf9\
+\xfc\x0b\x0b\x0a\x02\x0b\xb6\xdc\x72\xab\x05\x9b\x6d\xd6\xfd\xdb\
+\x1f\xff\x78\x9b\x6f\xb6\xda\xea\xa7\xf3\x5e\x7b\xed\xd9\x25\x9b\
+\xdc\xc2\xf0\x06\xbc\x49\x53\xc0\x03\xc3\x4d\x7a\xfa\x3b\xf7\xe0\
+\x1d\xc7\xe9\x31\x6f\xde\x82\x3d\xe7\xcd\x9b\xbb\xc7\xcc\x99\xb3\
+\xf7\x58\xb7\x66\xed\xaf\x96\x2c\x5d\xf2\xcb\xa5\x4b\x97\xf6\x58\
+\xb1\x62\x85\xac\x5d\xbb\x56\xea\x1b\xea\xc5\x27\x3e\x71\x8c\x95\
+\x12\xd2\xa1\x05\x27\x00\x47\x13\xb0\x8a\x7d\x6f\x34\xc1\x98\x86\
+\xc7\xbf\xf3\x81\x8a\x1a\xa0\x13\xf5\xa7\x20\x10\x4c\xd9\xcd\x50\
+\x28\x64\x68\x80\xf1\x1b\xb0\x15\xa7\xcc\x27\xbe\xb9\x5d\xbb\x75\
+\x9b\xdd\xbd\x5b\xf7\xaf\xb6\xfd\xf1\x36\x5f\x95\x96\xf6\x9a\x39\
+\x7e\xfc\xa8\xb2\x7c\x18\xaf\xd7\x07\x8f\x02\xb9\xa6\x80\x07\x86\
+\xb9\xa6\xa8\xd7\x5e\xbb\x50\xc0\x71\x9c\xee\xcb\x96\xad\xda\x77\
+\xc6\x8c\x69\xfb\x7e\xfe\xf9\xd4\xbd\x17\x2c\x58\xb8\xd7\xca\x95\
+\x2b\x77\x5a\xb2\x64\x89\x2c\x5b\xb6\x4c\xa0\xdc\x91\xe1\xeb\x0e\
+\x82\xf9\x17\x14\x14\x98\xef\x78\x51\x5b\xb3\x0a\x5c\x0c\x1c\x62\
+\x3b\x85\x1a\x5b\x1c\x08\x95\xe6\xd6\x2e\x03\x8f\xbd\x34\x1d\x18\
+\x06\x7c\x56\x2b\x4c\x76\x85\x23\x61\x03\x84\xc1\x60\xd0\x08\x01\
+\xd0\x2e\xf1\x59\xc0\x1f\x90\xa2\xa2\x22\xa3\x4d\x36\x84\xea\xf0\
+\x7b\xbe\x88\x7c\x59\x5a\x5a\x3a\xa3\x57\xaf\x6d\xa7\xfd\xe2\x17\
+\x3f\x9d\xf6\xf1\xc7\x1f\x97\xb7\xe7\xd8\xbd\x77\x7b\x14\xc8\x05\
+\x05\x3c\x30\xcc\x05\x15\xbd\x36\xda\x9c\x02\xf5\xf5\xce\x2f\xe7\
+\xcc\x99\x7d\xc0\xd4\xcf\x3e\xfb\xdd\xbc\x6f\xe6\xfd\xf6\x8b\xcf\
+\xbf\xd8\x63\xc3\x86\x0d\xb2\x7c\xf9\x72\x29\xaf\xb0\xbc\x99\x40\
+\x07\xe0\x0a\x85\x2d\xd8\x91\xe1\xd3\x7c\x48\xc0\x03\xf3\xe7\xe5\
+\xf6\xd7\xe1\x73\x13\xe2\xc2\xdd\xe2\xf2\xe7\xd9\x86\xd3\x6c\xa5\
+\xa6\x2e\xc0\x9c\xd3\x2b\x1d\x18\xfa\xcc\x00\x92\x5f\x51\x27\x6a\
+\x68\x03\xd3\x2a\x7e\x00\x7e\xa4\x19\xf4\xc4\x60\x20\x18\x37\xe9\
+\xa2\x15\x6d\xd6\x75\x44\xbe\x2a\x2d\x29\x9e\xda\x6d\xb3\xee\x9f\
+\xf5\xec\xb9\xf9\x94\x39\x73\xbe\x9c\x9b\xf3\x01\x7a\x0d\x7a\x14\
+\x68\x65\x0a\x78\x60\xd8\xca\x04\xf6\x9a\xcf\x0d\x05\xca\xca\xaa\
+\xf7\x99\x3b\x77\xee\x41\x93\x26\x7d\x7a\xd0\xb4\x2f\xa6\xfd\xdf\
+\xa2\x45\x8b\x7a\xad\x5a\xb5\x4a\xd6\xad\x5b\x27\xd5\x35\xd5\x1b\
+\xbd\x04\x1a\x8d\x31\x67\x3a\xd6\x3f\x06\x66\x6e\x82\x57\x62\xff\
+\xbb\x1f\xf0\xfb\xfc\x4d\x7d\x76\x31\xb3\x68\x93\xfb\x52\xed\x96\
+\x76\x06\xc3\x74\x54\x4e\x07\x86\x46\x1b\x54\xbe\x51\x9a\x4b\x29\
+\x2c\x44\x1d\x2b\x2c\x80\x4e\x71\x6d\x59\x09\x05\x2e\xba\xae\x0a\
+\x06\x02\x93\x4a\x4a\x4b\x27\x96\x96\x76\x9d\xb8\x62\xc5\xe2\xe9\
+\xe9\xfa\xe7\x7d\xef\x51\xa0\xbd\x29\xe0\x81\x61\x7b\xcf\x80\xf7\
+\xfe\x84\x14\xa8\xaf\xaf\xdf\x75\xde\xbc\x79\x87\x7e\xfa\xe9\xa7\
+\x7f\x9c\x3d\x7b\xf6\x1f\x26\x7d\x3a\x75\xcb\xf5\xeb\xd7\x0b\x00\
+\xb0\x51\x63\x69\x7c\xb4\xb4\xa4\xd4\x98\xf6\x70\x51\xb3\x41\xc4\
+\x27\x00\x10\x8c\x3e\x1a\xb5\xaa\x19\x7d\x83\x60\xea\xd4\x82\xf0\
+\x7d\x4d\x6d\x4d\xe6\x33\x91\x0e\xf8\x32\x6f\xa9\xcd\xee\xf4\x39\
+\xa9\xcd\xa4\xa0\x05\xe8\x47\xfa\x18\x3a\xfa\x6d\x00\x8e\xe3\x44\
+\x24\x10\x00\x0d\xa3\x1b\xdd\x03\x21\x03\x66\x66\x13\x24\x14\x0a\
+\x35\xd1\xc0\x1b\xe9\x1d\x5d\xeb\xf3\xf9\xc7\x3b\x4e\x78\xdc\x16\
+\x5b\x6c\x31\x76\xdd\xba\x75\xf3\xda\x6c\xe0\xde\x8b\x3c\x0a\x64\
+\x48\x01\x0f\x0c\x33\x24\x94\x77\x5b\xeb\x52\xc0\x71\x9c\x92\x1f\
+\x7e\xf8\xe1\xc8\xb9\x73\xe7\x1e\x3e\x69\xd2\xa4\xc3\x27\x4c\x98\
+\xb0\xe3\xec\xd9\xb3\xa5\xb2\xb2\xd2\xf8\xb1\xea\xeb\x23\x46\x2b\
+\xc1\xdf\x60\xbe\x16\xe0\xa2\x26\x7a\x13\x3f\x64\xe6\x5a\xbb\x61\
+\x8f\xc1\xd4\x23\x89\x52\x0f\x52\x0c\x49\x6b\x46\xe2\xb7\x69\x0d\
+\x4d\xb5\x44\xd7\xd6\x49\x64\x3a\x6d\x5d\x92\x35\xab\x75\xbf\xd8\
+\x48\xd3\x64\x17\xc6\xa7\xa3\x4d\x19\x44\x64\xb5\x69\xa4\x3d\x5a\
+\x68\x03\xf8\xe1\x3e\x9d\x26\xc2\xc0\x1b\x46\xaf\x9a\x3b\x63\xf4\
+\x30\x81\x48\x01\x31\x73\x14\x89\x58\x53\xb5\xe3\x38\x0b\x44\x64\
+\x34\x7e\x7e\xf4\xa3\x1f\xfd\x67\xf9\xf2\xe5\xcd\x90\x44\x9a\x35\
+\x6c\xef\x66\x8f\x02\x19\x53\xc0\x03\xc3\x8c\x49\xe5\xdd\x98\x6b\
+\x0a\x94\x97\x97\x03\xf0\x8e\xf9\xfa\xeb\xaf\x8f\x9e\x36\x6d\xda\
+\x51\xb3\x66\xcd\x92\x19\x33\x66\x48\x5d\x5d\x9d\x79\x15\x73\xf3\
+\xa0\x71\x14\x77\xe9\x66\x3e\xa3\x76\xa2\xb5\x18\x1d\xf8\x81\x7b\
+\xcc\x77\x0a\x9c\xac\xb9\xd4\x31\x9a\x0e\x18\xb6\x66\xd4\x04\x54\
+\x1d\x49\xe9\x1e\x67\x1a\x77\x5b\xae\xc9\xd2\x2a\xed\xa5\xd3\x0c\
+\x31\x7e\x6a\x82\xf4\x07\x52\xe0\x70\x84\xfe\x54\x57\xee\xa3\xd8\
+\xfc\x49\x08\x28\x30\x55\x6b\xfa\x36\xd5\xde\xa3\xd2\xa5\x4b\x17\
+\x69\x68\xa8\x33\xb4\xc7\xfd\xb8\x54\xd0\xd2\x87\x22\xf2\xef\xa2\
+\xa2\xa2\x0f\xea\xeb\xeb\x01\x94\xde\xe5\x51\xa0\xcd\x29\xe0\x81\
+\x61\x9b\x93\x7c\xd3\x7e\x61\x75\x75\xf5\x3e\xb3\x66\xcd\xea\x3d\
+\x79\xf2\x64\xfc\xec\xfd\xdf\xff\xfe\x57\xbe\xff\xfe\xfb\xb8\xa6\
+\x01\x06\x8c\xe8\x45\x80\x16\xb5\x3e\x14\x68\x71\xa2\x36\xe5\xc1\
+\xed\xaf\xe2\xff\x8c\x86\xd4\xbe\x2f\x30\x67\x03\x8e\xc6\x17\xe6\
+\x33\x9a\xa5\x89\x02\x8d\xf9\x03\xf1\x3f\x23\x27\xdd\x01\x28\x6e\
+\x4d\x70\x23\x40\x4c\xa7\x29\xb6\xf5\x34\xa7\xd5\x4c\x53\x9b\x49\
+\xd1\x5d\xd0\xc3\x08\x1c\x31\xbf\x2a\x03\x6a\x60\x26\xb5\xe6\xe6\
+\xc6\xdc\xc8\x78\xf1\x80\xd8\xbd\x5d\x8a\xba\xd8\xf9\x8a\x58\x2d\
+\x92\xb4\x25\x19\xc2\x91\x86\xb8\x59\x1a\xf7\x31\xd7\x11\xc0\x88\
+\xb9\x06\xa8\xd6\xd6\xd6\x4a\x24\x12\x9e\xe1\xf3\xf9\xdf\x0b\x04\
+\x7c\xef\x85\x42\x21\xcf\xd7\xd8\xd6\xeb\x68\x13\x7e\x9f\x07\x86\
+\x9b\xf0\xe4\xb7\xd5\xd0\x1b\x1a\x1a\xf6\x1f\x37\x6e\xc2\x89\x33\
+\x67\xce\x3c\x61\xdc\xb8\x71\xbb\x7e\xf9\xe5\x97\x82\xc4\x76\x95\
+\xfc\xdd\x24\x91\x3d\x61\xbf\x8c\xcf\xab\x7d\x97\x2b\x00\xd1\x87\
+\xa2\x31\xcd\xfc\xdd\x56\x74\xce\xef\xf7\xa4\x0f\xa7\x75\x0b\x3b\
+\x8e\xe3\xcc\xf3\xf9\x7d\xa3\x02\x51\xe7\x9d\x90\x84\x3e\xcf\xef\
+\xf1\x79\xbd\xeb\xe8\x14\x68\x5f\xee\xd2\xd1\xa9\xe7\xf5\x3f\x29\
+\x05\xea\xeb\xeb\x7f\x3d\x73\xe6\x57\x7d\xde\x7f\xff\x83\x3e\x9f\
+\x7d\x36\x65\x37\x98\x40\xab\xab\xab\xa5\xaa\xaa\x2a\x1e\xd4\x02\
+\xad\x00\x1a\x98\xdb\xac\x99\x18\x0c\x53\xfb\xbc\xbc\xa9\xe8\xf8\
+\x14\xd0\x60\x48\x41\xc9\x7e\x66\xb4\xfb\xaf\x45\xa2\x6f\x16\x16\
+\x16\xbf\xd9\xd0\x50\x3d\xab\xe3\x8f\xd6\x1b\x41\xbe\x51\xc0\x03\
+\xc3\x7c\x9b\x91\x0e\xdc\x9f\x9a\x9a\x9a\x1f\xcf\x9d\x3b\xef\xb4\
+\xcf\x3e\x9b\x7a\xea\x84\x09\xe3\xf7\x9f\x36\x6d\x9a\xd1\x00\xc1\
+\xd0\x00\x82\xb8\xf0\x37\x40\x90\xb5\x36\x01\x84\x60\x7c\xe9\xf2\
+\xe4\xc4\xf1\xc0\xb0\x03\x2f\x8d\x8c\xba\x4e\x30\xd4\x95\x7d\x08\
+\x86\xc5\xc5\xc5\x12\x89\x86\x4c\x4d\xd8\x48\x24\xfa\xb9\x88\xf3\
+\x0f\x91\xa2\xd7\x44\x6a\x97\x65\xd4\xb8\x77\x93\x47\x81\x34\x14\
+\xf0\xc0\xd0\x5b\x22\x59\x53\x60\xfd\xfa\xf2\xd3\x3e\xf9\x64\xfc\
+\xe9\xe3\xc6\x8d\x3f\x6e\xf4\xe8\xd1\xb2\x68\xd1\xa2\x26\x15\x5d\
+\xe0\x97\x2b\x29\x29\x89\x07\xbf\x20\x70\x02\x7e\x23\x30\x3d\x1d\
+\xb5\x98\xb2\x23\x79\x60\x26\xcd\x9a\x50\x5e\x03\x29\x29\xa0\x05\
+\x22\xfa\x76\x6d\x79\x3c\xf8\x31\x63\xbe\xc8\x98\x4f\x19\xf7\x5a\
+\xdf\xa3\xf3\xae\xdf\xef\x7f\xb5\xa1\xa1\xf6\x35\x8f\xbc\x1e\x05\
+\xb2\xa1\x80\x07\x86\xd9\x50\x6f\x13\x7e\xb6\xa1\xa1\x61\xaf\xaf\
+\xbe\x9a\x73\xf6\xfb\xef\xbf\x7f\xf6\x84\x09\x13\xb6\x9c\x32\x65\
+\x8a\xd4\xd4\xd8\x08\x79\xe6\x9d\x81\x59\x41\x0b\x2c\x2d\x2d\x15\
+\x54\x87\xc9\xee\x4a\x1f\x00\x92\x5d\xfb\xde\xd3\xed\x4d\x01\xd6\
+\x85\x45\x3f\x74\x10\x0f\x80\xaf\xa4\xb4\x4b\x2c\xc0\x26\x96\xfc\
+\x1f\x2b\x8e\xce\x74\x90\xfa\xfa\xfa\xb5\x22\xf2\xa2\x48\xf4\x45\
+\x94\x8b\x6b\xef\xb1\x78\xef\xef\x78\x14\xf0\xc0\xb0\xe3\xcd\x59\
+\xbb\xf6\x78\xe9\xd2\xa5\xe7\x4d\x99\x32\xf5\xbc\x0f\x3e\xf8\xe0\
+\x90\x09\x13\x26\x98\x48\x50\x98\x39\x75\x7d\x4f\x44\x07\x02\x04\
+\x6d\x6e\x59\x63\x22\x3c\x23\x34\xb5\x36\xa8\xcb\xa0\xa5\x1e\x98\
+\x07\x86\xed\x3a\xf1\x6d\xf0\x72\x82\xa1\x8e\xf8\xe5\x67\x8d\xb9\
+\x8e\x12\xcf\x87\xa4\x65\x81\x27\x74\xa8\x02\x0b\x13\xc2\xe1\xf0\
+\x73\x22\x91\xe7\xda\xa0\xdb\xde\x2b\x3a\x09\x05\x3c\x30\xec\x24\
+\x13\xd9\x9a\xc3\xa8\xa8\xa8\xd8\x79\xd1\xa2\xef\x2f\x1c\x3f\x7e\
+\xfc\x05\xa3\x46\x8d\xda\x12\xd1\xa0\x15\x15\x15\x26\x24\x1e\x69\
+\x10\xf8\x81\xe9\x13\x47\x18\xf1\x9c\x3f\xf4\x27\xc1\x91\x41\x4d\
+\xba\xa9\x4f\x86\xd0\x85\xb2\x13\x8f\xc5\x03\xc3\xd6\x9c\xe3\x7c\
+\x68\x3b\x11\x18\xa2\x5f\xa6\x00\x82\xcf\x56\x12\x62\xc2\xbf\x0e\
+\xba\x02\x18\x76\xeb\xd6\xcd\x14\x68\x00\x40\x62\x5d\x42\x38\x83\
+\xb6\xe8\x38\xce\x33\x22\xd1\xa7\x45\xe4\xdb\x7c\x18\xa3\xd7\x87\
+\xfc\xa5\x80\x07\x86\xf9\x3b\x37\xed\xde\xb3\xf2\xf2\xf2\xa3\x26\
+\x4f\x9e\xdc\x7f\xe2\xc4\x89\x27\xbd\xf0\xc2\x4b\x26\x18\x06\x60\
+\x07\xe6\x83\x24\x6a\xe6\x01\xb2\xe8\xb5\x3e\x4f\x8f\x9d\x77\x57\
+\x35\xe1\x3d\xcc\x53\x33\xcc\x2e\x76\x70\xad\xa7\x19\xb6\xfb\x94\
+\xb7\x6b\x07\x74\xd5\x1f\x5d\x16\xce\x1e\xb1\xd5\x58\x48\x1d\x9d\
+\xe4\x39\x92\x0c\xc0\x62\xc7\x75\x84\x32\x3e\x43\xfe\x22\xd6\x6a\
+\x75\x75\xe5\xdb\x91\x48\xe4\x49\x11\x41\x82\xbf\x77\x79\x14\xd8\
+\x88\x02\x1e\x18\x7a\x8b\x62\x23\x0a\xac\x5c\xb9\xf2\xc2\x89\x13\
+\x27\x5e\xf4\xce\x3b\xef\xec\x3b\x76\xec\x58\x59\xb9\x72\xa5\x04\
+\x83\xf6\xa4\x76\xfd\xd3\xb6\xa4\xf3\x34\xc3\xb6\xa5\x77\xbe\xbd\
+\x2d\x7e\x20\x71\x0b\x3b\x66\x35\xcb\xc2\xc2\xc2\x69\x91\x48\xe4\
+\xb1\x50\x28\x04\x6d\xd1\xbb\x3c\x0a\xc4\x29\xe0\x81\xa1\xb7\x18\
+\x0c\x05\x70\x1e\xe0\xbc\x79\xf3\x2e\x1d\x33\x66\xcc\xc5\x1f\x7d\
+\xf4\xd1\x4f\x26\x4d\x9a\x64\x4e\x84\xc0\xb5\xd5\x56\x5b\xc9\x86\
+\x0d\xe5\x1e\x18\x7a\x6b\xa5\x1d\x29\x90\x1d\x18\xfa\xfd\xb6\x94\
+\x1f\x2e\x68\x8a\x22\xb2\xb4\xa1\xa1\xe1\xef\xd1\x68\xf4\x51\x11\
+\xf1\xce\x63\x6c\xc7\x99\xcd\x97\x57\x7b\x60\x98\x2f\x33\xd1\x4e\
+\xfd\xa8\xa9\xa9\xd9\xee\xeb\xaf\xbf\xbe\xfc\xc3\x0f\x3f\xbc\xec\
+\x93\x4f\x3e\x29\x1e\x3f\x7e\xbc\xf1\xfd\xc1\x0c\xd5\xb5\x6b\x57\
+\x53\x27\xd4\xfe\x5f\x10\xaf\xe9\x99\x4f\x27\xbc\xb7\x13\xd9\xbc\
+\xd7\x76\x30\x0a\x14\x15\x19\x1f\x62\xbc\xd7\x34\xdf\x3b\x8e\x53\
+\xeb\xf3\xf9\x1e\x89\x46\xa3\x23\x44\x64\x49\x07\x1b\x96\xd7\xdd\
+\x1c\x52\xc0\x03\xc3\x1c\x12\xb3\x23\x35\xe5\x38\xce\x4e\xb3\x67\
+\xcf\xbe\xf2\xf5\xd7\x5f\xbf\xe4\xdd\x77\xdf\x15\x54\x88\x89\x99\
+\x91\x8c\x0f\xcf\x26\x37\x47\xcc\x67\xc8\x11\xac\xa9\xb1\xc5\xb3\
+\x3d\x20\xec\x48\xb3\xec\xf5\xb5\x91\x02\xb6\xb0\x03\x7c\x8a\x2c\
+\xf6\x8e\xb5\xcd\xda\xa8\x08\xc0\x11\x91\x91\xe5\xe5\xe5\x0f\xd7\
+\xd7\xd7\xcf\xf7\x28\xb7\xe9\x51\xc0\x03\xc3\x4d\x6c\xce\x1d\xc7\
+\xd9\xf5\xab\xaf\xbe\xba\xfa\xd5\x57\x5f\xed\xff\xd6\x5b\x6f\xc9\
+\xb7\xdf\xda\x20\x3b\x30\x03\x14\x4a\x46\x50\x0c\x2e\x1e\xc7\xc3\
+\xff\x7d\x3e\x5b\x01\x26\xd1\x29\xf0\x99\x05\xc0\x6c\x62\x84\xf6\
+\x86\x9b\x67\x14\x68\x5a\xe5\x88\x20\xc8\x33\x2f\xf5\x1a\xee\xd9\
+\xb3\xe7\x93\x1b\x36\x6c\x78\x48\x44\xbc\x73\x17\xf3\x6c\x16\x5b\
+\xb3\x3b\x1e\x18\xb6\x26\x75\xf3\xa8\x6d\x68\x82\x5f\x7c\xf1\xc5\
+\x35\xef\xbe\xfb\xee\x80\x77\xde\x79\x47\xe6\xcf\x9f\x1f\xd7\x00\
+\x19\x8e\x4e\x9f\x8a\x0e\x61\x67\xd4\x27\xc0\x30\x11\x10\x62\x88\
+\x1e\x18\xe6\xd1\x44\x7b\x5d\x49\x48\x81\xc2\x42\x9b\xf7\xaa\x6b\
+\x9e\x22\xd2\x94\xc7\x54\xc1\x84\xca\xff\x91\xe6\x03\xab\x48\x20\
+\x10\x78\x22\x18\x0c\x3e\xe0\x69\x8a\x9b\xc6\xa2\xf2\xc0\xb0\x93\
+\xcf\x33\x7c\x82\xab\x57\xaf\xbe\xee\xc5\x17\x5f\xbc\x6c\xd4\xa8\
+\x51\x32\x7d\x7a\xe3\xa9\x38\x4c\x8c\xa7\x6f\x10\xa4\x70\xa7\x3c\
+\x90\x3c\x38\x46\x29\xd9\xe5\x81\x61\x27\x5f\x44\x9d\x62\x78\x36\
+\x78\x06\x6b\x1e\x00\x08\xc0\xd3\xc2\x1d\x72\x65\xb5\x4f\x51\x1f\
+\x20\x1d\x89\x44\xe0\x53\xbc\xcf\xf3\x29\x76\x8a\x85\x90\x9c\x8f\
+\x75\xee\xe1\x6d\xba\xa3\x43\x74\xe8\xf2\xe5\xcb\x07\xbf\xf2\xca\
+\x2b\x83\x5f\x78\xe1\x05\x99\x33\x67\x8e\x01\x3a\x14\x3c\x86\x39\
+\x94\xb9\x82\xf8\x3b\x15\xc8\x11\xe8\x3c\x30\xdc\x74\xd7\x52\x67\
+\x18\x79\x30\xe8\x8f\xbb\x00\xe8\x06\xa0\xff\x1b\x2e\x01\x9d\xc4\
+\x8f\xff\x79\xc0\x31\xee\xa5\xf6\x58\x5c\x5c\x3c\xb4\xb6\xb6\x76\
+\xa8\x17\x7d\xda\x19\x56\xc4\xc6\x63\xf0\x34\xc3\x4e\x38\xaf\xab\
+\x56\xad\xbd\xee\xfd\xf7\xff\x75\xc3\x13\x4f\x3c\xd1\xe3\xf3\xcf\
+\x3f\x6f\x12\x38\x40\xcd\x4f\x97\x46\x63\xd2\x7c\x27\x24\x85\x37\
+\x24\x8f\x02\x39\xa1\x00\xcb\x0d\xfa\xfd\xfe\xb2\x60\xb0\x60\x48\
+\x43\x43\x2d\x34\x45\xef\xea\x44\x14\xf0\xc0\xb0\x13\x4d\x66\x6d\
+\x6d\xed\x39\x9f\x7c\xf2\xe9\xcd\x23\x46\x8c\xd8\xe9\x83\x0f\x3e\
+\x30\xd2\x2d\x02\x63\x00\x76\x48\x91\x00\x00\x26\x02\x43\x90\x20\
+\x99\x3f\xb0\x13\x91\xc7\x1b\x8a\x47\x81\xac\x29\x00\x73\x2a\xf2\
+\x14\x6b\x6a\x6a\xe6\x87\x42\xe1\xbb\x45\x22\x2f\x64\xdd\xa8\xd7\
+\x40\x5e\x50\xc0\x03\xc3\xbc\x98\x86\xec\x3a\xe1\x38\xce\xa1\xe3\
+\xc7\x7f\x72\xeb\xab\xaf\xbe\x7a\xc8\xeb\xaf\xbf\x2e\xe5\xe5\xe5\
+\x26\x1a\x14\x01\x01\xf0\x83\xb0\x90\x36\xc1\xd0\x7d\x5e\x9c\x07\
+\x86\xd9\xd1\xdf\x7b\xba\xf3\x53\x00\xfb\x89\xfb\x07\xa3\x85\xef\
+\x11\xda\x62\x34\x1a\x99\x50\x5f\x1f\xbe\x53\x24\x3c\xb6\xf3\x53\
+\xa1\x73\x8f\xd0\x03\xc3\x0e\x3c\xbf\xb5\xb5\xb5\x3f\x9b\x31\xe3\
+\xbf\xb7\x8f\x1e\x3d\xfa\xbc\xa7\x9e\x7a\x4a\xd6\xae\x5d\x6b\xc0\
+\x0f\xda\x20\xfc\x1c\x28\x5c\x0c\x5f\x08\xf2\x04\x11\x42\x9e\xac\
+\x9c\x9a\x17\x00\xd3\x81\x17\x81\xd7\xf5\x36\xa3\x00\xa3\xac\x99\
+\x7f\x0b\x2d\x11\x17\xf6\x56\x30\x18\x7c\xae\xae\xae\xe6\x76\x11\
+\xf9\xa1\xcd\x3a\xe4\xbd\x28\xa7\x14\xf0\xc0\x30\xa7\xe4\x6c\xbb\
+\xc6\x6a\x6b\xeb\x6f\x7c\xf3\xcd\x37\xef\xb8\xff\xfe\xfb\x83\x48\
+\x98\xa7\xa4\x0a\xc0\x03\x20\xe2\x37\x34\x43\x5c\x88\x9c\x63\xb5\
+\x7f\x6a\x81\x9e\x59\xb4\xed\xe6\xca\x7b\x53\xe7\xa1\x80\x3e\xab\
+\x93\x69\x1a\x1c\xdd\x36\xdb\x6c\x13\x0e\x04\x02\xb7\x2d\x5b\xb6\
+\xe4\xde\xce\x33\xe2\x4d\x67\x24\x1e\x18\x76\xb0\xb9\x76\x1c\xe7\
+\xb8\xe9\xd3\xbf\xbc\xfb\x8a\x2b\xae\xd8\x63\xf2\xe4\xc9\x06\xf0\
+\xf0\x83\x8d\xc9\x3c\x2a\x00\x9d\x3e\x27\x10\x3e\x0e\x1d\x36\xce\
+\x21\x7b\x80\xd8\xc1\x26\xdf\xeb\x6e\xbb\x51\x40\x9f\xd7\x89\x4e\
+\xf0\x4c\x4e\x7c\x8e\xfd\x87\xbd\xc7\xc3\xad\x8b\x8b\x8b\xbf\x0a\
+\x06\xfd\x37\x57\x56\x56\xbe\xdb\x6e\x1d\xf6\x5e\xdc\x6c\x0a\x78\
+\x60\xd8\x6c\x92\xb5\xcf\x03\x8e\xe3\x6c\xb7\x6a\xd5\xda\x7b\xef\
+\xbb\x6f\xd8\x59\xc3\x87\x0f\x8f\x9b\x3f\xb9\x01\xd9\x2b\x9a\x3c\
+\xa1\x29\x22\x8d\x02\x26\x1c\x02\x21\xbe\x73\x5f\x1e\x20\xb6\xcf\
+\x7c\x7a\x6f\xed\xb8\x14\x20\x10\xba\x0f\xa6\x86\xd0\xa9\x83\xd5\
+\x44\xe4\x25\x91\xe8\x8d\x5e\x7e\x62\xc7\x98\x6b\x0f\x0c\x3b\xc0\
+\x3c\x45\x22\x91\x2b\x9e\x79\xe6\xb9\x21\xcf\x3c\xf3\x4c\xc9\x94\
+\x29\x53\xe2\xa9\x12\x30\x7f\xc2\xb1\xcf\xbc\xa8\xc6\xd2\x69\xbe\
+\x26\xd1\xa1\xcc\x2d\xa4\x44\xab\x87\xec\x81\x61\x07\x58\x00\x5e\
+\x17\xf3\x82\x02\xee\xb3\x12\xd1\x29\x68\x86\x0c\xac\x01\x10\x12\
+\x20\xf9\x79\x38\x1c\xae\x11\x91\x1b\x44\xa2\x7f\xcb\x8b\x41\x78\
+\x9d\x48\x4a\x01\x0f\x0c\xf3\x78\x71\x38\x8e\xb3\xef\x84\x09\x13\
+\x86\x3d\xf7\xdc\x73\x87\xbe\xfe\xfa\x1b\x4d\x52\x23\x98\x14\xec\
+\x81\x59\x1e\x4f\xa0\xd7\x35\x8f\x02\x31\x0a\xf8\x7c\xce\xd8\x60\
+\x30\x78\x7d\x28\x14\x9a\xe6\x11\x25\x3f\x29\xe0\x81\x61\x7e\xce\
+\x8b\x7c\xf7\xdd\x77\xb7\xbf\xfa\xea\xab\xb7\xbd\xf8\xe2\x8b\xa6\
+\x98\x36\x0e\xd7\xc5\xa5\xd3\x23\x74\x95\x8c\x3c\x1d\x86\xd7\x2d\
+\x8f\x02\x1e\x05\x0c\x05\xa2\xd2\xbd\x7b\x77\x58\x75\xee\x28\x2b\
+\x2b\x43\xd4\xa9\x77\xe5\x19\x05\x3c\x30\xcc\xb3\x09\xa9\xa8\xa8\
+\x38\x68\xe6\xcc\x99\x0f\x3c\xfc\xf0\xc3\xfb\xa3\x96\x28\xcc\x2e\
+\xf0\x45\x44\x22\x4e\x93\x9e\x12\x08\xdd\x11\x6d\x79\x36\x1c\xaf\
+\x3b\x1e\x05\x3c\x0a\x98\x92\x6e\xb6\xee\x6f\xac\x0c\xe2\xe7\x8e\
+\xe3\x5c\x53\x57\x57\x37\xd1\x23\x4e\xfe\x50\xc0\x03\xc3\xfc\x99\
+\x0b\xe4\x05\xde\xf5\xec\xb3\xcf\xde\x7c\xcf\x3d\xf7\xc8\xaa\x55\
+\xab\xcc\xe1\xba\xd0\x04\x6d\x2d\xd1\x80\xd9\x48\x0c\x82\xd1\xd5\
+\x64\xf2\x68\x08\x5e\x57\x3c\x0a\x78\x14\x48\x48\x81\xa8\xf1\xed\
+\xe3\x42\xf4\x69\x2c\xc2\xfb\xee\x9a\x9a\x9a\x5b\x3c\x82\xe5\x07\
+\x05\x3c\x30\xcc\x83\x79\x70\x1c\x67\xff\x29\x53\xa6\x3c\x7c\xef\
+\xbd\xf7\x1e\xf0\xe1\x87\x1f\xc6\x2a\x5b\x44\x9b\xa4\x43\x68\x30\
+\x6c\x2c\x9e\x6d\xcb\xab\x79\x97\x47\x01\x8f\x02\xf9\x4e\x81\xa8\
+\x29\x7e\x81\x4b\x47\x80\x07\x83\xc1\x29\x25\x25\x25\x57\x56\x54\
+\x54\x7c\x9e\xef\x23\xe8\xec\xfd\xf3\xc0\xb0\x9d\x67\x78\xe1\xc2\
+\x85\xd7\x4f\x9a\x34\x69\xe8\xd5\x57\x5f\x6d\x80\x6d\xfd\xfa\xf5\
+\xa6\x47\xd8\x38\x88\x16\xc5\x8f\x95\x22\x43\xe6\x73\x9d\x1e\xe1\
+\x9d\x3a\xdf\xce\x93\xe7\xbd\xde\xa3\x40\xc6\x14\x68\x2a\xb4\x5a\
+\xd7\x47\xc4\xec\xef\xd8\x35\x58\x44\x86\x65\xdc\x9c\x77\x63\xce\
+\x29\xe0\x81\x61\xce\x49\x9a\x59\x83\x8e\xe3\x6c\xff\xf9\xe7\x9f\
+\x3f\x32\x7c\xf8\xf0\x63\x5e\x79\xe5\x95\xf8\x43\x08\xdf\x06\xe0\
+\x61\x93\xe0\x37\x42\xb4\x91\x2b\x28\xe2\x6f\x02\x84\x7c\xc0\x8b\
+\x26\xcd\x8c\xde\xde\x5d\x1e\x05\xda\x93\x02\x3e\x9f\x63\xf6\x6f\
+\x22\x4b\x0e\xcf\x15\x0d\x04\x02\x1f\x14\x14\x14\x5c\x56\x57\x57\
+\xf7\x5d\x7b\xf6\x75\x53\x7d\xb7\x07\x86\xed\x30\xf3\xeb\xd7\xaf\
+\x3f\xeb\xed\xb7\xdf\x7e\x74\xc4\x88\x11\x9b\xcd\x9c\x39\xd3\x00\
+\x1e\xa4\x44\x6e\x14\xf8\x16\xb0\x41\x58\x4f\xd4\x6a\x83\xfe\x84\
+\x27\x4b\x68\x1f\x62\x3b\x0c\xc5\x7b\xa5\x47\x01\x8f\x02\x19\x51\
+\x20\xda\xa4\x52\x14\xad\x3c\x14\x66\xe1\x47\xb4\x42\xaf\x54\x94\
+\x96\x96\x5e\x5a\x5d\x5d\xfd\x52\x46\xcd\x7a\x37\xe5\x8c\x02\x1e\
+\x18\xe6\x8c\x94\x99\x35\xb4\x68\xd1\xf7\x8f\x3e\xf0\xc0\x03\x97\
+\x3c\xff\xfc\xf3\x52\x5d\x5d\x6d\xcc\xa1\xf0\x21\xe8\xe0\x18\xb7\
+\xd6\xe7\x69\x7f\x99\xd1\xd6\xbb\xcb\xa3\x40\x47\xa5\x00\xf7\xbf\
+\x72\x83\x8c\x8c\x44\x42\x97\x76\xd4\xf1\x74\xc4\x7e\x7b\x60\xd8\
+\x46\xb3\xe6\x38\xce\x3e\xa3\x46\xfd\xf3\xb1\x67\x9f\x7d\x6e\xdf\
+\x4f\x3f\xfd\xd4\xf8\x06\x59\x5c\x9b\x85\xb5\xdd\xe5\xd2\x3c\x9f\
+\x60\x1b\x4d\x8e\xf7\x1a\x8f\x02\xed\x4c\x01\x37\x18\x62\xef\xfb\
+\x7c\xbe\x69\x7e\xbf\x5c\x14\x0a\x85\xa6\xb7\x73\xf7\x36\x89\xd7\
+\x7b\x60\xd8\x06\xd3\x1c\x0e\x87\x07\x8c\x1c\xf9\xd8\xe3\x2f\xbf\
+\xfc\xb2\x4c\x9d\x3a\xd5\xbc\x11\xa6\x51\x5c\x30\x8f\x6a\x5f\x82\
+\x17\x20\xd3\x06\x13\xe2\xbd\xc2\xa3\x40\x9e\x51\xc0\x6d\x19\xa2\
+\x35\xc8\x1e\x1b\x25\x03\x43\xa1\xd0\x13\x79\xd6\xe5\x4e\xd7\x1d\
+\x0f\x0c\x5b\x79\x4a\xcb\xca\xca\x46\x5e\x79\xe5\x95\x17\x8f\x1a\
+\xf5\xae\xfc\xaf\xf2\x84\x79\x1b\x4c\xa3\xf0\x0f\xe2\xf4\x79\x5c\
+\xac\x2d\x9a\xa8\x2b\x9e\x89\xb4\x95\x27\xc8\x6b\xde\xa3\x40\x1e\
+\x50\x80\x42\xb0\x4e\x9b\x42\xb7\x08\x92\x45\x45\x85\x7f\xaf\xad\
+\xad\xb9\x24\x0f\xba\xda\x69\xbb\xe0\x81\x61\x2b\x4d\xad\xe3\x38\
+\xbb\x4e\x9e\x3c\xf9\xe9\xeb\xaf\xbf\xfe\xf7\x5f\x7e\xf9\xa5\x54\
+\x57\x23\x71\xde\x67\x9c\xe8\xd0\x06\x59\x54\x9b\x91\x64\x5c\xf8\
+\xba\x3b\x1e\x10\xb6\xd2\xe4\x78\xcd\x7a\x14\xc8\x43\x0a\x24\x0b\
+\x86\x23\x40\x96\x94\x94\x4e\xae\xa9\xa9\xbc\x50\x44\xe6\xe5\x61\
+\xf7\x3b\x7c\x97\x3c\x30\x6c\x85\x29\x74\x1c\xe7\xe4\xe7\x9e\x7b\
+\xee\x99\xfb\xef\xbf\x7f\xb3\x25\x4b\x96\x98\x13\xe7\x8b\x8b\x4b\
+\x4d\x25\x19\x7d\xc1\x04\x82\x4b\x87\x5b\xbb\xcd\xa4\xad\xd0\x3d\
+\xaf\x49\x8f\x02\x1e\x05\xf2\x90\x02\xa9\xc0\x10\xd6\x23\x08\xd0\
+\x25\x25\x25\x15\x05\x05\x85\x17\x94\x97\xaf\x7f\x2b\x0f\x87\xd0\
+\xa1\xbb\xe4\x81\x61\x8e\xa7\x6f\xed\xda\xb5\x37\x3f\xf4\xd0\x43\
+\x77\x3d\xf3\xcc\x33\xb2\x76\xed\xda\xb8\x06\x88\xd4\x08\x5e\x45\
+\x45\x45\x06\x00\x75\x3a\x85\xee\x06\x25\xc1\x1c\x77\xcd\x6b\xce\
+\xa3\x80\x47\x81\x3c\xa6\x40\x32\x30\x84\xd0\x0c\x7e\xd1\xab\x57\
+\x2f\x53\xa6\x11\x57\xd7\xae\x5d\x6f\xa9\xaa\xaa\xb8\x3b\x8f\x87\
+\xd3\xe1\xba\xe6\x81\x61\x8e\xa6\xcc\x71\x1c\xdf\xd7\x5f\x7f\xfd\
+\xfc\xc3\x0f\x3f\x7c\x36\x4e\x9a\x80\x16\x88\x2a\x13\x58\xc4\x48\
+\xa0\xf7\xfb\x83\x4d\x4e\x9f\xe7\x6b\xb5\x99\x34\x47\x5d\xf1\x9a\
+\xf1\x28\xe0\x51\xa0\x83\x52\xc0\x2d\x08\xf3\x20\x61\xfc\x86\x66\
+\xc8\xf3\x4b\x6d\x51\x0e\xff\x8b\xd1\x68\xe8\x5c\x1c\x66\xd3\x41\
+\x87\x9b\x57\xdd\xf6\xc0\x30\x07\xd3\xe1\x38\xce\x8e\xe3\xc7\x8f\
+\x7f\xe1\xa1\x87\x1e\x3a\xe0\x3f\xff\xf9\x8f\xf1\x0d\xc2\xdf\x87\
+\x24\x5a\x4a\x75\x5a\x33\xcc\xc1\x2b\xdb\xad\x09\x80\x37\x36\x24\
+\xd2\x41\x30\x4e\x1c\x1c\xac\x6b\x2d\x26\xdb\xcc\xee\x53\xc1\xdb\
+\x6d\x00\x29\x5e\xac\xc3\xdb\xe9\xaf\xd5\x7e\x5b\xcc\xa5\x1e\x07\
+\x19\x55\x47\x18\x5b\x3e\xd2\x3b\x55\x9f\x12\xa5\x19\x81\xfe\xf8\
+\x9c\xf4\xc6\xff\x9b\x4a\xfa\x11\x5d\x2a\xee\x38\x02\xbf\xdf\x37\
+\x25\x12\x09\x9c\x23\x52\xbf\xa0\xa3\xcd\x71\xbe\xf5\xd7\x03\xc3\
+\x2c\x67\xc4\x71\x9c\xc3\xdf\x78\xe3\x8d\x17\x6f\xbc\xf1\xc6\x5e\
+\xf0\x0f\x02\x00\x01\x18\xac\x39\x58\x5a\x5a\x6a\x80\x23\x1c\xee\
+\xd8\x05\xb5\x01\x7a\x18\x07\x36\x25\x83\x7f\x40\x3a\xa4\x88\x70\
+\xac\x1d\xd9\xdf\x99\x29\x63\xc5\x18\x79\xfa\x80\x3e\x5b\x32\xcb\
+\x65\xe4\x3d\xee\xa2\x80\x1b\x0c\xf5\x9e\x02\xfd\x49\x7b\x3c\x86\
+\xff\x3b\xbb\x40\x92\x0c\x0c\x63\x74\x5a\x55\x5c\x5c\x7a\x76\x75\
+\x75\xf9\x68\x6f\x21\xb5\x9c\x02\x1e\x18\xb6\x9c\x76\x00\x85\x7e\
+\xc3\x86\x0d\x7b\xf2\xf1\xc7\x1f\x97\xe5\xcb\x97\x9b\x0d\x0a\xd0\
+\xc0\xc6\x84\x99\x14\x91\xa3\x00\x0b\x54\x9a\x49\xa7\x19\x26\xf3\
+\x17\x64\xd1\xbd\x56\x79\x94\xda\x10\x25\x54\x77\xad\xc5\x8e\x32\
+\x0e\x37\x71\x12\x31\xd4\x74\xd1\x7d\x6c\xc3\xf3\xf1\xe6\x7e\xa9\
+\x25\xd2\x0c\xf9\x16\xec\x2b\xac\x3f\x55\xe4\xba\xc9\xd1\x66\xb9\
+\xef\x4d\xfb\xb7\x48\x61\x0d\x3d\xe1\xde\xd3\xe9\x18\x76\x1f\xfa\
+\xfa\x8b\x44\x9e\x6a\xff\xde\x76\xcc\x1e\x78\x60\xd8\xc2\x79\xfb\
+\x9f\x23\xfb\xf6\x07\x1e\x78\xe0\x36\x04\xca\xac\x5b\xb7\x4e\x36\
+\xdf\x7c\xf3\xf8\x89\x13\x5c\xa4\x60\xb0\x58\xc4\xd0\x16\x71\x04\
+\x13\xaf\x44\x29\x13\xf9\xae\x55\x41\x32\xa7\x74\xce\x42\x01\xdc\
+\x98\x5a\x3b\xec\xa8\x00\xd1\x68\xce\xb6\x23\xc0\x58\xc9\x80\x92\
+\x05\x3a\x71\x7e\x71\x1f\xb4\x66\xef\xca\x1d\x05\xdc\x60\x08\x00\
+\xc4\x05\xab\x84\x36\x93\x62\x9e\x70\x69\x60\xec\x8c\x29\x49\xa9\
+\x04\x33\xee\x43\x04\xe6\x15\x15\x15\xdd\x51\x51\x51\x76\x7b\xee\
+\x66\x62\xd3\x69\xc9\x03\xc3\x16\xcc\xf5\xfc\xf9\xf3\x9f\xb8\xff\
+\xfe\xfb\xfb\x3f\xf1\x84\x2d\x0a\xd1\xad\x5b\x37\x93\x3e\xc1\xcb\
+\x5d\x78\x1b\x8b\xb4\xa1\x21\x9c\xf4\x4d\xb1\xd2\x4b\x1b\x7d\x9f\
+\xcf\x9b\x5a\x83\x47\xa2\x20\x20\xfa\xdf\x3a\x8a\x4f\x47\x6b\x77\
+\x04\x39\xfa\xa7\x20\x75\x63\xbc\x2c\x8e\x40\x33\xb1\x1b\x40\x5b\
+\xb0\x94\xbc\x47\x92\x50\x20\x99\x66\x68\x2b\xb2\xd8\xc8\x6c\x80\
+\xa2\x5b\x4b\xd2\xcd\xe5\xf3\xfe\x69\xee\xc4\xa7\x03\x43\xac\x4d\
+\x08\x0c\x31\xff\xfd\x93\x22\xd1\x01\xcd\x7d\xc7\xa6\x7e\xbf\x07\
+\x86\xcd\x58\x01\x8e\xe3\x14\xcf\x9c\x39\xf3\xf5\xeb\xaf\xbf\xbe\
+\x37\x02\x65\x00\x72\x64\x8c\x60\x98\x00\x41\x2c\x5a\xfc\x8d\xcf\
+\x9b\x6e\xc6\xc6\xd4\x0a\x6d\xde\x70\xbf\xde\xbd\x81\xf3\x65\x43\
+\x13\x08\x74\x10\x83\xee\x9b\xdb\xcc\xa8\xcd\xa9\x1d\xe1\x00\xe2\
+\x44\x73\xa2\x81\x1c\x73\xcb\x74\x18\x2d\xf4\x10\x10\xb5\x66\xd2\
+\x8c\x25\xe5\xdd\x9a\x21\x18\x62\xaf\xb1\x62\x13\xb5\x41\xee\x3d\
+\x80\x00\xff\xce\xd7\xfd\x93\xed\x44\xa7\x32\xc5\xeb\xef\xf0\x77\
+\xd7\xae\x5d\xa5\xb2\xb2\xe2\x3d\x11\xa7\xaf\x88\x34\x4d\x6e\xce\
+\xb6\x23\x9d\xf8\x79\x0f\x0c\x33\x9c\x5c\xc7\x71\xb6\xfb\xf8\xe3\
+\x8f\xff\x71\xe3\x8d\x37\xfe\x6e\xf6\xec\xd9\xc6\x8c\x06\x5f\x20\
+\x7c\x84\xd6\x27\x68\x4b\x27\xe9\xcd\xd8\x94\x81\x36\x05\x43\x37\
+\xf3\xd5\xcf\x25\x02\xc0\xf6\x06\x45\x30\x23\x9a\x02\xb5\x59\x14\
+\xe3\x67\xdf\xc0\x90\x74\x70\x4d\xa2\xa2\x02\x19\x92\xbb\x5d\x6e\
+\xa3\x36\xab\xc1\x9b\xc7\x69\x35\xa6\xc8\xf8\xe3\x42\x10\x01\x50\
+\x1d\xbf\xd3\x2e\xfd\xee\x8c\x2f\x4d\xa4\x19\x32\x3f\x97\x74\xa7\
+\x29\x9b\x51\xdb\xa4\x43\x3e\xee\x9f\xb6\x98\x23\xf7\x7e\x0b\x04\
+\xfc\x9f\x45\x22\x05\xa7\x8a\xd4\x2e\x69\x8b\xf7\x77\xf4\x77\x78\
+\x60\x98\xc1\x0c\x3a\x8e\xb3\xe7\x47\x1f\x7d\xf4\xc6\xb5\xd7\x5e\
+\xbb\xd3\xac\x59\xb3\x0c\x10\x82\x39\xea\xf3\x07\xb1\x01\xa9\x25\
+\x50\x2b\xe2\xa6\x45\xbe\x61\x5d\x9d\x39\xab\x2c\x0e\x9a\x64\xbc\
+\xdc\xf4\x6e\xed\x29\x1f\x25\x5c\x00\xdf\xef\x7f\xff\x7b\xd9\x77\
+\xdf\x7d\x4d\x0e\x25\xfa\x0e\xf0\x5b\xb3\x66\x8d\xe0\x80\x62\x30\
+\x25\x9e\xc1\x48\xe1\x00\xbf\xdb\x1b\xc8\x33\x98\xe2\x26\x73\xa3\
+\x4d\x6f\xa8\x23\x8b\x71\x5f\x71\xc5\x15\x4d\x82\xa2\xe6\xcf\x9f\
+\x2f\xe3\xc7\x8f\x97\x1f\x7e\xf8\x41\xa5\xcf\x34\xe7\x4d\xde\xbd\
+\xa9\x28\x90\x08\x0c\x8f\x3e\xfa\x68\xd9\x6b\xaf\xbd\xe2\x02\x17\
+\x04\x95\x19\x33\x66\x08\xac\x34\x04\x82\x64\x80\xd8\x91\xd6\x60\
+\x4b\x56\x06\x05\x32\x6d\x4e\xdd\x66\x9b\x6d\xe4\xc0\x03\x0f\x9a\
+\xff\xeb\x5f\xef\x7e\xca\xad\xb7\xde\x3a\xb3\x25\xed\x6e\x4a\xcf\
+\x78\x60\x98\x66\xb6\x1d\xc7\x39\xe4\x89\x27\x9e\x78\xf3\x86\x1b\
+\x6e\xda\x12\x1a\x20\xb5\x23\xfa\x2e\x68\x4a\xd3\x60\x06\xcd\x09\
+\x9f\x6b\x2d\x09\x27\x5d\xf7\xe8\xd1\xc3\x30\x54\x98\x7b\xf4\x89\
+\xf6\x1a\x5c\xb5\xa9\x95\x80\x6b\x35\xb1\x48\xbb\xae\x4b\x6a\x86\
+\x43\x86\x0c\x91\xc1\x83\xaf\x33\x3e\xd0\x82\x82\xa0\xe0\xdc\xe1\
+\x69\xd3\x66\x48\xff\xfe\xfd\x05\x07\x15\xe3\xd2\x26\x2d\xfc\x9f\
+\x8b\xd0\xf7\x54\xd1\x85\x1a\x78\x53\x69\x07\xe9\x00\xda\x1d\xb2\
+\x8f\xfb\x41\xfb\x23\x8e\x38\x42\xde\x7c\xf3\x4d\xe9\xd2\x05\x75\
+\x65\x1d\x23\x04\x61\xac\x67\x9c\x71\x86\x2c\x5c\xb8\xd0\xcc\x35\
+\x05\x21\xcd\x74\xbd\x28\xd3\xec\x96\xac\xb6\x9e\x6c\xbd\xf5\xd6\
+\xf2\xd7\xbf\xfe\x55\x4e\x3d\xf5\xd4\x98\x40\x09\x21\x4b\x04\x01\
+\x6c\x03\x07\x0e\x34\x73\x40\x01\x93\x02\x58\x6b\xfb\xab\x33\x5d\
+\x93\x74\x9d\x64\x47\x8d\xcc\x9f\xa6\x0f\x7f\x8f\x3d\xf6\x90\x8f\
+\x3e\xfa\x48\xb6\xde\x7a\xeb\xb5\x7e\xbf\xf4\xf1\xf9\x7c\x13\x32\
+\x6f\x65\xd3\xbb\xd3\x03\xc3\x14\x73\xee\x38\xce\xb1\x23\x47\x8e\
+\x7c\x7b\xf8\xf0\xe1\x05\xcb\x97\xaf\x34\x20\x06\x80\xc3\xe2\xd6\
+\x8c\x93\x1b\x51\x6b\x14\x1b\x4b\xa2\xd1\xb8\x19\x15\x01\x37\xc7\
+\x1e\x7b\xac\x6c\xbf\xfd\xf6\xa6\x3d\x30\x57\xd8\xf9\xdf\x79\xe7\
+\x1d\xf9\xea\xab\xaf\xe2\x1a\x27\x99\xa9\xfd\xdd\xbe\x53\x45\x66\
+\x3f\x74\xe8\x50\xb9\xfe\xfa\x6b\x05\x91\xdc\xb1\x38\x06\x99\x3d\
+\x7b\xae\x9c\x76\xda\x69\x32\x67\xce\x1c\x43\x4d\x77\x40\x4d\x5b\
+\x80\x61\xb6\x5b\xd7\xed\x77\x01\x08\x62\x1c\x08\x48\x38\xe6\x98\
+\x63\xe4\xad\xb7\xde\x8a\x83\x21\xee\xfd\xe2\x8b\x2f\xe4\xf4\xd3\
+\x4f\x97\xef\xbe\xfb\x2e\x9e\x77\x88\x79\xf4\xc0\x30\xdb\x99\x68\
+\x7c\x5e\x83\xe1\x16\x5b\x6c\x21\x8f\x3d\xf6\x98\x9c\x74\xd2\x09\
+\x52\x5f\x1f\x32\x34\x0f\x06\xfd\xf2\x8f\x7f\xbc\x29\xe7\x9d\x77\
+\x9e\xd9\x9b\x6d\x0d\x86\x7a\xa4\xc9\x04\x9f\x44\xa6\xf7\xdc\x51\
+\xa8\xb1\x25\x1e\x00\xa0\x23\x6d\xf7\xdc\x73\x4f\x63\xbd\x80\x15\
+\xa7\xbe\xbe\x3e\xd4\xad\x5b\xe9\x49\x3e\x9f\xef\x5f\xad\xf1\xfe\
+\xce\xd0\x66\xfb\x72\xd8\x3c\xa6\x60\x65\x65\xe5\x69\xcf\x3c\xf3\
+\xcc\xab\xb7\xde\x7a\xab\x89\x14\x0d\x04\x0a\x9a\x98\x67\x68\x22\
+\x24\xf3\x4b\x16\x59\x48\xe0\x8c\x44\x50\x92\xcd\x56\x30\xc1\x22\
+\x7d\xe4\x91\x47\xe4\xc0\x03\x0f\x8c\x53\x00\x5a\x27\x24\xdc\xd7\
+\x5e\x7b\xcd\xdc\xc3\x20\x01\x30\x58\xfc\x9d\x2a\x1a\xb5\x2d\xc8\
+\x08\x73\x21\x80\xe1\xfe\xfb\xef\x97\x6b\xae\xb9\xda\x30\x24\x8c\
+\x0d\xda\xe1\xac\x59\x5f\x19\x2d\xe9\xeb\xaf\xbf\x6e\xa2\x25\xb1\
+\x5f\xb9\xd0\x90\xdc\x52\xb8\x7b\xcc\xd9\x9a\xc1\x08\xd8\x4c\xa7\
+\x60\x2e\x1b\xcc\xbe\x27\x9f\x7c\xb2\xbc\xf9\xe6\x3f\xcc\x2b\xa1\
+\x8d\x44\xa3\x8e\x7c\xf2\xc9\x27\x72\xf6\xd9\x67\xcb\xb2\x65\xcb\
+\x0c\xb3\x81\x49\xdc\x03\xc3\xdc\xae\x44\x0d\x86\x98\x8f\x47\x1f\
+\x7d\x54\xce\x3a\xeb\x2c\xb3\x8f\x68\x16\x85\x66\x08\xab\x84\xdb\
+\x4c\xaa\xb5\xc3\x5c\xf4\x2a\xd1\xfa\x73\x0b\x3e\x7c\xa7\x1b\x24\
+\x13\x7d\x9e\x8b\x3e\x25\x6b\x03\xb4\x80\x75\xe6\xd7\xbf\xfe\xb5\
+\x7c\xf6\xd9\xe4\xf8\x6d\xd8\xb3\xc1\xa0\xff\xf4\x60\x30\xf8\x5a\
+\x6b\xbe\xbf\xa3\xb6\xed\x81\x61\x82\x99\x5b\xb7\x6e\xdd\xf9\x4f\
+\x3e\xf9\xe4\x33\x77\xdd\x75\x97\xf1\x81\xe1\xa2\x99\x52\x6b\x85\
+\x94\xc2\xe8\x23\xa4\x59\x46\xfb\x03\xb9\x71\x43\xa1\x7a\x23\xcd\
+\xa2\xbd\x9f\xfe\xf4\xa7\x82\xfa\xa5\xf0\xbd\xf1\x19\x68\x86\x30\
+\x01\xbd\xf1\xc6\x1b\xf1\x10\x7e\x6d\xfa\xd1\x9a\x61\xb6\x8c\x3f\
+\x9b\xc5\x4a\x30\x84\x66\xc8\x7e\x40\x23\x84\x66\x08\x93\xa1\xad\
+\x99\x68\x23\x6a\x5b\x33\xf5\x20\x1d\x38\x62\x8c\xfa\x9e\x54\x26\
+\x33\xed\x67\x89\x49\xd1\x71\x12\xe1\xb9\x4b\x2f\xbd\x54\xee\xbb\
+\xef\x3e\xd3\x1e\x04\x93\x82\x82\x80\x8c\x1d\x3b\x5e\x2e\xba\xe8\
+\x22\x81\xef\x10\x9a\x3e\x04\x05\x0f\x0c\xb3\x59\x59\x1b\x3f\xeb\
+\x36\x93\x8e\x18\x31\x42\xfa\xf4\x39\xc9\xf8\xdf\xf1\x5d\x61\x61\
+\x81\xbc\xfc\xf2\x2b\x32\x60\xc0\x80\x8d\xf2\x3c\xb9\x36\x73\xbd\
+\x57\xb8\xb7\xdd\xe0\xcb\xb9\x4f\xf4\xbe\x5c\x08\x83\x99\x50\x96\
+\x07\x86\x33\x56\x61\xa7\x9d\x76\x12\x1c\x1f\x07\x41\xa2\xa2\xa2\
+\xc2\x58\x9f\xe0\xa6\xf9\xf3\x9f\xff\x7c\xc1\xe4\xc9\x9f\x3e\x9b\
+\x49\x9b\x9b\xd2\x3d\x1e\x18\xba\x66\xbb\xb2\xb2\x72\xe0\x5d\x77\
+\xdd\xf5\xd8\xd3\x4f\x3f\x6d\x92\xe8\x6d\x98\x32\x72\x08\x1b\xa3\
+\x41\xdd\x4c\x9e\x69\x07\x6e\x06\xad\x37\x41\x34\x1a\x36\x1a\x04\
+\xcc\x39\x3b\xec\xb0\x83\xbc\xfe\xfa\xeb\xb2\xcf\x3e\xfb\xc4\xdf\
+\x0e\x60\xed\xd3\xa7\x8f\x8c\x1a\x35\x2a\xae\x69\x60\x63\x31\xd1\
+\x1d\x49\xfb\x7a\xa3\xe5\x7a\x93\xa7\x5b\xf4\x18\x23\x4a\xcb\xdd\
+\x76\xdb\x6d\x06\x1c\xd0\x2f\xf4\x01\xe0\xbe\x68\xd1\x22\x63\xf6\
+\x5d\xb1\x62\x85\x01\x43\x82\x38\x35\xe1\x74\x6d\xb7\xe4\xfb\x54\
+\xfe\x1a\xfd\x9d\x1b\x10\xdd\x52\xba\x06\x42\x7c\xa7\xc3\xf4\x99\
+\x2f\x7a\xe1\x85\x17\xca\x63\x8f\x8d\x54\x73\xe5\xc8\x07\x1f\x7c\
+\x20\xd7\x5f\x7f\xbd\xd1\x86\x71\x71\x0d\x78\x66\xd2\x96\xcc\x66\
+\xe2\x67\x34\x18\x62\xed\x3d\xf9\xe4\x93\xd2\xb7\xef\x29\xe6\x66\
+\x68\xe8\xf0\x57\x3f\xfb\xec\xf3\x72\xc1\x05\x17\x34\x29\x91\xd7\
+\x5a\x40\xc8\x5e\x32\xbd\x48\xaf\x2d\xc6\x0c\xb4\xb6\x9f\x32\x1d\
+\x75\x69\xe1\xd8\x6c\xb3\xcd\x64\xef\xbd\xf7\x96\x7f\xff\xfb\xdf\
+\xc6\xbc\xcf\xab\xa2\xa2\x4a\x7a\xf7\xee\x2d\x53\xa6\x4c\xb9\x28\
+\x14\xaa\x7f\x3c\x5d\x7b\x9b\xd2\xf7\x1e\x18\xaa\xd9\xae\xa9\xa9\
+\xb9\xec\xc6\x1b\x6f\x1c\x01\xd3\x4b\x55\x55\x95\x60\x41\xf1\x74\
+\x7a\x9c\x3a\x91\x2c\x5f\x8e\x0b\xd0\xcd\x58\xf5\x42\x2a\x2a\x2a\
+\x30\xa6\x0b\x48\x68\xbb\xec\xb2\x8b\x3c\xf7\xdc\x73\xf2\xbb\xdf\
+\xfd\xce\x48\x6a\x34\x6b\x40\xbb\xfa\xc7\x3f\xfe\x61\x36\x36\x2b\
+\xd4\xe3\x3b\x9e\x7a\xc1\xf6\x5a\x7b\xb3\xa7\xda\x00\x07\x1d\x74\
+\x90\xd9\x64\xac\x42\x83\x7e\x96\x97\x97\xcb\xbf\xfe\xf5\x2f\x33\
+\x36\x7d\xd1\x77\xd8\x1a\x92\xb1\x66\x94\x78\x67\xa2\xb9\xd1\xcc\
+\xca\xed\xe3\xd5\xfd\xa4\xb6\xcf\x80\x27\x4a\xff\x00\x43\x04\x4c\
+\xc1\xdc\xb4\xff\xfe\xfb\x9b\x39\xc1\x7c\x00\x30\x21\x00\x4c\x9c\
+\x38\xd1\xcc\x1f\xa2\x4d\x21\x14\x78\x9a\x61\x6e\x59\xa7\x9e\x63\
+\xcc\x05\xdc\x0a\x3f\xfe\xf1\x8f\xe3\xd5\x66\xb0\xbe\x16\x2f\x5e\
+\x2c\x13\x26\x4c\xd8\x08\x0c\x5b\x53\x28\x49\x24\x60\x71\x7d\xb5\
+\x17\x18\xba\x23\xdc\x31\x13\xb0\x58\x9c\x72\xca\x29\x46\x00\x87\
+\xcf\x15\x95\xb2\xd0\xf7\xd1\xa3\x47\x9b\x08\x70\x9f\xcf\x7f\x79\
+\x34\x1a\x7a\x24\xb7\xb3\xd6\x71\x5b\xf3\xc0\x30\x36\x77\xab\x57\
+\xaf\xbe\x62\xd8\xb0\x61\xc3\x1f\x7a\xe8\x21\xa3\x01\xc1\x87\x87\
+\x85\xcd\x02\xd5\xd0\xcc\xb4\x59\x54\x6b\x18\x64\xf6\x89\xb4\x0c\
+\x6a\x91\x0d\x0d\x75\x71\xb3\x21\x98\x2b\x7c\x86\x00\x16\x6a\x51\
+\x60\xaa\x08\x04\x40\xa0\x06\xda\x71\xe7\xeb\xb1\x9c\x9b\x06\xc2\
+\xb6\xd4\x0e\x19\xba\x8d\xdf\x2c\x2a\xe0\x06\x14\x77\x7f\x28\x24\
+\xe4\x22\x80\xc6\xbd\xc5\x12\x81\xa1\xfb\x33\x82\x1a\x9e\xe5\x3c\
+\xe8\x94\x18\xdd\x26\xcd\xd9\x14\x42\x30\xd7\xba\xdf\xc9\x8e\xda\
+\xa2\x20\xe3\x81\x61\xee\x99\xa0\x9e\x4f\xfc\xcd\xfd\xe7\x36\x07\
+\x62\x9e\xb8\x07\xb1\x06\x13\x1d\x96\x9d\x8b\xbd\xe2\x5e\x5f\x89\
+\xd6\x7f\x7b\x81\x61\x32\xea\xeb\x9c\x60\x58\xb9\x20\xdc\x41\xb8\
+\xee\xd9\xb3\x27\x03\x02\x07\x85\x42\xf5\x7f\xcb\xfd\xec\x75\xbc\
+\x16\x3d\x30\x14\xc1\xa2\xb8\xe2\xd6\x5b\x6f\x1d\x0e\xbf\x10\x17\
+\x0f\x36\x18\x80\x10\x1a\xa2\x8d\xd4\x72\x9a\xd4\x44\xd4\x9b\x53\
+\x9b\x4f\x08\x92\x68\x07\x41\x27\xd0\x06\xed\x67\x11\x93\x5a\x81\
+\xf6\xa0\x59\xdd\x78\xe3\x8d\x72\xc0\x01\x07\x18\x8d\x02\xed\x03\
+\x7c\x07\x0d\x1a\x64\x72\xa6\x08\x3c\xf8\x0c\x4c\xb8\x7b\xf7\xee\
+\xf2\xdd\x77\x3f\xc4\xda\xb1\x47\x97\xb5\xf5\xa6\xa3\x69\x88\x9a\
+\x2a\xc6\xcf\x74\x0b\xf4\x97\x29\x27\x04\x0d\x5d\xa9\xa6\xb5\xc0\
+\x50\x4b\xe8\xf4\xe1\xb8\x19\x28\x68\x45\x46\x49\x20\x4c\x76\xc2\
+\x01\xe9\xce\x60\xa1\x58\xad\x47\x63\x26\x27\xb0\x82\xee\x98\x5b\
+\x80\x26\x53\x68\x30\x76\xcf\x4c\x9a\x7b\xe6\xa7\xe7\x12\x73\x87\
+\xf9\xb1\x56\x12\xeb\xb2\x60\xd5\x27\x9e\x14\x43\x20\x74\x6b\x85\
+\x5a\x70\xcd\xa6\x97\xe8\x0f\x85\x26\xae\x07\xf6\x91\xee\x81\xb6\
+\xde\x97\x1c\x8f\xae\x10\xc5\xf5\xcd\xfd\x49\xf7\x0c\xf8\x0f\x2c\
+\x5d\xe8\x33\x3e\x83\x00\x8e\xab\xa0\xa0\xc0\x03\x44\xf0\x89\x6c\
+\x16\x47\x67\x78\x76\xd9\xb2\x65\x97\x0d\x1b\x36\xcc\x98\x46\xc1\
+\xe0\xb0\xa8\x35\xb3\x6c\xdc\x78\x99\x8d\x96\x8c\x7f\xcb\x2d\xb7\
+\x94\xdb\x6f\xbf\x1d\xce\xea\x18\xa3\xb4\xd5\x59\xb8\x89\xb6\xdb\
+\x6e\x3b\xf3\x39\x37\x13\x36\x36\x4e\xb1\x5e\xbd\x7a\xb5\x01\x61\
+\x5c\xac\xb0\x81\x44\xff\xab\xae\xfa\x8b\x31\xcd\xe1\x3b\xb5\x88\
+\x4d\x5f\xdb\xa2\xdc\x59\xa2\x68\x3d\xb7\x66\x45\x6d\x16\x20\x41\
+\x80\xcf\x8c\x6a\x99\xdd\xa5\x41\x95\x8c\x89\x41\x49\xba\xda\x0f\
+\x7c\xb1\xd7\x5c\x73\x8d\x91\x7e\x61\xba\x85\x30\xf1\xf9\xe7\x9f\
+\x9b\x20\x18\xd0\x0e\x0c\xcb\x0d\x88\x9a\xb9\xb9\xcd\x9d\x8c\x30\
+\x4d\xd5\xcb\x5c\x68\x1e\x99\x51\x21\x37\x77\x69\x41\x22\x37\x2d\
+\xa6\x6e\x45\xd3\x87\xeb\x5e\x5b\x3f\xd2\xf5\x01\xcf\x64\x72\xe5\
+\xca\x72\xe2\x5e\x6b\xf4\xdf\xc3\xf4\x88\xe8\x55\x08\xb2\xd8\x8b\
+\x58\x77\x10\x96\xfe\x4f\x41\x92\x54\x00\x00\x20\x00\x49\x44\x41\
+\x54\xf6\xb7\xbf\xc9\xe4\xc9\x93\x8d\x50\x88\x7b\x69\x89\x48\xe5\
+\x2a\x70\x5b\x92\x32\x19\x5f\x4b\xef\x49\xb7\x7f\x0b\x0a\x0a\x2e\
+\xaf\xaf\xaf\xdd\xa4\x4d\xa6\x9b\x34\x18\x96\x95\x95\x0d\x1c\x3a\
+\x74\xe8\x63\x30\x59\x82\x39\xe2\x87\x79\x7f\xd4\x28\xf8\xdb\x9c\
+\x90\x92\xe2\xd2\x9a\x09\xda\xd9\x6a\xab\xad\xe4\xef\x7f\xff\xbb\
+\x9c\x7c\xf2\x89\x1b\x3d\xa5\x4d\x70\x64\xc2\x3a\x9d\x02\x0f\xd0\
+\x27\x87\x76\x91\xcb\x76\xfc\xf1\x27\x9a\x1c\x44\x9a\x70\x71\x4f\
+\x6b\x46\x6b\xba\x3b\x9d\x6e\x33\x31\x05\xa4\xb5\xca\xb1\x69\xc6\
+\xe1\x36\x59\xda\x42\xe8\x0d\x46\x53\x05\xdd\x4e\x3c\xf1\x44\x19\
+\x3e\x7c\x38\x92\x8d\x0d\xf8\x95\x96\x16\x9b\x5c\xc8\x93\x4e\x3a\
+\xc9\x44\xbc\xba\x85\x07\x5d\xbd\x43\x9b\xdb\x48\x83\x4c\x80\xa3\
+\xad\xc1\xd0\xdd\xa7\xb6\x7e\x7f\x4b\x99\xb2\x7e\x0e\x63\x60\x20\
+\x56\x3a\x60\x4c\x37\x07\x5c\x9f\x2d\x05\x43\x2d\xf0\xe0\x5d\x7a\
+\x8d\xe0\x3b\x6a\x5e\xdc\xd7\x27\x9c\x70\x9c\x89\x30\x47\x64\x31\
+\xac\x46\x48\x2d\x7a\xfb\xed\xb7\xe3\xee\x0d\x6d\x21\x61\x0c\x80\
+\x7b\x8e\xf2\x09\x0c\x63\x5a\xf6\x26\x1d\x54\xb3\xc9\x82\x61\x55\
+\x55\xd5\xf9\x43\x87\x0e\x7d\x06\xda\x02\x18\x29\x35\x0b\xad\x15\
+\x34\x5d\xac\x8d\xd1\xa4\x89\x18\x81\x7b\x63\x03\xb4\x90\x3e\x71\
+\xc2\x09\xc7\x4b\x75\x75\x8d\x89\xe8\xa2\x19\x87\x92\xb1\x76\xba\
+\x83\x19\x30\xb7\x8d\xd5\xf8\x19\xcd\xf8\xed\xb7\xdf\xca\x29\xa7\
+\xf4\x35\x49\xed\xad\x19\x94\x92\x8a\xc1\xa5\x63\x46\x5a\xcb\xd5\
+\x26\x45\x0a\x19\xb9\x60\x9e\x68\x03\xef\x21\x5d\x68\x32\x63\x7d\
+\x58\x9e\x1e\x72\xee\xb9\xe7\x0a\x4e\x14\x29\x2c\x44\xc4\xab\x8d\
+\x3a\x9c\x35\x6b\xb6\x1c\x7c\xf0\xc1\x26\xd8\x07\x73\x43\x49\x9f\
+\xa7\x8d\x90\x51\x25\x63\x50\xe9\xc6\xdf\x96\x60\x44\xfa\x6a\x81\
+\x2d\x1d\x7d\xdd\xfd\x6b\xcb\xfe\xa2\x6f\x78\x1f\x4c\x73\x00\x16\
+\xec\x37\x06\x23\xe5\xca\xac\xa8\x85\x35\x0d\x88\xe9\xe8\xa2\x05\
+\x1e\x3e\xa7\x4d\x8e\x9a\x2f\xa0\xcf\x08\xaa\x43\xfa\xd3\x11\x47\
+\x1c\x66\x52\x3c\x18\xa9\x79\xde\x79\x17\xc8\x0b\x2f\xbc\x10\xd7\
+\x0a\xd9\x06\xd6\x3f\x23\x94\xdd\x42\x18\x05\xaf\x4c\xfb\x98\xcd\
+\x7d\xe9\xd6\x2f\xc6\x69\xd3\xc8\x7c\x17\x88\x44\x36\xc9\xb4\x8b\
+\x4d\x12\x0c\xcb\xcb\xcb\x4f\x1b\x36\x6c\xd8\xab\x0f\x3e\xf8\x60\
+\x3c\x02\xd0\x9d\x27\xb4\x31\x53\x4c\x0d\x86\x64\xd4\xf8\xcd\x8a\
+\x32\x48\x9f\x38\xfa\xe8\x23\x8d\x04\x09\x37\x87\x36\xf5\x30\x0f\
+\x4f\x6b\x89\x34\xcd\x10\x18\xd1\x07\x30\xfc\x05\x0b\x16\x48\x9f\
+\x3e\xa7\xca\xdc\xb9\x73\xe3\xfe\x2f\x5d\x1c\x3a\x59\x70\x47\x36\
+\x9b\xa7\xb9\xcf\x52\x4b\xd5\x74\xd3\x41\x29\xcd\x6d\xcf\x7d\x3f\
+\x35\x08\xb4\xaf\x4f\x2b\x60\x1e\x28\xee\xa7\x4f\x04\x89\xd9\x38\
+\x70\x99\xcc\x06\x1a\x23\x68\xf7\x7f\xff\xf7\x7f\xc6\xa4\x45\x1f\
+\x0a\x7f\x67\xd2\xb7\x74\xcc\xa4\xad\xc1\x85\xfd\xc9\x54\xbb\xc8\
+\x16\x2c\x32\xa1\x51\xaa\x7b\x34\x7d\xe8\x4f\x26\x48\xe6\xc2\xcc\
+\xef\x36\x65\x37\x77\x3e\xf4\x7e\x4a\xb4\x96\xb9\xbf\x21\x70\x3d\
+\xff\xfc\xf3\xd2\xbb\xf7\xb1\xb2\x61\x43\x99\x6c\xbe\x79\x0f\xa3\
+\x19\x9e\x79\xe6\x99\x26\x5d\x8a\x05\x18\xf0\x7e\xb4\xc9\x93\x36\
+\xd8\x3f\xb7\x3f\xb3\xb9\xfd\xcc\x76\x1e\x52\x3d\x8f\x7d\x82\xf5\
+\x54\x57\x57\x7f\xba\x48\x64\x93\x4b\xcc\xdf\xe4\xc0\x30\x1c\x0e\
+\x1f\x3b\x64\xc8\x90\xf7\x50\x63\x13\x89\xd2\x58\xb0\x58\xa8\xb4\
+\xf5\xbb\x4d\x63\x8d\x8b\x35\x3d\x18\xd2\x74\x89\xf6\x70\xd8\x2f\
+\x18\x32\xcd\x29\x88\x26\x85\x46\x82\x0b\x00\xc7\x40\x1d\x80\x21\
+\x36\x10\x41\x94\xef\xa7\xd9\x11\x66\x3e\x84\x44\x1f\x75\xd4\x31\
+\xc6\x67\x48\x53\x2e\x9e\x89\x9d\x5d\xb6\xd1\x69\x19\xad\xb9\x61\
+\xd2\x69\x8f\x4c\x33\x00\x60\x21\x10\x05\xb4\x40\xd0\x50\xb6\x17\
+\xda\x05\x63\x41\x7b\xf4\xf7\xa1\x7d\x06\x4f\xe0\x37\xc0\x10\xb9\
+\xa1\xc8\x0b\x04\xed\x03\x81\xc6\xe5\xbd\x70\xe1\x77\x26\x34\x7f\
+\xed\xda\xb5\xc6\xd7\x03\x50\x64\x7d\x58\xce\x7f\xb6\x7d\x6c\xcd\
+\xe7\x13\x31\xd3\x44\x5a\x4d\xb2\x3e\xb4\x37\x18\x42\xa3\x42\x40\
+\x18\x85\x3f\xf4\x47\xfb\x98\xb5\x50\xd3\x12\x3a\x6a\x61\xa5\xa5\
+\x00\x43\xeb\x8e\x16\xb8\x68\x32\xc5\x6f\x08\xab\xd8\xd7\xc8\x41\
+\xfe\xf3\x9f\x8f\x36\x55\x98\x90\x32\x85\xab\x6f\xdf\xd3\x4d\x5a\
+\x14\x85\x36\x8e\x53\x47\x73\xd2\x32\xd4\x9c\x79\x6b\x09\x2d\x5a\
+\xfa\x0c\xc6\x08\x1e\x65\xf7\xab\xaf\xb7\x48\x64\x93\x2a\xdd\xb6\
+\x49\x81\x21\x8a\x6e\x3f\xf8\xe0\x83\xa3\x6f\xbf\xfd\xf6\x02\xe6\
+\x11\x22\xc0\x22\x59\x24\x20\x25\x57\xbb\xb8\x52\x83\x21\xb5\x3a\
+\x48\x57\x00\x3b\xfc\x3e\xe1\x84\x13\x64\xd7\x5d\x77\x8d\x31\x71\
+\xab\x19\x82\x01\xc0\x97\x05\x1f\x03\xfc\x0f\xdc\x34\x60\xe2\x30\
+\xbf\xc0\x24\x8a\x7b\xc8\xe4\xf1\x3d\x40\xef\xc3\x0f\x3f\x32\x8c\
+\x9e\x01\x33\x3a\x90\xa6\xa5\x8b\x3f\x97\xcf\x21\x58\x05\x26\x48\
+\x6a\x83\x64\x6e\x00\x6d\x00\x7b\x2e\x98\x1d\x98\x09\xe9\x8b\xbe\
+\x33\x0f\x90\x51\x73\x9c\x03\x68\x86\xa8\x56\xd2\xa3\xc7\x66\x66\
+\x88\x35\x35\x75\xc6\xdf\x7a\xdc\x71\xc7\x99\x00\x25\x56\xe2\x00\
+\x2d\x75\xa0\x43\xb2\xb4\x8b\x5c\xd2\xa9\xa5\x6d\xa5\xd2\x00\xc9\
+\xc4\x33\x69\xbb\xa5\x40\x91\x49\xdb\xa9\xee\xd1\xb4\x4d\x26\x80\
+\xa6\x13\xb4\x52\x7d\x9f\x8b\x71\xe9\x5c\x54\x6d\xc2\xd4\x80\x86\
+\xc0\x38\x08\x5a\xa8\x91\x8a\x12\x89\xd4\x6a\xcf\x39\xe7\x1c\xb3\
+\x7f\xb9\x2e\x59\x05\x06\x42\x00\x78\x8c\x3b\x0f\x30\x53\x8d\x3e\
+\x5b\xba\x67\xfa\xbc\xb6\x92\xc4\xa2\xa5\x43\x8e\x13\x39\x5c\x44\
+\x36\x99\xe2\xde\x9b\x0c\x18\x36\x34\x34\xec\x39\x72\xe4\xc8\x8f\
+\x87\x0e\x1d\xba\x25\xb4\x03\x4a\xa5\x00\x26\x30\x48\xbd\x11\xb0\
+\x80\x36\x96\x34\x53\x83\xa1\x3b\x2c\x1f\x6d\xe8\xa8\x39\x68\x29\
+\xd4\x68\x00\x90\x38\x05\x61\xf7\xdd\x77\x37\x6b\x15\x1b\x19\xfd\
+\x41\xad\x4b\x38\xe1\x09\x78\x34\xab\xda\x60\x9a\xa6\x15\x68\x08\
+\x00\x6d\xe9\x77\xc8\x64\x63\x21\x72\x13\x17\x18\x00\xa4\x4c\xd0\
+\x05\x20\x9e\xed\xc5\x71\x32\x80\x08\x4c\x89\xc9\xff\x64\x40\x94\
+\xde\x61\x0e\x45\xc4\x1f\x00\x1a\xe6\x69\x04\x3f\x7d\xff\xfd\xf7\
+\xa6\xae\xea\xf2\xe5\xcb\x4d\x57\xa8\xad\x82\x59\xa1\xbe\x28\xc0\
+\x92\x5a\x77\x3a\xff\x61\xb6\x63\xc9\xd5\xf3\x3a\xcc\xbf\x23\x1c\
+\x2e\x8c\x35\x8b\x35\x0d\x2b\x0c\x05\x11\xd0\x22\x17\x66\xd2\x6c\
+\x69\x8a\xb5\xc3\xd3\x56\xd0\x47\xac\x2d\x08\xab\xb0\x46\x60\x0d\
+\xc3\x3c\x0a\x2b\xcd\xb6\xdb\x6e\x6b\x2c\x0f\xfb\xed\xb7\x5f\x7c\
+\x6d\x61\x8d\xdd\x77\xdf\x03\x32\x7d\xfa\x74\xb3\x8f\x59\xd2\x8f\
+\x6d\x22\x5d\x0a\x82\x22\x05\x02\xac\xaf\x7c\x03\x43\xd0\x4f\x03\
+\x22\xc6\xec\xf3\xc9\xda\x60\xb0\xcb\x61\xd5\xd5\x65\x9b\xc4\xf1\
+\x4f\x9b\x04\x18\xe2\x60\xde\xe7\x9f\x7f\x7e\xcc\x90\x21\x43\x76\
+\xfa\xe6\x9b\x6f\xcc\xa2\xa7\xc9\x82\x8e\x7c\x6a\x87\x2d\x0d\xa0\
+\x21\x38\x31\xb2\x11\x26\x3c\x1e\xfa\x8b\x45\x06\x33\x29\x13\xd6\
+\x51\x9b\xf4\xbd\xf7\xde\x93\x9f\xff\xfc\xe7\xf1\x8a\x26\x58\x8c\
+\xd0\x5c\xf0\xb9\xd6\xfa\xc0\xf0\xac\xef\xc1\x46\x4b\xe2\x02\x33\
+\x61\x2e\x5c\x5b\x45\x94\xa6\xf3\x99\xe1\x7b\x94\x69\x83\xef\x84\
+\x0c\xaf\x57\xaf\x5e\xf2\xd9\x67\x9f\xc9\xbd\xf7\xde\x1b\x2f\x5b\
+\x96\x0d\xd3\xe2\x49\x12\x60\x4a\x47\x1e\x79\xa4\x3c\xfc\xf0\xc3\
+\xb2\xeb\xae\x3b\xc7\x8b\x86\x43\xfb\x64\xbe\xe3\x16\x5b\xf4\x34\
+\x20\x88\x79\x86\x20\x12\x0e\x47\x65\xe5\xca\x95\x02\x10\x05\xcd\
+\x30\x37\xa0\x27\x24\xf6\x8f\x3f\xfe\xd8\xd4\x85\x05\xa0\x30\x5f\
+\x4c\x0b\x44\xb9\xd0\x3a\xb2\x19\x77\xa2\x67\x09\xfc\xa0\x35\xc6\
+\x73\xfc\xf1\xc7\x67\xf4\x0a\xb7\xaf\x91\xe3\x6c\xed\x31\xa2\x8f\
+\xa0\x37\xd2\x87\x00\x1a\x28\xdd\x87\x63\xcd\x74\x8e\x6a\x7c\x00\
+\xe0\x4a\x26\x9d\x36\x33\xd7\x44\x46\x03\x4f\x73\x13\xe8\x42\x13\
+\x3c\x8a\x62\xdc\x72\xcb\x2d\x66\x8d\xe1\x33\xe6\x95\x92\x37\x74\
+\xeb\x56\x1a\x3f\xb5\x05\xfb\x52\x47\xc4\xe2\x6f\x00\x3d\x2b\x13\
+\xc1\x1c\x8f\x9c\x62\xf8\x19\x13\x59\x1e\x5a\x9b\xee\x1c\x76\xba\
+\xfd\xcb\x00\x1a\x2d\x64\x43\x50\x2c\x2f\x2f\x9f\x5f\x5c\x5c\xf4\
+\xa7\xda\xda\xce\x7f\x40\x70\xa7\x07\x43\xc7\x71\x8a\x3f\xf8\xe0\
+\x83\xb1\x97\x5c\x72\xd9\xef\x70\x10\x2b\x4c\x64\x3c\x84\x96\x92\
+\x2a\xf3\xf6\xf4\x7e\x69\xee\x22\x4d\xb7\xd8\x18\x4d\x07\xf0\x45\
+\x39\x36\x44\x9a\x62\xd3\xd9\xa8\x46\xf8\xc1\x1c\x53\x3a\x09\x60\
+\x08\xf0\xa4\xe6\xe2\x3e\x9a\x25\xdd\xc6\xd7\x67\x29\x32\xea\xd2\
+\x1d\x26\x9e\x48\x12\xd7\x01\x08\xcd\x19\xbb\x0e\x92\x81\x1f\xf6\
+\xba\xeb\xae\x33\x63\xb2\x80\xdd\x45\xd6\xae\x5d\x2f\xbf\xfd\xed\
+\x6f\x4d\x7a\x48\xaa\x2b\xd1\x3b\xdd\x8c\x9b\x49\xd6\x00\x2c\xa4\
+\x49\xc0\x77\x43\x53\x28\xe8\xe7\xf7\xfb\x4c\xe4\xa8\xd5\x36\x1a\
+\x8f\x98\xaa\xac\xb4\xc0\x87\xe8\x52\x80\xa2\x05\x12\x84\xcf\x5b\
+\xb0\xc4\x31\x37\x00\x13\xb4\xab\xcd\xb9\x6d\x25\x68\xa4\x02\xde\
+\x46\x0d\xa2\xd1\xa4\xeb\xce\x81\x83\x2f\x74\xe4\xc8\x91\xb2\xf3\
+\xce\x3b\xc7\x23\x92\x99\x22\xa4\x05\xbf\x74\x6b\x27\x9b\xef\xb5\
+\x4f\x32\x51\x3b\x98\x1f\xac\x73\x94\x4f\x43\xa5\xa5\x4f\x3f\xfd\
+\x14\xb3\x24\xe2\x77\x24\xd4\xe0\xca\x5b\x8a\x83\x61\x63\x4b\xfe\
+\x40\x40\xa2\x91\x88\x14\x20\xf1\x1e\x51\x8f\x8e\xdf\x86\x09\xc7\
+\xea\xf7\xc6\x4b\xe9\xc5\x1f\x69\x0a\xa4\x0e\xde\x95\xe6\xa2\x29\
+\xf3\x47\x3f\xfa\x91\xd9\x9f\xa0\xab\x4d\xf6\x47\x29\x46\xbb\x9e\
+\x78\x9e\x25\x52\x2a\xe0\x33\xc4\xfa\xb1\x80\x69\xcf\xf6\xd4\xeb\
+\x8e\xd1\xa6\xfd\xfa\x0d\x90\x67\x9f\x7d\x36\x5e\x5b\xb8\x39\xfb\
+\x4b\x83\x99\xfb\x39\xbd\x3f\x72\xa5\x5d\xa3\x4d\x0a\x06\x0c\x74\
+\xf2\xf9\x7c\x9f\xd5\xd5\xd5\x1c\x2a\x22\x36\x4b\xbf\x93\x5e\x9d\
+\x1e\x0c\xc7\x8d\x1b\xf7\xee\xa0\x41\x83\x7a\xcf\x9f\xbf\xd0\x48\
+\x6b\xda\xfe\x4f\xa6\xe2\x8e\x44\xc3\x5c\x37\x77\xc1\xa6\x03\x43\
+\xbc\x17\xf7\x00\x24\x7e\xf9\xcb\x5f\x9a\x93\xe1\xf7\xdc\x73\x0f\
+\xb3\x79\x18\x59\x0a\x86\x8c\x1a\x9f\xd0\x0c\xb1\xb9\x59\x1a\x2c\
+\x5d\x0e\x16\xfa\xcb\xb2\x71\x89\x36\x05\x53\x36\x30\x26\x82\xa5\
+\x2e\x2e\xa0\x53\x3c\x9a\x3b\x76\x0d\x86\xc3\x86\x0d\x93\x6b\xaf\
+\xbd\xc6\x30\x05\x82\xd3\x92\x25\x4b\xe5\xd0\x43\x0f\x35\xc1\x3f\
+\xd9\x80\x21\x37\x28\xe7\x0f\x45\xcd\x91\xc7\x09\xb3\x29\xcc\xde\
+\x08\x6c\x00\xd3\xe2\xc5\xbc\x50\x9e\xb9\xa8\xdf\x0d\x26\xc6\x8d\
+\x0e\x06\x3d\x7e\xfc\x27\xa6\xd0\x78\x7b\x83\x61\x32\x81\xc0\x06\
+\x71\x84\xe3\xc7\x7a\x11\xa4\x31\x6f\xe8\xf3\xef\x7f\xff\x7b\xc3\
+\x6c\x71\x3e\x26\xd7\x34\xdb\x22\x83\x4f\xb7\x3e\x5b\x9b\xbf\xf1\
+\xfd\x98\x2b\xcc\x1d\xea\x89\x9a\x0b\x1c\x88\xb8\x65\x8b\x2b\x35\
+\x5e\x4a\x3b\xf4\xf9\x45\x1c\x4c\x6a\x8c\x59\x1b\x30\xc4\x3e\x75\
+\x25\x00\x37\x32\xb4\xe6\x81\xa1\xf6\x6d\xff\xe4\x27\x3f\x91\x97\
+\x5e\x7a\x49\x0e\x3e\xf8\x20\xa9\xad\xad\x8b\xf7\x07\xc2\x5d\xb2\
+\x0b\xc0\x47\xed\x8a\x3e\x5c\xbb\xdf\x02\x92\x2b\x30\x4c\xb4\x37\
+\x13\x69\xfa\x89\xee\x6b\x0e\x3f\x23\x20\x9a\xe9\x89\x49\x97\x91\
+\x48\xf8\x3d\x11\xe7\xb8\xd6\x5e\x27\xed\xd9\x7e\xa7\x06\xc3\xe9\
+\xd3\xa7\x3f\xd1\xbf\x7f\xff\xfe\x33\x66\xcc\x88\xef\x38\x2c\x7a\
+\x82\x0c\x80\x83\xbe\x16\x37\xb3\x68\xce\xe2\xd1\x8b\x26\xd9\x64\
+\xea\x28\x48\x80\x21\x98\xd7\xfe\xfb\xef\x6b\xc0\x10\xda\x08\xf2\
+\x95\xce\x3e\xfb\x5c\xb3\x09\x09\x58\xf4\x31\x36\xb7\x2f\x2c\x23\
+\x06\xe0\x65\x0e\xa5\x3b\x80\x45\xfb\x1a\x29\xd5\xf3\x3d\xcd\x79\
+\x1f\x41\x05\xcf\x00\x0c\x2f\xbb\xec\xb2\xb8\x0f\x14\x40\x05\x5f\
+\x1d\x80\x66\xde\xbc\x79\x59\x81\xa1\x1b\xe4\x11\x24\x03\xcd\x90\
+\x52\xbb\x4d\x47\xb1\xe7\x3e\x42\x4a\xc7\x05\x46\x66\x73\xdb\x2c\
+\x38\x63\xae\x41\x67\x0d\x94\xc8\x43\x1c\x33\x66\xac\x31\x51\x53\
+\x00\xd1\x3e\xc3\xe6\xd0\x22\xd7\x1b\x59\x33\x3a\x94\xf3\xa3\x30\
+\xc3\x3c\x54\x96\xd4\x82\xe6\x0d\x1f\x34\x8a\x58\xe3\x62\x50\x16\
+\xd7\xa5\xfe\x3f\xd7\x7d\x64\x7b\xe9\xe8\x04\x9a\x83\xfe\x35\x35\
+\x55\xa6\x2a\xd3\x17\x5f\x4c\xb5\x02\x49\xc0\x16\x8f\x68\x68\x08\
+\x19\x64\x8c\x62\x42\xcc\x41\xd6\x31\xcd\x0f\x37\x98\x41\x85\x25\
+\x58\xe0\x97\x30\xca\xb1\x05\x02\x8d\x69\x0b\xd1\xa6\x08\xea\x4b\
+\x62\x5a\x75\xe3\x6c\x2a\x3a\xc0\x8d\x81\x9c\xc1\x43\x0e\x39\xc8\
+\x02\x6e\x2c\x57\x15\x7f\x63\x7d\x31\x95\x89\x25\xf9\x6c\x44\x38\
+\xf2\x88\xad\xb2\xaa\x2f\xdc\x8f\xa3\xbe\x60\x26\x6d\xc9\xfe\x62\
+\x5b\xe9\xa2\x89\xdd\x3e\xc8\x74\xf3\xd1\x92\x75\x10\x08\x14\x3c\
+\x19\x89\xd4\x0f\x68\xc9\xb3\x1d\xe1\x99\x4e\x0b\x86\xff\x3b\x5a\
+\xe7\xf6\xab\xae\xba\xea\xb6\x0f\x3f\xfc\x30\x06\x2e\x8d\x01\x2c\
+\x58\x28\x58\x3c\xd4\xd6\x78\xa2\xb9\x9e\xb0\xe6\x2e\xa6\x74\x92\
+\x37\xdf\x89\xfb\xf6\xd8\x63\x0f\x53\xaa\x0d\x65\xc3\xa8\x95\xc1\
+\x97\x82\x83\x84\x3f\xfa\xe8\xa3\x26\xbe\x85\x4c\xfb\x91\xa8\x78\
+\xb1\x2e\x39\x86\xcd\xa4\xd3\x31\x78\x3f\xc6\xec\xce\xb1\x4c\xf5\
+\x4e\x0d\xa2\x64\xb6\x04\xfa\x07\x1e\x78\x40\xae\xba\xea\x2a\x03\
+\x3e\xbc\xbe\xfe\xfa\x1b\x63\xd2\x84\xaf\x36\xd5\x95\xce\x4c\xca\
+\xe4\x67\x02\xc2\x51\x47\x1d\x65\x68\x88\x00\x28\x30\x25\x9a\xbc\
+\x91\x86\x82\x20\x87\xae\x5d\x4b\xcc\xeb\x60\x16\xc5\x05\x0d\x70\
+\xc1\x82\x45\xc6\xd7\x4a\x9a\xd3\xb7\x39\x75\xea\x54\xe3\xeb\x64\
+\x81\x80\x4c\x69\xde\xda\x1b\x5c\x4b\xe8\x60\xb6\x88\x2a\xd6\x39\
+\xa5\x0c\x78\x40\x31\x81\x97\x5f\x7e\x39\x0e\x86\x34\xdd\xb1\x7f\
+\x6d\x01\x86\x99\xd0\x02\xf3\x04\xeb\x0c\x2c\x05\x5f\x7e\x39\xdd\
+\x06\x9a\x84\xea\x24\x1c\x72\x43\x15\x16\x10\x54\x41\x9f\x18\xb4\
+\xf4\xe1\x44\xe5\x90\x14\x97\x76\x91\xda\x9a\x1a\xf1\xf9\xfd\xf6\
+\x68\xb3\x86\x06\xf1\xfb\xfc\x4d\xea\xf4\xb6\x14\x0c\x69\x3d\xc1\
+\x3a\xfb\xc5\x2f\x7e\x61\x8e\x2a\x43\x20\x96\xce\x07\x06\x1d\x21\
+\x54\xee\xb4\xd3\x0e\x1b\x0d\x17\xd6\x06\x04\x67\xb1\x1d\xec\x09\
+\xb8\x3a\x30\x67\x7f\xfd\xeb\x5f\x8d\x90\x9b\x0b\x30\xb4\xe0\xbc\
+\x31\xb4\x67\x2b\xcc\x67\x32\x7f\xb1\xbd\x7f\xc7\xff\xcc\xdb\xb7\
+\x67\x72\x7f\x47\xbb\xa7\x53\x82\xe1\xf2\xe5\xcb\xfb\xdd\x7a\xeb\
+\xad\x4f\x3e\xf5\xd4\x53\xf1\x60\x19\x9c\x54\xcf\x82\xca\x58\xf0\
+\x88\x12\xc3\xa2\x62\xba\x43\x6b\x2f\x26\x6c\x7c\xbc\x8b\x0c\x0d\
+\xd1\x6a\x0c\x94\xc1\x86\x83\x99\x0f\x4c\x19\x85\x74\xc9\xac\xed\
+\x09\xf7\xf6\x70\xe1\x4c\x2e\x9a\xc8\xf0\x9b\x81\x3c\x34\xdd\xe0\
+\x33\xbc\x0f\x51\x6d\xbc\x30\x66\x06\x30\x64\xe2\x33\x74\x4b\x9f\
+\x04\x43\x02\x24\x0e\x59\x85\xd4\xcf\xe4\x5d\xbc\x13\xa9\x22\x00\
+\xc9\x6c\xcd\xa4\x6e\xcd\x10\x47\xd2\x40\x23\x02\x7d\xc0\xa4\x30\
+\xb7\x1c\x33\x7c\xaf\xfd\xfa\xf5\x33\x65\xd8\x78\xc1\x4c\x8e\x68\
+\x52\x7b\x74\x8d\x2f\x9e\xba\x82\x3e\x82\x89\x21\xa8\x43\x47\xfb\
+\x65\x42\xef\xd6\xbe\x87\x60\x88\xdf\x18\x0b\x03\xb2\x48\x6f\xae\
+\x8f\xc3\x0f\x3f\xdc\x9c\xf5\x07\xcd\x30\x51\x61\x07\x32\xf4\xd6\
+\xee\x6f\xaa\xf6\xb1\xdf\xd0\x5f\x04\x94\x1c\x79\xe4\xe1\xf2\xc5\
+\x17\xd3\x6d\x85\x20\x9f\x48\xa8\x21\x6c\xb4\x3d\x98\x3e\x1d\x7f\
+\x40\x00\x68\xf6\x94\x16\x00\xa2\x5f\x7c\xfe\x88\x84\xeb\x6b\x24\
+\x58\xe8\x8b\x07\xbe\x11\x14\xfc\xd0\x26\x95\xa9\x34\x19\x43\x73\
+\x9a\x19\x8c\x83\xda\xa3\xdb\x6c\xb3\x8d\xe1\x13\x4c\xe1\xc1\x3b\
+\xa1\x35\xe2\x1c\xcb\x1d\x76\xd8\xde\x68\x89\xe0\x21\xf8\x79\xf4\
+\xd1\x47\x65\xec\xd8\xb1\xf1\x33\x3e\x31\x0f\x58\x9b\xb0\x8e\xc0\
+\x32\x05\x61\x37\x1b\x30\x4c\xb4\xf7\xb8\xff\xdc\x74\xd7\xbc\xac\
+\xd1\xcc\x19\xc9\x6a\xfa\xb9\x16\xad\xdf\xbe\xb0\x7f\x28\x54\xf7\
+\x54\x56\x0d\xe6\xe1\xc3\x9d\x0e\x0c\x1d\xc7\x39\x7c\xd0\xa0\x41\
+\x1f\xa1\x70\x2e\xc2\xfc\x11\xe2\x6f\x27\xd2\x46\xdd\x31\xe1\x1d\
+\x0b\x93\x09\xef\xee\x84\xfb\x64\xd2\x57\xb6\xf3\xa7\x03\x32\x74\
+\xe9\x35\xfa\xc1\x18\x20\xc2\xd4\x8a\xe6\x56\x96\x61\x55\xff\xc6\
+\xd2\x4a\x62\x02\x86\x74\xd2\x3b\x68\x81\xcf\x00\xca\x78\x0f\x68\
+\x04\x26\xab\xa3\x68\x93\x69\x46\xa9\xc0\x10\xcf\xa3\x2d\x68\x5e\
+\xfa\x79\x30\x05\xa4\x2e\x64\xa2\x39\x27\xdb\xd4\xdc\x88\xa0\x1f\
+\x8b\x97\xa3\xff\x3c\x78\x19\xdf\xf3\x3b\xcc\x25\x4c\xb5\xf7\xdc\
+\x73\x8f\x6c\xb6\x19\x82\xa5\xc2\x66\x9c\x00\x65\xe4\x7d\xc2\x6c\
+\xab\x2f\x02\x0b\x41\x84\xcc\x2d\x1f\xb4\x43\x8e\x0b\xfd\x8d\x44\
+\x6c\xa1\x06\x68\x57\xda\x0f\x88\x7b\xf6\xdd\x77\x5f\x93\xe3\x06\
+\x8d\x58\x07\xb2\x50\x23\xa4\x55\x22\xdb\xf5\x9b\xcd\xf3\xec\xc3\
+\xba\x75\x6b\x8c\xa0\x02\x8b\x0d\xfc\x6c\xc6\x67\x88\x1a\xa5\x01\
+\x98\x19\x7d\x12\x81\xd9\xd3\x28\xf3\x31\xed\xd0\xfc\x76\x64\xeb\
+\x5e\xdd\x65\xf5\xea\x65\x12\x2c\xb0\x49\xee\x18\x9b\x59\xe7\x75\
+\xf5\x4d\xe7\x33\x49\x27\x33\x01\x43\x9d\x0a\x65\x7a\xe0\xf7\x9b\
+\x7d\xa1\xd7\x3d\xd2\xa2\xe0\xef\xdf\x6b\xaf\x3d\xe3\x7e\x71\x98\
+\x46\xcf\x3a\xeb\x1c\xa3\x9d\xeb\x67\x30\x66\xa6\x5c\x65\x22\x6c\
+\x36\x97\xbe\xda\x72\x90\xab\x00\x1a\x2d\x28\x6b\xb0\xa5\x7f\xba\
+\x91\x87\xf9\x8f\x10\x09\x8f\x6e\x6e\x9f\xf3\xf9\xfe\x4e\x05\x86\
+\x8e\xe3\xec\x78\xd7\x5d\x77\x7d\x3a\x7c\xf8\xf0\x5e\x30\x97\x61\
+\xe2\x90\x1f\x64\xb5\x21\xbf\x31\x7f\xe0\x73\x6c\x24\x84\x0d\x23\
+\xbf\x90\x95\x52\xdc\x11\xa5\xad\xc1\x0c\x59\x69\x86\xe6\x4b\xcd\
+\x88\x6d\x2e\xa1\x35\xdd\x26\xd2\x00\x32\x09\xa2\xd1\x75\x4b\xb1\
+\x78\x11\x58\x81\x9c\x28\xe4\xdb\x31\xe4\x9b\xa6\x1e\x54\xcb\x18\
+\x35\x6a\x54\xbc\x56\x64\xba\xcd\x9a\x4a\x73\xc6\xb3\x36\x2f\xc9\
+\x6a\x5c\x34\xc1\x42\xaa\xc6\x67\x3a\xfa\x31\xd9\x66\x48\x67\x26\
+\xd5\x9b\x9d\xe3\x24\xf8\x33\x78\x08\xf4\x05\xed\xae\xbe\xfa\x6a\
+\xa3\x05\xd2\x57\x88\xc8\xd1\x65\xcb\x56\x98\xc3\x94\x97\x2e\x5d\
+\x6a\x2a\xd5\x50\x00\xa2\x36\xa8\xdb\x27\x20\xb6\xf7\xc6\x55\xd1\
+\x7c\x32\x68\xd0\xe5\xc6\xac\x8e\xbe\xe9\x79\xc6\xdf\xb0\x2a\x00\
+\x10\x21\x8c\x70\x1c\x64\x5a\xfa\x77\x7b\x8e\x27\x1c\xb6\x29\x08\
+\x58\x1f\x38\x14\x19\x51\xa5\x06\x2c\xba\x14\x1b\xed\xa9\xbc\xac\
+\x5a\x42\xa1\xb0\xd4\xd4\x85\xa5\xbe\x0e\x27\xc7\x00\x84\x02\x12\
+\xf0\x17\x48\x20\xe8\xc8\xdc\x39\xd3\xe4\x95\x57\x5f\x68\x52\x85\
+\xc8\xa4\x17\x55\x55\x37\xa9\xc0\x94\x8d\x66\x48\x8b\x8a\x3e\x15\
+\x86\x05\xe0\xf1\x1d\x3e\xdf\x71\xc7\x1d\x8d\xe0\x81\xe0\x37\x16\
+\xea\x06\x5d\xfb\xf7\x1f\x68\x7c\xd8\xe0\x37\xb4\x52\x50\xc8\x64\
+\xda\x56\x36\x9a\x61\xa2\xb9\xd3\xc2\x92\x6e\x3b\x57\xbc\xcb\xad\
+\x61\x62\x6d\xa9\xe0\xbe\x55\x8e\x13\x39\x50\x44\x16\xb4\xe7\xba\
+\xca\xe5\xbb\x3b\x0d\x18\x3a\x8e\xe3\x7b\xfb\xed\xb7\x27\x5d\x7e\
+\xf9\xe5\x07\xc0\xec\x05\xc6\x00\x10\x24\xe3\xb8\xec\xb2\x2b\x4c\
+\xd5\x17\x96\xe0\xc2\x02\x85\x19\x15\x8e\x6d\x2c\xda\xd6\x36\x93\
+\x26\x9a\x34\xfa\xc1\xdc\xbe\x3d\x2c\x3a\xe6\x8f\x41\x93\xcd\x04\
+\x4c\xb4\xc9\x93\x12\x5d\xdf\xbe\x7d\x05\x87\x15\x6f\xbb\x6d\x2f\
+\xf3\x7a\x96\x8f\x82\x1f\xed\xce\x3b\xef\x34\xda\x13\x37\x0e\x81\
+\x39\x99\x56\x4c\xfa\xf0\x3e\xbd\xe1\xc8\x70\x59\x32\x8d\x3e\x2b\
+\xfa\x12\x75\xdb\x2d\x05\x43\x4a\xd9\xa0\x07\xda\x03\xcd\xb4\xd4\
+\x4d\xc1\x67\xc3\x86\x0d\x72\xed\xb5\xd7\x9a\xdc\x46\x5c\x36\x09\
+\xba\x50\x16\x2f\x5e\x2a\x7b\xed\xb5\x97\x29\x00\x00\xe6\x4b\xa0\
+\x8e\x87\xe4\x33\x4a\xb1\x1d\xce\x8a\x4c\x46\x13\x0d\x86\xaf\xbe\
+\xfa\xb2\x9c\x7c\xf2\xc9\x4d\x8e\xfc\xa2\x16\xc8\x31\x70\xad\xd3\
+\xaf\xca\x76\xf3\xc1\x67\x08\xcd\x16\xfd\x85\x46\xcf\xb2\x84\x66\
+\x7e\xa2\x8e\x04\xfc\x36\x48\x26\x12\x16\x29\xaf\xaa\x97\xaa\xca\
+\x5a\x03\x34\x3e\x41\xa0\x4c\x17\x09\x16\x88\x4c\x9e\x34\x5a\xae\
+\x18\x74\xb1\x2c\x5f\xba\x42\xc4\x87\x9c\x18\xbf\x94\x76\x2b\x91\
+\xea\xca\xaa\x26\x79\xb9\xd9\x80\x21\xb5\x41\xae\x6d\x80\x2d\x00\
+\xd0\xf8\x27\x43\x36\x8d\x02\xe9\x2b\x28\x8c\xb1\xfb\xee\xbb\xc5\
+\xc1\x10\xfb\x69\xe0\xc0\x81\x82\x63\xe0\xe8\xfa\xe0\x09\x2a\xcc\
+\x63\xd6\xfb\x2a\x57\x60\xa5\xd7\x07\x04\x41\x0a\x71\xb4\xf2\xe8\
+\x58\x00\xcd\x63\x92\x01\x6b\xba\x7e\xe9\x48\x7c\x5b\x07\xb8\x7c\
+\x8a\x48\xe4\xff\x98\x15\x9a\x4b\x60\x6a\x8f\xb6\x3a\x0d\x18\x8e\
+\x1d\x3b\xf6\x85\x4b\x2f\xbd\xf4\xec\xff\x05\xce\xc4\x93\xdb\x29\
+\xf5\x63\x12\x6f\xbb\xed\x0e\x63\xeb\x47\x20\x05\xf3\x7f\x86\x0c\
+\x19\x26\x37\xdf\x7c\xf3\x46\xe1\xe8\xe9\x16\x45\x7b\x4c\x14\xde\
+\xa9\x8b\x09\x43\x02\xa5\xa9\x93\xfd\xa1\x86\x44\x4d\x0d\x9a\x10\
+\x03\x72\x10\xe2\xcd\x0b\xfe\xf7\xdb\x6e\xbb\x5d\xee\xba\xeb\xae\
+\x78\xb5\x8c\x74\x63\xca\x37\x9a\x24\x12\x5e\x18\x50\x72\xe5\x95\
+\x57\xca\x5f\xff\xfa\xa0\x19\xd2\x86\x0d\xe5\xd2\xb3\x67\x77\x99\
+\x33\xe7\x6b\x81\x6f\x0d\xc9\xde\xd8\xc8\x00\x43\x16\x51\x4e\x37\
+\xf6\x5c\x7e\xef\x16\x0c\xc0\x68\xf1\x83\xbe\xb0\x74\x97\x66\x3a\
+\x2c\xd4\xf0\xf6\xdb\x6f\x1a\x7f\x2c\xe6\x16\xf7\x32\x2a\x1a\x7d\
+\xc3\xf3\xf9\x7f\x25\xce\xf3\xd3\xe6\xcb\x68\x44\x64\xf1\xd2\x75\
+\x52\x5e\x5e\x21\xa5\x25\xdd\x4d\xf0\x13\xb4\xc5\xcd\x37\xef\x2e\
+\x9f\x4f\x1d\x27\x17\x5c\x78\xb6\x94\x97\x55\x48\x81\x49\xa1\xf1\
+\x4b\xa8\xc1\xa6\x3d\xa0\x3e\x68\xdc\x72\x12\x75\x24\xea\xd8\x77\
+\x31\xb2\xd3\x04\xa8\x36\xd3\x67\xe8\xa6\x27\x2b\x1f\xc1\xba\x34\
+\x66\xcc\x18\x13\xb8\x45\x2d\x1d\xef\xbf\xe4\x92\xcb\x4c\xaa\x8f\
+\xde\xa7\x00\x44\xf4\x0b\xf7\x65\x62\xc6\xd4\x5a\xbc\xf6\x53\xea\
+\xbe\xd0\xd2\x82\xdf\x00\xe8\x43\x0e\x39\x44\x1e\x7b\xec\x31\x23\
+\x60\x80\x27\x40\xb0\x47\x61\x09\x00\x36\x00\x9a\x07\x53\x53\x40\
+\x62\xf4\xbc\xce\x5f\xce\x44\xd8\x4e\xb1\xbe\x5e\x14\x89\x9e\x93\
+\xff\xeb\x2f\x7d\x0f\x3b\x05\x18\x7e\xfb\xed\xb7\x37\x5f\x75\xd5\
+\x55\x77\xa1\x92\x08\x17\x1d\x26\x9d\xe0\x01\x66\x71\xcb\x2d\xb7\
+\xc9\xe0\xc1\x83\x8d\xd3\x9e\xe6\x8d\x7b\xee\x19\x62\xc0\xd0\x2d\
+\x11\xe6\x1b\xe3\xe7\x34\xd2\x67\x84\xfe\xe9\x60\x19\x9a\x07\x35\
+\xa3\xc5\xdf\x7f\xf8\xc3\x1f\x64\xcc\x98\x8f\x37\x0a\xf7\xee\x8c\
+\x60\xa8\x7d\x86\x30\x93\xe2\x68\x2e\x98\x47\xa9\x0d\x43\x33\x44\
+\x1e\xe7\x7f\xff\xfb\xdf\x26\x66\x35\x06\x2b\x65\xc2\xac\xd2\x6f\
+\xa7\xd4\x77\xd0\xc7\xa3\xcd\xb0\xe8\x37\x7e\xc0\x34\x11\x21\x4b\
+\x93\x36\xfc\xbc\xd4\xfc\x00\x7e\x77\xde\x79\xbb\x29\x11\x86\x0b\
+\xa6\x3b\xfa\x9c\x2d\xd3\xef\x08\xdb\x38\x35\x18\x86\xc3\xc8\x19\
+\x14\x59\xb1\x6a\x83\x54\x55\x55\x4b\x49\xf1\x66\x66\x9f\x22\xe5\
+\xa2\x47\x8f\x6e\x32\x79\xd2\x18\x19\x30\xf0\x02\x29\x2f\x2b\x8b\
+\x29\x22\x3e\x09\x16\x04\x4d\xaa\x05\x2a\xd9\x58\x1a\x44\x4d\xe0\
+\x29\x69\xe2\xf3\xdb\x7f\x9c\xa8\xcf\x68\xa0\xd9\x5c\xdc\x5b\xf0\
+\x19\xc2\xbd\xb0\xcb\x2e\x3b\x99\xe6\xb0\xbe\x30\x1f\x10\xc0\x5e\
+\x7d\xf5\x55\xa3\x49\xea\xbd\x49\xf7\x47\x26\x3c\x45\x6b\x93\x7a\
+\xcf\xe3\xdd\xf8\x0e\x6b\xc2\xad\xb5\xf6\xee\xdd\xdb\xbc\x17\x39\
+\x90\xf6\x74\x1c\x9c\xbd\xe8\x93\x09\x13\x26\x9a\xfd\xcf\x3a\xb0\
+\x14\xfc\x6c\x35\xac\x86\x8c\xc0\xb9\x19\xf4\xba\x45\x24\x7a\x77\
+\x33\xee\xcf\xcb\x5b\x3b\xc2\x2e\x4a\x49\xb8\xb2\xb2\xb2\x93\xaf\
+\xbd\xf6\xda\x37\x11\x4d\x87\x0b\x52\x3f\x34\x26\xfa\xae\x68\x66\
+\xbc\xfd\xf6\x3b\x4d\xd8\x3f\x00\x05\x0b\x16\x26\x10\xe4\xc5\x41\
+\x3b\x62\x88\x7d\xae\x6d\xfa\xb9\x9e\x71\x1d\x1c\xa1\x7d\x43\x5c\
+\xf0\x7a\xc3\xc1\x6f\xf1\xc7\x3f\xfe\x51\xde\x7d\xf7\xdd\x58\xda\
+\x41\xe3\x54\x77\x46\x30\x04\xad\x09\x6c\xa7\x9f\x7e\x7a\xbc\x36\
+\x29\x4d\xb6\xf0\x53\xc1\x8f\x88\x4a\x38\xf4\xb5\x64\x2a\xb1\xe7\
+\x6a\x1e\x13\x81\x21\xdb\x86\x09\x17\x87\x4c\xc3\xf7\x87\x3c\x49\
+\x68\x44\x2c\x22\x00\x0d\xa9\xaa\xaa\xc2\xac\x6d\x5c\x6e\xb3\x67\
+\x3e\x98\x41\xd3\xd3\x28\xbd\x66\x18\x0e\x89\xac\x5c\xb3\x41\x2a\
+\x2b\x6a\xa4\xa8\xb0\xd4\x04\xa8\x58\xff\x7e\x57\xf9\x6c\xca\x04\
+\x39\xf7\xdc\x33\xcd\xbe\x0e\x04\x7d\x52\x57\xdb\x20\x5d\x8a\x0b\
+\xa5\xae\x16\x45\x51\x1c\x29\x2c\x28\x94\xa8\x13\x16\x31\xa0\x67\
+\xdf\x65\xcc\x84\xb6\xae\x5b\xd6\x9a\x21\x5d\x1a\x28\x6c\x80\xf2\
+\x6a\xf0\xdf\x32\x35\x0b\x7d\xbc\xe2\x8a\x2b\x64\xca\x94\x29\xc6\
+\x5f\xe8\xf6\xdb\xa6\xa7\x8d\xd5\xee\xd3\xc5\x05\x68\xcd\x11\xe0\
+\x08\x3e\x86\x3d\x0e\x1f\x26\xcb\x0f\x42\x26\xc0\xcf\xf4\xe9\x5f\
+\x9a\xb5\x44\x85\x80\xd6\x06\x56\xa5\xa2\x00\xc6\x33\x40\x33\xe9\
+\x63\xea\x7b\x7c\x7d\x44\x22\x6f\x65\xdf\x4e\xfb\xb5\xd0\xa1\xc1\
+\xd0\x71\x9c\x5d\x6f\xb8\xe1\x86\xa9\x0f\x3f\xfc\xf0\x66\x4c\x98\
+\xd6\x92\x0f\xa5\x39\x2c\x80\xbb\xee\xba\xc7\x44\x19\xea\x70\xfb\
+\xbb\xef\xbe\xd7\xe4\xf6\x91\x61\xe6\x33\x18\x26\x3a\xbf\x90\x75\
+\x04\xdd\xcb\x87\x9b\xe6\xe8\xa3\x8f\x96\xd7\x5e\x7b\xcd\x30\x13\
+\x7d\x75\x46\x30\xa4\x39\x11\xc2\x0f\xb4\x2b\xa4\x5e\x80\x59\x60\
+\x0d\x80\x39\xc1\x04\x89\xc4\x7f\x9a\x25\xf1\x19\x4b\x96\xb5\xe5\
+\xf6\xd3\x91\x89\xfa\xbd\x00\xba\xd1\xa3\x47\xcb\xbe\xfb\xee\x6d\
+\x92\xb7\xa3\x51\xab\xed\x70\x4d\xf2\x38\x2a\xfc\xef\xd6\x04\x3b\
+\x0b\x18\x86\x42\xd0\x0c\xd7\x49\x79\x59\xa5\xf8\xfd\x05\x46\xa3\
+\x83\x80\xb3\x59\xf7\xae\x32\x73\xc6\x74\x39\xb9\xcf\x09\x06\x6c\
+\xac\xc9\x12\xc7\x0c\x59\xd0\x2b\x2d\x29\x36\x26\xc3\x70\x18\x7e\
+\xbd\xa8\xf8\xc4\xd2\xc8\x80\x63\xcc\x3c\x9a\x9d\x5e\xd8\x74\x85\
+\xc0\x44\x6a\x82\x7e\xca\xcb\x0d\x20\x62\xed\x61\xad\xa1\xba\x0e\
+\xe7\x0c\xbf\xe9\x6b\xcc\x64\x7d\xe9\xfd\xcd\xb5\xcc\xe2\x0a\x7c\
+\x1e\xef\x64\x95\x24\x9a\x60\xa1\x19\x62\x8f\x83\x4e\x70\x01\x95\
+\x97\x57\x4a\xf7\xee\xdd\xe4\xd3\x4f\x27\x9b\x7c\x4e\xb8\x4e\x10\
+\x51\x4f\x30\xe4\x7b\xc8\x3b\x32\x01\xe1\x4c\xfa\x5f\x50\x50\x50\
+\x11\x0a\x39\xbf\x15\x69\x48\x5d\x5d\x23\x93\xc6\xda\xe9\x9e\x0e\
+\x0d\x86\xcf\x3f\xff\xfc\xa4\xab\xaf\xbe\xfa\xf7\x88\x10\x85\xa6\
+\x07\x53\x00\xa5\x32\x6d\xfe\xc2\xc4\xe3\x24\x6a\x54\x19\x61\xd9\
+\x25\x2c\x56\x2c\x22\x98\x18\x98\x73\x98\xcf\x60\xa8\x17\x2d\x17\
+\x36\x9d\xf5\xa8\xae\x8f\xa2\xd8\x60\x14\x94\x56\xe9\x4f\xb8\xe3\
+\x8e\x3b\x0c\x30\xe8\x52\x65\x9d\x11\x0c\x35\x48\x30\x77\x94\xda\
+\x22\xe6\x9a\x52\x37\x6b\x75\xea\xfc\x4d\xcd\x88\xda\x6a\x1f\xba\
+\x41\x11\x60\x88\x7a\x9d\x08\xcc\x48\x54\x07\x13\xfd\x62\x5a\x90\
+\x5b\x3b\x4c\x04\x90\x6d\x35\x8e\xcc\xdf\x93\x5e\x33\xac\xab\x0b\
+\xcb\xba\x0d\x15\x52\x5d\x5d\x2b\xf0\x1f\x22\xef\xa2\xa0\xa0\xc8\
+\xec\xed\x09\x63\xc7\xc8\xe5\x57\x5c\x66\x7c\x60\x98\x43\x58\x7f\
+\x10\x2d\xdc\xad\xb4\xab\x14\x97\x14\x99\xc8\xf0\x50\xb8\xde\x64\
+\x6a\x40\x0f\x44\x50\x0e\xaa\xf6\x00\x0c\x61\x46\x0d\xdb\x06\xb3\
+\xba\xc8\x53\x18\xcc\x85\xfd\x86\x7d\xa9\x6b\x09\x13\x0c\xad\xb9\
+\xd2\x96\xcb\xcb\x24\x80\x8c\xf7\x30\xea\x5b\x5b\x79\xe8\xaf\xd4\
+\xbe\x3d\x06\xab\x1d\x71\xc4\x11\xa6\x9a\x15\x83\xe4\x6a\x6b\xeb\
+\xa5\xb8\xb8\x48\xc6\x8c\x19\x27\x87\x1d\x76\x58\x3c\xd5\x83\x7b\
+\x01\xed\xa3\xdf\x7a\xcd\x37\xe7\x90\xeb\x34\xda\xe1\xe4\x58\x40\
+\x4d\x56\x74\x6e\xaf\x87\x3b\x2c\x18\x4e\x9d\x3a\x75\xe4\x99\x67\
+\x9e\x79\x31\xcc\x5e\x7a\x82\xb1\x88\x68\x1a\xa5\x29\x00\x9f\x95\
+\x94\x74\x35\xa7\x44\xc0\xee\x0e\xc6\x88\xc5\x84\x53\x0c\x78\x7a\
+\x81\x3e\xad\x20\x13\xfb\x7e\x7b\x4d\x18\xde\x4b\x30\x64\x64\x2c\
+\x02\x43\x6e\xba\xe9\x26\xd3\x25\x2c\x6c\x48\x94\x88\xaa\x04\x48\
+\x22\x1f\xca\x7d\x75\x46\x30\x64\x10\x09\x85\x01\x6c\x78\x32\x24\
+\x9e\x64\x41\xba\x31\x1a\x95\x21\xef\x1a\x3c\xdb\x6a\x5e\xdd\x26\
+\x53\x98\xab\x60\xca\x85\x4f\x0a\x63\xd1\x07\x13\xb3\x4f\x3c\x09\
+\x41\x03\x63\x5b\x01\x61\xba\x3d\x91\xde\x6f\x99\x1e\x0c\x8d\x8f\
+\x30\x8c\x60\x93\x58\x41\xec\x08\x72\xfd\xac\xc6\xb3\x62\xe9\x2a\
+\x79\xff\xfd\xf7\xe2\x47\x3f\x99\x7c\xcb\x82\x80\x94\x16\x97\xc8\
+\xb2\x65\x4b\x4c\xd2\x7b\x4d\x6d\x95\x34\x60\xde\x8d\xa9\x10\x39\
+\x8b\x61\x63\x26\xf5\x21\x31\x5f\x72\x07\x86\xcc\x07\x06\x4d\x74\
+\x34\x32\xdd\x18\x3a\x72\x33\x99\x25\xc0\xbd\xce\x98\xda\x94\x2c\
+\x47\x58\x5b\x81\x90\x5f\x8b\x77\x60\x3d\x40\x33\x44\x9a\x14\xd6\
+\x30\x78\x19\x0b\xd7\x7f\xf5\xd5\x1c\x73\x10\x00\xd3\x45\x18\x40\
+\x03\x21\x82\xfd\x47\xdf\xd3\x45\x99\x66\xba\x1f\x94\xc6\xf9\xf7\
+\xfa\xfa\xda\x4b\x32\x7d\x2e\x9f\xee\xeb\x90\x60\x58\x56\x56\x36\
+\xe0\xd8\x63\x8f\x7d\x1c\x15\x5b\xa8\x09\x62\x52\xb1\x60\x18\xce\
+\xcf\x45\x4a\x40\x84\x84\xa8\x03\x6a\x18\x8d\xa5\x25\xb9\x7c\xd6\
+\x0c\x29\xd9\x25\x4a\x29\x40\xe5\x17\xa4\x49\x40\x82\x64\xd4\x28\
+\x2b\x36\xc1\x7f\xa0\xf3\xa1\x8c\xdc\xdc\x49\xa3\x49\x8d\x2e\x11\
+\x0b\x26\xa1\xf4\xae\x85\x1c\x9d\x9f\xc8\x20\x94\xb6\x32\x95\x32\
+\x51\x9e\xeb\xd5\x0d\x86\x30\xbd\x41\x33\xdc\x61\x07\x5b\xea\x0b\
+\x5a\x0f\xa2\x9e\xc9\x24\xed\x89\x1b\xa8\xbb\xda\x18\x39\x49\x33\
+\x1c\xf3\x3a\x5b\x93\xb1\x64\x0f\x86\xec\x5d\x53\x50\x6c\x34\x5f\
+\x22\xc1\xbd\xe9\xa9\x4d\x08\xa8\x61\x6c\x50\xb8\x5e\x64\xdd\x3a\
+\x5b\x1c\x82\xe3\xc5\xb1\x68\x5d\x4b\x4b\x64\xd6\xac\xff\x0a\x6a\
+\xd5\x56\x54\x96\x49\x6d\x75\x8d\x31\x9f\xa2\xbf\x11\xa3\x19\x9a\
+\x15\x2f\x99\x9c\x5a\x91\x8a\x7e\xe0\x2d\x58\x4b\x3a\xd0\x0a\xfb\
+\x8d\x3e\x42\xad\x35\x6a\x5f\xb4\x8e\x0c\x4e\xd5\x3e\xb5\x3e\xba\
+\x38\x20\xd4\x62\x7e\x21\xbc\x63\x6d\x60\xdf\xc3\x2c\x4b\xf3\x2b\
+\xd6\x2f\xee\x45\xb5\x25\x94\x7b\xdb\x7a\xeb\x2d\x85\x5a\x21\x7e\
+\xe3\xe8\xb4\x13\x4f\x3c\xb1\x49\xc5\x29\xbe\x9f\x69\x67\xd6\xb4\
+\x6a\xd7\x55\xb6\xa0\xa8\xb5\xcb\x92\x92\x2e\x03\x6b\x6a\x6a\x9e\
+\x68\xcd\xf5\xd8\x1a\x6d\x77\x38\x30\xac\xae\xae\xde\xa7\x5f\xbf\
+\x7e\xd3\xde\x7a\xeb\xad\x58\x81\x6b\x44\x51\xd9\x1c\x26\x86\x0d\
+\xeb\x05\x48\x8d\x01\x09\xbc\x89\xbe\x67\x85\x16\x32\x1d\x0b\x16\
+\xb9\xf4\x30\xe4\x66\xda\x30\x0e\xf4\x51\x33\x71\x9a\x61\x2e\xbe\
+\xf8\x62\x73\xb6\x9f\x29\x6f\xe5\x20\xb7\xce\x26\xf0\x43\xa2\xd6\
+\x47\xca\xb0\x27\x9d\x11\x0c\x39\x7f\x4c\xec\xc6\x58\x69\x72\x22\
+\x83\xa1\x06\xa8\x37\x6e\x26\x26\xac\x5c\xcc\x20\x53\x21\x74\x90\
+\x84\x7e\x37\x18\x14\x18\xd8\x4e\x3b\xd9\x28\x45\x7b\x18\xb4\x3d\
+\x8b\xd1\x7d\xb1\x44\x18\x03\xbf\x78\xce\x65\x2e\xfa\x99\xac\x8d\
+\x74\x7b\x22\xbd\x66\x98\x1e\x0c\x21\xb4\x05\x83\x01\x53\xa2\x0d\
+\x38\x16\x71\x44\x0a\x51\xa5\xcd\x11\xa9\xac\x10\xa9\xa9\xa9\x93\
+\x35\x6b\x56\xc5\xca\xfd\x39\xa6\x74\xe1\x76\xdb\x6d\x27\xdf\x7d\
+\xbf\x48\x4e\x3c\xfe\x04\xc3\xf8\xeb\x43\x08\xa8\x89\x4a\xd0\x17\
+\x90\xb0\x13\x32\x1e\xc3\x00\xf2\x04\x81\xa6\x39\xba\xc8\x5f\xf4\
+\xd9\x7f\x9a\x3e\xda\x04\xa9\xcf\x26\xcd\xe4\xf5\xda\x7a\x81\x36\
+\x01\xb8\x88\x8e\xc6\x49\x1f\xd0\x04\xd1\x36\x81\x17\xbc\x00\x26\
+\x64\x98\xd6\x59\x83\xd7\xae\x7b\xd4\x45\xad\x91\x2f\xbf\xfc\xd2\
+\x80\x1c\xd7\x19\x73\x26\x51\x1a\x0e\x69\x66\xb0\x8c\x91\x87\x64\
+\xd2\xb7\x74\xf7\xc0\xd4\x0f\xff\x24\x04\x86\x92\x92\x2e\xfb\xd6\
+\xd4\xd4\x4c\x4f\xf7\x4c\x3e\x7d\xdf\xe1\xc0\xf0\xb1\xc7\x9e\xfc\
+\xe2\xda\x6b\xaf\xd9\x17\x04\x67\xa5\x16\x12\x14\x0b\x07\x13\x4e\
+\xe9\x11\xbf\xb9\x18\xb2\x25\x7a\x3a\x66\x90\x6d\xfb\x89\x9e\xa7\
+\xf6\x60\xcd\x7a\xa8\xea\x6f\x4b\x44\xe1\x62\x62\x3e\xbe\x43\x91\
+\x69\x14\x10\xa0\x94\xa7\xc3\xf5\xf9\x59\x20\x60\xcf\x5b\xc3\x85\
+\x70\x70\x14\x22\x46\x34\x6d\xae\xfc\x65\xe9\x98\x21\xe9\xe7\xce\
+\xa1\xa3\xef\x8e\xc0\xc5\x5a\xa9\x1c\x2b\x9e\xcb\x32\x0f\xaa\x09\
+\x69\xdd\xf3\x98\xa9\x19\x2b\xd3\xf9\x75\xd3\xc1\xfd\x3e\xd4\xbc\
+\x84\xb9\x9e\x27\xa8\xf3\x37\x98\x26\x0e\x93\xdd\x6d\x37\x24\x73\
+\x23\x9d\xa0\x47\x3c\x94\x1e\xe3\x87\x16\xa4\xdb\xa6\xf6\xc1\x5c\
+\x5a\xfd\x1e\xfc\xcd\xef\x19\x84\x81\x52\x67\xfa\x72\xf7\x8b\x82\
+\x62\xb2\x71\x9a\x80\x94\x58\xd0\x11\xf6\x18\xf6\x1a\x4c\x6e\xa7\
+\x9f\xde\x37\x53\xd2\xc4\xef\x4b\x36\x07\xbc\x01\xa2\x28\x8f\x34\
+\x34\xbf\x1d\x91\xfa\x3a\x91\x25\xcb\xd6\x4b\x38\xd2\x60\x04\x84\
+\xba\xba\x5a\xe3\x12\xc0\xba\x06\x73\xef\x73\x62\x1f\x59\xb1\x72\
+\xb9\x74\xc7\x81\xb4\x15\x1b\x90\xce\x2f\x05\x85\x81\x58\x2e\xa2\
+\xad\x66\x93\x6a\xfc\xcd\x1e\x44\x8e\x1f\xd0\x45\x36\x28\xac\xd1\
+\xc4\x89\xf2\x6f\xbd\x7b\xff\x39\xfe\x46\xf7\x1a\x4b\xb7\xf7\xdc\
+\xe3\x46\xe1\x09\x1c\x16\x80\x58\x0b\x16\x05\xd0\xe6\x5e\x5a\x55\
+\xb0\x37\x1b\x63\x15\x52\x1f\xb4\xcc\x3e\x90\x67\x89\xc8\xb4\x48\
+\x24\xb4\x5f\x8e\xc9\xd4\xaa\xcd\x75\x28\x30\xfc\xcf\x7f\x46\x3f\
+\x7a\xe5\x95\x57\x5e\x82\xc4\x7a\x5c\x9c\x28\xcd\x60\x29\x05\x25\
+\x72\x36\x67\x43\xc9\xf6\x06\x43\x98\x3f\x99\x2b\x04\xc0\xc0\x05\
+\x46\x07\xe0\x3b\xfb\xec\xb3\x4d\xa5\x19\x44\x4c\xea\x8d\x01\xe6\
+\x45\x8d\xc9\x6a\x19\x08\x26\xb0\x54\x40\xaa\x09\x82\x6b\xb0\xf1\
+\xf0\x4c\xa2\x03\x8e\xb3\xa1\x97\xfb\x59\x30\x7b\x32\x66\x6d\xc2\
+\xc6\xbb\x99\xee\x82\xbe\xb2\xd8\xb6\xdb\x6c\xd3\x9c\x0d\x9f\xac\
+\xdf\xc9\xe6\xb0\x2d\xb4\x43\x8c\x11\xe7\xe4\x41\x00\x41\x94\x1f\
+\xd6\x27\xb5\x45\xfc\xc6\xc1\xd3\x7f\xf9\xcb\x5f\x4c\x91\x04\xd0\
+\x01\x60\xc8\xd2\x81\x36\x1c\xde\x0a\x43\x1a\xbc\x75\x85\x11\x8e\
+\x39\x11\x60\x5a\xe6\x96\xfc\x2c\x3e\xee\xa5\x54\xf3\x4d\xf3\x3c\
+\xee\x61\x74\x2e\xc6\x03\x0b\xcd\x76\xdb\xd9\xa3\xa3\x5a\xeb\x02\
+\x38\xd6\x56\x03\x0c\xd7\x4a\x43\xa8\xc6\xa4\x9e\x44\x70\x8a\x45\
+\x71\xb1\xa9\x44\xb3\x72\xe5\x2a\x39\xfd\xf4\x33\x65\xf1\xf7\x3f\
+\x48\xf7\xcd\x50\x50\xa1\x4a\xc4\x17\x91\x86\x50\xb5\x38\xd1\xb0\
+\x14\x14\x05\x25\xdc\xd0\xd4\x67\xd8\x1e\xfb\x39\x1d\x7d\xa8\x69\
+\x12\x0c\xb9\x67\x70\xd0\x70\x9f\x3e\x27\x35\x99\xff\x44\xf3\x9d\
+\xaa\x7d\xfa\x37\x31\x8f\x00\x43\xa4\x86\xe0\x37\xfe\xe7\xdc\x52\
+\x4b\xd4\xd6\x8b\xc6\xdc\xe6\xcc\xa0\xc2\x05\x8a\x23\x23\x91\xd0\
+\xa5\xe9\xc6\x9d\x2f\xdf\x67\x36\xc2\x3c\xe8\xed\xa2\x45\x8b\xce\
+\xba\xf2\xca\xab\x5f\x44\xde\xdc\xaf\x7e\xf5\x2b\xe3\x5b\x01\xb3\
+\xc0\x02\x42\x84\x19\xfe\xc6\xc9\x08\x60\x24\x98\x10\x3d\xa1\x0c\
+\x94\xc8\x66\x18\xed\xb1\x79\x12\x69\x86\x10\x00\xe8\x33\x01\x38\
+\x62\x6c\x28\xd3\x85\x88\x32\xc3\x1c\x62\x25\xc8\xd0\xdf\x46\x13\
+\x31\xaa\x55\x34\x9a\x4e\xf1\x37\x34\x43\x9c\x4c\xdf\x56\x97\x16\
+\x4e\x12\x99\xb1\xdd\x8c\x9d\xc0\x88\x8d\x9a\x4e\x6b\xc9\x64\x0c\
+\xed\x31\x7f\xee\x7e\x41\x58\x79\xef\xbd\xf7\xe4\xe0\x83\x0f\x8c\
+\x9f\x7d\x47\x53\x68\x65\x65\xb5\x61\x50\xf3\xe7\xcf\x37\x20\xa9\
+\xab\xe3\x60\x1d\xb8\x0f\x29\x4e\xe6\xdf\xe6\xfa\x77\xbf\x5b\x9b\
+\xd1\xdc\xdf\x65\x2a\x0c\x30\x47\x8d\x80\xf8\xb3\x9f\xfd\x4c\x66\
+\xcd\x9a\xb5\x51\xea\x4e\x26\xf3\xd1\x9c\x7b\x00\x86\xd0\x0c\x97\
+\x2e\x5f\x27\xb5\xb5\xd5\xe2\xf7\xdb\xb4\x09\xc3\xa8\x43\x51\x59\
+\xb5\x6a\xb5\x0c\x18\x70\x91\x2c\x5a\xb0\x30\xa6\x53\xc2\xf9\x08\
+\xf0\xab\x97\xc2\x22\x9c\x5f\x19\x96\x08\xb2\xfa\xd5\x95\x0f\xeb\
+\x01\xdd\xd1\xc2\x0d\x85\x7b\xb7\x6f\xfb\x9d\x77\xde\x91\xe3\x8f\
+\xef\xbd\x11\xc9\x5a\x2a\x20\xa2\x5c\xe5\x7e\xfb\xed\x67\x4e\x6b\
+\xa1\x0b\xc1\xdd\x38\x79\x26\xf9\x48\xaa\xf5\x93\x68\x2e\xd9\x37\
+\xc8\xea\x91\x48\xe4\xa5\xe6\xcc\x77\x7b\xdd\xdb\x21\xc0\xb0\xac\
+\xac\x6c\xfb\x21\x43\x86\xfe\xf7\xd1\x47\x47\x6e\x06\x46\x31\x72\
+\xe4\x48\x39\xe5\x94\x93\x65\xfd\xfa\x32\xd9\x7c\xf3\x1e\xc6\x71\
+\x8c\xd2\x43\x28\x41\x04\xd3\x0d\x4d\x3a\x9a\xa8\x2d\x5d\x38\x6c\
+\xa3\x3d\x36\x8f\x06\x43\x84\x87\xff\xe6\x37\xbf\x31\xda\x05\xc7\
+\x08\x66\x00\x5f\x13\x2a\x4d\x9c\x73\xce\x39\xf1\x43\x81\xd1\x67\
+\x9a\x53\xe1\x57\xc1\xe6\x82\x6f\x14\x0b\x9a\x92\x21\x7c\x8c\xa0\
+\x23\x4f\xbc\x4f\x97\xf0\x9b\xab\x05\x8a\x4d\x86\xc8\x49\x68\xa2\
+\x08\x3e\x80\xcf\xc3\xe6\x88\x59\xe6\x46\x9f\x28\x7e\x6b\x26\xdd\
+\x11\xe7\x4f\xd3\x8c\xa7\x79\x40\xf3\xc3\xd1\x53\x00\xff\xc2\xc2\
+\x02\x93\x4f\x48\x73\x3e\x4c\x57\x28\x17\x87\xf9\x82\xff\x8b\xf5\
+\x26\x6d\x34\x6c\xe2\x68\xcc\x54\xf3\xd2\x54\x4b\xb4\x5b\x3d\x11\
+\x1d\x2d\xd8\xa6\x36\x83\x71\x7e\x30\x57\x18\x0b\xfa\x84\xb5\xf8\
+\xd5\x57\x5f\x99\x79\x43\xfd\xd7\xd6\xba\x00\x86\x08\xa6\x59\xb3\
+\x0e\x25\xf4\x6a\x4d\x6d\x52\x00\x9c\x8d\x13\x88\x48\xd9\x86\x4a\
+\x63\xe9\x58\xb4\x70\x71\xcc\x12\x12\x91\xa0\x3f\x2a\x81\x20\x42\
+\x67\x42\xf2\xdf\x2f\x67\x98\xf4\x8a\x7c\x03\x43\x3d\x17\xd8\x17\
+\xf8\x9f\xf1\x0f\x04\x23\xec\xd7\x7f\xfe\xf3\x9f\x4d\xcc\xa4\xc9\
+\xe6\x31\x15\xfd\x75\xfd\xda\x05\x0b\x16\x18\xeb\xc4\x92\x25\x4b\
+\xe2\x35\x90\xf1\x2c\xcd\xeb\xb4\x3c\xe9\x82\xe5\xa0\x73\xa6\x97\
+\x1e\x97\xcf\xe7\xab\x88\x46\x83\xbf\x11\xa9\xfb\x2e\xd3\xe7\xdb\
+\xeb\xbe\x0e\x01\x86\x7f\xff\xfb\xdf\xdf\xbf\xf5\xd6\xdb\x8f\xc1\
+\x59\x74\xd8\x00\xff\xf9\xcf\x7f\xcc\xc1\x9b\x5d\xba\x20\xc2\x2b\
+\x6c\x16\x11\x8a\x33\x23\xbc\x1a\x93\xae\x27\x23\x57\x3e\xb1\xf6\
+\x06\x43\xe4\x0e\xe1\x5c\x40\x80\xbe\xbe\xe0\xb0\xc6\x18\x59\x9e\
+\x0b\x9b\x88\x17\xd2\x2b\x50\x99\x07\x26\x38\xfa\x8c\x30\x0e\x00\
+\x0d\x82\x35\xe6\xce\x9d\x9b\x53\x7f\x5c\xaa\x45\x4c\x9f\x08\xcd\
+\x9f\x3a\xaa\x92\xb4\xa5\x99\x88\xd1\x6e\x6c\xaf\xa3\x6a\xf6\x9a\
+\x1e\x94\xc0\xc7\x8d\x1b\x27\x87\x1c\x72\xb0\xd1\x0c\x89\x3f\xd0\
+\x0e\xb1\x6e\xe1\x4b\x44\x50\x03\x2f\x80\x0e\x2b\x29\xd5\xd7\x23\
+\x30\xa4\x69\x70\x97\xf2\xcf\xc4\xa3\x1c\x49\x4b\x37\xe8\xe1\x3c\
+\xcf\x44\x17\xef\x4b\xa7\x7d\x6b\xc1\x84\x5a\x3e\x82\x7d\xe0\xb2\
+\xb0\x66\xb6\xd4\xf5\x51\xd1\xaf\x96\x0a\x34\x06\xc6\xe0\x37\x44\
+\x81\x16\xec\x85\x85\x00\x00\x20\x00\x49\x44\x41\x54\x99\x68\x23\
+\xdd\x48\x3f\x68\x8d\x5f\xcf\x5d\x68\x7c\xe1\xc1\x20\x4c\xca\x61\
+\x73\x06\x62\x51\x51\x50\x16\x7d\xf7\xad\xdc\x7c\xe3\x60\x59\xf0\
+\xed\xb7\xb6\xc0\x77\xec\x6a\x8f\xfd\xcc\x77\x27\xa2\x03\xce\x49\
+\xc4\x79\x94\xd8\x17\x2c\x25\x89\xfb\x00\x48\x38\xc4\x9a\x3e\xc3\
+\x96\xd2\x50\x83\x1d\x2c\x68\x28\x1f\x07\xbe\x40\xc5\x81\xd1\xf8\
+\x88\x5e\x5d\xb8\x10\x1a\x76\xa3\x1b\xca\x06\x19\x22\x4a\x37\xf9\
+\xe5\x02\xc0\x26\x37\x3a\x8e\x7c\xe0\x38\xe1\x46\xa7\x67\x7b\xa1\
+\x5d\x9a\xf7\xe6\x3d\x18\x4e\x99\x32\xe5\xfa\x81\x03\x07\x0e\x9d\
+\x35\x6b\xb6\x91\x98\xa1\x55\x3c\xf7\xdc\x73\xa6\x68\x31\x1c\xe9\
+\x8c\x9e\xbc\xf4\xd2\x4b\x0d\xe3\x67\xf5\x06\x4a\x42\x04\x87\x6c\
+\x6b\x4f\xb6\xc7\xe6\x71\x9b\x49\x9f\x78\xe2\x09\x53\x66\x8c\x95\
+\x55\x78\x88\x2e\xe7\x98\x95\x48\xd0\x57\xdc\x83\xd3\xe5\x2f\xb8\
+\xe0\x02\x53\x8f\x93\x95\x38\x70\xaf\xce\x59\x82\xe9\x0e\x81\x48\
+\xd9\x86\x56\xa7\xdb\xa4\xe8\x93\x36\xc9\xa0\xfa\x3f\xca\x45\x31\
+\x15\x06\xfd\x00\x38\x23\xd7\x8e\x45\x84\xa1\x71\x30\x10\x24\x57\
+\x9a\x6b\x7b\x06\xd0\x40\xd3\xc3\x39\x7e\x87\x1c\x72\x90\x39\x67\
+\x91\x81\x4e\xa0\x3d\xb4\x7d\x14\x56\x87\xd4\xce\xa8\xe1\xa6\x7b\
+\xb7\xf1\x5c\xbd\x64\xa0\x96\xcc\x74\x6a\x81\x2c\xf5\x56\x4f\x37\
+\x7f\x34\x91\xd2\x0f\x8d\x3e\xc3\x55\x31\x73\xe6\x4c\x33\x5f\x88\
+\x02\x4d\x7d\xc5\xca\xa2\xc5\x22\xb5\x35\x90\x67\xc2\x1b\x1b\x8b\
+\xac\x25\xb8\xdb\x11\x99\xff\xed\x1a\x09\x06\x8b\xcc\x49\x17\x0d\
+\x21\x04\x1b\x89\x74\xdb\xac\x58\xe6\xcc\x99\x25\xc7\xfc\xf9\x08\
+\x89\xe0\x33\xa5\x5d\xb7\xc7\x7e\x46\xcf\xdd\x74\xe6\xff\xd8\xdb\
+\x08\xa0\x02\x2d\x61\xcd\xb1\xda\x76\x17\xf3\xf7\x6e\xbb\xed\x92\
+\x09\x89\x52\xde\xc3\x7d\x44\x7e\x88\x79\x63\xf5\x1c\x3c\x08\x10\
+\x84\xf0\x35\x6d\xda\x34\xa3\x58\xc0\x84\xda\xd4\x5c\x9f\xda\x72\
+\x90\xce\xb2\x10\x8d\x86\x07\x8b\xc8\xb0\xac\x07\xd2\x8a\x0d\xe4\
+\x35\x18\x2e\x5a\xb4\x68\xff\x9b\x6e\xba\x69\x2a\xaa\xc4\x30\x1a\
+\x0c\x39\x37\x23\x46\x8c\x30\x66\x52\x84\x5a\xa3\x40\x2d\xfc\x2d\
+\x98\xc0\xc7\x1f\x7f\xdc\x44\xb9\x01\x08\xa8\xf2\xa7\x92\xc6\x9a\
+\x43\xd7\xf6\xd8\x3c\x1a\x0c\x61\x16\xc2\x11\x31\xe7\x9d\x77\x9e\
+\x31\x51\x31\x6f\x8d\x80\x81\x7b\x59\x59\x82\xd2\x1e\xcc\x20\xa7\
+\x9e\x7a\xaa\x09\xb1\x46\x00\x05\xcd\x91\xf8\x9e\xe0\x97\xab\xea\
+\x13\xe9\x37\x83\x0d\xe6\x61\x68\x38\x6a\x39\x5e\x77\xdd\x75\x46\
+\x33\xc5\x18\xc0\x64\x31\x7f\x08\x22\xe1\x05\xd0\xa6\xef\x2c\x1d\
+\xb3\x4e\x37\x97\x7c\x3e\x19\x18\x66\x2b\x2c\x91\xd1\x69\x9f\x1d\
+\x19\x10\xdf\x89\xa0\x18\x1c\x19\x76\xdc\x71\xc7\x9a\xb5\x8b\x39\
+\xa4\x46\x85\x32\x5a\x38\x7f\x12\x02\x01\x2f\x68\xc8\x04\x4a\x53\
+\x84\x5a\x1d\x33\xc5\x7b\xb8\xce\xdd\x79\x6e\x1c\x6f\xe3\x1a\xb2\
+\x60\xa5\x01\x53\xef\x91\x4c\xc7\xcf\xa0\x1f\xf4\x6b\xf7\xdd\x77\
+\x37\xc2\x0b\x12\xbd\xd3\x67\x23\xd9\x08\x57\xfe\xd0\x34\x9b\xe9\
+\xbc\xd2\xc8\xc9\x52\x75\x36\xf5\x44\xa4\x3e\x64\x93\xea\x57\x2c\
+\x2f\x13\xc7\xc1\x49\x16\xd6\x37\x8e\xa8\xd3\x6e\xdd\x4a\x64\xc9\
+\xb2\xc5\x72\xe4\x91\x7f\x94\x9a\xaa\x32\xf1\xa9\xc4\xfb\xb6\xde\
+\xcf\x89\xc6\xa9\x3f\x83\x8b\x87\x7e\x41\xad\xfd\xe2\x6f\xf4\x35\
+\x51\x8a\x4d\xba\x35\x9f\xe8\x7b\x53\xac\x40\x55\xa1\x01\xcf\x30\
+\xf4\x0a\x87\x0d\x18\xc2\x62\x84\x44\x7e\xc4\x60\xe0\x3e\xfc\xd8\
+\x3d\x98\x59\x34\xa9\xfb\x9d\x8d\x74\x36\x5a\xf9\x6f\x45\xe4\xf3\
+\x96\xf4\xbb\x2d\x9e\xc9\x6b\x30\x7c\xfc\xf1\xc7\x27\x0f\x1c\x38\
+\xf0\x00\xcb\x30\xed\x71\x28\x60\x36\xa8\xe1\x08\xc6\xd1\x98\x3f\
+\xe6\x97\x6b\xae\xb9\xd6\x44\x54\x52\xeb\xa1\x76\x41\x06\x90\xed\
+\xe2\xcf\xf6\xf9\x96\x4c\xa6\x06\x43\xe4\x0e\xc1\xcf\x87\x04\x7b\
+\x02\x0f\xc0\x4d\x07\xc9\x70\xa1\xe3\x5d\xf8\x1b\x07\xa8\xe2\x74\
+\x77\xf8\x75\x00\x86\x4c\x63\xd0\xc1\x2c\xee\x64\xf0\x96\xf4\x13\
+\xcf\xa4\x03\x43\x9d\x12\x02\xc6\x8b\x9a\xb0\x77\xdc\x71\x5b\xdc\
+\x8f\x89\x63\x70\x9e\x78\xe2\x29\xb9\xfc\xf2\xcb\xcd\xe6\x64\x05\
+\x19\xb7\x46\x99\x6d\xff\x92\x81\x61\xb6\x9a\x31\xc1\x90\xe6\x60\
+\xfc\x4f\x5f\x20\xdf\x09\x41\x0e\x09\xd2\x67\x9c\x71\x9a\xf1\x75\
+\x41\x9b\x62\x51\x04\x30\x1c\xf8\x12\x51\x3f\x15\x5a\xb2\x3d\x90\
+\xda\xd2\xd5\x02\x88\xf5\xd9\x10\x6c\x35\xb0\x24\xa3\x89\x5e\x3f\
+\xda\x4c\xde\x92\xb5\xcc\xbd\x46\xe1\x09\xff\xe3\x14\x0d\x68\xba\
+\x28\x12\x9d\x29\x18\x32\xa2\x18\x7d\xd3\xb4\x4a\x37\xaf\x04\xc3\
+\x48\xac\xac\x1a\xcf\x40\x6c\x08\xdb\x34\x8c\xa5\x4b\xca\xa5\xbe\
+\x0e\xc9\xf6\x3e\xe3\x1f\xaf\xa9\xa9\x32\x41\x36\xab\xd7\xae\x94\
+\xe3\x7a\x1f\x2d\x95\x15\xab\xf3\x0a\x0c\xdd\xe0\x08\x5f\xf2\x9f\
+\xfe\xf4\x47\x53\x8a\x0e\x81\x70\x30\x01\xc3\xc7\x9f\x2c\x57\x38\
+\x1d\xbd\xdc\xdf\x93\x37\xe8\x22\xe2\xb8\x87\xc7\x81\xf1\x7e\x04\
+\x44\x01\x0c\x97\x2d\x5b\xe6\xb2\x16\xa5\x06\xc3\xf4\xfd\x89\x62\
+\x5e\xa6\x54\x55\x55\xfd\x3e\xfd\xbd\xed\x73\x47\xde\x82\xe1\xb4\
+\x69\xd3\xee\x3a\xe6\x98\x63\x6e\x46\xcd\x41\x5b\x9e\xaa\xc0\x30\
+\x48\x30\x0a\x1c\x75\x83\x60\x03\x68\x80\x30\x2f\x41\xa2\x81\xf6\
+\x88\x50\x61\x32\x11\x32\x02\x2d\xf1\xe2\x33\x56\xed\x20\xb9\xdd\
+\x15\x22\x98\x84\xef\xf6\x35\xba\x17\x6f\x4b\x18\x4a\x4b\xa6\xb8\
+\x51\xa3\x89\x18\xf3\x30\x02\x65\xac\xd9\xcb\xb2\x07\xad\xf1\xf0\
+\x73\x02\x08\x7c\x03\xd0\x0c\xa7\x4f\x9f\x2e\xc1\x20\xa2\xea\x10\
+\x78\xc0\xb3\xde\x7c\xf1\x76\x70\x7f\x3a\x09\x3d\x93\xf1\xd2\xc7\
+\x85\x8d\xa7\xa3\xd1\x34\xf8\x92\x01\xe2\xe8\xac\x5b\x6f\xbd\xd9\
+\x6c\x78\xf4\x09\xef\x87\xa9\x08\x27\x8b\x80\xd1\x52\x62\xc5\xdf\
+\x98\x23\x3c\xc7\xbc\x52\x3d\x37\xac\xdb\x08\x5a\xf0\x73\xb4\xa5\
+\x0b\x77\xeb\xf7\x93\x99\x93\x19\xeb\xfc\x2a\x3d\x3f\x99\x8c\xd7\
+\x3d\x9f\x6c\x1b\xe6\xc3\xd3\x4e\x3b\x2d\x4e\x5f\x16\x02\xc0\x38\
+\x60\xf6\xc2\x38\xc0\x84\x70\x42\x3d\x22\xa1\xd1\x07\x08\x2a\x93\
+\x27\x4f\x96\xa5\x4b\x97\x9a\xb1\x82\x21\xe2\x33\x0a\x30\x10\x16\
+\xe0\x1a\xa0\x90\x47\x9a\x41\x20\xc2\x9a\x65\x20\x94\x7b\x4d\x50\
+\xf3\x86\x9b\x01\x42\x11\x53\x57\x30\xbe\x44\x47\x06\xa5\x02\x56\
+\xd2\x84\x89\xe4\xf0\x71\x1d\x73\xcc\x31\x26\x88\x8b\x25\xef\x92\
+\xaf\x71\xbb\xee\xe0\xc7\x86\x4b\x03\x26\x61\xae\x3b\x9a\x5e\x53\
+\xed\x0f\x7b\x6f\xa3\xa9\x15\x56\x5f\x98\x44\xb1\x0d\x42\x0d\x22\
+\xcb\x96\x97\x4b\x5d\x6d\x44\x0a\x0a\x6d\x70\x4f\x61\x91\x2d\x69\
+\xb7\x64\xe9\xf7\x72\x5c\xef\x23\xa5\xb2\x7c\x55\x2c\xc2\xb4\x25\
+\xbb\x30\xfb\x67\xdc\xfb\xcb\xfd\xff\xfb\xef\xbf\x2f\x47\x1d\x75\
+\x44\xfc\xc8\x31\x5d\x70\x01\x5b\x56\x07\x00\xa5\xdb\xab\x89\x7a\
+\xcb\x1c\x51\xac\x1f\xee\x4f\x0a\x54\xd8\x63\x04\xc5\x2f\xbe\xf8\
+\xc2\x98\x6b\xb1\x4e\xa9\xbd\x5b\x41\x31\x7b\x30\x8c\xed\xd1\xbb\
+\x1b\x1a\x1a\x6e\xc9\x9e\xa2\xb9\x6f\x21\x2f\xc1\x70\xfd\xfa\xf5\
+\x07\xf5\xeb\xd7\xef\x13\xa4\x51\x50\x7d\x87\x59\x49\x5f\x34\x0b\
+\x91\xb9\x03\x24\x01\x8e\x89\x02\x01\x34\x78\x68\xc6\xe8\x66\x88\
+\x68\x9f\xe0\xc8\xfb\x68\x2a\x70\x6f\xf6\x96\x30\xcb\x96\x4c\x5f\
+\xae\xc0\x10\xc2\x04\xcd\x76\x9a\x61\xe2\xef\x5c\x81\xa1\x3b\xb7\
+\x93\xda\x04\x37\x15\xde\xc5\xf2\x67\xa8\xa5\x0a\x30\xc4\x05\x69\
+\x18\xa7\x89\x3c\xf2\xc8\x48\x19\x34\x68\x90\x61\xd2\x04\x6e\xce\
+\xa7\x35\x29\x16\xc6\xa3\xed\x58\x42\x8a\xef\xc0\x6f\xe6\x49\xa1\
+\x4d\x5a\x08\xd8\x16\xdb\xd1\x66\x61\x9a\x98\x35\x5d\x38\x47\x2d\
+\x99\x5f\x46\x7f\x42\x1b\xff\xdb\xdf\xfe\x66\x0e\x59\xe5\x05\x49\
+\x7f\xc5\x8a\x55\xa6\x86\x2c\x8b\xc3\x37\x5a\x36\x70\xa2\xbb\x3d\
+\xf9\x00\x17\x0b\x10\x68\x81\x67\xff\xfd\xf7\x35\x5a\xe5\x2f\x7f\
+\xf9\x4b\x33\x4e\xde\x07\x3a\xe0\x47\x8f\x81\xda\x24\x41\x06\xe3\
+\xbc\xe8\xa2\x4b\x4c\x61\x7a\xf4\x11\x6b\x99\x39\xaa\xda\x54\x9a\
+\x6a\x7d\xba\xe7\x96\x7d\x85\xe9\x97\x65\xc2\x52\x3d\x0f\x33\xbf\
+\xf5\x2d\x06\x4d\x20\x18\xcc\xfd\xe8\x17\x2d\x1b\xe9\xf6\x06\x34\
+\xe3\x38\x18\x9a\xf2\x6a\xfe\x26\x60\xb8\x7c\x45\x85\xd4\xd6\x84\
+\xa5\xb0\xa8\xd4\x94\xb1\x83\xf9\x39\x10\x74\x64\xc9\x92\x1f\xe4\
+\xb8\xe3\x8e\x92\xca\xf2\x15\x79\x05\x86\xee\x3d\xf8\xc1\x07\x1f\
+\xc8\x91\x47\x1e\x1e\x27\x03\x7c\xca\x18\x03\x5c\x40\xdd\xba\x95\
+\x36\xa9\x8a\xd5\x12\x30\x44\xc3\xba\xd0\xbb\xd6\x08\xb1\x1e\xb8\
+\x4f\x50\x12\x10\x82\x1c\xa2\x9a\x9b\x5e\xd9\x81\x21\xc6\xa2\x92\
+\xf8\x0f\x16\x91\x89\xe9\xe6\xbc\xad\xbf\xcf\x4b\x30\x1c\x3e\x7c\
+\xf8\xd4\xc1\x83\x07\xef\xcf\x0d\x67\x4d\x6c\x7e\xe3\x0f\xc4\x05\
+\x69\x1a\x97\x9b\x01\x72\x81\x61\xb1\x68\x8d\x50\x07\x6e\x68\x02\
+\x6b\xd3\x1d\x35\x16\x7c\x46\x73\x2c\x0b\x7e\x27\xaa\x62\xd3\x12\
+\x66\xd9\xd2\xc9\xb5\x60\x9e\x9d\x66\x08\x30\x64\x2e\x1f\xfb\x91\
+\x48\xc3\x4c\xd6\xc7\x4c\xc6\x4b\x26\x4c\xba\x26\x33\x3d\xe2\xbd\
+\xb7\xdc\x72\x8b\x31\x93\xda\x4d\x1a\x31\x35\x55\xef\xbf\xff\x41\
+\xe3\x47\xe4\xdc\x72\x2e\x28\xa0\xe8\x92\x74\x5a\xa3\xd7\x80\xc8\
+\xca\x3c\xf8\x0c\xf3\x77\xfe\xf9\xe7\x9b\x28\x4d\x16\x28\x86\x16\
+\x05\xbf\x1c\x98\x0f\xd6\x11\xda\xa4\xcf\x44\x8f\x3d\x93\xf1\x26\
+\xa3\x15\xcc\x4c\xc8\x0d\xa3\x9f\x07\x52\x3e\x2e\xac\xe7\x33\xce\
+\x38\xc3\xe4\x1a\x42\x8b\xc6\x9a\x43\x1f\xdc\x00\x4d\x41\x00\x9f\
+\x63\x1c\xe8\x3b\xc0\x10\x6d\x6e\xbb\xed\xb6\x71\xf3\x2b\xda\x64\
+\xce\x69\xa2\xbe\x68\x21\xe7\xea\xab\xaf\x31\xbe\x76\xae\x65\xbd\
+\x3f\x92\x1d\x05\x96\x6c\x7c\x04\x31\x46\x6e\xb3\x4e\x66\xaa\xf5\
+\x8d\x2d\x8c\xfe\x80\xde\x38\x11\x1e\xf3\xd2\xac\x0b\x66\x62\x6a\
+\x86\x26\x10\x06\x9e\xc2\x02\x73\x7c\x21\x34\x43\x0d\x86\x26\xaa\
+\xb4\x08\xe5\x0b\x45\x96\x2c\xfd\x41\x8e\xef\x7d\x84\x54\xb5\x33\
+\x18\xea\x3d\xa7\xc7\x4d\x60\xbb\xe8\xa2\x8b\x8c\xb5\x0b\x34\x05\
+\x38\x81\x56\x3c\xb9\x1e\xa5\xd8\xdc\x85\x0d\x9a\x0b\x88\x3a\xb9\
+\x1e\xda\xf9\xeb\xaf\xbf\x1e\x37\x53\x63\x3e\xb1\xc6\xb0\x5f\x60\
+\x1e\x85\x5f\x1b\x51\xcd\xb4\x1c\xd8\xf5\xd8\xac\xd9\xda\xe8\x66\
+\xec\x6f\xb4\x1f\x5b\x6b\xf0\x1b\xc2\x7f\x98\x57\x57\xde\x81\xe1\
+\xff\xd2\x26\x6e\x1f\x38\x70\xe0\x6d\xf0\x77\x71\xf3\x58\xa9\xbe\
+\x51\x32\x01\x83\xa0\xaf\xcb\x5d\xeb\x91\xf9\x3a\x98\xfc\x54\x41\
+\x01\x89\xcc\x78\x8d\xa5\xcb\x6c\x01\x5b\x06\xa4\x24\x6a\x2b\x1b\
+\x66\x99\x68\x05\x68\x73\x67\xa2\xcd\x92\x2d\x18\xfa\xfd\xa8\x5b\
+\x6a\x03\x18\x52\xbd\x3f\x1b\x30\x04\xcd\xd8\x3e\x81\x70\xcf\x3d\
+\xf7\x34\x26\x17\x5c\xd4\x10\x61\x66\x43\x94\x2b\x6a\xaa\xd2\x84\
+\x58\x52\x52\x2c\x2f\xbc\xf0\xa2\xd1\x7e\xa8\xe1\xa3\x0d\xfa\x0e\
+\x31\xe7\xd8\xa8\x5a\xdb\xe4\xbb\x1a\x4b\x46\xd9\xde\xe3\x1e\xfa\
+\xd6\x60\x7e\x3a\xe4\x90\x43\x6c\xe1\xe6\x58\x31\x77\x7c\x86\xd0\
+\x72\x1e\xf4\x9b\x48\x33\x6e\xee\xfc\x62\x4c\xd4\x4c\x61\x66\xfa\
+\xe7\x3f\xdf\x89\x1f\x4e\x0b\xa9\x98\x41\x11\xa7\x9d\x76\x86\x39\
+\x65\x80\x8c\x8e\x74\xd2\x82\x09\xe7\x80\x40\x8d\xf5\x8f\xd3\x47\
+\x90\x6f\x06\xbf\x23\x6b\x91\x52\xa2\xd7\x00\x47\x1a\xd3\x2c\x86\
+\xb6\xd0\xaf\x41\x83\xae\x32\x79\xa5\xb8\x38\x4f\x7c\xb7\xdb\x55\
+\x90\x6c\x0d\x68\xf3\x34\xd7\x2b\xda\x06\xb0\xbb\x4b\x23\xba\xdb\
+\x40\x6a\x10\x85\x5b\x80\x61\xbf\x7e\xfd\xe2\x26\x60\x9a\xc2\x93\
+\x73\x46\x13\x45\x12\x03\x43\x68\x85\xb6\x60\x5b\x47\x04\x43\xee\
+\x03\xf7\x58\x29\xd8\xd3\x2c\x4e\xd7\x00\xe6\x11\xee\x91\xbe\x7d\
+\x4f\x49\x1a\x89\x9a\x09\xa2\x68\x53\x34\xdc\x26\x58\xa3\x08\x92\
+\xc1\xa5\x0f\x30\x80\xb0\xa8\xf7\x6b\xe3\x3e\xc8\x4e\x33\x8c\x9f\
+\x3d\x59\x0a\xcd\xbd\x0e\x7b\xf1\x8e\xff\xbd\xfb\xf6\x4c\xfa\xde\
+\x56\xf7\xe4\x15\x18\x2e\x5e\xbc\x78\xdf\xab\xae\xba\xea\x0b\x94\
+\x78\xc2\xa5\xcb\x12\x15\x17\x97\x9a\x22\xb0\x94\x46\xb1\x09\x35\
+\x10\x92\xf9\xe1\x39\xcd\xf4\x35\x53\xd3\xa6\x1e\xcd\x00\xc0\xc8\
+\xc8\x58\x30\x51\xd8\xdc\x58\x14\xd8\xe0\x08\x39\x4e\xb4\x80\x9b\
+\xcb\x2c\xd3\x4d\x68\x63\xa0\x44\x53\xb0\xe2\xb8\x50\x8e\x2b\x1b\
+\x9f\x61\x5b\x69\x86\xf4\x65\x81\x3e\xa8\x14\x84\x92\x6f\xd4\x82\
+\x68\xaa\xc4\x3d\x88\x44\xdc\x7e\xfb\x9f\xc5\xc9\x02\xed\x10\x79\
+\x4f\x08\x20\x01\xb3\x67\xd8\x37\xe9\x8c\x92\x54\x88\x36\xc5\xc6\
+\xa5\x8f\x83\x8c\x9e\x20\xa7\x4d\xd9\x9c\xeb\x09\x13\x26\x98\x9c\
+\x54\x5d\xf8\xfa\xc3\x0f\x3f\x32\x81\x48\x88\xb6\xd5\xc5\x96\xf5\
+\x1c\xb5\x64\x7e\xf9\x4e\xf8\xb4\xa1\xfd\x91\x01\x21\x08\x82\xbe\
+\x51\x9c\x24\x00\xad\x94\x17\x68\x43\xd0\xc7\x67\x58\x8b\x00\x1a\
+\x0a\x01\xf4\x71\xff\xe6\x37\xbf\x96\x51\xa3\x46\x19\xd3\x2b\x68\
+\xc3\xf5\x92\x4a\x43\xd0\xc1\x12\x03\x07\x5e\x6c\xa2\x91\x09\x84\
+\x7a\x2e\xd2\xad\x4d\x7e\xaf\x8b\x8d\xeb\xbd\xa4\x83\xd5\x92\xb5\
+\x05\xcd\x80\x51\xd0\x48\x81\x3a\xf7\xdc\x73\x9b\xdc\xea\xa6\x77\
+\xd3\x71\x35\x05\x43\x00\xa3\x83\xc8\x5a\xa5\x19\xae\x58\x59\xd9\
+\xc4\x4c\x0a\xcd\x10\x73\xbe\x78\xd9\x77\x72\x5c\xef\xa3\xa4\x7a\
+\xc3\xf2\x76\x35\x93\x26\xa2\x8b\x1e\xa3\x8e\x65\x00\x6d\x29\x8c\
+\xe3\x39\x08\x41\xc7\x1e\x7b\x4c\xbc\x89\x74\xfe\x47\xf2\x40\xf7\
+\x7a\xc6\x9a\xc1\x5a\x83\x65\x04\x01\x88\xe0\x6f\xa0\xbb\xf6\xbb\
+\xe3\xbd\x58\x5f\x10\x5c\x78\xf6\x2b\xee\x69\x4e\xd2\x7d\xa2\xb1\
+\x42\x4b\xc7\x7a\x74\x9d\xfe\x81\xda\xa5\xd3\x32\x5d\x7f\xad\x7d\
+\x5f\x5e\x81\xe1\xfd\xf7\xdf\x3f\xe6\xa6\x9b\x6e\x3a\xd4\x12\x3f\
+\xe4\xf2\xdf\x35\x06\x8c\x68\x5f\x8a\x96\x9e\xdd\x1b\xca\xed\x57\
+\xd4\x00\xa8\xa5\x5c\x9c\xfb\x87\x90\x7e\xf8\x3f\x30\x61\xf8\x0e\
+\xf7\x22\xe0\x00\x4c\x98\x35\x22\xb3\x65\x96\xa9\x26\x33\x91\x66\
+\x48\x29\xdf\x9a\xfc\xea\xb3\x02\xc3\xb6\x08\xa0\x41\x7f\xe9\x87\
+\x05\x1d\xa1\x91\x41\x0b\x63\x75\x12\x00\x02\xc6\xc2\x2a\x33\xd8\
+\x20\x3c\x76\xc6\x4d\x1b\xa3\x08\xa8\xd5\xf9\xf8\xe3\x4f\x0a\x4c\
+\x49\xd8\x4c\x98\x57\x98\x75\x70\x71\x4e\x35\xfd\xb4\x96\x85\x28\
+\xbd\xc3\x0e\xfb\x93\xd4\xd5\x59\xd3\x53\x71\x31\x72\xfd\xfe\x63\
+\xea\xb9\xf2\x50\x68\x1e\xc3\x93\xcd\xfc\xd2\x84\x8b\x75\x7b\xfc\
+\xf1\xc7\x1b\xed\x0f\x00\x00\x13\xa9\xb5\x70\xf8\x8d\x6f\x14\x45\
+\xd5\xd1\x27\x6a\xaa\x78\x8e\x8c\x87\x55\x77\xb4\xa0\x47\x53\xf1\
+\x01\x07\xfc\xd6\x80\x21\x34\x43\xfa\xfc\x30\x76\x53\x92\x2c\x16\
+\x2e\xef\xa6\x21\x35\x46\xb4\x71\xc1\x05\xfd\xe4\xa5\x97\x5e\x8a\
+\x33\x59\x2d\xb4\x34\x87\xc9\x90\xb6\x10\x16\xd1\x2e\x04\x54\x06\
+\xe5\xa4\x6a\x87\xd1\xb0\x18\x2f\x84\x1a\x80\x21\x04\x4f\x5a\x79\
+\xe8\x07\xa5\xe0\xb9\x11\xc8\x2b\x33\xa9\x01\x43\x73\x68\x6f\x20\
+\x6e\x26\xd5\x60\xa8\xcd\xa4\xf9\x0c\x86\x6e\x21\x1b\xb4\xd0\xe9\
+\x44\xe0\x43\xa0\x11\xe6\x5d\x17\xea\x4e\x24\x9c\xbb\xe9\xe5\xb6\
+\x02\xd1\x75\x81\xf5\x09\x30\x44\xe4\xb2\x16\x1e\x59\x78\x9d\x56\
+\x92\x8d\x85\xc1\xec\x34\x43\x2b\x10\xda\x92\x78\x6a\x7f\x8e\xfd\
+\x9f\xef\xf0\x4f\xcd\x59\x7f\xad\x79\x6f\xde\x80\xe1\xc4\x89\x13\
+\xaf\xb8\xe8\xa2\x8b\x86\xcf\x99\x33\x27\x96\x7f\x55\x68\x18\x5e\
+\xa3\x3f\xc5\x46\x15\x12\xc4\x18\x11\x05\xe2\x24\x4b\xc8\xd6\x3e\
+\x41\xcd\x38\xdd\x4c\xf4\x17\xbf\xf8\x85\x89\xb8\xec\xde\xbd\x5b\
+\x13\x5a\x8f\x1e\x3d\xc6\x6c\x5a\x38\x93\x13\x2d\xb6\x5c\x4e\x4c\
+\x22\x33\x19\x4d\x27\xf8\x8d\x0a\x24\xd9\x68\x86\x48\x4d\x49\x15\
+\x4d\x9a\x6e\x2c\x99\x6a\x4a\xe8\x2b\x37\x31\x34\xb2\xf1\xe3\xc7\
+\x9b\xa6\x39\x17\xee\xaa\x5f\x34\x1f\x82\x81\xe1\xa2\x84\x8c\xf7\
+\x59\xdf\x94\xdd\x84\x8f\x3d\xf6\x84\x31\xab\x32\x88\x86\x6d\x72\
+\xd3\x73\x13\x53\xf3\x61\xf9\xb0\x7f\xfd\xeb\x5f\x72\xc4\x11\x87\
+\x99\xa0\x8a\xa2\xa2\x42\x03\xb0\x38\x05\x1c\xe7\xc0\xc1\x77\x42\
+\xbf\x88\xdb\xbf\x99\xe9\x78\x35\xdd\xa8\x2d\xa1\x56\x2c\x18\x3e\
+\x53\x0e\x1a\x1a\xe0\x2b\x29\x90\x75\xeb\x36\x18\x30\x44\x05\x25\
+\xe6\x56\xf2\xbd\x5a\xd3\x62\x9b\x0c\x2e\xc1\x58\xf6\xde\xfb\x37\
+\xa6\xfe\x2c\x0e\x6c\x75\x83\xb6\x5b\x8a\xe7\x5a\x22\x18\xa2\x9d\
+\xf3\xcf\xbf\xd0\x08\x76\x34\x33\x6b\x86\xea\xf6\xb1\x27\x5a\x0b\
+\x89\xf2\x51\x9b\x57\xdd\xc9\x46\x0c\x83\xde\x30\x93\x22\x80\x86\
+\x80\x8c\xf7\xe9\xbf\xb9\xd7\x9a\xec\xb9\x66\x80\x61\x6d\x43\xc8\
+\x04\x9f\xf8\x03\x51\x59\xbc\xf4\x87\xbc\xd5\x0c\xdd\x74\xa6\xf0\
+\xcb\x35\x61\xa3\xe8\x03\x26\xf0\x09\xb9\xa9\x89\xee\xe7\x67\x9a\
+\x56\x5c\xbb\xfa\x37\x2d\x5f\xf8\x6c\xf6\xec\xd9\xc6\x5a\x42\xb3\
+\x35\xac\x13\x14\x2e\xf5\xda\x63\xcc\x84\x8d\x35\xc8\x16\x2a\x1a\
+\x9d\x8e\xe4\x6b\xb1\x71\x0e\x8a\x46\xa3\x7f\x4b\xc7\x7f\xda\xe2\
+\xfb\x6c\x47\x98\x93\x3e\xd6\xd4\xd4\x6c\x77\xe9\xa5\x97\xce\x7b\
+\xf6\xd9\x67\x4b\x10\x15\x0a\x09\xd9\x5d\xa8\x18\x9a\x4d\xba\x92\
+\x51\xf4\x17\xba\xc3\xe5\xb9\x28\xb4\x66\xc8\xbf\xf1\x7b\x97\x5d\
+\x76\x31\xc9\xc3\xf0\xe3\x60\xe2\x61\x3e\xe8\xde\x7d\x33\xf9\xe4\
+\x93\x89\xf1\x03\x32\xdd\xcc\xb1\x25\xcc\xb2\xb9\xc4\xa2\xd4\x6c\
+\xcd\x82\x35\x59\x83\x21\xfa\xac\x53\x2b\xd8\x1f\xb7\x14\x99\xa8\
+\x9f\xe9\xc6\xab\xfd\x76\xfc\xfb\xc0\x03\x0f\x94\x89\x13\x27\xc4\
+\x4d\x2c\x76\x13\x20\xc1\xd7\x1e\xbe\x6a\xce\xae\x8b\x69\x80\x00\
+\x29\x86\x93\xf3\x33\x00\x25\xb5\x1e\xf8\x12\x51\x58\x01\x12\x2c\
+\x4c\xd7\xda\x6f\x46\x20\xd1\xfe\x44\xf4\x01\x26\x47\x04\x8d\xfc\
+\xf1\x8f\x7f\x8c\x47\x60\xe2\xbd\x00\xe8\x4b\x2e\xb9\x24\x5e\xc9\
+\x87\x1a\x99\x1b\x64\x9a\x3b\x5f\x3c\x65\x00\xd1\xa4\x77\xdd\x75\
+\x97\xa9\xdd\x49\xdf\x36\xd6\x33\x7e\x00\x02\x00\x43\x46\x75\xa2\
+\x3f\x58\x77\x08\xa4\xe9\xd5\xab\x97\xa0\xf8\x35\x23\x4b\xf1\x2c\
+\xc1\x7f\x9f\x7d\xf6\x32\x39\x98\xa8\xdc\x03\xc6\x47\xa0\xc3\x6f\
+\x06\xd1\x70\x1e\x09\x6e\x34\xd3\x82\x3e\xfd\xfb\x0f\x34\xc7\x7c\
+\x31\x50\x8c\xf9\x7e\xe9\xe6\x95\x34\x20\x6d\x35\x00\xf2\xef\x4c\
+\x7c\x8e\x0c\x26\x42\x3b\x98\x13\xf8\x0c\xe9\x02\xd8\x78\x5d\x26\
+\x28\x30\xa0\x4d\x05\x4e\x24\xae\x19\xa2\x66\x69\x43\x48\x64\xd5\
+\xca\x4a\xa9\x8e\x45\x93\x42\xb0\x8a\x83\xe1\xb2\xc5\x72\xdc\xb1\
+\x47\x4a\x65\x19\xcc\xa4\x8c\x3d\x70\x9d\x22\xdc\xdc\x89\x6e\x85\
+\xfb\x49\x4b\xa6\xc2\x30\x88\x06\xb4\x45\xf4\xf1\x09\x27\x1c\x97\
+\xd2\x67\xe8\x06\x43\x37\x20\x52\xf3\xc6\x7e\x42\xf5\x99\xc3\x0e\
+\x3b\xcc\xac\x39\x2d\x04\x6a\x57\xcd\xc6\x73\x9a\x9d\x66\x08\x9f\
+\x21\xd6\x3c\x78\xb8\x2b\x90\x0f\x26\x9e\x5d\x45\x64\x49\x2b\x90\
+\xb5\x59\x4d\xe6\x05\x18\x3e\xf6\xd8\xe3\x2f\x5e\x75\xd5\xd5\x67\
+\x51\x73\x21\xb1\xf4\x46\xcd\x74\xd3\x26\x1b\xbd\xd6\xbc\xb8\x70\
+\xa8\x85\xc0\x64\x80\x1c\x2f\x6a\x2d\x8c\x6e\xfc\xf8\xe3\xb1\x46\
+\x92\x47\xae\x63\xb6\x9a\x61\x2a\xdf\x4e\x26\xe0\x03\xb3\x14\x24\
+\x6a\x84\x3d\xeb\x44\x5c\x54\x2e\xa1\x46\x8b\x7e\x63\x41\xa3\xaa\
+\x3f\xc0\xe5\xeb\xaf\xbf\x31\x85\x08\xfe\xfd\xef\x7f\x1b\x60\x80\
+\x49\x0b\x8b\x1c\xa6\x36\x04\x8f\xd0\x51\x9e\xc8\xcc\xd5\x12\x7a\
+\xd3\xf7\x00\xba\x62\x93\x1d\x7d\xf4\xd1\x86\x01\x6f\xbb\x6d\x2f\
+\x33\x44\xd2\x95\x05\xd6\xf1\x99\xce\xa7\xc2\xf7\x78\xaf\x15\x02\
+\x90\x6c\x6e\x0f\x2a\x86\xb9\xf1\xa1\x87\x1e\x36\x35\x1a\xb1\x81\
+\xc9\x98\x09\x22\x9c\x5b\xb7\x64\x8d\xfe\x6c\xb1\xc5\x16\xc6\xfc\
+\x0d\xc9\x97\xa9\x14\x00\x53\xe4\xa4\x52\x1a\x66\x30\x55\x3a\x30\
+\x24\x43\x21\x03\xb1\xb4\xc6\x01\xca\xd6\xfc\x4b\x6d\x14\x75\x26\
+\x7f\xf4\xa3\x1f\xc5\x4d\x92\x60\x00\x08\x20\x41\x0a\x02\xf2\x08\
+\x75\xe0\x02\xfd\x9f\x68\x1b\x39\x7b\xf7\xde\x7b\x6f\x3c\x05\x81\
+\x8c\x83\xf4\x44\x54\x2c\xd3\x37\xd0\x07\x6a\x8e\xe8\x37\xd6\x2f\
+\x34\x3f\xd0\x80\xa9\x16\xf8\x9b\xe1\xec\xef\xbf\xff\x6f\x23\xe4\
+\xf1\xbc\x4f\x6a\x63\xf8\xad\xb5\xc5\x66\x71\x8f\x66\xdc\xcc\x68\
+\x42\xcc\x19\xa2\x26\x71\x28\xaf\x0d\x4c\x0b\x9b\xb5\xc9\xda\xba\
+\x83\xae\xb8\x42\x7e\xb3\xd7\x9e\xa6\x65\x27\x96\x17\x6b\xdd\x1d\
+\x3e\xf1\xd9\x90\x54\x9b\x0a\x14\x8b\x30\x47\x2c\x4d\x43\xbd\xc8\
+\x8a\xe5\xe5\x12\x0a\x5b\x3f\x22\xd6\x54\x41\x17\x44\x4f\x87\x65\
+\xe5\xca\xe5\x72\xf8\x91\x07\x4b\x6d\xf5\x6a\x73\xc6\xa1\xb5\x04\
+\x84\xcc\x3d\xb8\xb8\x76\x92\xad\xf7\x4c\xf7\x2d\xfd\x71\x9a\xa1\
+\x16\x04\x6d\x04\xb7\x29\x14\xe0\xc3\x18\x9a\xc6\x03\x68\x0d\x18\
+\xf7\x69\xed\x9b\xf9\xce\xf8\x8d\x7d\x84\x40\x34\xae\x37\x06\xd9\
+\xa0\x3d\x08\xf2\x08\xae\x69\x22\x2b\x38\x62\x4e\xf2\x40\xde\x2e\
+\x05\x47\x9e\x70\x83\x36\x90\x7f\x0c\x5f\x3a\xeb\xe0\x26\xb2\x4a\
+\xa5\x9b\xda\x6c\xf9\xa1\xab\xfd\x97\x44\xa2\x67\xa7\x7b\x67\x6b\
+\x7f\xdf\xee\x60\x38\x67\xce\xbc\xe3\xfa\xf5\xbb\xf0\x9f\x33\x66\
+\xcc\x30\x63\x25\x10\xba\xd3\x00\x5a\xc2\x9c\x35\xf1\x52\x81\x21\
+\x12\x80\x27\x4d\x9a\xd4\xae\x60\x98\x6c\xa3\x70\x0c\x60\x08\x67\
+\x9d\x75\x96\xec\xba\xeb\xae\x46\xba\x02\x23\xa7\x4f\x14\xa7\x59\
+\x1c\x7e\xf8\xe1\x66\xa3\xeb\xd3\x03\xa0\x81\x21\x28\x05\xf7\x23\
+\xc1\x1b\x9b\x08\x7f\x63\x83\x3c\xf2\xc8\x23\xf2\xe6\x9b\x6f\x1a\
+\x50\x48\xb4\xe1\x5b\x42\x6f\x4a\xb7\x4c\xca\x46\xb0\x07\x18\x3c\
+\x73\x0b\xc1\x88\xd1\x47\xdc\x07\x21\xe3\x4f\x7f\xfa\x93\x01\x3a\
+\x5c\x30\x63\x7e\xf2\xc9\x27\xe6\x7c\x3c\x96\x82\x02\xb3\xa4\x39\
+\x1c\xa6\x6a\x30\x7c\x0d\x78\x5a\x33\xd1\xe9\x2f\xd4\x34\x70\x2f\
+\x68\x84\x1f\x06\xa4\x50\x6b\x4a\x47\xef\x44\xe3\xc7\xb3\x6e\xc6\
+\xa1\xef\x73\x9b\xe5\xc9\x6c\x6d\x40\x84\x05\x4b\x6d\xba\xe4\x7a\
+\xe7\x67\x98\xdf\xc7\x1e\x7b\x2c\x7e\x14\x17\xdb\xd6\xf3\x83\x39\
+\x24\xe3\xb4\x02\x86\x95\xb4\x31\x97\xd7\x5c\x73\x4d\x93\x42\xdf\
+\x5c\x3b\x00\xcd\xa2\xa2\x62\x46\xf1\x99\x8f\xb5\x16\xd0\x12\x66\
+\xd8\x5c\xc6\x04\x61\xc0\x9c\x38\x21\x3e\x33\x3e\x06\x88\xc0\x17\
+\xce\xf7\xc3\x77\xff\xc8\x88\x11\xc6\x24\x58\x58\x54\x64\xab\x73\
+\x9b\xfa\x32\xa6\xc7\xf1\x57\x46\x79\xb6\xa3\xbf\x50\xa2\x11\x9f\
+\x4d\xba\x5f\xba\xce\xfc\xed\xf3\x15\x48\x38\x82\xf3\x1b\x83\xe2\
+\x48\x44\xd6\xac\x59\x25\xc7\xfc\xf9\x4f\x52\x5b\xbb\x5e\x22\x51\
+\xe4\x21\x67\x7e\xfa\x02\x5f\x98\x29\x7d\x8c\xe5\xc3\x67\xfb\x19\
+\x8e\x34\x1e\x19\xe5\xf7\xf9\x51\x4c\x2f\x61\x24\x37\xd7\x14\x9e\
+\xa1\x7b\x01\x7f\x6b\x60\x84\xf0\xca\x5c\x4e\x82\x2e\x01\x11\xfb\
+\xe8\xc5\x17\x9f\x37\xe3\xa2\xe5\x05\xcf\x7f\xf1\xc5\x74\x63\xd5\
+\x42\x04\xb6\xbe\xdc\xe6\xf9\xe6\xce\xa3\x9b\xa7\xf2\xff\x96\xf0\
+\x0b\xdd\x56\x20\xe0\x3b\x3e\x12\x89\xbc\x9b\x4d\x7f\xb2\x7d\xb6\
+\xdd\xc1\xf0\xf2\xcb\x07\xcd\x1a\x31\x62\xc4\x1e\x3a\x5f\x8a\xe6\
+\x1e\x6d\x3e\xc9\x7a\xa0\xae\xaa\x2d\xd6\x4c\x17\x34\x0c\x0a\x91\
+\x55\x30\x93\xb6\xa6\x66\xd8\xdc\xfe\x6b\x06\x48\x06\x0e\xa9\x9a\
+\x91\x87\xd4\x4e\xa0\xfd\xc0\x47\x05\x26\x8a\x53\x3c\x58\xde\x0b\
+\xe3\xc3\x21\xa8\xfa\x74\x04\xdd\x87\x6b\xaf\xbd\xde\x68\x8d\x89\
+\xcc\xa6\x2d\x5d\xe0\x64\x1a\xda\xc4\xa2\xcb\xe3\x81\x71\xa3\x5f\
+\xd8\xf4\xf7\xdf\x7f\xbf\x09\x88\x01\xd3\xa2\x76\xf8\xc2\x0b\x2f\
+\x19\xf3\x25\xc3\xf4\x09\x64\xcc\x91\x42\xbf\x74\xd5\x14\xed\x67\
+\xd3\xda\x0d\x25\x68\xbc\x4b\x6b\x71\x7a\xac\x34\x17\x72\xad\xa5\
+\xf3\x19\xea\xf6\x19\xed\xa7\xd7\x27\xbe\x27\xa3\xd1\x85\xd4\xd1\
+\xae\x35\xef\x37\xfa\x4c\xdc\x0c\x89\x6d\x23\xf7\x0e\xf3\x48\x2d\
+\x89\x1a\x1e\xde\x43\xb3\xb0\x0e\x91\x27\x18\xa2\x3d\x44\x8a\xc2\
+\xa7\x0a\x26\x69\xcb\x79\xd9\x40\x25\xba\x16\x90\x5a\xa3\x53\x8d\
+\xa8\x0d\x67\xcb\xc4\x32\x5f\xd7\x28\x2d\x66\x4f\xb6\xd0\x3e\x7e\
+\xdd\x8f\x9e\x3d\x7b\x1a\x6d\xe6\xc4\x13\x8f\x37\x02\x4c\xd8\x00\
+\x25\x4a\xd6\x41\x13\x44\x3e\xa8\x39\xcc\x49\xa2\x8e\x35\xb3\x07\
+\xfc\x38\x36\x0a\x9a\x39\xc0\xb0\x4c\xc2\x21\x00\x51\x40\x1a\x50\
+\x01\x29\x08\x53\x72\x58\xd6\xae\x5d\x6d\x2a\xd0\xac\x5f\xbf\xb4\
+\xc9\x1c\xa0\x2f\xda\xbf\xac\x69\x93\xf9\x98\x1a\xef\xd4\x3e\x35\
+\xd3\x6e\x24\x6a\xfa\x89\x2b\x18\x08\x4a\x38\x56\x46\x2e\x99\x10\
+\x66\xf7\x6b\x41\x7c\xbe\xc8\x0f\x39\x7f\xfa\x3b\xec\x33\x68\x8c\
+\xd0\xf6\x10\xac\x05\x9f\x22\xa3\xa5\x2d\x5f\xf3\xcb\xb4\x69\x33\
+\x8c\x5f\x10\x6b\x80\xe6\x49\xbd\x5e\xe1\x27\xe4\x1a\xc1\xd8\x93\
+\xc5\x5d\x64\x42\x8b\x4c\x85\x85\x34\x6d\x7d\x25\x12\x6d\xea\x10\
+\xcf\xe4\xe5\x39\xbc\xa7\x5d\xc1\xf0\xc3\x0f\x3f\xba\xf1\x8c\x33\
+\xce\xb8\x07\xda\x09\x4d\x50\x04\x01\x32\xa9\x6c\x17\x69\x22\xe9\
+\x8e\x93\x47\x30\xc4\xa2\x81\x56\x92\x6f\x60\xa8\x01\x91\x51\xb3\
+\x8c\x00\x23\x10\x80\x49\x22\xc8\x07\x7e\x18\x23\x0d\x3b\x30\x3d\
+\xda\x9a\x86\x96\x59\xda\xc2\xc5\x3a\x40\x01\xda\xd8\xe0\xc1\x37\
+\xca\x83\x0f\x3e\x68\x7c\x70\xd8\x08\x74\xa6\xbb\x37\x6b\xa6\xcc\
+\xd2\xed\x63\x00\x43\xc7\x7b\x59\x56\x0d\xed\x30\x5d\x05\x9b\x10\
+\x9a\xe9\x45\x17\x0d\x30\x7d\xa4\x89\x67\xd4\xa8\x77\xa5\x6f\xdf\
+\xbe\x06\x0c\x34\x20\x72\xa3\xea\xd0\x7e\x2b\x05\x07\xe2\x09\xe8\
+\xee\x0d\xa9\x99\x1d\xfd\x6a\x1a\x54\x49\x5b\xfa\xce\xd2\x99\x7d\
+\x5c\x21\xe1\x69\xb7\x20\xfa\x4a\xf3\x33\x68\xab\xa3\xe9\x68\xae\
+\xc5\xbb\x31\x56\xcc\x01\xcc\xbf\x88\x70\xc5\x3c\x62\x5c\xa4\x1f\
+\x5f\x04\xc6\xc7\x94\x0a\xf6\x15\x9f\x81\xae\x00\x3f\x98\x48\x51\
+\xfc\x1c\xa6\x6f\x6d\xba\xa5\x30\x42\x30\xc4\xfd\xd4\x46\xdc\xd6\
+\x97\xb4\x83\xca\xf2\x06\x04\x11\x21\xc5\xa7\xa1\xa1\xce\x00\x18\
+\xd6\x21\xfa\x05\xb3\x25\xfe\xc7\xd9\xa4\xa8\x4f\x8b\x82\xd5\x00\
+\x13\x63\x0a\x2e\x28\x30\xca\x21\xee\xf1\x1b\x23\x82\x23\x51\x68\
+\x8c\x51\x44\x94\x06\x44\x9c\xa0\x38\x51\x9f\xac\x5a\x59\x2e\xb5\
+\xf5\x30\xbb\xda\xb5\x0e\x41\x30\x1c\x0d\xc9\x9a\xd5\xcb\xe5\x98\
+\x3f\x1f\x29\x55\xe5\x30\x93\x46\x63\x27\xdd\xc0\x77\xde\xbc\xc1\
+\xa4\x33\x97\xea\x98\x06\x23\x2c\xf9\x6d\x92\xb9\xe9\xa5\x3f\x60\
+\xfa\x4c\x9e\xe6\x7e\x33\xd7\x2e\x2d\x19\x5c\xef\x98\x6f\x5a\x35\
+\x38\xcf\x68\x13\xdf\x73\x6d\x21\x10\xec\xf5\xd7\x5f\x8d\xe7\xb1\
+\x32\x20\xed\x9b\x6f\xe6\x9b\x92\x77\x00\x43\x77\xe4\x35\xde\x9f\
+\x89\x69\x5c\x8f\x39\x19\x1f\xc8\x95\x55\x29\x46\x93\x9b\x44\xa2\
+\xf7\x36\x6f\x66\x72\x77\x77\xbb\x81\x61\x6d\x6d\xed\xcf\x8e\x39\
+\xe6\xd8\x05\xe3\xc6\x8d\x0b\x32\xac\x57\x9b\x0c\x2c\x93\x6c\x0c\
+\xf8\xc8\x76\xc8\x9a\x59\xba\xc1\xf0\xa0\x83\x0e\x32\x41\x15\xf9\
+\x0c\x86\x5a\x28\x40\xff\x75\x5e\x12\x98\x28\xce\x72\x44\xd9\x26\
+\x5c\xba\xea\xbd\x9b\x6e\x08\x2e\xc0\x26\xbb\xfa\xea\xab\x65\xf8\
+\xf0\xe1\x71\x13\x15\x4d\x7c\xbc\xbf\xb9\xa0\x48\xc1\x82\xbf\xb1\
+\x59\xd1\x06\xcf\xe3\xc3\x26\x46\x0d\x4b\x1e\x17\x05\xa6\x7f\xc9\
+\x25\x17\x9b\xf3\x28\x59\xf1\x07\xf9\x54\xf0\x89\xc2\xa4\x0b\xb3\
+\x10\x98\xa1\xd6\xfe\x74\xa5\x14\x06\xa6\x80\x16\xb8\x2f\xd1\xe6\
+\xce\x64\x33\x6b\x61\x49\xd3\x2a\x95\x10\xe0\xd6\x42\x59\xef\x91\
+\xeb\x8a\x00\xcb\xf6\x6c\x54\xa0\xdd\x6a\x94\xc2\x13\xb5\x0f\xa1\
+\x06\x89\xf1\x4c\xd3\xa0\x29\x93\xcc\x4f\x3f\xaf\x01\x15\x34\x42\
+\x90\x05\x02\x6c\x10\x21\xcb\xfe\xa1\x3f\xe8\x1b\x04\x12\x44\x13\
+\x73\x3f\xe5\x4a\xc0\x6c\xd9\x9e\x44\x4a\x04\x80\x01\xf4\x60\x20\
+\x8b\xfd\x0d\xb0\x7c\xfe\xb9\x17\xa5\xef\x69\x27\x9b\xa6\x8d\xc5\
+\xc0\x8f\x13\x28\xac\x70\x07\x18\xc4\x33\x7c\x2a\xec\xc0\xf4\x0c\
+\xdf\xa2\x5f\x56\xaf\xda\x20\x35\xb5\x11\x73\x08\x30\xe8\x51\x5c\
+\xd2\x45\x42\xd1\x7a\x59\xb3\x6a\xb9\x1c\x7d\xcc\xe1\x52\xbe\x6e\
+\x95\x48\xac\xd8\xb9\xee\x37\x68\xe4\x5e\xfb\xe4\x3d\xc9\xf6\x42\
+\xd3\x71\x5b\xa1\x33\x18\x28\x94\x50\xd8\x46\x44\x6f\x04\x76\x28\
+\x10\xe0\x57\x75\x55\x13\x14\xbe\xd0\x02\x0c\xe7\xd9\xb4\x1b\xb4\
+\x1a\x3d\x4d\xe3\x34\x93\x73\x9f\x9d\x74\xd2\x49\xf2\xd6\x5b\x6f\
+\xc4\x0b\xbf\x63\x3f\xa1\xad\x6f\xbf\xfd\x56\x0e\x38\xe0\x00\x33\
+\xf7\x14\xa0\xa9\x6d\xd2\xb7\x4d\xf7\x05\xfd\x93\x6e\xba\xe8\xbd\
+\xe1\x5e\x33\x6e\x10\x74\x0b\xa3\x99\x0a\xd1\x7a\x8f\x84\x8d\x14\
+\x10\xdd\x51\x44\x7e\x68\xd9\xda\xca\xee\xa9\x76\x03\xc3\xa7\x9e\
+\x7a\xfa\xd9\x01\x03\x06\x9e\x97\xc8\x4c\xa7\xb5\x43\xf7\xc2\xcc\
+\x6e\xb8\x4d\x0b\x5b\x93\xd1\x22\x1f\x6e\xec\xd8\xb1\xad\x0a\x86\
+\x3a\xd8\x21\xd1\x18\xdc\x66\x8a\x44\x66\x52\x9a\xff\xe8\x47\xe3\
+\x86\x40\xf1\x6e\x80\x21\xfc\x32\xdc\x67\x30\x97\xa2\xbe\x21\xfd\
+\x8a\xd4\x14\xf9\x6e\x98\x49\x11\xa1\x49\xb3\x25\x7d\x10\xc9\x00\
+\x21\x93\xc5\xed\x96\x6c\xd9\x16\xe9\xcc\xb3\x13\xa9\x19\x0e\x18\
+\xd0\xaf\x91\xe9\x05\x7c\xf2\xd6\x5b\xef\x98\x94\x07\x86\x7a\x33\
+\xb4\x9c\x0c\x40\x03\x63\x22\x13\xa9\x66\x6c\x89\xb4\x1e\xbc\x97\
+\x74\xe5\xf7\xa4\x69\x3a\x33\x29\xc7\xa2\x23\x37\xf9\x19\x7d\x7e\
+\x5c\xcb\x04\x33\x6a\x61\x78\x87\xfb\x70\x5e\x46\xbb\xd2\x54\x07\
+\x8d\xee\xc2\x0b\x2f\x34\x01\x47\x89\x2e\x08\x11\xd0\x36\xd9\x7f\
+\x32\x70\x0a\x0c\x48\xbb\x81\xd9\x19\x8c\x0f\x9a\x22\x2e\x9d\x3f\
+\x69\xcd\x8d\x4d\xcb\x14\xe2\x1e\xed\x3b\xcc\x76\x6f\xa5\x7a\x1e\
+\x60\xa1\xfd\x68\x46\x5b\x8a\x05\x1e\x81\xa6\x18\x07\x84\x1d\xa4\
+\x8f\xf4\xe9\x73\x82\x69\x0a\xac\x11\x96\xd5\x9a\xda\xa8\x14\x16\
+\xf9\xa5\xc1\x14\x8c\x86\x76\x07\x8d\xd2\x2f\xb0\x3c\x1a\xf6\x19\
+\x15\x59\xbb\xb6\x5a\xaa\xab\xac\xc6\x89\x8d\x5c\xd4\x05\x26\xc7\
+\x3a\x59\xb5\x7a\x99\xf4\xfe\xf3\x11\x52\x57\x5d\x26\x4e\xb4\xc1\
+\xb4\xcb\xfc\x4c\xcc\x0f\x69\x44\xe1\x8d\x63\xe0\x7a\xe7\xef\xe4\
+\x9a\x61\xa3\x05\x06\x01\x33\x76\xbf\x01\xc8\xad\x6f\x92\xe9\x60\
+\x55\x55\x95\xc6\x87\x99\x4c\x3b\xd4\x96\x95\x44\x82\x9d\xbb\xfa\
+\x0f\xcd\xa4\xc7\x1d\x77\x5c\xac\xb4\x9a\x8d\xd2\xa6\x15\x04\x67\
+\x98\x22\x9a\x9b\x7e\x7a\x8c\x53\x9b\xa4\x53\x69\x86\x1c\x6b\x32\
+\x61\x32\x53\x20\xcc\x84\x67\x90\xde\x8d\xc2\x80\xef\xb9\x68\x34\
+\xd2\xcc\x5a\x7d\xb9\x59\xb9\xed\x02\x86\x53\xa7\x4e\x3f\x74\xc0\
+\x80\x7e\x63\x90\xd4\x9e\x4a\x4a\xd5\x93\x92\x2b\x69\x56\x03\x2d\
+\x19\x2a\x42\xef\x3f\xfe\xf8\xe3\xbc\x05\x43\x2d\x10\x68\x10\x00\
+\x73\x04\x50\x20\x5c\x1f\xfe\x3f\x44\x95\xea\x7c\x3a\x2e\x11\x30\
+\x08\xe6\x0c\x31\xf9\x1b\x47\x28\x21\x3a\x15\x9b\x05\xe0\x43\xe9\
+\x31\x99\x46\x98\xc9\xc2\x76\x4b\x87\x64\x06\xf8\xad\xea\x12\x1a\
+\x66\x0d\x13\x2d\xc2\xeb\x09\x60\xd0\xca\xff\xf1\x8f\x37\x4d\x99\
+\x36\x6c\x68\x98\x00\xdd\xda\x3c\xdb\x43\x5f\xe8\x4f\xc3\x67\xee\
+\xfb\xb4\xa4\x9f\xa9\x29\xd0\xbd\xc1\xdd\xe3\xa5\x9f\x90\x41\x3d\
+\x78\xaf\x36\xdb\x82\x59\x69\xdf\x0b\xb5\x32\x06\xb8\x40\x50\x21\
+\xa8\x13\x80\xf4\x9a\xc6\xf3\x30\x11\x43\x5b\xc7\x7c\x10\x24\xdd\
+\x42\x14\xc1\x0f\xef\x8f\x95\xb5\x32\x66\x56\x68\x86\x08\xa0\xd1\
+\x39\xb1\x6c\xdf\x32\x5a\x6b\x2e\xd7\x6b\x89\x60\x98\xab\xbd\x95\
+\x8a\x25\x15\x77\x29\x95\xfa\xfa\x86\xb8\x1f\xcd\x06\xc7\xd8\x0b\
+\x31\xa0\x85\xb1\x3a\xac\x4f\x3f\xfd\xb4\x9c\xd6\xf7\x64\x69\x68\
+\xb0\x45\x17\x60\x25\xc5\x05\x8c\x83\x32\x49\x80\xb4\x03\x89\x7d\
+\xe7\xa0\x5e\xb1\x48\x6d\x8d\x05\xc6\x18\x1e\x4a\x7d\x43\xbd\x94\
+\x95\xaf\x95\x3e\x27\x1f\x27\x4b\x16\xcd\x31\x47\x38\xd1\xfa\xa4\
+\x85\x4f\x4b\x9f\xfa\x66\x72\x54\x06\xf4\xc4\x7e\xfb\x6c\x64\xb1\
+\x01\xbb\x98\x09\x36\x18\x44\x41\x04\xab\x2d\x06\x10\x08\x9b\x02\
+\x0c\xf5\xcb\x69\xf9\xc1\x67\x7a\x9d\x27\xf2\x85\x23\xe8\x0a\x01\
+\x34\x2c\xee\x10\x08\x40\xe0\x13\xf9\xf2\xcb\x99\x26\x96\x80\x25\
+\x07\xdd\xf3\xce\xb9\xa7\x65\xc5\xfd\x7e\x37\x20\x52\xb0\x73\xdf\
+\xc7\xff\xdd\xc2\x43\x32\xd0\x4f\x47\x64\xcc\x45\x49\x49\x97\x3f\
+\x95\x97\x97\x23\x21\xbf\x4d\xaf\x76\x01\xc3\x1b\x6e\xb8\x79\xfc\
+\x90\x21\xf7\x1e\x92\x28\xb8\xc2\x3d\x7a\x4a\xf3\x6e\xc9\xbd\xa5\
+\x54\x72\x83\x21\x18\xc1\x1f\xfe\xf0\x87\x56\x07\xc3\x44\xa6\x18\
+\x3d\x86\x74\x66\x49\x32\x7c\xd2\x0c\xcc\x19\x0b\x07\x0c\x11\xc5\
+\x9f\x87\x0d\x1b\x66\xf2\xd4\xb4\x8f\x0e\xcc\x17\x7e\x98\xc6\x05\
+\x6b\x19\xcc\xea\xd5\x6b\x65\xe8\xd0\xa1\x26\x6f\x11\x66\x35\x3a\
+\xd8\xdd\x0b\x5b\xff\xdf\x1c\x30\x64\x2a\x80\xd6\x3a\x09\x7a\x9c\
+\x47\x54\xfc\x81\x54\x4b\xe6\x8e\x67\x50\x99\xe5\xce\x3b\xef\x8c\
+\x33\x15\x6a\x0c\xcc\x35\xd4\xbf\xd1\x37\x2d\x4d\x6b\x21\x21\x93\
+\xb5\x41\xa6\xc8\x4d\x9b\x0e\x0c\x0d\xd3\x8e\x05\x61\x61\x2e\xb7\
+\xd9\x66\x1b\x41\xb1\x06\x1e\x26\x8d\xf7\x63\x6e\x90\xbe\x02\x13\
+\xd5\xda\xb5\x6b\x4d\x37\x18\x0c\x03\x66\x8b\xbf\x91\x76\x81\x93\
+\x27\x90\xf2\x41\x86\x0c\xf0\x03\x68\xee\xbb\xef\xbe\x26\x08\x86\
+\xe3\x34\x20\x10\x73\x6e\xe1\x9d\x38\x6b\x0e\x12\x3f\xb5\x3f\x08\
+\x32\xf8\x1b\xcf\x23\x00\x0c\x15\x66\xc8\xdc\x34\xd3\xb7\x16\x04\
+\xab\x51\xe1\xf3\x64\x79\xb8\x99\xd0\xad\x65\xf7\x00\x30\x00\x79\
+\xea\xd8\x30\x13\x5f\xd9\xc8\x7e\x0c\xae\xf9\x7c\xf2\xc2\xf3\x2f\
+\xc9\x69\xa7\x9d\x22\x55\x55\x21\x09\x35\x84\xcd\x69\x26\x75\x0d\
+\x22\xab\xd7\x94\x49\x45\x45\x55\xbc\x3c\x22\x35\x43\xd4\x6a\x88\
+\x46\xfc\x52\x5b\xdb\x60\x0e\xf6\xf5\x07\x81\x9e\x51\xf1\xf9\x23\
+\x12\x89\xd6\x49\x43\x43\xad\x9c\x7f\x76\x1f\x11\xa7\x4a\x7c\xbe\
+\x06\x1b\x98\x13\xab\x84\x02\xba\x61\x2e\x10\xa1\x4d\x33\xb6\x66\
+\xe2\xfa\xef\xc6\x23\x94\x5c\x20\xe8\xd8\xff\x81\x7f\x35\xd5\x75\
+\xc6\xbc\x0f\x81\xd4\x0a\x34\x85\x26\xba\xf7\xbb\xef\x16\x4a\x75\
+\xd5\x86\xb4\x60\x88\x7d\x88\x4b\xe7\x58\xeb\x75\x47\x00\xa3\x46\
+\x0d\x1a\xec\xb6\xdb\x6e\x72\xfa\xe9\xa7\xc7\x41\x9e\x26\x7a\xc4\
+\x61\x40\xb0\x40\x7f\x74\xe0\x92\xb6\x2e\x71\x7d\xba\xad\x42\x5c\
+\x3b\x7c\x77\x32\x00\xd4\xdf\x73\x9d\x6a\x50\xcc\x84\x67\xe8\xb6\
+\x1b\x4d\xc2\xce\x04\x91\xc8\x1f\x5a\xb6\xd6\x5a\xfe\x54\x9b\x83\
+\xe1\xa8\x51\xef\x9d\x73\xc9\x25\x17\x3f\x0f\x66\x01\x62\xe9\xb2\
+\x6b\x2d\x1f\x46\xe6\x4f\x6a\x86\x40\xe6\x06\xcd\x70\xec\xd8\x8f\
+\x8d\xf4\x4c\xb3\x22\x36\xc7\xc4\x89\x93\x4c\x0a\x00\x6a\x58\x52\
+\xea\xc3\x9b\x9a\x3b\xc9\x78\x06\x13\x0d\x73\x2c\x0a\xe4\xb2\x42\
+\x3c\xce\x83\x43\xf5\x78\x30\xb2\x74\x60\x98\x68\x84\x00\x03\x9a\
+\x12\xf7\xdf\x7f\xff\x78\x9e\x1b\x13\xb5\x11\x9d\x87\xe3\x72\x90\
+\xfc\xad\x2b\xbf\x20\x37\x11\x63\xc2\x0f\xd2\x2c\xb8\x41\xb0\x09\
+\x91\x93\x87\xf3\xe6\x20\x51\xd2\x5c\xc9\xe0\x11\xb7\xf4\x97\x39\
+\xd5\x1b\x8b\x01\xe3\x19\x6c\x7a\xbc\x07\x1a\x22\x36\x91\xcd\xc3\
+\xb3\x79\x90\xd8\xbc\xf8\x9f\xa6\x46\xa6\x23\x34\xe7\x5d\xad\x71\
+\x2f\xcd\x38\x14\x46\x90\xfb\x05\x6d\x1c\x11\xbe\xa0\x0b\xbe\x47\
+\x5f\xc1\x84\x50\x04\x1c\x79\x5c\x04\x6b\xab\xe5\x45\x0c\xf0\x23\
+\x5a\xf6\xb6\xdb\x6e\x33\xe3\xe3\xdc\x91\xc9\xa1\x0d\xfd\x19\xc7\
+\x41\xe6\x87\xd3\x04\xe0\x17\x24\x48\xa2\x3d\x06\x46\x91\xc1\x27\
+\x67\x46\xd9\x26\x4d\x67\x43\x55\x1c\xb7\x64\x4f\x9e\x69\x8c\xaa\
+\x8d\xf9\xd0\x62\x1c\xc8\x0f\xb3\x69\x44\x64\xd8\x03\x0f\x4a\xdf\
+\x53\x4f\x97\xb2\xb2\x72\x13\x6c\x13\xf0\x23\x80\xa6\x50\x96\xfc\
+\xb0\x5e\x26\x7d\xfa\x99\x59\x1b\x58\x27\x81\x42\x80\x9e\x5f\x9c\
+\x68\x81\x04\x03\x45\x52\x55\x5d\x2f\xdd\xbb\xf7\x30\x40\x52\x58\
+\x58\x20\x05\x5d\x44\x2a\x2a\xd7\x49\x7d\x7d\xb5\x3c\xfb\xcc\xa3\
+\xe2\x84\x56\x4b\x61\x81\x35\x23\x82\x46\x98\xc7\xda\xba\x5a\x73\
+\x72\x0a\x34\x6a\x7c\x66\x9f\xb5\x11\xaf\x34\x37\x72\xfd\x31\x05\
+\xc8\x52\x81\x63\x81\xb6\x67\xe9\x1a\x08\x04\x65\xe9\x92\xe5\x52\
+\x5e\x55\x6d\x02\x7a\x20\xa4\x74\xed\xda\xcd\x54\xb6\xba\xe5\x96\
+\x9b\x65\xd5\xca\x1f\x9a\x1c\x2e\xec\xa6\x66\x4b\x78\x8a\xdb\x72\
+\x46\x81\x93\x7c\x0d\x6d\xb6\x54\xeb\x77\x0b\x87\xf4\x3d\xef\xb7\
+\xdf\x7e\xc6\x95\x01\xbf\x3e\x85\x05\xd4\x13\x86\x20\x86\x7c\x6c\
+\x7d\x51\x40\x4d\x65\x92\xe5\xfd\x1b\x0b\xa3\x72\xae\x48\xe4\x85\
+\x6c\x56\x5d\x73\x9f\x6d\x73\x30\x3c\xff\xfc\x0b\xbf\x7d\xe9\xa5\
+\x97\x76\x02\x43\x04\x28\xe4\x4a\xe3\x4b\x37\x70\x86\xb3\xeb\x05\
+\xc2\x49\x82\x66\x38\x6e\xdc\x18\xd3\x04\xec\xfd\x30\xe7\xe0\xbb\
+\x71\xe3\xc6\x99\x48\xcd\x55\xab\x56\x65\x0d\x86\x18\x2f\x4c\x93\
+\x38\xa2\x48\x17\x8d\xc6\xd1\x3a\xf0\xdd\x65\xa2\x99\xb8\xc7\x88\
+\xc5\x46\xff\x09\xc6\xe5\x3e\x73\x11\xd5\x4c\x5e\x79\xe5\x15\x41\
+\x1e\x22\xef\xd5\xbe\x43\xf8\x14\xf1\x5e\x6e\x74\x04\xd7\xe0\x3e\
+\xd0\xe3\xf3\xcf\x3f\x37\x7f\x53\x4a\xcd\x56\x18\x70\x9b\x50\xe3\
+\x7e\x1f\x24\x25\x47\x22\x71\xed\x94\xeb\x01\xf7\x53\x30\xc9\xd4\
+\xd4\x99\x6e\x0d\xe4\xe2\x7b\x30\x51\x30\x48\x84\xb4\x23\xd8\x05\
+\xb9\x94\x28\x72\x60\x0b\x04\x84\x65\xcd\x9a\x35\x06\xf0\x50\xa8\
+\x9b\x0c\x04\x63\x41\xfe\x27\x18\x39\x02\x97\x50\x3c\x40\x47\x86\
+\x62\xee\x18\x04\xa4\xfd\x9a\x14\xbc\x08\x78\xf0\xa7\x5d\x76\xd9\
+\x65\x71\x26\x44\xc6\x9e\x68\x6e\x36\x36\x53\xe5\x03\x18\x72\x06\
+\x1a\x4d\xa4\xac\xf2\xe5\xf3\x01\xd8\x44\x86\xdc\xf7\x80\x9c\xd6\
+\xf7\x4c\xd9\xb0\xa1\x3c\x96\x4e\x11\x10\x9f\xd3\x45\x16\x7f\x5f\
+\x26\x63\xc7\x58\xa1\xd1\x08\x4b\x85\x85\xf6\x54\x90\x30\x52\x5a\
+\x70\x22\x46\xc4\x04\x68\x99\x13\x4f\xc2\x75\x12\x2c\xf4\x49\x01\
+\x32\x2f\x7c\x21\x19\xf9\xe8\x30\x03\x86\x7e\x7f\x9d\x34\x20\x29\
+\x51\x1c\x29\x2d\x29\x35\xed\x98\xe3\xa4\x2e\xc0\x81\xd9\x8d\xab\
+\x83\x3c\x02\xeb\xcf\x5e\x76\x8d\x36\xbd\x2c\x68\x3a\x31\xed\xd6\
+\xef\x13\x59\xb6\x72\x83\xd4\xd5\x42\xfb\x0c\x5a\xb7\x40\x97\x12\
+\x93\x1b\x7b\xfd\x75\xd7\xc8\xd2\x25\xf3\xdb\x04\x0c\xb5\x56\x97\
+\x4b\x30\x44\x5b\xa0\x07\x0a\xdc\x43\x98\xeb\xd5\x6b\xab\x78\x44\
+\xee\x97\x5f\x7e\x29\xa8\xba\x04\x13\xbd\xd6\x10\x9b\x9b\x41\x41\
+\x78\x00\x00\x20\x00\x49\x44\x41\x54\x63\xad\x71\xf3\x3f\x11\xdf\
+\x7c\xc7\x09\xef\x9c\x8b\x3d\x9b\x69\x1b\x6d\x0a\x86\xef\xbc\xf3\
+\xcf\xeb\xfa\xf7\xef\x3f\x0c\x5a\x61\xa2\xdc\x97\x4c\x3b\xdd\x92\
+\xfb\x92\x39\xa5\xb1\xc8\x0f\x3e\xf8\x60\x19\x33\xe6\xe3\x26\x29\
+\x09\x78\xc7\xf8\xf1\x9f\x98\x70\x77\x24\xae\x6a\x66\xde\x12\x29\
+\x0e\x8c\x11\xfe\x20\xa4\x13\xc0\x8c\x82\x0b\x0c\xf2\x9a\x6b\xae\
+\x33\xfe\xb3\x74\x60\xe8\x06\x13\x3c\xaf\x25\x43\x9a\x14\xb9\x81\
+\xc1\x98\x77\xdc\x71\x47\x93\xc4\xbe\xfb\xee\xbb\xd9\x2d\x1d\xf3\
+\x65\xb8\xeb\x83\xf2\x3b\x7e\xfe\x9b\xdf\xec\x6d\x4a\x36\x81\x66\
+\x34\x2b\x65\x3b\x7e\x82\x1f\xdb\x21\xc0\x69\x73\x1e\x01\xd0\xf6\
+\xc7\x46\xd0\xe5\xcb\xc5\x8d\xcd\x90\x76\x24\x34\xa3\xfe\xe8\x96\
+\x5b\x6e\xde\xa4\x8b\xa8\x3f\x3a\x70\xe0\x40\x73\xf6\x20\xe6\x84\
+\x81\x0b\x10\x80\xb0\x6e\x50\x52\x0e\xa5\xda\xb4\xd9\x3c\x91\x3f\
+\x86\x40\xa8\x41\x0d\xb9\x84\x00\x5a\xd2\x45\x07\x9f\xe9\xf5\x93\
+\x58\x83\x6f\x5f\x30\xf4\xc7\x34\xa8\x98\x3e\x68\x69\xe6\x33\x49\
+\x12\x56\xd3\x42\xde\x44\xc4\x31\x60\xd8\xf7\xb4\x33\xa5\x6c\x43\
+\x95\x44\x05\x7e\x38\x80\x61\x89\xac\x5b\x19\x92\x7f\xbf\x3f\xd6\
+\x0a\x02\x62\x73\x16\x1b\xea\x43\x12\x71\x0a\xa4\xb0\xa0\x48\xea\
+\xeb\x1c\x63\xc9\x70\xfc\xb0\x34\xd4\x4a\x38\x52\x2f\x81\x60\x58\
+\x1c\x69\x90\x47\x47\x0e\x93\x68\x68\xb9\x14\x16\x58\xa1\x23\x12\
+\x0d\x49\x97\xa2\x2e\x52\x87\x7a\xbf\xcf\x3e\x67\x34\x1d\x44\x7b\
+\x32\x4f\xb7\xe9\x9a\xd3\x6b\x50\x97\x71\xb3\xf4\x24\xac\xd7\xd6\
+\x8b\xac\x5c\xb9\x5a\xea\xeb\x42\x12\x40\x40\x50\xd8\x91\xc2\xe2\
+\x12\x63\x21\xb8\xfa\xca\xcb\xa4\x7c\xfd\x8a\x36\x05\x43\xae\x9b\
+\x96\xf0\x2a\xcd\x5b\x48\x0b\x96\x0f\x84\x16\x3d\x6c\xd8\x10\xf3\
+\x31\x4c\xef\xcc\x69\x3c\xf5\xd4\x53\x4d\x81\x0f\x5a\x31\xd8\x46\
+\xa6\xca\xce\xc6\x60\x68\x2c\x70\xd7\x8b\x44\xef\x6b\x2b\x1e\xd0\
+\x66\x60\xb8\x7e\xfd\xfa\xee\xbd\x7b\x1f\xff\xfd\xa4\x49\x93\x7a\
+\x20\xaa\x10\xa6\x0e\x46\x48\x25\x62\xf4\xad\x49\x00\x4a\xd2\x34\
+\x63\x01\x0c\xc7\x8f\x1f\x1b\x4f\x49\x60\xde\x1b\xca\xb1\xc1\x1f\
+\x07\x69\x3f\x5b\xcd\x08\xef\x02\xf3\x3c\xff\xfc\x73\xe3\xe6\x58\
+\x80\x0f\xc0\x10\x20\x99\x69\x34\x63\x3a\xba\xe0\x3d\xa0\x27\xfc\
+\x00\xd0\x0c\x11\x58\xb1\xcf\x3e\xfb\xc4\x93\xdb\xa9\x65\x90\x19\
+\x73\xb3\x30\xc0\x06\x5a\xe2\xaf\x7e\xf5\x6b\x41\xc1\x74\xb4\x43\
+\xed\x26\xdb\xf1\xb3\xdf\x5a\xdb\xc3\x67\xd4\x58\x69\x1a\xe5\xf7\
+\xf9\x62\x1e\xd5\xfd\xa6\xe9\x0c\x7d\xc5\x01\xbe\x48\x10\x47\xd5\
+\x14\xcb\x18\xc2\x86\x41\xc3\x07\x0b\x30\x7c\xfb\xed\xb7\xe3\x66\
+\x52\xcc\x49\x38\xdc\x60\x18\xf9\xf5\xd7\x5f\x2f\x77\xdf\x7d\x77\
+\xdc\x8f\xb3\xb1\x16\xd2\x38\xc3\x6e\x46\x86\x48\x53\xf8\x14\xdd\
+\xfe\x19\xf7\x5c\x12\x48\x9b\xae\x95\xf6\x04\x43\xc0\x9d\xd5\xb2\
+\xac\x6f\x90\x00\x03\x30\x8c\x99\x19\x0b\x8b\x24\xd2\x10\x95\x7b\
+\x87\xdd\x2f\xa7\x9f\x7e\x96\xac\xdb\x50\x29\x3e\x41\x4a\x4a\x81\
+\x04\xfd\xdd\x64\xcd\xb2\x7a\xf9\xf7\x07\x00\x43\x7b\xc6\xa5\x15\
+\xa6\x7c\x12\xf0\x17\x89\xe3\x43\xae\x21\x4e\x08\x89\x98\x28\x52\
+\x68\x85\x0d\xa1\x6a\x09\x47\xab\x25\x14\xae\x91\xe7\x9f\x7f\x54\
+\x1a\x6a\x57\x48\x41\xd0\x06\xb3\x58\x2d\xc7\x67\x02\x6c\xde\x7c\
+\xe3\x0d\x39\xf9\xe4\xe3\xe3\x85\x6e\xb4\x8f\xd6\x0a\x64\xd6\x7a\
+\xe2\x8f\x1f\x2c\x4c\x3a\x52\x33\x8c\x0d\x2a\x60\x13\xff\x2b\xaa\
+\xaa\xc4\x27\x01\x84\xea\x48\xb7\xae\xdd\x4d\xfe\x32\xc0\x70\xfd\
+\xda\xc5\x6d\x02\x86\x04\xa1\x6c\x5c\x1a\x89\xc0\x90\x67\x56\xc2\
+\x85\x02\xd7\x0b\xd6\x1c\x78\x4c\xd7\xae\x25\x32\x6b\xd6\x6c\x41\
+\x8a\x07\xca\xbc\xf1\xbd\x14\x72\x09\x8e\xe9\x04\xdb\x44\x60\x28\
+\x22\x65\x8e\x13\xf9\xb9\x88\x94\xa7\xe3\x7b\xb9\xf8\xbe\xcd\xc0\
+\xf0\xe9\xa7\x9f\x1d\x72\xe1\x85\x17\x0e\x06\xb3\x43\xd0\x81\xb1\
+\xfb\x07\xec\x02\x66\x8a\x40\x2e\x06\x94\xac\x0d\xda\xd3\xc9\xd4\
+\xc1\xbc\xdc\x3e\x43\x46\x64\xa1\x4f\xf0\x3b\xa0\x50\x37\xcc\xa4\
+\xd0\x0c\xb5\xa9\xae\x25\xd2\x16\xde\x05\x66\x86\xc8\x4f\x98\x1e\
+\xe9\xd4\xbe\xe1\x86\x1b\x8c\xef\x29\x9d\x66\x98\x8e\x36\x0c\x5a\
+\xe1\x22\xc4\x18\x76\xda\x69\x27\x79\xe3\x8d\x37\x64\xcf\x3d\xf7\
+\x68\x02\xc0\xc9\xda\xa2\x10\xb0\xdf\x7e\xbf\x35\xc7\x57\x11\x20\
+\xf1\x3b\x5b\x30\x6c\xae\xc0\x43\x7a\xb4\x84\xd6\xe9\x68\x95\xcd\
+\xf7\x14\xa0\xa0\x19\x62\x3e\x11\xa0\x04\xba\xb1\xd2\x4f\x65\x65\
+\xb5\x49\x91\x40\x79\x34\xdc\x0b\x86\x61\xb5\x75\x5b\x35\x05\x60\
+\x08\xcd\xb0\xd1\x04\x97\x79\x6f\x70\x0e\x20\xd2\x27\x28\xd0\xf0\
+\x49\x37\x6d\x13\xd3\x2c\x3f\xc0\xd0\xf6\x39\x2a\x8e\x01\x44\x7b\
+\x2e\x21\xae\x60\x61\x89\x84\xeb\x1a\xe4\xce\x7b\xef\x93\xbe\xa7\
+\x9f\x25\x1b\x36\x54\x8a\x38\x01\x09\x04\x0b\xa5\x28\xd8\x5d\x56\
+\x2e\xa9\x94\xd1\x1f\x4e\x30\x9a\x88\x3d\xfc\x19\x09\xf9\x85\x52\
+\x10\x44\x99\xb9\x06\xe9\x52\x54\x2a\x55\xb5\x28\x51\xe8\x93\x40\
+\x41\x54\x8a\xba\xf8\xc5\x1f\x08\x49\x79\xc5\x1a\x79\xfe\xb9\x47\
+\x25\x54\xbf\x4e\xc2\x91\x1a\x81\x39\x13\x8c\x1d\x73\xb3\xa1\x6c\
+\x9d\xbc\xfc\x12\x02\x76\x4e\x35\xc9\xf1\x30\x77\x97\x97\x97\xc5\
+\xcb\x1a\x82\xce\x98\x27\xcb\xd0\x49\xed\xa6\x01\x34\x06\xdc\x51\
+\x03\xc0\x27\xb2\x72\x45\xa5\x94\x95\x57\x19\x20\x14\xc7\x6f\x7c\
+\x98\x13\x27\x7d\x2a\x83\xae\xb8\x54\xd6\xaf\xfc\x5e\x7c\xbe\xc4\
+\x79\x88\x89\x85\x97\xf4\xeb\x42\x5b\x86\x12\xcd\x79\x36\x7b\xc7\
+\xcd\x8f\x58\x20\x1f\x96\x8d\xfb\xee\x1b\x6a\x3a\xc7\x5a\xc3\x53\
+\xa6\x4c\x35\x7c\xf2\xfb\xef\xbf\x6f\x72\x98\x02\xd7\x65\x73\xcc\
+\xa5\x09\x46\x3d\x54\x24\x7a\x43\x7a\x6a\x64\x7f\x47\x9b\x80\xe1\
+\x82\x05\x0b\xb6\x3b\xe5\x94\xbe\x8b\x61\x7a\x03\x81\x98\x53\x44\
+\x13\x52\x36\xb6\xed\x4c\x49\xa0\x7d\x31\xd4\xc2\xf0\x19\x36\x05\
+\x82\x5a\x60\x4e\x24\x30\x63\xf1\xe3\x44\x85\x31\x63\xc6\x1a\x33\
+\x29\x22\xc2\xb2\x05\x03\x80\x15\xfc\x13\x48\x1d\xd0\xc9\xfd\x37\
+\xdf\x7c\xb3\xdc\x77\xdf\x7d\x2d\x02\x43\xcd\x04\x13\x81\x0d\xc0\
+\x10\xe7\xea\xe1\x60\x58\xf8\x07\x19\x1c\x00\x9a\xf1\xe4\x08\xd2\
+\x0f\x1a\x61\x4d\x8d\x05\x69\x04\xe3\x20\x72\x11\x97\x36\x95\x66\
+\x23\x6d\xd2\x67\xab\x25\x6f\xf4\x99\xe6\xd0\x44\xfd\x27\xcd\xb3\
+\xd9\xd4\x99\xae\x8f\x74\xf7\xb1\x7f\xac\x19\x89\xb0\x75\x80\x61\
+\x8f\x1e\x9b\x19\xdf\x95\x15\xb6\x44\xaa\xaa\x6a\x0c\x18\x62\x3d\
+\x99\x20\x8d\xda\xda\x38\x18\xe2\x1d\xf0\x19\x23\x62\xb6\xb9\x60\
+\x08\x1a\x00\x0c\xa1\x75\xe2\x6a\xbe\xb0\x90\x0f\x60\xa8\x34\x42\
+\x6a\x5a\x0c\xa0\x09\x16\x49\x34\x14\x95\x5b\xef\x1e\x2a\x67\x9e\
+\x71\x8e\x94\x95\x55\x99\x5a\xa3\xfe\x40\x81\x74\x29\xd8\x4c\x6a\
+\x2b\x45\xfe\xf9\xf6\xfb\xf1\x24\x74\x08\xb3\x85\x05\x5d\xc4\x1f\
+\x2c\x92\xca\x8a\x1a\x29\x2a\xb4\xb9\x95\x30\x77\x56\xd7\x57\x48\
+\xd7\x6e\x05\xc6\x4c\xba\x74\xd9\x22\x79\xf5\x95\x67\x62\x85\xba\
+\x63\x79\x8a\xb6\x94\x8d\x59\xdb\x8f\x3c\xf2\x37\x19\x30\xe0\xfc\
+\xb8\x66\xd8\x98\xba\x62\x03\xbb\xac\x56\x0f\xad\xdf\x15\x45\x0a\
+\x8d\x16\x42\x10\xfa\x8f\x38\x83\x90\xc8\x8a\x55\x1b\xa4\xb2\x1a\
+\xf5\x57\xe1\xff\x04\x18\x76\x97\xf1\x13\x26\xca\xe5\x97\x0f\x94\
+\xaa\xf5\xcb\xdb\x04\x0c\x73\xb5\x57\x92\x09\xe7\xf0\x19\xde\x74\
+\xd3\x4d\xc6\x22\x42\x61\x01\x7c\x1d\x81\x86\xcb\x97\x2f\x37\xb4\
+\x62\x09\x39\xee\x99\xe6\x0a\xc2\x1b\xef\xc5\xe8\x4f\xdb\xe2\x54\
+\x8b\x36\x01\xc3\x07\x1f\x7c\x70\xc4\x5f\xfe\x72\xed\x65\x88\x40\
+\x42\xb4\x1d\x2e\x9a\x48\x9b\x77\x26\x5a\x3a\x96\xd5\xbc\xef\x69\
+\x52\xc4\x71\x26\xff\xfa\xd7\x7b\x31\x26\x13\xcb\x55\x8a\x46\x4d\
+\xba\x05\x18\x1b\xa2\xa4\xb2\xd5\x0c\xc1\xfc\x0e\x3d\xf4\x50\x13\
+\x8e\x8f\xb6\xb0\x68\x20\xa1\xa2\x40\x38\xc2\xe5\xb3\xd5\x0c\x39\
+\x72\xb4\xc3\x10\x65\xbc\xeb\xe5\x97\x5f\x36\x01\x34\x56\xdb\xc5\
+\x29\xf1\xf6\x4e\xf7\xe1\xb9\x7c\x1e\x9f\xff\xee\x77\x07\xc4\x03\
+\x68\xf0\x1c\xb5\xcd\x6c\xc0\x30\xdd\xcc\x30\x4f\x2f\x51\xb0\x4c\
+\xae\x36\x78\xba\x3e\xa4\xfa\x9e\x9a\x37\x0f\x5f\x45\xc0\x00\x42\
+\xd7\x7b\xf6\xec\x21\x38\xaf\xd0\x9a\x94\x83\x52\x56\x56\x21\xfd\
+\xfb\xf7\x37\x3e\x43\x16\x2c\x47\xbb\xa6\x9c\xd8\xff\x8e\xe2\x1a\
+\x3c\x78\xb0\x01\x43\x3d\xdf\xa4\x6f\xaa\xf7\xbb\xc1\xb0\xf9\x82\
+\x42\x7b\x83\xa1\x66\x35\xd0\x0c\x71\x76\x57\xa3\xcf\xcd\x17\x28\
+\x14\x27\x1c\x95\x7b\x1f\xf8\xab\x5c\x70\xc1\x00\xa9\xa8\x40\x02\
+\xbd\x35\x83\x76\x29\x28\x94\x35\xcb\xab\xe5\x91\x87\x47\x9a\xe8\
+\x67\xa3\x9d\x9b\x5a\x9f\x7e\xf1\xfb\x0a\xa4\xb6\xa6\x5e\xfc\xfe\
+\x42\x09\x14\x20\x42\x57\xa4\xba\xa6\x42\x0a\xbb\xc0\x37\x58\x23\
+\xa5\x5d\x0b\xa4\xa2\x7c\xad\x44\xc2\x35\x12\x09\x35\xc4\x2b\x20\
+\xc1\x54\x8b\xfd\x77\xf4\xd1\x47\xca\x91\x47\x1e\x21\x51\xc7\x56\
+\x6e\x81\x39\x1b\x02\x0f\x4e\xbb\xc0\x9c\xe3\x44\x1b\xd0\xbe\x30\
+\x56\x50\x9e\x05\xc3\x6d\x29\xb8\x46\x30\x0c\x47\x45\x56\xaf\xad\
+\x92\xea\x5a\x1c\x22\xed\x93\x48\xd4\x67\xc0\xf0\x93\x09\x9f\xca\
+\xe5\x97\x5d\x2c\xeb\x57\x2d\xea\xd0\x60\x48\xcb\x1a\x52\x39\x40\
+\x13\x5a\xf3\xf0\x1b\x27\xb1\x4c\x99\x32\xc5\x44\x82\xd3\x7c\x8a\
+\xb5\x9c\xa5\x46\xa8\xb7\xc3\x23\x22\x51\x1b\x46\xdd\x8a\x57\xab\
+\x83\xe1\xc2\x85\x0b\x77\xea\xdd\xbb\xf7\xb7\x73\xe7\xce\x8b\x33\
+\x07\x5d\xfe\xa7\x2d\x4c\xa4\x9a\x7e\x4c\x23\xa0\x76\x88\x85\xbe\
+\xd7\x5e\x7b\x99\x04\x70\x5c\xd4\x60\x60\x16\x40\xc8\xf0\x3d\xf7\
+\xdc\x13\x8f\x6a\xcc\x06\x0c\xf4\x38\x99\x2c\x8f\xc5\xe2\x36\x41\
+\x36\x82\x52\xd3\xe3\x5e\xb4\x5f\x28\x15\x38\x68\x8d\x61\x87\x1d\
+\x76\x30\xe6\x3a\x68\x86\x1a\xfc\xf4\xe9\xeb\x78\x1f\xb4\x44\x80\
+\x10\x35\xc7\x03\x0f\x3c\xd8\x80\xb4\x3e\xf4\x33\x5b\xcd\x98\x29\
+\x2d\x16\x88\x6d\xc8\x77\xa2\x71\xb8\x35\x1e\x02\x45\x3a\x9f\x43\
+\x2b\xee\x91\x98\x90\x64\x03\x60\x68\x26\x45\x34\x29\x52\x1d\x50\
+\xe8\x40\xd3\x16\x66\x52\x68\xff\x00\x43\xcc\x33\x6b\xac\x9a\xdc\
+\xb7\xff\xf9\x72\x6f\xbc\xf1\x46\x63\x26\xa5\x56\x4c\x1a\x24\xd2\
+\x14\x19\x04\x81\x0e\x80\xfe\x5a\x33\x6c\x7e\xa4\x6d\x1e\x82\x61\
+\x2c\x91\xde\x8c\xcf\x1c\x77\xe4\x97\x11\x8f\x3c\x2a\x17\x0d\xbc\
+\x50\x6a\xea\xac\xc0\x86\x64\xf5\x2e\x05\x22\xe3\x47\xcf\x95\xbf\
+\xfc\xe5\x5a\x63\x8a\x43\xc0\x0c\xf6\x2f\x0e\xf1\x2d\x0a\x16\x49\
+\xc4\xf1\x89\xdf\xf1\x49\x5d\xa8\xde\x68\x70\x91\x68\xbd\xf8\x03\
+\x28\xee\x1d\x92\x3e\x7d\x4e\x94\xd3\xcf\xe8\x2b\x5b\xf6\xb4\x81\
+\x4e\xf0\x39\x76\xed\x56\x6a\xe6\x72\xe6\xcc\xe9\x26\xb5\x69\xde\
+\xd7\xb3\xed\xbe\x77\xc2\xc6\x47\x68\x8f\x06\x2b\x17\xa4\x11\xc0\
+\x72\x03\x0b\x8b\x66\x94\xc6\xcf\xe9\xf8\x8c\x56\x68\x74\x5d\x47\
+\x24\x14\x16\x59\xb9\x06\x55\x70\x6a\x4d\x51\x6e\xd4\x07\xee\xd9\
+\x63\x0b\x13\x4d\x6a\xcc\xa4\x1d\x1c\x0c\xc9\x17\x59\xca\x2d\x51\
+\x01\x71\x37\x00\x52\xab\xce\x8d\x30\x1b\x45\x64\xe9\xfc\xd6\xdc\
+\xe7\xad\x0e\x86\x57\x5e\x79\xe5\xe3\x4f\x3d\xf5\xd4\x00\x9a\xe5\
+\xc8\x08\xdd\xd1\x82\x6e\xcd\x28\xd1\xa0\xf1\x6c\x63\xe1\x61\x7b\
+\x8e\x9c\xbb\x4c\x11\xef\x61\xe5\x0f\x9d\x98\xcd\x36\xb5\x24\xce\
+\xf7\x9a\x48\xb4\xd8\x59\x69\x64\xd4\xfc\x8d\xcf\xdd\xe5\xd2\x9a\
+\x3b\x29\x3a\x7a\x30\xd9\xd8\xd2\x69\x06\xf8\x9e\xa0\xca\x71\xb1\
+\x2e\x26\xfd\x48\x64\xb2\xb8\x17\x09\xde\x38\xe9\x7d\x8f\x3d\x76\
+\x8f\x47\x7e\x31\x75\x84\x47\x3d\xd1\xee\x4f\x50\xc4\xf3\x48\x86\
+\x87\x56\xcc\x64\xdc\x5c\x09\x2c\xa9\xb4\x19\x1d\xed\xab\x25\xca\
+\xf6\xb4\x1c\x34\x9d\x0f\x0b\x66\x1c\x03\x8e\xa6\x42\xda\x0a\xf3\
+\x0c\x79\x2f\x34\x17\x98\x32\x71\x92\x80\x7b\x6d\x62\x8e\xc0\x5c\
+\x01\x86\x7a\xbe\xb0\xbe\xb8\x0e\x69\xa6\x63\xe0\x01\xf7\x0b\xca\
+\xa9\x21\x9a\x14\xc5\xb8\x75\x99\x35\x82\x68\xa6\x51\x7b\xcd\x5d\
+\xb7\xb9\xbb\x5f\x83\xb1\x3b\x42\xd3\xc0\xa1\x79\xd5\xd3\xcf\x3c\
+\x13\x0b\x32\x83\xe0\xe1\x13\x1c\xf8\x51\x10\x14\xf9\x6a\xd6\x37\
+\x26\xea\x1b\x60\x13\x31\x45\xba\x71\x31\x6d\x1f\x01\x2e\xc6\x13\
+\x69\xea\x9e\x22\xe8\x06\xf4\x03\x4d\xce\x3f\xaf\x9f\x0c\xbe\xfe\
+\x66\x29\xed\xd6\x43\x2a\xaa\x50\xd2\xae\x50\x1a\x42\xb5\x52\x58\
+\xe0\x93\x15\x2b\x96\xca\x49\x27\x1f\x27\xab\x96\x2f\x31\xe7\x23\
+\x02\x28\x51\xbf\x94\x3c\x06\xe7\x2e\xbe\xf2\xd2\xcb\x26\x31\xdf\
+\x1f\x64\xf5\x1e\x9f\x29\x0e\x80\xe3\x10\xcb\x2b\xc2\x52\x5d\xdb\
+\x60\x8e\xc7\xaa\xa8\xac\x36\xfd\x41\xe2\x3d\xf6\x0b\xcc\xe3\x28\
+\x82\x31\xe6\xe3\x8f\xe5\xda\xbf\x5c\x21\x6b\x57\x7d\x17\x3b\x5c\
+\x38\x77\x14\x6d\xad\x96\x12\xf1\x47\xbd\x5e\xe9\x72\xd2\x3c\x3b\
+\x7d\x9e\x6b\x76\xbd\xed\xd2\xa5\xe4\x89\xba\xba\x2a\xeb\x23\x68\
+\xa5\xab\x55\xc1\x70\xda\xb4\x69\xbb\xf6\xed\xdb\xf7\xeb\x85\x0b\
+\x17\x4a\x61\xa1\xad\xae\xa0\xb5\x02\x2d\xed\xa7\x03\x43\x4a\x17\
+\x64\xcc\xfa\xbc\x2f\xb3\x2d\x54\xf1\x6a\x2d\x35\x27\x62\xe4\x89\
+\x26\x9b\xf4\xd5\xda\x5f\x6e\x24\x1a\xdb\x72\xb6\x60\x48\x90\x23\
+\x50\x10\x3c\x12\x8d\x8f\xb9\x70\x38\x0c\x76\xd4\xa8\x51\xb1\x0a\
+\x1b\xb6\x4c\x13\x2e\xf8\x0f\xa7\x4d\x9b\x66\x4e\x5c\x87\xd9\x1a\
+\xe6\x1c\x44\x41\x82\xc9\x22\xd2\x17\x1a\x0f\x0f\xfe\x25\xf3\xcf\
+\x25\xb3\xd5\xda\x1f\xc6\xc3\x14\x04\xd0\xdb\xcd\xdc\x35\x48\xb6\
+\xd2\x1e\xc8\xb0\xd9\xf4\x60\x88\x71\xe1\xf4\x09\x0d\x86\x3c\xb6\
+\x8a\xf3\x97\x0e\x0c\x59\x77\x16\x41\x56\x58\xe3\x8d\x7e\x6c\x31\
+\x27\x7d\x20\xa1\x9f\x6b\xc9\xa4\x17\x34\xd8\x28\xd5\xfc\xbf\x92\
+\x69\xa6\x16\x18\xe9\x57\x7a\xfa\xe9\x27\x8d\x66\x8d\x71\xb1\x78\
+\x04\xfc\xd9\xf0\x4b\xa1\x68\x45\x75\x75\x6d\xac\xf4\x18\x12\xf9\
+\xed\x85\x6a\x33\xf6\x79\xfb\x1b\x27\x61\x38\xd1\xa0\x84\x23\x22\
+\x17\x9e\x77\x91\x5c\x77\xfd\xcd\x12\x2c\xea\x26\x15\xd5\x35\x28\
+\xf5\x25\xe1\x48\x9d\x14\x17\xf9\x4d\xdd\xd2\x53\xfa\x1c\x2f\x4b\
+\x97\x7c\x67\x8e\x59\x82\x56\x08\x30\x64\x0e\x34\xdc\x0b\xaf\xbc\
+\xf4\xaa\xec\xf6\xcb\x5d\xcd\x41\xc3\xbe\x00\x5c\x28\x7e\x89\xa0\
+\x2c\x5c\x48\x64\xcd\xfa\x2a\xa9\xac\xac\x35\x41\x3e\xe2\xc3\x11\
+\x53\x3e\x13\xcc\x83\x79\xa9\xab\xa9\x36\x60\xf8\xf1\xe8\xff\xc8\
+\x35\x57\x5f\x2e\xeb\x56\x2f\xee\xd0\x60\xa8\xdd\x25\x89\xcc\xfa\
+\x6e\xab\x99\xb6\x6a\xe4\x62\x6d\x62\xcd\x97\x96\x16\xef\x56\x59\
+\x59\x39\x2f\x17\xed\x25\x6a\xa3\x55\xc1\xf0\xee\xbb\xef\x7e\xe2\
+\x8e\x3b\xee\xe8\x6f\x37\xad\x3d\xec\x32\x19\xd8\xa4\x03\x43\xaa\
+\xdc\x04\x50\x6e\x1e\xb4\xa9\x73\xc0\xdc\x47\x1c\x25\x62\xa6\x7c\
+\x97\x7e\x67\x22\x33\x9c\xfe\x3e\x5b\x86\x93\x6e\x7c\xe9\x26\x18\
+\xe3\xe0\x82\x24\x68\x18\x5f\x46\x61\x61\x3c\x31\x9e\xc0\x08\x2d\
+\x17\xcc\x74\xfb\xed\xb7\x37\xc9\xdf\xf0\x1d\x82\x46\x3c\x3d\xbe\
+\xae\xae\xde\x30\x56\x24\x7f\xbb\x8f\x77\xa1\x69\x14\xed\xe2\x32\
+\x79\x59\x1b\x25\x1c\xa7\xeb\xed\xc6\xdf\x6b\x0d\x3d\x19\xc0\xb9\
+\x4d\xb1\x34\xcd\xe4\xe2\xfd\xcd\xef\xb1\xfb\x89\x96\x83\x21\x5b\
+\x4a\xa5\x19\x02\x34\xb5\x1f\x9d\xcf\xe0\x73\x0a\x7a\x23\x46\x3c\
+\x2a\x83\x06\x0d\x8a\xef\x21\x1d\x41\xdc\xde\x66\xe4\xf4\xf4\x4d\
+\x0d\x86\x5c\x13\xc9\xc0\x10\x7e\x75\x80\x21\x82\xbc\xac\x99\xdf\
+\x82\xa1\x8d\x02\x6d\x0c\xcc\xb1\x82\x67\x50\xc4\xc1\x21\xbf\x16\
+\x0c\xaf\xbd\xee\x26\x09\x14\x76\x95\xca\x1a\xd4\xe1\xb5\x60\x58\
+\x5a\x1c\x94\xd5\x6b\x96\x1b\x30\x5c\x0c\x30\xc4\x01\xbc\x2e\x30\
+\xdc\x7b\xef\xbd\x0d\x18\xee\xb2\xeb\xce\xb1\x70\x61\x08\x1d\x7e\
+\x81\xb7\x12\x5b\x62\xe5\x9a\x2a\x13\xf5\x8a\xb3\x16\x83\x05\xb6\
+\x88\x3a\xf8\x9c\x11\xee\x6a\x6b\x4c\x90\x49\x47\x05\x43\x0a\x28\
+\x7a\xed\xea\xcf\xb4\x40\xeb\xbe\x37\x1b\x77\x52\xaa\x75\xd4\xb3\
+\x67\x8f\x27\x37\x6c\x58\x6f\xcf\x7d\x6b\x85\xab\xd5\xc0\xf0\xb3\
+\xcf\x3e\xdb\xa9\x6f\xdf\xbe\xdf\x22\x11\xd3\x12\x0b\xd5\xdc\x93\
+\x4b\xb0\xe9\xc0\x02\xcf\x92\x59\x82\xb1\x43\x7a\x83\x29\x82\x6d\
+\xba\x4d\xa6\xda\xd4\x96\x0a\x10\x39\x91\x89\xc2\xd5\xf5\x24\xb7\
+\x36\x43\x4e\x37\x7e\x82\x21\xd7\x00\x7d\x9f\x64\x82\x04\x46\x08\
+\x03\x04\x45\xf8\x0c\xdf\x7f\xff\x7d\xd9\x65\x97\x9d\x0c\x13\x01\
+\x23\xe0\xf5\xe0\x83\x7f\x35\x15\x71\x40\x27\xf8\xb5\x34\x33\x65\
+\x75\x14\x77\x45\x9b\x5c\xad\x3f\x68\xae\x36\x62\xd7\x4a\xd3\x00\
+\x64\xbc\x13\x7d\xd1\x75\x19\xf3\xc7\x44\x8a\x91\x67\x0e\x86\x48\
+\x7f\x40\x7e\x27\x13\xf4\x33\x01\x43\xce\xff\x37\xdf\x7c\x63\xca\
+\xe7\x71\x0e\xe8\x9b\x01\x13\x86\xc6\x3e\x64\xc8\x10\x53\xf7\x94\
+\x67\x19\x66\x2b\xa4\xe5\x6a\x4e\xd3\xb7\x93\x1a\x0c\xb9\x5f\x9f\
+\x7a\xea\x09\x13\xb4\xe6\xd6\x0c\x51\xe5\x04\x60\x58\x5b\x5b\xbf\
+\x11\x18\xfa\x7c\xb6\x3a\x8c\x3d\x1a\x0a\x60\x88\xe0\x96\x02\x13\
+\xc4\xd2\xef\xfc\x8b\xe5\x2f\xd7\xdc\x20\x5d\x4a\x7b\x1a\xcd\x10\
+\x05\xd3\x43\xe1\xda\x8d\x34\x43\x18\x5c\x1d\x80\xa1\x44\xe3\x66\
+\x52\x80\xe1\xcb\x2f\xbe\x22\xbb\xee\xb6\xcb\x46\x60\x88\xf7\xad\
+\x5a\x5b\x17\x07\x43\xbc\x0b\xeb\x19\x6e\x07\x23\xa0\xd6\x54\xcb\
+\x56\x5b\x6d\x29\xa3\x3f\xea\x78\x9a\xa1\x1b\xdc\xb4\xeb\x45\x7f\
+\xa7\xd7\x9e\x16\x64\x71\x4f\x6b\xac\x4b\x2b\x50\xd7\xb7\x9a\xef\
+\xb0\xd5\xc0\x70\xf0\xe0\xc1\x8f\x0e\x1d\x3a\xf4\x12\xf8\x54\x2c\
+\xb3\x4d\xbd\x5d\xd2\x81\x01\x08\x01\x00\x64\x7e\x22\xfd\x79\xd4\
+\x10\xa9\xba\x6b\xd0\x70\x9b\x56\xdd\x3d\xc8\xa5\xe6\x97\x9e\x19\
+\x64\x37\x7e\x56\x82\x49\xd4\x0a\x02\x92\x00\x28\x2c\x1a\x8d\xcd\
+\x08\x41\x01\x3e\x0f\x24\x86\xc3\xdc\x83\xbc\x49\x98\x49\x19\xec\
+\x31\x74\xe8\x7d\x82\x1c\x47\xfa\x47\xb0\x91\x41\x63\x3c\x47\xf3\
+\x14\xe8\x87\xcf\xf1\x3b\x5b\x61\x80\x02\x09\xe7\x89\x7e\x32\xb7\
+\xa9\x9c\xa0\x0e\x66\x08\x93\x2d\xcd\x80\xad\x05\xcc\x99\xcf\x5b\
+\x6a\x30\xe4\x5a\x72\xfb\x0c\x69\x26\x35\x70\x9a\xc2\x67\x08\xfa\
+\xce\x9d\x3b\xd7\x44\x9a\xe2\x19\x9b\x4b\x17\x32\x3f\xf8\xae\xa4\
+\xa4\xab\xa9\xf0\x01\x97\x03\x2f\xcc\x97\xf6\xc1\x67\x3e\x96\xf6\
+\xb8\x33\x35\x18\x52\x80\x7b\xf2\xc9\xc7\x0d\x18\x52\x53\x66\x5a\
+\xc3\x8c\x19\x33\xe2\x60\x68\x78\x89\x83\xa2\xe3\x38\xe3\x17\xf3\
+\x62\xeb\x8d\xfe\x3f\x7b\x57\x01\x26\x67\x79\xad\xdf\xf1\x9d\x95\
+\xec\x46\x89\x10\xa4\x58\x81\x62\xc5\x5d\x83\xb4\xb4\x68\x80\xe0\
+\x16\x02\x41\x42\x14\xc9\xa5\x2d\xe5\xe2\x50\xa0\xc5\x21\x40\xa1\
+\xd0\x12\x24\x09\xa5\x85\x22\x45\x2e\x1e\x34\xb8\x06\xe2\xbb\x9b\
+\xdd\xac\x8e\xcb\xbd\xef\xf9\xfe\x33\xf3\xed\x64\x76\x67\x66\x25\
+\xc2\xed\xff\x3c\x79\x36\xbb\xf3\xcf\x2f\x9f\x9c\xf7\xe8\x7b\xb2\
+\x94\x6a\x8c\x21\x06\x04\x0c\xc7\x9e\x3e\x1e\x13\x27\x5d\x84\x8a\
+\x7e\x83\x32\x60\x18\x8b\x87\x50\xe6\x77\x89\x9b\xf4\xa8\x23\x7f\
+\x85\x25\x8b\xbe\x97\x78\x9f\xe9\x77\x98\xcd\x43\x60\x62\x1d\xc1\
+\x70\xf3\xcd\x37\x33\xb5\x86\x5e\xba\x62\xdd\x52\x53\x48\xae\xef\
+\xfa\xc6\x10\x9a\x9b\xdb\xa5\xfc\x23\x9e\x30\x7b\x85\x56\xab\xec\
+\xbf\xf6\x36\xa1\xea\x7b\xfe\xb9\x67\x31\x6d\xca\x04\x2c\xaf\xa5\
+\x51\xd0\x79\x9d\xe1\xea\x98\x91\x42\xf7\x2c\x24\x93\x6d\xc0\xeb\
+\x6b\x59\x6a\x19\x34\xb7\x03\xa9\x73\x0b\x3d\x7b\x77\x3e\xef\x13\
+\x30\x7c\xe5\x95\x57\x46\x8e\x1d\x3b\x76\x01\xd9\xfb\xb3\xee\xb1\
+\xae\xb3\xd9\x4a\x19\xf8\xcd\x36\xdb\x4c\x80\x91\x00\x41\xb0\xa5\
+\xe0\x20\xb1\x34\x99\x62\xf8\x37\x0e\x5c\x56\xa3\xee\xd5\x14\xdf\
+\xee\x8c\x71\x51\xdf\x29\xe5\xfd\x79\xae\xc6\x45\x29\x28\xd9\xc4\
+\x73\xb7\xdd\x76\x93\xb1\x50\x25\x81\xef\x4f\x22\x70\x16\x87\x8f\
+\x18\x31\x0c\xe4\x1d\x55\x81\x4c\xed\xf8\xa6\x9b\x6e\x11\x9e\x4c\
+\xa6\xff\x73\xf3\x32\xd6\xa5\xd9\xad\xf6\x03\xf7\x56\x7a\x34\x05\
+\x85\xce\x8b\xbd\x89\x38\x8f\xb4\x60\xed\xd8\x1a\x9f\x89\x31\xa2\
+\x35\xeb\xe8\x3e\x18\xaa\xa6\xdc\x15\x18\x72\x4c\x5e\x7c\xf1\x45\
+\xe1\x78\x54\x8f\x87\xc6\x53\x4d\xb2\x99\xc9\x74\x56\x25\x42\xd7\
+\x77\x4f\x13\xbb\x56\xdd\x18\x77\x0d\x86\x2a\x27\xee\xbe\xfb\x4e\
+\x01\x43\xa9\x23\xf4\xfb\x33\x35\x7e\x8c\x71\x93\x50\x9f\x96\x61\
+\x2e\x18\x02\x26\x04\xa3\xca\x1e\xff\x4f\x30\x4c\xa5\xdd\x38\xeb\
+\x8c\x73\x31\xe1\xc2\xa9\x1d\xc0\xd0\xb6\x0c\xd9\xde\x89\x31\x43\
+\x37\xdd\xa4\x49\xee\x91\xac\x65\x48\xe6\x26\x82\xa1\xb8\x49\xe5\
+\x06\xcc\x80\xce\xc6\x0c\xeb\x1a\xda\xd0\xd2\x12\x92\x98\x21\xc1\
+\x90\xef\x40\x30\xe4\xcf\x50\x5b\xab\x80\x21\xdd\xa4\x6b\x2b\x18\
+\xda\x6b\xc3\x96\x4f\x76\x88\xaa\x2f\x2c\xc0\x7c\x6b\xb2\x63\xf2\
+\x5d\xdf\xd4\x1d\xf6\x09\x18\x4e\x99\x32\xe5\xba\x5b\x6f\xbd\x75\
+\x2a\x37\x71\xb6\x3d\x48\xef\x80\x21\x5d\x17\xa4\xb3\x62\x86\x97\
+\xba\x4e\x59\x07\x48\x9a\x2a\x6e\x18\x1e\x36\xcd\x9b\x0a\xa2\x42\
+\x9b\xbe\x2b\x30\x5a\x15\x13\x5e\x0c\x18\xda\xc0\x44\x10\xd1\x20\
+\x35\x0b\x61\x49\xe9\x96\xaf\x86\x90\x20\x48\x20\xd2\x16\x35\x74\
+\xe3\x70\x61\x91\xf5\x86\x96\xa1\xc6\x21\x35\x26\xcb\xcf\x94\x9d\
+\xa7\xd8\xb1\x2b\x34\xb6\xfa\xb9\x6e\x22\x13\xbf\x34\x16\x27\x6b\
+\x2f\x99\x21\x49\x2b\x90\xcf\xc2\xfb\x33\x79\x87\x2d\xa6\x18\x27\
+\xa2\x57\x21\x5f\x46\x70\xb1\xf7\xec\xbd\xf3\x8a\x07\xc3\x7c\x6e\
+\x52\xb5\xe0\xba\x4a\xa0\x61\x39\x0b\x5d\x81\x7a\x68\x66\xa9\xb1\
+\xca\xb5\x3b\x82\x61\x44\xc9\x75\x51\xad\xed\x31\x43\xdd\xb3\x77\
+\xdd\x75\x87\x94\x39\xe5\x82\xe1\xdc\xb9\x73\x33\x60\xc8\x3a\x3e\
+\xdb\x32\xec\x0c\x0c\xd3\x69\x0f\xc6\x9e\x31\x1e\x17\x4c\x98\x82\
+\xca\xea\xc1\x2b\xb9\x49\x19\x33\x94\x5e\x87\x8c\x19\xba\xd9\xda\
+\x29\xd6\x21\x9b\x94\x2d\xb5\xfe\xf2\xe0\xc3\x12\x66\x10\xa4\x15\
+\xd6\x1c\x13\x33\x24\x20\xd7\x35\x84\x3b\x58\x86\x0a\x86\x5c\xdb\
+\xed\xad\x2d\xd2\xa6\xeb\xc5\x17\x9e\xc3\x45\x53\x2f\x5c\x2b\x2d\
+\xc3\x7c\x7b\x27\x57\x4e\xad\x0a\xd9\x68\xcb\x0f\xc7\xf3\x77\x3d\
+\x90\x9a\xd6\x7b\x7b\xdb\xd1\x75\x7a\xfb\x82\xdf\x7e\xfb\x6d\xf5\
+\x2f\x7e\xf1\x8b\xa5\x5f\x7e\xf9\x65\x90\x0f\xae\xee\x3d\x59\xc0\
+\x5d\x1c\x85\xc0\x80\xae\x40\x5a\x2f\xb4\x0a\x99\xd2\xfe\xf3\x9f\
+\x6f\x9b\xe1\x12\x65\xa1\x33\x99\x62\x18\x1f\xb3\xdd\x6c\x5a\xdb\
+\xb6\x26\x68\xcf\x85\xde\xaf\xd0\x3c\xf0\xbd\xec\xba\x3f\x1b\x18\
+\x19\xfb\x23\x2b\x84\x68\xc4\x6e\x43\x57\x55\x55\x55\x21\x71\x42\
+\xf6\x08\x64\xa6\xa8\xb2\xfe\x28\xe0\xfc\xf3\x9f\xff\x94\x1a\x44\
+\x1e\x76\x62\x8e\xde\xc3\x8e\xb3\xaa\x2b\xb5\xd0\x33\x16\xfa\xdc\
+\xce\x84\x55\x20\xb7\x9b\x93\x92\x0e\x8b\x32\x87\x1d\x0b\xf8\x77\
+\x3e\x23\x8f\xde\xb2\x4e\x0b\x3d\x5f\xd7\x9f\xf7\x3d\x18\xb2\x95\
+\x17\xcb\x07\x34\x96\xaa\xae\x42\x02\x1d\xcb\x05\xe8\x2a\xd6\x4c\
+\x52\x1d\x13\xf3\x99\xa1\x35\x5c\xb3\x8f\xae\x2d\x43\x1b\x0c\x69\
+\x19\x2a\x49\x84\x51\x08\x5c\x20\x18\xb2\x9b\x0a\xb3\x35\x4b\x01\
+\xc3\xb3\xce\x3c\x17\xe7\x9d\x3f\x09\xd5\x03\x86\x4a\x7b\x25\x8d\
+\x19\xda\x6e\xd2\xc5\x04\x43\x36\xe2\x95\x06\xbf\x59\xcb\x90\x60\
+\xf8\xd0\x9f\xff\x22\x60\x28\xfb\xc6\xcb\xf5\xe9\x15\x37\xa9\x0d\
+\x86\x4c\xa0\xa1\x4b\xd6\x28\x94\x26\x16\xde\xd6\xd2\x2c\x96\xe1\
+\x8f\x0d\x0c\x57\xf7\x1a\x73\x88\x2c\xc2\x40\x6a\x58\x6f\x73\x96\
+\xf6\xba\x65\x78\xd5\x55\x57\x5d\x7a\xe9\xa5\x97\x5e\xc9\xc5\xcd\
+\x45\xa1\xc9\x11\xb4\x48\x4a\x3d\xec\xac\x4f\x25\x8c\xa6\x4b\x8d\
+\x7c\x9b\x8c\x87\x99\xf8\x13\x9b\xd5\xd6\x0b\x1d\x10\xdd\x4c\x6a\
+\x75\x28\xd5\x9b\x2d\xe8\xbb\xba\x3f\xbf\xc7\x7f\x6a\xc9\xe6\x26\
+\x6f\xd8\xe0\x60\xc7\xd4\xfa\x32\xf5\xdf\x7e\x7f\xfe\x5f\xd3\xec\
+\x55\x50\x50\x10\x52\x60\x2a\xab\x89\xb6\x62\xe2\x46\xa5\x95\xb8\
+\x78\xf1\x52\x1c\x77\xdc\x71\xc2\x26\xa3\xb1\x54\x3b\xd6\x6a\x67\
+\x84\xad\x2a\x61\xaa\xae\x3f\x4d\x94\xa1\x55\x7b\xdb\x6d\xb7\x75\
+\x70\xef\x92\xfc\x57\x0b\xff\x3b\xb3\x0a\x3b\xd3\x50\x15\x2c\x54\
+\x63\xe5\xef\x3c\x57\x89\xb4\xed\xf8\xa7\xba\x9b\x8b\x53\x96\x4c\
+\xd0\x5b\xdd\x35\x87\x1e\x7a\xa8\x28\x65\x54\xd2\xec\xda\x40\xbe\
+\x17\xbd\x14\x0f\x3e\xf8\xa0\xc4\x63\xb5\xde\x4d\x13\x86\x58\x74\
+\xcf\x2c\x5e\xde\x9b\xf1\x45\x7e\x9f\x07\x9f\xe1\xad\xb7\xde\xc2\
+\x9e\x7b\xee\x29\x9f\xa9\xf2\xa7\xb1\x34\x26\xa0\x75\x75\xac\x4a\
+\x0d\xbd\xd4\x7d\x6c\xce\x2f\xec\x26\xe5\x38\xfe\xe9\x4f\xb7\x48\
+\x67\x0e\x55\xda\x8c\xf7\x07\xe2\xf5\xb1\xc1\x90\x74\x67\x26\x97\
+\x94\x49\x79\xc6\x4d\xca\xf3\x32\x9d\x59\x5c\x01\xd0\x32\x24\x18\
+\xd2\x4d\x1a\x28\xaf\x41\x24\xce\x4c\x4f\x0f\xd2\x88\x23\x9d\x8c\
+\xa0\xb5\x6d\x05\x0e\xfb\xf5\x21\x58\xb2\x98\xbd\x06\xb3\x09\x34\
+\x5a\xb6\x65\x27\xd0\x24\x13\x09\xa7\xd6\xd0\x23\x60\x48\xdd\xa3\
+\xbe\x31\x6b\x19\x32\x73\xd5\xcc\x55\xaa\x83\x9b\x94\x31\x43\xd6\
+\x19\x36\xd6\x2f\x2c\x18\x33\x54\x99\x63\xef\x11\xae\x05\x4d\x96\
+\x53\x32\x7b\x5d\xaf\xba\xb6\x57\xd5\xde\xed\xde\xbc\xf7\xd9\xb7\
+\xa6\x03\xa9\xab\x7a\xf3\xea\xbd\x0e\x86\x7b\xec\xb1\xc7\xc2\x37\
+\xde\x78\x63\x5d\xe5\x65\x64\x52\x87\x61\xe1\x28\x9d\x01\xc3\x06\
+\x03\x75\xe3\x6d\xb9\xe5\x96\x52\xd0\xcc\xa0\xb6\x16\x8c\x33\x9d\
+\x99\xfc\xa2\x2f\xbf\xfc\x72\x46\x60\x51\xf8\xa8\x20\x2d\x16\xb0\
+\x78\xbe\x66\x4e\xd9\x02\x32\x5f\x2d\x9f\x5e\xb3\xd8\x6b\x77\x67\
+\xd2\xec\xf7\x57\x4b\xca\xbe\x0e\x37\x0f\x37\x02\x63\x7f\x64\xca\
+\x91\x8d\x4e\xd2\xe0\x94\x61\xe5\x5f\xb0\x60\x51\x06\x0c\xf9\x0e\
+\x2a\x98\xf5\x1a\x36\x18\xf6\xb5\x9b\xcd\xae\x0b\xd5\x31\xa3\x96\
+\x47\x16\xfc\xeb\xaf\xbf\x56\x1e\x89\x82\x8c\x6b\x85\xe7\x1e\x78\
+\xe0\x81\xd2\xf4\x98\x47\xbe\xcd\x9e\x0b\x86\x7a\xcd\x62\x40\x41\
+\x93\x78\x4a\x7b\xe7\x2c\x18\xf2\x99\x7e\xf9\xcb\x5f\x96\x0c\x86\
+\xbc\x2f\x5d\xd3\xda\xc2\x49\x6b\x09\x75\x3e\xb8\x7e\xf9\xde\x76\
+\xbc\x5b\xdd\xe1\x5a\x9a\xd4\xd9\x3a\x2a\xe6\xbd\xbb\xb3\x06\x7b\
+\xef\x3b\xbd\x0f\x86\x9a\x40\xf3\x63\x03\x43\x1d\x73\x13\xde\x30\
+\x75\xb8\xf4\xf6\x68\xcc\x5d\xc1\xd1\xde\x17\x6b\xfe\xfc\xf7\xde\
+\x4a\x72\xae\xb4\x08\x48\x8d\xec\xcd\xab\xf6\x2a\x18\xde\x76\xdb\
+\x6d\x67\x9c\x7b\xee\xb9\xf7\x12\x08\x79\xd0\x3a\xeb\x2d\x30\xd4\
+\x7a\x3a\xba\x49\xd9\x55\x79\x87\x1d\x7e\x9e\x11\xfc\xcc\x30\x3d\
+\xfa\xe8\xa3\xf1\xda\x6b\xaf\x89\x86\xad\x71\xaf\x52\x62\x4d\x9a\
+\xe0\x61\xd7\xd5\x29\x00\x6b\x11\xbb\x9d\x00\xd2\x5b\x59\x96\x5d\
+\x4d\xa6\x0d\x86\x7c\x06\x2e\xf8\x6c\xe7\x6d\x06\xeb\x4d\x16\x1d\
+\x63\x6e\x24\xfb\x26\x18\x12\x50\x8c\x15\xe2\xc6\xfc\xf9\x3f\xe0\
+\xd8\x63\x8f\x15\x17\x93\xd6\xec\xe5\x5a\x86\xba\x89\xfa\x7a\x33\
+\x69\xbc\x90\xe3\xc6\x77\x51\x9a\x32\xba\xc4\x6e\xbe\xf9\x66\x01\
+\x40\x3e\x33\x15\x1c\x6e\x7c\xb2\xe0\xb0\x17\x1c\x0f\x3b\x60\x9f\
+\x0b\xe4\xfa\x7b\xee\xf3\x6b\xa9\x06\x3f\xd7\x78\x9d\x82\x8c\xce\
+\x75\x36\x9e\x5d\xcc\x96\x32\x6e\x52\x9d\x13\xb5\x0c\xb9\xbe\x8b\
+\xb1\x0c\xf9\x0c\x7c\x47\xce\x15\x5d\xda\x4c\x76\x22\x18\xea\x1a\
+\xe3\x33\x3d\xf5\xd4\x53\xf2\x39\x13\xc1\x72\xeb\x65\xff\x63\x19\
+\x66\x2d\xc3\xce\x12\x68\xfa\xd2\x32\x4c\x91\xa3\x57\x8c\xf3\xac\
+\x65\x58\xd7\x10\x92\x04\x1a\x66\x93\xf6\x86\x65\xa8\xca\x38\xd7\
+\x25\x29\xe0\x98\x18\xc7\x75\xc1\x75\x43\x5e\x67\xe6\x46\x3c\xf4\
+\xd0\x43\xb2\xbf\x95\x61\x8b\x4f\x94\x4f\x59\x2f\x66\x45\xaf\xfd\
+\xe7\xb8\xce\x04\x92\x33\x7a\xeb\x3d\x7a\x15\x0c\xf7\xda\x6b\xaf\
+\xb9\xaf\xbe\xfa\xea\x0e\x6a\xee\xdb\x44\xc5\x3d\xb5\x0c\xd5\xd2\
+\x63\xba\xf3\xb5\xd7\x5e\x8b\xad\xb7\x66\x27\x86\x98\xc4\x11\xd9\
+\x89\x9e\xcc\x1c\x9f\x7c\xf2\x49\x26\xfe\xa5\xed\x87\x4a\x75\x21\
+\x68\x06\x5b\xa6\xcd\xcb\x8a\x15\x19\x81\xac\x82\x50\x5d\x5e\xfc\
+\x40\xc1\xb7\x34\x2b\xa3\xb8\xe9\xb3\xc1\x90\xdf\x50\x66\x0c\xfb\
+\xdb\x14\xc6\xb4\x0c\xd9\x7d\x9a\xd6\xa0\x82\xa1\xc7\xe3\xc6\x77\
+\xdf\xcd\x17\x30\x7c\xef\xbd\xf7\x32\xe4\xdd\x7d\xf1\x9c\xc5\xbc\
+\x4d\xbe\xba\x4f\x6e\x62\x36\x05\xe5\xdc\x69\x87\x00\xce\x29\x5d\
+\xeb\x74\x27\xf2\xb9\x35\x49\x2a\xf7\xb9\x73\x2d\x43\xdb\xca\xcd\
+\x07\xec\x5c\x8b\x4a\x63\xa6\x99\xb8\x7a\xcd\x62\x62\x6e\xac\x61\
+\xe3\x91\xeb\x26\xe5\xf8\x4b\xda\xbd\xdb\xd0\x03\x76\xe6\x26\x55\
+\xcb\x9e\x1d\x41\xe8\xee\xe3\xf9\x54\x08\xf8\x93\xdf\xe9\xdf\xbf\
+\x3f\x58\x3e\xf0\xef\x7f\xff\x5b\xee\xc3\x75\x45\xa5\x41\x85\xde\
+\xff\x77\x30\xd4\x04\x1a\xc6\x0c\x57\x17\x18\xda\xa5\x15\x74\x93\
+\x2a\x18\x6a\xcc\xb0\xa7\x6e\x52\x5d\x5f\x04\x45\x92\x2b\x70\x4f\
+\xdb\xb5\xc1\x6c\x95\x44\x25\x91\x84\xd8\x36\xfd\x59\x31\xeb\xb7\
+\x98\x3d\xba\xb6\x9d\xe3\x72\xb9\xde\x4d\xa7\x93\x3b\xf6\xd6\x73\
+\xf7\x1a\x18\xce\x9c\x39\xf3\xe0\x13\x4f\x3c\xf1\x19\x0a\x04\x0a\
+\x26\x6e\x62\x75\x8d\x19\x41\x51\xfa\x23\xdb\x60\x60\xa7\xfd\x53\
+\x70\x10\x04\xb9\x20\x86\x0c\x19\x22\x42\x83\xd6\x21\x17\x49\xae\
+\x25\x61\x0b\xc9\xae\x9e\x80\x0b\x59\xdd\x12\xbc\xae\x6a\x5f\xfc\
+\x4e\x67\xc5\xdf\xba\x08\x7b\x2b\xc1\x24\xf7\xf9\x72\x63\x86\x24\
+\x87\x66\xc3\x5e\x0a\x76\x8e\xa9\x16\x26\xd3\x45\xbc\xfb\xee\xbb\
+\x99\xba\x2b\xab\x9b\xfd\xb7\xdf\xce\x17\xb0\xa1\x90\x55\xb6\x92\
+\xbe\xb6\x00\x0b\xcd\x32\x9f\x5b\x3b\x54\xa8\x65\xc6\xf1\x53\x8b\
+\x9c\x63\x3a\x6c\xd8\x30\x2c\x5c\xc8\x18\x4b\xe7\xc9\x33\xf9\xc0\
+\x50\x13\xa6\xd4\x82\xd6\x32\x04\x8d\x97\xea\xe7\xa6\x54\x21\xbb\
+\x20\x8b\x71\x75\xdb\x60\xc8\xe7\x52\x37\x69\xb1\x60\x68\x33\x05\
+\xd9\xc2\x4b\xff\x6f\xbb\x91\x55\xd3\xef\x98\x15\xdd\x75\x98\x61\
+\x75\xcf\x6b\xa1\x79\xef\x69\xcc\xb0\xab\x04\x1a\xad\x33\xec\x4b\
+\xcb\x50\xe9\xd8\x6c\x06\x1a\x82\xa1\xd6\x19\x6a\xd1\x7d\x77\x63\
+\x86\x35\x35\x35\x22\xc3\x74\x5d\x32\x0f\xe0\xea\xab\xaf\x94\x52\
+\x0d\xee\x13\x26\xfe\xcc\x9d\xfb\x1e\xf6\xd8\x63\x0f\xf9\xdd\x26\
+\xa9\xc8\xe7\x39\x29\x3c\x1f\x6b\xff\x19\xe6\xbd\x5d\x87\x00\x89\
+\x67\x7b\xe3\x6d\x7a\x0d\x0c\x8f\x38\xe2\x88\x27\x66\xcd\x9a\x75\
+\xa4\x02\x8a\x16\x4b\x67\x81\xa4\x67\x31\x43\x2e\x12\x0a\x0c\xb5\
+\x10\xd5\xcd\x66\x13\x55\xeb\x80\xd8\xc2\xad\x3b\x0b\x85\x6d\x4a\
+\x36\xde\x78\x63\xb9\x17\xef\xa9\xad\x96\xd8\xc9\xd9\x76\x8f\xea\
+\x7d\x4a\x71\xc7\x96\x32\x69\x36\x18\xd2\xad\x46\x17\xc9\x21\x87\
+\x1c\x62\xf5\x56\x83\xd4\x5d\x71\xa3\xe8\xa1\x24\x3f\x04\x46\x05\
+\x43\xb2\x77\x94\x12\x53\x2b\xe5\x19\x8b\x3d\x97\x00\x4e\x05\xc9\
+\x8e\xc5\xaa\x3b\x5d\x29\xc7\xd4\x8a\x57\xd2\x74\x1d\xd7\xdc\xef\
+\xa9\xc2\x63\xdf\xdb\x06\x3e\xfe\xdd\x4e\xa0\x51\xc5\x81\x7f\xd7\
+\xf9\x53\xa5\x2d\x5f\x2c\x36\xdf\x3b\x11\x0c\xf3\xb9\x49\xf9\xac\
+\xc5\x58\x86\x7c\x17\x1e\xb6\x92\xc5\xf7\xe7\xdf\x69\x19\xaa\xcb\
+\x9b\xe0\xca\xe7\xa5\xb2\x67\x1f\xff\xdf\x2d\x43\x26\x81\xb1\xce\
+\x50\xb3\x49\x5d\x60\xa7\x79\x32\xce\xb0\x15\x54\xc2\xf1\x20\xf4\
+\x5d\x02\x4d\x57\x60\x48\xcb\x90\x35\x8d\xbd\x61\x19\xaa\x02\x78\
+\xf9\xe5\x97\x63\xfa\x74\xd3\xd3\x96\x80\xc8\x3d\xc0\x31\x20\x41\
+\xbc\xc6\x0f\x75\x5d\x77\x47\xc6\x15\xbb\x6f\xd7\xe4\xf3\x1c\xf9\
+\xf8\x64\x3a\x9d\x3c\xaa\x37\x9e\xb3\x57\xc0\xf0\x1f\xff\xf8\xc7\
+\xa6\x27\x9d\x74\xd2\x97\xd4\x6c\x28\xec\x08\x20\x74\x49\x75\x2c\
+\x07\xe8\x19\x18\xea\x84\xab\xe6\x44\x10\x54\xe1\x44\x61\xc2\x85\
+\x41\x2d\x5b\x85\x9c\x0a\xdd\x62\x17\x8a\x7e\x7f\xe8\xd0\xa1\x52\
+\xc7\x78\xf2\xc9\x27\x66\xc6\xb7\xb9\xb9\x55\x4a\x37\x48\x6c\xcd\
+\x77\xe2\x7d\x78\x4f\xd5\xea\x8b\xbd\x47\xa9\x13\x66\x83\x21\xdf\
+\xf7\x99\x67\x9e\xc1\x3e\xfb\xec\x25\x02\x81\x9b\x83\xe5\x13\xb9\
+\x07\x0d\x1e\x29\x89\x72\x01\xdf\x7c\xf3\x9d\x58\x86\xac\xd7\xd3\
+\xb1\x59\x5d\x6e\x52\xdd\xe4\xaa\x1c\x29\xf0\xd9\x63\xc7\x75\xc3\
+\x79\x50\xbe\xd4\xae\xc6\x2b\xd7\x32\x34\x35\x5e\x86\x47\x95\x9f\
+\xd9\x56\x20\xff\xc6\x3a\x46\x65\x75\xd1\x04\x84\xe2\xb2\x48\xcd\
+\x53\x74\x05\x86\x0a\xc4\x5d\xb9\x49\x75\xdc\x35\x03\x50\x95\x13\
+\xdb\x8d\xcf\xe7\x56\x0b\x3e\xd7\x72\x2d\x54\x9a\xf4\x63\xb7\x0c\
+\xf3\x81\xa1\xf1\x84\x70\xc1\xaf\x1e\x30\xac\x5d\xde\x2e\x31\xc3\
+\xde\x02\x43\xf5\x08\x50\x71\x64\x3d\xea\xe4\xc9\x93\x33\xc9\x54\
+\xcc\xb0\x7e\xe3\x8d\xb7\x30\x7a\xf4\x68\x2c\x5d\xba\xb4\x43\x3b\
+\xb1\x52\xe5\xca\x8f\xe5\xfc\xac\xd7\xcf\xbb\x19\x10\xfd\xaa\xa7\
+\xef\xd5\x2b\x60\x38\x7d\xfa\xf4\x6b\xaf\xbc\xf2\xca\x69\xd4\x92\
+\xb5\xa4\xc1\x98\xf6\x41\x11\x40\xe6\xe8\x39\x18\x6a\xf2\x87\x02\
+\x97\xc6\x05\x35\x41\x22\x9f\xef\xbc\xd8\xe0\xb2\x0a\x27\xa6\xb4\
+\xff\xf1\x8f\x7f\x94\x36\x32\xca\xe7\xc9\x4c\x3e\x32\xe9\xb3\x51\
+\xae\x5a\x25\xbc\xa7\x5a\x2e\x7d\xe5\xb3\xb7\xc1\x90\xef\xfe\xec\
+\xb3\xcf\xe2\xa0\x83\x46\xc9\x33\x28\xad\x9a\xdd\x9b\x50\x33\x49\
+\xb5\x5e\xef\xeb\xaf\xbf\x95\x98\xe1\x9a\x00\x86\x3a\xbe\xb6\xdb\
+\x5a\x85\x3f\x41\x89\xe3\x69\x27\xb6\xa8\x2b\x55\x8b\xaf\x73\x93\
+\x5d\x72\xc1\x50\x41\x84\xf7\x61\x17\x0e\x92\x24\xf3\xa7\xce\x0d\
+\xcb\x18\xd8\x84\x54\x5d\xe9\xf6\xba\x28\x66\x8d\x28\xa1\x41\x6e\
+\xcc\x50\xad\x58\x3e\x4f\x57\x60\x68\xd7\x05\x72\xfe\x6c\x6f\x82\
+\xd6\x76\xda\x7f\xd3\xf7\xd7\x52\x90\x1f\xaf\x65\x28\xf6\xb2\xc3\
+\xde\xc2\xd2\x8a\x3f\x61\xfc\xf8\xb3\x73\x4a\x2b\xdc\x98\xfb\xce\
+\x5b\x12\x6b\x8d\x46\x92\xd2\xaa\xc9\xcd\xe6\xba\x1c\xf3\x74\x42\
+\x14\x15\x63\x9d\xab\x65\x68\x9a\xfe\x4a\x69\xc5\xd8\x73\x30\x61\
+\xc2\x34\x04\xca\xfb\x23\x1c\x4f\x48\x93\x5e\x96\x56\x24\x53\x11\
+\xb4\xb7\xae\xc0\xaf\x0f\x3b\x04\x4b\x17\x2e\x30\xe2\x29\x69\xb8\
+\x49\x8d\xcb\x3a\x86\x4c\x69\xc5\x16\x9b\x38\x16\xa8\x21\xea\xa6\
+\x83\x9d\x09\x33\x75\xcb\xdb\x33\x6e\x52\x96\x7a\xb0\xb9\x70\x32\
+\xce\x77\x31\x7c\xbf\x83\x06\x0f\xc0\xf3\xff\x7a\xce\x29\xad\x20\
+\x1d\x5b\xe7\xe5\x65\x9c\x6f\x8d\x1f\x73\x3d\x30\xe3\x98\x71\x43\
+\xdd\xcb\xdc\xdb\xff\xfc\xe7\x33\x38\xe5\x94\x53\xd0\xd0\xd0\x20\
+\x32\x80\x0a\x1e\x15\xc7\x52\x94\xba\x9e\x02\xc6\x9a\xf4\x7d\x4b\
+\x3e\x5e\x97\x4a\x25\x2e\xea\xe9\xb3\xf5\x0a\x18\x0e\x1b\x36\xa2\
+\xbe\xb6\xb6\x76\x90\xfd\x30\xb9\x9a\x6a\x4f\x35\xd7\x5c\xe1\x57\
+\xea\x8b\xdb\xf7\xb7\x63\x80\xb9\x56\x1d\x0b\x65\x6f\xbc\xf1\x46\
+\xb1\x0c\xd9\x2e\xa6\xa2\x22\x28\xb7\x3a\xf2\xc8\xa3\xc5\x32\xd3\
+\xfa\x38\xfd\x5e\x6e\x2b\xa9\x52\x9f\xab\xb3\xf3\xd5\xea\x55\x4b\
+\x82\xed\x69\x98\x5c\x41\xda\x35\xb5\xb2\xf8\x53\x33\x19\x73\xc7\
+\x9e\xdf\xff\xe6\x9b\x6f\xc0\x38\x23\x39\x2f\xbd\x5e\xbf\x08\x0c\
+\x75\xe9\x89\x08\x72\xe2\xbb\xc5\x58\xb6\x7d\x3d\x7f\x7c\x4f\x03\
+\xf2\xc6\xf5\xa5\xf7\xb3\xe7\x5d\x2d\x30\x05\x4e\xce\x23\x85\x41\
+\xae\x32\x72\xf0\xc1\x07\x0b\x09\x39\x5b\xe8\x68\x33\x52\x52\x03\
+\x92\x19\x66\xc1\x82\x05\x99\xb8\x8c\x5a\x90\xf9\x84\x89\x0d\xda\
+\x3a\xb6\xea\x62\xe5\xfd\x49\x73\x47\xb7\x75\x59\x59\x20\x43\x03\
+\xc6\x92\x16\x2a\x83\x76\x9d\x21\xe7\xc7\x66\xf4\xe9\xee\xfa\xe8\
+\xe9\xf8\x77\xf7\xbe\xbd\xf7\x3d\xce\x6f\x67\xe2\x26\x0d\x8f\xdb\
+\x83\x64\x2a\x8e\x7b\xef\xbe\x07\x67\x9c\x79\x3a\xe2\x8c\x8b\xb1\
+\x74\x28\x91\x80\xc7\xeb\xc5\x7b\x6f\x3b\xd9\xa4\xd1\x88\x80\x91\
+\x54\x19\x12\x04\xd3\x26\xf6\x9b\x6d\x01\xc0\x4f\xdc\xec\xeb\x24\
+\x2c\x35\x67\x9d\x75\x0e\x2e\x98\x30\x15\x65\x15\x83\x10\x8a\xc6\
+\x51\x51\x1e\x40\x24\xd2\x06\x9f\x1f\x58\x5e\xbf\x14\x47\x8f\x3e\
+\x02\x4b\xbe\xff\xc6\x79\xb4\x94\x53\x6f\x98\x82\xdb\xe5\x95\x5a\
+\xe6\x47\x1f\x9d\x89\x4d\x7f\xfa\x13\xb9\x67\x12\x09\xb8\xc5\x3d\
+\x0b\x44\x13\x40\x63\x43\x3b\xda\xda\x22\x48\xb3\xf0\x10\x7c\xfe\
+\x14\xfc\x0e\x65\x5e\x34\x1a\x46\xbf\x7e\x55\x52\x1e\x34\xe1\x82\
+\x71\x68\x6a\x58\x02\x57\x17\x60\xa8\x4a\x16\xf7\x24\x73\x22\xc8\
+\x27\xcc\xa2\x7f\xc6\x12\x35\xd1\x6a\xde\xbc\x79\x52\x6f\xa9\x96\
+\xa1\x7a\x7b\xd6\xfe\xb5\x51\x78\x95\x15\x90\xff\xcb\xd3\xe9\xe4\
+\xe0\xc2\x57\xe9\xfa\x8c\x1e\x83\xe1\xd5\x57\x5f\x7d\xea\x6f\x7f\
+\x7b\xf9\xfd\xb6\x40\xc9\x37\x39\x3d\x9d\xb0\x9e\x82\xa1\x6a\xee\
+\x3a\x1c\xfc\x9d\x9a\x38\x05\x9c\x26\xfb\x30\x4e\xc3\x14\x66\x52\
+\x95\x9d\x72\xca\x49\x62\x19\x1a\xd7\x1d\x70\xf8\xe1\x47\x0a\x18\
+\xf2\x7c\x9b\x3b\x92\xd7\xe9\x2b\xcd\x4c\x81\xd0\xdc\x23\x26\xa5\
+\x23\xbb\xef\xbe\x7b\x86\x9f\x32\x77\x6a\xb9\x91\xb4\x30\x9f\xdf\
+\x61\x8c\x93\x64\x04\x26\x81\xc6\x2f\xdf\x53\x30\xd7\xf9\xb0\x5d\
+\xbd\x5d\x2d\x95\xbe\x9e\x3f\x15\x06\x36\x20\xf2\xff\x3a\xef\x76\
+\xcc\xd3\x76\xc3\xf3\x1c\x5a\xf3\x5a\x72\xc2\xe7\x3c\xea\xa8\xa3\
+\xa4\x5c\x63\xe8\xd0\x21\xd2\x52\xc7\xef\xf7\xe2\xab\xaf\xbe\x91\
+\xa4\x17\x76\x4a\xd7\xba\x2d\x7d\x5f\x5e\x4f\xb9\x51\x3b\xcb\x5a\
+\x55\x00\x56\xa0\xfe\x0f\x18\x96\x2a\x7a\x8a\x01\xc3\x24\xee\xbd\
+\xfb\xae\xbc\x60\xf8\xee\x5b\xef\x61\xdf\xbd\xf7\x41\x38\x1e\x72\
+\x6e\x6c\x80\x2b\xe9\xc0\x20\xc1\xd0\x28\x75\x86\x9c\xc0\x25\x96\
+\x61\x1a\xe3\xc6\x9d\x83\x0b\x58\x74\x5f\x31\x04\xa1\x70\x0c\xe5\
+\x04\xc3\x68\x1b\x02\x7e\x17\xea\x97\x2f\xc5\xe8\xa3\x8f\xc0\x62\
+\x82\xa1\x80\x2a\x93\xff\xd8\xe4\xd7\x05\x8f\xcb\x03\x53\xd3\x3c\
+\x13\x3f\xdd\xe2\x27\x02\x63\x71\x24\xc5\x22\xa5\xd0\x8c\xc6\x80\
+\xa6\x15\x61\x84\xda\xc9\x88\x43\x34\x36\x75\xbc\x62\xd1\xa7\x13\
+\x50\x30\xe4\x9e\xbd\xe0\xbc\xb3\xd1\xb8\x7c\x41\x97\x60\x98\x6f\
+\x7f\xf1\x5a\x3c\x34\x61\xc6\xae\x3f\xd5\xfd\x62\x2b\x88\xa5\xce\
+\xc8\xda\x74\x7e\x21\xf9\xef\xf5\xba\x4f\x8b\xc7\xe3\x0f\xf4\xe4\
+\x9d\x7a\x0c\x86\xbb\xee\xba\xdb\xcb\x11\x93\xde\xfd\x00\x00\x20\
+\x00\x49\x44\x41\x54\x6f\xbe\xf9\xd6\xde\xb6\x66\x9f\x6b\xa5\xf4\
+\xe4\x01\x6d\xf0\xea\xc9\x75\xb8\x68\x98\xb0\xa0\x64\x00\x0a\x1c\
+\xb9\xd7\xa4\x6b\x8d\xae\x9a\x93\x4e\x3a\x21\xf3\x11\x17\xfb\x71\
+\xc7\x8d\xc1\xcc\x99\x33\xe5\x6f\x1a\x9f\x52\xc1\x99\xad\xa5\xec\
+\xc9\x13\xae\xfc\x5d\xb5\x0e\xf9\x33\x99\x34\x01\xf4\x1d\x77\xdc\
+\x51\x36\x39\x37\x06\xc7\x9c\xe0\xac\x87\xed\x2e\xa6\x36\xf9\xc5\
+\x17\x5f\xe0\xbc\xf3\xce\x13\x66\x13\x6a\xcb\xba\x81\xd4\x1d\xc7\
+\xf3\xb5\xf7\x61\x21\xb0\x2b\xf4\x79\xa1\x37\x2f\xb4\x98\x6d\x4b\
+\xcc\xbe\x97\xed\x2a\xe6\xf3\x13\xf4\x3a\xba\xdf\x61\xd5\xb2\x9a\
+\xa7\x38\xf2\xc8\x23\x71\xd7\x5d\x77\x61\xd0\xa0\x01\x42\x50\x1e\
+\x08\xf8\xb0\x68\xd1\x12\xec\xbc\xf3\xce\x58\xb2\x64\xc9\x4a\xdf\
+\xa7\xd0\xd1\x7b\xaa\xf5\x6c\x5b\xa6\x9a\x8d\xfa\x1f\xcb\xb0\xd0\
+\x2c\x77\xf5\x79\xd7\x61\x12\xb5\x0c\xef\xb9\xe7\x1e\x9c\x49\xcb\
+\x30\xda\xd1\x32\x24\x18\x0a\x03\x4d\xcc\x80\x61\x8a\xc0\x45\xd6\
+\x18\x0b\x0c\x45\x61\x22\x18\x0a\x6b\x8d\x01\x92\xb3\xce\x3a\x5b\
+\xc0\xd0\x5f\x3e\x18\xe1\x48\x0c\x15\xe5\x74\x81\xb6\xc1\xef\x73\
+\x0b\x18\x1e\x73\xf4\x61\x58\xf8\x83\x82\x21\x41\x94\x60\x98\x86\
+\x2b\xed\x12\xea\xc7\xbf\xfc\xe5\x11\x6c\xbe\xc5\x16\x68\x4f\xd2\
+\x22\x4d\xc3\xed\xf2\xc3\xe3\xf6\x21\x1e\x03\xda\xda\xc2\x88\x45\
+\xe9\xa6\xe5\x3d\x0d\x18\xfa\xfc\xa6\x55\x5d\x24\x12\x42\xbf\x7e\
+\x95\x20\xdf\xec\xf9\xe7\x8f\xc3\x8a\xda\x1f\xe0\x72\x75\xde\xb5\
+\x82\xdf\xa1\x52\xa6\x75\xa7\x5a\x06\x94\x3b\xa2\x76\xc6\x7b\xa9\
+\x65\x63\x3d\x99\xbd\xd5\xfd\xdd\x42\xf2\x23\x9d\xc6\x2b\x40\x72\
+\x9f\x9e\x3c\x67\x8f\xc0\xf0\xf1\xc7\x1f\xdf\xee\x94\x53\x4e\x7b\
+\x9f\xd6\x46\xbe\xc4\x8c\x9e\x0a\x50\xfb\xc5\x0a\x0d\x46\xa1\x41\
+\xe0\xb3\x28\x78\x50\xd3\x22\xe8\xd9\x56\x9e\x82\xcb\xc8\x91\x23\
+\x85\x25\x64\xcc\x98\x31\xf2\xb9\xcf\x67\xc0\xe6\x9c\x73\xc6\x4b\
+\xcc\x90\xb1\x27\x3d\x78\x3d\xba\x34\x48\x2c\xdd\xd3\x85\xd9\x99\
+\xab\x52\x01\x91\x8d\x47\x5f\x7d\xf5\x55\xa1\xeb\xb2\xc1\x4f\x2d\
+\x5e\x15\xd8\xb4\xf4\x44\x58\xa4\x52\x12\x5b\x20\x80\x7f\xfa\xe9\
+\xa7\xf0\xf9\x02\x19\x06\x0b\xbe\x2b\x6b\xf8\xf8\x4f\xef\x5b\x68\
+\x7c\x7b\x3a\x97\x85\xae\x6f\xbf\x7f\x3e\x30\x54\xcb\x4c\x5d\x8e\
+\xaa\xdc\x50\x80\xe8\x9c\xa8\x95\xcb\x24\x03\x52\xbc\x0d\x18\x50\
+\x83\xd6\xd6\x76\x49\x34\x22\x01\x01\x6b\xfc\xd8\x0b\x50\x05\x8e\
+\xad\xc4\xa8\x15\xae\x63\x97\xaf\xf4\xe2\x3f\x60\x58\x68\x97\x15\
+\x0b\x86\xea\xe8\xcc\xfe\xd4\xb9\xeb\x0c\x0c\xdf\x7b\xfb\x7d\x13\
+\x33\x8c\x86\x33\xd6\xa0\xc4\x0a\x69\xd1\x89\x45\xc8\xfd\xcd\xac\
+\x4e\xd3\xa7\xcc\xed\x61\xb7\x7b\x97\x63\x19\x4e\x76\xc0\x30\x91\
+\x01\xc3\x80\xdf\x23\xcd\x7d\x05\x0c\x17\xcc\x07\x52\xa6\x7d\x93\
+\x69\xe5\x24\x76\x26\xd6\x1b\xb9\x01\x1e\xb8\xff\x41\x6c\xb6\xf9\
+\x4f\xd1\x4c\x19\x07\xba\x73\xfd\xf0\x79\x49\xb3\xe7\x42\x3c\xc6\
+\x58\x25\x04\x1c\x79\x3e\x65\x00\xd7\x56\x3a\x9d\x42\x24\x9a\x05\
+\xc3\x0b\xce\x3f\x1b\x4d\xf5\xdf\x17\x04\xc3\xce\x46\x8f\x6b\x53\
+\xb3\xe6\xf3\x79\xa1\xfa\x2a\x67\xa1\x27\xb3\xdd\xdb\xdf\x2d\x24\
+\x3f\x78\xbf\x74\x3a\xf9\x73\x00\x1f\x74\xf7\xde\x3d\x02\xc3\x93\
+\x4e\x3a\xe5\x0f\x0f\x3d\xf4\xd0\x44\x5a\x17\xd9\x44\x99\xbe\x69\
+\xec\x58\xe8\x05\x0b\x0d\x96\x1d\x27\xa4\x2b\x74\xda\xb4\x69\x60\
+\x6c\x49\x99\x5d\x34\x01\x83\x16\x15\xcb\x2a\xa8\xd5\xd9\xc7\x07\
+\x1f\x7c\x94\xc9\x24\x55\x61\xca\x85\x49\x4b\x83\x45\xef\x5f\x7f\
+\xfd\x75\xa1\x47\xec\xf2\xf3\x7c\x31\x2a\x7e\x41\xff\x5e\x53\xd3\
+\x4f\xc0\x98\x02\x81\x96\x11\x0f\xcd\x9e\xe4\xb3\xeb\x79\x14\xe2\
+\x0a\x88\x3c\x87\x1a\x26\x95\x15\x82\x3f\x0f\xba\x0d\x99\xf5\x7b\
+\xc7\x1d\x77\x88\x2b\x51\x53\xf8\x0b\xb9\x7a\x7b\x0a\x86\x85\x06\
+\xa7\x2b\x65\xc0\x06\x7f\x65\xd2\x51\xf7\xb4\xc6\x6c\xb5\x74\x81\
+\x63\x42\x36\x22\x82\x21\x2d\x43\xa5\xec\xfb\xe1\x87\x85\x52\xa3\
+\xc5\x24\x1a\xbd\x97\x36\xdf\x55\x45\x42\x15\x0f\xb3\xb1\xb2\x71\
+\x4b\xbd\xff\x7f\xc0\xb0\xd0\x2c\x16\xfb\x79\x57\x60\x38\x43\x2c\
+\x43\x75\x6f\x1b\xe2\x6b\x37\xde\xa1\x9b\x54\x4a\x2b\x22\x48\x6b\
+\xec\xcd\x01\xc1\xcc\x5d\xa5\x87\x93\x11\x69\x02\x86\xe9\x34\xce\
+\x1a\x6b\x2c\xc3\xb2\xf2\x21\x08\x45\xa2\xa8\x2c\x0f\x8a\x9b\x94\
+\x4a\xae\xb1\x0c\x8f\x30\x96\x21\x2d\x4c\xc6\xd0\xdd\xc6\x32\xe4\
+\x75\x86\x0f\x1b\x8e\x19\xf7\xde\x8f\x9f\x6e\xb1\x25\x9a\x42\x11\
+\xa4\x5c\x5e\x78\xdc\xa4\x48\xf3\xc1\x05\x9f\x00\x21\x2d\x49\x03\
+\x86\x86\x28\x41\xd6\x67\x3a\x81\x48\x24\x8c\xea\xea\x2a\xb1\x0c\
+\x27\x9c\x7f\x56\x41\x30\xa4\x62\xc6\x77\x53\x12\x0f\xe3\x0d\xd2\
+\xa6\xc5\x06\xec\x73\x8f\x5c\xf2\x88\x62\x47\x7f\x6d\x3c\xaf\x90\
+\x7c\xe7\xb8\xc7\x62\xb1\x9b\x80\xd4\xa4\xee\xbe\x5f\x8f\xc0\x70\
+\xc3\x0d\x37\xaa\xff\xfe\xfb\xef\x07\xd9\x40\xd3\xd7\x42\xb3\xb3\
+\x17\x2d\x34\x58\x5c\x38\x2a\xf0\x19\x63\xa2\x1b\x6d\xcc\x98\xe3\
+\x32\x0d\x41\x35\x3b\x53\xfb\xfe\xa9\x2b\xd1\x68\x7a\x66\x21\x92\
+\xe1\x85\xd9\x9b\xcc\xf0\x4a\x26\x4d\x1b\x9d\xc5\x8b\x17\x63\xd4\
+\xa8\x51\x92\xac\xd2\x93\xa3\x10\x18\xd2\xba\x61\xfc\xef\x27\x3f\
+\xf9\x89\x58\x7d\x7c\x17\x15\xce\x74\xe7\xb0\xf0\x9e\x20\xa9\x09\
+\x32\xb4\x7e\x79\x4d\x05\x09\xd9\xdf\xd2\x05\xdc\xfc\xbc\xea\xaa\
+\xab\x25\x7d\x5b\x8f\x42\xe3\xb7\xba\xe7\xd5\x59\xec\xf2\x8e\x7c\
+\x77\xdb\x4d\x6c\x5b\x8d\x7c\x1f\x26\x0d\x91\x9e\x6e\xc3\x0d\xd7\
+\x97\xd7\xa3\xd0\x22\x3b\xd1\xf1\xc7\x1f\x0f\x76\x92\x57\x37\xb7\
+\x5e\x43\x49\xe0\x15\x00\x15\x14\x73\x01\xf1\x3f\x60\xd8\x93\x15\
+\xae\xdf\xcd\xcf\xbe\x91\xb5\x0c\xf3\x80\xa1\xc7\x8d\xb7\xde\x32\
+\x09\x34\xb1\x58\xd4\x4a\x96\xc9\x01\x55\xab\xa1\xa1\xcb\x6d\xdc\
+\x95\xe3\x98\x40\x23\x44\xdd\x03\x11\x8e\xd0\x32\xf4\x8b\x0b\xd3\
+\xe7\x77\xa3\xbe\xbe\x56\xc0\x70\xd1\xf7\xdf\x99\x8c\x9c\x54\x42\
+\xc0\x50\x94\xa3\x44\x0a\xeb\x8e\x58\x57\xc0\x70\xb3\x2d\xb7\x42\
+\x28\x9a\x46\xca\xc5\x5e\xa9\x5e\x20\x6d\x92\x74\x4c\xac\xd0\x9c\
+\xaf\x60\xc8\x35\x62\x83\xe1\x1b\x6f\xbc\x81\x09\x13\xc6\x61\xc5\
+\xb2\xef\x8a\xb2\x0c\xb5\xec\x47\xeb\x4e\x8d\xdc\x31\x5d\x49\xb8\
+\x4e\xf5\xff\x4a\x0c\xd2\x1b\x33\xb2\x36\x5c\xa3\x90\x7c\x72\xf6\
+\xf0\x72\x20\xd5\xed\x44\x9a\x6e\x83\xe1\x65\x97\x5d\x76\xdc\x35\
+\xd7\x5c\xf7\x57\x0e\x24\x27\x6a\x75\xd6\xaf\xf1\x19\x0a\x0d\x96\
+\xc4\x01\x5c\x2e\xb1\x04\x69\xc9\xb2\x03\xfc\x51\x47\x1d\x91\x69\
+\x03\xa5\x9a\x68\xbe\x85\xa1\x40\xc2\x6b\xd0\xd2\x52\x8a\x24\x0a\
+\x59\x5a\x84\xb4\x30\x99\x98\xd1\xdb\x87\x1d\x2f\xa3\x9b\x94\x1b\
+\x81\xcf\xaf\x75\x78\x5a\x12\xc0\x42\xdc\xfb\xee\xbb\x2f\x93\x3d\
+\xa9\x71\x44\x05\x4c\x93\x35\x6a\x36\xaf\x96\x08\xdc\x78\xe3\x4d\
+\xe2\x0e\xe6\xa1\x59\x99\x5d\x3d\xff\xea\x06\x43\x4d\x74\x52\xab\
+\x97\xcf\xc3\x34\x73\x82\x23\xff\xd9\xc0\xc5\xc4\x07\x26\xd1\xd0\
+\x9a\x56\x30\xa4\xe7\x82\x2d\xab\x1a\x1b\x1b\x9d\xbf\x99\x5e\x9b\
+\x14\x3e\xe4\x02\xa5\x72\xc4\xdf\xed\x12\x0e\x4d\xda\xd1\x71\xf9\
+\x0f\x18\xf6\x64\x85\x77\x4d\x41\xe5\xf6\x7a\x40\xfe\xcf\xbb\xef\
+\x56\x30\x64\x32\x0a\x63\xc4\x24\x4a\x00\xde\x79\xe7\x03\xe3\x26\
+\x0d\xd3\x32\x64\xa1\xbd\xe9\x58\x93\x4e\x09\x22\x89\x9b\x32\x6b\
+\xd5\xa5\x01\x8f\xb1\xd6\xd8\x15\xe5\xc2\x09\x53\xe0\x2b\xab\x11\
+\x82\x8a\x2a\xb1\x0c\xc3\x52\xfe\x20\x09\x34\x47\x1d\x85\x45\x74\
+\x93\x7a\x4c\x2b\x0a\xb1\xf4\x44\x71\x4e\x49\x73\xec\xfb\x67\x3c\
+\x80\xcd\xb6\xdc\x52\xc0\x30\xed\xa6\x07\xc6\x23\xee\x57\xee\x7d\
+\xa3\x40\x3b\x96\xa8\xc4\xb3\x4d\xef\x50\xee\x55\xba\x49\x69\x19\
+\x0a\x18\x5e\x70\x0e\x9a\x8a\x88\x19\xf2\x5a\xa5\xd6\x03\x2b\x78\
+\x16\xf2\xec\xf4\x64\xe6\xd6\x84\xef\x16\x92\xef\x6a\x25\x7b\x3c\
+\xde\x31\xb1\x58\xf8\x6f\xdd\x79\xe6\x6e\x83\xe1\x8e\x3b\xee\x32\
+\x67\xee\xdc\x77\x7e\x9d\x8f\x59\xa4\x3b\x0f\xd2\xd3\xef\x14\x33\
+\x58\xf6\x82\x21\xd9\xf7\xf1\xc7\x8f\x41\x2c\x16\xcf\x14\x69\xd3\
+\xf2\x23\x28\x9a\xd8\xa2\x01\x0f\x05\x10\xbb\x9e\x8f\x35\x48\x3c\
+\xca\xca\xfc\xf8\xee\xbb\xef\xb1\xff\xfe\xfb\xf7\x19\x18\xea\x7b\
+\x91\x65\x86\x2e\x5c\x8d\x1d\x70\xd3\x11\x18\xe9\xe6\x64\x66\xe3\
+\x8c\x19\x33\x24\x7e\xc9\xf8\x19\xcf\xd1\x36\x53\xea\x56\x54\xed\
+\x55\x8b\xf2\xaf\xb9\xe6\x5a\x29\x3f\x50\x77\x63\xa1\xf1\x5f\xdd\
+\x60\xa8\x0a\x0f\x81\x9d\xef\x4e\x41\xf5\xf6\xdb\x6f\x4b\xcf\x38\
+\x6d\x5c\xcc\x73\x38\x5f\xb4\xda\x95\xf4\xdb\xeb\x25\x41\x42\x34\
+\x23\xb4\x38\x67\x9c\x4b\xfb\x3b\xaf\xbe\xfa\x9a\x80\x27\x95\x0c\
+\xbb\xe0\xff\x3f\x60\x58\x68\x55\x94\xf2\x79\x37\xc1\x30\x0e\xd0\
+\x0b\xf9\xc1\xbb\x9f\x60\xef\xfd\xf6\x45\x8c\x60\xe8\x78\x6a\x6c\
+\xd7\xba\x7a\x44\x92\x8c\x21\x32\x66\xe8\x34\x8f\xce\x80\xa1\xbf\
+\x02\x91\x70\x1c\xe5\x15\x41\xb1\x0c\x99\x61\x5c\x57\xbf\xcc\x64\
+\x93\x2e\x58\x00\x8f\x9f\x35\x82\x71\xe9\x78\x6f\x12\xb5\x92\x18\
+\x36\x6c\x38\xee\x13\xcb\x70\x4b\xb4\xb4\xc7\x69\xa2\x19\x30\x14\
+\x17\xba\x23\x3a\xc5\x4a\x34\x49\x75\x89\x64\xcc\x21\x4d\x88\xcb\
+\x3d\x6a\xfa\x57\x0b\x18\x5e\x78\xfe\xd9\x68\x5e\xbe\xb8\xe8\xd2\
+\x0a\x1d\x55\xbb\xd6\x36\x9f\x4b\x34\x37\x91\xaf\x94\xd9\x58\xdb\
+\xce\x2d\x24\xdf\xf9\x39\xe5\x42\x2c\x16\x7d\x0a\x48\x1f\xd6\x9d\
+\xf7\xeb\x16\x18\xfe\xfd\xef\x7f\x1f\x71\xec\xb1\x63\x16\x69\xc0\
+\x98\x02\x64\x75\x5b\x86\xc5\xbc\xbc\xc6\x97\x58\x7f\xc6\x98\x12\
+\x2d\x43\x82\x1f\xe3\x07\xea\x26\x75\x14\xbd\x4c\xe2\x85\xfe\x9d\
+\xd7\xd7\xcc\x44\x9b\xff\xf3\xc3\x0f\xe7\x89\xfb\x92\xb5\x7c\x5d\
+\x1d\x85\x26\xb3\x10\xd8\x30\x59\x40\x63\x5c\xdc\x18\x74\xf1\x69\
+\x02\x08\x63\x64\x2c\x07\x61\xf2\x0f\x0f\x4d\x32\x51\xd7\xb0\xa6\
+\x7c\xeb\xf3\x11\x0c\x48\x2c\xc0\x58\xa7\x9d\xa2\xdd\x97\xcf\x5f\
+\xcc\xfc\xd8\xe7\xe4\x8e\x17\xe7\x4e\x69\xa8\xf8\x3e\xb4\xfe\x66\
+\xcf\x9e\x8d\x8d\x37\xa6\xdb\xd8\xc4\xf8\xb4\x19\x2e\xaf\x43\x0b\
+\x4f\x81\x4f\x3d\x17\x81\x80\x1f\xf1\xb8\xe1\x9d\xa5\x20\x51\x2b\
+\xff\x9d\x77\xde\xc5\x01\x07\x1c\x20\xd7\xcf\xc7\x5c\x64\x0b\x5d\
+\x6d\x9b\x45\x46\xa2\xeb\xaf\xbf\x5e\xe2\x92\x76\xa7\x10\x5a\x14\
+\x2c\x96\xbe\xfd\xf6\xdb\x65\xbe\x78\x0f\x8d\x47\x77\x35\x06\x85\
+\xe6\xbf\xd4\xf1\x5b\xf3\xce\x5f\x19\x0c\x35\xc4\xc7\x9f\x74\x3f\
+\x72\x4e\x7e\xff\xdf\x57\x61\xd2\xc4\x0b\xd1\xde\x9e\x40\x79\xb9\
+\x57\xca\x18\x92\x69\xe0\xf9\xe7\x5e\xc1\x49\x27\x9f\x8c\x15\xf5\
+\xf5\x02\x4a\x96\x69\xe6\x24\xbc\x88\x7b\x48\xfe\xef\x22\x10\xd2\
+\xa4\x04\x30\xfe\xfc\xf3\x71\xe6\x19\x67\x61\x93\x4d\x36\x42\x6b\
+\x4b\x0c\xe5\x15\x7e\x69\x76\x3d\x60\x40\x7f\x7c\xf4\xd1\x47\x38\
+\x67\xfc\x38\x7c\xfa\xe9\xc7\xf0\xba\x8c\x65\xc7\x23\x18\x64\x0e\
+\x44\x08\x3f\xfb\xd9\x56\xf8\xc3\x1f\x6e\xc6\x6e\x7b\xec\x8e\xd6\
+\x70\xc2\x84\x23\x1d\xf0\xcb\x32\x02\xc9\x1f\xe1\xf3\xb9\xa4\x14\
+\x4b\xdc\xf9\xf1\x88\x10\x01\x54\x55\x55\xe2\xe9\xa7\xff\x81\x29\
+\x93\x2f\x44\xfd\x22\x7a\x8e\xba\x41\xd0\xdc\x8b\x13\x69\x2b\x77\
+\x5c\xd3\x03\x07\x0e\x94\x84\x32\xf5\x30\x69\x48\x48\xf7\x80\xfe\
+\xbd\x18\x52\x8a\x5e\x7c\xcc\x6e\x5d\xca\x96\x17\xe9\x74\x72\x5d\
+\x00\x8b\x4b\xbd\x50\xb7\xc0\x70\xe2\xc4\xc9\x93\x6f\xba\xe9\xa6\
+\x1b\x28\x6c\x75\xa0\x7a\x9a\x4d\x59\xea\x83\x77\xe7\x7c\x5d\x0c\
+\x04\x11\x0a\x3f\x96\x29\xd8\xd9\x89\x4c\x2c\xa1\xc5\x41\x70\xe1\
+\x4f\x5a\x0f\x6d\x6d\x21\x54\x54\x94\x0b\xfb\x03\x0b\x68\x55\x01\
+\xe0\xfd\xf9\xee\xcc\x24\x65\xb3\xe1\x65\xcb\x96\xf5\x29\x18\xda\
+\x1b\x49\xe3\x99\x6a\xfd\x91\x72\xed\xde\x7b\xef\x95\x7a\x3b\x06\
+\xe1\x15\x28\xd5\x1a\xcc\x7d\xb0\xb5\x11\x0c\x15\x2c\xd4\x32\xe6\
+\xdc\xd1\xed\xb9\xee\xba\xc3\x45\x49\xf1\xfb\x49\xc7\x66\x2c\x42\
+\x1e\x1a\xdb\x65\x21\x3c\x63\xbc\x3c\x54\xd1\xe1\x67\x59\xf7\x16\
+\xf0\x3f\xff\xf3\xba\xc4\x19\x09\x86\xb6\x9b\xd4\x56\xf0\x34\x2e\
+\xae\x00\xc7\x24\x2b\xba\xc7\x39\xc6\x4a\x07\xc8\xf3\xe9\x29\x21\
+\x6d\x1f\xcb\x5a\x34\x29\x82\xf7\x2e\xa4\x2c\xfe\xf8\xc1\x50\x46\
+\xa1\xc3\x52\xb4\xc1\x50\x82\x76\xff\xe7\x86\xbc\xfc\xf2\x2b\x70\
+\xc1\xf9\x13\x84\xd9\xc5\xe7\x2f\x33\x6d\xda\x92\xc0\x82\x85\xdf\
+\x8b\xf7\x83\x4a\x91\x92\x9e\x7b\x5c\x6e\xf9\x5d\xeb\xef\x38\x17\
+\x9c\xc3\x54\x2a\x69\x5c\xe7\x48\x62\xe3\x8d\x36\x75\x6a\x6b\x5d\
+\x4e\xb2\x58\x5a\xb2\xac\xab\xfa\x55\x88\x7b\xfc\xd1\x47\xff\x8a\
+\x50\x6b\x2b\xdc\x6e\x43\xe5\x48\x60\xab\xaa\xea\x27\xe7\x0e\x1f\
+\x3e\x5c\xe2\xcc\x23\xd6\x5b\x1f\xad\xe1\x10\xd2\x2c\xe4\x4f\xa5\
+\x0d\x28\x26\xf9\x36\x2c\xc1\x30\x3f\x53\x89\x24\xe2\xa9\x38\xca\
+\xfc\x01\xc4\x12\x51\xc4\xa3\x11\x94\x57\x56\x60\xfe\xb7\xdf\xe1\
+\xe9\xa7\x66\xa3\x89\x20\xbe\x1a\xc1\x50\xf3\x07\x72\x63\x8d\x5c\
+\xcf\x34\x0e\x38\x6e\x3c\x87\x63\xc0\xf1\x24\x53\x93\x9d\x9c\x66\
+\xd7\x38\x76\x47\xf6\xae\xe2\xef\x4c\x01\x52\x37\x96\x7a\xcf\x6e\
+\x81\xe1\xe6\x9b\x6f\xf1\xf6\xe7\x9f\x7f\xb1\x53\x67\x19\x80\xa5\
+\x3e\xc4\xaa\x38\x5f\x01\xc4\x2e\xd8\xb6\x8b\x5a\x55\xd8\x6d\xb0\
+\xc1\x06\xd2\x2f\x91\xbd\xc4\x18\x5f\x53\x4a\xb6\xf1\xe3\xcf\x93\
+\xb8\x92\xba\x63\x94\xbd\x45\x93\x2f\x0a\xbd\x43\x6f\x58\x86\x2a\
+\x30\x75\x91\xaa\xc5\xc1\xb6\x2e\x14\x14\x9a\x31\xaa\x31\x43\x2e\
+\x70\xfe\x9f\x42\xc2\xce\x30\x25\x18\xb0\x96\x72\xe2\xc4\x89\x6b\
+\x8d\x65\xa8\x31\x5f\x05\x43\x92\x0f\x70\x9e\x46\x8e\x1c\x91\x89\
+\xfb\x52\x96\x19\xd2\x01\xba\xb3\xcc\x8c\x28\x28\xf2\x77\xc6\x8c\
+\xc8\x18\x43\xd0\x64\x8b\x2b\xcd\xb7\x78\xe9\xa5\x97\xa5\x36\x91\
+\x56\x5c\x67\x60\xa8\x8a\x94\xcd\x38\x44\x3a\x2c\x0a\x4d\xae\x2d\
+\xce\xaf\xb1\x34\x4d\x66\xb5\x96\x7e\x64\x5b\x30\x75\xbd\xd5\x7e\
+\xec\x60\xa8\x6f\x6f\x52\xd1\x0c\x28\x8a\xfc\x10\x02\x74\x1a\x74\
+\x3c\xc3\x8b\x4b\xa7\x5f\x86\xf1\xe7\x4e\x40\x43\x43\x13\x3c\x3e\
+\x96\x30\x18\x30\x1c\x3a\x6c\x08\xbe\xf9\xe6\x2b\x01\x28\xee\x3d\
+\x99\x4b\x9f\x49\x28\xd1\x84\x32\xce\x0d\x2d\x32\x0a\xfc\xf2\x20\
+\x63\xeb\xed\x78\xfb\xed\x77\x70\xd1\x45\xd3\x50\xbb\x74\xb1\x63\
+\xf5\x93\x85\x89\x6b\xc4\xe7\x90\x2f\xb4\x09\xc3\x8d\x89\xf5\xa5\
+\x32\xcc\x37\x64\xc0\xe1\xd1\x7f\xc0\x00\x24\xd8\x9a\x2b\x16\x95\
+\x0e\xf7\xae\x14\x21\x36\x0d\x17\xe3\x86\xd9\x64\x02\xb3\xd8\xd2\
+\x09\xb8\xbd\x3e\xa9\x81\x44\x2c\x0e\xb0\x2c\x2b\x9d\x94\x58\xe4\
+\x6a\xc4\xc1\x0e\xa2\x49\x65\x01\xdf\x95\x1d\x7f\xe8\x46\xde\x65\
+\x97\x5d\x84\xe9\x86\x6b\x90\x5e\x3e\x5a\xcc\x0c\xa1\x70\x3d\xaf\
+\x9d\xb1\x48\xd7\x3b\x40\x72\xe7\x42\x32\x39\xf7\xf3\x92\xc1\xf0\
+\xf6\xdb\x6f\xdf\xfa\xfc\xf3\x27\x7c\xa4\xd9\x7d\x85\x34\xde\x52\
+\x1f\xa8\xaf\xce\xb7\x33\xb2\x54\x70\xd9\xf7\xd2\xe4\x14\x12\x75\
+\x3f\xf1\xc4\x13\xd8\x66\x9b\xad\x65\x93\x6a\x6a\xf7\x79\xe7\x5d\
+\x20\xae\x55\x3b\x85\x5f\x4b\x2c\xb8\x91\xb4\x19\x6b\x67\xcf\xdf\
+\x53\x30\xa4\x95\xca\xc5\xaa\x31\x33\x4d\xc1\xe6\xef\xdb\x6c\xb3\
+\x8d\x94\x0d\x68\x22\x89\xd6\xcc\xf1\x9d\x68\xf1\xb0\xd8\xdc\x76\
+\xf7\xae\x8d\x60\xa8\xe3\xce\x77\x22\x60\x31\x83\x96\x6e\x5e\x6a\
+\xb5\xca\x83\xab\x85\xca\x6c\x73\xb5\xfd\xf6\xdb\x65\xc0\x50\x13\
+\x9f\xc8\xed\x4a\xeb\x9f\x80\xc9\xef\x70\x0c\xf9\xef\xe3\x8f\x3f\
+\xc6\x5f\xff\xfa\xd7\x0c\x8b\x8d\xce\x61\x47\xd7\x8b\x11\xe3\x14\
+\xb8\xfc\x7e\x6e\x37\x7a\x5e\x4f\xf7\x82\xc6\x69\x95\x34\xbc\x98\
+\x35\xfd\xe3\x07\x43\x87\x6e\xaf\x03\x18\x1a\x2b\x4b\x40\x91\x96\
+\x61\xda\x85\x8b\x2f\xfd\x1d\xa8\x78\xd6\x37\x34\xc1\xef\x2b\x97\
+\xc4\x18\x8e\x0d\x2d\x7f\x0a\x6a\x76\x6f\x31\x1d\x71\xcc\x5c\x24\
+\xa2\xb1\x4c\xc7\x0f\x11\xf4\x5e\x5a\xea\x21\xe1\x20\xa5\x62\xf2\
+\xd6\x5b\x6f\xe0\xd8\xd1\x47\x83\x6d\x9e\xbc\x3e\x21\x71\xcb\xb4\
+\x3f\xe3\x75\x79\x0e\xef\x1f\x0a\xb1\x93\xbc\x0b\xc9\x44\x12\x2e\
+\xb7\x0b\x7e\x7f\x00\xd1\x08\x79\x95\x8d\x1b\x14\xe2\x5d\x48\x1a\
+\x37\xa9\x8b\x7e\xf9\xec\x47\x72\x8a\x9b\x85\xf7\x44\x6e\x26\xef\
+\x50\xd1\x72\x23\x2d\xb5\x8b\x69\x94\x05\x83\x88\xb4\x29\x47\x73\
+\x31\xab\xa1\xf7\xcf\xb1\x0d\x17\xfd\x3f\xc1\x90\xe5\x5a\x07\x1c\
+\xb0\x9f\x70\xb1\x32\x8c\x40\x99\xc7\xbe\x89\x7b\xef\xbd\xb7\xac\
+\x71\x4d\x1a\x5b\x1b\x3c\x7f\x1d\x47\x2d\xb5\xcd\xff\xf1\x6f\xcc\
+\x2b\x65\x24\x4b\x06\xc3\x23\x8f\x3c\xfa\xf7\x4f\x3e\xf9\xe4\x65\
+\xb4\x42\x94\xf4\xb8\x94\x1b\xae\xae\x73\x6d\x7f\xb9\x02\x1f\xff\
+\xc6\xa4\x14\x8d\x47\xd1\x65\x40\x82\x67\x82\x21\xb9\x01\x8d\x55\
+\x65\x9e\xf8\xec\xb3\xc7\x8b\x65\xa8\x1a\x24\xaf\x41\xa1\xc7\x0d\
+\x5a\x8c\x85\x5c\x08\x0c\x0b\x8d\x0b\xb9\x49\x73\x7d\xf7\x0a\xf0\
+\x6a\x8d\x68\xbd\x9c\x5e\x8b\xda\xde\x4d\x37\xdd\x84\x53\x4f\x3d\
+\xd5\xa9\x89\x32\xae\x42\x6a\xdb\xb4\x0c\xd9\x54\x57\x63\x86\x85\
+\xee\x5f\xe8\xf3\xde\x16\xe6\xb9\xe3\x95\xef\xfa\x1b\x6d\xb4\x91\
+\xcc\x9f\x5a\x74\x04\x23\xba\x8a\x69\xe5\x5d\x76\xd9\x65\xa0\x62\
+\xa3\x89\x32\xef\xbf\xff\xa1\x70\x93\xb2\xc4\x82\xef\xac\x5a\x2f\
+\xe7\x5e\xb3\x4a\x95\x7d\x26\x1f\x18\xaa\x0b\x49\x63\x86\x0a\x74\
+\xb6\x05\xa8\xee\x3b\x3b\x9b\x97\x7f\xe3\x77\x73\x89\xc6\x73\xc7\
+\xb3\xb7\xc7\xaf\xd0\x7c\xad\xea\xcf\x5d\x1d\x88\xfa\xe9\x58\x54\
+\x10\x74\x32\x32\xa5\x48\x1e\xb8\x74\xfa\xe5\x38\x7b\xfc\xf9\x68\
+\x6c\x68\x41\x20\x50\x0e\xa7\xbd\xbc\x30\x30\xb1\x64\x41\xf0\x45\
+\x12\x56\x4c\xfb\xab\x70\x7b\xc8\x58\xe6\x69\xd3\xf7\x8f\x99\xde\
+\xa4\x2e\x4c\x26\xe2\x60\xa7\x87\xaf\xbe\xfe\x02\x27\x9e\x38\x06\
+\x75\xcb\x7e\x90\x50\x23\xe7\x42\x9b\x64\x8b\x97\x87\x96\xa5\xd4\
+\xf3\xb9\xe1\xf5\x79\x90\x88\x9b\xe2\xfb\xb2\x60\x05\xe2\xf1\xa8\
+\xfc\x9d\x6b\x48\xe8\xfa\x5c\x29\xa1\x63\x4b\xc9\x4f\x63\xec\xe9\
+\x4f\xde\x9f\x49\x3b\x29\x87\x74\x5e\x3d\x51\x34\x27\x25\xcb\xb5\
+\x3b\x0d\x5d\x7b\x71\x92\xd4\xf3\x95\x4d\xa4\x33\x0d\xa9\x9f\x7c\
+\xf2\x49\x29\xcb\x52\x65\x93\x0a\xc1\xbb\xef\xbe\x27\x04\x15\x3c\
+\xd6\x96\x82\x7e\x95\x17\xba\x8f\xdc\x6e\xf7\x15\xa9\x54\xe2\x37\
+\xa5\x0c\x61\xc9\x60\x38\x72\xe4\xfa\x9f\x2d\x5a\xb4\x68\x73\x05\
+\x90\xb5\xa9\xf0\xd3\x06\xad\xdc\x4c\x41\x5a\x55\xfc\x9c\x8d\x65\
+\x19\x03\xdc\x6e\xbb\x6d\x44\xfb\xd4\x6c\xd3\xe9\xd3\xa7\xe3\x96\
+\x5b\x6e\xc9\x14\xc2\xaa\x8b\x92\x42\x31\x97\x1e\x2c\xdf\x04\xf4\
+\x06\x18\xda\x9d\xcf\xd5\x4a\xd1\x56\x59\x9c\x07\xde\xc3\x76\x83\
+\xf0\x7c\x26\xca\x30\xd9\x83\x6e\x28\x65\xc0\xe7\xbe\xbc\xf5\xd6\
+\x5b\x25\xd1\x43\xdd\x4c\xa5\x2c\x9a\x7c\xe7\xf6\xb6\x30\xcf\x1d\
+\x2f\xbe\x8b\x26\x02\x29\xf9\xb5\x82\x1a\x9f\x87\x20\xc8\xb1\xe0\
+\xdf\x18\xe7\xe1\xfb\x51\x30\xf2\x5d\x29\xc8\x48\x6e\xcc\xd4\xfc\
+\x1f\x7e\xf8\xa1\x03\x9d\x1e\xd7\xb1\x0a\x47\x5e\x87\xef\x41\x6b\
+\x51\xdd\xb2\xfa\xb7\x7c\x56\x62\xee\x1a\xb2\xeb\x6d\xed\xfa\x54\
+\x3e\x77\xa1\xf1\x29\xf4\x79\x4f\xe7\x67\xf5\x7e\xdf\x2d\xd4\x69\
+\xd9\xc3\x90\xa8\xd1\xa5\x69\x7e\x7a\xe0\xf2\xb0\x3e\x0f\xb8\x78\
+\xfa\x6f\x71\xce\xd9\x17\xa0\xb1\xa1\x19\x01\x7f\x05\xe0\x32\x25\
+\x12\xf1\x84\x29\x87\x20\x89\x42\x20\x10\xcc\x10\x4e\xc4\x22\xa6\
+\x95\x59\x3a\x91\x46\x38\xdc\x8e\xea\x9a\x2a\x89\x1b\x87\x43\x6d\
+\xe2\x0e\xfd\xf0\xc3\xf7\x31\xe6\xf8\xa3\x81\x14\x69\xdc\x4c\x52\
+\x8d\xd2\xef\x71\xcc\xbd\x7e\x1f\x22\xa1\x68\xc6\x55\x2a\x1c\xb7\
+\x4e\xf2\x8d\x3d\x66\x64\x5c\xe3\xc1\x37\xa1\x35\xeb\x76\xac\x45\
+\xc6\x0c\xf9\x7b\x22\x96\x84\x2f\xe0\x97\xcf\xa3\xe4\x6a\x93\x92\
+\x0f\xa3\x49\x17\xa3\x2c\xf7\xf5\xfc\xd8\xcf\xa0\xca\x1a\x33\xb1\
+\x1f\x7d\xf4\x51\xec\xb5\xd7\x1e\xd2\x94\x80\x7f\xe7\xba\x25\x33\
+\x15\x1b\x02\x68\x69\xd6\xda\xe0\x2a\x5d\x59\xbe\xba\x3e\x4f\xa7\
+\x13\x5b\x94\x32\xae\x25\x81\xe1\xf4\xe9\xd3\x77\xba\xfe\xfa\x1b\
+\xdf\x96\xc5\x49\x4d\xc9\x6a\x63\x54\xca\x4d\x57\xe7\xb9\xaa\xe9\
+\x70\xe2\xed\xac\x4c\x65\x62\xd9\x70\xc3\x0d\xa5\x06\x71\xbf\xfd\
+\xf6\xcb\xf4\x05\xe4\xf3\x9e\x7a\xea\xe9\x19\x57\x9a\x0a\x4a\x75\
+\x8b\x15\xd3\xe9\xbe\xb7\xc0\x50\xe3\x23\x7c\x76\x8d\x03\x2a\x08\
+\xe8\xf3\x28\x28\x72\xd3\x93\xde\x8a\xd4\x72\x04\x05\x53\x93\x64\
+\x92\xef\xfe\xf4\xa7\xb5\x0b\x0c\xf3\x81\x85\x5a\xb5\x04\x42\xbb\
+\x19\xee\xc9\x27\x9f\x8c\x07\x1e\xb8\x3f\x13\x37\xe4\xfc\x2d\x5c\
+\xb8\x58\xa8\xec\xc8\x40\xa3\x59\xb8\xea\x76\x56\x0d\x58\x15\x3b\
+\x1b\x0c\xd5\x22\xec\x20\x18\x9d\x7a\x30\xfd\x9b\x26\x61\xa9\xdb\
+\x9c\xf3\xa0\x8d\x8b\xd5\x7d\x5e\x68\xfe\xff\x5f\x82\xa1\x03\x2c\
+\x32\x36\x2c\x92\x4f\xb9\x71\xd1\xf4\xdf\x60\xfc\x39\x17\x62\x39\
+\xdd\xa4\xfe\x72\xa7\x15\x53\x1a\x2e\x0f\xdd\x8d\x7e\x44\xc2\x31\
+\xe9\x24\x13\x6e\x37\x6e\x69\x66\x07\x97\x97\x07\xc5\x4c\x0b\x47\
+\x42\x08\x78\x3d\x88\x27\xd8\x4b\x35\x8e\x7e\xd5\x55\xf8\xe2\xb3\
+\xcf\x31\xe6\xf8\xa3\x10\x09\xd5\x23\x91\x0c\x19\x65\x27\x1f\x45\
+\xa8\x23\x09\xd9\x29\x43\xf7\xb7\xee\x2f\xfe\x8c\x84\x4c\x82\x89\
+\x4b\xd2\x65\x32\xce\x53\xb1\x14\x05\x0c\xe3\x71\x01\x54\x9f\xc7\
+\x8f\x44\x2a\x89\x24\xb3\x96\xe1\x82\xd7\xed\x11\xcb\x90\xcf\xb4\
+\x3a\x8f\x7c\x16\x1e\x93\x04\xa9\x2c\x33\x11\x8c\xf2\x90\xe5\x26\
+\x3c\xde\x7a\xeb\x1d\xf9\x9b\x7a\xfe\xd6\x06\xeb\x30\xbf\xc2\xe1\
+\xd9\x19\x88\xbf\x53\xec\xb8\x97\x04\x86\x07\x1f\xfc\x8b\xab\x5f\
+\x7c\xf1\xc5\x8b\x39\x70\x4c\x12\x50\x0d\x6b\x6d\xc8\x34\x52\xad\
+\x3d\xb7\x76\x47\x7d\xe1\xea\x82\xa4\xb6\x44\x61\x4a\x17\x9c\x26\
+\x42\x70\xd3\x31\xa6\xc4\xbe\x80\x5a\xdb\x63\x0b\xb7\x62\x34\x7f\
+\x17\xfb\xaf\x89\x9a\x68\x67\xd4\xd9\xff\x27\x4a\x29\xb3\xbf\xd3\
+\x86\x46\x34\x4b\x33\x45\x69\x90\x10\x18\x70\xa5\xd9\x4f\x2d\x09\
+\xba\x9d\x18\xca\xf7\xba\xfd\x48\xb2\xa7\x9b\xfc\xdd\xb4\x98\x11\
+\xde\x60\xf1\xfc\xa4\xf1\xc0\x7d\x7f\xc6\x31\xc7\x1d\x2d\x35\xc5\
+\xfc\x3b\x7f\xf2\xae\xb7\xfe\x71\x06\x26\x4c\x9c\x20\xec\xfc\xac\
+\xcd\x72\x22\x23\x79\x7f\x66\xa3\xff\x86\xd9\x5f\x02\x26\x2e\xa3\
+\x65\xeb\x91\x4d\x35\x57\x42\x66\x7d\x37\xfd\x59\x5a\x3f\xcb\x7c\
+\x6e\x52\x4d\x06\x52\x16\x7f\x2d\x99\xe0\xb9\x0a\x3e\xfc\xdb\x89\
+\x27\x9e\x88\x19\x33\xee\xcd\xd4\x17\x72\xce\xc9\x3c\x43\xa6\xa0\
+\xda\xda\x5a\x11\x76\x3c\x2f\xb7\x99\xb0\x08\x3b\x27\xa3\x4e\xac\
+\x00\x37\x63\x3f\x26\xc3\x4e\x15\x0c\x9b\xf9\x87\xd7\xb0\x4b\x53\
+\xd4\x2a\xe7\x7e\xb0\xd3\xd4\x09\xbe\x85\x1a\x16\xaf\xbd\x60\x98\
+\xeb\x30\xb4\x57\x85\x3d\xf7\x5c\xff\xb9\x6b\x40\x82\x6d\x4e\x3c\
+\x8e\xeb\x1f\xb8\xe8\xbf\x7e\x87\x73\xc4\x4d\xda\x04\x7f\xa0\xc2\
+\x01\x9b\x94\xb4\x77\xa2\x65\xd8\xd2\xd2\x86\x7e\x55\x03\x10\x8b\
+\xb0\x74\xc6\xc4\x6f\x4d\xb2\x70\x0a\xc1\x00\xe3\x84\x3e\xb4\xb5\
+\xb6\xcb\xef\x35\x35\x55\x78\xef\xbd\x0f\xf1\xeb\x5f\x1d\x84\x50\
+\xa8\x4e\xb6\x52\x20\xe0\x41\x2c\x6a\x92\xac\x58\xce\xc1\x4c\x64\
+\xaf\x24\xea\xa4\xc5\x5d\xea\x72\xb1\xcc\xca\xac\x6d\xc6\x0e\xd3\
+\x29\xd3\xe3\x50\xd6\x82\xa0\xa0\xd3\x32\xca\x62\x47\xa3\x72\x69\
+\x88\xc6\x8d\x0f\xd7\x2b\x54\x70\x4a\xa1\x46\xf2\x70\xc9\x37\x2d\
+\x56\x26\xf7\xc9\x79\x0a\x16\x76\x0c\x90\x09\x60\x4c\xa2\xa3\xc7\
+\x44\x15\x43\xae\x5d\x66\x42\x4f\x9d\x3a\x35\x13\x8b\xed\x93\x07\
+\x5a\x35\x17\xbd\x06\x48\x19\x66\x91\x22\x8e\x92\xc0\x70\x9d\x75\
+\x86\x7d\x5e\x5b\x5b\xfb\x53\xcd\xe8\x53\xb7\x55\xa1\x78\x48\x11\
+\xcf\xb1\x46\x9d\xa2\x42\x51\x36\x84\x93\x96\xd8\x9d\x00\xb2\x7e\
+\x97\x40\xc8\x0d\x63\xe8\x94\xdc\x52\x87\x74\xec\xb1\xa3\x31\x64\
+\xc8\x20\x71\x45\x50\x90\x93\x65\xdf\xeb\x09\xe0\xb5\xff\x99\x8b\
+\xda\x65\x2b\xe0\x4a\x97\x21\xe0\xaf\x94\x66\xa6\x22\xbc\x5d\x24\
+\x28\x8e\x4b\x0c\x3f\x49\x30\x64\x36\x1b\x63\x17\x69\x37\xd2\xee\
+\x34\x52\xf1\x14\xdc\x3e\x37\xca\x7c\x65\x92\xe2\x1d\x69\x8f\xa0\
+\x66\x60\x0d\x0e\x3a\xe0\x20\x8c\x3a\xf8\x20\xf8\x3d\x7e\xb4\x87\
+\xc3\x08\xf8\x7c\x88\x27\x93\x78\xe7\xad\xb7\xf0\xd4\xd3\x4f\xa3\
+\x71\xf9\x72\x0c\x1d\x3e\x1c\x91\x50\x08\x49\x61\xeb\x37\xdb\xd6\
+\xf4\x8b\x63\x2b\x1b\x02\x44\x5a\xdc\x54\xa3\x46\xed\x87\x21\x43\
+\xab\x11\x8b\xb7\x01\xe9\x08\xa2\x31\x13\x2f\xf5\x78\xbc\x78\x7a\
+\xce\x33\xf8\xf8\x93\xcf\x33\xe0\xed\x16\xde\x48\xe6\xdd\x39\x41\
+\x1e\x19\xc7\xce\x01\xb1\x54\x30\xc8\x67\x69\x69\x66\x2f\x63\x83\
+\xac\x01\x64\xcc\x48\x43\x35\x0b\x17\x2e\x94\x16\x4e\x24\x2d\xd7\
+\x66\xba\xea\xe6\x2c\x26\x6e\x5a\xe8\xf9\x78\x0d\xad\x5d\x64\x0d\
+\x24\xc9\xc2\xc9\x5b\x4b\xab\x95\xfb\x84\x64\x08\xeb\xad\xb7\x9e\
+\x64\xc0\xb2\xb7\x22\x01\x32\x37\x5b\xcf\x5e\x77\x6b\x5a\x62\x5a\
+\x36\x26\xd3\x51\x64\xb8\xcd\x4a\xb1\x6c\x25\x4b\x09\x12\xf4\xe0\
+\xa7\x5c\x0b\x5e\xf4\xef\x3f\x04\x2b\x56\x34\x61\x8b\x9f\x6d\x85\
+\x6d\xb6\xf9\x39\x1a\x1a\x9b\x04\x90\xbc\x7e\x43\x22\xdf\x1e\x8a\
+\xe0\xb8\xe3\x8e\xc3\x11\x47\x1d\x8c\xe5\xcb\x43\x68\x6a\x6d\xc1\
+\xe0\x01\x03\x11\x0a\xb5\x51\x0b\x94\x7d\x92\x4a\xb2\x85\x92\x0f\
+\xf1\xa8\x59\x57\xc1\x32\x1f\x9a\x9a\xeb\x30\xef\xc3\xb9\x88\x46\
+\x5a\xd1\xaf\xba\x0c\xad\xcd\x4d\x52\x1e\x41\xe5\xf2\xed\xb7\xdf\
+\xc3\xe3\x33\x1f\xc5\xd2\xa5\xf3\xe1\x72\x93\x29\xcb\x3c\x6d\x30\
+\x58\x21\x20\x18\x09\x27\x71\xd0\x21\x87\x62\x45\x63\xab\x24\xcb\
+\x05\x02\x2c\xdd\xf0\x21\x9d\x8c\x0a\x65\x5b\xbf\xaa\x80\xfc\x64\
+\x1c\xd2\x4e\x09\xed\x38\x0a\x2c\xa9\xa9\xc0\x9c\x39\x73\xc4\x43\
+\xc1\xeb\xe8\x51\x55\x59\x85\xd6\xb6\xd6\x4c\xec\xb3\x33\x41\x57\
+\x68\x7d\x15\x12\x90\xa5\x7a\x1e\x72\xcf\xb7\x99\x9d\xf8\x2c\xfa\
+\xaf\xd0\x7d\xd7\xe4\xcf\x5d\x2e\xf7\x17\xe9\x74\x62\xf3\x62\x9f\
+\xb1\x68\x30\xbc\xfa\xea\xab\xb7\xbf\xea\xaa\x6b\xde\xe5\xa6\x56\
+\x6a\x2c\xd1\x82\xbc\xde\x1f\x83\x06\xd1\x61\xbc\xfa\x02\x0c\x59\
+\xc7\x94\x48\x9a\x16\xa1\x2c\x00\xbe\xe7\x9e\x3b\x24\x63\x4b\x74\
+\x5a\xba\x30\x5d\x6e\xc4\xa2\xc0\x63\x33\x9f\xc1\x67\x9f\x7c\x8b\
+\x50\x1b\x45\x48\x19\xc2\xa1\x14\x12\x0c\xf0\xbb\xa3\x48\xa4\x99\
+\x45\x47\x4b\x85\x31\x2d\x4e\x5d\x36\x84\x5f\x55\x55\x8d\xb6\xb6\
+\x16\x87\x41\xc7\xa4\xaa\xc7\x62\x11\x21\x15\x36\x09\x36\x4e\x9a\
+\x74\xda\x2d\xee\xa6\xf2\x60\xa5\xb4\x9b\x21\xc9\xb0\xcb\x9d\x46\
+\x32\x41\x6b\x8f\x92\xc2\x58\x9c\x9a\x35\x27\x16\xad\x2b\x86\x54\
+\xb2\x1d\x67\x9c\x79\x22\xb6\xdb\x7e\x5d\x49\x9c\x73\x89\x86\x1c\
+\x17\x6a\x2c\x12\x17\x8c\x3e\x72\x0c\x5e\x7c\xf1\x15\xa4\x92\x8c\
+\x99\x44\xa5\xb9\x0e\xdf\x95\x1d\xe7\x44\x34\xf4\x31\x18\x72\xf3\
+\x6a\x5d\x1f\x81\x68\xdc\xb8\x71\x52\x6a\xa2\x20\xf5\xe6\x9b\x6f\
+\xe2\xf2\xcb\x2f\x17\x37\x29\x63\xbc\x85\x2c\xb5\x62\x37\x90\x7d\
+\x9e\xde\x8b\x31\x5a\xc6\x97\x6d\xd7\x13\xcf\xa3\x15\xc2\xc6\xbf\
+\xf4\x32\x68\x6d\x22\x01\x9c\xcf\xad\xdd\xcb\xbb\x73\xdf\x55\xf1\
+\x9d\xac\x1b\x4a\x15\x1a\xa7\x76\xd3\x10\xa1\x39\x8f\xc0\x39\xef\
+\x04\x0c\xe1\x83\xcf\x1b\x14\xb7\xe6\xb8\x73\xce\xc5\xe4\x29\x17\
+\xa3\xba\xba\xbf\xe8\x47\x54\x14\xc3\x91\x94\xd4\xec\x32\xee\x46\
+\x0b\xb0\x2d\xdc\x86\xb2\x60\x40\xac\xbf\xa6\xa6\x46\x04\xfd\x01\
+\x59\xcb\xf1\x58\x0a\x1e\x77\x90\x34\xa2\xa2\xa4\xf9\xbc\x2e\x34\
+\x36\x2c\xc6\x05\xe7\x9f\x85\x2f\xbf\x9e\x27\x20\xc6\x7d\x50\xe6\
+\x0f\xc2\xe3\x36\xe0\xd9\x16\x6a\x81\x0f\x49\x04\xca\x3c\x48\x48\
+\x47\x09\xfa\x49\xdd\x70\x7b\xfc\xf8\xd9\x56\x3b\xe2\xea\xab\xae\
+\xc7\xcf\xb6\xdc\x5e\x32\x2a\xcd\x52\x4d\x23\x9d\x8c\x20\x58\xee\
+\xc1\xe0\x41\x35\x28\x0b\x2a\xff\xb7\xf1\xa0\x74\x3c\xcc\xfb\xbe\
+\xfc\xd2\x4b\x92\xa0\xf5\xcd\x37\xe4\x20\x35\x85\xfb\xac\x51\xce\
+\x1c\x1a\x74\xec\x64\xb2\x56\x37\x18\x6a\x62\x8d\x3e\xc7\x8f\x03\
+\x0c\xa9\x84\xb9\x77\x00\xe2\xef\x15\xb3\x47\x8a\x06\xc3\x03\x0f\
+\x3c\xf8\x77\xcf\x3f\xff\xfc\x6f\x75\xd0\x6c\x4b\x69\x6d\x60\x28\
+\x28\x66\x30\xf4\x9c\x8c\x45\xa7\xc5\x6a\x45\x14\x4d\xe7\xbb\xbe\
+\x7d\x1d\xaf\xc7\x8f\x18\x03\xeb\x48\x61\xf8\xf0\xa1\x98\x31\xe3\
+\x1e\x29\xfc\xa7\x65\x18\x8b\xa5\x50\x55\x59\x89\x50\x3b\x30\xe3\
+\x9e\xbf\xe2\xa3\x0f\xbe\x40\x32\xe1\x47\xc0\x47\xed\x36\x20\x5a\
+\x25\xdd\x44\x84\x95\x54\x92\xf0\x63\x7e\x52\x5b\x96\x9e\xa4\x2e\
+\xf6\x59\x63\xac\x24\x26\xbf\xfb\x03\x3e\xf8\x7d\x01\x24\x53\x09\
+\x44\x23\x31\x89\xef\x56\x56\xf6\x73\x5c\xbc\xac\x25\x6a\x13\x8d\
+\x9c\x14\x6f\x2c\xb3\x68\x6d\x6d\x46\x45\x45\x55\x07\x70\x35\x6e\
+\x1e\x93\x65\x97\x46\x08\xa1\xf0\x12\x4c\x9e\x7a\x36\x76\xdd\x6d\
+\x53\x24\xe4\xcf\x31\x78\x7d\x14\x1a\xb4\x7a\xda\x71\xc6\xe9\xe3\
+\xf0\xec\x33\x2f\x20\x1e\x8d\x4b\x5d\x96\xb8\x96\x24\x41\x82\xc0\
+\xbd\x6a\xc0\x50\x63\x1b\x74\x75\xab\x9b\x5b\x5d\x9d\x04\x40\x02\
+\xa2\xed\xee\xec\xcd\xc4\x06\xd5\xac\xb9\x2f\x4e\x3b\xed\x34\xdc\
+\x77\xdf\xbd\xa2\xe4\xd0\x6b\xc2\xf1\x67\x92\x07\xc1\x70\xec\xd8\
+\xb1\x62\x1d\xe6\x0a\xbf\xdc\x64\x1c\x23\x94\x1d\x17\x79\x9e\x8e\
+\x05\xa5\xac\xe7\xde\x39\x37\xd7\xdd\xbd\x32\x28\xca\x33\xe7\x05\
+\x43\xa0\xbc\xa2\x06\xe1\x68\x0c\xa9\x78\x12\x17\x4c\x9c\x8c\x0b\
+\x26\x4c\x92\x5e\x80\xad\xed\x8c\xa5\xb9\x50\x5e\x51\x25\x2d\xb7\
+\xa2\xf1\x04\x9a\x9b\x57\xc0\x57\x46\x8b\xcc\x2b\x4a\x03\x95\xba\
+\xca\x20\xcb\x2c\xdc\x88\x47\xd8\x26\x29\x08\x57\x8a\x1a\x59\x1a\
+\x1e\x57\x12\xb5\x75\x8b\x70\xd2\x89\xa3\x31\xff\xbb\x4f\xe1\xf6\
+\x18\xaa\x3d\x8f\x8b\xdf\x4d\x48\xcc\x51\x32\x25\x13\xe4\x34\x8d\
+\x23\x91\x4e\xc3\xe3\xf5\x49\x22\x0e\xbb\xd3\xef\xbc\xeb\xbe\xb8\
+\xff\xbe\x87\x50\x5e\x31\x00\xed\x6d\x61\xc9\xfa\x14\x8f\x46\x32\
+\x82\x8a\x4a\x1f\x86\x0c\x1e\x80\xca\x2a\xee\x2d\x02\x68\x1e\x16\
+\x1d\x67\x70\x49\xba\xb1\xfd\xf6\xdb\xa3\xbe\xbe\x41\xfe\x52\x59\
+\x51\x29\x99\xce\xd4\x59\x4d\x6d\xaa\x01\xda\xce\x8e\xd5\x0d\x86\
+\xb6\xa5\x68\x03\x62\xef\xac\x9d\xd5\x73\x15\xc7\xa8\xb9\xfc\xff\
+\x8c\x87\xdf\x15\xf3\x04\x45\x83\xe1\xc0\x81\x83\xdf\x6b\x68\x68\
+\xf8\xb9\x26\x09\x68\x90\x79\x6d\x4c\xa2\x29\x6a\x60\x2c\x20\xcc\
+\x97\x44\x51\xca\x35\xf4\xfb\x26\xe3\x33\x2d\x60\x78\xd7\xdd\x77\
+\x60\xbf\x7d\x0f\x90\x0e\xf4\xb4\x0a\xa5\x44\x29\x09\xdc\x7e\xdb\
+\x4c\x7c\xf4\xc1\x57\x48\x25\x02\xf0\xb8\x99\x40\x10\x40\x1a\x26\
+\xb0\x2d\x10\xe3\x64\x26\xda\x71\x4a\xce\x01\x85\x86\x66\x89\x29\
+\xe3\x3d\xad\x0e\x82\x00\xe7\xac\xb6\xb6\x4e\x5c\x39\xb4\x42\x74\
+\x0e\x29\xa4\xf9\x6c\xca\x64\x93\x2b\x80\x35\x8e\x40\x30\x4c\x24\
+\x6b\x71\xe1\xe4\x33\xb0\xfd\x0e\xeb\x49\x97\x6f\x5a\xaa\x1e\x8f\
+\x89\xb3\x30\xd0\x7e\xc2\xf1\xa7\xe0\xc5\x17\x5e\xa1\xbe\x2d\x45\
+\xc7\x1e\xa9\x49\x49\x21\x95\x66\xa2\x55\xdf\x83\xa1\x32\x93\xa8\
+\xe7\x82\xcf\x9e\x8f\x74\x5b\xb3\x67\xf9\xb9\x02\x50\x6f\xd1\xa5\
+\xa9\x52\x78\xfa\xe9\xa7\x8b\xb2\x43\x81\xcb\xfb\x68\x62\x02\x7f\
+\x67\x91\x33\x6b\xbb\x38\x7f\x5a\xd6\xa1\xdd\x33\x38\xfe\x6b\xae\
+\x20\x2a\x16\x0c\x33\x2b\xd5\x6c\x11\x27\x63\x34\x2d\xf5\x79\x6e\
+\xb8\xbd\x7e\x4c\x9b\x76\x31\xce\x3e\xe7\x7c\x89\xe9\x26\xd3\x1e\
+\x54\x56\xf4\xc3\xd2\xda\x65\xa8\xac\xac\x42\x3c\x61\xe8\xf2\xfc\
+\xc1\x32\x24\x92\x71\x51\x16\x19\xdb\x4a\x44\x49\x71\xe6\x41\x22\
+\x4a\x02\xef\x72\x48\xc9\x82\x05\x86\xa7\x9e\x7a\x1c\xbe\xfe\xe6\
+\x33\xf8\x3c\x69\x29\x9c\xa7\xf2\x69\x3a\x4a\x18\x7a\xb4\x80\x27\
+\x8d\x44\x92\x49\x2d\x40\xa0\xcc\xc9\x32\x4e\xa4\xb1\xf9\x16\x3f\
+\xc7\x9f\xfe\x78\x07\x7e\xb2\xd1\x16\x88\x46\xc8\x4d\x6a\xae\x4b\
+\x30\x2c\x0b\xba\x31\x70\x40\x35\xca\x2b\x18\x70\xd7\xf7\xca\xbf\
+\xf3\x17\x2d\x58\x8c\xad\xb6\xd9\x1a\xcd\x4d\x4d\x1d\x4e\x90\xfa\
+\xc9\x22\x1b\x09\x14\x23\x53\x3a\x3b\xa7\xa7\x6e\x52\x95\xe7\x7d\
+\x05\xd6\x3d\x79\xb7\xee\x7e\xd7\x8c\x49\xfa\xfd\x74\x3a\xb5\x7d\
+\x31\xd7\x28\x0a\x0c\xaf\xbe\xfa\xea\x8d\x2f\xb9\x64\xfa\xd7\x26\
+\x1b\xd1\x74\x1b\xe7\xb1\x36\x71\xd7\x15\x33\x18\xb9\xe7\xe4\xd3\
+\x96\x4a\xb9\x8e\x6d\x19\x9a\x7a\x33\x03\x5a\xeb\xac\x33\x18\x7f\
+\x7e\xf0\x7e\xec\xbf\xdf\x28\x89\x2f\xb0\x7b\x36\x55\x48\x12\x56\
+\xdc\x79\xfb\x1c\x7c\x3c\xef\x2b\xb8\xd2\xe5\x48\xc4\x99\x61\xe7\
+\x45\x22\x69\x8a\xed\xc9\x80\x61\xfb\xf3\xed\xff\x53\xb0\x4a\xa6\
+\x9c\xd3\xde\x48\xa9\xf2\xf8\x3d\x6a\xe0\x83\x07\x0f\x11\x4d\x55\
+\x93\x3b\x34\x93\x56\x8b\xf8\x15\x48\x6d\x6b\x24\x03\x86\xae\x30\
+\x62\xf1\x25\x38\xf7\xfc\x93\xb1\xd3\xce\x9b\xc1\xe3\x15\xb9\x66\
+\xc0\x2e\x99\x94\x4e\x10\xc7\x1d\x77\x3c\x5e\x79\xf9\x75\xf8\xbd\
+\xe4\xff\x8c\xcb\xe7\xac\x0d\x2b\x36\x66\x58\x68\x5c\x73\x35\xe7\
+\xdc\xcd\x6f\x2b\x67\x6a\xf1\x71\xad\x4a\x61\xb6\x23\x60\x79\x8e\
+\x9d\x19\xa7\x0a\x45\x3e\xab\xac\xd0\xf3\xe4\x7e\xae\x75\xa7\x04\
+\x60\x82\xe1\x3d\xf7\xdc\x85\xe6\xe6\x56\x51\x36\xb4\x37\x26\xad\
+\xf0\x33\xce\x38\x03\x7f\xfe\xf3\x9f\xe5\xeb\x36\x30\xeb\xf5\x6c\
+\x0b\x53\xff\xd6\x9b\x16\x6c\xa9\xef\x95\x3d\x3f\x6b\x15\x99\xb1\
+\x27\x91\x3d\x7f\xaa\xbb\x54\x53\xb0\x34\xc9\x24\x7b\xbe\x94\x22\
+\x78\xb9\xfe\x3d\x48\xc6\x12\x38\xef\x82\x0b\x71\xfe\x05\x17\xca\
+\xef\x11\x32\xb5\xc0\x8d\x81\x83\x86\xa0\xa9\xa9\x05\xd1\x58\x5c\
+\xe6\x4c\xe7\x49\xd8\x5e\x98\xc4\x94\x88\xc3\xe7\x61\x2c\x8f\x09\
+\x2a\x7e\x27\x16\x9c\x12\xf0\x5b\xde\xb0\x14\x27\x9e\x78\x0c\xbe\
+\xf9\xf6\x73\xb8\xe1\x94\x46\xa4\xdd\xf0\xfb\xca\x84\x69\x26\x14\
+\x0e\xc1\x0b\x76\x7d\x71\x21\xed\x66\xdd\x9f\x49\x9c\xa1\x65\xb8\
+\xfd\x8e\x7b\xe2\xce\x3b\xee\x45\x4d\xff\xa1\xb2\x4f\xa8\xc4\xc9\
+\x79\xc9\x08\x02\x65\x2e\xf4\x1f\xd0\x0f\x65\x41\x86\x13\x34\x79\
+\x4c\x47\x24\x1b\xff\xe6\xfb\x2d\x59\xb4\x14\xdb\x6e\xb7\x9d\x64\
+\x95\x52\x21\xe3\xda\x32\xef\x60\x5c\xc7\xa5\x82\x55\xa9\xf3\x54\
+\xea\xf5\xf3\xed\x9f\xde\x96\x7f\xa5\xbe\x43\x6f\x9f\x9f\x95\x65\
+\xde\x4d\x80\x68\xc1\x1e\x7b\x45\x81\xe1\x11\x47\x1c\x71\xc1\xac\
+\x59\x73\x6e\xb1\x0b\x37\x39\xd9\x5a\x58\xda\x1b\xc2\xa4\xb7\x07\
+\x62\x4d\xb8\x9e\x0d\x86\x8c\xf3\xa9\xf2\xc0\xc4\x19\xd6\xf7\x30\
+\x8b\xcb\x04\x4d\x80\xd6\x96\x04\xaa\x2a\xbd\xb8\xe1\xfa\x3f\x4b\
+\xcc\xb0\x3c\x38\x10\xe9\x94\x0f\x5e\x4f\x50\xe2\x79\xcc\x20\x65\
+\xc2\x8c\x1e\xb9\xa0\xa8\xcd\x95\x15\x14\xb4\xf4\xc2\x00\x64\x0a\
+\x03\x06\x0c\xea\xc0\xbc\x62\xe2\x59\x26\x8d\x9c\x89\x1c\x5a\x74\
+\x9b\x7b\x7d\xfe\x9e\x46\x04\x2d\x2d\x3f\xe0\xbc\x0b\x4e\xc7\x8e\
+\x3b\x6d\x21\x40\xe7\xf5\x99\x76\x50\xb1\x68\x54\x62\x3d\x63\xc6\
+\x9c\x80\x57\x5f\x7d\x15\x5e\xd1\xc4\xd5\x25\x64\x04\x88\x64\xda\
+\xad\xdc\x9b\xb4\xa4\x29\x2a\x04\x86\x7c\x7e\xae\x43\x6d\x78\xac\
+\x8a\x1b\xbf\x47\x70\xce\x65\x8e\xb1\x5d\xfb\xbd\xbd\x7e\x19\xaf\
+\xbc\xf3\xce\xdb\x3b\xbc\x1f\x85\x22\x9f\x83\x71\x25\xc6\x0c\x55\
+\x29\xd1\x44\x19\x9b\x20\x5c\xc6\xdc\x72\x8d\xae\x7e\x30\xec\x08\
+\x84\x19\x30\x4c\x99\xc8\x30\x0f\xbb\x8e\x50\x28\xd6\x9c\x12\x04\
+\xe7\x43\xe1\x1d\x95\x31\x8f\xc4\x30\xf6\xec\xf1\x98\x70\xe1\x24\
+\x94\x95\x95\x23\x41\x7a\xb3\x64\x1a\xd1\x18\xd9\x80\x52\xa8\xac\
+\xea\x07\xbf\x9f\xa4\xec\x51\x01\x3d\xb7\xcf\x8b\x50\x5b\x8b\x28\
+\x8a\x92\x09\x99\x34\x9d\xe5\x19\x36\xe0\xda\xf2\x7b\x5d\x68\x68\
+\xac\xc5\x51\x47\xfe\x0a\x0b\x7f\xf8\x16\xfe\x00\xb3\x44\x99\xf9\
+\x49\x9e\x52\xe3\x82\x35\x29\x3c\xdc\x7f\xa6\x71\x6f\x4a\xe2\xee\
+\xac\xe6\xf0\x63\xe7\x5d\xf6\x11\x30\x1c\x30\x70\x38\xc2\x21\xc6\
+\xba\xb3\x31\xc3\xf2\x0a\x2f\x06\x0d\xae\x82\xcf\xaf\x90\xdf\x31\
+\xfb\xdb\x5e\xd2\xf3\xe7\x2f\xc4\x16\x5b\xd0\xba\xcc\x96\x50\xf8\
+\xf8\xbe\x89\xa4\x24\xcd\x99\xe7\xed\xfc\x58\xdd\x6e\xd2\x9e\xde\
+\xbf\xa4\xcd\xbc\x8a\x4e\xce\xca\x5f\xf7\x84\x54\x2a\xfe\xc7\x42\
+\xb7\x2d\x0a\x0c\xd7\x5f\x7f\xfd\x67\x16\x2e\x5c\x7c\xb0\x66\xcb\
+\x29\x28\xaa\xf6\xd6\xdb\xc2\xa4\xd0\x43\xaf\x2d\x9f\x77\x04\xc3\
+\x94\xc4\x8d\x68\x19\x0e\x1c\xd8\x5f\xac\x83\xbd\xf6\xda\x4b\x34\
+\x54\x0a\x85\x80\xdf\x27\xa0\x38\xf1\xc2\xcb\xf1\xc6\xeb\x73\x51\
+\xe6\xaf\x16\x30\xf4\x31\x3b\x34\x1e\x87\x3f\x68\xdc\x8e\x8e\x1f\
+\x3c\x23\x2c\x55\x98\x72\x4e\xec\x52\x00\x7e\x47\x1b\x82\x9a\x24\
+\x84\x16\xc9\x6c\xd4\x39\xe4\xe7\x5a\xa8\x6f\x97\x02\xd8\x82\x38\
+\xab\x3d\x26\x10\x4b\xb5\xe3\x77\x97\x5f\x86\xdd\xf7\xd8\xdc\x64\
+\xe4\xa5\xc8\x02\x62\xb8\x3f\x69\x19\x1e\x7b\xcc\x31\x78\xf9\xe5\
+\x97\x21\x99\xb3\x8e\x88\x24\x58\x4a\xb9\xb5\xcb\x25\xb5\x57\x3d\
+\x39\x0a\x81\x21\xaf\xad\x96\x96\x6a\xe5\x1c\x8f\xce\xca\x7e\x34\
+\x83\x54\xc7\xb3\x50\xf6\x66\x21\x61\xa1\x2e\x4f\x3e\x07\xe3\x82\
+\xec\x5a\xa1\x6e\x68\x2a\x2a\xec\x6d\xc7\x84\x0a\x5a\x8d\x24\x75\
+\xb0\x0f\x0a\x79\x05\x67\x1b\x14\x15\x04\x0b\xdd\xbb\x27\xe3\x5a\
+\xdc\x77\x0d\x08\x18\x83\xd0\x94\x9b\x48\xa2\x95\xc4\x95\x9d\xbe\
+\x59\x92\x68\x65\x83\x05\x63\xda\xd6\xd5\x5d\x1e\xf8\xcb\x8c\x62\
+\x47\xba\x35\x26\x12\xd1\x6a\x4b\xbb\x58\x2f\xeb\x43\x38\x12\x77\
+\x2c\x39\xd6\x12\x26\xd0\x16\x0a\x09\x18\x56\x54\x54\x8a\x27\x22\
+\x95\x8c\x08\xc0\x92\x7e\xcd\xd4\x83\x92\x36\x8d\xc0\x98\x42\x5d\
+\xdd\x52\x8c\x3d\xeb\x34\x7c\xfa\xf1\x07\x19\x52\x76\x51\x16\x25\
+\x76\xed\x46\x59\xa0\x0c\xb1\x68\x7b\x66\x5d\xf2\x45\xf8\xec\x1e\
+\x6f\x00\xdb\x6c\xbb\xe9\xae\x9c\x34\x00\x00\x20\x00\x49\x44\x41\
+\x54\x0b\x6e\xbe\xe5\x36\x0c\x1b\xba\x81\x80\xa1\xbc\x27\xb3\xb3\
+\x93\x11\x54\x56\xf9\xb1\xce\xe0\x01\xe2\x26\xcd\xc6\x42\x79\x86\
+\x94\xdc\x67\x0e\xde\x65\xc1\x82\xa5\x12\x33\x5c\xb1\xdc\xf4\xcb\
+\x64\x86\x75\x32\x29\xf1\x04\xb3\x6f\xe5\xc2\x9d\x97\x57\xf4\x74\
+\x8e\xfb\xc2\x32\x2c\x6e\x6d\xac\xb9\x67\x65\xc7\xc4\xf5\x6c\x3a\
+\x9d\x38\xa4\xd0\x93\x16\x04\xc3\xbb\xee\xba\xab\x7c\xdc\xb8\x71\
+\xed\x8c\x6d\xf1\xe2\xdc\xe0\xb9\x8c\x2b\x6b\x43\x51\x66\xa1\x81\
+\xe8\x8b\xcf\x3b\x82\x21\x33\xcc\x02\x52\xbb\x38\x78\xf0\x40\xa1\
+\x7c\xdb\x73\xcf\xdd\x25\xae\x45\x61\xc0\x31\x6c\x69\x0e\xe3\xe8\
+\xa3\x8e\xc3\xf3\x2f\xfe\x9b\x3c\x19\xe2\xc6\xf1\x21\x88\x38\xb8\
+\x49\xa9\x59\xd2\x3d\xad\xa9\xec\xfc\x69\x12\x5c\x3a\x12\x43\x11\
+\x7e\x0c\xab\x07\xe3\x75\x06\x8e\x94\x17\x32\x9b\x7d\x6a\x7f\xcf\
+\x94\x41\x50\xcb\xe7\xf5\xec\x2c\x55\x6a\xd4\x26\xce\x49\xcd\xfe\
+\x81\x07\xee\xc3\xf1\x27\xfc\xc2\x74\x12\x48\x40\x34\x66\x7a\xcc\
+\x59\x42\x70\xd6\xd8\x33\xf0\xe2\x8b\x2f\x66\xac\xb3\x4c\x9d\x5d\
+\xcc\x64\x9c\x76\xa8\x80\xef\xc6\x60\x17\x02\x43\x8d\x01\xaa\xc5\
+\xac\x40\x4f\x70\xb1\x6b\x4c\x73\x2d\x30\xe5\xd8\xd5\xc4\xb0\xce\
+\x1e\xad\x10\x0b\x87\x2a\x84\x9c\xf3\x33\xcf\x3c\x13\x37\xdf\x7c\
+\xb3\xd3\x8c\x99\xdd\x34\x4c\x5d\x23\x33\x58\xc9\xfa\xc3\xae\x16\
+\x4a\xeb\xa7\x16\x3d\x33\x7e\x99\x96\xaf\xe4\x01\x5a\xb3\xa8\x04\
+\x00\xdd\x18\xb2\x5e\xfc\x8a\x11\xe2\x12\x06\x66\x11\xb9\xd4\xcc\
+\x6a\xbf\x4f\x27\x89\x8b\xeb\x26\x57\x9a\x64\x38\x3c\x19\x2f\xf4\
+\x03\x92\x4d\x0d\x9c\x7d\xde\x79\x98\x78\xe1\x64\x59\xa3\x61\x71\
+\x57\xba\xa4\xa6\x90\x6b\x30\x1a\x49\x08\x27\x69\x55\xb5\x07\xd1\
+\x08\xd0\xde\x0e\x04\xfc\x4c\x42\xe1\x9a\x0b\x8b\xab\x9f\x16\x9e\
+\xdb\x43\x25\x8b\x59\xcf\x09\x2c\x5d\xb6\x18\x63\xc7\x9e\x86\xaf\
+\xbf\xfc\x5c\x40\x88\x40\xc9\x32\x0c\x19\xbb\x54\xca\x30\xa9\x90\
+\x77\x34\x45\xa7\x2b\x6b\x0d\xd9\x5a\xcb\xb8\x49\xb7\xdd\x61\x77\
+\xdc\x37\xe3\x41\xf4\xab\x1a\x2c\x31\x43\xf1\xa8\x78\x59\x5f\x18\
+\x85\x58\x86\x03\x2a\xe1\x0f\x10\xf0\x99\x19\xcd\x7a\x41\x13\xbf\
+\x17\xdb\xd7\xf1\x0c\xd3\x4d\xfa\xc9\xc7\xdf\x08\x0f\x30\x13\x68\
+\x92\x89\x98\x28\x9d\x1c\x29\xae\x87\xf6\xf6\x56\xa4\x08\x8c\xff\
+\x01\xc3\x5e\x5c\x93\x85\x2f\x95\xe3\x99\xab\x00\x60\xa5\xf7\xae\
+\xfc\xfd\x82\x60\x78\xf2\xc9\x27\x1f\xf1\xc8\x23\x8f\x3c\xa9\x3d\
+\xe3\x64\x21\xac\x86\xec\xb6\xce\x34\x78\x15\x62\xf9\x34\x7b\x2e\
+\x7a\x7e\x8f\xd6\xd8\xea\x38\x32\x93\xe1\xd4\x19\xf2\x79\xd8\x65\
+\x9b\x09\x34\x0f\x3f\xfc\x10\xf6\xd9\x67\x2f\xc7\x5d\x66\x68\xa6\
+\x28\x30\x0f\x3a\xe8\x10\xbc\xfe\xfa\x9b\x40\xda\x34\x12\xa5\x41\
+\x25\x20\xe5\x36\xa5\x0a\xf9\xc0\x4f\x9a\xc8\xe4\x94\x5a\x74\x3c\
+\xcf\x7e\x7b\x8d\xed\xe4\xfc\x14\x55\x97\xa0\x65\xba\x39\xb0\x14\
+\x44\xb6\x3c\xd5\xef\xb4\xe9\x38\x7e\xc7\x5d\xf7\x62\xec\xd8\x63\
+\xe5\xff\xec\x37\xc7\xd2\x8c\xca\xa0\x0b\xdf\x7e\xb7\x00\xa7\x9e\
+\x7a\x0a\xde\x7c\xf3\x75\x49\x40\x50\x17\xad\x08\xfa\xb4\x1b\x87\
+\x1e\x7a\xa8\xb8\x89\x74\x0e\x75\x0d\x69\xd1\x3c\xe7\x4e\xeb\xee\
+\x14\xcc\xf8\x3b\xdd\xae\xca\x82\x61\xbb\x40\x7b\x32\x97\xfa\x0c\
+\xf6\x4f\x5e\xcf\x4e\x48\x52\xcb\xd2\x00\x40\x36\x46\xde\x19\x20\
+\xf3\x5a\x9c\x5b\xbe\x2f\x2d\xc4\x9f\xfd\xec\x67\xd8\x6a\xab\xad\
+\xa4\x5f\x1c\xbf\xc3\xf7\xe4\x98\x50\x28\xb3\x1b\x0a\x3b\x2f\x90\
+\x30\x5c\xeb\x22\x95\xe3\xf6\x9a\x6b\xae\xc1\xdc\xb9\x73\x57\x56\
+\x28\x12\x24\x5c\x28\xb8\x55\x7b\x32\x2c\x05\xf6\xb4\xd4\xfe\x98\
+\xa6\xb9\xb4\xca\x52\x2e\x49\xc6\x62\xf7\x8f\x83\x0e\xf9\xa5\x64\
+\x2a\x8b\xb2\xe0\x3c\xa3\x3e\x2b\xc1\x82\xcb\x96\x30\x12\xf0\x97\
+\xa3\xa5\xd9\xf0\x88\x92\xdd\x64\xa7\x9d\x76\x76\x94\x85\x20\x62\
+\xd1\x94\x58\x69\x48\x7b\xf1\xe9\xa7\x5f\xa0\x61\x79\x33\xaa\xfb\
+\x71\xec\x80\x78\x4c\x8a\x77\x80\x54\x13\x3e\xff\xfc\x03\x2c\x5b\
+\xb6\x04\x5e\x9f\x0b\x6e\x4f\x0a\xd1\x28\x13\xbb\xc8\x44\x13\xc3\
+\xec\x27\x9f\x14\xfa\x35\x75\x93\x9b\x62\x79\x3d\x8c\x65\x46\x30\
+\x27\x1e\x8b\xf2\x2e\xb8\xec\xc1\x76\x3b\xec\x2e\xd9\xa4\x65\xc1\
+\xfe\x4e\x4c\x93\x45\xf8\x6e\x24\x13\x61\x89\x19\x0e\x1f\x31\x00\
+\x24\x66\xe1\xf5\xf8\xfd\x54\xca\xe4\x4d\x90\x6d\xad\xa9\x85\x59\
+\xd6\x71\x78\x03\x7e\x89\x0f\x3f\xfd\xf4\xd3\x58\xb2\x78\x29\xfa\
+\x57\x57\xcb\x8d\x2b\x82\x41\xf1\x96\xbc\xfa\xf2\xbf\xd1\xdc\x54\
+\xdf\x01\x0c\xbb\x2b\x43\xd5\x10\xb1\x9b\xaa\xdb\x9d\x54\xf4\x8d\
+\xd5\x40\x51\xb6\xa5\x52\x17\x87\x0d\x24\xba\x3f\xec\xfd\xab\x7b\
+\xb8\xbb\xef\x51\xea\xf3\xf4\xf4\x7c\x8f\xc7\x75\x64\x32\x99\x9c\
+\xd5\xd5\x75\x0a\xee\xb0\xad\xb7\xde\xfa\xf6\x79\xf3\xe6\x9d\xc3\
+\x54\x7c\x7d\xf1\xd5\x31\x00\x76\x8c\x47\xdd\x4a\x76\xf7\x00\x4e\
+\x14\x17\xa9\x32\x2c\x28\x5d\x5c\x4f\x07\xb1\x27\xdf\x5f\x19\x0c\
+\x83\x88\x44\x43\x18\x3e\x6c\x18\x1e\x7e\x84\x60\xb8\x47\x06\x0c\
+\x09\x3c\x8c\xb5\x1d\x72\xc8\x21\x78\xf5\xd5\xff\x91\xdb\x8a\x20\
+\x8e\xb3\xe5\x4c\xc1\x9a\x5d\x47\x58\xe6\x52\xe9\xeb\xef\x85\xdf\
+\x42\x19\x5c\x32\x49\x33\x76\xe1\x6d\xda\x0b\xb7\xb7\x02\x57\xfc\
+\xfe\x2a\x9c\x78\xe2\xc9\xf2\xcc\x46\xc0\xbb\xe0\xf3\xb8\xf1\xd9\
+\x67\xf3\x70\xe9\xf4\x8b\xf0\xee\x5c\x32\xf5\x65\xb3\x0e\x29\xf8\
+\xb6\xdb\x76\x7b\x69\x3c\xbc\xc3\x8e\x3f\x5f\x09\x0c\xf5\x5e\x04\
+\x1f\x5e\x8f\x4a\x8b\x66\xbb\x12\x04\xe9\x4a\x7b\xea\xa9\xa7\x3a\
+\x75\x75\xea\x18\x71\x9c\x4b\x21\x45\xc8\xdd\xe8\x7a\x1d\xb2\xf8\
+\x53\x88\x10\xa4\xd4\x9a\x24\xa7\x29\x9f\x4b\x41\x3a\x77\x24\xf3\
+\x29\x69\x9a\xbc\x64\xba\x2b\x64\x1d\x6a\x24\x81\x27\x41\x3a\x5b\
+\x6e\xd1\x4b\x60\x04\x4a\xd6\x68\x3e\xf9\xe4\x53\xf1\xc8\x23\x8f\
+\x64\xd8\x40\xf8\xb9\xae\xeb\x52\xde\xaf\xf0\x6c\x97\x7e\x46\x20\
+\xe8\x37\x9d\x59\xa4\x6d\x11\x4d\x44\x0f\xd6\xff\xc9\xc6\xb8\xed\
+\xb6\x3b\xb0\xc3\x8e\x3b\x3b\x7d\x41\x1d\x0f\x84\x0d\xdc\x0e\x79\
+\x27\x93\xc1\x82\x41\x3f\x5a\x5a\xd8\x6f\xd0\x70\xb5\x12\x54\x19\
+\x1f\xa4\x0b\xdf\xef\xaf\x44\x53\x53\x2b\x5e\x78\xfe\x55\x7c\xfe\
+\xd9\x57\x70\xbb\xca\x90\x88\x33\x71\x8c\xae\xd0\x24\x92\xa9\x7a\
+\x7c\xf0\xc1\xeb\x98\x3f\xff\x4b\xb6\x6e\x76\xbc\x24\x4e\xb9\x03\
+\xeb\x0d\x7d\x26\xfe\x2d\x99\xd4\x4e\x69\x8f\xbc\x25\xad\x31\xc7\
+\xd9\x61\xc0\x8c\x4e\x0e\xb6\x7d\xe2\xe0\x97\x08\x86\x6c\x0f\x95\
+\x34\x1d\x36\x62\xc9\x14\x56\x34\xb5\xa2\xa5\x2d\x02\xaf\xcf\xd4\
+\x8a\x2e\x5f\xde\x88\xb2\x40\x39\x2a\x84\x13\x37\x85\xaa\xf2\x72\
+\x3c\x70\xff\x03\xb8\xfe\xfa\x6b\xb0\x74\xc9\xfc\x0e\x9d\xee\x4b\
+\x95\xa1\xea\x32\xd7\x3c\x8d\xce\x62\xde\xea\x11\xd1\xb1\xd0\xef\
+\x15\x9a\x71\xe3\x7a\xce\xae\xd5\xdc\xe7\xeb\x4a\x11\x2c\x75\xff\
+\x15\x7a\x96\xbe\xf9\x3c\x75\x07\x7b\x3d\xf7\x08\x0c\x83\xc1\xe0\
+\xd7\xe1\x70\x78\xe3\xd5\x0d\x86\xf6\x4b\xe4\xba\x65\xed\xd8\x25\
+\x27\x2d\xa3\x99\x3a\xf4\x23\xab\xab\x0e\xb2\x14\x30\x64\x1a\x39\
+\xb5\xde\x31\xc7\x1f\x8b\xd7\x5e\x33\x35\xa2\x5e\xe3\x91\x11\x83\
+\x4d\x12\x78\xbb\x48\x42\x31\xf7\xea\x3e\x18\xe6\xdb\x9c\xbc\xa6\
+\x6c\x2e\xb7\x17\xf1\xa4\x1b\x13\x27\x4d\xc3\x89\x27\x9e\x84\x60\
+\x59\x85\x24\x28\x50\xd0\x90\x0c\x7b\xc1\xc2\xf9\x98\x36\x65\x02\
+\xde\xff\x80\x34\x80\xc6\x2d\x25\x59\x74\x29\x0f\x76\xd8\x7e\x47\
+\xbc\xf0\xc2\x0b\xa8\xae\x66\x07\x82\x95\x97\xa2\xb6\x84\xa3\xa0\
+\xa2\xeb\x2a\x10\xf0\x19\x37\x6c\x2a\x2d\xdd\x27\x08\x86\x99\xe7\
+\x70\xe8\xd2\x54\xfb\x2f\x65\xd3\x14\x12\x0a\x6c\x05\x75\xe9\xa5\
+\x97\x8a\x55\xa7\x7d\x2e\x29\xfc\xd9\xb6\x8b\xcc\x22\x9d\x29\x82\
+\x36\xb0\x8a\x6b\xcc\xe9\xaf\xa7\x2d\x9d\x14\x18\xf9\x93\x31\x5b\
+\x26\x4e\xed\xbd\xf7\x5e\x86\xfe\x8b\x99\xbe\xb1\x98\xdc\x8f\x85\
+\xe6\xa3\x47\x1f\x2b\x0d\x8b\x0d\x53\x11\xbd\x05\xa6\xb4\x40\xc1\
+\xba\xab\xf7\x2d\x24\x5c\x6d\xcb\x32\x9f\xd0\xb3\x85\xa1\x7e\x6e\
+\xbf\x5b\x26\x01\x24\xcd\xee\x0e\x01\x51\xd2\xfa\x0f\x1a\x82\xbf\
+\x3e\xf2\x28\xb6\xda\x66\x1b\xd4\x2e\xab\x37\x99\x9a\x4e\x71\x39\
+\xbf\x2b\xfd\xfe\x1c\x22\x07\xaf\xab\x5c\xca\x88\x58\x33\xa8\xe3\
+\x44\x6f\x06\x49\xb7\xe3\xb1\x04\xca\x02\x3e\xd4\xd5\x85\xf0\x8f\
+\xa7\x9f\xc7\x27\xf3\xbe\x16\xf6\x25\x0f\x59\x99\xfc\x41\xf8\x7d\
+\x29\xa4\x53\x75\x78\xe7\x9d\x17\xf0\xe9\x67\x1f\x21\x9e\x6c\x87\
+\xcb\xc5\x8c\x65\x93\x9c\x22\x0c\x49\x4e\x19\x8b\xd9\x23\x4e\xf1\
+\xbf\x03\x84\x12\xe2\xa4\x73\xa5\x13\x30\x9c\x71\xff\x43\x28\x2f\
+\x33\x96\xa1\x69\x5b\xe4\x46\x2a\x69\x2c\xc3\x11\xc3\x8d\x65\x68\
+\x62\x86\x04\x71\x86\x1f\x48\x2c\x91\xc2\xf2\x86\x66\xac\x68\x6d\
+\x97\x1e\x86\x26\x9c\xe0\x92\x77\x24\x8f\x69\x3c\x1a\xc3\x88\x75\
+\x87\xe1\x6f\x0f\x3f\x82\xe9\x97\x4e\x43\x38\xd4\xd8\x2b\x60\xa8\
+\x6b\x40\x65\x9a\x86\x23\x6c\x22\x14\x55\x9c\x74\xcd\xdb\x04\xf2\
+\xa5\xec\x19\xfb\xdc\xce\xf6\x8f\xe6\x29\xac\x6e\x65\xad\xf0\x7b\
+\xa5\x98\x4d\xba\x49\xb7\xc1\xf0\x92\x4b\x2e\xf9\xe9\xd5\x57\x5f\
+\xfd\xb9\x49\x0e\x30\x4c\xfe\x46\x9b\xed\x61\x6a\x60\xe1\x27\x5f\
+\xe9\x0c\xcd\x7c\xd4\xfb\xdb\x31\x1c\xad\x13\x53\x57\x9a\x6a\xd4\
+\x7a\xee\xea\x4a\xf0\xb1\x85\x09\x49\x88\x8d\x9b\x34\x62\x59\x86\
+\x74\x93\x32\x93\xd3\xf0\x96\x86\xc2\xed\xb8\xfe\xfa\x6b\xf1\xc1\
+\x87\xef\xc9\xa6\x64\x06\xaa\x8c\x7b\xca\x25\xf5\x86\xc6\xf5\xb9\
+\x72\x8c\x30\x37\x66\xd8\x9d\xdf\xa5\xde\x91\x09\x09\x1e\x26\xed\
+\x78\x44\x48\x11\x98\xf8\x93\xae\x31\xb8\x03\xd8\x67\xdf\xfd\xb1\
+\xd3\x4e\xbb\x22\x9d\xf2\x20\x19\x37\x1d\xb1\x2b\x2a\x03\x58\xb4\
+\xe8\x07\x8c\x3f\xe7\x74\xcc\xfb\xf8\x3d\x27\x63\x8f\xbc\x9f\x95\
+\x68\x6f\x8d\x60\x93\x8d\x37\xc5\xeb\xaf\xbf\x8e\x9a\x9a\x6a\x49\
+\x4c\xe8\x30\x26\x8e\xf5\x69\x0b\x7b\x3e\x03\xf9\x27\xab\xaa\x2a\
+\x71\xd8\x61\x87\xe3\xef\x7f\xff\xfb\x4a\xad\xab\xba\xb1\x7c\x3a\
+\x7c\x25\x9f\xcb\x91\x4d\x9d\xff\xf9\xcf\x7f\xe2\xa7\x3f\xdd\x54\
+\xb2\x10\xb9\xb9\x49\xe7\x36\x69\xd2\x14\x89\xff\xa9\x30\xe8\x4c\
+\x69\xc8\xf7\x77\x6d\xdf\xa4\x7c\xa6\x04\xd7\xe7\x9e\x7b\x0e\xfb\
+\xee\xbb\xaf\x8c\x93\x7d\x50\x79\x38\xe5\x94\x53\x24\xd3\xd4\x76\
+\xf9\x17\x02\xf1\x9e\x8e\x45\xd1\xdf\x17\x41\xcf\xa4\x10\xd3\x09\
+\xbe\xa5\x95\x49\x41\x03\xf0\xe8\x63\x8f\x61\xdd\x11\xeb\xc1\x95\
+\x01\x04\x77\xb6\x47\xa1\xc9\xae\x91\x98\x20\x2d\xbd\x68\x38\x62\
+\x1a\xef\x96\x97\x8b\xd7\x83\x6e\x65\xa1\x2e\x4b\x7b\x50\x55\x59\
+\x8d\x86\xe5\x6d\x78\xf6\x99\x17\xf1\xe5\x17\xdf\xa3\x2c\xd0\x4f\
+\xd6\x7c\x2a\xc5\x36\x6a\x64\x52\x6a\xc0\xdb\x6f\x3f\x8f\xcf\x3e\
+\x7f\x1f\xc9\x74\x18\x1e\x4f\x12\x70\x31\x06\xc8\x7d\x62\x98\x93\
+\x34\x33\x3b\xa3\x41\xba\xc9\x35\xea\xc8\x2c\x05\x43\x86\xbf\x45\
+\x61\xe1\x59\x1e\x6c\xb3\xfd\xee\xb8\xbf\x58\x30\x64\xd6\x18\x6b\
+\x82\x59\xfc\x9f\x04\xea\x1a\x5b\xd1\xdc\xd2\x0e\x97\xdb\x94\x7a\
+\x30\x36\xaf\x4a\x45\x34\x12\xc1\x80\x9a\x1a\x3c\x3e\x73\x26\x7e\
+\xfb\x9b\x8b\xd1\xd6\x5a\xdf\x23\x30\xd4\x3d\x62\xf3\xe4\x2a\xbf\
+\xae\x1d\x06\xb2\x0d\x05\xa5\x1d\x2c\x7a\x8e\xbb\x38\x51\xf7\xcc\
+\xea\x90\xfd\xbd\xf1\xfc\xf4\x62\x25\x93\x49\x52\xb3\x7d\xd1\xd9\
+\xf5\xba\x74\x93\xee\xbc\xf3\xce\xe3\xdf\x7e\xfb\xed\xdb\x4c\x5c\
+\xce\xa4\x25\xaf\x2e\x30\xcc\x7d\x01\x3e\x93\x92\x66\x2b\x30\xda\
+\x24\xdc\xb2\xd4\x1d\x2d\x7d\x75\x4d\x60\xae\xe0\x17\x30\x8c\x44\
+\x24\x66\xc4\xc2\xeb\x6c\xcc\xd0\xf4\x45\xa4\x95\x45\x26\x0b\xc6\
+\x41\x68\x45\x90\x4c\x98\xf4\x55\x7c\x0f\x52\xb5\x99\xc1\xd7\xe6\
+\xa2\x1d\x7f\x12\x30\x55\x0b\xef\xce\x4f\xa5\x63\xa3\x86\xcb\x70\
+\x21\x33\xf9\x18\x3b\x91\xf4\x76\xaf\x07\xa1\x48\x14\xf1\x04\xad\
+\xb7\x84\xc4\x7e\x18\x03\xe2\xfb\xf9\x7d\x6e\x7c\xf9\xd5\xa7\x98\
+\x3c\xe5\x3c\x01\x43\x32\x82\x24\x13\x30\x0d\x4d\xc3\x31\x6c\xbc\
+\xd1\xe6\xc2\xfc\x32\x68\x60\x65\x5e\xcb\x50\xe7\xd5\x74\xd5\x30\
+\xbf\xa9\x85\x78\xc4\x11\x47\x61\xf6\xec\xd9\x9d\x32\xb1\x74\x07\
+\x28\xec\x39\x51\x17\x27\xef\x49\x37\xd7\x4b\x2f\xbd\x84\x6d\xb7\
+\xdd\xa6\x43\xae\xcf\x69\xa7\x9d\x81\x07\x1e\x78\x40\x84\xb7\xae\
+\xfd\x7c\xeb\x89\x6b\x51\x93\x62\x68\xed\xf1\xda\xf6\xfa\xd4\xb8\
+\xce\x2b\xaf\xbc\x22\x2d\x73\xcc\xb5\x68\xf1\x27\x05\x20\xe8\x36\
+\x3d\xfd\xf4\x33\xf1\xb7\xbf\xfd\x4d\xac\x45\x0a\x3a\xb5\xa0\x8a\
+\x21\xc2\x2f\x94\x0d\xab\xd9\xb3\x3a\xde\x9d\xb9\xbd\x3a\x13\x14\
+\xe6\xfa\x86\x38\xde\xe3\xf1\x4b\xf3\xf6\xca\x7e\x35\x98\xf9\xd8\
+\x2c\xac\xb7\xde\x06\x48\x9b\xc2\xd3\x8c\x3f\x5f\xe6\xc6\xa9\x8b\
+\x95\xef\xa5\x4c\x5c\x95\x6b\x99\x74\x69\x7c\x67\x8e\x09\xbb\x3c\
+\x98\xf8\xb8\x17\x0d\xcb\x5b\xf1\xaf\x67\x5e\x16\x30\x24\xfb\x12\
+\xb3\xa9\x13\x71\x02\x69\x18\xc1\x60\x2b\xde\x7a\xfb\x5f\xf8\xf4\
+\xf3\xf7\x90\x44\x08\x3e\x2f\x93\x59\x62\x48\x30\x36\x48\x80\x73\
+\xb3\xd5\x53\x36\xa9\x27\x4b\x26\xef\x64\xb5\x3a\x61\x4f\xc6\xfa\
+\xf2\x81\x61\xd0\x89\x19\x26\x62\xf9\x2d\x43\xc4\x63\x70\x09\xdb\
+\x3d\xc1\xde\x03\x52\xa3\xd6\x35\xb6\xa1\xa9\xb9\x0d\x2e\x0f\x39\
+\x4e\x0d\x39\x3b\xdf\xaf\xcc\x67\xac\xc3\xca\x8a\x20\x66\x3d\xfe\
+\x04\x2e\xbb\xec\x22\x84\xda\x7b\x0e\x86\x5d\x59\x78\xba\xfe\xb4\
+\xce\xd8\xae\x09\x2f\x26\xc1\x31\x9f\x82\x68\xff\x6d\x8d\x54\xd0\
+\x4a\x42\x49\x29\x05\x3c\x37\x1e\x8f\x77\xac\x79\xb2\xae\xd1\x25\
+\x18\x56\x55\x55\x3d\x16\x89\x44\x8e\x36\x2d\x6a\xb2\x3e\xe5\xd5\
+\x01\x2e\xda\xb1\x80\xf7\xce\x15\x0e\xb6\xe5\x97\xdb\x3a\x67\x75\
+\xb9\x48\x45\x2e\x58\x09\x05\x26\xc3\xcd\x27\xb4\x4c\x06\x0c\xff\
+\x6a\xc0\x30\xc6\x78\x07\x93\x7c\x28\x1c\xd4\x2f\x9a\xa9\x65\x16\
+\xf7\x8f\x5a\x8e\x25\xcd\x7d\x2f\x9e\xac\x8c\x93\xf5\x0d\xad\x68\
+\x6d\x89\x20\x1a\x49\x23\x58\x66\xc0\xb0\x2c\xe0\xc7\x97\x5f\x7d\
+\x8c\xa9\xd3\x2e\xc0\x47\xf3\xde\x45\x99\xdf\x8d\xb6\xd6\xb0\xa4\
+\xbd\xa7\x93\x6e\x6c\xb4\xd1\xe6\x78\xe7\x9d\x77\xd0\xaf\x8a\x6e\
+\xd2\xfc\xa9\xe5\xc6\x0d\x4a\x2e\x55\x93\x28\xc2\x39\x26\x6b\x8b\
+\x82\x21\x19\x48\x98\x70\xd2\x1b\xda\xa9\x02\xa0\xfd\x93\x43\x45\
+\x37\x29\xad\xb6\x4d\x37\xdd\x54\x32\x16\x35\x76\x38\x7e\xfc\x78\
+\x3c\xf8\xe0\x83\x19\xfe\xdd\xce\x62\x87\x3a\xdc\xb6\xe0\xd1\x8c\
+\x50\x8d\x89\x72\x6d\x3e\xfb\xec\xb3\x32\xef\x5c\x07\x26\xf6\x6d\
+\x40\x84\x16\xd2\x31\xc7\x1c\x83\x59\xb3\x66\x39\x4d\xa5\xdd\x05\
+\x1b\x02\xf7\xe2\x14\x67\x2e\x95\x2b\x14\x33\x7b\x9d\xa5\x11\x24\
+\xd4\x76\xf1\x99\xfd\x68\x0b\x45\xa5\x76\xf5\xfe\x07\xfe\x82\x4d\
+\x7f\xba\xb9\xa1\x37\x53\xfe\x4d\x8b\x87\x53\x32\x2e\xd9\x8c\xd7\
+\x65\xa8\xe9\x8c\x82\x60\x92\xa9\x38\x56\xd1\xb0\xc9\xa6\x0e\x96\
+\xf5\xc3\xf2\xfa\x66\x3c\xfb\xcc\xcb\xf8\xec\x93\xef\xe0\xf7\x56\
+\x09\x07\xa9\xc7\x5d\x06\xbf\x2f\x09\xbf\xbf\x11\x6f\xbc\xf9\x0c\
+\x3e\xf9\xf4\x5d\xc4\x52\x2d\x70\xbb\xe2\x86\x33\x57\xb4\x0a\x48\
+\xfb\x24\x7a\x2c\x08\xd6\xe6\x99\x99\x78\xc3\x98\xa2\xe3\xc5\x72\
+\x9a\xd5\x4b\x9b\x41\x7a\x3a\x72\x2c\xc3\x42\x60\xe8\xa2\x86\x27\
+\xba\x80\xb1\x0c\x23\x09\x63\x19\x36\x35\x85\x00\xb7\x4f\xb2\x4c\
+\xa9\xc0\x46\xc4\xda\x4d\x20\x1e\x89\x62\x9d\xc1\x83\xf0\xfc\x33\
+\xcf\x62\xea\x94\x09\x58\xd1\xb8\x48\x5c\xbb\x9d\x29\x23\xc5\xcc\
+\x65\xae\x72\xaf\xe0\x48\x02\x78\x1d\x4f\xcd\x95\x60\x82\xcd\xd7\
+\x5f\x7f\x2d\x97\x2d\x46\x06\x76\xe6\x46\xcf\x7d\x2e\x5b\x81\x2c\
+\xb4\x17\x8a\x79\xa7\x55\x77\x8e\xb4\x55\x7b\x3c\x1a\x8d\x8e\xee\
+\xec\x9e\x5d\x82\xa1\xd7\xeb\xad\xf7\x7a\xbd\x83\x4c\x8c\xc6\x30\
+\x99\x1b\x8d\x76\xd5\xbb\x49\x6d\xc0\x1b\x30\x60\x40\x26\xc1\x81\
+\x9b\x8b\xc2\x92\x02\x8c\x29\xfe\x3c\x6c\xf7\x00\x05\x50\x6e\x22\
+\xc3\xaa\x9a\x80\x2c\x18\x72\xec\x52\x08\x94\x79\xa5\x86\xca\x64\
+\x93\xfe\x15\xfb\xec\xbd\x0f\xe2\x71\x53\xaf\x27\xe3\x4a\x57\x8b\
+\xcb\xa4\x93\x73\xbf\x32\x66\x48\x0d\x3c\x10\x80\x74\x94\xd0\xe6\
+\xa4\xf9\x9e\x3f\x9f\x66\xd7\xe1\xbc\x2e\xd2\xba\x79\x5e\x3e\xcb\
+\x22\x03\x3e\x70\x4b\xa2\x40\x6b\x1b\x0b\xa1\x59\x2b\xe6\x11\xc2\
+\x64\xba\xb9\x98\x2c\xf0\xdd\xfc\x2f\x71\xe1\xc4\x71\xf8\x84\x60\
+\x18\xf4\x19\x2d\xd9\xef\x45\x32\xe1\xc2\xa6\x9b\x6c\x89\xb9\x73\
+\xdf\x43\x65\x05\x2d\xd9\xc2\x23\xaf\x16\x22\xd7\x1b\xfb\x30\xda\
+\x35\x79\x1a\x7f\xe3\xb3\xda\x0a\x51\xa9\x31\x11\x7b\x43\xeb\x3b\
+\x32\xb9\x85\xb1\xcd\x2d\xb7\x34\x75\x94\x92\x79\x98\x4c\x0b\xe1\
+\xf7\x8c\x19\x33\x32\xee\xaf\x42\x02\x20\x9f\x37\x42\xd7\x2e\x39\
+\x53\xc9\x4b\x7a\xd0\x41\xa3\x04\x3c\x68\xf9\x73\xbe\xa9\x04\x10\
+\xfc\x4f\x3a\xe9\x14\xcc\x9c\x39\x53\xe6\x42\xbd\x1d\xbc\x9e\x26\
+\x4d\x74\x35\x7a\x85\xf6\xa4\xce\xaf\xad\xa0\xf1\x7a\xfa\xbb\x1d\
+\x67\xb2\x33\xb4\x6d\x30\x34\x13\x48\x2d\x87\x3f\x3d\x18\x34\x64\
+\x18\x6e\xbd\xed\x2e\xec\xb8\xf3\x2e\x08\xb5\xc7\x4c\xd9\x05\x95\
+\x19\x96\xf3\x30\xa9\x29\x13\xe4\x4e\xa1\xcc\xeb\x41\x4b\x6b\xa3\
+\x58\xe0\xec\x0a\xa1\xed\xb3\x5a\x5b\xdb\x24\xe9\x24\x95\x70\xa3\
+\xa9\x31\x82\xe7\x9f\x7b\x15\x9f\x7f\xfa\xbd\x50\x11\xa6\x12\x3e\
+\x61\x60\xf2\x79\x19\x37\x5d\x26\x96\x21\xdd\xa4\x09\xb4\x01\x08\
+\x77\x54\xae\xa4\xd7\x20\x37\x52\x16\x0c\xa5\x1c\x49\xd7\x5c\x37\
+\xc1\x70\xf8\xf0\x01\x08\x30\x66\x28\x24\xc0\x59\x37\x69\x2c\x05\
+\xd4\x2e\x6f\x47\x73\x4b\x44\xde\x9b\x6e\xe3\xfe\x83\x06\x4b\x1d\
+\xa4\xcf\x4b\x0e\xd5\x28\x06\xd4\x54\xe3\x1f\x73\x9e\xc2\xb9\xe3\
+\xc7\x22\x99\xa0\x32\xd7\x33\x30\xd4\xf9\xe2\x9c\x28\x69\x06\x5d\
+\xef\x6c\x59\xc6\x24\x35\x1e\x9c\x47\x8e\xfd\xfc\xf9\xf3\x71\xea\
+\xa9\xa7\xe2\xf3\xcf\x3f\xef\x96\xbc\xce\x55\x16\x35\x4c\x95\xc9\
+\xd6\x75\x42\x1c\xbd\xa1\xa0\x16\x96\x0a\xbd\x71\x86\x58\x86\xcb\
+\xe3\xf1\xf8\xe0\x92\xc1\xf0\xcc\x33\xcf\xdc\x7e\xc6\x8c\x19\xef\
+\xea\x66\x58\xdd\x09\x34\x9a\x52\x4c\x81\xc2\xae\x00\x87\x1f\x7e\
+\xb8\xa4\xae\xd3\xed\xc8\x8d\x7e\xdd\x75\xd7\xe1\x99\x67\x9e\x11\
+\x50\xb4\xd3\x89\xf3\xa5\x1d\xf7\xc6\xd0\x16\x73\x8d\xbc\x60\x18\
+\x49\x60\xf8\x30\x07\x0c\xf7\xd9\x27\x63\x19\xf2\x7a\x24\x6e\x11\
+\x4e\xe1\x44\x36\x79\x46\xf5\x0e\xa3\x6c\x6b\x9d\x61\xfe\x7a\xc1\
+\xae\x63\x85\x19\x9d\x34\xcf\xa3\x3b\x42\x2e\x53\x8f\xb8\xf2\x29\
+\xbc\xe3\xf2\xe5\xad\x48\x26\xdc\x4e\xd1\x3d\xa9\xa6\x92\xa8\xea\
+\x17\xc4\xb7\xdf\x7e\x85\xdf\x5c\x36\x0d\xff\xfa\xd7\xdf\x11\x28\
+\xf3\x0b\x39\x38\x35\xf5\x64\x1c\xd8\x60\x83\x8d\xc5\x32\xac\xee\
+\x57\x21\x25\x22\x9d\x09\x6d\xce\x21\xdd\xc4\xb4\x90\x4c\x12\x83\
+\x37\x33\xa7\x4a\x10\xa0\x6e\x70\x16\xf9\x53\xf1\x59\xb1\x62\x85\
+\x3c\x68\x31\x6e\xa0\x42\xf3\x35\x6c\xd8\x30\x5c\x7b\xed\xb5\x60\
+\xc3\x53\xbe\x17\xd7\x1b\x33\x5a\x6f\xb8\xe1\x06\xbc\xf5\xd6\x5b\
+\x12\xdb\x55\x20\xcc\xf6\x6e\xcc\x5e\x75\x65\xc0\x72\x0b\xe7\xac\
+\x24\x91\x10\x1e\x5c\xa4\x1c\xeb\x8f\xdf\xfc\xe6\x37\x52\x6a\xc2\
+\x7a\x42\x16\xe2\xd3\xca\x6a\x69\x69\x92\xf7\xbe\xf1\xc6\x1b\xf1\
+\xc1\x07\x1f\x88\x30\xd3\x7e\xa1\x7c\x37\xfe\x9f\x96\x73\x57\x47\
+\xa1\x3a\x48\xfd\xae\x54\xa1\x9a\x06\x80\xa6\xc3\xbc\xe3\xbd\x68\
+\x6d\x69\x37\xa4\x0d\x1e\xc3\xe0\xa2\x0a\x92\xd0\x00\x4a\xdb\x30\
+\x26\xc4\x18\xd7\x6f\x34\x1a\x93\xae\x27\x03\x07\x0f\xc3\xd4\xa9\
+\xd3\xb0\xd5\xd6\xdb\x3a\x75\xaa\x06\x04\xf9\x2f\xa5\x6e\x53\x49\
+\xe8\x4c\x22\x1a\x6d\x91\xfe\x82\x54\x4e\x3f\xf9\xf8\x23\xd4\xd5\
+\xd5\x09\x31\xb7\x74\x8f\x20\x3d\x5a\x7b\x0c\xf1\x98\x0b\x73\xdf\
+\x99\x87\x85\x0b\xea\x84\x74\x82\x6b\x8d\x9e\x13\x82\x88\xdb\xd3\
+\x88\xf7\xde\x7b\x09\xdf\x7c\xf7\x29\x52\x8c\x19\x7a\xc9\x7b\x4b\
+\x1e\x53\xe7\xcd\x44\x3f\x37\x59\xae\xe6\xb0\x7a\x6e\x3a\xb9\x65\
+\xc6\x5b\xe1\x64\x93\x26\xcd\xb9\xdb\xed\xb0\x2b\x98\x40\xa3\x96\
+\xa1\x10\x50\x78\x56\x4e\xa0\x41\x8a\xae\x6f\x53\x52\x41\x2b\x30\
+\x96\x04\x96\x37\xb6\xa3\xa9\x35\x02\xb7\x97\xfc\xc1\x0c\xdb\x04\
+\xc4\x83\x41\xf7\x28\x41\xb1\xbc\x2c\x80\x7f\x3d\xfb\x2c\x2e\x9d\
+\x36\x09\xcd\x4d\x4b\x7a\x04\x86\x76\x03\x71\x1d\x63\x5d\x8f\x57\
+\x5e\x79\x25\x2e\xbd\xf4\x62\x51\xde\x0c\xdb\x92\x1f\x0b\x16\x2c\
+\xc2\xce\x3b\xef\x2c\x61\x97\x62\x9a\x8f\xeb\xfa\xd0\xb2\x28\x55\
+\x3c\xd5\xdd\xaa\xeb\x9b\xe0\xcb\x7f\x6b\x7e\xc2\x4c\xc7\xdd\x42\
+\x65\xd3\xe1\x2a\xde\x01\x40\xde\x2e\x16\x9d\xee\xb0\x2d\xb7\xdc\
+\xf2\xc2\xf9\xf3\xe7\xdf\xa4\x59\x71\x99\x45\x57\x48\xaa\x74\xf3\
+\xf3\x4e\xdd\x33\xce\xf5\x54\xfb\xe7\x79\x74\x35\x1d\x78\xe0\x01\
+\x0e\xf3\x3c\x01\xc4\x83\x8b\x2e\xba\x44\x84\xa7\x82\x5f\xd6\xdd\
+\xc6\x0c\xb6\xae\x19\xe3\x73\x1f\x99\xdf\xb5\xb3\xb3\xba\xf9\x4a\
+\x79\xdd\xa4\x14\x24\x23\x46\xac\x2b\x16\x02\x5b\x38\x75\x70\x83\
+\x76\x65\x70\xcb\x4c\x75\x07\x04\x35\xe1\x46\x65\x04\xb5\x5b\x75\
+\x7c\x0a\x94\xd0\x91\x22\x3a\x7c\x7b\x1b\xb3\xf6\xdc\x60\x37\x27\
+\xaf\x63\x99\x92\x94\xdb\xef\x07\x6a\x97\xd6\xe2\xb9\xe7\x9e\x35\
+\x5c\xaa\x0e\x47\x2d\xbb\x5f\x70\x43\x26\x53\x31\xdc\x7f\xdf\xbd\
+\xf8\xee\xbb\x6f\x64\xa3\x54\x55\x55\x49\xdc\x8f\x16\xcf\xba\x23\
+\x46\x4a\xc2\x08\x13\x68\xe8\x26\xd5\x4d\xa5\x60\x43\xd7\x12\xe7\
+\x87\xd7\x24\xa7\x23\x5d\xc8\xdc\xc0\xdb\x6e\xbb\xad\x28\x3d\x76\
+\x2d\x9e\xce\x0b\x33\x4c\x69\xb1\x11\x0c\xb5\xc1\x6e\xa1\x98\x99\
+\x3d\x87\xf9\x2c\xc3\xae\x2d\x2b\x0a\x5e\x47\xea\x66\xe6\x28\x9b\
+\x00\x63\xd6\x9a\xd1\xc8\xcd\xff\x19\xe7\xf2\x09\xe7\x2c\x05\x14\
+\x9b\x2e\x93\x0e\x8c\x5d\x3c\x18\x1b\xe4\xbb\x33\x0e\x4b\x77\x21\
+\x93\x6e\x89\x3d\x74\x39\xee\xbf\xff\xfe\x98\x70\xfe\x05\x18\x39\
+\x72\x24\x2a\xca\x2b\x10\x8b\xc6\xe5\x1d\x79\x6d\x29\xfb\x74\x2c\
+\x39\x15\x82\xb6\x96\xde\xb5\x67\xc0\x29\x65\x60\x13\x67\x12\xc2\
+\x33\xf4\xc5\xb0\x07\x7b\x62\x12\xe4\x92\x40\x73\x6b\xab\xc4\x82\
+\x99\xcf\xc2\x32\x05\x69\x47\x9b\xa4\x62\x96\x40\x5b\x38\x22\x2e\
+\x0b\x8f\xcf\x10\x6f\x08\xd7\x6b\x32\x2d\x1e\x98\xc1\x83\xd7\x01\
+\x3d\x35\x04\x6c\x05\x40\xfb\x59\xf8\x7f\x77\x9a\xd9\xc5\x61\x69\
+\xb7\x44\x05\xe3\xe2\xa9\x53\xf0\xde\xbb\xef\x98\x72\x0c\x29\x66\
+\xf7\xc0\xef\x0d\x20\x1e\x4f\x89\x37\x81\x63\xc7\x22\x7c\x76\xa7\
+\x48\xb1\x46\x37\xc9\x8e\x13\x54\x18\xda\x10\x8b\x85\x56\xa2\x36\
+\xd3\x8c\x64\x25\xc5\xce\xf6\xcd\x74\xe6\xcc\xf2\x8a\x18\x52\x7c\
+\xbe\xb5\x8f\x7d\x55\xb0\xeb\x2e\x7b\xe3\x96\xdb\xee\x44\xff\x01\
+\xc3\xa5\x63\x86\xce\x25\x8b\xee\xab\x2b\xfd\x18\x3c\xb0\x9f\x14\
+\xfc\x83\x04\x16\xa2\x38\x98\xbd\x12\x4d\x00\xf5\x0d\xc6\x32\x74\
+\xb9\x7d\x4e\xf9\x93\x4f\xd6\xb8\x2b\x95\x46\x22\x16\xc5\xa0\xc1\
+\x03\xf0\xc4\x63\x8f\x61\xfa\x25\x53\xd1\xd6\xbc\xd4\xa9\x13\xee\
+\xae\x34\xe1\xbc\xf8\x64\xcc\x34\x51\x50\x65\xe2\x7f\xfd\xd7\x7f\
+\x49\x7b\x32\xae\x0b\xb7\xa3\xe8\x7c\xf7\xdd\x7c\x1c\x74\xd0\x41\
+\xf8\xe1\x87\x1f\xe4\x9d\x8a\x89\x3b\xab\x52\xc9\xfb\xd0\x2b\x43\
+\x12\x01\xae\x31\x1a\x17\xfc\xc9\x4c\x67\x86\x0c\x72\xa9\x0d\xbb\
+\xff\x46\xab\xee\x9b\x96\x67\x71\x22\x90\xba\x39\xdf\x9d\x3b\x05\
+\xc3\x61\xc3\x86\x3d\x51\x57\x57\xc7\x42\xc5\xcc\x06\x5f\x75\x8f\
+\x9e\x75\xdf\xd8\x1a\x8b\xc6\x0d\x09\x24\xac\xc7\xa3\x00\x0c\x06\
+\x49\x57\x96\xc0\xa4\x49\x93\x24\x0d\x9e\x1b\x94\x02\x59\x6b\x99\
+\xb4\xee\xb0\x90\x26\xa3\xe9\xec\xfa\xdd\xdc\xd8\x4f\x29\xc2\x56\
+\x9f\xd9\x76\x49\x29\x2b\x06\xaf\x4f\xeb\x23\x0b\x86\x26\xf0\xde\
+\xe7\x87\x08\x71\x75\xf5\xd8\xd4\x68\x06\x0c\x5b\x5b\xe3\x68\x58\
+\xde\x82\x58\x82\xb5\x8d\x69\xb8\x3c\x5e\x79\x2e\xa6\xc2\x97\x07\
+\xfd\x78\xe1\xb9\xa7\xf1\x87\x1b\xaf\xc3\xb7\xdf\x7d\x2d\x56\x92\
+\x6c\x48\xa7\x0b\xb8\x79\xf6\x6c\x7d\xa1\xf9\xdd\x80\x85\xd7\x43\
+\x97\x58\x40\x3a\x07\xe4\xeb\x22\x91\x6b\x51\x11\x1c\x09\x8a\x07\
+\x1e\x78\x20\x6e\xbd\xf5\x56\x6c\xb8\xe1\x86\x99\xc2\x77\x8e\x27\
+\xe7\x85\xa5\x0e\xec\xfe\x40\x0b\x51\xb3\xeb\x0a\xb9\x09\xfb\x16\
+\x0c\xb3\x21\x84\xec\x7d\x18\xff\x35\x8d\x68\x79\x04\x3c\xac\x17\
+\x8d\x4b\xf9\x81\xb8\x60\xd3\xac\xad\x34\x71\x28\xbe\x53\x22\x9e\
+\xc4\xa4\xc9\x13\x71\xc3\x75\x37\xca\x7e\x6b\x69\x6a\x15\x85\xac\
+\x9c\xcd\xf4\x04\x08\x19\x93\xeb\xa4\x36\xa5\x60\xe8\x82\x34\x7e\
+\x4e\xc6\x8e\xb8\x38\x0d\x93\x0c\xc1\x30\x99\x32\x49\x27\x74\xf3\
+\xb5\xb6\xb6\x23\x91\x72\xc1\xe7\x27\xe9\xbb\x01\x4a\x0a\x5f\x36\
+\xdd\xe5\xf3\xc2\xe3\x96\x37\x12\xf7\x67\x32\x25\xef\x12\xf0\xfa\
+\xe0\xf1\xfb\x90\x8a\x27\x04\x64\xf9\xb9\x16\xdb\xeb\x4f\xe1\xa7\
+\xf5\x24\x51\x16\xf0\xa2\x6e\xe9\x12\x8c\x3b\x7b\x2c\x3e\x7a\x77\
+\x2e\xbc\x3e\xaf\x94\x2c\x08\xdd\xa0\xd7\x00\x8a\xd1\x39\xe8\x97\
+\x34\xf1\xbf\x54\x9a\xf4\x7e\x31\x04\x7c\x09\x24\x53\x11\x09\x1b\
+\x74\x75\xac\x0c\x88\xce\xda\x74\x00\x51\x3b\xc4\x78\xe0\x41\x52\
+\xc1\xf0\xd6\x3b\x51\x33\xd0\x80\xa1\x0c\x14\x3b\xad\xa4\xe2\xa8\
+\x66\x0b\xa7\x81\xd5\x12\xa6\x30\x2e\x57\x03\x86\x7c\x04\x7a\x6f\
+\xea\x1a\xda\xd1\xd2\x1c\x95\xd2\x23\x8e\x23\xe7\x91\x60\xc8\xbd\
+\xce\x44\x9c\x41\x83\xfb\xe3\x89\xc7\x1e\xc7\xf4\x4b\x27\xa3\xad\
+\xa9\xb6\x47\x60\x98\xaf\x84\x81\x7b\x87\xeb\xff\xf7\xbf\xff\x3d\
+\x2e\xb9\xe4\x62\x29\xd7\x51\x0f\xc2\xd7\x5f\x7f\x2b\x7b\xe8\xfb\
+\xef\xbf\x2f\x4a\xb4\xd8\x71\x45\x2a\x6b\xf4\x52\x9c\x73\xce\xb8\
+\x4c\x1b\x32\x5a\x9b\xd7\x5d\x77\x03\x2e\xba\xe8\x22\xb9\x9e\xbc\
+\x2b\x63\xc1\x3e\xe6\x41\xac\x1e\x52\x93\xa2\x5e\xcc\x39\x29\x2b\
+\xcf\xd3\x4f\x02\xe9\xa3\xf2\x7d\xb7\x53\x30\xf4\x7a\xbd\xcb\x12\
+\x89\xc4\x3a\xb2\x6f\xc8\xb8\xd0\x39\xad\x5e\x29\xcf\x54\xf4\xb9\
+\xb9\xda\x25\x27\x5d\xc1\x90\x85\xc9\x47\x1c\x71\x84\x93\x71\xe7\
+\x91\x64\x84\x29\x53\xa6\x08\x1f\xa4\x6d\x41\xaa\xa0\x14\xb7\x4d\
+\x89\x2f\xc0\xc6\xb0\x74\xb9\x2a\xbf\xa7\x14\x1c\x97\x78\xac\x91\
+\x60\x28\x42\x61\x65\x30\x64\xec\xb2\xae\xb6\x05\xa1\x08\xbb\x5c\
+\x24\x05\x0c\xcd\x06\x89\xa1\xb2\xa2\x0c\x2f\xff\xfb\x59\x5c\x34\
+\x6d\x32\x96\xd5\x31\x2e\x9b\x82\x8f\x4c\xdd\x74\x18\xf9\x0c\x43\
+\x0b\x53\xd8\x8d\xab\xce\x94\x90\x30\xd1\x42\x7a\xf9\x49\x1f\x38\
+\xba\x7d\x8d\xb0\xa0\xb2\xa2\x96\xa0\x36\xd8\x55\x86\x16\xcd\x10\
+\xe6\xdf\xf7\xdb\x6f\x3f\x3c\xf9\xe4\x93\xe2\x4a\x14\x71\xe6\xc4\
+\x53\x29\x8f\x66\xcf\x7e\x4a\xf8\x3f\x15\x0c\x4b\x9c\x96\x0e\x16\
+\x7b\x71\xdf\x35\x96\x95\x24\x65\x64\xdc\x71\xf6\x37\xcd\xe6\x30\
+\xe4\xe5\xdc\x2b\xb4\x70\x18\x5b\xd7\x52\x18\x17\x02\x24\x2b\x97\
+\x9e\x94\x4e\xdc\x9d\x5f\x50\x01\xcd\xac\xe7\x64\x12\x97\x5c\x7a\
+\x29\xae\xfc\xef\x2b\x9d\x6e\x41\xd9\x6a\xfc\x44\x34\x0a\x2f\xcd\
+\x73\x3d\xba\x00\xc5\x4e\xdf\x27\xe3\x0d\xd0\x67\x32\x67\x2a\x00\
+\xd5\xd6\xb7\xa0\xad\xb5\x5d\x5a\x2a\xb1\xf3\xbc\x89\x0b\xba\x11\
+\x4f\x25\x25\x2b\x58\x32\x43\x09\x76\x64\x28\xf2\xb8\xe1\x75\x7b\
+\xc4\x7a\x4c\xc6\x13\x88\x27\x13\xa8\x08\x96\x9b\x92\x0a\xd6\x88\
+\x92\xb9\x88\xee\x44\xe7\x77\x51\x94\xd2\x09\xa1\x39\x23\x18\x8e\
+\x3f\x77\x1c\x3e\x9b\xf7\xa1\x70\x8e\x7a\x5c\x2e\x51\x94\xe8\xbe\
+\x95\x9a\x56\x82\x60\x9a\x5c\xb6\x24\xd4\xd6\xb7\x31\xdd\x29\x52\
+\xd2\xdc\xda\xfc\x8d\x43\x20\x3c\xb8\x56\x27\x17\xfe\x3d\x9f\x0b\
+\xdb\x7c\xc1\xa1\x94\x73\xda\xa5\x79\xa5\x8f\x85\x0b\xbb\xed\xba\
+\x0f\x6e\xb9\xf5\x4e\x54\x0f\x18\xb6\x46\x83\x61\xbe\x58\xb4\x76\
+\x9a\x21\xc5\xdf\x0d\x37\x5c\x27\x73\xa9\x46\xc0\xa7\x9f\x7e\x8a\
+\x93\x4f\x3e\x19\x5f\x7d\xf5\x95\xc8\xb0\x62\xdc\xe8\xb6\x01\x70\
+\xe7\x9d\x77\x62\xdc\xb8\xb1\x32\x74\xa1\x50\x44\x42\x18\x04\x43\
+\xd6\xe2\xda\x86\x45\x31\xc9\x39\xc5\xed\xb1\xbe\x3d\xcb\xb2\x0c\
+\x6b\x81\xd4\xd0\x7c\x77\xcb\x0b\x86\xa3\x47\x8f\xde\xe2\xb1\xc7\
+\x1e\xfb\xb4\x23\xdb\xc1\xaa\x45\x43\xdb\x95\xc5\x07\xd7\x44\x18\
+\x0e\x3e\xcd\xf5\x43\x0f\xfd\x85\xb8\xec\x28\x64\xa9\xd1\x5e\x72\
+\xc9\x25\x92\x02\x4f\x00\xe3\x51\x6a\x6d\xa1\xfa\xd5\xd5\xbd\x6a\
+\x2f\x0c\xfd\x5b\xa9\xd3\xb5\xe6\x82\x61\x47\x37\x29\x63\x20\xc4\
+\xac\xda\x65\xcd\x08\x45\xd8\x0f\xce\x80\xa1\x71\xc7\xc4\x51\x55\
+\x19\xc4\x73\xcf\x3e\x85\x8b\x2f\x9e\x24\x6e\x2e\xfa\xdf\xa3\x51\
+\xc3\xca\xc2\xda\x41\x6e\x0e\xce\x83\x82\xa1\x94\x18\x24\x91\x71\
+\x2d\x06\xcb\x0c\xf3\x8e\xc9\x12\xcd\xba\xad\x35\xdb\x52\xe9\xc8\
+\xec\x20\xfd\x6e\xbb\xed\x86\x7f\xfc\xe3\x1f\x99\xf8\xaf\xb6\x41\
+\xe2\x1c\xf4\x14\x0c\x8d\x30\xcd\x2e\xfd\x62\xe6\x57\xcf\x59\x59\
+\xd8\x3a\xd6\xb6\x5c\x34\xcf\x0a\x71\x84\xb7\x87\xdc\x9c\xce\xba\
+\xf4\xf8\x18\x7b\x62\xdd\x93\x95\x55\x19\x89\x60\xd2\x94\x89\x20\
+\x25\x9b\x97\x24\xcf\xe4\xd3\x24\x5a\xd8\xd2\x5f\x2f\xaf\x09\x92\
+\x16\x30\x14\x5c\x9b\x19\xcb\x90\x59\x96\x86\x72\x4f\x7a\x68\x0a\
+\xc1\x01\xd0\xb8\x22\x24\x44\xe2\xc6\x4d\x1a\x40\x4a\x80\x1c\xf2\
+\xbb\xc6\xe5\x09\x72\xfc\x02\x5d\xbc\xb4\xe4\x08\x8a\x6c\xee\x4c\
+\xab\x31\x40\x06\x18\x07\xfc\x0c\x33\x60\xda\xe0\xa9\x83\x68\x81\
+\x32\x5a\x31\x09\xd4\xd7\x2e\xc1\xe4\x49\x17\xe2\xbd\xb9\x8c\xc3\
+\x86\xc5\xce\x24\x48\x92\xcf\x33\xfb\x7a\xea\x82\x36\xa5\x1c\xa6\
+\xf1\x04\xdd\xa9\xd9\x43\xbb\x64\x18\x30\x34\xde\x2b\x73\x64\x4b\
+\xc0\x32\x67\x4b\xf1\xbd\xa1\x93\x63\x07\x15\xba\x78\xd7\x36\x30\
+\xb4\xd7\xac\x7a\x41\x54\x3e\x33\xdc\xb2\xdd\x76\xdb\x99\x58\xad\
+\xd3\x27\x93\x9d\x64\x68\x34\x50\x1e\xf2\xef\x85\x3c\x63\x2a\x63\
+\x79\x2e\xe7\xfb\xee\xbb\xef\x96\x26\xd5\xdc\xd7\x04\x43\xca\x47\
+\xc6\xd4\xaf\xbe\xfa\x6a\xf1\xbc\xd9\x9c\xb9\xc5\xec\x9f\x82\xeb\
+\x73\x15\x9c\xa0\x6b\x24\x9d\x4e\x6e\x09\xe0\xb3\xdc\x5b\xe6\x05\
+\xc3\x9d\x76\xda\xe9\x8c\x77\xde\x79\xe7\x5e\xba\xac\xa8\xa5\x1b\
+\x36\x8c\x9e\x75\x1d\x28\xf5\x5d\x73\xc1\xd0\xb6\xec\xae\xb8\xe2\
+\x0a\x71\x01\x30\x4e\x61\xe2\x53\x51\xf1\x99\x93\x07\x50\x2d\x38\
+\x1b\x0c\xbb\x8e\xa7\x64\x9f\x4c\x17\x59\xa9\xd9\x89\x9d\xbd\xdb\
+\x1a\x07\x86\xa2\x1d\x0b\x0f\x95\x15\x7f\x64\xf6\x9f\x17\xa1\xf6\
+\x24\x96\xd6\x36\x22\x16\x35\x31\x24\x82\xa1\x89\x35\x44\xa5\x2c\
+\xe2\xe5\x97\x9e\xc1\xa5\x97\x4c\x15\x30\x8c\x46\xc3\x48\x31\x13\
+\x41\x8e\x2c\x18\x68\xe7\x0c\xe3\x36\x31\xbd\x04\x59\x17\xc9\x39\
+\xa1\x30\xe4\xdf\xed\x8d\xd3\x19\xe1\x3b\xc1\x74\x97\x5d\x76\x91\
+\xd8\x70\x45\x45\x50\xee\x62\x63\xc2\xac\x59\x1d\xdd\xa4\xa5\x2a\
+\x3e\x3a\x5f\xc5\xae\x0b\x83\x73\x16\x1d\x61\x26\x4b\x92\x74\xcd\
+\xa6\xbe\x93\x42\x43\xe2\x32\xd6\x8e\xa2\xf7\xdb\x58\x3b\x6e\x44\
+\x42\xa6\xb3\xba\x0a\x35\x53\x12\xe0\x50\x85\xb1\x44\xe5\xff\x88\
+\xba\x27\x4f\x9e\x88\x2b\x7e\xf7\x5b\x39\x87\x29\xfa\xbc\x26\xdb\
+\x00\x65\x93\x42\xba\x20\x19\x32\xb5\xed\xc5\x93\x10\x39\xe7\x0b\
+\x20\x0a\x18\x46\x04\x0c\x93\xec\xe6\xe0\x61\x8b\x24\x93\x95\x29\
+\xe4\xd9\x51\xe3\x16\xcf\x17\xb1\xa6\x65\xc7\xbf\x07\xe8\xb2\x73\
+\x9c\xe3\xcc\x7c\x16\x1a\x79\xe7\x27\xff\xce\xb9\xe7\x1a\x68\xa8\
+\x5f\x86\xf3\xcf\x1d\x8f\x8f\x3e\x24\x5b\x51\x52\xba\x4e\xb8\xa5\
+\x78\x3e\x69\x58\x79\x6c\xcb\x8f\x7d\x05\x49\x20\x2f\xf5\x19\x6c\
+\x1b\x9d\x4d\xd0\x61\x76\x76\x36\xd3\xd5\xfa\xbf\xd5\x8d\x3e\xfb\
+\xb9\x63\x4a\xae\xe5\x60\xc8\xb5\xc4\x79\xd0\xf8\x9f\xe6\x47\x50\
+\x06\x32\x21\x4b\xf7\x96\xd2\x09\x32\xdc\xd0\xdd\xe3\xae\xbb\xee\
+\xc2\x59\x67\x9d\x29\x5f\x27\x09\x06\x95\xd1\xe9\xd3\x2f\xc3\x55\
+\x57\x5d\x95\x59\xc3\x6a\x15\x6a\x5c\xbf\xbb\xf7\x5a\x55\xdf\x33\
+\x7b\x91\xae\xff\xe4\x99\x40\x72\x46\x51\x60\xb8\xde\x7a\xeb\xdd\
+\xb3\x60\xc1\x82\x33\x15\x0c\x45\xe4\xad\x5a\xc3\x70\x25\xcd\xdd\
+\xe6\x1c\x65\x4d\x18\xdd\x6d\x9c\x6c\xd5\x8e\xe8\x7a\xa3\xa0\xd6\
+\xf3\xd4\x5d\xa0\x1a\x4f\x31\x49\x34\xcc\x54\x35\x09\x0b\xc6\xda\
+\x21\x57\xa5\x76\x15\xd0\x6e\x02\xa5\x4c\xdc\xda\x00\x86\x14\xe7\
+\x8c\x83\xb0\xf5\xdb\xb2\xa5\x2b\x24\xa3\x95\xa2\x8c\x02\xd1\xd4\
+\x74\x1a\x30\x7c\xe1\xf9\xbf\xe3\xe2\x8b\x26\xa3\xa9\xa9\x51\x38\
+\x54\xf9\xad\xaa\x7e\x15\x02\x8c\x5a\xd0\x6d\xc7\x0e\x94\x96\x2b\
+\x6b\x49\x99\x05\xa4\x6e\x52\x6a\x96\x74\x45\x73\xce\xa8\x75\xea\
+\x7c\x69\x97\x89\x1d\x77\xdc\x51\xdc\xa4\x35\x35\x35\x62\x89\x2a\
+\x51\x3c\x13\x04\x66\xcd\x9a\x2d\x31\x43\xce\x15\xbf\xd7\x1b\xd9\
+\xa4\x5d\x02\xa3\x58\x49\x54\x1a\x2c\x6b\xd2\x01\xc4\xac\xd2\xc6\
+\x44\x22\xc3\x95\xc9\xb8\x0d\x13\x5e\x24\x79\xc6\xd9\x37\x5e\x17\
+\x2d\x23\xd3\xff\x4f\x84\x96\x58\x66\x2e\xb8\xbc\x2c\x9d\xf0\x20\
+\x16\x0e\x63\xd2\xb4\x29\xb8\xe1\x5a\x23\x6c\xd8\x24\x56\xeb\x4b\
+\x59\x8b\x17\x08\x50\xb1\xb0\x56\x5f\xae\x1a\x5b\x28\xf9\xca\x2a\
+\x31\xb0\x01\x5b\x2c\xf8\x14\xb0\xbc\xa1\x1d\xed\xed\x61\xb1\x04\
+\x25\x86\x49\x82\x78\xd1\x40\x4c\xbd\x23\xff\x2f\x65\x1e\xb4\x56\
+\x99\xa4\x41\xe0\x72\xdc\xa1\xfc\x9d\x6e\x53\xdb\x22\xb4\xdd\xa4\
+\xfc\x3b\xef\x51\x53\xd3\x0f\xb5\xcb\x16\xe3\xa4\x93\xc7\xe0\x93\
+\x79\xef\x23\xe0\xf7\x48\x52\x4d\x7b\xa8\x59\x32\x20\x69\x39\x26\
+\x9c\x01\xe3\x58\x0b\x18\x8b\xee\xc6\xf1\x37\x45\xf5\x54\x2c\xcc\
+\x73\x51\xb9\xc8\xa6\x92\x32\x16\xa8\xf1\x3a\x4b\xbd\x35\x4a\x14\
+\xdf\x3d\xc7\x32\xf4\xb9\x7c\x88\xa7\x81\xdd\x77\xdb\x57\xdc\xa4\
+\xfd\xfa\x0f\x5d\xa3\xdd\xa4\x7c\xa7\xac\x30\x37\x14\x7d\xb6\x32\
+\x49\x39\x48\x50\xa2\x25\xa8\xfb\x91\xb2\x90\xdf\x29\x26\xa6\x67\
+\xf7\xaa\x25\xb8\x12\xf4\x68\x19\x32\xe1\x8b\xeb\x98\x6b\x96\x56\
+\xe1\x2d\xb7\xdc\x22\x72\x57\x2d\xcd\x62\xe4\x6a\x29\x32\xb3\x2f\
+\xcf\xb5\xc6\xef\x5e\x20\x65\x7c\xc0\x5d\x6c\x29\x15\x58\xf3\x42\
+\xa1\xd0\x56\x1c\x20\xed\xc9\xb6\x3a\xc1\x90\x0f\x65\xbb\x2f\x73\
+\xfd\xdf\xb6\xb5\x61\xfb\xb0\x55\x48\xaa\xbf\xbd\xab\x81\x66\x52\
+\xcb\x65\x97\x5d\x26\x96\x26\xff\x11\x04\x39\xd1\x4c\x5b\x66\xad\
+\x4e\x77\x8e\x35\x0e\x0c\x65\x20\x35\x66\x68\xf4\xf8\xb4\xd3\x8e\
+\x27\x14\x01\x96\x2c\x5e\x8e\x68\x94\x0b\x9f\x1a\xa8\x57\x04\x13\
+\xd9\x70\xfa\x57\x57\xe2\x95\x7f\x3f\x83\x69\x53\x27\xa2\xb1\x71\
+\x39\x12\x49\xba\xf0\x0c\x53\x0d\x13\x6c\xa8\xa1\x52\xd0\x31\xad\
+\x9c\xae\x6b\xc9\x96\x74\x7b\xc5\xab\xc0\xb8\x0e\xb3\xd1\xe2\x09\
+\x93\x8e\xad\xdd\x29\xb8\x41\x59\xdb\xb7\x68\xd1\xa2\x0e\x2e\x6d\
+\x4d\xe9\x66\xaf\x47\xf2\x78\x12\x30\xc5\x1d\xeb\x14\xe3\xf3\x27\
+\x0b\xd3\x15\x0c\x4d\x06\x9d\x89\xd3\xf5\xe4\x28\x04\x86\x06\x6b\
+\xec\xcc\x5c\xa3\x65\x6a\x79\x02\x3b\x38\x98\xc3\x24\x31\x30\xed\
+\x9f\x49\x18\x6e\xaf\x0b\x65\xfe\x00\xc2\x21\xba\x01\x9d\x1a\x3c\
+\xf9\x69\x80\x46\x0e\x5e\xe7\xff\x98\x59\xa6\x4c\x99\x84\x6b\xaf\
+\xfe\x9d\xfc\x49\xdc\xa4\x1d\x28\xdb\x4c\x13\xe8\x7c\x47\x31\x65\
+\xbf\x9a\x40\x23\x00\xa6\x65\x0f\xcc\x83\xa1\xe7\x33\x09\xc4\xe3\
+\x69\x01\x43\x26\xcd\x98\x84\x1e\x7d\x34\x93\x89\xa8\x44\x04\x3e\
+\x6a\xd7\x6c\x73\xe4\x58\x84\xfc\x99\xa6\xb6\x1d\x33\x05\xf0\xfa\
+\xf7\x5c\xd2\xc0\x30\xeb\xef\x7c\x1e\xd4\xd7\x2d\xc3\x84\x09\xe7\
+\xe1\xa3\x0f\xde\x83\xd7\x93\x46\x22\x1e\x91\x35\xa6\x87\x87\xed\
+\x99\xc4\x0a\xa5\xeb\xd4\x89\xd1\x0a\xca\xd2\xcd\x2c\x05\x7f\xce\
+\x30\x2b\x18\xb2\x93\x06\x81\x5b\x93\xc3\xb2\xf1\x5d\x19\x5a\x8d\
+\x5d\x3a\x59\xa4\xc6\x05\x9d\xc2\xda\x06\x86\x2a\xd7\x6c\x59\xa7\
+\xd9\xa5\x6a\x01\xdb\x7b\xa4\xd4\x7d\x91\xeb\xea\xa4\x3c\x24\x01\
+\x85\x96\x39\x11\x0b\x18\x87\x5c\xbc\x78\xf1\x4a\x4b\xb0\x98\x3a\
+\xd8\x9e\xec\xcd\xde\xfc\xae\xf3\x9e\x1f\x03\xa9\xad\x73\xaf\xbb\
+\x92\x9b\xf4\xac\xb3\xce\xaa\xbe\xfb\xee\xbb\x9b\x14\x80\x44\x04\
+\x48\xec\xa8\x2b\xd5\xb3\xe7\x8f\x9b\x2b\x8c\x72\xb3\x03\x75\xb2\
+\x94\x87\x94\x13\xc0\xe7\xa2\x50\x55\x4d\x28\xd7\x5c\xb7\x8b\xef\
+\x0b\xb9\xc4\xd8\x98\x93\x74\x5c\x14\xe4\x9a\x91\x45\x5f\xf9\x2f\
+\x7f\xf9\x4b\xbc\xf6\xda\x6b\x45\x05\xa0\x57\x1a\xdc\x95\x18\x68\
+\xd8\x47\x6d\x75\x66\x93\x2a\x18\x1a\x57\xa9\x99\x51\xd3\x9b\x8e\
+\x5e\xf0\xc5\x8b\x9a\x10\x0e\x53\xc8\x78\x85\x72\x8a\x73\xc0\x04\
+\x9a\x01\xfd\x2b\xf0\xf2\x8b\xff\xc4\xd4\x29\x17\xa0\xa1\xa1\x41\
+\xb2\x48\x29\xd8\xf4\xf3\xad\xb7\xde\x5a\xea\x9c\x58\x16\x51\x5d\
+\xdd\x5f\x40\x90\x49\x4d\x9a\x48\x23\xe5\x16\xfd\x2a\xc4\x92\x53\
+\x17\x0e\xff\xc6\xdf\x99\xb5\xc6\x56\x4d\x14\xc0\x3a\xe7\x04\xb6\
+\x7d\xf6\xd9\x47\x40\x8f\x20\xcb\xb5\x47\x8b\x50\x85\x3e\xff\xce\
+\x04\x1a\xad\x33\xec\xf9\xea\x2b\x74\x05\x27\x76\x65\x9f\xc6\x92\
+\x01\x17\x4b\x0d\x98\x3f\xe9\xc5\x80\xfe\x43\x84\x5a\x8d\xe1\x04\
+\x8e\x19\x79\x33\xfb\xf5\x2b\xc7\xc8\xf5\x86\x63\xc4\xba\xeb\x20\
+\xd2\x16\x32\xe0\xe9\xc4\x62\xd9\xd9\xbd\xa5\x2d\x94\xc9\x7c\xa6\
+\x92\xb0\xe1\x4f\xd6\xc7\x81\xfb\xef\x07\x9f\xdf\x8d\xf2\x20\x4b\
+\x0d\xa2\x68\x58\x5e\x67\xce\x71\x12\x5a\x74\x1d\x2b\xab\x8d\xd4\
+\x01\xb2\x54\xa0\x50\x8b\x27\xe9\xe5\x97\x74\xea\x1e\x4d\x69\x05\
+\xe7\x9d\x18\x6e\xae\x91\x46\x7b\x9b\x29\x8f\x90\x3d\xc6\xfa\x1a\
+\xb2\x6d\x3a\x2d\xac\x48\x31\xc6\x79\x27\x90\xd0\x26\x14\x1e\x4e\
+\x02\x17\xaf\xc3\xae\x11\x5e\xb6\x83\x37\xc8\x23\x58\x6b\xfd\x14\
+\x59\xe2\xf5\xa0\x3d\xdc\x2e\xb1\xbf\x87\x1f\xfc\x33\xea\x6a\x97\
+\x88\xc2\x40\x27\x6b\xc0\x6f\x88\x31\xb8\x5f\x2b\xaa\x2a\xa5\x93\
+\x05\x2f\x8b\x2c\x17\x00\x00\x20\x00\x49\x44\x41\x54\xbd\x13\xcc\
+\x6c\x15\xf7\xa8\x8b\x31\x68\x82\xb0\x5b\x12\x78\x4c\xbd\x2a\xd7\
+\x69\x5a\xe2\x8d\x5e\x17\xf0\xfd\x0f\xdf\x75\x20\xe8\xd6\x84\x27\
+\x05\x43\x79\x28\x26\xe1\xad\xe5\x60\xc8\xb1\xd4\x2c\x52\xb5\xce\
+\x34\xd3\x94\xef\xcc\xb9\xd4\x8c\x6c\xa5\x07\x34\x61\xae\x6c\xc1\
+\x7f\xbe\xd5\xae\xf2\x95\xeb\x90\xfb\x97\xd7\xca\xe5\x36\xd5\x42\
+\x7f\x9e\x4b\xe5\x68\x6d\x02\xc1\x8e\x5b\x57\x4a\xa1\x58\xe4\xda\
+\xdc\xe1\xef\xb9\x03\xb3\xf5\xd6\x5b\xef\xff\xd5\x57\x5f\xbd\x40\
+\x90\xe1\x20\x52\x78\x19\x57\x61\x47\x62\xe1\x42\xe2\x63\x4d\xfd\
+\xdc\x8e\x45\xda\x02\x84\x01\x68\x32\x90\xd0\x2a\x64\xea\x3b\x6b\
+\xe4\xb8\xc8\x58\x23\x47\x30\x54\x61\xad\x35\x5e\xc5\xbc\xdf\x1a\
+\x65\x19\x66\x1e\x38\x1b\x37\x34\x6e\x3f\x6a\xe1\x74\x85\xd1\x32\
+\x6c\x14\xcb\x50\x34\x70\xa7\x65\x17\x05\x7b\xff\x9a\x72\xbc\xfa\
+\xd2\xb3\x98\x3c\xe9\x3c\xd4\xd5\xd7\xc1\x23\x65\x15\x71\x59\x1b\
+\x14\x4a\xac\xf9\x24\x73\x8a\x96\xa7\x18\x45\x4a\x8b\x9f\xb3\x6d\
+\x8a\xa4\x3f\x5d\x9c\x40\xca\x78\x24\x84\x10\x9b\xb5\x75\x6f\xbf\
+\xcd\xd6\x4f\xc6\x2d\x27\x56\x49\x22\x81\x03\x0e\x38\x40\xd8\x67\
+\x08\x86\xda\xe6\x48\x59\x5b\x9e\x7a\xea\xef\xe2\xc2\x59\x75\x60\
+\x28\x2a\x21\xbc\x3e\x12\x3c\x9b\x3a\xcb\x04\xc1\x22\xcd\x77\xf4\
+\x61\xdb\xad\x77\xc2\x76\xdb\xee\x8a\xb2\x40\x85\xf4\xe4\xa3\xa5\
+\x93\x4e\xc7\xd1\xaf\x3a\x88\xe3\x4f\x38\x06\x3f\xdb\x6a\x7d\xc1\
+\x09\x86\xff\x04\xd3\xd2\x40\x24\x06\x2c\x5e\x5a\x2b\x6d\x7f\x58\
+\x98\xcf\xcc\xd8\x7b\x67\xdc\x85\x7f\xbf\xf8\x3c\x62\x91\x36\x24\
+\xe3\x6c\x8a\x1c\x67\x35\x83\x71\x53\xc9\xf6\xcb\xf2\xa3\x16\x5a\
+\x7f\x2b\x95\x9a\x74\xe6\x56\xcd\xb8\x10\x73\x92\x56\xe4\x06\xd6\
+\x9e\x17\x8a\xcf\x7c\x51\xc3\x5c\x1b\xd0\xfc\x6e\xd6\x96\x75\xbe\
+\x12\xcf\x3a\x16\x1c\xdf\x8b\x7f\x62\xcd\x9f\xe9\xd9\x49\x8a\xbf\
+\x0a\x9c\x7b\xde\x04\x1c\x7c\xf0\x2f\x4c\xab\x24\x17\x07\x8c\x27\
+\x7a\xe0\xf7\x05\x04\x50\x59\xc2\xc1\x79\xe0\xba\x33\xdd\xee\xd3\
+\xa8\xaf\xad\xc5\x6f\x7f\x37\x1d\x5f\x7f\xfd\xa5\x98\xb9\xf1\x58\
+\x44\x2a\x33\x78\x6d\x36\x01\xa6\x10\x67\xcd\xa6\x9f\x6c\x54\x91\
+\xa8\x00\x79\xb9\xbf\x1c\xe1\x58\x02\xbb\xef\xbe\x2f\xfe\x74\xfb\
+\xdd\x08\x94\xf7\x47\x24\x66\xce\x61\x1c\x33\x1a\x69\x47\x4d\x95\
+\x1f\xc3\x86\xd4\xc0\xc7\xc7\x40\x0c\x2e\x37\x5d\xb4\x1e\x24\x69\
+\x09\xc7\x81\xfa\xc6\x76\x34\x37\x45\xe0\x66\x48\xc1\x89\x29\xd3\
+\x4a\xe5\x7b\x85\xdb\x43\x58\x67\xe8\x20\xcc\x99\x35\x1b\x17\x4d\
+\x9b\x80\xd6\x15\xcb\xba\x2c\xad\x50\x30\xca\xcd\x75\xe8\xac\x64\
+\x48\xbd\x5e\x6a\x1c\x94\x52\x5a\x94\x6f\xed\xe8\x7d\xf9\x1c\xea\
+\x49\xd3\x10\x84\x92\x5d\xe4\x66\xa5\xda\xb2\xb4\xa7\x9e\x99\x42\
+\xeb\xb9\xf7\x3f\x77\x1f\x00\x24\x5e\xec\x12\x0c\x37\xd8\x60\x83\
+\x8b\x16\x2e\x5c\x78\x8d\xa6\xbb\x6b\xf1\x79\x0f\xbd\x50\xbd\xff\
+\x2e\xdd\xbc\x62\x2e\x18\xea\x22\xa2\x4b\xe0\xa3\x8f\x3e\xca\xb0\
+\x6f\x50\x93\xa2\xbf\x7c\xb7\xdd\xf6\x10\xa2\xe9\x1f\x1b\x18\x1a\
+\xbb\x90\xe2\xcd\xa4\xda\x93\x08\x7c\xf1\x92\x26\xc4\x04\x0c\x29\
+\x80\x4c\xc2\xc8\xca\x60\x58\x6b\xb4\xeb\x94\x89\x69\x31\xce\x33\
+\x6a\xd4\x28\x3c\xf1\xc4\x13\xa2\x29\x6a\xcc\x96\xb1\x42\x1d\x6b\
+\x9b\x84\x5b\xe3\x0f\x14\x18\xcc\x02\xe6\x77\x09\x86\x6a\xdd\x17\
+\x03\x86\x73\xe6\x3c\x25\x60\xc8\x8c\xb9\x55\x75\x88\x20\x8d\x47\
+\xb2\xc8\x2e\x3c\x98\x6c\xdd\x13\xc4\x41\xa3\x0e\xc7\xd6\x5b\xed\
+\x08\x8f\xab\x1c\xa9\xa4\x71\xd9\xa6\x11\x45\x59\xb9\x07\xa3\x8f\
+\x39\x1c\x3f\xdb\x6a\x80\x24\x86\xb0\x34\x4b\x63\x58\x8c\xd1\x2e\
+\x5d\xda\x80\xda\xba\xe5\xe2\x3e\x66\x6c\xf4\x8a\x2b\x2e\xc7\xe3\
+\x33\xff\x66\x0a\xbc\x41\x37\xa9\x0b\xe5\x41\x9f\x80\xa5\xc6\xae\
+\xf5\x7d\xf3\x79\x4e\x3a\x1b\x0b\xce\xb5\xf1\x76\x18\xb7\x63\x87\
+\x7f\xa2\x85\x90\x72\xd3\x01\x3e\x27\x8b\xd4\x94\x23\x9a\xbf\xa9\
+\x67\x52\xc0\xb0\x13\xa2\x78\xba\xc3\x6d\x82\x78\x9b\x38\x3e\xed\
+\x32\x71\xdd\x14\x0b\xd2\x25\x29\x47\x02\x92\xe6\x71\x79\x49\xa7\
+\x5c\xa5\x5f\x65\x7f\xfc\xf7\x95\xd7\x62\xf4\x31\x63\x84\xfe\x8f\
+\x45\xf8\x6e\x4f\x40\xdc\xb2\xdc\x8f\x04\x1a\xd3\x01\x84\xa9\x34\
+\xf4\x16\x98\x92\x9d\xe5\x0d\x75\x38\xed\xd4\x93\xf0\xd9\x27\xf3\
+\xa4\xc4\x87\x5e\x04\xf2\x00\x87\x42\xad\x1d\x86\xc4\xcb\x24\x1f\
+\x06\x43\x53\x2e\x94\x07\xca\xd1\x1e\x8d\x61\xc7\x1d\x76\xc7\xed\
+\x77\xcd\xc0\xc0\x21\x23\xd1\x1e\x66\x01\x3d\x1b\xfb\x46\xd0\xde\
+\xd6\x8c\xfe\xfd\x02\x58\x7f\xdd\xa1\x28\x2b\xa3\x25\xd1\xb7\x60\
+\x68\x3f\xa8\xc6\xb6\xb8\x2e\x72\x5d\xa0\x4a\x78\x61\x7f\xd6\x97\
+\x7b\x80\x7b\xd8\xd4\x1b\x77\x24\x2e\x51\x45\xbf\xa7\x20\xdc\x97\
+\xcf\x5e\xe0\xda\x17\x03\xa9\x6b\xbb\x04\xc3\xca\xca\xca\x47\x43\
+\xa1\xd0\x31\xdc\xd0\xca\xba\xcf\x17\xef\x6b\x37\xe9\xaa\x1c\x14\
+\x1b\x10\xf5\xbe\xdb\x6c\xb3\x0d\xde\x7f\xff\xdd\x4c\xad\x8e\x82\
+\xe1\x9e\x7b\xee\x2d\x74\x5c\x6a\x11\xae\xfd\x96\x21\xdf\x38\xe1\
+\x38\x49\x29\xde\x0c\x39\x38\x99\x66\x96\x2c\x36\x60\x48\x80\x54\
+\xfa\xbd\x78\x32\x86\x9a\xea\x72\xbc\xe6\x58\x86\xf5\xf5\x75\xa6\
+\xfe\x30\x49\xa2\x69\x53\x7a\x41\x40\x9b\x35\xfb\x09\x63\x19\x92\
+\xb4\x58\x12\x90\x4c\x9c\xcf\xed\x50\xa7\x50\xe0\xa9\xbc\x55\xb7\
+\x67\x7b\x7b\x48\x58\x32\xa8\x6c\xe4\xc6\x84\xf3\x59\x86\x5a\x4a\
+\xc3\x6c\x52\x82\x21\x93\x6f\x72\x63\x1d\xbd\xbd\x8e\x32\x9b\x5e\
+\x8a\xde\xcd\xd5\xdd\xb4\x4c\x52\x1e\x69\x31\x94\x8c\xf9\xb0\xe7\
+\x1e\x87\x60\xb7\x5d\x0e\x40\x2a\xe9\x13\xde\x56\xa9\xff\x72\xc5\
+\xe0\xf5\x25\x71\xf4\x31\xbf\xc2\xb6\xdb\xd4\x98\x0a\x01\x7a\xea\
+\x78\x19\xf6\x6e\x8c\x03\x4b\x96\xac\xc0\x92\xa5\xf5\x22\x68\x08\
+\x86\xbf\xfd\xed\x65\x78\x7a\xce\x93\x82\x41\x01\x9f\x0b\xd1\x58\
+\xc8\x01\x46\xb2\x00\xd1\x75\x6d\xee\x9f\x2b\x80\x34\x3e\xd4\xf9\
+\xbb\x3b\x6e\x54\x97\x49\x48\xc9\xae\x65\x81\x3a\x87\xb9\xc4\xb6\
+\x0c\x9d\x2b\x39\xc0\x98\xb9\xae\xd3\x9b\xb0\x98\xae\x28\x2b\x75\
+\x51\xc9\xcd\xf2\x74\x40\x59\x54\x31\x97\x47\x5a\x7e\xf9\x7d\x41\
+\x5c\xfe\xfb\xab\x70\xd4\xd1\x63\xb0\x78\x69\x1d\x62\xd1\x14\x82\
+\xe5\xfd\xa4\xd8\x5f\xe2\xa7\xee\xb4\x53\xa3\x6a\x4a\x2d\x08\x7a\
+\x3e\xbf\x0b\xcb\x97\xd7\x61\xfc\xd9\xe3\xf0\xe9\x47\x1f\x88\x7b\
+\x9a\xe8\x1d\xf0\x93\x36\x2e\xe4\x58\x73\xe6\x66\xd2\xad\x22\xc1\
+\x12\x0d\x37\x82\xbe\x20\xc2\xf1\x84\x24\xd0\xdc\x71\xf7\x7d\xf0\
+\xf8\xab\x10\x4b\x24\x11\x28\x2b\x13\xb6\xa0\x70\xa8\x55\x2c\xc3\
+\xf5\x46\x0c\x30\x16\x6c\x1f\x83\xa1\xbd\x8e\x73\xd7\xb4\x2a\x8a\
+\x1a\x3b\xe7\xe7\x2a\x9f\x75\x2d\x14\x53\x47\xd8\xd5\xde\x60\x48\
+\x43\x98\x85\x1c\xcf\x87\x1d\x7f\xe4\xff\xd5\xcd\xfa\x23\x00\x41\
+\x1d\x86\x99\x40\xea\xd8\x2e\xc1\x10\xc0\x57\x3e\x9f\x6f\x13\x2d\
+\x72\x67\xbc\xc2\x0c\x4c\xde\x2a\x8c\xde\x96\x3d\xab\xe4\x7a\x0a\
+\x86\xb6\x50\x59\x7f\xfd\xf5\x71\xcf\x3d\xf7\xa0\x7f\xff\xfe\x12\
+\x37\xa4\xe6\xc5\x31\x60\xe1\xea\xbc\x79\xf3\x0a\xb6\xf0\xc9\xf7\
+\xe0\x6b\x94\x9b\x54\xb3\xea\xe4\x41\x09\x86\xe6\xc8\x05\xc3\x48\
+\xcc\x74\x32\xcf\x82\x61\x02\x35\xd5\x41\xbc\xf6\xd2\x33\x98\x32\
+\xf9\x7c\x10\x0c\xa5\x2e\xcc\xe9\x74\x9f\x48\xc4\x71\xc0\x01\xfb\
+\x63\xf6\x9c\x27\x4d\x8b\x9e\x1c\x30\x54\xa6\x0a\x25\xa3\xe6\x3d\
+\x09\x86\xb4\x54\xe8\x26\x65\x89\x0c\xdd\xd0\xc5\x58\x86\x0a\x86\
+\x4f\x3e\x39\x5b\xc0\x50\x3b\x59\xf4\x95\x76\x9a\x05\x42\x8d\xb5\
+\xa6\xe1\xf1\xbb\x91\x24\x4b\x73\x1a\x08\x04\xab\x11\x0d\x79\xb0\
+\xc7\xee\x87\x60\xd7\x9d\x0f\x40\x32\xee\x47\x2a\xc9\xee\xed\xa4\
+\x33\x63\xe7\x8e\x18\x8e\x39\xee\x57\xd8\x6e\xfb\xc1\x10\xc3\xcc\
+\x25\xc4\x2d\x92\x8c\x19\x4b\x00\x4b\x96\xb6\x62\xf1\xa2\x65\x12\
+\x5f\x65\x9c\xe7\xca\x2b\xaf\xc0\xd3\x4f\xcd\x06\x5c\x74\x8f\x52\
+\xa1\x60\x23\x5c\x66\xf6\xba\xa4\x0f\x66\xaf\x1f\xb2\xa5\x33\x08\
+\xeb\x20\x6d\x17\xe1\x90\x12\xc0\x30\xd7\x82\x34\x2e\x46\xba\x98\
+\x8d\xc7\x40\xea\x10\x49\x38\xed\xa6\x37\xc1\x2f\xf4\x7d\x2c\xeb\
+\xb8\xea\xca\x1b\x70\xe6\x99\x67\xa3\x71\x45\xbb\xb0\xcf\xf8\xcb\
+\x4c\x0c\xcb\xe3\xcb\x26\x6c\xc9\x9a\x12\x30\x24\xd1\x81\x01\xc3\
+\x53\x4f\x3e\x11\x5f\x7d\xf9\x05\x3c\x9e\x34\x92\x31\x8e\x15\x09\
+\x21\xd8\x97\x33\x80\x76\x66\x9d\x07\xfd\x88\x93\x38\x23\x45\x07\
+\xae\x1b\x15\x81\x0a\xb1\x0c\xf7\xdc\x63\x7f\xdc\x78\xf3\xad\xa8\
+\xaa\x59\x27\xe3\x26\x65\xa9\x47\xa8\xbd\x05\xfd\x2a\xbc\x18\x36\
+\x64\x00\x7c\x5e\x5e\x2b\xd5\xa7\x6e\x52\x99\x89\x4c\xc7\x16\x53\
+\x8b\xab\x72\xca\x8e\xf9\x19\x05\x93\x4a\x28\xdf\xbf\xe7\x89\x63\
+\xba\xa6\xec\x90\x51\xee\x7e\xd2\x3d\xac\x20\x9c\xeb\x12\xed\xcd\
+\xe7\xe8\xf5\x35\xde\xf9\x05\xbf\x06\x52\x9b\x76\x0a\x86\x87\x1f\
+\x7e\x78\xcd\xec\xd9\xb3\x57\x70\x01\x29\x0d\x5b\x36\xf0\xfa\xe3\
+\x88\x19\xea\xa2\xd3\x41\xd0\x89\x67\xb0\x58\xb3\xa7\x34\x73\x8e\
+\xf1\x43\x66\x50\x69\xda\x7f\x67\x56\x61\x67\xd6\xc9\x9a\x08\x86\
+\x06\x04\x4d\x6a\x76\xe7\x60\xe8\x15\x8a\x29\x26\x2a\x50\x5b\xb4\
+\xc1\xb0\xae\xae\x36\xc3\x3a\x43\x21\x2d\xf1\xbd\x51\xfb\x08\x45\
+\x9a\x01\x43\x13\x2b\x34\xae\xd1\x2c\xdb\x89\x02\xa0\xba\xe8\xb4\
+\xb3\x3d\x63\x86\x6c\xfe\x5b\x08\x0c\xcd\x35\x0d\x88\x3e\xfe\xf8\
+\x93\x02\x86\x5a\x50\xdc\xdb\xf1\x0a\x5b\x30\xf0\xbe\x12\x45\xf5\
+\xb9\x91\x24\x81\x97\xc4\xf0\x0c\x18\x06\x83\x35\x08\xb7\x79\xb0\
+\xd7\x1e\x04\xc3\x51\xa6\xcb\x02\x19\x5c\x58\x73\x98\x6c\x43\x1a\
+\x21\x8c\x39\xe1\x70\x6c\xb7\xfd\x70\x03\x86\x48\x09\x6d\x97\xc4\
+\xa4\x69\x19\x3a\x60\x18\x8a\x24\x24\x56\x7d\xdd\xf5\xd7\x60\xce\
+\x93\x4f\x08\x17\xa7\x99\x23\xba\x4b\x4d\x3d\xa7\x71\x63\x66\x15\
+\xd2\x95\x14\x00\x3b\xa5\x34\x87\x50\x80\x0f\xab\x4d\x6e\x75\xfd\
+\xe7\x7a\x47\x3a\xf3\xfc\x64\x92\x37\x9d\xe7\xcf\x66\xd4\x76\x8c\
+\x15\x9a\x16\x6f\x7c\xd6\xec\xdf\xb3\xbf\x3b\xd6\xac\xf3\x8c\xf2\
+\x2c\xf2\x7f\x13\x53\x64\x82\x4c\xa0\x2c\x28\x96\xe0\xe5\xbf\xbf\
+\x12\xa7\x9c\x72\x06\x1a\x9b\x5a\xa5\x69\xae\xbf\xac\x12\xad\x6d\
+\x6d\x48\xa4\x0c\x79\xbb\x30\x42\x05\xbc\xd2\x45\x42\xfa\x6e\xba\
+\xdd\xa8\x5f\x5e\x8b\xb3\xce\x3c\x15\x5f\x7e\xfa\x09\xfc\x52\x0a\
+\x10\x47\x2a\x11\x43\x3a\x95\x04\x5d\xa3\x2c\x53\x91\x2c\x1b\x32\
+\xc7\xa7\x21\x3c\xa8\x7e\x8f\x5f\xc0\x90\x96\xe1\x95\xd7\xdc\x80\
+\xe1\x23\x37\x46\x5b\x28\x2c\xd6\x23\xc1\x30\x1e\x0b\x63\x60\x4d\
+\x10\xeb\x0e\xab\x59\x25\x96\x21\xe7\x45\x49\x27\xb8\x17\x68\x84\
+\x50\x31\x67\x28\x80\x73\x4d\x2f\x1d\x15\x26\xc6\xc9\x35\x71\xa5\
+\xb7\xea\xa1\x6d\x40\xb0\x99\x6e\xd4\x45\xaa\xa4\x18\xba\x2f\x7a\
+\x7b\xbf\xad\x0a\x00\xcc\x2f\xa3\x53\xfd\x01\x64\x62\x2d\x1d\xcc\
+\xbd\x5d\x77\xdd\x75\xef\x37\xdf\x7c\xf3\xe5\xdc\x41\x36\xc8\xbf\
+\x2a\x1e\x79\xd5\xdc\xa3\x18\x53\x3f\xb7\x76\xad\xb3\xef\x74\x75\
+\xad\x35\x17\x0c\xb3\x85\xf2\x2b\x59\x86\x51\x93\x54\x23\x60\xc8\
+\x98\xa1\xb8\x49\x83\x78\xfd\x65\x27\x81\xa6\xae\x56\x2c\x43\xc6\
+\x12\x0d\xeb\x4c\x2a\x03\x86\x5c\x37\xc2\x9a\x22\x47\xd6\xed\xa6\
+\xee\x1d\x01\x96\x2c\xcb\x98\x14\x79\x6b\xcc\xb0\x90\x9b\xd4\x06\
+\xc3\xc7\x1e\x7b\x42\xda\xd3\x30\x8e\xa6\xda\x6a\x6f\xad\x9c\x5c\
+\x20\x94\xe7\xca\xb8\x26\xb3\xae\x52\xb9\x5f\x9a\xee\xd0\x2a\xec\
+\xbe\xeb\x81\xd8\x6e\xeb\x3d\xe1\x76\x05\x25\xc3\x94\xb4\x6c\xc9\
+\x74\x1b\xbc\xfe\x18\x8e\x1d\x73\x28\xb6\xdd\xee\x27\x20\x79\x99\
+\x49\x2c\xf1\xca\xff\x48\xd7\xb6\x74\x59\x3b\x16\x2f\x5d\x2e\x20\
+\xc0\xf2\x14\xb2\xcf\xcc\x79\xe2\xd1\x0c\x08\xfa\xfd\x6c\x9e\x6c\
+\x18\x41\x18\xea\xea\xd9\x61\x31\xe5\xe4\xbd\x50\x21\x65\xb7\x67\
+\x02\x20\x18\xec\x67\xe2\x4e\xa9\x34\x7c\x7e\x8f\x80\x59\x2c\xce\
+\x2c\x59\x3a\xe5\xc9\x13\x4a\xd7\x70\x10\xbf\xbf\xe2\x2a\x8c\x3e\
+\x6e\x0c\x9a\x56\xb4\x31\x05\x15\xfe\xb2\x72\xb1\xd8\x08\x6a\x4c\
+\xa0\x49\x27\x08\x70\x86\xf9\x86\x09\x46\xc4\xd5\xba\xfa\xa5\x98\
+\x3a\x69\x22\xde\x9f\xfb\x96\xa8\x2e\xbe\x32\x3f\x92\x31\xf2\x13\
+\xc7\xc5\xed\x49\x8b\x34\x16\x33\x3d\x36\x59\x27\x49\xcc\x4e\x25\
+\x53\x42\x02\x7e\xc8\xc1\x87\xe1\xea\xeb\xfe\x20\x09\x34\x52\xfe\
+\xe1\xf7\x0b\x18\x32\x81\x86\xdc\xa4\xeb\x0c\xaa\x81\xc7\x4d\x00\
+\x36\x0a\x49\x5f\x25\xd0\x28\x08\x69\x68\x8a\xb5\xd4\xa3\x47\x8f\
+\x96\xb9\xe7\xda\x20\x38\xf2\x1c\xb2\xca\xb0\xe6\xd9\xb0\x3e\x19\
+\x96\x28\xae\xd1\x62\x6a\x09\x0b\xad\x1f\x2d\xea\x57\xaf\x18\xaf\
+\xad\xf7\xb0\xaf\xaf\x71\x4b\xcd\x64\x2e\x74\xdd\x35\xe1\xf3\xfc\
+\x72\x3a\xb5\x0f\x80\x57\xf4\xf9\x3a\x80\xe1\x46\x1b\x6d\x74\xde\
+\xb7\xdf\x7e\xfb\x27\xbb\x56\x2f\xfb\xff\x42\x9b\x65\x4d\x78\xe5\
+\xee\x3f\x83\xb6\x7d\x52\xed\x53\xc1\x50\xb5\x32\x9b\x7e\xc8\xbe\
+\x8b\x6a\xd8\xf9\xb4\xa5\x35\x09\x0c\x3b\x16\xc6\x50\x10\x68\xa6\
+\x9f\x99\x57\x8d\x19\x46\xba\x00\xc3\x49\x13\xcf\x45\x5d\x7d\xad\
+\x58\x67\xd4\xbe\xa5\x9e\x2e\x95\xc6\xa8\x03\xf7\x93\x8e\xf4\x5a\
+\xe4\x2b\x63\xe2\xb0\xad\xd0\xe2\x30\x9d\xdb\x4d\x0c\x51\x13\xb3\
+\x38\x5e\xcc\xa0\xfc\xf5\xaf\x7f\x2d\x75\x9c\x9a\x10\xd0\x59\x02\
+\x8d\x1a\x3e\x34\x90\x66\xce\x7c\x5c\xc0\x50\xcb\x6a\x8a\xa1\x9a\
+\x2a\xb4\x32\x72\x41\x50\x2d\x28\xc1\x3c\x87\x2c\x66\x9d\x11\x43\
+\x51\x5b\xb7\x38\x63\x65\xf9\x7d\x95\xa8\xae\x1a\x86\xf5\x47\x6e\
+\x81\xbd\xf7\xfc\x05\xbc\x9e\x0a\x29\xb3\x60\x7b\x21\x97\x27\x04\
+\x7f\x59\x02\x87\x1d\xb1\x1f\x36\xd9\x6c\x3d\x78\xd2\x49\x93\x84\
+\x25\x7c\x9a\x5e\xd0\x93\xb7\x74\x59\x33\x96\xd5\xad\x90\xa4\x1b\
+\x2a\x0f\x37\xdd\x74\x13\x5e\x7c\xfe\x19\xc9\x44\x4d\x44\xdb\x10\
+\x8e\xb4\x1a\xba\x32\xba\x12\x7d\x6c\x9d\xd0\x79\x36\xa9\x5d\x5e\
+\x61\xaf\x3b\xf3\x1e\x52\x54\xd1\x41\x45\xe9\x2c\x01\x47\x2d\xc1\
+\xdc\xf1\x62\x12\x0c\x13\x60\x0a\x1d\xf9\x5c\xd6\x0c\xb1\x24\xa3\
+\x5a\x26\x99\x42\x99\xdf\x2f\xa4\xdd\x4c\xbe\x52\x77\x5f\x5b\xa8\
+\x1d\x35\xd5\x03\x70\xe9\x7f\x5d\x86\x5f\x1d\x76\xb8\x64\x73\x7b\
+\x7d\x41\xa4\x5d\x6e\x84\x23\x31\xf8\x48\x3a\xe0\x36\x7c\xb7\x54\
+\xc6\x98\x55\xca\x71\x62\x66\x73\x5d\xdd\x52\x5c\x72\xf1\x34\x7c\
+\xf0\xf6\x9b\xf0\x05\x02\x92\x61\x6a\x62\x5f\x90\xae\xf3\x2d\x2d\
+\x2b\x00\x32\xdd\x30\xec\x28\xf5\x8b\x12\x15\x97\x04\xa8\x03\x46\
+\xfd\x02\xd3\x2e\xb9\x0c\x9b\x6d\xb1\x0d\x22\x31\x76\x07\x61\x8d\
+\x65\x18\xcd\x4d\x0d\x02\x86\xeb\xaf\xbb\x8e\x74\x6d\xe9\xeb\x98\
+\xa1\x8e\xab\x26\xea\x1d\x7c\xf0\xc1\x78\xf8\xe1\x87\x65\x4f\x55\
+\x56\x96\xa3\xb1\xb1\x49\xac\xc2\x23\x8f\x3c\x52\xbc\x55\xbd\xb1\
+\xe6\x0b\xcd\xa5\x5d\xe4\x2f\xb5\xc2\xf1\x78\x26\x76\x68\xbc\x3e\
+\xa6\x7f\xe2\xda\x70\xd8\x71\x57\xeb\x79\xcf\x07\x52\xb7\xe6\x05\
+\xc3\xea\xea\xea\xbb\x9a\x9b\x9b\xcf\x52\xed\x84\x0b\x2a\xdb\x0b\
+\xeb\xc7\x0d\x86\x1c\x10\xdb\x45\xc0\xdf\x6d\xbe\x52\x11\x8a\x39\
+\xd5\xcd\xb6\xd0\xf9\xff\x04\x86\xdc\x07\x14\x64\xa6\xb8\x3c\x8d\
+\x03\x0f\xdc\x0f\xcc\xf0\x54\x2d\x95\xe3\x42\x01\x4e\xd1\x43\x8d\
+\x36\x14\x8e\xa2\xbe\xbe\x21\xe3\xe6\x93\x62\xe1\x58\x5c\x6a\x16\
+\x8f\x3d\xf6\x58\x2c\x5c\xb8\x40\x04\x98\x29\xad\x70\x5c\xaf\x52\
+\x5a\xf1\x44\xa6\xb4\x42\xf3\x2f\xa8\xdd\xcf\x7c\xf4\x31\x71\x93\
+\x2a\x18\x26\x98\x95\xd2\xc3\x23\x9f\x45\x68\x5f\xf2\xa0\x83\x7f\
+\x81\xe3\x4e\x38\x1e\x15\x41\x1f\xbc\x74\xd3\xa5\xd2\x88\x27\x5d\
+\x68\xac\x6b\xc5\xd7\xdf\x2c\xc2\xb3\x4f\xbf\x04\xb8\x03\x48\xb1\
+\x0d\x91\x94\x44\x44\x00\x6f\x0c\xa3\x0e\xd8\x0d\xc3\x86\x0f\x44\
+\x3c\x16\x15\xc1\x46\xb0\x84\x2b\x80\x70\x34\x25\xd9\xa4\x0d\x0d\
+\xcd\xd2\x36\x8b\x16\x3a\x7b\x19\x6e\x30\x72\x3d\x1c\x3d\xfa\x48\
+\x8c\x18\x36\x14\x4d\xcd\x8d\xa2\x52\xd0\x85\xdf\x1a\x62\x32\x4d\
+\xe7\x60\x68\x5b\xdf\xb6\x0b\x54\xdf\x8b\x7c\xa8\xf2\x7f\x97\x93\
+\xd8\x24\xae\xd3\x6c\xc6\x2f\x63\xc4\x3c\xdc\xaa\x35\x65\x80\x8f\
+\x20\xc8\x4f\x52\x48\x67\x90\x32\x27\x7f\x20\xad\xbc\xb4\x66\xc4\
+\x56\x4e\xf0\x21\x43\x8d\xdf\x34\xbe\xf5\x79\x31\x68\x60\x35\x6a\
+\xfa\xf7\x33\xd9\xb5\x04\x7b\x8f\x89\xb3\xb2\xa0\x9b\xbd\x11\x6b\
+\x6a\x2a\xb0\x78\x69\x93\x58\x44\x04\x37\xc6\x12\x0d\x45\x20\x4b\
+\x73\x4c\xcf\x4f\xbe\x0a\x4b\x1e\x08\x54\x0d\x0d\x11\x3c\xf1\xc4\
+\x2c\x2c\x5d\xb4\x58\x88\x1c\x5a\x5b\x9b\x45\x68\x57\x56\x95\x63\
+\x79\x5d\x1d\x9e\xfd\xd7\xd3\xf8\xec\x93\xf7\xe5\x1d\xe8\x92\xe5\
+\xe1\x95\xf6\x5a\x2e\x6c\xbc\xc9\x66\x18\x3d\xe6\x04\x49\xd4\xa1\
+\x9b\x94\x47\x82\xc8\x9d\x4c\x60\xcb\x9f\x6e\x82\xfd\xf6\xdd\x13\
+\x23\x47\x0e\x41\x9a\x35\x91\x92\x48\x43\x85\xc6\x25\x31\xdf\x86\
+\xc6\x76\xac\x68\xa2\x6b\x95\x84\x00\x9c\xc3\xb4\xd4\x41\x72\x7f\
+\x84\xc2\x6d\x18\x3a\x64\x1d\xcc\x9e\x3d\xab\xa8\xd2\x0a\xad\x0d\
+\x54\x8a\x35\x2a\x89\x73\xe6\xcc\x92\x78\x32\xf7\x15\x13\xa8\xe8\
+\x49\x61\x09\xd8\x37\xdf\x7c\x23\x6b\x82\xeb\x9f\xe3\xd6\x1b\x56\
+\xa1\x1d\xf7\xa3\x1c\x64\xc3\x74\xba\xee\x79\x70\x0f\x33\x8f\x82\
+\x16\x29\x93\xd6\x34\x59\xa7\x2b\x43\xa0\x87\xdb\xb1\xd7\xbf\xae\
+\x60\x98\xb3\x3e\xef\x06\x52\xe3\xf2\x82\xa1\xcb\xe5\x7a\xdd\xe3\
+\xf1\xec\x46\xb4\xd7\x74\xda\xff\x2f\x96\x61\xaf\x8f\xbe\x45\x06\
+\x6d\x5c\x80\xc9\x0c\xb8\xae\xb6\x16\x4e\xcc\x5b\xc8\xf0\x92\x1a\
+\x2d\x3f\xed\xb4\x18\x8a\x30\xd5\x7f\x49\x13\xa2\x31\x63\xa5\xd0\
+\x4d\xca\x83\xcc\x31\x74\x93\xbe\xf8\xdc\xdf\x31\x6d\xca\x04\x11\
+\xd0\xd2\x7a\x08\xac\xc9\xf2\x21\x16\x8f\xe3\xa0\x83\xf6\x95\x38\
+\x5e\x45\xb0\x42\xc0\xd1\x08\x1c\xd5\x1c\x81\xa5\xb5\xf5\xd2\x22\
+\x88\xa9\xf2\x54\x30\xa4\xc1\x6a\x9a\xa5\x05\x8b\x71\xec\x31\xa3\
+\x51\xdf\xb0\x14\x7e\xaf\xb9\x17\x05\x09\x05\xdd\x01\xa3\x0e\xc4\
+\x23\x8f\xfc\x0d\xd5\xfd\xfa\x23\x1e\x4b\x20\x10\xf0\x22\xe1\x70\
+\x9b\x32\x3e\x79\xd2\xc9\xa7\x9a\x74\x7b\x5a\x0b\xd2\x4a\x4a\x59\
+\x5d\x1c\xeb\x45\xc9\x99\xcd\xea\xcf\x00\x49\x66\xe1\xe7\x14\xa9\
+\x53\x80\x6b\x3d\x95\xe9\xc2\xe1\x34\xa9\x75\x0a\xda\xc9\xd6\x7f\
+\xc5\x7f\xff\x5e\x5a\x2d\xf1\xe1\xe9\x6e\x63\xe8\x90\xb1\xc0\xc9\
+\x53\xa6\xe3\x0f\x7f\xb8\x49\x08\x0c\x3c\x8c\x9d\x49\x4c\x2c\x0e\
+\x29\x29\x70\x1b\x80\x97\x84\x08\x25\x4f\x11\xa9\xaa\xec\x3f\x86\
+\x7b\xd4\xe3\x2f\x97\xc4\x9c\x5f\x1d\x31\x1a\x93\x26\x4e\x85\xd7\
+\x5b\x86\x48\x98\x44\xde\x1e\xf9\x7e\xa6\xd3\x7a\x27\x0b\xb5\x33\
+\xcb\x56\xdc\xc8\xa4\x7e\xa3\x2d\xc4\x02\x75\x96\x25\x78\x38\x47\
+\xe6\x61\x68\x35\xf2\x1e\x3e\xaf\xc9\x26\x2c\x77\x92\xc7\x78\xcf\
+\x40\x99\x07\xec\x59\xa9\xdd\x49\x34\x66\xce\xf9\x65\xb9\x83\xb8\
+\xd1\x09\xfe\x8e\xd5\x9f\x71\x8d\xa7\x0d\x30\x64\xc6\x9a\x65\x25\
+\x48\x20\x12\x6a\x47\xb0\xdc\x8f\x91\x23\x06\xa3\xb2\xca\x4c\x8b\
+\x96\x9c\xe4\x0a\xa4\x0e\x9e\x0c\x1d\x37\x87\x54\x5c\x98\xd7\x9c\
+\x2e\x1a\x3a\xbd\xdf\x7e\xdb\x20\xae\x67\xbf\xbf\x1c\x6d\xa1\x08\
+\xfc\x01\x93\x81\xda\xd4\x5c\x8f\xd3\x4e\x3f\x11\x9f\xcd\x9b\x6b\
+\x3a\xfb\xd2\xb5\xcd\xd8\xab\xd4\x88\x32\xae\xcd\x16\x63\x6c\x2a\
+\x1d\x13\x6b\x92\x3f\xc9\xa1\x1a\x8d\xc4\xb1\xdb\xae\xbb\xe2\xc1\
+\x07\x1e\xc2\x46\x1b\x8d\x40\xda\x65\xc0\xd0\xb0\x36\x19\x92\x8a\
+\xe5\x0d\x21\xac\x68\x6e\x97\xfe\x8b\x02\x86\xc2\x7d\x6a\x94\x8e\
+\x70\xb8\x1d\xc3\x08\x86\x73\x66\x09\x73\x53\x4b\x13\xbb\xbd\x74\
+\xae\xb4\xe9\x7a\x23\xe8\x30\x61\x88\x59\xd6\xf4\xb6\xa8\xf0\xa6\
+\x3c\x66\xfc\x70\xcf\x3d\xf7\x14\x4f\x8a\x16\xd4\xf3\x99\x7b\x23\
+\x76\xa8\x72\x5e\x29\xde\x48\xc7\xc6\xe4\x41\x51\xe0\x9c\x1e\x96\
+\xf7\xdf\x7f\xbf\x70\x40\xab\x77\x47\xd9\xc9\xfa\x2a\x81\xad\x2f\
+\x64\xb2\x7d\x4d\x97\xcb\xf5\x46\x3a\x9d\xdc\x3d\x2f\x18\x02\x58\
+\xe1\xf5\x7a\x6b\x4c\x2d\x0f\xdb\xf7\x64\x7f\xfe\x58\x8a\xee\xfb\
+\x7a\x80\x73\x06\xdb\x11\x38\x6b\x1a\x18\x66\x13\x68\xba\x04\x43\
+\x97\xe9\x35\x47\x30\x7c\xe9\x85\x7f\xe0\xe2\x69\x93\x51\x57\xb7\
+\x0c\x69\x49\xee\x48\x49\x5a\x3b\x8b\xe8\x47\x1d\xb8\xaf\xb0\xc5\
+\x94\x97\x95\x23\x29\xc1\x65\xb7\x63\x19\xd2\x8d\x02\xd4\xd6\x37\
+\x23\x1c\x4b\x22\x16\x4b\x21\xe8\x0f\x4a\x41\x72\x79\xa0\x0c\xb5\
+\x75\x4b\x71\xcc\xe8\x23\xb0\xbc\x61\x29\x22\x61\x26\x9c\x50\xf8\
+\x9b\xb4\x8a\x51\xa3\xf6\xc5\x63\x33\x67\xa1\xba\x5f\x75\x76\x48\
+\x49\x9c\xea\x76\xe3\xf1\x99\x33\x71\xc2\x09\x27\x89\x68\xf1\x79\
+\x7c\x88\x4a\xf7\x07\x5a\x5c\x96\x08\xe6\xff\xed\x40\x77\x4e\x99\
+\x40\x2e\x78\xa8\x65\x65\x6f\x6c\x23\x24\x13\xf2\x8f\x54\x7d\x6c\
+\xa2\x4a\xad\xd9\xee\x3a\xcf\x2c\x48\x76\x4c\xa1\x8b\x53\x63\x2e\
+\x7c\x60\x3b\x9e\x22\xca\x50\x4e\xd0\x3d\x4b\xef\x66\xb8\x61\x5d\
+\x1e\x2a\x09\x1e\xfc\xfa\xc8\xe3\x71\xde\xb9\x13\x91\x4a\x7b\x91\
+\x4e\xf9\xa4\xdc\x40\x8a\x9d\xe3\xa1\x4c\x1b\xa2\x62\xd6\xb0\x6d\
+\xf5\xf1\x5e\x74\x33\x8a\x9a\xe0\x62\x2b\x25\x53\xe6\xc2\x7f\x26\
+\xb1\xc7\x25\x60\x28\x25\x2f\xa2\x54\x70\x64\x4d\x41\xbb\xcc\xb3\
+\xcf\x23\x8a\x0a\xaf\x29\x40\xc8\x49\x12\x0e\x34\x0a\x7e\x43\x4b\
+\x67\x92\x8a\x18\x53\x33\x56\xa3\xb1\x26\x0d\xff\xaa\x9b\x35\x93\
+\xe9\x38\xa2\x91\x36\x94\x05\xfd\x18\x31\x62\x28\x06\x0c\x24\xa2\
+\x99\x1a\x46\xa3\x97\x98\x98\x66\xd6\xe6\xd4\xd8\xb3\xfa\xa9\xcd\
+\x4f\x61\xbf\x71\x67\x63\xb7\xb4\xa8\x79\x8f\x25\x4b\xdb\xd0\xd0\
+\xd0\x8e\xb4\x2b\x20\x05\xf6\xbe\x32\x72\xbe\xba\xd0\xda\xd6\x88\
+\x33\xce\x38\x09\x5f\x7c\xfc\xb6\xd3\x2c\xd1\x30\x1f\x78\x3c\x65\
+\x19\x40\x21\xd3\x0f\xdd\xd1\x7c\x25\x7a\x3c\x4c\x87\x1c\x96\x5d\
+\xec\x89\x87\xfe\xfc\x30\xd6\x5f\x7f\x18\xe0\x71\x62\xbe\x8e\x65\
+\xc8\xa5\x58\xd7\xd8\x82\x96\xe6\x30\x5c\x1e\x9f\xac\x3f\x2d\x71\
+\x11\x66\xac\xf6\x36\x30\xee\x57\x2c\x18\xaa\x65\xa6\x3f\xd5\x32\
+\xb4\xe7\xba\xb6\xb6\x5e\x62\xec\x1f\x7f\xfc\xb1\x21\xc1\x77\x08\
+\xd0\x8b\x59\x0f\x85\xce\xc9\x25\xcd\x67\xd7\x8a\xb1\x63\xcf\x90\
+\x35\xc1\xd8\x3c\x5d\xb5\xb7\xdd\x76\x07\xa6\x4d\x9b\x66\x68\x16\
+\x9d\xcc\x57\x8d\x1f\xf6\xb4\xb4\xa3\xd0\xf3\xf5\xc5\xe7\x2e\x97\
+\xab\x29\x9d\x4e\x32\x89\xc6\xc8\x69\xfd\xcf\x61\x87\x1d\x36\x72\
+\xce\x9c\x39\x0b\x34\x53\x49\x27\x25\x4b\xb9\xf3\xe3\x77\x93\xf6\
+\xf6\x80\xaf\x49\x31\x43\xa7\xc6\xde\xd1\xd8\x4b\x07\xc3\x57\x5f\
+\x78\x16\x97\x5e\x32\x0d\x8b\x96\x2c\x10\xc1\x41\x77\x17\xfb\xcb\
+\x71\x13\x1c\x7c\xc8\x01\x42\xaa\xcd\x56\x4d\x4c\xa8\x11\x6e\x53\
+\xc9\x2e\x34\xda\x7f\x43\x63\x08\xb5\xcb\xd9\x95\xde\x85\x7e\x55\
+\xd5\x68\x6b\x6d\x45\xff\x7e\xd5\x58\xb0\xe0\x07\x1c\x72\xc8\x7e\
+\x68\x6b\x6f\x14\x4b\xc5\xe5\x8e\xc3\xe5\x21\x39\x38\xb0\xd7\x5e\
+\xbb\xe1\xb1\xc7\x9f\xc4\xe0\x41\xeb\x20\xc9\xac\x40\x71\xdb\x19\
+\x42\x80\xbf\x3d\xfc\x30\xce\x38\x63\x2c\xa2\x89\x38\xfc\xbe\x32\
+\x84\xa5\xec\xc0\xc9\x62\x74\x3a\x7d\x67\x8a\xba\x75\x52\x0b\x80\
+\x61\xe6\x34\xc7\x42\x54\xe6\x25\x8d\x69\xb1\x71\xf4\xd9\x67\x9f\
+\x25\xa7\x51\x50\xd2\xd2\xa3\x80\xe0\xfb\x4e\x9d\x3a\x15\x37\xdf\
+\x7c\xb3\x03\x94\x06\x1c\x4c\xad\xa5\x29\x9a\x96\xb8\x73\x26\xb1\
+\xc8\x01\x09\xa9\x81\x77\x0b\xaf\x27\x7f\x92\x71\x85\xd6\xca\xd1\
+\x63\x4e\xc1\xf8\x73\x2e\x44\x38\xc4\x6e\xf2\x1e\xf8\xfc\xe5\xe2\
+\x9e\xaa\xaa\x28\x2f\x19\x0c\xd5\x6d\x4d\xb4\x61\xec\x8d\xd9\xb0\
+\x42\x24\xee\x65\x2c\xcd\x2b\x89\x28\x9a\x36\x6f\x4a\x1c\x18\xc7\
+\xa3\xa5\xc1\x9f\x49\x21\x19\xf0\x7b\x3d\x02\x8a\xb1\xb8\x89\x79\
+\x1a\x77\x93\x89\xfd\xd2\x75\x69\x94\x03\xaf\x7c\x6e\x8e\x95\x5b\
+\x28\x09\xb5\x43\x2a\x86\x70\xb8\x09\x7e\xbf\x0f\xc3\x47\x0c\xc1\
+\xa0\x41\x8c\xed\xd9\x2a\x76\x11\x60\x68\xe0\x15\x20\x18\x3a\x0b\
+\x3a\x49\x2b\x34\xe9\xc6\xb2\xda\x36\xd4\xd7\xb7\x22\x10\xac\x92\
+\xf5\x27\x19\xa5\xe9\x18\x5a\xdb\x57\xe0\xb4\xd3\x4e\xc0\x37\x5f\
+\x7e\x80\x40\xc0\xb8\x33\xa3\xed\xec\x4d\xaa\x60\xab\x89\x45\x49\
+\xf8\xfd\x86\xea\x8d\xe3\x40\xcb\x70\xef\xbd\xf7\xc7\x83\x7f\xfe\
+\x0b\xd6\x5d\x77\xa8\x33\xf6\x3c\x97\xeb\x1e\x42\x68\x5f\xbf\xa2\
+\x0d\x2d\xcd\x21\xb8\xbd\x64\x62\x32\xef\xad\xe0\xa0\x60\x38\x67\
+\xf6\x2c\x4c\x9d\x56\xd8\x32\xd4\xb9\x52\xaa\x35\x5a\x86\xec\x29\
+\x48\xd0\xa3\x42\x4a\x97\xe5\x17\x5f\x7c\x21\xb1\x72\x82\xa1\x1e\
+\x76\x7e\x47\x6f\xc9\x2f\xae\x5f\x76\xad\x20\x18\x8a\xf5\xce\x72\
+\x14\x97\x4b\xa8\x13\xa9\xf8\xf5\x76\x59\x47\x6f\x3d\x77\xa9\xd7\
+\x71\x3c\x76\xeb\x01\x58\xd8\x01\x0c\xb7\xdd\x76\xdb\x51\x1f\x7e\
+\xf8\xe1\x73\xb9\x84\xb0\xff\x71\x93\x96\x3a\xc4\xd9\xf3\x7f\x3c\
+\x60\x58\x81\x97\xfe\xf5\x0f\xfc\xee\xb7\xd3\xf1\xc3\xc2\xef\x05\
+\x0c\xfd\x7e\x8f\x08\x4b\xba\x7f\x7f\xf5\xab\x5f\x4a\x96\x9b\x09\
+\xb2\x53\x68\x92\x99\x85\xc9\x35\x46\x19\x6f\x6c\x6a\x47\x7b\x28\
+\x81\x50\x24\x8a\x60\x20\x28\x89\x33\x23\x86\x0e\xc3\x92\xc5\x8b\
+\x70\xd4\x91\x87\x62\x45\x53\x1d\xda\x42\x2c\xa0\x4f\xc0\xeb\x67\
+\xb3\xd7\x34\xf6\xdf\x7f\x1f\x3c\x31\x7b\x0e\x2a\xcb\xfb\x09\x41\
+\x00\xf3\x0d\x9d\x9e\x0f\xb8\xff\x81\xfb\x71\xfe\x79\x13\x9c\x6c\
+\x52\x0a\x3e\xc7\x8f\xa6\x01\xaf\x0e\x65\x06\xb4\x80\x5c\x48\x09\
+\xd7\x66\x56\xa1\xcb\xb5\x0c\xbb\x4a\x08\x20\x59\x38\xc1\xf0\x84\
+\x13\xc6\x64\xb2\x61\xd5\x35\x48\x50\x9c\x38\x71\xa2\x08\x2e\x3d\
+\xf4\x5a\xf6\xca\xc9\x6f\x19\x1a\xf0\x10\x9d\xd4\x13\x00\x92\x6e\
+\x8c\x3e\xee\x24\x5c\x30\x61\x2a\x42\xed\x71\x89\x4f\x05\xcb\xab\
+\xa4\xb9\x2e\x9b\xff\x66\xbb\x34\xac\xbc\x26\xf3\xc5\x0c\x33\x60\
+\x48\x05\x81\xca\x89\xd4\xf8\x11\x0c\x5d\xf0\xb9\x5d\xf2\x53\x85\
+\x37\x69\xca\x68\x1d\xf0\x7d\xbc\x5e\xc3\x26\x43\x40\x09\x96\x39\
+\x35\x6f\x6e\x66\x59\x9a\xec\x45\xde\x2b\x6b\xf9\x3a\xee\x64\x31\
+\xdb\xb2\xe3\x6b\x5b\xd8\x04\xc3\x32\x1f\xdb\x52\xb5\xca\xba\x19\
+\x3a\x6c\x08\x06\x0e\x64\xe0\xcf\x79\x25\x17\x63\x79\x7c\xa7\x4e\
+\x2c\x43\x07\x03\x33\x6f\x9d\x69\x45\xc6\x7e\x8b\x4c\x88\x71\xe3\
+\xbb\xf9\x4b\xd1\xda\x12\x43\x75\xcd\x20\xa7\x07\x63\x08\x6e\x4f\
+\x0a\x91\x58\x48\xc0\xf0\xcb\x8f\xdf\x05\x3c\x74\x59\x07\x90\x24\
+\x70\xa7\xcc\xb8\x8b\x5b\xde\xcd\x66\xcc\x6c\x31\x45\x46\x25\x03\
+\xea\xa2\x90\xed\xb9\x07\x1e\x7a\xe8\xaf\x58\x77\xdd\xff\x65\xef\
+\x3a\xe0\xe4\xaa\xaa\xf7\xf7\xa6\x97\xad\xe9\xb4\x50\x05\x11\x88\
+\x28\xea\x5f\x90\x22\x28\x08\x8a\x5d\x69\x09\x09\x4d\x90\x16\x30\
+\x94\x54\x92\xd0\xab\x28\x45\x40\x91\x22\xbd\x06\x90\x4e\xe8\x24\
+\x14\x41\x90\xa2\x22\x2d\x94\x90\xb2\xd9\x3e\x3b\x7d\xde\xcc\xdf\
+\xef\xdc\x77\x66\xde\x4e\x66\x77\x36\xd9\x4d\xb2\x8b\xbc\xfc\xf2\
+\xdb\xdd\xa9\xef\xdd\x7b\xdf\xf9\xee\x39\xe7\x3b\xdf\xd9\x50\xc2\
+\xde\x52\xb4\xcf\xf7\x39\x75\xa2\xcc\x19\xb6\x77\x26\xe0\xf3\x1a\
+\x30\x54\xf9\x32\xae\x2d\x82\x21\xbb\xde\x28\x18\xc6\x3a\x96\x56\
+\xed\x74\xcf\x8d\x85\x00\x71\x3a\x2d\x02\xf5\xf4\x0e\xb5\x63\x08\
+\xcf\x89\x1b\xcf\xc7\x1e\x7b\x4c\xd6\xbd\x12\x57\x06\x12\x0c\x95\
+\x34\xc8\x39\xbe\xec\xb2\xcb\x70\xf8\xe1\xf4\x0c\xcd\x78\xb0\xb9\
+\xef\x85\x17\xfe\x56\xa2\x23\x66\x8d\x18\x4f\x78\xa8\x10\x68\x2a\
+\x59\x71\x03\x86\xd6\x5e\x40\x6e\x7e\x37\x30\x1c\x33\x66\xcc\x71\
+\xcb\x96\x2d\xbb\x4c\x3d\x42\xb7\x1b\x6c\xc8\x21\x9f\x7b\x86\xab\
+\x0a\x8b\x9f\x25\x30\x7c\xe2\xe1\xfb\x71\xe6\x19\xb3\xf1\xe1\xc7\
+\x8b\xa4\x33\x01\xc3\x6d\x14\x6e\x66\xc8\x70\xef\xbd\xf7\x12\x1d\
+\x51\x1a\x53\x29\x9d\x70\x0d\x14\x6d\x4b\x7b\x67\x46\xea\xc6\xb8\
+\x83\x8f\x86\x22\x92\x84\x1f\x31\x6c\x38\xde\xfa\xe7\xeb\x38\xe8\
+\xc0\x5f\xa2\xa9\xe5\x53\x11\x86\x63\x98\x94\xa9\x4a\x46\xdc\xbe\
+\xfd\xed\xdd\x70\xc7\x5d\xf3\x30\xac\x71\x18\x12\xa9\x2c\xf2\x76\
+\x5a\x4a\x16\x58\xa0\xfd\xa7\x3f\xfe\x19\x53\x4f\x9e\x8a\x64\x22\
+\x81\x50\x38\x8a\x8c\x9d\x13\xca\xbd\x91\xe2\x52\x21\x67\x1a\x6c\
+\x11\xbd\x34\x87\x23\xf9\xa5\xa7\x56\x29\x4c\xaa\xe2\xef\x34\x46\
+\x2a\x28\xae\x7a\x8c\x37\xde\x78\xa3\x30\xf9\xd8\xbe\xa6\xb1\xd1\
+\x84\x6e\x29\x1a\x40\x03\x42\xcf\xf0\x8a\x2b\xae\x28\x82\x84\xdc\
+\x58\x4e\x71\xb4\x86\x2b\x59\x0a\x20\xa7\x51\x1c\x1c\xed\x1a\x62\
+\x00\xd1\xeb\x0f\x21\x93\xcc\xe2\x87\x3f\xf9\x05\x26\x1f\x7f\x12\
+\x92\x69\x1b\xe9\xb4\x8d\x70\xa8\xc6\x3c\xef\xb0\x73\x7b\x5a\x83\
+\xee\xb5\xd6\x9d\x18\x63\xbc\x4f\xfe\xf7\xf8\x8c\x27\xc8\x71\x62\
+\x38\x90\x87\x8f\xed\xa6\x3c\x1e\x09\x0d\xd2\xdb\xa7\xae\x27\x9f\
+\xe3\x63\x04\x4b\xbe\xde\x18\x64\x1a\xfc\xd2\x75\xa9\x47\xc9\x31\
+\x56\xd5\x92\x9e\xea\x20\xb9\x79\x2a\xd8\x69\xa9\xdd\x0b\x85\x7d\
+\x18\x33\x66\x14\x86\x0d\x0f\x9a\xbc\x9f\xcd\xad\x8e\x0d\x1f\xc5\
+\x4a\xfb\x02\x86\xae\x90\x2a\xc7\x85\x1e\x35\xed\xf5\xa7\x4b\x5a\
+\x11\xeb\x4c\xc3\x1f\x30\x39\x37\x0e\x57\x4d\x4d\x14\x99\x6c\x02\
+\x13\x27\x8d\x17\x02\x4d\x96\x11\x04\xe6\x37\x7d\x01\x69\x60\xcc\
+\xb9\x35\x05\xfa\x0c\xbb\xe6\x4c\x98\xd4\x95\xd6\xdb\x71\xc7\xaf\
+\xe3\x96\x9b\xef\xc0\x26\x9b\x6c\x22\xde\x99\xd9\xe4\x99\xbd\x0b\
+\x09\x34\xcd\x2d\x49\xb4\x76\x74\x4a\x4a\xc0\x72\xc4\x26\x34\x67\
+\xb8\x3a\x60\xc8\x8f\x76\x97\x74\x95\x03\x9d\xfe\xad\xaf\xe1\x3c\
+\x2b\xfb\x7a\x55\x6d\x53\xf9\xeb\xdd\xdf\xcb\x4d\xed\xe5\x97\x5f\
+\x8e\x43\x0e\x99\x28\x2f\x53\xb1\x8b\x4b\x2f\xbd\x1c\x67\x9c\x71\
+\x86\x10\xdf\x64\xed\x38\xa9\x34\xc5\x8a\xfe\x9e\xc3\xda\x7e\xbf\
+\x73\xde\x45\x46\x69\xf1\xd6\x0c\x87\xc3\x97\xa6\xd3\xe9\xe3\x95\
+\x15\xe9\x66\x17\x39\x08\xba\xb6\xcf\x75\xc8\x7f\xdf\x67\x0d\x0c\
+\x4f\x9f\x3b\x0b\x1f\x2f\xfe\x08\x6c\xe3\x93\xb5\xc9\xbc\x2b\x88\
+\x06\x24\x19\x6e\xb7\xde\x7a\xb3\x30\xdc\xe8\x31\x31\xff\xc4\x36\
+\x41\x0c\x27\xf2\x88\x75\xc6\xf1\xe1\x47\x8b\xc5\x00\x85\x42\x11\
+\xd9\xf9\xd6\xd5\xd4\xe2\xcd\x37\x5f\xc7\x79\xe7\x9e\x85\x0f\x3f\
+\x7a\x0f\xf9\x42\x16\x99\x5c\x52\x48\x1e\xec\x44\xbe\xc7\x9e\xdf\
+\xc3\xed\x77\xdc\x8d\x86\xfa\xa8\x4b\xc8\xcb\x2c\x89\x3f\xfe\xe9\
+\x7a\x03\x86\xb1\xb8\x24\xbe\xfc\x01\x1f\xb2\xa9\x44\xd1\x73\x12\
+\xb1\x64\xd1\x01\xb5\x8b\x05\xf2\xd5\xc0\x90\xe1\x28\x53\x02\x62\
+\xac\xa1\x9b\x94\x40\x43\x41\xcf\xf0\xa8\xa3\x56\x6a\x81\x26\xd7\
+\x7b\xdc\x71\xc7\xe1\x9a\x6b\xae\x29\xaa\x16\x55\x5a\xb8\x7a\xa3\
+\x95\x88\x21\x5a\xa6\xa0\x9b\x4c\xd3\x45\xe2\x47\x3f\xf9\x25\x26\
+\x9f\x30\x45\x88\x20\xf1\x64\x06\x76\xce\xb4\x89\x92\x5e\x4b\xbd\
+\x1c\x6e\x6f\xd4\x0d\x86\x72\xef\x92\x0c\xe4\x09\x48\xd7\x07\x25\
+\x44\x98\x9c\xa1\x47\xc0\x90\x8f\x31\x7c\x49\x4f\xbf\xae\x26\x5a\
+\x1c\x3b\xda\x02\x82\x7f\x30\x18\x86\x65\x31\x7f\xaa\x9e\x80\xd1\
+\x1a\x35\x42\x32\x5a\x1e\x61\x4e\x6e\x25\x32\x05\x63\x8a\xcc\x3d\
+\xa7\x13\xc8\xe7\xb2\x88\x44\x03\x18\x35\x6a\x24\x1a\x87\xb1\x3b\
+\x8c\x99\x32\x86\x61\x8d\xd7\xaf\x9e\x61\x25\x69\x38\x27\x67\x28\
+\x84\x9f\xd2\x58\x50\xc4\x80\x7b\x75\x82\x61\x3c\x9e\x92\xf1\x4a\
+\xa4\x92\xc2\x86\x24\x20\x32\xc7\x7d\xd8\x21\x07\x63\xd1\x87\x14\
+\x1c\x61\xcc\x4f\x77\x24\x46\xab\xd5\x90\x83\x58\x4f\xcb\xee\x37\
+\x46\xae\x8e\x6a\x7a\xf4\x0c\x09\x86\xb7\xde\x72\x27\xa8\x4e\x25\
+\x8e\xaf\x33\x89\x12\x58\x65\x7d\x63\x73\x1a\x1d\xed\xec\x1f\x48\
+\x4f\xda\x88\xb8\x17\x09\x34\x5d\x31\xc9\x19\xd2\x33\x3c\xf9\x94\
+\x13\xd1\xd5\xd9\xbb\x50\xb7\x1b\x8c\xb8\x31\x51\xdb\xa1\x64\x46\
+\x93\x97\xb5\xbb\x31\x47\x75\x9e\x39\xee\x03\x59\x08\xcf\x4d\xe1\
+\xa4\x49\x93\x44\x2c\x5f\x23\x00\xfc\xae\xfb\xef\xbf\x5f\xd2\x21\
+\xaa\x53\x3a\x90\x5e\xe9\xba\x30\xf6\x66\xfc\x70\x59\x3e\x6f\x4f\
+\x76\xf6\x38\xe6\x34\x2c\xcb\x7a\xc8\xef\xf7\xef\xa3\x17\xea\x6e\
+\xcf\x61\x2e\xba\x7a\x8d\xd1\xba\xb8\xa0\xc1\xfc\x9d\x9f\x1d\x30\
+\x0c\xe3\x99\xf9\x0f\x63\xe6\x8c\x53\xb0\x78\xc9\x62\xa3\xfb\xc8\
+\x22\x66\x47\x99\x65\xd8\xb0\x06\xb9\xf1\x15\x50\xe8\xbd\x31\x64\
+\x46\x72\x0d\xd7\x0e\x3d\x28\x29\x83\xb0\x7c\xa6\x81\x6c\xce\x46\
+\x63\x7d\x03\x92\xc9\x04\x96\x2c\x5d\x8c\xbc\xc8\xc3\x99\x30\x20\
+\x05\xb1\xc9\x10\xdd\x69\xe7\xdd\xf1\xe7\x6b\xae\x47\xe3\xb0\x46\
+\x48\x77\x20\x00\xdc\xf0\xd3\x00\xdf\x74\xd3\x5d\xf8\xdd\xc5\x17\
+\x63\xc9\x92\x25\x26\x3f\x47\x61\x80\x86\x3a\x21\x68\x24\xe3\xec\
+\xa9\x48\xa0\xb6\x61\x79\x8d\x71\x95\xc0\x46\x15\xcf\x90\x9f\x43\
+\x7a\xbb\x12\x13\xd4\x23\xe4\x2e\x99\xd7\x46\xc0\xdb\x6d\xb7\xdd\
+\x44\x15\x44\x43\x57\xbc\xb6\xe6\xe6\x66\xcc\x9f\x3f\x5f\x72\x2c\
+\xfa\x1e\xb7\x61\x52\xf5\xa2\x95\x09\x06\x2e\x4f\xb1\xe0\x41\x38\
+\x1c\x45\x30\x1c\xc1\xb7\xbe\xb5\x0b\x7e\xf1\xf3\x03\x50\x5b\xdb\
+\x20\x8c\x5e\xe9\x9e\x42\x46\xa9\x53\x12\xd0\xd3\x7a\xaf\x14\x9a\
+\x2d\x1a\x4b\x8f\x17\xbe\x40\x04\x99\x6c\x4e\xc2\xd8\x3c\xb8\x61\
+\x91\x9c\xa1\x30\x4d\xf3\x78\xe9\xa5\x17\xf0\xfe\x07\xff\xc1\xa8\
+\xe1\xc3\xa4\x35\x93\x16\x5e\x73\xe3\xf2\xe5\xaf\x7c\x15\x5f\xf8\
+\xc2\x38\xd9\x58\xd0\x43\x22\x9b\x98\x39\x5e\xb2\x35\x59\x40\x6f\
+\x4a\xce\x1c\x80\x22\x71\xc9\x15\xa6\xd6\xc8\xb5\xdf\x47\xd0\x22\
+\x39\x25\x80\xfa\x86\x5a\x44\x22\xcc\x45\x1a\x56\x71\x89\x40\xd3\
+\x3d\xaa\x60\xae\xb5\x7b\xe8\x55\x3a\x55\x38\x4c\x5f\xc3\xe0\x34\
+\x79\xe9\xc5\x9f\xac\x40\x26\x47\x36\x28\xc5\xe5\x4d\xe3\xe8\xce\
+\x58\x0c\x6d\xed\x2d\xe2\xcd\x3c\xf9\xe4\x93\x92\x77\x63\x48\x53\
+\x3c\x1d\x76\xc2\x08\xb2\x5c\xa1\x03\xb1\x8e\x66\x78\x7d\x05\xc9\
+\x31\xf2\x2a\xc2\x61\x3f\x92\xf1\x2c\x76\xf8\xea\x57\x24\x4c\xba\
+\xf5\x17\xb7\x12\x4f\x50\xe0\xd3\xc1\x53\xee\x4d\x5a\xda\x12\x88\
+\x77\xa5\xe1\xa5\x00\xb8\x34\x49\x5e\x19\x0c\xef\xbd\x67\x9e\xe4\
+\x0c\xab\x81\x61\xb9\x77\x55\xcd\xdb\x52\xc0\x1c\x88\xb2\x0a\x5d\
+\x53\xee\x0d\x20\x7f\xe7\x18\x6a\x3f\x43\x36\x3e\xe7\xfd\x46\x09\
+\x44\x3d\x3e\x0b\x60\x08\xe0\x91\x42\xc1\xde\xa7\x1b\x18\x52\x93\
+\x34\x14\x0a\x7d\x41\x07\xd7\x3d\x30\x06\x18\xfb\x5f\xcb\x35\x98\
+\x81\x6b\x4d\x9c\xdb\x67\x09\x0c\x17\x3e\xf5\x28\x4e\x39\xe5\x04\
+\x2c\x59\xba\x04\xa1\x60\x00\xa9\x74\xd2\x29\xba\x67\xf1\xb3\x31\
+\x84\xdd\x6f\x0e\x53\xa2\xc1\x0e\xe4\x54\x19\x11\x15\x54\x1a\x22\
+\xf1\xbc\x3c\x08\xfa\x02\xc8\x50\xc5\xc6\x43\x76\x22\xcd\xb1\xe9\
+\xcb\xc7\xba\xb2\x74\x2a\x87\xf5\x36\xd8\x14\xd3\x67\x9d\x2e\x8c\
+\x4a\x32\x2b\x59\x80\x1d\xef\x4a\x60\xf4\xe8\xf5\xf0\xcf\x7f\xbe\
+\x89\xbf\xbf\xf2\x8a\xe4\xb6\x18\x5d\x4b\x24\x3a\x11\x09\xf9\xd1\
+\xb4\x62\x31\x96\x7c\xf2\x01\x56\x34\x2f\x81\x4d\xcf\xd5\x2a\x11\
+\x85\xaa\x81\xe1\x98\x31\x63\x84\x1c\xc0\xba\x47\x1e\xd2\x83\xb1\
+\xb6\x56\x3c\xa3\x8f\x3e\xfa\x08\x0f\x3d\xf4\x10\x1e\x78\xe0\x01\
+\x2c\x5d\xba\xd4\xe9\x79\xe9\x95\xd7\x6c\xb1\xc5\x16\xd2\x5b\x71\
+\xdf\x7d\xf7\x2d\x02\x48\x31\x34\xea\xe4\xd6\x74\x77\xdf\x7d\x8d\
+\x75\x0f\x9b\x12\x9c\xc4\x93\xf6\x78\x31\x7c\x38\xd5\x5a\x44\x9f\
+\x5a\x3c\x14\x7a\x50\xd5\x6a\x9b\x2b\xb5\x33\x94\x68\xb6\x80\x1d\
+\x40\x27\xba\xbd\x3d\x87\xb6\xb6\x76\xd1\x01\xd5\xfc\x5f\x2e\x9b\
+\x16\x41\xf0\xdf\xfd\xee\x42\x3c\xfa\xd8\x83\x08\x05\x78\x5d\x49\
+\x69\x21\x15\x8e\x46\x31\x6a\xd4\x18\x1c\x76\xd8\x11\xf8\xf9\x2f\
+\x26\x48\x49\x81\x34\x2d\x2e\x30\xac\x69\x49\x1e\xa9\xbe\x21\x84\
+\x48\xc4\xb9\x32\x7e\x17\xf9\x2d\x2e\x27\x56\xc3\xe6\x04\x8b\x9c\
+\xb9\x3c\xa9\x0d\x14\xf1\x6b\xa7\x50\x81\xf9\x65\xcd\x87\x96\x55\
+\x30\x96\x81\xa1\x09\xc9\x2a\x83\x55\x00\xc3\x01\x28\xc5\xe2\x74\
+\x0e\x22\x36\x1f\x8d\x5a\x88\xc5\xd8\x53\xd2\x8b\x47\x1e\x5b\x88\
+\x74\xca\x96\xa8\x04\x0b\xee\xf9\x19\x0d\xf5\xf5\x48\x24\xe2\xb8\
+\xf7\xbe\xbb\x70\xe3\x8d\xd7\x23\x99\x68\x23\x35\x4a\x2e\x24\x18\
+\x0a\x20\x9d\xcc\xe0\x0b\x5f\xd8\x0a\xd7\x5d\x7b\x03\xb6\xfe\xd2\
+\xb6\x02\xa0\xcc\xb9\x4a\x18\x55\x9a\x0f\x7b\xa4\xee\x2f\x95\xce\
+\x22\x48\x41\x00\x25\xd0\x38\x40\x9d\x74\x3c\xc3\xbe\x82\xa1\x7c\
+\x6f\x90\x3d\x2c\x4b\x7d\x07\x79\x9e\x5a\x77\xa8\x91\xba\x52\xdd\
+\x77\x69\x35\xe9\x6b\x06\xc2\x86\xb9\x8b\xd3\xdd\xd1\x41\xfd\x6c\
+\x3e\xc6\x08\x10\xef\x0b\xf5\x66\x07\xf2\xfb\x07\xe2\x1a\xfa\xfa\
+\x19\xc6\x3e\x5b\xef\x16\x0a\x39\xd1\x28\x2d\xae\x3d\xaf\xd7\x6b\
+\x17\x0a\x05\x4f\x4f\xfa\x9b\x83\x3d\x67\xa8\x8b\x84\x20\xee\x56\
+\x5f\x57\xe1\x00\x3e\xa6\x21\x30\xdd\x45\xbb\x43\xc2\x9c\x58\x93\
+\x17\x20\x25\xdb\xbf\x52\x38\x62\x75\x6a\x69\x86\x12\x18\x52\x2b\
+\xf3\xc3\x45\x2b\x90\xb3\xfd\xd2\x5c\x35\x67\x73\xa7\x6c\xea\xed\
+\x58\x5a\xf1\xd8\xc3\xf7\x60\xda\xd4\x13\xe5\x26\xc8\x64\xd2\xb0\
+\x73\x19\x04\x42\xda\xa1\x82\x64\x0f\x57\x5d\x99\xd3\xcb\x50\x55\
+\x68\x84\x8c\x41\x4b\xe8\x2c\x38\xbe\x34\x1a\x66\xd3\x5e\x1b\x69\
+\xf6\x8e\x52\x9e\x28\x69\xfa\x9e\x00\xec\x82\x0f\xb5\xd1\x11\x98\
+\x78\xe8\xaf\xe1\xb1\x42\xf0\x07\x6a\x91\x4c\x16\x44\xb9\x85\x86\
+\x5c\x64\xe0\x78\x0e\xd9\x0c\x42\x41\x2f\x3a\x63\x2d\xa8\xaf\x0b\
+\xa1\x69\xc5\x27\x78\xe5\xa5\x67\xf0\xe9\x92\x0f\x50\x28\x10\x0c\
+\x29\xe3\x65\xba\xb8\x2b\x18\x2a\x50\xf1\x06\x66\x6e\x49\x29\xe5\
+\xf4\x00\xd9\x86\xea\x7b\xdf\xdb\x53\x36\x7e\xa6\x3d\x95\x31\xda\
+\xfc\x49\xa0\xbc\xf0\xc2\x0b\x8b\x22\xc9\xfc\x1c\xad\xc5\x7d\xe2\
+\x89\x27\xa4\x19\xb1\x76\xe5\x70\xdf\x8c\xf4\x8a\xd9\x0a\xac\xe7\
+\xa3\x94\x3b\xa4\xc1\xe5\x98\x30\xf4\x1c\x8f\x67\x10\xc4\x66\x89\
+\x54\x00\x00\x20\x00\x49\x44\x41\x54\x09\xb3\x79\xb0\xeb\x9d\x5a\
+\xae\xa0\x4e\x98\xeb\x39\x0e\x2f\xc3\x7b\xe5\x07\xcf\x9d\x41\x1d\
+\x7e\xce\x07\x8b\xe2\x52\xe4\xcf\xc2\x7f\xcb\xa9\x2f\xf5\x5a\x36\
+\xec\x7c\x06\x27\x9d\x7c\x3c\x5e\x58\xf8\xa4\x09\x53\xe7\x32\xd2\
+\x84\xb8\x40\x1d\xd0\x50\x14\xb3\xe7\x9c\x89\x83\x26\x4c\x42\x67\
+\x8c\x35\x75\x26\x4c\x99\xcd\xa5\x24\x77\x3a\x66\x54\x8d\xb0\x53\
+\x2b\x9c\x66\x9f\x6c\x52\xc9\xef\x33\x9b\x83\xd2\xe7\x94\x73\x14\
+\xdc\x91\x29\xe7\x39\x17\xe8\xf2\x1a\xb5\x46\xd5\x78\x69\x66\x3c\
+\xa8\xcd\xbd\x74\x79\x3b\xda\xdb\x53\x08\x06\xa2\xb2\x61\xe3\x7f\
+\x2d\xca\x3f\xe7\xec\xd3\x71\xe5\x55\x97\xa2\xc0\xcd\x93\x8f\x02\
+\x6d\x86\x1c\xc4\xe8\x06\xfb\x53\xde\x76\xdb\x5d\xd8\xe6\x4b\xdb\
+\x22\x95\x4d\xcb\x17\x88\xed\x28\x90\x99\x4b\x20\x36\x24\x1c\xae\
+\x05\x11\x05\x90\x9d\x87\xc9\x5b\xe7\xd2\x29\x0c\x1f\x3e\x1c\x77\
+\xdf\x75\x17\x66\x9d\x36\x15\xed\xad\x8b\xab\x12\x68\xfa\x34\x60\
+\x6b\xf8\x45\xe5\x21\x76\xb5\x61\xd5\x4a\x27\x56\xc7\x3e\xae\xe1\
+\x4b\xe9\xeb\xc7\xb3\xbd\xb5\x14\x9d\xca\xda\xdb\x6b\xaf\xbd\x36\
+\x7d\xe2\x89\x27\x3e\x50\x20\xac\x7c\x61\x43\x83\x40\x43\x30\x94\
+\xc4\xb8\x4b\xd5\xbd\xdc\x9d\x2f\x07\x43\x4e\x38\x1f\x73\x83\xa5\
+\x02\x65\xb9\x46\x69\x5f\x47\x58\x06\x77\xb0\x75\xba\x2f\x16\xdd\
+\xaf\x5c\x5a\xa1\x60\x68\xe7\x03\x62\x08\x8c\x16\xb5\x89\x06\x10\
+\x68\x9e\x7d\xea\x61\x9c\x30\xf9\x28\xb4\x34\x37\xc3\x92\xae\xf3\
+\x4e\x5d\x56\x4f\x2e\x8b\x5a\x71\xe9\x7f\x67\x1b\x83\x59\x30\xde\
+\x81\xf4\xcf\x93\x4f\x66\x3d\xa2\xc3\xa0\xa3\xfc\x16\x91\xcb\x0a\
+\x02\x05\x3f\xea\x1b\xd6\xc7\xc4\x89\x47\xc2\xf2\x44\x98\x99\x84\
+\xdf\xd7\x08\xd2\xe8\x69\xc4\x18\xbd\x88\xc7\x3a\x60\xe7\xd2\xa2\
+\x42\x92\xc9\xc6\x10\x0e\x51\x96\xeb\x43\xbc\xfa\xca\x42\x2c\x6b\
+\x5a\x84\x02\x18\x2a\xcd\x16\xcb\x11\x6a\xa2\x35\x12\xae\x55\x26\
+\xa4\xce\x23\x41\x50\xf5\x1f\xcb\xc1\x50\x75\x54\xfb\x02\x86\x7b\
+\xec\x41\x99\x43\xd3\x91\xc3\xfc\x24\xe3\x96\xc2\xd2\xda\x4b\xb0\
+\xa7\x95\x63\x8c\x3c\xdf\x46\x2f\xba\xfc\x48\xa5\xe8\x0d\xd9\x08\
+\x87\x4d\x27\xf9\x9e\x54\x90\xf4\x7d\x2a\x1b\xa8\x52\x5a\xe2\x99\
+\xcb\xf9\x00\x1f\x7c\xd8\x81\x96\xe6\x98\xb4\x9e\x52\x30\xe4\xb3\
+\x76\x3e\x85\x53\xa7\x4e\xc6\x82\x67\x1f\x87\x2f\xc8\xc6\xb5\x69\
+\x78\x29\x8a\x9d\xb5\x45\x99\x85\x60\xb8\xff\x81\x13\x4a\x60\xe8\
+\x61\xb8\x34\x89\xc6\x61\x75\x18\x33\xaa\x51\x3c\x57\xa7\xba\xd0\
+\x69\x00\x6c\xce\xa6\x74\x35\xc6\x93\xaa\x74\xf4\x0d\x0c\xdd\xba\
+\xaa\x26\xe2\xe0\xaa\xe9\x2f\x8e\x9f\x7c\xa7\xa8\xc4\x38\x1e\x2a\
+\x89\x2e\x19\x60\xf9\xb2\x0e\xb4\x75\x52\x15\x88\x3a\xa5\xa6\x4c\
+\xc0\x84\x52\x6b\x70\xd1\x85\xe7\xe2\x4f\x57\xff\x01\xb9\x6c\x97\
+\xb0\x4d\x79\xa6\x02\x86\xde\x00\xc2\xe1\x5a\xdc\x7e\xdb\x5d\xd8\
+\x7a\xdb\x6d\x90\x72\xba\xf7\x30\x84\xcf\x1a\xca\x7c\x91\x09\x55\
+\x1d\x0c\x67\xcf\x9a\x8a\xd6\x36\x16\xdd\xf7\xde\x6d\x7e\x55\x6c\
+\xcb\x9a\x7c\xad\x1b\x10\xd5\x8e\x55\x63\x8d\x0e\x61\x30\x64\x54\
+\x62\x33\x00\x8b\x64\x0d\x6f\xb5\xd5\x56\xbb\xbf\xf7\xde\x7b\x4f\
+\x0e\x65\x30\xd4\x18\xbb\x9b\x69\x25\x3b\x36\xa7\x2f\xa3\x3b\xfc\
+\x50\x0e\x86\x1c\x83\x4a\xa0\x27\x8c\x3a\xc7\x63\x5c\x9d\xc5\x37\
+\xd4\xc0\xf0\xa3\x0f\x9b\xc5\x33\x54\x30\x94\x22\xf6\x42\x01\xb5\
+\x35\x01\x2c\x78\xee\x31\x9c\x78\xc2\xb1\x68\x5e\xbe\x5c\x2a\xb5\
+\xe9\x59\xe5\x0b\xa6\xab\x45\x88\x61\x25\x6e\xc1\x7b\x34\x77\x39\
+\xf1\xe2\x22\x51\x9f\xb4\x38\xa2\x41\xc9\xa6\xd9\x3b\xcd\x00\x24\
+\xeb\x08\x8d\xb2\x07\x97\x23\x6b\xc1\xfc\x68\x6c\xdc\x08\x13\x26\
+\x1c\x81\x70\xa8\x01\x99\x2c\xc9\x1d\x14\x01\x0f\x89\x27\x17\x4f\
+\xc4\x10\x8f\x75\x89\x47\x43\x1d\x49\xf6\x0d\x0c\xf8\x0a\x58\xbc\
+\xf8\x1d\xbc\xf6\xea\x02\xb4\xb6\x2f\x85\x65\x25\x91\xc9\xc6\x45\
+\x27\x94\x06\x92\x75\x61\xfc\x0e\xdd\x18\x69\xce\xc5\xe4\xc0\x6c\
+\xc9\x17\xde\x75\xd7\x5d\xdd\x3c\x43\x05\x43\xfe\x9c\x36\x6d\x65\
+\xcf\x90\x1b\x2f\x5e\x37\xf3\x51\x3b\xef\xbc\xb3\x18\x59\xaf\x97\
+\x85\xe8\x2b\x0f\x44\x35\x63\xc1\x73\x50\xba\x3a\xbd\x5f\x8e\x69\
+\xd1\xe0\x77\x63\x50\xf6\xbe\x12\x4d\xd3\x66\xf1\x57\xa4\x24\xc5\
+\x08\x67\x84\x45\xe8\x7b\xd1\x87\xed\x68\x6d\x89\xc1\x2a\x84\x60\
+\x51\x35\x85\x0d\x98\x59\x7d\x98\x4f\xe1\x94\xa9\xc7\xc9\x1c\x0b\
+\x99\x24\x4b\xfd\x4f\x1f\xec\x5c\x01\x14\xd8\x3e\x6d\xce\x19\x38\
+\x68\xfc\x24\x74\xc4\xba\xe4\xda\x58\xf4\x9e\xa7\x32\x51\x63\x0d\
+\x46\x8f\x19\x06\x0f\x4b\x23\x1c\x32\x8a\x81\x5e\x73\xe8\x86\x87\
+\xf3\xaa\x82\xf0\xdd\xcf\x7e\x65\x88\xac\x1c\x26\x15\x38\x77\xde\
+\x6a\x88\x46\xdd\xc0\x50\x1c\x32\xb3\x51\x30\xe4\x1a\x47\x7a\x8e\
+\xf5\x80\xd2\x37\xb2\x1d\xb1\x38\x85\x02\x82\xc2\x3a\xe6\x21\x62\
+\x12\x8d\xb5\xb8\xf0\xa2\xb3\x05\x0c\xf3\x59\x92\xb1\x9c\x73\x67\
+\xee\xcf\x1b\x42\x24\x1c\xc5\x1d\x77\xcc\xc3\x36\xdb\x7d\x19\xf1\
+\x64\x02\x05\x8f\xaa\x2b\x95\x8a\x5c\xf8\x6d\x6a\x67\x3c\x4e\x6b\
+\x2a\xe3\x19\x66\x8a\x9e\xe1\x50\x03\x43\x05\xc0\xe2\x3c\x3a\x75\
+\xb3\xbd\xad\xbc\x6a\xeb\x7b\x75\xec\xe7\xda\x7b\x8f\x67\x0f\x20\
+\xf7\x94\xac\xbd\x68\x34\x7a\x68\x2a\x95\xba\x76\x28\x83\xa1\xb2\
+\xe4\x14\xf4\xf8\x37\x17\xa5\x69\xd2\x1b\x5e\x89\x6d\xa5\x1e\x82\
+\x3b\x2c\xac\x14\x71\x25\x3d\x68\x0d\x56\xb5\x10\x41\x4f\x93\x36\
+\xd4\xc0\xf0\xe3\x8f\x5a\x90\xcd\x31\x8c\x64\x3c\x43\x15\x3c\x8e\
+\x46\x7c\x78\xe8\xc1\xbb\x71\xde\x79\x67\x63\xf1\xc7\x9f\x02\xf9\
+\x6c\x29\x7e\x28\x74\xc0\x62\x0d\xb4\xd6\x42\x3b\x3f\xb5\x33\x3a\
+\x0d\x50\x0e\x16\xbb\x0d\x14\x1b\x66\x7b\xe0\xf7\xf9\x45\x99\xc5\
+\xce\x9b\xe2\x79\x1a\xe7\x8c\xd4\x03\x52\xb2\x6b\x4b\xec\x77\xc0\
+\x24\x0c\x1f\x36\x06\x99\x8c\x17\x5d\x0c\x93\xc2\x87\xa0\x08\x2f\
+\x77\x4a\x88\x33\x9b\x49\x48\xde\xa7\xbe\x2e\x08\x9f\x37\x87\xf7\
+\x17\xfd\x0b\x2f\xbf\xf4\x2c\x3a\xba\x96\xc1\xef\xb3\x91\xcd\x75\
+\x99\x36\x3f\xac\xa7\xa3\xc7\x09\x6a\x3c\x9a\xf7\xf3\x70\x53\xd5\
+\xb9\x46\xe8\x19\xee\xb5\xd7\x77\x8b\x54\x72\x37\x18\x4e\x9d\x3a\
+\xad\x18\x26\x55\x51\x6c\x37\x18\xb2\x14\xc4\x0d\x82\xf4\x08\xe9\
+\x71\x46\xa3\x61\x74\x76\x76\x55\x09\x95\x9a\x73\x71\xef\xc2\x4d\
+\xe1\xb8\x21\x8b\x50\x21\x85\xf2\x62\x1c\x54\x13\x8d\x16\x13\x2c\
+\x3f\xc9\xda\xe5\xcf\x4c\x26\x2b\x8c\x50\xd3\xac\x97\x9e\x0d\x7f\
+\x67\xa8\xdb\x8c\x5b\xbe\xe0\xc1\xa2\x45\xcd\x68\x6d\x49\x1a\xcf\
+\xb0\x60\x14\x4c\x50\xc8\x21\x67\x27\x71\xca\xd4\x63\xb0\x70\xc1\
+\x7c\x78\x7d\x8c\xaa\xb0\x97\x1e\x95\x5d\x80\x50\xa8\x0e\xb3\xe7\
+\x9e\x89\x83\xc6\x1f\x5a\x04\x43\xd6\xef\xd9\xd9\x14\x1a\x1a\x23\
+\x18\x3d\x66\x84\x03\x86\xc6\x7b\x53\x4f\xaf\x3c\xdc\xc9\x4a\x51\
+\x03\x35\x8e\x38\x82\x73\xd3\x94\xfb\x8b\xab\x0b\x86\xfc\x6e\x86\
+\xf5\x75\x4c\xc4\xf3\x2d\x38\x61\xd2\xa5\x6d\x88\x25\x28\xea\x10\
+\x82\x95\x37\xe5\x08\x54\xd4\xa9\xad\x8d\xe0\x9c\x73\xcf\xc0\xd5\
+\x7f\xbc\xd4\x78\x6d\x04\x43\xc7\xad\xf4\x78\x82\xa8\x89\xd6\x8b\
+\x0a\xd2\x36\xe3\xc6\x49\x1b\x29\xe6\x0c\x25\xa7\xe6\x80\x6f\x71\
+\x26\x9c\x4d\xb7\x78\x54\x79\x0d\x93\x66\x30\x62\xf8\x70\xcc\xbb\
+\xd3\x84\x49\x87\x92\x67\x58\xc9\x9e\xa9\x2d\xeb\xc9\xd6\x0d\x6d\
+\x30\xb4\x0e\x03\xec\xeb\x74\xed\xcd\xf9\xef\x02\x99\x3b\x94\xc1\
+\x50\x6e\x33\xa7\xd9\x25\x27\x4e\xd5\x34\xdc\x54\x79\x59\xbc\xce\
+\x0e\xb2\x7c\xf7\xa3\x6a\x21\xe5\xef\xfb\x5f\x0a\x93\x12\x0c\xe9\
+\x19\x4a\x28\xa8\x60\x09\x90\x98\x1c\x96\x17\xef\xbf\xf7\x1f\x3c\
+\xf9\xd4\x63\xc8\x24\x33\x48\xa4\x13\x08\x78\x7d\xa2\x00\xe3\x65\
+\x06\x2a\x48\xc2\x41\xbc\xd8\x07\xc3\x66\xde\x44\xf6\xf2\x79\x78\
+\x24\x9c\x44\x23\xce\xb0\x61\x00\xa9\x64\x52\x72\x6d\xdc\x39\xc7\
+\x3a\xdb\xf1\xdc\x33\x4f\xa3\xa5\xb5\xb9\x48\x97\xb7\x29\xdf\xe5\
+\x0d\x62\xfd\xf5\x36\xc5\xb7\x77\xdf\x07\xc3\x1a\x47\x23\x99\xca\
+\x63\xe4\xe8\xf5\xd1\x15\x4f\x22\xd1\x15\x17\xb0\xe2\xbc\xa4\xe2\
+\x09\x11\x44\x6e\x6c\xa8\x41\x4d\x4d\x18\xef\xbe\xf7\x2f\xbc\xf4\
+\xe2\x53\xe8\x8c\xad\x40\x20\x90\x47\x3a\xd3\x29\xe1\x59\xbe\x96\
+\x45\xec\xea\x31\x68\xa8\x4c\x43\xe3\x3c\x1f\x7a\x8a\xe5\x60\xa8\
+\x37\x3e\xed\x63\x6f\x60\xf8\xd4\x53\x4f\xe1\xdb\xdf\xde\x55\x5e\
+\x4e\x12\x8c\x86\x99\xa4\x3b\x7b\xb7\xa3\x42\xde\xab\x07\xeb\x92\
+\xcb\xb0\x55\x91\xd1\xcf\x34\x28\xa9\xa1\x42\x05\x93\xde\x7f\x6a\
+\xde\x53\x18\x97\xf4\xff\xf2\x16\x16\x7d\xd8\x84\xf6\x66\xb2\x7a\
+\xc3\xb0\x10\x12\x19\x33\x4a\xeb\xe5\xec\x38\x66\xce\x9c\x8c\xa7\
+\x9f\x79\x18\xfe\x60\x1e\x99\x34\xc3\xcf\x5e\x09\x69\x47\x23\x0d\
+\x98\x33\xe7\x6c\xec\x77\xe0\x21\xe8\xe8\x8a\x1b\x2d\x53\x0f\x3d\
+\xfd\x14\x1a\x87\xd5\x62\xf4\xa8\x61\x42\xf4\xa1\xe4\x9a\x00\xd1\
+\x4a\xd7\x63\x1e\x31\x85\x13\x95\xc0\xb0\xfb\x18\x55\x70\xaa\x9d\
+\x77\xaa\x67\x68\x74\x40\xcb\x3d\x43\x03\x86\x9c\x63\x12\x6c\x18\
+\xc7\xa4\x77\x18\x40\x2a\x91\x43\xd3\x8a\x4e\xac\x68\x4b\xc1\xe3\
+\x33\x9d\x3f\xb8\x1e\x0a\xb9\x2c\x6a\xeb\xc2\x38\xfb\x9c\x33\x70\
+\xed\xd5\x97\x4b\x7e\x59\xc6\x58\xc0\xd0\x88\x20\x28\x18\x6e\x37\
+\xee\x2b\x72\xed\xdc\xed\x68\x54\x49\xec\x88\x73\xb2\xc6\x33\x74\
+\xe6\xfd\x73\x30\xec\x09\x2f\x07\xf3\xe3\x73\xff\x2b\x20\x78\xba\
+\xae\xbd\xab\xbd\x5e\xef\x11\x43\x1d\x0c\x15\x10\x09\x68\x5a\x22\
+\x42\x46\x20\x43\x59\xd2\xfa\x45\x0a\x9b\x0c\x20\x2a\x60\xba\x29\
+\xcc\x1a\xea\x73\xb3\xa8\x2a\x31\xaa\xfa\x3a\xab\x43\xcd\x33\xfc\
+\xe4\xe3\x56\xf1\x0c\xa5\xcb\x3d\x8d\x86\x8f\x5e\x49\x56\xc8\x24\
+\x24\x81\x90\xa6\x5e\x5f\xdb\x80\x74\x36\x85\x48\x28\x0a\xbb\x90\
+\x13\xca\x3f\xf9\x32\xa9\x44\x52\x8c\x03\xa3\x54\x64\x86\x8a\x56\
+\xb5\x55\x52\x14\xa1\x27\x17\x09\x46\x04\x10\x43\x01\x3f\x52\x89\
+\x2e\xbc\xf2\xf7\x97\x30\xf9\xf8\xa3\xb1\x74\x29\xd5\x90\x4c\x1e\
+\xd3\xe1\xa5\x22\x14\xa8\xc5\x7a\xeb\x6f\x8a\x80\x3f\x8a\xce\xae\
+\x84\x7c\x07\xc1\xb7\x90\x2b\xe0\x6b\x3b\x7c\x03\xdb\x6f\xbf\x83\
+\x28\x71\x50\x39\x85\x1e\xd1\xa7\x4b\x3e\xc1\x92\xa5\x1f\xe2\xcd\
+\xd7\x5f\x45\x3c\xd1\x02\x2f\x55\x45\xf2\xe9\x22\x23\xa3\xb1\x81\
+\xb9\x2d\xbf\x94\x42\x70\x1d\xa8\xea\xbf\x46\x12\xb8\x4e\x18\x26\
+\x75\x7b\x86\xee\x79\x3e\xf5\xd4\x9e\x3d\x43\x82\xe1\xae\xbb\xee\
+\x6a\xc2\xb1\x0e\xf9\x46\xdf\xfb\xc6\x1b\x6f\xa1\xb5\xb5\xd9\x84\
+\x3d\xbb\x1d\xdd\x41\x80\xa5\x15\x6c\x2e\x4d\x60\x26\x88\x66\x52\
+\xd4\x5b\xb5\xf0\xce\x3b\xef\x48\xeb\x9e\x60\x98\x45\xef\x66\x74\
+\xf4\xa7\x7b\x7d\xd1\xdb\xe5\x5a\xfd\xe2\x17\xbf\x88\xf5\xd6\x5b\
+\xaf\x18\x09\xe1\x63\x6c\x81\xe4\xf5\x07\xf0\xd1\xc7\x4d\x68\x6b\
+\x4e\xc0\x6b\xd5\x14\xc1\x90\x00\x42\x30\x9c\x31\xe3\x78\x3c\xfd\
+\xec\x83\x12\x72\x66\xe9\x0b\x01\x8e\xc2\xd7\x04\xc3\xb9\x73\xcf\
+\xc3\x7e\x07\x1e\x86\x8e\x18\x7b\x02\xd2\x5b\xcd\x23\x6f\x27\xd0\
+\xd0\x50\x8b\x31\xa3\x4d\xf3\x5b\x13\x1e\x75\x2b\xc8\x28\xc9\x85\
+\x39\x63\x0a\x2a\x98\xa6\x61\xe5\x87\x69\xa5\x54\x3a\x56\x1f\x0c\
+\x73\x02\x86\x96\xe5\x84\xdc\x6d\x4a\x02\x06\x84\x59\xda\xda\x16\
+\xc7\xd2\xe6\x4e\x21\x60\xa9\x84\x5c\xc1\x36\x61\xd2\x73\xce\x9d\
+\x8b\x6b\xfe\x78\x85\x01\x43\xa9\x7b\xa4\x50\x03\x43\xaa\x01\xd4\
+\x44\x87\xe1\xce\x3b\xe7\x61\xbb\x71\x5f\x45\x47\x8c\x75\x3d\x46\
+\x8e\x8e\x47\x49\xf0\x5e\xc3\xa4\xdd\xc1\xd0\x76\xc2\xa4\x9f\x7b\
+\x86\x7d\xb5\x96\xeb\xf4\x75\x7f\x06\xf2\xbf\x92\xb5\x67\x59\xd6\
+\xc3\x1e\x8f\x67\xef\xcf\x02\x18\xba\x59\x7e\xec\x0e\x41\x8d\xbf\
+\x86\x86\x06\x29\xc2\xa5\xa1\x91\x5d\xa1\x03\x86\x0a\x74\x0c\x83\
+\x52\x4e\x6b\xf9\xf2\xe5\x4e\x27\x04\x23\xad\xe4\x8c\x4d\x37\x03\
+\xb4\x2a\x53\x36\x54\xc1\x50\x8a\xbc\x2d\xaf\xd4\xa1\x19\x86\x2d\
+\x41\xd1\x96\x90\x5b\x34\x5c\x83\x58\xbc\x13\x21\x2a\x7d\xa4\xe2\
+\x22\x73\xc6\x2e\xe4\xb5\x35\x35\xa5\xe0\x1d\x41\x50\x52\x37\x85\
+\x62\xa7\x06\x0f\x5b\xf8\xb0\x49\xab\x74\x6c\xb0\x11\x0a\x78\x44\
+\x81\xe6\x67\x3f\xfd\x3e\x72\xf9\x24\x28\x1b\xa9\xbb\x6b\x7e\x77\
+\x36\x43\xaf\xc5\xc7\x22\x0c\xa9\x43\x54\x32\x8c\xe5\x0d\xe0\xa4\
+\x29\x53\x71\xd8\x61\xbf\x92\x9c\x16\xcd\x30\x37\x3a\xb5\x51\xea\
+\xa2\x66\xb0\x74\xd9\x62\xa4\xd3\x71\xc9\x7d\x65\xb2\x5d\x12\xc2\
+\xe3\x54\xa6\x53\x79\x10\x98\xa8\xaf\x48\x46\xac\x9b\x54\xc5\x79\
+\x62\xce\x90\x9e\xe1\x9e\x7b\x7e\xa7\x22\xe9\xe5\x94\x53\xa6\xe2\
+\xa2\x8b\x2e\x2a\x46\x1f\xb8\x76\xb4\x7d\x8e\xdb\x33\x54\xc2\x0c\
+\x3d\x44\x2a\x75\x4c\x99\x32\x45\x4a\x41\xba\xba\x3a\x1d\xcf\xa3\
+\xbc\xa0\xdc\xfc\xfd\xf3\x9f\xff\x5c\xc4\xc0\xeb\x6a\xa9\x38\x63\
+\x8e\xf7\xdf\xfb\x00\xd3\xa6\x4d\xc3\x3f\xfe\xf1\x0f\x01\x72\x37\
+\x10\xea\x6b\xdc\x6b\x8c\xde\xed\x91\x47\x1e\x29\xff\x7d\x7e\x0b\
+\xd9\x0c\xc5\xd4\x39\x3e\x79\x51\x9f\xf9\xf0\xe3\x65\x68\x6b\x49\
+\xc3\x83\x08\x2c\x84\xc5\x33\xb4\x0a\x39\x64\xed\x2e\x9c\x3a\xed\
+\x68\x3c\xfb\xdc\x23\xf0\x7a\xa9\x2c\xc4\xcd\xa2\x91\xd2\x0b\x87\
+\xea\x30\x77\xee\x05\x38\x60\xfc\x11\x06\x0c\xc5\x33\x64\xce\x30\
+\x89\x86\xc6\x28\xc6\x8c\xae\x73\xc0\xd0\xd9\x77\x48\x04\xd7\x09\
+\x8f\x2b\xdb\x53\x3a\x4c\xe4\xba\x75\xb2\x28\x65\x14\xcb\xc1\x50\
+\xff\x76\x43\x27\x7f\x37\x9e\x3d\xf3\xc9\x95\x3d\xc3\x2c\xec\x42\
+\xda\xa8\x23\x09\xa6\x11\xb8\x42\xd2\xa8\xa2\x2b\x9e\x43\x4b\x67\
+\x4a\xfa\x21\xb2\x56\xd2\xa4\x4f\x32\xa8\xa9\x0d\xe1\xcc\xd3\x67\
+\xe1\xaa\x3f\xfc\xde\x80\xa1\x89\x38\x1b\x21\x00\x5f\x48\x36\x02\
+\x77\xdc\x7e\x37\xb6\x1b\xf7\x35\x74\x76\x91\x9d\x4c\xa5\x19\x07\
+\xdc\x9d\x8d\x09\x7b\x3c\xca\x1c\xd8\x9f\x83\xe1\xaa\xd8\xc6\xc1\
+\xf5\xda\xc2\x23\x40\x61\x1f\xdd\x88\xbd\xe1\xf5\x7a\xb7\x1b\xca\
+\x60\xe8\x16\x09\x50\xb1\x5b\xd6\x7e\x9d\x79\xe6\x99\xd8\x6e\xbb\
+\x6d\xa4\x2f\x18\x8d\x97\x9b\xfe\xce\xf5\xcc\x5c\x0b\x3d\xc2\xdd\
+\x77\xdf\x1d\xef\xbf\xff\xbe\x48\x85\xf5\x37\x57\x58\xc9\x50\xad\
+\xf3\x16\x4e\x45\xbd\x8d\x52\xbd\x28\x33\x3c\x86\x68\x61\x58\x77\
+\x9f\x2c\xee\x10\xd6\x21\x41\x48\xc8\x20\x02\x86\x6c\xab\xe4\x93\
+\x5d\x36\x0d\x09\xfb\xb5\xb1\x11\x6b\x7d\x6d\x9d\xd4\x09\xb2\x65\
+\x91\xc5\x16\x45\xa9\xb4\xd9\x50\xf3\xf3\xd4\x23\x74\x81\x61\x28\
+\x58\x83\x78\x3c\x21\xc5\xce\x92\x6f\xaa\xaf\xc5\xbf\xfe\xfd\x3a\
+\xf6\xfe\xde\x6e\xc2\x08\xcd\xe6\x12\x45\x26\x22\x3d\x51\xea\x93\
+\x72\xab\xee\xa3\x41\xa3\x5c\x57\x30\x8f\x5c\x21\x03\x3b\x9d\xc7\
+\x59\xe7\x9e\x8f\x19\x53\x4f\x15\x06\xa6\x06\x12\x53\x29\xe6\xb7\
+\x4c\x94\x4b\x49\x99\x22\xef\x56\xbc\xeb\xfc\x78\xe8\xa1\x47\x70\
+\xd0\x41\x07\xc9\x1c\xeb\x7a\x31\x1d\x0a\x28\xba\xdd\x37\x30\xd4\
+\x48\x82\x1b\x0c\x9f\x7e\xfa\x69\x69\xad\xc3\xb5\xc5\x75\xa6\x5e\
+\x60\x4b\x4b\x9b\xa8\x78\xfc\xe3\x1f\xec\xa5\xd7\xd3\x61\xce\xf0\
+\xc7\x3f\xfe\x31\xee\xbd\x77\x9e\x18\xe3\x58\x67\x17\x6a\xeb\x6a\
+\xf0\xc1\xfb\x8b\x44\x9f\xf2\x5f\xff\xfe\x57\x9f\xe5\x10\x67\x4c\
+\x9f\x81\xb3\xce\x3e\x5d\x3e\x33\x11\x4f\x23\x12\xa5\xec\x98\x71\
+\x76\x08\x86\xad\x2d\x69\x78\x3d\x6c\x42\x1c\x12\xa5\x1f\xe6\x0c\
+\x09\x86\x33\x67\x4c\xc6\x33\xcf\x3c\x2c\x9e\x21\x8b\xf3\xa5\xb6\
+\x31\xe7\x41\x34\xda\x88\x39\xa7\x9f\x87\x5f\xee\x7f\x38\xba\x62\
+\x04\x84\x02\x3c\x04\xcc\x6c\x42\x08\x34\x63\x46\xd7\x82\xd1\x60\
+\xd9\xfc\x68\xee\xb8\xc2\xa5\x2a\x18\x72\x7d\x94\xc4\x1d\x57\x66\
+\x98\xb2\xc7\x85\x39\xca\xc1\xd0\x78\x7c\x66\xc6\x2b\x85\x49\x09\
+\xe2\x19\x78\x45\xe4\xd4\x63\x80\xde\x32\xde\x38\x49\x34\x19\x96\
+\x5e\x38\x8b\x85\xd7\xc6\xf5\xc2\x34\xed\x8c\xe9\xd3\x70\xc9\xef\
+\x2e\x34\xdf\xc7\x3d\x20\x87\xa4\x08\x86\x75\xb8\xe3\xf6\x79\xd8\
+\x76\xbb\xaf\x22\x16\xcf\x08\x18\x4a\xce\x50\xee\x25\x73\x1f\x95\
+\xc0\x90\xa0\x68\x68\xac\xbc\x47\x98\x06\xe8\x9e\x33\x1c\x1a\xa5\
+\x15\xbc\xa6\x6a\xf9\xc1\x4a\x2b\x79\x68\xe7\x0c\xf1\x26\x90\x1f\
+\xa7\x60\xb8\xc2\xe7\xf3\x8d\x70\xb7\x9d\x59\xf9\x82\x87\x46\x69\
+\x05\x27\x92\x74\x79\xee\xfe\x7f\xf9\xcb\x5f\x82\xad\x48\xc8\x7c\
+\x74\x03\xa1\x12\x23\x78\x8d\xdc\xc1\x33\xc4\xb4\xd7\x5e\x7b\x49\
+\x73\x55\x1a\x49\x7e\x06\x0d\xa4\x7a\x8e\xab\x13\x2a\x2d\x5f\x50\
+\x5c\x2c\x3c\xaf\x78\x3c\x2e\xc2\xbf\xb7\xdd\x76\x1b\xfe\xef\xff\
+\xfe\xcf\x74\x34\xf0\x33\x3f\xc3\xda\xa6\xee\x63\x5c\x5e\xef\xb6\
+\xfa\xbb\x29\x06\x75\xb4\xd7\xb9\x63\x2c\x5c\x30\x91\xe2\x7d\xee\
+\x21\x18\xc6\x8c\xe2\xbf\x10\x32\x8c\x51\xcf\xd9\x59\xa4\x92\x69\
+\xd4\x86\x1a\xa4\x50\x3b\x9d\x4a\x89\x31\xf0\xd1\xa2\xb0\x57\x1f\
+\x55\x65\x92\x5d\xd2\x95\x81\x20\x68\xc0\xd0\x31\x2a\x0a\x8a\x14\
+\x2e\x4e\xe5\xe4\xfa\x45\xd9\x24\x97\x15\x15\x92\x7f\xff\xf3\x0d\
+\xec\xb3\xf7\x77\x45\xb7\xd2\x84\xd8\xf8\xcd\xc6\x08\x06\x7c\xd4\
+\x81\x34\x4d\x63\x09\xb6\xf4\x46\x7c\x01\x2f\x98\x4b\x3b\x75\xda\
+\x54\xcc\x9d\x7d\xba\xe4\x70\x52\x89\x34\x6a\x6a\x48\x99\x37\xa3\
+\x53\x04\x42\x79\xa0\xa4\x86\x92\xc9\xd9\xa0\x07\xc7\x0d\x92\xb0\
+\xfd\x32\x2c\x1b\x88\x88\xbe\x29\x0f\x5e\xeb\xc3\x0f\x3f\x2c\xf5\
+\x82\x26\x34\x4c\x0f\xc4\xd4\xfd\xf1\xff\x8c\x19\xb3\x71\xf1\x6f\
+\x7f\x2f\x0c\x4d\x96\x2b\x70\x7e\x0d\x0b\x36\x0f\x82\xe1\x6e\xbb\
+\xed\x22\x1e\xa5\x14\xa4\x3b\x64\x98\x65\xcb\x96\xe1\xc0\x03\x0f\
+\x94\xe7\xa5\x8f\x63\x85\x7c\xb5\x3e\xc6\xb5\x4a\x49\x37\x12\x79\
+\xf4\x78\xf7\xdd\x77\x71\xf0\xc1\x07\xe3\xa5\x97\x5e\x92\x82\x71\
+\xbd\x3f\xdd\x91\x0d\xdd\xb8\xf1\x7c\xb8\xb6\xe8\xbd\x9e\x70\xc2\
+\x09\x45\x56\xab\xd4\x4a\xd2\x71\xc9\x03\xef\x7d\xb8\x1c\x6d\xed\
+\x29\x78\xbc\x61\xd8\x59\x53\x6f\xe7\xb1\x6c\xc4\xbb\x9a\x31\x6b\
+\xfa\x14\x3c\xb7\xe0\x51\xa7\xaf\x64\x56\x3c\x20\x8a\x52\x07\x23\
+\xf5\xc5\x30\x29\x65\xf5\x58\x67\x68\x08\x34\x09\x0c\x6b\xac\xc5\
+\x7a\xa3\x6b\x05\x64\x8a\x60\xd8\xcb\x22\x95\xf6\x4b\x2e\xfa\x4f\
+\xdf\x6b\x97\xab\xe7\x5a\x55\x99\xc6\x80\x68\xc9\xfb\xd6\x32\x8b\
+\xb4\x9d\x13\xed\x55\x7e\x7f\x5e\x3a\xab\xb0\x01\xb5\x85\xb9\xb3\
+\xe7\xe2\xec\xb3\xcf\x76\xc8\x37\x54\xd4\x09\x08\x90\x66\x73\x39\
+\x34\x34\x0c\xc7\x75\x37\xdc\x88\x1d\x77\xda\x05\xed\x1d\x69\xd9\
+\xa0\x71\xbc\xa5\xf9\x79\xc1\xa8\xf1\x68\x24\xca\x90\xef\x18\xf4\
+\x60\xeb\xb0\x1c\xec\x4c\x16\x23\x47\x8d\xc0\x3d\x77\xcf\xc3\xac\
+\x19\xa7\xa2\xb5\x6d\xdd\x82\xa1\x8a\xa8\x68\x44\xc4\xfd\xb7\x02\
+\x20\xaf\xc1\x5d\x92\x56\xa9\xc0\x7f\xf5\x6d\xd0\xa0\x7e\x67\x33\
+\x90\x1f\x69\x7d\xe9\x4b\x5f\x0a\xfc\xfb\xdf\xff\x4e\x33\x7c\x38\
+\x94\xc1\x50\x0d\x10\x8d\xa7\x82\x17\x77\xdb\xd7\x5f\x7f\xbd\x48\
+\x75\x11\x58\x44\x8d\x5f\xe4\xb9\x4a\xb5\x5f\x04\x21\xb6\xc8\xd9\
+\x67\x9f\x7d\xc4\xe8\xb8\xcb\x2e\xd4\x7b\x70\xe7\x15\xfb\x3a\xa5\
+\xe5\x60\xc8\xf1\xe5\xe2\x22\xc3\x70\xf3\xcd\x37\xc7\x5f\xfe\xf2\
+\x17\x7c\xf3\x9b\xdf\xe8\xf6\x71\x94\x2a\x73\x8b\x07\xf0\x49\x02\
+\x65\x7f\x0f\x1a\xa1\x02\x32\x60\xa0\xca\x2b\xa5\x0b\x3e\x69\x4e\
+\xca\xe1\x10\xa5\xb2\x3c\x10\x4f\x02\x4b\x96\xb2\x73\x84\x17\xd9\
+\x7c\x56\x42\x8e\xa1\x08\x59\xb8\x04\xaf\x3c\xfc\x08\x88\xc1\xa3\
+\x97\xc8\xa2\x70\xe9\xf3\x67\x67\x44\xd6\x4b\x4b\x30\xca\x08\xe7\
+\xdd\xd8\x95\x64\x13\xea\x8d\xc8\x82\x7d\xce\xc5\x5b\xff\x7c\x03\
+\x07\xee\xf7\x4b\xa4\xe2\x1d\x72\x89\x64\x7d\xfa\x29\xdf\x96\x8a\
+\x3b\xfe\x6a\xc9\x43\x10\x43\xea\x50\xbc\xd9\x53\xed\xbc\xf3\xce\
+\x2b\x51\xda\x9d\x4e\x0a\xe5\xbb\xda\x6e\xe0\xe3\xf1\x60\xfe\xe3\
+\xf3\xf1\xbd\xbd\xf6\x32\xc3\x59\xf0\x88\xf4\x1b\xc9\x22\x34\xfc\
+\xb5\x35\x11\xdc\x7e\xfb\xed\xd8\x63\x8f\x3d\xc4\x20\x18\x50\x2a\
+\x19\xe1\xe9\xd3\x4f\xc3\x45\x17\x5e\x8c\x9c\x48\x91\x19\x30\x14\
+\xd6\x31\x6c\x29\xad\xd8\x7d\xf7\xdd\x1c\x22\x62\xe9\x3c\x99\xeb\
+\x63\xf8\xf3\xc5\x17\x5f\x94\xf1\xea\x0d\x0c\xf7\xdb\x6f\x3f\x59\
+\xab\x1c\x23\x55\xac\xf9\xf0\xc3\x0f\x31\x61\xc2\x04\xbc\xfe\xfa\
+\xeb\x62\x78\xdd\x0c\x68\x7e\xbf\x1b\x08\xcd\xc6\x2e\x83\x4b\x2e\
+\xb9\x04\x93\x27\x8b\xd4\xa2\x1c\xfc\x5e\xb6\x57\x0a\x06\x82\x78\
+\x6f\xd1\x0a\xb4\x77\x26\x01\x0f\xbd\x42\x2f\x2c\x9f\x97\x3c\x53\
+\x74\x75\xb5\x60\xf6\xb4\x13\xf1\xdc\x82\xf9\x08\x79\x3d\x48\xdb\
+\x69\xd9\xf8\xb0\xc3\x7c\x30\xdc\x80\xd9\x67\x9c\x83\x03\x0e\x38\
+\x4c\xea\x0c\x59\x94\x4e\x30\xcc\x67\x12\x42\xa0\xa9\x06\x86\xae\
+\x48\x69\x7f\x97\x71\xaf\xef\xd7\x0d\x42\xf9\x8b\x94\xe8\xc2\xf8\
+\x07\xb3\x96\x84\xc9\x6c\x2e\x2b\x9b\x39\x86\x50\x67\xcf\x9c\x8d\
+\xf3\x2f\x38\x1f\xe1\x60\x14\xc9\x0c\xdb\x3e\x69\x71\x8a\x17\x94\
+\x20\xbb\xf9\xb6\xdb\xb1\xcd\x97\xc6\x21\x9b\x63\x44\x24\x8d\x60\
+\x20\x2c\x1a\xaf\xdc\x40\x7b\xfd\x3e\xc9\x3d\x33\x77\xcd\xfb\x5b\
+\x52\x30\x36\x73\x97\x39\xe4\xd3\x25\x30\x9c\x31\xf3\xd4\x41\x53\
+\x74\xaf\x84\xc0\xde\xa4\xd4\xf4\x3e\xe3\x3d\xa0\x5d\xee\xb9\xd1\
+\xfa\x6c\x1f\xf9\xa0\xb5\xfe\xfa\xeb\x6f\xd4\xd4\xd4\xf4\xb1\xde\
+\xa8\x3d\x0b\xbe\x0e\x1d\xcf\x90\x9e\x20\x17\xe8\x4f\x7f\xfa\x53\
+\x5c\x7a\xe9\xa5\xd8\x60\x83\xf5\x25\x1c\x5a\x52\xda\x37\x6c\x44\
+\xb6\xf6\x49\xa7\x33\x42\xd3\xa7\xc7\xf0\xf2\xcb\x2f\x8b\xf1\xd0\
+\xa3\x3f\x32\x43\x95\x3c\x43\x5d\x64\xcc\x65\xb2\xd3\xc1\x36\xdb\
+\x6c\x53\x0c\xd7\xd1\x6b\xe2\x79\x7c\xe7\x3b\xbb\x77\x5b\x73\xf4\
+\x36\xb4\x80\x7b\x75\x17\xa3\xf1\xb6\x4c\xe6\xcd\x03\x1f\xd2\x19\
+\x1b\x9d\xcc\xa1\xc0\x0b\x8f\x97\x02\xcc\x34\x10\x05\xb4\xb6\xb7\
+\x49\x89\x43\xae\xe0\x94\x3b\x50\xc0\xa0\x90\x13\x6f\x6f\x58\x4d\
+\x0d\x3e\xfe\x70\x91\x34\x4e\x8d\xd6\x44\xc4\xf0\x66\x32\x29\x11\
+\xdf\x66\x4e\xd1\xac\x1b\x27\xcf\x4a\x3d\x2e\x29\xb6\x37\x7f\x8b\
+\xbf\x28\x1d\xdb\xcd\x86\x80\x06\x95\x80\xf7\xd6\x5b\x6f\xe2\x37\
+\x27\x4e\x46\x67\x5b\x8b\xf4\xc4\x63\x07\x76\xee\xac\x09\xb2\x04\
+\xdc\x91\x23\x47\x4a\x9e\x91\xbb\x58\xd6\x79\xe9\x8d\x7c\xd8\x61\
+\x87\xc9\xf8\xf1\x79\x6e\x2e\xf8\xdd\xbc\x71\x2b\x8d\xb9\x86\x6f\
+\x52\x99\x34\x1e\x7f\xfc\x71\xfc\xf8\x47\x3f\x42\xb4\xa6\x46\xf2\
+\x8d\x1c\x57\x21\xd0\x14\x0a\xa8\xab\xaf\x97\xce\x1b\x7b\xed\xf9\
+\x9d\xe2\x30\xab\x91\xe3\xf7\x4f\x9f\x3e\xb3\x08\x86\x7c\x01\xc5\
+\x02\x04\x9c\x0a\x39\x50\x81\x86\x75\x86\xe2\x79\x38\xb1\x16\x3e\
+\xc7\x4d\x16\x89\x35\x04\x33\xad\x21\x2c\x27\xbf\xe8\x7d\xc7\x8d\
+\x1b\x45\x90\x05\xa7\x1d\x15\x93\x45\x8b\x16\xe1\x07\x3f\xf8\x81\
+\x74\x36\xe7\xc6\xcc\x0d\x86\x7c\x5d\x25\x30\xa4\x4a\x0e\x3d\x43\
+\x5e\x9b\xea\xac\x8a\x7e\x27\x3d\xc3\x5e\xc0\xf0\xb4\xa9\x27\x60\
+\xc1\xc2\xc7\x87\x2c\x18\xea\xa4\xb9\xc3\x75\xba\x1e\x08\xc8\x2c\
+\xdf\x21\x01\x2b\xe8\x33\xa1\x4e\xae\x69\xde\x5b\xb3\x66\xcc\xc4\
+\xf9\x17\x30\x4c\x6a\xec\x9b\xf4\x07\xf1\x33\x22\x52\x90\xf1\xbb\
+\xff\xa1\x07\xb1\xe9\x26\x5b\x20\x9d\x81\xb4\x20\xab\xaf\x6f\x94\
+\x1a\xcc\xf6\xf6\x4e\x59\xcb\xe1\x68\x44\x5a\x92\xc9\xba\x76\xc0\
+\x90\x1b\x24\x3b\x95\xc1\xa8\xd1\x23\x31\xef\xae\xbb\x31\x7d\xc6\
+\x29\xe8\x68\xfb\x74\x50\x28\xd0\xa8\x0d\xe2\x9a\xe6\xef\xfc\xc9\
+\xf3\x66\x24\x4d\x81\x9d\xe3\xd3\x73\xdd\xf0\xea\x5a\xa1\xc1\xfe\
+\xbe\xfc\x58\xde\xba\x3b\x04\x83\xc1\x57\x54\xc2\xac\x7c\x31\x95\
+\xfe\x1e\xdc\x60\x58\xee\xbd\xd1\xf8\x70\xb7\x7d\xc1\x05\x17\x60\
+\x83\x0d\xd6\xeb\x71\x26\xe8\x19\xd2\xe8\xd1\x98\xd1\xe8\xb8\x8b\
+\xf3\xdd\xfa\xac\xab\x3a\x95\xe5\x86\x59\x6b\x1d\xb9\xc8\x38\xa6\
+\x94\x6a\x52\x61\x67\x3e\xc6\xd7\xb3\xff\x19\x19\x8d\xe3\xc6\x8d\
+\x93\x05\x4a\x05\x93\x81\x38\x74\x77\x2e\x5e\x20\x80\xce\x8e\x14\
+\x9a\x56\xb4\x23\x9b\x29\x80\x84\x14\xb6\x56\xf2\x05\xa8\x09\x9a\
+\x95\x1b\x82\x61\x4e\x01\x37\x32\x38\xd3\x69\x04\xfd\x16\xde\x7a\
+\xe3\xef\xb8\xeb\x8e\x5b\xb0\xe8\xfd\x0f\xc4\x63\x24\x68\x09\x3f\
+\x30\x6f\xfc\x4e\xe6\x02\x35\x57\x28\x3f\x09\x86\x92\x33\x34\x39\
+\x96\x68\xb4\x56\x80\x8b\xd7\x29\x5a\xa4\xb6\xf1\x3e\x9f\x7f\xee\
+\xb9\x6e\xc4\x7b\x05\xd4\x5d\x77\xdd\x19\x07\x4f\x1c\x8f\xda\x68\
+\x8d\xbc\x27\x14\xae\x15\x40\xe1\x4d\xbb\xd5\x56\x5b\xe1\xcb\x5f\
+\xfe\x72\xd5\xa1\x71\xb3\x2f\xe9\xfd\x3d\xfe\xc4\xe3\xd8\x6b\xcf\
+\x3d\x11\x0a\x87\x25\xbc\xca\xc3\xe7\x84\xc5\x39\xd7\xf4\x0c\x7f\
+\xf0\xfd\xbd\x8b\x9f\xeb\x66\x86\x4e\x3d\x75\xa6\x84\x20\x8d\xce\
+\xaa\x29\x6a\x97\x68\x4a\x21\x27\x42\xdd\x25\x05\x1a\x03\xb0\x0a\
+\x54\x14\xf7\x26\x18\x56\xf3\x0c\x09\x7a\xf7\xde\x7b\x6f\x71\x4d\
+\x10\xfc\x48\xe8\xe2\x86\xee\x8d\x37\xde\x90\xc7\xcb\x73\xfa\xfc\
+\x0e\x33\x9e\x46\x04\x81\xe0\xcb\x73\x64\x7f\x45\x05\x4e\x73\x8e\
+\x66\x88\xdf\xfd\xc0\x78\x86\x16\xc3\xa4\x39\x4f\xd1\x33\x8c\xc7\
+\x5b\x31\xeb\xd4\xc9\x3d\x82\xe1\x9c\x33\xcf\xc5\xfe\xfb\x1f\x3a\
+\xa8\x3d\x43\x37\x18\xaa\x97\xe8\x06\x43\x6e\xf0\x24\x34\xea\x14\
+\x7f\xb0\xbe\x95\xf3\x3b\x77\xf6\x1c\x01\x43\x7a\xce\x1c\x27\x46\
+\x3e\x6c\x79\x2e\x07\x7f\x28\x24\x21\xee\x8d\xc7\x6e\x0a\x2a\x34\
+\x91\x5d\x2b\x80\xe7\xf1\x8a\x22\x8d\x64\xc8\xbd\x46\xb9\x4a\x3d\
+\x75\xb2\x51\x09\x86\xdc\xc4\x8d\x1e\x39\x62\xd0\x80\xa1\x3b\x72\
+\xd6\xd3\x8d\xa3\x9b\x4d\xd5\x48\xa5\x0d\xe8\x8f\x0d\xac\x7a\x83\
+\x0e\xaa\x17\xe4\xbf\x46\x30\xdc\x3b\x14\x0a\x3d\xac\x4a\xfc\x15\
+\x77\x56\x92\x7f\x19\xdc\x60\x58\x5e\x0f\xc8\xc5\xc9\xd6\x42\xbf\
+\xf8\xc5\x2f\x04\x78\x68\x28\x14\x30\xd5\xfb\xe5\xb5\x4a\x18\x29\
+\x93\xc1\xd5\x57\x5f\x8d\xa6\xa6\xa6\xa2\x67\xa8\x8b\x5b\x17\xfa\
+\xaa\x26\x88\x7b\xf2\x0c\xb5\x50\xdb\x1d\xae\xa0\x51\xe3\x39\x90\
+\xf1\xca\x50\xed\x17\xbf\xb8\x65\x31\x87\xa8\xe1\xdd\x4a\xaa\x26\
+\x7d\x5d\x4b\x62\x0b\x1d\xb5\x7d\xbe\xa7\xa3\x3d\x8b\xe5\x4d\x2d\
+\xa2\xd9\xe9\x0b\x90\x55\x48\x2f\xd9\x87\x9c\x9d\x97\x1d\x6e\xce\
+\x69\xea\xc6\xef\x24\x18\xd6\x44\xfd\x78\xf1\xf9\xf9\x38\xeb\xcc\
+\x39\x78\xe7\xdf\xff\x2e\x7d\xad\x43\x18\x28\x3e\x20\x7f\xbb\xd8\
+\x84\x45\x0f\x91\x44\x3e\x1f\xf2\x4e\x4b\x27\xc3\x52\x00\x22\xd1\
+\x30\x12\xff\xcd\x73\xb1\x63\x3c\x41\x8e\x21\xe1\x6c\x8e\xe1\x6c\
+\xe0\xa0\x83\x0e\x94\xb6\x49\x35\xec\xf0\xee\x22\x4e\xa8\xe7\xae\
+\xe5\x33\x1c\x67\x15\x5c\xa8\x34\x1e\xc5\x79\xb3\x2c\xdc\x73\xef\
+\x3d\xf8\xf9\xcf\x7e\x26\xe1\x51\xcd\x8f\x44\xd9\x3c\x37\x95\x12\
+\x2f\xf3\xda\x6b\xaf\xc5\x9e\x7b\xee\x59\x1c\x7b\x25\x5b\x71\x9c\
+\x4e\x9b\x39\x0b\x17\x5f\x6c\xc2\xa4\xe5\x60\xc8\x86\xab\x6e\x8f\
+\x5e\x81\x8b\xd7\xc4\xb0\x2b\x73\xd1\xd5\x3c\x43\x86\xe9\x99\x47\
+\x66\x84\x80\x07\xaf\x73\xf1\xe2\xc5\x92\xf7\x7e\xf5\xd5\x57\x8b\
+\x9e\xa1\x7a\x8e\x7a\xad\x0a\x86\xba\x89\x9b\x3b\x77\xae\xb0\x52\
+\x35\x55\x60\xbc\x57\xe6\xc7\x3c\x78\x6f\x51\x33\xda\x3a\x58\xa6\
+\x12\x5e\x29\x4c\x3a\xf3\x94\xe3\xb1\xf0\xf9\x27\x56\xf2\x0c\x43\
+\x91\x46\x09\x93\x0e\x45\x30\x94\x79\x72\xc4\xbc\x75\x23\x48\x83\
+\x97\x4a\x67\xa4\x4e\x96\x39\xfa\x33\x4f\x3f\x07\x67\x9f\x7d\x0e\
+\x32\x22\x51\x64\x08\x65\x3e\x89\x76\x78\x51\xdb\x50\x8f\x7b\xee\
+\xb9\x07\x1b\x8d\xdd\x04\xc9\x38\xfb\x69\x86\x4d\x63\xdd\x02\x50\
+\x53\x5b\x2f\xf7\x6c\x2e\x5f\xc0\x88\x11\x75\x68\x69\x89\x99\xc8\
+\x93\x88\x94\xb2\x65\x55\x06\x23\x05\x0c\xef\xc0\x8c\xe9\xa7\xa0\
+\xb3\xbd\xf7\x16\x4e\x7d\xbd\x97\x07\xe2\x75\xdc\x98\x4b\x2e\xde\
+\x31\x2a\x5c\x3b\xda\x71\x46\xc3\xbd\xda\xce\xec\x7f\x27\x6f\xe8\
+\x11\x36\xe9\xf8\x50\x28\x74\xd3\x50\x07\x43\x5d\x24\x9c\x4c\x15\
+\x61\xa6\x21\x20\xc0\xd0\x28\x95\x83\x53\x71\xd7\xe8\x74\x6b\xd6\
+\x2e\xdf\x0a\x7e\x9a\x13\x92\xd0\x89\x53\xcc\xbf\x2a\x0b\xb1\xd2\
+\xf7\xa9\xc2\x8d\xec\x50\x9d\x1c\xad\x09\xd7\x9a\x52\x0e\x1a\xcc\
+\x85\x0b\x17\x62\xeb\xad\xb7\x76\x12\xf3\x5a\x17\xa9\x6d\x6e\x56\
+\xe5\x0c\xba\xbf\x56\x5b\xb9\xf1\xd1\x58\x67\x1e\xcb\x9b\x5a\x65\
+\x67\x1c\xf0\x87\x61\x17\x98\xcf\x33\x9a\xae\x3c\x12\x4e\x0e\xc4\
+\xe3\x33\x2a\x28\xc3\x1b\xc3\x78\xe5\x6f\x4f\x61\xda\xa9\x27\xe0\
+\xdd\x77\xde\x31\x9e\x55\x32\x29\x9d\xbf\x99\xe3\xa3\x07\xc8\xfc\
+\x8b\xf1\x08\x39\x60\xa4\xec\x1b\x06\xa3\xfe\xa4\xfc\x1a\xbd\xb0\
+\x80\xdf\x2f\xef\x4b\xa7\x12\xc5\x3c\x98\x9e\x29\xa9\xee\x26\xfc\
+\x9a\xc7\x4f\x7f\xba\x2f\xae\xbf\xfe\x5a\xd4\xd5\xd6\x21\xcd\x10\
+\x37\x3b\xad\x4b\x87\x8b\x52\x25\x5a\xf9\x18\x57\x03\xc3\xdb\x6e\
+\xbf\x0d\x87\x1c\x72\x48\xf1\x3a\x25\x6f\x92\x35\x22\xe2\xc3\x47\
+\x8c\xc0\x75\xd7\xfd\x05\xfb\xee\x5b\xf2\x0c\x69\xd7\x08\x88\x0c\
+\x23\xcf\x9c\x31\x13\x97\x5d\x76\x69\xb7\x73\x96\x79\x2b\x98\xee\
+\xe3\x64\x23\x9b\x39\x2c\x6d\x1a\x19\x3e\x3b\xe9\xa4\x93\xf0\xca\
+\x2b\xaf\x14\xdb\x3e\xb9\xc3\xa4\xee\xcd\x19\xa3\x18\x2c\xa3\x90\
+\x3e\x7c\x4e\x7f\xba\x4f\x3f\xfd\x14\x04\xb7\x17\x5e\x78\xa1\x78\
+\xdd\xee\xbc\xa3\x1b\x10\x59\x3e\xc4\xe3\xd0\x43\x0f\x15\xd2\x0d\
+\xef\x01\xf5\x90\x64\x33\x24\x61\xd2\xe6\x1e\x73\x86\x0a\x86\x41\
+\x8f\x85\x8c\xb0\x32\xfd\x22\xf0\x4d\x30\xa4\x67\xb8\xdf\x7e\x87\
+\x0c\x09\xcf\xb0\x7c\xb3\x20\x7f\x93\x40\x54\x20\xe1\x09\xc2\x7c\
+\xe5\x7c\x06\x4d\xa5\x0a\x66\xce\x38\x03\xe7\x9e\x7b\x8e\xa4\x0f\
+\x82\xe1\x90\xcc\xa1\x09\x11\x16\x30\x72\xcc\x18\x5c\x7b\xdd\x75\
+\xd8\x71\xc7\x6f\x61\xd9\x92\x65\xa8\xad\x69\x94\xf9\x27\x0d\x28\
+\x1c\xad\x91\xf1\xe8\xe8\x88\x21\x5a\x6b\xa2\x17\xb2\x29\x2b\x98\
+\x3c\x32\x3d\xc3\x11\x23\x86\x0f\x1a\x30\xac\x04\x6a\xcc\x89\xb2\
+\x5b\x0b\xd3\x33\xb4\x43\xd2\x67\xb4\xae\x0e\xcc\x55\xd3\x66\xf2\
+\x70\x37\x3e\x58\x7d\xeb\x33\x14\xde\x69\x4d\xa0\x65\x99\x1c\x0c\
+\x06\x2f\x91\x49\x76\x6a\xeb\x74\x47\xe5\xbe\x84\x42\xa9\x45\xf7\
+\xa0\xbc\x32\x77\x98\xd4\xed\x25\xba\x3d\xb0\xf2\xdd\xb4\xfb\x42\
+\xb4\x63\x85\x7a\x1e\xfd\x2d\xbc\x2f\x37\xd4\x3c\x0f\x77\x3e\x52\
+\x95\x6e\x14\x20\xf9\x7d\x5c\xb0\x0b\x16\x2c\xc0\xb6\xdb\x6e\xdb\
+\xcd\xa8\x56\x17\x7b\xae\x3e\x25\xaa\xe2\x45\x91\x61\x82\xe1\x8a\
+\x15\xad\x48\x53\x1c\xdb\x4b\x2f\x89\x44\x9d\xa0\x18\x0c\x1a\x50\
+\x7a\x4a\xa2\xdd\xe9\x84\x49\x47\x8c\xa8\xc1\x8b\xcf\x3d\x82\x13\
+\x4f\x38\x06\x4b\x3e\xfd\xb4\xc8\xc2\x14\x56\xa9\x86\x47\x19\x0e\
+\x75\xd8\xa3\xca\xb2\x67\x02\x4d\xd9\x83\x26\x17\xe3\x43\x3a\x99\
+\x92\xb0\x2a\x59\xa8\x64\xe4\xd1\x13\x62\xd8\x54\x3d\x43\x01\x0b\
+\x2b\x8f\x1f\xfd\xf8\xc7\xb8\xe1\xc6\xbf\x20\x42\x16\xa5\x10\x7f\
+\x48\xda\x31\x1b\x06\x1e\x04\x69\xcd\x01\x4b\x28\x37\xd8\x73\x67\
+\x08\xf3\x99\x16\xe6\xdd\x33\x4f\xc0\x85\x20\xc5\x1d\x3e\xcb\x29\
+\x08\x78\xfc\xac\x4d\xb7\xf8\x02\x66\xcd\x9a\x85\x9d\x76\xfc\x96\
+\xb4\xe4\xe1\x98\xb0\x4e\xaf\xb6\xd6\x94\x85\x1f\x7f\xdc\x6f\x70\
+\xd5\x55\x57\x16\x81\x8a\x34\x0b\xe6\x0d\x79\xae\x0c\x93\x92\x40\
+\xc3\xf3\x23\x78\x12\xd0\xb5\x3b\x02\xcb\x75\x44\x70\x80\xe1\xe7\
+\x5e\xd8\xa4\x7c\x8e\x45\xf7\x5c\x0f\xba\x56\xf8\x19\xef\xbd\xf7\
+\x9e\xb0\x44\xd9\x5b\xce\x6d\xe8\xcb\x23\x15\x2c\x17\xe1\x75\xb0\
+\x11\x2d\xbd\x5c\x7d\xad\x7a\x46\x26\x4c\x6a\xc0\xb0\x52\x98\x74\
+\xc6\xc9\xc7\x89\x67\xf8\x59\x00\x43\xbd\x1b\x8a\x3c\x08\x6a\xb0\
+\xb2\x56\xd6\x06\xc8\x47\x93\xb9\xcd\x9a\x32\x18\x32\x84\x49\x5c\
+\xfa\xf4\x93\x8f\x4d\xed\x85\x13\x15\xf1\xf8\xfc\xf8\xea\x57\xbf\
+\x8a\xa9\xd3\x4f\x95\x8d\x4e\x57\x67\x1c\x7e\xbf\x11\xb1\x4f\x24\
+\xd3\x48\xa6\xb3\x88\xd4\xd4\x88\xec\x5d\x2c\x96\x40\xd6\x36\xbd\
+\x3b\x09\x86\xea\x19\x2a\x18\x4e\x9f\x76\x32\x62\x1d\xcb\xd7\x69\
+\xce\xd0\x6d\x1f\x79\x9e\x04\x39\x6e\xd4\x18\x79\xe0\x7a\x55\x72\
+\x1f\xed\x10\x6b\x71\x99\xbf\x56\xdd\xde\xea\xd6\x65\xe8\xbf\xc2\
+\xe3\xf1\x9e\x40\x5b\x35\x37\x18\x0c\xce\xa9\x04\x86\xee\x01\x1c\
+\xec\x60\xe8\x9e\x0e\xf5\xb6\x94\x59\xaa\x21\xcf\x72\x72\x90\x7b\
+\x97\xae\x0c\x3e\x55\xae\x71\x03\xea\x40\x79\x86\x7a\x73\xaa\x67\
+\xa8\xe1\x34\xdd\xb5\x51\x05\xe5\xf9\xe7\x9f\xc7\x36\xdb\x7c\x49\
+\x88\x18\x95\xca\x2d\x56\x77\xd9\xb9\xf3\x86\x89\x44\x01\x2d\xcd\
+\x6d\x46\x69\xc4\x67\x0c\x3f\x89\x31\xc5\x10\x89\x9d\x13\x42\x0a\
+\xcf\x97\xac\xb9\x61\x0d\x51\xbc\xfd\xd6\xdf\x70\xe4\x91\x93\xf0\
+\xd1\x47\x9f\x38\x61\xcd\x84\x00\xb6\xb4\xcb\x61\x3e\xc6\x25\xc4\
+\x55\xc9\x63\xa3\x67\x4a\x2d\x52\x32\xf9\x78\x90\x95\xc7\xf6\x4d\
+\xec\x12\xce\x12\x05\xc9\xc1\xf9\x4c\x37\x01\x96\x39\xfc\xe4\x67\
+\x3f\x15\xcf\x50\xd9\xb4\x1e\xf8\xe5\xa6\xe5\x4d\xcc\x43\x3b\x4d\
+\x94\x03\x63\xa5\xf1\x51\x30\x5c\xde\xb4\x5c\xf2\xc2\xc3\x86\x0d\
+\x93\x97\x11\x0c\xbb\x62\x09\xd9\xd5\x37\xb5\xb4\xe2\x2b\xdb\x7f\
+\x55\x74\x44\xd9\xa7\x8e\xe7\xc7\xf1\xf1\xfb\xc2\x48\xa5\xbb\x70\
+\xe1\xf9\x67\xe1\xc6\x1b\xaf\xeb\xf6\xf1\x64\x95\xd2\x7e\x92\x40\
+\xf3\xad\x6f\x7d\xab\x1b\xd1\x89\xdf\xa9\xe2\xdb\xe5\xc6\xd9\xbd\
+\xd9\xd4\x35\xa1\xeb\x4d\x85\xe5\xdd\xc0\x57\x29\xe4\xee\x7e\x9e\
+\xbf\x2b\x0b\x9a\xbf\x6b\xbb\x32\xdd\x20\x64\xb9\x89\xf0\x32\x4c\
+\xda\x52\x0c\x93\x32\x67\xe8\xf1\xfb\xe0\x2d\xd8\x60\xce\xb0\x27\
+\x30\x0c\x47\x87\x49\x98\x74\x28\x79\x86\xee\xf1\x96\x70\x78\x1e\
+\x72\xdd\xf1\x44\x0a\xe1\x60\xc4\x94\xc5\xd8\x79\xd4\xd5\xd5\xe0\
+\xa5\x97\xfe\x8e\x77\xdf\x7b\x0f\x51\x67\xb3\xc2\x35\x46\xb5\x25\
+\x6e\xb0\x3a\x3a\xda\xb1\xac\x69\x29\x5a\x5b\x5a\x90\x4d\xa5\xa5\
+\xeb\x49\x6d\x4d\x1d\x32\xcc\x97\x17\x2c\xec\xb5\xf7\xf7\xb1\xf3\
+\x2e\xdf\x16\x32\x4d\x20\x14\x74\xc0\x90\xdf\x9e\x47\x36\x93\x2a\
+\x7a\x86\x83\x01\x0c\xd5\x86\x29\x43\x9e\xeb\x8d\x0d\xa9\x0f\x3f\
+\xfc\x50\xb9\x2e\x43\xa4\x31\x51\x97\x23\x8f\xfc\xb5\xa4\x8d\x78\
+\x28\xbb\x79\x55\xd3\x44\xab\x6b\xa7\xd6\xd5\xfb\x7c\x3e\xdf\xe9\
+\x96\xdf\xef\xff\x7d\x3e\x9f\x3f\xa1\x5a\x8b\x8e\xc1\x9e\x33\xac\
+\x36\x88\xd5\x42\x6a\xeb\x62\xb2\xf5\x9c\x34\x24\x2b\x54\xee\x9b\
+\x6f\x16\x49\x30\xde\x60\x04\x47\x7a\x30\x26\xdf\xd4\xcf\xe6\xca\
+\x2c\x8e\x17\xd1\x67\x1b\x5d\x5d\x71\xb4\x77\x76\xc9\xce\x98\x94\
+\x02\xee\x78\x4d\x31\x71\xe5\xbc\x30\xeb\xff\xde\x78\xed\x45\x9c\
+\x79\xc6\x6c\xfc\xeb\xdf\x6f\x23\xe0\xf7\x09\x50\x33\x44\xc8\x70\
+\x1a\xcf\x4d\xc8\x07\x4e\x23\x5f\x9f\x97\xf9\xc7\x1c\xc2\xa1\x30\
+\x92\x29\xb6\x52\xf2\xc0\x27\x61\x37\xca\xb7\x99\x3a\xce\x2c\x43\
+\x8a\x42\x56\xb0\x4d\xeb\x22\x0f\x0d\x54\x06\xb5\xb5\x75\x88\xc5\
+\xda\x31\xe1\xe0\x09\xf8\xc3\x1f\x2e\x43\x6d\x6d\x54\x5e\x43\x0f\
+\x74\x20\x0e\xdd\x14\xe8\x67\xb9\x2b\xd8\x96\x2d\x6b\x43\x73\x4b\
+\x1b\x0a\x05\x8f\xb4\xf0\xe1\x06\x90\xbd\xff\x02\x41\x2f\x66\x4d\
+\x3f\x11\x77\xde\x79\xab\x78\x83\xa6\xbe\xd0\x30\x4a\x39\x06\x2c\
+\xad\x28\x69\x93\x96\x00\x9b\x73\xc7\x4d\x85\x7a\xda\xbd\x9d\x7f\
+\xa5\xf5\xe7\x5e\x1f\xd5\xd6\xa7\x8a\x87\xf3\x75\x46\x61\xc5\x90\
+\x78\x24\x02\xc1\x7c\x31\x5b\x38\x7d\xd4\x8c\xce\xae\x74\xd1\x33\
+\xa4\xe6\x9a\x96\x56\x4c\x3f\xe9\x58\x3c\xff\xc2\x93\xc5\x9c\xa1\
+\x3b\x4c\xaa\xa5\x15\xad\x6d\x1d\xc2\x04\x96\x4e\x5b\x76\x1a\x75\
+\xf5\x11\xac\x37\xba\xae\xd8\x9e\x8b\xca\x35\x34\xa8\xea\xa9\xd3\
+\x03\xaf\xad\x6b\x30\xfd\x45\x6d\x23\x98\x4f\x2f\x99\x9b\x10\xdd\
+\xd8\xe8\x18\x0d\xc8\xdc\x3a\xca\x52\x02\x47\x52\xf7\x67\xd6\x73\
+\x7b\x47\x1c\xcb\x57\xb4\xcb\xfa\x96\xba\x43\x86\x47\x1c\x8d\x52\
+\xa9\xb5\xf4\xfb\xa4\x21\x71\x29\x8f\x96\x17\x21\x6f\x6e\x48\xc7\
+\x8f\x3f\x10\xaf\xbc\xf4\x82\x99\x77\x51\x99\x61\x3d\xad\x4f\x88\
+\x63\xe7\xfd\xf6\x52\x4c\x9c\x34\x09\xad\xad\xb1\x62\xd9\x90\x19\
+\x73\x0f\x92\x89\x2e\x01\xc3\xbf\xde\x3b\x0f\xd3\xa6\x9e\x84\x8e\
+\xb6\xa5\x6b\xd4\x33\x74\xa7\x5a\xdc\x11\x28\x25\xc0\x94\xd7\x4c\
+\xf3\x71\xd6\x60\x53\x84\x42\x23\x2c\xba\xb1\x64\xb3\x6a\x96\x7e\
+\xf1\x60\x44\x83\x73\xa6\x87\xdb\x31\xd0\xe8\x96\xd4\xed\xba\x58\
+\xf8\x03\x31\x97\xeb\xe0\x33\x2e\xe1\xaa\xb8\xce\xeb\xf5\x1e\xf2\
+\x39\x18\x96\x9b\xc9\x35\x3f\x1d\x6e\x63\xc7\x05\x49\x03\xc6\x50\
+\x19\x8d\x06\x09\x3f\xaa\x9f\xc9\x10\x59\x3c\x1e\xeb\xd7\x09\x31\
+\x34\x29\x80\x47\xd2\x50\x36\x8f\x54\x96\x2d\x94\xf2\xf0\x7a\x7c\
+\x12\x22\x25\x48\x16\x77\xd4\x2e\x31\x11\x47\xdc\x0a\x75\x91\x10\
+\xde\x7b\xf7\x3f\xf2\x1e\x9e\x57\xac\xcb\x9c\x0f\xeb\x0c\xe9\xed\
+\x09\x6c\xb0\x69\x6a\x8e\x5d\xd4\x99\x4b\x73\x28\x8c\xb0\x30\x76\
+\xc3\xb1\xd2\xb4\xd7\xd0\xb7\x99\x5f\x31\x37\x0f\x89\x0a\x64\xa5\
+\x92\x91\xc7\xf7\x26\x12\x5d\x42\xaa\xa1\x31\x99\x30\xe1\x20\x9c\
+\x7c\xca\x14\x04\x83\xc6\x80\x89\xb0\xc8\x00\x1c\xbd\x81\xe1\xd2\
+\xe5\x6d\x68\x69\xee\x40\x21\xcf\xf3\x09\x49\xff\x44\x6e\x16\x28\
+\x15\x77\xda\x8c\xdf\xe0\xce\x3b\x6f\xee\x15\x0c\xe9\x61\xdb\xb6\
+\x16\xec\x97\x4e\xb6\x1a\x90\xb9\x2f\xab\x9c\xc0\x56\x6d\x13\xd7\
+\x97\x21\xa1\x67\xc8\x39\x79\xff\xc3\xca\x60\x48\xcf\x70\xda\x94\
+\x63\xfa\x0d\x86\x24\x60\x71\xee\x78\x0d\x24\x82\x9d\x7e\xfa\xe9\
+\x68\x5a\xd1\x62\x48\x2c\xf9\x1c\xda\xdb\xdb\x65\xfd\x5c\x71\xc5\
+\x15\x52\xd7\xcb\xf5\xce\x75\xe0\x16\x1a\xe8\xcb\xf5\xf4\xf4\x1a\
+\xcd\x91\x56\x02\xc3\x15\xcd\x5d\x0c\x6c\xcb\x06\xc7\x74\xa5\xa1\
+\x12\x8e\xc9\xdd\x2b\xf3\x37\xc7\x75\xcc\x7c\x3e\x9b\x17\x67\x59\
+\x7f\x9a\xc7\xf8\xf1\xe3\xf1\xda\xcb\x2f\x48\xd4\x82\xb9\x65\x0f\
+\x5b\x5f\x59\xac\xc9\xf6\xe0\xc2\x8b\xd9\x7c\xf2\x16\x00\x00\x20\
+\x00\x49\x44\x41\x54\x2f\xc3\x84\x89\x13\xd1\xd2\xda\x21\xeb\xc5\
+\x44\xa2\xe8\x4d\xad\x7d\x30\xd4\x31\xe1\xf9\x6b\xe4\x49\xc1\x5d\
+\x43\xef\xe5\x36\xfe\xc6\x1b\x6f\x14\x30\xe4\x61\x72\xe3\x86\x71\
+\x4b\xa1\x08\x96\x19\xf1\x90\xe8\x89\x90\xdb\x4c\x6d\xb1\x12\xc1\
+\xf4\xb3\x57\x65\x6d\xf7\x67\x6e\xd7\xf4\x7b\x3d\x1e\xeb\x7a\x9a\
+\x98\xbb\xfd\x7e\xff\xcf\xdc\x25\x05\x95\xbf\x78\x70\xb3\x49\xab\
+\x0d\x56\x35\xa3\xb2\x2e\x26\xd5\x0d\x86\xdc\xa9\xb9\x63\xf4\x0c\
+\x71\xf1\x26\xe5\xce\xd9\x1c\x95\x64\x8e\xab\x5d\xb5\xeb\xf9\x9e\
+\xc0\x84\x06\x5f\x40\xd2\xf5\x02\xb7\x4c\x88\xa2\x07\x77\xdd\xc2\
+\x8d\x31\xc6\x8e\xff\x18\xf6\x24\x98\xa6\x32\xac\x59\x64\x3e\xc6\
+\x8f\xac\x4d\x09\x34\xed\x6a\x97\x47\x24\x54\x83\x7d\x7f\xf8\x63\
+\x4c\x9f\x71\x1a\x62\xb1\xb8\x28\xa9\xf0\x60\x9d\x9f\x8f\x79\x3e\
+\x82\xa1\xcf\x08\x67\x67\x32\x69\xa4\x52\xec\x44\xd1\x89\xf5\xd7\
+\x5f\x0f\x9b\x6d\x3e\x86\x6a\x61\xf2\x5d\x01\xff\x00\xa1\xa1\x33\
+\x24\xee\xb0\x31\x1f\xe2\xdf\xcb\x96\x75\xa0\xa5\xa5\x1d\xf9\x02\
+\x73\x43\x41\x29\x39\x61\x7d\xa4\x3f\x50\xc0\x9c\x19\x93\xab\x82\
+\xa1\x7c\x0e\xd9\x9b\x42\xcd\x37\x61\x67\x0d\xd1\xaf\xc2\x4c\x15\
+\x5f\xea\x5e\x1f\xd5\x36\xab\xee\x94\x80\x7a\x45\x9a\x5f\x15\x2d\
+\x1e\x1b\x6b\x14\x0c\xed\x2c\x9d\xa5\x5c\xb1\x1c\xe8\x91\x47\x1e\
+\xc1\xf7\xbf\xff\xfd\xe2\xba\x22\x63\x98\x07\x0d\xeb\x83\x0f\x3e\
+\x28\xcf\x69\xa8\xdb\x0d\x62\xab\x33\x4e\xfa\x9e\xde\xc1\x30\x2e\
+\x32\x83\x22\x29\xce\xda\x5d\xca\xc2\x89\x27\x69\xc0\x90\x79\x6b\
+\x31\xf0\x1e\x6e\x10\x01\x3b\x63\xc0\x90\xa2\x07\xff\x78\xe5\x45\
+\xf8\x7c\x7c\x9e\x91\x14\xea\x93\xfa\x05\x0c\x2f\xfa\xdd\xe5\x98\
+\x30\x71\x12\x5a\x5a\x3a\x24\xdd\xd0\x33\x18\x4e\x41\x47\xdb\x9a\
+\x65\x93\x56\x22\xc8\xb8\xbd\x41\x8e\x8d\x94\x85\x14\x0a\x92\x1f\
+\xe4\x1a\xb9\xe3\x8e\x3b\xf0\xc3\x1f\xfe\xa0\x28\x48\xc2\xd0\x31\
+\x81\x7c\xff\xfd\x0f\x14\x16\xad\x8a\x4f\x30\x67\xdd\x53\x89\x45\
+\x39\x8b\xbf\x3f\xf3\xb7\x2e\xdf\x6b\x59\x9e\x79\xb4\x30\x8f\x05\
+\x02\x81\x3d\x35\x57\xd6\xf3\x09\x7d\x0e\x86\x03\x3d\x59\xe5\x61\
+\x52\xf7\x82\x53\x7d\x55\xcd\x3b\xf5\x3b\x4c\x4a\xc6\x27\x99\x6e\
+\xc2\x25\x29\x01\x0b\x41\x50\x6e\x14\x8f\x43\xaf\xab\x70\x91\x7c\
+\x35\x3d\x40\xae\x11\x2a\xd2\x88\x6a\xa8\xc5\xae\x16\x7e\xe4\x73\
+\x36\x72\x05\x9a\x16\x8f\xe4\xff\xf8\x3c\x7f\x32\xac\x99\xce\x65\
+\x50\x1b\xa9\xc1\xf1\x93\x4f\xc4\xd1\xc7\xff\x46\xc2\x55\xbc\x46\
+\x1a\x23\x7a\x51\x81\x80\x61\xef\xf1\xb3\x68\x18\x23\xd1\x00\xb8\
+\x3b\xf7\xfa\x0a\x92\x97\x0c\x47\x02\xa8\x09\x93\x92\x5a\x6c\x3e\
+\x31\x60\x53\x50\x19\x0c\x63\x68\x6e\xed\x00\x0a\x7e\x69\x24\x6c\
+\xe7\x8d\x16\x26\xdb\x04\xce\x99\x79\x1c\xee\xbc\xf3\xc6\x1e\x3d\
+\xc3\x9d\x76\xda\xa9\x5b\xd1\xbd\xee\xa2\x15\x98\x7a\x16\xb3\xe8\
+\x7e\x49\x3d\x79\x86\xd5\x36\x73\xe5\x03\xa3\x61\x53\x31\xd0\x14\
+\xf9\x2e\x30\x4c\xda\x52\x0c\x93\xe6\xb2\x96\x6c\x42\x34\x67\x38\
+\x10\x9e\x21\xe7\x89\xdf\x47\x03\x49\x52\x11\x85\x2c\xbc\x0e\x4b\
+\x99\x39\x34\x86\xfd\x19\xf1\xa0\x11\x66\xfd\x24\xc3\x6f\xca\x9e\
+\x1d\x88\x89\xed\x19\x0c\x13\x58\xb6\x9c\x91\x0c\x93\x0e\xc8\x4b\
+\xe4\xc2\x84\x4a\x65\x5c\x45\x95\xdc\x80\x1d\xd5\x75\x28\xc6\x61\
+\xe7\x52\xe2\x21\x4e\x98\x30\x1e\xaf\xbe\xbc\x10\x3e\x4a\xd0\x11\
+\x2c\x59\xa9\xe8\xf1\xc3\xce\x7b\xf1\xdb\xdf\x5f\x81\x83\x27\x4c\
+\xc4\x8a\xd6\x1e\xc0\x70\x64\x23\xfe\x7a\xcf\xbd\x98\x36\x75\xcd\
+\x83\x61\xb9\x36\xb3\xda\x0d\xce\x87\x3b\x54\x6a\x72\xf2\xe6\xbe\
+\x33\x60\xf8\xc3\x62\xc8\x9a\x1b\x38\x8a\x5d\xfc\xf8\xc7\x3f\x95\
+\x0d\x8b\xf2\x28\x74\x4e\x39\x76\xba\x29\xd3\x9f\xee\xef\x1d\x88\
+\x39\x5c\x77\x9f\x51\x98\xcf\x15\xf1\xbc\xdf\xef\xdf\xf1\xb3\xee\
+\x19\xae\xbb\x41\xee\xf9\x9b\xcb\xc1\x50\x45\xa3\x35\x87\xc8\x77\
+\x96\x00\x72\x60\x3d\x43\x8f\xd7\x69\x54\xea\x78\x32\x90\x3c\x4a\
+\xcf\x07\x41\x93\xca\x1b\x79\x16\x7f\x0b\x38\xfa\x8a\xa1\x55\xea\
+\x39\xda\xec\x6a\xc1\x67\xb8\xdb\xa6\x7e\xa3\x37\xe0\xd4\x6e\x01\
+\x27\x9f\x3a\x13\xc7\x4c\x9e\x82\xb6\xf6\x98\x3c\xae\xea\x2f\x04\
+\x43\x61\x85\x4a\xbf\x3d\xe6\x94\x82\xe8\xec\x68\x45\x30\xe4\xc5\
+\xa8\x51\xc3\x25\x27\x15\x0e\x92\x2c\xc3\xfc\xe3\xc0\x08\x10\x14\
+\xbd\x08\xe7\x17\x1d\x55\xe3\x19\x12\x0c\x63\xb0\x10\x90\x9d\xbe\
+\x94\x14\x16\xc8\xbc\x23\x18\x1e\xd3\x2b\x18\x52\xa8\x9b\x87\x92\
+\x10\xd4\x30\x93\x5c\xc3\xee\x15\xac\x75\xad\x76\x94\x47\x27\x34\
+\xe4\xc5\xf7\x55\xcb\xc9\x68\x69\x14\x05\x1b\xc8\x28\xd5\x43\x40\
+\x91\x9e\x7f\x9e\x9e\x61\x09\x0c\x49\xa0\x71\xe7\x0c\x07\x0a\x0c\
+\x55\xd3\x97\xc5\xea\xac\xd9\x24\x10\x73\xcd\x90\xac\x42\x1b\xc3\
+\x4d\xcf\x43\x0f\x3d\x84\xbd\xf7\xde\xbb\x28\x63\x56\x92\xbf\xab\
+\x36\x42\xbd\x3f\xdf\x2b\x18\x2e\x8b\xc3\xf2\x04\xe5\x9a\xa9\x8e\
+\x24\x2a\xa9\xc2\x80\xe6\x0f\xd3\x94\x97\x21\x6e\xb6\xfe\x92\xa6\
+\xd6\xd2\xe0\xd8\xc6\xa4\x83\x27\xe0\x95\xbf\x2d\x80\xdf\xc3\x90\
+\xae\x21\x8a\x89\x6a\x93\x0d\xfc\xee\xd2\xab\x30\x61\xfc\x44\x2c\
+\x6f\x6e\x97\x1a\xc4\x95\x3c\xc3\x91\x8d\x22\xa4\x30\x7d\xea\x14\
+\x74\xb6\xae\x59\xcf\x50\x47\x86\x6b\x46\x6b\x99\xf9\x98\x96\x8c\
+\xf1\x77\x13\x1e\x2e\xc8\xf3\x64\x71\x53\x0b\x97\x1b\x16\x25\xa9\
+\x09\x0f\x20\x9f\x17\xb1\x12\x7a\xf6\xcc\xfd\x72\x63\xc3\x08\x03\
+\x7f\x67\xf9\x0e\x3d\x7b\xf7\x5a\xfc\xec\x80\xa1\xf5\x02\x2d\xe0\
+\xeb\x5e\xaf\x77\x5c\xb5\x30\xcc\x50\x27\xd0\xf4\xef\x36\x5b\x33\
+\xef\x2e\x07\x43\xfd\x16\x86\x0c\x55\x0e\x89\x0b\xd7\x84\x4a\x7b\
+\x07\xc3\x6a\x9e\x83\x2a\x2e\xd2\x00\xb0\x64\xc2\x90\x0b\x8c\xa8\
+\xb1\x78\x2f\x15\xda\xb2\x9a\xf3\x31\xaf\x23\x69\x84\x60\xc8\xef\
+\xc9\x89\x84\x99\x13\x5e\x95\x72\x1c\xf7\xef\x14\xd5\x36\x39\xc0\
+\x2c\x5b\x61\xc0\x83\x29\xa7\x4c\xc5\x49\x53\x67\xa3\xb5\xad\x13\
+\x5e\x29\xe5\xe0\x2e\xbb\x80\x60\x20\x20\xf9\x4b\x66\x6f\x32\xa9\
+\x04\xea\xeb\x6b\x91\x4c\xc4\x90\xb3\x53\x18\x3e\xbc\x01\x23\x47\
+\xd5\x0a\x15\x7e\x20\x73\x86\x3d\x81\x21\xaf\x62\xe9\xb2\x2e\xb4\
+\xb5\xb2\x89\x6b\x00\x5e\x0f\xcf\x93\x5e\xb3\x1f\x7e\xbf\x8d\xb9\
+\x33\x8e\xc1\x9d\x77\xdd\xd0\x6b\xce\xd0\x34\x1d\x36\x9e\x36\x0f\
+\x6a\x93\x1e\x77\xdc\x71\xa2\x62\x52\x3d\xf2\x62\xce\xcc\xcd\x70\
+\xe6\xdf\x3a\xaf\x5c\x13\xbd\x1d\xdc\x48\xf1\x35\xfc\xbe\xfd\xf7\
+\xdf\xbf\x9b\xc7\xa5\x0a\x34\x3d\x81\x21\x73\x86\x53\x7f\x73\x74\
+\xbf\x72\x86\xe4\x77\x09\x19\x8a\x18\xeb\xf5\x0a\x2b\x9a\x0c\x5b\
+\xe6\x85\xc5\x2b\x26\xc9\xca\x29\xdd\x62\x08\xee\x27\x3f\xf9\x49\
+\xb1\xd4\xc4\xcd\x84\xed\xcf\x9d\xd6\x1b\x18\x36\x35\xb1\x17\x63\
+\x18\x05\xd1\xb7\x35\x35\x87\x25\x01\x41\x33\xce\xec\x7a\xc1\x3a\
+\x44\x8a\x97\x2b\x18\x4e\x74\x3c\x43\xbf\x37\x27\x1a\xbd\x7c\x8f\
+\x57\xc0\xd0\x83\x4b\x2f\xbf\x12\x07\x8d\x9f\x88\x65\x4d\x04\xc3\
+\x60\xb1\xb4\xa6\x98\x33\x5c\x8b\x60\x58\xa9\x14\x8c\x5c\x03\xd6\
+\x9c\xea\x66\xc3\xb0\x68\x6d\xc9\xff\xd1\x3b\x64\x3e\x74\xcb\x2d\
+\xbf\xd0\x4d\x43\x98\xe3\x7f\xfd\xf5\x37\xe0\xed\xb7\xdf\x96\x35\
+\xcb\xf7\xf0\xf5\xf4\xe8\x99\x3f\xa4\xd8\x3d\x45\x20\x14\x2f\xdc\
+\x25\x62\xfd\x99\xbb\x41\xf0\xde\x37\x2c\xcb\xb2\xde\xf5\xf9\x7c\
+\x5b\x7c\xee\x19\xae\xfd\xe9\x70\x83\x21\x43\x48\x2c\x63\xe8\xc9\
+\x3b\x60\xaf\xbf\x7e\x1d\x44\x40\x05\x37\x65\xa6\x6a\xdf\xb9\x5e\
+\x3e\x98\xe1\x4f\x0a\xae\xf9\x02\xc6\xc8\xdb\xac\xc4\x76\x0e\x16\
+\xd1\xcb\x63\x04\x34\xf1\x3e\x58\x63\x65\xbe\x47\xa5\xc2\xa8\x39\
+\x3a\xf9\x37\xa7\xe0\xe8\xc9\x27\xa3\xa5\xad\x53\x88\x06\xb2\x43\
+\xcd\x5b\x08\x51\x03\x92\xc0\x0a\x20\x9d\x4c\x60\xf8\x88\x7a\x01\
+\xbf\x58\x57\x1b\x22\xe1\x00\x46\x8e\x6c\x44\x34\x4c\xf6\xe9\x9a\
+\x0f\x93\xf2\xaa\x96\x2d\x8f\xa3\xb5\xa5\x4b\xc0\xd0\xe7\x0d\x23\
+\x67\xd3\x6d\x50\x30\xfc\x75\x55\x30\x24\x3b\x97\x61\x26\x9d\x57\
+\xe6\x5a\xa8\x39\x4a\xef\xb0\x2f\x06\xbf\xd2\xdc\x2b\x20\x56\xdf\
+\xac\x9a\x49\xd1\xae\x15\x6e\xf9\x2d\xea\x6c\x52\xec\xe0\x83\x8f\
+\x5a\xd1\x11\x63\xc7\xf7\x08\xca\xc3\xa4\xfd\x05\x43\x8a\x2b\x50\
+\x1c\x81\xd7\xcf\xf9\x7d\xee\xb9\xe7\xa4\x03\x08\xd7\x83\x09\x8d\
+\x1b\x36\x29\xaf\xe3\x86\x1b\x6e\x90\xd6\x54\xfc\xdd\x2d\x0e\xd0\
+\xaf\xf5\xed\x6a\xda\xcd\xcf\xe9\xce\x26\x4d\x60\xd9\x32\xb6\x9f\
+\x0a\xa0\x60\x39\x24\x1a\x32\x6c\x99\x22\xa0\x57\x28\xa2\xe7\x90\
+\x0e\x2d\x3e\x0f\xc9\x46\x36\xec\x1c\xcb\x7e\xf2\x38\x78\xfc\x41\
+\x78\xed\xe5\x85\xf0\xfb\xb2\xe0\x2d\xa8\x60\xc8\x30\x29\xc1\xf0\
+\xc0\x83\x0e\x1e\x14\x60\xe8\x1e\x3b\x6e\x46\xb8\x31\x62\x9d\x24\
+\xbd\x70\x53\x57\x58\x8a\xac\xa4\xd3\x59\x19\xfb\x48\x84\x22\x17\
+\xc6\xae\x88\xd2\x54\x0d\x6b\x7e\xf9\xbb\xc9\x77\xbb\x05\x24\xb8\
+\xbf\x63\xa9\x11\xd5\x8d\x58\x92\x41\x70\xec\xeb\x9a\xec\xef\xbc\
+\xae\xa5\xf7\xbf\x67\x79\x3c\x9e\x4f\x82\xc1\xe0\x86\x25\xa2\x46\
+\x4f\x5f\x3d\xb4\x73\x86\x6b\x69\x40\x57\xe9\x6b\x2a\x79\x86\xc2\
+\xbc\x73\x42\x19\x5c\x6c\x6a\x30\x48\x2c\xe9\xed\xe8\xdd\xd8\x3a\
+\xcd\x8a\x9d\xf2\x0a\x31\xba\x0e\x20\x2a\x93\x6e\xa5\x85\x4d\x6d\
+\x51\x65\x95\x8a\xe0\x36\x83\xa0\xc6\xe3\x09\x04\x59\xf3\x47\x66\
+\x8b\xf9\x9b\x1e\x23\xbb\x1c\xd0\x13\x24\x40\x1a\x80\x33\xef\xe7\
+\xdf\xc7\x1c\x77\x02\xa6\x9c\x32\x0b\x2d\x0c\x93\xfa\x58\x27\xc8\
+\xe7\x3c\x08\x12\x0c\x49\xc9\xce\x93\xbd\x97\x15\xca\xbe\xd7\xcb\
+\x2e\xef\x5d\x18\x3e\xa2\x01\xa3\x47\xd7\x98\x92\x0d\xf1\x90\x56\
+\x8e\x4d\x94\x02\xbb\x95\x7b\xa8\xf7\x3c\x5e\xe6\xf5\xe6\xec\xb5\
+\x47\x3b\xb0\xac\xa9\x0b\xad\xad\x5d\x40\x21\x08\xaf\x8f\x92\x65\
+\x04\x78\xb6\xec\x29\x60\xf6\xcc\x5f\xe3\xee\x3b\xcb\x3c\x43\x47\
+\xa0\xfc\xc9\x27\x1f\xef\xd6\xfa\x89\x86\x98\xff\x09\x86\x94\x03\
+\x7c\xf6\xd9\x67\xbb\x69\xde\xf6\x36\x8f\x3d\xe5\x0c\x4d\x4b\xa9\
+\x9e\x0f\x25\x5b\x51\x32\x4e\xb5\x49\x65\xfe\x1c\x39\x32\x4a\x88\
+\x11\x0c\x63\x31\xdb\x84\xf9\x32\x46\x38\x9d\x65\x33\xf1\x78\x0b\
+\x4e\x39\xe9\x28\xbc\xf8\xfc\xe3\xc5\x16\x4e\x54\x09\xb2\x6d\x8f\
+\x28\xd0\xcc\x3d\x9d\x9d\xee\x0f\x01\x4b\x2b\xd8\xc2\x89\xfd\x27\
+\x91\x4f\xa3\xbe\xce\x94\x56\x48\x33\x18\x47\xba\x8f\x1e\x6a\x22\
+\x95\xc4\x4b\x2f\xbe\x8c\x3d\xf7\xde\x07\x36\xfb\x52\x3a\x1e\xa1\
+\x8f\xad\xca\xb2\x19\xdc\xf7\xd7\x7b\xf1\xa3\x1f\xfe\xa0\x58\x82\
+\x51\x4d\x34\xa1\xaf\x37\x55\x6f\x04\x9a\x4f\x16\xb7\x99\x7e\x84\
+\xb2\x59\xe3\x9c\xd3\x05\xf4\x4a\xae\x9c\x6c\x66\x66\x09\x18\x26\
+\x65\x88\xd4\x67\xe5\xe5\x3c\x19\x32\x3d\x78\xfc\x01\x78\x95\x61\
+\x52\x1f\xc3\xa4\xe6\x4c\xe8\x19\xe6\x0b\x3e\x5c\x72\xd9\x15\x0e\
+\x18\xb6\xba\xc2\xa4\xdd\x4b\x2b\xee\xbd\x6f\xde\x5a\x0b\x93\x2a\
+\x41\x46\x3d\x70\x36\x02\x78\xeb\xad\x37\xe4\x5e\x55\x5b\x23\x92\
+\x87\x59\x7a\x87\x66\xd3\xca\x1a\x43\xa6\x27\xf4\x48\x24\x52\xb2\
+\x79\x51\x20\x94\xa6\xde\x8e\x3a\x16\x5f\x73\xfc\xf1\xc7\xe3\xca\
+\x2b\x8d\xf8\x44\xf9\xf7\xf5\x75\x9e\x06\xe9\xeb\x16\x5b\x91\x48\
+\xcd\x8a\x64\x32\x39\xa2\xda\x09\xae\x0b\xb6\xa5\xfb\x9c\x14\x24\
+\xf4\x31\xcd\xa7\xe8\x24\xd3\x98\x2b\x0d\x98\xaf\xa1\xf1\xa0\x81\
+\xd0\x1b\x8d\x46\x57\x58\x90\x2e\x15\x90\x6a\xd7\xfc\xf9\xf3\xe5\
+\x23\xd0\x7b\x5f\x39\x37\x7b\x4d\x6b\x8f\x28\x3e\xbe\xd7\xf7\xbe\
+\x8f\xb9\x73\xce\x41\x47\x3b\x25\x9e\x3c\x48\x53\x06\x2e\x10\xc4\
+\xa2\x0f\x3f\xc4\xae\xbb\xee\x82\xa6\xa6\x36\xb3\xe3\xf6\x99\x5d\
+\x3a\xed\x55\x24\x12\x46\xb4\x36\x20\xf9\x3a\xa2\x16\x95\xe2\x44\
+\xda\x8d\x8c\x37\x3f\x10\x09\x79\xe4\xef\x6c\x26\x29\xef\x93\xfe\
+\x8a\x72\x28\x44\x1a\xc0\x2d\xaa\xe1\xa8\x66\xaa\xbc\xa6\x1c\x0c\
+\xcd\xeb\x96\xad\xe8\x40\x5b\x7b\x5c\xc0\xd0\xb2\x4c\x9b\xa3\x3c\
+\x7c\x08\x07\x80\x99\xd3\x8e\xc6\xdd\x77\xfe\x05\xa6\x86\xd2\x94\
+\x92\xb0\xf4\x91\x06\xf4\xf1\xc7\xa9\x4d\xba\x67\x51\x15\xc7\xe4\
+\x54\x4c\xad\x1f\x3d\x43\x76\xcb\x70\xe7\x12\x79\x06\xee\x75\x38\
+\x10\x6c\x4a\x55\xad\xb9\xec\xb2\xcb\x24\x54\xca\x75\x4f\x8f\x40\
+\xd8\x7e\x2c\xf9\xf0\x00\x6f\xbc\xf5\x11\x52\xc9\x00\x86\x35\xac\
+\x27\xf9\x50\xc3\x00\xcd\xa3\xb3\x73\x19\x66\x4e\x3f\x06\xaf\xbd\
+\xf6\x34\x92\x49\x36\x3e\x26\xfb\x94\x21\x35\x7a\x07\x35\x38\xf3\
+\xac\x8b\xb0\xdf\xf8\x43\xd1\xde\x11\x13\x30\xf4\x79\x0b\xc8\xe7\
+\xd2\x68\xac\x0d\x61\xf4\xe8\x06\x21\x18\xc1\x63\x64\xc8\x48\x38\
+\xb2\xe1\xc1\x9b\x6f\xbd\x83\x5b\x6e\xbd\x1b\x4d\x2b\xda\xe0\x61\
+\x8d\x69\x26\x8b\xda\x28\xbb\x2f\x67\x61\xe7\x53\xd8\x7d\xb7\x9d\
+\x51\x5b\x13\x42\x67\x67\x3b\xea\xeb\xea\xd0\xd6\xda\x21\x46\xf7\
+\xe0\x49\x13\x65\x86\xe8\xcd\x9a\x31\x33\x21\x7a\xd6\xa9\xf6\xe7\
+\xe8\x8a\x67\x24\x34\x2f\x11\x0b\x59\x52\x1e\x19\x9b\x58\xc2\x46\
+\x53\x73\x1b\x17\x9f\x10\x6b\x8a\xe9\x83\x5c\x16\x7e\x5f\x01\x93\
+\xc6\x1f\x88\xbf\xbd\xf8\x0c\x3b\x6b\x9a\xf9\xce\x73\xad\x30\xcf\
+\x10\xc0\xa5\x97\x5d\x81\xfd\x0e\x98\x80\xe6\x96\x76\x21\x98\x69\
+\xf9\x12\xd7\x30\xeb\x0c\x47\x8d\x1a\x81\xfb\xee\xbd\x07\x53\x4f\
+\xf9\x0d\x3a\x5a\x96\xf4\xab\xce\x50\xc3\xef\x6e\x22\x96\x92\xec\
+\x94\xc1\xac\xcc\x4e\xad\x6d\xdd\x6e\xbb\xed\xa4\x13\x0f\x0f\x15\
+\xab\x58\xdd\x31\x54\x3b\x4a\x30\xbc\xfc\xf2\xcb\x8b\x1d\x51\x34\
+\x9d\xc3\x73\x50\xcf\x5f\x53\x02\xdd\x37\xfb\xab\xfb\xcd\x6b\xe7\
+\x7d\x96\x65\x35\x5b\xa1\x50\xa4\x23\x95\x4a\xd5\x55\xcd\x39\x69\
+\xf7\xd4\xb5\x73\x6e\x2b\x7d\x4b\x35\x30\x54\xf6\x9c\xd6\xd4\xa8\
+\x72\x02\x0d\x93\x34\xe3\x74\x74\x37\x3f\x07\xc3\x35\x33\x81\x34\
+\x22\x1c\x67\xbd\x39\xdc\x89\xf5\xb1\x1b\x6d\x82\x4c\x2a\x07\x8a\
+\xcf\x10\x04\x99\x5b\xab\xab\x6f\x44\x38\x52\x83\xb3\xce\x3d\x17\
+\x1b\x6e\xb4\x31\xc2\xe1\xa8\xe4\x73\x28\x12\x2e\x73\xe9\x05\x7c\
+\x2c\xf0\x13\xe9\xb5\xac\xf4\x89\x23\xfd\xdd\x53\xc8\xa3\xa6\x36\
+\x8c\x51\xc3\x6a\xa5\x06\xd1\x43\x26\xab\x08\xa2\x4a\x01\x81\xe3\
+\x75\x1a\xa6\xe0\x4a\x60\xc8\xe7\x9d\xb6\x52\xea\x17\xb2\x60\x84\
+\x5e\x02\x8d\x23\xc1\xb0\xbd\x8d\x14\xfc\x80\x90\x2d\x8a\x60\xe8\
+\xb7\x30\x73\xda\x31\xb8\xfb\xce\x1b\x45\xc9\xa5\x04\x86\xa6\x19\
+\xaa\x01\xc3\xef\x38\xa1\x39\x13\x8e\xe2\xed\xd2\xd2\xd2\x2a\x35\
+\x5b\x04\xc3\x6a\x39\xdf\x6a\xb3\x52\xed\xfe\xe4\xf8\x33\xe4\x48\
+\xcf\xf0\xc8\x23\x8f\xec\xf6\x71\x5d\xa9\x2c\xbc\x01\x3f\xee\x7f\
+\x70\x01\xfe\xf9\xc6\x27\xc8\xe7\xc2\xc8\xa6\x4c\x0d\x65\x28\xe4\
+\x41\x2e\xdb\x82\xbb\xe7\x5d\x8b\x7f\xbf\xfd\x02\xb5\x7d\xe0\xe1\
+\x25\x50\x59\x28\xef\x43\xd0\x5f\x8f\x39\x67\x9c\x8f\xfd\x27\x1c\
+\x8a\xd6\xce\x0e\xb0\x3d\x6e\x4f\x60\x98\xc9\xa6\x84\x3d\xca\xa2\
+\xf4\x58\x22\x8f\xd7\x5e\x7f\x1b\xe1\x50\x1d\xea\x6a\x87\x09\x00\
+\x65\x33\x09\x3c\xf9\xf8\xc3\xb8\xec\xf2\x8b\xd0\xd1\xda\x84\x58\
+\x57\xab\x74\x84\x6f\x68\xa8\x11\xa2\x12\x3d\x99\x3f\xfe\xe9\x5a\
+\x6c\xba\xe9\xa6\x08\x84\xb8\x99\xd5\x8d\x0b\xf3\xca\xfd\x23\x50\
+\x31\xc2\x20\xa5\x03\x42\x1e\x35\x79\x43\x6a\x3d\xc4\x13\xdc\x04\
+\xb5\x21\x91\x2d\x08\x18\xb2\x1e\x96\x2b\xa2\x90\x4b\x23\xe0\xb3\
+\x30\x69\xfc\xfe\xf8\xdb\x8b\xcf\x09\x18\x72\x4d\x4a\xb4\x40\xc2\
+\x14\x01\xfc\xfe\xb2\x2b\x70\x80\x80\x61\x1b\x7c\x7e\xa3\x05\xab\
+\xe9\x81\x22\x18\xde\x73\x1f\xa6\x9e\x7a\x42\xbf\xc1\xd0\xbd\x7e\
+\x14\x74\xf8\x5d\x5a\x9e\x42\x3b\xe7\x26\xb6\xf0\x1a\xd9\x3c\x9c\
+\x61\x52\x3a\x09\xd5\x22\x0b\xd5\xd6\x1f\xaf\x8d\xf7\xf6\x94\x29\
+\x53\x8a\x9e\x21\xdf\xa3\xc2\x0e\xee\x9c\x78\xe5\x3c\xe2\xe0\x8e\
+\x2c\x5a\x96\xd5\x69\x05\x02\xa1\x44\x26\x93\x09\x57\xbb\xd9\x06\
+\xbb\x67\xc8\x5d\x91\xaa\x5a\x88\xe2\x85\x13\x9a\x51\x3a\xb7\x5e\
+\x5f\x4f\x79\x99\x75\x7d\x7d\xd5\x16\xe3\x50\x78\xde\x5d\xeb\x24\
+\x79\xa2\x7c\xde\xb9\x41\x8d\xe1\x25\x38\xf9\x3d\x41\x64\xf3\x39\
+\xa9\xf9\xaa\xab\x69\xc4\x4d\xb7\xde\x8a\xaf\x7c\xf5\x6b\x52\x83\
+\xa8\xc1\x58\x91\xa9\xa3\xbd\x61\xbd\x17\x1c\xca\x3b\x33\x97\xf9\
+\x1c\xac\xbc\x8d\xba\xfa\x28\x36\x18\x3d\x02\xe1\x30\x15\x4f\xc5\
+\x8f\x28\x06\x3d\x7b\xf5\x0c\xbb\x81\xa1\x19\x51\x82\xa0\x01\x43\
+\xe3\x19\x76\x07\x43\x3e\xe7\x45\xf8\xbf\xa1\xa5\xbe\x80\x21\x3f\
+\x8f\x21\xa9\x92\x64\x5c\x46\xf2\x2b\x94\x80\x8b\xc5\x4c\x03\x63\
+\x03\x94\x26\x40\xeb\x5e\x73\xd5\x08\x36\xd5\x9e\xe7\x98\xf1\x7b\
+\x29\x44\xfe\xdd\xef\x7e\x57\x6a\xc9\xd4\x00\xd2\x5f\x4b\x65\x81\
+\x3f\x5f\xf3\x57\x2c\x7c\xf6\x55\x14\xec\x08\x90\xa3\xf1\xb6\x10\
+\x0a\x00\xb9\x42\x3b\x9e\x5b\xf0\x00\x96\x2c\xf9\x27\x03\x67\xf0\
+\xf8\x8c\xf0\xba\x85\x10\x82\xfe\x3a\xcc\x38\xed\x2c\x8c\x3f\xf4\
+\x70\xb4\x74\xb4\x0b\x18\x32\x4c\x6a\x67\x53\xe2\x19\x8e\x19\xd3\
+\x00\xbf\xec\x59\x8c\x67\xc8\xf1\x24\x3f\x38\x95\x01\xfe\xf3\xee\
+\x62\x04\x03\x35\x42\x46\x8a\x75\x76\x62\xd4\xc8\x46\x2c\x78\xf6\
+\x09\xcc\x3a\xed\x14\x7c\xbc\xe8\x5d\x8e\x96\x78\xf7\x81\x00\xbb\
+\xb6\xe4\xf1\x95\xed\xbf\x82\x3b\xee\xbc\x07\x9b\x6f\xbe\xb1\x11\
+\xd7\x66\x19\x4f\xc1\x96\x0d\x48\x7f\xc1\x50\x3b\xb7\x94\x9b\xe4\
+\x44\x12\x58\xda\x34\xf8\xc1\x50\x23\x0b\x95\xf2\x74\x64\xe6\x6e\
+\xb8\xe1\x86\xb2\x31\xd3\x74\x09\x01\x93\x9b\x0a\xf6\xb6\x74\x2b\
+\xcc\xf4\xc7\x8e\xd0\xae\x5e\x77\xdd\x75\x22\x4c\x4f\x60\xd4\x76\
+\x74\x7c\x9c\x82\xdf\x24\x8a\x2d\x5d\xba\xb4\x28\xe1\xc6\xef\xd2\
+\x9a\x46\xcd\x4d\xf6\xe7\xfb\xd7\xe4\x7b\x2d\xcb\x4a\x5a\x3e\x5f\
+\x20\x93\xcb\xe5\xfc\x43\x1d\x0c\x69\x58\x18\x92\x63\x5f\x42\x4e\
+\x8e\x0a\x31\xd3\x20\xb0\x66\x86\x94\xe0\x4a\x80\xa7\xe1\xd6\xbe\
+\xd6\x81\xad\xc9\x09\x19\xea\x9f\xed\xae\x8d\xd4\x5c\xa4\x78\xea\
+\xcc\xcb\x38\x75\x5d\x14\x3a\xce\x66\x68\x34\xbd\x88\xd4\xd4\xe2\
+\xa6\x1b\x6f\xc1\xe6\x5b\x6e\x09\xcb\x43\x99\x2b\x53\xa4\x2e\xdd\
+\x2e\x64\xf7\xed\x90\x76\x60\xc3\xef\xb1\x90\xcd\xa5\x44\xf3\xb1\
+\xae\x96\xb9\xaa\xe1\x62\xc8\x69\x4c\x3d\x4e\x4e\xb3\x34\x7e\xc6\
+\x2b\x34\x60\xe7\xc0\xe3\x4a\x61\x52\x03\x80\x26\x60\xaa\x60\x18\
+\x93\xf2\x0f\x14\xd4\x33\x74\xc0\x30\x60\x61\xe6\x54\x7a\x86\x37\
+\xf7\xe8\x19\x52\xcc\xd9\x84\xe5\x4d\x33\x62\xe9\x78\x68\x01\xad\
+\xad\xed\x62\x8c\x58\x5a\x50\x0e\x80\xee\xf5\x38\x10\x06\x8b\x39\
+\x4a\x6d\x01\xa5\xdf\x25\xbd\x32\x3d\x41\x14\xbc\x16\xae\xb8\xf2\
+\x01\xbc\xb0\xe0\x75\x44\xc3\x23\x11\xf0\xd4\x18\xed\x5b\x6f\x16\
+\x76\x21\x86\x87\x1e\xbe\x19\xcb\x9a\xde\x41\x20\xc0\x4e\xed\x69\
+\xe4\x32\x14\x53\x0f\x21\x18\xa8\xc3\xd4\x19\x73\x70\xf0\xe1\xbf\
+\x72\xc0\x90\x39\x43\x8f\x80\xa1\xe6\x0c\x25\x4c\x4a\xae\x91\xd3\
+\x4b\x9e\x63\x9a\x4c\x03\xef\xbc\xb7\x18\x79\xdb\x8f\x64\x22\x2d\
+\xda\x9f\x23\x86\xd7\xe3\xf1\xc7\x1e\xc4\xa9\x53\x4f\x40\xdb\x8a\
+\xa5\xf0\x07\x2d\xf1\x0c\x79\x44\xc2\x11\x6c\xbf\xfd\xf6\xb8\xfe\
+\x2f\x37\x63\xd3\x4d\x37\x11\x2f\x8c\x9f\x47\xaf\x9f\x5d\xea\xfb\
+\x0b\x86\xc2\x1e\xcd\xe7\x65\x1d\x71\x62\x58\x6a\xc2\xf9\x8f\x75\
+\xd9\x58\xb2\xbc\x19\x39\xcb\x3f\xe8\x3d\x43\x37\x63\x94\x6b\x8c\
+\x40\xc3\xbe\x9e\x97\x5c\x72\x89\x90\x65\xf4\x30\x9d\x5f\xcc\x7f\
+\xea\xf0\x0e\x44\x4e\x56\x3f\x83\x82\xf0\x0c\xff\xb3\xcc\x42\x49\
+\x5a\xfc\x5e\xaa\x0b\x9d\x7c\xf2\xc9\xd2\x86\x8c\xaf\x5d\xb9\x14\
+\x68\xd0\x7b\x86\x59\xcb\xeb\xf5\xdb\xb6\x6d\x7b\x86\x3a\x18\x72\
+\x57\xc4\x5d\xf1\x55\x57\x5d\x25\x8c\x36\x3d\xde\x7e\xfb\x1d\x09\
+\x55\xb1\xc1\xea\xe7\x60\xb8\x66\xe1\xb6\xa7\x84\xba\x78\x28\x79\
+\x23\x8e\xac\xe1\x4b\x6a\x3c\xd6\xd6\xd5\xe3\xee\xbb\xef\xc3\x86\
+\x63\x37\x01\x75\x2d\x25\x4c\xc5\xaa\x43\xaf\x51\xb9\x61\x57\x0b\
+\x9d\x33\xbf\xdf\x42\x26\x9b\x46\x36\x4d\x30\x0c\x63\xc3\xf5\x47\
+\x88\x4c\x9a\xde\x62\x2a\x1b\xd7\x1d\x10\xcb\xc0\x50\x9f\x14\xf0\
+\x74\x83\xa1\xa3\x40\xb3\x22\xee\x80\xa1\xcf\x09\x93\x0a\x75\x07\
+\xc1\x80\xb7\x2a\x18\xb2\xa3\xbd\xd9\x0c\x98\xd0\x91\xd3\x28\xa3\
+\xcf\x03\x5e\x8d\xcd\x5d\x8d\x8d\xaa\x39\x5a\x4d\x09\x70\xdc\x8a\
+\x0a\x34\xcc\xad\x16\x80\x2b\xae\x78\x0c\x0b\x9f\x79\x0d\xd1\xf0\
+\x08\x78\x3d\x54\xfc\xc9\x20\xe8\xcf\xc3\xe3\x4f\xe2\xc1\x87\x6e\
+\xc2\xb2\xa6\xf7\x10\xf0\x67\x65\xd3\x21\xf9\x35\x04\x10\x09\x37\
+\x62\xea\x8c\xd3\xc4\x33\x34\x61\x52\xe6\x0c\x2d\xe4\xb3\x19\xd4\
+\xd7\x45\x31\x66\x74\x54\x3c\x43\x29\x2b\xf1\x19\xd8\x4a\x67\xf3\
+\x48\x67\x3d\xf8\xe8\x93\x65\x08\xf8\x6b\xa5\x89\x34\xdf\xc3\x5a\
+\xd1\x87\x1e\xb8\x07\x33\x67\x9d\x8c\xce\xb6\x15\xa8\xab\x0f\xa3\
+\x20\x12\x68\x05\xc4\x62\x49\x8c\xdb\x6e\x1c\x6e\xba\xf9\x76\x91\
+\x24\xf4\x07\x75\x66\x4d\xbc\xa0\xbf\x60\x28\x1b\x1f\xf6\xab\x2e\
+\x2b\xa7\xed\x8c\xe5\x05\x0c\xb3\x54\x69\x1d\xe4\x61\xd2\x4a\x2a\
+\x30\xf4\x08\x59\x3c\x4f\x30\x24\x00\x71\x33\xc4\xb5\xd4\xdf\xb0\
+\x68\xf9\xc2\x55\x11\x09\x95\x61\x73\x03\xb3\x76\xbd\x60\x19\xc7\
+\x2d\xb7\xdc\x22\x6f\x55\x99\x3b\xb2\x5a\xe9\x98\x0c\x76\xcf\x90\
+\xcb\x83\x60\x98\xb7\x6d\x9b\x25\x16\xbd\xde\xb8\xeb\x3a\x8c\x58\
+\x2d\x67\x48\x30\x9c\x34\x69\x92\x88\xcf\x92\xf6\xcb\xf3\x1d\x31\
+\x62\x18\x96\x2f\x5f\x21\xc5\xbf\x6f\xbd\xf5\xd6\x4a\x3b\x73\x3e\
+\xd0\x53\xf8\xb4\xcf\x56\xec\xf3\x17\xca\x08\xb8\x6f\x54\xbd\x11\
+\xa4\x9e\xd0\xc9\xd5\x06\xc8\x7a\x21\x74\x31\x57\x63\x51\x9d\x26\
+\x87\x50\x20\x82\x07\x1f\x7a\x14\x1b\x6c\xb4\x31\x32\xac\x62\xa6\
+\x4b\xe8\xf5\x89\x27\x29\x41\x37\x79\xaf\xa9\x8b\x64\x98\x48\x8c\
+\x74\x36\x83\xda\xba\x28\xd6\x5f\xaf\x11\x21\x7e\x64\xc1\x18\xb8\
+\x1e\xd5\xe6\x5c\x94\x1a\x9d\xaa\x4a\xea\x33\x34\xb9\x4d\x4d\x09\
+\xb4\x09\xc9\x87\x2a\x23\x2c\x07\x90\xdb\x1a\xc1\x80\x85\xd3\x4e\
+\x3d\x0e\x77\xde\xd5\xb3\x67\xa8\x39\x43\x9e\xaf\x1b\x0c\x09\x12\
+\xc6\x38\xf4\x7e\x7f\x55\xbb\xff\xaa\x2d\x33\x2d\x25\x90\x4d\x84\
+\x13\x2e\x53\x00\xe5\x30\x32\x90\x7c\xd5\x95\x4f\xe1\xc5\x85\xff\
+\x40\x24\xd4\x28\x25\x23\x34\x52\x7e\x5f\x0e\x1e\x5f\x0a\xf3\x1f\
+\xbf\x13\x9f\x2e\x79\x07\x3e\x5f\x46\xea\x3c\x65\x9e\xe0\x47\x34\
+\x3c\x0c\x33\x4e\x9b\x8b\x03\x27\x4d\x42\x5b\x7b\xa7\x61\x93\x7a\
+\x7d\xb0\xb3\x64\x93\x46\xb1\xde\xe8\xb0\x10\x9a\xa4\x96\xd1\xc1\
+\x2f\x12\x8d\xe3\x89\x3c\xde\xff\x60\xb1\xb0\x72\x33\x69\x23\x71\
+\x56\x13\x0d\x4a\xce\x70\xee\xe9\xd3\xd1\xda\xb4\x04\xb0\xb2\xa6\
+\xff\xa5\x73\x7c\xf3\xff\xbe\x89\xdb\x6e\xbf\x1b\x63\xc7\xae\x2f\
+\x4b\x81\x62\xef\x04\x4a\x2f\xcb\x1f\xfa\x99\x33\xd4\xaf\x71\x7f\
+\x1f\xbf\xb6\x2b\xce\x30\x69\x0b\x52\xb6\x35\xe8\xc1\xb0\xb8\x97\
+\xb3\x2c\x47\xbe\x30\x83\xb1\x63\xc7\xe2\xf6\xdb\x6f\xc7\x0e\x3b\
+\xec\xe0\x14\xfd\x3b\xba\xbf\xae\x56\x67\x5c\x07\x03\x11\x79\x70\
+\xaf\x41\x2d\xe0\xe7\x63\xba\xf1\x3a\xe2\x88\x23\x44\xe0\x9b\xdf\
+\xb7\x72\x58\x7f\x70\x7b\x86\xd2\xf6\xd2\xe7\x0b\x14\x14\xed\x7b\
+\xbb\xe1\x86\x02\x18\x52\x6d\xfd\x4f\x7f\xba\xaa\xdb\xae\x9c\x60\
+\xc8\x5d\x3b\xfb\xc2\xe9\xc4\xad\xeb\x6b\xa9\x66\xd8\x86\xe2\xf3\
+\x6e\x8d\x42\xed\x3c\x6f\x40\xa1\x60\x8a\x77\x9d\x8b\xa2\xe6\x27\
+\xfb\x05\xc6\xe3\x49\x84\x82\x11\xcc\x7f\xfc\x29\x8c\x5e\x7f\x03\
+\xa4\xd2\x25\x30\x34\x1d\x23\x0a\xc8\xda\xa6\xf3\x80\xa1\x79\x93\
+\x55\x48\x7a\x7b\x56\x3a\x59\x8c\x1e\x15\x95\x06\xad\xd2\x3e\x8e\
+\x18\xda\x03\xd6\x54\x7a\xb8\x67\x30\x4c\x39\x60\x48\x72\x85\x82\
+\xa1\x07\xc1\x80\xa7\x4f\x60\x68\x42\x49\x61\xa7\x63\x04\x99\x9c\
+\x7d\xd7\x53\xad\x56\xb3\xb5\x2a\xc6\x4c\x4b\x3b\x34\x54\x4d\xed\
+\x03\x5e\xf3\xd5\x57\x3f\x83\x57\x5e\x7c\x1d\xd1\x48\x03\x3c\x56\
+\x48\x74\x60\xbd\x5e\x1b\x76\xa1\x13\x8f\xce\xbf\x1b\x9f\x2c\x66\
+\xce\x30\x25\xe5\x05\x1c\x57\x10\x0c\x43\xb5\x98\x39\xe7\x4c\x1c\
+\x38\x71\x12\xda\x3a\x3a\xc9\xc1\x84\xdf\xcb\x30\x29\x1b\xc1\xd6\
+\x60\xcc\x98\x10\x68\x77\xb9\x97\xf1\xfa\xcc\xa6\x84\xdf\x45\xdd\
+\xf7\x77\xde\x6d\xa2\x82\x2d\x52\xc9\x1c\x22\xe1\xa0\x78\x86\x8f\
+\x3e\xfc\x57\xc9\x19\x76\xb4\x2c\x07\x3c\x39\x21\xb4\xf0\x73\xda\
+\xda\x62\xf8\xda\x0e\x5f\xc3\x2d\xb7\xde\x29\x61\x52\x5b\x3a\xa1\
+\x50\x18\xda\x33\x60\x60\xe8\xf6\x0c\xe5\xfa\x2c\x43\xa0\x19\x0a\
+\x60\x28\xed\xd2\x9c\x92\x1d\xb7\x7d\x60\xae\x8e\x9d\x6e\x76\xdb\
+\x6d\xb7\xa2\x1e\xae\x7a\x85\x03\xc1\x52\xd6\xef\x52\x65\x21\x37\
+\x63\x9c\x1b\x38\xd5\xe0\xe5\xda\x3f\xf6\xd8\x63\xa5\x86\xd4\x6d\
+\x67\xb9\x49\xe6\xeb\x98\x3e\x18\xec\x07\xc1\x50\x3c\xc3\x6a\x27\
+\xba\xae\x01\xa4\x9a\x67\xc8\xf3\xa7\x02\xfb\x0d\x37\x5c\xef\x90\
+\x18\x7c\x12\x16\x59\xb6\x6c\x99\xe8\xef\x69\x98\xf4\x73\x36\x69\
+\xb5\x99\x5e\xfd\xe7\x39\x47\xca\x22\xd5\xf5\x22\xdd\xe4\xa9\x8f\
+\xe8\x63\xdd\x1a\x0d\x2f\x10\xf0\x87\x90\xc9\x66\x05\x0c\x9f\x78\
+\xf2\x59\x8c\x18\x3e\x12\xbe\x40\x44\x9e\xa3\x4b\x50\x60\xbb\x9c\
+\x1c\x41\xd4\x14\x76\xf9\x02\xd4\x3c\x25\xe9\xc6\x30\x4d\xeb\xea\
+\x6a\x31\x6a\x64\xd8\x94\x5d\x30\xf4\xe5\x6c\x3a\x2b\xed\x3d\xdd\
+\x0b\xbb\x1c\x04\xe5\xa6\x75\x2e\xd7\x78\x86\x19\x27\x4c\x4a\x6f\
+\x94\xeb\x87\x89\x25\x05\xc3\xc9\x55\x3d\x43\xd3\x8e\x28\x6a\x80\
+\x5c\xca\x47\x7c\xd0\xc6\xcc\xe5\x39\xe9\xfe\x7a\x82\xe5\xb3\xa4\
+\x9f\xaf\xbb\x74\xdd\xb9\x13\x44\x53\x29\xd6\x7b\x02\x7f\xba\xea\
+\x09\x3c\xf7\xec\x4b\x22\x28\x40\x25\x20\x9e\x43\x28\xc8\x21\x4f\
+\x60\xfe\x13\xf7\xe2\x83\x0f\xde\x84\x65\x65\x04\xd4\x18\xd2\x16\
+\x61\x84\x40\x0d\x4e\x9b\x7b\x16\x0e\x9a\x74\x38\xda\x3b\x63\xb0\
+\xd8\xde\xca\x47\xcf\x30\x83\xfa\x5a\x86\x49\x03\xf2\xd9\x04\x16\
+\x99\x3f\x12\x51\x19\x96\xcd\x01\x1f\xbc\xdf\x24\x25\x2a\x1c\x0b\
+\xb2\x80\xa3\x35\x41\xcc\x7f\xf4\x01\xcc\x9e\x33\x15\x6d\xcd\xcb\
+\x4c\x78\x35\x9d\x11\xa2\x14\x87\x9a\x04\x9a\x1b\x6f\xba\x4d\xc2\
+\xa4\x94\x53\x95\xcf\xca\xd3\x88\xb2\xdd\x57\xcf\xcd\x9b\xfb\xb2\
+\x62\xbb\x11\x68\xa4\xbc\x6a\x68\xb2\x49\xc9\x18\x56\x60\xe2\x3c\
+\x6c\xb6\xd9\x66\x92\xa7\x63\x19\x85\x82\xa5\xa8\x3f\x65\x4d\x61\
+\xbd\x34\xe9\xae\x12\xf5\xeb\xcb\xf8\xb9\x5f\xe3\x2e\xdb\xd1\xf0\
+\x29\xa3\x71\x24\xeb\x90\x60\xc3\x83\x20\xe8\x26\x32\x0e\x01\x05\
+\xb3\x82\xe5\xf7\x07\xed\x5c\x2e\xe7\x59\xd7\x60\xb7\xaa\x13\x52\
+\x3e\xc1\xbc\xe9\x0f\x3d\xf4\x50\xf1\x0c\xc5\x86\x89\x4a\xbb\x85\
+\x8f\x3f\x5e\x2c\x85\xcf\x7f\xff\xfb\xdf\x2b\xb2\xf8\x56\xf5\x7b\
+\xff\x57\x5e\xaf\x21\xb6\x81\xda\x3c\x90\xae\x1e\x0c\x98\x5a\x2c\
+\x82\x1c\x8b\xf4\x6b\x6a\x6a\xf1\xfb\x4b\x2e\xc3\xa6\x9b\x6e\x8e\
+\x0c\x73\x54\x5e\xd2\xe9\x03\xe8\x8a\x51\xd0\x3b\x84\xcd\xb6\xd8\
+\x52\x72\x51\x14\x50\x26\x20\xd2\x30\xf2\xbc\xc2\xe1\x10\xea\x6b\
+\xc3\x08\x85\x1d\x8d\x65\x9b\x37\x1f\x90\x4c\x50\x75\x9f\x0c\x36\
+\xd3\x9d\x9e\x22\x01\xa2\x9f\x43\xef\x91\x02\xcd\x52\xa6\x01\x24\
+\x12\xa6\xe7\x20\x8d\x3e\x4b\x02\xe9\x25\x10\x77\x63\xb1\x0c\x62\
+\xf1\x2e\x09\x8f\x7a\xbd\x46\x49\x46\xc8\x3c\xc8\xe1\xb4\x53\x4f\
+\xc0\xbc\x79\xb7\xc3\xef\xf3\x1a\x31\x71\x76\x00\x40\x56\x72\x34\
+\x6c\x42\x4c\xe1\x69\x73\xac\xdd\x70\x50\x5f\xee\x5b\x1a\xfe\x4c\
+\x16\xb8\xfb\xce\x05\x02\x86\xac\x31\xf4\xfb\xc3\x48\x26\xe3\xc8\
+\xe6\x58\xa7\x99\xc5\x23\x0f\xdf\x8d\x58\xbc\x19\xc9\x64\x9b\x01\
+\x1f\x69\xd9\x93\x47\x28\x18\xc5\xac\xd9\x67\xe2\xa0\x49\xbf\x42\
+\x67\x2c\x29\x2c\x53\x6e\x78\x18\x6e\x64\x6e\xbe\xa1\x2e\x80\x60\
+\x48\x9a\x8f\x08\xa8\x89\x82\x49\xb6\x80\x78\x22\x83\x44\x3c\x2b\
+\x1e\xbf\x68\x7a\xe6\x6d\xd4\x37\x44\xf1\xc4\xfc\x87\xc4\x33\x6c\
+\x5e\xb6\x58\x08\x34\x36\x85\x1a\x7c\xf4\x30\x0a\xd8\x69\xc7\x9d\
+\x70\xda\xec\x33\xb0\xd7\x5e\xdf\x41\x22\x95\x42\xce\xce\xc8\x3d\
+\x2c\x6d\xb1\xbc\x21\x09\x0d\x52\xa5\x89\xe2\xde\xbc\x6e\x2d\xa3\
+\xea\x8b\x07\x54\x1e\x26\x95\x88\x82\x53\x5a\xb1\x78\xe9\x0a\xa4\
+\x59\x3f\xe8\x31\xe1\x71\xb6\x9b\x82\x9d\x41\x24\xe4\xc7\xc4\x83\
+\xf6\xc3\x8b\xcf\x9b\x3a\x43\x36\x3d\x2c\xe4\x39\xef\x8c\x7b\x07\
+\x71\xc9\xe5\x57\x4a\x69\xc5\x8a\xe6\x56\x78\x7d\x41\x59\x13\x9a\
+\xaf\x4b\x25\xe3\x18\x3e\x7c\x18\x1e\x7d\xf8\x11\x9c\x34\xe5\x58\
+\xb4\xad\x58\xdc\xaf\x3a\x43\x77\x69\x85\x46\x5c\x78\x1a\x1c\x8b\
+\xc6\xc6\x46\x7c\xfd\xeb\x5f\xc7\x07\x1f\x7c\x00\x4a\xb0\xf1\x3c\
+\x56\xac\x58\x81\x1d\x77\xdc\x51\xda\x65\x51\x10\x9d\x63\xa7\x82\
+\xdb\xe5\xb6\x53\xd7\x10\xcf\x5d\x99\xd0\x1a\x6a\xd7\xc7\xb4\xef\
+\x24\xa5\xf4\x48\x48\xa4\x93\x41\xd0\x25\x08\x12\x1c\xf9\x3c\x99\
+\xa4\xcb\x97\x2f\x37\xa5\x51\x8e\x78\x08\xcf\x51\x4b\x59\x06\xb9\
+\xed\xcc\x13\x0c\x85\x4d\xda\x97\x9b\x6a\x30\x5d\x4c\xa5\x09\xdd\
+\x7a\xeb\xad\xa5\x4f\x5a\x73\x73\xb3\xec\x88\xd4\x2b\x61\x6f\x2e\
+\xb7\xd4\xd9\x50\xbb\xd6\xb5\x31\xee\xe5\x9e\x77\x69\x11\xbb\x92\
+\x3a\xfd\x38\x91\x48\x88\xf5\x85\x39\x64\xd8\xef\xd0\x63\x34\x4e\
+\xe9\x35\x6d\xb9\xd5\x17\xd1\xb4\xbc\x59\xc0\xc8\xc7\x2e\x18\xb6\
+\x11\x51\xde\x74\x93\xcd\x70\xca\x29\x53\xb1\xcd\x36\xdb\x21\x10\
+\x0a\x09\x39\x23\x67\x9b\xd0\x19\x6f\x76\xe6\xad\xa4\xbb\x40\x9e\
+\x3b\xe0\x2c\x42\x01\xee\x86\x33\x92\x97\x1a\x36\xbc\x1e\x21\x36\
+\x6c\x65\x6d\xb4\x03\x89\x09\x7a\x20\x16\x35\x16\xe3\xd2\xcd\x9e\
+\x89\x48\x76\xd7\xa0\x36\x2a\xdb\xf1\x84\x22\x51\x51\xe3\x48\x3b\
+\x7a\x8c\x6e\x30\xf4\x58\x39\x9c\x33\x67\x3a\x6e\xbe\xf9\x7a\x01\
+\x0a\x2f\xd5\xfb\xf3\xac\x6f\x24\xf5\xbf\x20\x6d\x70\x36\xd8\x60\
+\x83\x32\x30\x2c\x07\xc5\xfe\x69\xcb\x6a\x98\xb4\xa7\xb5\xdb\xeb\
+\x9a\x2e\xb0\xfe\xd3\x8b\x37\xde\x7c\x17\x9f\x7e\xba\x1c\x7e\x5f\
+\x48\x7a\x58\x8a\x67\x5c\xc8\x21\x8f\x04\x56\x2c\xff\x18\xc9\x74\
+\xbb\xc8\x90\xd1\xe8\x8b\x87\x9f\xa1\x5c\x5a\x14\xb3\x4e\x3b\x0b\
+\x13\x0e\x3d\x0a\x9d\xb1\x84\x80\x21\x19\xc1\xec\x56\xc2\x39\x0c\
+\x47\xfc\x12\xca\xec\xea\x6c\x83\xe5\x33\x6d\x82\x38\xea\x2c\x4e\
+\xcf\x65\x0b\xc8\xd9\x5e\x11\x4a\xf0\x58\x16\xea\x1b\xc2\xc2\x26\
+\x9d\x31\xf3\x24\x01\x43\xef\x7f\x95\x7d\xf2\x59\xe6\x05\x8b\x62\
+\x46\xd8\x64\x93\x2f\x88\xe1\x6e\xef\x64\xed\x1e\x6b\x27\x03\xa2\
+\x96\x32\x73\xfa\x6c\x91\x70\x33\xd2\x62\xa6\xfe\xd4\x4d\xea\x70\
+\x33\x1b\x2b\x2d\xd3\xa1\x0e\x86\xc6\x7b\x76\xb8\xcf\xdc\xd8\x39\
+\xbf\x73\xbc\xb9\x21\xa3\x7d\xe3\xa1\xfd\x06\xf9\x3b\xd3\x43\x8f\
+\x3e\xfa\xa8\x6c\x20\xcb\xc3\xec\xba\x81\xd0\xbc\x7e\x5f\x08\x37\
+\xac\x69\x64\x9d\xe1\x4d\x37\xdd\x24\x20\xe8\x26\xd1\x10\x94\x95\
+\xab\x21\x5b\x42\xd7\x39\x9a\xdf\xfb\x61\x3c\xd6\xce\x5b\xb3\x04\
+\xc3\x44\x2e\x97\x0b\x0f\x35\x80\xa8\x04\x86\x1c\x74\x82\xa0\xbb\
+\xc3\xb8\x86\x0c\xdc\xbb\xa9\xa1\x76\xad\x03\xbd\x16\x2a\x8d\x1d\
+\x6f\x16\x77\x52\x7c\xa0\xbf\x53\x77\xb6\x24\xcf\x68\xa7\x73\xe6\
+\x11\x82\xa1\x30\xd2\x2c\x4a\x23\xf1\x84\x2a\x1e\x42\x38\xf1\xa0\
+\xbe\x61\x04\x6e\xbe\xf9\x16\x7c\x65\xfb\x1d\x90\x4c\xa7\x90\xb1\
+\x8d\x82\x90\x69\x1a\x6c\x0e\x0d\x9b\xb2\x6d\x54\xde\x4e\xa3\x60\
+\x67\x31\xac\xb1\x0e\xa3\x46\x0d\x43\x38\x48\xb0\xa4\x57\x97\x97\
+\x42\x7e\xb6\xdd\xe1\x3b\xdb\xda\x52\x52\xee\x40\x99\x35\x9e\x4b\
+\x26\x67\xda\x5a\xd1\xc0\x0b\x30\x92\x2d\x49\x79\x39\x72\x7d\xf8\
+\x7d\x2c\x02\xf9\x2f\x38\x9c\x3d\x7b\x1a\x6e\xb9\x85\xdd\xbf\xe9\
+\x2d\x05\x91\x4a\xa7\x40\x86\xab\xf1\x04\xcc\xd8\x75\xf7\x0c\x07\
+\x16\x0c\xab\x75\xad\xe8\x7d\xbe\x78\x3d\xd4\x84\x15\x73\x29\x64\
+\x14\xe3\x35\x7b\xc5\x3b\xce\xe6\x12\x0e\xb0\xa7\x45\x94\x80\x1e\
+\x93\x94\xc0\xa4\x73\x08\x85\x8d\x67\x38\xf1\xd0\x5f\xa3\xb3\x33\
+\x25\xe1\x45\x3e\x97\x49\xe7\x24\x0c\x47\xc0\x22\x3d\x87\xc2\xd6\
+\x05\x47\xd0\xc0\x94\x2b\xf9\xa4\x90\xde\xce\x99\x66\xba\x1c\x64\
+\x82\x61\x25\xcf\x90\xf8\xe9\xf7\x85\x91\x4c\x25\x9d\x9e\x83\x3c\
+\xcf\x3c\x3c\x3e\x4b\x3a\x5e\xf0\x38\xf7\x9c\x73\x71\xe2\x89\x27\
+\x16\x95\x4f\x56\xc5\x88\x9b\xb5\x62\x0e\x25\xd0\x94\x7b\x86\x99\
+\x82\xd7\x28\xd0\x78\x83\x45\xcf\x90\x6b\x68\xb0\x78\x86\xc6\x43\
+\x36\x63\xe1\x06\x1a\x9d\x77\xb5\x7d\x1c\x7b\x7a\x82\x04\x37\x32\
+\x4c\x9f\x79\xe6\x19\xf9\xdd\x44\xca\x4c\x55\xae\x74\x8a\x29\x2a\
+\x36\x75\x5f\x39\x7c\xce\x5d\x6e\xc6\xdf\xb5\xb0\x9f\xe1\xd9\x03\
+\x0e\x38\x00\xf7\xdd\x77\x5f\xf1\x1c\xf8\xbd\x04\x63\x02\xa1\x1e\
+\xe5\xac\xf2\x21\xe2\x19\x26\x09\x86\x1d\xd9\x6c\xb6\x6e\xe0\x8d\
+\xdf\x9a\xfd\xc4\x72\x83\xce\x58\xba\xea\xab\xaa\x1a\x07\x17\x05\
+\x0f\x16\xa0\x6a\x81\xa8\xdc\x18\x55\xd4\x74\x3e\xeb\x0c\xd3\x4a\
+\xd7\xa7\x9b\x05\xf7\xd8\xb8\xc7\xb8\xda\x98\xf5\x75\xb6\xc5\xab\
+\xf3\xfb\xe5\x06\x13\xd6\xa9\xd7\x2f\x84\x1a\x13\x1a\x0d\x4b\x77\
+\x79\x82\x21\x49\x34\x0f\x3c\xf0\x10\xb6\xd8\xe2\x0b\xe2\x39\x46\
+\x6a\xa2\x46\x54\xd9\xc8\x92\x74\x9b\x43\x69\xb9\x43\xa1\x85\x42\
+\x06\xc3\x09\x86\x23\xeb\x44\x63\xd3\x50\xf2\xf3\x86\x88\xe3\x0d\
+\x48\x98\xb4\xa5\x39\x29\xca\x30\x34\xd4\xf4\xfe\x72\x79\x32\x15\
+\x4d\x83\x57\xb9\x46\x8f\xb6\xb6\x62\x78\x2f\x27\x06\x9e\x32\x8e\
+\x33\x4f\xf9\x0d\xee\xb9\xe7\x0e\xa9\x79\x0b\x85\x82\x62\xb8\xbd\
+\x5e\x23\x41\xc5\x1a\xd6\x95\x8f\x55\x03\xc3\x6a\xe3\x57\xee\xf9\
+\xe8\xdc\xf4\x6d\xad\x52\x35\x87\xea\x28\xec\xcd\x18\x11\x50\x94\
+\xfa\x43\x8b\xc0\x46\xd9\xb8\xb4\x23\x5c\xc0\x58\x27\x1b\xde\x9a\
+\x0e\xf0\xb9\x8c\x2d\x2a\x41\xa7\xcd\x39\x0b\x13\x26\x1d\x59\x04\
+\x43\x02\x17\x45\x9b\x8d\x51\xa5\xef\x6d\x04\xba\xd9\xf5\x41\x04\
+\x13\xa4\x11\xb4\x69\xa4\xab\x60\x48\x50\x53\x30\x64\x69\x85\x3b\
+\x4c\x4a\xbb\x2c\x11\x01\x61\xb5\x70\xd3\xc2\x90\xb9\x91\xbb\xa3\
+\xce\x2d\x15\x87\xce\x3f\xf7\x22\x1c\x73\xcc\x31\x32\x4c\xee\xba\
+\xb9\xbe\x84\x48\xfb\x0a\x86\xe5\x61\xd2\xc1\x04\x86\xe5\x9e\xa1\
+\xac\xee\x32\x77\x8b\xf3\xc6\x75\xcc\x39\xe0\xba\xfc\xc6\x37\xbe\
+\x21\x85\xf0\xe5\x87\x32\x8f\x25\x52\x93\xc9\xc8\x06\xc3\xdd\xf7\
+\x50\x3d\x6f\x77\x89\x86\x0a\x9a\x4c\x9c\x38\x51\x72\x94\xbc\x87\
+\xd5\xbe\x2a\x57\x40\xe7\xbe\xfc\xdc\x86\x88\x67\xd8\x49\x30\x5c\
+\x91\xcd\x66\xab\x6a\x93\x56\xbb\x59\xd7\xf6\xf3\xe5\x60\xc8\xc9\
+\x2f\x07\x3f\x65\x35\xf2\x86\x51\x6d\xd2\x6a\x60\xa8\xbb\x22\x7d\
+\x9d\x82\x40\xb5\x24\xf4\x40\x81\xc5\xda\x1e\xc7\x6a\xdf\xd7\x37\
+\x63\x5b\xed\x53\x20\x37\x9c\x6e\x48\x34\x7c\xcd\xc7\x08\x8a\x8e\
+\x14\xb7\xf3\xd3\x2b\x8c\x4c\xe6\xb5\x9e\x7c\xf2\x69\x6c\xb5\xe5\
+\xd6\xe8\x8c\x33\xb7\xe5\x30\x65\xa4\xeb\x80\xa9\x41\x54\x63\x40\
+\xfa\x3d\xf3\x3c\xf4\x4e\x86\x35\xd4\x60\xd4\xc8\x7a\x29\xc8\x57\
+\x30\xa4\xcd\xb0\x3d\x3e\xf0\x23\x5a\x5a\xe2\x68\x69\x6e\x97\xb2\
+\x01\x86\x65\x09\x8a\x0c\xdb\x32\x37\xa8\xb9\x0e\xbe\x8f\x84\x1d\
+\xd9\x25\x33\x64\xe8\xb3\x30\xfd\xa4\x13\xf0\xc8\xc3\xf7\x23\x9d\
+\x49\x4a\xc8\x4f\xf2\x43\xb9\xa4\x18\x05\xe6\x10\x4b\x1c\x05\x05\
+\xc1\x55\x03\xc3\x6a\xeb\xa7\xda\xf3\xd5\x66\xa0\x24\x8f\x47\x76\
+\x26\x81\xcb\x78\xb2\x96\x23\x6c\x60\x24\x67\x8c\x31\x35\xe3\xe0\
+\x45\x21\x5f\x40\x24\x52\x8b\xd9\x24\xd0\x4c\x3c\x0c\x1d\x9d\x71\
+\x01\x2d\x02\x6a\xce\xe9\x8d\x67\x40\x9a\xef\x65\x19\x4d\xba\xd4\
+\xda\xc7\x63\xf2\xbf\x24\xe1\xa8\x67\x58\x57\x1f\x92\x30\xe9\xf4\
+\x19\x53\xd0\xb4\xe4\xe3\x62\x98\x94\xe7\xe1\xb1\x8c\x9c\x1f\x95\
+\x89\xd2\x99\xb4\x80\x61\x5e\xc8\x33\x40\xb4\x26\x84\xf3\xce\xb9\
+\x50\x34\x57\xb5\x6f\x23\x23\x40\x3c\x44\xe0\xdd\x69\x2d\xd6\xdb\
+\x18\xf4\xc5\x33\xec\x29\x67\xf8\xc2\xc2\xa7\xd7\x78\xce\xb0\x9a\
+\x7d\xe1\x1a\x77\x83\x9f\xbb\xee\x94\xef\xe5\xbd\xa4\x1e\xa1\x96\
+\x35\x30\x67\xc8\x56\x5a\xbc\xc7\x4c\xaf\x45\x43\x7e\x52\xb0\x53\
+\x3e\x80\xfb\xb3\x14\x28\x39\x96\x7c\x9f\x9e\x17\x1f\xa7\x8d\x25\
+\x49\xf1\xd6\x5b\x6f\x2d\xe6\x04\x39\x0f\xfc\x3c\x0a\x3e\xf4\x24\
+\x5c\x32\x44\xc0\xb0\x99\x6c\xd2\x4f\x72\xb9\xdc\x86\xd5\x6e\xa6\
+\xc1\xf6\x7c\xf9\xe2\xe1\x8d\xa4\xfd\xb7\x34\x34\x4a\x83\xc5\x45\
+\xc2\x89\xea\x6b\x98\xd4\xbd\x30\xdc\x3b\x9c\x6a\x8b\xb5\xbf\xc6\
+\x6a\x4d\x8f\x6f\xa5\x9c\xa0\x18\x43\xc7\x8a\xaf\xf9\xf3\xf7\x88\
+\xc1\xe3\xf7\x84\x23\x41\x99\x2b\x86\x4b\xa9\x5c\x61\xfa\x1f\x52\
+\x99\x86\x21\xc7\x90\x18\x62\xe6\x9b\x1e\x7a\xe8\x11\x6c\xb1\xc5\
+\x96\xb0\xa5\xff\x5c\x41\x08\x0e\xda\x22\x4a\xda\xef\xa8\x87\x6f\
+\x19\x41\xb5\x9c\x9d\x46\x5d\x6d\x10\x23\x47\xd4\x21\xec\x27\xf3\
+\x25\x27\x25\x17\xcc\x4d\x16\xd8\x64\x16\x54\x84\xc9\xa0\xa5\xa5\
+\x4d\x40\x90\x65\x1e\xfc\x29\x75\x8f\x99\x4c\x29\x27\x23\x3d\x14\
+\xa9\x92\xc3\xfc\xa6\x91\x1f\xa3\x67\xf8\xc0\xfd\xf7\x81\xfa\x9b\
+\x0c\xba\x35\xd4\x37\xa0\xbd\xa3\x59\xa6\x4d\xd9\x90\xdd\xe7\x70\
+\xd5\xc0\xb0\xda\xfc\x6b\x58\xab\xa7\x75\x58\xbe\x6e\xbb\x7f\x9e\
+\x69\x58\x9b\x96\xf2\x15\x86\x40\x4d\x0e\x47\x8c\x97\x48\xbd\x98\
+\x86\xcc\xe6\x33\xe8\xcd\x91\xc5\x4b\x90\x2b\x20\x1a\x6d\xc0\xac\
+\xd9\x73\x70\xf0\xa1\x47\x08\xd3\x96\x9e\x1e\x3d\x43\x5b\x3a\x9f\
+\x98\x5c\x54\x81\xe4\x12\x8b\x61\x6c\xc3\xf6\xe5\xbc\x30\x04\xcb\
+\x71\xe5\x6b\x78\xf0\x33\xdd\x9e\x61\xd3\xd2\x4f\x10\x10\x02\x0d\
+\x05\xc5\xa9\xdc\x63\x42\x80\xd2\x11\x22\x9f\x47\xa4\x26\x2c\xf9\
+\xe0\x64\x22\x81\x60\xc8\x87\x0b\xcf\xbf\x58\x3a\x26\x10\xfc\x8c\
+\x47\x4b\xa6\xae\xf1\xd4\x0a\x43\x27\x00\x00\x20\x00\x49\x44\x41\
+\x54\x4e\xfb\x22\x42\x5d\x0d\x0c\xb5\xe8\xbe\x52\x98\x74\x30\x82\
+\xa1\xce\x6f\xf9\xfd\xab\x0d\x0a\x38\x4e\x7b\xed\xb5\x17\xe6\xcd\
+\x9b\x27\x20\xe6\x3e\x38\x66\xb4\x89\x04\x32\xfe\xe7\xdf\xca\x44\
+\x55\x49\x45\xce\xab\x3b\x1a\xa1\xec\xd4\xa3\x8e\x3a\x0a\xe4\x60\
+\x30\x0a\xe7\xf6\x44\xcb\xed\x8b\xe6\x2e\x4b\x25\x43\x6b\x97\x58\
+\x56\xed\x7e\xaa\xf0\xfc\x62\xcb\xeb\x0d\xbc\x6b\xdb\xb9\x2d\x56\
+\xe3\xcd\xeb\xf4\x2d\xe5\x46\x41\xc3\x03\x3a\xb9\xba\x13\xe2\x8d\
+\xc2\x1d\x4e\x5f\xc0\x50\xbd\x42\xf7\x02\xd3\xdd\xd3\x50\x07\xc3\
+\xf2\xc9\xd2\x85\x6c\xf2\x63\x46\xf0\x97\x37\x80\x3b\xaf\xe0\x0e\
+\x7b\xf4\x7f\xb2\x59\xa2\x10\x74\x6a\xf0\x18\xb6\x33\x32\x5c\x3c\
+\xc4\x6b\xa1\xdb\x26\x0c\x45\xb2\xde\xf2\x08\x85\x22\xb8\xf7\x9e\
+\xfb\xb0\xd1\x46\x1b\x83\xca\xd1\xe9\x8c\x2d\x39\x1d\x9a\x59\x31\
+\xb2\x4e\xdf\x44\x42\x16\x8d\x70\x6d\x34\x8c\x5c\x36\x81\xda\x9a\
+\x00\x46\x0c\xaf\x41\x50\xda\x0a\xe5\xc0\xbe\x13\xf4\x62\x6c\x2b\
+\x24\x94\xff\xd6\x96\x04\x5a\x5a\x3a\x80\x02\xdb\xf7\x04\x85\xe8\
+\xc1\xcc\xa2\x2a\xb7\x48\xcd\xa2\x74\xcf\x60\xb0\x8e\x9e\x09\x73\
+\x86\x79\xcc\x9e\x76\x32\x6e\xbf\xfd\x16\x09\x93\x32\x93\x58\x57\
+\x5b\x87\x78\xa2\xc3\xd9\x4c\x54\xea\xe6\xd1\xfd\xe6\x37\x62\xe2\
+\xab\x7f\xb8\xeb\x10\x2b\x6d\x5c\x7a\x5f\x9f\x79\x84\x23\xbc\x0f\
+\x4c\x19\x03\x3d\x62\xe6\x47\x05\xb4\x3c\xa6\xfc\x83\xb9\x58\x19\
+\x57\x06\x96\x6d\xfe\x6e\x48\x2a\x91\x70\x2d\x66\x9c\x36\x0b\x93\
+\x0e\x3f\x42\xba\x56\xd8\x39\xe3\x19\xda\xd2\xf8\xd8\x84\x54\x49\
+\x6a\x0a\x04\x38\x27\xc6\xa3\x16\x40\x24\xee\x4a\xe1\xbe\x91\xd8\
+\x63\xb8\x93\x60\xc8\xa2\x7b\x86\x49\x57\x2c\x5b\xdc\x0d\x0c\x09\
+\xb0\xe2\xc1\xb0\x5b\x06\xe9\xbc\x2c\xee\xff\xaf\xf2\x0f\xdb\x82\
+\xd5\xd6\x45\x04\x0c\x69\x88\x79\x68\x5d\xb4\x8a\xf0\xf7\xbe\x11\
+\x30\x63\xde\x17\x30\xec\x29\x4c\x3a\x58\xc0\x50\x57\x8f\xda\x24\
+\xf7\x6a\xe2\x18\x28\x20\xa9\x87\x46\x75\x1a\x36\x51\x26\x18\x72\
+\xd3\xa9\xe9\x23\x8e\x33\x35\x9b\x59\x72\x46\x92\x8d\xfb\xe0\x7b\
+\xa9\x68\xf3\xca\x2b\xaf\x08\x50\x92\x95\x4a\x1b\xa1\xc0\x78\xff\
+\xfd\xf7\xe3\x93\x4f\x3e\x31\xf9\x62\xa7\xb0\x5f\x59\xaa\xee\x28\
+\x9a\x9e\xcb\x10\x02\xc3\xf7\xe8\x19\xbe\x9e\xcb\xe5\xc6\xad\xfe\
+\x6d\xba\x6e\xde\x59\xe9\xe6\x77\x1b\x09\x77\xd7\x04\xb7\x44\x95\
+\xdc\x18\x3d\xe4\x0c\xff\x97\xc0\x90\x37\x06\xc7\x85\xff\x09\x80\
+\x0c\x61\xba\xc1\x90\x0b\x9c\xbb\x41\xdd\xe9\xf7\x14\x02\xe9\xfb\
+\xec\xd3\x88\x06\x90\xc9\x1a\x10\x54\x42\x40\x71\xf7\x29\xde\x60\
+\x16\x91\x68\x0d\x12\xf1\x24\x86\x0d\x1b\x8e\xbf\xfe\xf5\x01\x8c\
+\x1d\xbb\x89\xf4\xa0\xb3\xbc\x41\x01\xb3\x1c\x3d\xc4\x02\x0d\xb0\
+\xe9\x56\x9e\xcd\x53\x71\x25\x2b\x06\x99\xd2\x5e\xf5\x75\x61\x8c\
+\x1c\x51\x03\xb6\x68\xa3\x0c\xa5\x94\x58\xf0\x7d\xa2\x9d\x49\x02\
+\x8d\xd1\x0b\x35\x5e\x0d\xbb\x99\x18\x0f\x47\x36\x51\x2c\xdd\x60\
+\xa0\xce\x4f\x2f\xa9\x50\x64\xaa\x52\x7a\x7a\xf6\x8c\xa9\xb8\xf9\
+\xe6\x1b\x50\x5b\x53\x83\x58\x17\xc9\x02\x46\x26\x4c\xc3\xa4\x2b\
+\x2f\xa9\x72\x30\xd4\x8a\xc7\xca\xb4\xba\xee\x6b\x72\xe5\x50\xab\
+\xc7\xeb\xeb\xb6\x6e\x8b\xaf\xef\x53\x37\x99\x82\x6c\x0c\x78\x14\
+\x9b\x30\xd3\x63\x13\x99\x4e\x9f\x84\x43\x65\xa4\x04\x0c\x1d\x4f\
+\x91\xcc\x1a\x78\xa4\x16\x74\xda\x8c\xe9\x38\xf4\x57\x47\xa2\xa3\
+\x33\x06\xe4\xbd\x08\x04\x59\x4b\xc9\x3c\x9f\x99\x7d\x53\x0b\x68\
+\x36\x0d\x4a\x3c\x92\x46\xcf\x12\xfe\xf4\xc9\xe6\x82\xfe\x63\x5d\
+\x7d\x04\x8f\x3e\xf2\x20\xa6\x4e\x9b\x82\x25\x8b\x3f\x92\xd7\x8b\
+\xa7\xe7\x5a\x44\x81\x60\x58\xd6\x9c\x84\x71\x09\xae\x6c\x00\x1c\
+\x0e\xe2\xdc\xb3\xcf\xc3\xe4\xc9\x93\x8b\x9b\x5a\xf7\xfd\xaf\xf9\
+\xac\x3e\xad\x45\x07\x15\x95\x40\x13\x4b\x16\xb0\x64\x49\x33\x72\
+\x94\x63\xf3\x30\x77\xcc\xfa\xd2\x1c\x2c\x3b\x87\x50\xd0\x83\x89\
+\x07\x1d\x80\x17\x9e\x7f\x4a\xfa\x3e\x4a\x99\x4e\xa1\x54\x5a\x71\
+\xd9\xe5\x57\x4a\x0b\x27\x96\x56\xf8\xbc\x41\x78\x7c\xab\x5f\x5a\
+\x51\x7d\xb3\x6d\x48\x2f\x6e\x72\x8a\xbb\xb6\x94\xd7\xee\x16\xca\
+\xd7\x4d\x6e\xb9\x12\x8c\xa6\x28\x08\x86\x67\x9e\x79\xa6\x84\x9e\
+\x69\x0b\x54\x52\x8d\x1e\x1f\x73\xb3\xd7\x5f\x7f\x7d\xb1\x66\x58\
+\xd3\x19\xfa\xb3\x5c\x16\xae\xa7\xa8\x93\xac\xb7\x62\xe4\xa9\x6a\
+\x29\x7b\x9f\xa6\x6f\x0d\xbe\xe8\x0d\xca\xb1\x3d\x6f\xdb\xf6\x8e\
+\x7d\xf1\x9c\xd6\xe0\x89\xac\xf3\x8f\x56\x05\x15\x32\xa3\x18\x42\
+\xe0\xa1\x3a\x7f\xaa\x1b\x49\x03\xe4\x16\xa3\xe6\x44\x4b\xcd\x95\
+\x28\x2c\x90\x84\x50\x3a\xca\x17\xf7\x9a\x0f\x43\xf6\x3e\x84\x6e\
+\x85\x18\x21\xae\x78\x8c\x6c\x13\x65\xc4\xc8\xd2\xe3\xcd\xc1\x6b\
+\xe0\x2e\xf2\xe3\x8f\x3f\xc6\x8c\x19\x33\xf0\xd1\x47\x1f\x15\x6f\
+\xb0\xfe\xae\x8f\xea\x37\x7b\xc1\x91\x74\x33\x46\x7b\xd4\xc8\x51\
+\xd8\x65\x97\x5d\x30\x76\xec\xc6\x62\x30\x29\xe9\xc5\x5c\x62\x22\
+\x99\xc2\x06\x1b\x6f\x86\x7d\x7f\xf4\x13\x04\xc2\x51\xd8\x05\x47\
+\xcb\xd4\xf2\x82\x42\x35\x14\x91\x0e\x78\x49\xc0\xb1\x44\xc0\x9b\
+\xc5\xde\xb6\x88\x66\x87\x04\x0c\xd3\x69\xd3\xea\x86\x61\xc3\x6c\
+\x3a\x23\x5e\x25\xaf\x39\x93\x4e\xe2\x91\x47\x1e\xc6\x2b\x7f\x7b\
+\x1e\xc1\x90\x1f\x5d\x5d\x31\x09\xdf\xf1\xf3\xd8\x11\x7c\xbd\x91\
+\x23\xb1\xc5\x17\x36\x2b\x7a\xd0\x24\x9d\x28\x90\x6b\x34\xa2\xe7\
+\x19\x30\x84\x20\x83\x46\x06\x44\xcd\x51\x02\x46\xce\x09\x55\x79\
+\x58\xb4\x1f\x0c\x70\x27\x1f\x43\x7b\x5b\x27\xba\xba\x12\x68\x6d\
+\x6b\x87\x37\x18\x92\x06\xb4\xee\xa8\x85\x86\xb6\x84\xf5\x5a\x46\
+\xa6\x50\xb6\x65\xe9\x35\xb6\x21\x07\x99\x06\x45\xa2\x9f\x26\x9d\
+\x41\x08\x45\x1e\x93\x87\x95\xdc\x4f\x57\x52\xd6\x02\x8d\x22\xaf\
+\x6f\xf8\xf0\x91\xf8\xe6\x37\xbf\x89\xed\xc6\x7d\x59\xc6\x51\x5a\
+\x3b\x39\x5e\x1f\xd1\xd4\x74\x07\x64\xc8\xd5\x46\x80\xec\xda\x74\
+\x1c\xfe\x80\x0f\x7f\xfe\xf3\x9f\xf0\xfa\xeb\xaf\x89\x20\x42\xa1\
+\x90\x87\x55\xc8\x8a\x8c\xde\x9b\x6f\xbe\x81\x1f\xfd\x68\x5f\x6c\
+\xbe\xd9\x66\x88\x46\xc3\x18\x3e\x7c\xb8\x94\x05\x54\xdb\x6c\x51\
+\x61\x85\xe7\xc5\xb2\x0b\x1e\x7d\xcd\xe5\x17\xe7\xc4\xed\x98\x0b\
+\x4b\xd8\x14\xdd\x77\x25\x0a\x58\xba\x6c\x05\xb2\x79\xca\xe7\x98\
+\x28\x89\xe4\x9f\xf3\x36\x42\x41\x4b\x9a\xfb\xbe\xb8\xe0\x69\x58\
+\x4e\x28\xbe\x27\x30\xf4\x7a\xd8\x10\xd7\x08\x4c\x08\xb9\x24\x1e\
+\x93\x3a\xc3\xf9\x8f\x3e\x8a\x93\xa6\x1c\x87\x96\x15\x9f\x54\xad\
+\x33\xac\x64\x83\x38\x27\x1a\xc6\xd4\x54\x10\xaf\x49\xc3\xc4\x9a\
+\xe3\x2d\xb7\x2f\x95\xd2\x48\x1a\xe9\xe1\x18\xf2\xf5\xec\x4b\x78\
+\xc8\x21\xa6\x7f\xa4\x99\x43\x13\x3a\x3f\xf5\xd4\x53\x71\xe9\xa5\
+\x97\xca\xf7\x32\x95\x41\x4f\x52\x3f\xdf\xfd\x73\x5d\xdb\xb4\x81\
+\x04\x0d\xcb\xb2\x5e\x20\x18\x3e\x66\xdb\xf6\x9e\xfd\x35\x76\x03\
+\x79\x62\xeb\xe2\xb3\x74\x57\xa5\x0b\x9a\xe7\xa0\x8b\xb3\x7b\x3b\
+\x22\x73\x76\xee\x1d\x9a\x7b\x47\x56\xe9\xdc\x7b\xdb\x39\xad\xcd\
+\x6b\xad\x44\xc9\xa6\x9e\xe0\xd5\x57\xff\xb1\xdb\x69\x2c\x5e\xbc\
+\x44\xf4\x5c\xdf\x7e\xfb\xed\x52\x1b\x20\x87\x25\xe8\x36\x44\xab\
+\x72\xee\xd5\xc0\x50\x3d\x55\xde\x80\xba\xf9\xe0\x4d\xcb\x9b\x53\
+\x42\xb8\xc2\xf8\x0c\x20\x9b\xcf\xe3\x1b\xdf\xdc\x19\xb3\xe6\x9e\
+\x89\x4d\x37\xdf\x12\xd9\x3c\xeb\x0f\x69\xdc\x4c\xce\xcb\x2b\x24\
+\x10\xc0\x2b\x22\xdf\x36\x2c\x0a\x80\x8b\xda\x48\x40\x54\x65\x0c\
+\x10\x02\x41\x3f\x09\x1a\x2c\xfe\x27\x49\x24\x8c\xf7\xdf\x7b\x07\
+\x7f\xbc\xf2\x32\xdc\x71\xdb\x6d\x40\x81\xfa\x65\x05\xf8\x82\x7e\
+\xf8\x3c\x96\x30\x25\xe7\x3f\xf6\x18\xc6\x8d\xdb\x56\xbe\x43\x23\
+\x0d\xc2\xb8\x74\x88\x09\xbd\x5f\x9f\xe9\x92\x50\x3c\x8a\x3d\x15\
+\x4b\xfd\x15\xe9\x41\xd1\x4b\x25\xe3\x93\x58\x95\x4e\x19\x41\x80\
+\x74\x2a\x8b\xae\x44\x12\x79\xe9\x13\x48\x14\xa0\x07\x67\xd4\x61\
+\xa4\x65\x92\x20\xa4\xf9\x9b\x00\xaf\xcf\xf3\xa7\x78\xcb\xfa\x3a\
+\xf1\x0a\x0d\x7c\x49\xc1\x88\xc8\x91\x91\xf5\xc9\x1e\x7e\x64\x6d\
+\xda\x88\x44\xc3\xe8\xec\x88\x09\x98\xf9\xbc\x7e\x44\x6b\x22\xc2\
+\xf2\xa5\x47\xd0\x95\x24\x33\xbb\xd4\x0d\xc4\xc3\x22\x75\x8e\xab\
+\x39\x29\x76\x5d\x46\x90\x25\x26\x76\x1a\xa9\x54\x1c\x53\xa7\x9d\
+\x84\x87\x1f\x79\xc0\x74\x10\x96\xa6\xbf\x79\x51\xe4\xe1\x67\x51\
+\xcc\xf9\x07\x3f\xf8\x41\x37\x8a\x7f\x35\xc3\xca\x35\xe0\xce\x7d\
+\xad\x32\x18\xea\xf8\x4b\x84\xc0\xac\x09\x5e\x4e\x3c\x51\xc0\x92\
+\x65\x2b\x60\xe7\x99\x3b\x66\x5e\xdb\xe7\x8c\x1b\x19\xb2\x5e\x8c\
+\x9f\x70\x00\xfe\xb6\x80\x9e\xa1\x23\xe0\xe0\x78\x86\x1e\x4f\x10\
+\x97\xfc\xe1\x4a\x1c\xb0\xff\x04\x34\x35\xb7\x0a\x5b\xb9\x3f\x60\
+\xc8\x75\xa5\x65\x61\x1a\xd5\x52\x62\x90\x5b\xc4\x9d\x8f\x29\x23\
+\x9b\x63\xc0\x71\xa9\x24\xe5\x57\xbe\x1e\x75\xad\x72\x0d\xaa\xad\
+\x67\x7b\xb1\x5f\xfd\xea\xf0\xa2\x4a\x92\x8a\xcb\x1f\x7b\xec\xf1\
+\x52\xac\xcf\x43\x99\xa6\xff\x03\x60\x38\xdf\xb2\x2c\xdf\xdd\x1e\
+\x8f\xf5\x33\x77\x1c\xba\xda\xc2\x5c\x15\x23\x38\xd8\x5f\xab\x8b\
+\x46\x72\x1f\x79\xa3\x85\xc9\x9f\x6e\x39\xa1\x3d\xf6\xd8\x43\x68\
+\xca\x1c\x17\x77\xad\xcf\x3f\xfe\xf1\x0f\x3c\xf5\xd4\x53\xc5\x9d\
+\xdb\x60\xbf\x56\x3d\xbf\x92\x5e\x60\x5a\xd8\x61\x37\xdd\x74\x23\
+\x52\x29\xe3\xd9\xb2\x6c\x60\xf9\xf2\x26\x8c\x1b\x37\x4e\xf2\x05\
+\x5a\xa3\xa4\xe1\xd2\x35\x05\x86\xba\xe6\x34\x71\xcf\x71\x76\xd7\
+\xd6\xd5\x04\x6b\x24\x77\xd8\x95\x4c\xe2\x9b\x3b\xed\x82\xdf\x5d\
+\x76\x25\x36\xdd\x7c\x33\xb4\xb4\xc7\x91\xce\xb0\x19\xb0\xd1\xef\
+\x32\x61\x51\xbb\x1b\x18\x4a\xf7\x26\x82\xa1\xcf\x8f\x82\x14\x8b\
+\x3b\x6d\x88\xa4\x63\xbd\xc9\xa7\x75\x75\xb4\xe3\xbc\xf3\xcf\xc1\
+\x4d\xd7\x5f\x07\x58\xe2\x4b\x22\x10\xf4\x21\x93\x61\xf8\xd8\xc2\
+\xe3\xf3\xe7\xe3\xff\xfe\xef\xeb\xc5\x3a\x37\xf7\x5c\x97\x58\xa8\
+\x3d\xad\x00\x27\x46\xab\x4f\x17\xf3\x87\x25\x30\x24\x68\x31\x44\
+\xc7\x23\x93\x2e\x48\xa7\xf9\x78\x3c\x2d\x1d\xe0\xe3\xc9\x14\xac\
+\x60\xd8\x98\x63\x01\x1f\xed\xfe\x61\x7e\x4a\x7e\xd3\x79\xdc\xe4\
+\xfd\x4a\x8f\x9b\x11\x31\xf5\x93\xd2\x0e\xc9\x79\x9e\xaf\x97\xcd\
+\x82\xb4\xcd\xa2\x51\x65\x93\xdd\x3a\x91\x4e\x13\x16\xae\x45\x56\
+\xaf\x5f\x04\x0a\xa8\x00\x14\x08\x87\x0c\x1b\xd1\x32\x84\x23\x12\
+\x64\xc4\x66\x88\x97\x58\x10\x22\x0c\x43\xb1\xd4\x20\xa5\x17\x35\
+\xf9\xf8\xa3\xf0\xc0\x03\xf7\xc1\xe7\xa3\xaa\x0b\x6b\x33\xfd\x88\
+\xc7\x63\x72\x6f\x31\xef\xb4\xef\xbe\xfb\x8a\xf7\xa9\x20\xb0\xaa\
+\xf7\x8e\xe6\x2b\xfb\xfc\x3e\x97\x67\xd8\x23\x18\xc2\x30\x8b\x45\
+\xfa\x2f\xcf\x1a\x58\xcb\x01\xc3\xa7\x8b\x2d\xa0\xd5\x33\x1c\x68\
+\x30\xd4\x0d\xb6\xda\x1e\x46\x69\x14\x14\x69\x9b\xb4\x74\xac\xaf\
+\xf5\xc0\x3d\x45\xa6\xdc\xf5\x85\x04\xc3\xc3\x0f\x3f\x54\xc4\x26\
+\xc2\x61\xe6\xf3\x6d\xa9\x99\x3d\xea\xa8\xa3\xa5\xe1\x01\x37\x1f\
+\xee\x72\x35\x1d\xeb\x72\x60\xec\xf3\x1c\x0c\xe2\x17\x5a\x96\x35\
+\x8f\xdb\xa3\xeb\x7c\x3e\xdf\x21\xfd\x35\x76\x83\xf8\x3a\x7b\x3c\
+\x35\xf7\x82\xd1\x09\xd6\x30\x28\x6f\x52\xee\xc8\x28\x6f\x34\x77\
+\xee\x5c\x89\xad\x33\x6c\x26\x24\x3a\xe6\xa0\x9c\x46\x97\xb3\x67\
+\xcf\x46\x6b\x6b\x6b\x85\xfe\x5d\x83\x6f\x44\xd4\x43\x65\xf8\x97\
+\x3b\x4c\xf6\x26\xa3\x54\x1d\x85\x7e\xfd\x7e\x1a\x01\x7a\x26\x16\
+\xda\xdb\x3b\xa4\x31\x28\x9f\xd7\xa3\xbf\x91\x83\x6a\x9e\xa1\x1b\
+\x64\x15\x80\x55\x61\x84\x1e\x62\xac\xb3\x0b\x91\x50\x14\xf1\x54\
+\x0a\x3b\x7c\x7d\x27\x5c\xf4\xfb\x4b\xb1\xfe\x06\x1b\xa3\xb9\xbd\
+\x13\x3e\x3f\x59\x71\x86\x31\x27\x46\x92\x7e\x62\x81\xaa\x27\x42\
+\xb7\x31\x04\x8e\xbc\x09\x81\x49\x89\x0d\x6c\xf1\xf8\xb2\x39\x16\
+\xea\x33\x27\x15\x40\xac\xa3\x05\x17\x5e\x78\x01\xee\xba\xfd\x56\
+\x04\x42\x01\x29\xe0\x67\xc9\x04\x73\x5f\xf4\x9c\x16\x2e\x78\x56\
+\xe4\xad\xf4\x58\xa5\x3c\x95\x9c\x98\xf3\xce\x6e\xa9\x93\x52\xc8\
+\x94\x60\x44\xd2\x90\x74\xb9\xa0\xfe\xa7\x17\xe8\xe8\xc8\xa1\xb9\
+\xb9\xc5\x14\xa2\x07\x22\xe2\xcd\xb8\x37\xaa\x4a\x82\xe2\xcf\x9e\
+\xbc\x03\x1d\x77\x1a\x78\x86\x49\xdd\x61\x56\x05\x14\x3e\xc6\xb5\
+\xae\x44\x14\x0d\xc1\x29\xc8\x1b\x85\x93\xf6\x62\x31\x76\x09\x0c\
+\x59\x8f\x62\x2e\x2c\x1a\x0e\xca\x6b\xd8\xee\x2a\x18\xf2\xe2\x98\
+\x5f\xff\x0a\xf7\xdf\x3f\xcf\x94\x48\xd8\x0c\x1d\x32\x9f\x66\x36\
+\x5c\x24\x68\xfc\xf2\x97\xbf\x2c\x12\x70\x56\xe5\x4e\xd1\x4d\x7b\
+\x5f\x48\x33\xdd\x3e\xb7\x02\x18\xd2\xc9\x4e\x88\x67\xd8\x02\x3b\
+\xef\x75\xea\x4d\xdd\x60\xa8\x9e\xe1\x93\x6b\x05\x0c\x79\xbe\x9a\
+\x7a\xe1\xfa\x52\x30\xe2\xfa\xd7\xb2\x31\x5e\x37\x43\x97\xac\x6d\
+\xd5\x08\x05\xe7\xcb\x94\x28\x95\x8e\xf2\xfb\x4d\x37\xfb\xea\xbd\
+\x12\x14\xff\xf0\x87\x3f\xe0\xa8\xa3\x7e\x25\x60\xa8\xf7\x1c\xe7\
+\xe9\xc8\x23\x7f\x8d\xab\xaf\xbe\x7a\x25\x30\x74\xaf\xbd\xcf\x9a\
+\xc3\xe4\xf1\x58\xd7\x13\x0c\x7f\xef\xf5\x7a\x4f\xf8\x5f\xf2\x0c\
+\x7b\x22\xdf\x68\x58\xc2\x9d\x8b\xe1\x8e\x8c\xe2\xb3\xfb\xef\xbf\
+\x9f\xd4\x92\x09\x4d\x5f\x7a\xc5\x79\x70\xf5\xd5\xd7\x48\x52\xbf\
+\x9c\xad\xea\x36\xec\xab\x72\xa3\xaf\xc9\xd7\xf2\x9a\x35\x54\xe2\
+\x66\x8c\x6a\xa7\x0f\xea\x85\x12\x10\x79\x8d\x2b\x56\xb4\x60\xdb\
+\x6d\xb7\x45\x53\x53\x53\x31\x24\xa3\xf5\x5d\xab\x7b\x6d\xd5\xc0\
+\xd0\xbd\x63\xd5\x1c\x58\x37\xc3\x0f\x0f\xa2\xe1\x1a\xf1\x0c\x77\
+\xda\x79\x77\x5c\x78\xd1\xef\x30\x66\xc3\x8d\x10\x4f\xa4\x51\x53\
+\xdf\xe0\x34\x6f\x2e\x91\x54\x48\x73\x20\x81\xc6\xcb\xd0\x17\xd9\
+\xb2\x6c\x23\xe4\x35\x62\xe1\x25\xcf\xd0\x00\x23\x25\xbf\x12\x5d\
+\x9d\x38\xf7\xdc\x73\x70\xcb\x4d\x37\xc0\xe7\xf7\x4a\x57\x86\x82\
+\xc3\x10\x09\x47\x42\x78\xfa\xa9\x27\x24\x3a\xc0\x43\x43\xb7\x9a\
+\x7b\xa9\x6e\x18\x34\xb3\xe6\xee\x34\x2c\x9f\xe4\xe4\x10\x19\xbe\
+\x34\x32\x66\x06\xd1\xcd\x8f\x15\x4d\x64\xbe\xb6\x82\xa4\x12\x76\
+\xaa\x97\x9c\x5d\x99\xc1\x53\x16\xa1\x9b\xf9\x5b\x1e\x42\x34\x22\
+\xd5\x06\x08\x7b\x02\x43\x1a\x5e\xad\x15\xd3\x30\x1c\xaf\xd3\xcc\
+\x4b\x1e\xf9\x82\xa9\xf9\x33\x76\x42\xba\xbf\x15\x99\xa2\x0c\xd3\
+\x86\xfc\x01\x74\x74\xb4\x21\x1a\x09\xa2\xa6\x36\x82\xe3\x8f\xfd\
+\xb5\x68\xb9\x2a\x18\xd2\xcb\x64\xf8\x9a\xe7\xc9\x96\x43\x64\x39\
+\xea\x79\xf6\xb5\xf9\xac\xe6\x15\xf5\x9a\x75\x28\xfa\xe4\x25\xf6\
+\x08\x86\xc0\x92\x65\xcd\x0e\x18\xf2\x1c\x15\x0c\x33\x52\xd2\x71\
+\xf0\xf8\xfd\xf1\x22\xc3\xa4\x56\xae\x1b\x81\x66\xa0\x3d\x43\xda\
+\x19\xcd\x0d\xf2\xe7\x7a\xeb\xad\x27\x8d\xca\xb9\xd1\x66\x24\x87\
+\xf9\x52\x6a\x8f\x52\x63\x59\x81\xad\x37\x7b\xd1\x93\x8d\xd3\xf7\
+\xf0\xf3\xce\x3f\xff\x7c\x1c\x7d\xb4\x61\xe8\xaa\xa0\x3c\x7f\x3f\
+\xfa\xe8\x63\xa5\x2f\xac\x1e\x04\x5f\xe5\x51\xac\xee\xfd\xbf\x26\
+\x6d\xdb\x40\x7c\xb6\xc7\xe3\xb9\x84\x60\x38\xd7\xeb\xf5\xce\xf9\
+\x5f\x01\xc3\x4a\x3b\x26\x9d\x60\xf5\x9c\x94\x60\xa2\x4c\xac\x6b\
+\xae\xb9\x06\x87\x1d\x76\x88\x63\x08\x8d\x57\xc8\xfc\xc7\x8d\x37\
+\xde\x2c\xb5\x4f\xfc\xdb\xbd\x33\xab\x14\x5f\x1f\x88\x09\xeb\xcf\
+\x67\xb8\xf3\x96\x6a\x14\x69\x5c\x76\xda\x69\x27\x1c\x76\xd8\x61\
+\x60\x2b\x18\xfe\x4d\x0f\x81\x37\xe0\xb4\x69\xd3\xe4\xa7\x5e\xcb\
+\x9a\xf6\x0c\xd5\xcb\x51\x20\x74\xe7\x45\x44\x09\xc3\x4b\x61\x6d\
+\x3f\xe2\x89\x24\x76\xdc\x79\x57\x9c\x7b\xde\x85\x18\xb3\xfe\x86\
+\x88\x75\xa5\xe0\x0b\xf8\x25\xc7\x65\xd2\x67\x66\xb3\x22\x39\x1e\
+\xf6\xc2\x2b\x7a\x86\xcc\xa9\x99\xda\x34\x29\xa4\x27\x30\x3a\x1d\
+\x11\x18\x22\x8a\xc7\x3a\x71\xc6\x19\x73\x71\xe7\xad\x37\x9b\x30\
+\xa1\xa3\x44\x63\x53\x24\xdc\xef\xc7\x73\xcf\x3e\x8d\xaf\x7d\xed\
+\x6b\xc5\xd2\x13\x35\xe0\x0a\x42\xd5\x3c\x15\x32\x62\xe5\x10\x3c\
+\x73\xf5\xca\x70\xf2\x87\x5d\xd4\xfd\x2c\x98\x50\x69\x38\x14\x11\
+\xe0\x60\x19\x48\x7b\x7b\x27\x79\x9a\xc8\x4b\x8f\xc7\x12\x18\xba\
+\xc3\xfb\x95\x8c\x63\xf9\x1a\x34\xe5\x28\x24\x15\x71\x64\x0c\xc5\
+\x96\xe5\x14\xfc\x9b\x8f\x77\xc5\x62\xc2\x34\x25\x5b\x36\xc9\x62\
+\x6b\x39\x57\x76\xb5\x08\xa2\x23\xd6\x8e\xba\x3a\xd3\x8d\xc3\x44\
+\x90\xe8\x11\x1a\x2f\x46\xff\x67\x53\x69\xe4\x0b\xb6\x34\x5e\xe6\
+\x78\x9e\x70\xfc\x31\xb8\xe3\x8e\xdb\x44\xfb\x94\x30\x6e\xd2\x0f\
+\x86\x1c\x45\x05\x13\x7a\x86\xaa\x7a\xd2\xd7\x75\x5d\x09\xf4\xdc\
+\x00\xd9\xeb\xe7\x48\xac\xdc\xbc\x82\xce\x2c\x83\xc1\xbc\xf4\xae\
+\x24\xb0\x6c\x69\x2b\x6c\x9b\xe1\x62\x82\xa1\x49\x93\x14\xf2\x19\
+\x04\x83\x0e\x18\x2e\x64\xce\x90\xf9\x65\x6a\xe3\x1a\x36\xe9\x40\
+\x83\xa1\x19\xee\x52\x89\xcf\x91\x47\x1e\x89\x2b\xae\xb8\x5c\xce\
+\x97\x1b\x55\x6e\xd4\x29\x90\xcd\x08\x15\x05\xb1\x55\x40\x9b\x1e\
+\x5d\xa5\xce\xf2\x3d\x85\x49\xf5\xfa\x98\x9f\xe4\x86\x84\xa5\x15\
+\xee\xcd\x3f\xbf\x87\x91\xa2\x97\x5f\x7e\xb9\xf8\x78\x5f\xe7\x67\
+\x28\xbf\xce\xe7\xf3\x9d\x4e\x30\x9c\xec\xf3\xf9\x2e\xf9\xac\x87\
+\x49\x2b\xed\x94\x7a\xf2\x56\xd4\x43\xd4\x92\x03\xee\x92\x8e\x38\
+\xe2\xb0\x62\x9f\x44\xf5\xa2\xae\xbd\xf6\x3a\xa9\x7d\xa2\x41\x54\
+\xa1\xdb\x4a\x9b\x0a\xf7\x63\xeb\x6a\xc1\xb8\xc1\xd0\x4d\xbb\xe6\
+\xe3\x0c\x05\xb3\x0e\x49\x0f\x0d\xcb\x28\x59\x44\x99\x89\xfd\xc9\
+\x15\x54\xf3\x0c\x35\xe4\x53\x1e\xee\xe3\x1c\x88\xc1\x2d\x78\x90\
+\xa5\x2c\x0d\x2c\xec\xb6\xc7\x77\x71\xf6\x39\x17\x60\xc3\xb1\x1b\
+\x23\x99\xce\x38\x35\x73\xa6\xc3\x84\x09\xdb\x39\x35\x74\x0c\x93\
+\x3a\xb8\xc3\xd2\x0c\x0d\x07\xd2\x1b\xf4\x53\xa4\x3b\x97\x11\xcf\
+\x8c\x5d\x30\xd8\x65\xe0\xbc\xf3\xce\xc1\x2d\x37\xde\x28\x9e\x21\
+\x65\xc6\x78\x4e\xec\xec\xc0\x71\xf8\xdb\x4b\x2f\x48\x9b\x1c\x05\
+\x6d\xcd\x2f\x2b\x81\xa6\xda\xbc\x92\xa8\x52\x11\x0c\x9d\x37\x9a\
+\xf1\x29\x79\x86\xa9\x14\x89\x44\x36\x12\xf1\x94\x69\x9d\xc4\x1e\
+\x8f\x2e\xaa\xba\x7b\x3e\xdd\xdf\xad\xe0\xa4\x6b\xce\xcc\x99\xa9\
+\xcd\x2c\x30\x3a\xc0\x90\x2a\x37\x0b\xc2\xa8\xa4\xe7\xcc\x71\xb3\
+\xd0\x50\x57\x87\x54\x26\x23\x5d\x28\xe2\x49\xb2\x4d\xf3\xc8\xe4\
+\x72\x68\xa8\x0b\xa2\x2b\x99\x95\xfc\x62\xe9\xf0\xc8\xb8\x9a\xfc\
+\x23\x7f\x16\x10\xf4\xfb\xa4\x3e\x90\xe5\x2d\x24\xe6\x4c\x9b\x76\
+\x32\xee\xba\xfb\x0e\x61\xe5\xe6\x29\xa4\x1e\xa2\x98\x02\xc3\xf0\
+\x1e\x29\x04\x67\x41\xb8\xbb\x74\xa7\x5a\xe1\x7c\xa5\xcd\x86\xda\
+\xac\x72\x4f\xb1\xda\x5c\x74\x03\x43\xf6\x33\x5c\xd6\x8a\xbc\x82\
+\x21\x09\x34\x0a\x86\x21\x8f\xf1\x0c\xd7\x02\x18\x72\x7c\x78\x1d\
+\x5c\xff\x04\x37\x76\xe0\xb9\xf6\xda\x3f\x0b\xc3\x93\x21\xd2\x9a\
+\x9a\x08\x16\x2c\x78\x5e\x88\x47\x64\xdf\x6a\x79\x83\x9b\x25\x5e\
+\xbe\x0e\xdc\x7f\x0b\xb9\xcc\xd1\x23\x75\x97\x5b\xe8\xe7\xe8\x7a\
+\x52\x36\xbd\x3b\x3a\xb0\x72\xa3\xde\x6a\x23\x3c\xf4\x9e\xf7\x78\
+\xbc\x27\x58\x5e\xaf\x77\xbc\xc7\xe3\xbb\xa9\x52\x98\x65\xe8\x5d\
+\x52\xcf\x67\xdc\x93\x47\xa8\xef\xd0\x30\xa2\x26\xa8\xb9\x20\x95\
+\xd6\xcc\xf8\xf9\x21\x87\x4c\x92\x9c\x9a\xa9\x8f\x33\x3f\xe9\x19\
+\xb2\x26\x47\x75\x1e\xf9\x59\xe5\x60\xa8\x00\x52\x8d\x3a\xbe\xa6\
+\xc7\x5a\x17\x7b\x39\xa3\xd4\xcd\x98\xd5\x9d\xbf\xaa\x7a\xa8\xa2\
+\x8f\xee\x5a\xd7\x24\x18\xba\x43\x8d\xdc\xb5\xf2\x6f\xbd\x09\xc5\
+\xd8\x15\x3c\x22\xc1\xe6\x0f\x04\x85\x7c\x71\xda\x9c\x33\x31\x76\
+\xe3\x4d\xa5\xee\x90\x20\xa9\x9d\x30\xe4\x5c\xc5\x50\x13\x7e\x4c\
+\x2b\x19\x99\x17\xb2\x2a\x3d\x5e\xe4\xb3\x2c\xa7\x70\x4a\x64\x0a\
+\xa6\x63\x42\x34\x12\xc0\xe2\xc5\x8b\xf1\xdb\xdf\x5e\x88\x1b\xae\
+\x67\x3f\xcc\xb4\xd4\xb7\x19\x1d\x54\x0a\x00\x84\x30\x7d\xda\xa9\
+\xd2\x67\x4f\xa9\xf3\x9a\x63\xd3\x8d\x90\x9b\xf1\x57\x69\x2e\xb5\
+\x37\xa3\x79\x6e\xe5\xd2\x0a\xf3\x79\x2c\x6e\x36\x54\xfa\xda\x9a\
+\x7a\x7c\xf9\xcb\xdb\x63\x93\x4d\x36\x43\x32\x95\x11\x5d\x56\x9e\
+\x6c\xa5\x50\xa7\x7c\xa2\xd3\x36\x87\x63\xa5\xc0\x51\x02\x44\xe6\
+\x1a\x4b\x9e\x9c\x7b\x8d\xea\xe7\x91\x08\xf6\xea\xab\xaf\x16\x4b\
+\x2a\xd8\x85\x80\x79\x29\x6e\x8c\x18\xf5\xe0\xbd\x40\xd0\xf4\x39\
+\x9f\x6f\xc2\xba\xce\xe1\x88\x40\x73\x73\x91\x4d\xa7\x30\x6c\x58\
+\x03\x6e\xbc\xe9\x3a\xfc\xfd\xef\xaf\x38\x79\x41\x12\x82\x0c\x20\
+\xf2\xbb\xd9\x00\x96\xb9\x6a\x3d\x4f\xb7\x06\x66\x6f\xf7\x41\x79\
+\xf8\x57\x8b\xef\xdd\x21\xf6\x1e\xdf\xcf\x5c\xbf\xe3\x19\x0a\x45\
+\xc8\xf1\x14\xe3\xe2\x19\xb6\x1b\x30\x04\x3d\x43\x8a\xae\x93\xa5\
+\xcb\x30\xa9\x17\x07\x8f\xdf\x6f\xad\x80\xa1\x9e\xb7\x82\x13\x3d\
+\x43\xe6\xf4\x68\x5b\x58\x82\x42\x9b\x43\xc2\x1e\xcb\x8d\x48\x6a\
+\xd1\xd7\xb9\x65\x0e\x7b\x03\x43\x77\x84\x87\x6b\x45\xcb\x81\xf8\
+\xb8\xe6\x88\xd5\x06\x6a\xda\x47\x37\x7c\x83\x61\x33\xbf\xa6\xed\
+\xa3\xd7\x6b\x4d\xb0\x7c\x3e\xdf\xde\x80\xe7\xe1\x52\x08\xa4\x14\
+\x5c\xef\x69\xf7\xb9\xa6\x4f\x6c\x4d\x7c\xbe\xee\x1e\xd5\x38\xea\
+\xae\xd2\x1d\x32\xe4\x18\xe8\x8d\x25\xa4\x0d\x47\x89\x9d\xcc\xaa\
+\x23\x8e\x38\x5c\x0c\xa7\x32\xaf\xb8\x38\x59\x8b\x73\xde\x79\xe7\
+\x49\x6e\xcd\x9d\xbb\x51\xcf\x4a\x3d\x4c\xb7\x2e\xea\x9a\xb8\xb6\
+\xd5\xf9\xcc\x6a\x9b\x83\xf2\xcf\x5c\xd7\x60\xae\x89\x7f\x0a\x7b\
+\x6f\xbc\xf1\x26\xf8\xd2\xb6\xdb\x62\x83\x8d\xc6\x8a\xce\x66\x3c\
+\x95\x96\xc2\x7c\x3d\x58\x3c\xa0\xa0\x58\xda\x8c\x38\x22\xdc\x12\
+\x36\x75\xc0\xd2\x79\x0b\x03\x5f\x9c\xeb\xd7\xdf\x78\x0d\xff\xf9\
+\xcf\x7f\x90\x49\xa7\xd0\x38\x6c\x18\xda\x5a\x9b\x65\x5e\xf9\x9f\
+\xa1\xbf\xf2\xc3\x0d\xe0\xee\xf1\xa9\xb4\x69\x30\x6c\x4f\x3d\xdc\
+\x75\x16\xe6\x77\x82\xa0\x11\x3e\x30\xa1\xba\x68\xa4\x16\x17\x5f\
+\xfc\x3b\x1c\x7c\xf0\x01\xd2\x1f\xd0\x17\xa8\x5e\xb4\x4c\x11\x02\
+\x6d\x74\x9c\xcd\x19\x4d\x55\xfd\xc9\xef\x60\x29\x2c\x25\x3d\xb3\
+\x59\xaa\xfe\x98\x73\xc9\xd0\x39\xb6\x80\xdf\xfe\xf6\x77\x98\x33\
+\x67\x8e\xf4\x17\xe4\xe1\x71\x5e\x90\x67\x8f\x3b\xd6\x61\x26\xc9\
+\x16\x25\x33\x54\x55\x8a\xb4\xbe\x90\x35\x84\x46\x7c\x20\x9d\x26\
+\x3b\x14\x18\x3d\x66\x24\x0e\x39\xe4\x10\xec\xb2\xcb\xce\xd2\x6a\
+\x8b\x44\x25\x6e\x1e\x69\xc4\xe9\x79\xb0\x21\xed\xfa\xeb\xaf\x5f\
+\xac\xd1\xad\x16\x35\xe8\xcb\xfa\x76\x87\xd7\xf9\x7a\x6e\x28\xf4\
+\x5e\xa6\x87\xcd\xf3\x96\xc0\x82\x5c\x9b\x29\x33\xc9\xd8\x40\xac\
+\x2b\x8f\xae\x58\x5a\x9a\x11\x53\x77\x95\xfb\x14\x82\x21\xc3\xa2\
+\xa1\xb0\x0f\xe3\x0f\xfc\x05\x5e\x7a\xfe\x69\x11\x08\x40\x21\x2b\
+\x42\xf2\xfc\x2c\x8f\x15\xc0\xc5\x97\x5e\x2e\xa5\x15\x2d\x6d\x1d\
+\xd2\x15\xc5\x5d\x5a\x91\x4c\x74\x61\xd8\xb0\x46\xa9\x33\x9c\xf2\
+\x9b\x63\xd1\xda\xdc\x7b\x3f\x43\xf5\xc4\x34\xdd\xc2\xd4\xc5\x35\
+\xd7\x5c\x2d\xd1\x01\x93\xb6\x01\x9e\x7d\x76\x81\xb4\xb1\x22\xb1\
+\x8d\x60\xa6\x79\xfc\xcf\x92\x9d\xee\xcb\x5c\xaf\x89\xd7\xf8\x7c\
+\x9e\x7d\x2c\xbf\xdf\xbf\x83\x65\x79\x5f\xd1\xe4\xad\xfb\x06\xff\
+\xac\x0e\xb2\x7b\x77\xad\x03\x3b\x62\xc4\x08\x6c\xb5\xd5\x56\x68\
+\x6b\x6b\x13\xc3\xa8\xbb\x58\x3e\x4e\xef\xef\xa0\x83\x0e\x14\xa3\
+\xc1\xc5\x49\xba\x38\x3b\x81\x3f\xfb\xec\xb3\xd2\x2f\x8c\x21\x46\
+\xfe\xe7\x18\xd2\x90\xf1\xa6\xa0\x40\x2e\x8b\xd6\x79\x68\xa8\xcf\
+\x6d\x24\xd7\xf5\x6e\xab\xa7\x9c\xc2\x9a\x58\x68\x7d\xf9\xcc\x6a\
+\x06\x51\x6b\x3d\x4d\x13\x59\x0f\x2c\x1f\x85\xa4\x99\xbf\xa5\xf5\
+\xe2\x5e\xdf\xe5\xa9\xf0\x0b\x0d\xcb\xa3\x97\x66\xbb\xa6\x44\x41\
+\xbe\x97\x04\x10\x51\xee\x37\x8a\x3b\xcc\x13\x6a\x93\x3d\xdd\x2d\
+\x4b\x48\xb5\xc2\xa1\xe7\xad\x5e\x4e\xcf\xd7\xa1\xaa\x32\xe5\x0a\
+\x34\xe6\x6f\x69\x80\x6b\xb1\xa6\xd1\x74\x58\xe1\x86\xea\x92\xdf\
+\x5f\x86\xc3\x0f\x9f\x84\x58\x2c\x89\x50\x94\x39\x51\x47\x5c\xdb\
+\xd5\xb9\xbc\xe8\xf9\x3a\xf9\x3c\x3f\x55\x75\xa4\x64\x82\x9e\x31\
+\x7d\x63\xaa\xb8\x00\x3e\x51\x94\x31\x47\x8e\x83\x28\xeb\x92\xec\
+\x5a\x5b\x1a\x16\xcf\x3a\x6d\x36\xce\x3b\xfb\x6c\x44\xeb\xea\x4c\
+\x0e\x8a\x02\x0c\xcc\x1f\x4a\x47\x0e\x16\x28\x12\x41\x4c\x4e\x53\
+\xc6\x84\x59\x59\x21\xd3\x98\x8d\x07\x73\xe8\x86\xf1\x68\x23\x5a\
+\x13\x95\xfc\xd6\xae\xbb\xee\x24\x69\x3a\xdd\x40\xaa\xa7\xef\x0e\
+\x89\xaa\x87\xdd\x27\xef\xae\xca\x42\x52\x4f\xa6\x1c\x0c\x13\x89\
+\x14\x56\xac\x88\x89\xc6\x2d\xe7\xda\x4b\x61\x6f\xf6\xce\x94\x7a\
+\x4e\x5b\x4a\x59\xbc\x3e\x7a\xad\xce\x98\x89\xaa\x40\x16\xe1\x88\
+\x0f\x13\x0e\xda\x0f\x2f\x2c\x7c\x0a\x5e\xcb\x3c\xb6\xa6\xc0\x50\
+\x53\x12\x1c\x7b\xae\xc5\x09\x13\x26\xc8\x66\x9b\x63\x4d\x82\x17\
+\x87\xf9\xb1\xc7\xe6\x63\xd2\xa4\x49\xd2\x40\x57\xed\x8a\x21\x84\
+\x75\x67\x19\xf7\xe5\x7e\xfb\xfc\x35\xe5\x23\xe0\xfd\x9a\x05\x84\
+\x37\x0a\x04\x0a\x1f\x7f\xd6\xc1\x50\x8d\x86\x18\x09\x67\xb7\xcf\
+\x1b\x59\xaf\xfb\xe8\xa3\x8f\x16\xd5\x15\x15\xaf\xe5\x4f\x12\x48\
+\x78\xb3\x32\x64\xc4\xbf\xcb\xbd\x03\xc6\xf3\xb9\x4b\xe3\xe7\x34\
+\x34\x34\x08\x88\xf2\xf3\x09\x8c\x2c\xc7\x60\x71\x71\xb9\x32\xcd\
+\x60\x59\x84\x6b\x1b\x0c\xab\x81\x5d\xb5\x71\x61\x9e\xcf\x18\x80\
+\x80\x93\xd3\x71\x5a\x95\x0b\xf0\x91\x36\xaa\x60\x68\xf2\x59\x72\
+\x10\x3c\x1c\xa1\xe8\x6e\x9f\xcf\x9e\x7d\x52\x22\xa3\x2f\x24\x99\
+\xc4\x94\x39\x90\x65\xa7\x11\x01\x7a\x33\x64\x59\x72\x0d\xf4\x16\
+\x06\xe5\xb5\x95\xe7\x3a\xdd\xeb\xad\xda\xb5\xf1\x79\xae\x49\x82\
+\x04\x37\x52\xcc\x09\xd1\x83\xba\xe4\x12\x82\xe1\xa1\xf2\x76\x93\
+\xe1\xab\x2c\xe5\xa6\x9f\xcf\x6b\xa0\x18\x7a\xce\x36\x0d\x90\x25\
+\xa4\xcb\xce\x1c\xec\xee\x20\xa0\xe7\xb8\x83\xce\x1b\x58\x6f\xa7\
+\x32\x7c\x17\x5d\x74\x11\x66\xce\x98\x85\xda\xba\x1a\xf1\x38\xd8\
+\x63\x92\x45\xf7\x04\x38\x19\x9a\x02\x15\x5a\x28\x27\x63\x40\xbd\
+\xe4\xa7\x9a\x73\xe2\x67\xd5\x44\xa3\x32\x4e\xec\xec\xf1\xe2\x8b\
+\x2f\x62\x9b\x6d\xb6\x11\xef\x8f\x4c\xd2\x4a\xf9\x3d\x37\x78\xf5\
+\x65\x8c\xaa\xbd\x46\x43\xc5\x1c\x7b\xfd\x6c\xce\x4b\x67\x47\x02\
+\x8b\x3f\x6d\x66\x5b\x66\xb3\x01\xf2\x7a\x60\x71\xbd\x50\x79\x27\
+\x4f\x22\x95\xd1\xa9\x65\x88\xd4\x47\x0f\xd2\xa6\x02\x4d\x52\x08\
+\x34\x13\x27\x1c\xb0\x56\x3c\x43\x8e\x13\x37\x40\x5a\xce\x34\x76\
+\xec\x58\x21\xb7\x70\x73\xce\x75\xca\x75\x48\x7b\xb4\x70\xe1\xc2\
+\xa2\x7c\x9a\xea\x2e\x57\x1b\x97\xcf\x9f\xef\xcb\x08\xe4\xc7\x72\
+\x4d\x07\xfc\xfe\x60\xda\xcd\x28\xd2\xb7\x0e\xf5\x1d\x87\xdb\x00\
+\xbb\x3d\xde\x4a\x43\xc3\x10\xd1\x9c\x39\xb3\xc5\xe3\x53\xa6\xa0\
+\xf1\x0a\x4c\xbe\x45\x5a\xdd\xb9\xe4\x26\xb9\x93\x67\x79\x85\x1e\
+\xac\x13\xe3\xfb\xea\xeb\x29\x6b\x96\x95\x92\x0b\xb2\x50\x69\x94\
+\xf8\x5f\x8b\x57\xdd\xdf\xed\x36\x98\x6b\x3b\x0c\x39\xd8\xc2\xa4\
+\xd5\xc0\x52\xc1\x90\x5a\x9a\x4a\x06\xd0\xf7\x50\xac\x3b\xc7\xda\
+\x83\x8a\x87\xa3\x90\x22\xe6\x5b\x29\x85\x2e\x36\xa7\x53\x94\xae\
+\x9e\x1d\xe7\xca\x78\x2b\xf4\x76\x8c\xc8\x3b\x0f\x3e\xee\x5e\x43\
+\xe5\xa1\xd0\x4a\xe0\xb7\x2a\xeb\x4f\xe7\x5f\x43\x6d\x8c\x48\x50\
+\x16\x8b\xe1\x46\x91\x7d\xf3\xf0\x2a\xe9\xe5\x51\x33\x35\x07\x3b\
+\xc7\x72\x07\x36\x35\x36\xc2\xe1\xfc\x3b\x41\xb2\x8f\xe5\xc5\xd6\
+\x5f\xfc\xa2\xc0\x55\x2e\x9f\x85\xcf\x43\x11\xf4\x6c\x11\x08\x17\
+\x7d\xb8\x48\x3c\x0f\x43\x68\x31\xa0\xc1\x6b\x39\xfd\xf4\xd3\x71\
+\xf9\x65\x57\xca\xb5\xfa\xfc\x14\xd6\x66\x4f\x41\xe3\x74\x13\x03\
+\x19\x16\x24\x5d\xd7\xdc\x0b\x25\x50\x56\xcf\x9a\xbe\x22\xeb\x35\
+\x95\x82\xff\xda\x6b\xaf\x61\xfb\xed\xc7\x15\x41\x89\x00\xab\xc4\
+\x2d\x82\xb4\x96\x6d\x0c\x84\x47\xa8\xd3\xae\x5e\x92\x32\x9f\x79\
+\x6e\x9c\xcb\xf6\x8e\x38\x9a\x56\x24\xc4\xbb\x95\x56\x48\x45\x0d\
+\x04\x7a\xbc\x46\x44\x80\xa0\x48\x01\x73\x01\xc3\x7c\x06\xd9\x4c\
+\x42\x84\xc4\x09\x86\x7f\x7b\xfe\x19\x78\xbd\x26\x02\xb1\xa6\x3c\
+\x43\x5e\x83\xf6\x5d\xd5\x02\x7b\x25\xd4\xe8\xf5\xe9\x1a\xd5\x75\
+\xa9\x79\x43\xb7\x0e\x73\x5f\xcc\xfe\xe7\xaf\xa9\x34\x02\xf9\xa0\
+\x6c\xf0\x82\xc1\xd0\x8a\x5c\xce\x1e\xe1\x66\x94\xca\xee\x6f\x08\
+\xbb\xdf\x6e\x43\xe4\x0e\x25\xb9\x13\xc9\xee\x3c\xe2\x39\xe7\x9c\
+\x83\x63\x8f\x3d\xb6\x18\x92\xd0\x48\x14\xc3\xa2\xc6\xf8\x5a\x12\
+\xca\x52\x00\xe4\xe3\x7a\x43\xf3\xe6\xd6\x50\x06\xdf\x47\x83\x71\
+\xe4\x91\x47\x09\x18\xd2\xa3\xa4\x41\xd5\xa2\x56\xcd\x6d\xc8\x6e\
+\xda\x51\xfd\xd7\xdf\xd7\xe6\x22\xad\x06\x3e\xe5\xe7\x52\x6d\x33\
+\x51\xed\xf3\xaa\xbd\xbf\xda\xb5\x7b\xfd\x86\x69\x67\xc2\x9f\x15\
+\x8e\x4a\x1e\xa0\xbc\xcc\x90\x60\x8c\x0a\xa7\xfe\x74\x72\x8a\x54\
+\x6e\xa1\xa5\x77\xc2\xa5\x6e\xef\x4e\xc9\x53\x7c\x8c\xf9\x2d\x6e\
+\x66\x4a\x84\x14\x2d\x31\x30\x61\x42\xfe\x77\xb3\x1d\x2b\x81\x66\
+\xb5\xf1\x51\xdd\x49\x35\xe4\x8c\x42\x8c\x1e\x3d\x5a\xfe\xf3\x1c\
+\x62\xf1\x2e\xa7\x45\x12\x73\x5a\xec\xb5\xe8\x08\x94\x4b\x13\x79\
+\xb6\xe4\x49\xca\x1a\xdc\x78\xe3\x4d\x45\x17\x74\x83\x0d\x36\x42\
+\x28\x18\x90\x50\x20\xb9\x37\x04\xb0\x37\xdf\x7c\x13\x17\x5c\x70\
+\x81\x74\x1d\xe0\xc6\x4d\xef\x77\xae\x5f\x05\x31\x92\x66\xc8\x2e\
+\xe6\x79\xd0\x43\xe6\xb5\xb0\xc3\x85\xd7\x1b\x34\x7a\xa6\x14\x49\
+\x77\x4a\x24\xcc\xf0\x9a\x0e\x1f\xd2\x33\xd2\xce\xca\xb9\x72\xbc\
+\xb8\xf6\xa9\x69\xca\xa3\x1a\x41\x46\xc5\x15\xaa\xad\x81\x6a\xcf\
+\x57\x0a\xb9\xf2\xb3\xdb\xda\xe3\x68\x6a\x4a\xc2\xe3\x25\x63\x93\
+\x98\x6e\xfa\x61\x0a\xb0\xc3\x27\xf5\x92\x05\x0a\x1d\xb0\xd7\x9f\
+\xcf\x69\x52\x9c\x4b\x21\xe8\x07\x26\x1e\x6c\x84\xba\xa9\x73\xbb\
+\xa6\xc1\x50\xc1\x8d\xe3\x4f\x9b\xa1\x8d\x77\x19\x25\xe0\xef\xaa\
+\xd8\xa3\xea\x4c\x7c\x5c\x3c\xf7\x3e\x89\xb5\x57\x1b\xbd\xff\xe9\
+\xe7\x9b\x81\xfc\x48\x01\xc3\x70\x38\xfa\x46\x26\x93\xd9\xee\xb3\
+\x02\x86\x95\x76\xe9\xee\x1d\xa8\x7a\xc1\x72\x2f\x3b\x94\x63\xf6\
+\xe8\xfa\xfe\xf7\xbf\x2f\x60\x67\x34\x22\x0d\xd1\xc2\x28\x83\x18\
+\x91\x65\xfe\x6e\xba\x3c\xac\x4c\x66\x50\x9d\x64\xde\x6c\xcc\x51\
+\xd0\x33\xfc\xcb\x5f\xfe\x22\xa1\x0f\x86\xbd\x2a\x1d\x3c\x4f\x0d\
+\xdb\xba\xa5\xc7\xd6\xc6\xb2\x1c\xe8\x30\x69\x35\x63\xdf\xef\x1b\
+\x56\xf3\x65\xda\xe9\xde\x19\x70\xe6\xc2\x54\x81\xa3\xfb\x06\x48\
+\x69\xff\x0e\x9b\x54\xf2\x64\x46\x66\x4c\xc1\x4f\x36\x7b\xca\x30\
+\x74\x72\x2f\xba\x1e\x38\x1f\x34\x3a\x6c\x83\xc3\x9a\x4b\x92\x3e\
+\x78\xe8\x3d\xe2\xfe\xc9\xc7\x15\x48\xcb\xf3\xc2\x3a\x97\xd5\x3c\
+\x20\x7a\x05\x1a\xda\xe3\x6b\xdb\xdb\x5b\x25\xcc\xfe\xd8\x63\x8f\
+\x49\xa4\x81\xa1\xbd\xe2\x18\xf6\x62\xfc\xd6\xdf\x60\x03\x61\x85\
+\x52\xe8\x9c\x07\xbb\x84\x70\xbd\x72\x2b\xc0\xae\xe7\xcc\x45\x2d\
+\x5d\x6a\x72\x4e\x5c\xdf\x94\xdf\x23\x88\x4c\x9f\x3e\x5d\x6a\xd8\
+\x08\x8a\xfc\x1e\x6e\xe2\xb4\xe7\x1d\x0d\x71\x36\xcd\x7e\x85\x9a\
+\x27\x74\xba\xd9\x3b\xe3\xa7\xeb\x58\xc0\x24\x10\x10\xc3\x4d\x10\
+\x6f\x6c\x6c\x94\x50\x2d\xaf\xa7\x9c\x99\xac\xe4\x32\x1d\xd3\x4a\
+\xa5\x13\xab\x72\x1f\x08\x68\x3b\xdf\xe5\xf6\x0c\x39\x2f\x1d\x9d\
+\x49\x2c\x5e\x1c\x43\xc1\x13\x34\xed\xb9\x28\xc6\xed\x6c\x62\x04\
+\x0c\xd9\xcf\x32\xcd\x71\xf2\x0a\x18\x8a\x1c\x9f\x9d\x42\x90\xa5\
+\x15\x07\xef\x8f\x17\x16\x3c\x6d\xa2\xf0\x6b\xd0\x33\x24\xb0\x69\
+\xbd\x60\x6f\x4e\x88\xf2\x0f\x78\xad\x6e\x12\xcd\xaa\x8c\xd5\xe7\
+\xaf\x5d\x69\x04\xde\x04\xf2\xe3\xc4\x14\x84\x42\xd1\x87\xb3\xd9\
+\xcc\xde\x9f\x25\x30\x2c\x07\x44\x37\xb9\x85\xd7\xac\x0c\x4f\x25\
+\xbc\xdc\x75\xd7\x5d\xd8\x67\x9f\x7d\x56\x02\x3a\x4d\xfe\xeb\xf0\
+\xd1\x06\x9b\x36\x35\xfc\x0c\xe3\x1d\xf2\xbb\x48\x20\x30\x37\x36\
+\x09\x03\x49\x4c\x99\x32\x45\x24\x8d\x08\x86\x34\x2a\x95\x3c\x43\
+\x05\x63\xbe\xff\xb3\x0e\x86\xd5\x6e\xc0\x6a\x60\x4a\xd1\x69\x11\
+\x9a\x76\xa2\x15\xee\xb2\x37\x1a\x7b\xd3\x83\xcf\x09\x84\xca\xaa\
+\x36\xfd\xdd\xf4\x73\xf3\x39\xd3\x23\x4f\xd0\xaf\x42\x6f\x41\xce\
+\x27\x81\x95\x65\x1a\x6e\x63\xb4\xf5\xd6\x5b\xe3\x81\x07\x1e\x28\
+\x82\xa1\xdb\x3b\x74\x03\x9f\x76\xb0\xd0\xeb\x2c\x07\xff\x6a\xd7\
+\x47\x4f\x80\xc6\x4d\x41\x81\xde\x17\xd7\xd0\x1f\xfe\x9f\xbd\xef\
+\x80\x93\xa4\xac\xb6\x3f\x55\x9d\x27\xec\x2e\x1b\xd8\xc0\xa2\x80\
+\xf0\x04\x64\x89\x3e\x24\x89\x22\x88\xe0\x93\xa7\xa2\x82\xca\xf3\
+\x01\xa2\xa8\xe4\x28\xa8\x80\x04\x15\x14\x09\x0b\x18\x51\x30\xfc\
+\xcd\x4a\x86\x45\x10\x04\x44\xc9\xa8\xe4\x65\x49\xc2\x2e\x1b\x26\
+\xf6\x74\x4e\x55\x7f\xcf\xbd\x75\xbb\x6b\x7a\x67\xa6\x27\xb2\x2b\
+\xcf\xf2\x87\x33\x3b\xdd\x5d\x5d\xf5\x7d\x5f\xdd\xf3\xdd\x7b\xcf\
+\x3d\xf7\xdb\x97\x8b\x78\x74\xb9\xdc\x14\x9a\x0c\x0d\xa8\xae\x3f\
+\xcd\xa5\xce\x99\x33\x07\x0c\x51\xce\x99\x33\x6b\xf0\x90\xfb\xc0\
+\x43\x0f\x3e\x88\x0f\x7e\xf0\x83\x52\xb4\x1d\xae\xa5\x2d\x14\x0b\
+\x38\xef\xdc\xf3\xf0\xa5\x33\xce\xd0\x4d\x5f\x40\xdd\xe7\x3d\x90\
+\x6c\x32\xec\x51\x17\x1c\x57\xc2\x92\xa4\x17\x82\xf2\x09\x8b\x9a\
+\x34\x58\x9d\x9a\x52\xb0\xe7\xc5\x7e\x1f\xed\x66\xa1\xd5\xfa\xb1\
+\x88\x8b\x6d\x3a\xc2\x39\xc3\x4c\xa6\x82\xe5\xaf\x66\xe0\x3b\x94\
+\xec\x63\xce\x30\xe8\xfe\x21\x2e\xb3\xea\xbd\x32\x3d\xc2\x71\x64\
+\x98\x94\x60\xe8\x7a\x25\x24\x53\x11\x7c\xfc\xe3\x1f\xc6\x7d\xf7\
+\xfe\x51\xed\xc2\x14\x82\x61\x78\xcd\x19\x99\xc6\xc2\xbc\xb6\xd1\
+\xe2\x9c\x19\xcf\x21\x3c\x6e\x9c\xfb\xa1\xd2\x30\xad\xc6\xec\xdf\
+\xaf\xd7\x9f\xd6\x5b\x01\x7f\xff\x00\x0c\xdb\xae\xac\x54\x2a\x9f\
+\x7a\x3d\x83\x21\x6f\x9b\xc0\x44\x69\x21\x63\xb3\xd9\xa2\xe3\xbf\
+\x59\x22\xf1\x5f\xff\xb5\x7f\x3d\x0a\x17\x22\xec\xc9\x88\x85\xe5\
+\x8a\x4c\xdd\x3d\xbc\x98\x2c\x84\xca\x9f\x5c\xb0\x24\xe3\x7c\xe7\
+\x3b\xdf\x11\xf2\x8d\x79\x7f\x5c\xd4\x42\x4e\x28\x95\xe4\xa7\xe5\
+\x4e\xd6\xc5\xa2\x6c\x65\x9c\x9b\xaf\xa9\x95\x67\xd7\xea\x7c\xad\
+\x76\xfe\x23\x7f\xde\x03\xc3\xa4\x52\xa4\xcd\xfe\x83\xcc\x6b\x45\
+\x94\xd5\x28\xbd\x0c\x43\x25\x05\x82\x88\xe2\xf5\x68\xb1\xbe\x81\
+\x22\xbb\x29\xf0\x50\x30\x53\xd2\x0d\xb3\x6d\x76\x50\x93\x91\x86\
+\x9f\x82\xe5\xf4\x96\x62\x31\x6a\x6d\x0e\x48\xd8\x91\xde\xd9\x9b\
+\xde\xb4\xe9\x88\xd3\x64\x39\xbf\xe6\x4d\x98\xfd\xbb\x99\x60\xd3\
+\x7c\x32\x31\xc4\xd1\x68\xbd\x93\x3b\xc1\x90\x2c\xe6\x1f\xfe\xf0\
+\x6a\x01\xb6\x4c\x5a\x59\x9d\x54\x5b\x95\xfb\xb0\x05\x6a\x9d\xe4\
+\x19\x42\x06\xb0\xd1\xc2\xf9\xc2\x64\xde\x68\xfe\x1c\xe4\xf3\x65\
+\xb4\xa5\xe2\xc8\xe7\x49\x06\x49\x88\x94\x17\xc1\x90\x44\x8c\x70\
+\x6d\x19\xc1\xf0\x8a\xcb\xaf\x10\x01\x09\x4d\x1d\x34\x18\x32\xec\
+\x2d\xa9\xdd\x22\x9a\xc8\x3b\x61\x20\x0c\xfa\x24\x12\x44\x93\xa9\
+\x54\x3d\xfc\x6f\x86\x5b\x37\x0a\x81\xb2\x4b\x10\x52\x6e\x78\x72\
+\x43\x47\x5a\x46\xf3\x4c\x48\x06\x38\x54\x3f\x18\x7e\x2e\xf9\xbc\
+\x72\x4c\x39\x2f\xd9\x7c\x0d\xab\xbb\xd8\xdd\x41\x3b\x52\xf0\xe0\
+\x86\xd6\xd6\x07\xaf\xa5\xb3\x53\x7b\x34\x8a\xd0\x3b\x9b\x3a\x7b\
+\x25\xd1\x59\x3d\xe8\xe0\x0f\xe0\x9e\xbb\xee\x40\x54\x42\xcd\x24\
+\x5a\xf1\x73\x31\x11\x7e\xbf\x64\xf1\x15\x38\xf8\xa3\x2c\xad\x18\
+\x10\x75\xa3\xa1\x4b\x2b\x96\xe0\xa4\x13\x8f\x6d\x59\x5a\xc1\x71\
+\xe7\xb5\x0e\x57\x37\xc8\x6b\x0e\x17\xd8\xd3\x93\x34\x00\x7c\xad\
+\xf9\x06\xa3\x99\x9b\x7f\xb1\xf7\xfc\x00\xf0\x3e\xad\x7b\x68\xd7\
+\xfd\xf2\x3f\x27\xe3\xec\x70\xf8\x70\xed\x9b\x19\xdc\xac\x74\x7d\
+\xbf\xd9\x66\xe3\x4a\x46\x1b\x73\x82\x54\x70\xe0\x42\xe2\xeb\x06\
+\x4c\x7c\xd8\xb7\xdc\x72\x4b\xf9\x7b\xb3\x12\x46\xab\x7c\x87\x8d\
+\x43\x33\x33\xee\xf9\xe7\x9f\xc7\x8b\x2f\x2a\x59\x81\xaf\x11\x24\
+\x69\x10\x19\xe3\xbf\xf4\xd2\x4b\x71\xf7\xdd\x4c\xca\xb3\xc0\x97\
+\xdd\xc1\x47\x66\x09\xbe\xd6\x63\x1d\xf6\xa8\x1a\xc6\x7c\x38\x82\
+\x8a\x5e\x9d\xed\x6c\xc3\xa2\xc2\x64\xd8\x92\x59\xcb\xbf\x59\x8e\
+\x2a\x58\x6f\xf2\x19\x03\x08\x0b\x6b\x8d\x74\x9f\x83\xc1\xb8\xd1\
+\x4a\xc8\x9a\xec\x4a\xf4\x34\x14\xbd\x96\xd6\x46\x34\x6d\x3e\xe3\
+\x5b\xec\x9a\xee\xa3\xcc\x62\x32\x1f\xc2\x18\x65\x9f\x40\x65\x5c\
+\x96\xc5\xf8\xc7\xe2\x6c\x70\x4a\x86\x2a\x6b\xfe\xf4\xb3\x6c\x6b\
+\xb4\xd5\x56\xdb\x8a\x3c\xd5\x0e\xdb\x6f\x33\xe4\xe5\xd9\x75\xb5\
+\xda\x0c\x8c\x66\x0e\xb9\x0e\xac\xa7\xe4\x8a\x15\x2b\x40\x11\xf8\
+\xab\xae\xba\x4a\x72\x7e\xe6\xcc\xb2\x9e\xcd\x73\xdc\xa0\xb1\x2e\
+\x41\x26\xb8\x69\xd6\x05\x56\x2a\x78\xeb\x2e\x6f\xc3\x8f\xae\xbe\
+\x12\x5b\xbd\x79\x53\x85\x4d\x69\x92\x4b\x0b\x1e\xc1\x75\xd7\x5f\
+\x27\xa4\x9c\x65\xcb\x96\x85\x36\x01\x31\x01\x60\xd2\xf8\xd9\xce\
+\x8b\xcf\x82\xe5\xf0\xc2\xde\x55\xab\x30\xaf\x7e\x95\x57\xcf\x73\
+\xd1\xd3\xfd\xd3\x9f\xfe\x24\xcf\x93\x92\x8f\x54\x6a\x8c\xe5\x46\
+\x07\x1e\x78\x60\xbd\x76\x4e\x30\x76\xb8\x12\xca\x60\xaf\x22\xce\
+\xbc\xc3\x92\x10\x7a\x9f\x54\xc3\xd1\x56\x56\xac\x06\x74\x59\xf7\
+\xc7\x30\x30\x73\x81\x4c\xeb\xe9\x56\x41\xc8\x3f\x9c\x9b\x72\xad\
+\x8c\x6a\x2d\x22\x3a\xaf\x1e\xe2\xd2\x64\x38\x2a\x1a\xb5\x15\x74\
+\xb6\x77\xe0\xe1\x07\xef\xc7\xc3\x0f\x3f\x28\xe5\x25\xfc\x74\xa5\
+\x5a\x10\xcf\x90\xf8\x9d\xee\xeb\xc5\xbd\xf7\xde\x83\x47\x1e\x79\
+\x50\x86\x50\x22\x42\xd2\x12\x4b\xc1\xf0\xb2\x2b\xbe\x87\x83\x3f\
+\xfa\x71\xac\xe9\x4e\x23\x16\xd7\xe7\x5c\x40\xd6\xf5\x51\xc8\xe5\
+\xa4\xde\xf2\xfa\xeb\xaf\xc5\x69\xa7\x9e\x84\xbe\xae\x15\x2d\xfb\
+\x19\x86\xd7\x48\xf3\x7a\x6a\xb5\x19\x1d\xcd\xfa\xfa\xf7\x7b\x86\
+\x1d\x81\xb3\xff\x99\x49\xa6\x1c\x9b\x34\xb1\x3d\xbc\x54\x2a\x5d\
+\xf5\x7a\x06\x43\xaa\x62\xb0\x78\x9e\x0f\xa2\x75\x71\xb7\x3c\x0d\
+\xef\x3b\x1c\xe6\xb2\x71\xb0\xf8\xfc\x68\x17\x91\x79\x7a\x16\xb2\
+\x0a\x1b\x7e\x3b\x07\xc3\xae\xdc\xf1\x33\x9f\x68\x0b\x7c\x7d\x65\
+\x83\x85\x1f\xc8\xc1\x72\x5c\x6b\x8f\x88\xed\x5a\xc3\xf7\x42\x10\
+\xe4\x93\x8d\xa4\x26\x00\x00\x20\x00\x49\x44\x41\x54\x86\x83\x0d\
+\x84\x8f\x38\x82\x7d\xd3\xd4\x7b\x31\x2f\xd1\xfe\xdd\xcc\xd4\x5c\
+\xfb\xec\xaa\x98\xa1\x47\x00\x84\x01\xc8\x29\x12\x57\x51\x2e\x17\
+\xb5\xaf\x9f\x36\xea\xd3\x52\x00\x9f\x61\x25\x25\xc8\xf4\xa7\x57\
+\xe3\xfa\x1b\xae\xc5\x1f\x6e\xbf\x93\x7e\xa5\x6c\x4e\x22\x12\x12\
+\xf3\xd0\xd6\x16\xc7\x67\x8f\xfa\x0c\x16\x6d\xbb\x8d\xe4\x87\xb5\
+\x73\x04\xbd\x0a\x66\xda\x62\xa2\x78\xd3\xd9\x41\xef\x48\xbd\x8d\
+\xe6\x83\xf3\x38\x19\x60\xc8\xf3\x1a\x10\xf1\x9c\x54\x85\x61\xc8\
+\x73\x5a\x47\x27\x20\xa4\x19\x16\x0c\x26\x04\x14\xd2\x99\x22\x8a\
+\x15\xc6\xec\x23\x42\x70\x91\x12\x1e\xd6\xd0\x39\x40\x26\xdd\x8b\
+\x7c\xa6\x17\xb5\x6a\x11\xa5\x5c\x56\xc5\xd6\x13\x29\x24\xdb\x52\
+\xd8\x68\xa3\x8d\xe4\xdf\xdc\xa8\x70\xa3\x66\x39\xc2\xb7\xbd\xed\
+\x6d\xd8\x7d\xf7\xdd\xe5\xd6\xec\x1a\xc6\xdc\x99\x23\x18\x18\x5e\
+\xfb\x92\x25\x4b\x70\xe6\x99\x67\x4a\x4d\x9c\x31\x74\xf9\xbc\xf1\
+\x77\xf6\xca\xdb\x6d\xb7\x3d\xa4\x69\x72\xc8\x39\x5f\x7b\xda\x83\
+\xdc\x28\xbd\xe0\x52\xb9\x86\x6c\x36\x87\xcc\x40\x4e\x44\x08\x38\
+\xc7\x64\x80\x4a\x0e\x98\x3a\xb2\x4e\x04\xd5\x80\xe5\xca\x29\x72\
+\x23\xda\xcf\x92\x44\x19\xaa\x14\x25\x92\x33\x05\x40\xbd\x4a\x55\
+\x34\x69\x1d\x46\x18\x1c\x0f\x57\x7d\xff\x7b\xb8\xf2\xca\xef\xa2\
+\x98\xcf\x0a\x8b\xd6\x67\x2d\xa1\x47\x6e\x00\xbb\x6f\xa8\xee\x67\
+\x21\x97\x17\xbc\x8e\xb1\xef\xa3\x08\xe0\xc6\xe1\xb8\x49\x5c\x76\
+\xc5\x77\x70\xf0\xc1\x1f\xc3\x9a\x1e\x76\x4e\x61\xce\x97\x4a\x48\
+\x2c\xca\xaf\x05\x60\x38\x0b\xd7\x5f\x7f\x3d\x4e\x3b\xf5\x04\xf4\
+\x75\xad\x1c\x13\x18\x8e\xd6\xe6\xfc\xfb\x7d\x93\x31\x02\xce\x27\
+\x81\xda\xd5\xf2\x64\x47\xa3\xd1\xbd\x00\xdc\xf9\x7a\x06\x43\x1a\
+\x44\xf6\xef\xfa\xc4\x27\x3e\x21\xa3\x47\x43\xc0\x63\xb0\x52\x45\
+\x25\xd8\xb1\x0e\xf6\x82\xc7\xc3\x76\xb3\x5d\x35\x0d\x8a\x79\x86\
+\xd6\x23\x91\xba\x83\x6c\x63\xc3\x6b\x08\x4b\x1f\x4d\xc6\xb4\x8e\
+\xf7\x1c\x66\xcc\x87\xdb\x81\x92\x31\x38\xd2\x61\x34\xf0\x46\xce\
+\x4b\xf7\xe8\x04\xc4\x93\x4f\x3e\x19\xe7\x9e\x7b\xee\x78\x2f\xad\
+\xae\x35\xda\x00\xc3\xb5\xfb\x03\xea\xf5\x49\x41\x5c\xe0\x6a\x18\
+\x68\xea\xa7\xf2\x85\x2c\x4e\xff\xc2\xe7\xf1\xed\x6f\x7d\x5f\x0a\
+\xc7\xd5\x73\xa4\x71\xab\x60\xda\xf4\x0e\xfc\xf4\xa7\x57\xe3\x80\
+\xf7\xbd\x4f\xce\x51\xa2\xea\x4a\x2c\x21\x40\x48\x32\x54\x3c\x9e\
+\x0c\x94\x5d\x34\xaf\x34\x59\xc0\x37\xd4\x80\x84\x23\x0c\xfc\x9d\
+\x5e\x9b\x6c\x04\x58\x46\x21\xed\xa4\x62\xc8\x97\x6a\xe8\xee\x49\
+\x23\x9b\x2f\x09\x1b\x96\xdc\x20\xae\xa5\xf6\xb6\x24\x9e\x7c\xfc\
+\x31\xe9\xce\xde\xb5\x52\x3b\xab\x93\x41\xcb\x72\x9f\xfe\x74\x46\
+\xf4\x40\x7f\xf4\xa3\x1f\x49\xe8\x9e\xf3\x62\xd1\x11\xae\x4b\x46\
+\x2c\xf8\x37\x7e\x9f\xe5\x13\x47\xdb\x4d\x82\xf7\x61\x29\x16\xf3\
+\x20\x49\x48\xe3\xb3\xc6\x73\x58\xf8\xd0\xee\x97\xde\xd2\xfe\xfb\
+\xff\x97\x78\x8a\x96\x2b\xaf\x6f\x46\x07\x2d\x33\xdd\x3c\x51\xa8\
+\x9c\x47\x4f\x1f\x45\xe4\xfb\x51\x2e\x71\x1e\x02\x21\x00\x7a\x86\
+\x42\x8a\x72\x84\x25\x2a\x87\x4b\x02\x9c\x5c\x95\x74\x25\x11\xee\
+\x54\x24\x8a\x18\x37\x12\xa5\xb2\x28\xe2\x4c\x6b\xeb\x40\x47\x67\
+\x02\x8b\x2f\xba\x18\x17\x9c\x7f\x8e\x46\x0f\x62\xca\x38\x2e\x57\
+\x0a\xba\x96\x18\x0a\x8e\x44\xa4\x69\x71\xb9\x50\x96\x50\x69\x4d\
+\x84\xba\xa9\xc4\x63\x60\xf8\x71\xac\xe9\x49\x0b\x18\x12\x7c\x65\
+\xfd\x3b\x55\x14\xf3\x79\xcc\x9d\xf7\x6f\x30\x9c\xc0\x43\xff\x1a\
+\x7e\xd4\x7d\x17\x50\xfd\xa3\x6d\x73\x37\x8d\x46\xa3\x2f\xbc\x9e\
+\xc1\x70\xfe\xfc\xb9\xb8\xe8\xa2\x8b\x44\xce\xc8\x0c\x8c\x79\x31\
+\x16\xca\x34\x4f\xc5\x44\xb7\x6d\x36\x46\x63\x14\x18\xbf\xe7\x03\
+\x1d\xf6\x8c\xec\x77\x05\x8a\x86\x06\x20\x8d\x04\xdb\xd8\xd0\x28\
+\x0d\xc7\x34\x7d\x0d\x57\x82\x7c\x55\xab\xb0\x4c\x2b\x30\x14\xa3\
+\x15\x78\x48\x56\xb2\x62\xda\x91\x2c\x5b\x21\x23\x33\xec\x09\x9a\
+\x01\x15\xdb\x15\x2e\xe0\x1c\xf2\xc6\xd5\xa8\xa9\x65\x0c\x42\x83\
+\x61\xa3\x29\x4d\x6b\x99\x01\xe4\x7b\x02\x30\x14\x8f\x50\x55\x6a\
+\x78\x94\xca\x39\x1c\x77\xfc\x31\xf8\xc1\x95\x3f\x42\x32\xd1\x21\
+\xa1\x36\x91\xb3\x82\x87\xb6\x8e\x04\x7e\xf7\xbb\xdf\xe0\x3d\xfb\
+\xee\x83\x52\xa5\xa4\x84\xa8\x28\x3d\x51\x25\x8f\x88\x24\x96\xe4\
+\xd2\xd4\x03\x9c\x0a\x30\x34\x82\x97\xe5\xb9\x84\xbc\x52\x17\x12\
+\x50\xc3\xae\x39\x43\x02\x38\xb0\x7a\x4d\x1a\xe9\x5c\x41\x81\xc0\
+\xd1\xd6\x54\x6c\x46\x9c\xed\xef\xc7\xbb\xf7\x7e\xa7\xd4\xc9\xe5\
+\xb3\x69\xd5\x04\x4d\xc4\x50\x2c\x55\xb0\xcf\x3e\xfb\xe0\xf6\xdb\
+\x6f\x1f\x71\x69\x85\xd7\xba\x6d\x14\x47\xbb\x19\x34\x52\x1a\xd7\
+\x3d\x95\x99\xd8\x38\x9a\xe5\x19\xd3\xa6\x75\x08\x00\x99\xc0\xc5\
+\x0d\x37\xdc\x80\xbd\xf6\xda\x2b\xe8\x2e\x62\xf2\x6e\x43\x5c\x56\
+\xa0\x22\xc4\xb0\x24\xef\xbe\xbb\xa7\x86\xde\xee\x3e\x94\x2b\x94\
+\x7f\x4b\x48\xa1\x3c\xc3\xe0\xac\xc0\xb4\xb1\xd1\xc5\x4c\xb0\x94\
+\x58\xaa\xfc\xce\xee\x1c\x1c\xcf\x64\x47\x52\x3c\xc3\x7c\x36\x83\
+\x44\x3c\x8e\xe9\x1d\xed\xf8\xf6\xb7\x2e\x93\xa6\xce\x5e\x95\xf5\
+\xa4\x8c\x16\x04\xb5\xc5\x8e\x8f\x8a\x44\x1b\x74\xec\x2d\x4c\xea\
+\x79\x51\x05\x43\x27\x8e\xc5\xf4\x0c\x0f\x3a\x04\x6b\x7a\xfa\xa4\
+\xcd\x56\x73\x98\x74\xde\xfc\xd9\xb8\xee\xba\xeb\xc4\x33\xec\xef\
+\x5e\x35\xa2\x67\xd8\x7a\x33\xda\x88\x48\xfc\x3b\x64\x3a\xd9\xd6\
+\xd1\x23\x55\xfc\xc5\xfa\x08\x47\xa3\xd1\x9a\xe7\x79\xee\xf0\xf9\
+\xab\x7f\xfd\x9c\x21\x73\x3f\x0c\x93\x36\x1f\x61\xef\xd0\xd8\x82\
+\xc6\x7a\xb3\x10\xde\x68\x0c\xa0\x7d\x96\x60\x2b\x0f\x5f\xe0\x7d\
+\xaa\xe1\xd7\x9c\x03\x05\x9b\xe9\x19\x92\x36\x6f\xa1\xc5\x70\x47\
+\xe9\xc9\x9e\xe6\xb1\x9c\x6f\x38\xf2\x07\xff\x3e\x9c\x1c\x99\x9d\
+\x9f\xef\x31\xd5\x13\xfe\x8d\xde\x8c\xa9\xef\x50\x8d\x47\x74\x2f\
+\x83\x30\xa9\x19\xf9\xd1\xe7\xdb\xc2\xea\x2b\x01\xbb\x71\x10\x18\
+\xda\x55\x90\x1c\x11\xd0\x62\x04\x0c\x99\xe4\x61\x58\x0b\x28\x94\
+\x0a\x38\xf6\xd8\xa3\x71\xd5\x0f\x7e\x2c\xcd\x80\x19\x5a\xd4\xc3\
+\x93\x62\xf1\x6b\xae\xfd\x2d\xf6\x7b\xcf\x3e\x28\x96\x0b\x48\xc6\
+\x19\x35\xd0\xd0\x1c\xbd\x09\x31\x72\x02\x82\x53\x07\x86\x43\xb1\
+\x21\x0d\x78\x4d\x98\xd9\xd8\x9d\xa5\x0a\xc1\xb0\x1f\x7d\x99\x8c\
+\x6a\x99\x46\x48\x42\x89\xa0\xaf\xbf\x07\x71\xd7\xc5\xde\x7b\xbd\
+\x13\xe5\x52\x0e\x85\x6c\x5a\x37\x09\x01\xf5\xf6\x1d\xef\x78\x87\
+\x84\xed\x98\x1b\xe7\x06\xc4\xb4\x42\x2d\x1c\xda\xec\xdd\xd9\xa8\
+\x8e\x36\x5c\x1a\x26\xcc\xdc\x71\xc7\x1d\xd2\x22\x88\x75\x8b\x0a\
+\x50\xc1\x0f\x07\x58\xb2\xe4\x46\x01\x66\x1e\x11\x77\x38\xb6\x6a\
+\xa3\x94\x84\xe0\x53\xf5\x81\xae\x9e\x0a\xd2\xbd\x69\x54\x6a\x54\
+\x0a\x69\x93\x7b\xf7\x6a\x8e\x84\x8d\xe9\xed\xd7\x33\x86\x0c\x97\
+\xd7\x37\x46\x3a\xc7\xbc\xb7\xb6\xf6\xa4\x94\x98\x48\x93\x61\x4a\
+\xd6\xf9\x1e\xae\xb8\xfc\x12\x5c\xbe\xf8\x62\x29\xa9\x28\x07\x80\
+\x28\x59\x41\x16\x19\xc2\x93\xd0\xab\xe3\xd7\xe0\xd7\x18\x82\x66\
+\xae\x56\xb2\x8e\xe2\xa1\x5f\x2a\x60\xf8\x51\xac\xe9\xe9\x1f\x26\
+\x67\x38\x0b\x37\x5e\x77\x3d\x3e\xff\xf9\x13\xd0\x37\x4a\x30\x6c\
+\x7e\x5e\xed\x19\x69\xce\xab\xff\x1b\x10\xc7\x62\xd9\x46\x7c\x2f\
+\x33\xcd\x12\x7a\x08\x83\xe1\xb3\x9e\xe7\x6d\xf1\x7a\x05\xc3\x59\
+\xb3\x36\x00\x25\xd7\xde\xf3\x9e\xf7\xd4\x69\xe8\x34\xce\x56\x4c\
+\xbd\xc5\x16\x5b\xe0\x8d\x6f\x7c\xa3\x9a\xc7\xa0\x5c\x82\xaf\x1b\
+\x9d\xb9\x15\x18\x1a\x10\x9a\x97\xf3\xc4\x13\x4f\x80\x24\x1a\x63\
+\x93\x72\x07\xcf\x90\x28\xff\x63\xce\x84\x04\x1a\xab\x65\x9b\xb4\
+\x69\x9d\xe0\x89\xc2\x60\x68\x86\x78\x2c\x04\x1a\xde\xbb\xc9\x96\
+\x59\xe7\x09\xfe\x8d\x35\x6c\xcc\x1f\xd9\xda\x1a\x0f\x18\x1a\x0b\
+\x50\xe5\xc0\x98\x0f\x1c\x7c\xb3\x4c\xff\x19\x99\x86\xbf\x09\x24\
+\x9a\x77\xc8\x57\xfc\x9a\x10\xa8\xbe\xff\xdd\x1f\x4a\xe7\x8b\x4a\
+\x59\x6b\xe9\x98\xe7\xa9\xd6\xca\xb8\xfe\xfa\x6b\xf0\xbe\xf7\xed\
+\x57\x0f\xb5\xd6\x84\xd8\x84\x00\x0c\x25\x08\xa7\x36\x7d\x8a\x3c\
+\x43\x5b\x77\xb6\x7e\x86\xda\x28\x90\xc9\x18\xb4\x12\xc4\xaa\x35\
+\x59\xa4\xd9\xda\xc9\x21\x0b\x36\x2e\x00\xd7\x9f\xee\x65\xc2\x0f\
+\xbb\xef\xb1\x1b\x32\x3d\xac\x25\xac\x61\xda\xb4\x4e\xf1\x70\xb8\
+\xce\xb9\xf6\x19\x91\x60\x51\x37\x0f\xae\xc5\xf0\x86\x2d\x3c\xa2\
+\x61\x6f\x70\x34\x39\xd1\x66\xef\xf1\xce\x3b\xef\x94\x5c\x2b\x81\
+\x54\x36\x9b\x51\x8a\x83\x93\xad\x5b\xc5\x2d\xb7\xdc\x80\xfd\xf7\
+\xdb\xbf\xfe\x75\xc5\x52\x11\xc9\x44\x5b\xfd\xdf\x64\xcc\xd2\x30\
+\x49\x67\x09\x9b\x55\x07\xe8\xeb\x07\xfa\x05\x0c\x6b\x88\x47\x52\
+\xa2\x28\xc3\x92\x08\x89\xba\x44\xb4\x16\xd8\x97\xbc\x31\x59\x9f\
+\xba\x31\xb2\x0d\x0c\xe7\x58\xbc\x45\x8f\x02\xe6\x2e\x52\x89\xb8\
+\x82\xe1\x65\x17\x63\xf1\x65\x97\xca\xef\x7c\x8f\xf6\xb8\xd4\x15\
+\xa4\x13\xae\xbf\x93\x74\x43\x51\x78\xcf\x73\xe0\x71\x12\xdc\x04\
+\x2e\xbf\xe2\xdb\xf8\xc8\xc1\x1f\x41\x57\xd7\x80\x6c\x48\xf8\xbd\
+\x4a\xe4\xf2\xea\x61\xd2\xf1\x80\x61\xd8\xd6\x0c\xe5\x31\xda\xda\
+\xf8\x37\x20\x4e\xd0\xe0\xe9\xc7\x97\x01\xde\x7f\xd4\xa7\x9a\xbf\
+\x44\xa3\xd1\x5b\x3c\xcf\xdb\xff\xf5\x0a\x86\x2c\xa6\xb7\x7b\x33\
+\x1a\xb3\x81\xdd\xcc\x99\x33\xa5\x0c\x82\x4c\x53\x33\xe2\x16\xae\
+\x32\x03\xdf\x1c\x3a\x6d\x9e\x86\xb0\x31\x20\x75\x9d\xde\xd0\xe5\
+\x97\x5f\x5e\xf7\xfe\x92\x49\x6d\x85\xc3\xd2\x0e\xdb\x2d\x9b\x16\
+\xa5\x0a\x1c\xaf\xdb\xa3\xd9\x2b\x34\xc3\x6f\x57\xd5\x2a\x4c\x6a\
+\x63\x6b\x9b\x02\xcb\x3b\xf1\x1e\x4f\x39\xe5\x14\x61\x46\x86\xc1\
+\xd0\xc6\x77\x74\xe0\x12\x0a\x93\x22\xd0\xd7\x6c\xf2\x0c\x25\xa2\
+\x26\xa1\x31\xa5\xce\xab\xa1\x68\xb0\x4e\x8b\x85\x32\x8e\x3a\xf6\
+\x18\xfc\xe4\xaa\x9f\x20\x9e\x6a\x47\xb9\xc8\xb0\xa2\xb6\x8a\xaa\
+\x94\xb2\xb8\x65\xc9\x4d\x78\xcf\x7e\x7b\xc3\x91\xa0\x9b\x27\x25\
+\x16\xa9\x64\x7b\xa8\xc7\xa0\xa9\xd6\x0c\x4d\xa0\x99\xe8\xec\xd9\
+\x78\x34\x3f\x7f\x5c\x7f\xe2\x15\x30\xd4\x5b\xd5\x0e\x06\x2c\x99\
+\x5c\xd3\xdd\x8f\xfe\x74\x56\xc0\xd0\x8d\x46\x44\xd3\x92\x6b\xab\
+\x56\x2a\xe1\x03\x1f\x3c\x00\x2b\x57\xbc\x02\xdf\xab\x08\x11\xa4\
+\x98\xcd\x09\xa4\x50\x54\xe2\xa7\x3f\xfd\xa9\x14\xc3\xf3\x20\x40\
+\xda\x7a\x0f\x13\xc8\xc2\x40\x3c\x1a\x20\x1c\xea\xde\xff\xf0\x87\
+\x3f\xe0\xdd\xef\x7e\x77\xa8\x9e\x51\xc3\xcb\x85\x62\x09\x37\xde\
+\x74\x83\x5c\x0b\xef\x95\x24\x26\xb6\x62\xe6\xff\xec\x30\x79\xf5\
+\xa0\x8a\x46\x43\xc3\x0e\xd0\xdb\x57\x12\x30\x2c\xb3\x8b\x07\x3d\
+\x41\x27\xa6\xec\x4e\x51\x4e\x50\xcd\x61\x9d\x7b\x6e\x64\x58\x97\
+\xaa\xe0\x24\xc5\xf4\x31\x6d\xcd\x54\x2a\x14\x05\x28\xdb\x12\x71\
+\x44\x23\x0e\xae\xb8\x6c\x31\x2e\xbe\xf8\xc2\x00\xf7\x98\x37\xd4\
+\xfc\x24\x57\x1c\xaf\x97\xe4\x1d\x8e\x3e\xeb\x54\xa9\x5d\x4a\xd2\
+\x8e\x34\x59\x76\x12\xb8\xec\x8a\x6f\xe1\x23\x07\x7f\x18\x5d\xdd\
+\x03\xe2\xa5\xea\x58\xf9\x75\x36\x29\xc3\xa4\x37\x5c\x4b\x06\xef\
+\x09\xe8\x0f\x36\x27\xc3\xad\x93\xa1\x36\xa2\xe1\x67\x30\xfc\x7c\
+\xd9\xfa\xfe\x37\x18\x4e\xf4\xa9\x93\x91\x94\x1a\xc3\x41\x60\x18\
+\x89\x44\x2e\xf3\x7d\xff\xd8\xd7\x2b\x18\xaa\x9c\x9a\xaa\x61\x18\
+\xc0\x71\x01\x1a\xc8\xb1\x40\x9e\xea\x1c\x7c\xcd\xc2\x42\xa3\x2d\
+\xab\x08\x4f\x89\x81\x01\xeb\x0c\xbf\xfe\xf5\xaf\x8b\xe1\x21\xd8\
+\x31\x8c\x63\x79\x45\x7e\x07\xaf\x83\xff\x5e\x5f\x98\xa4\xe1\xbc\
+\xdd\x50\x0f\x59\x2b\x36\xa9\x8d\x81\x8d\xa7\xe5\x87\x78\x9f\x04\
+\xc3\xf3\xcf\x3f\x7f\x48\xcf\xb0\x95\xc7\xad\xe7\x65\xef\x85\xa0\
+\xff\x0e\xc1\x90\xc6\xaf\xc9\x33\x14\x55\xb5\xe0\xbd\x6a\xca\xec\
+\x0d\x0a\x88\xb9\x42\x09\x47\x1f\x7d\x2c\x7e\x7a\xf5\x4f\x11\x4b\
+\xb6\xa1\x12\x68\x99\x46\xe3\x09\xb8\x11\x1f\x37\x5e\xff\x3b\xec\
+\xf1\xf6\xb7\x21\x95\x24\xd8\xfa\xa8\x88\xc8\x75\x02\x35\x4f\xe5\
+\xc8\x98\x77\x1b\xea\xb0\xb1\x1a\xfe\xb9\x19\xdd\x03\x6b\x79\x6c\
+\x0b\x35\x9a\x48\x83\x78\xda\xae\x23\xda\xa2\xc5\x0a\x0d\xbc\x86\
+\x15\xbb\x7b\x33\x48\xa7\x33\x22\x1c\xea\x06\x9a\x9a\x94\x70\x5b\
+\xfa\xcc\xd3\x38\xe8\xa0\x0f\xa3\xb7\x6b\x35\x10\x78\x39\xd1\x78\
+\x14\xd5\xa2\x7a\x86\xbf\xf8\xc5\x2f\x06\x95\x10\x85\x09\x3b\xcd\
+\xde\x1d\xaf\x85\x1b\x38\xad\x33\x6c\x7d\xd8\x9c\xf3\xda\x59\xeb\
+\x68\xec\x54\xfd\xa4\xca\x9d\xf1\x3b\xee\xba\xfb\x6e\xec\xb9\xe7\
+\x1e\x22\x21\xc7\x5e\x7d\xe1\x99\x93\xdf\xcd\x23\x64\xca\xcf\xbc\
+\x61\x17\xc8\xe4\x81\xbe\xde\x1c\xca\x25\x12\xdd\x12\x22\x46\x40\
+\xad\x5a\xae\xa1\x5a\xb5\xa1\x1a\xc5\xb9\x27\x20\x12\x98\xa8\x38\
+\xc3\x8d\x70\xb1\xc0\xde\x8c\x49\x09\x77\xb3\x97\x13\xbd\x43\x76\
+\xed\x58\x7c\xc9\x45\xd2\xd4\x99\x3d\x2c\x99\x2f\xe4\xc1\x26\xc5\
+\xac\xe5\xa0\xb7\xc9\xad\x91\x5f\xa5\x10\x03\x37\x25\x6c\xfc\x4b\
+\xb0\xa5\x58\x6b\x14\x97\x5e\xfe\x6d\x1c\x74\xf0\x41\xe8\xee\xee\
+\x13\x92\xd5\xda\x39\xc3\x0d\x71\xc3\xb5\xd7\xe0\xf3\xa7\x9e\x84\
+\xfe\xde\x91\xd9\xa4\xcd\x60\x68\x79\x77\xfb\xbb\x11\x8d\xc2\x5e\
+\xe1\xbf\xc1\xb0\xf5\x9a\x1c\xc5\x3b\x2e\x07\xbc\xe3\x06\x81\xe1\
+\x3f\x9f\xaf\x63\x5c\xd7\xbd\xdc\x8c\x39\x5f\xe4\xe2\x6d\x90\x6a\
+\xd6\xef\x9c\x61\x2b\xa3\xca\x1d\x22\x1f\x56\xbe\xcf\xee\xcb\x48\
+\x0b\x0c\x31\x5d\x7d\xf5\xd5\xb2\x5b\xe5\x83\x6c\x0f\xad\xc9\x7c\
+\x71\xf7\xac\x79\xb3\x6a\xbd\x04\x23\x9c\x47\xb1\x70\x13\x69\xea\
+\x0c\x3b\x11\x00\x58\xb3\xc5\x73\xf2\xdc\xda\xcd\xa2\xa9\xc5\x50\
+\xd3\x2c\x4d\xf5\xc2\x6e\x35\x3e\x36\x2e\x26\xa8\xfc\xd6\xb7\xbe\
+\x15\x5d\x5d\x5d\x72\xfd\x5c\x03\xac\xcb\x1a\xe9\xe0\xe7\x58\xbf\
+\xc7\x31\xe0\xb9\xc8\x4c\x64\x8d\xe1\xfc\xf9\xf3\x85\xb4\x44\x02\
+\xcd\xf8\x0f\x0f\x35\x54\xb4\x25\x91\x1f\x41\xa9\x48\x8f\x82\x9a\
+\x92\xaa\x04\x14\x8b\x4b\x74\x10\xe5\x0a\x1b\xa1\x26\x24\x5f\xc4\
+\x52\x8b\x44\x9c\xbf\x33\x03\x14\x41\x26\x57\xc4\xd7\xbe\x76\x3e\
+\x7e\xf5\xcb\xdf\x21\x91\x68\x43\x3e\x57\x96\x8d\x0f\x8d\x62\x47\
+\x47\x0a\x8b\x2f\xbb\x08\x3b\xee\xb4\x08\x9d\x6d\x89\x46\x61\x36\
+\x0d\x2d\x34\xb7\x46\x40\x08\x87\x15\xed\xb9\xe0\x1a\xe1\xeb\xc3\
+\x85\x1b\xed\x9e\x5b\x8d\xff\x48\x63\x63\xb0\x6e\x99\xd3\x4c\xa6\
+\x84\xae\x9e\x3e\xf4\xf7\x0f\x08\x30\x10\xfa\x99\xf3\xe2\xba\x7b\
+\xea\xe9\x27\x71\xe7\x9d\x7f\x40\xf7\x9a\x55\x70\x58\x36\x92\x4a\
+\x21\xcf\xb2\x01\xf8\xc2\x26\xe5\x5c\x6c\xbc\xf1\xc6\xf2\x75\x9c\
+\x33\xae\xf7\x89\x5c\x5b\xf8\xba\xc3\x91\x17\xe6\x0c\x09\xbe\x9a\
+\x87\xe4\x4c\x45\x10\x8f\x6b\x41\x3e\x01\xf9\xc0\x03\xff\x4b\xfa\
+\x2b\x92\xf2\x14\x60\x90\xcc\x23\x75\xd1\x7b\xba\x8b\x52\xd8\xce\
+\x96\x4b\xb5\xb2\x87\x48\x3c\x8a\x52\xa5\x88\x42\x91\xe1\x5e\x0a\
+\x56\x54\x1a\x65\x15\x22\x11\xe7\x48\xfd\xa1\xe6\x56\x09\xb8\x65\
+\x09\x8b\x73\xcd\xf2\xdf\x4f\x3c\xf9\x77\xe4\x72\xdd\x48\x26\x5c\
+\xf8\xd5\x9a\x84\x43\x53\xec\x07\x58\xcc\xe3\xfe\xfb\xfe\x2c\xe3\
+\x45\x5b\x20\x20\x28\x79\xcc\x88\xe4\x00\x19\x1d\xd8\x79\xd7\x5d\
+\xe5\x19\x28\xe6\x8a\x98\x3e\x8d\x75\xb3\x03\x42\x60\x5a\xb0\x70\
+\x63\x1c\xf4\xd1\x8f\x61\xd1\xb6\xdb\x63\xda\xb4\x19\x28\x94\x8a\
+\x72\x6f\x2c\x6d\xb1\x3a\xc3\x79\xf3\x37\xc4\x8d\xd7\x5d\x2b\x60\
+\xd8\xd7\xf3\xea\x88\x04\x1a\xe3\x0d\x84\xc5\x10\x04\xe4\x43\x2d\
+\x9a\x28\xde\xde\xdd\xdd\x2d\x36\x88\x73\x3d\x99\x1d\x71\x5a\xad\
+\x81\x56\xf6\x69\xa2\x9f\x1f\xbf\x6d\x18\xdf\x27\x43\xe1\xe7\x63\
+\x01\xef\x8a\x66\x30\x7c\xb7\xeb\xba\xb7\x85\xc1\xd0\xea\xec\xf4\
+\xc1\x1f\xdf\x97\xbe\x56\x9f\x6a\x35\x19\x23\x81\x21\x0d\x37\x81\
+\x8b\xdd\xb7\x79\x10\xf4\x68\x28\xf8\xf7\xf0\xce\x79\x44\x83\x15\
+\x74\x66\xb7\x7a\xb8\x63\x8f\x3d\x16\x57\x5c\x71\x45\x1d\x3c\x99\
+\xd7\x68\xf5\xf9\xd7\x6a\xac\x46\xfa\x1e\x3e\x68\xdc\xd1\xb3\x8b\
+\x01\x1f\x50\xe6\x97\x38\x16\x43\xe9\xb1\x36\x9f\x87\x80\x40\xe0\
+\xe7\x98\x59\x38\x98\xf3\xf2\xa6\x37\xbd\x49\x80\x72\xfc\x87\x85\
+\x49\x1d\xe4\x72\x15\xa4\xfb\xf3\xa8\x56\xb8\x39\xd1\x0d\x0e\x77\
+\xfe\xac\x11\x73\x9c\x1a\xe6\xce\x9b\x89\x58\x8c\x79\x1d\x92\x5e\
+\x34\xef\x44\xa3\xca\x10\xd7\x43\x8f\x3e\x81\x65\xcf\xbc\x80\xb6\
+\x54\x07\x4a\xa5\x9a\x5c\x63\xb9\x58\x40\x7a\xa0\x07\xfb\xed\xff\
+\x6e\xcc\x9f\x3f\x43\x02\xab\x35\xaf\xa4\xf5\x62\xf2\x3f\xf5\x2c\
+\xc3\x22\xd0\x61\xc2\x15\x43\xde\x9c\xe7\x67\x9e\x79\x66\x42\xf3\
+\x6b\xdd\x31\x86\x3b\x49\x2e\x5f\x94\xce\xbd\x62\xf8\xcb\x15\xf1\
+\xaa\xe8\xed\x7a\x15\x4f\xba\x30\x64\xfa\xd3\x88\xa7\x92\x98\xbf\
+\xe1\x1c\x7c\xf2\x88\xc3\xb0\xef\xbe\xfb\x20\xc1\xbc\x18\x73\x9d\
+\x35\x0f\x99\x81\x7e\x91\x6a\xe3\x3d\xf3\x30\xe0\x92\x50\x60\x93\
+\xd0\xf8\x78\xe7\x69\x64\x30\x8c\x21\x16\x63\xe9\x46\x19\x3f\xfe\
+\xf1\x4f\x84\xc8\x36\x90\xcd\x4a\x0e\x8e\xf9\xb6\x7c\x8e\x25\x18\
+\x71\xbc\xf4\xe2\x72\x3c\xf9\xf4\xb3\xc8\x65\xb5\xb8\x5e\x94\x9f\
+\xa2\x71\xc9\x05\x6a\x2b\x2d\x76\xa1\xe7\x7c\xc6\xc4\x33\x34\x65\
+\x1b\xfe\x5d\x23\x2f\xec\xd1\x58\x16\x61\xed\x4a\xad\x0c\xaf\x56\
+\xc3\xfd\x0f\xdc\x8d\x47\x1e\x58\x02\x44\x28\xba\xc0\xbc\x61\x4d\
+\xf2\x97\x14\xe2\x28\x97\x0a\xb2\x89\x4a\x25\xb5\x55\x57\x84\x92\
+\x7c\x64\x0f\x47\xe3\xe8\x98\x36\x43\xc2\xfb\xbb\xec\xb2\x2b\x4a\
+\xf9\x02\x3a\x67\x6c\x80\x72\xa9\x2a\x61\xd2\x72\xb5\x86\x8d\x16\
+\xbe\x41\xc2\xa3\x5c\x0f\x55\x4f\xf5\x5a\xc7\x0b\x86\x62\x8c\x03\
+\x59\x3d\x82\xdc\xbb\xde\xf5\x2e\x61\xe3\x12\x88\x69\x8f\x58\x1f\
+\xca\xc6\xd3\x4c\xbf\x58\x3f\x43\x7e\xa6\xb9\x94\x69\xbc\x73\xd7\
+\xca\x7e\xbe\x7e\xc1\xd0\xd9\x17\xa8\x0a\xc5\x3a\x9c\x00\xd9\x38\
+\x12\x89\xbc\x2c\xc9\xe7\x00\xf9\x38\x40\x0d\x9a\xfc\xfa\x8d\x86\
+\xad\x26\x53\x95\xf5\xb5\x4e\xcc\x18\xa2\xe6\x19\xd2\x88\x93\x58\
+\xc0\x84\x3f\x0f\x33\x4c\xfc\x3b\x77\x62\xdc\x91\xd9\x61\x92\x6a\
+\xd6\xe7\x8e\xa5\x11\xb3\x66\xcd\xaa\x6b\x9d\x72\xa7\x4d\xef\xe8\
+\x8c\x33\xce\x90\x3c\xa4\x79\x5a\x52\xc8\x3d\xc2\xd1\x6a\xb1\xb5\
+\x5a\xe4\x66\xd4\x86\x7a\xdf\x48\xaf\xd9\xfb\x6d\x47\xca\x1c\x1f\
+\x35\x5a\xaf\xbd\xf6\x77\xad\xbe\x72\xd0\xeb\x06\x10\x1c\x63\x3e\
+\xbc\xa6\xe4\x63\xbb\xd7\x46\xd1\xfc\x98\x4e\x1b\xbc\x99\x60\xc8\
+\x50\xa9\x8b\xde\xbe\x2c\xba\xbb\xd2\x28\x17\xb9\x6b\xe6\x9c\xb2\
+\x64\x85\xe5\x05\x55\xa9\x13\xdb\xf8\x0d\x73\xd1\xde\x4e\x32\x85\
+\x8e\x37\x1b\xdd\x2a\xe1\x21\x8a\x9e\xde\x1c\xb2\x69\x6a\x80\xa6\
+\x90\xcd\x14\x54\x48\xba\x54\x46\x7f\xba\x07\x5b\x6f\xb5\x91\xa8\
+\x96\x54\xca\x34\xca\x2e\xa2\xae\x23\x22\xd7\xf1\x98\xd5\xa3\x36\
+\x4a\x1d\x38\xbf\x34\x52\x3c\x08\xfe\xdc\x44\x51\xb2\x6d\x4a\x0f\
+\x49\x8b\x89\xa8\x66\x83\x45\x23\xfd\x05\xc5\x24\xa2\x93\xfd\x34\
+\x49\xa0\x71\x5c\xfc\xfa\x37\xbf\xc2\x81\x07\x1e\xa0\xf7\x5f\xa1\
+\xe1\x67\x2b\x5e\x3d\xc4\x70\x07\x11\x0e\x23\x32\x85\xc1\x7d\x22\
+\xf7\x30\x3c\x18\x32\x2a\xc2\x1c\x1d\x05\x03\x2a\xf8\xde\x77\xbf\
+\x8f\x03\x3e\xf0\x41\xdd\x38\xd5\x82\xce\xf1\x6e\x5c\xf2\x70\x4f\
+\x3d\xf5\x2c\xee\xbf\xef\x11\xa4\xfb\x0b\x88\xb0\xbc\xc5\x67\x78\
+\x32\x26\x0c\x60\x99\x6f\x71\xde\xb8\xf1\xa1\xc4\x8c\x8b\x1a\x05\
+\xd5\xab\xbe\xcc\x07\xcb\x37\xb8\x69\x63\x54\x20\x1e\x73\x05\x40\
+\xb3\x99\x34\x7e\x7f\xfb\xb5\x58\xbe\xea\x6f\x80\x9f\x95\xcd\x81\
+\x74\xdd\x90\x48\x07\xe3\x06\x40\x47\x7b\x1b\xb2\xb9\xac\x80\x6b\
+\x84\xac\x52\x2a\x15\xc1\xc5\x06\xb3\x36\xc4\x0f\x7f\x78\x15\xf6\
+\x7f\xef\xbb\xf0\xca\x3f\x7a\xc1\xbc\xbf\x44\x13\xfe\x99\x07\xcf\
+\x16\x0a\xb2\xae\x28\xde\x4f\x11\x75\x63\x7b\x4e\x04\x0c\x4d\xad\
+\x87\xa0\x7e\xe4\x91\x47\xca\x26\x8b\x73\x67\x52\x90\x8f\x3e\xfa\
+\x37\xb1\x51\x26\x64\x40\x9b\x31\x59\x9a\xc6\xad\xec\x67\x2b\xfb\
+\x34\xd1\xcf\x4f\x64\xdd\x8d\xe7\xb3\x0d\xcf\xb0\xf6\x06\x00\x2c\
+\xca\x1d\x2c\x84\x14\x8d\x46\xfb\x00\xcc\xe0\xc3\xb1\xf6\xcd\xff\
+\x6b\x87\x49\xc3\x60\x68\x0b\xd7\xbc\x3e\x2e\x42\x6a\x36\x6e\xb7\
+\xdd\x76\x42\x6e\x31\xc0\x24\x28\xb2\xb9\xe6\x27\x3f\xf9\x49\x6c\
+\xbb\xed\xb6\x42\x36\x08\x4f\x3a\xe5\xa6\x28\xf0\xcd\xcf\x87\x77\
+\x68\xdc\x61\xb2\x09\xe7\xc3\x0f\x3f\x2c\xf3\xa4\x9f\x19\x79\xfc\
+\x5a\x2d\xb6\x56\x13\x3e\x1c\xe0\xf1\xef\xa3\x01\xc3\xb0\xee\x21\
+\x6b\xc0\x58\x8f\x66\x39\x4e\x7e\xde\x88\x05\xc3\x5d\x07\xef\x39\
+\x2c\x65\x37\xda\xda\xb4\x56\xf7\xc5\xd7\xd5\xa7\x56\x30\xec\xef\
+\xcf\xa1\x6b\x4d\x1a\x95\xb2\x49\xad\x31\x17\xc5\xc2\xf3\x32\xa2\
+\x31\x0f\x1b\x2d\xdc\x50\x04\x96\x99\xe3\x64\x0e\x48\xf2\x47\x88\
+\x80\x8e\xf9\x8a\x95\x7d\xe8\xeb\x4e\xa3\x2d\x35\x0d\xfd\xfd\x19\
+\x95\x0a\x83\x83\x44\x32\x8a\x4d\x37\x99\x8d\x78\x02\x28\x4b\x97\
+\x12\x86\x47\xc9\x2e\xac\x8a\x81\xd4\xb9\x6d\xcc\x9f\xe5\x92\x2d\
+\x3c\xca\xcd\x43\xab\xfa\xbd\x56\xc6\xa2\xe5\x38\x58\x2c\x51\xb0\
+\x2f\x8a\x08\x6b\x28\xf9\x37\xb6\x72\xe2\x06\x96\xb9\xc5\xe0\xf8\
+\xed\x75\xd7\xe0\xc0\xf7\xbf\x4f\xbc\x63\x99\x7f\x96\x13\x8c\x10\
+\x12\x1d\x4f\x6e\x7c\xa8\xeb\x1d\x09\x0c\x5d\xb7\x0d\xd1\x08\x81\
+\xa6\x82\x2b\xbf\xff\x03\xbc\xef\xfd\xff\x8d\x81\x74\x16\x35\xf1\
+\xf2\xe2\x52\xcc\x4e\xef\xec\xd9\xa5\xcb\x71\xdf\x7d\x7f\x45\x66\
+\x80\xde\x1a\xbd\xd8\xa8\x10\x86\x94\xc9\xa9\x25\x4a\xa2\x2b\x2b\
+\x0a\x41\x14\xe6\x61\x38\x54\x8b\xdd\xc9\x08\x65\xad\x65\xb1\x98\
+\x13\xf5\x98\x48\xc4\x47\x76\x20\x8d\x1b\x6f\xf9\x39\x5e\x7a\xe5\
+\x7e\xc0\x4f\xcb\x3a\x4a\xb0\x0b\x0d\xa5\xef\xca\x85\xba\x01\x94\
+\x18\x00\xc9\x4a\x2c\xd7\xf0\xe9\x5d\x7a\x98\x39\x7b\x2e\xbe\xfb\
+\xbd\x2b\xb1\xeb\xae\xbb\xa3\x90\x2b\x4a\xfe\x58\xee\x91\xde\x63\
+\x95\x5d\x3c\xa8\xd1\xc6\xf0\x6f\x3c\x78\xc6\x6a\x52\x7e\xe1\xb8\
+\x9e\xa8\xd6\x8c\x25\x4c\x6a\xac\x75\x13\xdd\x3e\xf1\xc4\x13\x71\
+\xf1\xc5\xdf\x14\x2f\x95\xcf\x1e\xbf\xea\xa9\xa7\x9e\xc6\x3b\xdf\
+\xf9\x4e\x49\x3f\x84\x6d\x74\xb8\x8c\xa9\xe5\x3a\x1a\xe6\x0d\x13\
+\x5e\x9f\x2d\xbe\x78\xa2\xf6\x6d\xbc\xf7\x35\xdc\xe7\x82\xfb\xed\
+\xf7\xfd\x9a\xb2\xc9\x86\x50\x05\xfc\xb3\xe3\x38\xbb\xf1\x8d\x6b\
+\x13\x02\xd6\x6f\x30\x6c\x35\x58\x5a\x6f\x35\xb8\x4e\xcc\xfe\x6d\
+\xf5\x71\x0c\x09\x72\xa1\xa9\xf1\x8f\x05\xe1\xc1\x88\xf4\x66\xfb\
+\xe8\x47\x3f\x1a\x5a\xf4\xba\x23\x23\xe9\xe6\xb4\xd3\x4e\x13\x82\
+\x8c\x79\x9d\xcd\x93\xde\x68\xb3\x32\x9c\x00\x63\xab\x2b\x1f\xdf\
+\xeb\xb6\xb8\xed\xe7\x58\x08\x1e\x0c\xd1\xdc\x71\xc7\xed\x52\x13\
+\xd9\xe8\xc6\x31\xb2\x67\xab\xc2\x02\xca\x76\xe4\x41\x8f\x50\x76\
+\xd1\xd4\xcc\x9c\xe0\x11\x06\xc3\x81\x81\x12\xd6\xac\x4e\xa3\x52\
+\xd2\x12\x0b\x7a\x0a\xf4\xe8\x08\x84\xfc\xea\x05\x0b\x67\x82\x82\
+\x2d\x2c\x8d\x88\x32\xac\x28\x59\x29\x16\x66\x03\xcb\x57\xa6\xd1\
+\xbd\xba\x0f\x33\x66\xcc\x42\x29\xaf\xc6\xcc\xab\x56\x25\xcf\x38\
+\x73\x66\x1b\x36\x98\x19\x53\x19\x4f\x16\x6d\x87\x84\xa9\xb5\x46\
+\x54\xf3\xe7\x61\xa2\x11\xd7\x0a\xc3\xbf\xac\x99\x63\xa9\xcc\x48\
+\x47\x2b\x63\x33\x96\xf9\x69\xf4\x29\xa6\x77\xd4\x58\x57\x33\x36\
+\x98\x8e\xcc\xc0\x00\x6e\x5e\x72\x13\xf6\x79\xd7\xde\x5a\x44\x1e\
+\xe8\xdf\x6a\x1d\x5e\xe3\x68\xae\xf9\x9c\xe0\x14\xc9\xc7\x47\x06\
+\xc3\xa4\x14\xca\x73\x5d\x5c\x7d\xd5\x8f\xc4\x33\x4c\xf7\x67\x50\
+\xa9\xf2\x99\x8c\xa1\x54\xa6\x87\xd6\x8e\x67\x97\xad\xc6\xfd\x7f\
+\x21\x18\x96\x91\x4c\x75\x88\xe7\x28\x9a\xb1\x52\x53\xa2\xfd\x14\
+\x25\x07\x29\xca\x33\x0d\x0e\x6a\xa1\x90\x43\x3c\xea\x4a\xe8\x33\
+\x97\x1f\x10\x6d\x51\x02\x63\x2e\x9b\xc6\x2d\xb7\xfe\x1a\x2f\x2e\
+\xbf\x2f\x00\x43\xb9\x52\x59\x2b\x02\x32\x35\x8d\x64\xf0\x5c\x04\
+\x3b\x96\x75\x10\x9c\x7d\x3f\x82\xb9\xf3\x17\xe0\xaa\xab\x7f\x8c\
+\x45\x8b\xb6\x43\x45\xba\x86\xe8\x77\x96\x29\xe5\x17\x0b\xba\xd4\
+\x90\x6c\x55\xa9\x0c\x09\x86\x0b\xe6\x6d\x88\x1b\xae\xbf\x16\xa7\
+\x8e\x22\x67\x68\xbd\x09\xcd\xee\x50\x43\xf6\x2b\x5f\xf9\x8a\xd8\
+\x16\x93\xb1\x7b\xfa\x69\x05\x43\x46\xa3\x34\x8f\xaf\x39\xce\xc9\
+\x20\xe1\xb5\x5a\x9f\xad\x5e\x6f\x05\x76\xad\x5e\x9f\x8c\xf5\x37\
+\x96\x73\x04\xf7\xf3\x17\xdf\xaf\xa9\x06\xe1\x10\x60\xf8\x3d\x00\
+\x47\x5a\x78\x54\x93\xdf\x01\xc5\x38\xf4\xd0\x8d\xe5\x4b\xd7\x97\
+\xf7\x86\x4b\x03\x86\x9a\x58\xde\x6b\xb3\x62\x3c\xdf\xc7\x1d\x1b\
+\x13\xfe\x1f\xfa\xd0\x87\xea\x92\x53\x9a\x5b\x88\x88\xb4\x15\x77\
+\x70\xd6\x81\xc2\xc2\x1c\x5c\xc0\xf6\x59\x2e\x54\x2d\x9d\x78\x6d\
+\x36\x13\xe6\x09\x86\xc7\x5d\x72\x19\x83\xd4\x4c\xd6\x9e\x15\x1b\
+\x13\xde\xdb\x7e\xfb\xed\x87\x25\x4b\x6e\xae\xb7\xa9\x52\xf6\x6b\
+\x6b\x30\xb7\x64\x7f\xb3\xa2\xcc\x44\xbd\x44\xa1\xd6\xd7\xca\x70\
+\x23\x71\xa4\xd3\x65\xac\x59\x95\x46\xb5\x12\x91\xee\xeb\x2a\x5f\
+\xe9\xa3\x1a\xf4\x9f\x7b\xc3\x1b\x67\x21\x11\x48\x5e\x6a\xad\x1a\
+\x65\xb5\x5c\x94\x6a\xa4\xe6\xe7\xb1\x6a\x45\x0f\xe2\xb1\x14\x1c\
+\x3f\xaa\x9d\xc5\xf3\x05\x38\x6e\x05\x73\xe6\x4c\xc7\xec\x39\x71\
+\x99\x25\xf9\x2e\xa1\xcf\x2b\xf5\x5f\x3d\x44\xf5\xfe\x79\x2f\xfc\
+\x8f\xf3\x6a\xa5\x39\x7b\xee\xb9\xa7\x44\x02\x26\x72\x34\x8f\x59\
+\xf3\xb9\x38\xfe\xe1\x7c\xbe\x11\xb2\xea\x3d\x06\x59\xa6\x20\xf9\
+\xb2\xaa\x88\x43\x93\x0c\x66\x11\x0e\x05\xaa\xa0\xeb\x42\x90\x02\
+\x31\x46\xf3\x44\xae\xb9\xf9\xb3\x23\xe5\x0c\x5d\xd7\xc0\xb0\x88\
+\xab\xaf\xfe\x09\x0e\x78\xff\x07\x84\x0d\xcb\x32\x09\x9f\x02\xda\
+\x6e\x52\x3c\xf4\xa5\x4f\x77\xe3\x2f\xf7\x3d\x8a\x74\x5f\x11\xa9\
+\xe4\x34\xd4\xfc\xa8\x8c\x73\x2a\x46\xcf\x50\x01\xa0\x26\x9d\x61\
+\x82\x5c\xa7\x84\x4c\x99\xd9\xf5\x84\x15\xcc\xcd\x5b\x2e\x9f\x46\
+\xc4\xe5\x9a\xf7\x51\x28\xe6\x71\xfb\x1d\xd7\x60\xe9\xf3\x7f\x81\
+\x1b\xcd\xc9\xe6\x87\xa1\xf0\xba\xc0\x7b\xd0\x8c\x5b\xef\x45\xbb\
+\x82\x10\x9c\xc9\x18\x9d\x39\x7b\x1e\x7e\xf1\xcb\x5f\x63\xab\xad\
+\xde\x82\xbe\xde\x01\xf1\xc8\xa5\xcb\x7c\x99\x44\x2d\x15\x2e\x60\
+\x62\x9a\xd1\x24\xfe\x5d\xa2\x11\x81\x67\x58\xa2\x67\x38\x06\x30\
+\xb4\x3e\x90\x7c\x4e\xf9\xdf\xa9\xa7\x9e\x8a\xaf\x7c\x65\xb0\x84\
+\xe1\x5f\xff\xfa\x77\x99\x57\x12\xdb\x8c\x6d\x3c\x59\x24\x9a\x56\
+\x60\xd7\xea\xf5\x56\x60\xd7\xea\xf5\xc9\x5c\x87\xa3\x39\x97\xda\
+\x49\x7c\xdf\xf3\x6a\x9f\x19\x12\x0c\x5d\xd7\x3d\xc6\xf3\xbc\xcb\
+\xf9\xa2\xe5\xd5\x1a\x54\xde\xd6\xc6\x70\x34\x17\xb1\xae\xde\xd3\
+\x5c\x27\x17\x9e\xdc\xf0\x43\x6c\xa1\x3e\xdb\x75\x11\x1c\x08\x7a\
+\x2c\xbb\xa0\xa1\x09\xe7\xbe\xd8\x51\x80\x6d\x6f\xcc\x38\xf2\x3c\
+\x24\xdd\x30\x17\x62\x61\xc7\x86\x2e\xe3\x6b\x07\x86\x96\xe7\x35\
+\xe3\xc9\x9f\xad\x3c\x34\xdb\xf4\x10\xd8\x99\x97\xb8\xe6\x9a\x6b\
+\xea\xa1\x51\x6d\x76\x3c\xf2\xcc\x59\x28\x76\x28\x32\xc6\x68\x49\
+\x48\xc3\x7d\x03\xf1\x4e\x9a\xd4\xc6\xe2\x48\xf7\x55\xc4\x33\xac\
+\x55\xa9\x35\x99\x0c\x5a\x35\xf9\xc8\xe6\xd2\x48\x24\x1d\xbc\x71\
+\x93\xd9\x48\xa6\x94\x38\xa3\x04\x1a\x05\x43\x6e\xec\x07\x32\x35\
+\x2c\x7f\x79\xb5\x18\x52\x82\x21\xc9\x24\xac\x3b\x63\x2b\xca\x0d\
+\xe7\xcc\xc0\x06\xb3\x1c\xea\x61\xa3\xe6\x15\x54\x6d\xc4\xd7\xdc\
+\xa7\x78\xbc\xae\x86\xc8\xa5\xd1\x6d\xb0\x19\xe2\xe6\x89\xbf\x73\
+\xbc\xee\xb9\xe7\x9e\x11\x07\xa8\x95\x31\x68\xe5\x19\x4a\x9e\x8b\
+\x35\x6c\x2c\x35\x08\xfe\xd3\xdd\x6c\x30\x31\xac\xad\xd3\x6c\x1a\
+\x7e\x7f\xdb\x12\xec\xf3\xee\x77\x8b\xc1\xe7\xb8\xb1\x44\x64\x38\
+\x36\xb3\xe5\x9d\x5a\xad\x8f\xd1\x3c\xb7\x23\x82\x61\x84\x04\x9a\
+\x38\x4a\xc5\x32\xae\xbc\xea\x2a\x7c\xe0\x03\x07\x22\x33\x90\x47\
+\xcd\x23\xa0\x24\xe0\xd7\xe2\x88\x44\x23\x78\xe6\xa9\xd5\xb8\xff\
+\xfe\xbf\x61\x20\x5d\x42\x34\xde\x01\x07\x0c\x41\xfa\x48\x44\x59\
+\xe4\x50\x55\x4f\xae\xa2\xa1\x51\x59\x97\x52\x5f\x4a\x95\x18\x5f\
+\x0a\xe6\x95\x91\x9a\x05\xcb\x05\x45\x30\xbb\x90\xc3\x1d\x7f\xbc\
+\x09\x4b\x9f\x7f\x10\x70\x8a\xc1\x73\x59\x56\x05\x9a\xd0\x4d\x71\
+\xdc\x48\xe0\x11\x9d\xd7\x54\x87\xb4\xbf\x9a\xbd\xe1\x7c\xfc\xf2\
+\x57\xbf\xc1\x66\x9b\x6e\x01\x5f\x0a\xfc\x55\x52\x71\x20\x9b\x91\
+\x8d\x33\x43\xbe\x75\x10\x8b\x12\x9c\xc7\x0f\x86\x76\x29\x7c\x76\
+\x79\x6e\x6e\xbe\x29\x6e\x2f\xb9\xd0\x4a\x45\xfe\xf6\xd8\x63\x8f\
+\x89\x80\x05\xfb\x51\xca\xdc\x07\xfc\x87\xa1\xd3\x5a\xa3\x99\xb1\
+\xc6\x7b\x5a\x81\x5d\xab\xcd\x5a\xab\xf5\xdb\x6a\xfd\x8f\xed\x6a\
+\x27\xfe\xee\xc0\x5e\xd5\x99\xa4\xfa\x2c\x85\x8e\x64\x32\xf9\x8e\
+\x62\xb1\x78\x97\x0d\x34\x7f\x36\x6e\xe2\xb5\x31\xe6\x13\xbf\xcd\
+\xa1\xcf\x30\x14\x18\x9a\x01\xe7\x44\x32\xdc\x45\x10\xe3\x61\x64\
+\x12\x0b\xfd\x51\x54\xfb\x23\x1f\xf9\x88\x2c\x4a\x0b\x63\x70\x01\
+\x52\xde\xed\x84\x13\x4e\x90\xd0\x8f\x51\x9d\x0d\x04\x2d\x74\x61\
+\xe7\x52\x7a\xf9\xd4\x1f\x56\xa4\x1d\xbe\xb7\x56\x0b\xd5\xae\xca\
+\x80\x9b\xbb\x4f\xb2\x6b\x37\xdc\xb0\x41\x1c\x1a\x7e\x31\x07\x82\
+\xd7\x55\xcd\x6d\xf0\xb0\x8d\x84\x3d\x40\xf2\xa0\x19\x99\x76\x88\
+\x61\x30\x69\xed\xc1\xa3\x33\x38\x2c\x6b\x7d\xfc\xd2\xfd\x65\xac\
+\x7c\xb5\x1b\x95\x32\xd5\x61\x52\xb2\x3b\x27\x9b\x92\x9e\x61\x3c\
+\x1e\xc1\xc2\x8d\x67\x23\xce\x52\x0b\x36\x78\x20\x27\x23\x38\x79\
+\xbe\x4c\x30\xf4\xb0\x66\x75\x0f\x52\xa9\x76\x78\x15\xbd\x90\x62\
+\x21\x87\x69\xd3\xdb\xb0\xe1\xcc\x36\xb0\x39\x04\xc9\x18\x64\xa3\
+\x0a\xd1\xc2\xa7\x47\xa8\xeb\x5e\x43\xc6\xc9\x7a\xa4\xc4\xae\x75\
+\xd5\xaa\x55\x38\xec\xb0\xc3\x44\x8b\x73\x22\x47\x2b\x63\x63\xad\
+\x81\x34\x54\xc8\x31\x0e\x19\x32\x90\x14\x16\x13\x0f\x36\x16\x4b\
+\xca\xba\x3c\xf0\xc0\x0f\xa8\x6c\x39\x43\xbc\x31\xe5\x8b\x70\x1a\
+\xea\x01\x02\x5f\xbb\x3a\x68\xc4\x20\xf4\x6c\x87\xe6\x69\x48\xc5\
+\xbb\xd0\x4d\x36\xf3\xa3\x83\xca\x04\xd9\x38\xdd\x79\xc7\x3d\x41\
+\x69\x85\x54\xea\x89\xd7\x4a\xb0\x29\x15\x2b\xb8\xf2\x87\x3f\xc1\
+\x07\x3f\xf8\x61\x61\x06\x3b\x48\x20\x12\x63\x58\x5d\x37\x2f\xcf\
+\x2c\x4d\xe3\xe1\x87\xfe\x8e\xfe\x01\xe6\xf3\x12\xf0\x3d\x57\x80\
+\xad\x54\xea\x81\xeb\x96\x25\xc7\xcb\xd0\xb7\x6e\xf4\x54\x33\x94\
+\xa5\x0c\x5c\xe3\xa5\x52\x01\x89\x18\x59\xc6\x15\xc4\x13\xda\xad\
+\x24\x5f\xc8\xe0\xce\x3f\xde\x8a\x67\x9e\xfd\x1b\x3c\xbf\xa8\x3b\
+\x09\xf2\xa9\x78\xff\xa6\x77\x1b\x6c\x22\xb4\x0c\xa7\xe1\x19\xce\
+\x5d\xf0\x06\x5c\x73\xcd\x0d\xd8\x78\xe1\x26\x18\xc8\xe6\x25\x8f\
+\xd8\xd6\xa1\x1d\xe9\xd9\xb7\x91\xf6\x82\xd1\x05\x4b\x2b\xf1\x7c\
+\x46\xa0\x29\xe5\x72\xea\x19\x5e\x77\x3d\x4e\xfd\xfc\x89\xe8\xeb\
+\x19\xb9\x85\x53\x58\xc7\x98\xf7\x42\x72\x17\x19\xa4\xd6\x66\x8e\
+\xcf\x14\x37\xda\xcf\x3e\xfb\xac\xac\x79\xce\x9b\x85\x67\x07\xdb\
+\xe9\xf1\xad\xc2\xff\x9b\x60\xe8\xbc\x13\xa8\xd6\xf3\x1b\xcd\xa6\
+\x69\x86\xeb\xba\x7d\xb6\x93\x1f\x6c\x44\xa7\x16\x0c\x8d\xd4\x32\
+\xd4\xc4\x9a\x61\x0f\x93\x3c\xf8\x3b\x77\x4d\xd6\x45\xde\x18\xa0\
+\x61\x22\x8b\x01\xd1\x68\x96\x87\x9d\x9b\x0f\x99\x9d\xd7\xbe\x97\
+\x9d\xce\xd9\xf8\x97\x07\x13\xda\x5c\xa0\x7c\x08\xe8\x19\xb2\x84\
+\xc2\x3a\x4f\x0c\x77\xed\xfc\x7b\x98\xa1\x1b\xbe\x9e\xc9\xde\x31\
+\xd9\x43\xc5\xeb\x23\xc0\x1f\x7c\xf0\xc1\x52\x1e\x61\xda\xa2\xcd\
+\x61\x54\xfb\x7e\xbe\x9f\xe1\x1e\xee\x40\x17\x2d\x5a\x04\xb6\xf4\
+\xb1\x7a\x34\xad\xaf\x53\xb9\x2b\x3d\x86\x30\x9e\xa3\x19\x64\x7b\
+\x4f\xb0\xea\xc2\xf5\x73\x8d\x33\x8a\xbe\x47\x9d\x0d\x2a\x28\x2a\
+\x1b\x89\xa8\x78\x6d\x95\x8a\xe6\x68\x2a\x41\x13\x65\xbd\x1c\x07\
+\xb9\x62\x41\x14\x63\xd8\xb2\x87\x12\x5d\xd1\x48\x52\x08\x37\x1e\
+\x85\x2c\xd9\xc2\x28\x09\xf4\xa5\x6b\xe8\xeb\x4b\x23\x19\x63\x38\
+\x94\xe5\x17\x55\x24\xe3\x31\xe4\x0b\x03\x78\xf4\xc1\xfb\xb1\x6a\
+\xf5\x2b\x48\x25\x28\x6f\x46\xef\xa3\x84\x64\x82\xc4\x05\x0d\xcd\
+\x91\x84\x43\x16\x2a\xf3\x84\x16\xca\xe2\xb8\x50\xbd\x88\xe3\x4c\
+\xe9\x3d\x9b\xff\xb0\x47\x6e\x7f\x6b\xc5\xfa\x6b\x15\xc6\xa6\xca\
+\x0c\xe7\xb0\x2d\xa9\xf5\x8e\xcc\x63\xaf\x5e\xdd\x25\xdf\x29\x8d\
+\x8c\x11\x95\xce\x09\x04\xed\x2b\xbe\x75\x25\xf6\xdb\xff\x7d\x80\
+\x1b\x47\xb5\xe6\xa0\x58\xca\x23\x99\x70\x40\xdd\x80\x85\x1b\x4f\
+\x13\x3c\x88\x38\x04\x14\xf5\x64\xc2\xf2\x76\x61\x80\x0b\x1a\x7b\
+\xc8\x77\x44\x02\xdd\x6b\x4e\x0e\xb9\x3a\xd1\x18\x30\x90\xab\xe1\
+\xe5\x57\x5e\x15\xcf\x93\x79\x36\x7a\x7d\x51\x37\x86\xf6\x8e\x14\
+\x6e\xbc\xee\x3a\x9c\x7c\xca\xf1\x22\x90\xce\x32\x87\x48\x4c\xd3\
+\x2d\x6e\xb4\x1d\x1f\x3d\xe8\x70\xec\xb4\xc3\xdb\xe1\x38\x54\x02\
+\x22\xb9\x49\xaf\x9d\x60\x33\x90\xc9\xca\x18\x67\xf3\xac\x35\xd4\
+\x90\xa1\xe3\x97\x51\xcc\xad\xc4\xdf\x1f\xbd\x57\x42\xa0\x52\x57\
+\x5a\x63\x5d\x9f\xe6\x7d\x99\x1b\x24\x10\xcb\x33\x16\xb4\x7d\xe2\
+\xe6\x97\x75\x86\x24\xc9\x50\x7c\xbd\x8b\x2d\x94\x5c\x7a\xd6\xba\
+\xd2\xe8\x49\x12\xbc\x54\xdb\x87\x5e\x75\x20\xb7\x27\xca\x36\x3c\
+\x5f\x04\x5b\x6c\xb9\x0d\x2e\x5b\xfc\x1d\x6c\xbd\xcd\xf6\x18\x18\
+\xc8\x2a\x49\x27\xa2\x79\x43\x32\x49\x1b\xcf\xae\x12\x95\x14\x0c\
+\x55\xd0\xbd\x9c\x2f\x60\xde\xbc\xd9\xb8\xe1\xfa\x1b\x71\x2a\xb5\
+\x49\x7b\xb4\x8b\xc8\x70\x47\xab\xcd\x50\x58\xc2\x30\xbc\xbe\x26\
+\xdb\x7e\xd4\x1f\xd1\xa6\x56\x65\x46\xd2\x59\xb8\x70\xa1\x6c\xfe\
+\xc8\xa0\x37\x8e\x00\x49\x86\x74\x18\x98\xd3\x0c\xdb\x68\x5d\x9b\
+\xe1\x71\x1a\x8b\x91\x78\x2d\xde\xeb\x91\x3c\xd3\xdf\x64\x96\x1a\
+\x5f\x1c\x8d\x46\x9f\xad\x56\xab\x5b\x98\xd1\x6c\x00\xe2\x6b\x03\
+\x86\x43\x4d\xae\x0d\xa8\x79\x2e\x34\xdc\xa6\x79\xc8\x2b\xe7\xdf\
+\x39\x59\x04\x46\xb1\x8d\x41\xd7\xe8\xf0\x44\x8c\x66\xe7\xc3\xf7\
+\xd0\x68\xd9\xe7\x09\x0c\xfc\x9d\x5d\x17\xa8\x6b\xda\x20\x93\x68\
+\xc1\xf2\x4f\x7e\xf2\x13\xe9\x68\xcf\x87\xb7\x11\x4e\x1e\xbc\x5f\
+\xb6\xef\x9d\x6a\x30\xb4\x1e\x8a\x66\x74\xf9\xef\x9d\x76\xda\x49\
+\x8c\xe6\x56\x5b\xbd\xb9\x7e\x7d\x23\x8d\x83\x74\x71\xf0\x55\xb3\
+\x73\xf0\xd1\x10\xb5\x0e\x4b\x9c\xa9\xf5\x1f\xc7\xa2\x0d\x81\x61\
+\x33\x2d\x87\xb9\x1f\x79\x88\xea\xed\x98\x94\x3d\xa8\xdd\x2a\xf4\
+\xfb\x44\xa3\x93\x3b\x7b\x27\x20\xb4\x38\xae\x08\x39\xd3\xab\xeb\
+\xed\xcb\x61\x20\x9d\x83\x47\x31\x65\x27\x8a\x2a\x49\x96\x34\xaa\
+\xb1\xa8\x30\x4a\x45\xe9\x25\x16\x15\x8f\x82\x60\x48\x06\xe2\x9a\
+\xae\x57\x71\xd8\xff\x7c\x1c\xcb\x57\xbc\x84\xa8\x5b\x03\x7c\xe6\
+\x05\x0b\xe2\x45\x99\x7d\x15\x71\xb7\x60\x47\x6e\x85\xf6\xbc\x1c\
+\x12\xab\x48\x74\x60\x2d\x65\xf8\x68\x5e\x0f\xad\x8c\x5d\xab\x51\
+\x6c\x38\x6c\x9e\x34\xe7\x25\xc3\xf9\xa1\x87\x1e\x92\x62\x73\x92\
+\x63\x98\x93\xe3\x3d\xd3\x88\x9f\x77\xfe\x85\xd8\x6d\xd7\x77\x62\
+\xf5\x9a\x1e\xb4\xb5\xcd\x40\x7b\x47\x1b\x32\x03\x5d\x98\x3d\xbb\
+\x1d\x6f\xdd\x69\x73\xc4\x63\x52\x9d\x07\xcf\x2b\xcb\xd7\xd6\xaa\
+\x40\x94\xa1\x4a\xe9\x03\xd9\xe0\xe4\x78\x8c\x41\x3a\xaa\xfc\x53\
+\x2d\xd4\x04\xe8\xa2\x94\x35\x93\x87\x0c\x78\x75\xe5\x00\x9e\x7c\
+\x62\x19\xca\x15\x12\xce\x52\xe2\xc5\x45\x1d\x17\xc9\x54\x0c\x7f\
+\xbc\xfd\x56\x7c\xed\xfc\x73\x50\xa9\x65\x11\x71\x3d\xd4\x3c\x76\
+\x85\xa0\x0d\x69\xc3\xdb\xdf\xfe\x5f\xd8\xec\x8d\xdb\xa3\x98\xa7\
+\x0a\x13\xff\x1c\x17\x6d\x52\x02\x0d\xd7\x2f\x0b\xec\x39\x7e\xd1\
+\x44\x5c\x45\x30\x9c\x32\x7a\xd6\x2c\xc5\xa3\x0f\xdd\x85\x74\x66\
+\x0d\xdc\x08\x0b\xe7\x0b\xf0\x51\x92\x92\x1b\x91\x74\x0b\xd6\x05\
+\xbf\x83\xff\x93\x34\x0f\xb4\xc0\xbe\xbe\x70\x64\x9b\xc5\x8e\x13\
+\x6c\x0a\xcc\x5b\xd5\x16\x57\xda\xae\x89\xc4\x5c\x12\x6b\x62\xf0\
+\x23\x51\x70\x68\xb6\x7c\xcb\x0e\xb8\x64\xf1\xb7\xb1\xcd\x36\xdb\
+\x4a\x1f\x45\x03\x67\x59\x8e\xd4\x28\x0d\x16\xbf\x7a\x86\x0a\xcc\
+\x11\x76\x70\x62\x38\x3d\x4f\xcf\x30\x0c\x86\xf4\x0c\x87\x17\xae\
+\x68\xb5\x3e\x9a\x9d\x85\x70\xfe\xb8\xd5\xda\x19\xcf\xeb\xcd\x76\
+\xc2\x52\x2d\x64\xdd\x5f\x72\xc9\x25\x58\xb0\x60\x5e\xfd\xb4\xcb\
+\x97\xbf\x2a\x75\xa3\xec\xbd\x69\x60\x48\x7b\x37\xb4\x53\x35\x9e\
+\xab\x99\x92\xcf\xd4\x35\x49\x87\x05\xc3\x58\x2c\xf6\x2b\xcf\xf3\
+\x0e\x22\xea\x9b\x97\xa1\x37\x38\x1e\xab\x37\xfa\x9b\xb0\xc1\x6f\
+\x06\xc3\xf0\xdf\x79\x3d\x34\xf2\xec\xfa\xb0\xd5\x56\x5b\xd5\x6b\
+\x6c\xf8\x00\xb1\x0b\xc4\x23\x8f\x3c\x32\x88\x09\x6a\x31\x75\x63\
+\x8b\x8d\x74\x35\xf2\xf0\x05\x72\x51\x96\x2f\x35\x96\xe9\x6e\xbb\
+\xed\x26\xcd\x50\x8d\xc2\x4d\x42\x0c\xaf\xe5\x95\x57\x5e\xa9\x17\
+\x5b\x0f\xe5\xd9\xda\xb5\x5b\x18\x45\x8c\x7c\xd3\x8e\x6b\xa2\x3b\
+\xbb\xa1\xc6\xcd\x36\x32\xdb\x6c\xb3\x0d\xae\xbd\xf6\x5a\x6c\xb6\
+\xd9\x26\x75\xc6\xdc\x50\xd7\x20\x18\x13\x14\x5e\xdb\xf9\x18\x0a\
+\x32\xe2\x0b\x19\x7a\x7a\x98\x6a\x64\x0b\xcf\x50\xa4\x61\x42\xa3\
+\xcd\xbe\x70\xc1\x8e\x3c\x40\x3a\xc3\xb5\x10\x67\x53\xdf\x3f\x18\
+\x0c\xed\x3c\x2c\xa3\xa0\x95\x69\x3a\x67\xc8\xcc\x89\x17\xe8\x03\
+\xaf\xbe\xda\x8b\xbe\x3e\x92\x1d\x48\xca\x50\x61\x65\xad\xcf\x8b\
+\x21\x96\xd4\x7e\x76\x42\x0c\xab\x91\x86\xef\x8a\x66\xe5\xea\xd5\
+\xaf\xe2\x90\x83\x0f\xc2\xcb\x2f\x3f\xcf\x22\x04\x69\xf0\xea\x04\
+\xf2\x6f\x36\x5d\xd1\x58\x54\xbc\x2e\x1e\x9c\x7b\x6e\x18\xb8\x0e\
+\x58\x86\xc2\x08\x01\x77\xcc\x53\x79\xd0\x50\x0b\x18\x3b\x90\x75\
+\xc7\x72\x8e\x27\x9f\x7c\x5a\xbe\x52\x75\x6f\x69\x68\xe9\xbd\xc7\
+\x71\xe6\xb9\xe7\xe3\xdd\xfb\xec\x8f\x9e\x5e\xf6\xd9\x6b\x97\xcf\
+\x94\x4a\x69\xcc\x9b\x33\x0d\xff\xb9\xf3\x9b\x24\x1c\xa9\xf7\xc7\
+\xff\x82\xb2\x1f\x69\x96\x1c\xcc\xab\x8c\xb3\x85\x11\xf9\x1e\x7a\
+\xeb\x81\x07\x29\xa1\xc4\xa8\xcc\xdb\xea\x35\x79\x3c\xfd\x7e\x91\
+\x30\x00\x00\x20\x00\x49\x44\x41\x54\xf5\xc4\x8b\xa8\x79\x71\xc4\
+\x63\x2c\x83\x60\xce\xb5\x22\xe1\xc8\x3f\xfe\xe1\x66\x5c\x74\xf1\
+\xd7\x50\xad\x66\xe1\xf9\x15\x24\xb8\xb1\x74\x12\xa8\x94\x62\xd8\
+\xeb\x1d\xef\xc3\x82\x05\x5b\xa1\x90\x23\x88\x24\x11\x4b\xb4\x8b\
+\xaa\x8c\x1b\x90\x47\xbc\x60\x93\xc3\x92\x19\x87\x1d\x39\x9c\x02\
+\x7a\xd6\x3c\x8d\x07\xee\xbb\x0d\xdd\x7d\x54\x72\x29\xb1\xeb\x64\
+\x5d\x47\x56\xc7\xdd\xca\x97\xf4\x1e\x22\xf4\x96\x25\x7c\x5a\x15\
+\x35\x1a\x03\x3c\x5d\x47\x8e\x84\x5b\x6d\x4d\xd3\x43\xd6\x12\x1c\
+\xf5\xb2\xe9\xf6\xfa\x15\x1f\x5b\x6e\x43\x30\xfc\x16\xde\xb2\xf5\
+\xb6\xc8\xf4\x67\x84\x40\x63\xa4\x99\x3a\x71\x29\x38\x4b\x3d\x7a\
+\x35\x4e\x30\x6c\xb5\x59\x6f\xf6\xb0\x26\x6a\x37\x5a\xad\xd5\xe6\
+\xeb\x31\x56\x3c\x37\x7f\x6c\x34\x40\x01\xf8\x7c\x9e\x8a\x3f\x71\
+\x3c\xf7\xdc\x73\x38\xf4\xd0\x43\x65\x73\xc6\x23\xac\x5c\x36\x19\
+\x65\x1f\xad\xae\x75\x9c\xaf\xff\x1a\xf0\x0e\x0e\x7f\x76\xad\x0c\
+\x8e\xeb\xba\xa7\x45\x22\x91\x0b\x4c\x2b\x91\x46\x51\x41\x71\x78\
+\x17\x7f\x9c\x17\x33\xe8\x63\xc3\xb9\xd3\x61\x0f\x95\x83\x4c\xf7\
+\x9c\x39\x91\xbd\xf7\x66\x3f\x34\xcd\x83\x50\x22\xe9\xb8\xe3\x8e\
+\x93\xc2\x79\x73\xdd\xe9\xe5\xa8\xa1\x48\x8e\x4a\xb6\x48\x76\x75\
+\x02\xfa\xda\xa9\x82\xdf\x6b\x1d\x18\x86\xba\x3f\xbe\x6e\xf9\x43\
+\xa3\x45\xf3\x7d\x23\x81\x79\x18\x1c\xc3\xef\x1d\xef\xc2\x0e\x9f\
+\xcf\xbc\x65\x4b\xb6\xf3\xfe\xb7\xde\x7a\x6b\xc9\x65\x31\x94\x47\
+\xc3\x22\x26\x23\xb0\xee\xcd\x20\x1a\x06\x73\x1b\xf3\xc1\xf7\x6d\
+\x3e\x5c\x53\x84\x60\xb8\xc4\x52\x40\x6c\xa8\x9f\xa3\x09\x0c\xc3\
+\xe5\x12\xe1\xef\x69\x80\x61\xf0\xd7\x20\xe7\x17\x74\x21\xd2\x6e\
+\xf6\x04\xd7\x10\xde\x72\x7f\x1f\x71\x62\x42\xd3\xef\xea\xee\x43\
+\xba\x3f\x07\x27\x42\x30\xa4\x10\x37\x73\x4a\x71\x09\xab\x46\xe2\
+\x31\x54\x4b\x6a\xdc\x59\xac\xcd\x1c\x67\x5b\x2a\x86\x81\xfe\x3e\
+\x7c\xe8\xc0\xff\xc6\x8b\x2f\x3e\x07\xd7\x27\xa8\xb0\x91\x2e\x8b\
+\xef\x75\x7d\x49\x1e\x36\x12\x17\x29\x30\x8e\x33\x41\xd0\xd6\x0a\
+\x65\xeb\x7e\xf7\xbb\xdf\xd5\xc1\x30\x6c\x44\xc2\xbf\x5b\x1e\x75\
+\xb8\x67\xa5\x95\x31\x24\x34\x49\xd4\x02\x3e\xd6\xac\x59\x23\x0a\
+\x25\x2f\xbc\xf0\x42\x40\xea\x88\x8b\x57\xe6\x46\x12\xa8\xd4\x5c\
+\x9c\x7e\xfa\x59\xd8\xf3\x9d\xfb\xc8\x7d\x17\x0a\x65\xb9\xde\xe9\
+\x1d\x31\xcc\x9a\xd9\x89\x1d\x77\xd8\x5c\xc1\xd0\xe1\x66\xa7\x84\
+\x24\xd9\x43\x6c\x76\x2c\xa2\x10\xc2\xc9\x0c\xc6\x98\xfa\x9c\x65\
+\xf8\x0e\x7f\x7a\x88\xfd\x13\x64\x59\xcf\xc8\x2e\xef\xb5\x2a\xdf\
+\x93\xc0\xaa\x57\x73\x58\xba\xf4\x15\xc0\x69\x97\x1c\xae\xac\x1b\
+\x6e\x24\x9c\x12\xee\xbc\xe3\x46\x5c\x74\xc9\x57\x51\xab\x65\x24\
+\x87\xe8\x49\x97\x1c\xea\x90\xa6\xf0\xf6\x5d\xf6\xc7\xc2\x85\x5b\
+\xa3\x5a\x61\x2d\x60\xa7\xd4\x13\x52\x4d\x87\x25\x32\x04\x44\xba\
+\xed\xe2\xf9\xc8\xa6\x8a\x17\x9b\x43\xb5\xb4\x1c\x7f\xb9\x77\x09\
+\x56\x77\x31\xdc\x48\xbd\x56\xe6\xe9\x49\x76\xa2\x67\xcc\xa0\x77\
+\xe0\x1d\x06\xcb\x54\xc7\x93\x79\x51\x05\xf5\x7a\xd7\x93\x20\x3f\
+\x28\xcf\x82\xd8\x8f\x20\x28\x2f\xef\xe3\xe1\x8a\xfa\x0c\xa3\x0c\
+\x5b\x2d\xda\x01\x8b\x17\x5f\x86\x2d\xb7\xde\x16\xe9\x9e\x01\xf1\
+\xc0\xa5\x54\x45\xc6\x29\x28\xf3\x08\x9e\x29\x7b\x7e\xd4\x33\xf4\
+\x51\x2c\x14\xb0\x60\xee\xe8\xc3\xa4\x93\x61\x43\x27\xf3\x1c\xcd\
+\xeb\x91\xa9\x00\x96\x74\x90\xd8\xf3\xfd\xef\x7f\x5f\x9e\x03\xae\
+\xc7\xce\xce\x76\xbc\xf0\xc2\x4b\xf8\xd8\xc7\x3e\x86\x07\x1f\x7c\
+\xb0\x6e\x63\xcc\xa6\x59\x03\xf3\xc9\xbc\xb6\x49\x3a\xd7\xe9\x80\
+\xf7\xf5\x11\xc1\x30\x1a\x8d\xb2\x40\xe9\x0f\xc6\x90\xb4\xce\xd7\
+\xad\x14\x54\x26\xe9\x02\xd7\x02\xc8\xb0\xf1\x26\xf8\x30\xff\x45\
+\x6f\x87\x39\x2d\x86\x45\x3b\x3a\x28\x57\x54\x13\x22\x0b\x77\x2c\
+\x7c\xbf\x11\x5f\x6c\x97\xd2\x2a\x5f\xc3\xf7\xf1\xdc\x7c\x9f\x4d\
+\xa2\x81\xb3\xed\x6c\xf8\x93\x06\x8d\x3f\x39\x26\x0d\x65\x19\xf5\
+\x16\x5a\x79\xb6\x76\x63\xc3\x79\x86\xe3\x01\x44\x03\x2d\xfe\x24\
+\x80\x1b\xcd\xda\x0c\x35\xc1\x90\xf5\x6f\xb3\x66\xcd\x14\xa3\x3e\
+\x9a\xc3\xc6\xca\xba\x18\x34\xa4\xe9\x54\x89\x65\x6c\x25\x22\xcd\
+\xe1\xd5\xc6\x15\x18\x18\x0e\x77\x3e\xbd\x5c\x53\x58\x51\xc6\xa0\
+\xa9\xca\x34\xca\xf0\x03\x32\x09\xfd\x16\x86\x44\x3d\x1f\x7d\xbd\
+\x59\xf4\xf7\x65\x51\x65\x37\x03\x31\xc0\x8e\x18\xb7\x42\x89\x2d\
+\x7c\xe8\xdf\x30\xd7\x9c\x42\xad\x52\x95\x7c\x52\x22\xe6\x22\x97\
+\xcb\xe0\xe3\x1f\xfb\x08\x9e\x7f\xe1\x59\x38\x6c\xf5\xc3\xb0\x5e\
+\x95\xef\xaf\xa7\xa0\x02\xaf\xc1\x91\x08\x01\x73\x24\x3c\x38\xce\
+\xbb\xee\xba\xab\x14\xdc\xb7\xd2\x26\x1d\xcd\xd8\x8f\xf4\x1e\x86\
+\x03\xc5\x7b\xa9\x79\x20\x69\x87\x60\xc8\x1d\x39\x09\x32\xda\xf2\
+\x88\x7a\x9a\xcc\x99\xba\x38\xf3\xac\xaf\x60\xfb\x1d\xff\x13\x1d\
+\x9d\x94\x0f\xab\x61\xfa\xb4\x4e\x0c\xf4\x76\x61\xd6\x06\x1d\xd8\
+\x69\xa7\xcd\x04\x74\x74\xd1\xf2\xc3\xe1\x4d\x8e\x02\xa1\x8e\x33\
+\x37\xbf\xd5\x80\x64\xc2\x9f\x1a\x50\x8c\x80\xeb\x20\x21\x80\xf0\
+\xea\xf2\x22\x9e\x78\xfc\x1f\x80\x9f\x40\x47\xfb\x4c\x8d\x3e\xa0\
+\x8c\x78\xb2\x86\x5b\x97\xfc\x16\xe7\x7d\xf5\x34\xc0\x61\x19\x03\
+\x8b\xe6\xdb\x11\x75\xa7\xa3\x5c\x89\xe0\x9d\x7b\xec\x87\x8d\x37\
+\xde\x06\xb5\x4a\x1c\x1e\xf3\x85\x91\x24\x2a\xa1\x92\x8f\x46\x4a\
+\x9a\xde\x30\x01\xa8\x80\x6c\x7a\x19\xfe\x74\xef\x4d\x58\xd3\x6b\
+\xe1\x46\x4a\x04\x92\x48\xa4\xa1\x47\x6e\x7c\xa8\x46\xd4\x10\x68\
+\xe7\x5f\x35\x1f\x28\xff\xd9\x1e\xae\x29\x2e\xaf\xcd\xa2\x34\xef\
+\x2c\xf5\xa4\x11\x6a\x13\xb3\xc6\xb8\x8a\x45\xdb\xef\x88\x4b\x2e\
+\x59\x8c\xad\xb7\x7e\x0b\x06\xfa\xb8\xc1\x8a\xc2\x75\x22\xf0\x1c\
+\xcd\x34\x4a\xe1\x3f\x99\xc9\x41\x5e\xac\x11\x26\x55\x30\x64\x98\
+\xf4\xc6\xeb\x6f\xc0\xe7\x4f\x25\x81\x66\xe4\x9c\xe1\x44\xd7\xc7\
+\x64\x7f\x7e\xa8\xcd\x19\xef\x8f\xac\xfa\x1f\xfc\xe0\x07\x52\xcf\
+\x69\x12\x9d\x7f\xfb\xdb\xdf\xc4\x19\xb9\xff\xfe\xfb\xb5\x5e\x33\
+\x24\xda\x32\x19\x35\x90\x93\x7d\x6f\xc1\x84\xef\x03\x54\xef\x08\
+\x9f\x7b\x28\x13\x39\xdd\x75\xdd\x7e\x8b\xf7\x5a\xf8\x6c\xaa\xc3\
+\xa4\x43\xdd\x70\xd8\xd8\x9b\x9b\xce\xfe\x80\x24\xb4\x10\x0c\x35\
+\x94\xab\x3b\xc2\xcf\x7c\xe6\xb3\x52\x04\x2f\x09\xf7\xc0\xf2\x5b\
+\x78\x74\x34\x40\x13\x4e\xfc\x36\xbb\xf9\x96\x47\x1c\xca\x53\xb4\
+\xc9\x1e\xce\xb3\x15\x9b\x13\x42\xa2\xc9\x04\x43\x2b\xa1\xe0\x4f\
+\x03\x72\x96\x0b\x30\x74\xc1\x3c\x26\xc3\xa4\xb7\xdc\x72\x0b\x36\
+\xda\x68\x7e\x9d\xe1\xd9\xec\xf5\x85\x73\x5b\x23\x93\x38\x86\xf1\
+\x0c\x87\x5d\xa9\x61\x20\x5c\x1b\x44\x69\xdc\xc3\x87\x0a\x63\xd9\
+\x41\x35\x11\x19\xb9\x7a\xd7\x02\xeb\x42\xa0\x1d\xed\xf5\xd0\x33\
+\xa8\x3a\x8c\xf1\x3b\x7a\xba\x73\xe8\xe9\xe9\x07\x23\x9a\x04\x08\
+\x4a\x79\xb1\x55\x93\x10\x9f\xaa\x25\x78\x55\x1f\x1d\x1d\x6d\xe2\
+\x19\x92\x7d\xd8\x96\x8c\xc9\xcf\x0f\x7f\xe8\x03\x78\xf1\xf9\x65\
+\x80\x4f\x7a\xbe\x8b\x6a\x59\x3d\x15\x92\x71\xc4\xd8\x46\xc9\xde\
+\x53\xf6\x25\xd7\x1d\xd7\x21\x37\x1f\x6f\x79\xcb\x5b\x64\x73\xb6\
+\x60\xc1\x82\x41\xf7\xd3\xec\x81\xb7\x7a\xa0\x5b\x79\x86\xd5\xc0\
+\x03\x22\x41\x83\x61\x52\xb6\x1b\x7b\xf2\xc9\x27\x41\x2a\x2d\xc3\
+\xa4\xf4\x7c\xf9\x1f\xc9\x30\xe7\x9e\xf7\x0d\xec\xb2\xeb\x1e\xa8\
+\x7a\xae\x10\x86\xb8\x81\x8c\xbb\x0e\x36\x98\xde\x8e\x6d\xb7\xdb\
+\x44\x40\xc4\xf2\xa1\xf5\x92\x99\x26\x4a\xaf\x92\x9f\xa9\xc3\xa9\
+\x21\x46\x06\x47\xab\x35\xfe\xa4\x3a\x4f\x92\xd5\x2a\x58\xfe\x72\
+\x09\x4b\x97\xae\x40\x2c\xda\x81\x6c\xa6\x28\x4d\x73\xa3\xd1\x1a\
+\x3a\xa7\xc5\x71\xf7\xdd\x37\xe2\xab\xe7\x7f\x11\xd5\x2a\x8b\xc6\
+\x63\x28\xe4\x5d\xb8\x4e\x07\x3c\x3f\x8e\x3d\x77\xdd\x0f\x6f\xdc\
+\xe4\x2d\xf0\x6b\x49\xf1\x32\x19\x76\xe5\x3a\x94\x46\xba\x0e\xcb\
+\x78\x14\xb9\x08\xff\x1c\xef\x78\xbc\x8a\x52\xfe\x1f\xb8\xf7\xde\
+\x5b\xb0\x6a\xcd\x2b\x70\x1c\x82\x33\xeb\x4e\xad\x60\x9e\xcf\x18\
+\x7b\x5c\x52\xbb\x95\x9f\x0c\x56\x48\x00\xec\xb2\x66\x6c\x63\x63\
+\x0b\x25\x98\x10\x6e\x8e\x94\xa9\xac\x6a\x45\x00\x4b\x40\x18\x09\
+\xab\x62\xd1\x76\xdb\xe3\xa2\x4b\x2e\xc6\x96\x5b\x6e\x85\x7c\xb6\
+\x10\xa8\x11\x51\xf2\x3c\x68\xf4\x25\x83\xc4\x0d\x04\x6d\x90\x12\
+\x72\x8c\x40\x43\x96\x32\xd9\xa4\xaf\x27\x30\xe4\x86\x8f\xe2\xeb\
+\x6c\xd4\x3d\x77\xee\x5c\x7d\xfa\x5c\x57\x36\x65\xcc\x61\x93\x44\
+\xc6\x7f\x87\xed\xa4\xf1\x2f\x5a\xad\xff\xd7\xfe\x75\x6f\x06\x00\
+\x4a\x12\xd5\x8f\x21\xfd\x05\xc7\x71\x1e\x73\x1c\x67\x11\x01\xb1\
+\xe1\x31\x8d\xd2\xb5\x98\xc4\xbb\x1a\xca\xf3\xe1\xce\x9c\x06\x7e\
+\xe7\x9d\x77\x96\x42\x70\x82\x34\x29\xce\x54\x82\x31\xf7\x9d\x46\
+\x8a\xe0\x49\xd6\x1d\x17\xe9\x48\x40\xd5\x7c\xb9\x7c\xf8\x78\xcf\
+\xa6\xa0\xd2\x1c\xde\xe2\xb9\xf8\x7a\x58\x90\x60\x34\x9e\x67\x18\
+\x84\x9a\xbd\xc8\xd1\x24\xc3\x87\xba\x87\x70\x19\x85\x15\x24\x87\
+\x3d\x5c\x4a\xc8\x51\x2e\x6e\x8b\x2d\xde\xb4\x56\x49\x40\xf3\x7d\
+\x37\xd7\x02\xf2\xdf\xcd\xc0\x39\xd2\xd4\x0e\xce\x28\xaf\xad\x56\
+\x53\xaf\x87\x0b\x20\xac\x01\x86\xfa\x49\x0b\x51\xe9\x77\xb8\x70\
+\xc2\x54\x46\x11\xcf\xe6\xb6\xbd\xe1\x4f\xf2\x5d\x3a\x8e\x0a\x84\
+\x0c\xfd\x51\xb8\xbb\xab\x27\x87\xbe\xbe\x4c\x1d\x08\x69\xa8\xb4\
+\x33\x03\x8d\x79\x19\xc5\xbc\xea\x57\xd6\x58\x48\x1f\x01\x3a\x52\
+\x49\xe4\x0b\x59\x7c\xe0\xfd\xef\xc3\x0b\xcb\x96\x8a\x47\xa4\x7a\
+\x90\x14\x56\xa0\x77\x49\xa9\x2f\xa5\xdc\x13\x0c\x1b\x75\xa3\x7a\
+\xa5\x7b\xec\xb1\x07\x6e\xb8\xe1\x86\x7a\x8f\xc0\x49\x5c\xfe\x83\
+\x4e\x45\x50\xb2\xae\x7f\x24\xd0\x50\xc4\xf9\xe1\x87\x1f\x95\x2d\
+\x84\x7a\x85\x49\x94\xca\x65\xcc\x98\x31\x07\x9f\xfe\xcc\x51\x38\
+\xe8\xe0\x43\xc4\x4b\xa4\x87\xc3\x28\x46\x7f\x4f\x3f\xe6\xcc\x9a\
+\x8d\x9d\x76\xda\x5c\x98\xa0\x2a\x5c\xcf\x88\x88\x7e\x4d\x40\xc2\
+\xd4\xdf\xed\x51\x67\x9d\xa6\x94\x21\xe8\xf8\xca\x7b\x82\xd4\x04\
+\x7f\xae\x7c\x15\x58\xb6\xf4\x65\xe9\x46\x31\x7d\xda\x2c\xa9\xe9\
+\x2b\x16\xd2\xf0\x51\xc4\x1d\x7f\xbc\x01\xdf\xf8\xe6\x39\x28\x16\
+\x07\x82\x2f\x88\x21\x16\xed\x44\xb5\x1a\xc1\x5e\x7b\xbe\x17\x9b\
+\xbe\x71\x6b\xf8\x4e\x12\xbe\x17\x13\xa6\xae\x3e\x53\x5a\x4b\xc9\
+\x1e\x82\x7c\x26\xb8\x11\xe1\x1a\x4f\xc4\x3d\xbc\xba\xe2\x31\xdc\
+\x77\xdf\xed\xe8\xee\x5b\xa9\x79\x5d\x50\x35\x86\x61\x50\x1b\x26\
+\x73\xfd\xc2\x61\xfc\x70\x34\x61\xed\x99\x31\x16\xae\x23\x3d\x32\
+\x5d\x21\xd0\x08\x18\x46\x19\x72\x2f\x61\xd1\x76\x8b\x04\x0c\xdf\
+\xfc\xe6\xff\x40\x3e\xab\x42\x1a\x42\xb0\x91\xf7\x32\x47\xad\xeb\
+\x4f\x9e\x4d\x19\x1f\x0a\x75\x2b\x9b\x74\x30\x18\x1e\xdf\xb2\xb4\
+\x62\xaa\xd6\xcd\x78\xcf\x3b\xdc\xa6\x9d\xf3\xc4\xd4\x00\x5f\xb7\
+\xe8\x21\xc3\xa7\x5c\x93\xb4\xb7\xf6\x7c\x58\xd8\x78\xac\xf6\x77\
+\xbc\xd7\x3b\xc6\xcf\x3d\x0e\x78\xdb\x36\x7f\x66\x48\x84\x73\x5d\
+\xf7\xca\x68\x34\xfa\x29\x3e\x44\x0d\x55\x96\x75\x0b\x86\x1c\x7c\
+\x1a\xe8\xcd\x36\xdb\x4c\x68\xbc\xec\x4c\x2f\x3b\xfc\x9a\x82\x1d\
+\xc3\xa4\xdf\xfa\xd6\xb7\x24\x96\xcd\xf0\x69\xd8\xd3\x1b\x8b\xab\
+\x1e\xde\xc9\x84\xdb\xaa\x84\x59\xa6\xe1\x41\x34\xb2\x4d\xab\x5a\
+\xbe\xa9\x04\x43\x5e\xf3\x9b\xdf\xfc\x66\xb0\xa9\x30\x63\xfb\x06\
+\xe4\x3b\xec\xb0\x83\x30\xbf\x16\x2e\x5c\x30\xc8\x33\x6c\x00\x49\
+\x23\xc7\x19\x66\xb3\xd5\xb5\x1e\x47\x1b\x5b\x1d\x25\xa9\xb4\xb1\
+\x82\x2c\x3f\x23\x95\x70\x4d\x60\xc8\xd0\xa8\x7a\x84\xf6\x82\x19\
+\x67\x1a\x66\x2b\x38\x97\x9f\x76\xc2\xa0\x08\x9d\xcc\xd1\xee\xbe\
+\x9c\x88\x70\x6b\x91\x7c\x04\x65\x76\x39\x90\xba\xb4\x8a\xb0\x1c\
+\xb5\x49\xab\x16\xd4\x13\xec\x98\x4a\x5d\xbd\x72\x25\x3e\x7f\xca\
+\x09\x78\x66\xe9\x53\xa8\x56\xf8\x40\x13\x44\x8a\xfa\xbe\x9a\xb2\
+\x35\x6d\xf7\xcf\x87\xdd\x42\xe4\x1c\xa7\x77\xbc\xe3\x1d\xb2\xee\
+\xde\xf0\x06\xea\xfd\x0e\x7f\xb4\xf2\xfc\x5a\x45\x2f\xc2\x9e\x21\
+\x8b\xae\xd9\x4d\x81\x45\xd8\x2c\x15\x10\x32\x4f\xb1\x24\x92\x61\
+\xc9\x44\x07\xda\x3a\x3a\xb1\xeb\xee\x7b\xa2\xb7\x2f\x2d\x35\x95\
+\xcb\x5f\x5d\x89\x7c\xae\x8a\xcd\x36\xdb\x5c\x76\xf6\xac\x61\x13\
+\x65\xa4\x9c\x50\x39\x51\xad\xf9\x88\xc7\x68\xe4\x83\x21\x17\x82\
+\x4d\x30\x47\x52\xd0\x4e\x7f\x53\xe5\xd0\xd8\x09\xc3\xd4\x77\x58\
+\xf3\xf6\xc8\x23\x7f\x53\x29\x42\xf1\xb0\x58\xdf\x50\x41\x7b\x47\
+\x0c\xcf\x2c\xfd\x2b\x7e\xfd\xdb\x9f\x22\x1e\x53\x8d\x57\xca\xaa\
+\xc5\x13\x6d\x28\x97\x1c\xec\xb6\xcb\xde\xd8\x68\xfe\x66\x22\x9c\
+\x40\xef\x95\xf3\x24\x9e\xa1\x78\xbf\x1a\x7e\xe6\x75\x95\x29\x28\
+\xee\x44\x11\x8d\xd7\x90\x1d\x58\x8e\x07\x1f\x24\x9b\xb4\x17\x2e\
+\xcb\x42\xd8\xd2\x8b\x80\xee\x91\xc1\xa9\x21\x4e\x05\x37\x3d\x97\
+\xe6\x08\x2d\x81\x38\xd4\x02\xa5\xa7\xca\xce\x17\x49\x29\xa5\x60\
+\xcd\x6a\x95\x3d\x11\xf9\x7b\x2c\x86\x62\x35\x8f\xed\xb7\xdf\x0e\
+\x17\x5e\x74\x01\xb6\x7c\xf3\xe6\xc8\x65\xd2\xca\xda\xe5\xb5\xba\
+\x11\x69\x25\x46\x4e\xa1\x7a\x95\xee\xe0\xae\x15\x8e\x13\x02\xc3\
+\xeb\x82\x30\xe9\xc8\x75\x86\xad\xd6\xc7\x50\x2b\xab\xd5\x9a\x19\
+\x23\x40\x0c\x7a\xfb\x50\x60\x68\xb5\xd8\x26\x36\x61\xfc\x0c\x19\
+\x6f\xca\x1f\x46\xa3\x82\x17\x2c\xd1\xe2\x9a\xa4\xcd\x6c\x95\x2b\
+\x9f\xc8\x35\x4e\xe0\xb3\x3f\x00\xbc\x4f\x8f\x0a\x0c\x93\xc9\xe4\
+\x11\xe5\x72\xf9\x07\xe6\x21\xa9\x57\x32\xb5\x60\xd8\x6a\x31\x18\
+\xb3\x93\x46\x67\xef\xbd\xf7\x96\xf0\x14\x0f\x23\x8c\xb0\x84\x80\
+\xc4\x02\x76\x99\x18\x8a\xd2\xdb\xea\xfc\xad\x16\xd6\x78\x3e\x1f\
+\x0e\x95\x19\x2d\x9f\xf7\x61\xa1\x04\x1a\x25\x5e\x6f\x38\xc6\x3e\
+\xdc\x8e\x8c\xf7\x6a\x61\x51\x23\xf9\x70\x7e\x28\x16\x7d\xc0\x01\
+\x07\xe0\x98\x63\x8e\x11\x20\x0c\x9f\x8b\x21\xd3\x4d\x37\xdd\x14\
+\x33\x66\x4c\x9b\xc0\xba\x19\xf9\xa3\x61\x8f\x90\xfd\xe0\x9c\x7a\
+\x42\x4a\x61\x8e\xab\x46\x0a\xe0\x29\xa3\x49\x1d\x51\x25\xf3\x35\
+\x72\x39\x41\x3f\x0a\xe9\x27\xce\x56\x4b\xac\xf1\xf2\x20\x9d\x29\
+\xa8\x02\x42\x71\x67\x27\xca\x2e\xe5\x24\xce\x34\xfb\x9f\x0d\x06\
+\x21\x6b\xdd\xc8\x48\x64\x17\x01\x92\x1f\xc8\x1e\x65\xee\x47\x35\
+\x39\xa9\x44\xd2\x8b\x5f\xff\xe6\x17\x58\xfa\xd4\xd3\x98\x3e\xbd\
+\x53\x6b\xef\x92\x09\xe4\x73\x4a\xf0\x98\x3b\x67\x16\x3e\xf4\xa1\
+\x03\xd1\xdb\xd3\x15\x84\xfb\x78\x3d\x34\xb4\xae\x7c\x77\x22\xd9\
+\x26\xdd\xe4\x4d\x85\x88\xeb\x8e\x63\xcd\xf5\xc8\xb5\x48\x62\xd7\
+\x54\x1e\x0c\xf1\xd2\x63\xe1\x51\x2a\x16\xe5\x5a\x98\x97\xa2\xf1\
+\x57\x15\x94\x2a\x8a\xa5\x0a\x96\x2d\x7b\x01\x87\xfc\xcf\xff\x6a\
+\xe3\x5f\x49\xaa\x29\xe9\x05\x7e\x0c\x0b\x37\xdb\x0a\x07\x1e\xf8\
+\x61\xcc\x9a\xb9\x21\x8a\x65\x4f\x44\x04\xb8\x71\x20\x78\xd6\x2a\
+\x04\xbf\xc0\xcb\x71\x1d\x29\x91\xa0\x10\xb8\x64\x59\x59\x97\xc8\
+\xe2\x77\xb2\x52\xcb\x59\xc4\x12\x1e\x0a\xf9\x34\xfe\x78\xd7\xef\
+\xf1\x97\xfb\xfe\xa4\x1e\x9d\x30\x53\x6d\x73\xc3\xdf\xd9\x3b\x94\
+\xe4\x9b\x80\x88\x23\xfa\xae\x40\x3c\xde\x89\x64\x62\x3a\x62\x91\
+\x0e\x61\x97\x52\x03\xd4\x9e\x3d\xb2\x48\x1b\x79\xe1\x20\x17\x2a\
+\xec\xcf\x2a\x0a\xf9\x5e\x78\xb5\xa2\xd4\x17\xb2\x4c\x43\x9a\x4d\
+\x0b\x11\x48\xd7\x98\xe6\xaf\x14\x98\xf4\x68\x94\x4c\xc8\xe6\x4f\
+\x08\x5c\xd2\xb3\x3e\x68\xfd\xc4\x7c\x9f\x8b\x59\x33\x37\xc2\x66\
+\x9b\xbe\x19\xa9\xe4\x74\x64\xf3\x1c\xe3\x04\xca\x95\xa2\x88\x7d\
+\xef\xb0\xe3\x22\x9c\x7d\xce\x97\xb0\xd9\x9b\x66\xa0\x54\x60\xd9\
+\x85\x9e\x9b\xa6\x90\x6b\xba\xa7\xaf\x84\xf4\x40\x4e\x40\x80\x82\
+\x02\xda\x1f\x52\x6b\x23\xd9\x32\x8b\xe5\x07\x4b\x6e\xbe\x09\x27\
+\x9d\x78\x4c\xcb\x7e\x86\x53\xb9\x76\x46\x73\xee\x56\xf6\xad\x55\
+\xe9\x87\x45\xae\x2c\xca\xd5\xca\x9e\x8e\xe6\x9a\xa6\xee\x3d\xce\
+\xa7\x80\xda\x0f\x47\x05\x86\xf1\x78\x7c\xeb\x72\xb9\xfc\x24\x1f\
+\xb2\xba\x88\xed\x6b\x54\x5a\x31\xdc\x00\x18\x18\xf2\x75\xfe\x1e\
+\x66\x4f\x5a\x68\x93\xc0\x60\x47\xd8\x33\x6c\x35\xd1\xb2\xc0\xc3\
+\x71\xa2\x21\x2e\xa2\xd5\x39\x86\xfa\x7c\x18\x0c\x69\x50\x59\x8b\
+\x73\xd0\x41\x07\x89\xe1\xe4\x83\xc3\xbf\x31\xb4\x7b\xe3\x8d\x37\
+\xae\x55\x72\xd1\xea\x9a\x78\x6e\x23\xf3\x1c\x72\xc8\x21\x42\x1e\
+\x22\x31\x44\x77\xc8\x0c\x19\xaa\x4a\x87\xd5\x46\x4e\xd5\xc2\x0a\
+\xc3\x53\x29\xf0\xba\xa4\x5b\x44\xe0\xb9\x59\x95\x05\xcd\x08\xc3\
+\x72\x51\x69\x7e\xaa\xc6\x8b\x72\x59\x0c\x40\x8a\x64\x98\x68\x7d\
+\xfa\xd2\x5d\xbc\x54\xa2\x52\x4c\x2f\xd2\x19\xb2\x36\x63\xd2\xdd\
+\x9d\xeb\xd0\x42\x76\x12\x41\xad\xb3\x53\x15\x10\x59\xa7\x46\x70\
+\xd2\xba\x40\x7e\x89\xd2\xe0\xa5\xe7\x9d\x53\xc5\x8a\x15\xcb\x70\
+\xd1\x85\x5f\xc3\xad\x37\xdf\xd4\x30\xda\x54\x02\x8b\x38\x98\x36\
+\xad\x03\x97\x2f\xbe\x14\x87\x1c\x72\xb0\x74\x77\xd0\xa2\xfa\xc6\
+\xe6\xcf\xa7\x26\x66\xe0\x64\x18\xb1\x88\x63\x4b\x0f\x3c\xdc\xb1\
+\x64\xaa\xc6\x58\x36\x7d\x35\xbd\x2e\xc2\x13\xb3\x53\x5e\xa5\x5a\
+\xf7\xc8\x74\x83\x45\x16\x26\xf0\xd7\xbf\x3e\x81\xbd\xf6\xda\x1b\
+\xe9\x81\xac\xf4\x37\x64\x31\x7a\x95\x65\x13\xb5\x04\xde\xf8\x1f\
+\x8b\x70\xd8\xa1\x47\x20\x99\x9a\x8e\x6c\x86\x39\xd1\x14\x0a\x05\
+\x7a\xcc\x4a\x42\x33\xf1\x6b\x9f\x5d\xdd\x83\x36\x49\x52\x84\xe0\
+\x53\x0b\x26\x8e\x78\x04\xa8\x56\xd2\x48\xb6\xb1\xb7\x60\x9f\xb4\
+\x46\xba\xf3\xae\x5b\x00\xa7\xc2\xf6\x11\x4d\xee\x57\x08\xd8\xdc\
+\x92\xb8\xf4\x9c\x77\x61\xe7\x3a\x6c\xcd\xa4\xea\x32\x06\x86\x0c\
+\x7b\x36\xc0\xd4\x46\xd2\x36\x3b\x40\x5c\x1a\x8d\xb3\x6c\x83\x8d\
+\x7b\x49\x9a\xd1\xda\xc0\x06\x18\x36\x87\x49\x43\x60\x28\xa2\x33\
+\xdc\x14\x69\xa0\xd9\x71\x75\xe3\xe5\xfb\x31\x2c\x98\xbf\x29\xb6\
+\xda\x72\x07\xa4\xda\x66\xa2\x54\xac\xa2\xad\x6d\x9a\x80\x78\xb1\
+\x94\xc3\x56\x5b\x6f\x86\x13\x4f\xfe\x1c\x16\xcc\x8b\x2b\xb9\xc6\
+\xbe\x82\xc2\x03\x04\xc3\xde\x32\xfa\x07\x72\x42\xba\xe1\xa6\xab\
+\x0e\x86\x51\x07\x99\xf4\x00\x16\x6c\x34\x17\x4b\x6e\xba\xf9\x75\
+\x01\x86\xad\xd6\xf6\x50\x75\x90\xad\x3e\xb3\xee\x5e\xf7\xe8\x49\
+\x3d\x35\x2a\x30\x0c\xde\xb4\xca\x75\xdd\xb9\x7c\xd0\x34\x21\x3a\
+\xb5\x45\xf7\xad\xc0\xc6\xb4\x13\x09\x20\xad\x72\x74\xd6\x0e\xc5\
+\x5c\xf4\x56\xe7\x6e\x05\x3c\xb2\xb3\x6c\x11\x32\x6c\x05\x86\x5c\
+\x2c\x2c\xd0\x67\xf2\x59\xa9\xe6\xfa\x70\x9d\x7e\xfa\x17\x71\xd1\
+\x45\x17\xd5\x15\x6a\xc2\xe7\x09\xff\x6e\xa1\x89\x70\x48\xc2\x00\
+\x9f\x1a\x86\xdf\xfc\xe6\x37\xd1\xde\x4e\x40\x60\xb8\x42\xe7\x8a\
+\x39\x2e\x7e\x2f\xa9\xf5\xa4\x40\x4f\xe8\x30\xd4\x6b\x0a\x10\x84\
+\xc9\x2c\x04\x0c\xa6\x5d\x22\x51\x05\x3e\xe2\x95\xe4\x9a\x02\x05\
+\x13\x2e\x23\x6e\xae\x69\xb7\xb9\xb1\x97\xd2\x85\x10\x91\x46\x41\
+\xcc\x01\x75\x94\x57\xae\xee\xc5\x00\x0d\x0d\xbd\x1a\x1a\xe7\x18\
+\x89\x0b\xca\xfd\x1b\x9c\x5f\xe4\x5d\xb9\x52\x04\xcd\x39\x12\x50\
+\x10\x2f\x93\x68\xac\xe3\xe0\xba\x55\x0c\xa4\x57\xe2\x6b\x5f\xfd\
+\xb2\x90\xaf\xe8\x11\x32\x27\xc4\x5d\x3c\xc3\x5f\x6c\xf4\x7a\xc5\
+\x15\x97\xe1\xf0\x4f\x1e\x2a\x6c\x4d\xcd\x31\x6a\x58\xde\xd6\x1b\
+\xff\x6d\xad\x7a\x8c\xac\x64\xeb\xcc\xca\x90\x26\x34\xbe\x2d\x3e\
+\xac\xfd\x1c\x95\xe6\x21\x06\x3d\x5c\xaa\x22\x85\xf3\x2a\xd4\xfd\
+\xe8\xa3\x8f\x09\xb9\xac\x1a\xe8\xb5\x39\x6c\x8c\x5b\xe3\x38\xb4\
+\x63\xde\x26\x5b\xe2\xe8\xa3\x4f\x46\xc4\x4d\x21\x97\xf7\x91\x6a\
+\x9b\x01\xaf\x46\xb6\x6d\x32\x08\x67\x05\xc4\x15\xca\xb6\x89\xc8\
+\x81\x7a\x53\xfc\xdd\xcb\xd7\x44\xc5\xa6\x58\xec\x41\x5b\x27\x89\
+\x44\x19\xdc\x7c\xcb\x2f\x71\xdb\xed\xd7\x20\x16\xf5\x51\xab\xb2\
+\xa8\x5e\x63\x01\x1a\x45\xa2\x17\x66\xab\x83\x5a\x6b\x0a\x5e\x75\
+\xa6\x93\x5c\xbf\xd1\x5a\x83\x12\xd2\xc0\x33\x94\x65\x40\x32\x4c\
+\x40\x6c\xd1\x79\x14\xff\xaf\xce\x72\x95\xe1\x0a\xbc\x42\x7d\x7e\
+\xcd\x2b\xb4\x2f\x69\x06\xc3\x18\x5c\x11\x62\x50\x5e\x2e\xbd\x42\
+\xe6\x07\x17\xcc\xdd\x1c\xdb\x6c\xfb\x9f\x48\x25\x66\x23\x97\x65\
+\x1f\xc4\x36\xd9\xa4\x79\xd5\x1c\xde\xb2\x68\x73\x9c\x70\xd2\x67\
+\x30\x77\x1e\x4b\x40\x74\x13\x27\xa2\x04\xb2\x39\x21\x18\x96\xd0\
+\x3f\xc0\x0d\x5b\x5c\xae\x35\x0c\x86\xd9\x81\x4c\x1d\x0c\x4f\x3e\
+\xe9\x58\xf4\x76\x8f\x1c\x26\x9d\xca\xb5\x33\x9a\x73\x8f\xc7\xbe\
+\x85\xcf\x3b\x52\x44\x6b\x34\xdf\xff\x1a\xbe\x67\x35\xe0\x35\x14\
+\x03\x42\x5f\x3c\x6c\xec\x33\x1a\x8d\xfe\xae\x5a\xad\x1e\xd8\xc8\
+\xb7\xad\x5b\x30\x34\x60\x90\x3a\x9f\x80\xd3\x6b\xc6\x88\xc6\xc9\
+\x72\x77\x96\x9b\x0b\x03\x66\xf8\x33\xc3\x0d\xfa\x54\x7b\x86\x3c\
+\xff\xe9\xa7\x9f\x2e\x6a\x25\x04\x69\xe6\x35\x19\xbe\x3c\xe9\xa4\
+\x53\x70\xe9\xa5\x97\xd6\x9b\x83\x1a\x30\x37\x5f\x8f\x85\x21\xd4\
+\xb8\x6b\x38\xcb\xc0\x9e\x05\xaf\xdf\xfd\xee\x77\x45\x32\xcd\x1a\
+\x81\x4e\xfa\xe2\x6a\x01\x86\x8c\x4c\xf6\xf7\x65\x50\x64\xf1\xb4\
+\x13\x45\x89\x61\x37\x5f\x1b\x29\x0b\xf0\x7b\xec\xfe\x50\x11\x35\
+\x12\x97\x1d\x05\x1c\xb2\x0e\xdb\xd0\xd9\x41\xbd\x4f\x65\x69\x1a\
+\x18\x32\xf7\xb7\x6a\xcd\x00\x06\x32\x64\xf0\xc5\x04\x5d\xd5\x33\
+\x1b\x62\x0d\x9a\xbc\x96\xa3\xaa\x23\xb6\x43\x65\x29\x90\x91\x80\
+\x5c\xa7\x8a\xfe\xbe\x15\x38\xeb\xcc\xd3\x71\xc7\xed\xb7\x05\xa7\
+\xf1\x44\x4d\xa5\x5a\x2a\x22\x9e\x88\xe1\x87\x57\x5d\x89\x43\x3e\
+\x7e\xc8\x20\x4e\x6b\x58\xac\xc1\x98\xb6\xe6\x11\xf2\x7b\xc2\xfd\
+\x1b\x27\x7d\xbc\x43\x27\x34\xda\x10\x33\x65\xc6\x67\x8f\x8a\xa7\
+\xa3\x12\x64\xe6\x11\x33\x9f\xf7\xc0\x03\x0f\xe2\x5d\xfb\xb0\x3a\
+\x0a\xb2\x09\x8a\x27\x52\xf0\xdd\x04\x2a\x5e\x02\x1b\x6f\xfc\x66\
+\x7c\xee\xa8\x93\x50\xab\x25\x90\xcd\xd7\x10\x8f\x4f\x93\x3c\x23\
+\xbb\xb6\x33\xca\x60\x9e\xb7\x7c\x58\xc0\xd0\x81\xe3\x51\xad\xc7\
+\x45\xc4\x8b\x20\x15\x8b\x20\x93\x7f\x15\xed\x1d\xdc\x30\x64\x70\
+\xf3\xcd\xbf\xc2\xdd\x77\xdf\x24\x9e\x21\xbb\x44\x48\xe8\xd2\x27\
+\x33\xd4\xda\xe6\xda\x9c\xad\x0d\x86\x02\x97\xec\x56\x4f\xef\xdd\
+\xa5\xa2\x53\xa9\x49\x29\xd9\x76\x3d\xaa\x3e\x64\xda\xb4\x56\xf2\
+\x61\x60\xd8\x10\x77\xb0\x16\x55\x43\x83\x61\x04\x31\x09\x29\xcb\
+\x96\x42\xe4\xd4\x14\x0c\xe7\xcf\xdf\x02\xdb\x2d\xda\x0d\xed\xa9\
+\x39\xc8\x66\xca\x88\xb0\x55\x97\x5f\x81\x57\xcb\x60\xdb\xed\xb7\
+\xc0\xc9\xa7\x1e\x85\x79\xf3\x02\x14\xa4\x3a\x91\x27\x3b\x38\xb0\
+\xff\xef\x9a\x9e\x02\x06\x06\xf2\x52\x72\xc1\x9a\xce\xc1\x60\x48\
+\xcf\x70\x9e\x44\x22\x4e\x3a\xf1\xb8\xd7\x3d\x18\x36\xaf\xff\xf5\
+\x17\x1c\xfd\x6b\x00\xff\x43\x43\x3d\xaf\xc3\x82\x61\x7b\x7b\xfb\
+\x09\xb9\x5c\xee\x12\x4b\x96\x5b\x4d\xc9\x54\x3d\xf4\xad\x76\x26\
+\x76\x1d\xc3\x25\x64\xc3\x60\xd1\xbc\x63\x09\x87\x4c\xd7\x15\x18\
+\xf2\xfa\xbe\xf4\xa5\x2f\xe1\x9c\x73\xbe\x2c\x1a\x8c\x04\x43\xe6\
+\xae\x3e\xff\xf9\xd3\x71\xf1\xc5\x17\xd7\x2f\x2b\x1c\x73\x0f\x8f\
+\x89\x81\x63\x38\xf7\x68\x09\x6a\x76\xc5\x26\xa0\x12\x0c\x79\x6e\
+\x1b\x0b\x1a\x4a\x86\x49\x4d\x9c\x60\x42\x73\x37\x38\x5d\x57\x37\
+\x5c\xf6\xe7\x62\xd9\x47\x57\x57\x0f\xb2\x39\xaa\x83\x90\x69\x06\
+\x09\xd1\x39\x04\x39\x7a\x6d\xd2\x30\xb5\x8a\xa8\xcb\xeb\xab\x20\
+\x1e\x75\x30\x7b\xce\x34\xcc\x9a\x39\x5d\x42\x92\xea\x85\xd1\x6b\
+\x74\xc5\x33\x5c\xdd\x35\x80\x4c\xb6\x88\x08\x3b\xa0\x53\x63\xd3\
+\x23\x14\x0c\xbf\x21\x63\x3a\xd1\xf2\x1a\x42\xc6\xe0\x05\x04\x1b\
+\x07\x02\x70\xb5\xdc\x8f\x33\xbe\x78\x1a\x6e\xba\xe9\x7a\x61\x87\
+\x32\xe4\xc6\x72\x09\xd6\x13\x4e\xdf\x60\x9a\xcc\xc1\xe1\x87\x1d\
+\x2a\x25\x17\xba\xa1\xd2\x12\x8a\x70\x44\xc2\x36\x5a\x36\x8e\xc6\
+\x28\xe6\xbf\x47\x2e\x4b\x99\xd0\xc8\x6b\xb5\x9c\xdf\x08\x13\x8b\
+\x07\x2c\x8a\x31\xa1\x23\x08\x35\xfc\xe9\x9e\x7b\xf0\xee\xf7\xec\
+\xab\x35\xa7\x42\x35\x25\x98\xd0\x15\x4f\x62\xf3\xad\x76\xc0\xa7\
+\x3e\x75\x1c\xa6\x4d\x9b\x87\x7c\x81\x6e\x95\x36\xd5\x2d\x95\xab\
+\x88\x44\xc9\xe2\xd4\x12\x0a\xc1\xc2\x60\xf3\x41\x30\xe4\x77\x71\
+\xfe\x92\x71\x57\x72\xaf\x89\x24\xc3\x9e\x03\xb8\xf5\xd6\x6b\x70\
+\xc7\x1f\x6e\x02\x37\x1b\x24\x1a\x69\x91\xbb\x5e\xd7\x20\x3e\xb1\
+\xc3\x42\xfc\xc0\xb9\x0b\x16\x8c\x9d\x5f\xef\xa0\x41\x74\x69\x4a\
+\x0b\xeb\xb5\x08\xf0\xdb\xfd\x06\xb9\x48\x29\x7a\x0f\x0f\x80\x82\
+\xb7\xee\x74\x42\xb9\xcb\x00\x1b\x23\x41\x98\x54\x58\xb9\x8e\x4a\
+\xf5\x79\x5e\x14\x0b\x37\xde\x0a\x8b\x16\xed\x0a\xc7\x6f\x47\xa9\
+\x00\xb4\x25\xdb\x85\xa9\x5a\x2e\xf5\x61\xab\xb7\xbc\x01\x27\x9d\
+\x74\x24\xe6\x6f\xd4\x86\x48\xb4\x2a\x8a\x36\x04\x43\xfa\xe6\x02\
+\x86\xbd\x59\xa4\xfb\x0b\x5a\x7f\x18\x61\xce\xba\x2c\xcf\x5b\x24\
+\xea\x20\x3b\x30\x80\x8d\x16\xce\xc7\xcd\x37\xdf\x88\x53\x4e\x3a\
+\x1e\xbd\x6b\x96\x8f\xa8\x4d\x3a\xb1\x15\x32\xf1\x4f\xb7\xb2\xbf\
+\xad\x9c\x85\xf5\x1d\x0c\x43\xf8\x70\x22\xe0\x5d\x3a\x26\x30\x8c\
+\xc5\x62\x3b\x55\x2a\x95\x87\x79\x12\xcd\xd7\xad\x4d\x97\x9f\xf8\
+\x14\x34\xce\x30\x91\xc9\x68\x06\x3b\x0d\x97\xa9\xe1\x1c\x6d\xa8\
+\xb4\xd5\x64\x8f\xe7\xfa\x9a\x73\x86\x67\x9c\x71\x06\xce\x3b\xef\
+\x1c\xb9\x2e\xeb\x60\x4d\x30\xbc\xf0\xc2\x0b\x07\xb5\xcc\xb2\x6b\
+\x09\xdf\x87\x98\x0c\xf6\xac\x0b\xea\xdc\x24\x7f\x14\x84\xf2\x3e\
+\xf5\xa9\x4f\xe1\xb2\xcb\x2e\x5b\x2b\x3f\x38\x28\xcf\x31\xd1\xc9\
+\x6a\x01\x86\x4c\x29\xbf\xba\xb2\x0f\x03\xac\xc7\x72\xe3\x12\x7e\
+\x93\x56\x49\x42\x60\x21\xed\x8f\x0c\x4e\xd6\x61\x51\x0d\xa4\x84\
+\xb8\x5b\xc3\x9c\x0d\x67\x60\xe6\x06\x6d\x75\x60\xd5\x3c\x22\x50\
+\x24\x18\xae\xca\x20\x93\x2d\x08\x10\xea\xce\x7b\x70\x73\xda\x26\
+\x24\x80\x17\x6a\xe3\x20\x1e\x8a\x01\x21\xf3\x7f\xae\x87\xd5\xaf\
+\xfe\x03\x17\x7c\xed\x1c\xfc\xfe\xf7\x4b\x44\x48\xba\x58\x2c\x88\
+\x27\x53\xa9\xa8\x67\x48\xcf\xfa\xb0\x43\x0f\xd3\xdc\x96\x95\x6c\
+\xd4\x7f\x0f\x4c\x76\x53\x73\x5f\x5b\x5b\x53\x09\x84\x0a\x06\x0a\
+\x86\x12\x2e\x0e\x6e\xbc\x5e\x7a\x62\xe1\x7b\xde\x7f\x24\x82\x3b\
+\xef\xb8\x03\x1f\xfb\xf8\xc1\x58\xd3\xd5\x23\x61\xe0\xf6\xce\x0e\
+\xf4\xf7\xa5\xe1\x44\xda\xb1\xe3\x0e\xbb\x62\xe7\x9d\xdf\x89\x8d\
+\x16\xfe\x07\xca\xe5\x28\x8b\x48\x84\x45\xc9\xda\x89\x52\xad\xa0\
+\x64\x17\xe6\xee\x28\x87\x26\xf9\x3c\x6d\x75\x45\xc6\x88\x96\x95\
+\x30\xbe\x9f\x45\x2c\xee\xa1\x54\xe8\xc6\x5f\xfe\x7c\x27\x1e\x7a\
+\xe0\xcf\x28\x97\xf2\x60\x5e\xd5\x8e\x46\xe9\xbb\x81\x5c\xe3\x35\
+\xb9\x5c\xc9\xd7\xa9\x20\x82\x15\xc6\xcb\xe3\x1a\x30\x57\x1b\x27\
+\x0a\x42\x9f\x3e\x3d\x3a\xdd\xb7\xb3\x9c\x82\x39\x60\xdb\x34\xea\
+\x7b\xc3\x21\xd7\xb5\xc1\x90\x00\x1b\x63\x0b\x26\xbf\x56\xf7\x0c\
+\xf5\xfb\x13\x98\x3b\x77\x73\x2c\x5a\xb4\x3b\x3a\xdb\xe6\xa3\x90\
+\xa7\x70\x7b\x2a\x00\xc3\x1e\x2c\xda\x6e\x33\x9c\x76\xfa\x51\x98\
+\x39\x9b\x0c\x67\xaa\xde\x68\xe9\x05\xbf\x8f\x21\xff\xae\x9e\x2c\
+\xd2\xec\xae\x11\x61\x28\x3f\x52\x6f\x86\xdd\x00\xc3\xb9\xb8\xf9\
+\xe6\x9b\x71\x0a\xc3\xa4\x6b\x28\x23\x37\xb5\x2a\x5e\x13\x79\xc4\
+\x5b\xd9\xb7\x56\xe7\x1e\x2a\x92\x15\xfe\x4c\x2b\xfb\xda\xea\xfc\
+\x13\x7d\xbd\x01\x86\xde\x5b\x01\x3c\x32\x26\x30\x0c\xde\x4c\x59\
+\xfc\xd9\x7a\xa2\x75\xcb\x26\xe5\x60\x1a\x30\x9b\xf1\xa1\x31\x32\
+\x0f\xc0\xc0\x21\x7c\x93\x96\xf3\xd1\x87\x68\xe4\xeb\x6f\x35\x59\
+\xe3\xf9\x7c\x18\x0c\x49\xf8\x39\xfa\xe8\xa3\x71\xd4\x51\x47\x61\
+\xce\x9c\x39\xb2\x73\xe7\xf5\x9f\x7f\xfe\xf9\xf8\xce\x77\xbe\x23\
+\xff\x1e\xfc\x80\x07\x32\x60\x41\x48\xd4\x0a\x59\x0d\x0c\x79\x6e\
+\x86\x89\xf9\x77\x12\x68\xae\xb8\xe2\x0a\xe9\xcf\xc7\x73\x44\xa3\
+\x2a\x44\xc0\xb1\xe1\x4e\x75\x52\x42\xa7\x2d\xc0\xb0\x54\x01\x96\
+\xaf\xe8\x12\xd2\x8b\x74\x8c\x90\x02\x68\x02\x11\x1b\xa5\x32\x47\
+\xa8\xf5\x57\x14\xc2\xae\x51\xea\xcc\x29\x63\xf6\x9c\xe9\x22\x11\
+\xc6\x1d\xb7\x10\x56\x82\x7c\x0c\x0b\xe6\x57\xaf\xca\x61\x20\x93\
+\x07\x5c\x16\x78\x47\x85\x40\x12\x2e\x3d\x0c\x4a\x0e\x75\xba\x29\
+\x17\xc6\xd2\x00\x6a\x4c\xda\x3a\x61\x6e\x52\xc6\x4e\xf3\x92\xab\
+\x96\x13\x0c\xcf\xc3\x2d\xb7\xdc\xa8\xe1\xd1\x4a\x59\x7e\x52\xce\
+\x8b\x1e\xfa\x65\x97\x2e\xc6\x27\x3e\x71\x48\x90\xcb\x55\x23\xac\
+\xcc\x5c\xad\x79\x23\xb0\x08\x89\x27\x00\x44\x7b\xb8\x8c\x50\x33\
+\xd1\x87\x75\xa4\xcf\x5b\x98\x94\xa6\xb8\xee\x1b\x33\x22\x49\x3d\
+\x59\x5b\xd7\xc1\x0b\xcf\x3f\xff\x1c\x7e\xf9\xcb\x5f\xa2\x3f\x9d\
+\x16\x0f\x85\x9a\xa0\x64\xd8\x2a\xa8\xc5\x70\xcf\x3d\x0f\x8b\x7c\
+\x5a\x36\x4b\x1f\x89\xb9\xb0\x98\x94\x34\x38\x51\x82\x4c\x19\x70\
+\xe9\xe1\x55\xe1\xd6\xbb\x3b\x68\x88\x92\xb9\x58\xcf\xf1\x65\x13\
+\x13\x8d\xf9\x28\x17\x06\xb0\xfc\x95\x17\xd1\xbd\x3a\xe8\xad\x37\
+\xc8\x6b\x37\x5d\xd3\x20\x4f\xd8\x40\xc9\x3a\x70\xa9\x3a\x28\xff\
+\xd3\xdc\x9e\x27\x22\xd6\xcd\x1b\x6e\x03\x39\xfb\xa9\x39\x43\x96\
+\x55\x0c\x3e\xc2\xef\x33\x30\xb4\xfc\xa2\xc2\x68\x9c\x22\xe0\xb5\
+\xa0\x37\x45\x5d\x59\x28\x81\xf9\x0b\xb6\xc4\x4e\x3b\xee\x05\xc7\
+\xef\x44\x26\x5d\x46\xc4\x61\x48\xbe\x88\x6a\xa5\x0f\xdb\xee\xb0\
+\x19\x4e\xfd\xfc\x67\xb0\x60\xa3\x99\x52\xf8\xaf\x9b\x05\x82\x61\
+\x54\x3c\xc3\xee\x9e\x5c\x1d\x0c\x59\x73\xc8\x0d\xc3\x60\xcf\x70\
+\xae\xd4\x44\x9f\x7c\xe2\x31\xff\xf2\x60\x38\x56\xfb\xd8\xea\xfd\
+\x53\xf9\xbc\x0c\x09\x74\x5a\xbb\xda\x0d\x78\x73\x86\xfb\xee\x11\
+\x11\xc2\x71\x9c\xdf\x44\x22\x91\x0f\x2b\xe0\xac\xfb\x9c\xa1\x01\
+\x5e\x73\x3e\x70\xa4\x5a\x16\xcb\xaf\xb5\xaa\x03\x6c\x35\x79\x13\
+\x05\x43\x7e\xff\x96\x5b\x6e\x29\xf5\x91\xe1\x86\x9d\xd4\xf3\x63\
+\xc1\x6a\xb8\x48\xd5\xc0\x3b\x5c\x54\xcf\x7b\x64\x3f\x33\xfe\xc7\
+\x73\x91\x50\x63\xa5\x15\xec\xb5\x48\xef\x92\x0f\x62\xd8\x1b\x9c\
+\x32\xcf\x30\xd8\xd0\x73\x7f\x64\xe6\x8b\x06\xfb\xe5\xe5\xfd\x18\
+\x48\xb3\x4e\x8f\x35\x6b\x0c\xcf\x92\xea\xa1\x1e\x00\xf3\x80\x51\
+\xd6\xf5\x91\x9f\xef\x95\xa5\x70\x7a\xf6\xcc\x0e\xcc\xd8\x80\xdd\
+\x12\xd8\x35\x41\xab\x00\x48\xb0\x29\x96\x29\x02\x9d\xc5\x40\xb6\
+\x24\x04\x1a\x82\xa1\x7c\x57\x68\xb5\x2a\x18\x36\x3c\x0f\x51\x19\
+\x09\x3a\x07\x48\xdf\xbe\x40\x23\x52\x45\xb9\xcb\x28\xe4\xb3\xb8\
+\xe8\x1b\x5f\xc7\x92\x5b\x6f\x16\xc2\x8c\xf4\xbe\x13\xf5\x99\x92\
+\x84\x97\x09\x86\x14\x21\xe6\x38\xab\x47\x3e\x92\x27\xda\x78\x9c\
+\xb8\x6e\x18\x1e\x5b\xbb\xd3\xc7\x30\x8f\x9c\xd5\x9b\xd8\xcf\x51\
+\x5a\x05\x81\x17\x82\x9f\x08\x0c\x04\x22\x62\x4d\x1b\x14\x32\x61\
+\x63\x6c\xe6\x18\x94\xae\x48\xbd\x69\xd4\x41\x8c\x9e\x8b\xef\xe2\
+\xfe\xfb\x1e\xc2\x41\x07\xfd\x2f\x96\xaf\xe8\x86\x4f\xa3\xee\xb0\
+\xf5\x12\x6b\x29\x29\x99\xc6\x98\x36\x41\x86\x22\xa3\x81\x07\x43\
+\xd1\x6a\xdb\x04\x5b\x81\xa7\x53\x83\x43\xd5\xa7\x2a\x1b\xe4\x92\
+\xac\xa5\xad\xbd\xd8\x70\xb7\x71\x04\x40\x14\x68\xc8\xca\x7a\x5e\
+\x8b\xe4\xa2\x1b\x0e\x03\x43\x9d\xda\x70\x69\x45\x98\x10\xa3\x5a\
+\xa0\x8d\xf0\x67\xe3\x7d\x22\xac\x2d\x64\x1b\x3b\xc2\x9e\xa1\xbe\
+\xaf\xc1\x49\xd5\x33\x44\xe3\x8e\xe4\xa0\x5d\x27\x85\x2d\xb7\x7c\
+\x1b\x76\xdf\x6d\x3f\xcc\x9c\xb1\x09\xb2\x03\x35\x24\xd8\x1f\xca\
+\xa9\xa0\x54\x5a\x83\xcd\x36\xdf\x10\x47\x1c\x79\x30\x3a\x3b\x1d\
+\x29\xeb\x20\xf3\x98\x21\x7f\x96\xed\x54\xaa\x0e\xba\xeb\x9e\xa1\
+\x0a\x07\x58\xbf\xd3\x68\xcc\xad\x87\x49\x6f\xb9\xe5\x26\x09\x93\
+\xf6\xac\x5e\xbf\xe5\xd8\xc6\x63\xdf\xc2\x4b\x77\xfd\xcd\x11\x06\
+\xfb\x65\x01\x43\xef\xb7\x80\xff\x91\x71\x81\x61\x5b\x5b\xdb\x51\
+\xf9\x7c\xfe\x5b\xea\x8d\x34\xbb\x06\xa3\x7c\x8a\xd7\xd1\xdb\xc2\
+\x5e\x19\x2f\x81\x0f\x3d\x81\x84\x6a\x09\x24\x3e\xf0\x3f\x16\x87\
+\xd2\x9b\x62\xfe\xce\xc0\xa8\x15\x68\x8e\xf7\x76\x46\xbb\xd8\x9a\
+\x73\x9f\x16\x2a\xa5\x22\xca\xa7\x3f\xfd\x69\xe9\xaa\xce\x7a\x42\
+\x3e\x78\x2c\x25\xa1\x67\x32\x6f\xde\x3c\x69\xd7\x34\xd9\x47\x78\
+\x83\x20\xd7\x6f\xf9\x1e\x9a\x18\xad\xc1\x56\x86\xa3\x43\xb2\x06\
+\x90\xcb\x7b\xc8\x66\xa9\x42\x42\x43\xc9\x1a\x3d\x65\x65\x0a\xb3\
+\x30\x28\x8f\x10\x71\x64\xb0\x1d\x10\xc4\x2b\x9c\x39\x4b\x09\x14\
+\xd2\xc1\x3d\xd8\x6f\x15\x8a\xdc\x75\x17\x91\xc9\xb2\x45\x0f\x43\
+\x79\x24\x80\x04\x9d\x07\x82\x9b\xd4\xb7\x9a\x62\xa6\x36\x76\x6d\
+\x6f\x4b\xe2\xd7\xbf\xfc\x19\x5e\x79\xe5\x1f\xc2\x68\x95\xd0\x9b\
+\xaf\xdd\xce\xe7\xcc\x9a\x89\x1d\x77\xd8\x4e\x74\x45\x59\xda\xc2\
+\x90\x9f\x79\xdb\xac\xd9\x7b\xff\xfb\xdf\x2f\xe3\x4a\x0f\x5e\xcc\
+\xf2\x18\x15\x78\x5a\x8e\xfd\x58\x1f\x9f\x10\x90\xe8\x9d\xae\xbd\
+\x19\x15\x00\x19\x02\x54\xb5\xc5\x95\x5e\x91\xcd\x21\x37\x22\x4b\
+\x97\x2e\xc3\x3e\x7b\xbf\x47\xfa\x20\x32\xc7\x25\x4a\x4d\xa2\x5c\
+\xc3\xde\x81\x54\x51\x91\x6c\xef\x10\x25\x12\x04\x0e\xed\xe4\x2e\
+\xe7\x14\x64\xd3\x3a\x44\x05\x34\x17\x3e\xfb\x40\x31\xb3\x17\x8b\
+\x23\x91\x8c\x4b\xfd\xa6\x96\x5b\x04\xc6\x28\x0c\x49\x02\x5e\xcd\
+\x03\x32\x5c\x1a\xa6\xf9\xbe\xc7\xf7\x3e\xa9\x97\x74\x1d\xf1\x82\
+\x03\xd9\x1e\xc9\xff\x11\x08\x0f\x3f\xfc\x44\xcc\xde\x60\x33\xe9\
+\xad\x48\xd1\x82\x62\x39\x8d\x72\xb5\x07\x1b\xcc\x8e\x60\x8f\x77\
+\x6c\x8b\x54\xd2\x43\x8c\xc5\x96\xa2\x8a\xc3\xbc\x76\x5c\xc2\xa4\
+\x6b\xba\x99\xd7\x2e\x48\xd7\x0d\x11\x31\x67\x0d\x68\xa9\x24\xf2\
+\x77\xf9\x6c\x16\x9d\xd3\xda\x61\x60\x98\x4d\x77\x49\x6b\xb0\xf0\
+\x9c\xb4\x5c\x33\x63\x78\x83\x6d\x9c\x2d\x72\x61\xe4\x2f\x6b\x26\
+\x20\x73\x13\xa4\x58\x9a\x75\x98\xc7\xf0\x35\xff\xc2\x6f\x95\x75\
+\x73\x34\x80\x6f\x0f\x77\x13\x23\x7a\x86\x9d\x9d\x9d\x5b\x66\x32\
+\x99\xa7\x55\x95\x65\xfd\x1e\x87\x30\xd8\x34\x03\x21\xff\xbd\xe7\
+\x9e\x7b\x8a\xb2\xba\xa9\x23\xd0\x3b\x63\x3f\xc2\x3b\xee\x50\xad\
+\x56\x63\xa3\xae\xaf\x60\xc8\x1a\x42\xf6\x55\x64\x7e\x30\xec\x85\
+\x08\x29\x85\x35\x0a\x53\x70\x34\xc0\x90\x1e\x1e\x01\xaf\x82\x7c\
+\xa1\x24\xc2\x60\xd2\x00\x95\xea\xfd\x1e\x41\x51\xd9\x11\xd2\x95\
+\xbb\x58\x09\x04\x9b\x35\x34\x4d\x0f\x8e\xe9\x66\x27\x4a\x21\x65\
+\x2f\x68\x26\x4b\x63\x5a\xc1\xf4\xce\x14\xa6\x75\xd2\xf3\xd3\x90\
+\x6e\x2c\xce\xb6\x3b\x0e\xf2\xc5\x2a\x06\x32\x25\xc9\xe1\x90\xe4\
+\xe1\xb2\x8b\x40\xb8\xb5\xbb\xf6\x56\x18\x04\x86\x6c\xc6\x9b\x49\
+\xf7\xe2\x8c\x2f\x7e\x01\x77\xdf\xfd\x07\xcd\xf1\x04\x6d\x98\xe8\
+\xf5\x6c\xb2\xc9\x26\xf8\xd9\xcf\x7e\x0a\xb6\xe3\xe2\xc1\x6b\x25\
+\x18\x72\x1d\xf0\xd0\x06\xc6\x26\x46\xbe\x3e\x81\xa1\x06\x47\x47\
+\x22\x0f\x35\x4f\x7d\x03\x08\xf5\x15\x9b\xc7\x27\x9e\x78\x02\xef\
+\xdd\x7f\x7f\xac\x5c\xb9\x3a\xa8\x57\x04\x3a\xda\xa7\xa1\x48\xb2\
+\x8d\x74\x89\xa0\xda\x8c\xea\x78\x9a\x02\x4d\xbd\xdf\x5f\xc0\x19\
+\x20\x1c\xd6\x4b\x5b\xa4\x70\x50\x67\x22\xde\xde\x89\x72\xb1\x08\
+\xd0\x63\xa4\xc2\x02\xc3\xc9\x11\x07\xa9\x44\x0c\xb9\x6c\x36\x88\
+\x10\x34\xae\xb4\x55\x24\x66\x72\x97\xb3\x24\x24\x45\x40\x81\x21\
+\x7a\x59\xbe\x4c\x03\xd6\x5c\xec\xbe\xdb\x7b\x71\xc4\x61\xc7\xa3\
+\xb3\x63\x53\x94\x8a\x6c\xe9\x95\x44\xa1\x98\x46\xd5\xef\xc7\xec\
+\xb9\x71\xec\xf9\xae\xed\x90\x4a\x31\x3c\xac\xe1\x72\x11\x86\x60\
+\xb9\x59\x8d\xd1\x8b\x01\xa9\x33\x64\x39\x46\x51\x0a\xee\x59\x2b\
+\x4b\x66\xb4\x2b\x0a\x34\x1b\x6f\xbc\x11\x6e\xbb\xed\x36\x1c\x7f\
+\xec\x51\xe8\xed\x5a\x31\xa5\x60\x18\x1e\x2f\xdb\x50\x1b\x6f\x22\
+\x1c\xda\x37\xd5\x18\xe3\x1b\x58\xca\x69\xa4\x0e\x3d\x93\x3b\x17\
+\xeb\xea\x6c\x02\x60\x5b\xfd\xb3\x05\xe9\x33\xe3\x02\xc3\xe0\x43\
+\xcb\x00\x6c\x3e\xd5\x61\xd2\x89\x0e\x51\x2b\x30\xa4\x76\xe9\x57\
+\xbe\x72\xae\x24\xb9\x35\xcc\x18\xc7\x17\xbe\xf0\x25\xa9\xf1\x23\
+\xb8\xd0\xcb\xe2\x62\x5f\x5f\xc1\x90\x9e\x21\xa5\xd5\x98\x77\x34\
+\x65\x20\x2b\x2d\xe1\xd8\x4d\x05\x20\x36\x83\x61\x77\x77\x06\xdd\
+\x3d\x3d\xa8\x78\x3e\xa2\xb1\x24\x7c\x61\x5c\x52\xf3\xd3\x47\x2a\
+\xd5\x16\x74\x1b\xd7\x99\xac\x77\x03\xf0\x3c\x54\x74\x3b\x0d\x8f\
+\xb9\xb7\x28\xc3\xa7\x35\x61\x1f\x26\xe3\xdc\x89\x6b\x07\x77\xcf\
+\x63\x2e\xca\xd5\x02\x7b\xcf\x47\xa9\xcc\xd0\x1b\xfd\x87\xb8\xe4\
+\xab\xa8\x57\xa9\xe7\xd5\x43\x59\x87\x0d\xcf\x70\x5a\x47\x1b\xfa\
+\xd3\x3d\x38\xee\xd8\xcf\xe1\xae\x3b\x6f\x93\xbc\x29\x19\x92\x7c\
+\xf8\xe3\xf1\x08\x66\x4c\x9f\x8e\x1b\x6e\xb8\x0e\xdb\x6f\xbf\xbd\
+\x00\x1f\xc1\x97\x62\xdb\x5c\x37\x2c\x41\x60\xd4\x20\x7c\x98\x01\
+\x99\xe8\xba\xac\x7f\x7e\xb4\x9e\x61\x7d\x7b\x3a\x54\xfe\x6c\xf4\
+\x57\x13\xce\x3f\x13\xdc\x18\x5a\x7d\xec\xc9\x67\x70\xf0\x87\x3f\
+\x82\xa5\x4b\x9f\xad\x87\x3f\x59\x23\x47\x9d\xd6\x7a\xd1\x1e\x69\
+\x9e\x41\x98\x35\x80\x52\xf9\x11\x8b\xa8\x98\xb6\x96\x4d\xb8\xd2\
+\xb9\xc1\x66\xba\x2e\x0c\x2b\x53\xe2\x01\x31\x57\x6b\x0f\xe0\xa1\
+\x8d\x2d\xaf\x0a\xd4\xf5\x1c\x3c\x00\xeb\x02\x0c\xc9\x54\x66\x6b\
+\x2e\x2b\xd6\x27\x18\xee\xb2\xeb\xfe\x38\xe2\xf0\xe3\xb1\x41\xe7\
+\x9b\x90\xcf\xf9\x88\x44\x13\xa2\xb2\x53\xf3\xd3\xd8\x70\x7e\x12\
+\x7b\xed\xb3\x1d\xda\xc8\x31\x0a\x42\xbd\x92\xd7\x96\x46\xc0\xc0\
+\xaa\xd5\x59\xf4\xf6\x67\x45\x28\x42\x02\xb2\xb4\x2b\x71\x7a\x8d\
+\x15\x14\xf3\x03\x78\xe3\x26\x1b\x4b\xce\xf0\xb8\x63\x8f\xc2\x40\
+\x3f\x3d\xc3\xc0\xb3\x6e\x21\xf0\x31\xfa\x59\x6e\xbc\xd3\xbc\x3e\
+\x93\x93\x34\xd6\x39\xd7\xb7\x79\x82\xd6\xd6\x4e\x9e\x23\x6e\x0c\
+\x06\x6d\x30\xc7\xf3\xad\xff\x4a\x9f\xf1\x9e\x03\xb0\xc5\x48\x57\
+\xdc\x92\x15\x93\x48\x24\xbe\x5d\x2a\x95\x3e\xb7\xbe\x83\x61\xf3\
+\x4d\x36\x7b\x87\x5a\xd6\x70\xb6\x1a\xd2\xe0\xae\x4f\x39\xe5\xf3\
+\x02\x86\x3c\xd6\x77\xcf\x90\x00\xf2\xbd\xef\x7d\x4f\x3c\x43\x1e\
+\x04\x6f\x0b\xe9\x4d\xd5\x92\x0c\x83\x0a\x32\x2a\x42\x00\x00\x20\
+\x00\x49\x44\x41\x54\x21\x8d\xc0\xaa\xd5\x69\xac\xe9\xe9\x16\xb9\
+\xb3\x58\x3c\x55\xaf\xff\xe3\xb3\xcd\x50\xa6\xe4\x08\x03\x26\xaf\
+\x81\xa1\x4f\x92\x93\x48\xa9\xa9\x11\x51\xa3\x5a\x43\xb9\xc4\x10\
+\x6f\x44\xc2\x4f\x95\xb2\x16\x6c\xb3\xd3\x39\x41\x93\x79\x20\x6a\
+\x3f\x8a\x42\x89\x50\xe2\xb5\x86\x30\x7c\x88\x6d\x15\x4f\x86\xc6\
+\xdb\x93\x7a\x41\x86\xfb\x4e\x3a\xf1\x58\xdc\x7b\xcf\x9d\x22\x40\
+\x40\xe9\xae\x52\x91\xaa\x44\x9e\x88\x95\x5f\x77\xdd\x75\xd2\x14\
+\xda\xe4\xec\xc4\x76\x4b\xe8\x4b\x05\xb8\xed\xdf\x46\xc2\x69\x15\
+\xda\x1e\xd3\xb8\x4f\x18\x0c\xf9\x6d\x46\xa1\x69\xfd\x53\x6b\x36\
+\xb5\xa9\x32\x15\x65\xb8\x6d\xa0\xe1\xbe\xe4\xa2\x4b\xd1\xdd\xdb\
+\x23\x79\x44\xd9\xc4\x24\x52\x52\xb6\xc2\x98\xb7\x16\xbb\xdb\x4f\
+\xce\x97\x71\x38\x11\xf4\x81\x54\x10\x10\x50\x14\x40\x14\xb3\x2a\
+\x40\x67\x2a\x50\x71\x09\x3f\x97\x71\xff\xbd\x7f\xc2\xa3\x8f\x3e\
+\x54\x17\xbd\x96\xb7\x86\x42\xbf\xeb\x02\x0c\x19\x75\xf0\x7d\xe6\
+\x44\x83\x8a\x13\x2f\x8a\xb7\xbd\x6d\x5f\x1c\x71\xf8\x89\x98\x39\
+\x7d\x13\x64\x33\xdc\x54\xb2\xc3\x49\x11\x9e\x33\x80\x59\x73\xe2\
+\x78\xe7\xde\x8b\xd0\xde\xa1\x62\xe5\x92\x29\x08\xfa\x54\x0b\x81\
+\xa6\x2b\x8f\xbe\x81\x8c\x80\xe1\x86\xf3\x36\xc0\x3f\xfe\xb1\x12\
+\xf3\xe7\xce\x43\x47\x9b\x83\x5c\xbe\x88\x54\x22\x81\xeb\xae\xbf\
+\x06\xe7\x9d\xfd\x65\xbc\xf8\xc2\xb2\xa0\x1d\x56\x6b\xb5\xab\x31\
+\xad\xab\xe0\xcd\x26\x90\x3d\x5c\x33\x5d\x03\x4b\x46\x42\xb8\x19\
+\x34\x75\x31\xb5\x87\x1a\xd5\x79\x7d\x1f\xde\x77\x00\x1c\x35\x21\
+\x30\xec\xec\xec\xfc\x60\x36\x9b\xbd\x66\xaa\xd9\xa4\x93\x3d\x11\
+\xcd\x60\x78\xea\xa9\xa7\xe2\xbc\xf3\xce\x93\x49\xe7\x83\xc8\x45\
+\x43\x6f\x71\xf1\xe2\xc5\x83\x7a\x19\xfe\xab\x78\x86\x66\xb0\xed\
+\xe7\x64\x8f\x9f\x01\x83\x9e\x57\xe5\xd5\xba\xba\x72\xe8\xee\xed\
+\x95\xbe\x71\xa2\x5a\x42\xa6\x25\xc1\xcf\x21\xc1\x45\xbb\xd1\x6b\
+\x69\x5b\x43\x68\xdb\xf1\x44\x26\x1b\xd1\x38\x85\x8d\x3d\x44\xa5\
+\xc6\xcf\xab\x83\x21\x8d\xa7\x89\x62\xcb\x3b\x29\xb6\x2c\x9d\xe9\
+\xc9\x34\x8c\xaa\xf1\xf5\xb4\x54\x26\xbc\x73\x53\x47\x43\x81\x90\
+\x3f\xe3\xd1\x08\x8a\xc5\x3c\x8e\x3f\xee\x28\xdc\x71\xfb\x12\xc4\
+\xd9\xc8\x97\x0c\x54\x7a\x3d\x8e\x8f\x99\x1b\x4c\x97\x46\xc7\x3b\
+\xee\xb8\xe3\xa0\xb2\x1b\xd3\x1a\x0d\x47\x05\x8c\x74\x35\xa9\x63\
+\xda\x0a\x0c\x87\xd9\x96\xda\xc7\x1a\xb9\x3c\x2b\x47\x18\xfd\x4f\
+\x02\x57\xa9\xc6\xe6\xbf\xc0\x13\x8f\x2d\x83\x1b\x8b\xa3\xb3\xad\
+\x03\x65\x86\x3e\x6b\x40\xa9\x5a\x41\x3c\x12\x1d\x24\x77\x27\x25\
+\x75\x2c\xb1\x08\x2e\x20\x1a\x4d\xca\x6e\x46\x0a\xff\x83\xc3\x72\
+\x87\x64\x03\x57\x03\x19\xbb\x44\x2c\x82\x7c\x3e\x8b\xef\x7d\xeb\
+\x0a\x7c\xef\xfb\xdf\x95\xba\x4d\xb2\x3f\x25\xdc\xba\xce\xc0\x50\
+\x41\x5b\xb8\x5c\x52\xa2\x12\xb8\x79\xb5\x28\x76\xde\xf9\xdd\x38\
+\xfc\xb0\x13\x30\xbd\x73\x63\x64\xd2\x55\xc4\xa2\x6d\xa8\x78\x65\
+\xd4\xfc\x01\xcc\x98\x19\xc7\x1e\xef\xd8\x0e\xed\x29\xae\x6d\xed\
+\x72\xc2\x7d\x83\x74\xd5\xf0\x1c\xa4\xb3\x39\x14\xf2\x2a\xc9\x47\
+\x91\xfc\x6f\x7c\xe3\x1b\xe8\xeb\x59\x2d\xf7\x59\x2a\x14\x30\x77\
+\xce\x06\xe8\xee\x59\x83\x27\x1f\x7f\x5c\xb4\x64\x45\xc8\x3c\x14\
+\xb6\x9e\xd4\xf5\x15\x9c\xac\x19\x0c\x17\x2e\x5c\x28\x9b\x3d\x13\
+\xef\x67\x5e\xfc\xc5\x17\x5f\x9c\x8a\xaf\x5e\xaf\xcf\x19\x89\x38\
+\x07\xd6\x6a\xb5\x6b\x27\x04\x86\x00\x18\x3f\xca\xad\xef\x9e\x61\
+\xab\x30\x29\xc1\xf0\x6b\x5f\xfb\x8a\x8c\x85\xd5\xf8\x99\x67\xc8\
+\x10\x99\x95\x36\xac\xaf\x60\x48\x31\x64\x86\x49\x3f\xfb\xd9\xcf\
+\x0e\xca\x19\x4e\x7a\x38\x2f\xb4\x5a\xea\xbb\x77\x4d\x22\xa1\x6b\
+\x4d\x01\xbd\xe9\x7e\x61\xe2\x39\x4e\x4c\x94\x4b\x68\x68\x63\x31\
+\x32\x42\x03\xf6\x1f\xd9\x1b\x16\x52\x92\x52\x69\x47\x8c\x2c\xf5\
+\x20\x49\xe6\x57\xe1\xeb\x2a\x2a\x25\x96\x36\xb8\x48\x44\x59\x9f\
+\x55\x16\xcf\x4c\xbc\xb4\x7a\x2f\x3a\x2b\xde\xd6\x5c\x8d\x58\xa1\
+\xd0\xd1\xc0\x0e\x2d\xb0\x26\x21\x87\x4d\x7a\x4f\x3e\xe9\x78\xdc\
+\x73\x17\xf3\xc0\xdc\xca\xd3\x72\xd5\x90\x4c\xa5\x30\x6f\xee\x1c\
+\xa9\xf9\x62\x77\x0f\x6b\xf1\x35\x9a\xfa\x40\x5b\x0f\xad\x84\x8a\
+\x5b\x5a\x82\x09\x83\x61\x98\x69\xd9\xf2\xdb\x06\xbd\x81\xde\x75\
+\x25\x08\xef\xad\x5c\x99\x46\xbe\x50\x94\x12\x02\x16\xdb\x4b\xe4\
+\xce\x75\xd5\x63\x17\xcf\x30\x68\x2e\xdf\xf4\xb3\x52\x6e\x74\x76\
+\x97\xf9\xe5\x86\x87\x4c\x4d\x11\x28\x60\x89\x87\x2f\x1e\x61\x32\
+\x1e\x45\x3c\x16\xc1\xe5\x97\x5e\x82\xc5\x97\x5d\x22\xd7\xe1\x4a\
+\xab\x25\xad\x5f\xac\x03\xe9\x14\x84\x0a\x47\x1e\x95\x21\xc0\xb0\
+\x1a\xc3\x5b\xdf\xb6\x37\x3e\x79\xe8\x09\xe8\x6c\x5f\x80\x81\xfe\
+\x32\x22\xb1\x76\x59\x9f\x55\x2f\x83\x8e\x69\x0e\x76\xd9\x6d\x5b\
+\x24\x53\x0e\xca\x45\x86\x43\x95\x85\xca\xcd\x1a\xe5\x01\xcb\x25\
+\xed\xca\xc0\x5c\xf3\xa3\x8f\x3e\x8a\x43\x3f\x71\x08\x8a\xb9\x7e\
+\x24\xd8\x05\xbe\x9c\x97\x71\x28\x14\xf3\xb2\x59\x6b\xd6\xee\x1c\
+\xdb\x0c\x8e\xfd\xdd\x7c\x9e\x28\xd2\x7f\xe2\x89\x27\x0a\x58\x13\
+\x24\x39\x57\xf4\x0a\x19\x61\x62\xfe\x98\xd1\x25\x6b\x47\xf7\xfa\
+\x0f\x99\x7a\x24\x07\x70\x32\x86\x3d\x5a\x86\x49\x83\x4f\x2e\x01\
+\xdc\xfd\xc6\x3e\x25\xaf\xdd\x27\x5a\x81\xe1\xc9\x27\x9f\x2c\xda\
+\xa0\xd6\x8a\x89\x8b\x85\xa1\xd3\xcb\x2f\xbf\x5c\xbb\x13\x88\x1c\
+\xd8\xfa\x9b\x33\x64\x1d\x1e\x55\x66\x18\x26\x35\x89\x3c\xbb\xe6\
+\xd1\x18\xf5\xf1\xcc\x44\x33\x18\xb2\xf6\xaf\xa7\x9f\x3b\x5c\x32\
+\x40\xa3\x02\x86\x0c\x67\xb2\x97\x9e\x65\x55\xe8\xbf\x89\xb7\x1a\
+\x18\x7f\x35\x96\xac\xe7\xd3\xf0\x10\x1b\x2f\x30\x3f\xc8\x32\x00\
+\xce\x01\xeb\xf7\x98\xc7\x15\x30\x0c\xde\xa3\xea\x91\x04\x50\x36\
+\x7a\xa5\xf1\xf1\x03\x85\x93\x06\x75\x52\x3c\x96\x7a\x1e\xca\x93\
+\x52\x8a\xbe\xbe\x9e\x80\x40\x73\x87\x78\x85\x04\x44\x65\x40\xd6\
+\xb0\xc1\x8c\x0d\x84\x2c\xc5\xb6\x56\x3c\x2c\xa7\x36\x12\xc8\x99\
+\xc2\xcc\xa4\x8c\xef\x70\x60\x58\x07\x88\xc1\xac\xc9\xe6\xb7\x8f\
+\xf6\x41\x1d\x6a\x9e\x79\x2e\xab\xe2\x5b\xb5\x2a\x87\xae\xee\x5e\
+\x06\x9e\xa5\xc3\x08\xc3\xa5\xb1\x44\x12\x95\x12\x3d\xb8\x46\x19\
+\xbc\xf8\x9d\x41\x11\xbc\x6c\x74\x48\xcf\x35\xb4\x0c\xc0\x50\xda\
+\xe2\xd2\x89\x97\x89\xab\x89\xa4\x1a\x3d\xc3\x44\x3c\x8a\xc5\x17\
+\x5f\x84\x4b\x2e\xbd\x48\x04\xb6\x39\x17\xeb\x1e\x0c\x03\x11\x1b\
+\x11\xcf\x0d\x58\x40\xb5\x18\x76\xfa\xcf\x77\xe1\x93\x87\x1d\x87\
+\xce\xce\x85\xe8\xef\x2d\x21\xe2\xb2\x46\xb6\x8a\x8a\x97\x41\x5b\
+\x87\x83\x5d\x76\xdd\x01\xe4\x55\x95\x0a\x59\x61\x20\x6b\x24\x26\
+\x82\x48\x40\x96\xb1\x32\xa7\x15\xaf\xfc\x03\xfb\xed\xb7\x2f\x8a\
+\x39\xd5\xba\xad\x54\xf2\x88\x70\xdd\xfa\xf4\x36\x59\xcb\xc9\xb5\
+\xa8\xb3\x3a\x15\x21\x62\x63\x93\x5a\xd9\x19\x01\xf0\xed\x6f\x7f\
+\xbb\x44\x43\xc2\xa2\xf3\xd9\x6c\x5e\x1a\xf1\xb2\x39\x00\x81\xf1\
+\xff\xc6\xe1\xdf\x0a\xf8\xfb\xb7\xba\xd7\x51\x3d\x63\x89\x44\xe2\
+\xb8\x52\xa9\xb2\xb8\xd5\xc9\xd6\xa7\xd7\x9b\xc3\xa4\x1b\x6f\xbc\
+\x31\xb6\xdb\x6e\x3b\xf4\xf4\xf4\x08\x83\x90\x8b\xe5\x91\x47\x1e\
+\x91\x16\x4a\x4c\x78\xaf\xef\x60\x48\x02\x0d\xfb\xe6\xb1\x68\xdf\
+\x1e\x28\xbb\xc7\xa9\xf2\x0e\x9b\xc1\x70\xc5\xca\x0c\x7a\xba\xd3\
+\x92\xd7\x8b\xc6\x13\x0a\x70\x20\xa0\x25\xb4\x11\x2b\x3b\x45\xd0\
+\xc8\x8a\xd7\xa0\x87\xfd\x5e\xef\xfa\x10\x34\x93\xad\x94\x55\x8f\
+\x94\xa9\x3a\xca\xaf\x59\x4a\x50\xbb\x4e\x10\x5b\x69\x68\xb5\x6d\
+\x4e\x24\xa2\x9d\xcd\x65\x87\xdd\x24\x50\x6d\x75\x64\xac\xb1\x5c\
+\xbd\x7a\x15\xce\x3a\xe3\x8b\xf8\xf3\x9f\xff\x84\x6a\x8d\x0d\x9e\
+\x63\xe2\x7d\xf2\xa1\xdf\xea\xcd\x5b\x8a\xb8\xc1\xe6\x9b\x6f\x2e\
+\x3b\x79\x1b\x3b\xdb\x00\xd9\xfc\xdb\x35\x5b\x2e\xd1\x8c\xcc\x84\
+\xd7\xf6\x04\xc1\xd0\xbe\x7f\x38\xcf\x6d\xa4\xbf\xd7\xd8\x7a\xc9\
+\x03\x28\x66\x90\xcd\x54\xd1\xd7\x97\x46\x4c\xea\x03\x5d\xd0\xe3\
+\x0b\xd1\x92\x9a\x6e\x53\x2f\x9a\x9e\xbd\x74\xb9\x0f\x92\xed\x8c\
+\x88\x6b\x57\x0b\xf5\xc8\xd9\x5f\x30\x2a\xde\xa5\x2f\x40\x48\xfd\
+\x84\x0b\xbe\xf6\x55\x5c\x7c\xe9\x37\x91\x88\xc7\xb4\x74\x43\x12\
+\x75\xeb\xd2\x33\x0c\x81\xa1\xec\x3b\x58\xd8\x1a\x11\x30\x3c\xfc\
+\xd0\x63\xd0\x39\x6d\x3e\x7a\xbb\xa9\x85\x1b\x17\x21\x86\x4a\x8d\
+\xad\xad\x48\xb0\xd9\x01\x6d\x29\xea\xb3\x56\x10\x93\x3a\x5e\xbd\
+\x07\x97\x20\x1f\xf4\xeb\x8b\x27\xa2\x78\xf5\x95\x97\xb1\xef\x7b\
+\xf6\x46\xa5\x90\x17\x85\x1c\x46\x32\x84\x54\x5b\xab\x22\x1a\x8f\
+\xa2\x5a\x61\xc1\xbf\x3e\x15\x53\x01\x86\x3c\xaf\xb6\xf2\xa2\x24\
+\x9c\xfe\x64\x03\xf4\x07\x1e\xb8\x4f\x44\x17\x68\xe3\x28\xd6\xcf\
+\xa8\xd8\x87\x3f\xfc\x61\x69\x48\xcd\x83\xbc\x03\x6b\x82\x3e\xe1\
+\x35\xbe\xfe\x9e\xe0\x78\xc0\xbb\xac\xd5\xe5\x8d\x0a\x0c\xc9\x26\
+\x75\xdd\xe8\xb2\xa9\xdc\xd9\xb4\xbc\xd0\x75\xa0\x20\x13\xbe\xa6\
+\x30\x5b\xcb\xd8\x59\x56\xa0\xad\x1e\x4e\x4c\x58\x89\xfc\x9d\x06\
+\x94\x8b\xb1\x59\x50\xbb\xd5\x3d\x0e\xf5\x7a\xe3\x1c\x15\xf1\x0c\
+\x8f\x3b\xee\xb8\x3a\xc8\x18\x4d\x7a\x3c\xe7\x1d\xd3\x67\x18\xa5\
+\xf4\xa9\x17\x9a\x47\x5f\x6f\x46\xf3\x83\x2e\x73\x72\xdc\xf9\xb2\
+\x4b\x79\x5c\x8c\x48\x4f\x4f\x1f\x92\x89\x94\x3c\x60\x79\xd6\x5f\
+\xc5\x62\x48\x26\x62\xc8\x0c\x14\x50\xad\x68\x2e\xd0\x75\xe9\xf5\
+\x55\xc5\xeb\x50\xe0\x09\x94\x48\x08\xa4\xec\x9e\x2d\xaa\x42\x65\
+\x4c\x9f\x96\x42\x26\xdb\x8b\x17\x5f\x5a\x8a\x64\x9b\x23\x5d\x04\
+\xca\x95\x02\xaa\xb4\xe8\x21\x2d\x50\x3e\xe4\xd5\x32\x0b\xe7\x93\
+\x78\xf2\xc9\xc7\xb1\xe3\x8e\xdb\x63\xf3\x2d\x36\x43\x77\x77\x97\
+\x88\x10\xb4\xa5\x12\x02\xba\xb3\x67\xcf\xc6\xcc\x99\x33\xa5\x96\
+\xd0\x0c\x52\x98\x72\x3e\xa6\xf1\x18\xcf\x9b\x87\x74\xf5\x06\x83\
+\x83\x79\xd0\xd6\x2a\x88\x5a\x17\xec\xa4\xc0\xbf\x53\xc8\x40\x6a\
+\x3a\xad\xb6\x93\x51\x0c\xf9\xb7\xfe\x8c\x50\x9a\x2f\xa4\xcc\x29\
+\x25\x96\xcc\xe7\xd2\x2f\x76\x80\x62\x85\x60\x58\x13\xc3\x57\x2e\
+\x55\xe0\x79\x9a\xe3\x55\x02\x8c\x0a\xbf\x37\xda\x62\x05\x37\x18\
+\xcc\x91\x04\xa2\xa3\xd4\x25\x2d\xa0\xad\x2d\x85\x52\x81\xe5\x04\
+\x9c\xf7\x08\xee\xff\xf3\xbd\x78\xc3\xc6\x0b\x50\x2a\xe6\xc5\x7b\
+\x9a\x35\x73\x06\x06\xfa\x7a\xf1\xf3\x9f\xfd\x14\xd7\x5d\x77\x2d\
+\x0a\xc5\x5c\xdd\x38\x8f\x34\x6c\x93\x4a\x56\x1a\x0a\xd2\xb9\xc3\
+\x62\xff\x30\x69\xaa\x19\x28\x38\xd4\x22\xf8\xcf\x5d\xde\x85\xc3\
+\x0e\xfd\x9c\x74\xad\x28\xe6\x7d\x29\x99\xa8\x54\xcb\x70\xdc\x0a\
+\xe6\x2f\x98\x8d\x2d\xfe\x63\x13\xcc\xd9\x70\x3a\xdb\x82\xc0\xa7\
+\x3e\x2e\x99\xb9\xd2\x02\x4a\xa3\x0e\x91\x78\x4c\x98\xe9\x4f\x3e\
+\xfe\x37\xbc\xf7\xbd\xfb\xa1\x98\x1d\x50\x6f\xd9\x63\xd4\xa4\xaa\
+\xec\xe7\xa0\x4b\xcd\x58\xca\x63\xc6\xb3\xc4\x2c\x62\x64\x3f\x77\
+\xd9\x65\x17\xdc\x77\xdf\x9f\x05\x0c\x09\xdc\x6c\x86\xce\x61\x38\
+\xe0\x80\xff\x96\x94\x81\xd9\x96\x30\xf3\x78\x2c\xdf\x3b\x55\xa0\
+\x3e\x96\x6b\xb0\xf7\x8e\xb4\x7e\x7c\xbf\x46\x16\x29\xd9\xa4\x23\
+\x1e\xa3\x05\x43\x86\xc5\x1e\xf1\x7d\x7f\x47\x33\x24\xad\x4e\x3c\
+\xd9\xaf\xb7\x7a\x58\x5a\x4d\xcc\x44\x3f\x6f\x94\xe5\xb0\x0e\xaa\
+\xe5\xb9\xc2\xe1\x55\x95\x05\x53\xa1\x68\x82\x02\x7f\x9f\x48\x38\
+\x62\x7d\x00\x43\xda\x71\x46\x97\x08\x86\xec\x9e\xee\x81\x80\x4f\
+\x30\xa4\xac\x73\x44\xd8\x74\xdd\xdd\xfd\x58\xb1\xfc\x55\xa9\x3b\
+\x4c\x24\x68\x30\x35\x0c\x1a\x71\x5c\x74\xad\xe9\xc7\xf3\xcf\x2d\
+\x57\xf9\x2d\x2a\xff\xb3\x53\xb9\x81\x21\x08\x90\x31\xa4\x92\x04\
+\x29\x8a\x79\x97\x85\x70\x91\x4a\x3a\x78\xee\x85\xc7\xf1\xc7\xbb\
+\x6e\x93\xf6\x4b\xd5\xea\x80\x68\x9a\x9a\x3c\x1a\x21\xd4\x1e\x62\
+\xd3\x6c\xa5\x97\x78\xee\x79\x67\xe3\xa8\xa3\x3e\x87\x54\x4a\x5d\
+\x50\x2e\x70\xce\x85\xb1\x6f\x9b\x4b\x50\x46\x13\x2e\x9d\x94\xb5\
+\xdc\x02\x0c\xf5\x3b\xa8\xdf\xda\x60\x3b\x67\x06\xca\xe8\xef\x1f\
+\x90\x3a\x4d\xd6\x5c\x5a\x6b\x23\x7a\xcd\xd2\xe2\x48\xc2\x98\x43\
+\xff\xa4\x87\xde\x78\x1d\x88\xa5\x92\xe2\xdd\x99\xc4\x1c\x3b\x41\
+\x08\x51\xc9\x7c\xf8\xba\xc7\x6d\x0a\x2e\x8d\xbb\x26\x91\xc6\x8b\
+\xb0\x60\xbd\x8a\x8e\xf6\x14\x8a\xb9\xac\x14\xd5\x3f\xfe\xf7\x47\
+\xf1\x8d\x0b\xce\x97\x9a\xce\x72\xb1\x80\x62\x21\x83\x99\x33\xa6\
+\x09\x79\xe9\x1f\x2f\xbd\x80\x4c\x26\xad\x77\x35\x81\x3a\xe5\x56\
+\xcf\xed\xa8\xe7\x26\x90\x25\x12\xe5\x1c\xb9\x28\xae\xe1\x38\xb6\
+\xdb\x76\x67\x1c\x70\xc0\x47\x30\x7d\xda\x3c\x89\x50\x50\xd4\xbc\
+\x26\x6a\x3c\x35\xcc\x9e\x3d\x03\x0b\x37\x9e\x8b\x0d\xa6\xb7\x8b\
+\x80\xb9\x36\x31\x26\xb7\x8b\x60\xa8\xd2\x7f\x8c\x3c\xc4\x92\x71\
+\x3c\x74\xff\x7d\xf8\xc2\x17\x4f\xc3\x40\x6f\x77\x5d\xb4\xdc\x94\
+\x6f\x1c\xe6\x1a\x6b\xca\xc0\x9d\xaa\x23\x2c\x51\xc9\xef\x60\x8e\
+\x90\xb5\xd5\x4b\x96\x2c\x59\x2b\x4c\x7a\xf8\xe1\x87\x4b\x2b\xb3\
+\xb0\x5d\x6a\x35\xce\xad\xec\xeb\x54\xdd\xd7\x68\xcf\x3b\xfc\xf5\
+\xfb\x8f\xfa\xbe\x37\x2a\x45\x92\xb1\x80\xe1\xd9\xbe\xef\x7f\xf9\
+\xff\x2a\x18\xda\x43\xcd\x45\x67\x05\xaa\x24\xde\xd0\x1b\xe4\x61\
+\xa1\x37\x1a\x1b\xa3\x29\x5b\x8d\xcf\x44\x68\xcb\xeb\x25\x18\xb2\
+\x5d\x92\x9b\x94\x52\x32\x82\x21\xc5\x9e\x57\xad\xe9\xc1\xb3\x4b\
+\x5f\x40\x3e\x93\x97\x0e\xea\x35\xd1\x69\x4c\xca\x58\xad\x78\x79\
+\x35\x9e\x7a\xe2\x45\x44\x9d\x38\x7c\xb7\x02\x87\xde\xa1\x81\x21\
+\x45\xb8\x11\x85\x57\x53\x8f\x9a\xfe\x0d\xb5\x2f\xdb\xdb\x7d\xbc\
+\xf0\xd2\x93\xb8\xe7\xee\x25\x80\x9f\xd1\xdc\xb7\xa3\xfd\x19\x65\
+\x0d\x06\x7c\x1a\x0b\x63\xf2\x67\xa5\x52\x12\x92\xd1\x71\xc7\x7d\
+\x4e\x40\xc5\x88\x0b\xfc\x3b\x43\xb9\x76\x34\x87\x95\x5f\x13\x0f\
+\xbb\x41\x0b\x0d\x3d\xdf\x0d\x52\x0c\x43\x68\x2a\x5d\xa7\x07\x59\
+\xb4\xbd\xbd\x79\x74\x77\xf5\xa2\x52\x61\x88\x32\x01\xdf\x8d\x48\
+\x98\xd8\x67\x08\xb9\xe9\x27\x85\xbb\x95\xfd\xd9\x78\xdd\xfe\xcd\
+\x9f\x54\x5e\x91\x9c\xa0\x78\xe7\xf4\xc2\x15\x0c\x55\x65\x8d\x85\
+\x17\x4d\x5d\x30\xc4\xea\xab\xe7\xca\xff\xaf\x78\x25\xf9\x5e\x12\
+\x64\xf8\x97\xd8\x3f\x85\x2c\xee\xbc\xe3\xf7\x38\xe6\xa8\xcf\xc1\
+\x2b\x17\x74\x4e\xa9\xb9\x17\x92\x54\x63\x9a\x31\x95\x4a\x22\x9b\
+\xb1\xdc\xd4\xd8\xc1\xa0\x95\x91\x1e\xad\xb1\xe4\x3d\xb2\x58\x9e\
+\xdd\x4a\x78\xc4\xe3\x29\xf1\x94\xa7\x75\x6e\x88\xad\xb6\xdc\x16\
+\x3d\xdd\x03\x02\x86\x5a\xd3\xca\x0d\x54\x09\xc9\x54\x14\xd3\xa6\
+\xb7\x0b\x98\x50\xa1\x55\xf3\x85\xbe\x28\xef\xc8\x06\x58\x88\x31\
+\x5a\xe3\x4b\x1d\xd8\x7b\xef\xbd\x87\x1f\xd4\xee\x1d\x5e\x55\x1c\
+\x50\x96\x5c\x96\x83\xb5\x3a\x95\x60\xd8\x3c\x0e\xdc\x94\x93\x40\
+\x73\xfc\xf1\xc7\xcb\xf5\x59\xf4\x8a\x6a\x5b\x57\x5f\x7d\x35\x9e\
+\x7a\xea\x29\x11\x20\xb1\x30\x69\xab\x71\xfc\x57\x05\x43\xc7\x71\
+\xce\xf9\xe7\x26\x46\x6b\xea\x5a\x1c\xa3\x06\x43\x20\xb6\x93\xe3\
+\x78\x0f\xff\x1b\x0c\x1b\x60\xc8\x85\x44\x8f\x83\xc5\xdb\x94\x79\
+\x0b\x1f\xfc\x5b\x26\x93\x91\x45\x38\x91\x3a\x9e\xf5\x05\x0c\x69\
+\x9c\xd7\x74\xe5\xd0\xd7\xd7\x1f\x78\x86\x6c\x08\xab\xdd\xc2\x63\
+\xb1\x14\xb2\xb9\x0a\x9e\x7a\xea\x59\x0c\x48\x3e\x2a\x25\x1e\x0b\
+\x77\xa7\x95\x4a\x15\xaf\xbc\xb4\x0a\x4f\xfe\xed\x39\x69\x9b\x83\
+\x48\x4d\xbc\x43\x9f\x5d\xee\x45\x45\x9b\x86\x39\x0e\x07\x71\x09\
+\xab\xb2\x2f\x5e\xcd\xcb\x21\x12\x2d\x62\xd9\xf3\x8f\xe2\xd1\x47\
+\xee\x05\x90\x45\xa9\xd8\x8b\x48\x24\x00\x43\x11\x01\xa7\x61\xd2\
+\xf0\x1e\xc7\x88\xdf\x35\x30\x90\xd6\x50\xf2\xf1\x47\x09\x63\x94\
+\x5e\x26\xf3\xc3\x9a\x47\x51\x75\x99\xa1\x84\xdd\xf5\x5c\x63\x78\
+\x14\x5a\x3d\x55\x43\xbd\xde\x02\x0c\x39\xbe\x04\xa8\x3a\x60\x03\
+\xe8\xeb\x2d\xa3\xbb\xbb\x07\xe5\x0a\xbb\xc4\xb7\x49\x78\x5a\x38\
+\x43\x6e\x50\xba\x12\xfc\x1c\x8e\x05\x6a\xef\xe3\xc6\x43\x64\xc8\
+\xea\x60\xc8\x4d\x87\x35\x30\x56\xd2\x18\xa5\xf3\xea\x47\x3d\xb7\
+\xd7\xc8\x19\x4a\x69\x8c\x57\xd2\x8d\x9e\x5f\xc5\xcc\xce\x4e\xdc\
+\xf6\xfb\x9b\xf1\xd9\x23\x3f\x2d\xc2\x09\x5e\xb5\x04\xdf\xd3\xd4\
+\x00\x37\x1f\x35\x96\xdf\x44\x08\x14\x11\x94\x4a\x64\xf5\xf2\xec\
+\xeb\x16\x0c\xb5\x50\x90\xf5\xac\xac\x77\x65\x5e\x8d\xc0\x15\x81\
+\x13\x49\x22\xe6\x26\x51\x66\x33\x6c\x22\x38\xe1\x4c\x08\x58\x35\
+\xd0\xab\xf3\xa5\x3d\x55\x78\x66\x6c\xad\xd8\x8e\x2c\x98\x5c\xe9\
+\x4b\x45\xba\x29\xfb\x75\x6a\x51\x3b\xc3\xc9\xcc\xd3\xe9\x3b\xc6\
+\x7e\xff\x63\x5d\x6a\x7c\x0e\xac\x7c\x8c\x9f\x5d\xb0\x60\x81\xfc\
+\x9b\x5e\x20\x9f\x05\xce\xcf\xca\x95\x2a\xae\x2e\x57\x24\x5e\x7b\
+\x23\x1f\x3c\xdc\xf7\xfd\xab\x82\xa1\xef\xbb\x6f\x05\x2a\x43\x76\
+\xa9\x68\xbe\xd7\x31\x59\x00\xc7\x89\x3e\x0d\xf8\x5b\xae\x8b\x81\
+\x99\x6a\x63\x35\x9a\x7b\x0a\x5f\x03\xdf\x6f\xb1\xf9\x3d\xf6\xd8\
+\x43\x4a\x1e\xd4\x10\xe8\x83\x43\x70\xbc\xea\xaa\xab\xf0\xd8\x63\
+\x8f\x4d\x48\xe9\x61\x7d\x02\x43\x91\x9f\xea\x67\xce\x90\x4d\x59\
+\x93\xba\x09\x46\x1c\x91\x18\x77\xff\x55\x3c\xf3\xf4\x32\x69\x76\
+\x1a\x63\x4d\x5a\x8d\xde\x72\x1b\xbc\xaa\x8f\x15\x2f\xaf\xc4\xdf\
+\x1f\x79\x46\xbd\x8f\x68\x00\x86\x8e\xf6\x0d\xa4\xe8\x31\xc3\x55\
+\xb5\xaa\x02\x1a\xfb\x1c\x7a\x28\xc0\x47\x3f\x9e\x78\xea\x7e\x3c\
+\xfa\xf0\xed\x01\x23\xba\x14\xe8\x66\xaa\x51\x91\x6e\xef\x52\x9c\
+\xaf\x0d\x83\xc8\xd8\xab\x54\x2b\xb8\xe0\xfc\x0b\x70\xda\xe9\x27\
+\x07\xe1\xc0\x70\x31\x7d\x50\xa2\x11\x3c\x01\xcd\x04\xab\xb1\x1a\
+\x9d\x31\xbf\x7f\x18\x30\xd4\x8c\x9f\x6a\xe9\x70\x7c\x68\x5e\xed\
+\xa1\x4c\xf7\x93\xec\xd2\x2f\x1e\x78\xc5\x53\xf1\x73\xcd\x19\x2a\
+\x5b\x57\xea\xfc\x82\x62\x79\x61\xf1\x36\x95\x46\x84\xc1\x90\x79\
+\x2c\x0d\xed\xa9\x30\x82\x81\xa1\xd6\x90\x36\x6f\x06\xec\x62\x1b\
+\x39\x4d\x37\xae\xc5\xf5\xe5\x42\x51\x80\x62\xc6\xf4\x76\xdc\x78\
+\xfd\x35\x38\xee\xa8\xcf\x06\xb2\x77\xbc\x83\xaa\xce\x8b\x6c\x68\
+\x6c\xa0\x83\x9f\xe3\x04\x43\x7e\x7a\x32\x9e\x7d\xbd\x6f\xd5\x17\
+\x35\xd6\x2c\xcb\x7d\x18\x16\x8d\x50\xee\x4f\x08\x2e\xea\x19\x72\
+\x03\x4b\xc2\x9a\x2c\x57\x8a\xe9\x54\x2a\x70\x6a\x8d\x31\x92\x71\
+\x67\x1e\x50\xb0\x95\x13\x52\x95\x0d\x8a\x30\x4c\x45\xe4\xa1\x71\
+\xcf\xa6\x04\x43\x40\x9c\xca\xc3\xd2\x37\x46\x9e\xe1\x98\x35\xdb\
+\x34\x4b\x11\xd8\xe6\x91\x9b\x75\xdb\xd0\xb7\x1a\xe3\xd1\xd8\xc7\
+\xa9\xbc\xbf\x56\xe7\x1e\xfa\xfa\x9d\x67\x7c\xbf\x4a\x09\xb6\x51\
+\x1d\x63\x02\x43\xd7\x8d\x9e\xef\xfb\xfe\xe9\xeb\x62\x60\x5a\x4d\
+\xd6\xa8\xee\x76\x84\x37\xb5\xba\xa7\xa1\xd8\xa6\xfa\xd0\xd4\x70\
+\xcc\x31\xc7\xe0\xb2\xcb\xb4\x5f\xa4\x35\xd2\xed\xee\xee\xc5\x67\
+\x3e\xf3\x19\xdc\x7a\xeb\xad\xf5\x76\x4d\xe3\xb9\xc6\xf5\x0a\x0c\
+\xbb\xfa\x45\xc5\x84\x41\x23\x37\x42\x30\x64\x9f\x39\x0a\x69\x27\
+\xd1\xdf\x57\xc6\xb2\x67\x5f\x90\x90\x18\x55\x3c\xbc\x32\x43\x51\
+\x09\xf8\x35\x0f\xab\x56\xf4\xe0\x89\xbf\x2d\x53\x08\x8b\x56\xe1\
+\xb9\x15\xf8\x75\x30\x4c\x48\x37\x7b\xc9\xd7\x88\xd3\x53\x43\x2c\
+\x51\x46\x5b\x7b\x05\xcf\x3d\xf7\x30\xfe\xfc\x97\x5b\x50\x29\xf7\
+\x23\x1e\xd7\xd0\x93\xec\x62\x25\xcf\xa8\xe4\x0f\x1a\x5d\xfe\x8d\
+\x04\x99\xf4\x40\x9f\xe8\xb7\x9e\x78\xe2\xf1\x52\xc8\xcf\x39\x4d\
+\xa5\xc8\x7a\x65\x7d\x63\x23\x4c\x6a\xf3\xd0\xe8\x50\x31\xf5\x3b\
+\xf6\x41\xba\xd4\x21\xc9\x35\x03\x43\xf5\x1a\x5c\x2d\xcb\x0e\xb0\
+\x48\xc1\x30\x2d\xb9\x59\x44\x92\xa8\xd1\x33\x0c\xc2\xa1\xfc\xc9\
+\xdc\x16\xc3\xa2\xfc\x19\x61\x17\x77\xc7\xab\xff\xe4\xdf\x2d\x4c\
+\x2a\xa5\x29\x6c\x0e\x2c\x5d\x3d\x94\x28\x23\xa1\x52\x69\x71\xa5\
+\xf7\xae\x2c\xc9\x26\x10\x0c\xb1\x3f\xad\x23\x83\x08\x72\xfb\x55\
+\xc9\xa3\x2d\xb9\xe5\x46\x1c\xf9\xa9\x4f\x22\x95\x8c\x22\xca\xa6\
+\xcc\x65\xca\xdc\x95\x25\x64\x48\x59\x3d\x02\x8a\x78\xbc\x94\xfe\
+\xaa\x8c\x2c\x6e\x3c\xd4\xf3\x1d\x7e\x26\x27\xfc\xfc\xd7\x5b\xd0\
+\x69\x40\xda\x22\x0a\xfc\x49\x6d\x5d\xc9\xa5\xca\xfa\x73\xe1\x46\
+\xb5\x11\x35\x97\x18\xef\xa5\x5a\xae\x20\xea\xeb\x9a\xe3\x35\xf1\
+\x9d\xaa\x0b\xe1\xaa\xba\x12\x65\xcd\xa8\xa6\x14\x8b\xa1\x92\x2f\
+\x28\x35\xda\x68\xd1\xe4\xed\x08\xf3\x74\x6a\xc5\x9d\xcd\xc3\xb3\
+\xb5\x6d\x20\xcc\xeb\x6d\x6e\x79\xc7\x7b\xe6\xdf\xc2\xdd\x7f\x5a\
+\x8d\x6f\x33\xb8\xb6\xb2\x97\xe3\xb1\x75\x13\xf9\xcc\x50\xd7\xef\
+\x38\xce\x05\x9e\x57\xfd\xc2\x68\xcf\x3b\x26\x30\x04\x62\x3b\x3b\
+\x8e\xf7\xc0\xba\x18\x88\x56\x93\x35\xda\x1b\x1e\xee\x7d\xad\xee\
+\xc9\x72\x55\x16\x52\xe0\xfb\xb9\x0b\xa3\x91\x38\xeb\xac\xb3\xc0\
+\xc6\xbd\xac\x43\x2a\x95\x2a\x42\xe9\x5f\xb3\xa6\x1b\x07\x1f\x7c\
+\x30\xee\xba\xeb\xae\xba\x5a\xfc\x78\xae\x71\xbd\x01\x43\x50\x98\
+\x78\x6d\x30\xf4\x9d\xb8\x48\xb1\xf5\xf6\x94\xf0\xfc\x73\x2f\x23\
+\x9f\x2b\x89\x70\x71\xad\xcc\x1e\x83\x09\xf1\x0c\x57\x2e\x5f\x83\
+\xc7\xff\xfa\xcc\x20\x30\xd4\xfe\x75\xac\x25\x8c\x83\xe7\x68\x4b\
+\xcd\x40\xad\x5c\x41\xad\x9a\x87\x13\x2d\x20\x9e\xc8\xe1\xd9\x67\
+\x1f\xc4\x7d\xf7\x2f\x81\x5f\x1b\x10\x16\xaa\x34\x49\x08\x36\x1c\
+\x54\x00\xe1\x1e\xdf\x72\x5d\xd6\x05\xe1\x9b\x17\x5d\x84\x93\x4e\
+\x3a\x21\xd4\x1b\xcf\x8c\xd0\xda\x62\xe6\x93\x56\x50\x3f\x9a\x89\
+\x0d\x13\x68\xea\x0d\x40\x1a\x39\xc3\x66\xcf\x90\x9b\x2a\x82\x61\
+\x6f\xaf\x7a\x86\x55\xd6\x6a\x12\xb8\x78\xdf\x23\x10\x67\x18\x9e\
+\x6e\x26\xd8\x30\xf7\x17\x95\xcf\x6a\xe1\xbc\x7a\x86\x5a\x02\x63\
+\x47\xfd\xf7\x40\xd1\x47\xff\x1e\x36\xe0\x1a\x92\x16\xc1\x84\x72\
+\x11\x1d\xc9\x38\xee\xfc\xc3\xad\x38\xea\x73\x9f\x95\xe6\xc9\x95\
+\xaa\x7a\xee\x96\x65\x24\x18\x12\x4c\xc8\x38\xae\x4f\xda\x08\xe3\
+\x64\x06\xdb\x9e\xc3\xe6\x9f\x13\x7e\xfe\x29\xb0\x2d\xdb\x0d\xb7\
+\xee\xf9\x55\x7d\xfa\xd8\xbc\x3e\x86\x89\x23\x22\x4b\xa7\x69\x0d\
+\x0a\x08\x90\x44\x13\x48\xb0\xb1\xb5\x58\x68\xfe\x6c\xdb\xc0\xf6\
+\x58\x52\x11\x1b\x1e\x26\x82\x5f\x22\x21\x2d\xad\xd8\x4e\xab\xc2\
+\x16\x2c\xeb\xe8\x68\xb0\x5e\x1b\x51\xac\xf0\x7c\x73\xcc\x8d\x7c\
+\x16\x06\xc6\xa1\x2e\x37\x5c\x7a\x64\xa4\xb3\x56\x36\xf3\xb5\xbc\
+\xed\xa1\x37\x53\xee\xdb\x80\xca\x83\xa3\xbd\x8e\x31\x82\x21\x17\
+\x47\xf4\x29\xdf\xf7\x46\xed\x7a\x8e\xf6\x42\x5a\xbd\x6f\xc2\x0f\
+\x43\x8b\x2f\x18\xcd\xc4\x5a\x28\x82\x0f\x0c\x17\x11\xc1\x90\xb1\
+\x78\xca\xba\x9d\x73\xce\x39\x02\x82\xa6\x6e\xd3\xd5\xd5\x83\x0f\
+\x7d\xe8\x43\xf8\xd3\x9f\xfe\x34\x2a\x6a\xf9\x70\x97\xa7\x60\xc8\
+\xb0\x53\x0d\x97\x5c\x7a\x71\xa3\xb4\x82\x21\x35\xf1\x78\x86\x20\
+\x3e\xb4\x1a\xcc\x21\x5e\x6f\x55\xbf\xc6\x88\xe8\x1a\x11\x26\x4e\
+\x8b\xfa\x0c\xc3\xa4\x35\x4f\x1b\xc6\x32\x3c\xd4\xbb\xa6\x80\x65\
+\xcf\xbf\x8c\x52\xae\x8c\x64\xb2\x83\x4c\x74\xad\x3f\xac\x78\x78\
+\x75\xf9\x0a\x2c\x7d\xe2\x19\xc9\x15\x3a\x2e\x59\x91\xac\x1b\xf4\
+\xc4\x73\xd1\x9c\x21\x77\xce\x5a\x27\x95\x88\x93\x9c\x53\x44\xa5\
+\xd6\x87\xc7\x1e\xbf\x17\x0f\x3e\x70\x87\x36\x9d\xf5\x6b\x88\x31\
+\xe5\x18\x89\xc9\xd8\x5b\xd8\x89\x9f\x35\x56\x2f\xbd\xc0\xf3\xbe\
+\xfa\x15\xf1\xc8\xb9\x31\xe1\x6e\x9f\xc3\xa3\xf9\x30\x6b\xd6\xcb\
+\xe6\xc7\x93\xd5\xe5\x63\xa4\xdd\x7e\x93\xb7\x19\x34\x2e\xd6\x1d\
+\xc0\xda\x50\x13\x34\xaa\x1f\xe4\x40\x0e\xa4\x21\xe5\x2a\x94\x4d\
+\x13\xe9\x00\x97\xa6\x5c\xc3\xa1\x8d\x9f\x2c\x7d\x6f\x84\x24\xc2\
+\x22\x6d\x22\x69\x17\x18\x71\x63\xdf\x8a\x12\x59\x50\x46\x41\x1f\
+\x87\x63\x69\xc2\xf5\x7a\x69\x06\xd0\xa4\xb5\x06\xf7\x27\x4c\x53\
+\x0d\x4b\xb3\x3a\x41\x6a\x38\xe3\x51\xfc\xf1\x8e\xdb\x24\x67\x58\
+\x2a\x66\x45\x5d\x88\x35\x85\x22\xb5\x57\xad\xd4\x3d\xaf\x66\x65\
+\x13\xbd\xbe\xb5\xc7\x4d\x36\x4e\x5a\x60\xda\x10\x04\x17\x76\x4f\
+\x30\x58\x4d\x42\xdf\x75\xa3\x3e\x64\xf8\x75\xed\xf3\x77\xb4\xb7\
+\x21\x9b\xcb\x0a\x20\x6a\x09\x8a\x86\x45\xe9\xd1\x8a\xb7\x67\x0a\
+\x47\x52\x3a\x41\xa5\x19\x1d\x38\xa9\x7f\x0d\x94\xe4\x38\x6c\xd6\
+\xb6\x8c\x73\xc8\xe2\x7a\x29\x14\xaa\x2a\x70\x8a\xbb\x58\xf7\x08\
+\x5d\xb4\xb5\xb7\x23\x9f\xcb\x29\x28\x4e\xb1\xf6\xa7\x6c\x70\x64\
+\xb3\x32\xf8\xde\x2d\x6c\x6a\xe3\xd5\xcc\x86\x37\x10\x6c\x65\x5f\
+\x9b\xb5\x7b\xd7\x37\x40\x5c\xfb\xfa\x9d\xa7\x7d\xbf\xba\xf5\x58\
+\x4c\xe1\x98\xc1\x30\x1a\x8d\x9f\x5b\xad\x56\xcf\x64\x1f\x40\xb2\
+\x91\x78\x98\x48\xec\x58\xbe\x78\xa2\xef\x6d\xbe\x79\x4e\x4e\x18\
+\xa4\xf8\x6f\x2b\xa6\xe7\x84\xdb\xeb\x7c\x0f\x01\xcc\xc2\x0a\x96\
+\xf7\x6b\x75\x3d\xe1\x45\x14\xfe\x9d\x79\x2e\xaa\xdb\x9c\x7d\xf6\
+\xd9\xe2\x01\x5a\x8d\xd8\x2b\xaf\xac\x10\xe0\xa2\x38\xf4\x78\xc7\
+\xc7\x16\x38\x77\xfa\x54\x6d\xf9\xe6\xa5\x17\xe0\xf8\x63\x4f\x94\
+\xfe\x71\xec\xb6\xcd\x07\xd3\xbc\xa5\xb0\x00\xbd\x6c\xf8\x83\x5d\
+\xad\x35\xbc\x6b\x35\xd1\x54\x74\xa1\xc1\x2d\xe6\x3c\xe4\x8a\x05\
+\x78\x95\xaa\xb0\xe6\xa8\x59\xc9\x16\x4a\xf9\x42\x19\xe5\x9a\x07\
+\x16\xcb\x57\xab\x54\x84\x61\x87\x09\x12\x5e\x52\xd2\x0e\xa7\x67\
+\x4d\x01\x2f\xbe\xf4\x8a\xb4\xc5\x61\x1e\xa6\x52\xa1\x44\x17\x6b\
+\xb0\x92\xb8\xff\xbe\x7b\xf0\xc0\x7d\xb7\x21\x16\xa5\x37\xa8\x21\
+\x3b\x91\xf0\x92\x52\x37\x0d\x51\x31\xc9\xcf\xf1\x4b\xc4\x5c\xe9\
+\x36\x51\x2e\x17\xd0\xd3\xbb\x12\x2b\x5e\x7d\x19\x99\x4c\x4f\xc0\
+\x0c\xa5\x01\xd2\x86\xbc\xbb\xef\xfe\x76\xec\xb5\xd7\x5e\xd2\xc7\
+\x90\x79\x0f\x8e\xf1\x86\x1b\x6e\x88\x6d\xb7\xdd\x16\x3b\xec\xb0\
+\x9d\x7c\xaf\xad\x01\x1a\x84\x89\x92\x17\xd6\xae\x99\x6f\x78\x75\
+\x21\x7c\x0b\x2d\xa3\x30\x18\xba\xda\xef\xb1\xa0\x79\x52\x92\x4a\
+\xb8\x59\x50\x9d\x9d\x80\xd4\xe3\xea\x06\x4b\xd9\xb1\x8e\x74\xfa\
+\x28\x16\x95\xb0\x22\x4a\x38\x0c\x75\xd2\x50\x4b\xdf\x47\x07\xae\
+\x84\x4b\xf9\x6f\xed\x2b\xa8\x61\x51\xc0\xf5\xf4\xa7\xca\xe0\xb9\
+\xf2\x7e\x91\xc3\xd3\x84\x98\xd4\x25\x4a\xaa\xd6\xf1\x51\x2c\xe5\
+\x45\x3d\x86\x7d\xf7\x96\xbf\xfc\x32\x7e\x7f\xdb\x12\xcc\x9c\x3e\
+\x0d\xa5\x72\x41\xa4\xd5\x58\x47\xc8\xb8\xbf\x18\x42\x96\x1c\xd4\
+\xe8\x61\x44\x90\x48\xc4\x91\xee\xeb\xc1\xdf\xff\xfe\x57\x3c\xf8\
+\xd0\xfd\x78\xf9\x1f\x2f\x05\xf4\x7d\xca\xae\x05\xfa\x41\xf5\x3e\
+\x52\x3a\x0e\x0a\xb2\x3a\x0b\x52\x1f\x69\x5e\xbe\x8d\x18\x43\x90\
+\x1e\xb0\xf0\x0d\x9b\x61\xfa\xf4\x59\xe8\xed\x1b\x90\x70\x2e\xcb\
+\x74\x44\x36\x4c\xf6\x2f\xcd\x89\x57\xbd\x3f\x9e\x95\xd7\xc8\xe7\
+\x5d\x6d\x80\x86\xd3\x79\xcc\x98\xde\x89\xa7\x9e\x7a\x12\x3e\x4a\
+\xc2\x78\xb5\x9c\xab\xcf\x31\x0d\xbe\xbb\x11\x02\x1c\x7e\x73\x13\
+\x7e\x7e\xd6\x5a\x0b\xf6\xe2\x5a\x82\x10\x8d\xe5\x60\xa1\x49\x2d\
+\x6d\xf1\xa5\x8f\xaa\xd9\xcf\x66\xc0\x6a\x65\x8b\xa6\xea\x75\xdb\
+\x54\xf2\xfc\xb4\x6b\xfc\xcf\x14\x76\x74\x03\x5a\x11\xdb\xc9\xe7\
+\x4f\xf7\x5f\x9a\x47\x1d\x8d\x23\x31\x55\xd7\x5c\xdf\x14\x99\x20\
+\x44\x70\x3d\xbe\xef\x9f\xf7\xcf\x9d\xc9\x59\x63\xf9\xde\x56\x36\
+\x72\xad\x73\xc5\xe3\xed\xdb\x56\xab\xa5\xbf\x4b\x1e\x20\x98\xd8\
+\xb1\x7c\xe1\x64\xbd\xb7\x19\x0c\x39\x71\x9c\x28\xfe\xdd\x7e\xe7\
+\x77\x91\xd5\xc9\x43\xd9\x85\x6a\x8c\xf8\xd3\x00\x6d\xb4\x60\x68\
+\xd7\x6d\x3b\xa4\xf0\x39\xf6\xdd\x77\x5f\x21\xd0\xd8\x6e\x89\xf4\
+\x65\x0a\xf7\xfe\xec\x67\x3f\x13\x95\x1b\x1a\x66\x3e\xd0\x63\x3d\
+\x06\x81\xa1\x5f\xc3\xf9\x17\x7e\x0d\x47\x1f\x7d\x8c\xb0\x2f\x99\
+\x03\x2b\x16\x2b\x02\x38\x3c\xa8\x76\x51\xef\xaa\x63\xc6\xc6\x36\
+\xd5\x2a\x2d\x3a\xe4\x61\x1b\x6e\xda\x0e\x6e\x5e\x73\xb9\x92\x94\
+\x8b\x70\x2c\x2d\xa7\xc6\x1d\x6f\x22\xd5\x11\x78\x11\x2a\x9c\xed\
+\xfb\x2a\xa4\x4d\x02\x0c\x83\x6e\x03\x03\x25\xc9\x19\x92\x5d\xcf\
+\xba\x41\xdf\x33\x0a\x7f\x04\x77\xdf\x7d\x2b\xae\xfc\xc1\x39\x2a\
+\x71\xab\x8f\x91\xfc\x3f\x03\x9d\x0a\x09\x35\xb4\xa7\xda\x51\xad\
+\x56\x24\xcf\x24\x0f\x59\xa0\x10\xad\xb9\x9c\x1a\x92\x09\xea\x9f\
+\xb2\x5c\x23\x2e\xaf\x7f\xe1\x0b\x5f\x10\x35\x9e\xb6\xb6\x64\x3d\
+\x5c\xcd\x07\x96\xc6\xda\x42\xda\x04\x12\x8e\x21\xe7\x78\x6a\xc1\
+\x90\x41\xce\xc6\xa1\x9e\x5a\x03\x0c\x59\x7e\xf2\xc2\x8b\x5d\xc8\
+\xe7\xca\xc2\x08\x8d\x46\x62\xf5\x1c\x12\x85\xc9\xb9\x96\xe2\xc9\
+\x54\x9d\xf4\x23\xd7\x2f\x82\xe6\x06\x9e\xea\xbd\x34\xe4\xe7\xa4\
+\xa2\x3e\x08\x73\x06\x9a\xb0\xa1\xef\xd4\xfa\x41\x1d\x61\x3b\x14\
+\x0b\x03\xe6\x20\x73\x61\x0e\xc5\x9b\xa9\xb8\xe2\xa3\xb3\xb3\x03\
+\xdf\xfe\xd6\xe5\xb8\x7c\xf1\x45\xa8\x94\x58\xcb\xa9\xcd\x99\x95\
+\x49\x29\xf5\x33\x70\x5d\x1a\x46\x25\x81\xd0\x23\x62\x2e\x8d\xf2\
+\x6b\x6c\xc5\x25\x48\x1b\x66\xe3\x86\x75\x47\x83\x71\x20\x18\xda\
+\x88\x18\xe4\xd4\xd3\x78\xc1\x45\x26\xda\x3a\x70\xf0\x47\x3f\x81\
+\xfd\xde\xf3\x3e\xb8\xd1\x14\xa2\x91\x04\x3a\x3b\xa7\x6b\x9e\x98\
+\xd7\x54\xf7\x28\x09\xea\xf5\x66\x5e\xba\xfe\x25\xba\x50\x95\xe8\
+\x8c\x00\xb2\xc7\xa6\xce\x05\xbc\xf8\xc2\x73\xb8\xe4\xd2\x0b\xf1\
+\xd2\x3f\x96\x0a\x18\xca\x30\x35\xc9\x2e\xbe\x16\x06\xbd\x39\xa7\
+\x67\x61\x47\xb3\x27\x13\x29\xbf\x1a\xab\x5d\x19\xee\xfd\xe1\x71\
+\xa0\x4a\xcd\x01\x07\x1c\xa0\x02\x1a\xf9\xbc\x88\x55\x5c\x7f\xfd\
+\xf5\xf8\xf9\xcf\x7f\x3e\x28\xd7\xc8\x73\x35\xdf\xdb\x64\x5d\xcf\
+\x58\xce\xb3\xb6\x73\x54\xdb\x0e\xc0\x63\x63\x3a\xc7\x58\xde\x6c\
+\xef\x8d\x46\xe3\x0f\x54\xab\xd5\x9d\xd5\x13\x6a\x30\x28\xc7\x73\
+\xae\xf1\x7e\x66\x38\xb7\x7e\xf7\xdd\x77\x17\x19\x22\x09\x91\xb9\
+\xae\x74\x9d\xa6\x61\xe7\x24\xae\x5a\xb5\x4a\x26\x92\x0f\x97\x79\
+\x6b\x61\x2f\xaf\xd5\xb5\xf0\x3b\x09\x6c\x26\x5f\x64\x75\x86\x54\
+\x36\x21\xf8\xd9\xee\xcf\x76\x7e\x64\x94\x9a\x47\xda\x2a\x26\x3f\
+\xd4\x77\xd7\xc1\x50\xc2\x1f\x35\x9c\x75\xde\xb9\xf8\xd4\x11\x47\
+\xc2\xf3\xd8\xa8\x34\x81\x72\x89\xe5\x09\xac\x15\x73\x24\x47\x51\
+\x3f\x1c\xad\x87\x6a\x74\x75\x90\xd6\xa6\xc1\xcb\xcd\x64\x11\xfd\
+\x77\x5c\x24\xd5\x6a\xb2\xfb\xe3\x7f\xe1\x8d\x8e\x5c\x47\x54\xa9\
+\xf8\x9a\x6b\x0a\x3a\x4b\xb0\xcd\x92\x10\x32\x22\x28\x95\x3d\x2c\
+\x7d\xe6\x79\x94\x4a\x55\xb9\x36\x2a\xa6\x68\xf8\xd3\xc3\xad\xb7\
+\xfe\x16\x3f\xff\xe9\xc5\x88\x46\x35\x7f\x42\xcf\x90\x07\xa5\xd6\
+\x78\x10\x00\x2b\x42\x5f\x1f\xec\x6d\x49\x15\x23\x6b\xeb\x5c\x37\
+\xd0\xb7\x6c\xec\xc9\xcf\x3c\xf3\x4c\x9c\x7e\xfa\xe9\x02\x86\x83\
+\xeb\x04\x03\xef\x84\x3b\x7f\xf3\x6a\xe4\x5b\x26\x46\x92\x69\xe5\
+\x19\xda\xd8\x2b\xfc\xd8\x77\x05\x21\x3f\x38\x78\xf9\x95\x3e\x29\
+\x3f\xa1\xf7\xa3\x1b\x49\x0d\x09\xb2\xf8\x5b\x5a\x48\xc5\xb5\x31\
+\xac\x12\x1e\x1c\x6d\x67\x25\x63\xa4\x60\x6e\x05\xd2\x83\xd7\x7d\
+\xb3\x72\x4c\x03\x20\x2c\x14\x2a\x27\x61\xd1\xbc\xe4\x67\x39\xd8\
+\xa4\xd1\x73\x5c\xb9\xf9\x29\x0a\x18\x4e\x9f\xd1\x81\x1b\xae\xbd\
+\x06\x27\x9d\x7c\x02\x4a\x0c\x25\xc6\x1c\xf8\x55\x86\xb4\xd5\x8b\
+\xe4\xea\xa1\xb0\x02\x43\xd3\x5c\x87\x12\x65\x65\x1c\xc1\xf7\x44\
+\xa2\xac\xad\x3d\x89\x74\x7f\xff\xd0\x8f\x0f\x3b\x99\x04\x25\x0d\
+\x83\x93\x6b\x41\xcc\x22\x68\xed\xc5\xef\x48\xb5\x4f\xc7\x97\xce\
+\xf8\x32\x8e\xfc\xf4\x51\x28\x96\x7d\x51\xdf\xa1\x67\xc8\x31\x61\
+\xa4\x20\x1c\xb6\x95\x3b\x35\x5a\xa7\xd4\x9d\xaa\xa0\x80\x78\x33\
+\xd4\x03\x8d\x45\xc5\x90\x3f\xfe\xf7\xbf\xe2\xe3\x1f\x3f\x08\x3d\
+\x3d\x2b\xd6\x29\x18\x86\x07\xc7\x6c\x8f\xcd\xe5\xfa\xe0\x59\xd9\
+\x35\x19\xb0\x5d\x78\xe1\x85\x38\xe5\x94\x93\xe4\xb2\x8d\x14\xf8\
+\xed\x6f\x7f\x17\x27\x9d\x74\x52\x20\xce\xee\xd4\x3b\x61\x48\x98\
+\x79\x3d\xe8\x8d\xd8\x18\x4f\x3c\x08\xd4\xde\xd6\xca\x9e\x37\xbf\
+\x3e\x66\xcf\x90\x27\x48\x24\x52\x27\x97\x4a\xa5\x6f\xaa\xb6\x64\
+\xb4\xee\x36\x8f\xf5\xcb\x27\xf2\xfe\x66\x30\xe4\x24\x12\x94\x68\
+\x24\xe9\x31\x84\xc5\x69\x49\x42\xd8\x7f\xff\xfd\xf1\xf8\xe3\x8f\
+\x4b\xd8\x89\x13\x67\x1e\xe1\x68\x77\x85\xb6\x48\xc2\x2d\x52\x18\
+\xea\x30\x0f\xca\x42\x0a\x04\xda\x30\xf0\x8d\x37\x44\x2a\x26\x28\
+\xc8\x03\xd0\x33\xe3\xa6\xfc\xf4\x33\xce\xc2\xa1\x87\x7e\x52\x42\
+\x95\x6c\xa9\x53\x29\x93\xf1\x16\x0f\x9a\xea\x86\x42\x3c\x01\x09\
+\xa2\xde\x50\x35\x9c\x6f\x69\xde\x8e\x87\x0c\xb7\x7d\x9f\x31\xd1\
+\x44\x6b\x94\xa1\x35\xd7\x47\xae\x50\x08\x31\xf0\x06\x83\x21\xfb\
+\x0e\xb2\x03\xc2\xb2\x65\x2f\xca\xb5\x45\x22\x64\x17\x26\x85\xb1\
+\x48\x8f\xfc\xe6\x9b\x7f\x85\x9f\xff\xec\xc2\x90\x67\x68\x33\xaf\
+\xcc\x3e\x25\x31\x28\xf0\x49\x83\xdf\x20\xf7\x61\x1b\x17\xbe\x9b\
+\xf3\x25\x75\x88\x11\xb6\x08\xca\x0b\x69\x89\xb9\x5a\x7a\x02\x7c\
+\x1f\xe7\x95\xaf\x33\x57\x18\x5e\x1b\x8d\x50\x69\xa3\x8b\xfd\x78\
+\xd6\xdd\xd0\x60\x28\xd0\x1e\x3a\x9d\xb5\x99\x0a\x01\x6f\x90\x2b\
+\x7c\x75\x55\x1e\x99\x4c\x29\xa8\xe9\xa2\x37\xa8\xb5\x5d\x0c\x41\
+\x8b\x21\x09\x0a\xb9\xeb\x1b\x2a\xd6\x06\xca\xc6\x4d\xbd\x43\xe6\
+\x4a\xeb\x00\x17\xf4\x29\x6c\x06\x46\xbd\x90\xc0\x63\x0c\x87\xec\
+\x64\x3d\xe8\x06\x49\xbc\x7d\x97\x75\x70\x94\x1d\x2b\x89\xa6\xe8\
+\xf4\x19\x9d\xf8\xc5\xcf\x7e\x8c\x53\x4e\x39\x59\x3a\xd5\xa7\x3a\
+\xda\x50\xc8\xb2\x6e\x96\x7d\x2b\xd5\x13\x67\xa3\x65\x7e\x9f\x14\
+\x70\xc7\xb4\x67\x61\xb5\xc2\x46\xb9\x2d\x58\x92\x75\xcf\x50\x02\
+\xb7\x6a\x5c\x49\x00\x62\x38\x6b\x50\xa8\x94\x04\x1f\xe0\xdc\xaf\
+\x5e\x88\x23\x8f\xfc\x1c\xba\x7a\xd2\x02\x86\xa9\x54\xbb\x5c\x73\
+\x2a\xc5\x50\xf7\xe0\x2d\x87\xd0\x61\x2c\x27\x2a\xde\x76\x19\x51\
+\x37\x22\x1e\x61\xb9\x52\xc4\xec\xd9\xb3\xf0\xd2\x4b\x2f\xe1\xbf\
+\xdf\xb7\x2f\x32\x99\xae\x75\x0a\x86\xb4\x0f\xa6\x65\x6a\x36\xc7\
+\xc6\x93\x36\x63\x5d\x83\x89\x39\x05\xb6\xd9\xbf\xf8\xe2\x8b\x25\
+\xf7\x2e\x6b\x54\xea\x78\x63\xf8\xd1\x8f\x7e\x82\x23\x8e\x38\x62\
+\xca\x1a\xa0\x8f\xe7\xb9\x0c\x7f\x26\xb4\xb9\x38\x05\xf0\xb4\x51\
+\xed\x18\x8e\x71\x81\x61\x2a\x95\xda\xa8\x50\x28\x2d\xd7\xfc\x86\
+\xd2\x90\x5f\xeb\x63\x6d\xb7\x58\x73\x1b\x54\x20\x39\xe6\x98\xa3\
+\x82\x3c\x36\xf3\x52\x0e\x56\xae\x5c\x85\x8f\x7d\xec\x63\xb8\xef\
+\xbe\xfb\xe4\x5a\x75\xf7\xcd\x1c\x88\x16\x7e\x8f\x66\x67\x66\xa0\
+\x16\x06\x37\x2e\x70\xde\xbf\xc5\xd0\xcd\xe3\xe4\xb9\xf9\x37\x86\
+\xf4\x2c\x97\x61\xf5\x87\x63\x19\xa7\x06\x18\x52\xa1\x25\x86\x33\
+\xce\x3c\x17\xff\xf3\x3f\x87\x4a\xeb\x98\x68\x34\x2e\x21\x49\x02\
+\x0f\x43\x9c\x16\x1a\xd4\xf3\xd7\x03\x51\x62\xac\x68\x7c\xa4\xbb\
+\xfc\xa0\x58\x5e\xc3\x7b\xe1\x27\xcc\x38\x47\xea\x94\x7b\x25\x4c\
+\x88\xf1\xf2\x69\x40\x07\x1b\xfd\xc6\xae\x9c\x00\x10\xc1\xc0\x40\
+\x06\x2f\xbd\xf4\xb2\x00\x33\x41\x50\x94\x4e\x1c\x6d\xcf\xb4\x64\
+\xc9\x6f\xf0\xff\xfe\xdf\x85\x88\x44\xd4\x33\xb4\x07\xdf\x36\x2c\
+\xf6\xef\x30\x63\x37\x3c\x4e\x46\x4d\xe7\x78\x58\x08\x9c\x39\x5a\
+\x76\x21\x91\xbc\xd6\xa0\x63\x6d\xe3\xac\xb9\xb8\x89\x91\x66\x86\
+\x07\xc3\x60\xc4\xa5\xe0\x9a\x07\xc7\x23\xc8\x93\xd5\x73\x49\xc0\
+\xf2\x15\x79\x64\xb2\xa5\x20\x62\xc1\x8e\x1f\x04\x39\x6e\x26\xe3\
+\x9a\x2b\x0c\x98\x7d\x02\x54\xd2\x41\x45\xbd\x74\x05\xc3\x88\x80\
+\x21\x0f\xf1\xf0\x03\x30\x94\x7f\x0f\x23\x16\x60\x25\x13\x36\x34\
+\xd4\x83\x65\xf4\x55\xd7\xbc\x2f\xed\x88\x08\x68\x0c\x77\x4e\x9f\
+\xde\x89\xab\x7e\xf0\x7d\x9c\x75\xd6\x99\x42\x54\xa2\xa6\x6b\xb9\
+\xc0\x90\xb6\x75\xb4\xb5\xca\x3c\x3d\x1b\x9b\xe4\x4a\xbe\x97\x45\
+\xe9\x41\x0b\xa7\x41\x91\x89\xf0\x7c\x04\xfa\xa7\x16\xb2\x55\x09\
+\x77\x1d\x4d\x53\x21\xe2\x46\x20\x1a\x4b\x48\x09\xc3\x05\xdf\x58\
+\x8c\xc3\x0f\xff\xa4\x80\x61\xc4\x8d\xa3\xad\xad\x43\xc0\xad\x22\
+\x45\xf0\xa1\xc3\x74\x55\xeb\x64\x55\x0d\x2b\xb3\xd3\x3c\xd7\x7f\
+\x36\x3b\x80\xce\x69\x1d\x58\xb1\x62\x05\xf6\xdf\x6f\x1f\x11\x6d\
+\x60\x2b\x29\x5d\xcf\x83\xbb\xd3\x8c\xd6\x06\x34\x2d\xb4\x09\xfd\
+\x33\x1c\x5a\x1c\x6b\xaa\x66\x42\x5f\xdc\xe2\xc3\x76\x2d\xec\xf3\
+\x7a\xf4\xd1\x47\xd7\x9d\x0a\xea\x9b\xfe\xf8\xc7\x3f\x16\x47\x83\
+\x80\xa9\x6b\xd3\x93\xe7\x91\xb6\x6e\x5d\x83\xb9\xdd\x96\xce\x65\
+\x6d\x21\x80\x15\x63\x1d\xa7\x71\x81\x21\xbf\x24\x12\x89\x5e\xef\
+\x79\xfe\x7f\x1b\x3d\xb7\x99\xc5\x34\xd6\x0b\x19\xeb\xfb\x9b\x8d\
+\x00\x27\x85\x46\x93\x9d\xeb\x8f\x3c\xf2\x53\xc8\xe7\x8b\x81\xa7\
+\x10\x11\x15\x8f\xf7\xbf\xff\xfd\x02\x86\xe1\xc3\xc0\xc6\x72\x7d\
+\x23\x5d\x83\x3d\x30\x16\xeb\xb7\x4d\x80\x2d\x9e\xf0\xe2\x1e\xae\
+\xdb\xf4\x78\xee\x51\xee\xd3\x21\x18\x26\x70\xc6\x99\xe7\xe1\x7f\
+\x0e\xf9\x5f\x6d\x79\x24\x75\x7e\xf4\xc2\x82\x1c\x49\xb8\xa6\xb7\
+\xfe\xd0\xf3\x8f\xec\x5c\xae\x74\xb8\xb5\x61\xa2\x01\x88\xe2\x01\
+\x8a\x68\xb3\x81\x60\x10\xe2\x93\x12\x06\xf6\x6c\xa3\x20\x95\x32\
+\x0f\x65\xf3\x60\x14\xfd\x20\x64\x3a\x90\xce\xe2\x95\x57\x5e\x09\
+\x36\x16\x5c\x90\x8d\x5a\xa6\x5b\x97\xfc\x16\x57\x5f\x75\x3e\xdc\
+\x48\x49\xec\xa0\x11\xde\xea\x24\x0a\xc9\x49\xa9\x61\xb7\x71\x64\
+\x03\x61\x81\x16\x31\xbc\xd1\x3a\x8b\xd4\x3c\x6f\xb2\x77\xd9\x82\
+\x8b\x80\x6a\xf9\x5b\x0d\xd7\xe8\x43\xca\xf3\x68\xae\xd0\x8e\xa9\
+\x08\x93\x86\x67\x74\x88\xf3\x07\x86\x9a\xe3\xbe\x72\x65\x05\xd9\
+\x6c\x51\xaf\xcd\x89\xa2\x5c\x23\x38\x29\x13\x56\x72\x62\xc1\xa6\
+\x92\x63\x6d\x0c\x62\x93\x93\xe3\x7b\xca\x65\x9d\x3d\x63\xfd\x0e\
+\x55\x64\x1f\x66\x99\x36\xde\xa7\x1a\xa5\x04\x0a\x8e\xb1\x02\xaf\
+\x0a\x7b\xd3\x33\xe4\xdf\xa6\x4d\xeb\xc0\x4f\x7e\x74\x35\xce\x3e\
+\xfb\x2c\x94\xf2\xd9\x40\x0d\xbc\x86\x78\x82\xb5\x99\x6c\xc4\x5c\
+\x92\x36\x5d\x34\x78\xfa\x9c\xf3\x7a\x83\x96\x44\x41\x7e\x50\x7a\
+\x3b\xd7\x77\x0c\xaa\xf4\xd2\xc8\x9b\x72\x6c\xc2\x9b\x96\x70\x14\
+\x43\x01\x97\x0d\x87\xbd\xaa\x83\x8b\x2f\x59\x8c\x43\x3e\xfe\xbf\
+\xe8\xe9\xa3\x7a\x13\x60\xa2\xea\xfa\x00\x00\x20\x00\x49\x44\x41\
+\x54\xd7\xb6\x83\x4c\x36\x8f\x64\x9b\x5e\x8b\x8e\x41\x28\x4f\x1a\
+\x6c\x3c\x84\x15\x5b\xe5\xd8\x41\x94\x56\xd8\x79\x82\x02\xda\x2b\
+\x97\xaf\xc0\xbe\xef\xd9\x0b\xe9\xbe\x15\xeb\x14\x0c\x6d\x5d\x5b\
+\x6a\x65\xac\x9b\xf1\xb1\xda\x8e\xb1\xbe\xdf\x7a\xba\x1a\xa8\x5d\
+\x70\xc1\x05\x38\xed\xb4\x53\xe5\x34\xb9\x5c\x01\xed\xed\x29\x5c\
+\x7a\xe9\x65\xd2\x1f\x51\xed\xbf\x3a\x13\xeb\xdf\xe1\xdf\xf0\xff\
+\xd9\xfb\x0e\x38\xb9\xaa\xea\xff\x33\x7d\x6b\x7a\x02\x84\xa2\xa2\
+\x08\x82\x05\x45\x44\xa5\x88\x54\x01\xe9\x41\x90\x8e\x52\x44\xe9\
+\x90\x50\x42\x0d\xbd\x28\xe5\xa7\x20\x5d\x01\xa5\x93\x90\x84\x5e\
+\xc4\x42\xef\x58\x80\x20\x4a\x4d\xdf\xcd\xf6\xdd\x69\xef\xfd\xfd\
+\x9e\x73\xcf\x9b\x3b\x6f\x67\xe6\x4d\xdd\x24\xf0\x7f\x7c\xc2\xec\
+\xee\xbc\x72\xdf\x2d\xe7\x7b\x4f\xfb\x1e\x22\x77\xd7\x6a\xda\x55\
+\x35\x18\xc6\xe3\xf1\x7d\x52\xa9\xcc\xed\x1a\xd0\x50\x8d\xe6\x53\
+\x4d\x83\xed\x1d\x80\x1f\xd8\x00\x42\x57\x5d\x75\x15\x1d\x7a\xe8\
+\x4f\x18\x30\xb0\xc3\xc5\x81\xf0\xf4\x9d\x76\xda\x89\x9e\x7f\xfe\
+\xf9\xbc\x34\x87\x62\x9a\x48\xa9\x76\xf9\xcd\x09\x36\x08\xea\x77\
+\x0a\x86\xd8\x41\x41\x33\xc2\xef\x35\x05\xd0\x30\x18\xc6\xe9\xf4\
+\x33\xce\xa3\x03\x0e\x38\x80\x92\x08\x9c\x09\x23\x7a\x0e\x65\x62\
+\xb0\x13\x16\xc0\xe0\x60\x14\x96\x48\x66\xe7\xad\x95\xb5\x8d\x59\
+\x8a\x53\x19\xec\xc3\x22\x67\xe6\xd8\x3a\x4e\xc6\x36\x3e\x41\xe3\
+\x1b\xd4\x0a\x77\x4c\xa1\x06\x0d\xd1\xa7\x22\xc9\xa6\x44\x2a\x1a\
+\x7c\xf0\xc1\x07\xec\x6b\xd2\x8d\x91\x56\xf7\x78\xe0\x81\xbb\xe9\
+\xe6\xdf\x5d\x46\x91\x88\xec\xee\xb1\x86\xd0\x4c\x8d\xbc\xb5\xf3\
+\xbd\xd5\xda\x90\xef\x87\x10\x60\xb3\xe7\xd8\x8c\x19\x33\x38\x88\
+\x06\x66\xd1\xfc\x23\xf7\x8e\xb6\xdf\x13\x1a\x58\x2d\xc7\x70\xcd\
+\xb0\xf0\x53\xbd\x20\x4a\x74\xa7\x69\x0a\x3e\x59\x33\xec\x47\x70\
+\x0a\x34\x3f\xf1\x0f\x62\xf3\xa1\x60\x88\x8d\x06\x83\x0d\x12\xe8\
+\x23\x18\x03\xa9\x8a\xa0\xa6\x34\x54\xf4\xe0\xf1\x61\x8d\x4a\x74\
+\x4f\x0e\x8a\xe1\x14\x15\x2b\xca\xd4\x44\x8f\x4a\xd4\xa9\x70\x98\
+\x32\xd1\x36\x28\xd7\x22\x12\x40\x03\x30\x8c\x85\x61\xbd\x00\xa7\
+\xa8\x4b\xa3\x46\xb5\xd3\xf5\xd7\xfd\x96\xce\x3f\xff\x5c\x4a\x71\
+\xa0\x97\x98\x55\x23\x20\x95\x50\x62\x6b\xcb\xe7\x0a\xe0\xd3\x00\
+\x27\x47\x05\xa2\x27\x49\x6c\x33\x6d\xce\x87\x89\x80\x2a\x06\x32\
+\xcb\x3c\x2a\x3e\x6d\x13\xdd\x95\x11\x1f\xea\x25\x57\x5c\x49\xfb\
+\xed\x77\x00\x57\x3a\xc1\x5c\xe4\x02\xc4\xd8\x58\xc5\x24\x4a\x16\
+\x87\x57\xc6\xcb\x02\x45\x58\x08\xf0\x35\x0a\x3c\x63\xae\x60\x53\
+\x04\x73\xee\xc7\x1f\x7e\x44\x3b\x6c\xbf\x15\x65\xd3\xdd\x2b\x04\
+\x18\xa2\x8c\x9c\x5d\xcc\x1a\xae\x9d\xbf\xfd\xed\x6f\x2b\x94\xe9\
+\x11\xc1\x32\x88\x84\x3f\xf2\xc8\x23\x69\xfc\xf8\xf1\xcc\xa6\x85\
+\x79\x8a\x12\x68\x97\x5d\x76\x19\x75\x59\xfe\x61\xac\x57\x00\xa9\
+\x46\xc6\xd6\xb2\xc6\xea\x73\x6d\xe8\xc7\x44\xd9\x3b\xaa\xb9\x57\
+\xd5\x60\x68\xa6\xe5\x92\x58\x2c\x36\x41\x4d\x8f\xd5\x34\xa0\xda\
+\x6b\x0a\x99\x49\xe1\x30\x87\x7a\x7f\xd0\x41\x07\xb1\x2f\x4f\xcb\
+\x2a\x2d\x5a\xb4\x88\x0e\x3b\xec\x30\x7a\xe6\x99\x67\x38\xa0\x06\
+\x03\xa7\x41\x17\x9e\xa6\x53\x46\x43\x6c\x16\x1a\x05\x3c\xdb\x6c\
+\xaa\xf6\x76\xd5\x22\x6b\x0d\x99\x56\xcd\x15\x51\x9b\x59\x27\x42\
+\x67\x9d\x73\x3e\x1d\x78\xc0\xc1\x6c\x96\x80\xe9\x2c\x89\x6a\xf1\
+\x91\xb8\x14\xcf\xb5\x76\x69\x52\xd0\xd6\x04\x39\x98\x9f\xc0\xb9\
+\xe8\x30\x92\xe5\xcc\x54\xf2\xca\x02\x66\x46\x0f\x33\x66\x3e\x00\
+\x6b\xd8\x23\x73\x86\xd0\xf2\xd2\x21\x18\x78\x2d\x00\x62\xa1\xed\
+\xb2\x1f\xef\xbf\xff\x7d\x97\x32\x49\x49\x05\x60\x93\x66\x93\x00\
+\xd8\x9c\xd9\x77\xd3\x1f\xff\x78\x35\x73\x8b\x2a\x18\xea\x93\xb9\
+\x9d\x79\x48\x93\xbb\x37\x6b\x8a\x4c\x28\x8d\xd2\x4e\x12\x19\xaa\
+\x9b\x2f\xf8\x0c\xb1\x4b\x45\x6e\xa1\xf6\xb7\x9a\x00\x6d\xc6\x0d\
+\xd1\xb2\xe4\x1d\x6b\x39\x82\xc0\xb0\x7f\x48\x82\x63\x20\xb8\x39\
+\xd5\x0c\xa9\x0f\x48\x72\x77\xc0\xd2\x13\xa2\x9e\x5e\x44\xe9\x82\
+\x15\x47\x34\x66\xc7\xd0\x7b\x29\x18\x3a\x66\xcc\x60\x99\x96\x22\
+\xb2\x59\xf6\x7b\xf1\x06\x00\x39\xad\x30\x93\x5a\x3b\x91\xfc\xf9\
+\x9f\xdb\x00\x0c\xff\x7b\xce\x07\x1b\x8a\x46\xb8\xb4\x90\x6e\x38\
+\x90\x42\x81\xae\x19\xd5\xde\x4a\x7f\xf8\xc3\xad\x74\xd9\x65\x97\
+\x50\x1f\x73\xec\xca\x98\x66\x98\x5a\x10\x41\x32\xc8\x93\x13\x02\
+\x6a\xe5\xf7\x54\x5f\xa1\x46\x30\x7b\x56\xe2\xbc\x20\x2b\x3b\xc0\
+\x07\x39\x79\x22\x6e\xa4\x8d\xb0\x58\xe4\x46\x24\x91\x90\x8d\xe3\
+\x25\x97\xfd\x8a\xf6\xd9\x67\x5f\xea\xe9\xee\xe7\x7e\x4c\x67\x1c\
+\x6a\x1f\x3d\x8a\x06\x07\xfb\x0d\x18\xca\x38\x22\x85\xc4\xc8\x20\
+\xfe\x00\xb0\x8f\x19\x33\x86\x52\xc9\x41\xe9\x5f\x68\xc2\x11\xa2\
+\xf9\xf3\xe7\xd3\x0f\x77\xda\x8e\xfa\xbb\x16\x2c\x57\x30\x44\x9b\
+\x40\x9c\x8d\x2a\xf3\x1b\x6f\xbc\x31\xb5\xb5\xb5\x52\x67\xe7\x32\
+\x5a\xbc\x78\x31\xcf\x63\x14\xe1\x5d\x9e\x07\xda\x67\x07\x6a\x41\
+\xbb\x06\x10\x62\xfe\x61\x5c\xd0\xb7\x68\x2b\x28\xdc\x70\xe8\x46\
+\xb7\x1c\x17\xd3\x08\xbe\xd7\x52\x22\x67\x62\xb5\xcf\xab\x09\x0c\
+\x47\x8d\x1a\xf3\xab\x9e\x9e\x1e\xd1\x9b\x47\xf8\x28\x04\x86\xd8\
+\xa1\x6c\xb0\xc1\x06\xf4\xd9\xcf\x7e\x56\x20\xc0\xf0\x87\x42\x48\
+\xce\x9c\x39\xd3\xf3\x15\xd8\x26\x5d\xcb\xe9\x3a\xc2\x6f\x10\xfc\
+\xb8\x1c\x18\x22\xc1\xde\xa1\x8b\x2f\xbe\x8c\x0e\x39\xe4\xa7\x1c\
+\x25\xc7\x7e\xc2\x10\x02\x19\x10\x64\x21\x66\x0b\x3d\x72\x60\x28\
+\x42\xd2\x18\x97\x44\xf8\x20\xba\x4f\xa3\x0e\x24\x7b\x4f\x84\x0b\
+\xfc\xbf\x21\xa2\xee\x9e\x34\x75\x77\xf7\x33\x08\x71\x0d\x3d\x0d\
+\xe1\x37\x25\x6b\xf0\x1c\xce\xe7\x8a\x88\xbf\x18\x11\x89\xf0\x39\
+\xbd\xfc\xe2\x8b\xf4\xab\x5f\x5d\xc6\x7e\x1f\x01\x4e\x44\xde\x26\
+\x78\xf1\x2c\x59\xfa\x31\x7d\xf4\xe1\x5b\x14\x0a\x29\x61\xb3\xb6\
+\x34\x37\xfd\x38\x2a\x55\x5a\xc2\xff\x57\xbf\x9b\x77\x26\x27\x3c\
+\x43\xdb\x97\xc2\xa5\xd0\x0c\x4f\x3f\x7d\xba\x91\xcd\x36\xb7\x66\
+\xb1\x80\x8e\xda\xc0\x50\xe7\x53\x5e\x0a\x81\xc6\xbf\x42\x1b\xcb\
+\x12\xbd\xfd\xf6\xbf\x99\x2d\x06\xfd\x06\xbf\x2e\x07\xbd\x80\xba\
+\x2e\x16\xa7\xa6\x44\x1b\x6b\x39\x00\x48\xdd\x80\x61\xf3\xa4\x01\
+\x1f\x00\x3a\xc9\x87\x14\x33\x64\x6f\xdf\x32\x9a\x3d\xfb\x7e\x7a\
+\xe7\x9d\x77\xb8\x26\x60\xd8\x05\x94\x14\x7b\x37\x61\x18\xd1\xc3\
+\x9b\xdf\xc6\xb7\x88\x75\x00\x2d\x0b\x0c\x2b\x30\x25\xba\xb8\x17\
+\x82\x72\xa2\x02\xcc\x48\xdb\x47\x15\x83\x8f\xe7\x7f\x48\xcb\x3a\
+\x3b\x25\xd8\xc6\x90\x3d\xe4\x34\x3f\x4b\x54\xe4\x59\x18\x64\x9b\
+\x80\x9a\x96\x1c\x08\xc2\xb4\x6b\x61\x6a\x6a\x6e\xa1\xfd\xf6\x3d\
+\x80\xd6\x58\x03\xee\x9b\x28\x45\xe3\xcd\x92\x94\x0e\x48\xd4\x04\
+\x71\x93\xef\x88\xeb\xe1\x1b\xc4\x75\xc8\x13\x5d\x6f\xdd\xf5\x39\
+\x60\x0b\xc1\x58\x88\x26\xed\x1b\xe8\x97\x5c\x47\x84\xc0\x1a\x92\
+\x76\x2e\x89\x84\xf5\x1d\x86\x3f\x35\x42\x43\x43\xa8\x96\x12\x67\
+\x6d\x10\xbf\xf7\xf7\xf6\x50\x53\x73\x9c\x23\xc8\xb7\xdb\x76\x4b\
+\x4a\xf5\x2f\x25\x10\xd8\xe5\xd6\x48\xd0\xf6\x26\x78\x7d\x96\x3a\
+\x43\xcd\xa1\xf6\x66\x19\x5a\xe0\x0b\x2f\xbc\xc0\x7d\x22\x29\x20\
+\x44\x8b\x17\x2f\xa1\x83\x0f\x3e\x98\xc1\x10\xef\xa3\x5c\xa1\xb8\
+\xb7\x6e\xbe\xcb\x71\xe3\xd4\xd6\xda\xe1\x57\x17\x92\xaf\xbc\x2e\
+\x8d\x6f\x43\x41\xd0\x1b\x4b\x5f\xb2\x7f\xbd\xdb\x53\xce\xfd\x62\
+\xb1\xd8\xe5\xe9\x74\x52\x42\x60\xab\x38\x6a\x02\xc3\x58\xac\xe5\
+\xeb\x99\x4c\xf2\x15\x09\x15\x1f\x59\xfb\xb1\x7f\xb0\x54\x58\x61\
+\xf2\x89\x90\xce\x77\xb8\x43\x58\xb0\x5f\x41\x7d\x5e\xa6\xb3\x56\
+\x0a\x30\x64\x2d\xab\x89\xb5\xde\x9f\xfe\xf4\x10\x6e\xf9\xd0\x10\
+\x82\x68\xe0\x4b\xcb\x4f\xf1\x92\x7e\xc8\xcd\x04\xfd\x59\xeb\x99\
+\xf2\xf7\x3e\xfd\x10\xe2\x4b\x49\x34\x96\x75\x3a\xd4\xd1\xd9\xcd\
+\x1a\x0c\x57\xfd\x36\x89\xb5\xec\xa3\x32\xa9\x0a\xc8\x2f\x8b\x19\
+\xda\x2a\x06\xc3\x31\xed\x74\xf7\x1d\xb7\xd3\x69\xd3\x4f\xa5\x4c\
+\x72\x80\xc2\xac\xc5\x38\x92\x83\xe6\x4a\x99\x1b\xd7\x85\xf9\xcd\
+\xa6\xa1\x46\x4b\x0c\x40\x41\xc0\xf9\x12\xaa\xf3\x4b\x0a\x41\x80\
+\x2e\x5f\x30\xd4\xf9\xed\x11\xa2\x18\xb3\x25\x9b\xee\x40\x58\x00\
+\x30\x9c\xf7\x1f\xfe\x44\xd5\x0e\x08\xeb\x50\x24\x6a\xf2\x2d\xc3\
+\x0c\x92\xa2\xd9\x4a\xb1\x61\xfc\xcc\xb5\x2f\xb3\x0e\x0d\x0c\xf6\
+\xb3\x9f\x0b\xda\x0d\x2a\x3e\x40\xa3\xfe\xe8\xa3\xf7\xb9\x36\xe3\
+\x5f\x9f\x78\xc2\x10\x61\xa3\xef\x4a\x45\x6e\x96\xfa\xce\xf2\xb1\
+\xa1\xdd\xd8\xf8\x30\x67\xb5\x59\xb3\x21\xc7\x94\xf2\x19\x34\xe6\
+\x54\x53\xa2\xc8\xac\xe9\x61\x16\x8e\x22\x11\xa4\xe0\xa4\x85\xb9\
+\x3e\x9b\x75\x68\xf2\x6a\x6b\xd0\xb5\xd7\x5e\x4f\x5f\xfe\xf2\x57\
+\x29\x9d\x85\x69\x36\xc1\x1b\x2f\x2d\x42\xac\x42\x54\x35\x4c\xb0\
+\x04\xc1\x1c\x07\x30\x80\x96\xb8\x0c\x75\x1c\x33\x19\x26\x7b\x07\
+\xa3\x0d\x03\x02\xaa\x74\x18\xdf\xa3\x06\x77\xc9\xbe\xce\x61\x53\
+\x1d\x48\x04\x60\x35\x01\xd0\x60\xee\xa1\x7c\x14\x2a\x34\xec\xf0\
+\x83\xad\xa8\xb7\x73\x41\x43\xc1\x50\x2a\xb4\x08\xc5\xa0\x5a\x46\
+\xd0\x66\xf4\x9d\xd6\x36\x45\x1b\xdf\x7e\xfb\x6d\x4e\xb8\x47\x2a\
+\x16\xf8\x74\xe1\xf3\xde\x68\xa3\x8d\xe9\x95\x57\x5e\x31\x9b\x0a\
+\x89\x8e\x56\xb0\xa9\xc6\x95\x53\x05\x0e\x0c\xbb\xa4\x10\x18\xea\
+\x98\xf9\xc1\x59\x2d\x33\xf5\x78\x6e\xb5\xf7\x90\x4d\x47\x0a\xf5\
+\x76\x5f\xad\xf6\x1e\x35\x81\xa1\xec\x14\x22\x4f\xb9\xae\xfb\xbd\
+\x6a\x1b\x50\xed\x75\xfe\xc1\xc2\x64\x64\xd3\x8e\x89\x6c\xc5\x24\
+\xd4\x90\x65\xf5\x37\x69\x14\x99\x5f\xb5\x5f\x11\x06\xb3\x50\x3f\
+\x78\x9a\xa1\xa1\x63\xfb\xcd\xd5\x57\xd1\x91\x3f\x3b\x92\x41\x24\
+\x93\x45\x10\x8d\x98\x33\xf3\x8f\x60\xcd\x48\xf6\xee\x79\x31\xa7\
+\xb2\x88\x89\x08\x56\x90\xa5\x4b\x40\x0e\x2d\xb5\xef\xc0\x34\xc3\
+\x31\x8c\x26\xda\x11\xec\x29\xa2\x19\x4a\x15\x80\x4c\x6a\x80\xc6\
+\x8c\x1d\x4d\x0f\x3d\x30\x97\x4e\x3c\xe9\x78\xea\xe9\xea\xa0\x48\
+\x2c\xce\xc9\xda\x5a\x3b\xae\xa5\x35\x41\x83\x03\x30\xaf\xe8\x93\
+\x4d\x8b\xad\xc4\xe9\x1c\x18\xaa\x66\x98\x1f\x70\x11\x02\xb8\x2e\
+\x67\xcd\xd0\xee\x67\xaf\x2a\x83\xe9\xfe\x54\x9a\x68\xde\xbc\xf7\
+\xc8\xc9\xc2\xbf\x05\xcd\x3d\xc4\x9c\xad\x28\x73\x05\xad\x9e\x4d\
+\xbe\xc6\x64\x2b\x1b\xb2\x9c\xb9\x90\x4d\xf6\xe0\xf1\x84\x7f\x2e\
+\x94\xa1\x89\x13\x27\x30\xc3\xcb\xd4\xa9\x27\xd2\x23\x0f\xce\xa1\
+\x78\x0b\x72\x4a\xfb\x95\xc6\xbb\xc8\x92\xc9\x95\xb3\xb2\x77\xeb\
+\xaa\x25\xf2\xf3\xa0\x03\x22\x92\x12\x79\x9e\x66\x97\x04\xeb\x02\
+\x7c\x89\xa8\xf8\xa1\x01\x3b\xaa\xfd\xeb\x0c\x01\xc0\x95\x17\x20\
+\x87\xce\xc0\x9c\x0c\x51\x73\x73\x1b\x3d\xf6\xd8\x63\xb4\xce\x17\
+\xbe\x48\xbd\x03\x83\x34\x80\x32\x4e\xcc\x80\x83\xc9\x67\x9b\x4b\
+\xe5\x75\x94\xe7\x97\xfb\x86\x49\x1d\x10\x1d\x2e\x65\xbd\xa4\xbe\
+\x60\x26\xe7\x33\x0c\x87\x29\xe2\xca\xfc\xd0\x0d\x2e\x5f\x9f\x49\
+\x52\x3a\x39\x44\xcd\x2d\x90\x05\x92\x4f\xf9\xfe\xfb\xef\xd3\x4e\
+\x3b\x6e\x47\xe9\x81\x65\x0d\x05\x43\x1d\x14\x3b\x65\x0b\xe3\x60\
+\xf7\x1b\x4c\x8d\xff\xf8\xc7\x3f\x98\x29\x49\x2d\x39\x78\x4f\x90\
+\x76\x80\xb6\x51\xe5\x15\x04\x3b\xbb\x06\x2c\x50\xac\x56\x4e\x56\
+\x7b\x5d\x21\x65\xc3\x56\x1c\x56\x30\xf3\x28\xac\x31\x7f\xce\x64\
+\x92\x5b\x56\xfb\xbe\x8c\x65\xb5\x5c\x2c\xd7\x46\x0e\x26\x72\x6f\
+\xae\xfd\x3e\x95\xdd\xa1\x98\x1a\xaf\x77\xc1\x4e\x1b\x93\x09\x3b\
+\x45\x15\x42\xba\xa3\x59\x59\xc1\xf0\xd7\x57\x5f\x41\x47\x1c\x0e\
+\x62\x64\xf1\xf1\x49\x98\x3a\xd1\x50\x72\x88\x9a\x12\x9a\x47\xa7\
+\xc1\x33\xb6\x19\x08\x46\x47\x31\xa3\xc9\xbb\x0b\x28\x49\xca\x85\
+\x18\xdf\x20\x14\xf1\x4d\x47\x47\x92\x16\x2f\xed\x62\xa1\x8e\xdd\
+\x3c\x13\x3b\x9b\xdd\xb8\x04\x7f\x44\x4c\x7e\x1a\xbe\x47\x5a\xda\
+\x20\x9b\x49\x67\xdf\x3f\x93\xce\x38\x63\x3a\x0b\xf1\x5c\xf2\x7c\
+\x2e\xc5\xc3\xcb\x79\xd4\x01\xf2\x51\x57\xf9\x8d\x56\x2b\x9a\x66\
+\xe8\x9f\x9d\xcc\x51\x09\xdf\xa0\x28\x5a\xac\xf9\xbd\xf3\xce\x87\
+\x94\x4a\x23\x28\x26\xc1\x1a\x21\xd2\x05\xa0\x25\x89\x56\x29\xa6\
+\x4c\xdd\x90\x29\x61\x05\x6b\x88\xf1\x08\x0d\x0d\xf4\x53\x3c\x11\
+\xa5\x81\x81\x5e\x36\xef\xf5\xf7\x74\xd3\x19\x67\x4e\xa7\x87\xe7\
+\xce\xa1\x44\x4b\x9c\xd2\x49\x44\x79\x16\xd7\xfe\x40\x88\xae\x87\
+\x98\x38\x05\x50\x58\xc3\x0f\x4b\xa0\x0e\xf8\xfb\xc4\x4c\x2b\x1a\
+\x21\xc6\x8f\x7d\xb2\x61\x69\x1b\xfc\xec\xca\xd2\xc4\x95\x2e\x3c\
+\xd3\x17\x4c\xeb\x76\x6a\x8a\xbf\x1d\x61\x06\xb3\xe4\x10\x8a\x28\
+\xb7\xb0\x79\x18\x24\x0e\x4f\x3c\xf1\x27\x1a\x3f\x7e\x22\xf5\xf6\
+\x0f\x52\x04\xc9\xf3\xf2\x54\x43\x08\x21\xdb\x31\xd1\xf0\x1c\x1a\
+\x1c\x4c\x52\x5b\x5b\x0b\x6b\xd4\xd8\x6c\x41\x43\x54\x0b\x0f\x83\
+\x3b\x82\x7f\xd8\xac\x6a\x52\xa1\x18\xcf\xe5\x8e\x68\x3f\xae\x69\
+\x69\x42\x85\x12\x04\x97\x01\x48\x24\x6d\x04\x11\xce\xbb\xed\xfa\
+\x43\xea\x5f\xb6\x78\x44\xc0\x10\xa6\x6f\xc8\x1c\xf4\xb7\x52\x07\
+\xe2\x3d\xd0\xbe\x35\xd7\x5c\x93\x83\x65\x50\x63\x50\x49\xfd\x61\
+\xc1\xda\x6f\xbf\xfd\xe8\xc1\x07\x1f\xe4\x40\x3b\xf8\xde\x75\x63\
+\xcf\xef\x66\xcc\x92\x9a\xbe\x55\x99\x94\xac\xfe\xec\x62\x60\xa8\
+\x00\xbf\xa2\x81\x21\x51\xe8\x10\xa2\xec\xef\xaa\x7f\xe3\xba\x80\
+\x21\x6b\x10\x4b\x5c\xd7\x9d\x50\x4b\x43\x2a\xbd\xd6\x3f\x58\x92\
+\x18\x2a\x94\x6c\x58\xc4\x5e\x60\x82\x21\xd4\x56\x13\xc6\x8a\x37\
+\x88\xc5\xdf\xdc\xd6\x0c\x13\xcd\x71\xfa\xf5\xaf\xaf\xa2\x83\x0f\
+\xfa\x09\x0b\x0f\x2e\x9e\xaa\xc4\xa4\x01\x9d\x97\xcf\x8a\x82\x93\
+\x6d\xdd\x30\x17\x3c\x83\xbf\x76\x74\x26\xa9\x63\x69\x17\xb9\x4e\
+\x94\x42\x06\x0c\xd9\xf4\xc5\x5c\x8e\xc2\xea\x0f\x53\x5e\x4e\x33\
+\x14\x30\x9c\x79\xdf\xdd\x74\xfa\x19\xa7\x51\x6f\x57\xa7\x29\x6e\
+\x1a\x62\xe1\x0e\xe1\xca\xf5\xe0\x86\x11\x2d\xe7\x6b\xb4\x39\x9f\
+\xa1\xbc\x4c\xbe\xcf\x50\xe8\xd9\x30\xae\xcb\xcb\x67\xa8\x39\xa9\
+\x3a\xef\xe0\x4b\xe5\x52\x76\x16\xf5\xdd\xbf\xdf\x59\x44\x49\xb0\
+\x93\x51\x8c\xcb\x2e\x35\x35\xb5\x52\x36\xe3\x9a\x2a\xf3\xf0\x7f\
+\x89\xb5\x82\x7d\x5d\x91\x28\x07\xc8\x48\xe1\x61\x90\x14\xc0\x6c\
+\x0a\x50\xec\x65\x33\x5f\x6f\x5f\x17\x9d\x7e\xfa\x69\xf4\xe8\x43\
+\x73\x29\x02\x42\xe8\xec\x20\xf3\x88\xe6\x8e\xfc\x00\x12\x80\x2b\
+\x5b\x45\x38\x22\x58\xbe\x03\xf9\x34\xfa\x11\x9a\x1f\x2c\x09\x66\
+\xdb\xc3\x8a\x99\xd0\x80\x81\x54\x5b\xa2\x84\xfd\xa6\x50\xbc\x67\
+\x2e\x60\x4c\x02\x83\x4a\xcc\x54\xde\x00\x20\xd5\x07\x54\x7c\xc8\
+\x2f\x05\x59\xfb\x9f\xfe\xf4\x27\x1a\x3f\x6e\x22\xf5\xf4\xf7\x53\
+\xbc\x75\x94\xe7\xb3\xf6\xf2\x24\x35\x5f\x12\x9f\x4e\x88\xc6\x8e\
+\x6d\xa1\xc1\x41\x87\x7a\x7b\xbb\xb9\x3d\x68\x03\xe6\x0e\x07\xab\
+\xa5\x87\x3c\xf3\x32\xc6\x42\x4b\x42\xd9\x81\x1f\xe0\x21\x1d\x18\
+\xe8\xa3\x64\x72\x88\x81\x1e\x29\x23\xf3\xe7\x7f\x44\xbb\xed\xb2\
+\x13\x2d\x59\xf8\x61\x9e\xcf\xb5\xde\x72\x40\x83\xe7\x0a\xf5\x91\
+\xfa\x0d\x11\x40\x83\x20\xbe\x55\x57\x9d\xc4\x79\xbd\x12\xc8\x44\
+\xb4\xcd\x36\xdb\xd1\x13\x4f\x3c\xe1\xe5\xec\xd5\x42\xd4\x51\xa9\
+\x1c\x2d\x76\xfe\x4a\x06\x86\x35\x05\xce\x78\x9b\xc8\x7a\x74\x5e\
+\x34\x1a\xbf\x38\x93\xc9\x4c\xab\xc7\xbd\xca\xbd\x47\x21\xcd\xd0\
+\x4e\x73\xd0\x5d\x95\xee\x8a\x47\x7a\x67\x55\xee\x7b\x94\x3a\x2f\
+\x07\x86\x30\xb5\xa5\xe9\xca\xab\xae\xe2\x44\x58\x0e\x9c\x31\x95\
+\x01\x20\xd0\x60\x2e\x55\xd6\x7d\x7f\xbf\xf0\x3d\x38\xc0\x03\x35\
+\xef\x54\xa0\x49\x54\x60\x8e\x01\x04\xbb\x75\xe4\x11\x0a\x18\x2e\
+\xed\xe8\x11\x73\x1f\xfc\x3c\x59\x21\x82\xd6\xc4\xfd\x7c\x30\x84\
+\x66\x08\x9f\x61\x2b\x3d\xfc\xe0\x83\x74\xdc\xf1\x47\x31\x73\x49\
+\x38\x02\x0f\x23\x34\x22\xad\xae\x1e\x6c\x80\x18\xae\xad\xe7\x27\
+\xd3\xeb\x8e\x74\x79\x81\xa1\x8e\x13\xda\xc9\xda\x89\xf9\x83\xc2\
+\x13\xcc\xca\xef\xfe\x77\x29\xf7\x9b\x4b\x88\xbe\x74\x28\x11\x6f\
+\xe5\x08\x4a\xf4\x43\x38\x02\xde\xd4\x28\xa7\xa0\x00\xb4\xda\x5a\
+\x9b\xf9\x13\x1a\x4c\x7b\x7b\x2b\x0d\x0d\xf6\x33\x37\x2b\x0a\xc5\
+\x4e\x98\x38\x86\x3a\x3b\x97\xd0\x49\x53\x4f\xa0\xc7\x1f\x7e\x90\
+\x22\xa0\x6a\x4b\x0e\x14\x98\x2a\x39\x40\x8c\xc7\xa4\x9c\x18\xda\
+\x05\x26\x1f\xd6\xf8\x0d\x78\xa2\x45\xcd\x4d\x92\x6e\x00\x21\xac\
+\x74\x78\xd0\xf9\x73\x74\xd5\x72\xfb\x5c\xf4\xad\xd6\x38\xe4\xbf\
+\x8a\x1f\x78\x58\x24\xb2\x6c\x5b\x00\xc0\x42\xfc\x80\x0a\x24\xb0\
+\x1c\x64\xa8\xb5\x79\x0c\xfd\xe9\x4f\x4f\xd1\xda\x6b\x7f\x8e\x96\
+\x76\x76\x53\x16\xf9\xb0\xf2\x84\x61\x9b\x31\xcc\xe1\xbe\xde\x5e\
+\x8e\x58\x04\xd0\xa9\xdf\x0f\xfd\x8c\xdf\x99\xdb\x17\xbe\x68\x43\
+\xf2\xc1\x1a\xaf\x71\x77\x32\x23\x4e\x34\xcc\xd7\x63\x53\xd6\xd7\
+\xd7\xcb\x91\xc7\xc8\x31\xc4\xbf\x79\xef\xbc\x4d\x3b\xef\xb8\x03\
+\xa5\x06\x7b\x1a\x0a\x86\x9a\x56\x05\x6d\x70\x8b\x2d\xb6\xa0\xd5\
+\x56\x5b\xcd\xf8\x5f\x23\xac\xe5\x62\xd3\x03\x8d\xf0\xa4\x93\x4e\
+\xa2\xb1\x63\x47\xe7\x8d\xe5\x0d\x37\xdc\xc4\x4c\x39\xb0\x66\x61\
+\x33\x8f\xf3\x31\x37\xa0\x25\xde\x7d\xf7\xdd\xf4\xee\xbb\xef\x96\
+\x45\x0c\x52\x0f\x99\xe3\x01\x43\x01\x32\x87\x15\xd8\x4c\x7a\x09\
+\x91\x73\x72\xad\xef\x1f\x2c\xa5\xca\x78\x42\x22\x91\xf8\x62\x32\
+\x99\x7e\xbb\x8c\x53\xeb\x76\x4a\x31\x30\xd4\xd0\x7b\x3b\x80\xa6\
+\xde\xbb\xc0\xba\xbd\x44\xc0\x8d\x6c\x30\x1c\x35\x7a\x2c\x5d\x78\
+\xe1\x45\x74\xc8\x21\x87\x90\x9d\x4b\x2e\x42\xa8\xf4\x8d\x78\x90\
+\x61\xd7\x83\x70\xd4\xbc\x2e\x0e\x93\x57\xe1\x24\xc2\x0c\xbf\x77\
+\x2e\x4b\x51\x67\x47\xaf\x68\x86\xa8\x35\x08\x41\x07\x11\x16\x83\
+\x70\x94\xa0\x1d\x4f\x33\x0c\x3b\x94\x49\x02\x0c\xdb\x68\xd6\xcc\
+\x7b\x69\xfa\xf4\x53\xa9\xbf\xb7\x8b\x35\x1c\x50\x75\xb1\x0f\xcc\
+\x15\x62\xe7\x14\xec\x88\x25\x8e\xfc\xf4\x8a\xe1\x41\x41\x00\xeb\
+\xe5\xa9\x19\x6a\x0e\x27\xea\x55\x4a\x92\xbc\x10\x01\x64\x01\x3a\
+\x59\xa2\x64\x8a\xe8\xc3\x8f\x17\xb1\x86\x44\x04\x56\x8e\x0c\x27\
+\xaa\x03\x1c\x91\x36\xe1\xb8\x43\xd4\xd4\x14\x63\x30\xc4\xb8\x8e\
+\x1b\x3b\x96\x85\x3e\xf2\xe2\x00\x86\xad\x2d\x4d\x34\x94\xec\xa7\
+\x6c\x0a\x01\x34\x51\xfa\xe8\xe3\xf7\xe8\x9c\x73\xce\xa2\x27\x1e\
+\x7f\x4c\xf2\x0d\xa1\xd9\x15\x4c\x41\x41\x74\x12\x40\x4d\x61\x39\
+\x4c\x89\x18\xd2\x4d\xc4\xb7\x8b\x61\x8f\x81\x54\x3b\x03\x46\x19\
+\xa9\xdb\x07\xcd\x4c\xb8\x51\x85\xfb\x54\x28\x15\xd3\x6c\x76\x87\
+\x16\x8a\xf5\x62\xe7\x68\x0a\x80\x89\xef\x78\xf8\x91\x03\x64\x31\
+\x0f\xa3\xe0\xb2\x43\xab\xad\xb2\x26\xd3\x77\x7d\xe9\x4b\x5f\xa2\
+\xee\xde\x7e\x8a\x40\x4b\x96\x24\x49\xb6\x1c\x84\x25\xb4\xd9\x03\
+\x58\xe5\x15\xd5\x7e\x8e\x99\x02\xbb\x92\x46\x24\x5a\x33\x97\xd5\
+\x75\xc4\xec\xeb\x05\x96\x40\x4b\x34\xff\xa0\x09\xa6\x86\x90\x9f\
+\x48\x14\x8d\xa1\x42\x7d\x8a\x73\x5f\x7f\xfa\x93\x03\xe9\xbd\xff\
+\xbc\xd3\x50\x30\xd4\x8d\x04\x22\x45\x91\x8b\x07\x3f\x20\xfa\x11\
+\x41\x33\xe2\x03\xcc\xcd\x69\x4d\x62\x47\xaa\x0d\xb8\x75\x79\x79\
+\x72\x5a\x8e\xc4\x3c\x00\x50\xf1\x0e\xc8\x8f\xc6\x7a\x9f\x33\x67\
+\xce\x48\x89\x1c\xef\x39\x85\xe4\xab\xca\xa3\x15\x2f\x80\xc6\x59\
+\x97\x88\xe6\xd5\xda\x49\x75\x01\x43\x69\x44\xe8\x5e\xa2\xd0\x1e\
+\xb5\x36\xa8\xdc\xeb\x0b\xa9\xf1\x76\xb8\x2f\x7e\x56\xd3\x69\x35\
+\x09\xef\xe5\xb6\xa3\x91\xe7\xe5\x69\x86\x59\xa2\xfd\xf6\xdf\x9f\
+\x77\x9d\x38\xe2\xf1\x98\x57\x62\x05\x3b\x63\x24\xe0\x8b\x29\xd2\
+\xf6\xc5\x18\x7e\x53\x14\x1c\x45\x5a\x03\x9b\xf4\x44\xb3\x41\xdf\
+\x70\x74\x9e\x89\x8a\xcc\x38\xa8\xbc\x10\xa5\xee\x9e\x01\x5a\xd6\
+\x89\x5d\x34\xa2\x1e\xa3\x2c\xec\x59\x68\xc6\xc2\x94\x71\xb3\x86\
+\x97\x32\x4d\x31\x5c\x0b\x5f\x4d\x32\xc9\xd1\xa4\xaf\xbf\xf2\x32\
+\x5d\x7d\xcd\xff\x31\x60\xea\xb6\x9d\x2b\x85\x73\x60\x48\xb0\x77\
+\xba\x5c\x30\x4c\xc4\xe2\x94\xfc\x1f\x8d\xd8\xb9\xe7\xcc\xa0\xe9\
+\x67\x68\x6a\x85\x1f\x3c\x87\xfb\xd6\xdc\x1a\xf3\x0c\x21\xac\x20\
+\xc4\x10\xf1\x38\x94\x82\xd9\x37\xc2\x80\x88\x40\x19\xd4\x1b\x6c\
+\x6d\x19\x4d\x8b\x16\x77\xb0\x79\x10\x7e\xb8\x21\x80\x21\xfb\x0c\
+\x85\x15\x07\xa4\x05\xed\xed\x2d\x1e\x8d\x15\x08\xb2\xe7\xcd\x9b\
+\x47\x7f\xff\xc7\xab\x94\x44\x1a\x41\x26\x49\xcd\x71\x98\x18\x85\
+\xdd\xa5\xaf\xaf\x8b\xe6\x3e\x30\x87\xfe\xfd\xf6\x5b\x26\xdf\x4f\
+\xa1\xc8\xbf\xf3\x51\x23\x38\x34\xfb\x10\x35\xc5\x5b\xa8\xbd\x7d\
+\x0c\x45\x63\xcd\xac\x9d\x42\x43\xc4\xfc\x18\x1a\xea\xa2\x55\x56\
+\x1d\x47\x6b\xae\xb9\x1a\x8d\x1d\x37\x8a\x03\x75\xa4\x32\x3d\xb4\
+\x77\x04\xfb\x48\xba\x0e\xd2\x2f\xe0\xaf\x45\x8a\x02\xe6\x08\x36\
+\x34\x20\xb0\xe8\xee\x46\x34\x70\xfe\xb3\x25\x92\x56\xfe\x86\xf1\
+\x43\xc0\x0b\xcc\xc2\xf8\x5c\x75\x95\xd5\xd9\x8a\xf1\x99\xcf\x7c\
+\x8e\x86\x00\xb4\xb1\xb8\x80\xa1\x39\x42\x86\x61\x48\x7f\x17\x8d\
+\x5f\xcc\xc6\x78\x6e\xdc\xaa\x3e\x22\x6b\x5d\x4a\x08\x01\xf8\xd4\
+\x1f\x87\x4d\xc9\x40\x7f\x2f\xa1\x4a\xcc\xcc\x7b\xef\x61\x96\x94\
+\xc1\x81\x3e\xa1\x9d\x73\x52\xdc\x76\x5c\x7b\xc5\x2f\x2f\x15\x18\
+\xb7\x7c\xae\xf5\xde\x20\xab\x49\x79\xec\xd8\xb1\x5c\xad\x66\xfb\
+\xed\xb7\xf5\x6a\x9b\x42\x1b\xc7\x7b\x21\xba\x55\x15\x2e\xdb\x4c\
+\x0a\x7f\x29\xde\x5f\xe9\x09\x31\x0e\xd8\x04\x20\x2d\x69\xdf\x7d\
+\xf7\x65\x13\xea\x48\x1f\x85\xc0\x50\xe4\x87\xcc\x37\x5b\xd6\xaa\
+\xd5\x66\xa4\xdb\x28\xcf\x73\xef\x23\x72\xf7\xac\xc7\xb3\xeb\x06\
+\x86\xd1\x68\xf4\x07\x99\x4c\xe6\x21\xd8\xf7\x31\xf0\x0a\x46\x68\
+\xa4\x38\xe2\x6b\xcf\xf3\xaa\xe5\x85\x0b\x81\xa7\x7d\x3f\xcf\xe7\
+\x62\x22\xdb\x6c\xcd\x52\x23\xc4\xd4\x14\xa2\x91\x6f\x6a\x32\x6b\
+\x54\x6a\x89\x0d\x86\x1a\xbc\xa2\x61\xf9\x62\x62\x13\x6d\x4b\x38\
+\x27\x73\x81\x31\xc3\xa2\x36\xbd\x74\xe7\xfc\x1e\xcc\x29\x1a\x22\
+\xf8\x34\x5e\x02\xfc\xa4\x39\x33\x9b\xe6\x21\x6a\x40\x86\x5e\xa5\
+\xa9\x34\xf2\x3b\x04\x11\xfa\x0c\x5a\xa3\x29\xb8\xe0\x05\x6e\x80\
+\xd7\xd0\x9f\x9f\xe7\x1f\xcb\xd2\xc2\x29\xcc\x3e\x36\x4e\x58\xa7\
+\x10\xa5\x9c\x0c\x5d\x78\xee\xf9\x34\xed\xd4\x69\x52\x89\x41\x15\
+\x0c\x5e\xad\x7a\x67\x05\x44\x18\x02\xa1\xdd\xd6\x36\xff\x20\xbb\
+\x17\x2d\xea\xa3\xa5\x9c\x87\x87\x9c\xcc\x38\xd7\x1c\x04\x18\xa0\
+\xfc\x52\x26\x2d\xc1\x20\xca\x09\xca\x74\x68\xec\x57\x94\x7c\x38\
+\xd9\xa8\xb8\x5c\xe1\xa1\xa7\xa7\x8b\xc6\x8d\x1d\x4d\xb7\xdf\xfe\
+\x07\x9a\x71\xee\x59\xac\x5d\x13\x22\x3c\x01\x84\x8e\x94\xac\x42\
+\xdd\x41\xd6\x84\x3c\x5a\x33\x68\x46\x80\x3b\xd9\xec\xe8\xdb\x20\
+\x55\x01\xf3\x24\x03\x86\x99\x30\xca\x1e\x35\xd3\x2e\xbb\xfe\x88\
+\x9a\x9b\xc7\x53\x34\x36\x9a\x42\x2e\x04\x30\x8a\x48\x25\x69\xcd\
+\xcf\x8c\xa3\x83\x0e\xf9\x11\xad\xb6\x7a\x1c\x59\xeb\x48\x55\xe7\
+\x67\x24\xff\xc7\x09\xda\x14\x1f\x4d\xd9\x8c\xf8\xb0\x18\x7a\x0c\
+\x43\x10\x4c\xad\xbd\xbd\xfd\xb4\x70\xbe\x6c\x90\x3c\xf3\x30\x4e\
+\x42\x99\x29\xe3\xf7\x4b\x67\x33\xd4\xda\xda\x46\x03\x7d\xd0\x40\
+\xc3\x94\x1a\x1c\xa2\x49\x93\x56\xe5\x39\x31\x98\x4c\x4a\x84\xb1\
+\x25\x4c\x3d\x50\xb4\xcd\x71\x25\x02\x84\xc2\x26\x12\x56\x40\x07\
+\xfd\x2e\xa9\x26\xf0\x78\xcf\x9a\x75\x1f\x9d\x79\xc6\x74\x06\xbf\
+\x6c\x1a\xc4\x06\xf0\x8f\x4a\xc5\x0d\xee\x7f\x43\x71\x67\xcf\x39\
+\xff\x7c\xab\x15\x1c\x85\x24\x3e\xca\xa0\xf6\xf0\xc3\x0f\xd3\xb7\
+\xbf\xfd\x2d\x06\x43\x31\xf3\xc6\x39\x40\x08\x04\x11\x18\xce\x54\
+\x0a\x7e\x50\xc9\x33\xd4\xd7\xc7\x86\x03\x87\x46\xf2\x62\x4c\x61\
+\x32\xdd\x67\x9f\x7d\xf8\x7e\x23\x71\xd8\xbe\x4a\xbf\xcb\x49\x7f\
+\x57\x5f\xb2\xca\xbc\x91\x4e\xa9\x1b\xde\x0f\xe1\x1d\x88\x32\x75\
+\xe9\xa0\xba\x81\xa1\x69\xe4\x8b\x44\xf4\x4d\x3f\x78\xc8\x77\xb5\
+\x09\xa3\x5a\x27\x43\x10\x18\xfa\xb5\x4a\x3c\xcf\x3f\x39\x84\x23\
+\x52\xf2\x17\xf5\x7e\x8d\x02\x42\x7d\x86\x02\x22\x6b\x5c\xd6\x8e\
+\xcc\x16\x26\x68\xbb\x04\x44\x14\x3f\xf4\xfa\xdc\x19\xc3\x03\x30\
+\x38\x48\xc4\xcd\x25\xf0\xe7\x08\xb5\x25\x61\x5b\x1a\x00\xf1\x63\
+\x18\x6e\x20\xe4\xf9\x8f\x39\x4d\x0c\xfe\x4c\x68\x15\x52\x71\xc1\
+\x8c\x7c\x08\x60\x54\x7a\xaa\x05\x09\x23\x96\xbd\x02\x43\xfc\xb4\
+\xf3\x66\x9c\x47\xd3\x4e\x39\x99\x03\x25\x50\x72\x8f\xb3\x4c\x70\
+\x52\xde\x63\xa4\x01\xba\x4d\xc8\xcd\xc3\xfc\x00\x22\x7f\x40\x51\
+\xa1\x00\x23\x5c\xb1\x78\x71\x8a\x3a\x3a\x51\xaa\x08\x91\xb4\x60\
+\xd7\xc9\x52\xd6\x15\xe6\x0e\x30\xca\xb0\x30\x53\x22\x6d\xd5\x7c\
+\xf4\x93\x83\x9d\x5c\x0e\x2a\x02\x89\xf4\xa4\x89\xe3\xe9\xf7\xbf\
+\xbf\x89\xce\x3a\xe3\x54\x22\x27\x2d\x1b\x88\x90\x98\x42\x91\x16\
+\xa0\xda\xb5\xf4\x0b\xa2\x39\xc1\xaa\x02\x4e\x51\xe1\x33\x05\x68\
+\xa6\xc0\xca\xe3\xf5\x3d\x48\xbf\x5b\xa9\xb9\x69\x0c\xed\x39\xe5\
+\x40\x6a\x6b\x59\x8d\x5c\x17\x15\x1f\x84\x4c\xbe\xaf\x67\x01\xad\
+\xbd\xf6\x24\x3a\xe4\xd0\x3d\x69\x95\xc9\x00\xcf\x41\x8a\xc4\xa4\
+\xca\x83\x74\x5a\xb3\x80\xa1\x31\xe7\xb1\xf9\x1d\x85\xdb\x01\x86\
+\x3d\x83\xb4\x68\x41\x3f\x91\x2b\x69\x0e\xde\x36\x03\xa5\x2f\xe0\
+\x75\xe4\x0a\x18\x92\xab\x88\xa4\x7e\x7c\x0e\x0d\x40\xf8\x37\x4b\
+\xb9\x33\x33\x26\x6c\x21\xb5\x89\xc6\x01\xfe\xbe\xdf\x59\xd3\xb4\
+\x03\x6b\x8c\xe6\x29\x6c\x38\xb2\x26\x99\xbc\x9c\x40\xec\x40\x14\
+\x8b\x84\xe8\x81\xb9\xb3\x69\xea\x09\xc7\x93\xe3\xa6\x39\xbf\x50\
+\xc0\x50\xac\x20\xda\x5a\xd4\x91\xd4\xa3\xd0\x5c\x0b\x9a\x7f\xe5\
+\xca\x1f\x04\xc9\xa0\x5c\x1c\xc0\x10\x87\xad\xf5\x61\xbe\xd8\xc4\
+\xf2\x30\x4d\x03\x14\xb1\x59\x04\x88\x4a\x3e\x6e\x0e\x20\x61\x26\
+\x45\x42\xfe\xdc\xb9\x73\xcb\x7d\x7c\x4d\xe7\x09\x8d\x9d\xd0\x29\
+\x42\xee\x48\x1e\xb3\x90\xed\xab\xff\xb6\xd0\x03\x54\x49\xa8\xe9\
+\xe1\x55\x5d\x1c\x7a\x89\x28\xbb\x71\x55\x97\x16\xb8\xa8\xae\x60\
+\x18\x8b\xc5\x7e\x9a\x4e\xa7\x6f\x50\xaa\xb2\xfc\xdd\xc5\x8a\x0f\
+\x86\x36\xcf\xaa\x06\xde\xf0\xae\x3b\x93\x29\x48\x2a\x60\x47\xac\
+\xd6\x6b\x40\xec\xfb\xd8\x9a\x21\x04\x80\x6a\x85\x58\xb8\x76\x62\
+\x6f\x79\x39\x60\xc5\x5a\xe8\x1f\x17\xcd\xf3\xb3\x60\x13\x60\xe6\
+\xd9\x31\xd5\xd7\xc3\x84\x5a\xe6\x24\x11\x8f\xcc\x66\x82\x14\x0d\
+\xc3\x56\xa3\x41\x3d\xf0\x53\x19\xac\x28\xda\x4d\x41\xc2\x08\x42\
+\x1f\x3e\x2d\xf4\x39\xb4\xe0\xf3\xce\x3b\x8f\x4b\x38\x41\xc6\x41\
+\x41\xf3\x08\x78\xb8\xd6\x9e\x1e\x7e\x73\x69\x65\x20\xa8\xa0\x28\
+\xfa\x07\xd1\xc2\x45\x19\xa3\x19\xc2\x27\x25\x26\xd0\x8c\x63\xfc\
+\x57\x46\xe2\x43\xa3\xc3\x21\xfe\xbd\x5c\xd1\xdf\x94\x11\xe6\x09\
+\x54\x84\x48\x0f\xd0\x5a\x6b\xad\x4a\xd7\x5d\x7f\x3d\x9d\x3e\xed\
+\x04\x56\xed\x23\xa0\xb5\xa3\xb4\x07\x86\x1c\xda\x62\xd9\x8e\x35\
+\xd0\x05\x9a\x21\xe7\x06\x22\xeb\x90\xb5\x23\x44\xa6\x42\x4b\x05\
+\xbb\x69\x8c\x9a\xa3\x63\xe8\xc7\xfb\x1d\x4e\x6d\xcd\xab\x52\x3a\
+\x03\x72\xed\x04\x35\xc5\xa1\x85\x74\xd3\xda\x9f\x9f\x40\x3f\x39\
+\x74\x47\x6a\x1f\xc3\x7c\x66\x94\x75\x07\x4c\x59\x27\xdc\xa3\x85\
+\xb2\x19\x04\xc0\x88\x30\x2e\x0c\x86\xa2\x19\x4a\x8a\x83\xeb\x99\
+\x3d\x19\xae\x4d\x5d\x46\x49\x94\x6f\xa2\xa1\x81\x41\xcf\xf7\xd8\
+\xdc\xda\x22\x3e\x31\xee\x99\xfc\xd4\x8a\x42\xbf\x17\xda\x9c\x24\
+\x0c\x3b\x0f\xe6\x17\x82\xc9\xd8\xf4\xec\x81\xe1\x2c\x3a\xf6\xe8\
+\xa3\xb8\x4d\x30\x3f\x33\xb9\x83\x49\x21\x52\xb7\x80\xce\xbf\x7a\
+\x6b\x84\xf6\x84\x86\xfc\x40\xfa\x04\xca\x1c\xad\xbf\xfe\xfa\xbc\
+\x1e\x24\x18\x48\xac\x65\xf8\x7d\x97\x5d\x76\xf6\x2e\x51\x0d\xf1\
+\x99\x67\x9e\xa3\xee\xee\x6e\xfe\x1e\x9f\xb8\x0f\x40\x09\x89\xf9\
+\x37\xdc\x70\x03\xbd\xfa\xea\xab\xc3\x48\x44\x1a\x21\x6f\x0a\xdd\
+\x53\x65\xb8\x02\xa5\xf8\x6f\x25\x4d\x0b\xef\x16\xb4\x6e\x1b\xdb\
+\xce\xd0\xa1\x44\xd9\x1b\xeb\xf5\x8c\xba\x82\xa1\x69\xd4\x87\x89\
+\x44\x62\x0d\x3b\x7a\x93\xa3\xef\x4a\x86\x66\xd7\xeb\x75\x8a\xdf\
+\xa7\x1c\xcd\xd0\x0e\x2f\xb7\x69\x91\x30\x21\xb0\xc0\x11\xdd\x55\
+\xa8\xdc\x8a\xbc\x5f\x5e\x74\x43\x5d\x5e\x28\xdf\x67\x28\x3b\x63\
+\xb4\x51\x27\xa6\xf6\xb1\xfe\x5e\xea\xa1\xc5\x53\x1b\xd4\xe7\x63\
+\xda\x6f\x8a\xb1\x32\xe4\x99\xea\x14\x90\x90\x19\xce\x32\x97\xcc\
+\x46\xbd\x97\x98\xa0\xc4\xfc\xa7\xb5\x08\x61\x5f\x4b\xa5\x53\x2c\
+\xb0\xe1\xab\xc2\xcf\x82\x0e\xfe\x52\x4b\xf9\xad\x2d\xdd\x7f\x20\
+\x99\x16\x73\x60\x94\xf3\x1c\x1d\xf6\x19\x4e\x3b\xe5\x54\x4e\x2f\
+\x81\xa0\x83\x92\xe2\x69\x20\xe6\x55\xc0\xc5\x2a\x6f\x07\x38\x13\
+\x2d\xa6\x58\x34\x23\xcf\x4f\xbf\x46\xa2\x74\x66\x04\x7e\x51\xa2\
+\x05\x0c\x86\x1d\x1c\x30\x13\x43\x5e\xa7\x1b\x86\x41\x53\xe8\xc5\
+\x00\x98\x9c\x6b\x01\x10\x43\x65\x76\xe3\xaf\x35\xfd\x95\x00\x93\
+\x0a\x4c\x78\xd9\x0c\x33\xa5\xac\xb5\xd6\x64\xba\xee\xb7\xd7\xd0\
+\x99\xd3\xa7\x51\x28\x1a\xca\x33\x8f\x72\x93\x35\x5c\xd2\xb4\x3f\
+\x96\x88\x72\x14\xa8\x9b\x11\x73\xb6\xc4\xb3\xea\x46\x26\x44\xb1\
+\x70\x2b\x65\x1c\x68\xa9\xed\xb4\xdf\xbe\x47\x50\x5b\xcb\x24\x4a\
+\xa6\x10\x00\xd5\x4c\x6d\x2d\xcd\xd4\xd7\xf7\x11\xad\xb9\xd6\x28\
+\x3a\xf8\xa7\x7b\xd1\xe4\x35\x90\x60\x28\x66\x52\xce\xf1\x4b\x26\
+\xa9\x39\x31\x8a\xb2\x59\x94\xdd\x92\x31\xce\x33\x93\x1a\xcd\xd0\
+\x75\x11\x1c\x84\xd7\x96\x48\x64\x98\x48\xd1\xc3\x2a\x20\xb5\xfe\
+\x24\x6f\x2a\xb3\xc2\xf6\xe4\xad\x9d\xc1\xb4\x97\x6c\x6f\x8f\x7c\
+\xd0\xba\x94\x73\x51\xe9\x43\x88\xcb\xd1\x3e\xb1\x72\xa0\x26\xa3\
+\x80\xdf\xfd\xf7\xcf\xa4\x13\x8e\x3b\x86\x40\xcc\x20\x26\x7a\x70\
+\xc2\x0a\x8b\x0b\x03\x24\x7c\x9f\x3e\x1f\x25\x9f\x55\xc7\x35\x6b\
+\xa7\x56\x60\x3d\xaa\x9c\x90\xb4\x22\x11\xb3\xdf\xfc\xe6\x37\x39\
+\x9f\x70\xc2\x84\x71\xfc\x3b\xfc\x86\x88\x67\xd8\x7f\xff\xfd\x69\
+\xf6\xec\xd9\x5e\x6a\x85\xe6\x58\xe2\x1e\x36\x29\x76\x5d\x84\x4a\
+\x91\x9b\xa8\x15\x0c\xef\x81\x7e\x29\x37\xfa\x1e\x6d\xc4\x78\xc3\
+\x6f\x3b\xc2\xc7\x47\x44\xce\x9a\xf5\x7c\x66\xdd\xc1\x30\x1c\x0e\
+\x9f\x16\x8f\xc7\xcf\x87\x79\x44\x03\x35\x24\xb7\xaa\xee\x8f\xaa\
+\xa8\x1f\xca\x59\x74\xba\x0b\xc2\xae\x0e\x55\x2e\x94\x89\x1d\x3b\
+\xbb\xb7\xde\x7a\x8b\x1e\x7a\xe8\x21\xcf\x74\x6a\x9b\x06\x1a\x95\
+\x17\x64\x83\x21\xe7\xa0\x0d\x49\x3d\x40\x0d\x7f\x57\x33\xa6\x4d\
+\x05\x55\xac\x53\xd8\xf4\x96\x77\xe4\x8f\x07\x27\xd7\x1b\x92\xe5\
+\x7c\x5b\xa3\x08\x79\x0e\x16\xf1\x8c\x94\x9a\xfc\x9c\xa3\xf3\x12\
+\x0e\x4b\x97\x12\xf1\x04\x25\x53\x49\x16\xa8\x2d\xcd\x4d\x34\x30\
+\x68\x52\x02\x8a\xd4\xdd\xd3\x26\x05\x81\x21\x5b\xb9\x90\x1f\xc7\
+\x75\xf8\x5c\x9a\x71\xce\x0c\x3a\xe5\xd4\xe9\x0c\xb8\x36\xc4\xd9\
+\xaf\x68\x6f\x4f\xc4\x88\x0c\xf5\xa4\x80\x19\xce\xe4\xb9\x15\x07\
+\xc3\x10\x65\x43\x44\x4b\x3b\x89\x16\x2f\xe9\x64\xf3\x68\x24\x2a\
+\x04\xe9\xac\x25\x19\x40\xe0\x7e\x72\x45\xa3\x13\x4e\x74\x01\x61\
+\xf6\xd9\x45\x62\x9c\x03\x27\x09\xe2\x49\xfa\xec\x5a\xab\xd3\x8d\
+\x37\x5e\x4f\xa7\x4f\x3f\x85\xe9\xd7\x86\xfa\x25\xa9\x5e\x35\x4b\
+\x8f\x08\x9b\x8b\x03\x67\x3d\xa0\x87\x06\x0c\xb3\x30\xd3\x28\x44\
+\x91\xfa\xe2\x32\x65\x5e\x84\x9a\xa0\x23\x52\x53\x7c\x0c\x1d\x70\
+\x80\x80\xe1\x50\x12\x14\x84\x4d\xd4\xda\x12\xa7\xa1\xa1\xf9\x0c\
+\x86\x07\x1c\xb4\x07\xad\xb2\x5a\x0c\xe1\x28\x14\x89\x18\xf2\x6d\
+\x06\x55\x98\xc8\x8a\x83\xe1\xc2\x85\xfd\xec\x7f\xe4\x5e\x34\x1b\
+\x0f\x54\xcf\xb0\xcd\x8f\x3a\x37\xf1\xfe\xd0\xa5\x39\xd5\x23\x9b\
+\xe5\xda\x8d\xcd\x2d\xa3\xf2\x67\x9f\x6f\x3e\x94\x5c\x9f\x88\x7e\
+\xcd\x20\xd8\x47\xcc\x75\x48\xaa\x47\xdd\x42\x6c\x90\x00\x7a\xf7\
+\xde\x7b\x17\x9d\x3c\xf5\x04\xfe\xbb\x82\x21\xb4\x47\xb6\x9e\x18\
+\x8b\x42\x90\x99\xb4\x22\x61\x52\xe0\x64\x95\x01\xba\xa1\x86\x7c\
+\x10\x2b\x86\x04\xfc\x60\xed\x22\xb2\xf6\xa5\x97\x5e\x62\xf0\x90\
+\xc8\x68\x99\x95\xbb\xef\xbe\x27\xcd\x9a\x35\x8b\x69\xda\x20\x73\
+\xfc\x39\x8b\x8d\xda\x6c\x17\x7a\x67\x65\xbf\xd1\xbc\x5a\x8d\xf2\
+\xc5\x46\x47\x23\x63\x01\x94\x5a\x24\xbd\x9e\x1b\x8a\x0a\xc7\x60\
+\x3a\x91\x73\x41\x85\xd7\x94\x3c\xbd\x11\x08\x35\xba\xa9\xa9\x69\
+\x41\x32\x99\x6c\x56\x33\xa2\x08\xed\x15\xdb\x4c\x8a\x1d\x0e\x06\
+\x18\x13\x11\x66\x0e\x54\x7a\xc6\x40\x6b\xad\xbc\x5b\x6f\xbd\x95\
+\x8e\x3e\xfa\x68\x2f\x38\x08\xef\x86\xef\x1b\xe9\x40\xb6\xc1\x10\
+\x0b\x5f\xa9\xa7\x30\xa2\xf6\x77\xf8\xbd\xd6\x12\x5a\x1c\xfc\x01\
+\x0d\xc8\xf8\xa8\x64\xd6\xd8\x63\xa6\xd4\x6f\x76\xe0\x8c\x44\xa6\
+\xb2\x29\x8a\x93\xbc\xd3\xcc\x84\x83\xa4\x67\xf6\x8f\xc5\xe2\xac\
+\x19\x8a\xf6\x56\x9c\x3d\x05\x4f\x0a\x02\x43\x34\x85\xa3\x53\x41\
+\x1d\x96\x76\x68\xc6\x8c\x73\x69\xea\xc9\xa7\x52\x2c\x3a\x5c\xe3\
+\xf4\xeb\xe8\xea\x6f\x1c\x96\xf7\x5f\xe6\x4a\x32\x86\x37\x82\xbb\
+\xb0\xa3\xb3\x9f\xd3\x10\x54\xd3\x65\xe3\xad\x09\x62\x01\x02\x4a\
+\x94\xa4\x7a\x48\x45\x43\x64\x90\x33\x01\x11\xc8\x85\x03\x60\x8e\
+\x1d\xdb\x4e\xd7\x5e\x77\x0d\x4d\x3f\x65\xaa\x17\x0c\x62\x1b\x78\
+\xd5\xd7\x25\x46\x69\x29\xbb\xc4\x24\x32\x88\xf8\xe4\xc4\xfe\x30\
+\x45\xc3\x88\xf8\x8d\x51\x36\x13\xe2\x48\x5f\xe4\x37\xb6\x37\x4d\
+\xa0\x03\x0e\x3c\x8c\xda\x5b\xa1\x19\x46\x29\x9d\x8c\x50\x2c\x1e\
+\xa6\x9e\x9e\xf7\x68\xdd\xf5\x26\xd3\xe1\x3f\xdb\x8f\xc6\x8c\x25\
+\xca\xba\x69\xca\x3a\x43\x14\x8f\xe9\xb8\x02\x0c\xc1\x47\x8b\xf7\
+\x31\x66\x52\xd4\x3f\x54\x9f\xe1\x42\x04\xf9\xc4\x3c\x20\xe4\xb9\
+\x62\x69\xe3\xea\x6b\x52\xbf\x7a\x73\x02\x5a\xa9\x4b\x2d\x4d\x02\
+\xa0\x03\x43\x29\xcd\xaa\x60\x0d\x51\xeb\x2d\xea\x27\x9b\xd7\x25\
+\xeb\x62\xd8\x27\xfa\x22\x16\x97\x62\xc4\x32\x2b\x85\x54\x83\x4d\
+\xb5\x99\x14\xdd\x7b\xef\x3d\x74\xca\xb4\x13\x78\xa3\xa1\x33\x16\
+\x5a\xb4\x82\x21\x5f\xe4\x15\xaa\xae\xbf\x05\x47\xa7\x11\xc6\x98\
+\x99\x78\x92\xd0\xb8\xf3\x0f\x80\xe3\x5a\x6b\xad\xc5\x9b\x6a\x05\
+\x41\x04\xcd\x60\x63\x8b\x8d\xf7\xa3\x8f\x3e\xea\x5d\xa0\xfe\x7f\
+\xde\x54\x68\x9d\xcb\x3a\x6a\xb1\x85\xa6\xbd\x6d\x09\xc3\xf7\x90\
+\x87\x88\x8c\xed\xe8\xe8\xe0\x77\x1a\x35\x6a\x14\x9b\x70\x75\x43\
+\xce\x2e\x11\x43\xf4\x50\x9b\x9b\xa6\xcc\x45\x98\x7f\xda\x20\x91\
+\xb3\x1a\x11\x75\x57\x75\x75\x91\x8b\x1a\x01\x86\x98\xa8\x97\x44\
+\xa3\xd1\xa9\x58\x20\x39\x7e\xbd\x15\x1b\x0c\xed\x40\x18\x84\x84\
+\x83\xed\x45\x84\xb4\xf8\x50\x40\x2d\xb5\xfd\xf6\xdb\x7b\xd1\x81\
+\x1a\xb4\x82\xeb\xfc\xa4\xe0\xf5\x1a\x20\xbf\x99\x74\xa3\x8d\x36\
+\x62\x56\x7f\x3c\x13\xe6\x15\xc9\x47\x42\xd8\xfc\x90\xa9\x78\x50\
+\xfc\xc9\x1a\xb6\x3d\xfc\x0c\x13\x2d\xca\x35\xf6\x5c\x1a\x1a\x4a\
+\x52\x7f\x1f\x08\xa3\xc1\x26\x22\x1c\x89\xc0\x31\x04\xbb\x01\xd0\
+\xd8\x34\xca\x81\x33\x42\xc0\x2d\x39\x5f\x21\xea\xed\x5e\x46\xcf\
+\x3c\xf3\x57\x36\x97\xe2\x59\x62\x2a\x85\xf9\xd8\x11\x50\xcc\x0c\
+\x17\x10\x76\x5b\xca\x01\xc3\x50\x34\xcc\x25\xab\xd2\xc9\x34\x9d\
+\x7e\xe6\xd9\x74\xc2\xf1\x27\x52\x3c\xde\xcc\xd1\x90\x52\x08\x56\
+\xee\xe8\xf9\x87\xe0\x77\x43\x20\x08\x7c\x77\x88\x8e\x2c\x31\x30\
+\xa5\x34\x13\xe8\x77\xd8\xcf\xf5\x0d\x38\xd4\x37\x30\x28\x39\x78\
+\x9e\x01\xd6\xa4\xa7\x18\xa4\x55\xe2\x68\xf1\xf9\xc1\x88\x2a\x84\
+\xd8\xcd\xf1\x04\x75\x2e\xeb\x20\xd4\x8a\x03\xf5\x5a\x53\x73\x94\
+\x85\xf8\x15\xbf\xba\x84\xfa\xfa\x7b\xb8\x80\x6e\x0e\x0c\x0b\xf8\
+\x3a\x35\x38\xc8\x91\x14\x86\x10\x12\xfb\x91\xe9\xcf\xba\xa7\x84\
+\x16\xc5\xa3\x2d\xd4\x94\x68\xa7\xbd\xf6\xda\x8f\x5a\x5b\xc6\x11\
+\x39\xc8\x73\x8c\x71\x5a\x47\x32\xb5\x98\x3e\xf3\xb9\x09\x74\xf0\
+\x21\xfb\xd1\xaa\x93\x9b\x29\xc3\xe9\x1e\xe0\xb7\xe5\xde\xe1\xb4\
+\x9a\x61\x60\x88\x00\x1a\xc7\x04\xd0\x78\x60\xc8\x55\x98\xb9\x27\
+\x19\x0c\xad\xaa\x27\xd8\x90\x29\x99\x00\x02\x5b\xba\xba\x3a\xa9\
+\xbd\xb5\x8d\x5a\xda\x5a\x79\x8d\x14\xaf\xbb\x28\x51\xc2\xfa\xbd\
+\xff\x93\xcd\xa4\xbc\x19\x94\x20\x32\x00\xa0\xf8\xcc\x5d\x8a\x86\
+\x43\x34\x67\xce\xfd\x74\xcc\x31\x47\x49\x60\x97\x57\x39\x5a\xfa\
+\x3f\x37\xaf\x1a\x2f\x7f\xd4\xb2\x64\xfb\xd9\xd4\x8a\x83\x4d\xf6\
+\xea\xab\xaf\x4e\x2f\xbf\xfc\x32\xa7\x45\xa1\xda\x8c\x00\x4a\x88\
+\xf6\xdf\xff\x40\x36\x93\x72\xb0\x91\xc5\xaf\xec\x8f\xe8\xac\x97\
+\x5c\x29\x75\x1f\x3c\x13\x1a\x2a\x02\x77\x7e\xfc\xe3\x1f\x73\x3f\
+\x6b\xa4\xec\x2d\xb7\xdc\xc2\xc1\x41\x28\xe5\x64\x1f\x7e\x20\x1d\
+\x81\x76\x5e\x4a\xe4\xd4\x9d\xe4\xa5\x21\x60\x48\x44\x6b\xb6\xb4\
+\xb4\x7c\x80\x1d\x12\x04\x87\xd8\xcf\x47\xb6\xaa\x85\x7f\x40\x82\
+\xcc\xa4\xe2\x5f\x90\xfc\x3b\x4c\x84\x1b\x6e\xb8\x8e\xeb\xcf\x61\
+\xc2\x22\xe2\x6b\xce\x9c\x07\x68\x97\x5d\x76\xf1\x78\x03\x35\xc2\
+\x8a\xd9\x31\xb8\x20\x6a\xfd\x0f\x1b\x0c\x11\x9e\x8d\x1a\x7e\xd0\
+\x4e\x31\xf9\x90\x83\x84\x1d\x9b\x52\xd0\xa1\xdd\xa5\x8f\x62\x9a\
+\x99\x5c\x17\x45\xfe\x5e\x32\x4b\xdd\x5d\xbd\x9c\xec\x8b\x28\x38\
+\x6c\xd1\x39\x30\x02\xb9\x6a\xf1\x04\x83\x0c\x8a\xf7\x42\x53\x11\
+\xe6\x1b\xa1\xec\xc2\xa3\xef\xb9\xeb\x4e\xba\xe2\x8a\x5f\x51\x4f\
+\xcf\x32\x63\x2a\x1d\x14\x66\x1c\x14\x59\x8d\x44\x99\x92\xac\xd4\
+\x11\x68\x6e\x81\x29\x13\xe3\x13\x6d\x22\x27\x95\xa1\x13\xa6\x9e\
+\x4c\x47\x1f\x75\x3c\x17\xba\x1d\x1c\x00\x17\xa4\x68\x22\x2c\xa0\
+\x01\xd8\x6c\xbf\xcc\x05\xa1\x84\xb4\x32\x6c\x91\x46\x94\xec\x3f\
+\x98\x90\xa3\x31\x4e\x9f\xe0\x0a\x0c\xe0\xfe\x34\x1b\x05\xd5\x0c\
+\xb3\x88\x70\x04\x85\x19\x7c\x79\x6c\xee\x34\x55\x21\x8c\x40\x3e\
+\xf5\xe4\x69\xf4\xde\x7f\xde\x15\x93\x59\x72\x80\xd6\x58\x63\x35\
+\x2e\x99\xf4\xf6\xbf\xde\xa0\x48\x34\x42\x59\x4e\x93\x29\xae\x3d\
+\x87\x50\x03\x88\x40\x00\x00\x20\x00\x49\x44\x41\x54\xa3\xa8\x80\
+\xd0\x44\xeb\xac\xbd\x1e\x6d\xb4\xd1\xb7\x68\xe2\x84\xc9\xd4\xd3\
+\xdb\x4f\xe9\xa4\x98\xaf\xc4\x82\x01\x96\x97\x10\xed\xb4\xe3\xae\
+\x0c\x8a\xf1\x78\x0b\x85\x29\x21\x1c\xb2\x99\x6e\x0a\x45\x52\xf4\
+\xdd\x4d\xbf\xc4\x41\x47\xd0\xf8\xc2\xec\x37\x74\x99\xbd\x28\x12\
+\x46\xd0\x86\x4f\x33\xf4\xc0\x70\x88\x16\x2d\xea\x27\x87\x7d\x86\
+\x02\x86\xda\x9d\xea\x33\x64\xcd\x37\x39\x40\xa3\xda\xda\x99\x4e\
+\x6d\xfe\x47\x1f\xd0\x93\x4f\x3e\xce\x25\xa1\x80\x9d\x6c\xd2\x34\
+\xd2\xc6\xbf\x16\x3d\xcd\xba\xc4\x04\xe1\x00\x32\xc3\xb1\x0a\x73\
+\xa9\x08\xe9\x28\xb5\xb7\x36\xd3\x63\x8f\x3d\x42\xaf\xbe\xf6\x32\
+\x73\xae\xba\x0c\x86\xb2\x51\xc3\x7d\x73\x55\x6a\x82\xd6\x47\xed\
+\xeb\x57\x4d\xa4\x1a\x40\xe8\xbf\xe3\x17\xbe\xf0\x05\x2e\x95\x95\
+\x03\x4b\x44\x6a\x66\x68\xd7\x5d\x77\xf5\xd2\x27\xfc\xb1\x0a\xb8\
+\x87\x6e\x40\x6b\x6f\x61\xe9\x3b\x68\xfb\xd1\x6f\xe7\x9f\x7f\x3e\
+\x9d\x7a\xaa\x90\xba\x68\xa1\xf4\xe9\xd3\xcf\x60\x8b\x19\x40\x1b\
+\x73\x0e\x72\x4f\xe5\x66\xe0\xfa\xad\x6b\xe3\x9d\xb5\x88\xe8\xc3\
+\xba\xde\x32\x38\x15\xba\xfa\xc7\x85\xc3\xe1\xdf\x38\x8e\xf3\xf3\
+\x5c\x50\x4a\xe3\x27\x63\xa9\xd6\x16\x9a\xa0\xf8\x1b\x16\x8b\x9a\
+\x18\x41\x87\x04\x47\x30\xa2\x14\xcf\x39\xe7\x1c\xcf\xf1\x0d\xb3\
+\xc6\x43\x0f\x3d\x42\x3b\xee\xb8\x23\x53\x26\xa9\xb3\x58\x6d\xfb\
+\x8d\xda\xc1\xf9\x35\xc3\xab\xae\xba\x8a\xc1\xd0\x9e\x80\xea\x4f\
+\x08\x02\xfb\x5c\xdf\xe4\x0b\x5c\x7f\x32\x7a\x6f\x7f\x86\x3a\x41\
+\xc7\xc6\x49\xf8\xd0\xb6\x90\x5c\x0f\x93\x98\x44\x94\xa2\x74\x13\
+\xe7\x12\xc2\x27\x12\x0e\x79\xf5\x0c\xef\xba\xf3\x8f\x34\x75\xda\
+\x89\x4c\xc7\xc6\xc9\xfa\x1c\xf6\x0f\xe1\x2a\x82\x57\x00\xb4\x96\
+\x03\x6a\x68\x88\xc2\xb1\x26\x72\x92\x19\x3a\xfa\xf8\x13\xe9\x67\
+\x47\xfc\xc2\x54\x8d\x47\xa1\x58\xd1\x8e\x74\x51\xca\x7b\x99\xd4\
+\x0a\xd6\x66\x23\x5e\x35\x04\x15\x30\x76\x9f\xe9\xcf\xfe\x7e\xe4\
+\xfb\xb1\xef\x4f\xd4\x4e\x80\x9f\xfa\x50\x31\xee\xea\x8b\x02\xcb\
+\x0c\xae\x8d\xb2\x06\x27\x60\x08\x01\x0e\x9f\x16\xcc\xa2\x7b\xec\
+\xb6\x2b\xbd\xfb\xce\x9b\xdc\x0f\xe2\x5f\x42\x74\xa1\xd0\xec\x71\
+\xd4\xa9\x31\xa7\x4a\x0f\x59\x79\xb9\x26\xb5\x20\xde\x04\x56\x9b\
+\x14\xed\xfd\xa3\x03\xe8\x8c\xd3\xcf\xa6\xe6\xa6\x76\xea\x1d\x18\
+\xe0\x54\x0e\x6c\x94\xa0\x81\x43\xc3\x84\xe6\xb9\xc6\x1a\xe3\x29\
+\x81\xd2\x88\x5e\x54\xab\xd1\x39\x75\xeb\xcb\x6d\xc4\x7b\xe5\x58\
+\x81\x00\xe3\xb0\x0c\xa0\xee\x21\xc0\x0b\x3f\xab\x69\xbe\xaf\x37\
+\x69\xc0\x30\x26\xc4\xda\xc8\x2f\x54\xcd\x58\xa3\x68\xc3\x2e\x0b\
+\xc7\xd1\xed\x6d\x4c\x87\xf6\xd0\xdc\x39\x74\xfe\x79\xe7\xd2\xd2\
+\x25\x8b\x4c\x09\x2a\x6c\x66\x6a\x98\x03\x79\xc4\xee\xb9\x1c\x52\
+\x79\x49\xa6\x6f\xa1\x66\x6c\x4c\x87\x50\xdc\xd7\x54\x54\xc9\x08\
+\x63\x92\xb8\x33\x4c\x94\xaf\x89\x86\x54\xd6\x1a\x5c\x3e\x52\xa9\
+\x01\x1b\x6e\xb8\x21\xdd\x73\xcf\x3d\xf4\xf9\xcf\x7f\xce\x03\x19\
+\x00\xcb\x11\x47\x1c\x41\x77\xdc\x51\x55\x71\xf6\xbc\x05\xa5\x1b\
+\x3a\x35\x5b\xda\xd1\xee\xb6\xfc\xb3\x7d\x90\x76\xd0\xa0\x2d\xc7\
+\x2e\xbf\xfc\x72\x26\x4d\x50\xdf\x21\x14\x82\xcb\x2e\xfb\x15\x4d\
+\x9d\x3a\xd5\xeb\xaf\x46\x47\xd3\xfb\xa5\x85\x79\x87\xab\x89\x9c\
+\x5f\xd4\x22\x49\x8a\x5d\xdb\x28\xcd\x10\xcf\x5b\x27\x16\x8b\xcd\
+\xd3\xc4\xf0\xe5\x1d\x40\xa3\x1d\x50\x28\x5a\x4a\x17\x83\x7e\x9e\
+\x76\xda\x69\x74\xfe\xf9\xe7\xf2\x25\x88\xf8\xc2\x01\x9b\x3e\x6c\
+\xfb\x62\x16\x34\xa6\x45\x63\x22\x55\xc7\x77\xbd\x07\x68\x24\xc1\
+\x10\x5a\x21\x54\x88\xae\xae\x3e\xea\xec\x40\xd5\x8a\x08\xd7\xe3\
+\xe3\xfc\x39\xe6\x3e\x95\x1d\xaa\xd2\xb1\x69\x3d\xc3\x4c\x2a\x49\
+\x63\xc6\xb4\x49\xae\xd7\xd4\x93\x68\xb0\x1f\x60\x08\xb3\x22\xc0\
+\x10\x72\x53\x38\x32\x6b\x03\x43\x13\x3d\x13\x89\x71\xe0\x4a\x36\
+\x99\xa6\x5f\x1c\x73\x02\x1d\x71\xc4\x91\xa2\xb9\x82\xf4\x38\xaa\
+\x55\x3b\x34\x7e\xd4\x4e\xfb\x00\x90\xe7\x0a\xc3\x2a\x18\xb2\x1c\
+\x0d\x08\xe4\x50\x30\x84\x6b\x92\x83\x63\x38\x75\x04\x31\xb4\x26\
+\x0a\xd7\xe4\xaf\xe1\xfd\x04\x0c\x05\x84\x99\x20\x8d\xd9\x78\x80\
+\x8a\x69\xda\x73\x8f\x5d\xe8\xdf\xf3\xde\x64\xd0\x42\x19\x2c\xad\
+\xaa\x90\x45\x34\x4c\x5e\x16\xa6\x0a\x7a\xb3\x79\x64\x10\xe0\x14\
+\x72\x2e\x8f\xb4\xef\x8f\x0f\xa6\x33\xce\x9a\xc1\xc5\x82\x35\x51\
+\x1b\xf7\x8a\xc6\x5c\x1a\xec\xef\x66\x6a\xb7\xc9\xab\x4f\xa4\x44\
+\x42\x98\x7f\xd4\x4f\xea\xa5\xa1\xda\x80\xe8\xdb\xa0\x14\x03\xc3\
+\x9e\x5e\x68\x86\x03\x1c\xa0\xc3\xda\x96\x67\x70\xc6\x16\x41\xf2\
+\x4e\xd1\x27\xa8\x46\xdf\x94\x40\x24\x65\x84\xe6\xcc\x9c\xc9\x44\
+\xe3\x28\x3d\x05\x2e\xce\xae\x5e\x10\xb8\x17\xb7\x0e\x21\xd0\xa6\
+\xe8\x01\xc0\xe5\x7e\xf0\x3c\x82\x06\xe9\xb5\xaf\x5c\x8a\x47\x63\
+\x6c\x31\xe9\xe9\xed\x32\x1b\x22\xf9\x4e\x03\x5b\x30\x4f\xfc\x1a\
+\x16\xd6\xb1\x26\xb9\xd7\x7b\xed\xfa\xef\x07\xd0\x41\xe5\xf8\x3d\
+\xf6\xd8\xc3\x2b\x87\x06\xa0\x41\x9b\x41\xb7\x86\x22\xce\xb5\x1e\
+\xfe\xc0\x3a\xbd\x9f\xca\x35\x8c\x1d\x00\x05\x87\x1d\x8c\x87\xdf\
+\xd5\x1c\xaa\x34\x7c\x97\x5c\x72\x09\x1d\x77\xdc\x71\x1c\xa0\x86\
+\x03\x7e\x72\xd0\xcc\x9d\x7e\xfa\xe9\x05\x49\xdd\x47\x4e\x33\x74\
+\xbe\x48\x44\xb5\x77\x56\x81\xce\x6e\x24\x18\xc2\x3c\x7a\x5d\x3a\
+\x9d\x3e\x4c\x9e\xbb\x7c\x35\x43\xdd\x0d\xd9\x91\x9f\xba\xb3\x11\
+\x01\x8f\xe8\x3a\x09\xc6\x80\x66\x38\x7d\xfa\x74\x66\x8c\x10\x01\
+\x11\xa2\xb9\x73\x1f\xa0\xdd\x76\xdb\xcd\x5b\x5c\xca\x93\x69\xef\
+\x30\x6b\x9d\xcc\xfe\xeb\xeb\x0a\x86\x8a\x0d\xbe\xdd\x79\xce\xf7\
+\x25\x4f\xef\xed\xcd\x70\x71\xdf\x6c\x06\x1a\x00\xb4\x29\x68\x0a\
+\x11\x4a\xc3\x04\xa5\x60\x98\x49\xb2\x56\x08\xf3\x1b\xe8\xd8\xc6\
+\x8e\x6e\x65\x6e\xd2\x42\x60\xc8\xc2\x13\xec\x2a\x35\x1d\x06\x0c\
+\xc3\x51\xe6\xfb\x4c\x0f\xa5\xe8\x98\xe3\x4e\xa2\x9f\x1d\xf1\x73\
+\x66\x36\x01\x60\x87\xc3\xa2\x0a\xa9\xa0\xce\x2d\x4e\x01\x30\xc7\
+\x89\xb2\x76\x5b\xc8\xe4\xa4\xe6\x34\xbf\x76\xa8\xf7\x08\xb9\x28\
+\x52\x9c\xa1\x30\x84\x39\x07\x62\x00\x5c\x0d\xbb\x4c\x48\x36\x47\
+\x02\x9a\x88\xea\xcc\x05\x14\xb1\xcf\x2a\x0b\x2d\x31\x4d\x53\x76\
+\xdf\x91\xde\x99\xf7\x26\x39\x24\x7e\x3a\xcc\x1b\xcc\x2b\x68\x86\
+\xc3\xd3\x5e\xac\xf5\x62\xc0\x70\xf4\x98\x09\x34\x38\x90\xa2\xbd\
+\x7f\x7c\x10\x9d\x78\xc2\x34\x72\xb2\x51\x36\x11\x8b\x99\x1c\x3e\
+\xc8\x30\x25\x93\xbd\x34\x76\x74\x0b\x4d\x5e\x7d\x12\x99\x40\x45\
+\xaf\xd7\xf3\xe2\x2f\x78\xd5\xdb\x81\x24\x02\xe4\x62\x71\x18\x1e\
+\x90\xd4\xdb\x97\xa4\x85\x8b\x7a\xc9\x75\x25\xbf\x0c\xfd\xc8\xe4\
+\x0b\x7c\x1f\x59\xd7\x52\x65\xc2\xe5\xa4\x77\x58\x52\x66\xde\x7d\
+\x27\x1d\x7f\xc2\xb1\xe4\x62\x53\x14\x82\x69\x1d\xc8\x5c\xe5\x3c\
+\x40\xba\x0f\xd7\x2f\xf4\x81\xa1\xf5\x0e\x92\xe2\x93\x03\x40\xf5\
+\x2f\xa2\x7f\xc4\x8d\x21\xd7\xea\x7b\xfa\x81\x50\xc7\xbe\xd1\x42\
+\x5d\xcd\xa0\x9a\x7a\x51\x28\x55\xab\xa6\xa5\x62\x34\x5d\xd5\x88\
+\xd5\x8a\xa4\x34\x77\xaa\x35\xea\x9c\xd5\xf7\xf5\x03\xe9\xa5\x97\
+\x5e\x4a\xc7\x1f\x7f\x3c\x6b\xd9\x9d\x9d\x5d\x34\x6e\xdc\x18\xba\
+\xe4\x92\xcb\x58\x36\x42\x4e\xe6\xcc\xcf\x56\x59\xad\x5a\x1b\x5e\
+\xe2\x7a\xd3\x4f\xd7\x13\x39\x87\x37\xea\x31\x0d\x05\xc3\x78\x3c\
+\xbe\x5e\x36\x9b\x7d\x73\x45\x88\x26\x55\x73\x80\x6a\x75\x9b\x6c\
+\xb2\x09\xfd\xe0\x07\x3f\x60\xb3\x27\x06\x56\xab\x51\x63\xc7\xb4\
+\xd9\x66\x9b\xd1\x66\x9b\x7d\xd7\x33\x15\xa1\xf3\xe7\xcd\xfb\x37\
+\xdd\x7b\xef\xbd\xec\x5c\xd6\x24\x7c\x4d\x92\xbd\xfe\xfa\xeb\x69\
+\xfe\xfc\xf9\x75\x1f\xa3\x91\x04\x43\xad\x41\xdf\xd5\x9d\xe1\x12\
+\x4e\x48\x26\xe7\x4a\x16\x0e\x54\x22\x24\xcd\x3b\xd8\xff\x53\x3c\
+\x22\x66\x52\x10\x29\x23\x30\x03\x60\x38\x66\x6c\x1b\xcd\x9e\x75\
+\x1f\x4d\x3b\xc9\x68\x86\x51\x04\x39\x88\x90\x57\xa0\xa9\xad\x73\
+\x86\x83\xe1\xb1\xc7\x9f\x48\x47\x1e\xf9\x0b\x8a\x84\x51\x41\x5d\
+\x42\x10\xd5\xfa\xa0\x9c\x99\xca\x94\x03\xc1\x9d\x81\xf0\xd6\x54\
+\xca\x02\x91\x79\x4a\x62\x50\xa8\x9d\x9c\x37\x08\x61\x8e\xdc\x3f\
+\x2e\x6d\x04\xdf\x1c\xee\x07\x67\x58\x98\x40\x5f\xa7\xe6\x24\x0e\
+\x47\x31\x95\x42\x24\xa0\x03\x67\xa6\x68\xcf\xdd\x76\xa0\x77\xde\
+\xf9\x27\x83\x1f\x72\x25\x51\x52\x89\xcd\xa4\x9c\x3c\x5e\x68\x19\
+\xfa\x35\x43\x80\x41\x84\xf6\xde\xe7\x60\x3a\xfb\x9c\x0b\x28\x12\
+\x6e\x62\x1e\x50\xcc\xeb\xc1\xa1\x7e\x4a\xa5\x7b\x29\x95\xee\xa7\
+\x71\xe3\x5a\x68\x8d\xc9\x93\xa8\xb9\x49\x0a\xf9\x6a\xf2\x7e\x7e\
+\x3d\xc2\x42\x6f\x29\x6b\x40\x84\x22\x4c\xa6\x59\x23\xf4\x88\x7a\
+\xfb\x06\x69\xc9\xd2\x3e\x72\x10\x4d\x2a\x90\xc2\x9b\x01\x49\x98\
+\x97\x7a\x84\xc8\xc1\x45\x3d\x42\x70\x83\xa2\xae\xe0\x43\x0f\xce\
+\xa6\xd3\x4f\x3f\x95\xdc\x6c\x9a\x06\x06\xba\x89\x42\xa5\x7d\xc6\
+\xa5\x09\x8a\x90\x87\xa9\x0c\x4b\x12\x5f\x9b\x77\x84\x24\xc8\x43\
+\xfd\xf8\xe2\xcf\xea\xf7\xea\x31\x0a\x93\x8a\xd4\x92\x64\xbf\xb2\
+\xa3\x35\x26\xe5\x2e\xb8\x56\x2d\x58\xbc\x4d\x68\x40\xe4\x26\xfa\
+\x55\xdd\x2a\x78\x3e\xe4\x08\x40\x1a\xfd\x8c\x48\x4d\x70\xde\xd6\
+\x72\x68\x1a\x47\xa9\xb6\xdb\xc0\xab\x9b\x01\xad\x0a\x82\xf1\xd3\
+\x03\xf7\x3a\xe6\x98\x63\x68\xca\x94\x29\x3c\xbf\x90\xfc\x8f\x6b\
+\x11\x51\x7f\xd3\x4d\x37\x79\xe7\xa9\xf2\xa0\x7d\x5a\x4b\xfb\x83\
+\xae\x15\xed\x36\xfd\x25\x22\x7a\x2b\xe8\xdc\x6a\xbf\x6f\x28\x18\
+\xa2\x51\x91\x48\xe4\x5a\x22\x3a\x5c\x6d\xf6\xd5\x36\xb4\x9e\xd7\
+\x61\x60\x7f\xf6\xb3\x9f\xd1\x8c\x19\x33\x68\xcc\x98\x51\x2c\x24\
+\x51\x84\x55\x0b\x6e\x22\xda\x0b\xf2\x49\xe9\x93\x34\xa2\x54\xfd\
+\x28\x76\x5b\x60\x3e\xf8\xe1\x0f\x7f\x48\x8f\x3f\xfe\x78\x3d\x9b\
+\x28\x22\xc7\x84\xec\xe3\x13\x42\xb3\x26\x9f\x61\x80\x66\x98\x82\
+\x95\x34\x44\xb4\xac\x2b\x45\x4b\x3a\xa0\x19\x4a\x5d\x3e\x07\x3b\
+\x72\x09\x1b\xa5\x2c\x65\x99\x23\x14\x60\x18\x07\x18\x86\xb2\x94\
+\x49\xa7\x68\xcc\xe8\x56\x9a\x73\xff\x4c\x9a\x3a\xf5\x04\x1a\x82\
+\xcf\x30\x1a\xf6\x81\x21\x34\x82\x1a\x2d\x03\x21\x04\xea\x20\x91\
+\x3f\x46\xa9\x64\x9a\x8e\x3f\xfe\x24\xfa\xd9\xcf\x8f\xa2\x48\x44\
+\xd8\x3a\x38\x74\x25\x6f\x36\x0b\x13\x0e\x0e\x80\x23\x97\x56\xd2\
+\xe0\x1a\x4b\xd8\x29\x10\x29\x98\x69\xbf\xdb\x42\x11\x8b\xbd\x29\
+\x9e\x10\xa2\x68\x04\x9e\x60\x93\x00\x2d\x13\x15\xd9\xc3\x92\x4f\
+\xa6\x74\x6c\x0c\xdb\x9a\x22\x60\xe8\xea\x00\x86\x53\x76\xdb\x8e\
+\xde\x79\xe7\xef\x02\x82\x20\x31\x70\xa0\x19\x8a\x79\x2a\x1f\x0b\
+\xf5\x25\x6c\x30\x24\x6a\x82\x80\x1f\x48\xd1\x3e\xfb\x1e\x4c\x67\
+\x9e\x79\x01\x85\x43\x4d\xd4\xd3\x07\xff\x18\xb4\x35\x68\xad\x92\
+\x2a\x31\x76\x4c\x33\xad\xb6\xea\x58\x6a\x4a\x60\xf7\x8e\x7e\x91\
+\xa8\xca\x88\x67\x27\xb5\xcd\x8d\xf6\x94\xcd\x25\xc9\x73\x9f\x71\
+\x35\x14\xd9\x40\xf4\xf6\x0d\xd1\xe2\x8e\x3e\x78\x3b\x99\x70\x20\
+\x07\x86\x5c\xcb\x94\x6f\x02\xa1\x89\xf5\xd3\xd3\xdd\x49\xcd\x08\
+\x38\x9b\x7d\x1f\xe7\xfe\x61\x03\x91\xce\x20\x10\x2d\xa7\xb9\x15\
+\x5a\x28\x41\xf2\x21\x57\xdf\x52\xcc\xd0\xf9\x70\xe8\xe4\xf9\xf2\
+\xed\xfb\x43\x88\xf2\x86\x01\x01\x61\xbe\x35\xa5\x2e\x0f\x8d\xc8\
+\xf6\xb7\xab\x11\xa0\x58\xe8\xdd\x6d\x1f\x5e\x2d\x42\x04\x72\x0d\
+\xf7\xb2\xa3\xdb\x31\x37\xf1\x7e\x00\xfb\xd1\xa3\x47\xf3\x77\x85\
+\x12\xe4\xd1\x47\xda\x3f\x08\x7c\x44\x39\x2d\x28\x0a\x38\xb0\x36\
+\x70\x2d\x40\x71\xc9\x92\x25\xc3\xcc\xa4\x23\xe4\x73\xbd\x8e\xc8\
+\x39\xa2\x96\xfe\x09\xba\xb6\xe1\x60\x08\xdf\x61\x24\x12\x99\x17\
+\x34\xd9\x83\x1a\x5a\x8f\xef\x6d\x53\xc0\xe1\x87\x1f\x4e\x30\x05\
+\xa0\xec\x8b\x96\xe5\x81\x59\x94\xeb\xbd\x99\x02\xac\x92\x38\x8b\
+\xd4\x09\xd9\x31\xe3\x67\x2c\x2a\x35\x31\x68\x22\xea\xa6\x9b\x6e\
+\x4a\xcf\x3d\xf7\x5c\x3d\x9a\x98\x77\x8f\x91\x04\x43\x89\x2b\x24\
+\xea\xea\x71\xa8\x83\xc1\x10\x21\xfb\x00\x43\x09\x5c\x09\x61\x67\
+\xe6\x3a\x9c\xd7\xe7\x07\x43\xd4\x33\x9c\x79\xf7\x5d\x1e\x18\x86\
+\x62\x21\x72\xd3\x30\x8f\xd9\x9a\x61\xad\x60\x28\xd1\xa4\x91\x30\
+\xf2\xea\x1c\x9a\x7e\xfa\x19\x74\xdc\xb1\x27\x50\x34\x81\xf4\x01\
+\x11\xd0\x0c\x60\xd6\x8c\xb6\x89\x06\x72\x66\x30\xc3\xfd\x69\x6a\
+\xf3\x09\xb1\xb6\x54\x80\xe7\x40\x96\x3c\xe6\x6f\x68\x12\x32\x24\
+\xa1\x48\x9c\x7a\x7b\x06\x68\xc0\x84\xbf\x43\x5b\x06\x60\x00\x20\
+\x98\x3c\xda\xb8\xaf\xf4\x2d\x85\xf1\x46\x3c\x7d\x02\x86\xdb\xd0\
+\xbc\x79\x6f\x14\x00\x43\x3f\x87\xf9\x70\x30\xc4\x3b\xc1\xf4\x88\
+\x62\xf6\x53\xa6\xec\x4f\xa7\x9d\x7a\x0e\x35\xb7\x8c\xa3\x81\x7e\
+\x24\x96\xcb\x77\x83\xfd\x5d\x5c\x26\x6a\xfc\xf8\x56\xae\x4e\xd1\
+\x12\x47\x55\x0d\x00\x37\x8b\x33\x82\x6f\x52\xfa\x46\xfd\x6f\xf9\
+\x5c\xb6\x98\xdb\x52\x77\x51\x78\x86\x64\xe3\x87\xa4\x7d\xd1\x0c\
+\x3f\x5e\xd8\x49\x59\x53\xb7\x90\x37\x01\xa6\xda\x89\x6a\x86\xac\
+\x99\x40\xeb\x25\x87\x2d\x05\xf0\x19\x1e\x7d\xf4\x91\x94\xc9\xa0\
+\x74\x15\x22\x95\x61\xaa\xe4\x28\xa1\x82\x9f\x41\xca\x98\xf4\x4a\
+\x6e\x0e\xe5\xc0\xb0\x70\x50\x0e\xda\x03\x4d\x2c\x47\x9c\xd1\x2c\
+\x84\xe6\x86\xe0\x5e\x41\x52\xd3\x19\xd4\x62\xe4\x07\xc0\x7a\x01\
+\xa2\x9a\x16\x15\x80\xb1\xb1\x52\xee\xcf\x72\xd9\x5e\xca\x11\x30\
+\x78\x47\xd5\xfa\xf0\xc9\x29\x2d\x26\xdd\x44\x69\xde\xf0\x4e\x30\
+\xd7\x2a\x19\x80\x16\x56\xd0\x4d\x8d\x52\xc7\xe9\x06\xd1\xb6\xee\
+\x68\x3a\x97\xb6\xb9\x51\xc1\x83\xc3\xdf\x35\xf6\x45\xa2\x64\x43\
+\x7c\x85\xfa\xac\x91\x00\x43\x3c\xeb\xff\x88\xc2\x47\x95\x33\x98\
+\x8d\x3a\x47\xc0\x4c\x04\x17\x16\x00\x22\xa5\x2e\xbc\xf0\x42\x6a\
+\x6d\x6d\xf1\x72\x09\x45\x20\x4a\x18\xb8\x7d\x60\xa1\xa2\x8a\x37\
+\x02\x1f\xec\x5d\x3c\x34\x47\x98\x3a\xbe\xf7\xbd\xef\xd1\x6b\xaf\
+\xbd\x56\xf7\xa6\x8f\x0c\x18\x8a\x90\x49\x03\x6b\xc2\xa8\x67\x98\
+\x66\x30\x4c\xa7\x21\x12\x11\x6d\x8b\x68\xd2\x30\x39\x11\x0e\x93\
+\xa0\xb8\x01\x43\xa4\x55\x44\x43\x0e\xa5\x53\x28\xe1\xd4\x4a\x0f\
+\xdc\x3f\xcb\x80\x61\x17\x85\x50\x7b\x0e\x09\xd2\x9c\x04\x2d\xe1\
+\xed\xb5\x69\x86\x46\xe0\x31\xdb\x8b\x08\xf4\x73\xcf\xbb\x80\x4e\
+\x3e\xf9\x14\x8f\x93\xb4\x58\x9c\xa2\x8a\x5f\x63\x68\x2d\x25\x8f\
+\x8b\xc9\x69\x06\x11\x00\xd1\x92\x8e\x0c\x75\x2e\xeb\x96\x48\x5b\
+\x53\xd9\x03\x44\xdd\x79\x60\x68\x18\x6e\x94\x8e\x8d\xb3\x00\x43\
+\x49\x0f\x0c\x51\x94\x99\x49\x08\x8c\x66\x88\xc0\x24\x8b\x43\xda\
+\x0a\xfb\xcc\x69\x86\x28\xac\x0c\x40\x4b\xb4\x36\xd1\xee\xbb\xff\
+\x98\x8e\xfa\xf9\x54\x9a\x30\x69\x4d\xca\xa6\xa3\xd4\x3f\x38\x24\
+\xa6\x4d\xae\x74\x91\xa4\xb1\x63\x5a\x69\xc2\xc4\x76\x6a\x46\x61\
+\x0a\x53\x81\x42\xa8\xd7\xd4\x4c\x89\xfb\x1a\xff\x9b\x67\x2d\xd0\
+\x5a\x7a\x29\x01\x43\x58\x22\x32\xf9\x60\xb8\x70\x49\xb7\x01\x43\
+\x6c\x16\x61\xfd\x15\x1a\x36\x6c\x0a\xf8\xfc\x34\x68\xe6\xfa\x29\
+\xc6\x29\x30\x59\x7a\xf2\xd1\x47\xe8\xc2\x8b\xce\x65\x4d\x51\x02\
+\x84\x34\xba\xb7\xda\xcf\xc2\xcb\xcb\xd6\x10\xe1\x1f\x44\x5b\xb0\
+\xbe\xed\xea\x39\x48\x69\x58\xb2\xa4\x83\x4d\xb9\x00\x02\x98\x51\
+\x71\xe8\xef\x00\x06\xdb\x4c\x58\x08\x00\xeb\x05\x8a\xfe\xb7\xa8\
+\x97\x56\x68\xb3\xd6\xf8\x01\x0a\x66\x58\x5b\x1b\xb4\x89\x42\x0a\
+\xc5\x52\xa0\x8d\xb8\x1f\x40\x11\xda\x21\xd2\xb8\xd0\x67\x0a\x92\
+\x5c\x27\xd3\x71\xbc\x12\x72\xb5\x12\x7e\x94\x21\x38\x7f\x4d\xe4\
+\x1c\x5d\xc6\x79\x35\x9d\x32\x52\x60\xb8\x26\x51\xf8\x83\x9a\x5a\
+\x5a\xe3\xc5\xfe\x49\x07\x9b\x38\xc8\x9e\x31\xe8\xca\x24\x0f\x0d\
+\x50\xcc\x0a\x12\x5a\x8e\x41\x96\xb0\x75\xd9\xbd\x6b\xbe\x0d\x3e\
+\x71\x3f\xa1\x48\x4b\x71\x9e\x90\xcd\x20\x51\x63\x53\xbd\xcb\x1b\
+\x0d\x86\x76\xf0\x8c\x0a\x95\xee\x5e\x97\x3a\x96\xf6\x52\x3a\x03\
+\x30\x84\x66\x20\x60\x98\x01\xdb\x07\x65\xc5\x67\x88\xe8\xc5\x08\
+\x82\x56\x50\xe9\x7e\x90\xc6\x8c\x6a\xa7\xfb\x67\xdd\xc3\x66\xb1\
+\xa1\x3e\x3f\x18\x42\xeb\xca\xdf\xd5\x57\xde\x3f\x42\x5d\xe5\x15\
+\x08\xfe\x5f\x02\xfd\x8c\xf3\xce\x65\x67\x7e\x2c\x0a\xb2\x00\x21\
+\xea\xb6\x69\xd9\x20\x72\x73\xf1\x89\x2e\x45\x3d\x6e\x52\xc3\xa4\
+\xe0\x6b\x84\x06\x1a\x14\x6a\x1b\x00\x0f\x18\xb7\x78\x69\x86\x96\
+\x2c\xed\x64\x30\x44\x54\x2b\xb9\xc2\xde\x12\x8a\x46\x72\x66\x52\
+\x4d\x01\xf0\xa8\xd8\xb0\x69\x48\xd1\x9e\xbb\x6f\x43\xf3\xde\x7a\
+\x9d\xeb\x16\x32\x71\x39\x4c\x98\x9c\x76\x52\xa8\xba\x95\xe8\x93\
+\x7c\x18\x70\x75\x4d\x24\x66\xfb\xe8\x09\xf4\xf9\xb5\xd7\xa3\xc1\
+\x41\x97\x32\x69\x97\x06\x93\x52\x09\x1e\xbe\x39\x54\x6d\x68\x6f\
+\x8b\xd3\x98\x51\xad\x44\x60\x98\x41\x41\x60\x82\x7f\x2c\x4d\xa1\
+\xa8\x94\x3c\x62\x20\xe4\x36\x46\xbd\x5a\x84\x48\x4d\x80\x66\x88\
+\xa8\x54\xb5\x9e\x08\xaf\x28\x2a\x44\x88\x66\x38\x30\x94\x61\x3f\
+\xa1\xb0\x20\x81\x02\x4e\x7d\x86\x42\x3a\xc0\x24\xf2\x4e\x96\x0b\
+\x13\x83\x2f\x74\xa0\xaf\x8b\x3e\x78\xff\x3d\x2e\x5e\x8b\xfb\x66\
+\x60\x87\x2f\x71\xe4\x48\xdf\x8b\x9d\x54\x78\xbb\xe3\xe1\xb9\x8f\
+\x1f\x58\x63\x04\xd6\x5e\x7b\x6d\x9a\x36\x6d\x1a\x6d\xb1\xc5\x96\
+\xcc\xa6\x02\xe1\x0e\x93\xdf\xd3\x4f\x3f\x4d\x57\x5c\x71\x05\xbd\
+\xf2\xca\x2b\xfc\x40\xd5\x0c\xf5\xe9\xf5\xd6\x10\xd5\xa7\xc7\x43\
+\xea\x8a\xaf\x57\x7d\x9c\xca\xe4\x52\xf9\xba\x18\x7e\x05\x34\x37\
+\xdd\xf0\xe3\xdb\xad\xb6\xda\x8a\x23\x58\x95\x30\x1c\x32\x0d\xef\
+\x0c\x6a\xc9\xa5\x4b\x97\x4a\x04\xb4\x49\x3f\xd1\xc2\xc2\x36\xb8\
+\xf9\xfd\x99\x7e\xa0\xad\x17\x98\x97\x7e\xf7\xc6\xe4\x15\x0e\xdb\
+\x98\xd4\x63\x00\xca\xb9\x47\x34\x1a\xbf\x30\x93\xc9\x9c\x62\x77\
+\xa6\x1d\xd9\x59\xce\x3d\x6a\x39\xc7\x36\x91\x42\x78\x80\x34\xf7\
+\xfb\xdf\xff\x3e\x4d\x9e\x3c\x99\x77\x4d\xea\x40\xc7\x77\x60\x79\
+\xf9\xfe\xf7\xbf\x67\xfc\x26\x02\x8c\xd8\x39\x82\x7d\x01\x13\x0d\
+\xb9\x5c\x58\x58\x70\x82\xe3\xda\xeb\xae\xbb\xae\xe1\x9a\x21\x04\
+\xd9\x6f\x7e\xf3\x1b\xa6\x8a\x53\xba\x26\xf4\x07\xda\xad\x93\x19\
+\xbf\x17\x0e\xc6\xc0\x37\xbe\x90\x7d\x1f\xdf\x09\x32\x28\x60\x52\
+\xeb\xe9\x23\x5a\xba\x04\xc1\x18\x92\x67\x28\x38\x86\xa4\xf9\x2c\
+\x45\xe2\x12\x4d\x08\xa1\x87\x22\xb4\x10\xec\xd0\x0e\xdb\xdb\x5a\
+\x69\xf6\xfd\xf7\x32\x18\x0e\xf6\x2e\x93\x98\x4e\x4e\xd8\x4e\x53\
+\x6b\x4b\x33\x17\xc5\xad\x54\x33\xf4\xbf\x07\xc0\x10\x0b\x1a\x9b\
+\x13\x68\xe4\x67\x9f\x7d\x36\x87\x79\x8b\x70\x31\xb8\xe1\x37\xc2\
+\x59\xfc\x6b\xfa\x63\xb1\x1d\xbe\x5f\x18\xda\x73\x4d\xe9\xd8\x16\
+\x77\xb8\xd4\xd1\xd1\x29\x51\xb5\x91\x38\xfb\x53\x11\x44\x83\xdc\
+\x3c\x8e\xae\x44\x80\x06\xa2\x6c\x4d\x74\x29\x08\x0a\x44\xd8\x64\
+\x68\xff\x1f\xfd\x80\x5e\x7e\xf9\x69\xbe\x2d\x76\xd9\xa2\x89\x48\
+\x02\xff\x70\x3a\xab\xe1\x26\x65\x98\x9c\xa5\x38\xbc\xf1\xf9\x71\
+\x74\x25\x0f\x8e\xd5\x54\xc9\xe5\xf3\xf3\x9b\xca\x09\x6a\x08\xf7\
+\x99\x61\xcd\xd5\xd2\x2f\x7e\xc0\xc9\x19\x7d\xc5\x24\xe2\xdb\x3b\
+\xe7\xe5\xfe\x99\x7c\x3f\x19\x11\x5f\xde\x64\xed\x41\x29\x02\xd6\
+\x12\x8d\x6a\x47\x84\x8a\x3f\x5d\x80\x56\x03\x44\x6c\xaa\x44\xac\
+\xef\x27\x9f\x7c\x92\xd6\x5d\x17\xc5\xd0\x25\xa5\x00\x6b\x1c\x01\
+\x6f\x20\xd1\x40\x45\x08\x99\x43\x42\x7d\x86\x7f\x7e\x4d\x47\xe6\
+\x62\xfe\x98\x34\x4a\x53\x2c\x25\xe3\x6c\x79\x59\x08\x94\xf4\x3d\
+\x6c\x80\xfa\xc9\x4f\x7e\xc2\x1c\xb8\xac\xcd\x3b\xb2\xe9\xb9\xe3\
+\x8e\xbb\xe8\xc0\x03\x0f\xf4\xde\xd3\x36\xd7\x6a\x1f\xda\x9a\xb5\
+\x9a\x78\x4b\xb5\xad\x81\xfd\x71\x11\x91\x73\x6a\xa9\x67\xd7\xeb\
+\xbb\x91\xd2\x0c\xd1\xde\xd1\x91\x48\xec\xbd\x58\x2c\x36\x46\x73\
+\x5c\xea\xf5\x12\xd5\xdc\x07\x93\x89\xeb\xaf\x39\xc2\x1c\xaf\x66\
+\x06\x00\x1c\xf2\x6b\xce\x38\xe3\x0c\x8f\x2e\x09\xf7\x7f\xea\xa9\
+\xbf\xb0\x06\x08\x21\xa6\x8b\x12\x3b\x4c\x08\x68\xbb\xd0\x6e\x35\
+\x6d\x29\x76\x8d\x5f\x33\xc4\x4e\x16\x09\xba\x68\xab\x1e\xea\x2c\
+\xd7\xb2\x2a\x36\x88\xd8\x69\x04\x52\xda\x26\x47\x9f\xc5\x14\x5c\
+\x66\xf4\x73\xd9\x5a\x44\xdd\x5d\x2e\x2d\x46\x34\x69\xc6\x90\x73\
+\xe3\xcb\x50\x84\x52\x86\x96\x89\xef\x69\x8a\xaa\x3a\x19\x98\xe8\
+\x88\x46\xb5\xb7\xd0\xac\x99\x77\xd3\xc9\x53\x4f\x22\x27\x2b\x95\
+\x10\x9c\x4c\x9a\x13\xce\xa1\x3d\x8b\x70\xa9\xcc\x67\xe8\x07\x43\
+\x0d\x86\xd1\x45\x8a\xe0\xa7\x53\x4e\x39\x25\x6f\x23\x50\xaa\xef\
+\x8b\x6f\x12\x0c\x54\x28\x8d\x57\x81\x9b\x70\xe4\x68\x98\x68\xe1\
+\x92\x34\x2d\xeb\xe8\x62\x62\x6c\x94\x4d\x12\xcd\xda\xb0\xd1\xb8\
+\xc2\xbf\xca\xcf\x81\xd9\xd2\x75\xb9\xf8\x2f\x8a\xef\x46\x23\x19\
+\xda\x67\xaf\x1f\xd0\x1b\xaf\x8a\x5f\xd9\x26\x6b\xd0\xe0\x86\xa0\
+\x79\x13\xd4\xfe\xa0\xeb\x83\xbe\x0f\xba\x7f\xad\xc2\xae\xd6\xeb\
+\x79\x33\xe0\x73\x2c\xaa\x46\xaa\xeb\xd1\xd6\xb6\xd0\xaf\x00\x49\
+\x6c\x5c\x01\x86\x5f\xff\xfa\xd7\xbd\xe0\x12\xf4\xff\x47\x1f\x7d\
+\xc4\xeb\xf9\x8d\x37\xde\xf0\x02\x4c\xec\x4d\x09\xd6\x13\x9e\x97\
+\x03\xe0\xfc\x94\x93\x5a\xdf\x27\x68\x3c\x0a\x7d\x5f\x68\xe3\x64\
+\xff\xcd\x26\x09\xd7\xfc\xc9\xfd\xf6\xdb\x8f\x37\xeb\x4a\x0e\x8e\
+\xf5\x78\xd7\x5d\xf7\xd0\xbe\xfb\xee\xeb\xd5\x2a\xb4\x41\x56\x81\
+\x54\x23\x45\xb5\x1d\x41\xfc\xa3\x0d\xea\x8f\x2e\x22\xe7\xb3\xf5\
+\xe6\x20\x2d\x2a\x6f\xab\x19\x94\x6a\xaf\x89\xc7\x9b\xa7\xa5\xd3\
+\xa9\x8b\xd1\x71\x76\xa2\xbb\x9d\xb3\x52\xed\xbd\x83\xae\x93\x3c\
+\xa8\x5c\xc1\x4a\x80\x98\x3a\x81\xfd\x4c\x0a\xc8\x31\x3c\xef\xbc\
+\x19\x1e\xcd\x21\xee\xfd\xcc\x33\xcf\xd0\xe6\x9b\x6f\xee\xed\xe4\
+\xb1\xa0\x38\xba\xd0\x2c\x38\xd8\xd5\xeb\x7d\xd8\x60\x08\x80\xf9\
+\xed\x6f\x7f\x4b\x87\x1e\x7a\xe8\xb0\xc7\x14\x12\x12\xfa\x37\xfd\
+\x94\x80\x8e\xfc\x00\x13\x8f\x63\xd2\xdc\x11\xfe\xab\xce\xce\x41\
+\x5a\xd6\x89\x30\xef\x30\x85\x51\x15\xc1\x80\x61\xda\xd5\xc2\xaa\
+\xd0\x3c\x4c\x24\x64\x16\xb9\x99\x61\x6a\x6f\x6b\xa2\x7b\xee\xbd\
+\x93\x8e\xfb\xf9\x91\x8c\x79\x1c\x25\xc9\xa4\xca\x52\x7a\x09\x47\
+\xa5\x01\x54\xc3\x85\xb3\x68\x51\x1a\xc6\x7d\xd1\x45\x17\xb1\x99\
+\x54\x8f\x20\xc2\x74\xbb\x8f\xf4\xde\xf6\x33\x82\x34\x43\x58\xf9\
+\x96\x74\x0c\x51\x77\x67\x37\xa5\xb2\x19\x8a\x86\x10\x2a\x62\x34\
+\x06\x44\xba\x72\x99\x27\xc3\x72\xc2\x55\x5a\xb3\x12\x31\x0a\xfd\
+\x3a\xea\xd2\x7e\x3f\xda\x89\x5e\x7f\x1d\xb5\xaf\x73\x89\xe0\x6c\
+\x5a\x34\x41\x1d\x41\x73\x27\x08\xac\x82\xae\x0f\xfa\xbe\xd4\xfb\
+\xe3\xda\x20\x61\x18\x74\xff\xda\x85\xa5\x6c\x34\x14\xe4\xf0\x3c\
+\xfd\x5d\x34\x1e\xe1\xd1\xb5\x23\x29\xd1\xbf\x88\x8a\x7c\xf1\xc5\
+\x17\x69\x8d\x35\xd6\xf0\xea\xf0\x01\xe0\x16\x2e\x5c\xc8\x51\xe0\
+\xaf\xbf\xfe\xba\x95\x98\x2f\xf3\x4b\x2d\x2f\xaa\x21\x62\xad\x33\
+\x39\xbb\x75\xd4\xfe\x3e\x41\x3d\x56\xf8\x7b\xf6\x4f\x9b\xf4\x10\
+\x0d\x94\xd1\x76\xe6\x2c\x0e\xa2\x25\xa3\x3f\x0e\x3a\xe8\x20\xba\
+\xee\xba\xdf\xb2\x35\x45\x13\xeb\xc1\x82\xb3\xf7\xde\x7b\xe7\x31\
+\xef\xa8\x79\x55\x83\x66\xec\x22\xe6\xa5\x5c\x08\xda\xca\x06\xf5\
+\xc7\xc9\x44\xce\x25\xd5\xf5\x54\xe5\x57\x8d\xa4\x66\x68\x5a\x17\
+\x9e\x17\x89\x44\xd6\xc1\xc0\x01\x40\xc4\xf7\x26\x39\x42\xcb\xeb\
+\x50\xaa\x22\x65\x92\x39\xe9\xa4\x93\xe8\xe2\x8b\x2f\xe6\x48\xb4\
+\xf6\xf6\x36\xc6\x8c\x47\x1e\x79\x8c\x76\xdf\x7d\x77\x06\x3f\xad\
+\x6e\x01\x0d\x17\x3e\x08\x75\xc4\xd7\xbb\xfd\x85\x34\x43\xd0\xb1\
+\x61\x11\x00\xc8\x35\xb2\x4b\xc0\x46\x4c\x45\xf9\x00\x2a\x2d\xe2\
+\xc9\xac\x26\x2e\xbf\xa5\xcb\x6a\x34\xe8\x63\x11\x3c\xd3\xb5\xac\
+\x8f\xa3\x2a\x11\x4d\x98\xc9\xc2\x3c\x27\xe9\x15\x08\xcf\x47\xa9\
+\x26\x44\x69\x4a\xd0\x08\xa2\x6c\x89\x46\xb5\x35\xd3\xdc\xb9\xb3\
+\xe9\xf0\xc3\x7e\x4a\x6e\x26\x65\x4a\x0f\x38\x14\xc5\xee\xda\xd4\
+\x95\x2b\xa1\x78\x15\xec\x36\xbf\xf0\x47\xa4\x2f\xde\x43\x79\x60\
+\x31\x3e\xc7\x1e\x7b\xac\x61\xc4\x41\xc5\x70\x61\xd6\x28\x76\xd8\
+\xc2\x5c\xfb\x48\xfb\x4b\xfb\xc8\xbe\x36\x4f\xc3\x36\x06\xc4\x81\
+\x7e\xa2\xee\xee\x5e\x4f\xd3\xf5\x72\xed\xb0\x71\x80\x5f\xd5\x68\
+\x86\x0a\xda\xec\xb3\xc3\xfc\x8e\x66\x69\xe7\x1d\xb7\xa6\x37\xff\
+\xf5\x77\x2f\x97\x4f\x7c\x72\x85\x4c\xa4\x85\xdf\xa0\xd1\x60\x18\
+\x24\xcc\x6a\x7d\x7e\xd0\xfd\x83\xd7\x8e\xcc\x39\xff\x5c\xd7\xfb\
+\xaa\xf0\xd7\x0d\x06\xd6\x03\xd6\x08\x7e\x47\xd9\x24\x94\x4f\xb2\
+\xd7\x0b\xdc\x1c\x60\x94\xc2\x77\x58\xc3\x58\xeb\x1a\x6d\xe9\xaf\
+\xcf\x27\xe3\xe9\x0f\xaa\x6b\x5c\xf5\x8b\x42\x7d\xa1\x1a\x9b\xbd\
+\x71\xb7\x81\x11\xd7\x68\xee\x22\xda\x8b\x77\x85\x5c\xfa\xd1\x8f\
+\x7e\xc4\xf9\x81\xe0\x71\x55\x4b\xd0\xac\x59\xb3\x59\x96\x29\xe8\
+\x8b\x1f\x38\x37\x1f\x6d\x8a\x36\x05\xd8\xa0\xf1\xaf\x7d\x7c\x87\
+\xbd\xf5\x3b\x44\xcc\x36\x33\x62\xc7\x72\x00\xc3\xc8\x81\xb1\x58\
+\xf4\xf7\xb6\x93\x77\x24\xde\x56\x27\x8e\x0a\x40\xdd\x09\xdb\xfe\
+\x01\x05\x43\xf0\xef\x5d\x72\xc9\x45\x9c\x46\x01\x21\x8c\xe3\xb9\
+\xe7\x5e\xa0\xef\x7e\xf7\xbb\xc3\x4c\x35\x28\x73\xb2\x6c\x19\xfc\
+\x64\xf5\x3f\x6c\x60\x43\x3b\x10\x08\x00\x26\x79\x98\x7e\xb0\xd8\
+\x55\xdb\xd5\xc4\x59\xdd\x29\xdb\x9f\xfa\xbe\xb9\xc5\x6c\x4c\x79\
+\x56\x73\xd5\xdc\x94\x4a\x67\x99\xa4\xbb\xbb\xbb\xc7\xf8\xc0\x50\
+\x36\x27\xcb\x1a\x10\x2a\xbb\x23\x50\x44\xe8\x9a\xa4\x46\x9b\xe4\
+\x34\x38\xd4\xd6\xda\x4a\xb7\xdf\xfe\x07\x3a\xff\xdc\x73\x8c\xb6\
+\x2d\xa5\x75\xe2\xa8\xf0\x5d\xa0\x9c\x4d\x39\x3d\xe5\x5f\x7c\x5c\
+\x01\xc2\x04\x49\xe0\xd9\xd8\xb0\x60\x77\xab\x85\x50\xed\xa4\xe9\
+\x62\xc2\x44\xff\x5e\x6c\xc3\xa0\x7d\x65\x7f\x2f\x3f\x47\xa8\xaf\
+\x7f\x88\xab\x79\x80\xbc\x5d\x9e\x85\x42\x42\xf9\x41\x24\xe0\x6e\
+\xe5\xbe\x87\x0b\x91\xf9\x30\x05\x0c\x11\x79\x7b\xf8\xa1\x07\xd1\
+\x07\xef\xff\xd7\xdb\xb4\xa8\x8f\xaa\x56\x8d\xcb\x7e\xa7\x72\xfa\
+\xb5\xd8\x39\x41\xc2\x6c\x39\x08\x43\x5f\x53\x95\xd3\x55\xfc\x86\
+\x7e\x0d\xc9\x36\x37\xdb\xc2\x7c\xc2\x84\x09\xf4\xec\xb3\xcf\x12\
+\x22\x4a\x95\x48\x00\x6b\xfe\xe3\x8f\x3f\xe6\xc0\x12\xf5\x19\xda\
+\xb9\x72\xba\x39\x46\xf0\x88\xd6\xed\x53\x5a\x46\x6d\x54\x50\x7f\
+\xd5\x32\x16\x85\xae\x55\x53\xa6\xdd\x4e\xfd\x59\xe7\x2b\xde\xdb\
+\xa6\x59\xc3\xdc\x52\x9f\x21\x02\xfd\xb4\x08\x38\x2a\x64\x00\x24\
+\x55\x11\xd1\x39\xa8\xeb\x4b\x37\x1c\x6a\xc1\xc3\x7c\x1f\xf9\xf1\
+\x0f\x1d\x44\x94\xbd\xa5\xde\xfd\x58\xea\x7e\xcb\x01\x0c\x31\x91\
+\x63\x4f\x65\xb3\xd9\xef\x29\xf3\xc3\x48\x4e\x2c\xbf\x7d\x1c\x83\
+\xac\x66\x16\x15\xa8\xca\x4d\x0a\xd3\x1e\xbe\xc7\xdf\xdf\x7f\xff\
+\x7d\xfa\xe2\x17\xbf\x68\xf2\x0d\x25\x47\xab\x91\x54\x6c\x7e\xc1\
+\x8c\x88\x40\x2c\x68\xd4\x44\x53\xb3\x85\x6a\x43\xca\x9e\xa3\x20\
+\xa8\x81\x00\xb6\x06\x64\xef\x6c\x73\xf4\x5f\xb9\x80\x09\xdd\xfd\
+\xf6\xf6\xf6\xf3\x82\x42\x3e\x1f\x0b\x74\x94\x72\x42\xc5\x06\xa4\
+\xb5\x23\xc7\xcf\x54\x9f\x90\xbc\x34\xa1\x68\x6b\x6d\x4e\xf0\x86\
+\xe0\x99\xa7\xff\x46\x61\x53\xe7\x2c\x9d\x1a\xe2\x30\x49\x0e\xbb\
+\x30\x7d\x5c\xc9\xc4\x2e\x04\x86\xea\x2b\x45\xfb\x60\xf6\x9a\x38\
+\x71\xa2\x17\x04\x10\xb4\x58\xb5\x3f\xfd\xe0\xa1\xd7\xa9\x46\x31\
+\x1c\x08\x05\xf0\x90\x5b\x07\x21\x8a\xf2\x51\x5c\xdf\x1d\x55\x2b\
+\xc2\x51\x36\x8f\x22\xf2\x88\xfb\x8a\xb2\x4c\xc7\x86\x3f\xa1\xae\
+\x61\x9a\xa9\xd6\x42\x14\x8b\x84\xe9\xbd\xff\xbe\xcb\x49\xcb\xb6\
+\xc0\xd1\xb9\x68\xff\xad\x92\x3e\xb2\xcf\x2d\xe7\xfd\x4b\xdd\x3b\
+\x68\x0d\x06\xdd\x3f\xe8\xfa\x6a\xdf\x2b\x77\x5d\x3e\x18\xda\x80\
+\x87\x0d\xa9\x6a\x4c\x98\x93\xd8\xd4\x4a\xb0\x55\x13\xcf\x93\x6b\
+\xae\xb9\x86\xbe\xf6\xb5\xaf\x19\x0a\x3c\xd1\xc6\xe1\x33\x3c\xf7\
+\xdc\x73\x39\xf0\x4d\x41\x44\xcd\x8f\x58\x4f\xa8\x2e\x91\xdf\xbf\
+\xcb\xd7\x67\xa8\x73\x45\xad\x09\x3a\x4f\xf1\x2e\xab\xad\xb6\x9a\
+\x21\x6f\x08\xb1\xe5\x04\xe7\xe0\x7c\xbc\x17\x40\x0f\xfe\x75\xb0\
+\x03\xe1\x80\xb9\xf7\xc1\x07\x1f\xe4\x8d\x35\xd6\xac\x5a\x5b\x20\
+\x4b\x24\xb2\x3e\x46\x1f\x7e\x28\x05\x21\x82\xc6\xdc\xee\x9f\xfa\
+\x8e\x7f\xe8\xcf\x44\xd9\x2d\x6b\x9f\x33\x95\xdd\x61\xb9\x80\x21\
+\x51\x74\x2b\x22\xe7\x09\x8d\xc6\xac\x46\x58\x56\xf6\x9a\x72\xb6\
+\xdf\x37\xe8\x17\x8c\x18\x50\x4c\x20\x68\x5f\x60\xa8\xc1\xef\x98\
+\x24\xb8\x0e\xe1\xc8\x87\x1d\x76\x58\x5e\xb4\x99\x4e\x00\xbb\x92\
+\x45\x35\xed\x2a\x76\x8d\x2d\x98\xd5\x4c\xa8\x01\x3b\x95\x3f\x27\
+\x17\xc0\x92\x03\x43\x49\x0a\xcf\x2b\xe6\xea\xa5\xf4\x81\x1c\x1a\
+\x21\x22\x30\x8f\x26\xb8\x5a\x39\x9f\x68\x82\x18\x60\x32\x05\xe5\
+\x1a\xf7\x2b\x4a\x34\x19\xc2\x69\x5d\x44\xda\x37\x1a\x52\x5e\xe9\
+\x62\x29\x04\x86\xb8\xb7\x6a\xef\xf6\x4e\xd9\xf6\x23\x55\xde\x2f\
+\x72\x45\x90\x86\xa6\x0c\x28\xe8\x0f\xa5\x24\x93\x1c\xc6\x5c\x3d\
+\x8b\xdc\xb3\x4d\x64\xa6\xf2\xc0\x42\x3b\x0c\x0b\xe5\x97\x46\xe6\
+\xe9\xae\x5b\x38\x4a\xcb\x37\x97\x96\x9a\x2b\xd5\xbe\x3b\xae\x0b\
+\x1a\x9f\x20\xc1\x18\x74\x7d\x2d\x6d\x33\x23\xe4\xf9\xf6\xf0\xbb\
+\x1d\x39\x8a\x4d\x2a\x48\xa4\xc7\x8d\x1b\xc7\x02\x1c\xda\x20\xe8\
+\xcd\xd0\xb7\x88\xf6\x06\xf5\x22\xce\xc7\x18\xeb\xa6\x07\x3f\x03\
+\xf0\x70\x1e\xfe\x86\xef\xb5\x8a\x0d\xd6\x3a\xac\x43\x60\x5b\xd1\
+\x80\xad\xe5\x1d\x4d\x6a\x5b\x45\x34\x82\x5c\x37\xa3\xc8\x73\x86\
+\xff\x1c\x16\x23\x98\x35\x21\xc3\xb0\x71\xc3\xbb\x4f\x9a\x34\x89\
+\xbe\xf8\x45\x68\xc5\xb9\x1c\x6a\x98\xfa\xa1\x11\xe3\xdd\x70\x0d\
+\x64\x0a\x5c\x56\x58\x53\xa8\x55\x88\x7b\x21\xed\x02\x5a\xb1\xe6\
+\x5f\x8e\xec\xf8\x87\xb7\x26\xca\x3c\x59\xfb\x9c\xa9\xec\x0e\xcb\
+\x09\x0c\xd1\xc8\xf0\xcd\x6d\x6d\x6d\x07\x2b\x43\x44\x65\xcd\xae\
+\xfd\x6c\xa5\x1f\xc2\xa4\xd1\x85\x8c\xc9\xa1\xe6\x47\x14\xe2\xc4\
+\x42\x01\xd0\xe1\x5c\x54\x79\x5e\xb4\x68\x91\x24\x18\x5b\x02\xac\
+\x11\x44\xbb\x36\x48\x2b\x20\xc2\x4c\xa8\x1a\xac\xf2\xa9\x62\xb2\
+\xa3\xed\x30\x15\x6a\x30\xd0\x70\x10\x31\x41\x1d\x24\x69\x11\x52\
+\x46\xc7\x88\x73\xae\x50\x2f\x3f\x23\x77\x0c\x7e\x05\xbc\x1b\xff\
+\x8c\x74\x8a\x0c\x72\xcb\xa4\xd6\x61\x46\x13\xcd\x4d\x3d\x3f\x2c\
+\x1c\xf4\x1d\xca\xf5\xe8\x2e\xdd\xce\x49\xd2\x54\x16\x08\x9a\x6a\
+\xfc\xc1\xfe\xf7\x40\x20\x0e\xda\xa3\x81\x4b\x7a\x5f\xbc\x3b\x8e\
+\xa0\x00\x1a\x3b\x3a\xae\x90\xe0\xb6\x9f\x87\xef\xf5\x9f\x8e\x45\
+\x9c\x4b\x1b\xa1\xd0\xb1\x68\x81\x20\xab\x96\xdf\x0d\xa5\x1a\xea\
+\xf5\xc1\x4c\x0a\xa2\x01\xc4\xcf\xb8\x60\x7d\x01\xc7\x9d\x24\xaf\
+\x0f\xf6\x0f\x49\x01\xde\x78\x5c\xfa\x95\x69\xd8\xe4\x9a\x7a\x1c\
+\x41\xc2\x2a\xe8\x19\x41\xed\x08\xba\x7f\xd0\xf5\x41\xcf\x0f\xfe\
+\x5e\xf8\x47\xd5\xad\xa1\x9b\x21\x8c\x3f\xd2\xa4\xe6\xce\x9d\xcb\
+\x1c\x9f\x58\x13\x58\x1f\x9a\x42\xa1\xc0\xa1\xf7\x57\xab\x0a\xee\
+\xa3\x11\xd8\xba\x19\xd0\x77\x7c\xea\xa9\xa7\x68\x9f\x7d\xf6\xe1\
+\xf5\xae\xc4\xda\x7e\x02\xf3\xc6\xbf\x6f\xe1\x1e\xd1\xb5\x66\x13\
+\x7d\xa3\xad\xd0\x7e\xb1\x36\xa4\xec\x96\xcc\x49\x04\xb7\xd9\x24\
+\x21\x9a\x27\x8d\x3b\x2b\xd5\x24\x7e\x86\x09\x15\x29\x4b\x38\xfe\
+\xf3\x9f\xf7\xe8\x3b\xdf\xf9\x4e\x5e\x01\x5f\x05\xd7\x52\x63\x54\
+\xc7\xfe\xf8\x1d\x91\x73\x48\xf0\x7c\xa8\xff\x19\xcb\x0d\x0c\x9b\
+\x9a\x9a\x3e\x93\x4a\x65\xfe\xed\x38\x4e\xb4\x1e\x3b\xe3\x5a\xbb\
+\x46\x4d\x8b\xfa\xc9\x66\xaf\xac\x08\x34\x5d\x40\xf5\x9e\x0c\xba\
+\xf8\xf0\x89\xe7\x02\x8c\xfd\xc1\x38\xf8\x4e\x92\x72\x2b\x0f\x30\
+\xca\x13\x60\x9c\x20\x9e\x0f\x86\x4a\x17\xc6\x7f\xd6\x02\xac\xfc\
+\xde\x12\x03\x23\x54\x5e\x12\x18\xa2\x45\x5c\x55\x70\x04\xf5\xb7\
+\x6a\xcb\xfa\x6e\x41\x60\x55\xe8\x7e\x76\xff\x28\x80\x6b\x3f\x41\
+\xe8\xe9\xae\xd6\x0f\xb6\xf6\x7b\x17\xdb\x1c\x94\xfb\x1e\xda\x2e\
+\xe6\x6c\xe1\x9a\x8e\x5c\xce\xd7\x24\x97\x48\xbe\x21\x0b\x17\xe6\
+\x1c\x05\x05\x1a\x80\x14\x1b\x0a\xcc\x9b\x5c\x6a\x1e\xae\x85\x40\
+\x45\x7b\xd4\x1c\xaf\x02\xbd\x91\x1b\xaa\xa0\x71\xd2\xef\x6b\x05\
+\xbb\x52\xfd\x5c\x6e\x1b\xec\xf3\xfc\xf7\xe3\x8a\x18\x0e\xc8\x17\
+\xa4\xbf\x6d\xca\xb0\x8d\x36\xda\x88\xd3\x27\x30\xe7\x34\xa5\x40\
+\x37\xb5\x41\x51\xb2\xfa\x4c\x5b\x6b\xff\xeb\x5f\xff\xca\xfe\x68\
+\x68\x49\x0a\x86\x42\x40\xe0\x78\xbf\x6b\x7a\xcc\xf2\x18\x3b\x7d\
+\xb6\xce\x9f\x3d\xf7\xdc\x93\xd3\x27\x50\x59\x02\x07\xfc\x9b\xd8\
+\x1c\x8b\x3f\x3d\x57\x9b\xd2\x06\x41\xcc\x4d\xd4\xc7\x44\x3f\xa3\
+\x56\x21\xae\x41\x5f\xa1\x94\x14\x34\x4d\x98\xf4\xb5\x92\x4f\x35\
+\x6b\xb7\xd2\x31\x37\x91\xb1\x99\x74\x3a\xf9\x05\x22\x7a\xbf\xd2\
+\xeb\xeb\x71\xfe\x72\x03\x43\x69\x7c\xf8\xb4\x48\x24\x72\x3e\x7e\
+\x1a\x89\x0e\x0f\xea\x30\x15\xdc\xaa\xd5\xa8\x0f\xc1\xaf\x25\x14\
+\xba\x4f\x35\x3b\x23\x5b\xd8\xfb\xcd\x74\x9a\x17\x94\x13\xda\xaa\
+\xcd\xe5\x86\xcc\x16\x18\x41\x01\x24\xc3\x92\xb3\xf9\x25\xc4\x4c\
+\x2a\xcf\xc8\x31\xa1\x78\x7c\x9c\x4c\x7f\x1d\xa1\x8c\x32\x97\x20\
+\xa1\xdc\x14\xb7\xb5\xdf\x17\xde\x32\x35\x35\xe1\x13\x40\xa5\x42\
+\xa2\x96\x8d\x8e\xdd\x3f\xc8\x8f\x52\x0e\x45\x0d\x1c\xd0\x7b\x6b\
+\x88\xb9\x8e\x8b\xb6\xad\xd8\x98\xe4\x83\xac\x5c\x15\x04\x06\x5c\
+\x7d\x22\x1c\x65\xfa\xb9\x58\x1c\x91\xad\x21\x4a\x82\x7f\x95\x6b\
+\x0d\x0a\x9f\x27\xa7\x95\x20\x1f\x4e\xa8\xac\xcd\x6e\x42\xc6\x2d\
+\x6b\x22\xf3\xed\x00\x08\xed\x23\xfb\x6f\x41\x73\xb4\x51\xdf\x07\
+\xbd\x7f\xd0\xfc\x6e\x34\x18\x6a\x9e\x29\xde\xdf\xd6\x8a\x20\xb0\
+\x51\x34\x17\x60\x08\x13\xba\x9a\x43\xd5\x8a\xa2\xeb\x27\xe8\xfd\
+\xb4\x5f\x01\x22\x7f\xf9\xcb\x5f\x38\xf0\x04\x7e\x45\x8d\xa6\x8c\
+\xc5\xc4\x6a\xa4\xb2\xc0\x9e\xd7\xf5\xd4\xf0\x8b\x8d\xaf\xfd\x0c\
+\x05\x41\x8d\x7e\x85\x66\x88\xca\x39\xd8\x4c\x6b\xe5\x11\xad\x43\
+\xa8\xe0\x88\xdf\xb1\xae\x07\x06\x06\xa9\xb5\x15\xf9\xd5\x92\x02\
+\x25\xb2\x57\x0a\x39\xe3\xf8\xc7\x3f\xfe\x45\xdb\x6d\xb7\x1d\x2d\
+\x58\xb0\x80\x7f\x57\x6b\x59\xb0\x7c\xa9\xcb\xcc\x9c\x4e\xe4\x5c\
+\x50\x97\x3b\x55\x71\x93\xe5\x0c\x86\x20\x19\x6e\x7e\x23\x95\x4a\
+\x7e\xa5\x8a\xb6\x37\xe4\x12\x4c\x3a\xfd\x67\x0b\xd7\x20\x61\x10\
+\xf4\x7d\xa1\xc6\xda\x42\x19\xfe\x0e\x98\x65\xb1\xb8\x0b\xfb\xc0\
+\x8a\xb1\x6f\xca\x9d\xed\x1d\x70\x21\x30\xc8\x37\xf3\xd8\x69\xf6\
+\x72\x3d\x16\x8a\x06\xd1\xc8\xf5\x61\xd6\x84\x42\xa0\xe0\x62\x81\
+\x6f\x11\x59\xca\x12\xca\xbd\x12\x33\xa3\xc8\xf7\xa0\xdf\x82\x76\
+\xab\xe6\xd7\x78\x2c\x4e\xa9\x74\xca\x2b\x86\x5b\xc9\xa0\xd9\xfd\
+\xc3\xb5\x01\x35\x5a\xd3\x24\x54\xe7\x04\x55\xce\x7c\x56\xc9\xfd\
+\x2b\x3b\xd7\x24\xd8\x1b\xe6\x9e\x18\x8a\x0c\xbb\x0e\x35\xc5\x9b\
+\x29\x05\x73\xb1\xf1\x9f\xe6\x58\x5c\xb0\xbb\xc0\x13\x50\x15\x39\
+\xc7\x9a\xa2\x42\x4d\x83\x1c\x94\x92\xab\x9a\xf9\x53\x59\xfb\x4b\
+\x9f\x1d\x04\x16\x41\xed\x6b\x34\x18\x42\x70\x4b\xf5\x09\xb0\x19\
+\xc9\xa1\xa6\x6f\x04\xc7\x80\x0e\x11\x60\x58\x28\xc5\x46\xd3\x06\
+\x4a\xf5\x80\xf2\x99\x02\xf0\x9e\x78\xe2\x09\x06\x43\xb0\xd4\x68\
+\xfe\x22\xcc\x8a\x92\x6f\x98\xf4\xe8\xd4\x1a\x61\xee\x2e\xd6\x46\
+\xed\x5f\x8c\x83\x6e\x9e\xd0\x1f\xf8\x1d\x29\x22\xb7\xdd\x76\x1b\
+\xf7\x0f\xbe\x53\x90\xeb\xeb\x1b\xe0\x36\xcb\x26\x3f\x47\xb2\x81\
+\x67\x2c\x5b\xd6\xcd\x45\x97\xf5\x50\x2a\xca\x17\x5e\x78\x81\x59\
+\xae\xfc\x01\x44\xf5\x9c\x6b\x85\x65\x21\xfd\xdd\x75\x9d\xaf\x36\
+\xfa\x39\xa5\xee\xbf\xdc\xc1\x30\x91\x68\xd9\x25\x99\x1c\xba\x7f\
+\x79\x76\x82\x2e\x2c\x5b\x03\xf4\x2f\xfe\x5a\x85\x45\xe1\x09\x20\
+\xdd\xaf\x1a\x29\x16\x17\x26\x34\xa2\xe3\xb0\xe8\xd4\xaf\x24\x40\
+\x97\x03\x43\xcd\x0b\x52\xe6\x1b\x3d\x4f\x40\xcd\x30\xcd\x18\xbf\
+\x97\xfe\x2d\x07\x86\x85\x41\x95\xcd\x4f\x5c\xc7\x0e\xac\x1b\x59\
+\xce\xce\x47\x3d\x43\x5c\x97\xd3\x5a\x55\x7d\x44\x20\x8d\x16\x6a\
+\x75\xb8\x64\x53\x73\xa2\x89\xfa\xfa\x91\x37\x2a\xfe\x36\x05\x43\
+\x98\x60\x10\xc1\x26\xad\xaa\x8e\x85\x06\xfd\x03\xcd\x50\xc9\x19\
+\xf0\xde\x88\x12\x44\x74\x2d\x36\x10\xf8\xbb\x92\x34\xf3\x53\xb8\
+\x26\x5f\x6e\x53\x63\x0b\x12\x1d\x63\xd5\xfa\xb5\x7f\x4a\x0b\x7b\
+\x61\x99\xe9\xe9\xe9\xa5\xf9\x1f\x2f\x34\xe3\x12\xe1\xe4\xfb\x78\
+\x4c\xc8\x17\xd8\x97\x93\x01\x28\x9a\xca\xf5\xf0\x07\x9a\x0d\x03\
+\x42\x6c\x50\x0c\xb9\xbf\x4f\x6a\xd6\x69\xdb\x20\x68\xff\x3f\x18\
+\x16\x5e\xf9\xc3\xc1\x35\xcb\x2c\x32\x38\xd4\x6f\xa8\x79\x83\x98\
+\x07\xd7\x5e\x7b\x2d\x9b\x05\xd5\x8c\x6a\xdf\xb5\x1c\x30\xb4\xcf\
+\x47\x05\x1a\xd0\xfd\xbd\xfb\xee\xbb\x1e\xdb\x13\xe6\x30\xcc\xb0\
+\x30\x9d\x02\x24\x35\xb5\x03\xed\xc4\x38\xd6\xb3\xf2\x44\x29\x40\
+\xc4\x3c\xf5\x5b\x14\x36\xd8\x60\x03\xae\xcd\xaa\xc1\x6a\x68\x93\
+\xc6\x35\x20\x7d\xe4\x3b\xdf\xd9\x84\xd7\x20\xd6\x22\xc4\xc3\x3f\
+\xff\xf9\x2f\xba\xfd\xf6\xdb\xbd\x60\x22\x3c\x0f\xed\xc7\xfb\x21\
+\x6a\x7e\xe6\xcc\x99\x6c\x26\xad\x67\xb4\x73\x90\x7c\x4f\x24\x62\
+\xbb\x26\x93\xc9\xd9\x41\xe7\x35\xf2\xfb\xe5\x0e\x86\xf2\x72\xe1\
+\x5b\x89\x68\xff\x46\xbe\x68\xd0\xbd\x55\xb3\x2a\x16\x55\xd8\x68\
+\x30\x44\xfb\x20\xd0\xf7\xda\x6b\x2f\xda\x7a\xeb\xad\xbd\x45\xad\
+\xda\x90\x56\xee\x56\x61\xae\xfe\x4c\xdd\x9d\xaa\x09\xc7\x2f\xdc\
+\x55\xc8\x17\x64\xa0\x51\x46\x1a\x57\xca\x54\x21\xe0\x0c\x8b\x66\
+\x68\x30\xc3\x80\x08\xb3\x20\x00\x92\xef\x81\x2a\x0d\x24\x91\x8f\
+\x51\x26\x98\xce\x90\x93\x81\x79\x34\x4c\x89\xa6\x18\xfd\xf3\xef\
+\xaf\xd2\x03\x73\xe6\x70\xa1\x59\xae\xd4\x00\x5f\x05\xe8\xd8\x50\
+\x46\x26\xab\xdc\x2c\xd5\x83\xa1\xbe\xbf\x86\x8c\x23\xb2\xf7\xc8\
+\x23\x8f\x64\xbf\xa1\xfa\x89\xec\x8d\x45\xb9\x60\x18\x64\x52\xe5\
+\xfe\xa4\x30\x0d\x0c\xa5\xb9\xf2\x01\x02\x0c\x06\x07\xbb\x88\x4e\
+\xfa\x00\x00\x20\x00\x49\x44\x41\x54\xb0\x51\x71\x19\xfc\x62\x88\
+\xb4\x45\xdf\x65\xb3\x34\x94\x4e\x31\x18\xea\x5c\x41\x9b\xf1\x73\
+\x3c\x1a\xa2\xab\xff\xef\x97\x34\xff\xe3\x0f\x3c\x0e\x4c\x65\x03\
+\x51\xf3\x53\x90\xe6\x15\x34\x7f\x6b\xfd\x3e\x68\x7e\x57\x7a\xff\
+\x5a\xdf\xc7\xdf\x9e\x4d\x36\xd9\x98\x29\x12\x3f\xf3\x99\xcf\x78\
+\x9b\x47\x9c\x83\xfe\xc3\x1c\x58\x65\x95\x55\xf2\x92\xea\xf5\xf9\
+\xaa\x89\x97\xf3\x7e\x76\x1e\xe2\xbc\x79\xf3\x78\x0d\xaa\x1f\xbf\
+\xb9\xb9\x95\x01\xe3\xe1\x87\x1f\x26\x30\x54\xe1\x58\x5e\xc1\x7f\
+\xaa\x11\xeb\x86\x4e\x23\xac\xed\x48\x65\xb4\x0f\x7f\x07\x39\x05\
+\x28\x1c\xc5\x87\x8a\xa0\x38\x87\xee\xbe\xfb\x6e\xfa\xf9\xcf\x7f\
+\xce\x11\xa4\xba\x91\xc6\x27\xc0\xd0\x8e\x56\xd7\x7c\x4b\xfd\xac\
+\x74\x0e\x54\x70\xfe\x6d\x44\xce\x01\x15\x9c\xdf\x90\x53\x57\x10\
+\x30\x24\x54\xb5\x40\x05\x63\x49\x86\x59\x81\x0e\x15\xaa\x41\x8b\
+\x3b\xe8\xfb\x42\xaf\x64\x9b\x01\x31\x19\x41\x1d\x85\xdc\x27\x50\
+\xae\x69\x74\x57\xa9\xae\xd0\xc5\x80\x4f\x65\x93\x28\x26\xdc\x3d\
+\xa2\x6a\x6b\xc4\xbd\xaa\x15\x70\x77\x41\xd9\xe3\xc0\x04\xa2\xbe\
+\xde\x0c\x0b\x78\xd7\x68\x86\xec\x03\x33\xb9\x82\x48\x28\x47\xde\
+\x1c\x8a\x21\x83\x9b\x34\x16\x8f\x70\x65\xf3\x5b\x7f\x7f\x13\x9d\
+\x7f\xc1\xb9\x34\xff\xe3\x8f\x28\xc2\x65\x7c\xa4\xd4\x4f\x8c\x0b\
+\xd8\x8a\x51\x55\x9f\x57\xee\xf0\xda\xfd\xc3\x95\x03\x2d\x76\x7d\
+\xe4\x4e\xe5\x88\xba\x25\x1f\xb4\x51\x87\x12\x75\x27\x33\x44\x8b\
+\xe6\x77\xb0\xd9\x38\x01\xaa\xba\x50\x98\x35\xc3\x64\x3a\x4d\xcd\
+\x09\x98\x83\x45\x2b\x0e\xa3\xf0\x31\xb9\x94\xc9\x66\x29\x86\xba\
+\x7a\x09\xa2\xcd\x36\xd9\x90\xde\x99\xf7\xa6\x97\x5e\xa1\x82\xd7\
+\xd6\x54\x1b\xd5\xfe\x72\xee\x5b\xef\xfe\xab\x66\x3d\xd8\xed\xf4\
+\xb7\xe7\xcb\x5f\x5e\x9f\x40\x23\x86\x34\x8a\x42\x9a\x9e\x6e\x1a\
+\xfd\x9b\x41\x5d\xbf\xe5\xf4\x81\x7d\x0f\x1d\x1f\x5c\x07\xed\x5d\
+\x35\xce\x3b\xef\xbc\x9b\x23\x4d\x35\x88\x45\x03\x6c\xca\xb9\x7f\
+\x2d\xe7\xf8\xd9\x66\xf4\xbd\x34\x5d\xc4\x26\xe1\xb0\x37\xf6\xbf\
+\xfc\xe5\x2f\x39\x25\x0c\xd7\x6b\xa4\x29\xc0\x70\xff\xfd\xf7\xf7\
+\xac\x48\xb6\x26\x89\xfb\x68\x8a\x09\xda\x3b\x02\xe5\x99\x06\x88\
+\x9c\xf5\x88\x48\x92\x1b\x97\xe3\xd1\x38\x09\x52\xf1\x4b\x85\x8f\
+\x21\xa2\x2b\x2b\xbe\xac\x41\x17\xd8\x8b\x51\x77\x97\x41\xc0\x54\
+\x69\x53\xfc\x60\x88\x05\x87\x7c\x29\x14\x1e\x16\xff\x9d\x18\x17\
+\x25\xe5\x41\xcd\x92\xf9\xc1\x1e\xb6\x09\xb0\xd4\xf3\xd5\x6c\xa9\
+\x80\x94\x03\x26\xf9\x06\x80\x95\x4c\x11\x17\xb0\x5d\xd6\x8d\xc4\
+\xfb\xb4\x24\x95\x1b\xed\x50\x4c\xb3\x19\x8a\x44\x25\x89\x1c\x8b\
+\x26\x93\x1e\xa2\x44\x2c\x44\x6d\xad\xcd\xf4\x97\xa7\x9e\xa0\xa9\
+\x53\x4f\xa4\xa5\x4b\x17\x32\x18\x22\xea\x12\x7a\x60\x0c\xd5\x2b\
+\x5c\xe2\x7a\x89\xb5\x80\x21\x3f\x9b\x8b\x2d\x8b\x49\x0a\xfd\x74\
+\xe2\x89\x27\x32\xb8\x60\xc1\xaa\xaf\xc8\xbf\x19\x28\x66\xee\xce\
+\x07\xda\xd2\x23\x87\x76\x0f\xa6\x88\xba\xfa\x06\x69\xf1\xc2\x25\
+\xac\x2d\x83\xa8\x9b\x89\xb8\xc3\x31\x1a\x4a\xa5\x29\x11\x6b\xa2\
+\xac\xa1\xb4\x0a\xc7\xa2\x84\x8a\x15\xc9\x6c\x92\x12\xd1\x18\xb5\
+\xb5\xc6\x69\x8f\x5d\xb6\xa6\x7f\xfd\xfd\x15\xee\x37\x3b\x81\x1a\
+\x4f\x0e\xca\x71\xac\x74\x5e\x55\x73\xfe\x8a\x0e\x86\x1b\x6e\xf8\
+\x55\x4e\x16\x5f\x75\xd5\x55\xd9\x6f\xa8\xe0\x64\x6b\x49\x78\x6f\
+\xfb\x3d\x6c\x70\x0b\xea\x13\x3b\xc2\x57\x01\x50\xb5\x77\xac\x45\
+\xf8\x0c\xa1\x59\xdd\x7e\xfb\x9d\x04\xf2\x6b\xf8\xab\xed\x40\xb1\
+\xa0\xfb\xd7\xe3\x7b\x3b\xd0\x4a\xdf\x53\xb5\x41\x75\x0d\xf8\xc1\
+\x0b\x51\xa6\x87\x1d\xf6\x53\x6e\xbf\x5e\x03\x33\x28\xa2\x65\x35\
+\x00\x87\x37\x70\xa6\x62\x07\xd6\x96\xa6\x52\xd4\xba\xa1\x29\xf3\
+\x9d\x8f\x25\x72\xae\x2a\xf3\xdc\x86\x9e\xb6\x02\x81\x21\x4f\xe5\
+\x27\x88\x42\x5b\x35\xf4\x8d\x8b\xdc\xdc\xde\x41\x16\xd2\xae\x82\
+\x84\x45\x35\x13\xc7\x16\xc8\xb8\x1e\x93\xf0\xf2\xcb\x2f\xa7\x23\
+\x8f\x3c\x82\x5b\x09\x2c\xe4\xda\x79\x26\x87\x8d\x8b\xbc\x3a\xf9\
+\x43\x26\x95\xd9\x8b\x1d\x5a\x4a\xc7\xba\xc6\xfc\xa8\xe1\x30\x76\
+\x28\x0d\xdc\x5d\xcb\xba\xd3\xd4\xb5\xac\x9f\x06\x87\xc0\x39\x13\
+\xe3\x84\x7b\xee\x9b\x30\x18\x55\x60\xf6\x14\x1f\x09\x38\x4a\xd3\
+\xe9\x41\x6a\x8e\x47\xa8\x0d\x44\xdd\x77\xdf\x41\xa7\x9d\x72\x12\
+\xf5\xf7\x77\x53\x22\x11\xa1\x4c\x3a\xc9\x6e\x4e\x68\x9c\x00\x43\
+\x29\x20\x54\xbd\x99\x54\xcb\x1d\x61\xf1\x2b\x18\x1e\x7f\xfc\xf1\
+\x5e\xee\xa5\xdd\xff\x41\x63\xa5\xbd\x55\xee\x35\xe8\x2b\x04\x83\
+\xf6\xf6\x13\x2d\x5c\xb8\x98\xa9\xea\xb0\x49\x40\x3d\xc1\x68\x3c\
+\x41\xe9\x14\xcc\xc5\x92\xd4\x0d\x20\x94\x1c\xc8\x21\x6e\x67\x3c\
+\x11\xa5\xd1\xad\x09\xda\x75\xa7\x2d\xe9\x8d\x57\x5f\xe0\x47\xdb\
+\x60\xa8\x9a\xe1\xf2\x98\xf3\xf6\x33\xcb\xed\xb3\x72\xdb\x59\xcd\
+\x7a\x28\xd5\x9e\x6f\x7c\x63\x43\x06\xc3\xf1\xe3\xc7\xf3\x06\xc8\
+\x0e\x94\xd1\x48\x74\x5d\xc3\xb5\xbc\x8b\x8e\x87\x6e\x46\xf5\x5e\
+\x9a\xa3\x77\xe3\x8d\x37\xb3\xd9\x51\x4d\xb4\x68\xf3\x48\x45\x03\
+\xdb\x84\x01\xba\x89\xb2\x53\x3b\x34\x92\x16\x6d\xd3\x75\x72\xf5\
+\xd5\x57\x73\x30\x90\xe6\x54\xc2\x7d\x31\x77\xee\x83\xb4\xf3\xce\
+\x3b\xe7\x91\x18\xe0\x7e\x36\xab\x8f\x8e\x45\x31\xa2\x92\x72\xe7\
+\x41\xe9\xf3\xdc\x27\x89\xdc\xad\xeb\x73\xaf\xda\xef\xb2\x82\x81\
+\x21\x7d\x93\x88\x5e\xf4\x0f\x8a\x0c\x78\xe9\xe2\xa0\xf6\xae\xd0\
+\x5e\x88\x36\x63\x89\x4e\xf4\x46\xed\xc4\x6d\xf3\x84\x3f\xa5\x00\
+\xa1\xcd\x1a\xf8\xa2\xc3\x66\xe7\x36\x6a\x70\xc8\x95\x57\x5e\xc9\
+\xf6\x7c\xfb\x7d\x38\x07\x0a\x54\xa0\x12\xe3\x99\x17\x88\x62\x95\
+\xec\x2b\x3c\x1b\x34\xd7\xcd\x15\x70\x05\xdf\x30\x27\x85\x6b\xb2\
+\x3d\x83\x94\x4b\x19\x07\x74\x6b\x61\xae\x74\xbf\x74\x49\x0f\x65\
+\x9d\x18\x45\xc2\x4d\xe4\x3a\x42\x37\x46\xa1\x24\xb9\x84\x2a\xed\
+\x32\x16\x51\xd6\x1a\x43\xe4\xa4\x07\x69\xcc\xd8\x56\x9a\x33\xfb\
+\x1e\x3a\x69\xea\xb1\xd4\xdf\xb3\x8c\x40\x5b\xca\x21\xde\x5c\x99\
+\x5e\x72\xf3\x82\x80\x30\x48\x80\xe9\xee\x55\xb5\x74\xf8\x42\x4e\
+\x3a\xe9\x04\x6f\xd3\xd0\x40\x2b\x29\x9b\x8f\x01\x86\x5d\xbd\x29\
+\x5a\xb0\x60\x11\x85\x43\xe8\x1b\xf0\xae\x66\x29\x96\x68\xa2\x4c\
+\x1a\x09\xce\x42\x6a\x10\x89\x4b\x0a\x88\x54\x8c\x47\x81\xe8\x24\
+\x8d\x1f\xd3\x4a\xbb\xee\xb8\x0d\xbd\xf6\xb2\x94\x70\xd2\xb1\xc5\
+\x3b\x95\xca\x53\xf3\x5b\x0e\x70\x9d\x9e\x6f\x9b\xe7\x54\x08\x2a\
+\x28\x68\x95\xf2\x6a\x12\xfb\x31\x27\x71\x3f\x25\xb9\x56\x7a\x33\
+\x68\x63\xf0\xcb\x29\x11\x85\x0a\x5b\x50\x7a\x29\x18\x14\x33\xd1\
+\x57\x2b\xa6\xec\xf7\x47\xf0\x0c\x34\x9a\x35\xd7\x5c\x3d\x8f\x33\
+\x18\xf7\x56\xde\x50\xf8\xaf\x31\xc7\x45\xfb\x46\x4e\xa7\x3c\xd9\
+\x4e\x36\x2f\xa7\x2d\x9a\x76\x00\x1e\x5a\x44\x47\xeb\x81\xe0\xb2\
+\x1b\x6f\xbc\x91\x7d\xd5\x3a\x0f\x6d\x3e\xd0\x72\xee\xdd\xa8\x73\
+\x54\xde\xa0\x3d\x68\x1b\xc6\x0f\x25\xe6\xc0\xa4\x33\x7d\xfa\xa9\
+\x79\x89\xf5\xd0\x6e\x11\x31\xaa\x91\xb9\x4a\x8b\x59\xaa\x6d\xb5\
+\x6e\x6e\x0a\xdf\xdb\xd9\x98\x88\x5e\x6a\x54\x9f\x54\x7a\xdf\x15\
+\x0d\x0c\xd1\xfe\xb3\xa3\xd1\xe8\x59\x18\x50\x4d\x33\x90\xa8\xbb\
+\x9c\x99\xb0\xd0\x4b\x62\xe0\xc1\x12\x83\xeb\x30\x21\x30\x39\x30\
+\xd8\x2a\x34\xd4\xe6\xde\xa8\x9d\xb8\x1d\xc9\xa5\x42\x48\x17\x8c\
+\x24\xa0\xf7\xe6\xb1\x8d\xe0\x3b\x1b\x0c\x35\x1a\xed\xd2\x4b\x2f\
+\xe5\x6a\x0c\x6a\xfe\xe1\x1d\xaa\x18\x32\x0d\x7c\x89\x76\x25\xa0\
+\x28\xc9\xf1\x79\x87\x05\x7e\x85\xfa\x89\x4f\x47\x02\x33\x09\xe1\
+\x76\x96\x45\x7d\x98\x22\x61\x49\x66\x5e\xd6\x9d\xa5\x25\x8b\xbb\
+\x29\x93\x45\xc5\xf2\x04\xb9\x8e\x80\x9e\x1b\x1e\xe4\x00\x9a\x1c\
+\x18\xa2\x8f\x89\x9c\xd4\x10\x8d\x19\xdb\x42\x73\xe6\xdc\x4b\x27\
+\x4d\x3d\x9a\xc1\x10\xb8\x90\x4d\x23\x78\x04\x77\x8e\x1a\x30\x2c\
+\x3d\x35\x57\x5a\x30\x8c\xb7\x98\xc8\x3d\x21\x35\x40\x01\x64\x68\
+\x85\xc3\xc1\x70\x2b\x7a\xed\x65\xd1\x0c\x79\x08\x0c\xfb\x4c\x25\
+\x60\x68\x6f\xb6\x34\xad\xa4\xd0\x6e\xde\x7e\x86\x32\x05\x05\x09\
+\x06\x5b\xbb\xd1\x9f\xd5\x77\x04\x10\x84\x86\xb1\xe5\x96\x5b\x7a\
+\xd1\xaf\xb8\xdf\xcd\x37\xdf\x4c\xa7\x9e\x7a\xaa\xb7\x4e\x1b\x09\
+\x86\x88\x98\x84\x86\x03\x96\x19\xf5\x91\x63\xcd\x20\x25\x62\xcd\
+\x35\xd7\xa4\xdd\x77\xdf\x35\xef\x15\x01\x90\xb2\xd9\xd0\x4a\x17\
+\x92\xb4\x8f\x7e\xd7\x1c\x3c\x9b\xa2\x0c\x17\x6b\xae\xed\xa2\x45\
+\x4b\xe8\xad\xb7\xde\x62\x8e\x4e\xc8\x0f\x80\xab\x92\x61\x20\x21\
+\x1f\x69\x0c\x6a\xae\x6f\xd4\xc6\x3a\x68\xbc\xfc\xdf\xdb\x91\x9f\
+\x9a\x9a\x85\x71\x04\x3b\xcf\x66\x9b\x6d\x96\x2b\x38\xed\xba\xf4\
+\xe6\x9b\x6f\xb2\x96\xad\x73\x30\x68\xed\x49\xdf\xd4\x87\x29\xc9\
+\x6a\xf7\x39\xff\x93\x69\x67\x57\xfa\x9e\x8d\x3c\x7f\x45\x04\x43\
+\xbc\xef\xf3\xe1\x70\xf8\x5b\x36\xe3\x43\xb1\xb0\x7c\x1d\x48\x4c\
+\x5a\x4c\x58\x3b\x11\x1b\x3f\x63\x21\x83\xa1\x5e\x05\x49\x23\xc1\
+\x50\xa9\x9f\xd4\xff\x90\x6f\x3e\xc9\x4f\x69\xb0\x27\x20\x7e\xc6\
+\xbb\x62\x47\x8f\x3a\x7d\x00\x43\x1c\x1a\x29\x1a\x89\x21\xe7\xcf\
+\xd6\x0c\xf1\x6d\x00\x18\xfa\x31\x12\x31\x2d\xb8\xa4\x84\x99\x14\
+\x97\x74\x76\x39\xb4\x74\x09\xc0\x10\x94\xd3\x51\x72\xa1\x21\xc2\
+\x4c\x1b\x86\x66\xf8\xe9\x05\x43\xd8\x25\x96\xf5\xa4\x68\xfe\x82\
+\xc5\x14\x0e\x21\x9f\x2b\x4e\xa9\x24\x52\x61\x5a\x28\x8b\x42\xc8\
+\x5c\x5e\x48\x34\x3d\x80\x21\x21\x10\xd7\xd2\x0c\x77\xdb\x69\x6b\
+\x7a\xf5\xa5\xe7\xf3\x04\x50\xa5\x9a\xa1\xd2\xee\x69\x2a\x09\x34\
+\x50\xfc\x8d\x89\xd5\x23\x11\xcf\x74\x88\xdf\x6d\xca\xc0\x72\x04\
+\x99\x1d\x89\xa8\x3f\x6b\x12\xf7\x3a\xeb\xac\xc3\x11\x88\x1b\x6c\
+\xf0\x25\x8e\x36\xc6\x73\xdb\xdb\x5b\x09\x26\x43\xf8\xb7\x95\x86\
+\xaf\x91\x60\x88\x77\xc6\x06\x80\xb5\x6e\x93\x3a\xa3\xeb\x0c\x20\
+\x8d\x4a\x0c\x1a\x4c\xd2\xd4\x04\xd3\x7e\xb0\xd8\xb4\x13\xcf\xf1\
+\xb3\x5e\xf3\xf8\xe3\xf0\x7f\x4f\xe5\x5a\x87\x4a\x9f\x87\xbb\xa1\
+\xaf\xe1\x27\xd4\x43\x65\x8d\x06\xd3\x04\x3f\x71\x64\xce\xb0\x5d\
+\x3e\xba\xe9\x86\x85\x0c\xd1\xa3\xaa\x05\xfa\xd9\x65\x82\x00\xb1\
+\x9c\x39\x54\xfe\xdb\x85\x5e\x20\xca\x6e\x52\xfe\xf9\x23\x73\x66\
+\x19\x53\x66\x64\x1a\xe2\x7b\xca\xe6\x44\xf4\x17\xfc\x2d\x57\xb0\
+\x72\xb8\xbf\xc9\x6f\x46\xda\x78\xe3\x8d\x99\x3d\x01\x03\x87\x85\
+\x8c\x7f\xd0\x16\x7f\xfd\xeb\x5f\x7b\x61\xd0\xc5\x02\x2a\x6a\x1d\
+\x6c\x15\x20\xba\xd3\xc7\xe4\xfb\xc6\x37\xbe\xe1\x69\x7f\x83\x83\
+\xb2\x88\x14\x8c\xf1\x29\x3c\xa0\xb2\x83\xd5\xc5\x06\x7f\x04\x98\
+\xe6\xb1\xc0\xf0\x77\x7d\x47\xe8\x72\xf8\xaf\x22\x33\x29\x7c\x8c\
+\x46\x53\x74\x1c\xf8\xb9\xa4\x97\x51\xa3\x50\x53\x00\x42\x28\x8a\
+\x0a\x7e\xc2\xa4\x08\x83\xae\x9e\x14\x75\x77\xf5\x91\xe3\xc6\x4c\
+\x19\x27\xd4\x35\x04\x18\x0a\x87\xeb\xa7\x55\x33\x04\x18\x76\x76\
+\xa7\x69\xc1\xc2\x25\x14\x0e\xc1\x2f\x18\xa7\x74\x0a\xe0\x97\xb0\
+\xc0\x50\x82\x9d\x18\x0c\xc1\x0b\x09\x3f\x2b\xcc\xa4\xa3\x5b\x69\
+\xb7\x1f\x02\x0c\x9f\xad\x1a\x0c\x31\x6e\x98\x13\xd8\xf0\x41\x0b\
+\x50\x33\xa5\xae\x1b\xdd\xe5\x17\x5a\xad\xa5\xb4\x47\xfb\x7c\x15\
+\xee\xea\x5f\xc2\x78\x63\x9e\x20\xa9\xfd\xae\xbb\xee\x22\xf0\xf5\
+\x82\xbd\x44\x8f\x9b\x6f\xfe\x3d\x6b\x6b\xbc\x35\xb3\x02\xbe\x6a\
+\x5d\x4b\xf6\x3b\xe1\x67\xbc\x9b\x9a\x6e\x0b\xbd\xdf\x56\x5b\x6d\
+\x45\x8f\x3d\xf6\x98\x37\xbf\xed\x73\xc4\x6c\x2a\xf5\xfa\xf4\x5e\
+\x0a\x10\xf2\xbb\xfc\x83\xe9\x1f\xef\x80\xb9\xfe\xd8\x63\x4f\xd0\
+\x6e\xbb\xed\x96\xb7\xb9\x46\xdf\xe3\x7b\xa5\x39\x83\xd5\x69\x45\
+\x60\xcd\x2a\x26\x9d\xf5\x1d\x8b\xb5\xd1\x36\xb3\xdb\x63\x57\xec\
+\x7e\xf5\x1a\x53\xb9\xbf\xb3\x05\x11\xfd\x75\xb9\x20\x4b\x89\x87\
+\xae\xa8\x60\x88\x26\x9f\x1b\x0e\x87\x4f\xc7\x40\xc9\x0e\xb0\x30\
+\x18\xea\x2e\x08\x83\x8e\x80\x0a\xa4\x26\x48\xa5\x09\x39\xff\xb5\
+\xd7\xde\xa0\x29\x53\xa6\xd0\x7f\xfe\xf3\x1f\x0f\x8c\xec\xfe\xf0\
+\xc0\xa6\x4e\x66\x00\x2c\x5a\x08\xaa\x6f\x7d\xeb\x5b\xac\xe5\x7d\
+\xe5\x2b\x5f\x31\xcc\x15\x39\xe6\x0c\x05\x44\x9b\xfb\x54\x4d\x31\
+\xc8\xa3\x52\x2d\x56\xdb\x89\x5d\x5c\xd4\x98\x7b\xfc\xfd\x30\x6c\
+\x00\x3d\xa2\x98\x1c\x21\x37\xee\xe3\xba\xec\xc4\x62\x53\x50\x6f\
+\x6f\x1f\xf5\xf7\x0f\x51\x9a\x99\xec\xe1\x40\x0c\x13\x85\xa2\x14\
+\x8d\xc6\x39\x9f\x0e\xbb\x7f\x44\x92\x82\x72\x0c\x5a\x4f\x34\x16\
+\x26\x04\xef\x7c\xea\xc1\xb0\x2b\x43\x0b\x16\x08\x18\x46\xa3\x12\
+\x38\x03\x9f\x21\x6b\x86\x26\x90\x29\x1a\x17\x30\x64\xed\xc5\x80\
+\xe1\xd8\x31\xad\xb4\xfb\xce\xdb\x0c\x03\x43\x08\x68\x35\x6f\x15\
+\x5a\xa3\x85\x7c\x86\x38\x6f\x8b\x2d\xb6\xe0\x14\x03\xec\xf4\x21\
+\xa4\x31\xdf\x91\x20\x0e\x13\x9e\x72\x76\x62\xac\x14\x00\xca\xe5\
+\xcf\xb4\xc1\xd0\xce\x7f\xc4\x5c\x06\x18\x82\x0c\x02\xc0\x8a\x7f\
+\x00\x05\x98\x0b\x8f\x3a\xea\x28\x6e\x3a\xce\x6f\xa4\x66\xa8\x72\
+\x00\x9b\x4c\x1c\xd0\xd0\xb4\x1d\xe8\x8f\x47\x1e\x79\xc4\x4b\x47\
+\x52\x6e\x4e\xbc\x37\x22\x40\x71\xd8\x94\x63\x76\x5f\x03\x23\x01\
+\x6c\x00\x79\x8d\x4b\xc0\xbd\x10\x6d\x89\x75\x87\xe7\x69\x05\x0c\
+\xbd\xce\x4f\x35\x58\x6e\xff\x36\x52\xf8\x17\xb3\x7c\xa9\xdb\x48\
+\x8b\x81\xa3\xad\xd8\x50\xa9\x92\xa1\x63\x3e\x82\x9a\xe1\x79\xff\
+\x2b\x84\x7a\x46\x23\xfb\xa2\xda\x7b\xaf\xc8\x60\x88\x1d\xe1\x33\
+\xae\xeb\x7e\xa7\x58\x00\x8d\x9a\x4b\xd4\x46\x0e\x30\xbc\xf4\xd2\
+\x4b\x0c\xe8\x49\xa0\xc8\x5b\x6f\xcd\xa3\x1d\x76\xd8\x81\x3e\xf8\
+\xe0\x03\x0f\x0c\xeb\xbb\xcb\x91\xae\xc7\x4e\x4b\x05\x10\x04\x12\
+\x40\x10\xc2\x02\xbe\x0e\x89\x7e\x33\x55\x23\x7c\x23\xa5\xc0\x68\
+\x9b\x77\x01\x8c\x98\xbc\x98\xb0\x02\x64\x60\x7e\x51\x94\xcb\xdf\
+\x14\x14\x04\x43\xab\x32\x85\xaa\x86\xa9\x0c\x72\xde\x12\xbc\xe0\
+\x41\xc5\xd4\xd5\xd3\x4f\x60\x10\x83\x10\x77\x61\xd3\xa3\x30\x81\
+\x62\x2c\xed\xa0\x30\x2f\xa2\x24\x4d\x3d\x43\xa4\x0f\xa0\xaa\x3d\
+\x83\xa1\xd4\x34\x94\x00\x9a\x4f\x97\xcf\x30\xe3\xc2\x84\x9c\xe5\
+\x68\x52\x04\xd0\x60\xe3\x00\x30\x8c\xc7\x9b\x58\xd3\x16\x30\x14\
+\x33\x69\x32\xad\x3e\x43\xf8\xbd\x93\x34\x6e\x4c\x2b\xed\xb9\xf3\
+\xb6\xf4\xd2\x4b\xcf\xe4\x69\x86\x95\x80\x21\xfc\xce\x10\xce\xc8\
+\x45\x45\xf0\x10\x72\xdd\x44\x63\x12\x9f\x18\xf2\xdf\xc0\x9a\x02\
+\x5f\x17\xce\xd5\x8d\x56\x25\x79\x62\xb6\x0f\x09\x73\x4e\x83\x69\
+\xbe\xfa\xd5\xaf\xd2\x1f\xff\xf8\x47\xfa\xc2\x17\xd6\xce\x9b\xbd\
+\xd7\x5f\x7f\x23\x97\x3a\xd3\xeb\x46\x02\x0c\xc5\xe7\x27\x15\x53\
+\xf4\x00\xfb\xca\xfd\xf7\x0b\x89\x95\xb6\x21\x1e\x8f\xe5\x05\xd0\
+\x88\xd6\x27\xf9\xb1\x6a\x6a\xb5\x73\x79\x01\x8a\x4a\xd6\x7d\xdf\
+\x7d\xf7\x71\xfa\x04\x6f\x42\x51\xaa\xcc\x54\xa9\xc1\xa6\x03\x26\
+\x68\xd5\x52\xeb\xc1\xbf\x5b\xad\xe0\xf6\x5f\x67\x6f\xaa\x6c\xdf\
+\x32\xce\xb3\x83\x6b\x30\xe7\x34\x1a\x57\xd3\x28\x94\x05\xa9\x54\
+\x5b\xea\x23\x33\x43\xcf\x12\x65\xbf\x5b\xaf\x77\xae\xf7\x7d\x56\
+\x68\x30\x24\xa2\x6f\x19\xff\x21\x0b\x62\xff\x80\x68\x00\x0a\x16\
+\x08\x06\xf8\xe8\xa3\x8f\xa6\x2b\xae\xb8\xdc\x33\x8b\xc0\x64\xf5\
+\xd6\x5b\x6f\xd3\xa6\x9b\x6e\xca\xbb\x3b\xdb\x44\x59\xef\x8e\xc4\
+\xfd\xd0\x0e\x65\x6b\x80\x89\x14\x49\xc2\x9f\xfd\xec\x5a\xc6\x04\
+\x93\xa3\xe1\xd2\x73\xed\xc5\xab\xc2\x47\xdb\x65\x27\x16\x63\xd2\
+\x16\xe2\x5c\x1c\xfe\x0e\xea\x97\xb4\xfd\x93\x62\x27\x45\x2e\x5c\
+\x2c\xde\x4c\x99\xac\x43\x9d\x1d\xdd\xd4\xdd\xdd\x4f\x4e\x36\x44\
+\x91\x68\x0b\x87\x98\xb2\x99\x08\x7c\x9b\x86\x8c\x58\xc0\x30\xcb\
+\xc5\x7c\xb1\xe8\xb3\xb0\xb8\x7e\x8a\xc1\x10\xef\xbf\xac\xcb\x35\
+\x60\x88\x7c\xc7\x38\x25\xd3\x48\x50\x96\x00\x0b\x2e\x00\x6c\xa2\
+\x3d\x53\x00\x43\x28\xdb\x1c\x04\x96\xa4\xb1\x63\x5b\x69\xca\x2e\
+\xdb\x79\x60\x68\xb3\x7e\x54\xaa\x19\x62\x63\x72\xd3\x4d\x37\xd1\
+\x81\x07\x0a\x61\x13\x47\x08\xbb\x44\x0f\x3d\xf4\x10\x93\x35\x2c\
+\x5c\xb8\x30\xaf\xd6\x9f\xcd\x4c\x54\x6a\xce\x17\x0a\xa0\x51\xee\
+\x4b\x14\x8f\xdd\x7e\xfb\xed\x69\xed\xb5\xd7\x66\x6d\x54\x12\xb8\
+\x23\x5c\xe3\x13\xbe\x3a\x5b\x2b\xb1\xe7\x74\xad\x6b\xcc\xd6\x8c\
+\x95\x30\xda\xa6\xaf\x53\x73\xf1\x36\xdb\x6c\x43\x73\xe7\xce\x36\
+\x54\x82\xb9\x8d\xa7\x6d\xfa\xd4\xbe\xb2\x7d\x89\xd0\x20\xed\x0d\
+\x09\x9e\x87\xf7\xba\xe3\x8e\x3b\xe8\xb8\xe3\x8e\xe3\xe2\xb7\x4a\
+\x7c\xad\x39\x87\x36\x08\xaf\x48\x60\x68\xf7\xb5\xbe\x07\x3e\xd5\
+\x15\xa3\xa6\x66\xad\xf0\xa2\x6d\x57\x7f\xe7\xc8\x68\x86\x0e\xfc\
+\x84\xb9\x28\xb2\x5a\x27\x48\x9d\xaf\x5f\xd1\xc1\x10\x0b\xed\x64\
+\xc7\x71\x2e\x02\x47\x66\x31\x30\x54\x13\x0a\x26\xf0\x2f\x7f\x79\
+\x29\xf5\xf7\x8b\x49\x12\xa6\x8f\x8f\x3e\x9a\x4f\x5f\xfe\xf2\x97\
+\xd9\xac\xa2\x60\xd8\x88\x08\x30\x75\x4c\xab\x7f\x06\xcf\xbc\xf7\
+\xde\x7b\x69\x9d\x75\x3e\x9f\xc7\x10\x5f\x6c\xfc\x34\xf8\xc6\x06\
+\xc1\x42\x4c\x1b\xc5\xc7\xbf\x10\x10\xca\xd9\x10\xd2\x62\x68\x16\
+\x93\xd1\xd2\xa5\xbd\xd4\xd9\xd1\x4b\x19\x80\x61\x18\x44\xbe\xd0\
+\xfc\x40\xf0\x2b\x26\x69\x16\x10\xf1\x08\xa7\x52\xa0\x14\x11\x27\
+\xe1\x66\x10\x7d\x1a\xf9\xd4\x6a\x86\x79\x60\x08\x4a\xba\x88\x94\
+\xbd\x81\x66\x88\xe4\x7b\x35\x5f\x43\x53\x43\x35\x0b\xb1\x5a\xc0\
+\x67\x98\x1e\x06\x86\x3a\x8f\x2b\xd1\x0c\x55\x78\x41\xeb\x03\x0f\
+\x27\xfc\xca\xca\x92\x02\x3f\xd7\x7d\xf7\xcd\xe2\x60\x96\x8e\x8e\
+\x0e\xd6\x1e\xbb\xba\xba\x78\xac\x55\xb3\x09\xda\xd9\xdb\x60\xa8\
+\x02\xd2\x16\x94\x1a\x8d\xad\x0c\x25\xd8\xa0\xe1\xde\x5a\x5f\xd2\
+\xae\x0b\x1a\xf4\xac\x72\x65\x98\xdf\x4c\xac\x74\x61\x68\x03\xfa\
+\x03\xcf\x87\xc9\xef\xb3\x9f\xfd\x2c\xed\xb2\xcb\x2e\x3c\x77\x95\
+\x9f\x14\x40\x86\x36\x61\x53\x0a\x7a\xc3\x75\xd7\x5d\x87\xcd\xff\
+\xb8\x0e\x1b\x15\x44\x8c\xfe\xf9\xcf\x7f\xe6\x20\x19\xd0\xaa\x71\
+\x6d\xce\x4c\x86\xb5\x6a\x80\x3c\x2a\x57\xe4\x6a\x19\xca\x46\xdc\
+\x9f\xd3\xa7\xa6\x61\xd5\xbc\xca\x7d\xaf\x46\x9d\xa7\x63\xa4\xf2\
+\x4d\x37\x2d\x6a\xf2\xd6\xf5\x8d\x8d\x05\xde\x17\xe7\xa9\xbc\x1a\
+\x01\x30\x3c\x85\xc8\xb9\xb8\x51\xef\x5e\x8f\xfb\xae\xf0\x60\x68\
+\x5e\xf2\x81\x48\x24\xb6\xa3\x1d\x6c\xa2\xda\x95\x3a\x8a\x31\xe0\
+\xc7\x1c\x73\x0c\xfd\xe2\x17\xbf\xf0\x22\xec\xb0\x48\x30\xe1\x91\
+\x17\x04\x9f\x8a\x7d\x54\xba\x60\x55\x58\xd8\x0b\xc2\x1f\x4d\x26\
+\xc5\x35\x23\x6c\x4a\x59\x7f\xfd\xf5\x3d\x30\x04\x38\xdb\x81\x07\
+\xf5\x18\xb8\xdc\x3d\x86\x13\x6f\xdb\x81\x37\x0a\x86\x08\xbd\x51\
+\x43\x6b\x57\x57\x92\x96\x2c\xee\x22\x04\xd5\x44\x23\xcd\x34\x94\
+\x92\xc2\xa9\xf9\xf7\x44\x78\x1d\x28\xd9\xe4\x2a\x24\xce\x47\x22\
+\x09\x72\x38\xdd\x33\xcc\x66\xd2\x6c\x36\x8d\xc4\x09\x6a\x69\x8d\
+\x72\x6a\xc5\xd4\x69\xc7\xd0\x40\x6f\x17\x45\xe3\x21\xca\xa4\xc4\
+\x8c\x15\x26\x80\x6a\xae\xe6\x45\xb5\xef\xae\xbe\x58\x0d\xfc\xb9\
+\xe2\x8a\x2b\xd8\x44\xc7\xcf\xa8\x2c\x97\xbf\xe2\x26\xa0\x07\xf0\
+\xfe\x3d\x3d\x44\x4b\x16\x77\x70\x9a\x0f\xd3\xdf\xc1\xc4\x6c\x2a\
+\x7c\xf0\x2e\x1c\xd9\x94\x26\x08\x43\x73\x4a\xd1\xee\x96\xa6\x08\
+\xed\xb1\xdb\x76\xf4\xf2\x4b\xcf\xe7\x05\x5d\xa8\x65\xa3\x90\xf6\
+\xe6\x17\x4e\xf0\x5d\x41\xf0\x43\x90\xdd\x72\xcb\x2d\xb4\xe7\x9e\
+\xbb\x7b\xe4\xcb\x78\xa1\x87\x1e\x7a\x84\x0e\x3e\xf8\x60\x26\x92\
+\xc6\xb9\xd8\xfc\x95\x9b\x56\x51\x4e\x87\x04\x09\xcb\xa0\x7b\x54\
+\xba\xde\xfc\xf7\x0b\x7a\xbe\xbe\xab\xb2\xaa\xe0\x7a\xf4\x2b\x64\
+\x00\x2a\x31\x4c\x9c\x38\x9e\x35\xe8\x14\xd8\x82\x12\x31\x42\xb5\
+\x77\x54\x7b\x00\xf0\xc1\x67\x58\x2c\x76\xa0\x5e\x31\x05\x41\xed\
+\xaf\xb5\x7f\x82\xfa\x7f\xf9\x3e\xdf\x7d\x90\xc8\xdd\x29\xa8\x8d\
+\xcb\xfb\xfb\x95\x02\x0c\x9b\x9a\x9a\x3e\x97\x4e\x67\x5f\x73\x5d\
+\x77\x14\x0b\x77\x13\xec\xa2\xc1\x33\x6a\x0e\xc0\x82\x40\x2a\x05\
+\x3e\x21\x0c\x10\xf2\x8d\x03\x40\xe8\x9f\x0c\x95\x4e\x3e\xf5\x8b\
+\xa8\x49\x08\x42\x09\x3f\xdb\xa1\xd6\xf6\x60\x02\x0c\xe1\x67\xf9\
+\xda\xd7\x1a\x5d\x9d\xaa\x10\x18\xe6\x0f\xab\x83\x40\x18\xde\x3d\
+\xfc\xcf\x75\x9d\x25\xea\xea\x1a\xa2\x8e\xa5\xdd\x14\xa2\x38\x45\
+\x62\xcd\xac\xe1\x20\x39\x9e\x0f\x06\x3f\x13\x7c\x03\x3f\x61\x48\
+\xc8\x0e\xca\x01\x43\xe4\x19\x0e\xf6\x75\xe7\x81\x61\x24\x54\x5e\
+\x9e\x61\x31\xe1\xa7\xe3\xe6\xd7\xe6\x11\x9c\x74\xf2\xc9\x53\xf9\
+\x32\x0f\x9c\x4a\xac\x26\x68\x69\x55\x1f\x60\x2a\x08\x11\x75\xf7\
+\xba\xec\x6f\x65\x53\x1d\x89\xaf\x8e\xcd\xf7\x5c\x18\x59\x2c\x17\
+\x3c\x3f\xc2\x20\x1a\x10\x0d\x1b\x60\xd8\x9c\x88\xd0\x6e\x3b\x6f\
+\x47\x6f\xbc\xfe\x0a\x5f\xab\x82\xdb\xef\xdb\xb1\xdb\x57\x6c\xbe\
+\x4e\x98\x30\x81\xae\xba\xea\x2a\x8e\x76\x14\xed\x48\xc6\xed\x96\
+\x5b\x6e\x63\xae\x56\xe4\xc6\xf9\x03\x3a\x4a\x99\x62\xcb\xed\x93\
+\x20\x61\x1a\x74\x9f\x4a\xd7\x5b\xa5\x60\x28\x29\x2d\xf9\x05\xb0\
+\xd1\xbf\xeb\xad\xb7\x1e\x3d\xff\xfc\xf3\xbc\x41\xd6\x9a\x7d\x3a\
+\x67\xb6\xdd\x76\x5b\xfe\x0e\x5a\x6e\xb1\x00\x94\xa0\xf7\x5a\x59\
+\xbe\x0f\x1a\xbf\x5a\xc7\xa7\x44\x3f\xf4\x10\x39\x1b\x12\xd1\x7f\
+\x57\xf4\xbe\x5a\x29\xc0\x10\x9d\x18\x89\xc4\xf7\x27\x72\x51\xdd\
+\xa2\xe0\x01\xe6\x7a\x2d\xe7\x63\x9b\x7c\xec\x64\x54\xfb\xc2\x4a\
+\x07\x1f\x8b\x4d\x35\x53\xbf\x60\x9e\x3c\x79\x32\x0b\x42\xad\x75\
+\x86\x85\x07\x33\x29\x22\x5b\xf1\x29\x61\xd9\x35\x4e\x85\x62\xb2\
+\x9c\x83\x65\x84\x5b\x94\x27\x7c\x81\x04\x2b\xa1\x42\x13\x88\x83\
+\x45\xaf\xab\x2b\xcd\x60\x48\x14\xa1\x68\xa4\xc9\xf8\x45\xc4\x84\
+\x2a\x47\x0e\x0c\xf1\x33\x84\x3d\x00\x95\x29\xc7\x8a\x68\x86\xb3\
+\x67\xdf\xc3\x9a\x21\xc0\x50\x93\xee\x79\xdc\xca\x04\x43\xdd\x6c\
+\x68\x0b\x74\xa3\xa3\x41\x52\x02\x3c\x52\xcb\x0d\xff\xe0\x1f\x3b\
+\xe0\x80\x03\xbc\x74\x83\x7c\xcd\x76\x78\x5f\x07\x81\x61\x69\x61\
+\x81\x4d\x4f\x9a\xfa\xfb\x93\x34\xd0\x3f\xe8\x55\xaa\x17\xc2\x02\
+\x39\x38\x3c\x9d\xbb\x5f\x4a\x47\xa9\x49\x9e\xf3\xff\xe2\x11\x3a\
+\xe9\x84\x63\xe8\x3f\xef\xce\xf3\x00\x53\x05\x70\x31\x93\xbd\xbf\
+\x3d\x2a\xec\xf1\x09\xff\x1d\x72\xff\xd4\xec\x85\x73\xdf\x7b\xef\
+\x3d\xae\xa8\xa0\x01\x1e\xb6\x6f\x2b\x3f\xdf\xb5\xba\x79\x18\x24\
+\x4c\x83\xee\x5a\xe9\x7a\xf3\xdf\x2f\xe8\xf9\xb6\x35\x04\x3f\x2b\
+\x8d\x18\xca\x3b\xc1\xe4\xb9\xca\x2a\x13\xbd\x5b\x0e\x0d\xa5\xd8\
+\x4c\xf8\xfd\xef\x7f\x9f\x5e\x7e\xf9\x65\xfe\x7b\xa3\x49\x39\x82\
+\xfa\xa7\xd1\xdf\x97\xd3\x7f\x8d\x69\x43\xe8\x00\xa2\xec\x6d\x8d\
+\xb9\x77\x7d\xef\xba\xd2\x80\xa1\x4c\xd8\xd8\x6f\x88\x48\xb8\xca\
+\xcc\xe1\xf7\xbf\xe0\xcf\xea\x7f\xd3\x1d\xb2\x5d\x56\xc7\x7f\x5d\
+\x25\xdd\x29\x26\xb0\x48\x1e\x33\xce\x46\x1b\x6d\xc4\x82\x19\x1a\
+\x29\x04\x11\x0e\x98\x6a\x60\xaa\xda\x7c\xf3\xcd\xbd\x9d\x7b\x25\
+\xcf\x29\x78\x6e\x59\x60\x88\xa8\x0d\x09\xa8\x40\x36\x0a\x68\xc2\
+\x70\x84\x50\xe5\x1a\x94\x62\x59\x01\xcd\xfe\xbe\x0c\x75\x75\x01\
+\x0c\xc1\x3c\x63\xa2\x43\x61\xf6\xf3\xd2\x57\x2c\xff\x23\xb4\x43\
+\x03\x44\xe1\x68\x65\x60\x58\x09\x03\x4d\xa1\x77\x56\x33\xa2\xf6\
+\xbb\x5d\xd8\x15\xe7\x63\x03\x04\xcd\x5c\x2d\x03\xa5\xfb\xb8\x74\
+\x71\xe4\xd2\xd7\x86\x29\x9e\x90\xe4\x7a\x61\x2d\xf1\xf2\x57\x0c\
+\x55\x5d\x48\x76\x19\xdc\xd9\xca\x6a\x60\xce\x31\xd5\x02\xc6\x8c\
+\x6a\xa5\x8e\xa5\x8b\xbd\xbc\x53\x3b\x30\xa3\x90\xcf\xa9\x90\x99\
+\x14\xc1\x2b\x7a\x60\x1e\xe2\x1c\xbd\x8f\xb0\x34\x89\x66\xa4\x1b\
+\x03\xdc\xb7\x5e\x75\xf6\x82\x84\x69\xd0\xfc\x1e\x29\x30\xcc\x45\
+\x93\xc6\xb9\x3f\xbe\xf4\xa5\x2f\xb1\xab\x04\x66\x52\x8e\x82\x8e\
+\x82\x2e\x2f\xcd\xeb\x18\xc9\xfa\x30\xa1\xc2\x4f\x08\xbf\x61\x23\
+\x63\x0a\x82\xfa\xa7\xd1\xdf\x07\x8d\x5f\xad\xe3\x53\xa4\xfd\x57\
+\x13\x39\xbf\x68\xf4\xbb\xd5\xeb\xfe\x2b\x15\x18\xe2\xa5\x23\x91\
+\xe8\x8b\xae\xcb\x1c\xa6\xde\xe4\x95\xbf\x8b\x99\xaa\x50\x6e\x95\
+\xb2\xb0\xdb\x9d\x56\xcd\xe0\x63\x42\xa9\x39\x45\x9f\xbf\xe7\x9e\
+\x7b\x72\x74\x5f\x5b\x5b\x8b\x47\xe7\x24\x80\x8c\x1c\x32\x84\x72\
+\x4b\x72\xbd\xe6\x3b\x55\x3d\x70\x2a\x83\xfd\x23\xe6\xfb\x1d\xa7\
+\xa5\x92\xc8\x25\x1c\xa0\xde\xde\x7e\x4a\x67\x1d\x8a\xa0\xea\x85\
+\x1b\xe1\x88\x50\xd9\x31\xbb\x94\x1c\x4a\x1b\xff\x16\xc0\x1d\xa9\
+\x12\x30\xfb\x15\x52\x5f\x45\x33\x44\x64\x69\x29\x30\xbc\xff\xfe\
+\xbb\x59\x33\x1c\xea\xef\xc9\xa3\x63\x8b\x84\x10\x89\x6a\xeb\x50\
+\xe5\xf7\x80\xf6\xb7\x6a\x5a\xe8\x47\x31\x77\x45\xd8\x7f\xa6\x63\
+\xad\x5a\x40\xa9\x3b\x07\x69\x86\xa5\xe7\x03\x78\x65\x19\xe9\x86\
+\x3d\x22\xc4\x15\xc4\xc1\x20\x54\x84\x3b\xd7\x80\x63\x34\x12\xa6\
+\x4c\x3a\x9d\xe7\x9b\x52\x10\x2c\xa4\xb9\x15\x12\x5e\x68\xa3\xcd\
+\x76\xa2\x9b\x3d\xdb\x84\xaf\xda\xa2\x82\xa2\xa6\x07\x68\x10\x45\
+\xf9\xbd\x9f\x7f\x66\x90\x30\x0d\xba\x6f\x35\xeb\xcd\xbe\x67\xd0\
+\xf3\xb5\x2f\xfd\xcf\xd9\x64\x93\x4d\xe8\xd1\x47\x1f\xa5\x51\xa3\
+\xda\xf2\x38\x4a\xb1\x61\xdc\x6a\xab\xad\xe9\xa9\xa7\x9e\xe2\xc7\
+\x60\x0e\xfd\x7f\x30\x0c\x1a\xc5\x4a\xbe\x0f\xbd\x44\x94\x05\xf7\
+\xe8\x4a\x73\xac\x74\x60\x48\x14\xdb\x28\x14\x72\x98\xdc\xd5\x3f\
+\xf1\x55\x28\x40\xb8\xe8\x4e\x59\x4d\x6b\x7e\x73\x54\xa5\x8b\x53\
+\xcd\x75\x10\xc8\x78\x8e\xfa\x7d\xb0\xbb\x44\xd4\xa8\x16\x99\xad\
+\xd9\x1c\x5a\x6c\xea\xa8\x62\x53\x0a\x0c\x51\x1d\x82\x83\x04\x88\
+\x2b\x4f\x74\x75\xf5\x70\x35\xf6\x28\xfc\x82\xc8\x1f\x44\x7d\x41\
+\x43\x0a\xa0\x1a\x05\xde\x8b\x05\x26\xe8\xc4\x90\x7c\xcf\x87\x0d\
+\x8a\x9a\x70\x0f\x30\x8c\x14\x35\x93\x36\x02\x0c\xb9\x25\x86\x7a\
+\x4b\x23\x08\x95\x51\xc3\x1f\x89\x19\x24\x2c\x6b\x03\x43\x93\x56\
+\x62\xb4\x31\x2f\xe0\x45\x4d\xa2\xf0\xc8\x72\x01\x64\xd3\x6f\x4a\
+\xe0\xc0\x66\x6b\xd8\xa6\xc1\x89\x09\x6a\xbb\xfc\x24\x7b\x05\xc1\
+\x72\x34\x43\x35\x03\x62\x9e\x41\x8b\xd1\xcd\x1f\xfa\x48\xa3\x8e\
+\x75\xd3\xa7\x26\x52\x5d\x0f\x7e\x13\x74\x35\xd2\x29\xa8\x7f\x83\
+\xee\x59\xe9\x7a\xf3\xdf\x2f\xe8\xf9\xe8\x43\x9d\x1b\xb6\xcf\x74\
+\xdd\x75\xd7\x65\xf2\x0b\x90\x14\xc0\x8a\xa0\x14\x73\xb0\x32\x4c\
+\x9b\x36\x8d\x5e\x7c\xf1\x45\xcf\xb2\xa0\x60\x58\x6b\x5b\x0b\xf5\
+\x45\x50\xfb\x1b\xf1\xcc\x4a\x36\x13\xf5\x7f\xbe\x03\x85\x45\x6c\
+\xd0\x2b\xc9\xb1\x12\x82\x21\x8b\xc8\xc3\x89\xe8\x5a\xfc\x64\x4f\
+\x32\xd5\x10\x74\x51\xe0\x77\xce\x91\xe3\x72\x43\xb9\x24\xdd\x42\
+\x40\x5a\xce\x78\xa9\xff\x11\x0b\x0f\xc1\x39\x30\x5b\x81\xfe\x0d\
+\xbc\x8d\x1a\x2d\xaa\x9a\x20\xfb\x90\xd8\x77\x91\x63\xcf\x2f\xe7\
+\x19\x45\xcf\x09\x00\x43\x97\xf3\x00\x85\x7f\x34\x57\x8a\xa9\x87\
+\x35\x9a\x44\x53\x33\xa5\xb3\x21\x42\xe2\x3d\xe4\x35\x02\x09\x14\
+\x0c\xc1\x92\xa2\xac\x25\x00\xc3\x10\x03\xa2\x05\x8a\x1c\x20\x82\
+\x68\xd0\x74\x49\x30\x9c\x35\xeb\x2e\x9a\x76\xf2\xb1\x75\xd7\x0c\
+\xb5\x3f\xd0\x97\x42\x78\x9e\xe3\x86\xac\xac\x02\x77\x2d\x66\x52\
+\xb3\x45\x30\x60\x97\xa3\xf6\x92\x2a\x20\xb6\xd5\x94\xc1\xcf\xe6\
+\x47\x30\x1a\x3d\x27\xe5\x3b\xb9\x4d\x14\xe6\x2d\x00\x4d\x4d\xf8\
+\x85\x36\x76\xfe\xb9\x80\x73\x14\x38\xed\x48\x66\x9d\xdf\x0a\xae\
+\xaa\x51\xd7\x93\x2e\x2c\x48\x98\x07\xcd\xed\x5a\x85\x6d\xd0\xf3\
+\xf5\xfe\xec\xa3\x4d\x24\xbc\x08\x51\xac\x59\x10\x55\x6b\x3c\x81\
+\x82\x26\xe4\xc2\x6b\xaf\xbd\xe6\x99\x96\x1b\x1d\x40\x63\x5b\x94\
+\x0a\xf5\x55\x23\xd2\xbd\x96\x23\x18\x1e\x41\xe4\x5c\x17\x34\x27\
+\x56\xb4\xef\x57\x52\x30\xc4\x26\x3c\x72\xb5\xeb\xd2\x91\x58\x24\
+\xba\x50\x74\xf1\xc3\x94\xa6\x79\x43\xda\xe1\xfe\xc5\x54\xcd\xe2\
+\xd4\xf0\x76\x4c\x5c\x35\x57\x21\x22\x0d\x54\x55\x00\x47\xae\xe2\
+\x60\x98\x2c\x6c\xb3\xa8\xed\xdc\xaf\x7a\x02\x14\x32\x93\x72\xf0\
+\x8c\x6a\x23\x12\xf6\x82\x01\x85\x6f\x90\x83\x64\x3a\x7b\xc8\xc9\
+\xba\xd4\xdc\xdc\x4a\x29\x27\xc4\x3e\x4d\xb4\x51\x4c\x42\xc2\x2c\
+\x03\xaa\x35\x08\x64\xee\x3b\x4b\x33\x04\x28\xa2\xec\x92\xca\x76\
+\x90\x74\x87\xa3\x21\x4b\x33\x44\x4d\xc3\x0c\x45\x42\x59\x6a\x69\
+\x8d\xd1\xac\x99\x77\xd2\xb4\x93\x8f\x2f\x00\x86\x11\x29\x5d\x55\
+\xc0\xc4\x58\x6c\xb1\xda\x63\x65\x8f\x13\xfa\x1c\x3b\x7a\x30\xf3\
+\xa0\xbd\x00\x71\x7c\x8f\xdf\xd5\x5f\x5b\xac\x7f\x4b\x6b\x86\xd0\
+\xdc\x24\x3a\xb4\xd8\xc1\xa4\xce\x51\x09\x8c\x51\xeb\x00\x04\x2a\
+\xda\xca\x79\x86\x16\xeb\xb3\xe3\x30\xb5\x0f\xf7\x2f\x07\x5d\x65\
+\x84\x23\x16\x11\xa8\x85\x34\x98\x42\x9a\x9b\x7f\xbe\xda\xe7\xd8\
+\x1b\x03\x25\xea\xd6\xf3\xfd\x42\x55\xd7\x47\xad\xc2\x36\x08\x8c\
+\x82\xe6\x75\x35\xeb\xad\x12\x61\x6e\xf7\xab\x6e\x14\x74\xf3\x64\
+\x27\xc7\xe3\x9e\xda\x17\x38\xcf\x06\xce\x42\x9b\x64\x7d\xef\x5a\
+\xdb\xff\x29\x02\xc3\x6b\x88\x9c\xbc\xb8\x8e\xa0\xb9\xb1\xa2\x7c\
+\xbf\xd2\x82\xa1\x74\x60\xe4\xe9\x70\x38\xe4\xd1\xfb\xa8\xf0\x29\
+\xb4\x23\x0e\x5a\xcc\x81\x93\x1d\x26\x2f\x10\x67\x1b\x8d\x8f\x85\
+\x93\xe3\xd0\x0e\x3b\x6c\xcf\x29\x14\x48\x74\xd6\x85\xc6\x02\x08\
+\xc2\x9f\x89\xb2\x11\xd4\x22\x5a\x49\xb5\xc1\xfd\x9c\xf6\xe0\x07\
+\x43\x8f\x72\x4d\xf3\x07\xc3\xa6\xc4\x13\x51\x1a\x45\x7a\x3b\x93\
+\xd4\xb1\xac\x97\xfd\x83\xb1\x38\x48\xbf\x25\x05\x40\x20\x73\xf8\
+\xa1\xe6\x64\x7c\xc3\xfe\x25\x27\x44\xa1\x08\x68\xc1\x95\xf9\x27\
+\xcc\x81\x41\xd0\xcc\xf0\x6f\xe2\xf8\x09\x9c\x87\xd8\xd3\xd5\x41\
+\x93\x27\x4f\xa2\x3b\x6e\xbf\x8d\x23\x26\xa3\x11\x10\x81\xa7\x28\
+\x16\x09\x53\x3a\x83\x24\xe7\x88\x50\x83\x05\x28\x66\xb6\xff\x0c\
+\x6d\xc0\x35\x10\x66\x68\x17\xfc\x83\xb5\x1f\xaa\xed\x2a\x61\xb3\
+\xdc\x91\x5d\x7a\x26\xe5\x84\x7f\xcf\x7b\x90\x5c\x23\xe3\x26\xc1\
+\x49\xde\x21\x9d\x29\x87\xbc\xb4\x7c\xb2\x89\x14\x49\x99\xdc\x91\
+\xdc\xdf\xa1\x48\x94\x62\xe1\x18\xa5\x4c\x08\xbf\xbd\x39\x52\x13\
+\x67\xad\x60\x55\x7b\xff\x04\xdf\x41\x37\x80\x0a\x2e\x9c\x6b\xa9\
+\xf3\xc5\x5c\x6e\x27\x74\xeb\x26\xa5\xda\x77\xd3\x35\x8b\x4f\xdc\
+\xc3\x6f\x56\xd6\x39\x53\x28\x26\x20\xf8\x6d\xf2\xcf\x08\x5c\xff\
+\x95\xde\xd0\x77\xbe\xf6\x99\x7f\xa3\xae\x2c\x3f\x41\x3e\xdd\x72\
+\xda\xe7\x27\x64\xd7\x0d\x94\xdd\x4f\x68\x96\x5d\xf9\x43\x89\x1b\
+\x82\xac\x08\x41\xf2\x53\x78\x62\x53\xcf\x10\x65\x37\xad\xb1\xab\
+\x96\xdb\xe5\x2b\x39\x18\xd2\x7a\xb1\x58\xe2\xf9\x6c\x36\xcb\x09\
+\x85\x6a\x9a\xd4\x81\xb5\x77\x75\x41\x83\x19\x34\xd9\x18\x04\x51\
+\x0f\xcd\xf7\xb9\xe3\x8e\x3b\x32\x18\x8e\x1e\xdd\xee\x51\x63\x89\
+\x90\x35\x15\x27\x40\x97\xc5\x6a\x41\xe9\xae\x0e\xe2\x09\x77\xad\
+\x72\x8e\x5c\xf1\x9e\x53\x1e\x4c\x5a\x05\xea\x06\x86\x50\xd4\x53\
+\xe6\xd1\x50\x1a\x3e\xc3\x21\xea\xee\x19\x60\xca\x35\x50\xab\x05\
+\x09\x24\x3f\x18\xda\xbf\x03\x48\x33\xa9\x2c\x47\xc8\x26\x12\x51\
+\x1a\x1a\x4a\x52\x2c\x1a\xa6\x54\x6a\x90\xfa\x7b\xbb\x69\xc2\xf8\
+\xd1\xf4\xf8\xa3\x8f\xd0\xd1\x47\x1f\x49\x03\xa8\xdb\x48\x19\x6a\
+\x42\x5d\xbf\x34\xf2\xb7\x40\x09\x15\x9c\x74\x6f\x73\x40\xa2\xad\
+\xa8\x4f\x09\xfe\x4d\x90\x43\xdb\x82\x42\xfd\x3a\x9a\xe6\xa2\xe3\
+\x16\x14\x35\x69\x8a\x16\xf0\xb8\xe4\x8d\x8f\xe9\x43\x08\x5a\xfe\
+\xbb\x6a\xc7\x9e\xb9\x58\x36\x1b\x83\xe9\x34\xf5\x0f\x0e\x10\x0a\
+\xbe\x32\x98\xd9\x79\x86\x46\x5b\xd4\x20\x0c\x8c\x4d\x24\x2a\x54\
+\x6c\xac\xc5\xb5\x34\xd3\xdf\xfe\xfc\x14\x2d\x5e\xb4\x28\x4f\x2b\
+\xc1\x9c\x2c\x57\x18\x2d\x37\x09\x61\x3d\x58\xcd\xd2\xb6\x70\x55\
+\x16\x13\xdd\xb0\xe8\x1a\x54\xc0\x0f\x5a\x57\xa5\xde\xcb\x06\x43\
+\xdc\x07\x02\x57\x37\x0f\xaa\x9d\xdb\xfe\xd1\x5a\xfa\xa8\x96\x76\
+\x96\xfb\x5c\xf4\x1f\x2a\x80\x80\x1d\x08\x96\x0c\x6c\x16\x30\xef\
+\xfe\xf5\xaf\x7f\x05\xde\x22\xa8\x7d\xe8\x77\x3b\xa2\x18\x3f\x6b\
+\x14\xb6\xca\x46\x80\xa0\x4d\xa8\x1e\xf8\x50\xeb\x84\x32\xe4\x67\
+\x4f\x7b\x7b\xeb\x26\xbd\xbd\xbd\x6f\x55\x72\xdf\x15\xe9\xdc\x95\
+\x1d\x0c\xa1\x1d\xee\x99\x48\xc4\xef\xc1\xa2\xf0\x9b\x4b\xd5\x34\
+\x81\x05\x54\xc6\x60\x96\x1c\x17\x31\x11\x22\x78\x46\x02\x21\xc2\
+\xc6\x04\x06\x92\xe0\x5b\x6f\xfd\x03\x8d\x1f\x3f\x9a\xaf\x57\xa1\
+\xab\xb1\x14\x90\xbd\x0c\x59\xf8\xac\xb2\xb7\xc3\x88\xcd\x60\x49\
+\x2d\x4d\x54\xa5\x44\x95\x2d\x65\x48\xd1\xbf\xa3\x1c\x53\x4f\x77\
+\x8a\x7a\x7a\x07\x28\x0b\x30\x34\x91\x72\xa5\x9e\xaf\xfe\x28\xdc\
+\x5f\x37\x13\x9e\x69\x27\xeb\x50\x73\xa2\x89\xba\xba\x3a\x29\xce\
+\xa6\x41\xd1\x7e\x20\xf0\x43\x4e\x96\x5a\x5b\x12\x74\xeb\xef\x6f\
+\xa6\xf3\xce\x9b\x41\xc9\xa1\x01\x06\xc3\x78\x34\xc2\x9a\xa1\x1e\
+\x45\x33\x43\x0c\x82\xeb\x62\x57\x6d\x03\xf9\x99\xf0\xc5\xa2\x70\
+\x2b\x84\x88\x82\x60\xa1\x4f\x5d\xec\xa5\x06\xb0\x10\x18\x72\x97\
+\xa2\x73\x7d\xbe\xe7\x9c\xef\x94\xef\x4c\x80\x3e\x27\x4c\xb4\x64\
+\x69\x2f\x75\x74\x08\x5f\x65\x2c\x16\x67\x40\x54\x1f\x31\xe6\x17\
+\xa2\x87\x79\xd3\x11\x52\x2d\x06\x05\x8e\x43\xd4\xda\x12\xa7\x3d\
+\x76\xdb\x99\xde\x7a\xf3\x9f\x5e\xaa\x83\x82\x2f\xfa\xba\x1e\x49\
+\xf1\x23\x25\x54\x54\xe8\xea\x9a\x52\x30\x52\x9e\x50\x6c\x4a\x34\
+\x17\x54\x53\x3d\xca\x2d\x21\xe5\x7f\x07\x1b\x0c\x15\x80\xed\x4d\
+\x9d\x52\xb2\xe1\x6f\xfe\x84\xfb\x4a\xfb\x23\x08\x6c\x2a\xbd\x9f\
+\xff\x7c\xb4\x1f\x1b\x67\x30\x27\x61\xa3\xa7\x7d\x02\x62\x75\x10\
+\xac\x3f\xf9\xe4\x93\x25\x1f\x51\x4e\xfb\xb4\x8f\x4a\xf9\x8c\x35\
+\x20\x0d\x7d\x87\x7f\xb0\xf2\x68\xba\x58\x39\x1b\x93\x62\xe7\xb8\
+\x2e\x4d\x21\xca\xde\x5b\x6b\x3f\x2d\xcf\xeb\xab\x14\xcf\xcb\xb3\
+\xc9\xc3\x9f\x1d\x0e\x47\x4f\x77\x5d\xf7\x5c\x35\x0b\xe8\xc4\x09\
+\x02\x40\xfb\x4e\x41\x93\x0d\x2e\x25\x80\x20\xea\xd8\xe5\x76\xa7\
+\x2e\xa1\x96\xda\x8d\x37\xde\x44\xe3\xc7\x8f\x27\x76\x0d\x59\xf4\
+\x5c\x82\x5c\x12\x48\x23\x80\x58\x3c\xf3\xbe\xd4\xf3\x79\x90\xd8\
+\xce\xa8\x9a\x20\x34\x4d\x4b\x33\x64\x61\x1e\x61\x73\x1c\x4c\xaa\
+\xa9\xb4\x4b\x43\x83\x52\x8a\xc9\x75\x22\x14\x42\x14\xa8\x11\xd2\
+\xc5\x27\xb3\x61\x4f\x31\x60\xa8\x0b\x8a\xc1\x27\x93\xa5\xb6\xd6\
+\x04\xdd\x7e\xfb\x1f\xe9\xcd\x7f\xfe\x8b\xd2\x99\x24\x65\x32\x29\
+\x4a\x44\x63\x14\x46\x70\x8d\xeb\xd0\x87\xef\xa3\x84\xd0\x53\x94\
+\x60\x1e\xd3\x24\xb9\x4e\x4e\x95\xe5\x80\x1d\xce\xcf\xcb\x3f\x0a\
+\x8d\x8f\x06\x95\x20\x0a\xf0\xa5\x97\x5e\x62\x6d\xb4\x31\x47\x71\
+\x2e\x57\x79\x9e\x29\x6d\x65\x1e\x9e\x0d\x81\xa8\x3b\x43\x4b\x97\
+\x74\x9a\x54\x99\x16\xf1\xff\x99\x8a\xea\xba\x0b\x67\x2d\x36\x24\
+\xe4\x00\x8e\x23\x60\x88\xbe\x9b\xb2\xe7\x4e\x4c\xc7\x06\x8d\x40\
+\xfd\x78\x0a\xec\x7e\xc6\x98\xc6\xbc\x6f\x6d\x77\xf5\x03\x36\xde\
+\x41\x4b\x28\x41\xb8\x23\x40\x45\x23\xac\xf1\x9d\x16\xdb\xc6\x53\
+\xab\x05\x7b\x3f\x18\xea\x9c\xd4\x3c\x62\xdb\x1a\x50\xc9\x5a\x2f\
+\xd4\x13\x41\xeb\xbf\xb6\xde\x93\xab\x77\xde\x79\x67\x26\x01\xc7\
+\x81\xbe\x43\x15\x8d\x8f\x3e\xfa\x98\xf6\xdf\x7f\x7f\x2e\xbf\x55\
+\xea\x28\xa7\x7d\x7e\xb3\x28\xee\x87\x92\x70\x88\x67\x58\xb4\x68\
+\x11\xcf\x49\xac\xa7\x8f\x3e\xfa\x88\x7d\xef\x95\x1c\xa5\xfa\xd7\
+\x75\xdd\x33\x88\x9c\xf3\x2a\xb9\xdf\x8a\x78\xee\x27\x02\x0c\x59\
+\x74\x85\x23\xb7\x38\x8e\x7b\x40\xa1\x4e\x2e\x67\xa1\x04\x4d\x36\
+\x68\x43\x38\x87\x4d\x8e\x59\x31\xc9\x66\xd2\x59\xfa\xce\x66\x9b\
+\xd3\x35\xd7\x5c\x4b\x2d\x2d\x6d\xcc\xd2\x22\x3b\x57\x78\x0c\xc5\
+\xec\xe6\x18\xfe\x4a\x98\x2b\x0b\xe7\xf1\x49\x8b\x83\x9e\xef\xaa\
+\x96\x65\xd1\xa5\x39\xea\x8b\x34\xa3\x18\x89\xc5\x39\x89\xde\x01\
+\x1f\xa8\x8b\xc0\x22\x21\xd6\xe6\xb6\xb2\xff\xaa\xf8\xa1\x9a\xa1\
+\x0a\x68\x15\x3c\x78\x9f\x6c\x7a\x90\x26\x8c\x1f\x43\x47\x1f\xf5\
+\x33\x9a\x35\x6b\x16\x51\x26\x25\xbc\x6e\xf2\x86\xfc\x2f\x91\x68\
+\xa2\x64\x72\x80\x5a\x9a\x9b\x69\x70\x08\xa4\xe8\xf2\x7d\x44\xdf\
+\xdf\xf2\x98\x16\x1b\x0f\xee\xdf\x68\x94\xdb\x8a\x45\x0c\x76\x10\
+\x2c\x60\xf8\x0e\xed\x00\x04\x5b\x48\xea\x1b\x05\x99\x81\x0b\x11\
+\x0a\xf0\x7d\xb8\x0f\x6d\xa0\x56\xf5\x3b\x17\x51\x8b\x40\xa2\x54\
+\x96\x68\xf1\xd2\x41\x5a\xd6\xd9\x6d\xa2\x84\x13\x32\x6e\x0e\x72\
+\x4f\x91\xbb\xe9\x78\xfd\xcc\x39\x99\x86\x92\x0d\xcf\x18\xd5\x96\
+\xa0\x03\xf7\xdb\x83\x5e\x78\xe1\x6f\x1c\xd8\xa5\xa4\xee\x3a\xe6\
+\x2b\x03\x18\xaa\xd6\xa1\x56\x06\xbf\x8f\x49\xe9\x09\x15\xec\xd5\
+\xbf\xa7\xf3\xa9\x1a\xe1\x67\x8f\x33\xfa\x57\x83\x85\xec\xcd\x2e\
+\x7e\xd6\x58\x81\xa0\xf9\x5d\x4d\x1b\xca\xbd\x26\x48\xc6\xa0\x9d\
+\x20\x13\xbf\xff\xfe\x99\x79\xb7\xfc\xf8\xe3\x05\xcc\x91\xfa\xc6\
+\x1b\x6f\x04\xae\xcf\x52\x27\xa8\xc6\x67\xbb\x88\x10\xc7\x80\x4a\
+\x3e\xdf\xfe\xf6\xb7\x3d\x9f\x2b\xcc\xd9\xbf\xfb\xdd\xef\xe8\xc1\
+\x07\x1f\xf4\x2c\x46\x68\x7b\x90\x9b\xa1\xd8\xfb\x85\x42\x74\xab\
+\xe3\x64\x0f\x2c\xb7\x9f\x56\xe4\xf3\x3e\x31\x60\x28\x46\xc4\xc8\
+\xd3\x44\xee\x77\x74\x87\xa4\x1d\x1f\x34\x51\x83\xc1\x28\x17\xfd\
+\xa1\xfe\x37\xf8\xe8\x32\xe9\x0c\x6d\xfc\xed\xef\xd2\x95\x57\xfd\
+\x9a\xc6\x8c\x19\x47\x50\x7e\x80\x85\x0c\x44\x00\x24\x35\x01\x3a\
+\x00\x49\x8d\xfa\x34\x01\x35\x1a\x58\x63\x3e\x21\x54\xf3\x02\x6e\
+\x7c\xdf\x4b\x52\xbc\x09\xc4\x09\x21\x36\x13\x9a\xa1\x90\xac\xc1\
+\x3c\x8a\x45\x10\x66\xd3\x1d\x34\x51\x01\xc2\x70\x04\x40\x28\xc9\
+\xc4\x21\xe4\x5e\x04\x80\xa1\xf6\x93\x02\xa3\x46\xe8\x65\x52\x03\
+\xb4\xe6\x9a\x13\xe8\x90\x83\x0f\xa4\xb9\xb3\xee\xa3\x68\x2c\xce\
+\xa5\x9d\xa0\x29\xc7\xa2\x30\xb7\x44\x68\x80\xd9\x51\xe0\xd7\x51\
+\x26\x14\x89\xb8\x05\x61\xb7\x9d\x74\xef\x1f\x0b\xfd\x5d\xc1\x4c\
+\x85\x2d\xf2\xc2\xc0\x1b\xe9\x07\xc2\x42\xaf\xc0\xef\x17\xe0\x93\
+\x1d\x7e\x9d\xad\x19\x16\x00\x43\x2b\xba\xa8\xb5\x7d\x00\x00\x20\
+\x00\x49\x44\x41\x54\xbd\x04\xdf\x62\x6c\x97\x74\xb8\xd4\xdd\xdd\
+\xc3\xb7\xe2\xf1\xe7\x82\xb6\x11\x06\x37\xed\x33\xad\xfa\x21\x60\
+\x20\xc4\x06\xed\xad\x31\x9a\xb2\xc7\xb6\xf4\xe2\x8b\x4f\xb3\x50\
+\xb2\x13\xe7\x79\xc3\xc0\xe7\x16\x49\xda\x5f\xc1\xa4\x07\x40\x4f\
+\x49\x0f\xf0\x1e\xa8\xdb\x09\x41\x0a\xcd\x10\x7f\x07\x60\x41\xf3\
+\x80\x5f\x0c\xda\x8f\x8e\x67\xa5\x9a\x08\x5e\xdb\x06\x43\xfc\x8c\
+\x22\xc3\x00\x5b\x08\x74\x2d\x6a\xfc\xe6\x9b\x6f\xe6\x11\x30\x14\
+\xeb\xae\xa0\xcd\x66\xad\xdd\x1c\x34\xff\xf0\x3d\x5c\x2a\x33\x67\
+\xe6\xc0\x10\x6b\xa5\xb3\xb3\x8b\x40\xdc\x01\x96\x9c\xa0\xf5\x59\
+\x4e\x1b\x6d\xed\x70\xd5\x55\x57\xa5\xab\xaf\xbe\x9a\x76\xd9\x65\
+\x67\x2e\x6b\x07\x33\x3e\xac\x45\xa7\x9e\x7a\x2a\x5d\x79\xe5\x95\
+\xb2\x99\x83\xe5\x27\x28\x60\xc1\xef\x46\xc8\x35\xe4\x59\xd7\xe5\
+\x80\x99\x6a\x63\x03\xcb\x79\xa5\x11\x3b\xe7\x93\x04\x86\x44\x94\
+\xf8\x42\x38\x9c\xfd\x5b\x28\x14\x5a\x05\x3d\x68\xfb\xbe\x82\x06\
+\xbc\xf4\xf7\xe2\x73\xd4\x5d\x28\x07\x3d\x44\x51\xe1\x3c\x4b\xdf\
+\xfa\xce\xa6\x74\xc5\x95\xff\x47\x93\x26\xad\xc6\x66\x52\x27\x8b\
+\x24\x75\x44\x9e\xe2\x53\x4c\x6d\x32\xe1\xb4\xab\x35\x59\x21\xff\
+\x53\xe6\x23\xfe\x37\xfc\x7b\x60\x9e\xbc\x8b\xcc\x39\x04\xce\x08\
+\x18\x8a\x56\x06\x1c\x15\xb3\x8b\x68\x84\x69\x63\xba\x03\x97\x28\
+\x34\x22\xf6\x4b\x85\x83\x02\x78\x04\x50\xb4\x1f\x6c\xb3\x5f\x3a\
+\xd9\x4b\xab\xae\x32\x8a\x8e\x3c\xe2\x10\x9a\x0d\xcd\x90\x31\xd8\
+\x06\x57\xf8\x0f\x51\x04\x35\x2d\xad\x37\xe0\xa4\x66\x34\x11\x6c\
+\xa5\xcd\xa4\x78\xb6\x26\x92\x43\x7b\x82\x99\xf4\x4f\x7f\xfa\x13\
+\x8d\x1b\x37\x4e\x52\x40\x4c\xe4\x62\xb1\x95\x51\x8d\x66\x28\x3d\
+\x2e\x20\x94\x6b\x9d\x8f\x78\xc0\x45\x94\xae\xf4\xdd\xc2\xc5\x29\
+\xa6\xb1\xe3\xb6\x86\xa5\x0c\x0e\xc0\x90\xdb\xc6\xdc\xad\x39\x50\
+\xe3\x9f\x9d\x8c\x01\xc3\x08\xed\xb5\xe7\x76\xac\x19\xa2\x6f\x34\
+\x10\x45\xdf\x39\x48\x6b\x1f\x31\x69\x50\xe2\x41\x85\x72\x3a\x01\
+\x4e\x97\x5d\x76\x19\x8f\x11\x36\x2d\x5a\xfd\xe1\xb7\xbf\xfd\x2d\
+\x5d\x7f\xfd\xf5\xec\xc7\xab\xe5\xdd\x6c\x30\xdc\x63\x8f\x3d\xe8\
+\xb4\xd3\x4e\x63\x93\x9f\xc6\x07\x80\x7c\xe0\x9c\x73\xce\x61\x86\
+\x99\x20\x9f\x61\xd0\xfa\xaf\xb5\x8f\x83\xc0\x10\xeb\x09\x9a\x21\
+\x6a\x9c\x22\x9e\x40\x19\xaa\x50\x62\x0e\xef\x06\x97\x40\x3d\xc0\
+\x90\x37\x6a\x26\xe2\x1d\xe6\xeb\x1b\x6f\xbc\x91\x9f\x8b\x0d\x44\
+\x7b\x7b\x1b\x07\xf9\x01\x0c\x2f\xb9\x44\x8a\xa0\x97\x7b\x14\x78\
+\xbf\x45\xae\x9b\xdd\x8c\x88\xfe\x5d\xee\x3d\x56\xf4\xf3\x3e\x61\
+\x60\xc8\xfe\x89\x6d\xc3\xe1\xe8\xa3\x98\xfc\x1a\x39\xa5\x91\x8a\
+\xd5\x4f\xb6\x02\x61\xdd\x28\x67\xe4\xb8\xf4\x9d\x4d\x37\xa7\x2b\
+\xae\xfc\x0d\xb5\x8f\x1e\xc3\xda\x1f\xbb\xf6\x5c\x68\x85\x02\x84\
+\x59\x93\x9a\x60\xe2\x34\xaa\x9e\x0f\xd1\xb0\x84\xb1\x6b\x49\x25\
+\xd6\x12\x43\x00\x42\x01\x25\x8d\x4a\x54\x53\x2d\x16\x04\x6a\xed\
+\x61\x12\x73\x82\xbd\x49\xf5\x08\x3b\x61\x72\xc2\x0e\xf9\x3f\x43\
+\xd9\x10\xb9\x11\x97\xf0\x89\xef\x63\xa1\x18\xa1\xfc\xa1\x93\x72\
+\x28\x99\xee\xa1\xcf\x4c\x1e\x47\x47\x1d\x75\x28\x57\x54\x77\x61\
+\x26\xc5\x1d\xa3\x61\x0a\x41\xeb\xcd\xe6\x13\x1a\xf8\x4d\x36\x62\
+\x16\xcc\xaf\x28\xe0\x5f\x5c\xaa\x31\x69\x30\x04\xa2\xee\x9e\x78\
+\xe2\x09\xf6\xc5\x2a\xd0\x15\x32\x8f\x56\xdd\xa1\x5e\x8a\x89\x9d\
+\xf6\x52\x88\x81\xc7\x10\x9c\x03\x0c\x17\xa4\xa8\xb3\xb3\x13\x26\
+\x79\x8a\xc5\x12\xcc\x55\x8a\x3d\x01\x0a\xfd\xa2\x8f\xd9\x5c\x87\
+\xaa\xf7\x26\x97\x93\xb5\x75\xd6\x0c\x23\xf4\xa3\x29\xdb\xd3\xf3\
+\xcf\xff\xd5\xab\x64\xa1\x34\x69\xf8\x3e\x48\x90\x57\xff\x8e\xf5\
+\xbf\x12\x63\x89\x4d\x0e\x84\x2b\xfc\xe5\x30\x9b\x83\x8a\x10\xc2\
+\x1d\xef\xd4\xdc\x9c\xa0\x33\xcf\x3c\x9b\x49\xea\xf5\xa8\x47\x00\
+\xcd\xde\x7b\xef\xcd\xb4\x87\xa8\x4e\xaf\x40\x82\xfb\xff\xf4\xa7\
+\x87\xd1\xcd\x37\xdf\x1c\xf8\xa2\xcb\x1b\x0c\xf1\xfc\x5d\x77\xdd\
+\x95\xee\xbc\xf3\x4e\x2e\x21\x05\x0a\x44\x58\x54\xe6\xcf\x5f\x48\
+\x53\xa6\x4c\xa1\xe7\x9e\x7b\xae\x26\x30\xf4\x6f\x56\x30\xaf\x00\
+\x86\xb7\xdd\x76\x1b\xed\xb8\xe3\x0f\xbc\x34\x58\xf4\x1d\x36\x15\
+\x97\x5e\x7a\xa9\xf7\xbc\x72\x7c\xba\xfe\xf5\xea\xba\xa1\xed\x88\
+\x32\x8f\x05\x76\xfc\x4a\x74\xc2\x27\x0e\x0c\xa5\xef\x23\x87\xc6\
+\xe3\xb1\xeb\x35\x9f\x46\x1d\xfb\xf6\xb8\x54\xb6\x38\x72\x45\x30\
+\x71\x0f\x2c\xee\x50\x38\x4e\xc9\xa1\x24\x6d\xba\xc5\x96\x74\xf1\
+\x25\xbf\xa2\xf1\x13\x27\xb1\x96\x00\x30\x02\x18\xb2\x36\x01\xad\
+\x02\x92\x11\xbf\xb1\x0f\xad\xb8\xa9\xb2\x74\x7b\x00\x65\xd0\xf2\
+\x54\x6b\x44\x2b\x04\x0c\xbd\x7b\x46\x72\xc1\x39\x98\xb8\xf2\x2f\
+\x97\x48\x1e\x02\x4f\x1b\xb7\x43\xe8\xd5\x0a\x7d\x52\x18\xde\x31\
+\x00\x39\x54\xdc\x10\x65\xdd\x0c\xa1\xd9\x8e\x3b\x48\x93\xc6\x35\
+\xd3\x29\x27\x1f\x4b\xb7\xfc\xfe\x36\x72\x5d\x44\x53\x36\x71\xa0\
+\x0c\x07\x05\x95\x65\xa6\xcc\xbd\xbb\xe6\xa2\x01\x2c\x10\x5e\x0e\
+\x21\x8a\x7f\x4a\xbc\x0d\xf0\x83\xa0\x45\x94\x1d\xc8\xce\xab\x33\
+\x83\x96\x5a\x85\xb9\xb6\xa8\x46\x28\xc9\x1f\x12\x39\xea\x3f\xf0\
+\x0d\xb4\xfe\xa5\x1d\x69\x2e\xe1\x94\xc9\x48\x04\x28\x9b\xc2\x8d\
+\x49\x5a\x37\x1d\x51\x04\x58\xb9\x52\xef\x10\xbe\x43\xcc\xc1\xf1\
+\xe3\xda\x69\xef\x3d\xb6\xa7\x67\x9f\xfd\xb3\xa7\x3d\xfa\x4d\xf9\
+\xb5\xca\x8c\x20\xcd\xa4\xb2\xf9\x5e\xbc\x35\xea\x1b\x84\x16\x08\
+\xcd\x10\xdc\x9e\xf8\x1b\xc6\x4c\x59\x8d\x30\x6e\xd0\x3c\xd4\x57\
+\x5d\xce\xb3\x83\xda\xbf\xef\xbe\xfb\xd2\xad\xb7\xde\xc2\x69\x3d\
+\x1a\xb9\x0a\x0d\xeb\x80\x03\x0e\x62\x81\xaf\x87\xce\x7d\xde\x38\
+\x5a\x26\xc0\xa0\xfb\x07\xf5\x7f\x39\xef\x80\x7b\xc0\x7c\x3b\x69\
+\xd2\x24\x36\x13\x6b\xda\x89\xba\x1b\xa0\x01\xa2\xfc\x56\x4b\x0b\
+\x2a\xc5\x88\xd9\xb2\xa7\xa7\x8f\x8b\x0f\x6b\xf5\x0c\x6d\x47\xb9\
+\xcf\x2b\xd4\x6e\xf5\xa1\xc2\x67\xf8\x87\x3f\xfc\x81\x73\xa1\xf5\
+\x79\xd8\xbc\xa1\xd4\xd7\x85\x17\x5e\xc8\x97\x96\x03\x84\xf6\x33\
+\xc4\x62\x14\x3d\x2c\x9d\x1e\xba\x21\xa8\xcf\x56\xb6\xef\x3f\xa1\
+\x60\xc8\xbb\xf5\xb3\x9b\x9a\x9a\xce\xc2\xe4\x5c\xba\x74\x69\x8d\
+\xf5\x0c\x0b\x81\x18\x34\xb5\x10\x6d\xb9\xf5\xb6\x74\xe1\x45\x97\
+\xd0\xe8\xd1\xe3\x88\x0b\xe8\x3a\x00\x42\x13\x45\x6a\xb4\x43\xd6\
+\xe0\x1c\xd4\xc0\x2b\x6e\x5a\xb7\x03\x44\x86\x4f\x22\x68\x5f\x16\
+\x23\x0c\x83\x99\xf8\x0a\xd9\x5c\xea\xf3\xaf\xe0\xfa\x9c\x50\x10\
+\x90\x54\xac\x84\xb5\x92\xaf\xf3\x7d\x82\xd4\x14\x7f\xe7\x24\x7b\
+\xcc\x0a\x70\x99\xe2\x19\x59\xdc\x3f\x45\x93\xc6\xb7\xd0\xf1\xc7\
+\xfd\x9c\xee\x34\xd1\x70\xcd\x2d\x2d\x34\x68\x25\xc3\x6b\xc0\x50\
+\xb1\x05\xa0\xa9\x26\x6a\xba\xc6\x82\x5d\x6d\xb5\xd5\xe8\x94\x53\
+\x4e\xe1\x32\x57\x9a\x17\x05\x9f\x10\x84\x2a\x04\xca\xe7\x3f\xff\
+\x79\x8e\x7e\x83\xe0\x85\x2f\xaa\x3e\x47\xfe\x58\x7a\x09\xf5\x44\
+\x94\xcc\x80\xb6\x2f\x4b\x2e\xb4\x67\xc7\x04\xf0\xe2\xa1\xe1\x08\
+\xfb\x0c\x7b\x7b\x40\x38\x30\x68\xcc\xe5\x30\x8d\xe6\x8a\xfb\xaa\
+\xe0\x57\x4a\xc0\x3c\x30\x1c\xdf\x4e\x7b\xef\xbe\xc3\x0a\x01\x86\
+\x36\x28\x54\x22\x70\x35\x39\x9c\x03\xaa\x8c\x7f\x13\x81\x19\x30\
+\x51\xb6\xb7\xb7\xe6\x0d\xcd\xe9\xa7\x9f\x49\xe7\x9f\x7f\x3e\xff\
+\x0d\xcf\x2b\xb4\x19\xf5\x8f\x65\x10\x58\xa1\x70\xf1\x4d\x37\xdd\
+\xc0\x66\x3e\x00\x22\xe6\x0f\x7c\x6e\xbf\xf8\xc5\xd1\x74\xcd\x35\
+\xd7\xe4\x6d\x98\xf4\x5e\xe5\xfa\xc3\xb4\x9d\xa5\xe6\x57\x50\x5f\
+\x41\xce\xa0\x6f\xbe\xfe\xf5\xaf\xd3\x59\x67\x9d\x45\xa8\x3b\xa9\
+\x66\x7f\xa5\x84\x44\x1f\x6e\xb0\xc1\x97\xf8\x31\xf0\xdd\x61\xce\
+\x00\x34\x51\x9b\xf2\xd9\x67\x9f\xcd\x7b\x7c\xd0\xf3\x4a\xb5\x55\
+\x9f\x8b\x1c\x5d\x80\xe1\xf6\xdb\x6f\xcb\x29\x40\x88\xea\xc6\xbc\
+\x3e\xe3\x8c\x33\xe8\x82\x0b\x2e\xa8\x08\x0c\x71\x4f\xb3\xe1\x3b\
+\xe7\x7f\x9b\xea\xb3\xeb\xb3\x16\x57\xac\xbb\x7c\x62\xc1\x10\xdd\
+\x7c\xde\x79\x17\x5d\xd7\xdb\xdb\x7d\x18\xfc\x17\xcb\x96\x2d\xab\
+\x61\xb2\x89\x00\x65\x2a\xb3\xb8\xe4\xbc\xc1\x67\x14\x89\x44\xe9\
+\x9b\xdf\xfa\x36\x1d\xf9\xf3\xa3\x68\xbd\xf5\xd6\x67\x6d\x90\x99\
+\x5e\x58\x3b\x14\xdf\xa1\x2c\x4c\x97\xc2\x5c\x24\x37\x80\x86\xa5\
+\xe8\xdc\x80\xf6\x15\x95\xfb\x31\x88\x21\x20\xc6\x80\x5a\x09\x30\
+\xf4\x40\xd1\xa6\xa0\x32\xf9\x8e\x30\xdb\xc2\xd7\xa8\x9f\xd0\x1c\
+\xf1\x7b\x04\xf0\xca\xb1\x3c\xf0\xa6\xc1\x59\x09\x30\x4c\xd3\x98\
+\xf6\x18\x5d\x78\xc1\x0c\x5e\x5c\xfe\x60\x08\x68\x77\x83\x83\xc9\
+\x92\x33\x5b\xe9\xe9\x20\x48\xd5\x8f\x04\x5f\x13\x4c\xa1\x1b\x6e\
+\x88\xda\x9f\x42\x93\xe5\xdf\xd9\x2b\xf3\x48\xed\xcb\xa6\x08\xf3\
+\x8e\x09\x94\x49\x66\x5c\xea\xed\xe9\x93\x4a\x1f\x1c\x78\x8b\x6d\
+\x86\xf0\xb4\xf2\x46\x05\xb4\x6b\xe9\x34\x0b\x15\xb4\x11\xa6\x52\
+\x04\x3d\xa9\xd0\xd2\x94\x10\x06\x43\x4f\x33\x94\xfc\xb7\xf1\xe3\
+\x46\xd1\xde\x7b\xec\x40\xcf\x3e\xf3\xd7\xe5\xaa\x19\xfa\xcd\xcc\
+\xda\xf6\x72\x05\xaf\xad\x45\xc0\x47\x08\x30\xbc\xf6\xda\x6b\x69\
+\xf5\xd5\x57\x97\x00\x2e\x43\x96\x0d\x41\x7b\xf9\xe5\x97\x4b\x11\
+\x64\x53\xe9\xc5\xcf\x0d\x5c\x29\x18\xa2\x4c\x1a\x72\xf4\x34\x25\
+\x01\x01\x21\x08\xdc\x39\xea\xa8\xa3\x38\x3a\xb2\xd0\xbb\x95\xfb\
+\x5e\xf5\x00\x43\x7d\x9f\xaf\x7e\xf5\xab\xf4\xf4\xd3\x4f\xb3\xe9\
+\x18\x07\x36\x57\xa2\x4d\xc1\x5d\x21\x73\x50\x0b\x32\xe3\xe7\x45\
+\x8b\x96\xd0\xee\xbb\xef\x3e\xcc\x4c\x5a\x49\xdb\xfd\x7d\xa9\x1b\
+\x6b\xb8\x18\xa0\x35\x6f\xb7\xdd\x36\x79\x60\x78\xe6\x99\xb9\xcd\
+\x4a\xb9\x9a\xa1\x89\x78\xbe\x9e\xc8\x01\x2f\xf4\x27\xf2\xf8\x44\
+\x83\x21\x46\xec\xdd\x77\xff\x3b\x7b\xca\x94\x29\x3b\x83\x94\xd7\
+\x3e\x2a\x9f\x6c\x46\x98\x32\xb6\xd9\xbe\xa5\x10\xad\xbb\xfe\x97\
+\x79\x52\xb3\x89\x94\xcd\x33\xb9\x73\x5c\x13\x05\x1a\x8b\x88\x78\
+\x2d\x76\x94\x0a\x00\x81\xf1\x12\xc2\xd7\xa6\x76\x0b\x12\x26\xfe\
+\x9d\xb6\x17\x72\x5d\x42\x33\x24\x94\x23\x32\xdf\x43\x33\x64\x9d\
+\x13\x1a\x23\x65\x28\xe2\xa6\xa9\xab\x7b\x29\x3f\x16\xbb\x60\x5d\
+\x44\xca\x09\x1a\xc4\xed\xc9\x51\xaf\x56\xd1\x55\xbd\xcf\xeb\xaf\
+\xbf\xce\x1a\x20\x04\x1b\x9b\x1e\x0d\xf5\x16\xfa\x03\x0b\xb0\xb4\
+\xc6\x5c\xc9\x9a\x2c\x0d\x86\xbd\xfd\xf0\x07\xf6\x50\xe7\xb2\x6e\
+\x66\xed\x91\xc8\x5c\xb4\x47\x76\xc4\x12\xac\x84\x5c\x4c\x6c\x17\
+\x72\x55\xee\x55\x90\x8a\x66\x28\x55\xec\x05\x0c\xa5\xa4\x58\x2a\
+\x35\x64\xc0\x70\xa7\xe5\x0e\x86\xc5\x84\x7e\xb1\xb5\xe0\xd7\x22\
+\x95\xf6\x0c\xe7\x63\x6c\x20\x6c\xa1\xd5\xa8\xd9\x1b\xe0\x87\xb9\
+\xf1\xcc\x33\xcf\xd0\x2b\xaf\xbc\x52\x51\x94\x6c\x90\x66\x88\xe8\
+\x62\x44\x63\x82\x1c\x1f\x41\x34\xba\xf9\x40\x8a\x00\x0a\x1b\xfb\
+\xa3\x71\x2b\xd1\x0a\xeb\x01\x86\x4a\x00\xb0\xde\x7a\xeb\xd1\x2b\
+\xaf\xbc\xc4\x9a\x1f\x7c\x83\xd8\x3c\x81\x85\x09\xda\x2c\xfc\xa9\
+\xea\x2b\x54\x4d\x6d\xe9\xd2\x4e\x8e\x26\xf5\xe7\x19\x56\x2e\x9f\
+\x72\x6b\x41\xfb\x12\xda\xa9\x82\xa1\x6d\x26\xb5\xc1\xb0\xdc\x48\
+\xe6\x48\x24\x3c\x27\x9b\xcd\xec\x52\xc9\x8a\x5b\xd9\xce\xfd\xc4\
+\x83\xa1\xeb\xba\xcd\xeb\xae\xbb\xfe\x93\xef\xbc\x33\xef\xdb\xb5\
+\x80\x61\x34\x2e\x89\xeb\xc8\xdb\xc3\x64\xc3\xa2\xc7\x84\x4f\xa2\
+\xa0\x6f\x28\x6c\x22\x31\x2d\x8a\x18\x2f\xd4\x1f\x28\x08\x1f\x5c\
+\xe9\x3c\x3f\xae\x6a\x50\xe2\x80\x9f\x4e\x8e\x22\xe7\xf9\x53\x0b\
+\x8a\xa4\x1a\x14\x33\x93\xc2\x3c\xea\x69\x8a\xf0\x9c\x29\x8d\x1c\
+\xdb\x11\xb3\x14\xe3\x88\x49\x29\x5f\xc5\xe9\x03\xc6\xe4\xab\x00\
+\x16\x14\x35\xa8\x95\x32\x54\xf0\x28\x4b\xc9\xdb\x6f\xbf\xcd\x9a\
+\x85\x9a\x61\x0a\x75\x81\x26\x59\xd7\xb6\xb8\x2c\xff\xaa\xd7\x8f\
+\xca\xeb\x4a\x04\xc5\x76\xc9\xe2\x65\xd4\xb9\xac\x87\xdc\x10\x82\
+\x44\x9a\xc5\xe7\xeb\x1a\xf3\x50\x76\x88\xdb\xa8\xa9\x2a\xba\x79\
+\x01\x08\x2a\x60\x0b\x18\xe2\x9a\x15\x17\x0c\xb5\x0f\x0b\x99\x4b\
+\x4b\x01\x12\x84\x33\xc0\x90\x79\x66\x8d\x16\x88\x3e\x50\x32\x6c\
+\xdd\x1c\x69\xb0\x9a\x6e\x7c\x82\xe6\x45\xa1\xf6\x14\x1a\x67\xdc\
+\x0f\x66\x3f\xdb\xc2\xa3\x82\x1c\x26\x74\x25\x6d\x97\xcd\xe8\x70\
+\x77\x44\x10\xb8\x04\x81\x71\xd0\xf5\x3a\xaf\x51\x4c\xf8\xd5\x57\
+\x5f\xe5\xf6\x40\x46\xe0\x3a\xd5\x98\x61\x1d\xe1\xca\x32\x21\xd1\
+\x18\x71\x2c\x59\x22\x9a\x21\x4a\x49\xd5\x22\x9f\xf4\xf9\x76\x3b\
+\x27\x4e\x9c\x48\xb7\xde\x7a\x2b\x6d\xb3\x0d\x34\x43\xf1\x73\xe3\
+\x7b\x44\xe0\xda\x01\x4e\xc1\xeb\x2a\xf4\x1c\x51\x76\x2b\xb0\x12\
+\x06\x9f\xbb\xf2\x9e\xf1\x89\x07\x43\x0c\xcd\xe4\xc9\x93\xd7\x5c\
+\xb0\x60\xf1\x13\x44\xee\x3a\x3a\x54\xe5\x4c\xee\xbc\x61\x35\x51\
+\x9b\xaa\x15\x22\x95\x00\x93\x0b\x60\xd8\xdc\xd2\x96\xe7\x3f\x93\
+\xeb\x72\x5d\x8b\xac\x43\x65\xe7\x2c\x9c\x58\x51\x28\xa1\xc2\x4e\
+\xb4\x90\xe0\x17\x25\xfc\x2e\xcc\x64\x53\x0c\x4c\x55\x23\x2a\x0d\
+\xb6\x41\x53\x18\xc9\xf3\x10\xf2\xc6\xab\xc8\x15\xde\x15\x10\x64\
+\x63\x50\xda\x4c\x8a\x5d\x32\x04\x84\xfa\x8f\xb4\xff\xc1\xcb\x88\
+\x5d\x3f\x16\x2b\x9b\x9f\xad\x34\x0a\xdc\x5f\x4d\xa7\xf8\x7b\xf5\
+\x87\x1f\x08\x75\x53\x91\x03\x43\xc8\xa6\x45\x8b\xfa\x99\xdc\x3c\
+\x1c\x8e\x51\x2c\xda\x4c\xd9\x0c\x02\x67\xb4\x6c\x92\x00\x1c\x36\
+\x2d\x68\xab\x26\xd9\x6b\xe4\x2c\x46\x0b\x04\xe5\x42\xc9\x86\x1a\
+\x92\xf0\x27\xaa\x99\xb4\x8d\xf6\xde\x63\xc5\xd0\x0c\x55\x68\x06\
+\x01\x5f\x31\x50\x51\xb3\xa7\x52\xe4\xa1\x1f\x30\xf6\x08\x7e\x82\
+\xd6\x86\xf1\x55\x1f\x99\x06\xd5\x94\x43\x2a\x10\x04\x46\x18\x7f\
+\x3c\x03\x51\xac\xb8\x1f\x9e\x69\xf3\x6c\xea\x86\xc4\x5e\xd7\xb6\
+\xe9\x34\x38\xf5\xa6\xf4\xec\x0a\x92\x17\x0a\xcc\x1b\x6f\xbc\x31\
+\xfd\xe5\x2f\x7f\xe1\xa8\x57\xde\x46\x1a\x5f\x1d\x3e\x31\xff\xc5\
+\xcc\x9b\xb3\x20\xcd\x9f\xbf\x80\xc1\xd0\x9f\x5a\x11\xf4\xbc\x42\
+\xad\x55\x62\x04\xfd\x6e\x95\x55\x56\xa1\x5b\x6e\xb9\x85\x83\xd1\
+\x14\x0c\xa1\xa5\xce\x98\x71\x2e\x83\x61\x99\xb9\xad\xef\x10\x39\
+\x5b\xff\x2f\x70\xf7\xc3\xea\xd7\xdf\xca\x71\xe5\xa7\x02\x0c\x65\
+\x28\x62\x5f\x0b\x85\x9c\xc7\x89\x68\x42\xb1\x85\x5e\x6a\xc8\xe2\
+\x26\x62\x0e\x93\x9e\xb5\x41\xeb\xf0\x4f\x42\xf9\xca\xf8\x19\xc1\
+\x46\xc3\x51\x9d\x02\x46\x7e\x5f\x9d\xfe\x4e\x2e\xca\x1c\xc9\x59\
+\xc3\x3f\x41\x10\x0e\x30\x1c\xde\x42\xd1\xe0\x84\x60\x5a\x03\x63\
+\xec\xb3\x3c\xbf\x90\x09\xdf\x29\x06\xc6\xac\x19\x9a\x58\x4a\x7f\
+\xb6\x23\xee\x07\x8d\x18\xc9\xf3\x68\x44\x38\x14\x12\x81\x94\x4a\
+\x5a\xa5\xfc\x4c\xe3\x74\xd3\x30\xac\xa9\x62\x26\x05\x70\x72\xef\
+\x18\x46\x11\x24\xd6\x23\xa7\xb0\xd0\x81\xf3\x83\x84\x64\x79\xcb\
+\x4c\xc1\x50\xdf\xcc\x07\x86\x28\x88\x9c\x21\x5a\xc8\x60\xd8\xc3\
+\x09\xf5\x91\x68\x33\x81\xf4\x07\xfe\x5f\x8e\xce\x23\x13\x41\x6a\
+\xc8\xb5\x75\xc7\xcf\x26\x54\xde\xfd\x4b\xb5\x8e\x28\x38\x6c\x59\
+\x33\x04\x18\x66\x99\xac\x7c\xc2\xd8\xe5\xef\x33\xd4\x7e\x52\x9f\
+\xac\xbf\x5f\xfd\xfe\x43\xbf\x99\x51\x01\x4d\xdf\x97\x57\x54\x0c\
+\x29\x02\x92\x56\x53\x78\x0d\xc8\x53\x4b\x7d\x67\xb7\xab\xd4\x58\
+\x16\x03\x07\xf8\xab\x01\x90\x9a\x5b\x67\xdf\x43\x81\x1b\x9f\x41\
+\x82\x3f\x08\x7c\x82\xbe\x57\x30\x84\x99\x14\x79\x7c\x30\xe5\xda\
+\x9b\x01\x80\x20\x52\x1d\xbe\xfb\xdd\xef\x1a\xcd\x50\x22\x8e\x41\
+\x56\x00\x33\x29\x72\x6a\x0b\xad\xdb\xf2\xe6\xf7\xf0\x7e\x46\x7f\
+\x20\x40\x0d\x9a\xe1\xf7\xbf\xff\x3d\xb6\x62\x89\xdb\x81\xe8\x82\
+\x0b\x2e\x62\xed\xb0\x8c\x94\x9e\xa5\x44\xce\x36\x44\xf4\x7a\x25\
+\xed\x58\x59\xcf\xfd\x14\x81\x21\x86\x28\xfa\xbd\x50\xc8\x45\x6e\
+\x4c\x2c\x68\x72\x17\x1d\x50\x53\xca\x89\x85\x01\x78\x38\x53\xc2\
+\x35\xe9\xbf\x5f\x2e\xc5\xde\xec\x02\x19\xc9\x50\x12\xa9\x10\xd8\
+\x15\x03\x41\xfd\x7b\x8e\x87\xd4\x13\x1e\x65\x72\x3e\xe8\xf3\x6a\
+\x9b\xa0\x12\x48\x92\x88\x27\x98\x82\x0e\x29\x17\x38\xa0\xf1\xaa\
+\xb9\x94\x4b\x56\xf1\x1f\x0b\xfb\xe6\x24\x01\x7f\x90\x37\x06\x00\
+\x09\x7c\x8e\x19\x33\x8a\x1e\x7e\xf8\x51\xda\x78\xe3\x8d\x28\x95\
+\xca\xb0\x8f\x05\x07\x04\x2c\x17\x25\x36\xbf\xd7\xc5\x4c\xca\x38\
+\xa8\x25\xb5\x24\xcb\x5e\x0b\xf3\xa2\xc5\x08\x9a\x59\xb0\x68\x90\
+\x96\x2d\xeb\xe1\xb4\x99\x68\x24\xc1\xbb\x7a\x68\xe1\x68\xfb\x60\
+\x72\xc8\xf3\x61\xda\x11\xb1\x18\x77\xd9\x75\x87\x0d\x18\x0a\x27\
+\xa9\x68\x86\x48\xad\x18\xa2\xf1\xe3\xdb\x69\x9f\xdd\x76\x5a\xae\
+\xd1\xa4\x36\x08\xda\x41\x4a\x3a\x2f\x54\x73\x52\x10\xf4\x83\x61\
+\x0e\xf4\x65\x53\xa7\x9a\xb1\x06\x38\xe1\x53\x37\x2f\xba\x16\x6c\
+\x93\x69\xd0\xfc\x0b\xda\xf4\xd8\x04\x0e\xca\xf8\x83\x79\xa1\x66\
+\x5a\xbd\x5e\x9f\xad\x40\xa8\x9a\x7b\x90\xb9\x36\x48\x1e\x04\x7d\
+\xaf\xef\x87\xe7\x21\x30\x0c\xf9\xa8\xe8\x13\x3b\x15\x65\xaf\xbd\
+\xf6\xa2\x1b\x6e\xb8\x81\x46\x8d\x6a\xf3\x7c\x87\x48\xad\x80\x19\
+\xb3\xde\x9a\x21\xfa\x68\xf2\xe4\xc9\x0c\x86\x9b\x6f\xbe\x29\xaf\
+\xaf\x58\x0c\x3e\x70\xa2\x8b\x2f\xbe\x94\x66\xcc\x98\xc1\x9b\x08\
+\x7f\xbf\x59\xe3\x94\x26\x72\xb6\x25\xa2\xd2\xd4\x38\x41\x03\xbb\
+\x12\x7d\xff\x29\x03\x43\x50\x5f\x25\x7e\x98\xcd\xa6\xe7\x60\x8c\
+\x34\x19\xd8\xcf\x15\xe9\xdf\xad\x6a\x50\x47\xe5\xe3\xaa\x3a\x5e\
+\xee\xca\xea\xcc\xa4\x2c\x7e\xca\x7c\x7c\x3e\xdc\x32\x3d\x5b\x99\
+\x57\x96\x77\x5a\x61\x78\xf5\x27\xda\xa3\xcf\xd4\x24\x0a\xe1\xb0\
+\xca\xc4\x49\x86\x5a\x2d\xca\x20\x87\xc0\x81\xf5\xd7\x5f\x8f\x10\
+\x86\xbf\xe1\xd7\xbf\x52\xde\xa3\x6b\x3c\x8b\xcb\x34\x66\x89\x98\
+\x98\x47\xcb\x0d\x86\x89\x22\x51\x22\x64\x89\xf4\xf4\x65\x39\x9a\
+\x34\x85\x08\x40\x94\xc4\x8a\x00\xd0\x0c\xa1\x41\x9e\x0f\x56\x96\
+\x8d\x1d\x34\xe4\x68\x70\x90\x0b\x72\x6e\xa5\x58\x4b\x73\x55\x8c\
+\xd6\x96\x18\xed\xbd\xdb\x76\x9c\x74\xaf\xbe\x35\x05\x24\x3f\xe8\
+\xd4\xf8\x8a\xa6\x5d\xda\x3e\x44\xbd\x9a\xd4\x9a\x88\x68\x47\x6a\
+\x8e\xd6\xe7\xc0\xdf\x06\x93\xa3\x9a\xa3\x35\x35\xc4\x8e\xec\x15\
+\xa0\x2b\x2e\x2a\x0a\x6d\x06\xeb\xf1\x1e\x95\xdc\x43\xcb\x3b\xd9\
+\xa0\xa7\xe9\x3a\x48\x77\xd0\xda\x8a\xea\x9b\x46\x4a\xc3\x3f\xff\
+\xf9\x4f\xaf\x62\x43\x31\x4d\xb9\x92\x36\xc8\x9c\xd0\x1c\x5f\x35\
+\x85\xca\xea\x43\x1f\x6e\xb1\xc5\x16\xf4\xf0\xc3\x0f\x73\x20\x8d\
+\xfa\x0e\xb1\x0e\x7e\xf8\xc3\x1f\xd2\x0b\x2f\xbc\x50\xf2\x51\xe5\
+\x80\xb1\x44\xad\x46\x3c\x6d\x1d\xbe\x78\x98\x48\xa1\x8d\x22\xd0\
+\x4d\x41\x1a\x11\xdc\x08\xd8\xe9\xee\xee\xe6\xf9\x51\x58\x73\x0e\
+\xed\x4c\x94\x9d\x5b\xe9\xfb\xaf\xcc\xe7\x7f\xea\xc0\x50\x40\xb0\
+\x79\x9f\x54\x2a\x79\x3b\x7e\xfe\x7f\xed\x5d\x09\xb4\x1c\x55\x99\
+\xfe\xaa\x7a\x79\x4b\x76\x96\xc4\x19\x13\x01\x07\x24\x01\x42\x08\
+\x44\xc0\x41\x0f\xdb\xb0\x29\x01\x46\x94\x11\x44\x11\x81\x40\x10\
+\xc2\x08\x0e\x20\xe8\x28\x33\x2e\xe0\x20\x2e\x04\x08\x41\x01\x45\
+\x61\xd4\xa0\x43\x38\x32\x20\x18\xf1\x00\x11\x39\xa8\x8c\x70\x66\
+\x9c\x01\x14\xd9\x93\xbc\x60\x16\xde\xda\xdd\x55\x93\xef\xde\xfe\
+\xfb\xdd\x57\xa9\xee\xaa\xee\xea\x7e\xaf\x97\x5b\xe7\xbc\xd3\xaf\
+\xbb\x6e\xdd\xfa\xef\x7f\x97\xef\xfe\xff\xfd\x17\xed\x16\xa0\xcf\
+\x85\xc3\x06\x9c\x0c\xee\xa4\x67\x0e\xad\x3c\x48\xe2\xd2\x2e\xaa\
+\x22\x51\x8b\xc9\x66\x63\xf7\xdd\x77\xc7\xdd\x3f\x5a\xa5\x7c\x05\
+\xb9\x18\xf3\x73\xe3\xc6\x8d\x6a\x22\xee\xb7\x70\x41\xdc\xea\x13\
+\x95\xa3\xca\x73\xcb\x96\x61\xf4\x0f\x50\x3a\xd5\xc1\xb5\x73\xcc\
+\xb3\x48\xf7\x12\xf5\x3f\xcf\xf7\xf2\x18\x1a\xa6\x54\xca\x14\x5d\
+\xda\x92\x95\x20\x40\x49\x4f\x19\x10\x95\x14\xd8\xda\x5a\x58\x1b\
+\x3d\x69\xb0\xc9\x31\x02\x0d\x55\xa4\x2a\x4c\x5d\x20\x6b\xc5\xe4\
+\x34\x4e\x3b\xf9\xb8\x86\x82\xa1\x48\x4b\x72\xce\xba\x3d\xb3\xf4\
+\x66\x8a\x16\x99\xbb\xed\xb6\x9b\x3a\x6f\x63\x5f\x50\x72\xa1\xaa\
+\x9a\x46\x1f\xe2\x9f\x16\xae\x52\x2c\x7f\xe6\xdc\x0c\x60\x68\xb6\
+\x97\x6d\x92\x00\x00\x54\xc1\xd3\xc1\x9c\x86\x2d\xec\x4f\xde\xa3\
+\x44\x74\xd7\x5d\x77\x29\x7f\x40\xce\x79\x09\x00\x6e\xd6\x11\x07\
+\x7c\xca\x0d\x48\x53\xf2\x16\xde\xf0\x93\x01\x24\x08\x86\xd9\x2c\
+\xd5\xcb\x79\x35\x56\x68\x10\xc4\x70\x69\x41\xa7\xfb\x60\xdd\xb5\
+\xd2\xc3\xf6\xd2\x57\x97\xea\x58\xf1\xd5\xe5\xd9\x6e\xe5\xfa\x9c\
+\x53\x81\x82\x4e\xaf\xd1\x41\x57\x47\x82\x21\xfb\x37\x95\xca\x9c\
+\x59\x28\x14\x6e\x35\xcf\x42\xc2\x00\xb1\x82\x1a\xa1\x83\x86\x49\
+\xbc\xa6\x8a\x54\x21\x3b\x4d\xd9\x99\xd3\xa9\x7e\xcd\x9a\x87\xd4\
+\xa4\xe4\x39\x85\x4c\x4a\x51\x7f\x8a\x61\x41\xbc\xb7\xd4\x56\x8a\
+\xd1\xe0\x36\x6c\xd8\x8a\x8d\x6f\x6c\xd2\x86\x3a\x19\x9d\x75\x82\
+\x06\x32\x8c\x61\xee\x66\x68\x69\xc7\xf3\x3e\xad\xce\x76\x5c\xed\
+\xe6\xa1\x25\xb7\x02\x52\x4a\xc2\x32\x24\x7d\x05\x86\x2c\xab\xa7\
+\x50\x69\x57\x4e\xab\x1b\x05\x86\xfa\xec\x90\xbf\x4f\x99\xdc\x85\
+\x0f\x2c\x3e\xb2\xa1\x60\x68\x72\x45\x54\x84\xda\xfa\x55\xe8\xd4\
+\x3e\x9c\xcc\x11\x49\xb5\x1c\xa5\x41\x51\xf1\x32\x2a\x0a\x0d\x2a\
+\x44\x8a\x34\x13\xe6\xca\x6f\x3a\x00\x7d\xb8\x8e\xa1\x19\xc0\x30\
+\x4c\x8d\x4b\x9e\x30\xfb\xc9\xa3\x8f\x3e\x8a\xd9\xb3\xff\x5a\xa9\
+\xbd\xf5\xf8\xeb\xc2\x4f\x7e\x72\x0f\xce\x3a\xeb\xac\x92\x75\x6a\
+\xbd\x24\x43\xe9\x87\x20\x20\x72\x83\x71\xcc\x31\xc7\xe0\xfe\xfb\
+\xef\x1b\x33\x80\x37\x6f\xde\xaa\xfa\x23\x29\x18\x9a\x7d\x20\x21\
+\xf3\x08\xb6\x94\x08\xe5\x7c\x5b\x36\xf4\x14\x00\x64\xc3\xc0\x71\
+\x20\x1a\x03\x4d\x98\xf3\x71\xa0\x10\x1d\xdf\xae\xb6\x69\xd8\xd4\
+\x4f\x75\x2c\x18\xb2\x57\xba\xba\x7a\xcf\x1d\x1e\x1e\x5a\x21\x8b\
+\x59\x39\x95\x55\x33\x4c\xf6\xa6\x1e\x45\x45\xe2\xe4\x8c\x48\x4c\
+\xc9\x65\x51\x5e\xb0\x60\x3e\x1e\x7a\xe8\x67\x98\x31\x63\x9a\x3a\
+\x2b\xa1\x04\xe5\x3a\xda\x1f\x8f\x9f\xb5\x9c\xa2\x46\x9d\xb2\x8e\
+\xbd\xef\xaa\xb0\x72\xaf\xaf\x1b\x50\x12\x29\x41\x2f\xcd\x90\x7a\
+\x4e\x0a\x79\x06\x15\x20\x00\xa6\x5c\x4d\x0b\x9d\xe9\x99\x7f\x52\
+\x05\x4f\x18\x4d\xfc\xab\x7d\x44\xcb\x83\xa1\x5e\x70\x1c\xe4\x3d\
+\x5a\x9a\xea\x33\x43\x7e\x12\x90\x98\xc2\xe9\x94\x93\x8e\x1d\x37\
+\x30\x0c\x1f\x2b\x5a\x32\xa4\x43\x38\xd5\x66\xe6\x45\x63\x0a\x86\
+\x50\x93\x79\x20\x8b\xa6\x39\xee\x45\x25\x5c\x4e\x7b\x52\xab\xe4\
+\x52\xef\x71\x2d\xda\x09\x2e\xf6\x04\x3e\x46\x32\x62\xdc\xcf\xd9\
+\xb3\x67\xab\xfc\x81\xfd\xfd\x03\x4a\x1b\xc4\x18\xa1\xe7\x9c\x73\
+\x8e\xda\x14\x84\x49\xc2\xd5\xb6\x27\x6c\x8d\x30\x55\xa6\x7c\x07\
+\x53\x35\xad\x5e\xbd\xba\x94\xe1\x83\x91\x7b\x06\x06\x86\xd4\xef\
+\x49\xb3\x56\xc8\x46\x54\xd6\x30\x79\xb7\xb8\x30\x71\xe3\x29\x2a\
+\x64\xf3\xcc\xd5\x04\x6f\xdf\xf7\xcf\x03\xbc\x9b\xeb\xdd\x27\xad\
+\x52\x5f\x47\x83\xa1\x06\xc4\x9e\x0b\xf2\xf9\xfc\xf5\x32\xf8\x1b\
+\x71\x86\xd3\x2a\x83\x21\x29\x9d\xa2\x1e\x35\xd5\xa5\xac\x73\x9f\
+\x7d\xf6\xc2\x03\x0f\xde\x87\x59\x33\x67\x2a\x49\x8a\x06\x38\x29\
+\x27\x8d\x91\xfc\xb0\x0a\x6c\xdd\xd5\xa5\x53\x4f\x95\xcb\xda\x91\
+\xfc\xf7\xb4\xb2\x0c\xed\xdb\x30\xa4\xc2\x5f\x15\x08\x86\xca\xe7\
+\x8a\x01\x76\x28\x31\x31\xdc\x5a\xd1\xea\xd7\x75\x54\x64\x99\x7c\
+\x31\x2b\x47\xc9\x10\xa3\x14\x07\x76\x34\x15\x57\x50\x9a\x50\x8e\
+\xe0\x85\x11\x2d\x49\xaa\x0c\x22\x05\x62\xab\x92\x0c\x3f\x78\xd2\
+\x31\xf8\xf5\xe3\x8f\x35\xec\xcc\x30\x48\x4b\xf0\xec\x8a\xf1\x30\
+\xb9\x20\x33\xa3\xfa\xde\x7b\xef\xad\xce\xcb\x45\x9a\xbd\xe6\x9a\
+\x6b\x54\xbc\xca\x51\x7f\xc9\xa2\x81\x54\x51\x32\xd6\xc6\x32\xc5\
+\x40\xf1\x31\x53\xfe\x24\x1d\x4b\xb5\x3e\x2f\x63\x50\x24\x1f\x82\
+\x21\x43\x9d\xf1\xfc\x8c\x46\x4e\x43\x43\x23\x6a\xbc\x7d\xff\xfb\
+\x77\x62\xc9\x92\x25\xc5\xcc\x23\x0c\xb8\x1e\x08\xd3\x17\x23\xad\
+\x51\x50\x1a\xaf\x74\xcc\xc2\x7b\x04\xbd\x3b\xef\xbc\x53\x81\x31\
+\x37\x4e\x04\xe6\xe7\x9e\x7b\x0e\xe7\x9e\x7b\xee\x76\x7e\x86\xc1\
+\xf6\xc7\x01\x67\xf6\xb9\xcc\xbd\xb0\xf2\xa2\x29\x60\x5b\x65\x03\
+\x20\xae\x30\x83\x83\x83\x17\x02\xde\xf2\x5a\xf9\xde\x0e\xcf\x75\
+\x3c\x18\xea\x4e\x74\x97\xa5\x52\xa9\x6f\x08\x10\xc6\x19\x78\xed\
+\xd0\xf9\x8d\x6a\xc3\xd8\xf8\x9c\xbe\x8a\xc7\xb8\xe6\xe1\x9f\x63\
+\xfa\xb4\xa9\xea\x95\x9e\xef\xc1\x8d\x08\x32\x50\x5f\xda\xd2\xc8\
+\x0d\x03\x1b\xff\x92\x57\xf9\x08\xc5\x38\x24\xcf\x33\x43\x25\xd1\
+\xa5\x8b\xa1\xd7\x54\x8c\x19\x4d\x63\xd1\x18\x82\xd2\xa2\x0a\xfe\
+\xe3\xd1\x85\x20\x4c\x32\xd4\x94\x2a\xd0\x4c\xd1\xd8\x86\x69\x9d\
+\xb4\x1b\x86\x56\x93\x32\xd3\x7d\x06\x1f\x3c\xe9\xb8\x86\x83\xa1\
+\x00\x62\x09\xc0\x8b\x2a\x52\x7e\x1f\x1c\xec\x57\x6a\xea\x9f\xfe\
+\xf4\xa7\x38\xe0\x80\x03\x94\x31\x93\x9c\x2f\x32\x83\x01\xe3\x55\
+\xf2\x32\xa5\x24\x51\x73\x2b\x49\xd9\x50\x93\x36\xe3\x86\xd1\x3c\
+\x9b\x33\xe7\xef\xdb\xdf\xfe\x76\xe5\xb6\x30\x67\xce\x6c\x95\xd3\
+\x8f\x2a\x60\x6e\x04\x98\x71\xfe\xbc\xf3\xce\x03\xd3\x40\x85\xb9\
+\x65\x54\xbb\x06\x54\xd2\x1e\x99\xfd\x71\xd4\x51\x34\xd0\xd4\x16\
+\xd3\xe4\x35\xef\xd1\xe1\x9e\xe7\x78\x95\xae\xb8\xf4\xc8\x26\xc8\
+\x0c\x06\x21\x2e\x1e\xe2\x74\x5f\x8a\x46\x35\x6a\x05\x7f\x11\xe0\
+\x7d\xb3\xbe\x73\xae\xf5\x6a\xb3\x60\x58\xec\x33\xd7\xcd\x2c\x03\
+\xfc\x12\x20\xb6\x5e\x57\x4e\x2c\xc5\xe6\x62\x20\xea\x52\x7e\xf2\
+\x62\x3a\xa6\xb5\x8f\x3f\x06\x97\x66\x9b\x0c\x63\x31\x34\xa8\xdc\
+\x14\xd2\xa9\x34\x46\x72\x94\xa4\x7c\xe5\xb6\xd1\xc8\x8b\x01\x80\
+\xfa\x36\x7a\xd8\xb4\x69\xcb\x68\xba\x2b\x59\xe0\x8b\x52\x8f\x64\
+\xad\xd0\x0b\x4a\x31\x0c\x9b\x42\x3a\x0f\x5e\x81\x29\xa8\xc6\x5a\
+\x07\x9b\xd2\x18\x93\x18\xcb\x39\xa1\x06\x43\xe6\x33\xcc\xa9\xc5\
+\x6e\xca\xa4\x2e\x9c\x7a\xca\x89\x0d\x05\x43\x51\x7d\x95\xdb\xd0\
+\x91\x26\x86\x4f\xa3\x7a\x90\x59\x12\x78\xc9\x99\x2d\x63\x89\x9a\
+\x92\xa1\x9c\x31\x89\x94\xa1\xcb\x65\x4b\x59\x20\x9a\x11\x0c\xcd\
+\xb1\x23\x9b\x31\x82\xde\xae\xbb\xee\xaa\xda\x46\xc9\x90\x3c\xa2\
+\xc4\x48\x00\x64\xea\x29\x49\x70\x6b\x1a\xd1\x49\x3d\x71\xc1\x27\
+\xee\x98\x15\x17\x90\xa0\xcf\x65\x58\xb0\x80\xb0\x3a\xa3\xe8\x91\
+\x40\xea\x66\x0c\x58\x01\xf9\xb0\x67\x79\xaf\x08\x8e\x17\xe5\x72\
+\xc3\x1d\x0f\x84\x6a\x9a\xc7\xed\xcc\x4e\x28\xe7\xba\x99\x0b\x7c\
+\xdf\x2b\xa9\x4c\x3b\xa1\xcd\xf5\x6a\xa3\x58\x22\x8a\xdf\x99\xe9\
+\x8b\xb7\x70\xff\xfd\xf1\xb3\x9f\xaf\x41\x4f\x77\x2f\x32\x19\x1d\
+\xbb\x95\x92\x46\xa2\xa0\x32\x55\x10\xae\xe2\xf7\x14\x80\xf5\xeb\
+\x0a\x25\xff\x2f\xc9\xf5\xc8\x60\xdc\x04\xac\x92\xe4\x53\x0c\xad\
+\x27\x61\xd7\xa8\x46\x25\xa8\xa5\x55\x00\x9c\x72\x60\xe8\xa1\xa7\
+\xab\xbb\x74\x4e\xa8\x5c\x2b\xd2\x74\x65\xd0\x60\x38\xb9\xb7\x0b\
+\xef\x3b\xf6\x88\x86\x82\xa1\x48\xa7\x5c\xec\x69\xa0\xc4\xc5\x97\
+\x8b\xbc\xc4\x91\x15\x69\x95\xc1\xae\x79\x66\xc8\xf3\x34\x89\x1c\
+\x73\xfd\xf5\xd7\xab\xc0\xda\x5c\x1c\x65\x03\xc3\xfe\xa3\xf1\x05\
+\xad\x10\x29\xb5\x68\xff\x50\x2d\x49\x37\x2b\x18\x06\x23\xdd\xc8\
+\x77\xfa\xdb\xd1\x82\x54\xac\xc6\x09\x1c\xfc\xa3\x2f\x20\x79\xd4\
+\xdf\xdf\x9f\x30\xab\xcd\xd8\xc1\x28\x9b\xa4\x72\x20\xc4\xfb\xe4\
+\x2f\x25\x75\x02\xb3\xf4\x5d\x52\xc9\x70\xd4\xd8\x49\xab\x7c\x4d\
+\x3a\xca\x04\x3e\xe8\x78\xd5\xa8\xc9\x73\x0b\x86\x81\x11\x98\xc9\
+\x64\xce\xcd\xe5\x0a\x2b\x64\x51\x10\xc7\x5e\x2e\x0c\xe2\x16\xc0\
+\x49\x25\x8b\xbf\xb9\x30\x04\x27\x01\x17\x22\x3e\x17\x37\x18\x6e\
+\xd4\xfa\x2e\x6a\x2b\x89\x1c\x21\xf5\x06\x93\xa7\xca\x7b\x59\x1f\
+\x17\x04\x91\x02\xcc\xfa\xa3\x76\x9a\x51\xb4\x04\xef\x8b\x2a\xc8\
+\x8c\x5b\x29\x3e\x5d\xfb\xcc\x5f\x80\x87\xd6\x3c\x82\xde\x49\x5a\
+\xfa\x63\x06\x20\x01\x42\xf9\x3f\x78\x44\x13\xfc\x5e\x26\xd4\x6a\
+\x89\x8c\x8a\xf7\x19\x61\x66\x18\xe8\x1f\xa4\x3f\xe1\x70\x31\x74\
+\x9c\x8e\x29\x2a\x86\x21\xf9\x62\x5a\xa2\xd1\xfd\xa1\xe9\x4a\xc0\
+\xe8\x40\x79\xe5\x33\xc8\x48\x3f\xe2\x70\xae\xda\xe7\xeb\x3c\x7e\
+\x3d\xbd\x5d\x78\xec\xb1\x47\xd0\xd3\x95\xc5\xe6\xcd\x7f\xc1\x8c\
+\x1d\xa6\xa0\xaf\x6f\x83\x2a\xbb\xf3\x4e\x3b\xe0\x9f\x2e\x59\x86\
+\xbe\x0d\xeb\x4a\x8b\x9f\xb9\x79\xa8\xc5\x40\x2b\x78\x46\x68\xf6\
+\xe7\x87\x3f\xfc\x61\x65\x29\xc9\x71\xc0\x36\x52\x22\xa4\x9a\x94\
+\x17\x43\xdf\x99\x01\xd0\x09\x88\x3c\x47\x7d\xfe\xf9\xe7\x55\x79\
+\xde\xa3\xb9\x3f\x41\x95\x40\xc8\x40\xcf\x0c\xe9\x95\x4a\x65\x54\
+\x5b\xea\x3d\x6e\xaa\x1d\x67\x71\xca\x9b\xe7\xa5\xc2\x27\xf3\x4c\
+\x30\x0c\xcc\x83\xfc\x0c\xbe\x27\x69\xbb\xe3\xd4\x6f\xce\x5b\x82\
+\x34\x69\x16\xab\x5f\xd2\x23\xf3\x9d\x75\xb1\x2c\xd7\xa1\x32\x20\
+\x57\x96\x4d\xc6\x5a\xd4\xd1\xc6\x32\x61\x0c\xb2\x60\x18\x3a\x6c\
+\x52\x67\x02\xfe\xad\xbc\x25\x03\x54\x06\x9d\x38\x4d\xcb\xa0\x92\
+\x4f\x96\xd3\x91\x53\x1a\xb3\x60\xc8\x7b\x85\x5c\xee\xfe\xb9\x70\
+\x71\xc1\x12\x3a\x4d\x8b\xb1\xb0\xf3\x81\x46\x82\xa1\x39\x59\x4d\
+\xde\xf0\xf7\xbd\xf7\x59\x80\xef\x7e\x7f\x15\x7a\x26\x4d\x43\x0a\
+\x29\xe4\xbc\x1c\x32\x6e\x06\x1e\xd5\x8f\x39\x0f\x4e\xda\x61\x2c\
+\x70\xf5\xdd\x55\x09\x91\xf5\x67\x01\x85\xd2\xf7\xb0\xfb\x66\xf9\
+\x34\xad\x53\x03\xcf\x97\xbe\x6b\xdf\x52\x8c\x0c\xe7\x95\x44\x24\
+\x06\x21\x3a\xde\x69\x31\x27\x61\x09\x4d\x65\x4a\x8c\x05\x43\xdf\
+\x29\x8c\x01\x43\x2e\x48\x2a\x15\x0f\x53\x5d\x79\x39\xbc\xf1\x46\
+\x1f\x2e\xbe\xf8\x93\x78\xe5\xa5\x3f\x63\x60\xe0\x4d\x4c\x9f\x31\
+\x05\xb9\xdc\xb0\x5a\xac\x72\x23\x03\x18\xec\x7f\x13\x03\xfd\x5b\
+\x4b\x67\x72\xe6\x22\x16\xec\xdb\xb8\x0b\xbe\x59\x4e\xea\xe0\x98\
+\xe0\xf9\xdf\x95\x57\x5e\xa1\x9c\xff\x79\x51\xea\x55\xe1\xe2\x94\
+\xba\x33\x5d\xf2\xc1\x13\x49\x42\x97\xa1\x91\xcc\xd8\xe8\x32\x94\
+\x98\x68\x65\x7a\xed\xb5\xd7\x22\x93\xd1\x09\x7c\xa3\xc2\x9a\xc5\
+\xa1\xbd\xd1\x65\x04\x0c\xf9\x9e\x72\x9b\x86\x20\x20\xc6\x01\xab\
+\x24\x74\xc7\xa9\xdf\x0c\x78\x60\xbe\x4b\x54\x9a\xfc\x2d\x18\x42\
+\x2d\x38\xcf\xcb\xd1\x38\x76\x43\xde\xb9\xee\x13\x95\xfa\xd0\x82\
+\x61\x19\xee\x4c\x9e\x3c\xf9\x43\x6f\xbe\x39\x70\x17\x07\xa2\x04\
+\x06\x96\xa2\x72\x38\xcd\xc5\x25\x2c\x08\x31\x07\xa8\x56\xbd\x31\
+\x9b\x75\x5a\x2d\x20\x51\xe1\xa0\xa2\x26\x9a\xb9\x6b\x8c\x2a\x2b\
+\xf7\xf9\x8c\x19\x1c\xbb\xd1\x60\x18\x66\x4d\xca\x45\x67\xaf\xbd\
+\xf6\xc3\xb7\x6e\xfb\x21\x7a\x26\x4f\x53\x56\xa4\xb4\x26\x4d\x13\
+\x0c\x09\x77\x04\x43\x26\xf6\x50\xb1\x55\x99\xb4\x58\x7f\x32\x85\
+\x46\xa5\xef\x51\xe5\xc7\xde\xd7\x9b\x1a\x33\x64\x18\x25\x1d\xa1\
+\x57\x2d\x8c\x4c\xd9\x31\xe6\x32\xbf\xfb\x9a\x46\x06\x92\x15\xc9\
+\xd0\xf1\xb5\x4a\xd1\xd3\x01\xba\xbd\xdc\x08\x8e\x38\xf2\x70\xac\
+\x7f\xed\xc5\x62\xd4\x75\x6d\x70\x93\xca\xa6\x51\xa0\x58\x6a\x44\
+\x10\x32\xa5\x42\xbe\x32\x4e\x20\xeb\x60\x9f\x07\x17\x57\x59\x48\
+\xd9\x26\x3a\x99\x5f\x72\xc9\x27\x4b\xb9\x17\xb5\xb4\xae\x6b\x30\
+\xfb\x88\xdf\xb9\x81\x93\xf7\xf3\x93\xe3\x45\x24\x7a\x4a\x1e\x4c\
+\xf7\x73\xdd\x75\xd7\x81\x6a\x65\x31\xb8\x09\x73\xbd\x88\x3b\x26\
+\xc7\xa3\x9c\xf0\xc6\xe4\x91\xf9\xbf\x48\x79\xd5\x48\x7b\xd5\x94\
+\x0d\x6b\xa3\xb9\xf1\x08\xbb\x2f\xeb\x05\xdf\x23\x5a\x16\x6d\xb8\
+\x34\xd6\xca\xd5\x3c\x1b\x0c\x6a\x84\xa2\x78\x4b\x1a\xba\xba\x32\
+\xa7\x0e\x0e\x0e\x76\x9c\x43\x7d\x14\x6f\xd4\xc6\x29\x4e\xa1\x4e\
+\x2d\xd3\xdb\x3b\xe5\xf8\xc1\xc1\x81\x1f\xfb\xbe\x5f\x0c\xe0\x35\
+\xba\xa0\x88\xde\x5f\x06\xa4\xa9\x12\x35\xcf\x55\xea\xa5\x22\x95\
+\x3e\x90\xc9\xc0\x05\xce\x94\x4a\xa9\x8e\xe5\x62\xc6\xdf\x78\x3e\
+\x12\xb5\x78\x26\x9d\xdc\xe5\x26\xbc\x79\x66\x28\xea\xbf\x79\xf3\
+\x16\x60\xe5\x6d\x3f\xc2\xa4\xc9\x3b\x94\xd4\xcb\xb2\x78\x73\x31\
+\x16\x13\xff\x60\x9d\xd5\xd0\x18\x15\x21\x48\x07\xce\xd6\xe7\x5d\
+\xa6\x81\x4c\x29\x62\x4b\x29\x47\xe5\x76\x9c\xd3\x2e\x1f\xae\x5f\
+\xb4\x2a\xd5\x9b\x1c\xd7\xd1\x51\x66\xe8\x7f\xc8\xd4\x4d\x03\x6f\
+\x6e\xc5\x51\x47\x1d\x89\xc1\x81\x2d\x2a\xc2\xc8\x60\xff\x26\x05\
+\x80\xd9\xae\xac\xba\xef\x15\xd5\xb0\xe2\xf7\x65\x3a\x3a\x57\xab\
+\xea\x52\x13\x37\xa0\x17\x16\x63\x09\x8e\x01\xba\x4a\x2c\x5b\x76\
+\x21\x46\x46\x74\x4e\x3d\x5e\xa6\xe4\x67\xb6\x90\x6a\x38\x71\x43\
+\x60\x9f\x08\x38\x72\xf3\xc6\x7b\x94\x32\x97\x2f\x5f\xae\xd4\xa4\
+\x61\xe1\xdc\xaa\xe9\xa3\x46\xae\x23\x95\x24\x2f\x31\x08\x92\xf7\
+\x9b\x34\xcb\xff\x71\x24\xb7\x24\xf4\x47\xd5\xcf\xba\x83\xbc\x34\
+\xc1\x4e\x32\x81\x48\xee\x48\x73\x23\x1e\x47\xcd\xee\x38\x4e\xce\
+\x75\xd3\xef\x2f\x14\x86\x3b\x2a\xc4\x5a\x35\x7d\x66\xc1\x30\x82\
+\x5b\xdd\xdd\xdd\x87\x0e\x0d\x8d\xac\x62\xb6\x0b\x73\x70\xea\xf3\
+\x26\x1d\x87\x90\xff\x07\xd5\x17\x52\x96\x91\xea\xb9\xc0\x84\x01\
+\x54\x35\x1d\x25\x65\x65\x87\x29\x67\x81\x92\x3a\x29\x28\x5d\x70\
+\xd2\x70\xe1\x95\xa4\xb9\x41\xfa\x1a\xb1\x88\x05\x25\x43\x13\x0c\
+\xbf\xf5\x9d\xbb\x31\x69\xca\xce\x25\x30\x14\xe9\x88\x93\x9a\xe5\
+\xb4\xca\x72\xec\x65\xd2\x18\x05\x76\x95\x77\xde\x9e\x32\x68\x09\
+\xdb\x69\xab\xac\x1f\x0a\x20\xcb\xa4\x88\x22\x48\x52\x52\x2d\xf6\
+\xb3\x8f\x62\xfa\x26\xa6\xf8\x25\xcd\x3e\xa5\xfe\x11\xe4\x86\x87\
+\x70\xf4\xd1\x47\x60\xc3\xfa\xd7\x00\x2f\x87\xae\x6e\xfa\x31\x7a\
+\xf0\x8b\x79\x2c\xcd\x30\x69\x42\x6b\x12\x95\x63\x70\x71\x55\x3e\
+\x8e\x3c\xbb\xdc\xa6\x3e\xff\xe2\x17\xbf\x88\x65\xcb\x96\x95\x52\
+\x05\xe9\x8c\x05\xfa\x3e\xc7\x25\x2f\x01\x3d\xfe\xcf\x31\x22\xe7\
+\x88\x66\x34\x20\x6e\xb0\x2e\xbb\xec\x32\x05\x86\x94\x0c\x5b\x05\
+\x0c\x6b\x19\xdb\x51\x60\x55\x4b\x9d\xd5\xcc\x6f\xce\x57\xd2\xc0\
+\xfe\x91\xa3\x0f\x59\x43\x82\x9b\x25\xd9\x04\xd3\x48\x4a\x82\x6d\
+\x47\xcc\x8f\xbe\x74\x3a\xfb\x81\x7c\x7e\xa8\x63\x82\x6e\x57\xc3\
+\x7b\x29\x6b\xc1\x30\x06\xd7\x66\xce\x9c\xb9\xa0\xaf\xef\x8d\x1f\
+\x65\xb3\xd9\x3d\x24\xb3\x3b\x77\xd1\x02\x36\x74\x1d\x20\xe8\x89\
+\x01\x82\x2c\x76\x74\x70\xe6\xe2\x62\x9a\x3b\xc7\x78\x5d\x68\x11\
+\x39\x1b\x08\x9e\x49\x32\xe1\x29\xad\x03\x39\x59\x05\xf0\x48\xc7\
+\xb3\xcf\x3e\x0b\x26\xce\xe5\x25\xaa\x5a\xb3\xe2\x46\x4c\xee\x72\
+\x6a\xd2\xb9\x7b\xef\x87\x6f\xdf\xb6\x0a\xbd\x4a\x32\xa4\x21\x86\
+\x98\xea\x33\x70\xb4\x4e\x7f\x24\x11\x63\x74\x40\xe8\xd1\x24\x56\
+\xc1\xef\xe5\x22\xcf\x68\x30\x2b\x9f\x04\x4b\xc0\xd0\x6c\xb7\xda\
+\xc8\xa8\x14\x5b\xda\x9a\xb4\xd2\x45\x8b\x54\x25\x7d\x51\xb5\x4b\
+\xb5\xa3\x02\x43\x47\x99\xc6\xe6\xf3\xc3\xe8\xdf\xba\x19\x8b\x17\
+\xbf\x0f\x1b\x5e\x7f\x85\x50\x83\x8c\x4a\xe4\x9a\x47\x9e\x0e\x8e\
+\xea\xd9\xf4\x18\x95\x97\x6c\xa4\xc2\x8c\x39\xe2\x8c\x91\xe0\xe2\
+\x2d\x2a\x4e\xfe\xce\xb0\x5f\x07\x1d\x74\x50\xe9\x7c\x8f\xe3\x8f\
+\x12\x22\xc7\xe8\x29\xa7\x9c\xa2\xdc\x0c\x74\xa6\x0d\x4d\x13\x33\
+\x26\x3c\xf4\x10\xb3\x9b\x69\x90\x94\x18\xb2\xfc\x7e\xef\xbd\xf7\
+\xaa\x08\x2e\x72\x66\x68\x82\x7a\x1c\x89\x24\x4e\x5b\x9a\xa1\xcc\
+\x44\x83\x61\x90\x07\x5c\x53\xf6\xdd\x77\x5f\x65\xe9\x2a\x6e\x33\
+\x7d\x7d\x7d\x2a\xb4\x9c\x3a\x87\x2e\xfa\x4b\x8a\x85\x6c\x05\x1e\
+\x32\x1f\xe1\x07\x3b\x25\x0d\x53\x92\xb1\x64\xc1\x30\x26\xf7\x7a\
+\x7a\x7a\xe6\xe4\x72\x85\x1f\x16\x0a\x85\x83\xb9\x80\x71\x27\xc7\
+\x85\x81\x83\xf2\xfc\xf3\xcf\xc7\xf2\xe5\xd7\x2b\x83\x85\x7c\x5e\
+\x5b\x17\xbe\xf0\xc2\x0b\x58\xba\x74\xa9\x8a\x7e\x11\x95\xf8\x36\
+\x26\x09\x25\x29\x54\x54\x91\x9c\xc0\x47\x1f\x7d\x34\xe8\x34\x3d\
+\x6f\xde\x9e\xca\x65\x21\x9f\x2f\xa8\xf7\x7d\xf5\xab\x5f\xc5\xd5\
+\x57\x5f\xad\xaa\x66\x39\x01\x71\x79\x57\x23\xc0\x30\x68\x54\x24\
+\xd2\xde\xbc\x7d\x16\x62\xc5\xca\x3b\xd1\x3b\x65\x06\x21\x44\x01\
+\x4a\x3a\x95\x55\x12\x57\x21\xef\xeb\x00\xd7\x2a\x55\x22\x25\x29\
+\xc7\x48\xb5\x34\xfa\x9d\xf9\x14\x47\x53\x30\x49\x2a\xa6\xd1\x4f\
+\x79\x5e\x25\x3e\x2e\xa5\x6a\x32\xca\x29\x3e\x6c\x1f\x5b\x53\xfc\
+\x09\xbd\xbc\xce\x3c\x5e\xee\xa2\x33\xbe\x5a\xfc\x8b\x92\x21\xab\
+\x32\xc1\x30\x3f\x32\x84\x63\x8f\xfb\x3b\x0c\x0e\x6c\xc5\xc8\xd0\
+\x9b\xca\xcf\x50\xab\x47\x73\x45\xa3\x95\xed\xd1\x56\x16\xe0\x5a\
+\xfa\x22\x4c\x4d\x1a\xe2\x4c\x5d\x04\x62\x1d\x1a\x8e\x3e\x77\xb4\
+\x0e\x3d\xe4\x90\x43\xd4\xef\x7c\x2f\x9f\x59\xb9\x72\x25\x2e\xba\
+\xe8\xa2\x52\x59\xd9\x54\x49\x00\x6b\x6d\x59\xad\xad\x68\x93\x48\
+\xb3\x71\xc7\xf9\x44\x94\x9b\x68\x30\x14\x4d\x0f\xfb\x84\x79\x08\
+\xe9\x1b\xb9\x64\xc9\xd9\x2a\x62\x8e\x1c\x23\x3c\xfc\xf0\xc3\x38\
+\xfb\xec\xb3\xf1\xe2\x8b\x2f\x8e\xd9\x58\x95\x3f\x3b\x54\x19\xea\
+\x4f\xe9\x84\xc4\xbc\xf5\x18\x33\x16\x0c\xab\xe3\x62\x0f\xe0\xfc\
+\xc0\x71\xdc\xc5\xe2\xa8\xcb\x05\xe2\xc6\x1b\x6f\xc4\xd2\xa5\xe7\
+\xaa\x9a\x98\xf9\x20\x9b\x4d\x63\xfd\xfa\x3e\x95\xc1\x7a\xed\xda\
+\xb5\x25\x8b\xd4\xea\x5e\x35\xb6\xb4\x39\xe0\x8d\x10\x4a\x38\xf4\
+\xd0\x43\x55\x04\xfe\x9d\x77\xde\xb9\x94\x29\x9e\x92\xd6\xd7\xbe\
+\xf6\x0d\x5c\x72\xc9\x25\x6a\x57\xc9\xc5\x2d\x38\xd9\x6b\x59\x80\
+\x2b\xd1\x2f\xea\xe2\x70\xd7\x8a\xfd\x70\xd7\x0f\xee\x45\xf7\xe4\
+\xe9\x4a\xa2\x2a\xf8\x1e\x32\x74\xc0\x67\xe8\xb3\x82\x07\x37\x9d\
+\x52\x9f\x92\x9c\x58\x3e\x55\xb2\xe1\x62\xde\x41\x3e\x17\xbc\x6f\
+\x7e\xa7\x21\x4b\xe5\xfb\x34\xd4\x71\x91\x72\x74\x12\x64\x65\x05\
+\x4a\x35\x26\x73\x16\x16\xcd\xd6\xa3\xfa\x47\xa5\x74\x2a\x66\xb9\
+\x97\xf6\x3a\x45\x35\x29\x41\x6f\x9f\xf9\xf3\xd0\xbf\x65\x33\x9d\
+\x47\x8a\xa1\xe5\x74\x3c\x53\xad\xc2\xa6\x11\x8b\xf8\x34\x26\xb7\
+\x38\x2e\xd7\x9f\x92\x92\x89\xf7\x25\x6d\x11\x37\x6e\xcc\x25\xf9\
+\x96\xb7\xbc\x45\x45\xa0\x99\x3f\x7f\xbe\x02\x35\x8e\x5d\xd2\x46\
+\x6b\xd1\x4b\x2f\xbd\x3f\x9f\x51\x7d\x00\x00\x14\x0c\x49\x44\x41\
+\x54\xb4\x94\x7c\xd9\x34\xf6\xe2\xff\x62\x75\xdb\x28\x4b\xe9\x28\
+\xbe\x37\xe2\x7e\x14\xf8\x05\xdf\x99\x74\xbe\xc4\x79\x9f\x9c\xd9\
+\x52\xfd\xc9\x8d\xec\x05\x17\x9c\xaf\x36\xd7\xca\x6a\x99\x89\x05\
+\x7f\xf9\x88\x0a\xe9\x46\x69\x91\xfd\xcc\xbe\x29\xaf\x75\xf2\xef\
+\x05\xfc\x7f\x60\x8c\x8b\x46\xf0\xaf\x1d\xeb\xb4\x60\x58\x43\xaf\
+\x4e\x99\x32\x65\xe5\xd6\xad\x5b\xcf\xe1\xa0\xa5\x14\x46\xf3\xf3\
+\x2b\xaf\xbc\xb2\x74\xa6\x42\xe0\xfa\xe3\x1f\xff\x08\xfa\x7b\x31\
+\x1a\x3d\x27\x12\x07\x75\xd2\x8b\x0b\x97\xec\xce\xc5\x41\xfa\x9d\
+\xef\x7c\xa7\x8a\x77\x28\x51\xf9\x55\x14\x14\x0f\x6a\x81\xe3\xd9\
+\x11\xd5\x28\xb2\x9b\x97\x09\x5d\x6e\x62\x8b\x2a\x36\x78\xb6\x26\
+\xbb\x56\x99\x78\xa2\x5e\x13\x63\x14\xd2\x24\x6a\x3f\xb6\x51\xce\
+\x2f\xb8\xf8\x73\xd2\x76\x65\x7b\xb0\xf4\xfc\x8b\x54\xc8\xb3\x14\
+\xa5\x2b\xba\x25\x50\xe5\xc8\xb3\x42\xaa\x28\xf5\x43\x15\x94\x9c\
+\xd1\x61\xb9\x1d\x5a\xde\x95\x94\xad\xdb\x97\xaf\x74\xdf\xa4\xb9\
+\x5c\x1f\xd1\x81\x5e\xbb\x6a\x84\x94\x70\x74\x2a\x9e\xd5\xab\xef\
+\xc1\x6b\xaf\xbe\xaa\x42\xcd\x89\x5a\x96\xa5\x93\x5a\x12\x87\xd1\
+\x14\xb5\xb8\x4a\x7f\x48\x39\xd2\xb0\xc7\x1e\x7b\xa8\x14\x42\x94\
+\x3c\x98\xb9\x81\xe3\x84\xbf\xdf\x72\xcb\x2d\xb8\xf0\xc2\x0b\x4b\
+\x9a\x07\x91\x1a\x83\xbe\x79\x49\xc7\x6f\xd4\xf3\x61\x86\x44\x95\
+\xb2\xca\x24\x91\xac\xa3\x68\x89\xba\x6f\x5a\xe0\x72\x5e\x98\xfd\
+\x11\x34\xca\xa9\x06\x48\x59\x2f\xff\x6e\xbf\xfd\x76\x9c\x7c\xf2\
+\xc9\x6a\x23\xab\xe3\xc8\x02\x6b\xd7\x3e\x8e\xc5\x8b\x17\x97\xf2\
+\x10\xf2\xbd\xa2\x8d\x31\xdd\x73\x52\xa9\xd4\x2d\x85\x42\x6e\x49\
+\x54\x1b\xec\xfd\xb1\x1c\xb0\x60\x58\xe3\x88\xd8\x36\x40\x19\xe6\
+\xff\x73\x1c\xac\x8c\xde\x41\x83\x05\x39\x87\xe1\xc4\xa0\x9a\xf4\
+\xb4\xd3\x4e\x53\xe7\x2d\x7a\x32\x94\xcf\x07\x57\x0d\x09\xa2\x7a\
+\xe4\x84\xa1\xea\xf3\xb0\xc3\x0e\xc3\x3d\xf7\xdc\xa3\x40\x87\xc0\
+\x3c\x69\x52\xaf\x52\xd7\x7e\xe9\x4b\x57\x2b\x80\xe6\x25\x96\x68\
+\x51\x60\x18\xa4\x23\xcc\xe4\xdf\x74\x2b\x11\x89\x4a\x24\x06\xd3\
+\x4f\x4d\xea\x22\x2f\xa8\x12\x65\xbe\xbf\x20\x0f\x9c\xe2\x79\x1d\
+\xcb\x46\x2d\xee\xd5\xf0\xa8\xfe\x65\x3d\x78\xd4\xc3\xaa\x60\xdd\
+\xe1\x17\xcf\x6e\x19\xd1\x84\x8b\x12\x25\x32\x31\x82\x10\x2b\xcf\
+\x6a\x16\xc4\x38\xf4\x47\xf1\xcb\xdc\x9c\xf0\x7f\x82\x1e\xf3\x4a\
+\x32\x4e\x27\x37\x4e\x12\xd4\x80\x63\x45\xb4\x08\x22\xb9\xca\x39\
+\xa6\xb9\xa8\x47\x19\x30\xc5\xa1\xb9\x52\x19\xf2\x4d\x72\x0d\xf2\
+\xbd\x02\x8c\x26\x40\x4e\x24\xf8\x89\x81\x0b\xe7\xb8\x9c\xd7\x71\
+\xee\x07\x01\xbc\xd6\x73\x54\xce\x5f\x39\xff\x9b\x32\x65\x8a\xca\
+\x50\x7f\xe2\x89\x8b\x8b\xc9\xa5\xb5\x74\xf8\xe0\x83\x3f\x57\x60\
+\x28\x46\x71\x32\x17\x4d\x3b\x86\x6d\x53\xe9\xaa\x6d\xea\x79\x9d\
+\x82\xc4\x5e\x55\x71\xc0\x82\x61\x55\xec\xda\xae\xf0\xd9\xdd\xdd\
+\xdd\xb7\xf0\x7c\x8e\xe7\x86\x22\x21\xb1\xd4\x53\x4f\x3d\xa5\x7e\
+\x63\x10\x5e\x0d\x16\xc9\x58\x6d\x86\x6e\x12\xf0\xe0\x02\x42\xb5\
+\xc9\xcd\x37\xdf\x8c\x99\x33\x77\x2a\x11\xd7\xdf\x3f\xa8\x24\x43\
+\x9e\x25\x52\xa5\x22\xe6\xd8\x95\xc0\xd0\x04\x32\xd9\x65\x9a\x13\
+\x94\x46\x39\x5c\x50\xe5\x9c\x89\x2f\x0b\x46\xc4\x11\xd5\xe1\xf6\
+\xea\x34\xa6\x47\xd2\xd6\x9a\xe6\x22\x6e\xfe\x9f\x57\x79\x00\x9b\
+\xf9\x52\x41\xdd\x22\x09\xe4\x66\x45\x0c\x1c\x58\x58\xab\x28\xb5\
+\x11\x4d\x3d\xaf\x28\x30\x14\x5e\x0b\x28\xb2\x4f\x18\x7d\xe6\x81\
+\x07\x1e\xc0\xdb\xde\x36\x1b\x83\x83\xda\x82\x94\x69\x8d\xbe\xf2\
+\x95\x7f\xc3\x15\x57\xd0\x49\x7f\x34\x3b\xbb\xe9\x4b\xc8\xdf\x1b\
+\x0d\x86\x41\xde\x98\xd1\x56\x82\x46\x4f\x2c\x1b\xfc\xad\xde\x9b\
+\x8d\x72\x7d\x25\x73\x43\x8c\xd2\x82\xef\x0d\x03\xec\x38\x00\x29\
+\x65\xf8\x39\x6b\xd6\x2c\x30\x44\x1e\x8f\x59\xa4\x7e\x82\xe1\x2f\
+\x7e\xf1\x4b\x9c\x7e\xfa\xe9\x78\xf5\xd5\x57\x4b\x56\xd9\x2c\x3f\
+\x7a\x34\xe1\x9f\x03\x14\xbe\x55\xcf\x71\xd6\x49\x75\x25\x5b\xa1\
+\x3b\x89\x53\x65\xda\x3a\x6d\xda\xb4\xa3\xe6\xcc\x99\x73\xc7\x89\
+\x27\x9e\x38\x8b\x45\x04\x54\x36\x6c\xd8\x80\x55\xab\x56\x81\x16\
+\x60\x7a\xf7\x98\x8c\x59\xb2\x03\x35\xa3\x54\xf0\x7f\x9e\x03\xd1\
+\x72\x50\xac\x5b\xb9\x88\x70\xc7\x4a\x30\xa6\x45\x29\x17\x63\x09\
+\xdb\x14\x25\x19\x4a\xdd\xfc\x14\x67\x7d\x33\x6a\x89\xb4\x4f\x26\
+\xa0\x98\xe3\x9b\x8b\xbd\xb4\x3f\x68\x25\xa9\xf3\x16\xaa\x25\xba\
+\x81\xa9\x9a\x08\x58\xe1\xf5\xeb\xac\xf4\xe5\xef\x6b\x49\xa9\xc2\
+\xf3\xa1\xfa\xd1\xd1\x3e\xa5\x2a\x2b\x68\xd9\xc7\xdf\xd8\x1f\x31\
+\x2c\xfe\xaa\x1e\x1c\xe5\xc0\x50\x54\xd7\x26\x18\xf2\x7f\x2e\x98\
+\x73\xe7\xce\x55\x1b\x27\x26\x5b\xe6\x45\x80\xa3\x69\x3e\xc3\xad\
+\x49\x3e\xc3\x30\xa9\x90\x7d\xda\x68\xc3\x19\x8e\x53\x8e\x27\xc9\
+\x22\x41\xbe\x89\x04\xc6\xb6\xf2\x7f\x53\x52\x35\xc7\x57\x1c\xb0\
+\xa9\x9a\xc1\x81\x07\x64\x43\xc9\x4d\x21\x79\x26\x1a\x1a\xf2\x50\
+\x36\x8d\x41\xfa\xa4\x8a\xb8\xf4\xb1\x4e\xf2\x80\xe5\x09\x84\x7b\
+\xee\xb9\x67\x29\x70\x07\xeb\x7a\xf9\xe5\x97\x55\x5f\x99\xe3\x49\
+\x69\x5e\xd2\x99\x75\xbe\xef\x7f\x24\x9f\x1f\x7e\x30\x69\x3b\x3b\
+\xf9\x79\x0b\x86\x75\xe8\xfd\xa9\x53\xa7\xee\xbe\x65\xcb\x96\xef\
+\x02\x78\x97\xf8\xcf\x71\x21\x14\xf5\x45\x3d\xc0\x50\xc8\x0c\x9c\
+\x0d\x94\x16\x29\xbe\xcf\x94\xc8\xcc\x7c\x65\x04\x34\x51\xd7\x05\
+\x77\xd5\x66\xf3\x4d\x23\x1d\x9e\x87\xf2\x32\xdb\x20\x67\x14\xa4\
+\x41\x00\x30\x4c\x0d\x18\x94\xfe\x04\x3c\xf5\xbb\xcc\x8c\xf1\x95\
+\x4e\xf9\x9a\xad\x5c\xbc\x81\x22\xd2\x71\xa3\xc1\x23\x08\x86\x61\
+\x12\x8a\xa9\x2a\x15\x70\x61\x4a\x23\x6a\x0b\x48\x1f\x9f\xe1\x42\
+\x4e\x49\xc3\x7c\x3e\x08\x34\xe3\x01\x86\xa6\x4a\x9e\xc0\xc3\x8b\
+\x63\x8c\xe0\x23\xb4\x49\xb8\xc3\xa0\x3a\x3e\xec\xac\x31\x5e\x6f\
+\xc5\x2f\x65\xce\x3b\x09\x52\x20\x20\x47\xb5\xb8\xb8\x50\x85\x49\
+\xd0\x71\xe9\x33\xdb\xcd\x7e\x61\xfd\x9c\x7f\x62\x58\xc3\xdf\x08\
+\xc4\x62\x5d\xaa\xcf\xf0\x9d\x5f\x75\x75\xa5\x3f\x3a\x3c\x3c\xfc\
+\x5c\xfc\xd6\xd8\x92\x61\x1c\xb0\x60\x58\xbf\x71\xe1\xa4\x52\xa9\
+\xef\x78\x9e\xf7\x11\x99\xbc\xb2\xd3\xd3\x80\x92\xec\xcc\x30\xcc\
+\x7c\x9a\x93\x82\x8b\x05\x2f\xd3\xa9\x5f\xfc\x92\x38\x31\x4d\x55\
+\x66\x25\xc9\x50\x42\x70\x89\xe3\xf6\x19\x67\x9c\xa1\x02\x3c\x4b\
+\x24\x12\x4a\xa0\xf7\xdd\x77\x9f\xb2\x8e\x15\x83\x10\x73\xc7\x5b\
+\xe9\x6c\x4c\x00\x82\x6a\xc6\x72\x7e\x83\x5a\x72\x6e\x56\x70\xac\
+\x6e\x90\x34\xea\x9c\xd0\xa4\x22\x0a\x0c\x59\x56\xc0\x50\xca\x8a\
+\x3a\x8d\xe3\x80\x0b\x38\xc1\xc6\xdc\x40\x99\x2a\xbe\xf1\x56\x43\
+\x0a\xd8\xec\xb7\xdf\x7e\x4a\xf5\x3f\x7d\xfa\x74\x25\x01\x71\xdc\
+\x33\x90\xf8\x4d\x37\xdd\xa4\xc6\xb8\x18\xab\x98\x00\x1d\x57\xf2\
+\xaa\xae\x17\xc7\x96\x16\x40\xe3\x66\x82\xee\x0d\x72\xbe\x2a\xf1\
+\x80\x69\x37\x40\xa9\x36\x6c\x6e\xc4\xa5\xcf\x54\x69\x87\x9d\x45\
+\x72\x5e\xcb\xc6\x56\x6f\x30\xbd\x3b\x3c\x2f\x77\x46\x51\xa5\x91\
+\xa4\x79\xf6\x59\x1b\x8e\xad\xfe\x63\x20\x9b\xcd\x7e\x66\x64\x64\
+\xe4\x5f\x59\x33\x77\x7a\x5c\x54\xb4\xdf\x56\x32\x30\x14\x4a\x39\
+\x09\x08\x80\xb2\x90\xc9\xef\x12\x28\x5c\xfb\x84\xe9\x80\xbe\xe6\
+\x82\x16\x47\x32\x54\x72\x9b\xeb\x62\x97\x5d\x76\xc1\xea\xd5\xab\
+\x55\x86\x7a\xf3\xfa\xf4\xa7\xaf\x54\x71\x2a\x45\x85\xca\x7b\x32\
+\xf9\xa3\x77\xbf\x95\xf5\xc4\x7a\x21\x2e\xaf\xa6\x4c\xaa\x5e\x8d\
+\x4a\x5c\xae\xa5\x8d\x72\x60\xcc\x33\xaa\xca\xfb\x46\x39\x53\x35\
+\x4d\xdd\xe3\x2e\x82\xb5\x8c\xc2\x6a\xc1\x50\xce\xe0\x4c\x40\x94\
+\xfe\x36\xfd\x13\xa5\xde\xf1\x3e\x23\x94\xf7\x9e\x79\xe6\x99\xb8\
+\xea\xaa\xab\x94\x91\x0f\xdd\x51\xe8\xaf\xf9\xe2\x8b\x2f\xe1\xe0\
+\x83\x0f\x56\xa0\x28\x9a\x0a\xd3\xb2\xba\x91\x7c\x36\xfb\x86\x63\
+\xe4\xdd\xef\x7e\xb7\x3a\x77\x15\x0b\x4f\xd2\x48\xc3\x29\x82\x38\
+\x2d\x8a\x4d\x8d\x89\x79\xee\x1a\x75\xa6\x69\xc6\xab\x35\x37\xb3\
+\xfc\x9d\xf5\x70\x2d\x91\x20\xf3\xc5\x7a\x3f\x0b\x78\x5f\xa8\x65\
+\xec\xd8\x67\xc2\x39\x60\x25\xc3\x06\x8c\x8c\x6c\x36\x7b\xf2\xc8\
+\xc8\xc8\xad\xe9\x74\x7a\x2a\x17\x1a\x4e\xd6\xa4\x67\x86\xfa\x6c\
+\x40\xc7\x8e\x34\x2f\x2e\xc2\x62\xe1\xc6\xc9\xca\x89\x24\x13\x92\
+\xbb\x7f\xde\x13\x3f\xc3\x4a\x92\xa1\xe9\x2e\x41\x89\x90\xc1\x02\
+\xb8\x0b\x26\x46\xd0\xd8\xa2\xbb\xbb\x0b\x97\x5d\x76\x39\x6e\xb8\
+\xe1\x06\xb5\x43\x37\x0d\x43\x24\x71\xa9\x09\xd8\x63\xa5\x8c\xb1\
+\x0e\xed\x61\xe9\x96\xa2\xc0\xaa\x01\xdd\x54\x65\x95\xd1\x9b\x19\
+\x59\xc4\x82\xd2\x41\x23\x16\xeb\x6a\xc0\x90\x0d\x35\xd5\x7c\x72\
+\xee\xc5\xf1\x42\xd5\x1b\xd5\xa6\xa6\x24\xc9\xff\x83\x67\xbe\x55\
+\x32\xab\xea\xe2\x62\x20\x46\x30\xa4\xe1\xd7\x8e\x3b\xce\x28\xf9\
+\xd8\xbd\xfc\xf2\xab\x2a\xca\xd2\xc6\x8d\x1b\x4b\x1a\x10\x39\x16\
+\x68\x84\xdb\x4a\x18\xf1\xb2\x99\xa0\x8f\xe6\xef\x7f\xff\x54\x69\
+\x3e\x73\x7e\xd0\xa7\x78\xd1\xa2\x45\xca\x3e\x40\xce\xf3\x82\xaa\
+\xdc\x28\x86\x08\xe8\x91\xef\x41\x9f\x62\x73\xd3\xd9\xdb\xdb\xbb\
+\x65\x60\x60\xf0\xe3\x40\xe1\xee\xa8\x3a\xed\xfd\xea\x38\x60\xc1\
+\xb0\x3a\x7e\x55\x53\x7a\x6e\x2a\x95\xfa\x36\x80\xbf\xd5\x3b\xef\
+\xb1\x8b\x69\x9c\xc5\xac\x9a\x97\x05\xeb\x0b\x3e\x1b\xb5\x33\x15\
+\x29\x81\xf5\x30\x6c\x17\xf3\xdb\xd1\xc4\x5b\x3b\x66\x73\x77\x0a\
+\xe5\xaa\xb1\x62\xc5\x0a\xb5\x43\xe7\xc5\x09\x1c\x66\x38\xb2\x3d\
+\xdd\x09\xad\x87\xaa\x61\x44\xc3\xca\x46\x83\x61\xc3\x5e\x1d\xa3\
+\xe2\xa8\xfe\x8f\xaa\x22\xce\xf8\x88\xaa\x23\xc9\x7d\x6e\xdc\xb8\
+\xc9\x3a\xfe\xf8\xe3\x71\xf7\xdd\x77\x97\x42\xc5\xd1\x8a\xf2\xa5\
+\x97\x5e\xc1\xfe\xfb\xef\xaf\xc0\x86\xed\x94\x40\x12\x32\x06\x1b\
+\x7d\x3e\x2b\xed\xe2\x7b\x09\x7a\x6b\xd7\x3e\x8a\x4d\x9b\xb6\x60\
+\xfa\xf4\xa9\xea\xd6\xeb\xaf\xaf\x07\xc3\xa7\x11\xac\x65\xf3\x5b\
+\xce\x98\xa6\x1c\x8f\xa2\xfa\x4f\xd7\xe7\xac\x05\x0a\x67\x01\xf8\
+\x43\x12\x5e\xdb\x67\xc3\x39\x60\xc1\xb0\xf1\x23\xe3\x46\x00\x4b\
+\x25\x73\xba\xbc\xae\xde\x8b\x4f\xbc\xc9\x54\xbe\xb1\xa6\x95\x2a\
+\x63\x57\x32\x58\xc0\xac\x59\x3b\xab\x70\x50\x94\x2c\xa7\x4e\x9d\
+\x8c\x8b\x2f\xfe\x94\x92\x0c\xf9\x5d\xfc\x1a\xe3\xab\xd3\x5a\x1d\
+\x10\x2d\x18\x36\x72\xaa\x70\x53\xc5\x31\x7c\xc2\x09\x27\xe0\xb6\
+\xdb\x6e\x2b\x45\x58\xe1\x6f\xf4\xd9\x3d\xfc\xf0\xc3\xb1\x7e\xfd\
+\x7a\xa5\x19\x29\x67\x44\xd6\x48\xfa\x44\x13\xb2\x70\xe1\x42\x15\
+\xcb\x55\xb2\xad\xc8\x31\xc8\xbc\x79\xf3\x14\x7d\x66\x40\x7c\xf3\
+\x0c\x30\x8a\xb6\xa8\xf9\x9b\xcd\x66\x6f\x1a\x1e\x1e\x3c\x3f\xaa\
+\x1e\x7b\xbf\x76\x0e\x58\x30\xac\x9d\x77\xd5\x3c\xb9\x24\x95\xca\
+\xdc\xcc\x07\x82\xa6\xeb\xd5\x54\x52\xa9\x6c\xd4\x64\x8a\x0b\xbe\
+\x5c\x94\x68\x7a\xcf\x18\x96\xf4\x4b\xd3\x07\xf5\x3a\x1f\xe3\xe5\
+\x97\x5f\xae\xa2\x95\x84\xb9\x10\x04\xb3\x62\xb4\x9f\x74\x68\xc1\
+\xb0\x5e\x63\xb5\x5c\x3d\x53\xa7\x4e\xc5\x49\x27\x9d\xa4\xce\xa5\
+\xa9\x26\x95\xab\xaf\x4f\x9f\xc9\xd1\x5d\xc9\x54\xf9\x73\x6c\x8e\
+\x87\xa5\xab\x49\xef\x91\x47\x1e\xa9\xa2\xf8\x50\x62\xa5\xb6\x84\
+\xc1\x15\xa8\x66\xa6\x1a\x77\xdd\xba\x75\x63\x7c\x4a\xc5\xc8\x26\
+\x8e\xe4\x5a\x69\xfe\xfa\xbe\x7f\x2e\xe0\xad\x6c\x34\xff\x3b\xbd\
+\x7e\x0b\x86\xe3\x34\x02\x32\x99\xcc\x01\x9e\xe7\xaf\xf0\x7d\x2c\
+\x8a\xf2\xf7\xab\x85\xa4\xa4\x60\xc8\x89\x2b\x0b\x0b\x77\xc1\x34\
+\x14\xe0\x77\x1a\x2c\x50\xfa\xa3\x35\x29\x7d\x17\x19\x66\x4e\xa4\
+\x41\xd3\x02\x35\x9a\x66\x2b\x19\x46\xf3\xa8\xf6\x12\x51\xfd\x1f\
+\x55\x73\xdc\xcd\x52\x54\x3d\x49\xee\x73\x3c\xf1\xec\x90\x21\x06\
+\x09\x7a\xe2\xfe\xc1\x33\x70\xfa\xcc\xd2\x5a\xd3\x34\x4a\xe1\xbb\
+\xe4\x3c\xb6\xd1\xf4\x53\x8d\x2b\xb1\x40\x19\xe8\x5c\x36\x89\xa4\
+\x97\x52\xe2\x33\xcf\x3c\xa3\x0c\x68\xcc\x33\xcc\x6a\xc0\xba\x4c\
+\xff\x3d\xe9\xfb\xee\x79\x40\xee\x37\x49\xf8\x6a\x9f\x8d\xc7\x01\
+\x0b\x86\xf1\xf8\x54\xb7\x52\xae\x9b\xba\xc1\xf7\xa1\xd4\x1d\xe6\
+\x04\x88\xaf\x6e\x0c\x27\x25\x6a\x31\x8c\xbb\x58\xc8\xe2\x62\x1a\
+\x7d\x94\xfb\x9f\xea\x2a\xde\xab\x47\x8a\xaa\xba\x31\xb8\x43\x2b\
+\xaa\x57\xff\x4f\x14\xfb\x24\x6d\x54\x30\xc4\x99\xb8\x27\xc9\x18\
+\x33\xe3\xe0\x8a\xc4\x15\x6d\xc9\x5c\x9f\x56\x89\x61\x0b\x3f\xe5\
+\xdd\x04\xc9\xad\x5b\xb7\x8e\x31\x28\x13\x63\x1b\xbe\x35\x01\x6d\
+\x37\x02\xde\x27\xea\x43\xb9\xad\x25\x0e\x07\x2c\x18\xc6\xe1\x52\
+\x9d\xcb\xa4\x52\xa9\xd3\x7d\xdf\xb9\x01\xc0\x54\x59\xc4\xe2\xa8\
+\x52\x2a\x91\x91\x74\x31\x14\x95\x8e\x69\xe2\xcd\x3a\xc5\x4f\x51\
+\x00\x91\x8b\x92\x84\x65\x13\x7a\xc2\x62\x98\xd6\x99\x65\xb6\xba\
+\x08\x0e\x24\xed\xff\x66\x61\xb0\x04\xaa\x96\xf9\x20\x8e\xf6\x6c\
+\x9f\xb8\x2a\x11\x10\x39\x5e\xc5\x7d\xc8\xdc\xac\x35\xb2\x1d\x02\
+\x86\xe6\xfb\x82\x60\x37\xd6\x21\xbe\x26\x30\xdc\x02\x38\x9f\x00\
+\x0a\xdf\x6b\x64\x5b\x6c\xdd\xdb\x73\xc0\x82\xe1\x84\x8d\x8a\xee\
+\xdd\x1c\x27\xbf\xdc\x71\xf0\x5e\x92\x30\xd1\x92\x61\x70\x41\x91\
+\x49\x1e\xb6\xd0\x10\x20\x25\xc2\x4e\x52\xba\x27\x8c\xfd\x6d\xf6\
+\xe2\x56\x07\x43\x19\x6f\xa6\x54\x65\xaa\x41\xf9\x3f\xa5\x47\x82\
+\x23\x81\x52\xa2\xc0\x88\x13\xfa\x78\x8e\x43\xd2\x61\x06\xd6\x20\
+\x3d\x54\xe5\xf2\xb7\xe0\x39\x61\xb0\x3d\x95\x87\x9d\x7f\x1f\xe0\
+\x5f\x00\xe0\x4f\x6d\x36\x3c\x5b\xa2\x39\x16\x0c\x27\xbc\x9b\xdc\
+\xcb\x00\xe8\x2c\xbc\x09\xae\x7a\x2d\x86\x32\x79\x83\xbb\x60\x1d\
+\xd4\x39\x55\x9a\xf4\x26\xa9\x56\x32\x4c\xd0\x71\x75\x7a\xb4\x5e\
+\xfd\x5f\x27\x72\xaa\xae\x46\xc6\x1d\x7d\x20\xc5\xb9\x3c\x98\x3a\
+\x2c\x18\xb2\x4d\x2c\x39\xab\x03\x9c\xaa\x49\x53\x0f\x98\xe7\xe3\
+\xb2\x41\x24\x28\x12\x84\x09\x84\xe6\x7c\x61\x79\x01\x46\x82\x63\
+\x4c\x5f\xc8\xcb\x01\xef\x9a\xda\xa8\xb3\x4f\xd5\x83\x03\x16\x0c\
+\xeb\xc1\xc5\xe4\x75\x1c\x08\xe0\xeb\x8e\xe3\xbc\x4b\x26\x12\x3f\
+\xc7\xaa\x60\x26\xd6\x9a\xb1\xd5\x17\xdb\xe4\x5d\x64\x6b\x68\x24\
+\x07\xc4\x49\xbd\xdc\x3b\xa2\xce\xbc\xa3\xee\x27\xa5\xbd\x71\xe3\
+\xdf\xf9\x15\x50\xf8\x47\x00\x4f\x24\xa5\xd1\x3e\x9f\x8c\x03\x16\
+\x0c\x93\xf1\xaf\xde\x4f\x33\x8c\xdb\x67\x82\x95\x6a\x1f\xa7\xb1\
+\x91\x67\xea\xfd\xe2\xa8\xfa\x1a\xb7\x18\x44\xbd\xd9\xde\xef\x04\
+\x0e\x74\x28\x18\x7e\x01\xf0\x3e\xdb\x09\xfd\xdb\x0a\x6d\xb4\x60\
+\xd8\x64\xbd\x94\x4e\xa7\xdf\xd3\xd5\xd5\x75\x6d\xa1\x50\x38\x50\
+\xe2\x30\x6a\xb5\xcc\xc4\x76\x95\x05\xc3\x26\x1b\x28\x6d\x46\x4e\
+\xd4\xf8\x8a\x6a\x6e\x6b\x49\x86\xce\x13\x40\xe1\x53\x00\x1e\x89\
+\x6a\x97\xbd\x3f\x7e\x1c\x98\xd8\x15\x76\xfc\xda\xd9\x72\x6f\xda\
+\x76\x06\xf1\x79\xdf\xf7\x3f\xc7\xc3\x79\x6d\x1c\x60\xd5\xa4\x2d\
+\xd7\x89\x96\xe0\xba\x71\x20\x0a\x2c\x5b\x08\x0c\xaf\xda\x16\x10\
+\xde\x66\xa2\xaf\xdb\xc8\xa8\x5f\x45\x16\x0c\xeb\xc7\xcb\x46\xd4\
+\xb4\x28\x95\x4a\x5d\xe3\x79\xde\x11\x13\x2d\x19\x36\xa2\x71\xb6\
+\x4e\xcb\x81\xb8\x1c\x68\x7d\x30\xf4\xd7\x00\x3e\x8d\xe5\x9e\x8c\
+\xdb\x66\x5b\x6e\x7c\x39\x60\xc1\x70\x7c\xf9\x5d\xeb\xdb\x96\x01\
+\xee\x97\x01\xf4\xd6\x5a\x81\x7d\xce\x72\xa0\x95\x39\xd0\xc2\x60\
+\x38\xb0\x2d\x4f\xf1\xa7\x01\xef\x9b\xad\xcc\xff\x4e\xa0\xdd\x82\
+\x61\xeb\xf4\xf2\x1c\xc0\xfd\x12\x80\xd3\x5b\x87\x64\x4b\xa9\xe5\
+\x40\x7d\x38\xd0\xa2\x60\xf8\x3d\xc0\xbb\x02\xc0\x4b\xf5\xe1\x82\
+\xad\xa5\x91\x1c\xb0\x60\xd8\x48\xee\x36\xa4\xee\xd4\x09\x80\xcf\
+\xa4\x9e\xf3\x1b\x52\xbd\xad\xd4\x72\x60\x02\x38\x10\x05\x76\x51\
+\x24\x35\xd9\x99\xe1\xd3\x80\xf3\x19\xa0\xb0\x3a\x8a\x6e\x7b\xbf\
+\x79\x38\x60\xc1\xb0\x79\xfa\xa2\x2a\x4a\xd2\xe9\xec\x15\xf9\x7c\
+\xfe\x2a\x9d\xb7\x35\x5d\x8a\x95\x28\x95\x34\x7a\x71\xa8\x8a\x58\
+\x5b\xd8\x72\xa0\x33\x38\x90\x77\x5d\xf7\x73\x9e\x97\xa7\x06\xc7\
+\x5e\x2d\xc6\x01\x0b\x86\x2d\xd6\x61\x01\x72\x77\xd9\x66\x65\xfa\
+\xf9\x54\x2a\xf5\xb1\x60\x38\x2a\x0b\x86\xad\xdd\xb1\x96\xfa\xd6\
+\xe2\x40\x2a\x95\xba\xbd\x50\xc8\xd1\x4a\xf4\xcf\xad\x45\xb9\xa5\
+\x56\x38\x60\xc1\xb0\x2d\xc6\x42\xfa\x08\xc7\xf1\xff\x19\xc0\xa1\
+\x56\x32\x6c\x8b\x0e\xb5\x8d\x68\x19\x0e\x38\xbf\x04\x9c\x7f\x01\
+\xf2\x6b\x5a\x86\x64\x4b\x68\x28\x07\x2c\x18\xb6\xd5\xc0\x48\x7d\
+\xd4\x71\x78\x56\xe1\xef\x61\x25\xc3\xb6\xea\x58\xdb\x98\xe6\xe3\
+\xc0\xb3\x80\xf3\x05\xa0\xf0\xdd\xe6\x23\xcd\x52\x54\x0b\x07\x2c\
+\x18\xd6\xc2\xb5\xa6\x7f\xc6\xbd\x54\x9b\x73\x63\x7a\xd3\x93\x6a\
+\x09\xb4\x1c\x68\x2d\x0e\x6c\x02\xf0\x65\xc0\xfb\x4a\x6b\x91\x6d\
+\xa9\x8d\xe2\x80\x05\xc3\x28\x0e\xb5\xee\xfd\x69\x80\x7b\x39\x00\
+\xfe\xd9\xcb\x72\xc0\x72\x20\x39\x07\xae\x06\x3c\x66\x98\xd9\x9c\
+\xbc\x2a\x5b\x43\xb3\x71\xc0\x82\x61\xb3\xf5\x48\xfd\xe9\xa1\x7f\
+\x22\x25\x45\xe6\x49\xb3\x97\xe5\x80\xe5\x40\xf5\x1c\x58\x5e\x94\
+\x04\xad\xbf\x60\xf5\xbc\x6b\x99\x27\x2c\x18\xb6\x4c\x57\x25\x26\
+\x74\x0f\xc0\x65\x70\xe0\x25\x89\x6b\xb2\x15\x58\x0e\x74\x06\x07\
+\x56\x02\xde\xb5\x00\x9e\xed\x8c\xe6\x76\x76\x2b\x2d\x18\x76\x5c\
+\xff\x67\xe7\xba\x6e\xe1\x62\xcf\xf3\xcf\x11\x47\x67\x6b\x6c\xd3\
+\x71\x83\xa0\xe3\x1a\x1c\xe5\xd4\xcf\x39\x20\x49\x7b\x01\xdc\x02\
+\xa4\xaf\x03\x46\xfe\xd0\x71\x8c\xea\xe0\x06\x5b\x30\xec\xdc\xce\
+\xa7\xa4\xc8\xa4\xa2\xe7\x1b\x8b\x40\xe7\x72\xc3\xb6\xbc\xad\x39\
+\x10\x07\x0c\x5d\xd7\xb9\x31\x93\x49\x7f\x7d\x78\x78\xd8\x4a\x82\
+\x6d\x3d\x1a\xc2\x1b\x67\xc1\xb0\x03\x3b\x3d\xd0\xe4\x39\xd9\x6c\
+\xd7\x85\xb9\x5c\x9e\x67\x8a\x3d\xe5\xd8\x61\xa5\x47\x3b\x50\x5a\
+\x99\x03\x15\xc0\x70\xd0\x71\x9c\xe5\x9e\x97\xbf\xde\xc6\x10\x6d\
+\xe5\x1e\x4e\x4e\xbb\x05\xc3\xe4\x3c\x6c\x97\x1a\x68\x7d\xfa\x09\
+\x00\x4b\x01\xcc\x6e\x97\x46\xd9\x76\x58\x0e\x90\x03\x21\x60\xf8\
+\xb2\xef\xfb\x37\x01\xde\x0d\xd6\x3a\xd4\x8e\x11\x35\x46\x2c\x1b\
+\x2c\x07\xb6\xe7\x40\xea\x2c\x00\xe7\x01\xfe\x22\xcb\x1d\xcb\x81\
+\x76\xe0\x80\x01\x86\x4f\xfa\x3e\x56\x00\x85\x6f\xb7\x43\xbb\x6c\
+\x1b\xea\xc7\x01\x0b\x86\xf5\xe3\x65\x1b\xd6\x94\x3e\x16\x28\x9c\
+\x03\x38\xef\x6f\xc3\xc6\xd9\x26\x75\x10\x07\x1c\xc7\xf9\xb1\xef\
+\x3b\xb7\x00\xf9\xfb\x3b\xa8\xd9\xb6\xa9\x55\x70\xc0\x82\x61\x15\
+\xcc\xea\xe0\xa2\xef\x00\x5c\x4a\x8b\x1f\x07\xb0\x53\x07\xf3\xc1\
+\x36\xbd\xb5\x38\xd0\x07\xe0\x56\xc0\xa3\x14\xf8\x7f\xad\x45\xba\
+\xa5\x76\xbc\x39\x60\xc1\x70\xbc\x39\xde\xf2\xef\x4b\x7d\x0c\xc0\
+\xc7\x00\xbf\x14\x14\xbc\xe5\x9b\x64\x1b\xd0\x66\x1c\x60\xf0\x6c\
+\xdc\x0e\x14\x6e\x6f\xb3\x86\xd9\xe6\x34\x90\x03\x16\x0c\x1b\xc8\
+\xdc\xf6\xae\x3a\xb3\xd0\x75\xfd\x8f\x38\x8e\xc3\xbf\x9d\xf2\xf9\
+\x7c\xc5\xe6\xc6\x31\x6d\x6f\x6f\x7e\xd9\xd6\x55\xe2\x40\x1d\xc6\
+\x07\xa5\xc0\x3b\x80\xd4\x1d\x40\xee\x77\x96\xdb\x96\x03\xd5\x72\
+\xc0\x82\x61\xb5\x1c\xb3\xe5\x43\x38\x90\xfa\x10\xe0\x9d\x0a\x38\
+\x27\x58\xf6\x58\x0e\x8c\x2f\x07\xfc\xd5\x80\x7b\x17\x50\xf8\xf7\
+\xf1\x7d\xaf\x7d\x5b\xbb\x71\xc0\x82\x61\xbb\xf5\xe8\xc4\xb6\xe7\
+\xad\x80\xfb\x21\xc0\x39\x05\xf0\x0f\x9c\x58\x52\xec\xdb\xdb\x89\
+\x03\x01\xc9\xf1\x09\xdf\xf7\x7f\x08\x78\x04\xc0\x57\xda\xa9\x9d\
+\xb6\x2d\x13\xc7\x01\x0b\x86\x13\xc7\xfb\x76\x7f\xf3\xbe\x80\xfb\
+\x01\x00\xfc\x9b\xd7\xee\x8d\xb5\xed\x6b\x38\x07\xfe\x07\xc0\x2a\
+\xc0\x5b\x05\xe0\xf7\x0d\x7f\x9b\x7d\x41\xc7\x71\xc0\x82\x61\xc7\
+\x75\xf9\x44\x34\x38\x73\x20\x50\xf8\x7b\x00\x27\x01\x98\x3b\x11\
+\x14\xd8\x77\xb6\x24\x07\x18\x1b\xf4\x3f\x00\xef\x27\x00\x9e\x68\
+\xc9\x16\x58\xa2\x5b\x86\x03\x16\x0c\x5b\xa6\xab\xda\x85\xd0\xcc\
+\x01\xae\xeb\x2f\xf6\x7d\x6f\x31\xe0\xec\x2f\xad\xb2\xe1\xde\xda\
+\xa5\x7f\x6b\x6b\xc7\xa8\x1a\xd4\xff\xad\xe3\xb8\xf7\x7a\x9e\x73\
+\x2f\x90\xfb\x4d\x6d\xb5\xd9\xa7\x2c\x07\xaa\xe7\x80\x05\xc3\xea\
+\x79\x66\x9f\xa8\x1b\x07\xba\x76\x77\x5d\xef\xbd\xbe\xef\x1f\xe7\
+\xfb\xde\xb1\x75\xab\xd6\x56\xd4\x62\x1c\xf0\xef\x77\xdd\xf4\x7f\
+\x7a\x9e\x7b\x1f\x30\xfc\x5c\x8b\x11\x6f\xc9\x6d\x13\x0e\x58\x30\
+\x6c\x93\x8e\x6c\x83\x66\xf4\x02\xa9\x63\x00\xff\x28\x00\xfc\xdb\
+\x3d\xbc\x4d\x2e\x00\x0f\x40\xb5\x9f\x6d\xc0\x21\xd5\x84\x6a\xdb\
+\x2d\xe5\xeb\xd5\xfe\xba\xbc\x9f\x80\xf7\x20\xe0\x3c\x08\x14\x1e\
+\x00\x30\x50\x2f\xea\x6c\x3d\x96\x03\xb5\x72\xc0\x82\x61\xad\x9c\
+\xb3\xcf\x35\x98\x03\xd9\xb9\x80\x7f\x04\xe0\x1f\x9e\x49\x67\x0e\
+\xcb\xe5\x73\x3b\x39\x2e\x17\x62\x07\xbe\x57\x50\x9f\x8e\xeb\x20\
+\x95\x4a\xc3\xf7\x3d\x78\x9e\x0f\x80\x7f\x8e\xfa\xae\xc3\xee\xea\
+\xef\xea\xd3\xe7\x33\x15\x2e\x27\x6a\x2a\xf0\xdd\x49\x2e\xd2\x94\
+\xe4\x92\xf7\x07\xda\x15\x6c\x67\xd9\xef\x49\xde\x4d\x16\x92\x97\
+\xbc\xca\xbc\xdf\x21\x7d\x06\xbf\xc7\x96\xeb\x83\xef\x3f\xec\xba\
+\xa9\x5f\xa4\xd3\xd9\x35\x23\x23\x5b\x6d\x9e\xc0\x84\xdd\x61\x1f\
+\xaf\x3f\x07\xa2\x56\x80\xfa\xbf\xd1\xd6\x68\x39\x50\x13\x07\x78\
+\xd6\x98\x7e\x8f\xef\x78\xef\xf1\x3d\xef\x10\xc0\x99\xa5\xf2\x30\
+\x7a\x15\x40\x66\x0c\xc0\x71\xa1\x4e\x02\x48\x49\xc1\x90\x8d\xae\
+\xf5\xfd\x7a\x13\x90\xec\x12\x30\xab\xb5\x96\x88\xf7\x97\xc0\x52\
+\xd5\xbf\x6e\x9b\x84\xff\x18\xe0\x3c\x02\xe0\x11\x7b\xf6\x57\x2b\
+\xcf\xed\x73\xe3\xc9\x81\xa4\x33\x6c\x3c\x69\xb5\xef\xb2\x1c\x30\
+\x38\x90\xdd\x2b\x95\x71\xdf\x55\x28\xf8\x07\xc3\xf3\x0e\x02\x30\
+\x5f\x0b\x2e\xe5\x86\x74\x83\xc1\xa0\x62\xdf\x24\x7d\xb7\x48\x64\
+\x4d\x3b\x00\x9e\x86\xef\xff\x1a\xc0\xe3\x80\xf3\x2b\x60\xe4\xbf\
+\x9b\x96\x52\x4b\x98\xe5\x40\x19\x0e\x58\x30\xb4\x43\xa3\x4d\x38\
+\x30\x63\x5a\x3a\x3d\xb8\xc8\xf3\x9c\x45\x80\xbf\xbf\x0f\x7f\xa1\
+\xef\xfb\x7b\xa8\xc6\x51\x6a\x49\x3c\xd2\x13\x57\x50\x54\x23\xd6\
+\xca\xee\x7a\xbc\xbf\xd6\x77\x8f\x79\xee\x59\x38\xf8\x1d\x3c\xfc\
+\x16\x70\x9f\x04\x86\x9e\xb4\xf9\x00\xeb\xc2\x57\x5b\xc9\x04\x73\
+\xa0\x69\x66\xd8\x04\xf3\xc1\xbe\xbe\x3d\x39\x30\x1d\x48\x2f\x00\
+\x9c\xf9\x70\xdd\xf9\xf0\xfd\x7d\x00\xec\x05\x60\x7a\xd5\xcd\xf5\
+\x13\xa8\x49\x9d\x5a\xd5\xa3\x55\x53\x59\xfe\x81\xaa\xe9\xf7\x37\
+\x6d\x8b\x24\x44\x09\xef\x19\xc0\x7f\x1a\x28\x3c\x0d\xe4\xff\x0b\
+\xc0\xa6\x3a\x52\x65\xab\xb2\x1c\x68\x1a\x0e\x58\x30\x6c\x9a\xae\
+\xb0\x84\x8c\x1f\x07\x7a\xe6\x20\xed\xcd\x85\x87\x3d\x5d\xe0\x1d\
+\xbe\x8f\xdd\x7d\xf8\xb4\x5e\xfd\x9b\xa2\xb9\xe6\xf6\xa4\x54\x0d\
+\x26\x21\xad\x99\x48\x50\x0c\xa7\x9f\x28\xfd\x3c\x80\xe7\x00\xe7\
+\x39\xc0\x63\x9a\xa3\xff\xdd\x16\x52\xef\x0f\xc0\xe0\x4b\xe3\xd7\
+\x1f\xf6\x4d\x96\x03\x13\xcf\x01\x0b\x86\x13\xdf\x07\x96\x82\xa6\
+\xe2\x40\xf7\x6e\xdb\xd2\xff\xec\x5a\xfc\x7b\x1b\x80\xd9\xfa\xcf\
+\x7d\x2b\x80\xbf\xaa\x2d\x9f\x63\x1d\x24\xc3\x9a\x80\xd4\xe9\x03\
+\xfc\xd7\x54\xfc\x4e\xdf\x7d\x19\xe0\x9f\xf3\x22\xe0\xbc\x00\xe4\
+\x5f\x00\x86\xfe\xd4\x54\xac\xb7\xc4\x58\x0e\x4c\x20\x07\x2c\x18\
+\x4e\x20\xf3\xed\xab\x5b\x92\x03\x59\xa0\x67\x16\xe0\xcc\x04\x9c\
+\x9d\x01\xec\x08\x78\x3b\x02\xce\x0e\x80\x33\x1d\xf0\xa7\x01\x98\
+\x0a\x60\x0a\x80\xc9\x00\x26\x01\xe8\x05\xbc\x6e\x00\xfc\xcb\x02\
+\xc8\x00\x48\x03\x48\x15\xcd\x44\xc5\x5f\x81\x96\x36\xf4\x01\x61\
+\x3e\xac\x1c\x80\x11\x00\x43\xea\xcf\xf1\xe8\x8b\xd7\x0f\xf8\x6f\
+\x02\xce\x56\x38\xd8\x02\xf8\x9b\x01\x67\x13\x3c\xe7\x0d\xc0\xdf\
+\x08\x38\x1b\x01\x6f\x03\x90\x5e\x0f\x0c\xae\x2b\x3e\xdf\x92\x4c\
+\xb6\x44\x5b\x0e\x8c\x37\x07\xfe\x1f\xdd\x86\xb9\xb0\x68\xdc\x69\
+\xc2\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x0c\x01\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0d\xd7\x00\x00\x0d\xd7\
+\x01\x42\x28\x9b\x78\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x0b\x7e\x49\x44\
+\x41\x54\x78\x9c\xed\xd9\x41\xcb\x6e\x55\x1d\x87\xe1\xff\x8a\x97\
+\x8e\x81\x42\x10\x82\x81\x10\x11\x38\x55\xa1\x50\x47\x19\xe4\x67\
+\xa8\x70\xd0\xc0\x41\x46\x13\x83\x84\x20\xfa\x0e\x09\x41\x06\xf9\
+\x09\x1c\xf4\x01\x8a\xd4\x49\x1e\x29\xd0\xa0\x41\x84\x03\x07\x42\
+\x4e\x82\x06\x81\x1e\xb2\x56\x03\x0f\x45\x76\x26\x8a\xba\x1e\xbd\
+\xaf\x0b\xf6\xf8\xf9\xb1\xdf\xcd\xde\xf7\xcb\x5a\x7b\xef\x01\x2e\
+\xd7\x5a\xeb\xe1\x99\x79\xee\xf4\x8e\xf7\xe8\x6b\x7b\xef\xe7\x4f\
+\x8f\xb8\x04\x6b\xad\xb7\x66\xe6\xda\xe9\x1d\xfc\xc7\x43\x7b\xef\
+\xeb\xa7\x47\x5c\x82\x4f\x9d\x1e\x00\x00\x7c\xf4\x04\x00\x00\x04\
+\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\
+\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\
+\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\
+\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\
+\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\
+\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\
+\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\
+\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\x6b\xef\x7d\x7a\
+\x03\x5c\xac\xb5\xd6\x63\x33\xf3\x95\xc3\x33\xde\xb8\x79\x7d\x9c\
+\xdc\x75\xf3\x3a\xe9\x77\x7b\xef\x67\x0e\x6f\x98\xb5\xd6\x5b\x33\
+\x73\xed\xf0\x8c\x67\x67\xe6\x37\x87\x37\xdc\x3d\x33\x3f\x3a\xbc\
+\x61\x66\xe6\xa1\xbd\xf7\xf5\xd3\x23\x2e\xc1\xd5\xe9\x01\x70\xe1\
+\x1e\x99\x99\x6f\x1c\xde\xf0\xc2\xde\xfb\xe1\xc3\x1b\xde\x93\xb5\
+\xd6\xf3\x33\xf3\xd5\xc3\x33\x3e\x3b\x33\xc7\x03\xe0\x42\xfc\x76\
+\xef\xfd\xf4\xc9\x01\x6b\xad\xfb\xe6\x32\x02\x80\x9b\x1c\x01\x00\
+\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\
+\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\
+\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\
+\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\
+\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\
+\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\
+\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\
+\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x74\x75\x7a\
+\x00\xdc\xca\x5a\x6b\xcd\xcc\x03\xa7\x77\xcc\xcc\xeb\x33\xf3\xd2\
+\xe1\x0d\xaf\xae\xb5\x1e\x3c\xbc\xe1\xbd\x7a\x75\x66\x6e\x3b\xbc\
+\xe1\xf5\x0b\xb9\x6f\xeb\xf4\x00\xb8\x15\x01\xc0\xa5\xba\x36\x33\
+\x2f\x9e\x1e\x31\x33\xdf\xda\x7b\xff\xe0\xe4\x80\xb5\xd6\xc3\x73\
+\x19\xf7\xe2\xbd\xf8\xda\xde\xfb\xf9\x93\x03\xd6\x5a\xdf\x9c\x8f\
+\xdf\x7d\x83\x8f\x8c\x23\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\
+\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\
+\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\
+\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\
+\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\
+\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\
+\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\
+\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\
+\x41\x02\x00\x00\x82\x04\x00\x00\x04\x5d\x9d\x1e\xc0\xe5\x59\x6b\
+\x3d\x3a\x33\x4f\x1e\x9e\x71\x63\x66\xee\x3f\xbc\x61\x66\xe6\xdb\
+\x6b\xad\x1f\x1e\xde\x70\xfb\xe1\xdf\x7f\x3f\x7e\xb1\xd6\xfa\xfb\
+\xe1\x0d\xcf\xcd\x65\x3c\x43\x2f\xcd\xcc\xa7\x4f\x8f\x80\x77\x13\
+\x00\xdc\xca\x9d\x33\x73\xef\xe1\x0d\x37\xf6\xde\xaf\x1c\xde\x30\
+\x37\x3f\xfe\xa7\xef\xc5\xc7\xd1\x97\x4e\x0f\x98\x99\x3f\x5d\xc8\
+\x33\xb4\x4f\x6f\x80\x5b\x71\x04\x00\x00\x41\x02\x00\x00\x82\x04\
+\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\
+\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\
+\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\
+\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\
+\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\
+\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\
+\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\
+\x00\x20\x48\x00\x00\x40\xd0\xd5\xe9\x01\xfc\xaf\xb5\xd6\xa3\x33\
+\x73\xe7\xe1\x19\xff\x9a\x99\xa7\x0e\x6f\x78\x7b\xad\xf5\xc4\xe1\
+\x0d\x33\x33\xf7\x9c\x1e\xc0\xfb\x76\xcf\x85\x3c\x43\x3f\x9d\xf3\
+\xef\xda\x97\x0f\xff\x3e\x17\xe8\xf4\x43\xc9\xff\x7b\x72\x66\xee\
+\x3d\xbc\xe1\xa9\xbd\xf7\xd1\x17\xe7\x5a\xeb\xb6\x99\x79\xf3\xe4\
+\x06\x3e\xf6\xee\xbf\x79\x9d\xf6\x99\xbd\xf7\x5b\xa7\x47\xc0\xbb\
+\x39\x02\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\
+\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\
+\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\
+\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\
+\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\
+\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\
+\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\
+\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\
+\xe8\xea\xf4\x80\x4b\xb1\xd6\x5a\x33\x73\xed\xf4\x8e\x99\xb9\x71\
+\xf3\x3a\xe9\xed\xb5\xd6\x6d\x87\x37\x5c\xc2\xdf\x02\x3e\x08\xd7\
+\xde\x79\xbd\x1c\xf5\x8f\xbd\xf7\x3f\x4f\x8f\xe0\xb2\x08\x80\xff\
+\x7a\x60\x66\x5e\x3c\x3d\x62\x66\xee\xdf\x7b\xbf\x72\x72\xc0\x5a\
+\xeb\x89\x99\x79\xf3\xe4\x06\xf8\x04\xf9\xdb\xe9\x01\x33\xf3\xfd\
+\x99\xf9\xc9\xe9\x11\x5c\x16\x47\x00\x00\x10\x24\x00\x00\x20\x48\
+\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\
+\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\
+\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\
+\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\
+\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\
+\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\
+\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\
+\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x5a\x7b\xef\xd3\x1b\
+\x66\xad\xf5\xd8\xcc\x3c\x72\x78\xc6\xeb\x33\xf3\xfb\xc3\x1b\x66\
+\x66\x1e\x98\x99\xcf\x1f\xde\x70\xcf\xcc\xdc\x7f\x78\x03\xf0\xc1\
+\x79\x79\x66\xfe\x7c\x78\xc3\x5f\x66\xe6\xa5\xc3\x1b\x66\x66\xbe\
+\x3c\x33\x77\x1f\xde\xf0\xab\xbd\xf7\x33\x87\x37\x5c\x4c\x00\x3c\
+\x3d\x33\xdf\x39\x3c\xe3\xa5\xbd\xf7\x83\x87\x37\xcc\x5a\xeb\x95\
+\x99\xb9\xf7\xf4\x0e\x80\x0f\xd8\x1f\xf6\xde\xf7\x9d\x1e\xb1\xd6\
+\xba\x3e\xef\xfc\xa3\x75\xd2\xcf\xf7\xde\x8f\x1f\xde\xe0\x08\x00\
+\x00\x8a\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\
+\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\
+\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\
+\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\
+\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\
+\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\
+\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\
+\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\xa0\xab\xb5\
+\xd6\xc3\xa7\x47\xcc\xcc\x1b\x33\xf3\xc2\xe1\x0d\xaf\x5e\xc8\xbd\
+\xb8\xfd\xf4\x00\x80\x0f\xc1\xed\x17\xf2\x8e\xfd\xe3\xcc\xbc\x75\
+\x78\xc3\x1b\x97\x70\x2f\xd6\xcc\xec\xd3\x23\x66\xe6\xbb\x7b\xef\
+\xa7\x4f\x0e\x58\x6b\x3d\x38\x33\x2f\x9e\xdc\x00\xc0\x87\xee\xa1\
+\xbd\xf7\xf5\x93\x03\xd6\x5a\x8f\xcf\xcc\xcf\x4e\x6e\x98\x71\x04\
+\x00\x00\x49\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\
+\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\
+\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\
+\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\
+\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\
+\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\
+\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\
+\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\
+\x00\x80\xa0\xab\x99\xf9\xe2\xe9\x11\x33\xf3\xbd\xb5\xd6\x6b\x87\
+\x37\x5c\x3b\xfc\xfb\x00\x7c\xf8\x7e\xb9\xd6\xba\x71\x78\xc3\xb3\
+\x73\x01\xdf\xde\xab\xbd\xf7\x6b\xa7\x47\xac\xb5\xee\x98\x99\x2f\
+\x9c\xde\x01\xc0\x27\xde\x5d\xa7\x07\xcc\xcc\x1d\x97\xf0\xed\x75\
+\x04\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\
+\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\
+\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\
+\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\
+\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\
+\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\
+\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\
+\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\
+\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\
+\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\
+\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\xae\x4e\x0f\
+\x80\x03\x7e\x3d\x33\x7f\x3d\x3d\x82\x8b\xf2\xb9\x99\xf9\xfa\xe9\
+\x11\xf0\x51\x12\x00\x14\xfd\x78\xef\x7d\xfd\xf4\x08\x2e\xc7\x5a\
+\xeb\xc1\x11\x00\xc4\x38\x02\x00\x80\x20\x01\x00\x00\x41\x02\x00\
+\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\
+\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\
+\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\
+\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\
+\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\
+\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\
+\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\
+\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\
+\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\
+\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\
+\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\
+\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\
+\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\
+\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\
+\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\
+\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\
+\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\
+\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\
+\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\
+\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\
+\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\
+\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\
+\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\
+\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\
+\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\
+\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\
+\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\
+\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\
+\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\
+\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\
+\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\
+\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\
+\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\
+\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\
+\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\
+\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\
+\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\
+\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\
+\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\
+\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\
+\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\
+\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\
+\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\
+\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\
+\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\
+\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\
+\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\
+\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\
+\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\
+\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\
+\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\xe8\xdf\xb8\x62\xb2\xea\
+\x80\x71\x19\x4b\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\
+\x00\x00\x08\x9c\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x04\x00\x00\x00\x5e\x71\x1c\x71\
+\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\
+\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\
+\x00\x00\x3a\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x00\x02\
+\x62\x4b\x47\x44\x00\xff\x87\x8f\xcc\xbf\x00\x00\x00\x09\x70\x48\
+\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\xa8\x64\x00\
+\x00\x00\x07\x74\x49\x4d\x45\x07\xe8\x09\x11\x10\x2f\x2c\xef\x94\
+\x96\x3a\x00\x00\x07\x46\x49\x44\x41\x54\x78\xda\xed\xd7\xa1\x8e\
+\x5c\x65\x1c\x87\xe1\x6f\xd8\x69\xea\x48\x70\x08\x52\x83\x45\xb3\
+\x41\x63\x71\x1b\x52\xca\x5d\x90\x70\x19\x35\x28\x3c\x09\x45\xec\
+\x66\xef\x00\x89\xa0\x92\x5b\x00\x8f\x22\xa9\xe8\x76\xb0\xc8\xd3\
+\x64\x86\x7f\xf6\xbc\xcf\x33\x6a\xcd\x97\xdf\x37\x99\xbc\x7b\xce\
+\x5a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\xc0\xff\xea\x30\x3d\x80\x1d\xfa\x62\x7d\x37\
+\x3d\x61\xb3\x6f\xd6\xbb\xe9\x09\xb0\x2f\xcf\xd7\xe9\xd1\x7c\xae\
+\xa6\xbf\xac\x59\x1f\x4c\x0f\x00\xe6\x08\x00\x84\x09\x00\x84\x09\
+\x00\x84\x09\x00\x84\x09\x00\x84\x09\x00\x84\x09\x00\x84\x09\x00\
+\x84\x09\x00\x84\x09\x00\x84\x09\x00\x84\x09\x00\x84\x09\x00\x84\
+\x09\x00\x84\x09\x00\x84\x09\x00\x84\x09\x00\x84\x09\x00\x84\x09\
+\x00\x84\x09\x00\x84\x09\x00\x84\x09\x00\x84\x09\x00\x84\x09\x00\
+\x84\x09\x00\x84\x09\x00\x84\x09\x00\x84\x09\x00\x84\x09\x00\x84\
+\x09\x00\x84\x09\x00\x84\x09\x00\x84\x09\x00\x84\x09\x00\x84\x09\
+\x00\x84\x09\x00\x84\x09\x00\x84\x09\x00\x84\x09\x00\x84\x09\x00\
+\x84\x1d\xa6\x07\x30\xea\xe9\x7a\x33\x3d\x61\x87\xee\xd7\xcd\xf4\
+\x84\xad\x3c\x01\x40\x98\x00\x40\x98\x00\x40\x98\x00\x40\x98\x00\
+\x40\x98\x00\x40\x98\x00\x40\x98\x00\x40\x98\x00\x40\x98\x00\x40\
+\x98\x00\x40\x98\x00\x40\x98\x00\x40\x98\x00\x40\x98\x00\x40\x98\
+\x00\x40\x98\x00\x40\x98\x00\x40\x98\x00\x40\x98\x00\x40\x98\x00\
+\x40\x98\x00\x40\x98\x00\x40\x98\x00\x40\x98\x00\x40\x98\x00\x40\
+\x98\x00\x40\x98\x00\x40\x98\x00\x40\x98\x00\x40\x98\x00\x40\x98\
+\x00\x40\x98\x00\x40\x98\x00\x40\x98\x00\x40\x98\x00\x40\x98\x00\
+\x40\x98\x00\x40\x98\x00\x40\x98\x00\x40\x98\x00\x40\xd8\x71\x7a\
+\x00\x9b\x5d\xaf\x67\x67\x3f\xf3\xc9\xf4\xa5\xc6\xdd\xad\xd3\xd9\
+\xcf\x7c\x3d\x7d\xa9\xed\x0e\xd3\x03\xd8\xec\xd5\x7a\x31\x3d\x61\
+\x87\x8e\xeb\x61\x7a\xc2\x24\xaf\x00\x10\x26\x00\x10\x26\x00\x10\
+\x26\x00\x10\x26\x00\x10\x26\x00\x10\x26\x00\x10\x26\x00\x10\x26\
+\x00\x10\x26\x00\x10\x26\x00\x10\x26\x00\x10\x26\x00\x10\x26\x00\
+\x10\x26\x00\x10\x26\x00\x10\x26\x00\x10\x26\x00\x10\x26\x00\x10\
+\x26\x00\x10\x26\x00\x10\x26\x00\x10\x26\x00\x10\x26\x00\x10\x26\
+\x00\x10\x26\x00\x10\x26\x00\x10\x26\x00\x10\x26\x00\x10\x26\x00\
+\x10\x26\x00\x10\x26\x00\x10\x26\x00\x10\x26\x00\x10\x26\x00\x10\
+\x26\x00\x10\x26\x00\x10\x26\x00\x10\x26\x00\x10\x26\x00\x10\x26\
+\x00\x10\x76\x9c\x1e\xb0\x4b\x9f\xaf\xef\x2f\x70\xea\xf5\xf4\xb5\
+\x86\xfd\xb0\x7e\xbb\xc0\xa9\xef\xa6\xaf\x35\x4b\x00\x2e\xe1\x93\
+\xf5\xf5\xf4\x84\x1d\xfa\x7d\xdd\x4e\x4f\xd8\x1f\xaf\x00\x10\x26\
+\x00\x10\x26\x00\x10\x26\x00\x10\x26\x00\x10\x26\x00\x10\x26\x00\
+\x10\x26\x00\x10\x26\x00\x10\x26\x00\x10\x26\x00\x10\x26\x00\x10\
+\x26\x00\x10\x26\x00\x10\x26\x00\x10\x26\x00\x10\x26\x00\x10\x26\
+\x00\x10\x26\x00\x10\x26\x00\x10\x26\x00\x10\x26\x00\x10\x26\x00\
+\x10\x26\x00\x10\x26\x00\x10\x26\x00\x10\x26\x00\x10\x26\x00\x10\
+\x26\x00\x10\x26\x00\x10\x26\x00\x10\x26\x00\x10\x26\x00\x10\x26\
+\x00\x10\x26\x00\x10\x26\x00\x10\x26\x00\x10\x26\x00\x10\x26\x00\
+\x10\x26\x00\x10\x26\x00\x10\x76\x98\x1e\x30\xee\xed\xba\x9a\x9e\
+\xb0\x3b\xf7\xeb\x66\x7a\x02\xdb\x78\x02\x80\x30\x01\x80\x30\x01\
+\x80\x30\x01\x80\x30\x01\x80\x30\x01\x80\x30\x01\x80\x30\x01\x80\
+\x30\x01\x80\x30\x01\x80\x30\x01\x80\x30\x01\x80\x30\x01\x80\x30\
+\x01\x80\x30\x01\x80\x30\x01\x80\x30\x01\x80\x30\x01\x80\x30\x01\
+\x80\x30\x01\x80\x30\x01\x80\x30\x01\x80\x30\x01\x80\x30\x01\x80\
+\x30\x01\x80\x30\x01\x80\x30\x01\x80\x30\x01\x80\x30\x01\x80\x30\
+\x01\x80\x30\x01\x80\x30\x01\x80\x30\x01\x80\x30\x01\x80\x30\x01\
+\x80\x30\x01\x80\x30\x01\x80\x30\x01\x80\x30\x01\x80\x30\x01\x80\
+\x30\x01\x80\xb0\xe3\xf4\x80\xf7\xf0\xd9\xfa\xf8\x3f\x7f\x7d\xb8\
+\xae\xce\x72\xea\x61\xfa\x5a\xc3\x7e\x5d\xa7\xb3\x9f\xf9\xc7\xf4\
+\xa5\xd8\xea\x31\xfd\xfc\x5f\xad\x17\xd3\x13\x76\xe8\xb8\x1e\xa6\
+\x27\x30\xc7\x2b\x00\x84\x09\x00\x84\x09\x00\x84\x09\x00\x84\x09\
+\x00\x84\x09\x00\x84\x09\x00\x84\x09\x00\x84\x09\x00\x84\x09\x00\
+\x84\x09\x00\x84\x09\x00\x84\x09\x00\x84\x09\x00\x84\x09\x00\x84\
+\x09\x00\x84\x09\x00\x84\x09\x00\x84\x09\x00\x84\x09\x00\x84\x09\
+\x00\x84\x09\x00\x84\x09\x00\x84\x09\x00\x84\x09\x00\x84\x09\x00\
+\x84\x09\x00\x84\x09\x00\x84\x09\x00\x84\x09\x00\x84\x09\x00\x84\
+\x09\x00\x84\x09\x00\x84\x09\x00\x84\x09\x00\x84\x09\x00\x84\x09\
+\x00\x84\x09\x00\x84\x09\x00\x84\x09\x00\x84\x09\x00\x84\x1d\xa6\
+\x07\xbc\x87\x2f\xd7\xa7\x17\x38\xf5\xc7\x78\x04\xef\xd6\xe9\xec\
+\x67\xbe\x5e\x2f\xa7\xaf\xc5\x36\x8f\x29\x00\x97\xf1\x76\x5d\x4d\
+\x4f\xd8\x9d\xfb\x75\x33\x3d\x81\x6d\xda\xff\xfd\x20\x4e\x00\x20\
+\x4c\x00\x20\x4c\x00\x20\x4c\x00\x20\x4c\x00\x20\x4c\x00\x20\x4c\
+\x00\x20\x4c\x00\x20\x4c\x00\x20\x4c\x00\x20\x4c\x00\x20\x4c\x00\
+\x20\x4c\x00\x20\x4c\x00\x20\x4c\x00\x20\x4c\x00\x20\x4c\x00\x20\
+\x4c\x00\x20\x4c\x00\x20\x4c\x00\x20\x4c\x00\x20\x4c\x00\x20\x4c\
+\x00\x20\x4c\x00\x20\x4c\x00\x20\x4c\x00\x20\x4c\x00\x20\x4c\x00\
+\x20\x4c\x00\x20\x4c\x00\x20\x4c\x00\x20\x4c\x00\x20\x4c\x00\x20\
+\x4c\x00\x20\x4c\x00\x20\x4c\x00\x20\x4c\x00\x20\x4c\x00\x20\x4c\
+\x00\x20\x4c\x00\x20\xec\x30\x3d\x60\xdc\x47\x17\x38\xf3\xab\xf5\
+\xd3\xf4\xb5\x76\xe8\xdb\xf5\xcb\xf4\x84\xfd\x39\x4e\x0f\x18\xf7\
+\xf7\x05\xce\xfc\x67\xfa\x52\xb0\x8d\x57\x00\x08\x13\x00\x08\x13\
+\x00\x08\x13\x00\x08\x13\x00\x08\x13\x00\x08\x13\x00\x08\x13\x00\
+\x08\x13\x00\x08\x13\x00\x08\x13\x00\x08\x13\x00\x08\x13\x00\x08\
+\x13\x00\x08\x13\x00\x08\x13\x00\x08\x13\x00\x08\x13\x00\x08\x13\
+\x00\x08\x13\x00\x08\x13\x00\x08\x13\x00\x08\x13\x00\x08\x13\x00\
+\x08\x13\x00\x08\x13\x00\x08\x13\x00\x08\x13\x00\x08\x13\x00\x08\
+\x13\x00\x08\x13\x00\x08\x13\x00\x08\x13\x00\x08\x13\x00\x08\x13\
+\x00\x08\x13\x00\x08\x13\x00\x08\x13\x00\x08\x13\x00\x08\x13\x00\
+\x08\x3b\x4e\x0f\xd8\xa5\xbf\xd6\xed\x05\x4e\xbd\x5e\xcf\xa6\x2f\
+\x36\xea\x7a\xbd\xbd\xc0\xa9\x77\xeb\x34\x7d\xb1\x49\x87\xe9\x01\
+\x6c\xf6\x6a\xbd\x98\x9e\xb0\x43\xc7\xf5\x30\x3d\x61\x92\x57\x00\
+\x08\x13\x00\x08\x13\x00\x08\x13\x00\x08\x13\x00\x08\x13\x00\x08\
+\x13\x00\x08\x13\x00\x08\x13\x00\x08\x13\x00\x08\x13\x00\x08\x13\
+\x00\x08\x13\x00\x08\x13\x00\x08\x13\x00\x08\x13\x00\x08\x13\x00\
+\x08\x13\x00\x08\x13\x00\x08\x13\x00\x08\x13\x00\x08\x13\x00\x08\
+\x13\x00\x08\x13\x00\x08\x13\x00\x08\x13\x00\x08\x13\x00\x08\x13\
+\x00\x08\x13\x00\x08\x13\x00\x08\x13\x00\x08\x13\x00\x08\x13\x00\
+\x08\x13\x00\x08\x13\x00\x08\x13\x00\x08\x13\x00\x08\x13\x00\x08\
+\x13\x00\x08\x13\x00\x08\x13\x00\x08\x3b\x4c\x0f\x60\xb3\xeb\xf5\
+\xec\xec\x67\x3e\x59\x3f\x4f\x5f\x6b\xd8\xdd\x3a\x9d\xfd\xcc\xd7\
+\xeb\xe5\xf4\xb5\xb6\x12\x80\xb6\xa7\xeb\xcd\xf4\x84\x1d\xba\x5f\
+\x37\xd3\x13\xb6\xf2\x0a\x00\x61\x02\x00\x61\x02\x00\x61\x02\x00\
+\x61\x02\x00\x61\x02\x00\x61\x02\x00\x61\x02\x00\x61\x02\x00\x61\
+\x02\x00\x61\x02\x00\x61\x02\x00\x61\x02\x00\x61\x02\x00\x61\x02\
+\x00\x61\x02\x00\x61\x02\x00\x61\x02\x00\x61\x02\x00\x61\x02\x00\
+\x61\x02\x00\x61\x02\x00\x61\x02\x00\x61\x02\x00\x61\x02\x00\x61\
+\x02\x00\x61\x02\x00\x61\x02\x00\x61\x02\x00\x61\x02\x00\x61\x02\
+\x00\x61\x02\x00\x61\x02\x00\x61\x02\x00\x61\x02\x00\x61\x02\x00\
+\x61\x02\x00\x61\x02\x00\x61\x02\x00\x61\x02\x00\x61\x02\x00\xc0\
+\x19\x3d\x5f\xa7\x47\xf3\xb9\x9a\xfe\xb2\x66\x79\x02\x80\x30\x01\
+\x80\x30\x01\x80\x30\x01\x80\x30\x01\x80\x30\x01\x80\x30\x01\x80\
+\x30\x01\x80\x30\x01\x80\x30\x01\x80\x30\x01\x80\x30\x01\x80\x30\
+\x01\x80\x30\x01\x80\x30\x01\x80\x30\x01\x80\x30\x01\x80\x30\x01\
+\x80\x30\x01\x80\x30\x01\x80\x30\x01\x80\x30\x01\x80\x30\x01\x80\
+\x30\x01\x80\x30\x01\x80\x30\x01\x80\x30\x01\x80\x30\x01\x80\x30\
+\x01\x80\x30\x01\x80\x30\x01\x80\x30\x01\x80\x30\x01\x80\x30\x01\
+\x80\x30\x01\x80\x30\x01\x80\x30\x01\x80\x30\x01\x80\x30\x01\x80\
+\x30\x01\x80\x30\x01\x80\xb0\xe3\xf4\x00\x76\xe8\xcf\x75\x3b\x3d\
+\x61\xb3\xd3\xf4\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\xe5\x5f\xca\x81\xdb\xb6\
+\xea\xcd\xf7\x48\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\
+\x3a\x63\x72\x65\x61\x74\x65\x00\x32\x30\x32\x34\x2d\x30\x39\x2d\
+\x31\x37\x54\x31\x36\x3a\x34\x37\x3a\x34\x34\x2b\x30\x30\x3a\x30\
+\x30\xeb\xcb\x27\xa0\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\
+\x65\x3a\x6d\x6f\x64\x69\x66\x79\x00\x32\x30\x32\x34\x2d\x30\x39\
+\x2d\x31\x37\x54\x31\x36\x3a\x34\x37\x3a\x34\x34\x2b\x30\x30\x3a\
+\x30\x30\x9a\x96\x9f\x1c\x00\x00\x00\x28\x74\x45\x58\x74\x64\x61\
+\x74\x65\x3a\x74\x69\x6d\x65\x73\x74\x61\x6d\x70\x00\x32\x30\x32\
+\x34\x2d\x30\x39\x2d\x31\x37\x54\x31\x36\x3a\x34\x37\x3a\x34\x34\
+\x2b\x30\x30\x3a\x30\x30\xcd\x83\xbe\xc3\x00\x00\x00\x19\x74\x45\
+\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\
+\x6e\x6b\x73\x63\x61\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\
+\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x0c\x14\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\
+\x01\xc7\x6f\xa8\x64\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x0b\xa1\x49\x44\
+\x41\x54\x78\x9c\xed\xdd\xb1\x8e\x54\x87\x1d\xc5\xe1\xb3\x19\x85\
+\x06\xd6\x6f\x80\x45\x6d\xb6\xe0\x15\x42\xc0\x92\x79\x82\xf4\x71\
+\x81\x05\x38\x72\x1e\x24\x7d\x24\x28\xd2\xbb\x8e\x0b\xb0\xfc\x04\
+\x29\xcc\x42\x6d\x1e\x01\x21\x2c\x79\x91\x60\x53\x2c\x8a\x1c\x07\
+\x16\x85\x99\xdd\xff\x9d\x39\xdf\x27\xdd\xfe\xec\x88\x3b\xf7\xb7\
+\x77\x66\xb9\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x2c\xd7\xde\xf4\x00\xce\xdc\xf1\xf4\x80\x35\xf9\x37\
+\xca\x36\x73\xfe\xb1\x58\xbf\x9b\x1e\x00\x00\x9c\x3f\x01\x00\x00\
+\x85\x04\x00\x00\x14\x12\x00\x00\x50\x48\x00\x00\x40\x21\x01\x00\
+\x00\x85\x04\x00\x00\x14\x12\x00\x00\x50\x48\x00\x00\x40\x21\x01\
+\x00\x00\x85\x04\x00\x00\x14\x12\x00\x00\x50\x48\x00\x00\x40\x21\
+\x01\x00\x00\x85\x04\x00\x00\x14\x12\x00\x00\x50\x48\x00\x00\x40\
+\x21\x01\x00\x00\x85\x04\x00\x00\x14\x12\x00\x00\x50\x48\x00\x00\
+\x40\x21\x01\x00\x00\x85\x04\x00\x00\x14\x12\x00\x00\x50\x48\x00\
+\x00\x40\x21\x01\x00\x00\x85\x04\x00\x00\x14\x12\x00\x00\x50\x48\
+\x00\x00\x40\x21\x01\x00\x00\x85\x04\x00\x00\x14\x12\x00\xbb\xed\
+\x93\xe9\x01\x1b\xb0\x3f\x3d\x00\x3e\x92\xf3\x8f\x45\x13\x00\xbb\
+\xed\xd3\xe9\x01\x1b\x70\x79\x7a\x00\x7c\x24\xe7\x1f\x8b\x26\x00\
+\x76\xdb\xe7\xd3\x03\x36\xe0\xe6\xf4\x00\xf8\x48\xce\x3f\x60\xc4\
+\x2a\xc9\xd3\x24\xc7\x5b\x7e\x1c\xbe\xfd\x59\x60\x9b\x38\xff\x80\
+\x31\x5f\x67\xfe\xcd\x63\x53\xc7\x9d\x0d\xbf\x36\x70\xd6\x9c\x7f\
+\xc0\x88\x1b\x49\x5e\x65\xfe\x8d\x63\x53\xc7\x51\x92\x3f\x6e\xf4\
+\x15\x82\xb3\xe3\xfc\x03\xce\xdd\x2a\x27\xbf\x79\xec\xd2\x9b\xcf\
+\xaf\xdf\x84\xee\xc6\xed\x48\x96\xcb\xf9\x07\x9c\xab\x4b\x49\x0e\
+\x92\xfc\x35\xbb\xf1\x99\xe3\x87\x8e\x27\x49\xbe\x79\xfb\x33\x5f\
+\xda\xc0\xeb\x07\xeb\x70\xfe\xb1\xb5\xf6\xa6\x07\x6c\x81\xe3\xe9\
+\x01\x6c\x35\xe7\xd8\x7a\x9c\x7f\xac\xc3\xf9\x77\x0a\x7f\x06\x08\
+\x00\x85\x04\x00\x00\x14\x12\x00\x00\x50\x48\x00\x00\x40\x21\x01\
+\x00\x00\x85\x04\x00\x00\x14\x12\x00\x00\x50\x48\x00\x00\x40\x21\
+\x01\x00\x00\x85\x04\x00\x00\x14\x12\x00\x00\x50\x48\x00\x00\x40\
+\x21\x01\x00\x00\x85\x04\x00\x00\x14\x12\x00\x00\x50\x48\x00\x00\
+\x40\x21\x01\x00\x00\x85\x04\x00\x00\x14\x12\x00\x00\x50\x48\x00\
+\x00\x40\x21\x01\x00\x00\x85\x04\x00\x00\x14\x12\x00\x00\x50\x48\
+\x00\xc0\xd9\xda\x9f\x1e\xb0\xc5\x3e\x99\x1e\x00\xbb\x4c\x00\xc0\
+\xd9\xba\x3c\x3d\x60\x8b\x7d\x3a\x3d\x00\x76\x99\x00\x80\xb3\x75\
+\x73\x7a\xc0\x16\xfb\x7c\x7a\x00\xec\xb2\xbd\xe9\x01\x5b\xe0\x78\
+\x7a\x00\x5b\xed\x49\x92\x6b\x49\x5e\x4f\x0f\xd9\x32\xab\x24\x8f\
+\x93\x7c\x36\x3d\x84\xad\xe6\x1a\x77\x0a\x77\x00\xe0\x6c\x1d\x24\
+\xb9\x3d\x3d\x62\x0b\xdd\x89\x8b\x3f\x9c\x29\x75\xf4\x61\xee\x00\
+\xb0\xae\x57\x49\x6e\x25\xf9\x7e\x7a\xc8\x96\xb8\x91\xe4\x9f\x49\
+\x7e\x3f\x3d\x84\xad\xe7\x1a\x77\x0a\x77\x00\xe0\xec\x5d\xc8\xc9\
+\x05\xed\x6e\x4e\x6e\x6d\xf3\x6e\xab\x24\x5f\xc7\xc5\x1f\xce\x85\
+\x3a\xfa\x30\x77\x00\xd8\xa4\xa7\x49\x1e\x24\x79\x98\xe4\x59\x92\
+\x97\xa3\x6b\xe6\x5d\x4a\x72\x25\x27\x5f\xf8\xfb\x73\xdc\xf6\x67\
+\xb3\x5c\xe3\x4e\xe1\xc5\xf9\x30\x01\x00\xb0\x9d\x5c\xe3\x4e\xe1\
+\x23\x00\x00\x28\x24\x00\x00\xa0\x90\x00\x00\x80\x42\x02\x00\x00\
+\x0a\x09\x00\x00\x28\x24\x00\x00\xa0\x90\x00\x00\x80\x42\x02\xe0\
+\x74\x9e\x47\x0e\xb0\xbd\xf6\xa7\x07\x2c\x99\x00\x38\x9d\xe7\x91\
+\x03\x6c\xaf\xcb\xd3\x03\x96\x4c\x00\x9c\xce\xf3\xc8\x01\xb6\xd7\
+\xcd\xe9\x01\x4b\xe6\xbf\x49\x7c\x3f\xcf\x23\x07\xd8\x6e\x4f\x92\
+\x5c\x4b\xf2\x7a\x7a\xc8\x12\xb9\x03\xf0\x7e\x9e\x47\x0e\xb0\xdd\
+\x0e\x92\xdc\x9e\x1e\xb1\x54\xee\x00\xbc\x9b\xe7\x91\x03\xec\x86\
+\x57\x49\x6e\x25\xf9\x7e\x7a\xc8\xd2\x78\x36\xf9\x7f\x5b\x25\xb9\
+\x97\xe4\x1f\x71\xf1\x07\xd8\x05\xab\x24\x7f\x4a\xf2\x3c\xc9\xbf\
+\xe2\x09\xaf\xff\xe1\x0e\x80\xe7\x91\x03\xb4\x78\x9a\xe4\x41\x92\
+\x87\x49\x9e\x25\x79\x39\xba\x66\xd8\x79\x04\x80\xda\x02\x80\xff\
+\xdf\x99\x5e\xa3\x7d\x09\x10\x00\x0a\x09\x00\x00\x28\x24\x00\x00\
+\xa0\x90\x00\x00\x80\x42\x02\x00\x00\x0a\x09\x00\x00\x28\x24\x00\
+\x00\xa0\x90\x00\x00\x80\x42\x02\x00\x00\x0a\x09\x00\x00\x28\x24\
+\x00\x00\xa0\x90\x00\x00\x80\x42\x02\x00\x00\x0a\x09\x00\x00\x28\
+\x24\x00\x00\xa0\x90\x00\x00\x80\x42\x02\x00\x00\x0a\x09\x00\x00\
+\x28\x24\x00\x00\xa0\x90\x00\x00\x80\x42\x02\x00\x00\x0a\x09\x00\
+\x00\x28\x24\x00\x00\xa0\x90\x00\x00\x80\x42\x02\x00\x00\x0a\x09\
+\x00\x00\x28\x24\x00\x00\xa0\x90\x00\x00\x80\x42\x02\x00\x00\x0a\
+\x09\x00\x00\x28\x24\x00\x00\xa0\x90\x00\x00\x80\x42\x02\x00\x00\
+\x0a\x09\x00\x00\x28\x24\x00\x00\xa0\x90\x00\x00\x80\x42\x02\x00\
+\x00\x0a\x09\x00\x00\x28\x24\x00\x00\xa0\x90\x00\x00\x80\x42\x02\
+\x00\x00\x0a\x09\x00\x00\x28\x24\x00\x00\xa0\x90\x00\x00\x80\x42\
+\x02\x00\x00\x0a\x09\x00\x00\x28\x24\x00\x00\xa0\x90\x00\x00\x80\
+\x42\x02\x00\x00\x0a\x09\x00\x00\x28\x24\x00\x00\xa0\x90\x00\x00\
+\x80\x42\x02\x00\x00\x0a\x09\x00\x00\x28\x24\x00\x00\xa0\x90\x00\
+\x00\x80\x42\x02\x00\x00\x0a\x09\x00\x00\x28\x24\x00\x00\xa0\x90\
+\x00\x00\x80\x42\x02\x00\x00\x0a\x09\x00\x00\x28\x24\x00\x00\xa0\
+\x90\x00\x00\x80\x42\x02\x00\x00\x0a\x09\x00\x00\x28\x24\x00\x00\
+\xa0\x90\x00\x00\x80\x42\x02\x00\x00\x0a\x09\x00\x00\x28\x24\x00\
+\x00\xa0\x90\x00\x00\x80\x42\x02\x00\x00\x0a\x09\x00\x00\x28\x24\
+\x00\x00\xa0\x90\x00\x00\x80\x42\x02\x00\x00\x0a\x09\x00\x00\x28\
+\x24\x00\x00\xa0\x90\x00\x00\x80\x42\x02\x00\x00\x0a\x09\x00\x00\
+\x28\x24\x00\x00\xa0\x90\x00\x00\x80\x42\x02\x00\x00\x0a\x09\x00\
+\x00\x28\x24\x00\x00\xa0\x90\x00\x00\x80\x42\x02\x00\x00\x0a\x09\
+\x00\x00\x28\x24\x00\x00\xa0\x90\x00\x00\x80\x42\x02\x00\x00\x0a\
+\x09\x00\x00\x28\x24\x00\x00\xa0\x90\x00\x00\x80\x42\x02\x00\x00\
+\x0a\x09\x00\x00\x28\x24\x00\x00\xa0\x90\x00\x00\x80\x42\x02\x00\
+\x00\x0a\x09\x00\x00\x28\x24\x00\x00\xa0\x90\x00\x00\x80\x42\x02\
+\x00\x00\x0a\x09\x00\x00\x28\x24\x00\x00\xa0\x90\x00\x00\x80\x42\
+\x02\x00\x00\x0a\x09\x00\x00\x28\x24\x00\x00\xa0\x90\x00\x00\x80\
+\x42\x02\x00\x00\x0a\x09\x00\x00\x28\x24\x00\x00\xa0\x90\x00\x00\
+\x80\x42\x02\x00\x00\x0a\x09\x00\x00\x28\x24\x00\x00\xa0\x90\x00\
+\x00\x80\x42\x02\x00\x00\x0a\x09\x00\x00\x28\x24\x00\x00\xa0\x90\
+\x00\x00\x80\x42\x02\x00\x00\x0a\x09\x00\x00\x28\x24\x00\x00\xa0\
+\x90\x00\x00\x80\x42\x02\x00\x00\x0a\x09\x00\x00\x28\x24\x00\x00\
+\xa0\x90\x00\x00\x80\x42\x02\x00\x00\x0a\x09\x00\x00\x28\x24\x00\
+\x00\xa0\x90\x00\x00\x80\x42\x02\x00\x00\x0a\x09\x00\x00\x28\x24\
+\x00\x00\xa0\x90\x00\x00\x80\x42\x02\x00\x00\x0a\x09\x00\x00\x28\
+\x24\x00\x00\xa0\x90\x00\x00\x80\x42\x02\x00\x00\x0a\x09\x00\x00\
+\x28\x24\x00\x00\xa0\x90\x00\x00\x80\x42\x02\x00\x00\x0a\x09\x00\
+\x00\x28\x24\x00\x00\xa0\x90\x00\x00\x80\x42\x02\x00\x00\x0a\x09\
+\x00\x00\x28\x24\x00\x00\xa0\x90\x00\x00\x80\x42\x02\x00\x00\x0a\
+\x09\x00\x00\x28\x24\x00\x00\xa0\x90\x00\x00\x80\x42\x02\x00\x00\
+\x0a\x09\x00\x00\x28\x24\x00\x00\xa0\x90\x00\x00\x80\x42\x02\x00\
+\x00\x0a\x09\x00\x00\x28\x24\x00\x00\xa0\xd0\xde\xf4\x80\x02\x17\
+\x93\x5c\x49\x72\x23\xc9\x97\x49\x0e\x46\xd7\x00\x2c\xd7\x61\x92\
+\x07\x49\x1e\x25\x79\x96\xe4\xe7\xd1\x35\x3b\x4e\x00\x9c\xaf\x55\
+\x92\xdb\x49\xfe\x96\xe4\xc2\xf0\x16\x80\xa5\x38\x4a\xf2\x4d\x92\
+\xbf\x27\x79\x33\xbc\xa5\x86\x00\x98\x71\x3d\xc9\x77\x11\x01\x00\
+\x47\x49\xbe\x48\xf2\xc3\xf4\x90\x36\xab\xe9\x01\xa5\x7e\x4a\xf2\
+\x3c\xc9\xad\xe9\x21\x00\xc3\xee\x25\xf9\x76\x7a\x44\x23\x77\x00\
+\xe6\xac\x92\xfc\x98\xe4\xea\xf4\x10\x80\x21\x87\x49\xae\xc5\x6d\
+\xff\x11\xfe\x0a\x60\xce\xeb\x9c\x7c\xd9\x05\xa0\xd5\xfd\xb8\xf8\
+\x8f\x11\x00\xb3\x1e\x4e\x0f\x00\x18\xf4\x68\x7a\x40\x33\x1f\x01\
+\xcc\xda\x4f\xf2\x62\x7a\x04\xc0\x90\xfd\x24\x2f\xa7\x47\xb4\x12\
+\x00\xf3\x8e\xa7\x07\x00\x0c\x71\x0d\x1a\xe4\x23\x00\x00\x28\x24\
+\x00\x00\xa0\x90\x00\x00\x80\x42\x02\x00\x00\x0a\x09\x00\x00\x28\
+\x24\x00\x00\xa0\x90\x00\x00\x80\x42\x02\x00\x00\x0a\x09\x00\x00\
+\x28\x24\x00\x00\xa0\x90\x00\x00\x80\x42\x02\x00\x00\x0a\x09\x00\
+\x00\x28\x24\x00\x00\xa0\x90\x00\x00\x80\x42\x02\x00\x00\x0a\x09\
+\x00\x00\x28\x24\x00\x00\xa0\x90\x00\x00\x80\x42\x02\x00\x00\x0a\
+\x09\x00\x00\x28\x24\x00\x00\xa0\x90\x00\x00\x80\x42\x02\x00\x00\
+\x0a\x09\x00\x00\x28\x24\x00\x00\xa0\x90\x00\x00\x80\x42\x02\x00\
+\x00\x0a\x09\x00\x00\x28\x24\x00\x00\xa0\x90\x00\x00\x80\x42\x02\
+\x00\x00\x0a\x09\x00\x00\x28\x24\x00\x00\xa0\x90\x00\x00\x80\x42\
+\x02\x00\x00\x0a\x09\x00\x00\x28\x24\x00\x00\xa0\x90\x00\x00\x80\
+\x42\x02\x00\x00\x0a\x09\x00\x00\x28\x24\x00\x00\xa0\x90\x00\x00\
+\x80\x42\x02\x00\x00\x0a\x09\x00\x00\x28\x24\x00\x00\xa0\x90\x00\
+\x00\x80\x42\x02\x00\x00\x0a\x09\x00\x00\x28\x24\x00\x00\xa0\x90\
+\x00\x00\x80\x42\x02\x00\x00\x0a\x09\x00\x00\x28\x24\x00\x00\xa0\
+\x90\x00\x00\x80\x42\x02\x00\x00\x0a\x09\x00\x00\x28\x24\x00\x00\
+\xa0\x90\x00\x00\x80\x42\x02\x00\x00\x0a\x09\x00\x00\x28\x24\x00\
+\x00\xa0\x90\x00\x00\x80\x42\x02\x00\x00\x0a\x09\x00\x00\x28\x24\
+\x00\x00\xa0\x90\x00\x00\x80\x42\x02\x00\x00\x0a\x09\x00\x00\x28\
+\x24\x00\x00\xa0\x90\x00\x00\x80\x42\x7b\xd3\x03\xa8\x77\x31\xc9\
+\x95\x24\x37\x92\x7c\x99\xe4\x60\x74\x0d\x9c\xad\xc3\x24\x0f\x92\
+\x3c\x4a\xf2\x2c\xc9\xcf\xa3\x6b\x00\x16\x62\x95\xe4\x4e\x92\xa3\
+\x24\xc7\x0e\xc7\x0e\x1d\xbf\x24\xf9\x2a\xee\xba\xb2\x20\xee\x00\
+\xb0\x44\xd7\x93\x7c\x97\xe4\xc2\xf4\x10\xd8\x80\xa3\x24\x5f\x24\
+\xf9\x61\x7a\x08\xfc\xda\x6a\x7a\x00\xbc\xc3\x4f\x49\x9e\x27\xb9\
+\x35\x3d\x04\x36\xe0\x5e\x92\x6f\xa7\x47\xc0\x6f\xb9\x03\xc0\x52\
+\xad\x92\xfc\x98\xe4\xea\xf4\x10\x58\xc3\x61\x92\x6b\x49\xde\x4c\
+\x0f\x81\xdf\xf2\x79\x14\x4b\xf5\x3a\x27\x5f\x96\x82\x6d\x76\x3f\
+\x2e\xfe\x2c\x94\x00\x60\xc9\x1e\x4e\x0f\x80\x35\x3d\x9a\x1e\x00\
+\xef\xe3\x23\x00\x96\x6c\x3f\xc9\x8b\xe9\x11\xb0\x86\xfd\x24\x2f\
+\xa7\x47\xc0\xbb\x08\x00\x96\xee\x78\x7a\x00\xac\xc1\x7b\x2c\x8b\
+\xe5\x23\x00\x00\x28\x24\x00\x00\xa0\x90\x00\x00\x80\x42\x02\x00\
+\x00\x0a\x09\x00\x00\x28\x24\x00\x00\xa0\x90\x00\x00\x80\x42\x02\
+\x00\x00\x0a\x09\x00\x00\x28\x24\x00\x00\xa0\x90\x00\x00\x80\x42\
+\x02\x00\x00\x0a\x09\x00\x00\x28\x24\x00\x00\xa0\x90\x00\x00\x80\
+\x42\x02\x00\x00\x0a\x09\x00\x00\x28\x24\x00\x00\xa0\x90\x00\x00\
+\x80\x42\x02\x00\x00\x0a\x09\x00\x00\x28\x24\x00\x00\xa0\x90\x00\
+\x00\x80\x42\x02\x00\x00\x0a\x09\x00\x00\x28\x24\x00\x00\xa0\x90\
+\x00\x00\x80\x42\x02\x00\x00\x0a\x09\x00\x00\x28\x24\x00\x00\xa0\
+\x90\x00\x00\x80\x42\x02\x00\x00\x0a\x09\x00\x00\x28\x24\x00\x00\
+\xa0\x90\x00\x00\x80\x42\x02\x00\x00\x0a\x09\x00\x00\x28\x24\x00\
+\x00\xa0\x90\x00\x00\x80\x42\x02\x00\x00\x0a\x09\x00\x00\x28\x24\
+\x00\x00\xa0\x90\x00\x00\x80\x42\x02\x00\x00\x0a\x09\x00\x00\x28\
+\x24\x00\x00\xa0\x90\x00\x00\x00\x80\x73\x76\x31\xc9\xd5\x24\x7f\
+\x49\x72\x98\xe4\x78\xc7\x8f\xc7\x6f\x7f\xd6\xab\x6f\x7f\x76\x00\
+\xa8\xb7\x4a\x72\x27\xc9\x51\xe6\x2f\xd4\x9b\x3e\x7e\x49\xf2\x55\
+\xdc\x75\x04\x80\xf7\xba\x9e\xdd\x8a\x80\x5f\x92\xfc\x61\xa3\xaf\
+\x10\x00\xec\xa8\xbb\x99\xbf\x70\x6f\xea\xb8\xbd\xe1\xd7\x06\x00\
+\x76\xd6\x2a\xc9\x93\xcc\x5f\xbc\xd7\x3d\x1e\xc7\x6d\x7f\x58\x24\
+\x27\x26\x2c\xd3\xeb\x24\x0f\xa6\x47\x6c\xc0\xfd\x24\x6f\xa6\x47\
+\x00\xc0\x36\x39\xc8\xfc\x6f\xf0\xeb\x1e\x9f\x6d\xfc\x55\x01\x36\
+\x62\x6f\x7a\x00\xf0\x5e\xfb\x49\x5e\x4c\x8f\x58\xd3\x7e\x92\x97\
+\xd3\x23\x80\xff\x25\x00\x60\xd9\x8e\xa7\x07\xac\xc9\x7b\x0c\x2c\
+\x94\xef\x00\x00\x40\x21\x01\x00\x00\x85\x04\x00\x00\x14\x12\x00\
+\x00\x50\x48\x00\x00\x40\x21\x01\x00\x00\x85\x04\x00\x00\x14\x12\
+\x00\x00\x50\x48\x00\x00\x40\x21\x01\x00\x00\x85\x04\x00\x00\x14\
+\x12\x00\x00\x50\x48\x00\x00\x40\x21\x01\x00\x00\x85\x04\x00\x00\
+\x14\x12\x00\x00\x50\x48\x00\x00\x40\x21\x01\x00\x00\x85\x04\x00\
+\x00\x14\x12\x00\x00\x50\x48\x00\x00\x40\x21\x01\x00\x00\x85\x04\
+\x00\x00\x14\x12\x00\x00\x50\x48\x00\x00\x40\x21\x01\x00\x00\x85\
+\x04\x00\x00\x14\x12\x00\x00\x50\x48\x00\x00\x40\x21\x01\x00\x00\
+\x85\x04\x00\x00\x14\x12\x00\x00\x50\x48\x00\x00\x40\x21\x01\x00\
+\x00\x85\x04\x00\x00\x14\x12\x00\x00\x50\x48\x00\x00\x40\x21\x01\
+\x00\x00\x85\x04\x00\x00\x14\x12\x00\x00\x50\x48\x00\x00\x40\x21\
+\x01\x00\x00\x85\x04\x00\x00\x14\x12\x00\x00\x50\x48\x00\x00\x40\
+\x21\x01\x00\x00\x85\x04\x00\x00\x14\x12\x00\x00\x50\x48\x00\x00\
+\x40\x21\x01\x00\x00\x85\x04\x00\x00\x14\x12\x00\x00\x50\x48\x00\
+\x00\x40\x21\x01\x00\x00\x85\x04\x00\x00\x14\x12\x00\x00\x50\x48\
+\x00\x00\x40\x21\x01\x00\x00\x85\x04\x00\x00\x14\x12\x00\x00\x50\
+\x48\x00\x00\x40\x21\x01\x00\x00\x85\x04\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x8b\xf2\x6f\xd2\
+\x27\x68\x81\x31\x10\xf6\x4f\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
+\x42\x60\x82\
+\x00\x00\x0f\x94\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x03\x00\x00\x00\xc3\xa6\x24\xc8\
+\x00\x00\x00\x03\x73\x42\x49\x54\x08\x08\x08\xdb\xe1\x4f\xe0\x00\
+\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0c\xde\x00\x00\x0c\xde\x01\
+\x13\x50\x10\x7a\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\
+\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\
+\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x02\xe5\x50\x4c\x54\
+\x45\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\xb9\x0d\x5f\x2c\x00\x00\x00\xf6\x74\x52\
+\x4e\x53\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\
+\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\
+\x1e\x1f\x20\x21\x22\x23\x24\x25\x26\x27\x28\x29\x2a\x2c\x2d\x2e\
+\x2f\x30\x31\x32\x33\x34\x35\x37\x38\x39\x3a\x3b\x3c\x3d\x3e\x3f\
+\x40\x41\x42\x43\x44\x45\x46\x47\x48\x4b\x4c\x4d\x4e\x4f\x50\x51\
+\x52\x53\x54\x55\x56\x57\x58\x59\x5a\x5b\x5c\x5d\x5e\x5f\x60\x61\
+\x62\x63\x64\x65\x66\x67\x68\x69\x6a\x6b\x6c\x6d\x6e\x6f\x70\x71\
+\x72\x73\x74\x75\x76\x77\x78\x79\x7a\x7b\x7c\x7d\x7e\x7f\x80\x81\
+\x82\x83\x85\x86\x87\x88\x89\x8a\x8c\x8d\x8e\x8f\x90\x91\x92\x93\
+\x94\x95\x96\x97\x98\x99\x9a\x9b\x9c\x9d\x9e\x9f\xa0\xa1\xa2\xa3\
+\xa4\xa5\xa6\xa7\xa8\xa9\xaa\xab\xac\xad\xae\xb0\xb1\xb2\xb3\xb5\
+\xb6\xb7\xb8\xb9\xbb\xbc\xbd\xbe\xbf\xc0\xc1\xc2\xc3\xc4\xc5\xc6\
+\xc7\xc8\xc9\xca\xcb\xcc\xcd\xce\xcf\xd0\xd1\xd2\xd3\xd4\xd5\xd6\
+\xd7\xd8\xd9\xda\xdb\xdc\xdd\xde\xdf\xe0\xe1\xe2\xe3\xe4\xe5\xe6\
+\xe7\xe8\xe9\xea\xeb\xec\xed\xee\xef\xf0\xf1\xf2\xf3\xf4\xf5\xf6\
+\xf7\xf8\xf9\xfa\xfb\xfc\xfd\xfe\x2c\x15\x77\xd9\x00\x00\x0b\x1f\
+\x49\x44\x41\x54\x78\xda\xed\xdd\x7b\x8c\x54\xd5\x01\xc0\xe1\x99\
+\x7d\xc0\xb2\xf2\x58\xd0\x22\x82\x82\xa8\x20\x50\xd0\x82\xa2\x16\
+\x9f\x14\xa9\x4d\xaa\x16\xa5\x45\x4c\x80\x5a\x45\x1a\x6d\x6c\xaa\
+\x55\xdb\xfe\x55\x63\x54\xb4\x56\xab\x69\x62\xad\xda\x56\x0d\x45\
+\x12\x23\x2a\x36\xa5\x45\x24\x54\xbb\x6a\xab\x08\x82\x8d\x96\xd6\
+\x07\x3e\x10\x16\xdc\x5d\x40\xe4\xb1\xaf\x1a\x44\x8b\x98\x65\xee\
+\x99\xf5\xe0\x1d\xee\xf7\x45\x83\x98\x33\xc3\x99\x7b\x7e\x73\xee\
+\x9d\x25\xb9\x93\xcb\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x10\x20\x1f\xff\x8f\x38\x65\xca\
+\xa8\xfd\x0a\x8d\x69\x5b\xb5\xec\x81\xe5\x19\x3a\xea\x67\x8d\x1b\
+\x71\x68\xc1\x43\xbf\xe9\x9f\x7f\xa8\xdd\x07\x02\x38\xf1\xb1\xaa\
+\x44\xe3\x9a\x6e\x9c\x99\x95\xf5\x1f\x77\xed\xc8\x64\x03\xb7\x9e\
+\xfd\xf7\xd8\x73\x29\x8f\xfe\x6a\xef\x1c\x94\x70\x26\xa7\xbe\xfd\
+\x62\x36\xd6\x7f\xda\x1f\x0f\x4a\x38\xb2\xe2\xe0\xd9\x25\xbf\x03\
+\xf4\x7c\x33\x71\x63\x1b\x87\xaf\xcf\xc2\xfa\x9f\x33\x2b\xf9\x41\
+\x6f\x1d\xf0\x5e\xe4\xd9\x94\xc5\x7e\xb9\x07\x27\xdf\x63\xba\x8f\
+\xce\xc4\x06\xf0\xc3\x80\x37\x5d\x59\xbf\x5c\xa9\x07\xd0\x33\x60\
+\xec\xa8\x2c\xac\x7f\xbf\xe3\x62\x1d\xbe\x74\x06\x50\x15\x30\xb6\
+\x47\x26\x02\x08\x3a\xeb\x76\x2e\xf9\x00\x52\xf6\x99\x94\x34\x07\
+\x40\xc6\x03\xb0\x03\x08\x00\xa7\x00\xec\x00\x08\x00\x01\xe0\x1a\
+\x00\x3b\x00\x02\xc0\x29\x00\x3b\x00\x02\x40\x00\xb8\x06\xc0\x0e\
+\x80\x00\x70\x0a\xc0\x0e\x80\x00\x70\x0a\xc0\x0e\x80\x00\x10\x00\
+\xae\x01\xb0\x03\x20\x00\x9c\x02\xb0\x03\x20\x00\x9c\x02\xb0\x03\
+\xf0\x85\x05\xb0\x2d\x60\x6c\x5d\x16\x8e\xf8\xc6\xa0\xd1\x0d\x25\
+\x1f\x40\x7d\xc0\xd8\x15\x59\x08\xe0\x95\xb5\x41\xa3\x4b\x3e\x80\
+\xb7\x9a\x13\x0f\xdd\xb0\x30\x13\x9b\xee\x23\x01\x63\x9f\xdb\x54\
+\xf2\x01\x34\x2e\x4a\x3c\xf4\xca\xd5\x99\x08\xe0\x67\xcf\x26\x1f\
+\xfb\xd3\xe8\xb3\x89\x7f\xa7\xd0\xe5\x67\x75\x4b\x76\xae\xb8\x64\
+\x4e\x36\x2e\xbb\x9a\xff\x3c\x60\x68\xc2\xeb\xa7\xcb\xe7\xed\x0b\
+\x17\xde\x7d\x4e\x3f\xa6\xe0\xcd\xa2\x73\x6b\x5f\x78\xea\xe3\xdb\
+\x84\xe6\x0f\xed\xd4\xb6\xbb\xdc\xa7\x7f\xdb\xd4\x92\xc2\x85\xed\
+\x9c\xff\x50\xee\xd3\xff\xec\xf6\x9b\xd5\x4d\x1f\x0d\x1d\x73\xfe\
+\x88\x23\xf2\x9f\x79\x55\xbb\xbd\xd0\xba\xa5\x0f\xed\x85\x8b\xa2\
+\xd4\x7d\xf2\x1a\x74\xf3\x57\x0b\xef\x18\x4d\x2f\x2f\xb9\xf5\xd5\
+\x54\x4d\xfb\xcc\x69\xc7\x24\xb8\x01\xf0\xb6\x17\x6f\x58\x90\xb2\
+\xe3\x9d\xb6\x00\xbe\x36\xa7\x6b\xb2\x81\x5b\x6f\xba\x29\x3d\xb3\
+\xae\xbe\xfb\x9c\x84\x23\x5b\x2f\xbf\x5b\x00\x7b\xb0\xdf\x92\xfe\
+\x89\xc7\xfe\xf8\x37\xa9\x99\xf6\xed\x17\x27\xff\x31\xc0\xb0\xfa\
+\x54\x1d\xf1\x94\xfd\x28\x78\x6a\xf2\xf5\xcf\xdd\x34\x2c\x2d\xb3\
+\x1e\x9d\x7c\xfd\x73\xdd\xa7\xe6\x04\xd0\xbe\xa3\x02\xc6\x56\x8c\
+\x4b\xcb\xac\x4f\x0b\x19\x3c\x4c\x00\x7b\x70\x78\xc8\xe0\xe3\xd3\
+\x32\xeb\x91\x21\x83\x0f\x15\xc0\x1e\x74\x0a\x19\xdc\x35\x2d\xb3\
+\xae\x8e\xf6\x12\x33\x17\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\
+\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\
+\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x29\x0f\x20\xe8\xc6\
+\xa5\x9d\xd3\x32\xeb\xaa\x90\xc1\x3d\x04\xd0\xbe\x5e\x47\x87\x8c\
+\x3e\x24\x2d\xd3\x1e\x18\x32\x78\xc8\x20\x01\xb4\xeb\xbc\xca\x90\
+\xd1\xfd\x7b\xa7\x63\xd6\xfd\xfb\x05\x0d\xbf\x2c\x55\xf7\x66\x2c\
+\x4f\xd3\x64\x7e\x34\x33\xa8\xc7\xb2\xb6\x45\xa9\x98\xf6\xaf\x46\
+\x04\x0d\x1f\x35\xe4\x2f\xcd\x02\xf8\xec\x09\x7d\xf0\x05\x37\x4f\
+\x09\xdc\x8f\x4e\xe8\xf9\xca\xa6\x2f\x7a\xde\x15\x43\xef\x38\x37\
+\xf0\x21\xc3\xa6\xf7\xad\xdf\xb4\x3d\x25\xc7\x7d\x2f\x6c\x47\xe3\
+\xa7\x1d\x53\xf8\x4f\xe9\xba\x7f\x71\x4f\xbe\x79\xfd\x17\x7c\xfc\
+\xfa\x56\x14\xf7\xc0\xc6\x0d\x05\x87\x34\xd7\xde\xff\xf4\x3e\x10\
+\xc0\xb1\x8b\x7d\xd4\x2c\xd6\x07\x63\x56\x96\xfe\x29\xe0\xae\xc3\
+\x2c\x64\xb1\x2a\x7b\xcf\x2d\xfd\x4f\x01\x43\xac\x63\xf1\x06\x97\
+\xfe\x29\xa0\xbc\xb1\xdc\x3a\x16\x7f\x0e\x38\xa0\xe4\x77\x80\x83\
+\xac\x7f\x07\x54\x1f\x54\xfa\x01\x58\xc5\x8e\x18\x58\xf2\x01\xd4\
+\x58\xc4\x8e\xe8\x5a\xf2\x01\xf8\x3e\xe0\x74\xf3\x19\x5d\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\
+\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\
+\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\xa0\x63\xba\x94\x7c\x00\xa7\x59\xc4\x8e\xf8\x4e\xec\x3f\x20\
+\xf6\x1d\x5c\x7a\xad\xe8\x69\x15\x3b\xa0\xe9\x8c\x67\xe3\xfe\x01\
+\x71\x6f\xe2\xd6\x69\xfa\x03\xbd\x2c\x62\x87\xd6\x67\x6a\xaf\x97\
+\x37\xa6\x6e\x07\xa8\x3c\xae\xf0\xcd\xdf\xf2\x7d\x0f\x1b\x78\x78\
+\xff\x22\xfa\xaa\xab\x6d\x29\x38\x66\xc0\xb1\xe9\xbb\xf7\x54\xdb\
+\xd2\xd7\x0a\x8e\xa9\x38\xa9\x98\x1b\x3f\xbe\xfc\xd4\xea\xba\xf7\
+\x0b\x8e\x6a\x7d\x7a\xcd\x5e\x0a\x60\xf0\xb5\x63\xbb\x45\x3b\x8c\
+\xcd\xd3\x1e\x6b\x49\x30\xac\xf7\x94\x6b\x2a\x52\xb5\xfc\x2d\xd7\
+\xdf\x9b\xe4\xf8\x57\x9c\xfb\xfb\x68\x57\x5d\xcd\x77\x5e\xbd\x57\
+\x4e\x01\xdf\x9f\x3d\x3c\xe2\x97\xf5\x5c\x77\x4f\x5b\x92\x61\x9b\
+\x9f\xa9\xfd\x46\x75\x8a\xd6\x7f\xc3\xf9\xf7\xbd\x9f\x64\x5c\xeb\
+\xbf\xba\x8c\x89\x76\x3d\x3f\x7a\x5e\x5d\xfc\x1d\xa0\xec\xbe\x89\
+\x31\x0f\x64\xc3\x80\xc4\x5f\xa6\x71\xf4\x93\x95\xe9\x79\xff\x8f\
+\x4f\x7c\xa9\x56\xf5\xd6\x7e\xf1\xde\x3d\x37\xc4\xff\x18\x38\x33\
+\xea\xfa\xe7\x16\x25\xff\x32\x95\x17\x67\xa6\x67\x03\xb8\x2d\xf9\
+\xa5\xfa\xd6\x88\x5f\x73\x53\xcc\x07\xae\xc0\x00\x2e\xbe\x2c\xee\
+\x91\x7c\x2a\x60\xec\x2f\xdf\x48\xcb\xfa\xbf\x7d\x5d\xc0\xe0\xc5\
+\xf1\xe6\xb1\x7f\xf4\x00\xf2\x57\x45\x3e\x94\x21\x17\xb2\xcd\x8b\
+\xd3\x12\xc0\xe2\x6d\x01\x83\x57\xc7\x9b\x47\x4d\xf4\x00\xc6\x1c\
+\x1c\xf9\x50\x36\x84\x0c\xae\x4d\x4b\x00\xb5\xd1\x5e\x62\xda\x4e\
+\x01\xa7\xc4\x3e\x94\x21\x6f\xa5\xdc\xba\xb4\x04\xf0\x6e\xc8\xe0\
+\xad\xf1\xe6\x51\x15\x3d\x00\x5f\xfe\xb0\xcf\xf1\xb7\x81\x02\x40\
+\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\
+\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\
+\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\
+\x10\x40\xcc\xe9\x54\x96\xe4\xac\xf3\xa5\x1c\x40\xf4\x7b\x33\x06\
+\xdd\xe7\x6a\x5c\x5a\x0e\x62\xd0\x9d\x73\x22\xde\x3c\xf9\xb0\xf2\
+\xd8\x01\xf4\x8f\x7d\x28\x87\x07\x8c\x1d\x7a\x4e\x5a\x02\x98\xd8\
+\x2f\x64\xda\xf1\xe6\xd1\xed\x17\xe1\x5f\x2f\x10\xd2\x4c\x59\xff\
+\x19\x7d\x22\x1f\xca\x51\x2b\x5e\x4f\x74\xab\xd8\xae\x43\x8e\x9f\
+\xfc\xdb\x9a\xb4\x04\xd0\x63\x5a\x73\xb7\x8a\xcd\x89\xee\x71\x99\
+\x3f\xed\x96\xaa\x78\x13\x19\x7d\x61\x75\x55\xd7\xfc\x96\xb6\x80\
+\x87\x7c\x74\x46\xaa\x1c\x3b\xe1\xf8\x82\x7b\x41\xc5\x21\x9d\xf6\
+\xc2\xc1\xdc\x52\x9f\xe0\xa6\xbb\x35\x07\xa6\xef\x6a\xaa\x6d\xed\
+\x86\xc2\x83\xba\xd4\x74\x8f\x3f\x93\xd6\x75\x8d\x85\xc7\x3c\x37\
+\x6f\xd1\xd6\x4f\x02\x18\x3a\xfb\x48\x97\xc3\x99\xf3\xc6\xd4\x25\
+\x3b\x4f\x01\x67\xcf\xed\xeb\x70\x64\x4f\xcd\x94\xc6\xe7\x77\x04\
+\x30\x69\x56\x67\x47\x23\x8b\xca\xcf\xd8\xf2\xcc\x87\xa7\x80\x2f\
+\xff\xad\xda\xb1\xc8\xa8\x96\x09\x4f\xe4\xbb\xd6\x0e\x72\x20\x32\
+\xab\xfe\xd8\xf2\x49\x17\x38\x0c\xd9\xd5\x65\x75\xd9\xb7\x1c\x85\
+\x2c\x9b\x90\x6f\x70\x05\x98\x65\x6d\x65\xd6\x3f\xd3\xf2\xfe\x3a\
+\x38\xe3\x04\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\
+\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\
+\x00\x08\x80\xf4\xa8\x08\x1c\xbf\xfd\xf1\x35\x1b\x37\x6e\xd8\xd0\
+\x54\x78\x64\xe7\x9a\x9a\xee\x35\xc7\xf9\x2a\x92\x8e\xaa\x7b\xb2\
+\xa1\xb1\xa1\x61\x73\xe1\x81\xf9\x1e\x3d\x6b\x6a\xbe\x74\x7a\x55\
+\xd4\x00\x6e\xbc\x63\x7d\xd0\xf8\xfc\xd7\x67\x77\xb1\x86\x1d\xd0\
+\x7a\xc5\xfd\x5b\x83\x1e\xd0\xfb\x27\x97\x84\xad\xd0\x07\x21\xa3\
+\x17\x4c\x08\x7e\x05\x77\x4e\xb3\x8a\x1d\x30\x6f\x72\xf0\x9e\xfe\
+\x52\xd0\x97\xfb\x85\x5d\x03\x2c\x0d\x7f\x05\x8f\x5a\xc4\x8e\x98\
+\x15\xfc\x88\xe6\x07\x23\x5e\x04\xb6\x84\xbf\x82\x16\x8b\xd8\x11\
+\xdb\xc3\x1f\xb2\xcd\xa7\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\
+\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\
+\x00\x10\x00\x02\x40\x00\x94\xa8\x8a\xb4\x4d\xa8\xa9\x61\xcb\x3e\
+\x7c\xb8\x7b\x76\x17\xc0\x1e\xd5\x5f\xb4\xa0\x6d\x9f\x7e\xc3\xf5\
+\x3a\xf9\xaa\x51\x4e\x01\xed\xfb\xf5\x5f\xf7\xed\xf5\xcf\xd5\x3f\
+\x7a\xd2\x03\x02\x68\xdf\x8a\x0c\x9c\x75\x2f\xfd\xaf\x00\xda\xd5\
+\x90\x81\x00\xb6\x3d\x21\x80\x76\x65\xe2\xde\xe2\x2f\x08\x20\xdb\
+\xb6\x08\x20\xdb\xf2\x02\x10\x80\x00\x04\x20\x00\x01\x08\x40\x00\
+\x02\x10\x80\x00\x04\x20\x00\x01\x08\x40\x00\x02\x10\x80\x00\x10\
+\x80\x1d\x40\x00\x02\x10\x80\x00\x04\x20\x00\x01\x08\x40\x00\x02\
+\x10\x80\x00\x04\x20\x00\x01\x08\x40\x00\x02\x10\x80\x00\x04\x20\
+\x00\x01\x20\x00\x3b\x80\x00\x04\x20\x00\x01\x08\x40\x00\x02\x10\
+\x80\x00\x04\x20\x00\x01\x14\x11\xc0\xf6\x90\xd1\xad\x56\x2f\xfd\
+\x01\x04\xdd\x64\x63\x7b\xd9\xc2\x90\xe1\x9b\xc2\xa7\x13\xf6\x90\
+\x0d\x02\xe8\xf0\x11\xaf\x0b\x19\xbc\xb0\xec\xe1\x90\xe1\x8d\xe1\
+\xd3\x59\x15\x32\xb8\x61\x65\x16\x02\x08\xb9\x43\xc8\xdb\xe1\x4f\
+\xff\x4e\xc8\xe0\x87\xcb\x1e\x59\x1e\xf7\x0d\xfa\xee\x5b\x01\x83\
+\xe7\xb7\x65\x21\x80\x97\x02\xb6\xf3\xd5\xe1\x4f\xbf\x26\x60\xec\
+\xf2\x47\xca\x36\x4f\x0a\xd8\x32\x36\x86\x4f\xa7\xed\xb6\xe4\x63\
+\x5f\xbf\x32\x13\xd7\x00\xcb\x93\x5f\x77\xad\x2e\xe2\xae\x59\xef\
+\x06\x9c\x2d\x26\x6d\x2e\xcb\xbd\x79\x5e\xf2\xf7\xf5\xba\x22\x5e\
+\xee\xef\xe6\x24\x1d\xf9\xdc\xb7\x1b\x33\x11\x40\xe3\x2d\x71\x4e\
+\xa0\x1f\xaf\xea\xe6\xc4\x1b\xfa\x79\x6f\xee\xb8\x20\x19\x70\xcf\
+\x89\x09\x57\xe8\xd4\xa2\x5e\xf0\xc4\x93\x87\x75\xca\xe5\xff\x6f\
+\xd7\xff\xfe\xe4\x37\xf5\xcb\x17\xcd\xfe\xe8\x43\x46\xa7\x5c\xdb\
+\x0e\xfb\x6e\x01\x9d\xe7\x9f\x90\x70\xe4\x8c\x59\x45\x3c\xfd\x35\
+\x57\x27\x1b\x57\x3b\x7d\xd5\xce\x2b\xd2\xf2\x2b\xa6\x1e\x91\xe0\
+\x01\x6b\x2f\x5a\x14\xfd\xd8\x8c\x9f\x31\xb2\xef\x27\x67\x8f\x30\
+\xed\xef\x5b\xcb\x16\x3e\xb9\xf7\x2e\xf1\xf3\x65\x3b\xe5\x77\xfd\
+\x35\xbf\xe3\xdf\xca\x93\xcf\xac\x3b\xbf\x29\x97\xab\xfc\xf9\x0f\
+\x3a\x27\x39\x7d\xfe\x69\x72\x31\x6f\x83\x1e\x0f\x8d\x49\x30\xea\
+\x3f\xb3\x6e\x6d\xd9\xe5\x23\xc9\x90\x51\x05\x7f\x24\xb4\x61\xc1\
+\xb6\xe8\x47\xef\xf6\xe9\x71\x9e\x78\xee\x95\x6b\x02\x1f\xd1\xfd\
+\x7b\x43\xca\x73\xf9\x9d\xab\xf8\xe1\xaf\xf9\x5d\x56\x72\xd7\x5f\
+\x77\xff\x1f\x05\x9f\xf8\xbb\x0f\xee\xd8\xe6\x46\x1e\x51\xf0\xd3\
+\x60\xeb\xd3\x6f\x14\xf9\x72\xbf\x32\xbc\xe0\xd5\xe5\x92\x95\x7b\
+\xe5\x87\x12\x81\x2e\xfd\x65\xac\x67\x5e\x36\x36\xac\xde\xbe\x8f\
+\x0f\x8c\x34\x93\xeb\xaf\x4f\xd5\x21\x2f\x4f\xd3\x64\x7a\x3e\x5c\
+\x19\xeb\xa9\xfb\x54\x07\xfd\xc4\x2b\x77\xd7\x09\xb1\x66\xb2\x72\
+\x7e\xaa\x02\x48\xd5\xdf\x05\x8c\xaa\x8e\xf7\xdc\x93\xc3\x2e\xd3\
+\xce\x8c\x36\x91\x03\x73\x02\x68\xcf\x51\x11\x9f\xbb\xf7\xe0\x90\
+\xd1\x47\xc6\xdb\x19\xf7\x17\x40\xbb\xaa\x63\x3e\x79\x9f\x90\xc1\
+\x35\x19\x39\xe9\xfa\xeb\xe0\xcc\x4b\x55\x00\x6d\xd6\xc3\x0e\x80\
+\x1d\x00\x3b\x00\x76\x00\xec\x00\xd8\x01\xb0\x03\x20\x00\x9c\x02\
+\xb0\x03\x60\x07\xc0\x0e\x80\x1d\x00\x3b\x00\x76\x00\xec\x00\xd8\
+\x01\xb0\x03\x60\x07\xc0\x0e\x80\x00\x70\x0a\xc0\x0e\x80\x1d\x00\
+\x3b\x00\x76\x00\xec\x00\xd8\x01\xb0\x03\x60\x07\x20\xf3\x3b\x40\
+\x5b\x4a\x52\x6c\x13\x40\xbb\xb6\xc7\x7c\xf2\xa0\xfb\x50\xbf\x16\
+\x6f\x1e\x9b\x05\xd0\xae\x7f\xc7\x7c\xee\xb5\x21\xa3\xdf\x79\x35\
+\xda\x44\x1a\x04\xd0\xae\xe5\x11\xb7\xc7\x07\xc3\x86\x3f\x14\x6d\
+\x22\xab\x04\xd0\xfe\x9b\xe3\xde\x78\x6d\x05\xde\x82\x72\xe6\x4b\
+\xb1\x66\xb2\x28\x5d\x01\xa4\xeb\x4e\xa1\x07\x2c\x8d\x74\x13\xb5\
+\xf7\xbe\xb9\x3c\xf0\x11\x23\xe6\xf7\x8a\x32\x93\x75\x83\xb7\xd9\
+\x01\xda\xb5\x7e\x7c\x9c\xaf\x0c\x59\x76\x72\xe8\xfa\xe7\x56\x9c\
+\xf4\x42\x94\xa9\xcc\xd8\x66\x07\xd8\x93\x9a\x0b\x4f\x19\xf1\x39\
+\x47\xd9\xfc\x8f\xf9\x73\xb7\x14\xf1\xb8\xaa\x89\x63\x47\x77\xfa\
+\x7c\xa7\xd2\xfa\xfc\x9c\xf9\x39\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x4a\xd8\xff\x00\xe8\
+\xa5\x49\x72\xcb\x41\x7d\x0e\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
+\x42\x60\x82\
+\x00\x00\x0a\xa5\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x4b\x97\x00\x00\x4b\x97\
+\x01\xee\xc5\x6f\x20\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x0a\x32\x49\x44\
+\x41\x54\x78\x9c\xed\xd9\x3f\xab\xa5\xd5\x1d\x86\xe1\xdf\x0c\xdb\
+\x0c\x04\x42\x62\x91\x42\xc1\xc2\x40\xba\x54\x92\x6a\xa6\x10\x24\
+\x4d\x50\x53\x84\xa0\xa5\x60\x93\x2a\xf8\x15\x52\xfb\x15\xd2\xa4\
+\x56\x11\x19\x0d\xe9\x12\x0b\xbf\x82\x08\xc2\x24\xa6\x13\x1b\x0b\
+\x09\x72\x26\xe2\xa4\x98\xa4\x08\x73\x66\x08\x9e\x75\x66\x9d\xbd\
+\xef\xeb\x82\x55\xbf\x0f\x6b\xff\xe1\x86\x77\x06\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xae\x90\x6b\
+\x1b\x9e\xf9\xc9\xcc\xfc\x70\xc3\x73\x2f\xc3\x2b\x33\xf3\xd1\xee\
+\x11\x70\x24\x7e\x3e\x33\xb7\x77\x8f\x58\xe4\x6c\x66\x9e\xdd\x3d\
+\x02\x2e\xe2\xb0\xe1\x99\x4f\xcd\xe9\x04\xc0\x8d\xdd\x03\xe0\x88\
+\x7c\x6f\xee\xff\xfe\x4f\xc1\xdd\xdd\x03\xe0\xa2\xae\xef\x1e\x00\
+\x00\x3c\x7e\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\
+\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\
+\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\
+\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\
+\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\
+\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\
+\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\
+\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\
+\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\
+\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\
+\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\
+\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\
+\x90\x00\x00\x80\x20\x01\x00\x00\x41\xd7\x36\x3c\xf3\x97\x33\xf3\
+\xc4\x86\xe7\x5e\x86\xe7\x67\xe6\xa7\xbb\x47\x2c\xf2\xc7\x99\x79\
+\x77\xf7\x08\x1e\xf0\xd2\xcc\xfc\x76\xf7\x88\x45\x9e\x9c\x99\x5b\
+\xbb\x47\x2c\x72\x77\x66\x6e\xec\x1e\x01\x17\x71\xd8\xf0\xcc\x3f\
+\x6f\x78\xe6\x65\x79\x63\x66\x5e\xd8\x3d\x62\x91\x8f\x76\x0f\xe0\
+\x5c\xcf\xce\xfd\x08\x00\x58\xca\x2b\x00\x00\x08\x12\x00\x00\x10\
+\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\
+\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\
+\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\
+\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\
+\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\
+\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\
+\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\
+\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\
+\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\
+\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\
+\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\
+\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\
+\x00\x08\xba\xb6\x7b\xc0\x91\x7b\x6d\x66\x7e\xb2\x7b\xc4\x22\x5f\
+\xce\xcc\x8f\x76\x8f\xe0\x01\x3f\x98\x99\xaf\x76\x8f\x58\xe4\x99\
+\x99\x79\x7d\xf7\x88\x45\xee\xce\xcc\x8d\xdd\x23\x00\x56\x78\x73\
+\x66\xee\x39\x57\xee\xdc\x79\xd4\x87\x76\x64\x6e\xce\xfe\xfb\x5c\
+\x75\xce\x16\xdf\x0d\x3c\x76\x5e\x01\x00\x40\x90\x00\x00\x80\x20\
+\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\
+\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\
+\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\
+\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\
+\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\
+\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\
+\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\
+\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\
+\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\
+\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\
+\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\
+\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\
+\x40\xd0\x61\xf7\x80\x23\x76\x7d\x66\x5e\xdc\x3d\x62\xa1\xbf\xcd\
+\xcc\x07\xbb\x47\x2c\xf2\xf4\xcc\x3c\xb7\x7b\x04\x27\xed\xfa\xcc\
+\xbc\xbc\x7b\xc4\x42\x1f\xce\xcc\x57\xbb\x47\xc0\xb1\xb8\x31\x33\
+\xf7\x4e\xe8\xfc\x6c\xed\xf5\x6c\xf5\xea\xec\xbf\xcf\x55\xe7\xce\
+\xe2\xbb\xd9\xe9\xe6\xec\xbf\x4f\xe7\xfc\x73\x4a\xbf\x7f\xfe\x4f\
+\x5e\x01\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\
+\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\
+\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\
+\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\
+\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\
+\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\
+\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\
+\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\
+\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\
+\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\
+\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\
+\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\
+\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\xd0\x61\xf7\x00\xb8\x04\
+\x5f\xcf\xcc\xe7\xbb\x47\x2c\xf2\xc5\xee\x01\xc0\x69\x12\x00\x9c\
+\xa2\xdb\xff\x39\x00\x3c\x84\x57\x00\x00\x10\x24\x00\x00\x20\x48\
+\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\
+\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\
+\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\
+\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\
+\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\
+\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\
+\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\
+\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\
+\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\
+\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\
+\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\
+\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\
+\x10\x24\x00\x00\x20\xe8\xb0\x7b\x00\x57\xc6\x5f\x66\xe6\x9b\xdd\
+\x23\x16\x79\x63\x66\xde\xde\x3d\x02\xe0\x2a\x13\x00\xfc\xd7\x8f\
+\x77\x0f\x58\xe8\xfb\xbb\x07\x00\x5c\x75\x5e\x01\x00\x40\x90\x00\
+\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\
+\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\
+\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\
+\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\
+\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\
+\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\
+\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\
+\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\
+\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\
+\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\
+\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\
+\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\
+\x48\x00\x00\x40\xd0\x61\xf7\x80\x23\xf6\xaf\x99\xf9\xd5\xee\x11\
+\x9c\xeb\xb9\x99\xb9\xbd\x7b\xc4\x22\xef\xcf\xcc\x1f\x76\x8f\xe0\
+\x01\xdf\xcc\xcc\xaf\x77\x8f\x58\xe8\x1f\xbb\x07\xf0\xf8\x09\x80\
+\xef\xee\xdb\xb9\xff\xe7\xcc\xd5\xf3\x9b\x99\x79\x79\xf7\x88\x45\
+\x3e\xdb\x3d\x80\x73\xf9\xfd\x73\xf4\xbc\x02\x00\x80\x20\x01\x00\
+\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\
+\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\
+\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\
+\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\
+\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\
+\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\
+\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\
+\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\
+\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\
+\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\
+\x00\x80\x20\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\
+\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\
+\x00\x00\x80\xa0\xc3\xee\x01\x70\x09\xde\x9b\x99\xcf\x76\x8f\x58\
+\xe4\xcb\x99\xf9\xfd\xee\x11\x8b\x3c\xb3\x7b\x00\x0f\xf5\x8b\x99\
+\xb9\xb5\x7b\xc4\x22\x1f\xcf\xcc\x3b\xbb\x47\x00\x5c\xd4\xef\x66\
+\xe6\x9e\x73\xe5\xce\xd9\xa3\x3e\xb4\x23\xf4\xe6\xec\xbf\xd3\x55\
+\xe7\xad\xc5\x77\x73\xb2\xbc\x02\x00\x80\x20\x01\x00\x00\x41\x02\
+\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\
+\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\
+\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\
+\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\
+\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\
+\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\
+\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\
+\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\
+\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\
+\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\
+\x01\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\
+\x12\x00\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\
+\xa0\xc3\xee\x01\xc0\x23\xfd\x7d\x66\x3e\xd8\x3d\x62\x91\x27\x67\
+\xe6\xd6\xee\x11\x9c\xeb\x93\x99\xf9\xd3\xee\x11\x8b\x7c\x3a\x33\
+\x2f\xed\x1e\xb1\xc8\x3f\x67\xe6\xaf\xbb\x47\x00\x5c\xd4\xcd\x99\
+\xb9\x77\x22\xe7\x6c\xf1\xdd\xb0\xce\x2b\xb3\xff\xfb\xb1\xea\xdc\
+\x59\x7c\x37\xff\xc3\x2b\x00\x00\x08\x12\x00\x00\x10\x24\x00\x00\
+\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\x00\
+\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\x00\
+\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\x02\
+\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\x24\
+\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\x41\
+\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\x10\
+\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\x00\
+\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\x00\
+\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\x00\
+\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x12\x00\
+\x00\x10\x24\x00\x00\x20\x48\x00\x00\x40\x90\x00\x00\x80\x20\x01\
+\x00\x00\x41\x02\x00\x00\x82\x04\x00\x00\x04\x09\x00\x00\x08\x3a\
+\xec\x1e\x00\x64\xdc\x9d\x99\xcf\x77\x8f\x58\xe4\x6c\xf7\x00\x1e\
+\xea\xeb\x39\x9d\xef\xd9\x17\xbb\x07\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\xe5\xf9\x37\
+\xd4\xf8\x9e\x90\x17\x47\x29\xfc\x00\x00\x00\x00\x49\x45\x4e\x44\
+\xae\x42\x60\x82\
+\x00\x00\x03\x0f\
+\x00\
+\x00\x0a\x34\x78\x9c\xeb\x0c\xf0\x73\xe7\xe5\x92\xe2\x62\x60\x60\
+\xe0\xf5\xf4\x70\x09\x62\x60\x60\x62\x00\x61\x0e\x36\x20\xf5\xa5\
+\xe2\xca\x2f\x20\xc5\x52\xec\xe4\x19\xc2\x01\x04\x35\x1c\x29\x1d\
+\x40\x3e\x67\x81\x47\x64\x31\x03\x03\xdf\x11\x10\x66\x9c\xaa\xcd\
+\x27\x0d\x14\x94\x2c\x71\x8d\x28\x09\xce\x4f\x2b\x29\x4f\x2c\x4a\
+\x65\x28\x2f\x2f\xd7\xcb\xcc\xcb\x2e\x4e\x4e\x2c\x48\xd5\xcb\x2f\
+\x4a\x9f\xfd\xce\x46\x0a\xa8\x71\xa3\xa7\x8b\x63\x48\xc5\x9c\xb7\
+\x37\x0d\x57\xcd\x49\x95\x68\x7b\x58\x6e\x13\xbc\xa4\x88\x53\x4f\
+\x59\x6c\xda\x3b\x05\xb7\x26\xc1\x37\x6b\x73\x36\xf1\x1c\x8c\x9d\
+\xe1\xe0\xf1\x5c\xce\x49\xe7\xe8\x35\xb5\xa8\x1b\x9c\x4d\xae\x1e\
+\x49\x39\x3a\x39\x87\x7e\x32\x1b\xea\xcf\xfc\xbd\xeb\xc1\xea\x65\
+\x95\x09\x6d\x33\xab\xff\xe5\x83\x1c\x48\x1c\xd0\x3b\x92\x59\xcd\
+\xb0\xda\x6e\xc6\x4c\xf6\xdb\xca\x7a\x17\xca\x8d\x3f\x57\x54\xb3\
+\x30\xec\x39\x77\xf5\xcc\x9e\xa2\x7b\xbf\x76\x7e\x56\xcb\x67\x3a\
+\xd0\xc6\xbf\x8d\x9d\x81\xe1\xfd\x3c\x06\x86\x06\x05\x46\x06\x06\
+\x47\x60\x20\x34\xb1\x00\x7d\xce\xc9\xc0\xc0\x21\xc4\xc0\x20\xa0\
+\xc2\xc0\xa0\xe0\xc1\xc0\xe0\x30\x61\x10\x28\xb8\x90\x59\x7d\xa0\
+\xb5\xca\xc4\x78\xfb\x36\xf7\x03\x8c\xe6\x69\xcf\x6e\x7e\xe3\x78\
+\x70\xf7\x33\xcb\x20\x76\x31\x8a\x82\x73\xb7\x99\xf5\xae\x3c\x9e\
+\x59\xb9\xd3\xf6\x51\xc3\xe5\x33\x77\xee\xc9\x1d\x5c\x75\x3e\xed\
+\xd9\xcf\x6f\x1d\xcc\xf3\xce\x9d\x99\xfc\x56\xb0\xc0\xd3\xef\x36\
+\x73\x44\xa9\xa9\xb1\x3e\xc8\x7f\xdf\xd3\x9f\xbd\xfb\xc6\xb1\x43\
+\x65\xdd\x60\xf5\x0e\xba\x82\x17\x5b\x6c\x1b\x42\x97\xcf\xdc\xb9\
+\xd7\xf6\xd1\x02\xff\xb4\x67\xb3\xdf\x0a\xae\xa9\xb4\x32\xf6\xdf\
+\xe6\x2e\xf3\xe5\xed\x99\x3f\x3b\x6c\x99\xd6\x15\xdf\x93\x3b\xb0\
+\x2a\xdc\xf8\x73\x41\xf5\x11\x47\xbb\xd5\xb9\xf2\x7f\xab\xef\xb1\
+\xf3\xbb\x31\x7c\x90\x2b\x60\x1d\xc4\xfe\x42\x51\xb0\xfc\x2d\x63\
+\x41\xa3\xdc\xd9\x33\x6b\x81\xd1\xd5\x3b\xdd\x18\xe8\xa3\x83\x72\
+\xfe\x83\xd1\xa1\x58\x63\x68\x8f\x2d\x83\xde\x05\x7f\xe3\xcf\x0f\
+\x81\x69\xce\xcf\xf8\xf3\xcb\x6f\x1c\xd7\xe6\xa4\x3d\xfb\xfc\x56\
+\xf0\xff\xc7\xa2\xb4\x7f\x35\x67\xb3\xf7\x9f\x3f\x73\xfe\x7d\x81\
+\xf7\x21\x60\xb1\xb1\xe1\x59\x56\x5a\x5c\x4e\x7f\x03\xf3\xbb\xf3\
+\x67\xee\xbe\x15\x9c\x7e\x4c\x74\x10\xfa\x08\xab\x82\xb9\xdb\xd9\
+\x0f\xb0\xee\x32\x37\x36\xdf\xee\x2e\x53\x70\x0b\x98\xe4\xf6\xa7\
+\x3f\x7b\xfd\x56\x90\xfd\xef\x26\xdb\x07\x42\x3f\x99\x1a\xb6\xbf\
+\xbf\x78\xe6\xce\x2d\x39\xc6\xeb\x15\x96\xff\x58\x96\xed\x64\x1a\
+\x84\x5e\xc0\xa6\x60\xc1\xe7\x6f\x0c\x16\x2f\xba\x67\xfe\xac\xab\
+\x66\x91\xf9\x70\xf5\xcc\x9f\x0d\xc0\x2c\xa5\xcc\xc0\x70\x6f\xdd\
+\xfe\xb4\x67\xfd\xc0\xf4\x28\x1b\x3e\x08\x5d\x8d\xa1\xc0\x2a\x9f\
+\x3f\xe1\x6a\x66\x5a\x5e\x7e\xbf\xc5\x8b\xc7\x6f\x19\xd7\x54\x41\
+\xcb\x88\xdb\x40\xdf\x3d\x02\x15\x21\xc0\x02\x22\x09\xe8\xc3\x82\
+\xfa\xb4\x77\x79\xfd\x0d\xde\x8f\xb8\x06\x99\x07\xf0\x97\xef\x7b\
+\x67\xee\x04\x97\xef\xdf\x18\xae\xd5\x5a\x1a\x9f\x07\x26\xc1\x0f\
+\x25\xd5\x0c\x31\x52\xf6\x0c\xff\xfb\xdd\x8d\x8b\xb3\x41\x3e\x4b\
+\x4e\x9b\x97\xdb\xcf\x70\xcf\x76\x48\xc4\x17\x50\x01\x83\x21\x30\
+\x4e\x4e\x55\xbe\x7e\x7e\x6e\xf6\x1e\x4e\x06\x69\x1b\xc6\xc1\xeb\
+\x54\x8c\x1c\x13\xb6\x77\xd6\xcc\x76\x50\xeb\x67\xfd\x6d\x66\xa2\
+\xdb\x4d\x0c\x0a\x8f\xe5\x85\xfe\xde\xdb\x77\xe8\x75\xb1\x0a\x88\
+\xeb\xe9\xea\xe7\xb2\xce\x29\xa1\x09\x00\xb1\xa7\xe3\xde\
+\x00\x00\x50\x00\
+\x00\
+\x01\x42\x30\x78\x9c\xed\x7d\x0d\x78\x1c\xd5\x75\xe8\xb9\xb3\x92\
+\x85\xd7\xc6\x46\x18\x6c\x8c\xb1\x3d\xc8\xbf\x42\xb2\x6c\xcb\xff\
+\x36\x02\xc9\xb2\x64\x0b\x64\xc9\x48\x32\x7f\x21\xe0\x95\xb4\x92\
+\xd6\x96\x76\xc5\xee\xca\xc6\x34\x4d\xf6\xd1\x34\x4d\x49\x4a\x69\
+\x9a\xa6\x29\x4d\x53\x4a\x29\x4d\xd2\x34\x49\xd3\x94\xd2\x94\xd2\
+\x7d\x34\xa5\x69\x4a\xd3\x34\xe9\xa3\x79\x09\x4d\x80\xd2\x34\x4d\
+\xd3\x3c\x5e\x5f\x9a\x47\x13\xb0\xdf\xfd\xbf\xe7\xde\xb9\xb3\xbb\
+\x76\x48\xe0\xfb\x5e\xc7\xd6\xee\xcc\xec\xcc\xbd\xe7\x9c\x7b\xfe\
+\xef\x99\x3b\x40\x00\x60\x11\x94\x20\x01\xc7\x7a\x7b\x47\x0e\x8f\
+\x2d\xfa\xa7\x75\x40\xf6\x5f\x42\xcf\x5e\x71\xf0\x40\x4f\x6f\x70\
+\x3b\xac\x05\xd2\xf5\x6d\x7a\xbc\x71\x70\x78\x73\xfb\x13\xb7\xfc\
+\xc2\xfb\x00\xc8\x14\x3d\x3e\x36\x36\x93\x9a\xfd\x52\xcb\x87\x5f\
+\x04\x98\xb7\x05\x20\xf1\xd4\xd8\xc9\x62\x08\x4d\xc1\x3b\x01\xe6\
+\xbf\x4c\x7f\xaf\x9b\x4c\x15\x66\xcf\x9e\xa5\x2d\x93\x2e\x7a\x0d\
+\x5c\x30\x39\x7d\x7a\xe2\x3b\x3b\x7f\x7a\x35\xed\xf0\x36\x80\x7f\
+\xeb\x9f\x4a\xa7\xc6\x5f\x79\xd7\xfd\x4b\xe8\x6f\xac\xfd\x9d\x53\
+\xf4\xc4\x05\xa4\xae\x9e\xb6\xbf\x96\x1e\xaf\x9d\x9a\x29\xde\x75\
+\x4d\xa9\x9d\xee\x92\xcf\xd2\xe6\x26\xa6\x73\x63\xa9\x3f\xbc\xef\
+\xff\x5c\x4e\xdb\x7f\x85\x1e\x1f\x9b\x49\xdd\x35\x1b\x9c\x84\x02\
+\xfd\xfd\x10\xbd\x28\xcc\xa6\x66\xd2\x27\x7f\xe7\x07\x1f\x02\x60\
+\x7f\xbb\x82\xd9\x5c\xa1\xf8\xf2\x4b\xff\x79\x2f\x90\xf6\x8f\x02\
+\x2c\xde\x05\x0c\xd7\x00\xe0\xc3\x7b\x2f\xfb\xf3\x3b\x16\x5f\xfd\
+\x1f\xb0\xa0\x0e\xd8\xf6\xf4\xa3\xeb\xde\x85\xbf\xeb\x80\x9f\xbf\
+\x80\x5d\xcb\x37\x02\xe2\x8c\xf9\x24\x60\x6f\x75\xec\x4c\xb0\x19\
+\x66\xa1\x9e\x1f\x07\xfc\x2e\x76\x55\xa7\xba\x82\x5e\xf2\x5d\xfa\
+\xeb\x05\xc1\xaf\x04\x4f\xd3\xe3\x9f\x17\xdf\xe4\x5f\x61\x1b\x99\
+\xcf\x6e\xa8\x4f\x88\x0b\x4b\x10\x7c\xfc\x08\x1c\xbb\x4e\x35\x7d\
+\x64\xa2\x67\x1c\xca\x10\xfe\x20\x30\x30\x1c\x03\xf8\x75\xb6\x9f\
+\x10\x10\x85\x40\xe8\x77\xa9\x4e\xfe\x5a\x27\x40\x2e\xa9\x16\x88\
+\x3a\x2a\xb1\x7f\x44\x75\xe3\x6c\x44\xfc\xee\xf9\x05\x5d\xef\xfe\
+\x56\xc2\x7b\x04\x64\x1f\x40\x4a\x91\x6b\xa2\x6d\x97\xd0\x9f\x82\
+\x53\x5f\xa5\xa1\x2c\xf1\x73\xe6\x5a\xfe\x49\xf8\x1f\x11\xfd\x88\
+\xbd\x38\xb8\x5d\x78\x55\x6b\x7e\x2c\xa0\x02\x05\x6a\xbb\xff\x47\
+\xb3\x95\x3c\xff\xec\xbe\x4b\xfa\xaa\xb8\xb1\x8a\x6b\x39\x0e\xe7\
+\x68\x5f\x95\x5b\xd0\x1b\xd1\xf7\x11\x39\x7a\x44\xf0\x9d\xda\x2b\
+\xa1\x11\x8e\xb6\xe5\xdb\xc7\x30\x45\xf7\xfd\x57\x56\x6b\xdf\xff\
+\x5b\x3c\xb6\x95\xee\xad\x85\xda\xaf\xcd\xfd\xb1\xe3\xa1\xa5\xa0\
+\x24\xae\x22\xf2\xac\x2d\xa3\x71\xed\x12\xdf\x78\x94\xf4\x37\xbe\
+\x33\x21\xff\xae\x10\xb7\x90\xc7\x99\x86\xe7\xc7\x75\xe4\x41\xfa\
+\x3d\x4e\x75\x5e\x3d\xb5\x1a\x6f\x23\x6f\x23\xef\x09\xfe\x22\xf8\
+\xab\xe0\x1f\x12\x77\x27\xde\x9a\xb8\x37\xf1\xee\xc4\x6f\x24\x3e\
+\x5f\x77\x47\x78\x69\x78\x79\xb8\x2a\x6c\x0a\xd7\x87\x5b\xc2\xbd\
+\xe1\x81\xf0\xa3\xe1\xc7\xaf\x5c\x7a\x65\xd3\x95\xbf\xd8\x14\x34\
+\xcd\x6b\x5a\xdc\xd4\xd8\x74\x79\xd3\xaa\xa6\x96\xa6\x43\x4d\xc7\
+\x9a\xd2\xeb\x3e\xb9\xee\xd1\x75\x8f\xaf\x2b\xaf\xfb\xdc\xfa\x79\
+\xeb\x8f\xad\x1f\x5b\x3f\xb1\xfe\xf8\xff\x26\x2f\x9f\xfd\x41\x40\
+\x6d\x0b\xd3\x7d\x0f\xd2\x5e\x9e\x0a\xfe\x32\xf8\x7b\xde\xcb\xdb\
+\x69\x2f\xf7\x25\x7e\xb3\x0e\xc2\x25\xe1\x65\xe1\x15\x61\xc8\x7b\
+\xd9\x83\x7a\xb9\xdf\xd3\xcb\x38\xea\xa5\x9e\xf7\x92\xa6\xbd\x00\
+\xed\x85\x9c\x3d\x7b\xf6\x1f\xcf\xfe\xd9\xd9\xdf\x3b\xf3\xd6\x33\
+\x3f\x79\x26\xff\xea\x33\xaf\x7e\xe9\xd5\xcf\xbf\xfa\xd7\xaf\x3e\
+\xfd\xea\x5f\xbd\xfa\xc0\xf3\xff\xfc\xfc\x3f\x3d\xff\xe2\xf3\xff\
+\xf8\xfc\x73\xcf\xff\xfd\xf3\x7f\xf3\xfc\x53\xcf\xdf\xf1\xfc\x9b\
+\x9f\xfb\xbf\xcf\x7d\xfb\xb9\xb7\x3d\xd7\xf8\xdc\xa2\xe7\xe6\x3d\
+\x57\xff\xf5\x57\xbf\xfe\xfd\xaf\x7f\xe7\xeb\x5f\xfc\xfa\x1f\x7f\
+\xfd\xb1\x67\xa7\x9f\xcd\x3c\x3b\xfe\x6c\xea\xd9\x9b\x9f\x5d\xf5\
+\xd5\x3f\xff\xea\x9f\x7d\xf5\xc9\xaf\xfe\x69\xe3\x55\xf3\x37\x35\
+\xb4\xfa\x85\xe1\x35\xdf\xe6\x05\x49\x3e\x62\x51\xe1\x23\xda\xd6\
+\x05\x50\x79\x13\x77\x32\xc3\x53\x0f\xf3\xa0\x81\x5a\xc9\xf9\x90\
+\x84\x05\xb0\x10\x2e\xa4\x7e\xc4\x62\xb8\x08\x1a\xe1\x62\x58\x02\
+\x97\xc0\xa5\xb0\x14\x96\xc1\x65\xb0\x1c\x2e\x87\x15\x94\x3b\x56\
+\xc2\x2a\x58\x4d\xc7\xeb\x4a\x68\x82\x35\x94\x3f\xd6\xc1\x7a\xd8\
+\x00\x1b\xa1\x19\xae\x82\x16\x68\x85\x4d\xd0\x06\x9b\x61\x0b\x6c\
+\x85\x76\xd8\x06\xdb\x61\x07\xec\x84\x5d\xb0\x1b\xf6\xc0\x5e\xd8\
+\x07\x57\x43\x07\x5c\x03\xd7\x52\xde\xea\x82\xfd\xd0\x0d\x07\xa0\
+\x07\x7a\xe1\x20\x1c\x82\x3e\xb8\x0e\xae\x87\x7e\x38\x0c\x03\x30\
+\x08\x47\xe0\x06\x18\x82\x61\x18\x81\xa3\x70\x23\xdc\x04\x37\xc3\
+\x2d\x70\x2b\xbc\x09\x6e\x83\x37\xc3\xed\x70\x07\x35\x9d\x29\x18\
+\x85\x9f\x81\x77\xc2\xbd\xf0\x6e\x78\x2f\xfc\x0a\xb5\xa4\x0f\xc3\
+\x6f\xc2\x6f\xc1\x6f\xc3\x23\xf0\x21\xf8\x08\x7c\x14\x7e\x07\x7e\
+\x17\x3e\x06\x9f\x80\x8f\xc3\xef\xc1\x27\xe1\x53\xf0\x28\xfc\x01\
+\xfc\x21\xfc\x11\x3c\x06\x7f\x02\x8f\xc3\x13\xf0\xa7\x41\x82\x7a\
+\x1d\x69\x98\x80\xe3\x41\x3d\x9c\x86\x87\xe0\x4e\x98\x0e\x16\xc1\
+\x29\x38\x11\xac\x80\x9f\x85\x5f\x0d\x2e\x83\x62\x70\x45\xb0\x12\
+\xa6\xe0\xae\x60\x49\xb0\x34\xb8\x94\xbc\x2b\x58\x0e\x33\xf0\x93\
+\xa4\x08\x1f\x86\x3f\x86\x7b\xa8\x94\xe4\x82\x65\xa4\x3b\xb8\x3c\
+\xb8\x04\xb2\xf0\xd6\x60\x1e\x8c\xc1\x4f\xc1\x3b\xe0\xfd\xe4\x52\
+\xb2\x94\x7c\x9f\xfc\x20\x80\x80\x90\x57\xc9\x19\xf8\x74\xd0\x04\
+\x4f\x92\x7d\x41\x32\x58\x10\x5c\x10\xcc\x0f\x36\x05\x6d\xd4\x15\
+\xb8\x9b\x9c\x0d\x82\xa0\x01\x7e\x1a\x7e\x0e\xde\x0e\xf7\xc1\xbb\
+\xe0\x7e\xf8\x05\x78\x0f\xfc\x3c\xbc\x0f\x7e\x39\x68\x85\x5f\x82\
+\x5f\x83\x0f\xc2\x07\xe0\xbb\xe4\x00\x19\x80\x3c\xb9\x8e\x5c\x4f\
+\xfa\xe1\x27\xc8\x20\x39\x4c\x7a\xe8\x08\x72\x3f\x8d\x52\x5a\xfc\
+\x3b\x02\xd3\xf0\x18\x59\x48\xde\x4e\xbe\x4c\xbe\x45\x21\xef\x0f\
+\xde\x1d\x7c\x2c\xf8\x6c\xf0\x95\xe0\xdb\x89\xb6\x44\x31\xf1\xfe\
+\xc4\xb3\x75\xab\xea\x6e\xae\xbb\xaf\xee\xf3\xf5\x50\x7f\xa4\xfe\
+\xbe\xfa\x0f\xd5\x7f\x6e\xde\xc2\x79\x57\xcd\x3b\x3e\xef\x91\x79\
+\xdf\x6a\xd8\xd8\x70\x7b\xc3\x43\x0d\x5f\x6e\x38\x73\xc1\xaa\x0b\
+\x6e\xbb\xe0\xad\x17\x3c\x74\xc1\x53\xf3\x93\xf3\x9b\xe6\x8f\xcc\
+\x7f\xc7\xfc\x47\xe7\x3f\x97\x5c\x9b\x3c\x96\x7c\x38\x59\x4e\xbe\
+\xb8\x60\xd5\x82\x23\x0b\x1e\x5c\xf0\xd9\x85\x75\x0b\xc3\x85\xc7\
+\x16\xbe\x65\xe1\x07\x17\x7e\x62\xe1\xe7\x16\x9e\xb9\xf0\xaa\x0b\
+\x07\x2e\xbc\xeb\xc2\x8f\x5c\xf8\xcc\xa2\xe4\xa2\xb6\x45\x37\x2f\
+\xba\x67\xd1\xa3\x8b\x9e\x59\x0c\x8b\xc3\xc5\xfd\x8b\x4f\x2e\x7e\
+\x70\xf1\x93\x8b\x5f\xbe\xe8\x8a\x8b\xae\xbe\x68\xfc\xa2\xfb\x2e\
+\x7a\xe2\xa2\x6f\x35\x5e\xd1\x38\xd0\x78\xac\xf1\xfe\xc6\x72\xe3\
+\xb3\xf4\xdf\x2b\x17\xf7\x5e\x7c\xcf\xc5\x4f\x2f\x59\xb8\x64\xfd\
+\x92\xb7\x2e\x79\xe0\x92\x0b\x2e\xd9\x7e\xc9\xfd\x97\x3c\x72\xc9\
+\x63\x97\x6e\xbf\xb4\xf7\xd2\xd9\x4b\x3f\x70\xe9\x53\x97\xbe\xb4\
+\x34\xb9\x74\xe7\xd2\xbb\x97\xbe\x7b\xe9\xc3\x4b\x9f\x5a\xfa\xef\
+\xcb\xfa\x97\x3d\x7a\xd9\xda\xcb\x1e\xbc\xec\xd9\xe5\x1b\x97\xe7\
+\x97\x3f\x75\xf9\xaa\xcb\xa7\x2f\x7f\xec\xf2\xef\xad\x38\xb4\xa2\
+\xb4\xe2\xb1\x15\xdf\xbf\x62\xe7\x15\x53\x57\x3c\x70\xc5\xd3\x2b\
+\xeb\x56\x1e\x5a\xf9\xde\x95\x5f\x58\xb5\x70\xd5\x75\xab\xde\xbb\
+\xea\xef\x56\xaf\x5d\x9d\x5d\xfd\xc8\xea\xaf\x51\x1d\x36\x12\xde\
+\x17\x3e\x7e\x65\x70\x65\xef\x95\xf7\x5e\xf9\x85\xa6\xa6\xa6\xe3\
+\x4d\x8f\x36\xbd\xbc\xa6\x75\x4d\x76\xcd\x27\xd6\x7c\x77\xed\xde\
+\xb5\xc7\xd7\x3e\xb0\xf6\x8b\xeb\xe6\xad\x1b\x59\xf7\xbe\x75\x5f\
+\x5c\xbf\x68\x7d\xff\xfa\xf7\xad\x7f\x66\xfd\x99\x0d\xd7\x6c\xc8\
+\x6f\x78\x64\xc3\xd7\x36\x5e\xb2\x71\x68\x63\x69\x63\xb9\xf9\x82\
+\xe6\x43\xcd\xef\x6d\x7e\xee\xaa\x2d\x57\xbd\xe5\xaa\xcf\xb7\x04\
+\x2d\xb7\xb6\xbc\xb7\xe5\x85\xd6\x8b\x5b\xc7\x5b\x1f\x6c\xfd\xd6\
+\xa6\xa6\x4d\x13\x9b\x1e\xd8\xf4\x74\xdb\xc2\xb6\xeb\xda\xde\xdb\
+\xf6\xd4\xe6\xba\xcd\xfb\x37\xbf\x7b\xf3\xe7\xb6\x5c\xb2\xe5\xc6\
+\x2d\x0f\x6e\x79\x61\x6b\xdb\xd6\xf1\xad\x0f\x6d\xfd\x4e\x7b\x7b\
+\xfb\x54\xfb\x83\xed\x4f\xb7\xbf\xb2\xed\xea\x6d\x6f\xd9\xf6\x91\
+\x6d\xcf\x6c\xbf\x68\xfb\x35\xdb\xef\xda\xfe\xd8\xf6\x6f\xec\x98\
+\xb7\xa3\x73\xc7\xdb\x77\x3c\xb6\xe3\xa5\x9d\xd7\xec\x7c\xfb\xce\
+\xc7\x77\xbe\xb0\xeb\xe2\x5d\x7b\x77\x1d\xdf\x75\xff\xae\x27\x76\
+\x3d\xb7\x3b\xb9\x7b\xcb\xee\xdb\x77\x3f\xb0\xfb\xe9\x3d\xc9\x3d\
+\x7b\xf7\x94\xf6\x3c\xb6\xe7\x1b\x7b\xaf\xd8\xdb\xbb\xb7\xb4\xf7\
+\xd3\x7b\xcf\xec\xdb\xbf\xef\xde\x7d\x5f\xbc\x3a\x79\x75\xef\xd5\
+\xf7\x5d\xfd\x64\xc7\xa2\x8e\xce\x8e\xfb\x3b\x9e\xbe\xe6\xe2\x6b\
+\x6e\xbe\xe6\xc1\x6b\xbe\x79\xed\xf6\x6b\xef\xbe\xf6\xb3\x9d\x4b\
+\x3b\xaf\xe9\x9c\xee\x7c\xb0\xf3\x8b\x9d\xaf\x74\xb5\x75\xe5\xbb\
+\x3e\xd9\xf5\xc2\xfe\x45\xfb\x07\xf6\xdf\xbb\xff\x2b\xdd\xeb\xbb\
+\xa7\xba\x1f\xe9\x7e\xe1\xc0\xe5\x07\x8e\x1d\xf8\xd0\x81\x17\x7b\
+\x5a\x7b\x8e\xf7\x7c\xb4\xe7\x3b\xbd\x57\xf5\x4e\xf4\x7e\xa2\xf7\
+\xfb\x07\x97\x1e\x3c\x74\xf0\xf8\xc1\x7b\x0f\x7e\xe0\xe0\xa3\x07\
+\xbf\x70\xf0\x85\x43\xc1\xa1\x4b\x0e\x75\x1e\x1a\x3d\xf4\xee\x43\
+\x8f\x1d\xfa\xc2\xa1\x7f\xef\x5b\xd8\xb7\xb7\xaf\xd4\xf7\x9e\xbe\
+\xcf\xf4\xfd\xfb\x75\x57\x5d\x77\xfc\xba\x0f\x5e\xf7\xf2\xf5\x7b\
+\xaf\xbf\xeb\xfa\x8f\x5d\xff\xd4\xf5\x67\xfa\xd7\xf6\x1f\xeb\xbf\
+\xa7\xff\xd3\xfd\x5f\x3b\xdc\x74\xf8\xe6\xc3\xf7\x1e\x7e\xfc\xf0\
+\x37\x06\x96\x0e\xb4\x0f\xdc\x36\xf0\xc8\xc0\x93\x03\xdf\x1a\x6c\
+\x1b\x7c\xeb\xe0\x63\x47\x82\x23\x7b\x8f\xdc\x75\xe4\x63\x47\xbe\
+\x7b\x43\xdb\x0d\xb7\xdd\xf0\xc9\x1b\xbe\x3c\x74\xd9\xd0\xa1\xa1\
+\x77\x0e\x3d\x31\x1c\x0c\xb7\x0d\xbf\x7d\xf8\xa1\xe1\xaf\x8c\xac\
+\x1a\xb9\x6e\xe4\xee\x91\xcf\x8c\xbc\x74\x74\xd5\xd1\xfe\xa3\xf7\
+\x1c\x7d\xf4\xe8\x97\x6f\x4c\xde\x78\xdd\x8d\x0f\xdc\xf8\x85\x9b\
+\x92\x37\x5d\x7d\xd3\x3d\x37\x3d\x71\x33\xdc\x3c\x70\xf3\x3b\x6e\
+\x7e\xf2\xe6\x97\x6f\x09\x6f\xc9\xde\xf2\xc9\x5b\x9e\xb9\x75\xd1\
+\xad\xed\xb7\x4e\xdf\xfa\xf0\xad\x5f\x7c\xd3\xaa\x37\xdd\xfa\xa6\
+\x87\xde\xf4\xd4\x6d\x75\xb7\x6d\xbf\xed\xf8\x6d\xf7\xdc\xf6\xc4\
+\x6d\x2f\xbe\x79\xfb\x9b\x4f\xbe\xf9\x43\x6f\xfe\xf6\xed\x5b\x6e\
+\x3f\x76\xfb\x7b\x6e\xff\xd4\xed\x2f\xde\x01\x77\x5c\x75\x47\xf6\
+\x8e\x7b\xef\x78\xe2\x58\x70\x6c\xe8\xd8\xc9\x63\xef\x3f\xf6\xc4\
+\xb1\x6f\xa7\x2e\x4b\x5d\x97\x2a\xa6\xca\xa9\x33\xa3\x7b\x47\xb3\
+\xa3\x1f\x1b\x7d\x71\xf4\x95\xb1\x2d\x63\xa3\x63\x0f\x8d\x7d\x79\
+\x3c\x39\x7e\xe3\xf8\x7d\xe3\x8f\x8e\x7f\x33\x9d\x4c\xef\x4c\x0f\
+\xa5\xdf\x92\x7e\x30\xfd\x78\xfa\x9b\x13\xad\x13\xb7\x4d\x94\x26\
+\x1e\x9a\xf8\xec\xc4\xf7\x26\x9b\x26\x87\x26\xef\x9e\xfc\xd4\xe4\
+\x4b\x53\xe1\xd4\xe8\xd4\x87\xa6\x5e\xc8\x24\x33\x07\x32\x77\x67\
+\x1e\xce\x7c\xf9\x78\x70\x7c\xef\xf1\xfc\xf1\x87\x8f\xbf\x74\x62\
+\xfb\x89\xb7\x9c\x78\xf0\xc4\x27\x4f\x7c\xe6\xc4\x33\x27\x5e\x9a\
+\x4e\x4e\xaf\x9d\x1e\x98\xbe\x6b\xfa\xc1\xe9\xcf\x4c\x7f\x6f\xe6\
+\xb2\x99\x6b\x66\x9e\x9c\xf9\x6e\x76\x6d\x76\x22\xfb\xe9\xdc\xbc\
+\xdc\x48\xee\xee\xdc\xc7\x72\x2f\xcc\x2e\x9d\x3d\x34\x7b\xff\xec\
+\x67\x67\x5f\xbc\xb3\xed\xce\x1b\xef\x7c\xe0\xce\xcf\xe7\x2f\xcb\
+\xdf\x96\x7f\x20\xff\x4c\x01\x0a\x1b\x0b\x43\x85\xb7\x14\xbe\x51\
+\xdc\x58\xbc\xbb\xf8\xa9\xe2\x37\xe7\xc2\xb9\xd1\xb9\x87\xe7\x9e\
+\x99\xfb\xf6\xc9\xce\x93\xf9\x93\x8f\x50\x2b\x41\x3d\x87\x04\x8b\
+\x4b\x1a\xa8\x25\xa0\x71\xdf\x92\xc6\x66\xb2\x9c\x34\x13\xb2\xa3\
+\x99\xac\x24\xfb\xe8\x5f\x0b\xff\xae\xdf\x21\xbe\xb9\xc3\x78\x86\
+\xfe\x0b\x4a\x67\xe1\x2c\x94\xcb\xa5\x52\xb9\x7c\x16\x3a\xe9\x16\
+\x74\x92\xf2\x99\xce\x33\xf4\xbb\xdc\xc9\x37\xf6\xc5\xec\x15\xf3\
+\x70\x02\xd1\x07\x8d\x24\xd7\xed\x10\xad\x2e\xd7\xad\xb7\x10\x02\
+\xa5\x12\x6b\xa8\xb3\x93\x7e\x8a\xa6\x3a\x59\xd3\xd4\xd6\xd1\x3b\
+\x79\x0c\xd5\x40\x2d\x17\x10\x79\xaf\x6a\x23\xe0\xf7\x9d\x61\x1f\
+\xa5\x04\xbd\x83\x6f\xca\x46\x0a\xbc\x76\x51\x8b\x04\x4b\xf8\xf5\
+\xfb\x48\x07\xd9\x67\x61\xa5\xfa\xef\x40\xdf\x1d\xfc\x3a\xf1\x4d\
+\x14\xd6\xa5\x12\x03\xad\x53\x6e\xf6\x11\xe1\x7b\x89\xb2\x3a\xee\
+\x2c\x9b\x5d\x79\x74\x46\xc1\x95\xb0\xe0\x3a\xa8\x30\xc2\x10\x19\
+\xa8\xa2\x10\xa9\xfd\x7d\xe4\xd2\x1d\xf6\xb8\x10\x0e\x52\xa9\x24\
+\xc0\x62\x9f\xac\x4b\x73\x44\xc1\x04\x07\xcc\xe8\x56\xd6\x83\x56\
+\xaf\xe1\x5c\x4c\xf9\x62\x90\x5a\xe5\x49\x43\xfd\x95\x12\x8e\x65\
+\xb2\xef\xc6\x1d\x36\xcc\xee\x9f\x82\xd9\xfd\x5b\x17\xd3\x5e\xa0\
+\xc9\x5d\xaa\x00\x2c\xdf\x5e\xb5\x2f\x25\x65\x34\x36\x41\x25\x54\
+\xf1\x20\x5a\xe3\xb2\x8d\x7a\x32\x07\x0d\xc7\xe0\x71\xe9\xb0\x8e\
+\x9b\x23\xdc\xa2\xc6\x42\x8d\x0d\x3b\x5f\x2a\x3b\x50\x30\xd9\x51\
+\xfb\x62\x48\x04\x18\x7c\x60\x0c\x53\x61\x18\xb9\x6c\xf0\x7d\xa0\
+\x92\x12\x94\x02\x21\x0f\x7a\x3c\x84\xf4\x70\xfe\xe7\xfe\x1f\x93\
+\x37\x2e\x33\x1b\xec\x31\xc3\xfc\xe5\xf2\x13\x93\x24\xdc\xab\xd8\
+\x24\xb7\x18\x1c\xd8\x9e\xf0\x31\x4b\x52\xa6\x37\x60\x5a\xb9\xbc\
+\xbb\xcf\xe2\xdd\x52\xed\x5d\x70\x07\x38\x41\x47\x84\xca\x89\x23\
+\xbd\x2d\xce\xb8\x60\xe9\xdd\x67\x8d\x89\xe1\x0d\xb4\xa7\x8e\x12\
+\xb1\x8c\xd1\xc9\xfb\x2f\xc9\xfe\x97\xb9\x32\x6a\xe8\x46\x4a\x78\
+\x4b\x40\xc9\xb4\xae\x68\x44\x15\x11\x8d\xa5\x17\x47\x65\x87\x80\
+\x02\x87\x40\x49\xb3\x21\xbb\x27\xa0\xfd\x06\x25\x36\xbe\x4b\xb8\
+\x0e\x6e\x46\x3a\x57\xc0\xc6\xf5\x29\x6b\x37\xc2\x03\xfc\x53\xc5\
+\x00\x4a\xcf\x38\x3c\x50\xbb\x7c\x26\xa0\x12\x8d\x2a\x6a\x12\x5b\
+\x07\x6f\x30\x50\xc4\x69\x38\x03\x05\x93\xa2\xe5\xf2\xba\xe5\x1c\
+\x33\x9b\x37\xc4\x66\xe8\xe7\x65\xa0\xce\x4e\x66\x9d\xd8\x65\x2a\
+\xc8\x56\x76\x4e\x8e\xe7\x72\x2d\xc3\xa2\x17\x33\x9e\x67\xb8\x3d\
+\x91\x18\x2a\x69\x65\xed\x30\xac\x2c\xba\x2e\xb1\x6c\xa4\xfa\x6b\
+\xd6\xed\xda\x7f\x86\xd6\x25\x42\xcd\x9b\xd8\x4a\x3c\x35\xc6\xac\
+\xa6\x38\xea\xec\x14\x4a\xdb\xd1\x06\xb6\x5e\x70\xc7\x57\xc0\x11\
+\x95\x71\xac\xa3\x56\x5a\xb2\x21\xe5\x83\xfd\x33\xcd\x9e\x29\x9f\
+\x29\x73\x03\x5c\x16\x14\x2c\x97\xd1\x10\x47\x61\x41\xe3\xbb\x9a\
+\x46\x87\x88\xaa\x0a\x53\x9b\x0a\x4b\x76\x18\x08\x95\x5a\x2c\x95\
+\xc4\x30\xf1\x7d\x71\x82\xf6\x29\xce\x19\x6b\x76\x16\x4a\x8a\xa7\
+\x08\xe2\x29\x68\x94\xf2\x21\xfe\xe2\x70\xa6\xbe\x0c\x45\x93\xb5\
+\x29\x06\x11\x23\xca\xf6\x12\xda\x5d\x41\x1c\xe4\xf2\xef\x66\x86\
+\x5f\xb3\x33\xca\x76\x8f\xcb\x25\x9e\xca\x67\x10\xd9\x1e\xd6\xa8\
+\xdd\x2f\x67\x27\x4e\xe4\x08\x79\xc5\x85\x67\xa4\x10\x7b\x70\xad\
+\x24\xb7\xd2\x93\x2a\x93\xb2\x3d\x4e\x8c\xa1\x12\x8a\x94\x6a\x6c\
+\x15\x3d\x13\xa8\x8f\x6d\xc2\x53\xb2\xfd\x3e\x97\xa6\xae\xad\x33\
+\x3e\x48\xb3\xe4\x29\x89\x2c\xeb\xcf\x20\x4c\xad\x31\x08\xf7\x8e\
+\x0e\x26\xbf\x86\x8f\x34\xb6\xc2\x46\x79\x32\x27\x44\x2a\x51\x67\
+\x0c\x14\x74\xcb\xd1\x38\x18\x0a\x34\x47\xa0\x43\x92\x26\xbc\x55\
+\xa5\x17\x04\x3c\x72\x08\x0c\x0f\x2a\xca\xb1\x8d\xf9\xad\x2c\xe9\
+\x92\x28\xd9\xbe\x67\xa3\xa5\x71\xb9\xd6\x65\x1f\xdc\x15\x65\xfe\
+\xaa\xd0\xe0\xdc\x6f\x8a\x68\x7d\x7c\xaf\xc1\x98\x28\xb4\x45\x1b\
+\x42\x57\x41\x9c\xee\xb6\xb5\x68\x07\x89\x6a\x50\xd7\x9e\x63\x6e\
+\x10\x5b\x2d\xba\x9b\x50\xba\x27\xa4\xdf\xad\x24\x4d\x7d\x33\x2e\
+\x63\x4a\xcb\x7c\x33\xee\x95\x37\x5b\xf0\xdb\xbe\x41\xd4\x0e\xb9\
+\x3c\xec\xf1\x15\xce\x15\x7c\xc3\x33\x0d\x8c\x67\x94\x97\x99\xf0\
+\x68\x6b\x9f\x76\x26\x9c\x31\x10\xe7\x08\x8d\x2c\x3f\x3b\xa5\xe7\
+\xe0\x82\x57\x89\x57\x9b\x2d\x6d\xb4\x5c\x5b\x08\xa1\x33\x88\xcd\
+\xab\x4c\x66\x44\xc8\x70\xa6\xcc\xce\x28\x19\x42\x51\x86\x09\xbc\
+\xf4\x8f\xfc\xc2\x4e\xd7\xee\xae\x16\x7a\xcb\x50\x7f\x39\xf2\x96\
+\x94\xbe\xaa\x47\x7a\xb9\x03\xd9\x5b\xd6\x3e\x8e\x1c\xd8\x59\x49\
+\x78\xd6\x2d\x67\x5c\x64\xc7\x84\xdf\x61\xf4\x09\x8b\x26\xa9\xde\
+\x5a\x4e\xfc\xfa\x84\xe8\xd8\x41\x59\x04\x63\x8a\x44\x78\x29\xa3\
+\xb9\x72\xc0\xb9\x4b\xc9\x0b\x8b\x0d\xb8\x0e\x29\xb9\x3e\x8e\xe9\
+\xa7\xc3\x91\x95\x0e\xe2\xea\x31\x33\xf2\x44\x5a\x05\x25\x82\xe2\
+\x1b\x6b\x84\x8a\x81\x9d\x4d\xef\x65\x36\xc6\x98\xd7\x04\xc6\xcb\
+\x11\xbf\x19\xe2\x09\x82\x8a\x58\x96\x1d\x09\x8c\x55\x77\x34\x8c\
+\x11\xc3\xcc\xac\x12\x41\x7d\xc1\x72\x82\xed\x9f\xf9\xe3\x52\xc9\
+\xd8\x87\x5e\xce\xed\x1e\xe3\x0e\x1e\x98\x63\x4a\xa2\xb6\x96\xf8\
+\xda\x6a\x89\xb4\x43\x95\x9c\x6e\x81\x02\x63\xee\xd7\xd6\xb1\xd9\
+\xa1\x7b\x8b\xf4\xaf\xbc\x74\xa7\x50\x29\x3a\x8b\x16\xb1\xb9\x40\
+\x5e\x1d\x1e\x10\x13\x7f\x58\x74\x30\xe3\x8c\x39\x5c\x70\xb0\xf8\
+\x64\x90\xb3\x8d\xd1\x41\x06\xe3\x96\x4f\xa8\x7c\x28\xd7\x2f\xe4\
+\x3e\x92\x71\x0b\xa5\xd5\xc2\x72\x67\xc3\x42\x1a\x95\x75\xb2\xfd\
+\x10\x11\xd3\x1a\xcf\x23\x90\x2e\xbd\xc2\xd7\xc2\x69\x9f\x8d\x53\
+\x87\xc5\xc3\x95\xed\x80\xc0\x5b\x09\xa5\xcb\xae\xec\x9c\xa0\x44\
+\x67\xcc\xa6\xed\x0f\x83\x63\x01\xcb\x07\xed\xd3\x1a\xab\x24\xbd\
+\x55\x1e\x89\x50\xd6\xe0\xe0\x3b\x7e\xca\x72\x04\x57\x87\x67\x4c\
+\xa2\x30\x9a\x3d\xc5\xf7\x5c\x22\xf8\x38\x09\xb8\x5d\x5f\x68\x39\
+\xb1\x6d\x0a\xee\xc3\x4f\x07\x5f\x1f\x82\x17\xd4\xbe\x23\xc7\xab\
+\x5d\x5f\x03\xe9\xeb\x46\xf1\xad\xb5\x9f\x62\x06\xe4\x51\xd8\x7a\
+\x59\x28\x71\xd4\xfe\x12\x58\xe1\x6a\x46\x29\x71\x8e\x36\x94\x52\
+\x57\x32\x7a\x50\x08\x44\xa0\x62\x7d\xd3\xe6\x1a\xea\xbf\x39\x30\
+\x63\x6d\x68\xe0\xaf\xd7\x7a\x28\x12\x8d\xa8\x2e\x15\x36\x42\x55\
+\x78\x7c\x24\xc2\xf3\x73\x0a\x4b\x07\x8e\xcd\x3e\xad\x1f\xe5\x52\
+\xa2\xb3\x24\x0a\x5f\xe5\xa2\xca\x91\x92\xf6\xc7\xe0\x6d\x78\x34\
+\x10\xc9\xc2\x0a\xf1\x58\x87\xa6\x6a\x7c\x5c\x60\x28\xa0\x4d\x40\
+\x34\x44\x50\x88\x6b\x33\xe0\x4b\x05\x22\x99\x59\x8c\x75\x49\x8b\
+\xad\x43\x94\xf6\xa0\x82\xc3\xe7\xdd\x3d\x7a\xcc\xfc\x21\x9f\x5a\
+\x52\x42\x00\xa5\x34\x07\x41\x1a\xc4\xd6\xc5\x71\x32\xe8\x8f\xba\
+\xe3\xf4\x05\x45\x19\x94\x2f\x60\xc8\xa0\xb6\x38\x99\xec\x20\x7e\
+\x99\x54\xfd\xc6\xc9\xa4\xea\xc7\xc8\xa4\xd3\xc7\x41\xe6\x85\x46\
+\xf1\xf2\xc5\xbd\x6e\x9f\xae\x7f\x19\xc5\x37\x7a\x26\x51\xe9\x47\
+\x1d\x02\xa3\x71\x5f\xed\xcb\x53\xd9\xb4\x96\x3c\x60\x5a\xd0\x29\
+\x6b\x15\x98\xd9\xe3\xe8\x8b\xf9\xe2\xf3\x0b\xcd\x28\xf6\x13\xa1\
+\x24\xa6\x25\x1b\xbf\x44\xd9\x1a\x62\xb3\x8f\x73\x86\x2c\xd2\x69\
+\xb4\x6d\xa1\xf0\x91\x84\xe3\x75\x16\x84\x3c\x0a\x5e\xb4\xe5\xaf\
+\x31\xe2\xeb\x57\x8a\x55\xcc\x5f\x67\x85\xad\x4a\xa4\x62\xf2\x90\
+\x52\xee\x96\x5b\xb6\x5b\x3b\x2e\x5c\xf2\x04\x3d\xa4\xcd\xa6\xd8\
+\x72\x7c\x9d\xfc\x9e\x1b\x09\x18\x79\xb7\x20\x51\x3e\x08\x8b\xf4\
+\x78\x1e\xae\x83\xd8\x91\x91\xbc\x88\x6a\xb6\x04\x28\xf8\xdc\x7e\
+\x8c\xc7\xab\xdb\x46\x3a\x9d\xba\xd2\x2b\xa8\x36\x75\xe2\x88\x16\
+\x3d\xda\x1d\xc8\x8b\x56\xb1\x03\xca\x56\xf1\xa1\xe2\x16\x89\xe7\
+\xc1\xb1\xfc\xca\x48\xc1\xb1\x77\x6a\xb4\x5d\x8d\xb9\x4e\xcf\x81\
+\xd8\xca\x51\x5a\xa5\x92\x08\xd5\x94\xfc\x1a\xbf\x30\x81\xfc\xaa\
+\x66\xc4\xb7\x4a\xe7\x32\xf5\xa5\x62\x1c\x09\x37\x87\x54\x5b\x7d\
+\xc7\x5e\x8a\xfc\x92\x4d\x83\x46\x34\x63\x80\x91\xe7\x86\x98\x9e\
+\xe2\x03\x81\x27\x60\x62\x68\xeb\x83\xb0\x3e\x1a\x97\x71\xa1\xb2\
+\xac\x3d\x87\xd8\x64\x5a\xf8\x10\x5a\x3a\xc1\xc4\xef\x6a\xd6\xab\
+\x45\xe7\x1b\x45\x9c\x2e\x7c\xd4\x92\x56\x0e\x9a\x17\x70\xca\x4a\
+\xf1\x05\xd8\xb0\x1b\x2b\xa1\xfe\x5c\xd8\xb9\x61\xc5\x4e\xbc\x05\
+\x3b\xf6\xb8\x45\xff\x7e\xdf\xda\x78\x15\xda\xa6\x69\xa3\xa9\xbc\
+\x6b\xe5\xa6\xab\x8e\x44\x2e\xc4\x1d\x3f\xe3\x5d\x33\x58\x97\xe8\
+\x7c\x08\x6b\x45\x65\x5e\x39\x20\x41\x19\x39\xfd\xc4\xd0\xa0\x24\
+\x6b\x2a\x51\x9b\x26\x0f\xb4\x1c\xb7\x59\x52\xe9\x1e\x21\xc5\xa2\
+\x4d\xed\x99\x31\x38\x95\x0e\x51\xf8\xb6\xb8\x76\xac\xb2\x6d\x11\
+\xb1\x85\xa2\x5f\x65\xff\xda\xf2\x11\x96\xf8\x73\xd0\x36\x15\x70\
+\xf6\x99\xa9\x2c\x24\x57\xc8\x7b\xc4\x63\xa2\xfe\x8c\x37\x25\xe3\
+\x77\x4e\x3f\x3c\x36\x7a\x8c\x4c\x9b\x4b\xfc\x6d\xaa\xb6\x18\x64\
+\xd1\x76\x90\x3c\x59\x3e\xb3\xeb\x71\x45\xf2\x71\x1e\x29\x32\x1a\
+\x44\xca\x3e\x48\xb8\xce\xc3\x57\xc6\x14\x10\x49\x35\x4b\x7e\x78\
+\x9b\x4a\x7e\x62\xe5\xc6\x24\xa7\x8d\xbc\x60\x0e\x2d\x99\x18\x52\
+\xea\xba\x46\xbf\xfd\x2f\xa9\xe9\x58\x9e\xef\x2f\x1b\x7b\x27\xe7\
+\xeb\x34\x0d\x37\xb8\xfa\x12\x53\xd2\x96\xf0\x92\x0a\x9f\xb5\x52\
+\x66\x2e\x21\x0a\xa9\xbd\xb3\x9f\xd1\x79\x10\x9f\x5e\x72\xe6\xb5\
+\x84\x5a\x32\x7d\xd9\x30\x2f\x71\xfd\x56\xec\xb3\x0a\x06\x0e\x10\
+\xd7\x69\xbf\x41\xd1\xed\x7c\xfc\xa6\xc0\xf8\x4d\x1a\x2f\x4b\x36\
+\x30\x3c\x36\x5c\xaa\x11\x1f\x6c\x11\x18\xd1\xb8\x34\xc6\xcc\x41\
+\x62\x7f\xc1\xe0\x2d\x36\xb5\x17\xe0\x04\xb7\xda\xd3\xfe\x83\xa0\
+\x01\x6e\xdf\xa7\xd5\x71\x0c\x60\x54\xb9\x24\x04\x56\xe3\xe0\xc2\
+\xed\xfa\x90\x58\x03\xa3\x6c\x54\xd9\x1f\x17\xfb\xd9\xe8\x35\x9f\
+\x63\x76\xa7\x01\x40\xf8\x4e\xba\x6e\x44\xe7\x55\x04\x33\xa8\x52\
+\x13\x78\x8d\xe7\xa1\x23\x60\x10\x9d\x07\x77\xda\xc7\xbc\xda\xe1\
+\xf0\x41\xc4\x28\x70\x9e\xf5\x12\x52\xd8\x48\x31\x97\x5b\xa5\xbe\
+\x45\xcf\x37\x70\x5d\xa6\x6b\x6a\x16\x18\x6b\xe2\xcc\x31\x94\x54\
+\x45\x0d\xe7\x40\x91\x57\xe6\x83\x0c\x91\xfa\x18\x77\x6e\xb6\x83\
+\xb4\x44\xb0\xf4\x8d\x68\xa3\x55\x7d\x62\xd3\x0e\x1f\xd5\x54\x1e\
+\xe3\xc9\x27\xda\xd0\x44\xe3\x1f\x7f\x1e\x97\x5b\x00\x27\xfe\xf1\
+\x84\xef\x8a\xd3\x02\x3d\xd7\xef\xad\x15\x8a\x97\x78\x5b\xf2\xb5\
+\xed\xb0\xf9\xca\x3e\x12\x03\x6a\xd5\x1e\xb8\xe4\x90\xb4\x28\x99\
+\xb8\xaa\x5a\xfd\xc3\x4a\x6b\x54\xac\xfa\x07\xa3\x37\xf1\xc6\x09\
+\x82\x0f\xa2\x7c\x89\x64\xcf\x37\xf7\xa5\x9b\x62\x79\x20\xaa\x24\
+\x18\xcc\x75\x1a\xe6\xcd\xa6\xba\xc9\x9f\x07\x8a\xce\x28\xfa\x2b\
+\x68\x2e\xb5\xe6\x52\x0d\x21\xd5\x0c\xb1\x38\x72\xec\x95\xa1\x67\
+\x34\xda\x2d\x77\xea\xb2\x34\x36\xee\x89\x5a\x6b\xcb\x54\x9b\x5c\
+\x65\xb3\x8f\x3a\x11\x3b\x5e\x0b\x37\x45\x7d\x7c\x85\x8d\x99\x71\
+\x72\x67\x2c\xc5\x35\x66\x06\xc6\x9f\x7b\x36\x78\x71\x04\x94\xa5\
+\x37\x04\x50\x3c\xa5\x8e\xd4\x15\x28\x2a\x61\x23\x14\xb9\xc3\xb4\
+\x84\xef\x94\x34\x09\x54\x5c\xbc\xda\x8e\x8f\x3a\x7c\xbc\x2e\x5a\
+\x32\x6d\xa3\x59\x2a\xc5\xd7\x9c\xdc\x01\xaa\xe7\x19\x34\xfa\xa6\
+\x92\x97\xed\xd3\x37\x78\xae\x6a\x25\xe2\x76\x33\x9f\x6a\x06\xdb\
+\x1c\x19\xb2\x71\xe0\x3a\x6b\xdc\x84\x9f\x53\x92\xfa\x7f\x81\xc9\
+\xeb\x75\xa8\x9a\x1c\x99\x10\x29\x77\xf2\x5a\xc5\x5a\x6a\x77\xea\
+\x34\xef\xb0\x18\xee\x7a\x18\x13\x96\xcd\x95\x68\x85\xbf\xf6\x71\
+\x7f\x58\x4e\x02\xa3\x65\x18\x5d\xd4\x94\xc6\x39\xb0\x14\xd8\x54\
+\xe4\x5c\x25\x5d\x86\x1a\x58\x8b\x20\x59\x43\xb4\x91\xf3\x9b\x9c\
+\x5f\x98\x4d\x0b\x84\xce\x59\x66\x22\xe7\xa8\x86\x5b\x86\x6c\x8e\
+\xd9\xf8\x41\x24\x59\x84\x62\xd0\x06\xd6\xe6\x2e\x35\x7f\x1d\xd3\
+\xb6\x1e\x2d\x33\xb9\xcf\x0d\x0a\x6b\x1b\x4a\xa6\x42\x81\xd7\xe1\
+\x09\x39\x89\x40\xea\xfa\x57\x98\xfa\x66\xbe\x2b\x0a\xaa\xdb\x66\
+\xb3\xc5\x11\xd8\xd2\x88\x36\x0d\xa5\xd5\x3c\xad\xb7\xcd\x48\xfe\
+\xc9\xb4\x15\xe8\x51\xb3\xf4\x9b\xe5\x97\xba\x7e\x34\xe6\x4e\x15\
+\x03\xdb\xb5\x0c\xa6\xd6\x06\xf3\x05\xd7\x9b\x6a\x2c\x56\xd0\x48\
+\x7b\x9b\xc0\xd1\x9d\x1b\xb2\x2d\x81\x91\xf4\x75\xc6\x12\xa0\x49\
+\x67\xc1\x5f\x86\xf7\x24\x2e\xcc\xf0\x2b\xc0\x4c\x98\x20\x53\x40\
+\x8c\xce\x84\x4a\x6a\xe0\xa9\x9f\xd3\xb1\x22\xe1\x0f\xa2\x52\x36\
+\x60\x74\x73\xeb\x54\x03\x39\x86\x82\x31\x38\x76\x66\xec\xac\xb8\
+\xca\xf6\x53\x84\xe3\x69\xa8\x92\x28\x23\xe3\x1f\xd1\xbd\x71\x3c\
+\xaa\x2b\x7e\x75\x6e\xde\xc2\xdd\x28\xfe\x52\x49\xc7\xbd\x58\xf7\
+\x36\x3a\xfe\x4d\xd4\x5b\xf6\x7b\xcd\xa6\xe2\xc7\xf8\x86\xc2\xcb\
+\x88\xd7\xbc\x86\xc3\x38\x74\x9d\x35\x6e\xd8\x3f\x5d\x02\x6f\xc2\
+\xfe\x2d\xf2\xf8\x64\x06\xa5\xc3\xf9\xb3\xa3\x1d\x77\xd6\xc3\xad\
+\x34\x51\x55\x8e\x02\xe6\x57\x4b\x15\xa0\xd2\x5b\x60\x59\xbc\xb2\
+\xa5\xff\x7c\x9b\x08\xf7\x90\x7f\x3b\x26\x7c\xba\xca\xd0\xbb\x16\
+\xc1\x86\xbc\x16\xcc\x22\xc8\xe0\x09\x36\xff\x96\xf0\x61\xe3\xf7\
+\x11\x2d\xdc\x12\x68\xbc\xc6\xe0\x44\xfc\x88\xd9\xd6\xfb\x7c\x46\
+\x0d\xe9\x40\xc9\x91\xd6\x08\x42\x25\xf4\xc4\x75\x52\x6f\xf0\x4f\
+\x77\x2c\x6b\xdb\x3c\xb5\x36\x1b\x4c\xad\x4d\x8b\x25\x23\x51\x7f\
+\x17\xd7\x81\xe1\xe2\x22\x13\xc6\xeb\xa4\x18\x1e\x00\x6e\xb8\x3b\
+\x3b\x9d\xf8\x6d\x73\x34\x7e\xf3\xcf\x66\x58\x16\x29\x52\xf3\x83\
+\xe9\xa3\xec\x09\x27\x09\x08\x78\x3c\x11\x9c\x22\xb4\xce\x3d\xc4\
+\xc1\xd5\x52\x23\x5c\x2a\x9e\x34\x70\x05\xb1\x70\x9d\x03\x54\x09\
+\x04\xd3\xae\x4a\xcf\x5c\xf8\x35\x9f\x1b\x95\x60\xaa\x61\xaf\x2a\
+\x4a\xb5\xaa\x30\xf2\x7d\x4d\x3c\xfb\x19\x84\xeb\x7d\x5e\x72\x75\
+\x58\x95\x77\xb4\x2c\x02\xab\x1d\x0c\x61\x68\x4b\xfa\xc3\x82\x16\
+\x4f\xeb\xf8\xe0\xad\xd3\xf0\xae\x96\x11\x5f\x4c\x1e\xc1\xef\xbf\
+\xb3\xdf\x1a\x9d\x98\xab\x52\xed\x99\x89\xc6\xa4\x64\x44\x61\xd3\
+\xf2\x6b\xd5\xb5\xc6\x48\x88\x9f\x0b\x97\xc5\x8d\xb5\xa1\x16\xa2\
+\x9d\x3e\xa9\x09\x67\x13\xcd\x04\x9d\x82\x64\xf1\x35\xc5\xae\xf7\
+\x28\x7a\x57\x16\x62\x89\xe5\xfd\x28\xb7\x14\x47\xc1\xfc\xc3\xca\
+\x61\x71\x6f\xac\x53\x64\xec\xb9\x27\x20\xfd\x3a\x31\x97\x5e\x5b\
+\xbd\x9c\xab\x83\xa3\x11\x99\xbf\x7e\x4e\xed\x39\xe9\x35\xc3\x57\
+\xd1\xcd\xe4\x44\x75\x4d\x81\x3d\x66\xd1\x3a\xb7\xe5\x04\x6b\xaf\
+\xb2\xb7\xe6\xcd\x91\x3f\xc9\x27\x9c\x2c\x00\xde\xfe\x5a\xaa\xf4\
+\xa7\xfc\xbf\xf3\xea\xcf\x6b\x2f\xaa\x61\x18\xf5\xf9\x7c\x3d\xf3\
+\x8e\xc0\xa1\x35\xee\x5f\xb2\x60\x5c\x8d\xa6\xa7\x8e\xd0\x95\xce\
+\xb8\xba\x42\x30\xb2\x89\xa7\x37\x90\xc7\x07\x66\xae\xc4\x37\xb6\
+\x6e\xdc\x64\xf8\x4d\xa5\xd3\x44\x0f\xa2\x0f\x8b\xc6\x58\x0b\x78\
+\xfb\xf0\x49\x97\x9d\x3b\x54\xe3\x89\xfb\xb0\x66\x62\xab\xf6\x51\
+\x0d\x0f\xe5\xfb\x2b\x2d\x76\x46\xcb\x46\x4c\x1f\x26\x56\x92\x63\
+\xb4\xc4\xd2\x14\xa6\x7d\x77\x8c\x22\xf5\x8a\x72\x70\x40\x2b\x4e\
+\xd5\x91\x1e\x27\x9b\x2f\x57\xdb\x95\x54\x58\x13\x18\x1f\x66\x5d\
+\x5c\x2c\xe0\x4b\x28\xd8\x7e\xa8\x7c\xdc\xc2\xa0\x5b\xd6\x1a\xcb\
+\x9a\xf3\x6f\xc1\x5a\x1b\x5b\x40\xb7\xaa\x48\xc9\xc8\xb2\x1d\x2d\
+\x08\x66\xd7\xea\xa9\x99\x5a\xa4\x2d\xc5\x21\x12\x16\xe5\x7f\xe1\
+\xc2\x66\x71\x5c\x59\x6e\xfd\x3e\x1e\xf6\x50\xcd\x23\x11\xb8\x97\
+\xc8\x73\x20\x98\x07\x78\x99\x6a\xbc\x7f\x59\xa9\x5f\x63\x2f\x82\
+\x98\x7e\xab\x75\x8b\x74\xc4\x6a\x1f\xc6\xd1\x5e\x95\x86\x5a\xe2\
+\x68\x2a\xeb\xa9\x17\x01\x8d\xee\x5b\x8d\x89\xb2\xa7\xb2\x48\x23\
+\x81\x78\x80\x79\x42\x15\xfd\x20\x17\x0e\x9d\x1d\xd2\x70\xd8\xe6\
+\xc6\x40\x53\x12\x20\x59\x94\xc0\xd4\xb0\x60\xaa\x73\x74\xe6\xe6\
+\xea\x73\xdd\x89\x88\x64\x7a\xe7\xbe\x4b\x8e\x5f\x83\xa7\xc1\x75\
+\x08\x00\xe2\x79\x44\x56\x6d\x74\x30\x3a\x0f\x65\xdb\x6b\xdb\xbf\
+\xc1\xb1\xa2\xed\x2b\xb6\x44\xe3\x43\xdf\x56\x53\xd0\x8e\xc6\xac\
+\x41\x68\x10\x9d\x57\x89\xa9\xa2\x8d\x66\x13\x54\x8e\x84\xb5\x77\
+\x16\x7c\xc4\x32\xa3\xc3\x93\xa9\xdc\xdb\xc3\x95\xb6\x98\x93\xc1\
+\xae\x6f\xda\x10\x5f\x5d\xe9\x56\x65\xd9\xd5\x96\x46\x9d\xb9\x33\
+\xc5\xfc\x9c\x1e\xa0\x73\xed\xcf\x8c\x88\x53\xdd\x79\x7e\xfd\x6d\
+\xf6\xcd\x50\xfb\xf1\xf3\xf7\x6b\xd7\xba\x89\x5a\xf9\xb2\x7e\x00\
+\x01\x8d\xb4\xd7\x7f\xa8\x8c\xa9\x96\x00\x07\x53\xc4\xf9\xd5\x70\
+\x35\x36\xb7\x62\x94\x1d\xcd\x23\x1a\xfb\x8e\x7d\x54\xf5\x29\x05\
+\x5f\x19\x7c\xf5\x19\xa5\x6f\x4c\x7d\xdc\x4a\xa4\xe3\x4d\x7d\x5c\
+\xb4\x6a\x5b\x67\xe9\x54\x0e\xd2\xe4\xa5\xd7\xb8\x4f\xaf\x60\x9b\
+\x8b\x6d\x1c\x7e\x2e\x56\x4b\x0b\x60\x83\xab\x47\xcf\xf5\xbb\x71\
+\x52\x0e\x57\xb6\x08\x4c\x03\x4b\xdf\x46\x6c\x9b\xaf\xee\x30\xde\
+\xbe\xb9\x25\x88\x1e\x2b\xe7\x26\x98\x5e\x2d\x77\x3a\xf2\x8a\xe0\
+\x68\xa9\x01\x0e\x9f\xbd\xf3\xc1\x51\x1b\x18\x88\xbf\xd7\x44\x29\
+\x12\x07\x45\x9c\xfd\x73\xe1\xf0\x59\x41\x0c\x89\xb4\x3a\x9d\x11\
+\x58\x9c\x08\xdb\xb5\x85\x71\x70\x55\xb6\x87\x51\xe8\xe4\x61\xc4\
+\x2a\x56\x80\xd1\xd8\xc6\x15\x8a\x62\xb5\xd4\xac\xc6\xd8\x47\x7f\
+\x0d\xab\x6b\x25\x23\xe5\xac\x48\x5b\xc4\xfa\x0f\xb5\x70\xd2\x32\
+\x77\x1c\x35\xb5\xa2\xb4\x52\x99\x93\x8a\x6c\x65\x48\x25\xe1\x4a\
+\x80\x4b\x25\x37\xf2\xc7\x76\x5a\xf1\x95\x53\x41\xc7\x8b\xab\xb4\
+\x43\xc7\x14\xa8\xe8\xbb\xb3\xd3\x9a\xfd\xc5\x1b\x3b\x8b\xe6\x76\
+\x22\xb5\x66\x71\xb1\xbe\x53\xab\xab\xf4\x24\xb2\x0d\x6e\xb1\x43\
+\x9c\x2c\xfb\x63\xdd\xea\x3e\xb3\x5b\x7a\xeb\xd1\x29\x0a\x04\x15\
+\x1e\x77\x5a\xcf\x81\x7a\xf5\x49\x3c\x0c\x5e\x7d\xe2\x81\xa1\x3a\
+\x08\x95\x75\x49\x1c\x04\xf5\x56\x0e\x2f\x1a\xf5\x57\xf2\xa8\x0d\
+\x14\x26\xf7\x54\x59\x46\x2b\xd5\x3e\xc7\xc9\xa8\xb7\x16\xda\x95\
+\x51\x9b\x20\x26\x37\x67\x6c\xdf\x12\x56\xc7\xec\x9b\x2d\x6b\x74\
+\x7c\x16\xbb\x32\x56\x6d\x81\x29\xba\x35\xad\x43\x2d\xed\x47\x57\
+\xe3\xc0\xed\x23\x9f\xcf\xd7\x03\x6e\xbf\xa5\x36\xf8\xfd\xfd\x60\
+\x8f\xcb\xd7\x93\xc4\x27\x81\xfa\x5b\xa1\x30\x72\x2b\xa9\x23\xb9\
+\x1a\x07\x23\x6b\x6c\x9c\xc2\x6a\xdd\x8f\x63\x6b\xfc\x75\x47\xbe\
+\xb8\xcb\x99\x99\x34\xab\x26\x59\xc6\x06\x55\x29\xaa\xe5\x4a\x38\
+\xe7\x9a\x18\x1d\xfb\x66\x62\x93\xb9\xcb\x18\x7d\x12\xb5\x82\xb8\
+\x12\xda\x89\x08\x2d\xcb\x67\xb2\xb8\xfc\x23\x62\xeb\x70\x8e\x4b\
+\x8f\xfb\x7f\xe5\x00\x2a\xf6\xfa\x5f\x39\x80\x1f\x69\x0e\x20\xa1\
+\xeb\x14\x1b\xec\xd5\x25\xc8\x0e\x3b\x5f\x2b\x04\x8f\xf2\xae\x55\
+\xcc\x22\x2a\x76\xf4\x07\x20\x7f\xa4\x01\xaf\x14\xd0\x42\x48\x15\
+\xac\x54\x04\x12\x17\xab\x9b\x85\x97\xcc\xba\x10\xf6\x9c\x88\xe3\
+\x23\x70\x3d\xed\xab\xd6\xf6\xc7\xe6\xc2\x13\xf3\x47\xe6\x32\xb6\
+\xd4\x44\x3b\x97\x7e\xdc\xd8\x58\x55\x88\x9f\x47\x3f\x2d\x6e\x45\
+\x77\x2d\xb1\xb8\xc2\xcb\x13\x89\xcb\x72\x6f\xcc\xa3\xd6\x9c\xfb\
+\x8a\x6a\x98\xd9\x31\xb8\xc2\x0c\xf1\x5d\x75\xdc\xc0\xac\x29\x51\
+\xad\x5a\xbd\x52\x8e\x03\x55\xaf\x1b\xca\x0a\x66\xb7\xd6\x8b\xd1\
+\x78\x9a\xbe\x7f\x98\x38\x9c\x99\xed\x92\xa2\x6b\x20\xac\x8a\xac\
+\xe5\xc4\x3a\xae\x56\xcc\x7c\x39\x0d\x8c\x19\xa2\x6c\x25\xdc\xb0\
+\x8e\xdd\xec\x5b\x25\x0b\x73\x89\x91\x41\x34\x2f\xa9\x64\x1f\xe2\
+\x67\x4e\xcf\xe8\x42\xbb\xca\x33\xa7\x96\x0f\x20\xfc\xc4\x9a\x22\
+\x39\x82\xeb\xf9\xe2\x22\xb8\x33\x60\x01\xe1\x0f\xe0\xdc\xfa\x81\
+\x4a\x1e\x88\x4b\x19\x63\x6b\x0d\x75\x4a\x18\x4b\x3c\x71\x2b\x54\
+\x57\x85\xe9\x6e\x16\x5e\x39\xfc\x6f\xe6\xe6\x63\xe1\xaa\x25\x57\
+\x62\xc1\xe4\x0b\x2a\x83\xca\xd1\x37\xdb\x74\xae\xc2\xc8\xc6\x36\
+\xe8\xf6\x59\xe8\x16\x8b\x5e\x0a\x96\x8a\x1c\x05\x98\x64\x32\x8a\
+\x88\xf0\x54\x64\xd5\x35\x4c\x40\x9b\x6e\x80\xe9\xe6\xae\xdf\x14\
+\x85\x2d\x8e\xcb\x4a\x26\xc5\xab\xc0\x52\x40\x61\x3e\xf3\xae\xe8\
+\xa4\xc9\xad\xe8\x66\x3d\x57\xee\xf3\xa8\x3a\x2c\x08\x7d\x95\x3c\
+\xd1\xea\x95\x00\x14\x50\x06\x40\xf6\xed\x42\x53\xf1\x99\x66\x43\
+\xbd\x9a\xe6\xa6\x5d\x38\x02\x39\x42\xee\xa3\xb5\x15\xe6\x33\x0d\
+\x6f\x77\xe3\xaa\x93\xf3\xa3\x84\xbf\x46\xb1\x32\x3d\x22\xb5\x8b\
+\x95\xe9\x62\xe0\x5d\x63\xc7\x5f\xd5\x23\x6a\x2b\x92\x46\xd4\x89\
+\xcc\x9c\xdb\x0e\xa0\xe7\x79\x99\xf3\x5b\x6d\xc8\x3c\xef\x5a\x6d\
+\xd5\x21\xe3\x0c\xc6\x6d\xe8\x99\x58\x2b\x4f\x1d\xf7\xc4\x35\xd1\
+\x3e\xa8\xe7\xc9\x6b\x59\xfe\x5a\x46\xa8\xeb\xf6\x2d\x59\x89\x7b\
+\x16\xe5\x5c\xb9\xa4\x54\x2a\xd9\xc8\xfb\x99\x23\x92\x5d\x89\x6e\
+\xdc\x90\x5b\xcf\x0e\xf9\x61\x8c\xcf\x38\x95\x8c\x63\x10\x65\x0c\
+\x47\x5c\x6d\xd1\xb1\xe2\xd2\x0a\x76\xc1\xe8\x62\x54\xb5\x82\xd6\
+\x3f\xb1\xa0\x50\x9b\x58\x65\x4b\x15\xeb\xc7\x50\x43\x25\x64\x0c\
+\x48\xc2\x86\xf3\x67\x0c\x16\x88\xf9\x19\xec\x8d\x45\x9f\xa2\x37\
+\x4f\x71\x25\x64\x9c\x74\xa6\x64\x72\xd2\xb2\xe3\xce\xb2\x4c\x23\
+\x44\x1f\xa9\x7f\x03\xd6\x0e\xac\xb6\x2b\x33\x5a\x22\x18\x63\xac\
+\x03\x85\x35\x8e\x8d\x4b\xba\x30\x40\xad\xbd\xc5\xf7\x9d\x78\x5c\
+\xfa\xa3\xfe\xea\x19\x25\x87\x71\x55\x33\xda\x29\xf3\x94\xcc\xc4\
+\xfb\x61\x95\xb2\x75\xae\x1f\xe6\xcd\xd2\x39\x7e\x98\x27\x49\x07\
+\xe7\x2a\x4f\x6e\x3d\x56\xc9\xe4\xb2\xbc\x88\x97\x62\x4c\xa0\x2c\
+\x93\xaa\xd1\xd7\xaa\x25\x87\x5c\xb2\x7c\xad\x48\xfa\xd4\xeb\x6b\
+\x79\xf3\xb8\x35\x8e\xb9\x8e\xa0\x63\xc6\x5c\x88\xb2\x6f\xc0\x2b\
+\xf9\xde\x95\xc7\xbc\x86\xcc\xec\x59\xa3\xdd\x2b\x8c\x37\x98\xf5\
+\x83\x7c\xd8\xc5\x7b\x6c\x3e\x6c\xb1\x9b\xc6\x92\x18\x71\x8b\xbc\
+\xc4\xfb\x88\xb5\xf4\xec\x52\xc3\xa1\x82\xed\x8a\x39\xe3\xed\xb3\
+\x28\x5a\x89\xfe\x70\xfc\xef\xd8\x93\xd7\x91\xff\xb1\x4d\x79\x6d\
+\xf8\x3f\x66\x16\xc3\xf8\x7e\xb5\xf8\x5e\x5c\x77\x97\xab\x7a\x5f\
+\xd8\x03\xc3\xb1\xfa\x86\x68\xac\x1c\xb7\x12\x0a\x86\xc0\x9f\x97\
+\xb4\x9f\x54\x72\xf3\x93\x76\xda\x5a\x31\xd3\x59\x95\x3f\x70\xd6\
+\x1f\x8b\xe3\x93\x78\xea\x78\xf4\xa5\x4b\x9c\x58\x0f\x44\x72\x6b\
+\x44\x7e\xa2\x50\x54\xa2\x8e\x57\x5f\x46\x53\x1a\x31\xfc\x62\x53\
+\x87\x9f\x29\x95\xf4\x73\x47\xd8\x1e\x1b\xbf\xd4\x4f\x8d\x88\x7f\
+\x6a\xd3\xc1\xe3\xa1\x22\x2f\xd5\xf0\x06\xd2\x9d\xd5\x56\xc7\xb1\
+\x7a\x8c\x5b\x25\x47\xeb\xce\xe8\x5a\x39\xe2\x91\x4e\xa4\x3b\x75\
+\x64\x80\x6b\x35\x31\xb6\x71\x73\xac\x56\x3d\x75\xa7\xbb\x2e\xa6\
+\xeb\x18\xa2\xba\x15\xcc\x12\x78\x18\xec\xd8\x3b\x32\xff\x59\x99\
+\x1f\x50\xe6\xbc\xa4\x82\x7a\x1f\x33\x58\x89\xf3\x78\x46\x70\xea\
+\xa2\x94\xd4\xba\x6b\xd1\xfa\xf2\x10\xac\x05\xf1\xe9\x64\x1e\x54\
+\x75\xab\x5a\xfc\x45\xf1\x9c\xb5\x96\x8f\x2f\xdb\x8a\x33\x87\xb8\
+\x77\x93\x75\x55\xcf\xb0\xaa\x9e\x1d\x55\xcd\x93\x79\x65\xb9\x7c\
+\x9f\xbf\x46\xc8\x64\x0f\x55\x0f\x46\x1f\xa3\x15\x49\x45\x5e\x52\
+\x4e\x8c\xaa\x75\x49\x11\x4f\xa9\x18\x37\xb2\x86\xb2\xbb\xde\x4f\
+\x07\xd6\xf4\x26\xae\x8a\x2c\x24\x65\xe6\xb3\xd0\x1c\x66\x85\xf9\
+\x34\x5c\x95\xe0\x8b\xed\x55\x47\xa2\x53\x53\xd5\x2c\xdf\x47\x81\
+\xe9\x16\x8d\xa7\xcd\x9c\xa6\x65\x4f\xa2\x73\xa8\x58\x72\x3a\x90\
+\xf4\x44\xd7\x8c\x52\x90\xb0\xef\xb8\xf9\x54\xd1\x3d\xea\x1f\xc5\
+\xcc\x51\x7c\x1b\xb5\x47\xed\x54\x55\xeb\xa7\xba\xcb\x08\x39\x12\
+\xc5\x2d\x66\xdd\xab\x04\xca\xda\x22\x1c\x90\x67\xee\x59\xfb\xca\
+\x53\x03\x57\xdb\x88\x09\x69\x32\x73\xab\x18\x91\x88\x33\x12\x57\
+\xeb\xbe\x26\x6a\x59\x5c\xac\x5c\x5b\xa6\xa7\xeb\x75\x07\x4a\x49\
+\xa8\xe7\xe5\x8d\xcf\xb9\x24\xf2\x24\x4c\x9c\xc7\xa7\xa2\x45\x39\
+\x22\x76\x3e\x50\x33\x9e\xad\x12\x45\x9f\xa0\xd6\x0f\xf3\xf8\x31\
+\xd5\x7b\xb4\xd7\x2a\x73\xbb\x35\x19\x1b\x9f\x5f\x69\xad\x5f\x56\
+\x03\xdf\x59\x96\xc9\xe2\xbb\xa8\x15\x74\xf9\x23\xe1\x5d\x5f\xcc\
+\x68\x54\x35\x2c\x16\x93\xd9\xba\x6c\x31\xd7\xd3\x8d\xb6\x9d\x20\
+\x31\xb0\x9a\x95\x8d\x99\x8e\x79\xd5\x9a\x7d\x61\xdf\x78\xa5\x63\
+\x0b\x70\xd6\x67\x9d\xb6\x51\x4b\xf0\x2c\xb3\xbb\xa6\xdb\x3a\xf4\
+\x34\x69\x74\x9d\x0e\xd6\xa0\x5a\xe7\xed\x0c\xc8\x55\x63\x05\xd9\
+\x5c\xe3\x6d\xd6\xab\xb0\x6b\x1f\xbc\xcf\x1d\xf9\xd6\x71\x56\x99\
+\x6b\xae\x81\x4a\xc6\xa3\x55\x33\xd9\x5a\x9e\xac\x6a\x07\x39\x41\
+\x8a\xf9\x6f\x89\x79\x67\x46\x0b\xf1\xe9\xbd\x88\xbe\x2b\x61\x3c\
+\x9d\xda\x11\xa4\x2e\x30\xe3\x23\x1f\x60\x17\x9b\x1f\x70\x57\x95\
+\xb6\xf9\xde\x95\x05\xc3\xfb\xeb\x76\x18\xbb\x8c\xc3\x29\x25\x59\
+\x0a\x16\xb5\x0e\x90\x5a\x15\xd2\xbf\x09\x19\x41\xb0\x6d\x76\x57\
+\xbc\x8e\xc2\x55\x0d\x26\x77\x25\xbe\x5a\xe1\x91\xb0\x98\x35\xb3\
+\x36\xd7\x42\x25\xbb\xb6\x5e\xc9\xbf\x6a\x53\x69\x03\x16\xe7\xfb\
+\x7a\x95\xba\x4f\xe9\x01\x2b\x3f\xa7\x62\x6f\x06\x43\x00\x92\x7d\
+\x40\x2c\xba\xad\x7d\x2d\x59\x48\x2a\x7d\x10\x01\x3b\x08\x1d\x6d\
+\x7b\x79\x3e\x5b\x60\x6a\x1a\xed\x8a\x2a\xab\x6d\x14\x0a\x23\x3d\
+\xbd\x02\xaf\x07\x1e\x1d\x91\x92\x7a\xb3\x87\x9e\x66\x95\x9e\xbc\
+\x41\xdd\x6e\xcf\xaa\x65\xf2\xf9\xc6\x78\x5d\x44\xec\xe0\x88\x55\
+\x1e\xac\x96\xad\x35\x6c\x24\x6d\x17\xb8\xd4\xad\x47\xab\x99\x07\
+\x12\x73\xa6\x23\x14\x85\x65\x9e\xb3\x53\x2f\x6e\x6e\x74\xe2\x02\
+\x7b\x35\x4f\x95\x49\x35\x14\x5e\xae\x75\xa1\xd2\x42\x7a\x25\x47\
+\x99\x3d\x45\xd3\x7d\xf4\x9f\xb5\x36\xc9\x12\xd3\xf6\x3a\x0c\x23\
+\x08\xe5\x8f\x16\x5e\xe7\xe8\x7b\xe0\x6b\x50\xbe\x46\x25\xd8\x98\
+\x46\xb4\x6c\x80\x60\x53\x1b\x2e\xa3\x0b\x57\xb8\xef\x41\xb3\xb3\
+\x0d\x25\xe3\x2e\xab\x06\x24\xaa\x4a\x43\xd9\xfe\x43\xfc\x3a\x29\
+\xd8\x4f\x89\xba\x0f\x7c\xb4\xcd\xec\xa2\x60\x02\x27\x47\xe3\x5b\
+\x83\x0e\x7b\xe1\xd8\xd7\xef\x20\x78\xed\x13\x53\x83\xe4\x3c\x59\
+\xa8\xe2\x71\xb1\xe7\x7b\x66\xd4\x91\xb7\xa8\x6f\x1e\x9d\x17\x54\
+\xbe\x43\x25\xe7\xdc\xca\xc7\x6d\x8b\xae\xe7\xbd\x3c\x22\x2b\x76\
+\x2c\xc9\xce\xe3\x79\x37\xac\x9d\x84\x50\x1a\x0a\x77\x5a\x9b\x5e\
+\x6b\x5f\xd4\x19\xad\xb1\xd7\x04\x75\xfb\xf4\xaf\x37\xaa\x57\x84\
+\xed\x8c\xae\x0c\x84\xd7\x0c\xe5\x3e\x58\x4c\xd6\xc4\x3f\x6a\x26\
+\x8e\x5a\x69\x47\x3c\x18\x59\x95\xce\xaf\xf0\x5c\x9f\xf7\x7d\x52\
+\x2d\x95\x66\xf5\xdd\x31\x75\x66\x6b\x54\x58\x57\xb5\x8e\x10\xf5\
+\xa7\xd7\x7c\x6c\xf6\xf4\xa1\xec\x8a\x59\xf5\xcc\x9a\x87\xa9\xc6\
+\x33\x2d\x71\x3c\xd3\x5c\x91\x57\x8c\x77\x11\xe1\x14\xf4\x82\x32\
+\xce\x25\x86\x47\x56\xb8\x3c\xd2\xec\xe1\x0d\xd5\xb2\xe1\x0c\xfc\
+\xdc\x16\xe7\x0a\xcf\x73\x45\xd5\xaa\xeb\x9c\xf9\x0e\xb7\xaa\xce\
+\x99\xe9\x88\x14\xd5\xbd\x5e\x7d\xe2\x1a\x97\xd8\xac\x61\x14\x82\
+\x0e\x47\x06\x4a\x76\x90\x53\x25\xab\xeb\xa9\xef\x7c\xe3\xc1\x81\
+\x2a\x3d\xf1\xdc\x60\x75\x78\x7c\x35\xb6\x51\x80\x22\x6f\x5d\xb3\
+\x41\x62\x6c\x5e\xb6\xe6\xf7\xde\x68\xf0\x78\x9e\x04\xc7\x96\xd4\
+\x7d\x3f\x49\xc9\x2c\x20\x68\xb2\xa8\xec\xd3\x79\x28\xcc\x7a\x4b\
+\x09\xae\x0b\x8d\xcc\x43\xd9\xbd\xd9\x72\x61\xcd\xc0\xe0\xe7\x53\
+\x44\x9f\x91\x95\x09\x75\x2a\x8d\xed\xda\x72\x11\xa1\xfb\x4a\x0f\
+\xcd\x7d\x56\xdd\xcc\xe9\x76\x5a\x18\x62\xfb\xce\xc8\xe1\x9d\x7e\
+\x51\xe6\x41\x15\x09\x19\xff\x6c\xb5\x7f\x35\x01\xbb\xef\x4b\xad\
+\xbe\x19\x66\x26\x43\xe0\xac\x01\x23\x69\x84\xf0\x56\xb6\xfe\xda\
+\xf8\x77\xa7\xc4\x59\xfc\x95\xc4\xae\x25\xc0\xef\x52\x71\xe3\x92\
+\xa0\xa4\xa2\x63\x52\x72\xf9\x52\x5f\xa3\x32\xc8\xd2\x4f\xa7\x3a\
+\x7e\x43\xdc\xda\xd6\xfb\x1c\xa8\xac\xb5\xae\x15\x00\xe2\x75\xce\
+\x06\x7b\xb5\x67\x8f\xf9\x3e\x5c\xbf\xe6\x97\xb1\x4a\x63\xef\xd6\
+\xd9\xc7\x8f\xbf\x27\x3b\x19\xcf\x05\x86\x07\x36\x54\xce\xba\xd9\
+\xb0\xe0\x1c\x29\x86\x41\xf0\x83\x77\x95\x0e\x9b\x2b\x62\xde\xdf\
+\xaa\xfc\x05\xd7\x46\xf9\xb3\xf8\x01\x08\x84\x2a\x2d\x13\x1e\x3b\
+\x19\x69\x46\xe9\x8d\x04\x8b\x63\xb3\x70\xde\xb8\x16\x48\xec\xb9\
+\xc8\x4a\xb0\x54\xa9\x4a\x33\x79\xec\x37\x16\x3c\xd6\x5c\x94\x7f\
+\x2d\x79\x5f\x9c\x6d\xf2\x5b\x18\x42\x0d\x80\xfd\x90\xb1\x7e\x51\
+\x7b\x59\x01\x57\xa1\x4a\x4b\x02\x66\xfc\xc5\x5d\xb5\xc2\x15\xa5\
+\x58\x2c\x3c\xca\x0f\xd6\xf0\x78\xb9\x47\x6e\x88\x9f\x63\x2b\x8c\
+\x6b\xe5\x6b\x2b\x0e\xa8\x3c\x7c\x35\x94\x7d\x5a\xf1\xc8\x1b\x11\
+\x36\x9c\x07\x42\xef\xb8\xc2\xbc\x84\xde\x77\x65\xc2\x4f\x3d\x65\
+\x27\xda\x12\xaf\xb3\x88\xe6\x81\x14\x4e\x6e\x9b\x0a\x2f\x53\x34\
+\x68\x3e\xd1\xdb\x09\x44\xe3\x3c\xed\x00\xde\x35\x7a\x5c\xad\x6d\
+\xbf\x8b\x25\x3a\x47\x52\x21\xa4\x93\x24\xa9\xad\x9f\x95\x08\x87\
+\x1a\xfa\x31\x16\x54\xcd\x69\x1a\x3f\xc4\x3b\x4f\x82\xdb\xd6\xb4\
+\x37\x5d\xa0\x75\xc9\xc4\x67\x1c\xdc\x95\xda\xb5\xe9\x8f\xe1\xd7\
+\xef\x16\xc6\x4e\x87\x6d\xdb\x37\xc4\xcd\x31\xba\xab\x82\xb0\xdf\
+\x96\xc9\x75\x0e\x44\xe6\x0f\x37\x6d\x3d\xb7\xc5\x5f\x6b\x6c\x86\
+\xc6\x5d\xaf\x58\xcd\x47\x58\x70\xac\x89\xb3\xe1\xcb\x6b\x84\xc1\
+\xf0\x70\x14\x02\xb5\x8e\x46\x85\xfe\xf5\x1c\xb1\x6f\xb5\x0c\xbd\
+\x2a\x72\x09\xaf\x92\x61\xe6\x04\x21\x66\x89\x0c\xeb\xb9\xa3\xc8\
+\xdb\x2f\x7c\x6d\x0b\x2c\xbc\x2d\xa3\x47\x7f\xdc\xe7\x0e\x2b\xd7\
+\x95\x20\x3f\x4c\xc5\x1f\x6e\x2d\x89\x4c\xc5\xbb\x31\xa1\x3d\x72\
+\xec\x69\x35\x99\x0f\x70\xea\xbc\xfd\xfd\x57\xed\x5b\x22\xeb\xeb\
+\x19\x8f\x18\xea\xd7\x7e\xee\xd1\x59\x3b\xd0\xc7\xb1\xee\x33\xfa\
+\x26\x52\x94\xde\xb9\xce\xa9\xb8\xcf\x41\xe2\x54\xbb\x93\xdd\xc7\
+\x4b\x69\x8b\x9f\x55\x46\xde\xae\x13\xdc\xe7\xc2\x77\x7e\xb0\xb9\
+\xb5\x58\x5e\xc8\x6c\x16\x77\xe1\x32\xb6\x0b\x55\x9b\x28\x2e\xef\
+\xa8\xca\x39\xca\x73\xc7\x4f\x9f\x60\x8a\xe9\x59\x35\x6f\x9d\x30\
+\x88\x37\xd3\x78\x73\xc2\xf1\x30\x54\xeb\xdf\x50\xc5\xdb\x3b\xa6\
+\x47\xa4\x86\xd2\x95\x72\x3b\x66\xb2\x75\xab\x79\x8e\xcc\x58\x37\
+\xe9\x0f\x7b\xc4\x1e\x6f\xbe\xbc\x5f\xb4\xdf\x4a\x7d\xba\x0f\xd4\
+\x24\x22\xea\xc0\xe9\xcf\xa9\xf7\x76\xa5\xc3\x8d\xc9\xed\xba\x1e\
+\xc5\x81\x86\xf3\x4c\x25\x9b\xb3\x4e\x7f\x19\xd1\x18\xaf\x61\xa8\
+\x40\xb5\x65\x75\x45\xfc\x5a\x2d\xae\x2c\x68\xcd\xde\x88\x6b\x7f\
+\xa2\x32\x20\x18\x2c\x02\x8b\xbd\xc4\xbd\x18\x18\xa5\x3c\x62\xe2\
+\x45\xd7\xcb\xed\xb0\x46\x03\xc5\x01\xda\x94\x62\x5f\xda\x8a\x58\
+\xb1\xfb\x23\xa4\xcf\xce\x21\x6c\x38\xf7\xca\xc8\x96\xc8\x98\xc4\
+\x57\x46\xa2\xb9\x0b\xcc\x1c\xea\x36\x05\x4f\x02\xf9\x2c\x31\xd6\
+\xc3\xa6\x44\xf4\xb9\x4a\xc7\xd5\x90\x53\x61\xfc\x33\x30\x5e\x93\
+\xf8\xc4\xcb\x3f\x54\x8a\x57\x5d\x39\x34\xeb\xbe\x60\x3f\xc7\xc4\
+\xab\x06\x2d\xfc\x4e\x24\x67\x96\x28\xba\xbd\x31\x60\x70\xec\x77\
+\xcd\x6f\x82\x42\x35\xec\xbe\x9e\xe5\x1b\x98\x7c\x7d\x8b\x54\xde\
+\xeb\xd5\x6f\x0d\xb1\x53\xad\xb4\xb7\x6a\xb8\x7d\xc0\x54\x4d\x55\
+\x88\x21\x78\x63\xc2\x44\x94\x6c\x2e\xc6\x36\xb2\x45\xd6\x1c\x58\
+\x53\x59\xe8\x55\xc5\xbe\x98\x21\x8a\x43\x94\x87\xd5\x5b\xd0\x04\
+\x88\x4e\xac\xe3\x3c\x4e\x05\xaf\xcd\x7b\x59\x51\x1b\x3e\xbd\x63\
+\xd1\x32\x22\x48\x50\xcb\xbb\x4a\xce\xeb\xbd\x1a\xe7\xf1\x2e\x58\
+\xf1\x4e\x19\x70\xdf\x29\xa3\x3c\x77\x0d\x6f\x75\x7c\x31\xad\x1d\
+\x7c\xd9\x1b\x6e\xf4\x7b\xd6\xac\x35\x24\x04\xb2\xc2\xae\x05\xa5\
+\xd7\xe0\xdd\x14\x0e\x2b\xea\xf7\x6c\x94\xec\x4a\x0d\xdb\x5f\x31\
+\x25\xbe\xbc\xb5\x48\x1b\x1a\x7f\x04\x99\x8b\xbf\xe1\x1d\x3b\x58\
+\x8d\x81\x2b\xd0\x6d\x2e\x76\xeb\x3e\x58\x2b\x91\x37\x82\xe8\xd1\
+\x8b\x29\xda\x47\x3c\xc0\x8c\x23\x7e\xaf\x88\xcd\x03\x52\x52\xd4\
+\x2d\xdc\x9f\x60\x6f\x15\xb2\x57\xfc\x50\xfd\x9a\xf7\x08\x60\xdf\
+\x91\x28\x52\x71\x9b\x79\x5e\xbc\x9a\xe0\xf8\x0b\x9e\x58\x86\x29\
+\xe0\x62\xae\x8e\xc5\x3b\x18\xd0\x33\xfd\xa5\x58\x1a\xd8\x6b\xb3\
+\x47\x66\x1e\x7d\x9e\x64\x8b\x8e\xca\x71\x2c\x53\x32\xc3\x88\xbc\
+\x05\xce\x23\x86\x7b\x25\x38\xe5\x33\x5c\xf9\x60\x2f\x92\xd7\x90\
+\xd4\xf2\x2e\x18\x06\x2f\x7f\x9e\x72\x0d\x58\x4f\x31\xac\x94\x9e\
+\x95\xa8\xd7\x32\x34\x61\x85\x5f\x65\xb1\xf8\x84\x29\xdc\x41\x44\
+\x56\x63\xa5\xe6\xc6\xa3\x7d\x18\x7a\xb8\x74\xd0\x7d\xe0\xd7\x06\
+\xeb\xb6\x99\x5f\xa0\x2a\xc9\x75\xeb\x91\xfa\x7b\x95\xb9\x33\xd6\
+\x66\xb9\x67\x64\xcd\x03\x99\xca\x07\x74\xd2\x85\x51\xcf\x1c\xe5\
+\x7d\x38\x2e\x8e\xe7\xe7\x56\x09\xd8\x18\xa1\xd8\xdd\xf8\xd8\xd6\
+\xb3\x27\xf6\xa0\xba\xdd\xeb\x19\x4c\x43\x4b\x6f\xd6\xc0\xf5\xc0\
+\x23\x34\x35\x5c\x65\xd1\x55\xc4\x29\xe6\x29\x01\x84\xe7\x41\xf6\
+\x5e\x1d\x1f\x17\xdb\xda\xcc\x9e\xb3\xf3\x9d\xc7\x5c\xce\x3b\xb1\
+\x8b\x1a\xa3\xfb\x25\x3d\x1a\xf8\x17\x77\x51\x25\x75\xbd\x92\x3d\
+\x61\xdb\xac\xa7\x42\xd6\x21\xdd\x8b\xdf\xf3\x84\x6d\xb9\xae\xb8\
+\x2d\x61\x6e\xc0\x95\x97\x11\xa9\xb7\xab\x09\x05\x0c\x38\x7e\x74\
+\x62\xa4\xea\xf1\x63\xe5\x77\x44\xa0\xc8\xc4\x27\xed\xb1\x6b\xdf\
+\xbb\xbe\x8c\x59\x75\xc2\xbc\xe1\xd2\x58\x68\x51\x87\x57\x96\x9b\
+\x78\x82\x43\xc9\x34\x67\x52\xf1\x78\x98\xf1\x97\xd8\xbb\xe3\x1a\
+\x8d\x9e\x28\xa9\x97\x64\x89\x17\x99\x8a\x06\x63\x9f\x93\x51\x91\
+\xac\x4b\x0f\x93\x9f\x54\xd5\x14\xf8\x1d\x00\x0e\x35\x0c\x25\x54\
+\xcc\x8a\x7d\xd3\x65\x15\x9e\x68\x2d\xc7\xac\xf9\x6f\x61\x6d\xe7\
+\x5d\xa2\x1e\xbf\xd1\x93\xb6\x6f\x2b\xb4\x82\xf1\xf8\x65\x31\x21\
+\x7a\x6f\x27\xeb\x53\x56\xff\xa9\xcd\xec\x47\x70\xf0\xeb\x4d\xeb\
+\xa9\x9b\x4e\xb1\xa2\x92\xd2\x92\x3e\x9e\xb0\x57\x29\x31\x39\x84\
+\x7a\x87\x27\x62\x6a\x80\x74\x96\x11\x6b\x28\xc3\x16\x60\xd5\xfe\
+\x2e\x89\xd1\xc6\x91\xca\xff\x48\x8b\x08\xf7\x7d\xd1\x9a\x65\x57\
+\xdf\x19\x8d\x64\xcb\xb6\xa0\x8f\x4b\x58\x23\xb2\x71\xef\x33\x37\
+\x83\x81\xe0\x88\x70\x6d\x4b\xc4\x7e\x99\x5c\x9b\x49\x0e\x9b\x6f\
+\x0f\xc7\x9a\x7d\x3b\xb6\xdf\x10\xad\x71\x73\xc7\x3d\x8a\x9f\xd9\
+\x0b\x4c\xce\x40\xbf\xb7\x03\xd5\x3f\x7a\xfb\x70\x79\xcb\x4f\x43\
+\x5f\x1f\x76\xa0\x66\xf1\x9c\x5c\xcb\xad\x83\xd8\xab\x06\xe8\x27\
+\x84\xca\xe2\x4d\xc7\xda\xe7\x2f\xa9\x33\xac\x69\xa2\x3f\x20\x32\
+\xcf\x10\xc7\xc5\xa6\x3e\xc8\xcb\xbd\x11\x3e\xb3\xed\xaa\x8a\x1b\
+\x97\x4b\x5d\xa6\xeb\xfc\x28\x54\x46\xc2\xc4\xb3\xee\xe2\xb9\x8f\
+\xe8\xfc\x84\xeb\x3d\x55\x7e\x97\xbb\xa0\xa2\xb0\xbb\x7c\x2d\x2d\
+\x9b\x0f\xae\x35\xfa\xa6\xc3\xe2\x73\x37\xeb\xe8\x8b\xab\xa5\xdf\
+\xcd\x61\xb7\xe7\x15\xb1\x0e\x92\x9c\xe9\x4e\x6e\xdb\xc7\x58\xae\
+\x17\xdb\xf3\xa3\x96\x3c\xa3\xd9\x50\x19\x58\x3b\xf3\x7b\x95\xfd\
+\x15\xe4\xf1\x49\x91\x91\xce\x49\x59\x79\x27\x51\xff\xba\xd6\x2c\
+\xa4\xd2\x6b\xfa\x5d\x8b\xa5\x68\x1d\x11\xb6\xb8\x52\x5a\x6d\x1f\
+\xe5\x8c\x52\x81\x68\x8c\x0e\x9a\x75\xd5\xb0\xac\x46\x75\x93\x2d\
+\x53\x2b\x11\x6c\x06\x7f\x97\xf8\xd1\x33\x89\x4a\x3f\xaa\x3d\xec\
+\x73\x47\x56\xcf\xf7\xc1\xd7\x1c\x81\x03\xff\x99\x05\xd5\xf5\x80\
+\x60\x67\x51\xcd\x89\x5a\x7c\x1b\x1d\x97\x5a\x3d\x45\x5b\x87\xda\
+\x83\x80\xf7\xad\x11\xf2\x79\x85\x32\xd6\xf3\xd9\xbf\x28\xde\x91\
+\x1c\xed\xf9\xbd\x6b\xe6\xf5\xcc\x0d\x3b\xb5\x94\xf6\xd3\x32\xd1\
+\xaa\xa5\x25\x4e\x4d\x1f\x5e\x4d\xab\xa4\xb5\xa5\x6f\x91\x18\x6b\
+\xac\x63\xeb\xa6\x7c\x2b\x38\xf8\xea\xa6\x3c\xef\x9a\x42\xb5\xfb\
+\x55\x13\x7f\xce\x1c\x51\xe5\x67\x16\x5a\x2c\x19\x10\xfd\x2b\x6a\
+\x1a\x3d\x60\x85\x61\x6e\x5d\x0e\xae\x5b\x80\xba\x98\xe7\x92\xa2\
+\xfa\xc7\x3c\x97\x14\xe1\x60\xf7\xa9\x24\x6c\x3f\xaf\xc5\x6b\xb8\
+\xe1\x28\xd6\xe8\x1b\x83\x93\xb2\x3a\xb5\xc5\x36\x58\xf3\xe1\x2a\
+\x35\x4f\x76\xa3\x5c\xc6\x29\x2f\x4f\xbc\x93\x00\x61\xe9\xc5\xca\
+\x04\xd1\x0a\xda\x92\x32\x98\xec\x2e\x61\x8b\x83\xb2\xe6\x2c\xe4\
+\xab\x82\x2d\x3b\xfe\xf8\x45\xf9\x94\xb1\x3e\xab\x42\xc9\xcc\x8c\
+\x6b\x7e\x36\x38\x2b\xcb\x68\xad\x77\x01\x6a\xfd\x78\x57\xa7\xc7\
+\xc5\xd7\xee\x9c\x26\x47\xb0\x2c\x07\xda\x4c\x3f\x96\xac\x18\x28\
+\x66\xcd\x76\x3c\x7a\x76\x86\xdc\xc8\xaa\x59\xe6\xd1\x3c\x6f\xcc\
+\xfb\x46\x12\x8b\x8b\x13\xf8\x95\x02\x43\xf3\x1c\x60\x64\x7d\xfc\
+\x78\x59\x2d\xe9\x15\xd5\x62\x04\xd4\x3b\x69\x81\x64\x72\x17\xd6\
+\xb9\x38\x5e\xb2\x33\x32\xde\x1a\x2f\xb5\x26\xbf\xc9\x99\x18\x73\
+\x24\xb6\x98\xea\x3c\x99\xc5\xc0\x63\xba\x3a\x6a\x07\x5d\xdd\xa0\
+\x52\xe6\x4a\x1b\x68\xd4\x5c\x3d\x60\xe7\xf9\x9c\xf7\x6e\x56\xf6\
+\x43\xdc\x88\x7f\x89\x53\xbb\xe0\xb7\x7b\xe8\x4d\x91\xea\xa4\xd7\
+\x41\x51\x9b\xb5\xbe\xa7\xd4\x55\xe2\xd9\x69\xf5\x6e\x5e\xcb\xef\
+\x52\x53\xe5\xd1\x07\xa7\x7f\xfc\xcf\x8e\xa2\xb8\xaf\xd1\xa2\x69\
+\x7c\x8c\x57\xc9\x97\xc2\xbc\x81\xbc\xa8\xb2\xd5\xad\xc9\xb3\x2a\
+\x6f\xe6\x47\xf5\x9e\x70\x4b\x06\x5f\x33\x1d\xa3\xc9\x27\xe1\x06\
+\x3b\x76\x70\x63\x86\xa8\xec\xb5\x44\x64\x8f\xfb\x26\x25\x93\x36\
+\x34\x1a\x05\xf3\x59\x2d\x53\x72\xc8\x46\x58\xb1\x9b\xab\xef\xea\
+\x2b\x67\x1e\x2c\x9f\x0b\xfb\xe0\xfc\x9d\x23\x11\x5c\x15\x0e\x56\
+\x0d\xa4\xcc\xc5\xe0\xc4\xa1\xd5\xac\x18\x2c\xf5\xdc\x0e\xc4\xc3\
+\xec\x5a\x20\x0d\xb3\x6d\x75\xe4\x20\xb1\x3f\x95\x27\x71\xed\x8c\
+\xbf\x5e\xb8\x86\xfa\xe0\xc8\x8a\x3e\xe5\xce\xa8\x16\x44\xb4\x5f\
+\xe1\x7f\xbe\x26\x4a\xff\x0e\x62\x55\x5a\x9a\x2a\x24\x99\x04\x2c\
+\x77\xda\x34\xd4\xeb\x5d\xa8\x31\x8e\xf4\xa2\xf9\xd8\x5e\xd7\xc2\
+\x22\x7d\x65\xd9\x88\xf7\x71\x70\x9c\x82\xd6\x65\x28\x77\x46\xbd\
+\x16\xc5\x8b\x82\xf6\xf2\x3d\x21\xf6\x9b\xca\x2b\x69\x6f\x6b\x66\
+\x26\x1a\x3c\x06\xaa\x63\xf3\x9c\x21\xd6\xcd\xd2\xc7\x31\x63\xff\
+\x63\x8e\x1b\x3d\x66\xda\xd6\x7b\x6c\x93\xf0\xd5\x81\x78\x2e\x46\
+\xac\x92\x11\xad\xf3\x32\xb2\x25\x7e\x8b\x2e\xd0\xc3\x19\x45\x26\
+\x75\xa2\x2b\x2b\xc9\x82\x22\xcb\xb6\xe0\x91\x30\x7e\xf4\x3e\xab\
+\xcf\x95\x68\x34\x4a\x2e\x2e\x7a\x1c\xd4\x08\x94\x65\x39\x1b\x1e\
+\x05\x34\x47\x20\xd7\x95\xf7\xd9\xc3\x48\x4c\x66\xec\x63\x2d\x2f\
+\x1b\x89\xe4\x28\x6a\xe5\xe5\x68\x2c\xe8\xe5\x6d\x1b\x84\x28\x9f\
+\xe3\x80\xd4\xa9\x57\xf9\xb1\xbd\x5f\xa3\x42\x7c\xe8\x8f\x53\x6c\
+\xfa\xe0\xf9\xdb\x68\x84\xa2\xd8\xd5\x0b\x80\xa2\x46\xe4\x7d\xed\
+\xe7\xca\x61\x91\x75\xfe\xe3\x38\xce\xfc\x52\x91\xf7\xac\x3c\xc1\
+\x8f\xfb\x5d\xd0\xaf\xdf\x7b\x91\x41\xd7\xee\x39\x36\xda\x5e\x6f\
+\xc6\xca\xb7\x72\x5b\x69\x3c\x0e\xa1\x53\xac\x55\x05\x38\x76\x0a\
+\xa4\x48\x0d\xcf\x0a\x97\xe7\x54\x3e\xd7\xce\x3b\xa8\x69\x6c\x77\
+\xc5\x02\x49\x35\x27\x9f\x15\x5d\x5b\xcd\xb6\xdb\x58\x7f\x47\x63\
+\x70\x7b\x55\x6c\xf4\x4e\xba\x52\x6c\x48\xe3\xdb\x54\x5e\xcb\x59\
+\x9b\xd1\x85\xcd\xef\x61\xad\x74\xe2\xac\x92\x01\x09\x7b\x15\xc2\
+\xaf\xf4\x3e\xff\xe4\xfa\xf2\xaf\xd9\x7c\xcf\x8f\x3b\x4f\x67\xcd\
+\xad\xd9\xab\x41\x19\x5a\x99\xd5\x9f\x04\x49\xf0\x6a\x4f\xb2\x21\
+\xa7\x8e\xdf\x17\x05\xba\x2b\x66\xe0\x37\xf7\x18\x2f\x0a\xab\x12\
+\xb4\x22\x88\x5e\x47\x99\xf3\xa4\xfb\xcc\xf4\x1a\xbc\x1a\x02\xd6\
+\xa2\xae\x4e\x33\x6b\xf4\xa9\xb1\xd3\xb3\x0e\x7c\x5f\xcd\x1c\xaa\
+\x6e\xb9\x06\x13\x9a\x1c\xd3\x6a\xb5\x5f\x86\xfd\xb2\xab\x7c\x01\
+\xff\x6a\x20\x25\x77\x8d\xc1\xcd\xe2\xf9\xe0\x73\xf3\x86\xa2\xef\
+\x62\xf1\x47\x9c\x81\x96\xae\xf8\xd8\x33\xa2\xb7\xf4\x9c\x6f\xdc\
+\x2c\xbe\xe1\x75\x27\x6e\x02\x41\x5f\x45\xe7\x48\xdc\xa9\x56\x3f\
+\x57\xd3\xa7\xa6\xdf\x1a\xd6\x2d\x88\xaf\x79\x8e\x5b\xeb\xd4\x7a\
+\x26\xce\x44\x27\x9e\x52\x06\x75\x8b\x9b\x13\x33\x73\xd0\xae\x3f\
+\x28\xfc\x4f\xe5\x20\x89\x19\x2d\x35\xff\xa3\xe6\x99\xe0\xf5\xad\
+\x8b\x88\x3c\xa3\xe4\x8f\xb8\xf0\x3c\x9d\xfb\x48\x61\xc0\x1d\x1e\
+\xbb\x2e\x80\x28\x1a\xbd\xd1\xeb\x2e\x80\xcf\x03\xad\x16\xfa\xa9\
+\x19\x79\xbb\xcd\x5a\x6e\xb4\x95\x6a\x34\x74\x37\xe6\x41\x05\xb5\
+\x86\xee\x5c\x85\x9b\x69\x44\xf9\xe8\x55\x59\x88\x7e\x44\xbf\xbe\
+\x66\xf5\x17\x07\x6b\x99\xcb\xb2\x6d\x74\x07\xd2\x0e\xe7\x1a\x33\
+\x25\x4a\x68\x33\x3c\x65\x9f\xa9\x60\x8b\xe3\x6d\xb0\x91\x58\xad\
+\xb9\x70\xee\xda\x98\x9c\xb2\x56\xcb\x4e\xf6\xba\xd3\x3a\xf2\xcf\
+\xeb\xe3\x91\x75\xf5\xd6\x4a\x12\x3f\xaf\xaf\x9f\x93\xd0\xb5\x03\
+\x8e\x0c\x57\x5d\xdb\x08\x6b\x47\x76\x6c\x72\x0b\x96\x6e\xc2\x0a\
+\x52\xe5\x1b\x22\x85\x8d\x9c\xeb\x3a\xc5\xf2\x01\x0e\x3f\xbc\x51\
+\x6a\x43\xd6\x28\xc9\x32\x55\x7f\x2b\x23\x7c\xa7\x24\xca\xed\x55\
+\x4a\x92\x5a\xda\x42\x8d\xf7\x8f\xbb\x1e\xe4\xfc\x6b\x8c\xfe\xff\
+\xac\xcd\x70\xde\x6c\xde\xe1\xf0\x5b\xed\xb1\x40\x95\x18\xc0\x66\
+\x41\xe3\xff\x97\x0c\x4d\xce\xa9\x1e\x03\xf1\x94\xff\x7d\x70\xd1\
+\x58\xc1\x79\x6a\x57\x07\x07\xb2\x1a\xc0\x9d\xae\xb5\x6d\xe2\x7f\
+\xd5\x69\xc4\x5f\x5e\xd1\xbf\x32\x56\x5a\x99\x1b\xb1\xec\x90\xe5\
+\x61\xc9\x75\x04\x6d\x39\x76\xc7\xd5\x1e\x47\xf5\xfe\x1b\x35\x7a\
+\x52\x21\x78\x74\x41\xf4\xaf\x19\xe1\xae\x2c\x35\x86\x45\x79\x7d\
+\x2a\x8f\x58\xe7\x9d\x3f\x89\xe2\x67\xc8\x22\x02\x39\x6f\xbb\x0a\
+\x57\x47\xdf\x34\x46\x38\x4b\x68\x08\x25\xdb\x2a\x21\x24\x1f\xff\
+\x56\x62\xa1\x23\x2c\x0e\xb2\x1d\x57\xe9\x37\x4e\x62\x6e\x31\x1a\
+\x11\xbd\xb7\xad\x64\xf2\x13\x22\xac\x61\x3d\x31\xe8\x45\xf3\xba\
+\x6e\x55\xe9\x0f\xcf\xf3\xec\x71\x7e\x28\x0a\xca\x2d\x0f\xd4\x84\
+\x86\x11\x9d\x74\x2d\xf6\x3f\x30\x6f\xbb\x72\xad\x64\xbb\xd9\xe2\
+\x75\x94\x13\x10\x9b\x9b\xa2\xc0\x6a\x2b\x22\x78\xee\xe6\xd6\xca\
+\x47\x63\x3b\x3b\x8a\xd0\x31\x9d\xb2\x13\x25\xd3\xbe\xb2\xc9\xe2\
+\x49\x0c\x61\x83\xdc\xac\x24\x5b\x1e\x58\xaf\xf3\xe5\xac\x8b\xa0\
+\xde\x98\x10\x2f\xd5\xf6\x53\xe4\x68\xfe\xc3\xc4\x51\x01\x08\x63\
+\x20\x0d\x36\xf6\x1a\xb4\xd1\xc6\xf3\x2d\x6b\xb0\x2d\xc4\x71\x9a\
+\x5a\x73\xda\x9a\x3b\xf2\xbf\x59\x92\x67\x30\xb0\x65\x88\xbc\xb3\
+\x64\x8d\xa9\x94\x68\xb6\x3c\x63\x3c\xf2\xdc\xfe\xa2\x98\x4a\xcf\
+\xea\xeb\xb4\xad\xb6\xc5\x82\xbd\xd0\x52\x3c\x32\xf1\xcd\x7d\xf3\
+\xb2\x98\x65\xc4\xeb\xa8\xd5\x18\xf3\x5c\x5a\x35\xe6\xb1\xb3\x88\
+\xdc\x63\x11\xb8\x9a\xb9\xa5\xf8\x98\x47\xdc\xac\x9e\x53\x06\x39\
+\xc7\xa2\xc7\x20\x2e\x66\xb6\xea\x53\xe2\xde\x92\x11\xf8\xde\x8f\
+\x01\x10\x37\xd6\xbe\x6a\x8a\x98\x77\xf8\x78\x66\x38\x15\x57\xc9\
+\x24\xb6\x99\x23\xd9\x55\x29\xf6\xa9\x14\xf3\xb8\xf6\xca\x3e\xd2\
+\x25\x65\x46\x95\x99\xa3\xc8\x9c\x5c\x5c\x6c\x63\xff\xb9\x63\x8c\
+\xa7\x2e\xf5\xf2\x91\xee\xe6\xf4\xf5\xc3\xc4\x30\xa4\x4c\xb4\x5e\
+\x52\x2f\x5b\x11\x5d\xf8\xe6\x04\xaa\xc5\x30\x71\x71\x8c\x37\x96\
+\x51\x7b\x01\x38\x75\x1a\x2e\x2c\x2a\xa2\x89\x8c\xf3\x8f\xb5\xce\
+\x22\x21\x73\xe5\xd1\xd8\x05\xf9\xaa\x72\xe6\x1a\x4d\xb0\x99\x77\
+\x50\x29\x61\xf0\x8e\xdd\xf9\xc4\x2a\x58\x0b\x08\x7a\xb1\x5f\x9d\
+\xf9\xe1\x1a\x63\x15\x81\xbf\xf0\x9a\x22\x32\xfb\xa3\xaa\x45\xa8\
+\x18\xa3\x28\x0b\x65\xad\x17\x0c\xf2\xbd\x06\xe7\x11\xa3\xe0\xd5\
+\x89\x79\xe2\x1b\x5c\x3a\xc5\xbd\x31\xd3\xd4\x75\xa1\x7a\x2e\x0b\
+\x2f\xa4\x77\x2b\xc7\x18\xda\x46\xc9\x35\x81\x62\x6b\xae\x7c\x5a\
+\x38\xe6\x1d\xd3\xd2\x37\x45\x6a\x57\xd7\x07\xf2\xb9\xe9\x1f\x6d\
+\x4c\x21\x7a\xac\x12\x53\x24\x22\x31\x94\x5f\x17\xef\x43\x78\x8a\
+\x4d\xed\x05\x3e\x20\x30\xfd\x6a\x8e\x09\x18\x5f\xe1\xf4\x3a\x8e\
+\x09\x12\xe7\x10\x13\x48\x6b\xa0\x12\x2f\x1e\x99\xab\x1e\x13\xb8\
+\xb0\x28\xad\xaf\x6b\x0b\xce\x33\x26\xf0\xb5\xab\x71\x75\xe4\xfa\
+\x7c\x62\x82\xa0\xac\x95\xa5\x00\xb9\x33\xea\xcf\x55\x8a\x09\xd6\
+\x55\x8c\x09\x94\x2e\x36\x4c\xed\xb4\x1f\x1b\x0f\xac\xab\x10\x0f\
+\x60\x0d\xcf\xdb\x73\x6a\x2a\x2a\xcd\x03\x56\xc8\x41\x9a\x40\x5f\
+\xb1\xab\xa5\x1b\xec\x4d\xf9\xf9\x89\x0a\x7e\xbe\x2b\x99\x58\xaf\
+\xc5\xfb\xf9\x16\x76\x65\xc5\x0f\x6e\x2c\xe5\xfa\x79\xae\xe4\x45\
+\xfc\x3c\xfc\xae\x74\xcb\xc3\x53\x32\x85\xf1\x72\xeb\x75\xf1\x9f\
+\xaf\x6a\xd6\x9e\x87\x31\x45\xab\xae\xcb\x27\x52\x9e\xac\xf3\x48\
+\x09\xab\x62\x4d\x06\x43\x9d\x15\x93\xca\x9a\xa5\xea\x7e\x66\x22\
+\x32\x4b\x5a\xc1\xef\x14\x22\x6f\x54\xb9\x0d\x87\x79\xc4\xc0\x5a\
+\x03\xca\x7e\x77\x82\x3b\xca\x86\xaf\x54\xfd\x9d\x56\x7d\x0a\x53\
+\x45\xea\x48\xaa\x8b\xf3\xb5\x2a\x5c\xf8\x11\xcd\xe9\x47\xe5\xa3\
+\xc3\xf2\x69\x7d\xf9\x3b\x2d\x1f\xb6\x5c\x68\x5a\x1a\x3c\xf0\xe6\
+\xda\x8b\xf3\xaf\xf7\x73\x56\xb6\xf4\x3b\xd1\x81\xa6\x57\xec\xfb\
+\xb9\xec\x77\x3d\xe1\x77\x8c\xb1\xe1\x77\x2a\x9a\x44\xac\x87\xdb\
+\x5c\xe3\x6f\x35\x52\x37\x62\xb5\x5e\x4b\xd9\x94\x7c\x7f\x10\xd8\
+\xb0\xb7\xe8\x5e\x96\x63\xd8\x39\x23\xa9\x4a\x3b\xd5\x2c\x7e\x11\
+\x92\x7e\x5f\x99\xa2\x7d\xec\xfc\xbc\xad\x2f\x6a\x99\x9f\x97\xa4\
+\x17\xea\x5c\x98\x12\x35\x61\xea\xf4\xf7\x5a\xcc\xcd\x2b\x2f\x56\
+\xfd\xca\xf6\xf5\xdc\xa3\x95\xcf\x8d\x93\xc9\x0a\xb2\x68\x54\x9e\
+\x25\x87\x96\x0c\xbe\x51\xe7\xe8\x71\x6d\xdb\xae\xda\x23\x46\x77\
+\x75\x1a\x6f\x14\x62\xc1\xe2\x8b\x25\x11\x24\x01\xd2\x8b\xaf\xd9\
+\x9c\xbd\xe5\x0e\xab\x88\x32\xf6\xed\xa4\xda\x41\xb5\xfd\xef\x1a\
+\xe7\xec\xb1\x67\xa5\x5a\x15\xed\xb0\xd5\x59\xc4\xfa\x21\xea\x6d\
+\x81\xea\x09\x5d\xb1\x3c\x8f\xb8\xa6\x0e\xec\x6b\x02\x7a\xee\x0c\
+\xfd\x87\xaf\xa9\xd6\x0e\xa1\x6d\xc4\xad\xe3\x62\xea\x4b\x65\x5a\
+\x4a\xf2\x7e\x8d\xf7\xa8\x81\x95\xf7\xb0\xd5\x7e\x82\x2a\xf7\x10\
+\xeb\x1e\xbe\x3e\x50\xa9\xee\x1c\xd6\xe0\xc1\x7f\xc8\xbe\x8b\xed\
+\xb5\x68\x53\xb5\x85\xe5\x41\xbe\x2b\x2b\x88\x7d\xd6\xb6\xc3\x96\
+\x42\xbb\x49\x12\x69\xd2\xf3\x1e\xaf\x7d\x5a\x8f\x2c\x47\x34\x33\
+\x1b\x5a\xb1\x58\xad\x1c\x89\x6d\xf8\x79\xac\xc7\x5b\xf2\xb5\x6f\
+\x8b\xab\x1c\x57\x02\xfc\x19\x97\x65\x6e\x1f\x2d\x56\x9b\x4a\xc0\
+\xac\x82\x79\x2b\xa7\x49\x18\x9f\x5a\x2b\x12\xad\x73\xbe\x85\x77\
+\x2a\x42\x66\xfc\x02\x5f\x34\xbe\xf5\xa0\x72\xdf\xd7\xc2\x20\xdc\
+\x04\x93\x90\xb3\xf9\x0d\x47\xf8\xca\xc7\xb0\xfd\xa7\xe8\x1f\x7e\
+\x43\x10\xbb\xde\x7d\xd7\xaf\xba\x57\xad\xb2\x22\xe0\x14\xf0\xa9\
+\x57\x03\x76\x46\x36\x54\x99\xcd\x71\x79\xd5\x70\x1b\x3b\x44\x1a\
+\xc7\xd6\xdb\x6a\xb3\x9e\x25\x97\x41\x94\x16\x1e\x35\x2e\x25\xfb\
+\x89\x54\xbf\xb5\x50\x78\x8a\x24\xb4\xe9\x53\x6c\xde\x85\xcf\x25\
+\x7f\x31\x4d\x20\xdf\xe5\x10\x9b\x13\x70\xe7\xf0\x6a\xee\x22\xa6\
+\x96\xd9\xff\x17\x37\x76\x66\x2c\x7c\x5b\x95\x27\x5c\xf1\x7c\xea\
+\x2e\xfc\x4c\xa8\x9f\x9e\x51\x9a\x1a\xb8\xdc\x67\x26\x09\x72\x03\
+\x84\x43\x83\x93\x11\xc6\x0e\x56\x7d\xd2\x87\xb3\x81\xca\xd1\xc8\
+\x98\x69\x9f\x3d\x1e\x6e\x34\x68\xfb\x26\xa6\x42\x00\x45\xd2\x6e\
+\x2f\x7c\xe2\x8b\x0b\x9b\x2e\x95\xb4\xe7\x29\x84\x2a\x23\x25\x55\
+\x3d\x20\x8d\xa2\x89\xa3\x1a\xf8\x7c\xc5\x3e\xb5\x42\x99\xf2\x29\
+\xa3\xda\x42\x49\xd1\x3a\xf9\x76\x10\x9c\xd1\x93\x81\x13\x86\x8c\
+\x1f\xbc\x8a\x38\x97\x81\x93\x30\x80\x49\x4f\x51\x95\x66\xe9\x2a\
+\x05\x61\x0b\x40\xc5\x38\xd1\x28\x16\xd9\x6c\x9c\x58\x97\xd8\xab\
+\x78\x07\xe7\xa6\xe4\x9c\x9b\xe4\x11\x15\x6b\x60\x9e\x70\xeb\x52\
+\x70\x45\xb2\xd3\x01\x8e\x96\xc5\x86\x7c\x0c\x5f\xfd\x7a\xd4\x46\
+\xe0\x7e\x24\xb1\x50\xa3\x4e\x19\xa2\x99\x7f\xd4\x36\xcd\xc6\xc7\
+\x2f\xdf\x02\x3f\xe1\x5d\x05\x0e\x16\xa6\xe1\x84\xcb\x51\xb8\x5e\
+\xcd\xe0\xd3\x68\x72\x51\x2e\xaf\x62\xfa\x89\x18\xc7\x6d\x30\xe1\
+\xa5\xa4\x95\x4f\xd8\x6c\x57\x8a\x45\xab\x2f\x7c\x33\xb3\x66\xbe\
+\x50\x53\xc8\x7e\xf3\xab\x10\x60\xcb\x4f\xc4\x4f\x4d\xa8\x4d\x3e\
+\x0d\xfc\x7a\xae\xc9\x74\x6e\x75\x3c\x6f\xcc\xf5\x50\x00\xe5\x25\
+\x1a\x4d\x6e\x1c\xf3\x87\xd0\xaf\x62\xa2\x04\x4d\x23\x97\xf1\x74\
+\xaf\x68\x8e\xe9\x4d\x02\x32\x47\x10\xb3\x6e\x60\x54\x1f\x60\x7d\
+\x6e\xe9\x4c\x37\xaf\xac\x34\x26\xdb\x74\xde\x00\x1b\x40\xed\xba\
+\x98\xf7\x56\x38\xbe\x5a\x07\x69\xb1\xe2\x87\x0e\xcd\x29\xb1\xf6\
+\x5a\x75\x84\x51\x45\x75\xdf\xd2\x2f\x58\xed\x9f\x87\xb3\x79\xbf\
+\xda\xfb\xd2\x4b\xca\x1b\x8c\xfb\x8e\xbc\x27\xdd\xf3\xe2\xf4\x2a\
+\xeb\x1a\x2b\x5d\x1a\xcd\x2e\x76\x68\xdd\x63\xec\xbc\x3b\x7d\x61\
+\x22\xea\xaa\xb6\x3e\x20\x20\x9f\x51\x6b\x60\x59\xaa\x75\x2a\x62\
+\xaa\xd1\x7b\x22\x28\x43\xee\x1b\x17\xd6\x7d\xac\x2f\x15\xd3\x77\
+\x34\x9f\xee\xf7\xaa\x4c\xdf\xe7\xd8\xb3\xf5\x8c\x81\x2f\xd3\xea\
+\xb7\x23\x46\x72\xad\x88\x48\x78\xe1\x56\x9b\xee\x5a\x57\xae\x6e\
+\x77\xa7\xbe\x83\x08\x87\xd8\xed\xf9\xd6\x81\x73\xf5\x8c\x7d\xbf\
+\x8e\x5d\x71\x9c\x10\xc1\xdb\x5d\x7f\x2b\xea\x43\xe2\x26\xac\x2a\
+\x6c\x45\xcb\x00\xf1\xf1\x1d\xb5\x58\x4d\x7f\x6f\xcb\x76\xe0\xeb\
+\x6c\x2f\xce\x1a\xf3\x52\x67\x85\xcd\xfb\x63\x55\x67\xd2\xdd\x7c\
+\xb2\xe9\x4a\x83\x9d\x75\xb2\x65\xb4\x45\xf3\x4d\x5c\xbd\x12\x35\
+\x99\x8a\x7b\xdc\xe4\x14\x07\xc0\xc9\x83\xc5\x7a\xe0\xbe\xf9\x87\
+\x16\x87\x9e\x98\x8e\x2d\x0e\x54\x78\xcf\xa2\x9d\xf7\x55\x34\x15\
+\xe8\x14\x59\xa1\xdf\xd6\x63\x6e\x5c\xe0\xfa\x67\xf8\xb5\x26\xbc\
+\xfb\x32\xfa\x09\xef\xc5\xbc\x4b\x30\xbe\x37\xfc\x3e\x00\x81\x93\
+\x29\x33\x93\x6f\x03\x70\x65\xd9\x95\xe7\xc8\xba\x4a\xd5\xb9\x1a\
+\xd9\x45\x7b\x73\x1e\x22\x35\xd4\x8f\xe3\xb9\x73\x93\xa2\xca\xd2\
+\x51\xd5\x16\xd8\x30\x34\xfa\x61\xc0\x9c\xe6\xda\xe8\x78\x18\x14\
+\x79\x13\x60\xa2\x3c\xb5\x59\xab\x56\x98\xfc\xbf\x5c\x2f\x99\xd5\
+\x60\x2d\xe7\x16\xc9\xae\x07\x8a\xac\xf6\x13\x94\x44\x8a\x5e\x94\
+\x0c\xb3\xc6\x94\x73\x17\x74\x4a\xcc\xcb\x9d\x68\x9e\x07\xa8\x73\
+\xb0\xc0\xc4\x2d\x02\x76\x61\x47\xd9\xbc\x1f\x07\x59\xc6\xc2\x72\
+\x6d\xb3\xaa\x6b\xaf\xf8\x2c\xa4\xbd\xd6\xb2\xf1\x1b\x03\x30\x2c\
+\x82\x59\x45\x4a\x62\x24\x18\x8e\x96\x66\x8b\x3b\xa5\x60\x38\xcf\
+\x07\x28\xd8\x6c\xbf\x17\xc7\x48\x22\x9e\x30\x85\x35\x56\x67\xd6\
+\x83\x32\xa0\xde\xd2\xe5\xd4\xac\xe2\x4a\x1e\xb7\x75\xb3\x7e\xb9\
+\xaa\xe8\x51\x3d\xe8\x15\xa5\xb9\xdb\xed\xf4\xa1\x38\xf1\x62\xf8\
+\x9a\x88\x92\xe8\x36\x00\x1f\x94\xfb\x04\x16\x91\x05\x72\x3f\x80\
+\x06\x72\x95\xdc\x4f\xc0\x55\xe4\x9d\x72\xbf\x8e\x5e\xf3\xb7\x72\
+\xbf\x1e\x2e\x24\xaf\xc8\xfd\x79\xb0\x30\x58\x2b\xf7\x2f\x6c\xdc\
+\xb1\xf6\xd7\xe4\xfe\x22\xb8\x7c\xe7\x7c\xda\x02\xa9\x9b\x4f\x8f\
+\x3e\xc0\x5b\x63\xfb\x04\xae\x80\x7f\x93\xfb\x01\x6d\xf3\x72\xb9\
+\x9f\x80\x11\xd2\x2e\xf7\xeb\xe0\x0a\xf2\xfb\x72\xbf\x1e\x2e\x27\
+\xcf\xc9\xfd\x79\x70\x59\x90\x94\xfb\x17\x36\x1d\x0f\xb6\xca\xfd\
+\x45\xb0\x7d\xc7\x97\x60\x23\x8c\x41\x33\x84\xd0\x0e\x5b\x60\x2b\
+\xfd\x17\x42\x37\xe4\x60\x1c\x4e\xd3\xbd\x26\xb9\x9f\x86\xc3\x90\
+\x82\x2c\x6c\x83\xdd\xf4\x5c\x08\xfb\xe9\xd9\x0c\x14\xe8\x9d\xd3\
+\xf4\x7c\x06\xf2\xd0\x46\xcf\x0e\xd1\xeb\xa6\xe9\x5f\x8a\xfe\x92\
+\xa6\x77\x85\x30\x47\xef\x61\x77\xe7\xe9\x7e\x11\xa6\xe8\x5e\x08\
+\xc3\xd0\x07\xfd\xf4\x7b\x10\x66\xe9\x71\x96\xee\xf5\xd2\xd6\xb2\
+\xf4\xf7\x90\x9e\xcf\xd0\x36\xd9\x59\xd6\x42\x1b\xc0\xc6\xb1\xe6\
+\xb0\x7d\xcb\xd6\xad\x61\x77\x6e\xfc\x74\xd8\x44\x3f\xd3\x87\x53\
+\xd9\x6d\xbb\x9b\xc2\xfd\xb9\x4c\x61\x6c\x3a\x95\xc9\xb7\x85\x43\
+\xe9\xe9\x74\xaa\x90\x1e\x0f\xe7\xb2\xe3\xe9\x7c\x58\x9c\x4a\x87\
+\xc3\x7d\xfd\xe1\xe0\x6c\x3a\x1b\xf6\xe6\xb2\xc5\xb0\x3f\x33\x96\
+\xce\x16\xd2\xb4\xbd\x23\x14\x94\x34\x6d\xbc\xc0\x01\x29\x52\x50\
+\xf3\xbc\xe3\x76\xfa\x0b\x1c\xc9\xa7\x0b\x85\x70\xb8\x98\xca\x17\
+\xc3\x76\x7a\xcc\xf0\x99\xa4\x38\x4c\xf3\xcb\x60\x28\x3d\x39\x37\
+\x9d\xa2\x3b\x0a\x5e\xf6\x9d\xa7\x57\xa4\x79\x03\x6d\x94\x7e\x21\
+\xec\xa5\x7f\x95\x3a\x11\x57\x6c\xa5\xfb\x9b\x60\x27\xfd\x53\x54\
+\x07\x06\x68\x6f\x2e\x3f\x99\x0e\xdb\xdb\xb6\x84\x7b\x43\x1b\x18\
+\x7a\x62\x6b\xfb\xa6\x9d\x9b\x18\x2d\xce\x11\x8b\x1b\x39\xfd\x0b\
+\x94\xb2\x39\x4e\x6d\x06\xe9\x56\xd8\x4e\xf7\xe0\xc6\x74\xbe\x90\
+\xc9\x65\x69\x8f\x5b\xb7\x87\xb8\x59\xd3\xa8\x69\x92\xb7\xc8\x1a\
+\x64\x2c\x31\x4b\xd9\x23\x4f\x9b\x9c\xa4\x83\xca\x7a\x76\x99\xa8\
+\xf5\x3c\xd9\x48\xb4\x24\xee\xeb\x84\xbb\x39\xc8\x69\x7e\x7d\x1b\
+\xdf\x2b\xd2\x5e\x5a\x21\x09\xa7\xe8\xd5\x8c\xa1\x04\xd3\x15\x38\
+\x8a\x27\x25\xd3\x19\x76\x1a\xa0\xad\xce\xf0\xe1\xf1\x53\xac\x8d\
+\xb6\x94\x84\x11\xda\x4e\x86\xff\x62\xee\x1c\xa6\x7b\x13\x74\xef\
+\x14\xbf\x92\xb5\x20\xae\x98\xb6\x18\xf4\x87\x67\x71\x46\x27\x77\
+\x80\xb6\xf2\x01\x6a\xb3\x20\xb3\xfb\x55\xd0\x8c\xf1\x91\xc8\x48\
+\x48\x46\xb9\xf8\xe5\x28\xcc\xac\xd5\x14\x87\x4b\x5d\x99\xa2\xbf\
+\x14\xe8\x6f\x6c\xef\x24\xa7\x35\xa3\xf8\x28\x17\xd7\x10\x51\x33\
+\xc5\x61\xed\x82\x1b\xf8\x7e\x91\x32\x6b\x92\x8f\x70\x91\xf6\xb3\
+\x97\x9a\x9c\xcd\x7c\xb4\xd8\xc8\xcf\xd2\x73\x05\x0a\x65\x81\xb7\
+\xd5\x26\x45\x61\x33\xc5\xb9\x97\xe2\x98\xe4\xff\x36\xbd\x2e\xff\
+\x92\x88\xfe\x47\xa0\x87\x72\x01\xc3\x69\x90\x7e\x8f\x70\xfa\xf7\
+\x51\x6e\x64\x67\x87\xe9\x67\x1c\xf5\x43\xda\x0e\xe3\xe6\x9d\xfc\
+\xde\x34\xa5\x54\x9e\x8e\x34\xe3\x85\xd3\x92\xcb\xb7\x50\xf3\xfb\
+\xfa\x61\x98\xa4\x98\x0d\x51\xf8\xbb\xa8\x44\xed\xa7\x38\xf5\x48\
+\x6e\x61\xa3\xc9\xa6\x5b\xc4\x78\x87\x9c\x8b\x0d\x5f\x56\xe7\x47\
+\x26\x7f\x62\x04\x9b\x39\x07\x08\xde\x2f\x72\xce\x29\xd0\xef\x0c\
+\x95\x27\xa1\x10\x8b\x92\x73\xd8\xb8\x4f\x53\x4e\x63\x3c\xc4\xe4\
+\x20\xc9\x3f\x4f\x4a\x5e\x9c\xe5\xf2\x27\x7a\x12\xb0\x30\x9e\x9d\
+\x96\xdc\xc7\xee\x4d\xf1\x56\x4f\xf2\xd6\x26\x34\x54\xb3\xf4\x97\
+\x1c\x1c\xa7\x67\xc7\x38\x9f\xb5\x22\x28\xe6\xe8\xaf\xb3\xfc\xde\
+\x22\xc2\xcd\xdc\x3b\xc6\xa1\x16\xed\xb2\x73\x49\x7a\x34\xc1\x7f\
+\xcf\xf3\xb6\x14\x24\x29\x7a\x65\x8a\x43\x3b\xc3\x69\x60\x64\x86\
+\x49\x5b\x96\xab\xfe\x8c\xc4\x7a\x4c\x42\x3e\xc3\xf1\xcf\x72\x79\
+\xc9\x70\x8d\x82\x65\x4d\x40\x28\x60\x3f\x29\xe9\x21\x64\x6a\x82\
+\xc3\x94\xd6\xd7\x26\x39\x6d\xc4\x58\x4c\x70\x2a\x30\x3a\x09\x6a\
+\x9e\xe0\x52\x9b\xe5\xd4\x9d\xe2\x7d\x4f\x21\xfc\x18\xfc\x33\xf4\
+\xfa\xd3\x52\xe2\x19\x45\xa6\xe4\x48\x8d\x5b\x72\x3f\xa3\x21\x49\
+\xcb\x33\x59\x0e\x9d\xd0\x7d\x59\xc9\xf7\x53\x5c\x96\xb1\x46\xcd\
+\x49\x9a\xe6\xb9\x7c\x27\x11\x67\x09\xce\x10\xda\x44\x68\x9a\x02\
+\x1a\x81\xa8\x6e\xc4\x30\x0b\xda\x08\x88\xe7\xe4\x15\xad\x92\xab\
+\xe6\xe8\x7e\x46\x9f\x99\xe1\xfa\x3f\x43\xef\xce\x58\x38\x25\x25\
+\x8e\x62\x4c\x98\x0e\x1a\xa5\x77\x16\x75\x5f\x82\xc2\xd3\x9c\x32\
+\x29\xa9\x35\x73\x7c\x1c\xd5\xb1\x80\xf4\x34\xe2\xec\x2c\xc7\x36\
+\xe4\xba\x71\x5a\x6a\xd1\xd3\xfa\xca\x19\x0e\xe7\x34\xa7\x60\x81\
+\xbb\x38\x82\x12\x49\x84\x59\xab\xa4\x2c\xb3\x61\x02\x0f\xd5\x63\
+\x96\xb7\x24\x6c\x43\x86\x6b\x5d\xc3\xe9\x6a\xa4\xc5\xfd\x63\xfc\
+\x6a\x45\x9d\x51\x69\x53\xa6\x35\x45\x18\x24\xa3\xfc\x68\x5c\x9f\
+\xab\x4c\x0d\x41\xb1\xcd\xbc\x17\x8c\x1d\xd6\xf4\x02\xbe\x42\xc4\
+\xd2\xd9\xfc\x3b\x2e\xa9\x91\xe2\x74\x52\x77\xe5\x1d\xab\x9b\xa4\
+\xe7\x05\x0f\x17\x3c\xd4\x9d\xd3\x1c\x31\x5a\x13\x4d\x0c\xa5\x6d\
+\x1e\x52\xbc\xed\xbb\xbf\xc0\xfd\x82\x29\xce\x95\x42\xff\xe4\x11\
+\x6d\x15\x24\x82\xc2\xf9\x8a\x8e\xaa\xc2\xd1\xc8\x01\xa3\xc0\x69\
+\x2e\xaf\x4a\x77\xd8\xbc\x8e\x39\x83\xb5\x7d\x27\xd7\x1c\x79\x3e\
+\x6e\x4a\xfb\x4d\xc8\xb1\x88\xca\x84\xb8\x2e\x25\xe5\xd3\xf5\x27\
+\xfc\xf6\x7f\x9c\xde\x29\x68\xad\x30\x4b\x71\xad\xc8\xb8\x3f\x29\
+\xdb\x35\x1c\x98\xa3\xf7\xce\x21\x58\x8c\x86\x54\xd8\x17\x34\xdf\
+\xba\xfa\x54\xe8\x4b\xe3\xdd\x08\x2f\xcd\x3f\x02\x42\x5b\x1c\xa0\
+\xd6\xa8\x97\x5a\xd9\x01\xfa\x37\x42\xff\x06\xb9\xad\x4d\x52\x8f\
+\x2f\xde\xbf\x6a\x92\x74\x98\x90\x7a\x47\xd1\x46\x41\x53\xe0\xbe\
+\x9f\xa2\xfe\x04\xf7\x39\x04\xfe\xd1\xb1\xc4\x12\x1c\x7a\xbc\xd5\
+\x24\x1c\x92\xf2\xc0\xfa\xda\x48\xef\x6b\xae\x99\xee\x8a\x03\xc7\
+\x64\x9f\x79\xa9\x6f\x66\xf8\xfe\x09\x2d\x7d\x05\x69\xa9\x98\xee\
+\x56\xdc\x91\x41\xba\x3b\x69\xe9\x8c\xb4\x94\xc3\x39\xda\xc6\x98\
+\xa4\xbe\xc2\xb0\x55\x6a\x84\x8c\x94\x60\xdb\xff\xc2\x32\x61\x8f\
+\xb2\xb1\x7f\x62\x54\x9a\x6a\xf2\x94\xe3\xc6\x41\xf1\x12\x96\xf2\
+\x02\x97\x88\x31\x47\x53\x63\xcc\xd9\xf1\x04\xe7\x32\xc3\x3f\x49\
+\xe9\xb5\xda\xf1\x43\x41\x42\x6c\x24\x46\x8c\x8b\x82\x7d\x50\x5e\
+\x9d\xe1\x10\x4c\x83\xeb\xb7\x55\xe3\x1f\xe5\x75\x08\x7f\x42\xf9\
+\x7a\x82\x9b\x2a\x79\xfd\xc2\xe6\xcf\xca\x38\xc4\xe8\xa1\x02\xf7\
+\x73\xfc\xba\xb7\x1a\xff\x85\x1e\xfe\x53\x78\x1e\x8e\xd8\xbe\xda\
+\xf0\xac\x6c\x6d\x66\xa4\x9f\xa3\x60\x4b\x71\x4b\x62\x24\x3e\xc7\
+\xb9\x6c\x5c\x4a\x52\x51\xfe\xd2\xca\xbd\x94\xbc\x1c\xcf\x51\xe9\
+\x09\x15\x39\xa6\xea\xde\x4d\xdc\x4f\xb6\x3d\x0b\xa5\x2f\x8c\x0f\
+\x93\x93\x71\x86\xb8\xda\xe8\xd7\x09\x67\x84\xa2\x94\xc6\xd7\x24\
+\xab\x72\x41\xab\xc6\x70\x8c\x5b\xac\xac\xbc\x76\x52\xeb\xdf\x19\
+\x4e\x17\xa3\xd3\xc4\xd5\xca\x9b\x74\x75\x60\x25\xce\x50\x74\x4f\
+\x72\x78\x4f\x41\xc8\xa1\x3e\xc9\xf5\x23\xbb\x4b\xf1\xb1\x1a\xd9\
+\x2e\x4e\xb7\x29\xde\x53\x2d\xa3\x58\xe0\x98\x66\xb5\x1d\x4b\x6b\
+\x6c\xd2\xfa\x9c\xb0\xd4\x93\xd2\x7f\x9c\xd1\xe7\x8b\x9c\xcf\xa7\
+\xb8\x9f\x3a\xc6\x29\xc5\xfc\xbb\x3c\x1f\x3d\x21\x8b\x39\xf9\x69\
+\x2c\xdc\xac\x84\x25\x87\x46\x4d\x8c\x4a\xd6\xc3\xe3\xb6\x74\xc5\
+\xd3\xa9\x4d\xc6\x2a\x3d\x54\xfb\x1c\xa6\xb6\x60\x98\xc7\x66\x83\
+\x3c\x26\x5b\xcf\xa5\x83\xed\x1f\x70\x2c\xc5\x11\x0e\xcb\x0c\x97\
+\x2f\x13\x99\x09\xfd\x29\xe0\x4d\xcb\x91\x13\xb8\x67\x25\x5c\xad\
+\x80\x3d\x6d\x15\x6f\x08\xef\x98\xa5\x69\x5a\x23\x94\xb6\xb1\xce\
+\xd1\x56\x8b\xd2\x12\x0b\x5e\x48\x72\xef\x5d\x69\x2c\x97\x67\xe3\
+\xf1\x36\x3d\xcd\xe9\x38\x5f\x79\xba\xa7\xa5\x5f\x22\xda\x14\x1e\
+\x6f\x1a\x41\x68\xbc\x3d\xdb\x1b\x3e\xcd\x25\x32\xce\xeb\xc3\x71\
+\x88\xf0\x5a\xa7\x21\xde\x97\x16\xf6\x2e\xfa\xab\xc9\x28\x44\xa3\
+\x47\x85\x6d\xd2\x8b\xad\xd0\x11\x2a\x62\x73\x39\x64\x42\xea\xdf\
+\x1c\xf7\x40\x85\x94\x09\xde\x1a\x97\xb1\x54\x8e\xdb\xd8\xbd\x9c\
+\x5f\xb6\x72\x8b\x3c\xc0\xbd\x0d\xec\x83\x55\x97\xca\xac\xe4\x6c\
+\x5b\xc7\x64\xa4\xcc\x67\x64\x7f\xc2\xb7\x9d\x93\x3a\xc4\xa7\x79\
+\x5a\xa5\x85\x0e\x3d\x3a\x47\xf4\x50\x4d\x53\x17\xe4\xe8\xd9\x91\
+\x9a\x1d\x65\x08\xb8\xd8\x58\x4d\x48\x49\x69\xe7\x98\x9f\x7f\x9f\
+\xb5\x73\xa8\x0b\x9b\x1b\x75\xfc\xa8\xe2\x0b\xa3\xb7\xfc\x11\x46\
+\x9a\xc7\xe5\x53\x48\x42\x92\x5a\x0b\x09\xc9\xc4\x31\xa7\xc8\x22\
+\x9c\xd4\x16\xc4\xb5\xb4\xc2\x3b\xce\x48\xaf\xca\xc4\xe9\x7e\xff\
+\xce\xf8\xf1\x05\xd9\xa2\x89\xcb\x5c\x8f\x6d\x9c\xc3\x8a\xf9\x53\
+\xf9\x3e\x45\xd9\xcf\x26\x3e\x76\x82\xab\x84\x4e\xbe\x4b\x46\x02\
+\xd8\xb7\x9b\xe2\x3e\x1b\xbb\x63\x93\xf4\xca\xc7\x51\x66\x6e\x4a\
+\x9e\x51\x76\x82\xd1\x5b\x71\xa6\xa1\xc1\xac\xa4\xe8\x2c\xc7\x5d\
+\xe5\x66\x66\x24\x25\x85\xcd\xf0\xb5\x3e\xc3\xad\xbd\x38\x57\x94\
+\x79\x8a\x0c\xe7\xc7\x71\xde\x9b\x1a\x4d\xd5\x9f\xc2\x40\x40\x31\
+\x2a\xf9\x53\xe4\xc4\xb0\x4f\x1e\x1f\x7d\xe7\x24\x65\xed\x7e\xec\
+\xf8\x57\xf8\xf2\x19\xe9\x59\x9f\xe4\x57\x9e\xf2\xfa\x56\x73\xd2\
+\x9f\x15\xb2\xb3\x4d\x6a\x8d\x5c\x0d\x92\x72\x3e\x72\x32\x27\x61\
+\x57\xf7\xc4\xfb\xd3\x49\xed\x4f\xe3\xe8\x42\x50\xa7\xc0\x31\xbc\
+\x8b\xc7\x6a\x19\xee\x3d\x17\x39\xa5\x85\x75\x2e\x42\x5a\xfa\x52\
+\xf1\x16\xd0\xb6\x79\x2e\x4d\xc6\xf8\xe8\x88\xf8\x7c\x56\x6b\x58\
+\x61\xcb\xaa\xf9\xa2\x76\xa4\x22\xda\x10\xb2\x6f\x7b\xcd\x59\x9d\
+\x65\x99\x95\x78\xa4\x3d\x3e\xb7\xe0\xc6\x19\xc4\x21\x8a\xc6\x2a\
+\x8a\x50\x9e\xf4\xac\xce\x27\x18\xac\xec\xb6\xd4\x48\xab\x18\x73\
+\x3b\xa7\xaa\xca\x11\x64\x1d\x6a\xdb\x63\x5b\x9b\x07\x6e\x47\xb9\
+\xa1\xe5\xaf\xf9\xdb\x8d\xb7\x87\x2a\x27\x27\x6c\xb0\x9d\x7b\x30\
+\xb9\x10\x9c\x2d\x9c\xe1\xd7\xa4\xb5\xa7\x37\xce\xfb\x2d\x48\x3f\
+\x46\x68\x97\x71\x99\xd5\x28\xf2\xf1\x51\xfa\x8c\xe9\xc7\x6a\xdc\
+\xde\x2a\x79\x8e\x69\xba\x59\x64\x9d\x99\x7e\x38\xc1\xe1\x3b\x25\
+\xf5\xfe\xa4\xc5\xe1\x51\xef\x4f\xb4\xe7\xa3\x47\x75\xee\x52\x77\
+\x61\x2d\x1c\x4f\xe9\xbc\x65\x4d\x70\xee\xa1\x9a\xf4\x24\xbd\xd2\
+\x23\xf8\x66\x87\xc5\x37\x95\xfd\xb7\xa8\x77\x24\xa0\xf2\x79\x4e\
+\x2a\x0b\x58\x3d\x0a\x62\x96\x75\x86\x73\x81\xe1\x89\x38\x2b\x2b\
+\xe4\x21\x23\x73\x1c\xa7\xa1\xb6\x2c\x05\xf6\x04\x4d\x4f\x98\x0b\
+\xe3\x63\xd7\x6a\x79\xb0\x38\x7b\x29\xb4\xc5\xb9\xe4\xbd\x92\xf0\
+\x5a\xe7\xbd\xa2\x51\x54\xe5\xbc\x57\xd2\x9b\xf7\xaa\x16\xcb\x8c\
+\xe8\x58\x66\x80\x72\xae\x8a\x5a\x2a\xcd\xd5\x31\x8a\x0b\x1f\x53\
+\x41\x3e\x27\x35\x83\x1a\xa5\x93\x90\xe3\xbe\x50\xc8\x39\x2a\x2e\
+\x42\x76\x7d\x1d\xd7\x77\x56\x79\xd7\xa4\xa6\x8d\xb0\xef\x2a\x2b\
+\xc7\xa2\xaf\x6e\xe8\xa7\x50\xf7\x51\xf8\x19\x16\x0c\xea\x43\x7c\
+\x16\xcc\xcc\x8f\x0d\xf3\x2c\xff\x08\xdc\x44\xaf\x1b\xe2\xbf\xb1\
+\xfb\x42\x3e\xdf\x34\x48\xf5\x4a\x1f\xcf\xef\x1d\x80\x90\xc7\xb4\
+\xc3\xf2\xf7\x26\xce\x75\x37\xf1\x38\xee\x10\xbd\xee\x28\x6f\x4b\
+\xb4\x31\x44\x3f\x59\xdb\xb7\x80\x98\x41\x08\xf9\x31\x3b\xba\x9e\
+\x53\xf1\x00\x97\x89\x1e\xb8\x59\xce\x69\x0d\xf3\x56\x07\xe9\x7e\
+\xc8\x21\x3d\xc2\xe7\xec\x7a\xf8\x75\x21\xbf\x83\x61\x71\x94\x63\
+\x34\x00\x07\x81\xcd\x23\x8b\xfe\x06\xe8\x5d\x6a\x8e\xef\x30\x87\
+\x45\x40\x3a\x42\xcf\x9b\x5e\x6d\xa8\xfa\x78\x8f\x02\xb2\xa4\xa4\
+\x4b\x37\xc5\x41\xfc\xda\x45\xdb\xee\xe3\xed\x31\xf8\x5b\x39\xa5\
+\xd8\xfe\x80\x86\xb3\x57\x42\xda\xc5\x69\xc4\x5a\x1e\xe1\x33\x8c\
+\x47\x39\xa5\x87\xf8\xd9\xa3\xf4\xfb\x08\xbd\x4e\xcc\x38\x76\x71\
+\x9c\x05\xb4\x03\x1c\x87\x5e\xfa\xbb\xc0\xa5\x87\x43\xc0\x7a\x4e\
+\x4a\x5a\x75\xf3\x59\xcc\x5b\xf8\x15\x07\x29\x5c\x23\x1c\x8a\x23\
+\x9c\xf7\xc4\x95\xad\x1c\x43\x86\xcf\x01\x7e\x3f\xeb\xf5\x7a\x7e\
+\x56\x40\x36\x28\x47\x99\xed\x9b\x56\xda\x24\x2d\x05\x1c\x21\xfd\
+\xfd\x46\xd9\x1e\xe3\x01\x86\x7f\x3f\x9f\xeb\x11\xf7\x26\x3d\x70\
+\x84\x7c\xa4\xfb\x79\xaf\x43\x7c\x14\x7a\x24\xed\xbb\xe4\x9c\x24\
+\xa6\x8e\xa0\xbd\xe1\x3f\x06\xdf\x01\x3e\x7f\xd9\xc5\xf1\x1e\xf6\
+\xc2\xab\x5a\xc3\x63\x90\xf4\xf2\x80\xea\xe1\x20\xc7\xa2\x87\xd3\
+\xa3\x9f\xf7\x32\xcc\xf3\x0f\xdd\xbc\xa5\x7e\xcd\x43\xec\xce\x21\
+\x7e\x7e\x04\xf1\x95\xe0\x6e\x31\xf2\xfd\x88\x86\xdd\x32\x37\xd1\
+\x03\x37\xd0\x5e\x7b\x24\xe7\x74\xf1\x99\x6e\x1b\x0b\x21\x07\x0c\
+\x7e\x83\x85\xa0\x73\x97\xfc\xec\xd6\x5a\x23\x44\x63\x3c\x20\xc7\
+\xb0\x5b\x8f\xe8\x20\xe7\xa5\x28\x55\x6e\xe2\x12\xd7\xc3\xaf\xea\
+\xe2\xe3\x31\x2c\xa9\x90\xe4\x9c\x34\x28\xa9\xab\xa4\x50\xf4\xa1\
+\x24\xfd\xa8\xe4\xc2\x41\x0d\x99\x4d\x5f\x25\x2d\xea\xba\x5a\x34\
+\x84\x68\x4b\xf5\x9d\xb4\x46\xf0\x00\x9f\xa5\xee\x97\x10\x0e\x6b\
+\x6a\x54\x6f\xb7\x0d\xa0\x3b\x37\x7b\x3a\x9f\x99\x9c\x2a\x86\xaa\
+\x10\xa8\xb5\x42\x25\x10\xbd\x88\xfe\xd6\x79\x77\x2e\x9b\xde\xb6\
+\xbb\x2d\x9b\x2e\x36\xb7\x26\x4f\x65\x8a\x53\xe1\x50\xba\x90\xce\
+\x9f\x4c\x8f\x8b\x6a\xa0\x81\xd4\x4c\x1a\x97\xd7\xb4\x25\x93\x23\
+\x53\x99\x82\xf8\x71\x38\x37\x51\x3c\x95\xca\xa7\x43\x7a\x62\x5a\
+\x94\x0d\x55\xad\x2b\x6a\x0d\x55\x21\xcd\xd6\xb6\xad\x6d\xa2\x31\
+\x79\x2f\x6b\x66\x2c\x37\x9b\xa1\x8d\x8c\xa6\xa7\x73\xa7\x5a\xc3\
+\x54\x76\x9c\x9d\x4c\x4d\x17\x72\x61\xea\x64\x2a\x33\x9d\x1a\x9d\
+\x4e\x87\x1c\xcc\x54\xd8\xdb\x75\x43\x98\x2a\xee\x4d\x4e\x15\x8b\
+\xb3\x7b\x37\x6f\x2e\x8c\xe5\x33\xb3\xc5\x42\x5b\x21\x33\xdd\x96\
+\xcb\x4f\x6e\x1e\xec\xed\x4f\x26\x93\x9b\xce\x7f\x4b\x72\xf8\x8f\
+\xf4\x0c\x84\xbd\x83\x03\x23\x61\x7f\x5f\x77\xcf\xc0\x70\x0f\x06\
+\x3f\xdc\x14\xb6\xef\x0c\x7b\xd3\xa3\xf9\xb9\x54\xfe\x34\x25\xf9\
+\x96\x5d\x3f\x54\x87\xc9\x23\x43\x3d\x5d\x87\xf7\xf7\xf7\x50\xb2\
+\xa4\xc3\xc9\x1c\xc5\x3b\xcc\x4d\x70\x5a\x46\xe8\x18\x6e\xa4\x08\
+\x36\x87\x8c\xfa\xc5\x5c\x58\x28\x66\x66\xe6\xa6\x53\x45\x4a\x9c\
+\x5c\x7e\x7a\xfc\x54\x66\x3c\x9d\x1c\x4f\x9f\xa4\x54\x9c\x9d\x49\
+\xd3\x9b\x68\x2b\x63\xb9\x69\x4a\xbe\x5c\x3e\x55\xcc\x9c\x4c\x87\
+\x13\xac\xa9\xd9\x7c\xee\x78\x7a\xac\x58\x68\xe5\x4d\xcc\xcd\xce\
+\xe6\xf2\x45\xde\x1b\xff\x75\x2c\x9f\xa6\xd7\xe6\xb2\xc9\xf4\xc4\
+\x04\xfd\x81\x83\x92\x1a\x4b\x8d\xa7\x67\x32\x63\x7c\x64\xa6\x33\
+\xd9\xc9\xb9\x0c\xed\x7a\x8c\x36\x3e\x33\x33\x97\xcd\x14\x33\xe9\
+\x82\x18\x35\xda\x20\x6d\xfd\x24\x85\x83\x8e\xd4\x44\x3e\x9d\x66\
+\x67\x93\x39\x86\xc5\x44\x9e\xf2\x14\x05\xf3\x44\x98\xc9\x86\xa7\
+\xa6\x32\x63\x53\xbc\xbf\x42\x38\x93\x3a\x4d\x07\x3e\x2c\x4c\x51\
+\xa4\xc6\xc5\xd8\xcf\xb0\x46\xe8\x01\xbd\x72\x96\x72\x5f\x96\xd2\
+\x7e\x2a\x33\x2b\x18\x35\x47\x21\xcd\x17\x38\x43\x52\xfa\xf4\xf6\
+\x53\x36\xa1\x4c\x53\xe0\x08\x68\x6e\x14\x2d\x53\x68\x68\xc3\x73\
+\xf4\x44\x2b\x25\xd5\xdc\x78\x86\xed\xcc\xe4\xc6\x33\x13\x19\xd1\
+\x53\x92\xf6\x48\x31\xc9\x67\x46\xe7\x8a\xec\x2e\x0a\xf0\xf4\xe9\
+\x30\x45\x59\x33\x97\x9d\x64\xdf\xb4\xd1\xd3\x9c\xd8\xd9\x5c\x31\
+\x2c\xe4\xa6\x29\x8b\x9e\x66\x27\x67\x0a\xe9\xe9\x93\xe9\x42\x5b\
+\x48\x81\x48\xf2\xce\x5a\x29\xb0\x63\xd3\xb4\x0f\x76\x63\xf6\x74\
+\x48\xa5\x21\x73\x52\x10\x9d\x21\x4d\x7f\x1f\x4b\x65\x19\x38\xa3\
+\x54\x52\xa6\x19\x20\xe9\x99\xd1\xf4\xf8\x38\xdb\x73\xc0\xa0\x80\
+\x6d\xce\xe5\x45\x77\x82\xe9\x69\x7b\x05\x25\x74\x92\xbe\x94\xd6\
+\x53\xa9\x22\xff\x29\x2f\x45\x37\x99\xa5\x14\x2e\x68\x70\x19\xde\
+\x0c\x5c\x17\x12\x0e\xb4\xa4\x10\xa3\xb6\xf9\xbd\xd0\x9a\x9c\xca\
+\x9d\xa2\xfc\x93\xe7\xd0\xb2\x46\x28\xc0\x79\xbb\x74\x90\xf5\xc8\
+\xc7\x20\x2c\x9e\x9e\x4d\x33\xee\x90\x54\x17\xc4\xc8\xa7\xef\x9c\
+\xcb\xe4\xd3\x9c\xfd\x28\xff\x98\x91\xa0\xe7\x52\x74\x3c\x95\x9e\
+\x40\xf2\x3f\x9e\xa3\x50\xb3\xce\x52\xb3\xb3\xd3\xa7\x93\xf4\x5a\
+\x4e\xc0\xdc\xd8\x1c\x6f\x85\x33\x24\xeb\xbe\xc0\x68\x5b\xd4\xb0\
+\xe7\xb8\xba\xa1\x2a\x0d\x21\x40\xd9\xe2\x40\x4f\x6f\xdf\x40\xdf\
+\x48\xdf\xe0\xc0\x70\xb2\xc9\xd2\x57\x4d\x14\x86\x09\xca\x3b\x0c\
+\x1a\xd6\x4c\x21\xcd\x25\x64\x22\x33\x4d\xfb\xd7\x58\x8a\x01\x0e\
+\xb5\x5a\x4d\x1e\xa2\xe3\x90\xce\x6f\x2c\x34\xfb\x60\x67\x04\x1c\
+\xa3\x77\xe6\x29\xdf\xcc\xa4\xf2\x27\xd8\xf0\x15\xa8\x50\x8d\x4d\
+\x31\x72\x64\x38\x77\x27\x05\x67\xd0\x0e\x73\x73\xf9\xb1\xb4\xe8\
+\xb0\x95\x32\x42\x86\x0e\xb0\xd4\x5f\x62\x24\x24\xca\x5c\xfe\x28\
+\x2a\x4d\x51\xa5\x8c\x71\x60\x54\x12\x43\x5e\x98\x4d\x8f\x49\xa6\
+\x16\x9d\x87\xa9\x89\xa2\x50\xc7\xc9\x31\x6d\x1f\x0a\xb4\x61\x3e\
+\x30\x14\x17\xd6\xfa\x20\x3d\x9d\xc9\xa6\xa6\x95\x6e\x73\xe9\xc3\
+\x54\x07\xd5\x13\x4c\xeb\x51\x32\xd9\xaa\x9f\x4a\xfe\x2c\xb5\x21\
+\x9c\x87\x0a\x49\xcc\xbd\x2e\xfd\x42\x4d\x3f\xd6\xe7\x61\x25\x7d\
+\x9e\x3e\x1d\xb1\x99\xa1\x3a\x87\xb5\x96\x1a\xe7\x42\x55\xcc\xb5\
+\xd2\x5f\xa7\xd3\x45\x7a\xd0\x9a\x64\xf2\x31\x37\x4a\x95\x50\x71\
+\x8e\x9d\x08\x37\x6d\x52\xca\x82\xf1\x05\xd7\x30\x39\x6a\x33\xe8\
+\x69\xce\xaf\x13\x12\x21\x0d\xb4\x38\x93\x74\x49\xd0\xca\x3a\x1c\
+\x9b\x4a\x65\x27\x59\xa3\x94\x7f\x67\x52\x82\xd3\xe8\x69\xa6\x26\
+\x15\x07\xda\xc4\x60\xb0\x27\xb3\xe9\x53\x61\x3a\x7b\x32\x93\xcf\
+\x65\x19\x8d\x19\xb2\x5d\x73\xc5\xa9\x5c\x3e\x8a\x62\x21\x33\x99\
+\x65\x32\x96\x66\xdd\xa4\xd9\x1e\x15\xea\x49\xaa\x1f\x67\xd8\x7e\
+\x31\x3d\x36\x95\xcd\x8c\xa5\xa6\x93\xa7\xf2\x19\x36\x8a\xb4\x7b\
+\x21\x70\xb3\xb4\x95\x1c\x47\x8d\xa2\x92\xd5\x14\x97\xc3\x65\xc1\
+\x44\xbb\x3f\xd2\x33\x74\xb8\x6f\x78\x98\x0a\x42\xb8\x3e\xec\x1e\
+\x1c\x38\x20\x85\xe2\x48\x3a\x3f\x93\x29\x70\x63\x46\xf9\x93\xb6\
+\x9b\xa6\xc8\xd1\xde\xb3\x45\xa6\x8b\xb8\xd2\x66\x76\x83\xaa\xe3\
+\xc9\x74\xab\x02\x5a\x76\x9d\x1b\x2d\x52\x21\xa6\x54\x48\xa6\x98\
+\xcd\xd6\x94\xb5\xfa\xe6\x37\xcd\x31\x9b\xcf\x94\xee\xe9\x56\x7e\
+\x25\x55\xbc\x69\xde\x20\x57\x7b\x52\x0d\x9f\x6e\xb5\x54\x9f\xb0\
+\x21\x54\xb5\x4e\x5b\x5a\x9a\xca\x9d\x3e\xe4\x8e\x42\x01\x77\x9b\
+\x34\xdd\x52\x8e\x60\x86\x4d\x11\x64\x22\xc7\x2c\x03\x1b\x32\x4a\
+\xad\xf1\x0c\x63\xe4\xc2\xde\x64\x72\x6b\x73\x38\x90\xce\x08\x0d\
+\x16\x19\xca\x6c\x2e\xaf\x38\x26\x43\x47\x3e\x43\xef\xa3\xda\x76\
+\x8e\x72\x88\x61\x9e\x56\x2a\xd0\xa1\xe6\x1c\x7a\x83\xcb\xd4\x54\
+\xb8\x95\x51\x93\x26\x83\xb6\x95\x9e\x9e\xa0\x83\xd2\xde\x5c\xf9\
+\x4e\x2f\x41\x55\x6b\xca\x74\x9c\x8b\xbd\x68\x75\x0c\x46\x3a\x45\
+\xb5\x03\x1b\x90\x24\x63\x21\x3a\x98\xc2\x72\x52\x17\xe1\x64\x3a\
+\x34\xba\x82\xaa\x63\xaa\xe1\x84\x4d\x47\xfa\x8e\xeb\x78\xaa\xf6\
+\x84\x2d\x53\x8a\x6d\x3c\x94\xf4\x64\xda\xa7\x48\xef\xd9\x94\xa2\
+\x06\x94\xca\x45\xfa\xae\xa2\xd2\x76\x53\x73\x33\xa9\xec\x26\xaa\
+\xca\xc7\xb9\x33\x37\x45\x77\x98\x4c\xe4\xf2\x8c\x98\x1c\x82\x59\
+\x0a\xe8\x6c\x3e\xc3\xbc\x99\x19\x0a\x24\x95\x0c\x73\xf9\x4c\xba\
+\x48\xf7\x8a\xd4\xa7\xc8\xa4\xa7\xc7\x0b\x1c\x4d\x76\x1f\xeb\x80\
+\x36\x31\x4a\xe9\x49\x3d\x31\xa1\xc9\x2d\xf3\x9d\x2b\xa4\xd5\x3d\
+\xd2\xfe\x52\x2d\x9f\xa1\xca\xfa\x64\x26\x7d\xca\x68\x2b\xca\xad\
+\x79\x3a\x3a\xdb\x28\x6b\xe4\x22\x83\x12\x3f\x26\xf4\x36\xfe\x8b\
+\xa5\xa7\x93\x4c\x4f\x0b\x73\x31\xcd\x1c\xe8\xf4\x5d\xb3\x94\x7a\
+\x99\x62\xc8\xc4\xb9\x48\x3d\xa1\x59\x4b\x00\xa5\xe4\x29\x48\xc6\
+\x72\x79\x6a\xcf\x67\x19\xc3\x52\x29\x73\xb5\xa8\x34\x2a\xf4\x0a\
+\x3a\xfa\x52\x35\x67\x99\xcb\x42\x2d\x27\x93\x0b\xc9\xf9\x94\x8c\
+\x33\x9c\x20\x0c\x62\x66\x22\x98\x92\x9e\x65\x7e\x42\x16\x29\x0c\
+\x86\x34\xb3\x98\xdb\x9b\xb9\x47\x90\x95\x60\x4b\x6c\x3d\x0a\x5c\
+\x9a\xdc\x50\xe8\x35\x74\xad\x25\x87\xcc\x93\xa3\x12\x2c\xbd\x07\
+\xee\x85\x08\xb7\x70\x26\xc7\x44\x3c\x9d\x1d\xcf\xe5\x29\xdd\x98\
+\xa0\x8d\x53\x57\xa3\x98\xe1\x66\xf4\x74\xd2\x25\x3b\xbd\xf4\xae\
+\xb1\xf4\x2c\x17\xe7\xd4\xd8\x89\x6c\xee\x14\xe5\xfd\xc9\xb4\xa4\
+\x92\x54\x7f\xf4\x3a\x03\x47\x84\x5c\xec\x27\xc1\xc2\x16\xd0\x79\
+\x21\x26\xc2\x7b\x70\x87\x27\x69\x86\x87\xd2\x66\x87\xa0\x8d\xa3\
+\xdf\xb4\x3a\xa2\x4d\x19\xe5\xd4\xea\x33\x41\xad\xc9\x99\xb9\x02\
+\xa7\x04\x16\x59\x3a\x0e\xd4\x49\xa2\x03\x17\x75\x29\x84\x12\xe4\
+\x37\x09\x12\x5a\xd6\xd5\xf5\xc1\xb0\x5c\x86\x71\xbe\x57\xb2\x56\
+\xdf\x2b\x8c\xf1\xbd\x92\xc6\xf7\x72\xad\xcc\x08\xb3\x32\x03\x5d\
+\xcc\xb4\xd8\x51\xdd\x68\x9a\x6a\x4c\xd6\xf8\x1c\x65\x06\x86\xd2\
+\xc9\x5c\x86\x7a\xf4\x13\xd8\x20\x2b\xad\xa3\xb4\x33\xf3\x5d\x93\
+\x0c\x1a\x2a\xef\xcc\x95\xeb\x1b\xee\xee\xef\xea\x3b\xdc\x33\x94\
+\x1c\x39\xd4\x23\xe2\xb1\xe1\xc1\xde\x91\x9b\xba\x86\x7a\xc2\xbe\
+\xe1\xf0\xc8\xd0\xe0\x8d\x7d\x07\x7a\x0e\x84\x4d\x5d\xc3\xf4\xb8\
+\xa9\x35\xbc\xa9\x6f\xe4\xd0\xe0\xd1\x91\x90\x5e\x31\xd4\x35\x30\
+\x72\x0b\x0d\x10\xc2\xae\x81\x5b\xc2\xeb\xfb\x06\x0e\xb4\x26\x7b\
+\x6e\xa6\x91\xd6\xf0\x70\x38\x38\x14\xf6\x1d\x3e\xd2\xdf\xd7\x73\
+\xa0\x35\xec\x1b\xe8\xee\x3f\x7a\xa0\x6f\xe0\x60\xb8\x9f\xde\x37\
+\x30\xc8\x22\xbe\xc3\x7d\x23\xb4\xd1\x91\x41\x7e\xab\x6c\xaa\xaf\
+\x87\xde\xd7\x9b\xa4\xb0\x74\x1f\xa2\x87\x5d\xfb\xfb\xfa\xfb\x46\
+\x6e\x69\x0d\x7b\xfb\x46\x06\x58\x9b\xbd\xb4\xd1\xae\xf0\x48\xd7\
+\xd0\x48\x5f\xf7\xd1\xfe\xae\xa1\xf0\xc8\xd1\xa1\x23\x83\x34\x70\
+\xec\x1a\x38\x40\x9b\x1d\xe8\x1b\xe8\x1d\xa2\xbd\xf4\x1c\xee\x19\
+\x18\x49\x52\xa8\xba\x07\x8f\xdc\x32\xd4\x77\xf0\xd0\x48\x2b\xbd\
+\x69\x84\x9e\x6c\x0d\x47\x86\xba\x0e\xf4\x1c\xee\x1a\xba\xbe\x95\
+\x41\x38\x48\x51\x1e\x0a\xf9\x25\x6d\x14\x4a\xda\x46\xd8\x73\x63\
+\x0f\xa3\xc0\xa1\xae\xfe\xfe\x90\xfe\x9a\xd4\x6d\x84\x87\x06\xfb\
+\x0f\xd0\xab\xf7\xf7\x50\xe8\xbb\x68\x24\x29\xc0\xa1\xd0\x73\xfa\
+\xb5\x86\x07\xba\x0e\x77\x1d\xec\x19\x36\xed\xb2\xcb\x04\x06\x49\
+\x43\x01\x76\xc3\xc1\x9e\x81\x9e\xa1\xae\xfe\xd6\x70\xf8\x48\x4f\
+\x77\x1f\xdb\xa1\xa4\xeb\x1b\xea\xe9\x1e\xe1\xb4\xa2\xe4\xa6\xc8\
+\xf7\x73\x08\xa9\x4f\x31\xdc\x73\xc3\x51\x7a\x82\x5e\x97\x94\x5d\
+\xd0\x31\x38\xd4\xc3\xbb\xa0\x30\x77\xd1\xff\xdd\x8c\x35\x42\x8e\
+\xf1\x00\xc5\x90\xb5\x33\x32\x38\x34\xa2\x41\xb9\xa9\x6f\xb8\xa7\
+\x35\xec\x1a\xea\x1b\xa6\x20\x24\x7b\x87\x06\x29\xb8\x6c\x08\xe9\
+\x1d\x6c\xd0\x8f\x52\x12\xb2\xf1\x1a\x90\xf0\xb2\x61\x61\xe7\xa2\
+\x0c\x41\xaf\x62\x77\x27\x05\x82\x07\x7a\xba\xfa\x69\x83\xc3\x0c\
+\x8c\xc8\xb5\x6d\x70\x5e\x4f\x6c\x40\x7c\xce\x41\x3d\xff\x4b\xb7\
+\xb3\xff\xc2\x56\xe1\xd4\xcf\xc2\xe9\x2d\xd8\xcc\xcf\x06\x7c\x09\
+\xc3\x7a\x98\x07\x0d\x70\x01\xcc\x87\x24\x2c\x80\x85\x70\x21\x2c\
+\x82\xc5\x70\x11\x34\xc2\xc5\xb0\x04\x2e\x81\x4b\x61\x29\x2c\x83\
+\xcb\x60\x39\x5c\x0e\x2b\xe0\x0a\x58\x09\xab\x60\x35\x84\x70\x25\
+\x34\xc1\x1a\x58\x0b\xeb\x60\x3d\x6c\x80\x8d\xd0\x0c\x57\x41\x0b\
+\xb4\xc2\x26\x0a\xec\x66\xfe\x60\x51\x3b\xed\x7d\x3b\xec\x80\x9d\
+\xb0\x0b\x76\xc3\x1e\x8a\xe0\x3e\xb8\x1a\x3a\xe0\x1a\xb8\x16\x3a\
+\x79\x22\xab\x5b\x96\x9f\xb2\x14\x65\x1f\x5c\x07\xd7\x53\xd4\x0e\
+\xf3\x14\xe7\x11\xb8\x01\x86\x60\x18\x46\xe0\x28\xdc\x08\x37\xc1\
+\xcd\x70\x0b\xdc\x0a\x6f\x82\xdb\xe0\xcd\x70\x3b\xdc\x01\xc7\x20\
+\x45\x02\x92\x80\xdf\x84\xb7\xc3\x4f\xc3\x9f\xc0\xfb\xe0\x9b\xf0\
+\x0e\xb8\x0f\xde\x05\xbf\x06\x1f\x86\x87\x49\x1d\xdc\x0b\x5f\x81\
+\x9f\x82\x5f\x24\xf5\x64\x1e\xfc\x1c\x69\x80\x77\xc2\x9f\xc1\xd7\
+\xc8\x05\xf0\x41\xf8\x08\xfc\x07\x7c\x17\xbe\x07\x0f\xc1\xef\xc2\
+\x5f\xc2\x5f\xc0\xc7\x60\x94\x12\xfd\x7e\x18\x87\xbf\x82\x34\x7c\
+\x16\x3e\x07\x7f\x03\x4f\xc3\x5f\xc3\xe7\xe1\x5f\x60\x02\xbe\x04\
+\x5f\x80\xbf\x85\x8f\x53\xe2\xbf\x04\xbf\x00\xcf\xc0\xdf\xc1\xff\
+\xa0\x43\xf6\xaf\xf0\x6f\xf0\xb3\x70\x9c\x0e\xce\x09\x98\xa1\x03\
+\x94\x85\x07\xe9\x10\xdd\xc9\x27\x08\x0b\x7c\x8a\xe6\x24\x9c\x82\
+\x6f\xc1\x5d\x70\x37\x9c\x86\x9f\x80\x9f\x84\xb7\xc0\x63\xf0\x1b\
+\xf0\x36\x78\x2b\x94\xe0\xbf\xc1\xb7\xe1\x3b\xf0\x69\x32\x9f\x24\
+\xc9\x02\xb2\x90\x5c\x48\x16\xc1\xab\x70\x86\x2c\x26\x17\x91\x46\
+\x72\x31\x9c\x25\x40\x96\x90\x4b\xc8\xa5\x84\x90\xa5\x64\x19\xb9\
+\x8c\x2c\x27\x97\x93\x15\xe4\x0a\xb2\x92\xac\x22\xab\x49\x48\xae\
+\x84\x97\xe1\x3f\x49\x13\x59\x43\xd6\x92\x75\x64\x3d\xd9\x40\x36\
+\x92\x66\x72\x15\x69\x21\xad\x64\x13\x69\x23\x9b\xc9\x16\xb2\x15\
+\xbe\x0f\x7f\x4f\xda\xc9\x36\xb2\x9d\xec\x20\x3b\xc9\x2e\xb2\x9b\
+\xec\x21\x7b\xc9\x3e\x72\x35\xe9\x20\xd7\x90\x6b\x49\x27\xbc\x00\
+\xff\x48\xba\xc8\x7e\xd2\x4d\x0e\x90\x1e\xd2\x4b\x0e\x92\x43\xa4\
+\x8f\x5c\x47\xae\x27\xfd\xe4\x30\x19\x20\x83\xf0\x09\xf8\x3d\x72\
+\x84\xdc\x40\x86\xc8\x30\x19\x21\x47\xc9\x8d\xe4\x26\x72\x33\xb9\
+\x05\x7e\x00\xaf\xc0\x8b\xf0\x4f\xe4\x56\xf2\x26\x72\x1b\x79\x33\
+\xb9\x9d\xdc\x41\x8e\x91\x14\x19\x25\x63\x64\x9c\xa4\xc9\x04\x99\
+\x24\x53\x24\x43\x8e\x93\x13\x64\x9a\xcc\x90\x2c\xc9\xc1\x1f\x93\
+\x59\x72\x27\xc9\x93\x02\x7c\x03\xfe\x99\x14\xe1\x11\xf8\x32\x3c\
+\x4f\xe6\xc8\x49\x72\x8a\xdc\x05\x5f\x85\x67\xe1\x1f\xe0\x39\xf8\
+\x9f\xf0\x75\x72\x9a\xdc\x4d\x7e\x82\xbc\x85\xfc\x24\x79\x2b\x79\
+\x1b\x29\x91\xff\x46\xee\x21\x3f\x45\xde\x4e\x7e\x9a\xbc\x83\xfc\
+\x0c\x79\x27\x7c\x88\xfc\x2c\xb9\x97\xbc\x8b\xbc\x9b\xfc\x1c\xb9\
+\x8f\xfc\x3c\xb9\x9f\xfc\x02\x79\x0f\xf9\x45\xf2\x5e\xf2\x4b\xe4\
+\x7d\xe4\x97\xc9\xfb\xc9\xaf\x90\x07\xc8\xaf\xc2\xaf\x93\x0f\x90\
+\x5f\x23\x1f\x24\xbf\x4e\x1e\x24\xbf\x41\x1e\x22\xbf\x49\x1e\x26\
+\xbf\x45\x1e\x21\xbf\x4d\x3e\x44\x3e\x4c\x3e\x42\x7e\x87\x7c\x94\
+\xfc\x2e\xfc\x32\xf9\x18\xf9\x38\xf9\x04\xfc\x2a\xf9\x3d\xf2\x49\
+\xf2\xfb\xe4\x53\xe4\x0f\xc8\xa3\xe4\x0f\xc9\x63\xe4\x8f\xc8\xa7\
+\xc9\x1f\x93\xc7\xc9\x9f\x90\x27\xc8\x9f\x92\x32\xf9\xef\xe4\x49\
+\xf2\x67\xe4\x33\xe4\xcf\xc9\x53\xe4\x2f\xc8\x67\xc9\x5f\x92\xcf\
+\x91\xbf\x22\x4f\x93\xbf\x26\x9f\x27\x7f\x43\xbe\x40\xfe\x96\x7c\
+\x91\x7c\x89\xfc\x1d\xf9\x1f\xe4\x19\xf2\xf7\xe4\xcb\xe4\x7f\x92\
+\xaf\x90\xaf\x92\x67\xc9\x3f\x90\xaf\x91\xaf\x93\xe7\xc8\xf3\xe4\
+\x05\xf2\x8f\xe4\x45\xf2\x4f\xe4\x1b\xe4\x9f\xc9\x37\xc9\xbf\x90\
+\x6f\x91\x7f\x25\xdf\x26\xff\x46\xbe\x43\xfe\x17\x79\x89\xfc\x6f\
+\xf2\xef\xe4\xff\x90\xef\x92\xff\x20\xdf\x23\xff\x97\xbc\x4c\xfe\
+\x93\x7c\x9f\xfc\x80\xbc\x42\x5e\x25\x67\xc8\xd9\x00\x02\x12\x04\
+\x41\x22\xa8\x0b\xea\x83\x79\x41\x43\x70\x41\x30\x3f\x48\x06\x0b\
+\x82\x85\xc1\x85\xc1\xa2\x60\x71\x70\x51\xd0\x18\x5c\x1c\x2c\x09\
+\x2e\x09\x2e\x0d\x96\x06\xcb\x82\xcb\x82\xe5\xc1\xe5\xc1\x8a\xe0\
+\x8a\x60\x65\xb0\x0a\x3e\x09\xbf\x1f\xac\x86\x47\xe1\x0f\xe1\x33\
+\xf0\x29\xf8\x03\xf8\x73\xb8\x07\x9e\x84\x9f\x81\xdf\x81\xa7\xe0\
+\x09\xf8\x53\x78\x3c\x08\x83\x2b\x83\x26\x78\x77\xb0\x26\x58\x1b\
+\xac\x0b\xd6\xc3\xfb\x83\x0d\xf0\x00\xfc\x0a\xfc\x16\xbc\x07\x3e\
+\x00\xbf\x0d\x3f\x0f\xef\x85\x5f\x0a\x36\x06\xcd\xc1\x55\x41\x0b\
+\xfc\x51\xd0\x1a\x6c\x0a\xda\x82\xcd\xc1\x96\x60\x6b\xd0\x1e\x6c\
+\x0b\xb6\x07\x3b\x82\x9d\xc1\xae\x86\xb9\x6c\x66\xcb\x96\x5d\xbd\
+\xe2\xbb\x6b\x8b\xfc\x3e\x20\xbe\xf7\xb7\xcb\xef\x6d\xf2\x7b\x87\
+\xfc\xde\xd3\xd0\x45\xdd\x6d\x1a\xb5\x36\xa4\xc4\xf7\xbc\xae\xd1\
+\x7c\xfa\x64\x7a\x5e\x8a\x7f\x35\x74\xe5\x26\xa9\x2f\x7f\xa2\x21\
+\x25\xbe\x17\x74\x8f\x65\xf2\xd4\x3b\x98\x98\x4e\xdf\xb5\x60\xcc\
+\xec\x27\xbb\xc7\x73\xc5\xd4\x18\xb5\xfd\xc5\xe4\x98\xde\x9d\x77\
+\x60\x2c\xc5\x9a\x1c\x17\x5f\x07\x68\xfb\xa9\x62\x43\x8f\xec\x30\
+\x2d\x3b\xec\x11\x1d\xa6\xf9\x57\xb2\xc7\x34\x94\xd6\xbb\x0d\x3d\
+\x12\x8c\xb4\xf8\x9e\xd7\x23\x5a\x4c\xf3\xaf\x05\x07\x11\x50\x93\
+\x08\xa8\x83\xa6\xad\x49\xbd\xbb\xf0\x20\xcb\x5b\xa6\xe4\xc1\x24\
+\x3a\x58\x70\x08\xb5\x33\x65\xf6\xeb\x0e\x8d\xa6\xf2\x75\x53\xf4\
+\x63\x5e\x5f\x31\x43\x3d\xcb\x79\x19\xfe\xd5\xd0\x27\x31\xc9\x48\
+\x4c\xfa\x04\x26\x19\x41\xba\x3e\x09\x73\x46\x7c\x07\x7d\xd7\x05\
+\x99\xe3\x0b\xae\x43\x7d\x1c\x37\xfb\x0b\xaf\xc7\x50\x9d\xb0\x0e\
+\x26\x69\x50\x9e\x9d\xa6\x4e\x54\x66\x6c\x5e\x7f\x6a\x8c\x7a\x82\
+\xf3\xa6\xf9\xd7\xc2\x7e\x7c\xdd\x34\x3a\x98\xd7\x2f\x08\x34\xcd\
+\xbf\xea\xfa\x29\xf6\x75\xd3\xf4\x63\xde\x80\xb8\x3f\x2b\xee\x1f\
+\xc0\xf7\x67\xf1\xfd\x03\xe2\xfe\xac\x20\x70\x36\x35\x9b\xa3\x5e\
+\x68\x6e\x76\x2a\x9d\xe8\xc9\x4e\x26\xd2\xd9\xc9\x86\x41\x89\x7c\
+\x4e\x22\x3f\x28\x90\xcf\xf1\xaf\x0b\x07\xa7\xe6\xb2\x93\xa9\xfc\
+\xdc\xcc\x74\x6a\xae\x78\x61\x0e\x1f\xcd\x1b\x12\x30\xe4\x05\x0c\
+\x43\x18\x86\x3c\x86\x61\x48\xc0\x90\x17\x5f\xc3\xe2\xae\x02\xff\
+\x5a\x30\x8c\xc8\x58\x40\x64\x1c\xc1\xad\x15\x71\x6b\x23\xa2\x99\
+\xa2\xa0\xc8\x08\x1b\xd2\x22\x1b\xd2\xa3\x62\x48\xe7\xc4\x90\x1e\
+\x95\x58\xcd\x49\xac\x8e\x0a\xac\xe6\xf8\x57\xfd\xd1\x3c\x75\x84\
+\xeb\xe7\xd8\xe7\x85\x47\x2d\x0c\xe7\xf0\x51\xc3\x51\x39\xf4\x73\
+\x52\x6a\x6e\x42\xd0\x9e\x42\xfb\xb7\xa0\xfd\xd3\x66\x7f\xde\xad\
+\x02\xd7\xbb\xf9\x57\xf2\x56\xc3\xc6\x77\xeb\xdd\x7a\x16\xe5\x16\
+\xb8\x14\xb7\x77\xef\x91\xdf\x5d\xf2\x7b\xbf\xf8\x3e\x20\xb4\xc2\
+\xb6\x5d\x5d\xf2\xbb\xa7\xbe\x98\xcb\xe6\x0a\x17\x8e\x67\xd2\x34\
+\x1c\xa4\x81\x05\x3b\x4a\x76\x4d\xcf\x4e\xa5\xf8\xee\xfc\x14\x75\
+\xbf\xd3\xd3\xe9\x4c\x6a\x61\xcf\x2c\xf5\x6f\xa8\xb7\xcf\x4e\x5f\
+\xd0\x53\x94\xbf\xf7\xe5\xe4\xde\xc2\xc1\x99\x0c\x23\x90\x38\x38\
+\x8a\x2e\x4e\x0e\xce\xa4\x27\xc5\x45\x8d\x19\x7a\xb9\xd5\x57\x3d\
+\xef\xab\x6e\x3f\x0d\xe8\xeb\x0f\xa6\xe8\xe0\x34\xc8\x7e\xea\x6e\
+\xa5\xa7\x12\xb4\x9f\x7a\x1a\xca\x14\x53\x75\xac\xa3\xfa\xeb\x69\
+\x58\x92\xa2\x2c\x3f\x33\x3a\x9e\x0a\x0e\xcf\x05\x03\x73\xc1\xcd\
+\x99\x06\xd9\x73\x70\x24\x93\x18\x9a\xca\xd5\x0f\x67\x26\x67\x52\
+\x89\x91\xd4\x5c\x83\x84\x22\x71\x64\x2a\x93\xe8\xa6\x7f\x47\x0a\
+\x99\x85\x7d\x08\x82\xc5\xf2\x02\x75\x9c\x4c\x69\xc4\x17\xa6\x31\
+\xba\x69\x85\x6e\x46\xa1\x7b\xc9\x9c\x7d\xab\x40\x86\xdf\x5f\x37\
+\xca\x90\x99\x64\xc8\xd4\x8f\xa7\xa7\x8b\xa9\x06\xd9\x56\xdd\xdd\
+\x0c\x25\xf6\x63\x91\xa3\xc4\x1a\xab\x3f\xc1\x51\x9a\x16\x28\x65\
+\xe7\x82\xbb\x32\x54\x80\x38\x3e\x89\xfc\x54\x6e\x5e\x81\x21\xb3\
+\xb5\x9e\x7f\x25\x8a\x14\x27\xd9\x6f\x62\x96\xe2\x33\x46\xff\xe8\
+\x61\x7d\x8e\x11\x78\x21\xa6\xed\x62\x07\xbc\x85\x39\x3c\x3a\x73\
+\x78\x74\x72\x7a\x74\x38\x4f\x6c\xdf\xb2\x65\x7e\x6a\x22\x93\xd9\
+\xba\x65\x4b\xfb\x36\xb5\xb7\x63\xab\xde\x6b\xd7\x7b\xe6\xd7\xed\
+\x7a\x6f\x87\xde\xdb\xa9\xf7\x76\xe9\xbd\xdd\x7a\x6f\x8f\xda\xdb\
+\xa9\x7b\xdb\xb9\x55\xf6\x7f\x40\x9f\x51\x7d\x6d\xdd\xae\xdb\xdd\
+\xaa\x5b\xdb\xaa\x5b\xdb\xaa\x5b\x6b\x37\xb0\x6b\x88\xdb\x35\xc4\
+\xed\x1a\xce\x76\xdd\x5e\xbb\x86\xb3\x5d\xb7\xdc\xae\x5b\x6e\xd7\
+\x2d\x6f\xd3\x2d\x6f\xd3\x2d\x6f\xd3\x2d\x6f\xd3\xb4\xd8\xa6\xfb\
+\xd8\xa6\xfb\xd8\xa6\xfb\xd8\xa6\xfb\xd8\xa6\xfb\xd8\xa6\xfb\xd8\
+\xae\xfb\xd8\xae\xfb\xd8\xae\xfb\xd8\xae\xfb\xd8\xae\xfb\x30\x74\
+\xd9\xae\xfb\xd8\xae\xfb\xd8\xae\xfb\xd8\x6e\xe8\xad\xef\xd8\xa9\
+\xef\xd8\xa9\xef\xd8\xa9\xef\xd8\xa9\xef\xd8\xa5\xa1\xda\xa5\x61\
+\xd9\xa5\x61\xd9\xa5\x61\xd9\xa5\x5b\xde\xa5\x5b\xde\xa5\x5b\xde\
+\xa5\x5b\xde\xa5\x5b\xde\xad\x5b\xde\xad\xf1\xdd\xad\xfb\xd8\xad\
+\xfb\xd8\xad\xfb\xd8\xad\xfb\xd8\xad\xfb\xd8\xad\xfb\xd8\xad\xfb\
+\xd8\xad\xfb\xd8\xa3\xfb\xd8\xa3\xfb\xd8\xa3\xfb\xd8\xa3\xfb\xd8\
+\xa3\xfb\xd8\xa3\xfb\xd8\xa3\xfb\xd8\x23\xf4\xe6\xf6\x1d\x86\x16\
+\xa6\x35\xd5\xd7\x56\x2d\x39\xf4\x9f\xde\xd3\x3c\xbc\x65\x9b\xde\
+\xdb\xae\xf7\x76\xe8\xbd\x9d\x7a\x6f\x97\xde\xdb\xad\xf7\xf6\xc8\
+\xfe\x95\x6c\x6c\xdd\xaa\xfb\x92\x38\x30\xe6\xdf\x5d\xd7\x33\x97\
+\xcf\xb1\x4b\xdb\xb7\x74\xf5\xf2\xd3\x3b\xb7\x6e\x63\x22\x9b\xcf\
+\xb3\x74\xd9\x44\xb1\x81\xef\xcd\xcd\x26\xf9\x37\xcf\x8d\x89\x1f\
+\xc7\x73\xa7\xb2\xfc\xc6\xf6\x2d\x3b\x1b\x8a\xf9\x4c\x6a\x72\x6e\
+\x96\x1f\xef\xd8\x2f\x8f\xc7\xc5\xef\x3b\xba\xb9\x27\xd9\xbe\x73\
+\xcb\x0e\xf9\xbd\xb3\xbe\x30\x9b\x1a\x4f\xd7\x8d\x4d\xcf\x8d\xd6\
+\x4f\xa5\x53\xf9\x62\xc3\x78\x26\x35\x43\x95\xcf\x82\x99\xb9\x02\
+\x9b\xb9\x60\x36\x84\x5d\xdc\x4b\x49\x24\xbf\xb9\xb0\xf7\xee\xee\
+\xe5\xee\x69\xef\x7e\x79\xbc\x7f\x4b\x3b\x5f\x25\xe6\x2c\x7b\x9f\
+\x1d\xe1\x6b\xbb\x00\x8d\x7a\x43\x1e\x4d\xd3\x70\x2c\x68\xa3\x9f\
+\x75\x32\xb6\x26\x3a\xaa\xe6\x9f\x4f\x77\x3c\xf4\x37\xec\xfb\x73\
+\x2b\xae\xf8\x1a\x3f\x7e\x74\xdd\xa9\xff\x07\xeb\x11\x9e\xf4\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00\x6d\x65\xb3\
+\x00\x66\
+\x00\x6f\x00\x6e\x00\x74\x00\x73\
+\x00\x06\
+\x07\x03\x7d\xc3\
+\x00\x69\
+\x00\x6d\x00\x61\x00\x67\x00\x65\x00\x73\
+\x00\x06\
+\x07\xac\x02\xc3\
+\x00\x73\
+\x00\x74\x00\x79\x00\x6c\x00\x65\x00\x73\
+\x00\x0b\
+\x09\x16\x75\x63\
+\x00\x62\
+\x00\x72\x00\x6f\x00\x77\x00\x73\x00\x65\x00\x72\x00\x2e\x00\x71\x00\x73\x00\x73\
+\x00\x08\
+\x04\xb2\x58\xc7\
+\x00\x75\
+\x00\x6e\x00\x64\x00\x6f\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x05\xe2\x59\x27\
+\x00\x6c\
+\x00\x6f\x00\x67\x00\x6f\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x06\x38\x5a\xa7\
+\x00\x68\
+\x00\x6f\x00\x6d\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x07\x9e\x5a\x47\
+\x00\x62\
+\x00\x61\x00\x63\x00\x6b\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x09\
+\x08\x97\x8a\x27\
+\x00\x68\
+\x00\x65\x00\x61\x00\x72\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0b\
+\x0b\x47\xe3\x87\
+\x00\x69\
+\x00\x6e\x00\x73\x00\x70\x00\x65\x00\x63\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x0c\xa8\x59\xc7\
+\x00\x6d\
+\x00\x75\x00\x74\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x0c\xf7\x59\xc7\
+\x00\x6e\
+\x00\x65\x00\x78\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x10\
+\x02\x73\xe9\xa6\
+\x00\x50\
+\x00\x72\x00\x65\x00\x73\x00\x73\x00\x53\x00\x74\x00\x61\x00\x72\x00\x74\x00\x32\x00\x50\x00\x2e\x00\x74\x00\x74\x00\x66\
+"
+
+qt_resource_struct_v1 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x0d\
+\x00\x00\x00\x10\x00\x02\x00\x00\x00\x08\x00\x00\x00\x05\
+\x00\x00\x00\x22\x00\x02\x00\x00\x00\x01\x00\x00\x00\x04\
+\x00\x00\x00\x34\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x00\x50\x00\x00\x00\x00\x00\x01\x00\x00\x04\x24\
+\x00\x00\x00\x66\x00\x00\x00\x00\x00\x01\x00\x00\x0a\x87\
+\x00\x00\x00\x7c\x00\x00\x00\x00\x00\x01\x00\x02\x3f\xa9\
+\x00\x00\x00\x92\x00\x00\x00\x00\x00\x01\x00\x02\x4b\xae\
+\x00\x00\x00\xa8\x00\x00\x00\x00\x00\x01\x00\x02\x54\x4e\
+\x00\x00\x00\xc0\x00\x00\x00\x00\x00\x01\x00\x02\x60\x66\
+\x00\x00\x00\xdc\x00\x00\x00\x00\x00\x01\x00\x02\x6f\xfe\
+\x00\x00\x00\xf2\x00\x01\x00\x00\x00\x01\x00\x02\x7a\xa7\
+\x00\x00\x01\x08\x00\x01\x00\x00\x00\x01\x00\x02\x7d\xba\
+"
+
+qt_resource_struct_v2 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x0d\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x10\x00\x02\x00\x00\x00\x08\x00\x00\x00\x05\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x22\x00\x02\x00\x00\x00\x01\x00\x00\x00\x04\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x34\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\xa1\x4f\x48\x92\x0e\
+\x00\x00\x00\x50\x00\x00\x00\x00\x00\x01\x00\x00\x04\x24\
+\x00\x00\x01\x93\x0d\xc4\xf1\x98\
+\x00\x00\x00\x66\x00\x00\x00\x00\x00\x01\x00\x00\x0a\x87\
+\x00\x00\x01\x93\x0d\xc4\xf1\x98\
+\x00\x00\x00\x7c\x00\x00\x00\x00\x00\x01\x00\x02\x3f\xa9\
+\x00\x00\x01\x93\x0d\xc4\xf1\x98\
+\x00\x00\x00\x92\x00\x00\x00\x00\x00\x01\x00\x02\x4b\xae\
+\x00\x00\x01\x93\x0d\xc4\xf1\x98\
+\x00\x00\x00\xa8\x00\x00\x00\x00\x00\x01\x00\x02\x54\x4e\
+\x00\x00\x01\x93\x0d\xc4\xf1\x98\
+\x00\x00\x00\xc0\x00\x00\x00\x00\x00\x01\x00\x02\x60\x66\
+\x00\x00\x01\x93\x0d\xc4\xf1\x98\
+\x00\x00\x00\xdc\x00\x00\x00\x00\x00\x01\x00\x02\x6f\xfe\
+\x00\x00\x01\x93\x0d\xc4\xf1\x98\
+\x00\x00\x00\xf2\x00\x01\x00\x00\x00\x01\x00\x02\x7a\xa7\
+\x00\x00\x01\x93\x0d\xc4\xf1\x98\
+\x00\x00\x01\x08\x00\x01\x00\x00\x00\x01\x00\x02\x7d\xba\
+\x00\x00\x01\x93\x0d\xc4\xf1\x98\
+"
+
+qt_version = [int(v) for v in QtCore.qVersion().split('.')]
+if qt_version < [5, 8, 0]:
+    rcc_version = 1
+    qt_resource_struct = qt_resource_struct_v1
+else:
+    rcc_version = 2
+    qt_resource_struct = qt_resource_struct_v2
+
+def qInitResources():
+    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
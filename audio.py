@@ -0,0 +1,130 @@
+import sys
+
+from PyQt5.QtCore import QIODevice, QObject
+from PyQt5.QtMultimedia import QAudioDecoder, QAudioFormat, QAudioOutput
+
+# The loop is decoded once into 16-bit PCM at this rate and kept in memory
+PCM_SAMPLE_RATE = 22050
+PCM_CHANNELS = 2
+
+
+def pcm_format():
+    audio_format = QAudioFormat()
+    audio_format.setCodec("audio/pcm")
+    audio_format.setSampleRate(PCM_SAMPLE_RATE)
+    audio_format.setChannelCount(PCM_CHANNELS)
+    audio_format.setSampleSize(16)
+    audio_format.setSampleType(QAudioFormat.SignedInt)
+    audio_format.setByteOrder(QAudioFormat.LittleEndian)
+    return audio_format
+
+
+class LoopDevice(QIODevice):
+    # Serves the decoded PCM forever, wrapping around at the end
+    def __init__(self, pcm, parent=None):
+        super().__init__(parent)
+        self.pcm = pcm
+        self.position = 0
+        self.open(QIODevice.ReadOnly)
+
+    def isSequential(self):
+        return True
+
+    def bytesAvailable(self):
+        return len(self.pcm) + super().bytesAvailable()
+
+    def readData(self, maxlen):
+        chunks = []
+        while maxlen > 0:
+            chunk = self.pcm[self.position : self.position + maxlen]
+            chunks.append(chunk)
+            maxlen -= len(chunk)
+            self.position = (self.position + len(chunk)) % len(self.pcm)
+        return b"".join(chunks)
+
+    def writeData(self, data):
+        return -1
+
+
+class BackgroundAudio(QObject):
+    # Looping background music. The file is decoded once; the audio output
+    # (and with it the device) only exists while something should be heard,
+    # so muted, minimized or hidden windows cost nothing.
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.volume = 0.5
+        self.suspended = set()
+        self.output = None
+        self.device = None
+        self.format = None
+        self.start_position = 0
+
+        self.pcm = []
+        self.decoder = QAudioDecoder(self)
+        self.decoder.setAudioFormat(pcm_format())
+        self.decoder.setSourceFilename(path)
+        self.decoder.bufferReady.connect(self.read_buffer)
+        self.decoder.finished.connect(self.decoded)
+        self.decoder.error.connect(self.decode_failed)
+        self.decoder.start()
+
+    def read_buffer(self):
+        buffer = self.decoder.read()
+        if self.format is None:
+            self.format = buffer.format()
+        self.pcm.append(buffer.constData().asstring(buffer.byteCount()))
+
+    def decoded(self):
+        pcm = b"".join(self.pcm)
+        self.pcm = []
+        self.decoder.deleteLater()
+        self.decoder = None
+        if pcm:
+            self.device = LoopDevice(pcm, self)
+            self.update()
+
+    def decode_failed(self, error):
+        print(
+            "Background music could not be decoded:",
+            self.decoder.errorString(),
+            file=sys.stderr,
+        )
+
+    def is_muted(self):
+        return "muted" in self.suspended
+
+    def set_muted(self, muted):
+        self.set_suspended("muted", muted)
+
+    def set_volume(self, value):
+        # value is 0-100 like the slider; silence is treated like mute
+        self.volume = value / 100
+        if self.output is not None:
+            self.output.setVolume(self.volume)
+        self.set_suspended("silent", value == 0)
+
+    def set_suspended(self, reason, suspended):
+        if suspended:
+            self.suspended.add(reason)
+        else:
+            self.suspended.discard(reason)
+        self.update()
+
+    def update(self):
+        should_play = self.device is not None and not self.suspended
+        if should_play and self.output is None:
+            self.output = QAudioOutput(self.format, self)
+            self.output.setVolume(self.volume)
+            self.start_position = self.device.position
+            self.output.start(self.device)
+        elif not should_play and self.output is not None:
+            # Whatever the output had buffered but not played yet is played
+            # first on resume, so the loop continues without a jump
+            played = self.format.bytesForDuration(self.output.processedUSecs())
+            played -= played % self.format.bytesPerFrame()
+            self.output.stop()
+            self.output.deleteLater()
+            self.output = None
+            self.device.position = (self.start_position + played) % len(
+                self.device.pcm
+            )
@@ -0,0 +1,1131 @@
+import argparse
+import atexit
+import functools
+import hashlib
+import http.server
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+# Benchmarks run without a visible window
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import (
+    PYQT_VERSION_STR,
+    QT_VERSION_STR,
+    QBuffer,
+    QByteArray,
+    QEventLoop,
+    QIODevice,
+    QPointF,
+    Qt,
+    QTimer,
+    QUrl,
+)
+from PyQt5.QtGui import QColor, QImage, QPainter, QRadialGradient
+from PyQt5.QtMultimedia import QMediaContent, QMediaPlayer, QMediaPlaylist
+
+import browser
+from adblock import RESOURCE_TYPES, load_filters
+from audio import BackgroundAudio
+from downloads import DownloadManager
+from headless import BatchRenderer
+from history import HistoryStore, SuggestionIndex
+from retro import transcode
+from tabs import TabPlaceholder, read_rss_mb
+
+
+BENCHMARKS = {}
+# Benchmarks that don't need a browser window
+HEADLESS = set()
+
+# Relative change that counts as a regression in --baseline comparisons
+REGRESSION_THRESHOLD = 0.15
+# Only metrics with these suffixes are compared; lower is better except for
+# HIGHER_IS_BETTER. Everything else is benchmark input or informational.
+METRIC_SUFFIXES = ("_ms", "_us", "_s", "_mb", "_kb", "cpu_pct", "per_second")
+HIGHER_IS_BETTER = ("per_second",)
+
+LIGHT_PAGES = 10
+HEAVY_PAGES = 10
+
+
+def benchmark(func=None, window=True):
+    def register(func):
+        BENCHMARKS[func.__name__] = func
+        if not window:
+            HEADLESS.add(func.__name__)
+        return func
+
+    return register(func) if func else register
+
+
+def percentile(samples, fraction):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+
+def wait(ms):
+    # Spin the event loop so pages can load and timers can fire
+    loop = QEventLoop()
+    QTimer.singleShot(ms, loop.quit)
+    loop.exec_()
+
+
+def run_js(page, code, timeout_ms=5000):
+    # runJavaScript is asynchronous, wait for its result
+    result = []
+    loop = QEventLoop()
+    page.runJavaScript(code, lambda value: (result.append(value), loop.quit()))
+    QTimer.singleShot(timeout_ms, loop.quit)
+    if not result:
+        loop.exec_()
+    return result[0] if result else None
+
+
+def wait_for_load(view, timeout_ms=15000):
+    loop = QEventLoop()
+    view.loadFinished.connect(loop.quit)
+    QTimer.singleShot(timeout_ms, loop.quit)
+    loop.exec_()
+    view.loadFinished.disconnect(loop.quit)
+
+
+def write_pages(directory, count, paragraphs=200):
+    paths = []
+    for i in range(count):
+        path = os.path.join(directory, "page%d.html" % i)
+        with open(path, "w") as page:
+            page.write("<html><head><title>Page %d</title></head><body>" % i)
+            for p in range(paragraphs):
+                page.write("<p>Page %d paragraph %d %s</p>" % (i, p, "8-bit " * 20))
+            page.write("</body></html>")
+        paths.append(path)
+    return paths
+
+
+class QuietHandler(http.server.SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+class RangeHandler(QuietHandler):
+    # Also answers single byte ranges ("Range: bytes=100-", "bytes=0-99")
+    # with 206 Partial Content, like the servers downloads.py resumes from
+    def send_head(self):
+        self.range_left = None
+        path = self.translate_path(self.path)
+        range_header = self.headers.get("Range", "")
+        if not range_header.startswith("bytes=") or not os.path.isfile(path):
+            return super().send_head()
+        size = os.path.getsize(path)
+        first, _, last = range_header[len("bytes=") :].partition("-")
+        first = int(first)
+        last = min(int(last), size - 1) if last else size - 1
+        if first > last:
+            self.send_error(416)
+            return None
+        source = open(path, "rb")
+        source.seek(first)
+        self.send_response(206)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Range", "bytes %d-%d/%d" % (first, last, size))
+        self.send_header("Content-Length", str(last - first + 1))
+        self.end_headers()
+        self.range_left = last - first + 1
+        return source
+
+    def copyfile(self, source, outputfile):
+        if self.range_left is None:
+            return super().copyfile(source, outputfile)
+        while self.range_left:
+            chunk = source.read(min(self.range_left, 64 * 1024))
+            if not chunk:
+                break
+            try:
+                outputfile.write(chunk)
+            except (BrokenPipeError, ConnectionResetError):
+                # Segments and paused downloads close the connection early
+                break
+            self.range_left -= len(chunk)
+
+
+def serve_directory(directory, handler=QuietHandler):
+    # Local http.server fixture on a free port; returns (server, base url)
+    server = http.server.ThreadingHTTPServer(
+        ("127.0.0.1", 0), functools.partial(handler, directory=directory)
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, "http://127.0.0.1:%d/" % server.server_address[1]
+
+
+HEAVY_SCRIPT = """
+var rows = [];
+for (var i = 0; i < 2000; i++) {
+    rows.push("<tr><td>" + i + "</td><td>" + (i * i) + "</td><td>8-bit</td></tr>");
+}
+document.getElementById("table").innerHTML = rows.join("");
+"""
+
+HEAVY_STYLE = "".join(
+    ".c%d { color: #%06x; margin: %dpx; }\n" % (i, i * 2654435 % 0xFFFFFF, i % 7)
+    for i in range(500)
+)
+
+
+def write_fixture_site(directory):
+    # Light pages (a little text) and heavy pages (big DOM, external script
+    # and stylesheet, a script-built table) served by serve_directory
+    for i in range(LIGHT_PAGES):
+        with open(os.path.join(directory, "light%d.html" % i), "w") as page:
+            page.write(
+                "<html><head><title>Light %d</title></head>"
+                "<body><h1>Light %d</h1><p>8-bit</p></body></html>" % (i, i)
+            )
+    with open(os.path.join(directory, "heavy.js"), "w") as script:
+        script.write(HEAVY_SCRIPT)
+    with open(os.path.join(directory, "heavy.css"), "w") as style:
+        style.write(HEAVY_STYLE)
+    for i in range(HEAVY_PAGES):
+        with open(os.path.join(directory, "heavy%d.html" % i), "w") as page:
+            page.write(
+                "<html><head><title>Heavy %d</title>"
+                '<link rel="stylesheet" href="heavy.css"></head><body>' % i
+            )
+            for p in range(1500):
+                page.write(
+                    '<p class="c%d">Heavy %d paragraph %d %s</p>'
+                    % (p % 500, i, p, "8-bit " * 10)
+                )
+            page.write('<table id="table"></table><script src="heavy.js"></script>')
+            page.write("</body></html>")
+
+
+FIXTURE = {}
+
+
+def fixture_url(name):
+    # URL of a page on the fixture site, started on first use and shut down
+    # when the benchmarks exit
+    if not FIXTURE:
+        directory = tempfile.mkdtemp(prefix="orbit-fixture-")
+        write_fixture_site(directory)
+        server, base_url = serve_directory(directory)
+        FIXTURE.update(base_url=base_url)
+        atexit.register(shutil.rmtree, directory, True)
+        atexit.register(server.shutdown)
+    return QUrl(FIXTURE["base_url"] + name)
+
+
+def seed_profile(profile_dir, url):
+    # A session with one tab, so the browser starts on the fixture site
+    # instead of the network home page
+    os.makedirs(profile_dir, exist_ok=True)
+    with open(os.path.join(profile_dir, "session.jsonl"), "w") as journal:
+        snapshot = {
+            "op": "snapshot",
+            "tabs": [{"id": 1, "url": url.toString(), "title": "Fixture"}],
+            "active": 1,
+        }
+        journal.write(json.dumps(snapshot) + "\n")
+
+
+def new_window(profile_dir):
+    seed_profile(profile_dir, fixture_url("light0.html"))
+    window = browser.Browser(profile_dir=profile_dir)
+    window.show()
+    start = time.perf_counter()
+    while (
+        "first_page_loaded" not in window.startup_probe.marks
+        and time.perf_counter() - start < 15
+    ):
+        wait(50)
+    return window
+
+
+def open_tabs_and_wait(window, urls, timeout_ms=60000):
+    # Opens a tab per URL and returns (seconds until all loaded, views)
+    pending = set()
+    loop = QEventLoop()
+
+    def loaded(view):
+        pending.discard(view)
+        if not pending:
+            loop.quit()
+
+    start = time.perf_counter()
+    views = []
+    for url in urls:
+        view = window.add_new_tab(url, "Bench")
+        pending.add(view)
+        view.loadFinished.connect(lambda ok, view=view: loaded(view))
+        views.append(view)
+    QTimer.singleShot(timeout_ms, loop.quit)
+    if pending:
+        loop.exec_()
+    return time.perf_counter() - start, views
+
+
+@benchmark(window=False)
+def cold_start(runs=5):
+    # A fresh process per run: first paint and first page, from the
+    # startup probe, with a new profile each time
+    marks = {}
+    assets = None
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as profile_dir:
+            seed_profile(profile_dir, fixture_url("light0.html"))
+            start = time.perf_counter()
+            child = subprocess.run(
+                [
+                    sys.executable,
+                    os.path.abspath(__file__),
+                    "--cold-start-child",
+                    profile_dir,
+                ],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                universal_newlines=True,
+                timeout=120,
+            )
+            wall = time.perf_counter() - start
+        lines = child.stdout.strip().splitlines()
+        if child.returncode or not lines:
+            return {"error": "child exited with %d" % child.returncode, "passed": False}
+        run = json.loads(lines[-1])
+        run["process_s"] = wall
+        assets = run.pop("assets", assets)
+        for name, value in run.items():
+            marks.setdefault(name, []).append(value)
+    result = {"runs": runs}
+    for name in ("first_paint", "first_page_committed", "first_page_loaded"):
+        if name in marks:
+            result[name + "_ms"] = round(percentile(marks[name], 0.5), 1)
+    result["process_s"] = round(percentile(marks["process_s"], 0.5), 2)
+    if assets is not None:
+        # Every UI asset should come from the bundle, decoded once
+        result["asset_reads"] = assets["reads"]
+        result["asset_decodes"] = assets["decodes"]
+        result["passed"] = not assets["missing"]
+    return result
+
+
+def cold_start_child(profile_dir):
+    # Runs in the process cold_start starts, prints the startup marks
+    app = QApplication(sys.argv[:1])
+    window = browser.Browser(profile_dir=profile_dir)
+    window.startup_probe.finished.connect(
+        lambda marks: (print(json.dumps(marks)), app.quit())
+    )
+    QTimer.singleShot(60000, app.quit)
+    window.show()
+    app.exec_()
+    window.close()
+    return 0
+
+
+@benchmark
+def open_tabs(window, tabs=20):
+    # Time until N heavy pages opened at once have all loaded
+    seconds, views = open_tabs_and_wait(
+        window, [fixture_url("heavy%d.html" % (i % HEAVY_PAGES)) for i in range(tabs)]
+    )
+    return {
+        "tabs": tabs,
+        "all_loaded_s": round(seconds, 2),
+        "per_tab_ms": round(seconds * 1000 / tabs, 1),
+    }
+
+
+# Wall clock time (epoch ms) of the page's first contentful paint
+FIRST_PAINT_JS = """
+(function() {
+    var paint = performance.getEntriesByName("first-contentful-paint")[0];
+    return paint ? performance.timeOrigin + paint.startTime : null;
+})();
+"""
+
+
+@benchmark
+def new_tab_paint(window, tabs=20):
+    # From add_new_tab to the first contentful paint, for the built-in new
+    # tab page and for a small page on the (local) fixture server
+    results = {"tabs": tabs}
+    for name, url in (("newtab", None), ("fixture", fixture_url("light0.html"))):
+        latencies = []
+        for _ in range(tabs):
+            opened = time.time() * 1000
+            view = window.add_new_tab(url)
+            wait_for_load(view)
+            painted = None
+            for _ in range(20):
+                painted = run_js(view.page(), FIRST_PAINT_JS)
+                if painted:
+                    break
+                wait(50)
+            if painted:
+                latencies.append(painted - opened)
+            window.close_tab(window.tab_widget.indexOf(view))
+        if not latencies:
+            results[name] = {"error": "no first paint"}
+            continue
+        results[name] = {
+            "first_paint_p50_ms": round(percentile(latencies, 0.5), 1),
+            "first_paint_p99_ms": round(percentile(latencies, 0.99), 1),
+        }
+    return results
+
+
+@benchmark
+def tab_switch(window, tabs=10, switches=200):
+    # Switching between loaded tabs, until the event loop is idle again
+    open_tabs_and_wait(
+        window, [fixture_url("heavy%d.html" % (i % HEAVY_PAGES)) for i in range(tabs)]
+    )
+    latencies = []
+    app = QApplication.instance()
+    for i in range(switches):
+        start = time.perf_counter()
+        window.tab_widget.setCurrentIndex(i % tabs)
+        app.processEvents()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return {
+        "tabs": tabs,
+        "switch_p50_ms": round(percentile(latencies, 0.5), 2),
+        "switch_p99_ms": round(percentile(latencies, 0.99), 2),
+    }
+
+
+def event_loop_lag(seconds, interval_ms=10):
+    # How late (ms) a repeating timer fires while the event loop runs
+    lags = []
+    last = [time.perf_counter()]
+
+    def tick():
+        now = time.perf_counter()
+        lags.append(max(0.0, (now - last[0]) * 1000 - interval_ms))
+        last[0] = now
+
+    timer = QTimer()
+    timer.setTimerType(Qt.PreciseTimer)
+    timer.setInterval(interval_ms)
+    timer.timeout.connect(tick)
+    timer.start()
+    wait(int(seconds * 1000))
+    timer.stop()
+    return lags
+
+
+@benchmark
+def many_tabs(window, tabs=500, live=20, seconds=5, switches=100):
+    # A restored 500 tab session (placeholders) with some live tabs whose
+    # titles change every few ms: event loop lag and tab switch latency
+    start = time.perf_counter()
+    for i in range(tabs - live):
+        placeholder = TabPlaceholder(
+            window.next_tab_id,
+            fixture_url("light%d.html" % (i % LIGHT_PAGES)),
+            "Tab %d" % i,
+        )
+        window.next_tab_id += 1
+        window.tab_widget.addTab(placeholder, placeholder.title)
+    add_seconds = time.perf_counter() - start
+    seconds_loaded, views = open_tabs_and_wait(
+        window, [fixture_url("light%d.html" % (i % LIGHT_PAGES)) for i in range(live)]
+    )
+
+    title_changes = [0]
+    for view in views:
+        view.titleChanged.connect(
+            lambda title: title_changes.__setitem__(0, title_changes[0] + 1)
+        )
+        view.page().runJavaScript(
+            "setInterval(function() { document.title = 'T' + Math.random(); }, 5);"
+        )
+    stats = dict(window.tab_widget.stats)
+    lags = event_loop_lag(seconds)
+    updates = window.tab_widget.stats["updates"] - stats["updates"]
+
+    latencies = []
+    app = QApplication.instance()
+    for i in range(switches):
+        start = time.perf_counter()
+        window.tab_widget.setCurrentWidget(views[i % live])
+        app.processEvents()
+        latencies.append((time.perf_counter() - start) * 1000)
+    lag_p99 = percentile(lags, 0.99)
+    return {
+        "tabs": window.tab_widget.count(),
+        "add_placeholders_ms": round(add_seconds * 1000, 1),
+        "title_changes": title_changes[0],
+        "tab_updates": updates,
+        "lag_p50_ms": round(percentile(lags, 0.5), 2),
+        "lag_p99_ms": round(lag_p99, 2),
+        "switch_p50_ms": round(percentile(latencies, 0.5), 2),
+        "switch_p99_ms": round(percentile(latencies, 0.99), 2),
+        # Responsive: the loop is never more than a few frames late
+        "passed": lag_p99 < 50,
+    }
+
+
+@benchmark
+def style_overhead(window, runs=50):
+    # Round trip of apply_8bit_style on a loaded heavy page, over a plain
+    # script round trip
+    seconds, views = open_tabs_and_wait(window, [fixture_url("heavy0.html")])
+    view = views[0]
+    plain, styled = [], []
+    for _ in range(runs):
+        start = time.perf_counter()
+        run_js(view.page(), "1")
+        plain.append((time.perf_counter() - start) * 1000)
+        start = time.perf_counter()
+        window.apply_8bit_style(view)
+        run_js(view.page(), "1")
+        styled.append((time.perf_counter() - start) * 1000)
+    return {
+        "plain_p50_ms": round(percentile(plain, 0.5), 2),
+        "styled_p50_ms": round(percentile(styled, 0.5), 2),
+        "overhead_ms": round(percentile(styled, 0.5) - percentile(plain, 0.5), 2),
+    }
+
+
+@benchmark
+def bookmark_add(window, count=300):
+    # What add_bookmark does after its dialog: store the bookmark, refresh
+    # the bar
+    latencies = []
+    for i in range(count):
+        start = time.perf_counter()
+        window.bookmark_store.add("Bench %d" % i, "http://bench.test/%d" % i)
+        window.bookmark_bar.refresh()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return {
+        "bookmarks": count,
+        "add_p50_ms": round(percentile(latencies, 0.5), 2),
+        "add_p99_ms": round(percentile(latencies, 0.99), 2),
+    }
+
+
+@benchmark
+def rss_per_tab(window, tabs=10):
+    # Resident memory (browser + renderers) added per loaded heavy tab
+    lifecycle = window.tab_lifecycle
+    lifecycle.memory_budget_mb = 1 << 20
+    wait(1000)
+    before = lifecycle.resident_memory_mb()
+    open_tabs_and_wait(
+        window, [fixture_url("heavy%d.html" % (i % HEAVY_PAGES)) for i in range(tabs)]
+    )
+    wait(2000)
+    after = lifecycle.resident_memory_mb()
+    return {
+        "tabs": tabs,
+        "resident_before_mb": round(before, 1),
+        "resident_after_mb": round(after, 1),
+        "per_tab_mb": round((after - before) / tabs, 1),
+    }
+
+
+@benchmark
+def tab_memory_budget(window, pages=40, budget_mb=900):
+    # Open N local pages with a tight budget and check resident memory
+    # (browser process + renderers of live tabs) ends up under it
+    lifecycle = window.tab_lifecycle
+    lifecycle.memory_budget_mb = budget_mb
+
+    with tempfile.TemporaryDirectory() as directory:
+        for path in write_pages(directory, pages):
+            window.add_new_tab(QUrl.fromLocalFile(path), os.path.basename(path))
+            wait(100)
+            lifecycle.check()
+        wait(2000)
+        lifecycle.check()
+        # Give discarded renderers time to exit before measuring
+        wait(3000)
+
+        resident = lifecycle.resident_memory_mb()
+        return {
+            "pages": pages,
+            "budget_mb": budget_mb,
+            "resident_mb": round(resident, 1),
+            "browser_process_mb": round(read_rss_mb(os.getpid()), 1),
+            "live_tabs": len(lifecycle.live_views()),
+            "passed": resident <= budget_mb,
+        }
+
+
+# The style injection this browser used before the profile script, kept
+# here so style_injection can compare against it
+OLD_STYLE_JS = """
+(function() {
+    var style = document.createElement('style');
+    style.type = 'text/css';
+    style.innerHTML = `* { font-family: "Press Start 2P", cursive !important; }`;
+    document.head.appendChild(style);
+})();
+"""
+
+# Records when the first frame with the 8-bit font was produced
+STYLE_PROBE = """<script>
+(function() {
+    function check() {
+        if (document.body &&
+            getComputedStyle(document.body).fontFamily.indexOf("Press Start 2P") !== -1) {
+            window.styledAt = performance.now();
+            return;
+        }
+        requestAnimationFrame(check);
+    }
+    requestAnimationFrame(check);
+})();
+</script>"""
+
+
+@benchmark
+def style_injection(window, navigations=20):
+    # First styled paint and DOM growth over repeated navigations,
+    # loadFinished + runJavaScript versus the document creation script
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "styled.html")
+        with open(path, "w") as page:
+            page.write("<html><head>%s<title>Style</title></head><body>" % STYLE_PROBE)
+            page.write("<p>8-bit</p>" * 500)
+            page.write("</body></html>")
+        url = QUrl.fromLocalFile(path)
+
+        results = {}
+        for mode in ("old", "new"):
+            view = window.tab_widget.currentWidget()
+            old_apply = lambda ok: view.page().runJavaScript(OLD_STYLE_JS)
+            if mode == "old":
+                window.retro_theme.uninstall()
+                view.loadFinished.connect(old_apply)
+            else:
+                window.retro_theme.install()
+
+            # Full loads: when did the first styled frame happen
+            styled_at = []
+            for i in range(navigations):
+                reload_url = QUrl(url)
+                reload_url.setQuery("n=%d" % i)
+                view.setUrl(reload_url)
+                wait_for_load(view)
+                wait(300)
+                styled_at.append(run_js(view.page(), "window.styledAt") or -1)
+
+            # Same document navigations: does the DOM keep growing
+            for i in range(navigations):
+                view.page().runJavaScript("location.hash = 'n%d';" % i)
+                wait(100)
+            counts = run_js(
+                view.page(),
+                "[document.querySelectorAll('style').length,"
+                " document.getElementsByTagName('*').length]",
+            )
+
+            if mode == "old":
+                view.loadFinished.disconnect(old_apply)
+            results[mode] = {
+                "first_styled_paint_ms_p50": round(percentile(styled_at, 0.5), 1),
+                "unstyled_loads": sum(1 for t in styled_at if t < 0),
+                "style_nodes": counts[0] if counts else None,
+                "dom_nodes": counts[1] if counts else None,
+            }
+        window.retro_theme.install()
+        return results
+
+
+def cpu_percent(seconds):
+    # CPU used by this process (all threads) while the event loop runs
+    cpu, wall = time.process_time(), time.perf_counter()
+    wait(int(seconds * 1000))
+    return round(
+        100 * (time.process_time() - cpu) / (time.perf_counter() - wall), 1
+    )
+
+
+@benchmark(window=False)
+def audio_cpu(seconds=10):
+    # The old always-playing QMediaPlayer versus BackgroundAudio, playing
+    # and muted
+    music_url = QUrl.fromLocalFile(
+        os.path.join(os.path.dirname(os.path.abspath(browser.__file__)), "bgm", "ok.mp3")
+    )
+    results = {}
+
+    playlist = QMediaPlaylist()
+    playlist.addMedia(QMediaContent(music_url))
+    playlist.setPlaybackMode(QMediaPlaylist.Loop)
+    player = QMediaPlayer()
+    player.setPlaylist(playlist)
+    player.play()
+    wait(1000)
+    results["old_playing_cpu_pct"] = cpu_percent(seconds)
+    player.setMuted(True)
+    results["old_muted_cpu_pct"] = cpu_percent(seconds)
+    player.stop()
+    player.deleteLater()
+
+    start = time.perf_counter()
+    audio = BackgroundAudio(music_url.toLocalFile())
+    while audio.device is None and time.perf_counter() - start < 60:
+        wait(50)
+    if audio.device is None:
+        results["error"] = "could not decode background music"
+        return results
+    results["new_decode_s"] = round(time.perf_counter() - start, 2)
+    results["new_pcm_kb"] = len(audio.device.pcm) // 1024
+    results["new_playing_cpu_pct"] = cpu_percent(seconds)
+    audio.set_muted(True)
+    results["new_muted_cpu_pct"] = cpu_percent(seconds)
+    audio.deleteLater()
+    return results
+
+
+HISTORY_WORDS = (
+    "news wiki github python rust video shop mail docs blog forum cat music "
+    "game retro pixel search maps weather sports"
+).split()
+
+
+@benchmark(window=False)
+def history_suggest(rows=1000000, queries=2000):
+    # Synthetic history in SQLite, then URL bar suggestion latency
+    rng = random.Random(8)
+    now = time.time()
+    with tempfile.TemporaryDirectory() as directory:
+        store = HistoryStore(os.path.join(directory, "history.sqlite"))
+        with store.db:
+            store.db.executemany(
+                "INSERT INTO urls (url, title, visit_count, last_visit)"
+                " VALUES (?, ?, ?, ?)",
+                (
+                    (
+                        "https://www.%s%d.com/%s/%d"
+                        % (site, i % 5000, section, i),
+                        "%s %s %d" % (site.title(), section, i),
+                        rng.randint(1, 50),
+                        now - rng.random() * 200 * 86400,
+                    )
+                    for i, (site, section) in (
+                        (i, rng.sample(HISTORY_WORDS, 2)) for i in range(rows)
+                    )
+                ),
+            )
+
+        start = time.perf_counter()
+        index = SuggestionIndex(store.rows())
+        build_seconds = time.perf_counter() - start
+        store.close()
+
+    latencies = []
+    for _ in range(queries):
+        text = rng.choice(HISTORY_WORDS)[: rng.randint(1, 6)]
+        if rng.random() < 0.5:
+            text += " " + rng.choice(HISTORY_WORDS)[: rng.randint(1, 4)]
+        start = time.perf_counter()
+        index.suggest(text)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    return {
+        "rows": rows,
+        "index_build_s": round(build_seconds, 2),
+        "p50_ms": round(percentile(latencies, 0.50), 3),
+        "p99_ms": round(percentile(latencies, 0.99), 3),
+    }
+
+
+def synthetic_image(rng, width, height, image_format):
+    # Overlapping soft blobs: smooth like a photo, and different every time
+    image = QImage(
+        width,
+        height,
+        QImage.Format_ARGB32 if image_format == "PNG" else QImage.Format_RGB32,
+    )
+    image.fill(Qt.transparent if image_format == "PNG" else Qt.white)
+    painter = QPainter(image)
+    for _ in range(12):
+        center = QPointF(rng.random() * width, rng.random() * height)
+        gradient = QRadialGradient(center, max(width, height) * rng.uniform(0.1, 0.6))
+        gradient.setColorAt(0, QColor(*(rng.randrange(256) for _ in range(3))))
+        gradient.setColorAt(1, QColor(0, 0, 0, 0))
+        painter.fillRect(image.rect(), gradient)
+    painter.end()
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.WriteOnly)
+    image.save(buffer, image_format, 85)
+    return bytes(data)
+
+
+@benchmark(window=False)
+def retro_transcode(per_kind=10):
+    # retro.transcode on one thread: photos, a transparent PNG and icons
+    rng = random.Random(21)
+    kinds = {
+        "photo_large": (1600, 1200, "JPEG"),
+        "photo": (800, 600, "JPEG"),
+        "transparent_png": (300, 300, "PNG"),
+        "icon": (48, 48, "PNG"),
+    }
+    results = {}
+    total_in = total_out = total_seconds = 0
+    for kind, (width, height, image_format) in kinds.items():
+        images = [
+            synthetic_image(rng, width, height, image_format) for _ in range(per_kind)
+        ]
+        latencies = []
+        bytes_out = 0
+        for data in images:
+            start = time.perf_counter()
+            bytes_out += len(transcode(data))
+            latencies.append((time.perf_counter() - start) * 1000)
+        bytes_in = sum(len(data) for data in images)
+        results[kind] = {
+            "p50_ms": round(percentile(latencies, 0.5), 2),
+            "in_kb": round(bytes_in / 1024, 1),
+            "out_kb": round(bytes_out / 1024, 1),
+        }
+        total_in += bytes_in
+        total_out += bytes_out
+        total_seconds += sum(latencies) / 1000
+    results["images_per_second"] = round(len(kinds) * per_kind / total_seconds, 1)
+    results["bytes_saved_pct"] = round(100 * (total_in - total_out) / total_in, 1)
+    return results
+
+
+def write_filter_list(path, rules, rng):
+    # Roughly the mix of EasyList: mostly host rules, then path patterns,
+    # some with options, a few exceptions and element hiding rules
+    with open(path, "w") as filters:
+        filters.write("[Adblock Plus 2.0]\n! Title: synthetic\n")
+        for i in range(rules):
+            kind = rng.random()
+            word = rng.choice(HISTORY_WORDS)
+            if kind < 0.55:
+                filters.write("||ads%d.com^\n" % i)
+            elif kind < 0.65:
+                filters.write("||track%d.net^$third-party\n" % i)
+            elif kind < 0.85:
+                filters.write("/%s/banner%d_*\n" % (word, i % 1000))
+            elif kind < 0.9:
+                filters.write("||cdn%d.com/ads/*$script,domain=%s.com\n" % (i, word))
+            elif kind < 0.93:
+                filters.write("&ad%s%d=\n" % (word, i))
+            elif kind < 0.95:
+                filters.write("@@||ads%d.com/allowed^\n" % (i - 1))
+            else:
+                filters.write("%s%d.com##.ad-box\n" % (word, i))
+
+
+@benchmark(window=False)
+def filter_match(rules=100000, requests=20000):
+    # Compile, cache reload and per-request match time of the content blocker
+    rng = random.Random(9)
+    with tempfile.TemporaryDirectory() as directory:
+        write_filter_list(os.path.join(directory, "easylist.txt"), rules, rng)
+        cache_path = os.path.join(directory, "filters.cache")
+
+        start = time.perf_counter()
+        load_filters(directory, cache_path)
+        compile_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        engine = load_filters(directory, cache_path)
+        cache_seconds = time.perf_counter() - start
+
+    urls = []
+    for _ in range(requests):
+        word = rng.choice(HISTORY_WORDS)
+        n = rng.randrange(rules)
+        kind = rng.random()
+        if kind < 0.1:
+            host = "ads%d.com" % n
+        elif kind < 0.2:
+            host = "track%d.net" % n
+        else:
+            host = "static.%s%d.org" % (word, n % 500)
+        path = "/%s/%s%d_%d.png?id=%d" % (
+            word, rng.choice(("banner", "img", "asset")), n % 1000, rng.randrange(9), n
+        )
+        urls.append(("https://%s%s" % (host, path), host))
+
+    # Rule patterns are compiled on first use, so the first pass is cold
+    results = {
+        "rules": engine.rule_count,
+        "compile_s": round(compile_seconds, 2),
+        "cache_load_s": round(cache_seconds, 2),
+    }
+    for run in ("cold", "warm"):
+        latencies = []
+        blocked = 0
+        for url, host in urls:
+            start = time.perf_counter()
+            blocked += engine.match(
+                url, host, "news.example.com", RESOURCE_TYPES["image"]
+            )
+            latencies.append((time.perf_counter() - start) * 1000000)
+        results[run] = {
+            "p50_us": round(percentile(latencies, 0.50), 1),
+            "p99_us": round(percentile(latencies, 0.99), 1),
+            "mean_us": round(sum(latencies) / len(latencies), 1),
+        }
+    results["blocked_pct"] = round(100 * blocked / requests, 1)
+    return results
+
+
+def wait_for_download(download, timeout_s=120):
+    # Seconds until the download is over (or the timeout)
+    start = time.perf_counter()
+    while (
+        download.state not in ("done", "failed", "paused")
+        and time.perf_counter() - start < timeout_s
+    ):
+        wait(10)
+    return time.perf_counter() - start
+
+
+@benchmark(window=False)
+def download_throughput(size_mb=64, segments=4, cap_mb=16):
+    # Downloads from a local range-capable server: one stream, segmented
+    # range requests, a throttled transfer and one paused halfway and
+    # resumed by a new manager (as after a restart). Every file has to
+    # match the served one's SHA-256.
+    with tempfile.TemporaryDirectory() as directory:
+        site = os.path.join(directory, "site")
+        os.makedirs(site)
+        data = os.urandom(size_mb * 1024 * 1024)
+        with open(os.path.join(site, "big.bin"), "wb") as big:
+            big.write(data)
+        expected = hashlib.sha256(data).hexdigest()
+        del data
+        server, base = serve_directory(site, RangeHandler)
+        url = QUrl(base + "big.bin")
+        state_path = os.path.join(directory, "downloads.json")
+        results = {"size_mb": size_mb, "segments": segments}
+        ok = True
+
+        manager = DownloadManager(state_path, segmented_min_mb=size_mb * 2)
+        download = manager.add(url, os.path.join(directory, "single.bin"), expected)
+        seconds = wait_for_download(download)
+        ok = ok and download.state == "done"
+        results["single_mb_per_second"] = round(size_mb / seconds, 1)
+
+        manager.segmented_min, manager.segment_count = 0, segments
+        download = manager.add(url, os.path.join(directory, "segmented.bin"), expected)
+        seconds = wait_for_download(download)
+        ok = ok and download.state == "done" and len(download.segments) == segments
+        results["segmented_mb_per_second"] = round(size_mb / seconds, 1)
+
+        manager.segmented_min = size_mb * 1024 * 1024 * 2
+        download = manager.add(
+            url, os.path.join(directory, "throttled.bin"), expected, cap_mb * 1024
+        )
+        seconds = wait_for_download(download)
+        ok = ok and download.state == "done"
+        results["cap_rate_mbps"] = cap_mb
+        results["throttled_rate_mbps"] = round(size_mb / seconds, 1)
+        throttled_ok = size_mb / seconds <= cap_mb * 1.1
+
+        manager.segmented_min = 0
+        download = manager.add(url, os.path.join(directory, "resumed.bin"), expected)
+        start = time.perf_counter()
+        while download.received() < size_mb * 1024 * 1024 // 2:
+            wait(1)
+            if time.perf_counter() - start > 60:
+                break
+        manager.pause(download)
+        paused_at = download.received()
+        manager.stop()
+        manager = DownloadManager(state_path)
+        download = [d for d in manager.downloads if d.path.endswith("resumed.bin")][0]
+        manager.resume(download)
+        wait_for_download(download)
+        manager.stop()
+        resumed_ok = download.state == "done" and paused_at < size_mb * 1024 * 1024
+        server.shutdown()
+
+    results["checksums_ok"] = ok
+    results["throttle_ok"] = throttled_ok
+    results["resume_ok"] = resumed_ok
+    results["passed"] = ok and throttled_ok and resumed_ok
+    return results
+
+
+@benchmark(window=False)
+def headless_throughput(pages=40, jobs=4):
+    # headless.py against a local server: pages/second per output format
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_pages(directory, pages, paragraphs=50)
+        server, base_url = serve_directory(directory)
+        urls = [base_url + os.path.basename(path) for path in paths]
+        for output_format in ("png", "pdf", "text"):
+            lines = io.StringIO()
+            renderer = BatchRenderer(
+                urls,
+                output_format=output_format,
+                out_dir=os.path.join(directory, output_format),
+                jobs=jobs,
+                results=lines,
+            )
+            loop = QEventLoop()
+            renderer.done.connect(loop.quit)
+            renderer.start()
+            loop.exec_()
+            rendered = [json.loads(line) for line in lines.getvalue().splitlines()]
+            results[output_format] = dict(
+                renderer.summary,
+                ok=sum(1 for result in rendered if result["ok"]),
+            )
+            renderer.deleteLater()
+        server.shutdown()
+    results["passed"] = all(
+        results[output_format]["ok"] == pages for output_format in ("png", "pdf", "text")
+    )
+    return results
+
+
+def run(names):
+    results = {}
+    for name in names:
+        window = None
+        profile_dir = None
+        if name not in HEADLESS:
+            # Every window benchmark gets a fresh profile
+            profile_dir = tempfile.mkdtemp(prefix="orbit-bench-")
+            window = new_window(profile_dir)
+
+        start = time.perf_counter()
+        result = BENCHMARKS[name](window) if window else BENCHMARKS[name]()
+        result["seconds"] = round(time.perf_counter() - start, 3)
+        print(name, result)
+        results[name] = result
+
+        if window:
+            window.close()
+            window.deleteLater()
+            wait(200)
+            shutil.rmtree(profile_dir, ignore_errors=True)
+    return results
+
+
+def metadata():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            universal_newlines=True,
+        ).stdout.strip()
+    except OSError:
+        commit = ""
+    return {
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "qt": QT_VERSION_STR,
+        "pyqt": PYQT_VERSION_STR,
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def flatten(results, prefix=""):
+    # {"a": {"b": 1}} -> {"a.b": 1}, numbers only
+    flat = {}
+    for key, value in results.items():
+        if isinstance(value, dict):
+            flat.update(flatten(value, prefix + key + "."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[prefix + key] = value
+    return flat
+
+
+def compare(baseline, results, threshold=REGRESSION_THRESHOLD):
+    # [(metric, baseline, current, relative change, regressed)] for the
+    # metrics both runs have
+    old, new = flatten(baseline), flatten(results)
+    rows = []
+    for metric in sorted(set(old) & set(new)):
+        if not metric.endswith(METRIC_SUFFIXES) or metric.endswith(".seconds"):
+            continue
+        if old[metric] == 0:
+            continue
+        change = (new[metric] - old[metric]) / abs(old[metric])
+        if metric.endswith(HIGHER_IS_BETTER):
+            change = -change
+        rows.append((metric, old[metric], new[metric], change, change > threshold))
+    return rows
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="OR-BIT benchmarks")
+    parser.add_argument("names", nargs="*", help="benchmarks to run (default all)")
+    parser.add_argument("--list", action="store_true", help="list benchmarks")
+    parser.add_argument("--json", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=REGRESSION_THRESHOLD,
+        help="relative change that counts as a regression (default 0.15)",
+    )
+    parser.add_argument("--cold-start-child", metavar="PROFILE", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.cold_start_child:
+        return cold_start_child(args.cold_start_child)
+    if args.list:
+        for name in sorted(BENCHMARKS):
+            print(name, "(no window)" if name in HEADLESS else "")
+        return 0
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error("unknown benchmark: %s" % ", ".join(unknown))
+
+    app = QApplication(sys.argv[:1])
+    results = run(args.names or sorted(BENCHMARKS))
+    app.quit()
+    failed = [name for name, result in results.items() if result.get("passed") is False]
+
+    if args.json:
+        with open(args.json, "w") as out:
+            json.dump({"meta": metadata(), "results": results}, out, indent=2)
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        for metric, old, new, change, regressed in compare(
+            baseline["results"], results, args.threshold
+        ):
+            print(
+                "%-50s %12s %12s %+7.1f%%%s"
+                % (metric, old, new, change * 100, "  REGRESSION" if regressed else "")
+            )
+            if regressed:
+                regressions.append(metric)
+        print(
+            "%d regressions against %s (%s)"
+            % (len(regressions), args.baseline, baseline["meta"].get("commit", "?"))
+        )
+
+    if failed:
+        print("failed:", ", ".join(failed))
+    return 1 if failed or regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,463 @@
+import json
+import os
+import sqlite3
+import sys
+import time
+from html.parser import HTMLParser
+from urllib.parse import urlsplit
+
+from PyQt5.QtCore import QEvent, QObject, QUrl, Qt, pyqtSignal
+from PyQt5.QtWidgets import QHBoxLayout, QMenu, QPushButton, QWidget
+
+ROOT = 0
+FOLDER = 0
+BOOKMARK = 1
+
+# Rows inserted per executemany() call while importing
+IMPORT_BATCH = 1000
+# Entries shown in the overflow menu (and folder menus) before "... more"
+MENU_LIMIT = 300
+
+BOOKMARK_BUTTON_STYLE = """
+    QPushButton {
+        background-color: white;
+        color: red;
+        border: 2px solid #0f0;
+        font-family: "Press Start 2P";
+        padding: 0px 4px;
+    }
+    QPushButton:hover {
+        background-color: #111;
+    }
+"""
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    parent_id INTEGER NOT NULL,
+    kind INTEGER NOT NULL,
+    title TEXT NOT NULL COLLATE NOCASE,
+    url TEXT,
+    host TEXT COLLATE NOCASE,
+    position INTEGER NOT NULL,
+    added REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS items_parent ON items (parent_id, position);
+CREATE INDEX IF NOT EXISTS items_title ON items (title);
+CREATE INDEX IF NOT EXISTS items_host ON items (host);
+"""
+
+
+def url_host(url):
+    host = urlsplit(url).hostname or ""
+    return host[4:] if host.startswith("www.") else host
+
+
+def prefix_range(prefix):
+    # Bounds for an index range scan matching everything starting with prefix
+    return prefix, prefix + "\U0010ffff"
+
+
+class BookmarkStore:
+    # SQLite backed bookmarks and folders. Each thread needs its own store,
+    # sqlite3 connections can't be shared between threads.
+    def __init__(self, path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def next_position(self, parent_id):
+        row = self.db.execute(
+            "SELECT MAX(position) FROM items WHERE parent_id = ?", (parent_id,)
+        ).fetchone()
+        return 0 if row[0] is None else row[0] + 1
+
+    def add(self, title, url, parent_id=ROOT):
+        with self.db:
+            cursor = self.db.execute(
+                "INSERT INTO items (parent_id, kind, title, url, host, position, added)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    parent_id,
+                    BOOKMARK,
+                    title,
+                    url,
+                    url_host(url),
+                    self.next_position(parent_id),
+                    time.time(),
+                ),
+            )
+        return cursor.lastrowid
+
+    def add_folder(self, title, parent_id=ROOT):
+        with self.db:
+            cursor = self.db.execute(
+                "INSERT INTO items (parent_id, kind, title, position, added)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (parent_id, FOLDER, title, self.next_position(parent_id), time.time()),
+            )
+        return cursor.lastrowid
+
+    def delete(self, item_id):
+        # Deleting a folder deletes everything below it
+        with self.db:
+            self.db.execute(
+                """
+                WITH RECURSIVE doomed(id) AS (
+                    SELECT ?
+                    UNION ALL
+                    SELECT items.id FROM items JOIN doomed ON items.parent_id = doomed.id
+                )
+                DELETE FROM items WHERE id IN doomed
+                """,
+                (item_id,),
+            )
+
+    def children(self, parent_id=ROOT, offset=0, limit=-1):
+        # (id, kind, title, url) rows of a folder in bar order
+        return self.db.execute(
+            "SELECT id, kind, title, url FROM items WHERE parent_id = ?"
+            " ORDER BY position, id LIMIT ? OFFSET ?",
+            (parent_id, limit, offset),
+        ).fetchall()
+
+    def count(self, parent_id=ROOT):
+        return self.db.execute(
+            "SELECT COUNT(*) FROM items WHERE parent_id = ?", (parent_id,)
+        ).fetchone()[0]
+
+    def search(self, text, limit=20):
+        # Prefix match on title or host, both answered from an index
+        low, high = prefix_range(text.strip())
+        if not low:
+            return []
+        results = {}
+        for column in ("title", "host"):
+            rows = self.db.execute(
+                "SELECT id, title, url FROM items WHERE kind = ? AND %s >= ? AND %s < ?"
+                " LIMIT ?" % (column, column),
+                (BOOKMARK, low, high, limit),
+            )
+            for row in rows:
+                results.setdefault(row[0], row)
+        return list(results.values())[:limit]
+
+    def import_file(self, path, folder_title="Imported", progress=None):
+        # Streams a Netscape HTML or Chrome JSON export into a new folder,
+        # returns the number of bookmarks imported. A file that can't be read
+        # or parsed raises and leaves the bookmarks as they were.
+        importer = BookmarkImporter(self, self.add_folder(folder_title))
+        try:
+            with self.db:
+                if path.lower().endswith(".json"):
+                    importer.import_chrome_json(path)
+                else:
+                    importer.import_netscape_html(path, progress)
+                importer.flush()
+        except Exception:
+            self.delete(importer.root_id)
+            raise
+        return importer.imported
+
+
+class BookmarkImporter:
+    # Collects bookmarks from an export and inserts them in batches inside
+    # the caller's transaction
+    def __init__(self, store, root_id):
+        self.store = store
+        self.root_id = root_id
+        self.positions = {}
+        self.pending = []
+        self.imported = 0
+        self.now = time.time()
+
+    def position(self, parent_id):
+        position = self.positions.get(parent_id, 0)
+        self.positions[parent_id] = position + 1
+        return position
+
+    def folder(self, title, parent_id):
+        # Folder ids are needed right away for their children
+        cursor = self.store.db.execute(
+            "INSERT INTO items (parent_id, kind, title, position, added)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (parent_id, FOLDER, title or "Untitled", self.position(parent_id), self.now),
+        )
+        return cursor.lastrowid
+
+    def bookmark(self, title, url, parent_id):
+        if not url:
+            return
+        self.pending.append(
+            (
+                parent_id,
+                BOOKMARK,
+                title or url,
+                url,
+                url_host(url),
+                self.position(parent_id),
+                self.now,
+            )
+        )
+        if len(self.pending) >= IMPORT_BATCH:
+            self.flush()
+
+    def flush(self):
+        self.store.db.executemany(
+            "INSERT INTO items (parent_id, kind, title, url, host, position, added)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            self.pending,
+        )
+        self.imported += len(self.pending)
+        self.pending = []
+
+    def import_netscape_html(self, path, progress=None):
+        parser = NetscapeParser(self)
+        with open(path, encoding="utf-8", errors="replace") as export:
+            while True:
+                chunk = export.read(64 * 1024)
+                if not chunk:
+                    break
+                parser.feed(chunk)
+                if progress:
+                    progress(self.imported + len(self.pending))
+        parser.close()
+
+    def import_chrome_json(self, path):
+        # The standard library has no incremental JSON parser; the document
+        # is parsed in one go but still inserted in batches
+        with open(path, encoding="utf-8") as export:
+            document = json.load(export)
+        if not isinstance(document, dict) or not isinstance(
+            document.get("roots", {}), dict
+        ):
+            raise ValueError("not a Chrome bookmarks file")
+        roots = document.get("roots", {})
+        stack = [
+            (node, self.root_id) for node in roots.values() if isinstance(node, dict)
+        ]
+        stack.reverse()
+        while stack:
+            node, parent_id = stack.pop()
+            if node.get("type") == "url":
+                self.bookmark(node.get("name"), node.get("url"), parent_id)
+            elif "children" in node:
+                folder_id = self.folder(node.get("name"), parent_id)
+                for child in reversed(node["children"]):
+                    stack.append((child, folder_id))
+
+
+class NetscapeParser(HTMLParser):
+    # <DT><H3>Folder</H3><DL> ... </DL> nests, <DT><A HREF=...>Title</A> adds
+    def __init__(self, importer):
+        super().__init__()
+        self.importer = importer
+        self.folders = [importer.root_id]
+        self.next_folder = None
+        self.text = None
+        self.href = None
+        self.seen_root_list = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "dl":
+            if self.next_folder is not None:
+                self.folders.append(self.next_folder)
+                self.next_folder = None
+            elif self.seen_root_list:
+                self.folders.append(self.folders[-1])
+            self.seen_root_list = True
+        elif tag in ("h3", "a"):
+            self.text = []
+            self.href = dict(attrs).get("href") if tag == "a" else None
+
+    def handle_endtag(self, tag):
+        if tag == "dl":
+            if len(self.folders) > 1:
+                self.folders.pop()
+        elif tag == "h3" and self.text is not None:
+            self.next_folder = self.importer.folder(
+                "".join(self.text).strip(), self.folders[-1]
+            )
+            self.text = None
+        elif tag == "a" and self.text is not None:
+            self.importer.bookmark(
+                "".join(self.text).strip(), self.href, self.folders[-1]
+            )
+            self.text = None
+
+    def handle_data(self, data):
+        if self.text is not None:
+            self.text.append(data)
+
+
+class BookmarkBar(QWidget):
+    # Shows as many bookmarks as fit; the rest go into a "»" menu that is only
+    # filled when opened. Widgets exist for the visible bookmarks only.
+    open_url = pyqtSignal(QUrl)
+    import_requested = pyqtSignal()
+    # The pointer is on a bookmark, or has left it
+    hovered = pyqtSignal(QUrl)
+    unhovered = pyqtSignal()
+
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.buttons = []
+        self.visible_count = 0
+
+        self.bar_layout = QHBoxLayout(self)
+        self.bar_layout.setContentsMargins(5, 0, 5, 0)
+        self.bar_layout.setSpacing(5)
+        self.bar_layout.addStretch()
+
+        self.overflow_btn = QPushButton("»")
+        self.overflow_btn.setFixedWidth(30)
+        self.overflow_menu = QMenu(self)
+        self.overflow_menu.aboutToShow.connect(self.fill_overflow_menu)
+        self.overflow_menu.aboutToHide.connect(self.unhovered.emit)
+        self.overflow_btn.setMenu(self.overflow_menu)
+        self.bar_layout.addWidget(self.overflow_btn)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.refresh()
+
+    def button_width(self, title):
+        return self.fontMetrics().horizontalAdvance(title) + 16
+
+    def refresh(self):
+        for button in self.buttons:
+            button.setParent(None)
+            button.deleteLater()
+        self.buttons = []
+
+        # Pull bookmarks a page at a time until the bar is full
+        available = self.width() - self.overflow_btn.width() - 20
+        spacing = self.bar_layout.spacing()
+        used = 0
+        offset = 0
+        full = False
+        while not full:
+            rows = self.store.children(ROOT, offset, 50)
+            if not rows:
+                break
+            for item_id, kind, title, url in rows:
+                width = self.button_width(title)
+                if used + width > available:
+                    full = True
+                    break
+                used += width + spacing
+                offset += 1
+                self.bar_layout.insertWidget(
+                    len(self.buttons), self.make_button(item_id, kind, title, url)
+                )
+        self.visible_count = offset
+
+    def make_button(self, item_id, kind, title, url):
+        button = QPushButton(title)
+        button.setStyleSheet(BOOKMARK_BUTTON_STYLE)
+        button.setFixedWidth(self.button_width(title))
+        if kind == FOLDER:
+            menu = QMenu(button)
+            menu.aboutToShow.connect(
+                lambda menu=menu, item_id=item_id: self.fill_menu(menu, item_id)
+            )
+            menu.aboutToHide.connect(self.unhovered.emit)
+            button.setMenu(menu)
+        else:
+            button.clicked.connect(lambda: self.open_url.emit(QUrl(url)))
+            button.bookmark_url = QUrl(url)
+            button.installEventFilter(self)
+
+        # Context menu for deleting bookmarks
+        button.setContextMenuPolicy(Qt.CustomContextMenu)
+        button.customContextMenuRequested.connect(
+            lambda pos, btn=button, item_id=item_id: self.show_bookmark_menu(
+                pos, btn, item_id
+            )
+        )
+        self.buttons.append(button)
+        return button
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Enter:
+            self.hovered.emit(watched.bookmark_url)
+        elif event.type() == QEvent.Leave:
+            self.unhovered.emit()
+        return False
+
+    def fill_overflow_menu(self):
+        self.fill_menu(self.overflow_menu, ROOT, self.visible_count)
+        self.overflow_menu.addSeparator()
+        self.overflow_menu.addAction("Import Bookmarks...").triggered.connect(
+            self.import_requested.emit
+        )
+
+    def fill_menu(self, menu, parent_id, offset=0):
+        menu.clear()
+        for item_id, kind, title, url in self.store.children(
+            parent_id, offset, MENU_LIMIT
+        ):
+            if kind == FOLDER:
+                submenu = menu.addMenu(title)
+                submenu.aboutToShow.connect(
+                    lambda submenu=submenu, item_id=item_id: self.fill_menu(
+                        submenu, item_id
+                    )
+                )
+                submenu.aboutToHide.connect(self.unhovered.emit)
+            else:
+                action = menu.addAction(title)
+                action.triggered.connect(
+                    lambda checked, url=url: self.open_url.emit(QUrl(url))
+                )
+                action.hovered.connect(lambda url=url: self.hovered.emit(QUrl(url)))
+        remaining = self.store.count(parent_id) - offset - MENU_LIMIT
+        if remaining > 0:
+            menu.addAction("... %d more" % remaining).setEnabled(False)
+
+    def show_bookmark_menu(self, pos, bookmark_btn, item_id):
+        menu = QMenu(self)
+        delete_action = menu.addAction("Delete Bookmark")
+
+        action = menu.exec_(bookmark_btn.mapToGlobal(pos))
+
+        if action == delete_action:
+            self.store.delete(item_id)
+            self.refresh()
+
+
+class BookmarkImportWorker(QObject):
+    # Runs an import on its own thread and connection. finished is always
+    # emitted, with -1 and the reason when the import failed.
+    finished = pyqtSignal(int, str)
+
+    def __init__(self, db_path, export_path):
+        super().__init__()
+        self.db_path = db_path
+        self.export_path = export_path
+
+    def run(self):
+        imported, error = -1, ""
+        try:
+            store = BookmarkStore(self.db_path)
+            try:
+                imported = store.import_file(self.export_path)
+            finally:
+                store.close()
+        except (OSError, ValueError, sqlite3.Error) as e:
+            error = str(e) or e.__class__.__name__
+        self.finished.emit(imported, error)
+
+
+if __name__ == "__main__":
+    # python bookmarks.py profile/bookmarks.sqlite export.html
+    store = BookmarkStore(sys.argv[1])
+    start = time.perf_counter()
+    count = store.import_file(sys.argv[2])
+    print("Imported %d bookmarks in %.2fs" % (count, time.perf_counter() - start))
@@ -12,35 +12,139 @@ from PyQt5.QtWidgets import (
     QMessageBox,
     QDockWidget,
     QInputDialog,
-    QTabWidget,
     QMenu,
+    QFileDialog,
+    QShortcut,
 )
 from PyQt5.QtWebEngineWidgets import QWebEngineView, QWebEnginePage
-from PyQt5.QtGui import QIcon, QFont
-from PyQt5.QtCore import QUrl, QSize, Qt, QPoint
+from PyQt5.QtGui import QIcon, QFont, QKeySequence
+from PyQt5.QtCore import QUrl, QSize, Qt, QPoint, QThread, QTimer, QEvent
 from PyQt5.QtGui import QFontDatabase
-from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
 from PyQt5.QtCore import QUrl
 from PyQt5.QtWidgets import QSlider
-from PyQt5.QtMultimedia import QMediaPlaylist
 from PyQt5.QtWebEngineWidgets import QWebEngineSettings
 from PyQt5.QtWebEngineWidgets import QWebEngineProfile
 
+from adblock import ContentBlocker, TabRequestInterceptor
+from assets import cache as asset_cache
+from audio import BackgroundAudio
+from bookmarks import BookmarkBar, BookmarkImportWorker, BookmarkStore
+from downloads import DownloadManager, DownloadsPanel
+from history import HistoryCompleter
+from imagecache import (
+    FAVICON_SIZE,
+    THUMBNAIL_DELAY_MS,
+    THUMBNAIL_SIZE,
+    ImageCache,
+    favicon_key,
+    thumbnail_key,
+)
+from monitor import ProcessMonitor, TaskManager
+from navigation import HttpsFirst
+from newtab import NEW_TAB_URL, new_tab_page
+from retro import RetroImages
+from schemes import OrbitSchemeHandler, query_url, register_schemes
+from session import SessionJournal, load_session, restore_history, save_history
+from sitesettings import POLICIES, POLICY_LABELS, SitePage, SiteSettings, covers
+from speculation import Speculator
+from storage import StorageManager, migrate
+from tabs import (
+    CrashTracker,
+    SadTab,
+    TabLifecycleManager,
+    TabPlaceholder,
+    TabWidget,
+    VerticalTabList,
+)
+from telemetry import LoadTimer, PerfLog, StartupProbe, TimingHud
+from theme import FONT_ASSET, RetroTheme, serve_font
+
+
+# In fast start mode, dev tools, audio and history are built this long
+# after the first page has started loading (or on first use)
+DEFERRED_INIT_DELAY_MS = 2000
+# Give every tab its own inspector (keeps its state across tab switches)
+# instead of moving one shared inspector to whichever tab is current
+INSPECTOR_PER_TAB = False
+# Show the tabs as a vertical list instead of the tab bar (Ctrl+Shift+L)
+VERTICAL_TABS = False
+# Where the home button goes, and the first tab of a new profile
+HOME_URL = NEW_TAB_URL
+# Show page images scaled down and dithered to a retro palette on sites
+# without a rule of their own (Ctrl+Shift+9, retro.py)
+RETRO_IMAGES = False
+# UI icons are scaled to these sizes once, when they are first shown
+# (NAV_ICON_SIZE is the default icon size of a QPushButton)
+NAV_ICON_SIZE = QSize(16, 16)
+LOGO_SIZE = QSize(60, 60)
+WINDOW_ICON_SIZE = QSize(64, 64)
+
+WEB_ENGINE_ATTRIBUTES = (
+    (QWebEngineSettings.AutoLoadImages, True),
+    (QWebEngineSettings.JavascriptEnabled, True),
+    (QWebEngineSettings.LocalStorageEnabled, True),
+    (QWebEngineSettings.WebRTCPublicInterfacesOnly, False),
+)
+
+
+def apply_web_engine_settings(settings):
+    # Shared by the browser window and headless.py
+    for attribute, enabled in WEB_ENGINE_ATTRIBUTES:
+        settings.setAttribute(attribute, enabled)
+
+
+# orbit:// has to be registered before the QApplication is created, which
+# every user of this module (bench.py, headless.py) does after importing it
+register_schemes()
+
 
 class Browser(QMainWindow):
-    def __init__(self):
+    def __init__(
+        self,
+        fast_start=True,
+        inspector_per_tab=INSPECTOR_PER_TAB,
+        profile_dir=None,
+        vertical_tabs=VERTICAL_TABS,
+        home_url=HOME_URL,
+    ):
         super().__init__()
+        self.fast_start = fast_start
+        self.inspector_per_tab = inspector_per_tab
+        self.home_url = home_url
+        self.startup_probe = StartupProbe(self, asset_stats=asset_cache.stats)
+        self.journal = None
 
         # Get the absolute path of the script directory
         self.script_dir = os.path.dirname(os.path.abspath(__file__))
+        # Per-user state (session journal, ...) lives here
+        self.default_profile = profile_dir is None
+        self.profile_dir = profile_dir or os.path.join(self.script_dir, "profile")
+        # The UI font ships with the browser, it doesn't have to be installed
+        self.load_custom_font()
 
         # Remove default window decorations (including title bar)
         self.setWindowFlags(Qt.FramelessWindowHint)
         self.set_web_engine_settings()
 
+        # The 8-bit page style is a profile script, registered once
+        self.retro_theme = RetroTheme(
+            QWebEngineProfile.defaultProfile(), self.site_settings.rules_for("style")
+        )
+        QShortcut(
+            QKeySequence("Ctrl+Shift+8"),
+            self,
+            lambda: self.toggle_site_policy("style"),
+        )
+        QShortcut(
+            QKeySequence("Ctrl+Shift+9"),
+            self,
+            lambda: self.toggle_site_policy("retro_images"),
+        )
+        QShortcut(QKeySequence("Ctrl+Shift+S"), self, self.show_site_menu)
+
         # Set up the main window properties
         self.setWindowTitle("OR-BIT")
-        self.setWindowIcon(QIcon(os.path.join(self.script_dir, "images", "logo.png")))
+        self.setWindowIcon(asset_cache.icon("images/logo.png", WINDOW_ICON_SIZE))
         self.setGeometry(100, 100, 800, 600)
 
         # Custom Title Bar
@@ -93,88 +197,154 @@ class Browser(QMainWindow):
         title_layout.addWidget(minimize_btn)
         title_layout.addWidget(maximize_btn)
         title_layout.addWidget(close_btn)
-        mute_btn = QPushButton()
-        mute_btn.setIcon(
-            QIcon(os.path.join(self.script_dir, "images", "mute.png"))
-        )  # Set an appropriate mute icon
 
         # Drag functionality for the custom title bar
         self.old_position = None
         self.title_bar.mousePressEvent = self.mouse_press_event
         self.title_bar.mouseMoveEvent = self.mouse_move_event
 
-        # Tab widget for multiple tabs
-        self.tab_widget = QTabWidget()
+        # Favicons and tab thumbnails, in memory and in profile/images
+        self.image_cache = ImageCache(
+            os.path.join(self.profile_dir, "images"), parent=self
+        )
+        self.image_cache.image_ready.connect(self.on_image_ready)
+        # favicon key -> placeholders waiting for it to be read from disk
+        self.waiting_icons = {}
+
+        # Tab widget for multiple tabs; each view's title, URL and tooltip
+        # changes go to its own tab, at most once per frame
+        self.tab_widget = TabWidget(self.tab_tooltip)
         self.tab_widget.setTabsClosable(True)
+        self.tab_widget.setMovable(True)
         self.tab_widget.tabCloseRequested.connect(self.close_tab)
         self.tab_widget.currentChanged.connect(self.update_url_bar)
+        self.tab_widget.current_url_changed.connect(self.update_url_bar)
+        self.tab_widget.tabBar().tabMoved.connect(
+            lambda from_index, to_index: self.record_tab_order()
+        )
+
+        # Freezes idle background tabs and discards old ones over the memory budget
+        self.tab_lifecycle = TabLifecycleManager(self.tab_widget, parent=self)
+        self.crash_tracker = CrashTracker()
+        self.speculator = Speculator(
+            self.make_prerender_page, self.tab_lifecycle, parent=self
+        )
+        self.tab_widget.currentChanged.connect(self.on_tab_activated)
+
+        # Load timings of every navigation go to profile/perf.jsonl, the
+        # current tab's are shown in a HUD (Ctrl+Shift+H)
+        self.perf_log = PerfLog(os.path.join(self.profile_dir, "perf.jsonl"))
+        self.load_timer = LoadTimer(self.perf_log, self)
+        self.timing_hud = TimingHud(self.tab_widget)
+        self.load_timer.timing_ready.connect(self.show_load_timing)
+        self.tab_widget.currentChanged.connect(lambda: self.show_load_timing())
+        QShortcut(QKeySequence("Ctrl+Shift+H"), self, self.toggle_timing_hud)
+
+        # Memory and CPU of every tab's renderer, shown in tab tooltips and
+        # the task manager (Shift+Esc); low system memory frees tabs early
+        self.process_monitor = ProcessMonitor(self.browser_views, parent=self)
+        self.process_monitor.sampled.connect(self.update_tab_tooltips)
+        self.process_monitor.memory_pressure.connect(self.on_memory_pressure)
+        self.task_manager = None
+        QShortcut(QKeySequence("Shift+Esc"), self, self.show_task_manager)
+        QShortcut(QKeySequence("Ctrl+J"), self, self.show_downloads)
 
         # Add "+" tab for adding new tabs
         self.add_new_tab_button()
 
-        # Create developer tools window (QDockWidget)
-        self.dev_tools_view = QWebEngineView()
-        self.dev_dock = QDockWidget("Developer Tools", self)
-        self.dev_dock.setWidget(self.dev_tools_view)
-        self.addDockWidget(Qt.BottomDockWidgetArea, self.dev_dock)
-        self.dev_dock.hide()
+        # Developer tools window (QDockWidget), built by ensure_dev_tools.
+        # Inspectors are only attached to the current tab while it is shown.
+        self.dev_tools_view = None
+        self.dev_dock = None
+        self.inspectors = {}
+        self.inspected = None
+        self.tab_widget.currentChanged.connect(lambda index: self.attach_dev_tools())
 
         # Create the navigation bar components
         self.url_bar = QLineEdit()
         self.url_bar.setFont(QFont("Press Start 2P", 10))
         self.url_bar.returnPressed.connect(self.navigate_to_url)
+        # Addresses typed without a scheme are tried over HTTPS first
+        self.https_first = HttpsFirst(
+            os.path.join(self.profile_dir, "upgrades.json")
+        )
+
+        # History and bookmarks backed autocomplete for the URL bar
+        self.history = HistoryCompleter(
+            self.url_bar,
+            os.path.join(self.profile_dir, "history.sqlite"),
+            # The store is opened further down
+            bookmarks=lambda text, limit: self.bookmark_store.search(text, limit),
+            parent=self,
+        )
+        # Enter on a suggestion already ends up in returnPressed
+        self.history.completer.popup().clicked.connect(
+            lambda index: self.navigate_to_url()
+        )
+        # Warm up the suggestion being looked at (speculation.py)
+        self.history.completer.highlighted[str].connect(
+            lambda url: self.speculator.hover(QUrl(url))
+        )
 
         button_size = QSize(30, 30)
 
         back_btn = QPushButton()
-        back_btn.setIcon(QIcon(os.path.join(self.script_dir, "images", "back.png")))
+        back_btn.setIcon(asset_cache.icon("images/back.png", NAV_ICON_SIZE))
         back_btn.setFixedSize(button_size)
         back_btn.clicked.connect(self.browser_back)
 
         forward_btn = QPushButton()
-        forward_btn.setIcon(QIcon(os.path.join(self.script_dir, "images", "next.png")))
+        forward_btn.setIcon(asset_cache.icon("images/next.png", NAV_ICON_SIZE))
         forward_btn.setFixedSize(button_size)
         forward_btn.clicked.connect(self.browser_forward)
 
         refresh_btn = QPushButton()
-        refresh_btn.setIcon(QIcon(os.path.join(self.script_dir, "images", "undo.png")))
+        refresh_btn.setIcon(asset_cache.icon("images/undo.png", NAV_ICON_SIZE))
         refresh_btn.setFixedSize(button_size)
         refresh_btn.clicked.connect(self.browser_refresh)
 
         home_btn = QPushButton()
-        home_btn.setIcon(QIcon(os.path.join(self.script_dir, "images", "home.png")))
+        home_btn.setIcon(asset_cache.icon("images/home.png", NAV_ICON_SIZE))
         home_btn.setFixedSize(button_size)
         home_btn.clicked.connect(self.navigate_home)
 
         bookmark_btn = QPushButton()
-        bookmark_btn.setIcon(
-            QIcon(os.path.join(self.script_dir, "images", "heart.png"))
-        )
+        bookmark_btn.setIcon(asset_cache.icon("images/heart.png", NAV_ICON_SIZE))
         bookmark_btn.setFixedSize(button_size)
         bookmark_btn.clicked.connect(self.add_bookmark)
 
         inspect_btn = QPushButton()
-        inspect_btn.setIcon(
-            QIcon(os.path.join(self.script_dir, "images", "inspect.png"))
-        )
+        inspect_btn.setIcon(asset_cache.icon("images/inspect.png", NAV_ICON_SIZE))
         inspect_btn.setFixedSize(button_size)
         inspect_btn.clicked.connect(self.toggle_dev_tools)
+
+        mute_btn = QPushButton()
         mute_btn.setFixedSize(button_size)
-        mute_btn.setIcon(QIcon(os.path.join(self.script_dir, "images", "mute.png")))
+        mute_btn.setIcon(asset_cache.icon("images/mute.png", NAV_ICON_SIZE))
         mute_btn.setCheckable(True)  # Make it toggleable
         mute_btn.clicked.connect(self.toggle_mute)
 
         logo_label = QLabel()
-        logo_label.setPixmap(
-            QIcon(os.path.join(self.script_dir, "images", "logo.png")).pixmap(60, 60)
+        logo_label.setPixmap(asset_cache.pixmap("images/logo.png", LOGO_SIZE))
+        self.bookmark_store = BookmarkStore(
+            os.path.join(self.profile_dir, "bookmarks.sqlite")
         )
-        self.bookmark_bar_layout = QHBoxLayout()
-        self.bookmark_bar_layout.setContentsMargins(5, 0, 5, 0)
-        self.bookmark_bar_layout.setSpacing(5)
-
-        bookmark_bar_widget = QWidget()
-        bookmark_bar_widget.setLayout(self.bookmark_bar_layout)
-        bookmark_bar_widget.setFixedHeight(30)  # Very thin bookmark bar
+        self.bookmark_bar = BookmarkBar(self.bookmark_store)
+        # New tabs open a local page with the bookmarks as a speed dial
+        self.scheme_handler.add_host(
+            "newtab", lambda url: (b"text/html", new_tab_page(self.bookmark_store))
+        )
+        self.scheme_handler.add_job_host(
+            "thumbnail", lambda job: self.serve_image(thumbnail_key, job)
+        )
+        self.scheme_handler.add_job_host(
+            "favicon", lambda job: self.serve_image(favicon_key, job)
+        )
+        self.bookmark_bar.setFixedHeight(30)  # Very thin bookmark bar
+        self.bookmark_bar.open_url.connect(self.open_in_current_tab)
+        self.bookmark_bar.hovered.connect(lambda qurl: self.speculator.hover(qurl))
+        self.bookmark_bar.unhovered.connect(lambda: self.speculator.unhover())
+        self.bookmark_bar.import_requested.connect(self.import_bookmarks)
         # Volume control slider
         volume_slider = QSlider(Qt.Horizontal)
         volume_slider.setRange(0, 100)  # Range from 0 to 100 (volume percentage)
@@ -207,135 +377,570 @@ class Browser(QMainWindow):
         main_layout.addWidget(self.title_bar)
 
         main_layout.addWidget(nav_widget)
-        main_layout.addWidget(bookmark_bar_widget)
+        main_layout.addWidget(self.bookmark_bar)
         main_layout.addWidget(self.tab_widget)
 
+        # Vertical tab list, built by toggle_vertical_tabs
+        self.tab_list_dock = None
+        QShortcut(QKeySequence("Ctrl+Shift+L"), self, self.toggle_vertical_tabs)
+        if vertical_tabs:
+            self.toggle_vertical_tabs()
+
         widget = QWidget()
         widget.setLayout(main_layout)
         self.setCentralWidget(widget)
-        self.music_player = QMediaPlayer()
-        self.load_background_music()
-        self.bookmarks = []
-
-        self.setStyleSheet(
-            """
-        QWidget {
-            font-family: "Press Start 2P", cursive;
-            background-color: #000;  /* Background color black */
-            color: #0f0;  /* Green text */
-        }
-
-        QPushButton {
-            background-color: gray;  /* Button color black */
-            border: 2px solid #0f0;  /* Green border */
-            color: #fff;  /* White text */
-            border-radius: 5px;
-            padding: 0px;  /* Adjust padding */
-        }
-        QPushButton:hover {
-                    background-color: #111;
-                }
+        # Background music player, built by ensure_music_player
+        self.music_player = None
+        self.volume = volume_slider.value()
 
-        QLineEdit {
-            background-color: #111;  /* Darker input field background */
-            border: 2px solid #0f0;  /* Green border */
-            color: #0f0;  /* Green text */
-            height: 30px;  /* Fixed height */
-        }
+        self.setStyleSheet(asset_cache.text("styles/browser.qss"))
 
-         QTabWidget::pane { border: 2px solid #0f0; }
-            QTabWidget::tab-bar { left: 10px; }
+        if self.fast_start:
+            # Let the window shell paint before any page or extra widget work
+            self.startup_probe.first_paint.connect(
+                lambda: QTimer.singleShot(0, self.finish_startup)
+            )
+        else:
+            self.finish_startup()
 
-            QTabBar::tab {
-                background-color: #000;
-                color: #0f0;
-                padding: 10px;
-                margin-right: 5px;  /* Space between tabs */
-                border-right: 1px solid #0f0;  /* Right border for separation */
-            }
+    def finish_startup(self):
+        # Reopen the last session, or the home page if there is none
+        self.restore_session()
 
-            QTabBar::tab:selected { background-color: #111; }
-            QTabBar::tab:last { border-right: none; }  /* Remove right border from the last tab */
+        if self.fast_start:
+            QTimer.singleShot(DEFERRED_INIT_DELAY_MS, self.build_deferred)
+        else:
+            self.build_deferred()
+
+    def build_deferred(self):
+        self.ensure_music_player()
+        self.history.start()
+        self.storage.start()
+        self.process_monitor.start()
+
+    def ensure_dev_tools(self):
+        if self.dev_dock is None:
+            self.dev_dock = QDockWidget("Developer Tools", self)
+            self.addDockWidget(Qt.BottomDockWidgetArea, self.dev_dock)
+            self.dev_dock.hide()
+            self.dev_dock.visibilityChanged.connect(
+                lambda visible: self.attach_dev_tools()
+                if visible
+                else self.detach_dev_tools()
+            )
 
-        """
-        )
+    def inspector_for(self, browser):
+        if not self.inspector_per_tab:
+            if self.dev_tools_view is None:
+                self.dev_tools_view = QWebEngineView()
+            return self.dev_tools_view
+        if browser not in self.inspectors:
+            self.inspectors[browser] = QWebEngineView()
+        return self.inspectors[browser]
+
+    def attach_dev_tools(self):
+        # Point the inspector at the current tab, if dev tools are open
+        current_browser = self.current_view()
+        if self.dev_dock is None or self.dev_dock.isHidden() or current_browser is None:
+            return
+
+        if not self.inspector_per_tab and self.inspected not in (None, current_browser):
+            self.inspected.page().setDevToolsPage(None)
+        inspector = self.inspector_for(current_browser)
+        if current_browser.page().devToolsPage() is not inspector.page():
+            current_browser.page().setDevToolsPage(inspector.page())
+        if self.dev_dock.widget() is not inspector:
+            self.dev_dock.setWidget(inspector)
+        self.inspected = current_browser
+
+    def detach_dev_tools(self):
+        if self.inspected is not None:
+            self.inspected.page().setDevToolsPage(None)
+            self.inspected = None
+        for browser, inspector in self.inspectors.items():
+            browser.page().setDevToolsPage(None)
+            inspector.deleteLater()
+        self.inspectors = {}
+
+    def toggle_vertical_tabs(self):
+        if self.tab_list_dock is None:
+            self.tab_list_dock = QDockWidget("Tabs", self)
+            self.tab_list_dock.setWidget(VerticalTabList(self.tab_widget))
+            self.addDockWidget(Qt.LeftDockWidgetArea, self.tab_list_dock)
+            self.tab_list_dock.hide()
+            # The list stands in for the tab bar while it is shown
+            self.tab_list_dock.visibilityChanged.connect(
+                lambda visible: self.tab_widget.tabBar().setVisible(not visible)
+            )
+        self.tab_list_dock.setVisible(self.tab_list_dock.isHidden())
 
-        # Open the initial tab with the home page
-        self.add_new_tab(QUrl("https://www.google.com"), "Home")
+    def ensure_music_player(self):
+        if self.music_player is None:
+            self.music_player = BackgroundAudio(
+                os.path.join(self.script_dir, "bgm", "ok.mp3"), self
+            )
+            self.music_player.set_volume(self.volume)
+            self.music_player.set_suspended("minimized", self.isMinimized())
+        return self.music_player
 
     def set_web_engine_settings(self):
         profile = QWebEngineProfile.defaultProfile()
-        profile.setRequestInterceptor(None)
 
-        # Disable GPU acceleration
-        profile.setPersistentStoragePath(os.path.join(self.script_dir, "webengine"))
-        profile.setCachePath(os.path.join(self.script_dir, "webengine_cache"))
-        profile.setPersistentStoragePath(
-            os.path.join(self.script_dir, "webengine_persistent")
+        # Filter lists (EasyList format) go in profile/filters; every page
+        # gets its own interceptor so blocked requests are counted per tab
+        self.content_blocker = ContentBlocker(
+            os.path.join(self.profile_dir, "filters"),
+            os.path.join(self.profile_dir, "filters.cache"),
+        )
+
+        # Site data and the HTTP cache live in the profile and are kept
+        # under a size limit (storage.py)
+        webengine_dir = os.path.join(self.profile_dir, "webengine")
+        if self.default_profile:
+            migrate(
+                os.path.join(self.script_dir, "webengine_persistent"),
+                os.path.join(webengine_dir, "storage"),
+            )
+            migrate(
+                os.path.join(self.script_dir, "webengine_cache"),
+                os.path.join(webengine_dir, "cache"),
+            )
+        self.storage = StorageManager(
+            profile,
+            webengine_dir,
+            open_urls=lambda: [view.url() for view in self.browser_views()],
+            parent=self,
+        )
+
+        apply_web_engine_settings(QWebEngineSettings.globalSettings())
+
+        # JavaScript, images, autoplay, plugins and the 8-bit style can be
+        # set per site; pages apply them to their own settings as they
+        # navigate (sitesettings.py)
+        self.site_settings = SiteSettings(
+            os.path.join(self.profile_dir, "site_settings.json"),
+            defaults={"retro_images": RETRO_IMAGES},
+            parent=self,
+        )
+        self.site_settings.changed.connect(self.on_site_settings_changed)
+
+        # Built-in pages (orbit://newtab) are served from memory
+        self.scheme_handler = OrbitSchemeHandler(self)
+        self.scheme_handler.install(profile)
+        # The 8-bit style's font is used by every page
+        self.scheme_handler.add_host("fonts", serve_font, public=True)
+
+        # Images are sent through orbit://retro while 8-bit images are on
+        self.retro_images = RetroImages(
+            os.path.join(self.profile_dir, "retro"),
+            enabled=lambda site: self.site_settings.get(site, "retro_images"),
+            parent=self,
         )
+        # Requested by web pages, but only with URLs the interceptor signed
+        self.scheme_handler.add_job_host(
+            "retro", self.retro_images.handle, public=True
+        )
+
+        # Downloads are queued, throttled and resumable (downloads.py), and
+        # listed in the downloads panel (Ctrl+J)
+        self.downloads = DownloadManager(
+            os.path.join(self.profile_dir, "downloads.json"), parent=self
+        )
+        self.downloads.user_agent = profile.httpUserAgent()
+        self.downloads.share_cookies(profile.cookieStore())
+        self.downloads_panel = None
+        profile.downloadRequested.connect(self.on_download_requested)
+
+    def restore_session(self):
+        session_path = os.path.join(self.profile_dir, "session.jsonl")
+        state = load_session(session_path)
+        self.journal = SessionJournal(session_path, state)
+
+        tabs = [state["tabs"][tab_id] for tab_id in state["order"]]
+        self.next_tab_id = max((tab["id"] for tab in tabs), default=0) + 1
+        if not tabs:
+            self.add_new_tab(QUrl(self.home_url), "Home")
+            return
+
+        # Only the active tab gets a real view, the rest stay placeholders
+        # until they are selected
+        self.tab_widget.blockSignals(True)
+        for tab in tabs:
+            placeholder = TabPlaceholder(
+                tab["id"],
+                tab.get("url", ""),
+                tab.get("title") or "Untitled",
+                tab.get("history"),
+            )
+            index = self.tab_widget.addTab(placeholder, placeholder.title)
+            self.show_cached_icon(index, placeholder)
+        self.tab_widget.blockSignals(False)
+
+        active = state["active"] if state["active"] in state["tabs"] else tabs[-1]["id"]
+        index = state["order"].index(active)
+        self.tab_widget.setCurrentIndex(index)
+        self.materialize_tab(index)
+
+    def materialize_tab(self, index):
+        placeholder = self.tab_widget.widget(index)
+        if not isinstance(placeholder, TabPlaceholder):
+            return
+
+        browser = self.create_browser_view(placeholder.tab_id)
+        if placeholder.history:
+            restore_history(browser, placeholder.history)
+        else:
+            browser.setUrl(placeholder.url)
 
-        # Set other WebEngine settings
-        QWebEngineSettings.globalSettings().setAttribute(
-            QWebEngineSettings.AutoLoadImages, True
+        # Swap the view in without the tab widget reporting intermediate
+        # current tabs, then run what currentChanged would have run
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.insertTab(
+            index, browser, self.tab_widget.tabIcon(index), placeholder.title
         )
-        QWebEngineSettings.globalSettings().setAttribute(
-            QWebEngineSettings.JavascriptEnabled, True
+        self.tab_widget.removeTab(index + 1)
+        self.tab_widget.setCurrentIndex(index)
+        self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
+
+        self.tab_lifecycle.on_current_changed(index)
+        self.update_url_bar()
+        self.attach_dev_tools()
+        self.journal.record("active", id=browser.tab_id)
+
+    def on_render_process_terminated(self, browser, status, exit_code):
+        index = self.tab_widget.index_of(browser)
+        if status == QWebEnginePage.NormalTerminationStatus or index == -1:
+            return
+
+        # Swap in a sad tab that remembers the page; it becomes a view again
+        # through materialize_tab when reloaded
+        url = browser.url()
+        crashes = self.crash_tracker.record(url)
+        self.perf_log.write(
+            "renderer_crash",
+            tab=browser.tab_id,
+            url=url.toString(),
+            status=int(status),
+            exit_code=exit_code,
+            crashes=crashes,
+        )
+        sad_tab = SadTab(
+            browser.tab_id,
+            url,
+            browser.title(),
+            save_history(browser),
+            crashes,
+            self.crash_tracker.reload_delay(url),
         )
-        QWebEngineSettings.globalSettings().setAttribute(
-            QWebEngineSettings.LocalStorageEnabled, True
+        sad_tab.reload_requested.connect(
+            lambda: self.materialize_tab(self.tab_widget.index_of(sad_tab))
         )
-        QWebEngineSettings.globalSettings().setAttribute(
-            QWebEngineSettings.WebRTCPublicInterfacesOnly, False
+        current = self.tab_widget.currentIndex()
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.insertTab(
+            index, sad_tab, browser.icon(), browser.title() or "Crashed"
+        )
+        self.tab_widget.removeTab(index + 1)
+        self.tab_widget.setCurrentIndex(current)
+        self.tab_widget.blockSignals(False)
+        self.release_browser_view(browser)
+
+    def show_cached_icon(self, index, placeholder):
+        # Restored tabs show the favicon their site had last time
+        key = favicon_key(placeholder.url)
+        pixmap = self.image_cache.pixmap(key)
+        if pixmap is not None:
+            self.tab_widget.setTabIcon(index, QIcon(pixmap))
+        else:
+            self.waiting_icons.setdefault(key, []).append(placeholder)
+
+    def on_image_ready(self, key, pixmap):
+        for placeholder in self.waiting_icons.pop(key, []):
+            index = self.tab_widget.index_of(placeholder)
+            if index != -1:
+                self.tab_widget.setTabIcon(index, QIcon(pixmap))
+
+    def on_icon_changed(self, browser, icon):
+        self.tab_widget.mark(browser, "icon")
+        if not icon.isNull():
+            self.image_cache.put(
+                favicon_key(browser.url()), icon.pixmap(FAVICON_SIZE).toImage()
+            )
+
+    def schedule_thumbnail(self, browser, ok):
+        if ok:
+            QTimer.singleShot(
+                THUMBNAIL_DELAY_MS, lambda: self.capture_thumbnail(browser)
+            )
+
+    def capture_thumbnail(self, browser):
+        # Only the current tab is painted, a background tab would grab blank.
+        # Scaling and encoding happen on the image cache's thread.
+        if (
+            self.tab_widget.index_of(browser) == -1
+            or browser is not self.current_view()
+            or not browser.isVisible()
+        ):
+            return
+        self.image_cache.put(
+            thumbnail_key(browser.url()), browser.grab().toImage(), THUMBNAIL_SIZE
         )
 
+    def serve_image(self, key, job):
+        # orbit://thumbnail/?url=<page> and orbit://favicon/?url=<page>
+        self.image_cache.serve(job, key(query_url(job.requestUrl())))
+
+    def on_tab_activated(self, index):
+        widget = self.tab_widget.widget(index)
+        if isinstance(widget, SadTab):
+            # Reloads itself once shown, after its backoff delay
+            self.journal.record("active", id=widget.tab_id)
+        elif isinstance(widget, TabPlaceholder):
+            self.materialize_tab(index)
+        elif widget is not None:
+            self.journal.record("active", id=widget.tab_id)
+
+    def record_tab_order(self):
+        ids = [
+            self.tab_widget.widget(i).tab_id for i in range(self.tab_widget.count())
+        ]
+        self.journal.record("order", ids=ids)
+
     def add_new_tab(self, qurl=None, label="New Tab"):
         if qurl is None:
-            qurl = QUrl("https://www.google.com")
+            qurl = QUrl(NEW_TAB_URL)
 
-        browser = QWebEngineView()
+        browser = self.create_browser_view()
         browser.setUrl(qurl)
 
-        # Set up developer tools for the browser
-        browser.page().setDevToolsPage(self.dev_tools_view.page())
+        index = self.tab_widget.insertTab(self.tab_widget.count() - 1, browser, label)
+        self.journal.record(
+            "open", id=browser.tab_id, index=index, url=qurl.toString(), title=label
+        )
+        self.tab_widget.setCurrentIndex(index)
+        return browser
+
+    def create_browser_view(self, tab_id=None, page=None):
+        if tab_id is None:
+            tab_id = self.next_tab_id
+            self.next_tab_id += 1
 
-        # Update the tab label when the URL changes
+        browser = QWebEngineView()
+        browser.tab_id = tab_id
+        if page is not None:
+            # A prerendered page adopted by this tab
+            page.setParent(browser)
+            browser.setPage(page)
+            browser.request_interceptor = page.request_interceptor
+        else:
+            profile = QWebEngineProfile.defaultProfile()
+            browser.setPage(SitePage(profile, self.site_settings, browser))
+            browser.request_interceptor = TabRequestInterceptor(
+                self.content_blocker, browser, self.retro_images, self.downloads
+            )
+            browser.page().setUrlRequestInterceptor(browser.request_interceptor)
+
+        self.startup_probe.watch(browser)
+        self.load_timer.watch(browser)
+        self.process_monitor.watch(browser)
+        browser.page().renderProcessTerminated.connect(
+            lambda status, exit_code: self.on_render_process_terminated(
+                browser, status, exit_code
+            )
+        )
+        browser.loadStarted.connect(lambda: self.reset_blocked_count(browser))
+        browser.loadStarted.connect(lambda: self.https_first.load_started(browser))
+        browser.page().certificate_rejected.connect(
+            lambda url: self.https_first.certificate_error(browser)
+        )
+        browser.loadFinished.connect(
+            lambda ok: self.https_first.load_finished(browser, ok)
+        )
+
+        # Update this view's own tab (and the URL bar, if it is current)
         browser.titleChanged.connect(
-            lambda title: self.tab_widget.setTabText(
-                self.tab_widget.currentIndex(), title if title else "Untitled"
+            lambda title: self.tab_widget.mark(browser, "title")
+        )
+        browser.urlChanged.connect(lambda q: self.tab_widget.mark(browser, "url"))
+        browser.loadFinished.connect(
+            lambda ok: self.tab_widget.mark(browser, "tooltip")
+        )
+        browser.iconChanged.connect(lambda icon: self.on_icon_changed(browser, icon))
+        browser.loadFinished.connect(lambda ok: self.schedule_thumbnail(browser, ok))
+        self.tab_lifecycle.track(browser)
+
+        # Record every navigation in the history
+        browser.urlChanged.connect(self.history.record_visit)
+        browser.titleChanged.connect(
+            lambda title: self.history.record_title(browser.url(), title)
+        )
+
+        # Keep the session journal up to date with this tab
+        browser.urlChanged.connect(
+            lambda q: self.journal.record("update", id=tab_id, url=q.toString())
+        )
+        browser.titleChanged.connect(
+            lambda title: self.journal.record("update", id=tab_id, title=title)
+        )
+        browser.loadFinished.connect(
+            lambda success: self.journal.record(
+                "update", id=tab_id, history=save_history(browser)
             )
         )
+        return browser
+
+    def reset_blocked_count(self, browser):
+        browser.request_interceptor.blocked = 0
+        self.tab_widget.mark(browser, "tooltip")
+
+    def tab_tooltip(self, browser):
+        lines = [
+            browser.title() or browser.url().toString(),
+            "%d requests blocked" % browser.request_interceptor.blocked,
+        ]
+        usage = browser.process_usage
+        if usage is not None:
+            shared = " (shared by %d tabs)" % usage["tabs"] if usage["tabs"] > 1 else ""
+            lines.append(
+                "Renderer %d: %.0f MB, %.0f%% CPU%s"
+                % (usage["pid"], usage["rss_mb"], usage["cpu_pct"], shared)
+            )
+        return "\n".join(lines)
+
+    def update_tab_tooltips(self):
+        for browser in self.browser_views():
+            self.tab_widget.mark(browser, "tooltip")
+
+    def on_memory_pressure(self, level, available_mb):
+        # Give memory back before the OOM killer picks a process: freeze
+        # background tabs and drop prerenders, and when it is critical,
+        # discard the least recently used tab (one per sample)
+        self.tab_lifecycle.freeze_background()
+        self.speculator.clear()
+        discarded = None
+        if level == "critical":
+            discarded = self.tab_lifecycle.discard_oldest()
+        self.perf_log.write(
+            "memory_pressure",
+            level=level,
+            available_mb=round(available_mb),
+            discarded=discarded.url().toString() if discarded else None,
+        )
 
-        browser.urlChanged.connect(lambda q: self.update_url_bar())
-        browser.loadFinished.connect(lambda success: self.apply_8bit_style(browser))
+    def show_task_manager(self):
+        if self.task_manager is None:
+            self.task_manager = TaskManager(
+                self.process_monitor, self.browser_views, self
+            )
+            self.task_manager.discard_requested.connect(self.discard_tab)
+        self.task_manager.show()
+        self.task_manager.raise_()
 
-        index = self.tab_widget.insertTab(self.tab_widget.count() - 1, browser, label)
-        self.tab_widget.setCurrentIndex(index)
+    def on_download_requested(self, item):
+        self.downloads.request(item)
+        self.show_downloads()
+
+    def show_downloads(self):
+        if self.downloads_panel is None:
+            self.downloads_panel = DownloadsPanel(self.downloads, self)
+        self.downloads_panel.show()
+        self.downloads_panel.raise_()
+
+    def discard_tab(self, browser):
+        # The current tab would only reload right away
+        if self.tab_lifecycle.can_suspend(browser):
+            self.tab_lifecycle.discard(browser)
 
     def close_tab(self, index):
         if self.tab_widget.count() > 1:
+            browser = self.tab_widget.widget(index)
+            self.journal.record("close", id=browser.tab_id)
             self.tab_widget.removeTab(index)
+            self.release_browser_view(browser)
         else:
             self.close()
 
+    def release_browser_view(self, browser):
+        self.tab_lifecycle.untrack(browser)
+        if self.inspected is browser:
+            self.inspected = None
+        if browser in self.inspectors:
+            self.inspectors.pop(browser).deleteLater()
+        # removeTab only hides the view, delete it so its renderer goes away
+        browser.deleteLater()
+
     def apply_8bit_style(self, browser):
-        css = """
-        * {
-            font-family: "Press Start 2P", cursive !important;
-        }
-        """
-        # Inject stylesheet in a secure way using QWebEnginePage.setUserStyleSheet
-        browser.page().runJavaScript(
-            f"""
-            (function() {{
-                var style = document.createElement('style');
-                style.type = 'text/css';
-                style.innerHTML = `{css}`;
-                document.head.appendChild(style);
-            }})();
-        """
+        # New documents are styled by the profile script, this is for pages
+        # that are already open
+        self.retro_theme.apply(browser.page())
+
+    def toggle_site_policy(self, name):
+        # Turn a policy on or off for the current site
+        current_browser = self.current_view()
+        if current_browser is not None:
+            host = current_browser.url().host()
+            self.site_settings.set(host, name, not self.site_settings.get(host, name))
+
+    def show_site_menu(self):
+        # The current site's policies, as checkable actions
+        current_browser = self.current_view()
+        if current_browser is None:
+            return
+        host = current_browser.url().host()
+        menu = QMenu(self)
+        menu.addSection(host or current_browser.url().scheme())
+        for name in POLICIES:
+            action = menu.addAction(POLICY_LABELS[name])
+            action.setCheckable(True)
+            action.setChecked(self.site_settings.get(host, name))
+            action.toggled.connect(
+                lambda checked, name=name: self.site_settings.set(host, name, checked)
+            )
+        menu.addSeparator()
+        reset_action = menu.addAction("Reset Site Settings")
+        reset_action.setEnabled(
+            any(self.site_settings.has_rule(host, name) for name in POLICIES)
         )
+        reset_action.triggered.connect(lambda: self.reset_site_settings(host))
+        menu.exec_(self.url_bar.mapToGlobal(QPoint(0, self.url_bar.height())))
+        menu.deleteLater()
+
+    def reset_site_settings(self, host):
+        for name in POLICIES:
+            if self.site_settings.has_rule(host, name):
+                self.site_settings.set(host, name, None)
+
+    def on_site_settings_changed(self, suffix, name):
+        # Bring open pages of the site in line: the style is patched in
+        # place, page settings only hold for the next document
+        if name == "style":
+            self.retro_theme.set_rules(self.site_settings.rules_for("style"))
+        for view in self.browser_views():
+            host = view.url().host()
+            if not covers(suffix, host):
+                continue
+            if name != "style":
+                view.reload()
+            elif self.site_settings.get(host, "style"):
+                self.retro_theme.apply(view.page())
+            else:
+                self.retro_theme.remove(view.page())
+
+    def current_view(self):
+        # The current tab's view, None while it is a placeholder
+        widget = self.tab_widget.currentWidget()
+        return widget if isinstance(widget, QWebEngineView) else None
+
+    def browser_views(self):
+        return [
+            self.tab_widget.widget(i)
+            for i in range(self.tab_widget.count())
+            if isinstance(self.tab_widget.widget(i), QWebEngineView)
+        ]
 
     def toggle_dev_tools(self):
+        self.ensure_dev_tools()
         if self.dev_dock.isVisible():
             self.dev_dock.hide()
         else:
@@ -348,32 +953,95 @@ class Browser(QMainWindow):
             self.showMaximized()
 
     def navigate_to_url(self):
-        url = self.url_bar.text()
-        if not url.startswith("http"):
-            url = "http://" + url
-        self.tab_widget.currentWidget().setUrl(QUrl(url))
+        qurl, upgraded = self.https_first.resolve(self.url_bar.text())
+        self.open_in_current_tab(qurl)
+        if upgraded:
+            self.https_first.attempt(self.current_view(), qurl)
+
+    def open_in_current_tab(self, qurl):
+        page = self.speculator.take(qurl)
+        if page is None:
+            current_browser = self.current_view()
+            if current_browser is not None:
+                current_browser.setUrl(qurl)
+            else:
+                # A sad tab: load the page in a new view instead
+                placeholder = self.tab_widget.currentWidget()
+                placeholder.url, placeholder.history = qurl, None
+                self.materialize_tab(self.tab_widget.currentIndex())
+            return
+
+        # The page was prerendered, put it in a view of its own in place of
+        # the current one. Its back history starts at this page.
+        index = self.tab_widget.currentIndex()
+        old_browser = self.tab_widget.widget(index)
+        if self.inspected is old_browser:
+            old_browser.page().setDevToolsPage(None)
+            self.inspected = None
+        browser = self.create_browser_view(old_browser.tab_id, page)
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.insertTab(index, browser, page.title() or "Untitled")
+        self.tab_widget.removeTab(index + 1)
+        self.tab_widget.setCurrentIndex(index)
+        self.tab_widget.blockSignals(False)
+        self.release_browser_view(old_browser)
+
+        self.tab_lifecycle.on_current_changed(index)
+        self.update_url_bar()
+        self.attach_dev_tools()
+        self.history.record_visit(page.url())
+        self.history.record_title(page.url(), page.title())
+        self.journal.record(
+            "update",
+            id=browser.tab_id,
+            url=page.url().toString(),
+            title=page.title(),
+            history=save_history(browser),
+        )
+
+    def make_prerender_page(self):
+        # A page with no view, blocked requests are counted for the tab it
+        # may end up in
+        page = SitePage(
+            QWebEngineProfile.defaultProfile(), self.site_settings, self.speculator
+        )
+        page.request_interceptor = TabRequestInterceptor(
+            self.content_blocker, page, self.retro_images, self.downloads
+        )
+        page.setUrlRequestInterceptor(page.request_interceptor)
+        return page
 
     def navigate_home(self):
-        self.tab_widget.currentWidget().setUrl(QUrl("https://www.google.com"))
+        self.open_in_current_tab(QUrl(self.home_url))
+
+    def show_load_timing(self, browser=None, record=None):
+        current_browser = self.current_view()
+        if not self.timing_hud.isVisible() or browser not in (None, current_browser):
+            return
+        self.timing_hud.show_timing(getattr(current_browser, "last_timing", None))
+
+    def toggle_timing_hud(self):
+        current_browser = self.current_view()
+        self.timing_hud.toggle(getattr(current_browser, "last_timing", None))
 
     def update_url_bar(self):
-        current_browser = self.tab_widget.currentWidget()
-        if isinstance(current_browser, QWebEngineView):
+        current_browser = self.current_view()
+        if current_browser is not None:
             self.url_bar.setText(current_browser.url().toString())
 
     def browser_back(self):
-        current_browser = self.tab_widget.currentWidget()
-        if isinstance(current_browser, QWebEngineView):
+        current_browser = self.current_view()
+        if current_browser is not None:
             current_browser.back()
 
     def browser_forward(self):
-        current_browser = self.tab_widget.currentWidget()
-        if isinstance(current_browser, QWebEngineView):
+        current_browser = self.current_view()
+        if current_browser is not None:
             current_browser.forward()
 
     def browser_refresh(self):
-        current_browser = self.tab_widget.currentWidget()
-        if isinstance(current_browser, QWebEngineView):
+        current_browser = self.current_view()
+        if current_browser is not None:
             current_browser.reload()
 
     def add_new_tab_button(self):
@@ -387,8 +1055,8 @@ class Browser(QMainWindow):
         self.tab_widget.setCornerWidget(new_tab_btn, Qt.TopLeftCorner)
 
     def add_bookmark(self):
-        current_browser = self.tab_widget.currentWidget()
-        if isinstance(current_browser, QWebEngineView):
+        current_browser = self.current_view()
+        if current_browser is not None:
             url = current_browser.url().toString()
 
             # Create a custom input dialog for bookmark title
@@ -405,64 +1073,42 @@ class Browser(QMainWindow):
             if dialog.exec_() == QInputDialog.Accepted:
                 bookmark_title = dialog.textValue()
                 if bookmark_title:  # If the user entered a title
-                    bookmark_btn = QPushButton(bookmark_title)
-                    bookmark_btn.setStyleSheet(
-                        """
-                        QPushButton {
-                            background-color: white;
-                            color: red;
-                            border: 2px solid #0f0;
-                            font-family: "Press Start 2P";
-                        }
-                        QPushButton:hover {
-                            background-color: #111;
-                        }
-                        """
-                    )
-                    bookmark_btn.clicked.connect(
-                        lambda: self.tab_widget.currentWidget().setUrl(QUrl(url))
-                    )
-
-                    # Context menu for deleting bookmarks
-                    bookmark_btn.setContextMenuPolicy(Qt.CustomContextMenu)
-                    bookmark_btn.customContextMenuRequested.connect(
-                        lambda pos, btn=bookmark_btn: self.show_bookmark_menu(pos, btn)
-                    )
-
-                    # Add the bookmark button to the bookmark bar
-                    self.bookmark_bar_layout.addWidget(bookmark_btn)
-                    self.bookmarks.append((bookmark_title, url, bookmark_btn))
-
-    def load_background_music(self):
-        # Path to the music file
-        playlist = QMediaPlaylist()
-        music_path = os.path.join(self.script_dir, "bgm", "sdp.mp3")
-        url = QUrl.fromLocalFile(music_path)
-        content = QMediaContent(url)
-        playlist.addMedia(QMediaContent(url))
-        playlist.setPlaybackMode(QMediaPlaylist.Loop)
-
-        # Assign the playlist to the media player
-        self.music_player.setPlaylist(playlist)
-        self.music_player.setMedia(content)
-        self.music_player.play()
+                    self.bookmark_store.add(bookmark_title, url)
+                    self.bookmark_bar.refresh()
+
+    def import_bookmarks(self):
+        path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Import Bookmarks",
+            "",
+            "Bookmark exports (*.html *.htm *.json);;All files (*)",
+        )
+        if not path:
+            return
+
+        # Large exports take a while, run them on a worker thread
+        self.import_thread = QThread(self)
+        self.import_worker = BookmarkImportWorker(self.bookmark_store.path, path)
+        self.import_worker.moveToThread(self.import_thread)
+        self.import_thread.started.connect(self.import_worker.run)
+        self.import_worker.finished.connect(self.import_thread.quit)
+        self.import_worker.finished.connect(self.bookmarks_imported)
+        self.import_thread.start()
+
+    def bookmarks_imported(self, count, error):
+        if count < 0:
+            QMessageBox.warning(
+                self,
+                "Import Bookmarks",
+                "The bookmarks could not be imported:\n%s" % error,
+            )
+            return
+        self.bookmark_bar.refresh()
 
     def set_volume(self, value):
-        self.music_player.setVolume(value)
-
-    def show_bookmark_menu(self, pos, bookmark_btn):
-        menu = QMenu(self)
-        delete_action = menu.addAction("Delete Bookmark")
-
-        action = menu.exec_(bookmark_btn.mapToGlobal(pos))
-
-        if action == delete_action:
-            # Remove the button from the layout
-            bookmark_btn.setParent(None)
-            bookmark_btn.deleteLater()
-
-            # Remove the bookmark from the list
-            self.bookmarks = [b for b in self.bookmarks if b[2] != bookmark_btn]
+        self.volume = value
+        if self.music_player is not None:
+            self.music_player.set_volume(value)
 
     def mouse_press_event(self, event):
         self.old_position = event.globalPos()
@@ -473,25 +1119,57 @@ class Browser(QMainWindow):
         self.old_position = event.globalPos()
 
     def load_custom_font(self):
-        # Load the font from the local file and add it to the QFontDatabase
-        font_id = QFontDatabase.addApplicationFont(
-            os.path.join(self.script_dir, "fonts", "PressStart2P.ttf")
-        )
+        # Add the bundled font to the QFontDatabase (the same bytes are
+        # served to pages, see theme.py)
+        data = asset_cache.data(FONT_ASSET)
+        font_id = QFontDatabase.addApplicationFontFromData(data) if data else -1
         if font_id == -1:
-            print("Failed to load font")
-        else:
-            print("Font successfully loaded")
+            print("Failed to load font", file=sys.stderr)
+
+    def closeEvent(self, event):
+        # Flush the session journal before the window goes away
+        if self.journal is not None:
+            self.journal.close()
+        self.history.stop()
+        self.storage.stop()
+        self.image_cache.stop()
+        self.retro_images.stop()
+        self.retro_images.report()
+        self.downloads.stop()
+        self.downloads.report()
+        self.speculator.report()
+        self.https_first.report()
+        super().closeEvent(event)
 
     def toggle_mute(self):
-        if self.music_player.isMuted():
-            self.music_player.setMuted(False)
-        else:
-            self.music_player.setMuted(True)
+        self.ensure_music_player()
+        self.music_player.set_muted(not self.music_player.is_muted())
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Expose events tell us when the window is fully covered
+        self.windowHandle().installEventFilter(self)
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Expose and self.music_player is not None:
+            self.music_player.set_suspended("occluded", not watched.isExposed())
+        return super().eventFilter(watched, event)
+
+    def changeEvent(self, event):
+        # Stop the music (and release the audio device) while minimized
+        if event.type() == QEvent.WindowStateChange and self.music_player is not None:
+            self.music_player.set_suspended("minimized", self.isMinimized())
+        super().changeEvent(event)
 
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     app.setApplicationName("OR-BIT Browser")
-    window = Browser()
+    # --no-fast-start builds everything before the window is shown,
+    # --home URL sets the home page
+    home_url = HOME_URL
+    if "--home" in sys.argv[:-1]:
+        home_url = sys.argv[sys.argv.index("--home") + 1]
+    window = Browser(fast_start="--no-fast-start" not in sys.argv, home_url=home_url)
     window.show()
     sys.exit(app.exec_())
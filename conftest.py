@@ -0,0 +1,15 @@
+import os
+import sys
+
+import pytest
+
+# Tests run without a visible window
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+
+@pytest.fixture(scope="session", autouse=True)
+def app():
+    # Timers, threads and event loops need an application object
+    return QApplication.instance() or QApplication(sys.argv[:1])
@@ -0,0 +1,899 @@
+import base64
+import collections
+import hashlib
+import json
+import os
+import sys
+import time
+
+from PyQt5.QtCore import (
+    QObject,
+    Qt,
+    QThread,
+    QTimer,
+    QUrl,
+    pyqtSignal,
+    pyqtSlot,
+)
+from PyQt5.QtGui import QDesktopServices, QFont
+from PyQt5.QtNetwork import (
+    QNetworkAccessManager,
+    QNetworkCookieJar,
+    QNetworkReply,
+    QNetworkRequest,
+)
+from PyQt5.QtWebEngineWidgets import QWebEngineDownloadItem
+from PyQt5.QtWidgets import (
+    QAbstractItemView,
+    QHBoxLayout,
+    QHeaderView,
+    QInputDialog,
+    QLabel,
+    QPushButton,
+    QSpinBox,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+from monitor import TASK_MANAGER_STYLE
+
+# Downloads running at once, the rest wait in the queue
+MAX_ACTIVE = 3
+# Bandwidth caps in KB/s for all downloads together, 0 for none (each
+# download can have a cap of its own too)
+RATE_KBPS = 0
+# Files at least this big are fetched in SEGMENTS parallel range requests,
+# if the server supports ranges
+SEGMENTED_MIN_MB = 16
+SEGMENTS = 4
+# A transfer that breaks off is continued from where it stopped this often
+MAX_RETRIES = 3
+# Throttled transfers are topped up, and speeds measured, this often
+TICK_MS = 50
+SPEED_INTERVAL_S = 0.5
+# The panel is refreshed at most this often while bytes are coming in
+CHANGED_INTERVAL_MS = 250
+# Most bytes read from a reply at a time; the reply buffers twice this
+# before Qt stops reading from the socket, which is what throttles it
+CHUNK_BYTES = 256 * 1024
+# Progress is saved at most this often
+SAVE_INTERVAL_MS = 2000
+PART_SUFFIX = ".part"
+# Form posts remembered, the downloads they lead to are left to the engine
+MAX_FORM_POSTS = 200
+
+RETRY_ERRORS = (
+    QNetworkReply.NoError,
+    QNetworkReply.RemoteHostClosedError,
+    QNetworkReply.TimeoutError,
+    QNetworkReply.TemporaryNetworkFailureError,
+    QNetworkReply.NetworkSessionFailedError,
+    QNetworkReply.UnknownNetworkError,
+)
+
+
+def unique_path(path, taken=()):
+    # "file.zip", "file (1).zip", ... whichever is free on disk and not in
+    # taken (the paths of downloads that haven't created their files yet)
+    root, ext = os.path.splitext(path)
+    number = 1
+    while (
+        path in taken
+        or os.path.exists(path)
+        or os.path.exists(path + PART_SUFFIX)
+    ):
+        path = "%s (%d)%s" % (root, number, ext)
+        number += 1
+    return path
+
+
+def parse_content_range(value):
+    # "bytes 0-99/1000" -> (0, 99, 1000), total None if unknown ("*")
+    try:
+        unit, _, spec = value.strip().partition(" ")
+        span, _, total = spec.partition("/")
+        first, _, last = span.partition("-")
+        return int(first), int(last), None if total == "*" else int(total)
+    except ValueError:
+        return None, None, None
+
+
+def parse_digest(reply):
+    # SHA-256 (hex) the server gives for the file in a Repr-Digest or
+    # Digest header, None if it doesn't
+    for header in (b"Repr-Digest", b"Digest"):
+        value = bytes(reply.rawHeader(header)).decode("latin-1")
+        for part in value.split(","):
+            name, _, digest = part.strip().partition("=")
+            if name.lower() != "sha-256":
+                continue
+            try:
+                return base64.b64decode(digest.strip(":"), validate=True).hex()
+            except ValueError:
+                pass
+    return None
+
+
+def segment_left(segment):
+    # Bytes still missing from [start, end, received], None if unknown
+    start, end, received = segment
+    return None if end is None else end - start + 1 - received
+
+
+def format_size(size):
+    if size is None:
+        return "?"
+    if size < 1024:
+        return "%d B" % size
+    for unit in ("KB", "MB"):
+        size /= 1024
+        if size < 1024:
+            return "%.1f %s" % (size, unit)
+    return "%.1f GB" % (size / 1024)
+
+
+class TokenBucket:
+    # Allows rate bytes per second, keeping at most a second's worth
+    def __init__(self, kbps=0):
+        self.set_rate(kbps)
+
+    def set_rate(self, kbps):
+        self.kbps = kbps
+        self.rate = kbps * 1024
+        self.tokens = 0.0
+        self.last = time.monotonic()
+
+    def allowance(self):
+        if not self.rate:
+            return sys.maxsize
+        now = time.monotonic()
+        self.tokens = min(self.rate, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+        return int(self.tokens)
+
+    def take(self, size):
+        if self.rate:
+            self.tokens -= size
+
+
+class Download:
+    # One file: where it comes from and goes, and what arrived so far. The
+    # file is fetched in segments [start, end, received] (end inclusive,
+    # None until the size is known), written in place to path + ".part".
+    def __init__(self, download_id, url, path, sha256=None, rate_kbps=0):
+        self.id = download_id
+        self.url = url
+        self.path = path
+        self.state = "queued"
+        self.total = None
+        self.segments = []
+        # ETag or Last-Modified of the first response, sent with If-Range
+        # when resuming so a changed file is fetched from the start
+        self.validator = None
+        self.resumable = True
+        self.expected_sha256 = sha256
+        self.sha256 = None
+        self.error = None
+        self.bucket = TokenBucket(rate_kbps)
+        # Downloads the engine handles itself (blob:, data:, saved pages)
+        self.item = None
+        self.streams = []
+        self.file = None
+        self.retries = 0
+        self.speed = 0.0
+        self.speed_bytes = 0
+        self.speed_since = time.monotonic()
+
+    def received(self):
+        return sum(segment[2] for segment in self.segments)
+
+    def part_path(self):
+        return self.path if self.item is not None else self.path + PART_SUFFIX
+
+    def to_json(self):
+        return {
+            "url": self.url,
+            "path": self.path,
+            "state": self.state,
+            "total": self.total,
+            "segments": [list(segment) for segment in self.segments],
+            "validator": self.validator,
+            "resumable": self.resumable,
+            "sha256": self.sha256,
+            "expected_sha256": self.expected_sha256,
+            "error": self.error,
+            "rate_kbps": self.bucket.kbps,
+            "engine": self.item is not None or None,
+        }
+
+    @classmethod
+    def from_json(cls, download_id, data):
+        download = cls(
+            download_id,
+            data["url"],
+            data["path"],
+            data.get("expected_sha256"),
+            data.get("rate_kbps", 0),
+        )
+        download.total = data.get("total")
+        download.segments = [list(segment) for segment in data.get("segments", [])]
+        download.validator = data.get("validator")
+        download.resumable = data.get("resumable", True)
+        download.sha256 = data.get("sha256")
+        download.error = data.get("error")
+        download.state = data.get("state", "paused")
+        # Transfers that were running when the browser closed wait to be
+        # resumed; the engine's own downloads can't be
+        if download.state in ("queued", "active", "verifying"):
+            if data.get("engine"):
+                download.state, download.error = "failed", "interrupted"
+            else:
+                download.state = "paused"
+        return download
+
+
+class Stream:
+    # A reply fetching one segment of a download
+    def __init__(self, reply, segment, probe):
+        self.reply = reply
+        self.segment = segment
+        # The first request of a new download, which finds out the size and
+        # whether the server supports ranges
+        self.probe = probe
+        self.checked = False
+        self.finished = False
+
+
+class ChecksumWorker(QObject):
+    # Hashes finished downloads on a background thread
+    hashed = pyqtSignal(int, str)
+
+    @pyqtSlot(int, str)
+    def hash(self, download_id, path):
+        digest = hashlib.sha256()
+        try:
+            with open(path, "rb") as data:
+                for block in iter(lambda: data.read(1024 * 1024), b""):
+                    digest.update(block)
+        except OSError:
+            self.hashed.emit(download_id, "")
+            return
+        self.hashed.emit(download_id, digest.hexdigest())
+
+
+class DownloadManager(QObject):
+    # Queue of downloads, at most max_active at a time. HTTP(S) downloads
+    # are fetched here with range requests, so they can be paused, resumed
+    # after a restart (progress is kept in a JSON file), throttled, and
+    # split into parallel segments when they are big. Every finished file
+    # is hashed (SHA-256) off the UI thread and checked against the
+    # expected sum, if there is one.
+    changed = pyqtSignal()
+    hash_requested = pyqtSignal(int, str)
+
+    def __init__(
+        self,
+        state_path,
+        max_active=MAX_ACTIVE,
+        rate_kbps=RATE_KBPS,
+        segmented_min_mb=SEGMENTED_MIN_MB,
+        segments=SEGMENTS,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.state_path = state_path
+        self.max_active = max_active
+        self.segmented_min = segmented_min_mb * 1024 * 1024
+        self.segment_count = segments
+        self.bucket = TokenBucket(rate_kbps)
+        self.user_agent = None
+        # URLs pages have posted forms to, see form_posted
+        self.form_posts = collections.OrderedDict()
+        self.downloads = []
+        self.queue = collections.deque()
+        self.next_id = 0
+        self.stats = {"completed": 0, "failed": 0, "segmented": 0, "bytes": 0}
+        self.last_changed = 0.0
+
+        self.network = QNetworkAccessManager(self)
+        self.network.setRedirectPolicy(QNetworkRequest.NoLessSafeRedirectPolicy)
+
+        self.thread = QThread(self)
+        self.worker = ChecksumWorker()
+        self.worker.moveToThread(self.thread)
+        self.hash_requested.connect(self.worker.hash)
+        self.worker.hashed.connect(self.hashed)
+        self.thread.start()
+
+        self.tick_timer = QTimer(self)
+        self.tick_timer.setInterval(TICK_MS)
+        self.tick_timer.timeout.connect(self.tick)
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(SAVE_INTERVAL_MS)
+        self.save_timer.timeout.connect(self.save)
+
+        try:
+            with open(state_path) as state:
+                entries = json.load(state)
+            for data in entries:
+                self.downloads.append(Download.from_json(self.new_id(), data))
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    def new_id(self):
+        self.next_id += 1
+        return self.next_id
+
+    def find(self, download_id):
+        for download in self.downloads:
+            if download.id == download_id:
+                return download
+        return None
+
+    def share_cookies(self, cookie_store):
+        # Send the cookies of the web pages with download requests
+        jar = QNetworkCookieJar(self)
+        self.network.setCookieJar(jar)
+        cookie_store.cookieAdded.connect(jar.insertCookie)
+        cookie_store.cookieRemoved.connect(jar.deleteCookie)
+        cookie_store.loadAllCookies()
+
+    def set_rate(self, kbps, download=None):
+        # Cap for one download, or for all of them together
+        (download.bucket if download is not None else self.bucket).set_rate(kbps)
+        self.save()
+
+    def form_posted(self, qurl):
+        # A page posted a form to qurl (TabRequestInterceptor). A file it
+        # answers with is the response to that post, a GET of the same URL
+        # would get something else.
+        url = qurl.adjusted(QUrl.RemoveFragment).toString()
+        self.form_posts.pop(url, None)
+        self.form_posts[url] = True
+        if len(self.form_posts) > MAX_FORM_POSTS:
+            self.form_posts.popitem(last=False)
+
+    def fetchable(self, item):
+        # Whether a plain GET of the item's URL, with the pages' cookies
+        # (share_cookies), gets the same file. Downloads answering a form
+        # post or needing credentials stay with the engine, which has the
+        # request that led to them.
+        qurl = item.url()
+        return (
+            qurl.scheme() in ("http", "https")
+            and not item.isSavePageDownload()
+            and not qurl.userInfo()
+            and qurl.adjusted(QUrl.RemoveFragment).toString() not in self.form_posts
+        )
+
+    def request(self, item):
+        # QWebEngineProfile.downloadRequested. Downloads a GET can fetch
+        # again (see fetchable) are left unaccepted, which cancels them in
+        # the engine, and fetched here; anything else (form posts, blob:,
+        # data:, saved pages) the engine keeps.
+        path = unique_path(
+            os.path.join(item.downloadDirectory(), item.downloadFileName()),
+            self.reserved_paths(),
+        )
+        if self.fetchable(item):
+            return self.add(item.url(), path)
+        item.setDownloadDirectory(os.path.dirname(path))
+        item.setDownloadFileName(os.path.basename(path))
+        item.accept()
+        download = Download(self.new_id(), item.url().toString(), path)
+        download.item = item
+        download.state = "active"
+        download.resumable = False
+        item.downloadProgress.connect(
+            lambda received, total: self.item_progress(download, received, total)
+        )
+        item.finished.connect(lambda: self.item_finished(download))
+        self.downloads.append(download)
+        self.set_changed()
+        return download
+
+    def add(self, qurl, path, sha256=None, rate_kbps=0):
+        # path is reserved right away, so downloads of the same file name
+        # queued before either has started get files of their own
+        path = unique_path(path, self.reserved_paths())
+        download = Download(self.new_id(), qurl.toString(), path, sha256, rate_kbps)
+        self.downloads.append(download)
+        self.queue.append(download)
+        self.schedule()
+        self.set_changed()
+        return download
+
+    def reserved_paths(self):
+        return {
+            download.path
+            for download in self.downloads
+            if download.state != "cancelled"
+        }
+
+    def active(self):
+        return [download for download in self.downloads if download.streams]
+
+    def schedule(self):
+        while self.queue and len(self.active()) < self.max_active:
+            self.start(self.queue.popleft())
+
+    def start(self, download):
+        download.state = "active"
+        download.error = None
+        download.retries = 0
+        part_path = download.part_path()
+        if not os.path.exists(part_path) or not download.resumable:
+            download.segments = []
+        os.makedirs(os.path.dirname(os.path.abspath(part_path)), exist_ok=True)
+        download.file = open(part_path, "r+b" if download.segments else "w+b")
+        if not download.segments:
+            segment = [0, None, 0]
+            download.segments = [segment]
+            self.open_stream(download, segment, probe=True)
+        else:
+            for segment in download.segments:
+                if segment_left(segment) != 0:
+                    self.open_stream(download, segment)
+            if not download.streams:
+                self.verify(download)
+        self.tick_timer.start()
+        self.save()
+
+    def open_stream(self, download, segment, probe=False):
+        request = QNetworkRequest(QUrl(download.url))
+        # Compressed transfers would not match the ranges or the size
+        request.setRawHeader(b"Accept-Encoding", b"identity")
+        start = segment[0] + segment[2]
+        end = "" if segment[1] is None else str(segment[1])
+        request.setRawHeader(b"Range", ("bytes=%d-%s" % (start, end)).encode())
+        if download.validator and not probe:
+            request.setRawHeader(b"If-Range", download.validator.encode("latin-1"))
+        if self.user_agent:
+            request.setHeader(QNetworkRequest.UserAgentHeader, self.user_agent)
+        reply = self.network.get(request)
+        reply.setReadBufferSize(CHUNK_BYTES * 2)
+        stream = Stream(reply, segment, probe)
+        download.streams.append(stream)
+        reply.metaDataChanged.connect(lambda: self.headers(download, stream))
+        reply.readyRead.connect(lambda: self.pump(download))
+        reply.finished.connect(lambda: self.stream_finished(download, stream))
+
+    def headers(self, download, stream):
+        reply = stream.reply
+        status = reply.attribute(QNetworkRequest.HttpStatusCodeAttribute)
+        if stream.checked or status is None or status >= 400:
+            return
+        stream.checked = True
+        if status != 206:
+            self.restart(download, stream)
+            length = reply.header(QNetworkRequest.ContentLengthHeader)
+            if length is not None:
+                stream.segment[1] = length - 1
+                download.total = length
+        else:
+            first, last, total = parse_content_range(
+                bytes(reply.rawHeader(b"Content-Range")).decode("latin-1")
+            )
+            if total is not None:
+                download.total = total
+            if stream.probe and total is not None:
+                stream.segment[1] = total - 1
+                if total >= self.segmented_min and self.segment_count > 1:
+                    self.split(download, stream)
+        if stream.probe or status != 206:
+            validator = reply.rawHeader(b"ETag") or reply.rawHeader(b"Last-Modified")
+            download.validator = bytes(validator).decode("latin-1") or None
+            if download.expected_sha256 is None:
+                download.expected_sha256 = parse_digest(reply)
+        self.set_changed()
+
+    def restart(self, download, stream):
+        # The server sent the whole file (it doesn't do ranges, or the file
+        # changed since the first part): go on with this response alone
+        others = [other for other in download.streams if other is not stream]
+        download.streams = [stream]
+        for other in others:
+            self.drop_stream(other)
+        stream.segment[:] = [0, None, 0]
+        download.segments = [stream.segment]
+        download.resumable = False
+        download.file.truncate(0)
+
+    def split(self, download, stream):
+        # The first response keeps the first part, the others are requested
+        # in parallel
+        total = download.total
+        size = -(-total // self.segment_count)
+        stream.segment[1] = size - 1
+        for start in range(size, total, size):
+            segment = [start, min(start + size, total) - 1, 0]
+            download.segments.append(segment)
+            self.open_stream(download, segment)
+        self.stats["segmented"] += 1
+
+    def pump(self, download):
+        # Moves what the bandwidth caps allow from the replies to the file
+        for stream in list(download.streams):
+            reply, segment = stream.reply, stream.segment
+            while stream.checked:
+                size = min(
+                    reply.bytesAvailable(),
+                    CHUNK_BYTES,
+                    self.bucket.allowance(),
+                    download.bucket.allowance(),
+                )
+                left = segment_left(segment)
+                if left is not None:
+                    size = min(size, left)
+                if size <= 0:
+                    break
+                data = reply.read(size)
+                download.file.seek(segment[0] + segment[2])
+                download.file.write(data)
+                segment[2] += len(data)
+                self.bucket.take(len(data))
+                download.bucket.take(len(data))
+                download.speed_bytes += len(data)
+                self.stats["bytes"] += len(data)
+            if segment_left(segment) == 0 or (
+                stream.finished and (not stream.checked or not reply.bytesAvailable())
+            ):
+                self.end_stream(download, stream)
+        if not self.save_timer.isActive():
+            self.save_timer.start()
+
+    def stream_finished(self, download, stream):
+        if stream in download.streams:
+            stream.finished = True
+            self.pump(download)
+
+    def drop_stream(self, stream):
+        # Stops a reply. It has to be out of its download's streams already,
+        # so the finished signal that abort() emits is ignored.
+        stream.finished = True
+        stream.reply.abort()
+        stream.reply.deleteLater()
+
+    def end_stream(self, download, stream):
+        download.streams.remove(stream)
+        segment = stream.segment
+        error = stream.reply.error() if stream.finished else QNetworkReply.NoError
+        error_text = stream.reply.errorString()
+        if not stream.finished:
+            # The segment is complete, the rest of the response isn't needed
+            self.drop_stream(stream)
+        else:
+            stream.reply.deleteLater()
+        if segment[1] is None and error == QNetworkReply.NoError:
+            # No length given, the response ended with the file
+            segment[1] = segment[0] + segment[2] - 1
+            download.total = segment[2]
+        if segment_left(segment) != 0:
+            if (
+                error in RETRY_ERRORS
+                and download.resumable
+                and download.retries < MAX_RETRIES
+            ):
+                download.retries += 1
+                self.open_stream(download, segment)
+                return
+            if error == QNetworkReply.NoError:
+                error_text = "connection closed early"
+            self.fail(download, error_text)
+            return
+        if not download.streams and download.state == "active":
+            self.verify(download)
+
+    def halt(self, download, state):
+        # Stops the transfer, keeping what arrived
+        streams, download.streams = download.streams, []
+        for stream in streams:
+            self.drop_stream(stream)
+        if download.file is not None:
+            download.file.close()
+            download.file = None
+        if download in self.queue:
+            self.queue.remove(download)
+        download.state = state
+        download.speed = 0.0
+        self.save()
+        self.set_changed()
+        self.schedule()
+
+    def fail(self, download, error):
+        download.error = error
+        self.stats["failed"] += 1
+        self.halt(download, "failed")
+
+    def pause(self, download):
+        if download.item is not None:
+            download.item.pause()
+            download.state = "paused"
+            self.set_changed()
+        elif download.state in ("queued", "active"):
+            self.halt(download, "paused")
+
+    def resume(self, download):
+        if download.item is not None:
+            if download.state == "paused":
+                download.item.resume()
+                download.state = "active"
+                self.set_changed()
+        elif download.state in ("paused", "failed"):
+            download.state = "queued"
+            download.error = None
+            self.queue.append(download)
+            self.schedule()
+            self.set_changed()
+
+    def cancel(self, download):
+        if download.item is not None:
+            download.item.cancel()
+            return
+        if download.state in ("queued", "active", "paused", "failed"):
+            self.halt(download, "cancelled")
+            try:
+                os.remove(download.part_path())
+            except OSError:
+                pass
+
+    def clear(self):
+        # Forgets downloads that are over, the files stay
+        self.downloads = [
+            download
+            for download in self.downloads
+            if download.state not in ("done", "cancelled")
+        ]
+        self.save()
+        self.set_changed()
+
+    def verify(self, download):
+        if download.file is not None:
+            download.file.close()
+            download.file = None
+        download.state = "verifying"
+        download.speed = 0.0
+        self.hash_requested.emit(download.id, download.part_path())
+        self.set_changed()
+        self.schedule()
+
+    def hashed(self, download_id, digest):
+        download = self.find(download_id)
+        if download is None or download.state != "verifying":
+            return
+        download.sha256 = digest or None
+        if not digest:
+            self.fail(download, "could not read the file")
+            return
+        if download.expected_sha256 and download.expected_sha256 != digest:
+            # Kept as .part, so the damaged file isn't mistaken for the real one
+            self.fail(download, "checksum mismatch")
+            return
+        if download.item is None:
+            os.replace(download.part_path(), download.path)
+        download.state = "done"
+        self.stats["completed"] += 1
+        self.save()
+        self.set_changed()
+
+    def check_sum(self, download, expected):
+        # Compares a finished download with a published SHA-256
+        download.expected_sha256 = expected.strip().lower() or None
+        self.save()
+        self.set_changed()
+        return (
+            download.sha256 is not None and download.sha256 == download.expected_sha256
+        )
+
+    def item_progress(self, download, received, total):
+        download.total = total if total > 0 else None
+        download.segments = [[0, download.total and download.total - 1, received]]
+        download.speed_bytes += received - download.received()
+        self.set_changed(throttle=True)
+
+    def item_finished(self, download):
+        state = download.item.state()
+        if state == QWebEngineDownloadItem.DownloadCompleted:
+            self.verify(download)
+        elif state == QWebEngineDownloadItem.DownloadCancelled:
+            download.state = "cancelled"
+        else:
+            download.error = download.item.interruptReasonString()
+            download.state = "failed"
+            self.stats["failed"] += 1
+        self.save()
+        self.set_changed()
+
+    def tick(self):
+        now = time.monotonic()
+        running = False
+        for download in self.downloads:
+            if download.state != "active":
+                continue
+            running = True
+            if download.streams:
+                self.pump(download)
+            if now - download.speed_since >= SPEED_INTERVAL_S:
+                download.speed = download.speed_bytes / (now - download.speed_since)
+                download.speed_bytes = 0
+                download.speed_since = now
+        if not running:
+            self.tick_timer.stop()
+        self.set_changed(throttle=True)
+
+    def set_changed(self, throttle=False):
+        now = time.monotonic()
+        if throttle and (now - self.last_changed) * 1000 < CHANGED_INTERVAL_MS:
+            return
+        self.last_changed = now
+        self.changed.emit()
+
+    def save(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.state_path)), exist_ok=True)
+        temp_path = self.state_path + ".tmp"
+        with open(temp_path, "w") as state:
+            json.dump(
+                [
+                    download.to_json()
+                    for download in self.downloads
+                    if download.state != "cancelled"
+                ],
+                state,
+            )
+        os.replace(temp_path, self.state_path)
+
+    def stop(self):
+        # Running transfers are saved as paused, to be resumed next time
+        self.max_active = 0
+        for download in self.downloads:
+            if download.streams or download in self.queue:
+                self.halt(download, "paused")
+        self.save()
+        self.tick_timer.stop()
+        self.thread.quit()
+        self.thread.wait()
+
+    def report(self):
+        if not any(self.stats.values()):
+            return
+        print(
+            "downloads: %(completed)d completed, %(failed)d failed,"
+            " %(segmented)d segmented, %(mb).1f MB transferred"
+            % dict(self.stats, mb=self.stats["bytes"] / 1024 / 1024),
+            file=sys.stderr,
+        )
+
+
+def status_text(download):
+    if download.state == "failed":
+        return "FAILED: %s" % (download.error or "?")
+    if download.state == "done" and download.expected_sha256:
+        if download.sha256 == download.expected_sha256:
+            return "DONE, SUM OK"
+        return "DONE, SUM BAD"
+    return download.state.upper()
+
+
+def progress_bar(download, width=10):
+    # "[#####-----] 50%"
+    received, total = download.received(), download.total
+    if not total:
+        return format_size(received)
+    share = min(1.0, received / total)
+    filled = int(share * width)
+    return "[%s%s] %d%%" % ("#" * filled, "-" * (width - filled), share * 100)
+
+
+class DownloadsPanel(QWidget):
+    # 8-bit downloads panel: one row per download with its progress, speed
+    # and state, and buttons for the selected one
+    def __init__(self, manager, parent=None):
+        super().__init__(parent, Qt.Window)
+        self.manager = manager
+        self.setWindowTitle("OR-BIT Downloads")
+        self.setStyleSheet(TASK_MANAGER_STYLE)
+        self.setFont(QFont("Press Start 2P", 8))
+        self.resize(800, 320)
+
+        self.table = QTableWidget(0, 5, self)
+        self.table.setHorizontalHeaderLabels(
+            ["FILE", "SIZE", "PROGRESS", "SPEED", "STATUS"]
+        )
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.table.verticalHeader().hide()
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+
+        buttons = QHBoxLayout()
+        for label, action in (
+            ("PAUSE", self.manager.pause),
+            ("RESUME", self.manager.resume),
+            ("CANCEL", self.manager.cancel),
+            ("LIMIT", self.limit_selected),
+            ("VERIFY", self.verify_selected),
+            ("FOLDER", self.open_folder),
+        ):
+            button = QPushButton(label)
+            button.clicked.connect(
+                lambda checked, action=action: self.on_selected(action)
+            )
+            buttons.addWidget(button)
+        clear_btn = QPushButton("CLEAR")
+        clear_btn.clicked.connect(self.manager.clear)
+        buttons.addWidget(clear_btn)
+        buttons.addStretch()
+        buttons.addWidget(QLabel("ALL KB/S"))
+        self.rate_box = QSpinBox()
+        self.rate_box.setRange(0, 1000000)
+        self.rate_box.setSpecialValueText("MAX")
+        self.rate_box.setValue(self.manager.bucket.kbps)
+        self.rate_box.valueChanged.connect(lambda kbps: self.manager.set_rate(kbps))
+        buttons.addWidget(self.rate_box)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.table)
+        layout.addLayout(buttons)
+
+        self.rows = []
+        manager.changed.connect(self.refresh)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+
+    def refresh(self):
+        if not self.isVisible():
+            return
+        self.rows = list(reversed(self.manager.downloads))
+        self.table.setRowCount(len(self.rows))
+        for row, download in enumerate(self.rows):
+            speed = "%s/s" % format_size(download.speed) if download.speed else "-"
+            if download.bucket.kbps:
+                speed += " (MAX %d KB/S)" % download.bucket.kbps
+            cells = (
+                os.path.basename(download.path),
+                format_size(download.total),
+                progress_bar(download),
+                speed,
+                status_text(download),
+            )
+            for column, text in enumerate(cells):
+                item = QTableWidgetItem(text)
+                if column in (1, 3):
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                if column == 0:
+                    item.setToolTip(download.url)
+                self.table.setItem(row, column, item)
+
+    def on_selected(self, action):
+        row = self.table.currentRow()
+        if 0 <= row < len(self.rows):
+            action(self.rows[row])
+
+    def limit_selected(self, download):
+        kbps, ok = QInputDialog.getInt(
+            self,
+            "Limit",
+            "KB/S for this download (0 = no limit):",
+            download.bucket.kbps,
+            0,
+            1000000,
+        )
+        if ok:
+            self.manager.set_rate(kbps, download)
+            self.refresh()
+
+    def verify_selected(self, download):
+        expected, ok = QInputDialog.getText(
+            self, "Verify", "Published SHA-256:", text=download.expected_sha256 or ""
+        )
+        if ok:
+            self.manager.check_sum(download, expected)
+
+    def open_folder(self, download):
+        QDesktopServices.openUrl(
+            QUrl.fromLocalFile(os.path.dirname(os.path.abspath(download.path)))
+        )
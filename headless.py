@@ -0,0 +1,309 @@
+import argparse
+import collections
+import json
+import os
+import re
+import sys
+import time
+
+# Nothing is shown; must be set before Qt is loaded
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QObject, QSize, QTimer, QUrl, pyqtSignal
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtWebEngineWidgets import QWebEnginePage, QWebEngineProfile, QWebEngineView
+
+from browser import apply_web_engine_settings
+from schemes import OrbitSchemeHandler
+from theme import RetroTheme, serve_font
+
+FORMATS = {"png": "png", "pdf": "pdf", "text": "txt"}
+JOBS = 4
+TIMEOUT_S = 30
+RETRIES = 1
+# Time given to the page to paint after loadFinished before it is captured
+SETTLE_MS = 250
+VIEWPORT = QSize(1280, 800)
+
+
+def normalize_url(text):
+    if "://" not in text and not text.startswith(("about:", "data:", "file:")):
+        return "http://" + text
+    return text
+
+
+def output_name(index, url):
+    slug = re.sub(r"[^a-zA-Z0-9]+", "-", QUrl(url).host() or url).strip("-")
+    return "%05d-%s" % (index, slug[:60] or "page")
+
+
+class Job:
+    def __init__(self, index, url):
+        self.index = index
+        self.url = url
+        self.attempts = 0
+
+
+class RenderSlot(QObject):
+    # One page of the pool: loads a job, captures it, reports the result
+    finished = pyqtSignal(object, dict)
+
+    def __init__(self, profile, output_format, out_dir, timeout_s, parent=None):
+        super().__init__(parent)
+        self.profile = profile
+        self.output_format = output_format
+        self.out_dir = out_dir
+        self.job = None
+        self.rendering = False
+        # Bumped per job so callbacks of an abandoned job are ignored
+        self.generation = 0
+
+        # A view (shown on the offscreen platform) so there is something
+        # to grab for screenshots
+        self.view = QWebEngineView()
+        self.view.resize(VIEWPORT)
+        self.view.show()
+        self.page = None
+        self.new_page()
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(int(timeout_s * 1000))
+        self.timer.timeout.connect(self.timed_out)
+
+    def new_page(self):
+        if self.page is not None:
+            self.page.deleteLater()
+        self.page = QWebEnginePage(self.profile, self.view)
+        self.view.setPage(self.page)
+        self.page.loadFinished.connect(self.loaded)
+        self.page.pdfPrintingFinished.connect(self.pdf_printed)
+
+    def start(self, job):
+        self.job = job
+        self.rendering = False
+        self.generation += 1
+        self.started = time.perf_counter()
+        job.attempts += 1
+        self.timer.start()
+        self.page.setUrl(QUrl(job.url))
+
+    def path(self):
+        return os.path.join(
+            self.out_dir,
+            "%s.%s"
+            % (output_name(self.job.index, self.job.url), FORMATS[self.output_format]),
+        )
+
+    def loaded(self, ok):
+        if self.job is None or self.rendering:
+            return
+        if not ok:
+            self.finish(error="load failed")
+            return
+        self.rendering = True
+        generation = self.generation
+        QTimer.singleShot(SETTLE_MS, lambda: self.render(generation))
+
+    def render(self, generation):
+        if generation != self.generation or self.job is None:
+            return
+        path = self.path()
+        if self.output_format == "png":
+            if self.view.grab().save(path):
+                self.finish(path=path)
+            else:
+                self.finish(error="could not save screenshot")
+        elif self.output_format == "pdf":
+            self.page.printToPdf(path)
+        else:
+            self.page.toPlainText(
+                lambda text: self.text_ready(generation, path, text)
+            )
+
+    def pdf_printed(self, path, ok):
+        if self.job is None or path != self.path():
+            return
+        if ok:
+            self.finish(path=path)
+        else:
+            self.finish(error="could not print PDF")
+
+    def text_ready(self, generation, path, text):
+        if generation != self.generation or self.job is None:
+            return
+        with open(path, "w", encoding="utf-8") as out:
+            out.write(text)
+        self.finish(path=path)
+
+    def timed_out(self):
+        # The abandoned load could still report back, start the next job
+        # on a fresh page
+        self.page.loadFinished.disconnect(self.loaded)
+        self.page.pdfPrintingFinished.disconnect(self.pdf_printed)
+        self.page.triggerAction(QWebEnginePage.Stop)
+        self.new_page()
+        self.finish(error="timeout")
+
+    def finish(self, path=None, error=None):
+        self.timer.stop()
+        job, self.job = self.job, None
+        self.generation += 1
+        result = {
+            "url": job.url,
+            "ok": error is None,
+            "format": self.output_format,
+            "attempts": job.attempts,
+            "ms": round((time.perf_counter() - self.started) * 1000, 1),
+        }
+        if path is not None:
+            result["path"] = path
+            result["bytes"] = os.path.getsize(path)
+        if error is not None:
+            result["error"] = error
+        self.finished.emit(job, result)
+
+
+class BatchRenderer(QObject):
+    # Feeds a queue of URLs through a bounded pool of pages and writes one
+    # JSON line per URL as soon as it is done
+    done = pyqtSignal(dict)
+
+    def __init__(
+        self,
+        urls,
+        output_format="png",
+        out_dir=".",
+        jobs=JOBS,
+        timeout_s=TIMEOUT_S,
+        retries=RETRIES,
+        style=True,
+        results=sys.stdout,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.queue = collections.deque(
+            Job(i, normalize_url(url)) for i, url in enumerate(urls)
+        )
+        self.total = len(self.queue)
+        self.retries = retries
+        self.results = results
+        self.completed = 0
+        self.failed = 0
+        self.summary = None
+        os.makedirs(out_dir, exist_ok=True)
+
+        # Same page settings and 8-bit style as the browser, in an
+        # off-the-record profile so batch jobs leave nothing on disk
+        self.profile = QWebEngineProfile(self)
+        apply_web_engine_settings(self.profile.settings())
+        if style:
+            self.retro_theme = RetroTheme(self.profile)
+            # The style's font comes from orbit://fonts
+            self.scheme_handler = OrbitSchemeHandler(self)
+            self.scheme_handler.add_host("fonts", serve_font, public=True)
+            self.scheme_handler.install(self.profile)
+
+        self.slots = []
+        for _ in range(max(1, min(jobs, self.total))):
+            slot = RenderSlot(self.profile, output_format, out_dir, timeout_s, self)
+            slot.finished.connect(
+                lambda job, result, slot=slot: self.job_finished(slot, job, result)
+            )
+            self.slots.append(slot)
+
+    def start(self):
+        self.started = time.perf_counter()
+        if not self.queue:
+            QTimer.singleShot(0, self.finish)
+            return
+        for slot in self.slots:
+            self.next_job(slot)
+
+    def next_job(self, slot):
+        if self.queue:
+            slot.start(self.queue.popleft())
+        elif all(other.job is None for other in self.slots):
+            self.finish()
+
+    def job_finished(self, slot, job, result):
+        if not result["ok"] and job.attempts <= self.retries:
+            self.queue.append(job)
+        else:
+            self.completed += 1
+            self.failed += not result["ok"]
+            self.results.write(json.dumps(result) + "\n")
+            self.results.flush()
+        # Leave the signal handler before the slot's page starts over
+        QTimer.singleShot(0, lambda: self.next_job(slot))
+
+    def finish(self):
+        if self.summary is not None:
+            return
+        seconds = time.perf_counter() - self.started
+        self.summary = summary = {
+            "pages": self.completed,
+            "failed": self.failed,
+            "seconds": round(seconds, 2),
+            "pages_per_second": round(self.completed / seconds, 2) if seconds else 0,
+        }
+        print("headless: %s" % json.dumps(summary), file=sys.stderr)
+        # The views are top level widgets, nothing else deletes them
+        for slot in self.slots:
+            slot.view.deleteLater()
+        self.done.emit(summary)
+
+
+def read_urls(sources):
+    urls = []
+    for source in sources:
+        if source == "-" or os.path.isfile(source):
+            lines = sys.stdin if source == "-" else open(source, encoding="utf-8")
+            urls.extend(line.strip() for line in lines if line.strip())
+        else:
+            urls.append(source)
+    return urls
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(
+        description="Render URLs to screenshots, PDFs or text without a window"
+    )
+    parser.add_argument(
+        "urls", nargs="+", help="URLs, files with one URL per line, or - for stdin"
+    )
+    parser.add_argument("-f", "--format", choices=sorted(FORMATS), default="png")
+    parser.add_argument("-o", "--out-dir", default="headless_output")
+    parser.add_argument("-j", "--jobs", type=int, default=JOBS)
+    parser.add_argument("-t", "--timeout", type=float, default=TIMEOUT_S)
+    parser.add_argument("-r", "--retries", type=int, default=RETRIES)
+    parser.add_argument("--results", help="JSONL results file (default stdout)")
+    parser.add_argument(
+        "--no-style", action="store_true", help="don't apply the 8-bit page style"
+    )
+    args = parser.parse_args(argv)
+
+    app = QApplication(sys.argv[:1])
+    results = open(args.results, "w") if args.results else sys.stdout
+    renderer = BatchRenderer(
+        read_urls(args.urls),
+        output_format=args.format,
+        out_dir=args.out_dir,
+        jobs=args.jobs,
+        timeout_s=args.timeout,
+        retries=args.retries,
+        style=not args.no_style,
+        results=results,
+    )
+    summary = {}
+    renderer.done.connect(lambda result: (summary.update(result), app.quit()))
+    renderer.start()
+    app.exec_()
+    if results is not sys.stdout:
+        results.close()
+    return 1 if summary.get("failed") else 0
+
+
+if __name__ == "__main__":
+    # python headless.py -f pdf -j 8 urls.txt > results.jsonl
+    sys.exit(main(sys.argv[1:]))
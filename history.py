@@ -0,0 +1,374 @@
+import bisect
+import collections
+import heapq
+import itertools
+import os
+import re
+import sqlite3
+import time
+
+from PyQt5.QtCore import QObject, QStringListModel, QThread, Qt, pyqtSignal, pyqtSlot
+from PyQt5.QtWidgets import QCompleter
+
+# Frecency weight of a visit by age in days (first bucket that fits wins)
+RECENCY_BUCKETS = ((4, 100), (14, 70), (31, 50), (90, 30))
+OLD_VISIT_WEIGHT = 10
+# Prefixes shared by more tokens than this get a precomputed top list
+MERGE_LIMIT = 32
+PREFIX_TOP = 1000
+# Urls visited since the index was built are always checked
+RECENT_VISITS = 256
+# Give up on extra filter words after looking at this many candidates
+MAX_CANDIDATES = 1000
+SUGGESTIONS = 8
+# Bookmarks matching the input are listed first, at most this many
+BOOKMARK_SUGGESTIONS = 3
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS urls (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE,
+    title TEXT,
+    visit_count INTEGER NOT NULL DEFAULT 0,
+    last_visit REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS visits (
+    id INTEGER PRIMARY KEY,
+    url_id INTEGER NOT NULL,
+    time REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS visits_url ON visits (url_id);
+"""
+
+
+def frecency(visit_count, last_visit, now=None):
+    age_days = ((now or time.time()) - last_visit) / 86400
+    weight = OLD_VISIT_WEIGHT
+    for days, bucket_weight in RECENCY_BUCKETS:
+        if age_days <= days:
+            weight = bucket_weight
+            break
+    return visit_count * weight
+
+
+def tokenize(url, title):
+    text = url.lower().split("://", 1)[-1]
+    if text.startswith("www."):
+        text = text[4:]
+    return tuple(set(TOKEN_RE.findall(text + " " + (title or "").lower())))
+
+
+class HistoryStore:
+    def __init__(self, path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def record_visit(self, url, when=None):
+        # Returns (visit_count, last_visit) of the url after this visit
+        when = when or time.time()
+        with self.db:
+            row = self.db.execute(
+                "SELECT id, visit_count FROM urls WHERE url = ?", (url,)
+            ).fetchone()
+            if row is None:
+                url_id = self.db.execute(
+                    "INSERT INTO urls (url, visit_count, last_visit) VALUES (?, 1, ?)",
+                    (url, when),
+                ).lastrowid
+                visit_count = 1
+            else:
+                url_id, visit_count = row[0], row[1] + 1
+                self.db.execute(
+                    "UPDATE urls SET visit_count = ?, last_visit = ? WHERE id = ?",
+                    (visit_count, when, url_id),
+                )
+            self.db.execute(
+                "INSERT INTO visits (url_id, time) VALUES (?, ?)", (url_id, when)
+            )
+        return visit_count, when
+
+    def set_title(self, url, title):
+        with self.db:
+            self.db.execute("UPDATE urls SET title = ? WHERE url = ?", (title, url))
+
+    def rows(self):
+        return self.db.execute("SELECT url, title, visit_count, last_visit FROM urls")
+
+
+class SuggestionIndex:
+    # In-memory token index over the history. Urls are numbered in frecency
+    # order when the index is built, so every posting list is sorted best
+    # first and the best matches for a prefix come from a lazy merge.
+    def __init__(self, rows=()):
+        now = time.time()
+        ranked = sorted(
+            ((frecency(count, last, now), url, title) for url, title, count, last in rows),
+            reverse=True,
+        )
+        self.urls = [url for score, url, title in ranked]
+        self.titles = [title for score, url, title in ranked]
+        self.scores = [score for score, url, title in ranked]
+        self.ids = {url: i for i, url in enumerate(self.urls)}
+        # " token token ..." per url, so prefix checks are substring searches
+        self.url_tokens = []
+        self.postings = {}
+        for i, (score, url, title) in enumerate(ranked):
+            tokens = tokenize(url, title)
+            self.url_tokens.append(" " + " ".join(tokens))
+            for token in tokens:
+                self.postings.setdefault(token, []).append(i)
+        self.sorted_tokens = sorted(self.postings)
+        self.recent = collections.deque(maxlen=RECENT_VISITS)
+
+        # Prefixes that match too many tokens to merge per keystroke get their
+        # best urls precomputed. Ranges only shrink as prefixes grow, so each
+        # length only has to look inside the big ranges of the previous one.
+        self.top = {}
+        ranges = [(0, len(self.sorted_tokens))]
+        length = 1
+        while ranges:
+            big_ranges = []
+            for low, high in ranges:
+                start = low
+                for prefix, group in itertools.groupby(
+                    self.sorted_tokens[low:high], key=lambda token: token[:length]
+                ):
+                    size = sum(1 for token in group)
+                    if size > MERGE_LIMIT:
+                        self.top[prefix] = list(
+                            itertools.islice(self.merge(prefix), PREFIX_TOP)
+                        )
+                        big_ranges.append((start, start + size))
+                    start += size
+            ranges = big_ranges
+            length += 1
+
+    def add_tokens(self, i, tokens):
+        for token in tokens:
+            if token not in self.postings:
+                bisect.insort(self.sorted_tokens, token)
+            self.postings.setdefault(token, []).append(i)
+
+    def visit(self, url, title, visit_count, last_visit):
+        score = frecency(visit_count, last_visit)
+        i = self.ids.get(url)
+        if i is None:
+            i = len(self.urls)
+            self.ids[url] = i
+            self.urls.append(url)
+            self.titles.append(title)
+            self.scores.append(score)
+            tokens = tokenize(url, title)
+            self.url_tokens.append(" " + " ".join(tokens))
+            self.add_tokens(i, tokens)
+        else:
+            self.scores[i] = score
+        if i not in self.recent:
+            self.recent.append(i)
+
+        # Keep precomputed top lists in line with the new score
+        for prefix in {
+            token[:length]
+            for token in self.url_tokens[i].split()
+            for length in range(1, len(token) + 1)
+        }:
+            top = self.top.get(prefix)
+            if top is None:
+                continue
+            if i not in top:
+                top.append(i)
+            top.sort(key=self.scores.__getitem__, reverse=True)
+            del top[PREFIX_TOP:]
+
+    def set_title(self, url, title):
+        i = self.ids.get(url)
+        if i is None or self.titles[i] == title:
+            return
+        self.titles[i] = title
+        new_tokens = set(tokenize(url, title)) - set(self.url_tokens[i].split())
+        self.add_tokens(i, new_tokens)
+        self.url_tokens[i] += "".join(" " + token for token in new_tokens)
+
+    def matches(self, i, needles):
+        # needles are query words with a leading space, see suggest()
+        tokens = self.url_tokens[i]
+        return all(needle in tokens for needle in needles)
+
+    def merge(self, prefix):
+        # Yields the urls of every token starting with prefix in rank order.
+        # Posting lists only join the heap once their best url could be next,
+        # so a prefix shared by thousands of tokens only touches a few lists.
+        low, high = self.token_range(prefix)
+        lists = [self.postings[token] for token in self.sorted_tokens[low:high]]
+        waiting = [(postings[0], k) for k, postings in enumerate(lists)]
+        heapq.heapify(waiting)
+        heap = []
+        while True:
+            while waiting and (not heap or waiting[0][0] <= heap[0][0]):
+                first, k = heapq.heappop(waiting)
+                heapq.heappush(heap, (first, k, 0))
+            if not heap:
+                return
+            i, k, position = heap[0]
+            yield i
+            position += 1
+            if position < len(lists[k]):
+                heapq.heapreplace(heap, (lists[k][position], k, position))
+            else:
+                heapq.heappop(heap)
+
+    def token_range(self, prefix):
+        low = bisect.bisect_left(self.sorted_tokens, prefix)
+        high = bisect.bisect_left(self.sorted_tokens, prefix + "{")  # "{" sorts after z
+        return low, high
+
+    def candidates(self, word):
+        # Recently visited urls first (they are ranked last in the posting
+        # lists), then the precomputed top list, then everything else
+        recent = (i for i in self.recent if self.matches(i, (" " + word,)))
+        if word in self.top:
+            return itertools.chain(recent, self.top[word], self.merge(word))
+        return itertools.chain(recent, self.merge(word))
+
+    def suggest(self, text, limit=SUGGESTIONS):
+        # [(url, title)] of the best urls with a token starting with every word
+        words = set(TOKEN_RE.findall(text.lower()))
+        if not words:
+            return []
+
+        # Walk the candidates of the word matching the fewest tokens, filter
+        # by the rest
+        sizes = {}
+        for word in words:
+            low, high = self.token_range(word)
+            sizes[word] = (high - low, -len(word))
+        words = sorted(words, key=sizes.__getitem__)
+        needles = [" " + word for word in words[1:]]
+        found = []
+        seen = set()
+        for i in itertools.islice(self.candidates(words[0]), MAX_CANDIDATES):
+            if i in seen:
+                continue
+            seen.add(i)
+            if self.matches(i, needles):
+                found.append(i)
+                # Later urls were ranked lower at build time; collect a few
+                # extra so score changes since then can reorder them
+                if len(found) >= limit * 4:
+                    break
+
+        found.sort(key=self.scores.__getitem__, reverse=True)
+        return [(self.urls[i], self.titles[i]) for i in found[:limit]]
+
+
+class HistoryWorker(QObject):
+    # Owns the history database and index on a background thread
+    suggestions_ready = pyqtSignal(int, list)
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        self.latest_request = 0
+
+    @pyqtSlot()
+    def start(self):
+        self.store = HistoryStore(self.path)
+        self.index = SuggestionIndex(self.store.rows())
+
+    @pyqtSlot(str)
+    def record_visit(self, url):
+        visit_count, last_visit = self.store.record_visit(url)
+        self.index.visit(url, None, visit_count, last_visit)
+
+    @pyqtSlot(str, str)
+    def record_title(self, url, title):
+        self.store.set_title(url, title)
+        self.index.set_title(url, title)
+
+    @pyqtSlot(int, str)
+    def suggest(self, request_id, text):
+        # Skip requests the user has already typed past
+        if request_id != self.latest_request:
+            return
+        self.suggestions_ready.emit(request_id, self.index.suggest(text))
+
+    @pyqtSlot()
+    def stop(self):
+        self.store.close()
+
+
+class HistoryCompleter(QObject):
+    # URL bar autocomplete. Visits and lookups are sent to a HistoryWorker
+    # thread, results come back as signals, so typing never waits on ranking.
+    # Bookmarks come from bookmarks(text, limit), an indexed prefix lookup
+    # (BookmarkStore.search), and go before the history suggestions.
+    visit_requested = pyqtSignal(str)
+    title_requested = pyqtSignal(str, str)
+    suggest_requested = pyqtSignal(int, str)
+    stop_requested = pyqtSignal()
+
+    def __init__(self, url_bar, path, bookmarks=None, parent=None):
+        super().__init__(parent)
+        self.url_bar = url_bar
+        self.bookmarks = bookmarks
+        self.bookmark_urls = []
+        self.request_id = 0
+
+        self.model = QStringListModel(self)
+        self.completer = QCompleter(self.model, self)
+        self.completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.completer.setCaseSensitivity(Qt.CaseInsensitive)
+        self.url_bar.setCompleter(self.completer)
+        self.url_bar.textEdited.connect(self.request_suggestions)
+
+        self.thread = QThread(self)
+        self.worker = HistoryWorker(path)
+        self.worker.moveToThread(self.thread)
+        self.thread.started.connect(self.worker.start)
+        self.visit_requested.connect(self.worker.record_visit)
+        self.title_requested.connect(self.worker.record_title)
+        self.suggest_requested.connect(self.worker.suggest)
+        self.stop_requested.connect(self.worker.stop)
+        self.worker.suggestions_ready.connect(self.show_suggestions)
+
+    def start(self):
+        # Lookups made before this are answered once the index is built
+        self.thread.start()
+
+    def record_visit(self, qurl):
+        if qurl.scheme() in ("http", "https"):
+            self.visit_requested.emit(qurl.toString())
+
+    def record_title(self, qurl, title):
+        if title and qurl.scheme() in ("http", "https"):
+            self.title_requested.emit(qurl.toString(), title)
+
+    def request_suggestions(self, text):
+        self.request_id += 1
+        self.worker.latest_request = self.request_id
+        if self.bookmarks is not None:
+            self.bookmark_urls = [
+                url for _, _, url in self.bookmarks(text, BOOKMARK_SUGGESTIONS)
+            ]
+        self.suggest_requested.emit(self.request_id, text)
+
+    def show_suggestions(self, request_id, results):
+        if request_id != self.request_id:
+            return
+        urls = list(self.bookmark_urls)
+        urls += [url for url, title in results if url not in urls]
+        self.model.setStringList(urls[:SUGGESTIONS])
+        if urls and self.url_bar.hasFocus():
+            self.completer.complete()
+
+    def stop(self):
+        self.stop_requested.emit()
+        self.thread.quit()
+        self.thread.wait()
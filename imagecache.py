@@ -0,0 +1,277 @@
+import collections
+import hashlib
+import itertools
+import json
+import os
+import threading
+import time
+
+from PyQt5.QtCore import (
+    QBuffer,
+    QByteArray,
+    QIODevice,
+    QObject,
+    QSize,
+    QThread,
+    QUrl,
+    Qt,
+    pyqtSignal,
+    pyqtSlot,
+)
+from PyQt5.QtGui import QImage, QPixmap
+from PyQt5.QtWebEngineCore import QWebEngineUrlRequestJob
+
+# Decoded pixmaps kept in memory, least recently used dropped first
+MEMORY_CACHE_MB = 32
+# PNGs kept on disk, least recently used dropped first
+DISK_CACHE_MB = 64
+FAVICON_SIZE = QSize(32, 32)
+THUMBNAIL_SIZE = QSize(256, 160)
+# Pages get this long after loading to settle before their thumbnail is taken
+THUMBNAIL_DELAY_MS = 1000
+# index.json is written at most this often while images are being stored
+INDEX_SAVE_S = 10
+
+
+def favicon_key(qurl):
+    return "favicon:" + qurl.host()
+
+
+def thumbnail_key(qurl):
+    return "thumbnail:" + qurl.adjusted(QUrl.RemoveFragment).toString()
+
+
+def encode_png(image):
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.WriteOnly)
+    image.save(buffer, "PNG")
+    return bytes(data)
+
+
+class DiskImageStore:
+    # Content addressed PNGs (<root>/<2 hex>/<sha1>.png): keys pointing at
+    # identical images share one file. index.json maps keys to files and
+    # remembers file sizes, so nothing has to be scanned at startup. It is
+    # written every INDEX_SAVE_S at most and on close; entries newer than
+    # that are lost if the process dies, their files are written again when
+    # those images are stored again. The lock makes it safe to share
+    # between threads.
+    def __init__(self, root, max_bytes):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.saved = 0.0
+        self.dirty = False
+        # key -> [digest, time last used]
+        self.keys = {}
+        # digest -> bytes
+        self.blobs = {}
+        try:
+            with open(os.path.join(root, "index.json")) as index:
+                data = json.load(index)
+            self.keys = data["keys"]
+            self.blobs = data["blobs"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def path(self, digest):
+        return os.path.join(self.root, digest[:2], digest + ".png")
+
+    def put(self, key, data):
+        digest = hashlib.sha1(data).hexdigest()
+        with self.lock:
+            if digest not in self.blobs:
+                path = self.path(digest)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, "wb") as blob:
+                    blob.write(data)
+                self.blobs[digest] = len(data)
+            self.keys[key] = [digest, time.time()]
+            self.evict()
+            self.dirty = True
+            if time.time() - self.saved >= INDEX_SAVE_S:
+                self.save()
+        return digest
+
+    def get(self, key):
+        with self.lock:
+            entry = self.keys.get(key)
+            if entry is None:
+                return None
+            try:
+                with open(self.path(entry[0]), "rb") as blob:
+                    data = blob.read()
+            except OSError:
+                self.forget_blob(entry[0])
+                return None
+            entry[1] = time.time()
+            return data
+
+    def forget_blob(self, digest):
+        self.blobs.pop(digest, None)
+        self.keys = {
+            key: entry for key, entry in self.keys.items() if entry[0] != digest
+        }
+
+    def evict(self):
+        total = sum(self.blobs.values())
+        if total <= self.max_bytes:
+            return
+        # A file is as recent as the most recently used key pointing at it
+        last_used = {}
+        for digest, used in self.keys.values():
+            last_used[digest] = max(used, last_used.get(digest, 0))
+        for digest in sorted(self.blobs, key=lambda digest: last_used.get(digest, 0)):
+            if total <= self.max_bytes:
+                break
+            total -= self.blobs[digest]
+            try:
+                os.remove(self.path(digest))
+            except OSError:
+                pass
+            self.forget_blob(digest)
+
+    def save(self):
+        path = os.path.join(self.root, "index.json")
+        os.makedirs(self.root, exist_ok=True)
+        with open(path + ".tmp", "w") as index:
+            json.dump({"keys": self.keys, "blobs": self.blobs}, index)
+        os.replace(path + ".tmp", path)
+        self.saved = time.time()
+        self.dirty = False
+
+    def close(self):
+        # Last used times of reads are only written here
+        with self.lock:
+            self.save()
+
+
+class ImageWorker(QObject):
+    # Scales, encodes and stores images, and reads them back, off the UI
+    # thread. QImage (unlike QPixmap) may be used on any thread.
+    image_ready = pyqtSignal(str, QImage)
+    # request id, PNG bytes (empty if the key isn't on disk)
+    data_ready = pyqtSignal(int, bytes)
+
+    def __init__(self, store):
+        super().__init__()
+        self.store = store
+
+    @pyqtSlot(str, QImage, QSize)
+    def put(self, key, image, size):
+        if size.isValid() and (
+            image.width() > size.width() or image.height() > size.height()
+        ):
+            image = image.scaled(size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        self.store.put(key, encode_png(image))
+        self.image_ready.emit(key, image)
+
+    @pyqtSlot(str)
+    def load(self, key):
+        # A null image if the key isn't on disk or can't be decoded
+        data = self.store.get(key)
+        image = QImage()
+        if data is not None:
+            image.loadFromData(data, "PNG")
+        self.image_ready.emit(key, image)
+
+    @pyqtSlot(int, str)
+    def read(self, request_id, key):
+        self.data_ready.emit(request_id, self.store.get(key) or b"")
+
+
+class ImageCache(QObject):
+    # Favicons and tab thumbnails in two tiers: an LRU of pixmaps bounded by
+    # MEMORY_CACHE_MB in front of the disk store. pixmap() answers from
+    # memory; on a miss it returns None and image_ready follows once the
+    # image has been read from disk (if it is there). A key that wasn't on
+    # disk is looked up again on the next miss.
+    image_ready = pyqtSignal(str, QPixmap)
+    put_requested = pyqtSignal(str, QImage, QSize)
+    load_requested = pyqtSignal(str)
+    read_requested = pyqtSignal(int, str)
+
+    def __init__(
+        self, root, memory_mb=MEMORY_CACHE_MB, disk_mb=DISK_CACHE_MB, parent=None
+    ):
+        super().__init__(parent)
+        self.memory_bytes = memory_mb * 1024 * 1024
+        self.pixmaps = collections.OrderedDict()
+        self.used_bytes = 0
+        self.loading = set()
+        # request id -> orbit:// job waiting for PNG bytes
+        self.jobs = {}
+        self.request_ids = itertools.count()
+        self.stats = {"memory_hits": 0, "disk_reads": 0, "stored": 0}
+
+        self.store = DiskImageStore(root, disk_mb * 1024 * 1024)
+        self.thread = QThread(self)
+        self.worker = ImageWorker(self.store)
+        self.worker.moveToThread(self.thread)
+        self.put_requested.connect(self.worker.put)
+        self.load_requested.connect(self.worker.load)
+        self.read_requested.connect(self.worker.read)
+        self.worker.image_ready.connect(self.remember)
+        self.worker.data_ready.connect(self.reply)
+        self.thread.start()
+
+    def pixmap(self, key):
+        pixmap = self.pixmaps.get(key)
+        if pixmap is not None:
+            self.pixmaps.move_to_end(key)
+            self.stats["memory_hits"] += 1
+            return pixmap
+        if key not in self.loading:
+            self.loading.add(key)
+            self.stats["disk_reads"] += 1
+            self.load_requested.emit(key)
+        return None
+
+    def put(self, key, image, size=QSize()):
+        self.stats["stored"] += 1
+        self.put_requested.emit(key, image, size)
+
+    def serve(self, job, key):
+        # Answers an orbit:// job with the PNG of key, read from disk on the
+        # worker thread
+        request_id = next(self.request_ids)
+        self.jobs[request_id] = job
+        # The page went away or stopped loading the image
+        job.destroyed.connect(lambda: self.jobs.pop(request_id, None))
+        self.read_requested.emit(request_id, key)
+
+    def reply(self, request_id, data):
+        job = self.jobs.pop(request_id, None)
+        if job is None:
+            return
+        if not data:
+            job.fail(QWebEngineUrlRequestJob.UrlNotFound)
+            return
+        buffer = QBuffer(job)
+        buffer.setData(data)
+        buffer.open(QIODevice.ReadOnly)
+        job.reply(b"image/png", buffer)
+
+    def remember(self, key, image):
+        self.loading.discard(key)
+        if image.isNull():
+            return
+        pixmap = QPixmap.fromImage(image)
+        old = self.pixmaps.pop(key, None)
+        if old is not None:
+            self.used_bytes -= self.cost(old)
+        self.pixmaps[key] = pixmap
+        self.used_bytes += self.cost(pixmap)
+        while self.used_bytes > self.memory_bytes and len(self.pixmaps) > 1:
+            dropped_key, dropped = self.pixmaps.popitem(last=False)
+            self.used_bytes -= self.cost(dropped)
+        self.image_ready.emit(key, pixmap)
+
+    def cost(self, pixmap):
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+    def stop(self):
+        self.thread.quit()
+        self.thread.wait()
+        self.store.close()
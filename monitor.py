@@ -0,0 +1,232 @@
+import os
+import time
+
+from PyQt5.QtCore import QObject, Qt, QTimer, pyqtSignal
+from PyQt5.QtGui import QFont
+from PyQt5.QtWidgets import (
+    QAbstractItemView,
+    QHeaderView,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+from tabs import read_rss_mb
+
+# Renderers are sampled this often, and more often while the task manager
+# is open
+SAMPLE_INTERVAL_MS = 5000
+PANEL_SAMPLE_INTERVAL_MS = 1000
+# Share of system memory still available below which pressure is reported
+MODERATE_PRESSURE = 0.15
+CRITICAL_PRESSURE = 0.07
+
+TASK_MANAGER_STYLE = """
+    QWidget {
+        background-color: black;
+        color: #0f0;
+    }
+    QHeaderView::section {
+        background-color: black;
+        color: red;
+        border: 1px solid #0f0;
+    }
+    QPushButton {
+        border: 2px solid #0f0;
+        padding: 4px;
+    }
+"""
+
+
+def read_cpu_ticks(pid):
+    # User + system CPU time of a process in clock ticks (None if gone)
+    try:
+        with open("/proc/%d/stat" % pid) as stat:
+            fields = stat.read().rsplit(")", 1)[1].split()
+        return int(fields[11]) + int(fields[12])
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def read_meminfo():
+    # (available MB, total MB) of the system, (None, None) if unknown
+    values = {}
+    try:
+        with open("/proc/meminfo") as meminfo:
+            for line in meminfo:
+                name, value = line.split(":", 1)
+                values[name] = int(value.split()[0]) / 1024
+    except (OSError, ValueError):
+        return None, None
+    return values.get("MemAvailable"), values.get("MemTotal")
+
+
+class ProcessMonitor(QObject):
+    # Samples memory and CPU of the browser process and every tab's renderer
+    # from /proc. Each view gets a process_usage dict, and memory_pressure
+    # is emitted when the system runs low on available memory.
+    sampled = pyqtSignal()
+    memory_pressure = pyqtSignal(str, float)
+
+    def __init__(self, views, interval_ms=SAMPLE_INTERVAL_MS, parent=None):
+        super().__init__(parent)
+        self.views = views
+        self.interval_ms = interval_ms
+        self.ticks_per_second = os.sysconf("SC_CLK_TCK")
+        # pid -> (cpu ticks, time) at the previous sample
+        self.last_ticks = {}
+        self.usage = {}
+        self.pressure = None
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(interval_ms)
+        self.timer.timeout.connect(self.sample)
+
+    def start(self):
+        self.timer.start()
+
+    def set_fast(self, fast):
+        self.timer.setInterval(PANEL_SAMPLE_INTERVAL_MS if fast else self.interval_ms)
+
+    def watch(self, view):
+        view.process_usage = None
+        view.page().renderProcessTerminated.connect(
+            lambda status, code: self.forget(view)
+        )
+
+    def forget(self, view):
+        # A dead renderer's pid may be reused, don't diff against it
+        if view.process_usage is not None:
+            self.last_ticks.pop(view.process_usage["pid"], None)
+        view.process_usage = None
+
+    def cpu_percent(self, pid, now):
+        ticks = read_cpu_ticks(pid)
+        if ticks is None:
+            self.last_ticks.pop(pid, None)
+            return 0.0
+        last = self.last_ticks.get(pid)
+        self.last_ticks[pid] = (ticks, now)
+        if last is None or now <= last[1]:
+            return 0.0
+        return 100 * (ticks - last[0]) / self.ticks_per_second / (now - last[1])
+
+    def sample(self):
+        now = time.monotonic()
+        views = self.views()
+        pids = {}
+        for view in views:
+            pid = view.page().renderProcessPid()
+            if pid > 0:
+                pids.setdefault(pid, []).append(view)
+
+        usage = {
+            os.getpid(): {
+                "rss_mb": read_rss_mb(os.getpid()),
+                "cpu_pct": self.cpu_percent(os.getpid(), now),
+                "tabs": 0,
+            }
+        }
+        for pid, sharing in pids.items():
+            usage[pid] = {
+                "rss_mb": read_rss_mb(pid),
+                "cpu_pct": self.cpu_percent(pid, now),
+                "tabs": len(sharing),
+            }
+        for pid in set(self.last_ticks) - set(usage):
+            del self.last_ticks[pid]
+        self.usage = usage
+
+        for view in views:
+            pid = view.page().renderProcessPid()
+            view.process_usage = dict(usage[pid], pid=pid) if pid in usage else None
+        self.sampled.emit()
+        self.check_pressure()
+
+    def check_pressure(self):
+        available, total = read_meminfo()
+        if not available or not total:
+            return
+        share = available / total
+        if share < CRITICAL_PRESSURE:
+            level = "critical"
+        elif share < MODERATE_PRESSURE:
+            level = "moderate"
+        else:
+            level = None
+        # Critical pressure is reported on every sample until it is relieved
+        if level is not None and (level != self.pressure or level == "critical"):
+            self.memory_pressure.emit(level, available)
+        self.pressure = level
+
+
+class TaskManager(QWidget):
+    # 8-bit task manager: one row per tab with its renderer's memory and CPU
+    discard_requested = pyqtSignal(object)
+
+    def __init__(self, monitor, views, parent=None):
+        super().__init__(parent, Qt.Window)
+        self.monitor = monitor
+        self.views = views
+        self.setWindowTitle("OR-BIT Task Manager")
+        self.setStyleSheet(TASK_MANAGER_STYLE)
+        self.setFont(QFont("Press Start 2P", 8))
+        self.resize(640, 320)
+
+        self.table = QTableWidget(0, 4, self)
+        self.table.setHorizontalHeaderLabels(["TAB", "PID", "MEMORY", "CPU"])
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.table.verticalHeader().hide()
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+
+        discard_btn = QPushButton("DISCARD TAB")
+        discard_btn.clicked.connect(self.discard_selected)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.table)
+        layout.addWidget(discard_btn)
+
+        self.rows = []
+        monitor.sampled.connect(self.refresh)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.monitor.set_fast(True)
+        self.monitor.sample()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.monitor.set_fast(False)
+
+    def refresh(self):
+        if not self.isVisible():
+            return
+        browser_usage = self.monitor.usage.get(os.getpid())
+        rows = [("Browser", browser_usage, os.getpid(), None)]
+        for view in self.views():
+            usage = view.process_usage
+            title = view.title() or view.url().toString()
+            rows.append((title, usage, usage and usage["pid"], view))
+
+        self.rows = [view for title, usage, pid, view in rows]
+        self.table.setRowCount(len(rows))
+        for row, (title, usage, pid, view) in enumerate(rows):
+            cells = (
+                title,
+                str(pid) if pid else "-",
+                "%.0f MB" % usage["rss_mb"] if usage else "-",
+                "%.0f%%" % usage["cpu_pct"] if usage else "-",
+            )
+            for column, text in enumerate(cells):
+                item = QTableWidgetItem(text)
+                if column:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.table.setItem(row, column, item)
+
+    def discard_selected(self):
+        row = self.table.currentRow()
+        if 0 <= row < len(self.rows) and self.rows[row] is not None:
+            self.discard_requested.emit(self.rows[row])
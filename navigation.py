@@ -0,0 +1,199 @@
+import ipaddress
+import json
+import os
+import re
+import sys
+import time
+import urllib.parse
+
+from PyQt5.QtCore import QUrl
+
+# What the URL bar searches with when the input isn't an address
+SEARCH_URL = "https://www.google.com/search?q=%s"
+# Hosts that failed over HTTPS are tried over HTTPS again after this long
+HTTP_RETRY_S = 7 * 24 * 3600
+# Least recently seen hosts are forgotten beyond this many
+MAX_HOSTS = 5000
+
+# Loaded as they are, never upgraded
+URL_PREFIXES = ("about:", "data:", "file:", "javascript:", "view-source:")
+# "example.com", "example.com:8080/path?q", "localhost:8000", "[::1]/x"
+HOST_RE = re.compile(
+    r"^(?P<host>localhost|\[[0-9a-f:.]+\]|[^\s/?#:@]+\.[^\s/?#:@.]+)"
+    r"(?::\d{1,5})?(?:[/?#]\S*)?$",
+    re.IGNORECASE,
+)
+
+
+def classify(text):
+    # "url" (has a scheme), "host" (a bare address) or "search"
+    if "://" in text or text.lower().startswith(URL_PREFIXES):
+        return "search" if re.search(r"\s", text) else "url"
+    match = HOST_RE.match(text)
+    if match is None:
+        return "search"
+    # "3.14" or "1.5.2" is a search, only a whole IPv4 address is a host
+    host = match.group("host")
+    if re.fullmatch(r"[\d.]+", host):
+        try:
+            ipaddress.IPv4Address(host)
+        except ValueError:
+            return "search"
+    return "host"
+
+
+def is_local(host):
+    # Local development servers rarely speak HTTPS, don't try them
+    if host == "localhost" or host.endswith(".localhost"):
+        return True
+    try:
+        address = ipaddress.ip_address(host.strip("[]"))
+    except ValueError:
+        return False
+    return address.is_private or address.is_loopback or address.is_link_local
+
+
+class HttpsFirst:
+    # Loads bare addresses typed in the URL bar over HTTPS straight away,
+    # instead of over HTTP to be redirected, and falls back to HTTP when the
+    # HTTPS load fails to connect. What worked per host is kept in a JSON file, so
+    # known HTTP-only hosts skip the failing attempt and known HTTPS hosts
+    # are upgraded even when typed with http://.
+    def __init__(self, path):
+        self.path = path
+        # host -> [HTTPS works, time last seen]
+        self.hosts = {}
+        self.redirects_avoided = 0
+        self.stats = {
+            "upgrades": 0,
+            "fallbacks": 0,
+            "known_http": 0,
+            "certificate_errors": 0,
+        }
+        try:
+            with open(path) as cache:
+                data = json.load(cache)
+            self.hosts = data.get("hosts", {})
+            self.redirects_avoided = data.get("redirects_avoided", 0)
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def https_works(self, host):
+        # True, False, or None if unknown or due for another try
+        entry = self.hosts.get(host)
+        if entry is None:
+            return None
+        works, seen = entry
+        if not works and time.time() - seen > HTTP_RETRY_S:
+            return None
+        return works
+
+    def resolve(self, text):
+        # (QUrl to load for URL bar input, whether it is an HTTPS attempt
+        # that may need to fall back)
+        text = text.strip()
+        kind = classify(text)
+        if kind == "search":
+            return QUrl(SEARCH_URL % urllib.parse.quote_plus(text)), False
+        if kind == "url":
+            qurl = QUrl(text)
+            if qurl.scheme() == "http" and self.https_works(qurl.host()):
+                qurl.setScheme("https")
+                return qurl, True
+            return qurl, False
+
+        qurl = QUrl("https://" + text)
+        if is_local(qurl.host()):
+            qurl.setScheme("http")
+            return qurl, False
+        if self.https_works(qurl.host()) is False:
+            self.stats["known_http"] += 1
+            qurl.setScheme("http")
+            return qurl, False
+        return qurl, True
+
+    def attempt(self, view, qurl):
+        # Watch the view's load of an upgraded URL (and of its HTTP
+        # fallback), see load_started and load_finished
+        view.https_attempt = qurl
+        view.https_loads = 0
+        view.https_certificate_error = False
+        self.stats["upgrades"] += 1
+
+    def certificate_error(self, view):
+        # The page rejected a certificate during the view's load
+        if getattr(view, "https_attempt", None) is not None:
+            view.https_certificate_error = True
+
+    def load_started(self, view):
+        # Redirects are part of the load that started them; a second load
+        # is another navigation, which says nothing about HTTPS
+        if getattr(view, "https_attempt", None) is None:
+            return
+        view.https_loads += 1
+        if view.https_loads > 1:
+            view.https_attempt = None
+
+    def load_finished(self, view, ok):
+        attempt = getattr(view, "https_attempt", None)
+        if attempt is None:
+            return
+        view.https_attempt = None
+        host = attempt.host()
+        # A load cut short by another navigation may finish before that one
+        # starts; only fall back from a failure on the attempted host
+        if not ok and view.url().host() != host:
+            return
+        if attempt.scheme() == "http":
+            # The fallback: only remembered if it worked, a host that is
+            # down is not HTTP-only
+            if ok:
+                self.remember(host, False)
+            return
+        if ok:
+            # Also after a redirect to another host (example.com to
+            # www.example.com), unless it went back to HTTP
+            if view.url().scheme() == "https":
+                self.redirects_avoided += 1
+                self.remember(host, True)
+            return
+        # Anyone on the network can present a bad certificate; falling back
+        # would hand them the page over HTTP. The error page stays.
+        if view.https_certificate_error:
+            self.stats["certificate_errors"] += 1
+            return
+        self.stats["fallbacks"] += 1
+        fallback = QUrl(attempt)
+        fallback.setScheme("http")
+        view.setUrl(fallback)
+        view.https_attempt = fallback
+        view.https_loads = 0
+        view.https_certificate_error = False
+
+    def remember(self, host, works):
+        self.hosts[host] = [works, time.time()]
+        if len(self.hosts) > MAX_HOSTS:
+            oldest = sorted(self.hosts, key=lambda host: self.hosts[host][1])
+            for host in oldest[: len(self.hosts) - MAX_HOSTS]:
+                del self.hosts[host]
+        self.save()
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w") as cache:
+            json.dump(
+                {"hosts": self.hosts, "redirects_avoided": self.redirects_avoided},
+                cache,
+            )
+        os.replace(temp_path, self.path)
+
+    def report(self):
+        print(
+            "https-first: %(upgrades)d upgraded loads, %(fallbacks)d fell back to"
+            " HTTP, %(certificate_errors)d certificate errors not downgraded,"
+            " %(known_http)d known HTTP-only; %(avoided)d redirects avoided"
+            " in total"
+            % dict(self.stats, avoided=self.redirects_avoided),
+            file=sys.stderr,
+        )
@@ -0,0 +1,99 @@
+import html
+
+from PyQt5.QtCore import QUrl
+
+from bookmarks import BOOKMARK
+from schemes import quote_url
+from theme import FONT_FACE_CSS
+
+NEW_TAB_URL = "orbit://newtab"
+# Bookmarks from the start of the bar shown as speed dial tiles
+SPEED_DIAL_SIZE = 12
+
+NEW_TAB_PAGE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>New Tab</title>
+<style>
+%s
+    body {
+        background: #000;
+        color: #0f0;
+        font-family: "Press Start 2P", monospace;
+        margin: 0;
+        padding: 48px 24px;
+        text-align: center;
+    }
+    h1 { color: red; font-size: 32px; margin-bottom: 40px; }
+    form { margin-bottom: 48px; }
+    input {
+        background: #111;
+        border: 2px solid #0f0;
+        color: #0f0;
+        font: inherit;
+        padding: 10px;
+        width: 60%%;
+    }
+    .dial {
+        display: grid;
+        gap: 16px;
+        grid-template-columns: repeat(auto-fill, minmax(160px, 1fr));
+        margin: 0 auto;
+        max-width: 880px;
+    }
+    .dial a {
+        border: 2px solid #0f0;
+        color: #0f0;
+        display: block;
+        font-size: 10px;
+        overflow: hidden;
+        padding: 24px 8px;
+        text-decoration: none;
+        text-overflow: ellipsis;
+        white-space: nowrap;
+    }
+    .dial a:hover { background: #111; color: red; }
+    .dial img {
+        display: block;
+        height: 80px;
+        margin: -16px auto 16px;
+        max-width: 100%%;
+    }
+    .dial span { color: #080; display: block; font-size: 8px; margin-top: 12px; }
+    .empty { color: #080; font-size: 10px; }
+</style>
+</head>
+<body>
+<h1>OR-BIT</h1>
+<form action="https://www.google.com/search">
+    <input name="q" placeholder="SEARCH" autofocus>
+</form>
+%s
+</body>
+</html>
+"""
+
+
+def new_tab_page(store, size=SPEED_DIAL_SIZE):
+    # The new tab page: a search box and the first bookmarks of the bar,
+    # with their thumbnails where there are any (imagecache.py)
+    tiles = [
+        '<a href="%s" title="%s">'
+        '<img src="orbit://thumbnail/?url=%s" onerror="this.remove()">'
+        "%s<span>%s</span></a>"
+        % (
+            html.escape(url),
+            html.escape(title),
+            quote_url(QUrl(url)),
+            html.escape(title),
+            html.escape(QUrl(url).host()),
+        )
+        for item_id, kind, title, url in store.children(limit=size * 2)
+        if kind == BOOKMARK
+    ][:size]
+    if tiles:
+        dial = '<div class="dial">%s</div>' % "".join(tiles)
+    else:
+        dial = '<p class="empty">BOOKMARK PAGES WITH THE HEART TO SEE THEM HERE</p>'
+    return (NEW_TAB_PAGE % (FONT_FACE_CSS, dial)).encode("utf-8")
@@ -0,0 +1,338 @@
+import argparse
+import collections
+import hashlib
+import hmac
+import itertools
+import os
+import sys
+import time
+
+from PyQt5.QtCore import (
+    QBuffer,
+    QByteArray,
+    QIODevice,
+    QObject,
+    QSize,
+    QThread,
+    QUrl,
+    QUrlQuery,
+    Qt,
+    pyqtSignal,
+    pyqtSlot,
+)
+from PyQt5.QtGui import QImage
+from PyQt5.QtNetwork import QNetworkAccessManager, QNetworkReply, QNetworkRequest
+from PyQt5.QtWebEngineCore import QWebEngineUrlRequestJob
+
+from imagecache import DiskImageStore
+from schemes import query_url, quote_url
+
+PALETTES = {
+    "pico8": (
+        0x000000, 0x1D2B53, 0x7E2553, 0x008751, 0xAB5236, 0x5F574F, 0xC2C3C7, 0xFFF1E8,
+        0xFF004D, 0xFFA300, 0xFFEC27, 0x00E436, 0x29ADFF, 0x83769C, 0xFF77A8, 0xFFCCAA,
+    ),
+    "cga": (
+        0x000000, 0x0000AA, 0x00AA00, 0x00AAAA, 0xAA0000, 0xAA00AA, 0xAA5500, 0xAAAAAA,
+        0x555555, 0x5555FF, 0x55FF55, 0x55FFFF, 0xFF5555, 0xFF55FF, 0xFFFF55, 0xFFFFFF,
+    ),
+    "gameboy": (0x0F380F, 0x306230, 0x8BAC0F, 0x9BBC0F),
+}
+PALETTE = "pico8"
+# Images are scaled down to fit in this before they are quantized
+MAX_SIZE = QSize(480, 480)
+# Strength of the ordered dither, in 0-255 channel steps
+DITHER_SPREAD = 64
+# Transcoded images kept in profile/retro
+CACHE_MB = 128
+# Image URLs that failed are left alone; at most this many are remembered
+MAX_FAILED = 2000
+
+BAYER_4 = ((0, 8, 2, 10), (12, 4, 14, 6), (3, 11, 1, 9), (15, 7, 13, 5))
+
+
+def dither_tables(spread):
+    # One byte translation table per Bayer level: adds that level's offset
+    # to a channel value and keeps its top 4 bits. 16 levels per channel
+    # are plenty for the palettes, and leave at most 4096 distinct colours
+    # for the palette lookup (which Qt caches per colour).
+    tables = []
+    for level in range(16):
+        offset = int(((level + 0.5) / 16 - 0.5) * spread)
+        tables.append(
+            bytes(max(0, min(255, v + offset)) & 0xF0 | 0x08 for v in range(256))
+        )
+    return tables
+
+
+DITHER_TABLES = dither_tables(DITHER_SPREAD)
+
+
+def ordered_dither(image):
+    # Adds a 4x4 Bayer pattern to the colour channels of an ARGB32 image, so
+    # that after quantizing, areas between two palette colours alternate
+    # between them. Every fourth pixel of a row shares a pattern level, so
+    # each channel of those is offset with one bytes.translate over a
+    # strided slice rather than pixel by pixel.
+    width, height = image.width(), image.height()
+    stride = image.bytesPerLine()
+    bits = image.constBits()
+    bits.setsize(stride * height)
+    data = bytearray(bits.asstring())
+    for y in range(height):
+        start = y * stride
+        end = start + width * 4
+        levels = BAYER_4[y % 4]
+        for x, channel in itertools.product(range(4), range(3)):
+            first = start + x * 4 + channel
+            data[first:end:16] = data[first:end:16].translate(
+                DITHER_TABLES[levels[x]]
+            )
+    return QImage(bytes(data), width, height, stride, QImage.Format_ARGB32).copy()
+
+
+def color_table(palette, alpha):
+    colors = [0xFF000000 | color for color in PALETTES[palette]]
+    if alpha:
+        colors.append(0x00000000)
+    return colors
+
+
+def transcode(data, palette=PALETTE, max_size=MAX_SIZE):
+    # Encoded image -> indexed PNG bytes in the palette, None if the image
+    # can't be decoded
+    image = QImage()
+    if not image.loadFromData(data):
+        return None
+    alpha = image.hasAlphaChannel()
+    if image.width() > max_size.width() or image.height() > max_size.height():
+        image = image.scaled(max_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    image = ordered_dither(image.convertToFormat(QImage.Format_ARGB32))
+    image = image.convertToFormat(
+        QImage.Format_Indexed8,
+        color_table(palette, alpha),
+        Qt.ThresholdDither,
+    )
+    encoded = QByteArray()
+    buffer = QBuffer(encoded)
+    buffer.open(QIODevice.WriteOnly)
+    image.save(buffer, "PNG")
+    return bytes(encoded)
+
+
+def signature(secret, palette, qurl):
+    message = "%s %s" % (palette, qurl.toString(QUrl.FullyEncoded))
+    return hmac.new(secret, message.encode(), hashlib.sha256).hexdigest()[:32]
+
+
+def retro_url(qurl, palette, secret):
+    # Signed, so orbit://retro only fetches what the interceptor sent there
+    # and web pages can't use it as a proxy for URLs of their choosing
+    qurl = qurl.adjusted(QUrl.RemoveFragment)
+    return QUrl(
+        "orbit://retro/?palette=%s&url=%s&sig=%s"
+        % (palette, quote_url(qurl), signature(secret, palette, qurl))
+    )
+
+
+class RetroWorker(QObject):
+    # Looks up, transcodes and keeps the results on disk, off the UI thread
+    # request id, cache key, PNG (empty if it isn't cached)
+    looked_up = pyqtSignal(int, str, bytes)
+    # request id, PNG (empty if the image couldn't be decoded), seconds
+    transcoded = pyqtSignal(int, bytes, float)
+
+    def __init__(self, store):
+        super().__init__()
+        self.store = store
+
+    @pyqtSlot(int, str)
+    def lookup(self, request_id, key):
+        self.looked_up.emit(request_id, key, self.store.get(key) or b"")
+
+    @pyqtSlot(int, str, bytes)
+    def transcode(self, request_id, key, data):
+        started = time.perf_counter()
+        palette = key.split(":", 1)[0]
+        result = transcode(data, palette)
+        if result is not None:
+            self.store.put(key, result)
+        self.transcoded.emit(request_id, result or b"", time.perf_counter() - started)
+
+
+class RetroImages(QObject):
+    # Opt-in 8-bit images. The request interceptor sends page images to
+    # orbit://retro/?url=<image>, which fetches the original, scales it
+    # down and quantizes it to a retro palette with ordered dithering, and
+    # answers with an indexed PNG. Results are cached on disk by palette
+    # and URL, and looked up there on the worker thread. An image that
+    # can't be fetched or decoded is redirected to its original URL and not
+    # rewritten again.
+    lookup_requested = pyqtSignal(int, str)
+    transcode_requested = pyqtSignal(int, str, bytes)
+
+    def __init__(self, root, palette=PALETTE, enabled=None, parent=None):
+        super().__init__(parent)
+        self.palette = palette
+        # enabled(site) says whether images on the pages of site are rewritten
+        self.enabled = enabled or (lambda site: False)
+        # URLs of images that failed, least recently failed dropped first
+        self.failed = collections.OrderedDict()
+        # Signs the orbit://retro URLs of this session, see retro_url
+        self.secret = os.urandom(16)
+        self.network = QNetworkAccessManager(self)
+        # request id -> [job, original URL, network reply while fetching]
+        self.jobs = {}
+        self.request_ids = itertools.count()
+        self.stats = {
+            "images": 0,
+            "cache_hits": 0,
+            "failed": 0,
+            "bytes_in": 0,
+            "bytes_out": 0,
+            "transcode_s": 0.0,
+        }
+
+        self.store = DiskImageStore(root, CACHE_MB * 1024 * 1024)
+        self.thread = QThread(self)
+        self.worker = RetroWorker(self.store)
+        self.worker.moveToThread(self.thread)
+        self.lookup_requested.connect(self.worker.lookup)
+        self.transcode_requested.connect(self.worker.transcode)
+        self.worker.looked_up.connect(self.looked_up)
+        self.worker.transcoded.connect(self.transcoded)
+        self.thread.start()
+
+    def rewrite(self, qurl, site=""):
+        # The orbit://retro URL for an image request made by a page of site,
+        # or None to leave it
+        if (
+            not self.enabled(site)
+            or qurl.scheme() not in ("http", "https")
+            or qurl.toString() in self.failed
+        ):
+            return None
+        return retro_url(qurl, self.palette, self.secret)
+
+    def handle(self, job):
+        original = query_url(job.requestUrl())
+        query = QUrlQuery(job.requestUrl())
+        palette = query.queryItemValue("palette")
+        if palette not in PALETTES or not hmac.compare_digest(
+            query.queryItemValue("sig"), signature(self.secret, palette, original)
+        ):
+            job.fail(QWebEngineUrlRequestJob.RequestDenied)
+            return
+        key = "%s:%s" % (palette, original.toString())
+
+        request_id = next(self.request_ids)
+        self.jobs[request_id] = [job, original, None]
+        # The page went away or stopped loading the image
+        job.destroyed.connect(lambda: self.cancel(request_id))
+        self.lookup_requested.emit(request_id, key)
+
+    def looked_up(self, request_id, key, cached):
+        entry = self.jobs.get(request_id)
+        if entry is None:
+            return
+        if cached:
+            self.stats["cache_hits"] += 1
+            del self.jobs[request_id]
+            self.reply(entry[0], cached)
+            return
+        reply = self.network.get(QNetworkRequest(entry[1]))
+        entry[2] = reply
+        reply.finished.connect(lambda: self.fetched(request_id, key, reply))
+
+    def cancel(self, request_id):
+        # The reply is only kept until it has finished, it is deleted then
+        entry = self.jobs.pop(request_id, None)
+        if entry is not None and entry[2] is not None:
+            entry[2].abort()
+
+    def fetched(self, request_id, key, reply):
+        entry = self.jobs.get(request_id)
+        if entry is not None:
+            entry[2] = None
+        reply.deleteLater()
+        if entry is None:
+            return
+        data = bytes(reply.readAll())
+        if reply.error() != QNetworkReply.NoError or not data:
+            self.fall_back(request_id)
+            return
+        self.stats["bytes_in"] += len(data)
+        self.transcode_requested.emit(request_id, key, data)
+
+    def transcoded(self, request_id, data, seconds):
+        self.stats["transcode_s"] += seconds
+        if not data:
+            self.fall_back(request_id)
+            return
+        self.stats["images"] += 1
+        self.stats["bytes_out"] += len(data)
+        entry = self.jobs.pop(request_id, None)
+        if entry is not None:
+            self.reply(entry[0], data)
+
+    def fall_back(self, request_id):
+        # The request may have been cancelled (and its job deleted) meanwhile
+        entry = self.jobs.pop(request_id, None)
+        if entry is None:
+            return
+        job, original, _ = entry
+        self.stats["failed"] += 1
+        self.failed[original.toString()] = True
+        if len(self.failed) > MAX_FAILED:
+            self.failed.popitem(last=False)
+        job.redirect(original)
+
+    def reply(self, job, data):
+        buffer = QBuffer(job)
+        buffer.setData(data)
+        buffer.open(QIODevice.ReadOnly)
+        job.reply(b"image/png", buffer)
+
+    def stop(self):
+        self.thread.quit()
+        self.thread.wait()
+        self.store.close()
+
+    def report(self):
+        if not self.stats["images"] and not self.stats["cache_hits"]:
+            return
+        print(
+            "retro images: %(images)d transcoded (%(cache_hits)d from cache,"
+            " %(failed)d left as they were), %(kb_in)d KB in, %(kb_out)d KB out"
+            % dict(
+                self.stats,
+                kb_in=self.stats["bytes_in"] // 1024,
+                kb_out=self.stats["bytes_out"] // 1024,
+            ),
+            file=sys.stderr,
+        )
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(
+        description="Convert an image to an 8-bit palette PNG, as the browser does"
+    )
+    parser.add_argument("image")
+    parser.add_argument("output")
+    parser.add_argument("-p", "--palette", choices=sorted(PALETTES), default=PALETTE)
+    args = parser.parse_args(argv)
+    with open(args.image, "rb") as source:
+        data = source.read()
+    result = transcode(data, args.palette)
+    if result is None:
+        print("could not decode %s" % args.image, file=sys.stderr)
+        return 1
+    with open(args.output, "wb") as out:
+        out.write(result)
+    print("%d -> %d bytes" % (len(data), len(result)))
+    return 0
+
+
+if __name__ == "__main__":
+    # python retro.py photo.jpg photo-8bit.png -p gameboy
+    sys.exit(main(sys.argv[1:]))
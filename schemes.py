@@ -0,0 +1,95 @@
+import urllib.parse
+
+from PyQt5.QtCore import QBuffer, QIODevice, QUrl, QUrlQuery
+from PyQt5.QtWebEngineCore import (
+    QWebEngineUrlRequestJob,
+    QWebEngineUrlScheme,
+    QWebEngineUrlSchemeHandler,
+)
+
+# Built-in pages and resources: orbit://<host>/<path>
+SCHEME = b"orbit"
+
+
+def register_schemes():
+    # Chromium has to know the scheme before the QApplication is created.
+    # Secure so pages served from it are a secure context; CORS enabled so
+    # web pages may use its resources.
+    if QWebEngineUrlScheme.schemeByName(SCHEME).name():
+        return
+    scheme = QWebEngineUrlScheme(SCHEME)
+    scheme.setSyntax(QWebEngineUrlScheme.Syntax.Host)
+    scheme.setFlags(QWebEngineUrlScheme.SecureScheme | QWebEngineUrlScheme.CorsEnabled)
+    QWebEngineUrlScheme.registerScheme(scheme)
+
+
+def quote_url(qurl):
+    # A URL to be carried in the query of an orbit:// URL, see query_url
+    return urllib.parse.quote(qurl.toString(QUrl.FullyEncoded), safe="")
+
+
+def query_url(url, name="url"):
+    # Decoding the value once keeps escapes of the carried URL ("%26")
+    # intact, which QUrlQuery's fully decoded value would not
+    value = QUrlQuery(url).queryItemValue(name, QUrl.FullyEncoded)
+    return QUrl(urllib.parse.unquote(value))
+
+
+class OrbitSchemeHandler(QWebEngineUrlSchemeHandler):
+    # Answers orbit:// requests. Each host is served by a function of the
+    # request URL returning (mime type, bytes), or None if there is nothing
+    # at that URL; hosts that answer later take the job itself instead.
+    # Hosts serve the browser and orbit:// pages only, unless they are added
+    # as public: the scheme is CORS enabled, and a web page probing
+    # orbit://favicon or reading orbit://newtab would learn the history and
+    # bookmarks.
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.hosts = {}
+        self.job_hosts = {}
+        self.public_hosts = set()
+
+    def install(self, profile):
+        # Replaces the handler of an earlier window on a shared profile
+        if profile.urlSchemeHandler(SCHEME) is not None:
+            profile.removeUrlScheme(SCHEME)
+        profile.installUrlSchemeHandler(SCHEME, self)
+
+    def add_host(self, host, serve, public=False):
+        self.hosts[host] = serve
+        if public:
+            self.public_hosts.add(host)
+
+    def add_job_host(self, host, handle, public=False):
+        # handle(job) has to reply to, fail or redirect the job
+        self.job_hosts[host] = handle
+        if public:
+            self.public_hosts.add(host)
+
+    def allowed(self, job):
+        # The initiator is empty for navigations made by the browser itself
+        # and "null" for pages with an opaque origin
+        if job.requestUrl().host() in self.public_hosts:
+            return True
+        initiator = job.initiator()
+        return initiator.isEmpty() or initiator.scheme() == SCHEME.decode()
+
+    def requestStarted(self, job):
+        if not self.allowed(job):
+            job.fail(QWebEngineUrlRequestJob.RequestDenied)
+            return
+        url = job.requestUrl()
+        if url.host() in self.job_hosts:
+            self.job_hosts[url.host()](job)
+            return
+        serve = self.hosts.get(url.host())
+        reply = serve(url) if serve is not None else None
+        if reply is None:
+            job.fail(QWebEngineUrlRequestJob.UrlNotFound)
+            return
+        mime_type, body = reply
+        # Owned by the job, freed with it
+        buffer = QBuffer(job)
+        buffer.setData(body)
+        buffer.open(QIODevice.ReadOnly)
+        job.reply(mime_type, buffer)
@@ -0,0 +1,139 @@
+import base64
+import json
+import os
+import queue
+import threading
+
+from PyQt5.QtCore import QByteArray, QDataStream, QIODevice
+
+# Rewrite the journal as a single snapshot after this many appended records
+COMPACT_EVERY = 500
+
+
+def empty_state():
+    return {"tabs": {}, "order": [], "active": None}
+
+
+def apply_record(state, record):
+    # Fold one journal record into the session state
+    op = record["op"]
+    if op == "snapshot":
+        state["tabs"] = {tab["id"]: tab for tab in record["tabs"]}
+        state["order"] = [tab["id"] for tab in record["tabs"]]
+        state["active"] = record.get("active")
+    elif op == "open":
+        tab = {key: record[key] for key in ("id", "url", "title") if key in record}
+        state["tabs"][record["id"]] = tab
+        index = record.get("index", len(state["order"]))
+        if index < 0 or index > len(state["order"]):
+            index = len(state["order"])
+        state["order"].insert(index, record["id"])
+    elif op == "update":
+        tab = state["tabs"].get(record["id"])
+        if tab is not None:
+            for key in ("url", "title", "history"):
+                if key in record:
+                    tab[key] = record[key]
+    elif op == "close":
+        state["tabs"].pop(record["id"], None)
+        if record["id"] in state["order"]:
+            state["order"].remove(record["id"])
+        if state["active"] == record["id"]:
+            state["active"] = None
+    elif op == "order":
+        known = [tab_id for tab_id in record["ids"] if tab_id in state["tabs"]]
+        state["order"] = known + [i for i in state["order"] if i not in known]
+    elif op == "active":
+        state["active"] = record["id"]
+
+
+def snapshot_record(state):
+    return {
+        "op": "snapshot",
+        "tabs": [state["tabs"][tab_id] for tab_id in state["order"]],
+        "active": state["active"],
+    }
+
+
+def load_session(path):
+    state = empty_state()
+    try:
+        with open(path) as journal:
+            for line in journal:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # A crash can leave a half written last line behind
+                    continue
+                apply_record(state, record)
+    except OSError:
+        pass
+    return state
+
+
+class SessionJournal:
+    # Append-only session log. Records are queued from the GUI thread and
+    # written, flushed and periodically compacted by a background thread.
+    def __init__(self, path, state=None, compact_every=COMPACT_EVERY):
+        self.path = path
+        self.state = state if state is not None else empty_state()
+        self.compact_every = compact_every
+        self.queue = queue.Queue()
+        self.thread = threading.Thread(
+            target=self.run, name="session-journal", daemon=True
+        )
+        self.thread.start()
+
+    def record(self, op, **fields):
+        fields["op"] = op
+        self.queue.put(fields)
+
+    def close(self):
+        self.queue.put(None)
+        self.thread.join()
+
+    def run(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        # Start from a compact file so old records don't pile up across runs
+        self.compact()
+        journal = open(self.path, "a")
+        appended = 0
+
+        while True:
+            record = self.queue.get()
+            if record is None:
+                break
+            apply_record(self.state, record)
+            journal.write(json.dumps(record) + "\n")
+            appended += 1
+
+            if appended >= self.compact_every:
+                journal.close()
+                self.compact()
+                journal = open(self.path, "a")
+                appended = 0
+            elif self.queue.empty():
+                journal.flush()
+
+        journal.close()
+
+    def compact(self):
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w") as journal:
+            journal.write(json.dumps(snapshot_record(self.state)) + "\n")
+            journal.flush()
+            os.fsync(journal.fileno())
+        os.replace(temp_path, self.path)
+
+
+def save_history(view):
+    # Serialize a view's back/forward history so it survives a restart
+    data = QByteArray()
+    stream = QDataStream(data, QIODevice.WriteOnly)
+    stream << view.history()
+    return base64.b64encode(bytes(data)).decode("ascii")
+
+
+def restore_history(view, encoded):
+    stream = QDataStream(QByteArray(base64.b64decode(encoded)))
+    stream >> view.history()
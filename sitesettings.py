@@ -0,0 +1,144 @@
+import json
+import os
+
+from PyQt5.QtCore import QObject, QUrl, pyqtSignal
+from PyQt5.QtWebEngineWidgets import QWebEnginePage, QWebEngineSettings
+
+from adblock import host_suffixes
+
+# Per-site policies, with their values for sites that have no rule
+POLICIES = {
+    "javascript": True,
+    "images": True,
+    "autoplay": False,
+    "plugins": False,
+    # 8-bit page style (theme.py) and 8-bit images (retro.py)
+    "style": True,
+    "retro_images": False,
+}
+POLICY_LABELS = {
+    "javascript": "JavaScript",
+    "images": "Images",
+    "autoplay": "Autoplay",
+    "plugins": "Plugins",
+    "style": "8-bit Style",
+    "retro_images": "8-bit Images",
+}
+# Policies that are page settings: policy -> (attribute, value when allowed)
+PAGE_ATTRIBUTES = {
+    "javascript": (QWebEngineSettings.JavascriptEnabled, True),
+    "images": (QWebEngineSettings.AutoLoadImages, True),
+    "autoplay": (QWebEngineSettings.PlaybackRequiresUserGesture, False),
+    "plugins": (QWebEngineSettings.PluginsEnabled, True),
+}
+# Resolved policies are cached for this many hosts
+MAX_CACHED_HOSTS = 1000
+
+
+def covers(suffix, host):
+    # Whether a rule for suffix applies to host
+    return host == suffix or host.endswith("." + suffix)
+
+
+class SiteSettings(QObject):
+    # Per-site policies kept in a JSON file as {host suffix: {policy: value}}.
+    # A rule for example.com also covers www.example.com, unless that has a
+    # rule of its own for the same policy. Lookups walk the host's suffixes
+    # once and are cached per host until a rule changes.
+    changed = pyqtSignal(str, str)
+
+    def __init__(self, path, defaults=None, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.defaults = dict(POLICIES, **(defaults or {}))
+        self.rules = {}
+        self.resolved = {}
+        try:
+            with open(path) as rules:
+                data = json.load(rules)
+            self.rules = {
+                suffix: {
+                    name: bool(value)
+                    for name, value in policies.items()
+                    if name in POLICIES
+                }
+                for suffix, policies in data.items()
+            }
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def policies(self, host):
+        # Every policy for host, least specific rules applied first
+        resolved = self.resolved.get(host)
+        if resolved is None:
+            resolved = dict(self.defaults)
+            for suffix in reversed(host_suffixes(host.lower())):
+                resolved.update(self.rules.get(suffix, ()))
+            if len(self.resolved) >= MAX_CACHED_HOSTS:
+                self.resolved.clear()
+            self.resolved[host] = resolved
+        return resolved
+
+    def get(self, host, name):
+        return self.policies(host)[name]
+
+    def set(self, suffix, name, value):
+        # None removes the rule, so the site follows its parent again
+        suffix = suffix.lower()
+        policies = self.rules.setdefault(suffix, {})
+        if value is None:
+            policies.pop(name, None)
+        else:
+            policies[name] = value
+        if not policies:
+            del self.rules[suffix]
+        self.resolved.clear()
+        self.save()
+        self.changed.emit(suffix, name)
+
+    def has_rule(self, suffix, name):
+        return name in self.rules.get(suffix.lower(), ())
+
+    def rules_for(self, name):
+        # {host suffix: value} of the rules for one policy
+        return {
+            suffix: policies[name]
+            for suffix, policies in self.rules.items()
+            if name in policies
+        }
+
+    def apply(self, settings, host):
+        # Set a page's own settings for host
+        policies = self.policies(host)
+        for name, (attribute, allowed) in PAGE_ATTRIBUTES.items():
+            settings.setAttribute(
+                attribute, allowed if policies[name] else not allowed
+            )
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w") as rules:
+            json.dump(self.rules, rules, indent=1, sort_keys=True)
+        os.replace(temp_path, self.path)
+
+
+class SitePage(QWebEnginePage):
+    # Applies the site's policies to the page's own settings when a main
+    # frame navigation is accepted, before the new document is created, so
+    # they hold from its first script on. Certificates are rejected as by
+    # default, and certificate_rejected tells the view why its load failed.
+    certificate_rejected = pyqtSignal(QUrl)
+
+    def __init__(self, profile, site_settings, parent=None):
+        super().__init__(profile, parent)
+        self.site_settings = site_settings
+
+    def certificateError(self, error):
+        self.certificate_rejected.emit(error.url())
+        return super().certificateError(error)
+
+    def acceptNavigationRequest(self, url, navigation_type, is_main_frame):
+        if is_main_frame:
+            self.site_settings.apply(self.settings(), url.host())
+        return super().acceptNavigationRequest(url, navigation_type, is_main_frame)
@@ -0,0 +1,158 @@
+import collections
+import html
+import sys
+import time
+
+from PyQt5.QtCore import QObject, QTimer, QUrl
+
+# Hovering this long makes a link worth loading in full
+PRERENDER_DWELL_MS = 400
+MAX_PRERENDERS = 2
+# Unused prerenders are dropped (and counted as waste) after this long
+PRERENDER_TTL_S = 60
+# No prerendering once tabs use this share of the tab memory budget
+MEMORY_HEADROOM = 0.8
+# Origins stay warm in the preconnect page for this long
+PRECONNECT_TTL_S = 30
+
+
+def speculation_key(qurl):
+    # "https://a.com", "https://a.com/" and "https://a.com/#top" are one page
+    key = qurl.adjusted(QUrl.RemoveFragment | QUrl.NormalizePathSegments)
+    if not key.path():
+        key.setPath("/")
+    return key.toString()
+
+
+def origin_of(qurl):
+    return qurl.adjusted(
+        QUrl.RemovePath | QUrl.RemoveQuery | QUrl.RemoveFragment | QUrl.RemoveUserInfo
+    ).toString()
+
+
+class Speculator(QObject):
+    # Warms up likely navigations. Hovering a link preconnects to its origin
+    # (through <link rel=preconnect> in a hidden page sharing the profile's
+    # socket pool); hovering it a while longer loads it in a hidden page that
+    # the browser swaps into the tab if the user does navigate there.
+    def __init__(self, make_page, lifecycle, parent=None):
+        super().__init__(parent)
+        self.make_page = make_page
+        self.lifecycle = lifecycle
+        self.preconnect_page = None
+        self.preconnected = {}
+        self.prerenders = collections.OrderedDict()
+        self.hovered = None
+        self.stats = {
+            "preconnects": 0,
+            "preconnect_hits": 0,
+            "prerenders": 0,
+            "hits": 0,
+            "misses": 0,
+            "wasted": 0,
+            "skipped_memory": 0,
+        }
+
+        self.dwell_timer = QTimer(self)
+        self.dwell_timer.setSingleShot(True)
+        self.dwell_timer.setInterval(PRERENDER_DWELL_MS)
+        self.dwell_timer.timeout.connect(self.dwelled)
+
+        self.expire_timer = QTimer(self)
+        self.expire_timer.setInterval(PRERENDER_TTL_S * 1000 // 4)
+        self.expire_timer.timeout.connect(self.expire)
+
+    def hover(self, qurl):
+        if qurl.scheme() not in ("http", "https"):
+            return
+        self.preconnect(qurl)
+        self.hovered = qurl
+        self.dwell_timer.start()
+
+    def unhover(self):
+        self.hovered = None
+        self.dwell_timer.stop()
+
+    def dwelled(self):
+        if self.hovered is not None:
+            self.prerender(self.hovered)
+
+    def preconnect(self, qurl):
+        now = time.monotonic()
+        origin = origin_of(qurl)
+        last = self.preconnected.get(origin)
+        self.preconnected[origin] = now
+        if last is not None and now - last < PRECONNECT_TTL_S:
+            return
+        self.stats["preconnects"] += 1
+        self.preconnected = {
+            origin: when
+            for origin, when in self.preconnected.items()
+            if now - when < PRECONNECT_TTL_S
+        }
+        if self.preconnect_page is None:
+            self.preconnect_page = self.make_page()
+        self.preconnect_page.setHtml(
+            "".join(
+                '<link rel="preconnect" href="%s">' % html.escape(origin)
+                for origin in self.preconnected
+            )
+        )
+
+    def memory_ok(self):
+        budget = self.lifecycle.memory_budget_mb * MEMORY_HEADROOM
+        return self.lifecycle.resident_memory_mb() < budget
+
+    def prerender(self, qurl):
+        key = speculation_key(qurl)
+        if key in self.prerenders:
+            return
+        if not self.memory_ok():
+            self.stats["skipped_memory"] += 1
+            return
+        while len(self.prerenders) >= MAX_PRERENDERS:
+            self.drop(next(iter(self.prerenders)))
+        page = self.make_page()
+        page.setUrl(qurl)
+        self.prerenders[key] = (page, time.monotonic())
+        self.stats["prerenders"] += 1
+        self.expire_timer.start()
+
+    def drop(self, key):
+        page, started = self.prerenders.pop(key)
+        page.deleteLater()
+        self.stats["wasted"] += 1
+        if not self.prerenders:
+            self.expire_timer.stop()
+
+    def clear(self):
+        for key in list(self.prerenders):
+            self.drop(key)
+
+    def expire(self):
+        now = time.monotonic()
+        for key, (page, started) in list(self.prerenders.items()):
+            if now - started > PRERENDER_TTL_S:
+                self.drop(key)
+
+    def take(self, qurl):
+        # The prerendered page for a navigation the user made, or None
+        self.unhover()
+        entry = self.prerenders.pop(speculation_key(qurl), None)
+        if entry is not None:
+            self.stats["hits"] += 1
+            return entry[0]
+        self.stats["misses"] += 1
+        started = self.preconnected.get(origin_of(qurl))
+        if started is not None and time.monotonic() - started < PRECONNECT_TTL_S:
+            self.stats["preconnect_hits"] += 1
+        return None
+
+    def report(self):
+        print(
+            "speculation: %(preconnects)d preconnects (%(preconnect_hits)d used),"
+            " %(prerenders)d prerenders: %(hits)d hits, %(misses)d misses,"
+            " %(wasted)d wasted, %(skipped_memory)d skipped for memory"
+            % dict(self.stats, wasted=self.stats["wasted"] + len(self.prerenders)),
+            file=sys.stderr,
+        )
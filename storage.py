@@ -0,0 +1,294 @@
+import json
+import os
+import shutil
+import sys
+
+from PyQt5.QtCore import QObject, QThread, QTimer, pyqtSignal, pyqtSlot
+from PyQt5.QtWebEngineWidgets import QWebEngineProfile
+
+# "disk", "memory" or "none"
+CACHE_TYPE = "disk"
+MAX_CACHE_MB = 256
+# Site data (IndexedDB, WebSQL) above this is evicted, least recently used
+# origin first
+STORAGE_QUOTA_MB = 512
+CHECK_INTERVAL_MS = 30 * 60 * 1000
+# Origins picked for eviction while the browser runs, removed at next start
+PENDING_FILE = "evict.json"
+
+CACHE_TYPES = {
+    "disk": QWebEngineProfile.DiskHttpCache,
+    "memory": QWebEngineProfile.MemoryHttpCache,
+    "none": QWebEngineProfile.NoCache,
+}
+
+# Chromium keeps these per origin, in entries named after the origin
+# ("https_example.com_0.indexeddb.leveldb", "databases/https_example.com_0")
+ORIGIN_DIRS = ("IndexedDB", "databases")
+
+
+def disk_usage(path):
+    # (bytes, newest mtime) of a file or directory tree
+    if os.path.isfile(path):
+        stat = os.stat(path)
+        return stat.st_size, stat.st_mtime
+    total, newest = 0, 0
+    for root, dirs, files in os.walk(path):
+        for name in files:
+            try:
+                stat = os.stat(os.path.join(root, name))
+            except OSError:
+                continue
+            total += stat.st_size
+            newest = max(newest, stat.st_mtime)
+    return total, newest
+
+
+def origin_of_entry(name):
+    # "https_www.example.com_0.indexeddb.leveldb" -> "https://www.example.com"
+    name = name.split(".indexeddb", 1)[0]
+    scheme, _, rest = name.partition("_")
+    host, _, port = rest.rpartition("_")
+    if not scheme or not host:
+        return None
+    if port and port != "0":
+        return "%s://%s:%s" % (scheme, host, port)
+    return "%s://%s" % (scheme, host)
+
+
+def origin_of_url(qurl):
+    if qurl.port() != -1:
+        return "%s://%s:%d" % (qurl.scheme(), qurl.host(), qurl.port())
+    return "%s://%s" % (qurl.scheme(), qurl.host())
+
+
+def migrate(old_path, new_path):
+    # Move data from where older versions kept it, once
+    if os.path.isdir(old_path) and not os.path.exists(new_path):
+        os.makedirs(os.path.dirname(new_path), exist_ok=True)
+        os.replace(old_path, new_path)
+
+
+def scan(storage_path, cache_path):
+    # Disk usage of the profile: {"origins": {origin: [bytes, newest mtime,
+    # [paths]]}, "shared_bytes": ..., "cache_bytes": ...}
+    origins = {}
+    shared = 0
+    if os.path.isdir(storage_path):
+        for entry in os.listdir(storage_path):
+            path = os.path.join(storage_path, entry)
+            if entry not in ORIGIN_DIRS:
+                shared += disk_usage(path)[0]
+                continue
+            for name in os.listdir(path):
+                size, mtime = disk_usage(os.path.join(path, name))
+                origin = origin_of_entry(name)
+                if origin is None:
+                    shared += size
+                    continue
+                usage = origins.setdefault(origin, [0, 0, []])
+                usage[0] += size
+                usage[1] = max(usage[1], mtime)
+                usage[2].append(os.path.join(path, name))
+    return {
+        "origins": origins,
+        "shared_bytes": shared,
+        "cache_bytes": disk_usage(cache_path)[0] if os.path.isdir(cache_path) else 0,
+    }
+
+
+def pick_evictions(origins, quota, open_origins=()):
+    # Least recently used origins whose removal brings the per-origin data
+    # under quota. Shared data (Local Storage, session data...) can't be
+    # evicted per origin, so it isn't counted against the quota.
+    total = sum(size for size, _, _ in origins.values())
+    picked = []
+    for origin in sorted(origins, key=lambda origin: origins[origin][1]):
+        if total <= quota:
+            break
+        # Origins open in a tab may have their databases in use, skip them
+        if origin in open_origins:
+            continue
+        total -= origins[origin][0]
+        picked.append(origin)
+    return picked
+
+
+def evict_pending(root):
+    # Removes the site data picked by the last check. Run before the profile
+    # uses its storage, while Chromium has none of the databases open.
+    pending_path = os.path.join(root, PENDING_FILE)
+    try:
+        with open(pending_path) as pending:
+            entries = json.load(pending)
+    except (OSError, ValueError):
+        return []
+    storage_path = os.path.join(root, "storage")
+    for paths in entries.values():
+        for path in paths:
+            # Only entries of the per-origin directories, as written by check
+            if path.split("/", 1)[0] in ORIGIN_DIRS and ".." not in path:
+                remove(os.path.join(storage_path, path))
+    remove(pending_path)
+    return sorted(entries)
+
+
+def summary(usage):
+    origins = usage["origins"]
+    return {
+        "cache_bytes": usage["cache_bytes"],
+        "storage_bytes": usage["shared_bytes"]
+        + sum(size for size, _, _ in origins.values()),
+        "shared_bytes": usage["shared_bytes"],
+        "origins": {origin: size for origin, (size, _, _) in origins.items()},
+    }
+
+
+def remove(path):
+    if os.path.isdir(path):
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+class StorageWorker(QObject):
+    # Measures the profile on a background thread and picks the origins to
+    # evict. Their data is removed at the next start (evict_pending), never
+    # while Chromium may hold the databases open.
+    usage_ready = pyqtSignal(dict)
+
+    def __init__(self, root, cache_type, quota_mb):
+        super().__init__()
+        self.root = root
+        self.storage_path = os.path.join(root, "storage")
+        self.cache_path = os.path.join(root, "cache")
+        self.cache_type = cache_type
+        self.quota = quota_mb * 1024 * 1024
+
+    @pyqtSlot(list)
+    def check(self, open_origins):
+        # A disk cache left over from before the cache type was changed
+        if self.cache_type != "disk" and os.path.isdir(self.cache_path):
+            shutil.rmtree(self.cache_path, ignore_errors=True)
+
+        usage = scan(self.storage_path, self.cache_path)
+        origins = usage["origins"]
+        pending = pick_evictions(origins, self.quota, open_origins)
+        pending_path = os.path.join(self.root, PENDING_FILE)
+        if pending:
+            temp_path = pending_path + ".tmp"
+            with open(temp_path, "w") as entries:
+                json.dump(
+                    {
+                        origin: [
+                            os.path.relpath(path, self.storage_path).replace(
+                                os.sep, "/"
+                            )
+                            for path in origins[origin][2]
+                        ]
+                        for origin in pending
+                    },
+                    entries,
+                    indent=1,
+                )
+            os.replace(temp_path, pending_path)
+        else:
+            remove(pending_path)
+
+        result = summary(usage)
+        result["pending"] = pending
+        self.usage_ready.emit(result)
+
+
+class StorageManager(QObject):
+    # Configures the HTTP cache and keeps site data under a quota. Usage is
+    # measured off the UI thread, at startup and then every CHECK_INTERVAL_MS;
+    # over-quota origins are evicted when the next session starts.
+    check_requested = pyqtSignal(list)
+    usage_ready = pyqtSignal(dict)
+
+    def __init__(
+        self,
+        profile,
+        root,
+        cache_type=CACHE_TYPE,
+        max_cache_mb=MAX_CACHE_MB,
+        quota_mb=STORAGE_QUOTA_MB,
+        open_urls=list,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.storage_path = os.path.join(root, "storage")
+        self.cache_path = os.path.join(root, "cache")
+        self.open_urls = open_urls
+        self.usage = None
+
+        # Before the profile is pointed at the storage and opens any of it
+        evicted = evict_pending(root)
+        if evicted:
+            print(
+                "storage: over quota, evicted site data of %s" % ", ".join(evicted),
+                file=sys.stderr,
+            )
+
+        profile.setPersistentStoragePath(self.storage_path)
+        profile.setCachePath(self.cache_path)
+        profile.setHttpCacheType(CACHE_TYPES[cache_type])
+        # Chromium evicts from its own cache to stay under this
+        profile.setHttpCacheMaximumSize(max_cache_mb * 1024 * 1024)
+
+        self.thread = QThread(self)
+        self.worker = StorageWorker(root, cache_type, quota_mb)
+        self.worker.moveToThread(self.thread)
+        self.check_requested.connect(self.worker.check)
+        self.worker.usage_ready.connect(self.set_usage)
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(CHECK_INTERVAL_MS)
+        self.timer.timeout.connect(self.check)
+
+    def start(self):
+        self.thread.start()
+        self.timer.start()
+        self.check()
+
+    def check(self):
+        self.check_requested.emit([origin_of_url(url) for url in self.open_urls()])
+
+    def set_usage(self, usage):
+        self.usage = usage
+        if usage["pending"]:
+            print(
+                "storage: over quota, site data of %s is evicted at next start"
+                % ", ".join(usage["pending"]),
+                file=sys.stderr,
+            )
+        self.usage_ready.emit(usage)
+
+    def stop(self):
+        self.timer.stop()
+        self.thread.quit()
+        self.thread.wait()
+
+
+def format_usage(usage):
+    lines = [
+        "HTTP cache: %.1f MB" % (usage["cache_bytes"] / 1048576),
+        "Site data: %.1f MB (shared %.1f MB)"
+        % (usage["storage_bytes"] / 1048576, usage["shared_bytes"] / 1048576),
+    ]
+    for origin, size in sorted(usage["origins"].items(), key=lambda item: -item[1]):
+        lines.append("  %8.1f MB  %s" % (size / 1048576, origin))
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    # python storage.py [profile/webengine] -- print disk usage per origin
+    root = sys.argv[1] if len(sys.argv) > 1 else os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "profile", "webengine"
+    )
+    usage = scan(os.path.join(root, "storage"), os.path.join(root, "cache"))
+    print(format_usage(summary(usage)))
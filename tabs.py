@@ -0,0 +1,441 @@
+import os
+import time
+
+from PyQt5.QtCore import (
+    QAbstractListModel,
+    QModelIndex,
+    QObject,
+    Qt,
+    QTimer,
+    QUrl,
+    pyqtSignal,
+)
+from PyQt5.QtGui import QFont
+from PyQt5.QtWidgets import (
+    QLabel,
+    QListView,
+    QPushButton,
+    QTabWidget,
+    QVBoxLayout,
+    QWidget,
+)
+from PyQt5.QtWebEngineWidgets import QWebEnginePage
+
+# Background tabs are frozen after this many seconds without being selected
+FREEZE_AFTER_SECONDS = 5 * 60
+# Least recently used tabs are discarded while the browser uses more than this
+MEMORY_BUDGET_MB = 1536
+# How often the lifecycle manager looks at the open tabs
+CHECK_INTERVAL_MS = 15 * 1000
+# A page that crashed again waits this long before it is reloaded, doubling
+# with every further crash up to the maximum
+CRASH_RELOAD_DELAY_S = 2
+CRASH_MAX_DELAY_S = 5 * 60
+# Crashes older than this no longer count towards the delay
+CRASH_FORGET_S = 10 * 60
+# Tab labels, tooltips and the URL bar are updated at most this often
+UI_UPDATE_MS = 16
+
+SAD_TAB_STYLE = """
+    QWidget {
+        background-color: black;
+        color: #0f0;
+    }
+    QPushButton {
+        color: red;
+        border: 2px solid #0f0;
+        padding: 8px;
+    }
+"""
+
+
+def read_rss_mb(pid):
+    # Resident memory of a process in MB, read from /proc (0 if unavailable)
+    if not pid:
+        return 0.0
+    try:
+        with open("/proc/%d/statm" % pid) as statm:
+            resident_pages = int(statm.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return 0.0
+    return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+class TabLifecycleManager(QObject):
+    def __init__(
+        self,
+        tab_widget,
+        freeze_after=FREEZE_AFTER_SECONDS,
+        memory_budget_mb=MEMORY_BUDGET_MB,
+        check_interval_ms=CHECK_INTERVAL_MS,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.tab_widget = tab_widget
+        self.freeze_after = freeze_after
+        self.memory_budget_mb = memory_budget_mb
+
+        # view -> time it was last the current tab
+        self.last_active = {}
+        # view -> scroll position saved right before the page was discarded
+        self.saved_scroll = {}
+
+        self.tab_widget.currentChanged.connect(self.on_current_changed)
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(check_interval_ms)
+        self.timer.timeout.connect(self.check)
+        self.timer.start()
+
+    def track(self, view):
+        self.last_active[view] = time.monotonic()
+        view.loadFinished.connect(lambda ok, view=view: self.restore_scroll(view))
+
+    def untrack(self, view):
+        self.last_active.pop(view, None)
+        self.saved_scroll.pop(view, None)
+
+    def on_current_changed(self, index):
+        view = self.tab_widget.widget(index)
+        if view not in self.last_active:
+            return
+        self.last_active[view] = time.monotonic()
+
+        # A discarded page reloads itself here, restore_scroll puts it back
+        # where the user left it once the load has finished
+        page = view.page()
+        if page.lifecycleState() != QWebEnginePage.LifecycleState.Active:
+            page.setLifecycleState(QWebEnginePage.LifecycleState.Active)
+
+    def restore_scroll(self, view):
+        position = self.saved_scroll.pop(view, None)
+        if position is not None:
+            view.page().runJavaScript(
+                "window.scrollTo(%d, %d);" % (position.x(), position.y())
+            )
+
+    def can_suspend(self, view):
+        # Visible, inspected or audible pages have to stay active
+        page = view.page()
+        return (
+            view is not self.tab_widget.currentWidget()
+            and not view.isVisible()
+            and page.devToolsPage() is None
+            and page.inspectedPage() is None
+            and not page.recentlyAudible()
+        )
+
+    def freeze(self, view):
+        page = view.page()
+        if page.lifecycleState() == QWebEnginePage.LifecycleState.Active:
+            page.setLifecycleState(QWebEnginePage.LifecycleState.Frozen)
+
+    def discard(self, view):
+        page = view.page()
+        if page.lifecycleState() == QWebEnginePage.LifecycleState.Discarded:
+            return
+        self.saved_scroll[view] = page.scrollPosition()
+        page.setLifecycleState(QWebEnginePage.LifecycleState.Discarded)
+
+    def suspend_candidates(self):
+        # Live tabs that may be frozen or discarded, least recently used first
+        return sorted(
+            (view for view in self.live_views() if self.can_suspend(view)),
+            key=lambda view: self.last_active[view],
+        )
+
+    def freeze_background(self):
+        for view in self.suspend_candidates():
+            self.freeze(view)
+
+    def discard_oldest(self):
+        # Discards the least recently used tab that may be, returns it
+        for view in self.suspend_candidates():
+            self.discard(view)
+            return view
+        return None
+
+    def live_views(self):
+        return [
+            view
+            for view in self.last_active
+            if view.page().lifecycleState()
+            != QWebEnginePage.LifecycleState.Discarded
+        ]
+
+    def resident_memory_mb(self):
+        # Browser process plus every renderer still backing a live tab.
+        # Several tabs can share one renderer, so count each pid once.
+        pids = {view.page().renderProcessPid() for view in self.live_views()}
+        pids.add(os.getpid())
+        return sum(read_rss_mb(pid) for pid in pids)
+
+    def check(self):
+        now = time.monotonic()
+
+        for view, last_active in list(self.last_active.items()):
+            if now - last_active >= self.freeze_after and self.can_suspend(view):
+                self.freeze(view)
+
+        if not self.memory_budget_mb:
+            return
+
+        usage = self.resident_memory_mb()
+        if usage <= self.memory_budget_mb:
+            return
+
+        # Discard least recently used tabs until we are back under budget.
+        # Renderers exit asynchronously, so estimate what each discard frees.
+        live = self.live_views()
+        sharing = {}
+        for view in live:
+            pid = view.page().renderProcessPid()
+            sharing[pid] = sharing.get(pid, 0) + 1
+
+        for view in self.suspend_candidates():
+            if usage <= self.memory_budget_mb:
+                break
+            pid = view.page().renderProcessPid()
+            usage -= read_rss_mb(pid) / sharing.get(pid, 1)
+            self.discard(view)
+
+
+class CrashTracker:
+    # Renderer crashes per page, for the reload backoff
+    def __init__(self):
+        # page -> (crashes, time of the last one)
+        self.crashes = {}
+
+    def key(self, url):
+        return QUrl(url).adjusted(QUrl.RemoveQuery | QUrl.RemoveFragment).toString()
+
+    def record(self, url):
+        now = time.monotonic()
+        crashes, last = self.crashes.get(self.key(url), (0, now))
+        if now - last > CRASH_FORGET_S:
+            crashes = 0
+        self.crashes[self.key(url)] = (crashes + 1, now)
+        return crashes + 1
+
+    def reload_delay(self, url):
+        # Seconds to wait before reloading: none after a first crash
+        crashes, last = self.crashes.get(self.key(url), (0, 0))
+        if crashes <= 1:
+            return 0
+        return min(CRASH_MAX_DELAY_S, CRASH_RELOAD_DELAY_S * 2 ** (crashes - 2))
+
+
+class TabWidget(QTabWidget):
+    # Keeps every tab's label and tooltip (and the URL bar, for the current
+    # tab) in step with its own view. Views report what changed with mark();
+    # changes are applied once per frame to the tab that owns the view,
+    # however many signals arrived in between.
+    current_url_changed = pyqtSignal(QUrl)
+    # First and last index whose label or tooltip changed
+    tabs_updated = pyqtSignal(int, int)
+    # Tabs were added, removed or moved
+    tabs_reset = pyqtSignal()
+
+    def __init__(self, tooltip, parent=None):
+        super().__init__(parent)
+        # view -> tooltip text
+        self.tooltip = tooltip
+        # widget -> index, rebuilt on first use after tabs were added,
+        # removed or moved
+        self.indices = None
+        # view -> set of "title", "url", "icon", "tooltip"
+        self.dirty = {}
+        self.reset_pending = False
+        self.stats = {"marks": 0, "flushes": 0, "updates": 0}
+
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(UI_UPDATE_MS)
+        self.flush_timer.timeout.connect(self.flush)
+        self.tabBar().tabMoved.connect(lambda from_index, to_index: self.reindex())
+
+    # Called by Qt even while signals are blocked
+    def tabInserted(self, index):
+        super().tabInserted(index)
+        self.reindex()
+
+    def tabRemoved(self, index):
+        super().tabRemoved(index)
+        self.reindex()
+
+    def reindex(self):
+        self.indices = None
+        self.reset_pending = True
+        self.schedule()
+
+    def index_of(self, widget):
+        if self.indices is None:
+            self.indices = {self.widget(i): i for i in range(self.count())}
+        return self.indices.get(widget, -1)
+
+    def mark(self, view, *changes):
+        self.stats["marks"] += 1
+        self.dirty.setdefault(view, set()).update(changes)
+        self.schedule()
+
+    def schedule(self):
+        # Not restarted by later changes, or a busy page would hold
+        # updates back indefinitely
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+
+    def flush(self):
+        dirty, self.dirty = self.dirty, {}
+        current = self.currentWidget()
+        updated = []
+        for view, changes in dirty.items():
+            index = self.index_of(view)
+            # Closed or replaced since it was marked
+            if index == -1:
+                continue
+            if "title" in changes:
+                self.setTabText(index, view.title() or "Untitled")
+            if "icon" in changes:
+                self.setTabIcon(index, view.icon())
+            self.setTabToolTip(index, self.tooltip(view))
+            if "url" in changes and view is current:
+                self.current_url_changed.emit(view.url())
+            updated.append(index)
+
+        self.stats["flushes"] += 1
+        self.stats["updates"] += len(updated)
+        if self.reset_pending:
+            self.reset_pending = False
+            self.tabs_reset.emit()
+        elif updated:
+            self.tabs_updated.emit(min(updated), max(updated))
+
+
+class TabListModel(QAbstractListModel):
+    # The tabs of a TabWidget as a list model, for the vertical tab list
+    def __init__(self, tab_widget, parent=None):
+        super().__init__(parent)
+        self.tab_widget = tab_widget
+        # Tabs change before the list hears of it, answer with the count
+        # of the last reset until then
+        self.rows = tab_widget.count()
+        tab_widget.tabs_reset.connect(self.reset)
+        tab_widget.tabs_updated.connect(self.update)
+
+    def update(self, first, last):
+        last = min(last, self.rows - 1)
+        if first <= last:
+            self.dataChanged.emit(self.index(first), self.index(last))
+
+    def reset(self):
+        self.beginResetModel()
+        self.rows = self.tab_widget.count()
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.rows
+
+    def data(self, index, role=Qt.DisplayRole):
+        row = index.row()
+        if not 0 <= row < self.tab_widget.count():
+            return None
+        if role == Qt.DisplayRole:
+            return self.tab_widget.tabText(row)
+        if role == Qt.DecorationRole:
+            return self.tab_widget.tabIcon(row)
+        if role == Qt.ToolTipRole:
+            return self.tab_widget.tabToolTip(row)
+        return None
+
+
+class VerticalTabList(QListView):
+    # Tabs as a vertical list. Only the rows in sight are laid out and
+    # painted, so it stays quick with hundreds of tabs. Middle click closes.
+    def __init__(self, tab_widget, parent=None):
+        super().__init__(parent)
+        self.tab_widget = tab_widget
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QListView.Batched)
+        self.setModel(TabListModel(tab_widget, self))
+        self.clicked.connect(lambda index: tab_widget.setCurrentIndex(index.row()))
+        tab_widget.currentChanged.connect(self.select)
+        tab_widget.tabs_reset.connect(lambda: self.select(tab_widget.currentIndex()))
+
+    def select(self, index):
+        self.setCurrentIndex(self.model().index(index))
+
+    def mouseReleaseEvent(self, event):
+        index = self.indexAt(event.pos())
+        if event.button() == Qt.MiddleButton and index.isValid():
+            self.tab_widget.tabCloseRequested.emit(index.row())
+            return
+        super().mouseReleaseEvent(event)
+
+
+class TabPlaceholder(QWidget):
+    # Stands in for a restored tab until it is first selected, so restoring a
+    # large session doesn't start a renderer for every tab
+    def __init__(self, tab_id, url, title, history=None):
+        super().__init__()
+        self.tab_id = tab_id
+        self.url = QUrl(url)
+        self.title = title
+        self.history = history
+
+
+class SadTab(TabPlaceholder):
+    # Replaces a tab whose renderer died. Nothing is reloaded while the tab
+    # is in the background; once it is shown it reloads after its backoff
+    # delay, or right away with the button.
+    reload_requested = pyqtSignal()
+
+    def __init__(self, tab_id, url, title, history, crashes, delay_s):
+        super().__init__(tab_id, url, title, history)
+        self.retry_at = time.monotonic() + delay_s
+        self.setStyleSheet(SAD_TAB_STYLE)
+        self.setFont(QFont("Press Start 2P", 10))
+
+        face = QLabel("X_X")
+        face.setFont(QFont("Press Start 2P", 48))
+        message = QLabel(
+            "THIS TAB CRASHED"
+            if crashes == 1
+            else "THIS TAB CRASHED %d TIMES" % crashes
+        )
+        page = QLabel(self.url.toString())
+        page.setWordWrap(True)
+        self.countdown = QLabel()
+        reload_btn = QPushButton("RELOAD")
+        reload_btn.clicked.connect(self.reload_requested.emit)
+
+        layout = QVBoxLayout(self)
+        layout.addStretch()
+        for widget in (face, message, page, self.countdown):
+            widget.setAlignment(Qt.AlignCenter)
+            layout.addWidget(widget)
+        layout.addWidget(reload_btn, alignment=Qt.AlignCenter)
+        layout.addStretch()
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(1000)
+        self.timer.timeout.connect(self.tick)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Emitting from inside the show would swap the tab mid-switch
+        QTimer.singleShot(0, self.tick)
+        self.timer.start()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.timer.stop()
+
+    def tick(self):
+        if not self.isVisible():
+            return
+        remaining = self.retry_at - time.monotonic()
+        if remaining <= 0:
+            self.timer.stop()
+            self.reload_requested.emit()
+        else:
+            self.countdown.setText("RELOADING IN %d S" % (remaining + 1))
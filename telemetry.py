@@ -0,0 +1,257 @@
+import json
+import logging
+import logging.handlers
+import os
+import sys
+import time
+
+from PyQt5.QtCore import QEvent, QObject, Qt, pyqtSignal
+from PyQt5.QtGui import QFont
+from PyQt5.QtWidgets import QLabel
+
+IMPORT_TIME = time.time()
+
+# profile/perf.jsonl is rotated at this size, keeping this many old files
+PERF_LOG_BYTES = 1024 * 1024
+PERF_LOG_BACKUPS = 3
+
+# Navigation and Paint Timing of the loaded document, in ms since the
+# navigation started
+NAVIGATION_TIMING_JS = """
+(function() {
+    var nav = performance.getEntriesByType("navigation")[0];
+    var result = {};
+    if (nav) {
+        result.ttfb_ms = nav.responseStart;
+        result.dns_ms = nav.domainLookupEnd - nav.domainLookupStart;
+        result.connect_ms = nav.connectEnd - nav.connectStart;
+        result.dom_content_loaded_ms = nav.domContentLoadedEventEnd;
+        result.load_event_ms = nav.loadEventEnd;
+        result.transfer_bytes = nav.transferSize;
+    }
+    performance.getEntriesByType("paint").forEach(function(entry) {
+        result[entry.name.replace(/-/g, "_") + "_ms"] = entry.startTime;
+    });
+    return JSON.stringify(result);
+})();
+"""
+
+HUD_STYLE = """
+    QLabel {
+        background-color: rgba(0, 0, 0, 200);
+        color: #0f0;
+        border: 2px solid #0f0;
+        padding: 6px;
+    }
+"""
+HUD_FIELDS = (
+    ("LOAD", "load_ms"),
+    ("TTFB", "ttfb_ms"),
+    ("DCL", "dom_content_loaded_ms"),
+    ("FP", "first_paint_ms"),
+    ("FCP", "first_contentful_paint_ms"),
+)
+
+
+def process_start_time():
+    # Wall clock time this process started, from /proc (or when we were imported)
+    try:
+        with open("/proc/self/stat") as stat:
+            # Fields after the command name, which may itself contain spaces
+            fields = stat.read().rsplit(")", 1)[1].split()
+        with open("/proc/uptime") as uptime:
+            uptime_seconds = float(uptime.read().split()[0])
+        start_ticks = int(fields[19])
+    except (OSError, ValueError, IndexError):
+        return IMPORT_TIME
+    return time.time() - uptime_seconds + start_ticks / os.sysconf("SC_CLK_TCK")
+
+
+class StartupProbe(QObject):
+    # Times process start -> first paint of the window -> first page commit.
+    # asset_stats (assets.py) is reported with the marks, to catch startup
+    # reading or decoding UI assets more than once.
+    first_paint = pyqtSignal()
+    finished = pyqtSignal(dict)
+
+    def __init__(self, window, asset_stats=None):
+        super().__init__(window)
+        self.asset_stats = asset_stats
+        self.process_start = process_start_time()
+        self.marks = {"window_created": self.elapsed_ms(time.time())}
+        window.installEventFilter(self)
+
+    def elapsed_ms(self, when):
+        return round((when - self.process_start) * 1000, 1)
+
+    def mark(self, name, when=None):
+        if name not in self.marks:
+            self.marks[name] = self.elapsed_ms(when or time.time())
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Paint and "first_paint" not in self.marks:
+            self.mark("first_paint")
+            watched.removeEventFilter(self)
+            self.first_paint.emit()
+        return False
+
+    def watch(self, view):
+        if "first_page_committed" not in self.marks:
+            view.loadFinished.connect(lambda ok: self.page_loaded(view))
+
+    def page_loaded(self, view):
+        if "first_page_committed" in self.marks:
+            return
+        # domLoading is the wall clock time (ms) the committed document was
+        # created, which Qt has no signal for
+        loaded_at = time.time()
+        view.page().runJavaScript(
+            "performance.timing.domLoading",
+            lambda dom_loading: self.page_committed(dom_loading, loaded_at),
+        )
+
+    def page_committed(self, dom_loading, loaded_at):
+        if "first_page_committed" in self.marks:
+            return
+        self.mark("first_page_committed", dom_loading / 1000 if dom_loading else None)
+        self.mark("first_page_loaded", loaded_at)
+        print(
+            "startup: first paint %.0f ms, first page committed %.0f ms,"
+            " loaded %.0f ms (since process start)"
+            % (
+                self.marks.get("first_paint", -1),
+                self.marks["first_page_committed"],
+                self.marks["first_page_loaded"],
+            ),
+            file=sys.stderr,
+        )
+        marks = dict(self.marks)
+        if self.asset_stats is not None:
+            print(
+                "startup: assets %(reads)d read from the bundle (%(missing)d"
+                " missing), %(decodes)d decoded, %(scales)d scaled,"
+                " %(hits)d shared" % self.asset_stats,
+                file=sys.stderr,
+            )
+            marks["assets"] = dict(self.asset_stats)
+        self.finished.emit(marks)
+
+
+class PerfLog:
+    # Append-only JSONL log of performance records, rotated by size
+    def __init__(self, path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.logger = logging.getLogger("orbit.perf." + path)
+        self.logger.propagate = False
+        self.logger.setLevel(logging.INFO)
+        if not self.logger.handlers:
+            handler = logging.handlers.RotatingFileHandler(
+                path, maxBytes=PERF_LOG_BYTES, backupCount=PERF_LOG_BACKUPS
+            )
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            self.logger.addHandler(handler)
+
+    def write(self, kind, **fields):
+        record = {"kind": kind, "time": round(time.time(), 3)}
+        record.update(fields)
+        self.logger.info(json.dumps(record))
+
+
+class LoadTimer(QObject):
+    # Times every navigation of the views it watches (Qt load signals plus
+    # the page's own Navigation and Paint Timing) and logs the result
+    timing_ready = pyqtSignal(object, dict)
+
+    def __init__(self, log, parent=None):
+        super().__init__(parent)
+        self.log = log
+
+    def watch(self, view):
+        view.load_timing = None
+        view.last_timing = None
+        view.loadStarted.connect(lambda: self.started(view))
+        view.loadProgress.connect(lambda percent: self.progress(view, percent))
+        view.loadFinished.connect(lambda ok: self.finished(view, ok))
+
+    def started(self, view):
+        view.load_timing = {"started": time.perf_counter(), "progress_events": 0}
+
+    def progress(self, view, percent):
+        timing = view.load_timing
+        if timing is None:
+            return
+        timing["progress_events"] += 1
+        timing.setdefault("first_progress", time.perf_counter())
+
+    def finished(self, view, ok):
+        timing, view.load_timing = view.load_timing, None
+        if timing is None:
+            return
+        now = time.perf_counter()
+        record = {
+            "tab": getattr(view, "tab_id", None),
+            "url": view.url().toString(),
+            "ok": ok,
+            "load_ms": round((now - timing["started"]) * 1000, 1),
+            "first_progress_ms": round(
+                (timing.get("first_progress", now) - timing["started"]) * 1000, 1
+            ),
+            "progress_events": timing["progress_events"],
+        }
+        view.page().runJavaScript(
+            NAVIGATION_TIMING_JS, lambda result: self.harvested(view, record, result)
+        )
+
+    def harvested(self, view, record, result):
+        try:
+            page_timing = json.loads(result) if result else {}
+        except ValueError:
+            page_timing = {}
+        record.update(
+            (name, round(value, 1) if isinstance(value, float) else value)
+            for name, value in page_timing.items()
+        )
+        view.last_timing = record
+        self.log.write("navigation", **record)
+        self.timing_ready.emit(view, record)
+
+
+class TimingHud(QLabel):
+    # 8-bit overlay in the top right corner of its parent showing the last
+    # load timing of the current tab
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.setFont(QFont("Press Start 2P", 8))
+        self.setStyleSheet(HUD_STYLE)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.hide()
+        parent.installEventFilter(self)
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Resize:
+            self.place()
+        return False
+
+    def place(self):
+        self.adjustSize()
+        self.move(self.parent().width() - self.width() - 10, 40)
+        self.raise_()
+
+    def show_timing(self, record):
+        if not record:
+            self.setText("NO DATA")
+        else:
+            lines = []
+            for label, field in HUD_FIELDS:
+                value = record.get(field)
+                if value is not None:
+                    lines.append("%-5s%6.0f MS" % (label, value))
+            self.setText("\n".join(lines))
+        self.place()
+
+    def toggle(self, record):
+        if self.isVisible():
+            self.hide()
+        else:
+            self.show_timing(record)
+            self.show()
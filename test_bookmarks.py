@@ -0,0 +1,57 @@
+import os
+
+from bookmarks import ROOT, BookmarkImportWorker, BookmarkStore
+
+
+def run_import(tmp_path, name, content):
+    export_path = os.path.join(str(tmp_path), name)
+    with open(export_path, "w") as export:
+        export.write(content)
+    db_path = os.path.join(str(tmp_path), "bookmarks.sqlite")
+    worker = BookmarkImportWorker(db_path, export_path)
+    results = []
+    worker.finished.connect(lambda count, error: results.append((count, error)))
+    worker.run()
+    return db_path, results
+
+
+def test_corrupt_json_export_reports_failure(tmp_path):
+    db_path, results = run_import(tmp_path, "export.json", '{"roots": {"bookmark_b')
+
+    assert len(results) == 1
+    count, error = results[0]
+    assert count == -1 and error
+    # No half imported folder is left behind
+    store = BookmarkStore(db_path)
+    assert store.count(ROOT) == 0
+    store.close()
+
+
+def test_json_export_of_the_wrong_shape_reports_failure(tmp_path):
+    _, results = run_import(tmp_path, "export.json", "[1, 2, 3]")
+
+    assert results[0][0] == -1
+
+
+def test_missing_export_reports_failure(tmp_path):
+    db_path = os.path.join(str(tmp_path), "bookmarks.sqlite")
+    worker = BookmarkImportWorker(db_path, os.path.join(str(tmp_path), "gone.html"))
+    results = []
+    worker.finished.connect(lambda count, error: results.append((count, error)))
+    worker.run()
+
+    assert results[0][0] == -1
+
+
+def test_html_export_is_imported(tmp_path):
+    db_path, results = run_import(
+        tmp_path,
+        "export.html",
+        '<DL><p><DT><H3>Folder</H3><DL><p>'
+        '<DT><A HREF="https://example.com/">Example</A></DL><p></DL><p>',
+    )
+
+    assert results == [(1, "")]
+    store = BookmarkStore(db_path)
+    assert store.count(ROOT) == 1
+    store.close()
@@ -0,0 +1,85 @@
+import os
+
+from PyQt5.QtCore import QUrl
+
+from navigation import HttpsFirst, classify
+
+
+class View:
+    # Stands in for a QWebEngineView: its URL and the loads it was asked for
+    def __init__(self):
+        self.current = QUrl()
+        self.loaded = []
+
+    def url(self):
+        return self.current
+
+    def setUrl(self, qurl):
+        self.current = QUrl(qurl)
+        self.loaded.append(qurl.toString())
+
+
+def navigate(https_first, view, text):
+    qurl, upgraded = https_first.resolve(text)
+    view.setUrl(qurl)
+    if upgraded:
+        https_first.attempt(view, qurl)
+    https_first.load_started(view)
+    return qurl
+
+
+def test_upgrade_redirected_to_another_host_is_remembered(tmp_path):
+    https_first = HttpsFirst(os.path.join(str(tmp_path), "upgrades.json"))
+    view = View()
+    navigate(https_first, view, "example.com")
+    view.current = QUrl("https://www.example.com/")
+    https_first.load_finished(view, True)
+
+    assert https_first.redirects_avoided == 1
+    assert https_first.https_works("example.com") is True
+
+
+def test_failed_upgrade_falls_back_to_http(tmp_path):
+    https_first = HttpsFirst(os.path.join(str(tmp_path), "upgrades.json"))
+    view = View()
+    navigate(https_first, view, "example.com")
+    https_first.load_finished(view, False)
+
+    assert view.loaded[-1] == "http://example.com"
+    https_first.load_started(view)
+    https_first.load_finished(view, True)
+    assert https_first.https_works("example.com") is False
+
+
+def test_certificate_error_does_not_downgrade(tmp_path):
+    https_first = HttpsFirst(os.path.join(str(tmp_path), "upgrades.json"))
+    view = View()
+    navigate(https_first, view, "example.com")
+    https_first.certificate_error(view)
+    https_first.load_finished(view, False)
+
+    assert view.loaded == ["https://example.com"]
+    assert https_first.https_works("example.com") is None
+    assert https_first.stats["certificate_errors"] == 1
+
+
+def test_another_navigation_is_not_counted(tmp_path):
+    https_first = HttpsFirst(os.path.join(str(tmp_path), "upgrades.json"))
+    view = View()
+    navigate(https_first, view, "example.com")
+    view.setUrl(QUrl("https://other.example/"))
+    https_first.load_started(view)
+    https_first.load_finished(view, True)
+
+    assert https_first.redirects_avoided == 0
+    assert https_first.https_works("example.com") is None
+
+
+def test_numbers_are_searched_unless_they_are_an_ipv4_address():
+    assert classify("3.14") == "search"
+    assert classify("1.2.3") == "search"
+    assert classify("256.1.1.1") == "search"
+    assert classify("192.168.1.10") == "host"
+    assert classify("10.0.0.1:8080/status") == "host"
+    assert classify("example.com") == "host"
+    assert classify("3.14 pi") == "search"
@@ -0,0 +1,133 @@
+import functools
+import http.server
+import os
+import threading
+
+import pytest
+
+pytest.importorskip("PyQt5.QtWebEngineWidgets", exc_type=ImportError)
+
+from PyQt5.QtCore import QEventLoop, QObject, QTimer, QUrl  # noqa: E402
+from PyQt5.QtGui import QColor, QImage  # noqa: E402
+from PyQt5.QtWebEngineCore import QWebEngineUrlRequestJob  # noqa: E402
+
+import retro  # noqa: E402
+from retro import RetroImages, retro_url  # noqa: E402
+
+
+class Job(QObject):
+    # Stands in for a QWebEngineUrlRequestJob, records how it was answered
+    def __init__(self, url):
+        super().__init__()
+        self.url = url
+        self.answer = None
+
+    def requestUrl(self):
+        return self.url
+
+    def initiator(self):
+        return QUrl("orbit://newtab")
+
+    def reply(self, mime_type, buffer):
+        self.answer = ("reply", bytes(buffer.data()))
+
+    def redirect(self, qurl):
+        self.answer = ("redirect", qurl.toString())
+
+    def fail(self, error):
+        self.answer = ("fail", error)
+
+
+class QuietHandler(http.server.SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server(tmp_path):
+    image = QImage(64, 64, QImage.Format_RGB32)
+    image.fill(QColor("orange"))
+    image.save(os.path.join(str(tmp_path), "image.png"))
+    handler = functools.partial(QuietHandler, directory=str(tmp_path))
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield "http://127.0.0.1:%d/" % server.server_address[1]
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def images(tmp_path):
+    images = RetroImages(os.path.join(str(tmp_path), "cache"))
+    yield images
+    images.stop()
+
+
+def wait_until(condition, timeout_ms=5000):
+    loop = QEventLoop()
+    timer = QTimer()
+    timer.timeout.connect(lambda: condition() and loop.quit())
+    timer.start(10)
+    QTimer.singleShot(timeout_ms, loop.quit)
+    loop.exec_()
+    timer.stop()
+    return condition()
+
+
+def test_image_is_transcoded(images, server):
+    job = Job(retro_url(QUrl(server + "image.png"), "pico8", images.secret))
+    images.handle(job)
+
+    assert wait_until(lambda: job.answer is not None)
+    assert job.answer[0] == "reply"
+    assert QImage.fromData(job.answer[1], "PNG").format() == QImage.Format_Indexed8
+
+
+def test_job_destroyed_while_transcoding(images, server):
+    # The fetched reply is deleted before the job goes away: cancelling must
+    # not touch it
+    job = Job(retro_url(QUrl(server + "image.png"), "pico8", images.secret))
+    destroyed = []
+    job.destroyed.connect(lambda: destroyed.append(True))
+    images.transcode_requested.connect(lambda *args: job.deleteLater())
+    images.handle(job)
+
+    assert wait_until(lambda: destroyed and images.stats["images"])
+    assert images.jobs == {}
+
+
+def test_unsigned_urls_are_denied(images, server):
+    # A page can't have orbit://retro fetch a URL of its choosing
+    url = retro_url(QUrl(server + "image.png"), "pico8", b"guessed")
+    job = Job(url)
+    images.handle(job)
+
+    assert job.answer == ("fail", QWebEngineUrlRequestJob.RequestDenied)
+    assert images.jobs == {}
+
+
+def test_cached_image_is_served_without_fetching(images, server):
+    url = retro_url(QUrl(server + "image.png"), "pico8", images.secret)
+    first = Job(url)
+    images.handle(first)
+    assert wait_until(lambda: first.answer is not None)
+
+    second = Job(url)
+    images.handle(second)
+    assert wait_until(lambda: second.answer is not None)
+    assert second.answer == first.answer
+    assert images.stats["cache_hits"] == 1
+
+
+def test_failed_images_are_remembered_up_to_a_limit(images, server, monkeypatch):
+    monkeypatch.setattr(retro, "MAX_FAILED", 2)
+    images.enabled = lambda site: True
+    for name in ("a", "b", "c"):
+        job = Job(retro_url(QUrl(server + name + ".png"), "pico8", images.secret))
+        images.handle(job)
+        assert wait_until(lambda: job.answer is not None)
+        assert job.answer[0] == "redirect"
+
+    assert list(images.failed) == [server + "b.png", server + "c.png"]
+    assert images.rewrite(QUrl(server + "c.png")) is None
+    assert images.rewrite(QUrl(server + "a.png")) is not None
@@ -0,0 +1,66 @@
+import pytest
+
+pytest.importorskip("PyQt5.QtWebEngineCore", exc_type=ImportError)
+
+from PyQt5.QtCore import QObject, QUrl  # noqa: E402
+from PyQt5.QtWebEngineCore import QWebEngineUrlRequestJob  # noqa: E402
+
+from schemes import OrbitSchemeHandler  # noqa: E402
+
+
+class Job(QObject):
+    # Stands in for a QWebEngineUrlRequestJob, records how it was answered
+    def __init__(self, url, initiator=""):
+        super().__init__()
+        self.url = QUrl(url)
+        self.origin = QUrl(initiator)
+        self.answer = None
+
+    def requestUrl(self):
+        return self.url
+
+    def initiator(self):
+        return self.origin
+
+    def reply(self, mime_type, buffer):
+        self.answer = ("reply", bytes(buffer.data()))
+
+    def fail(self, error):
+        self.answer = ("fail", error)
+
+
+@pytest.fixture
+def handler():
+    handler = OrbitSchemeHandler()
+    handler.add_host("newtab", lambda url: (b"text/html", b"bookmarks"))
+    handler.add_host("fonts", lambda url: (b"font/ttf", b"font"), public=True)
+    return handler
+
+
+def request(handler, url, initiator=""):
+    job = Job(url, initiator)
+    handler.requestStarted(job)
+    return job.answer
+
+
+def test_web_pages_are_denied_private_hosts(handler):
+    assert request(handler, "orbit://newtab", "https://example.com") == (
+        "fail",
+        QWebEngineUrlRequestJob.RequestDenied,
+    )
+    assert request(handler, "orbit://newtab", "null")[0] == "fail"
+
+
+def test_browser_and_orbit_pages_are_served(handler):
+    assert request(handler, "orbit://newtab") == ("reply", b"bookmarks")
+    assert request(handler, "orbit://newtab", "orbit://newtab") == (
+        "reply",
+        b"bookmarks",
+    )
+
+
+def test_public_hosts_are_served_to_web_pages(handler):
+    assert request(handler, "orbit://fonts/x.ttf", "https://example.com") == (
+        "reply",
+        b"font",
+    )
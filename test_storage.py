@@ -0,0 +1,70 @@
+import json
+import os
+
+import pytest
+
+pytest.importorskip("PyQt5.QtWebEngineWidgets", exc_type=ImportError)
+
+import storage  # noqa: E402
+
+
+def write(path, size, mtime):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as data:
+        data.write(b"x" * size)
+    os.utime(path, (mtime, mtime))
+
+
+def check(root, quota_mb, open_origins=()):
+    worker = storage.StorageWorker(str(root), "disk", quota_mb)
+    results = []
+    worker.usage_ready.connect(results.append)
+    worker.check(list(open_origins))
+    return results[0]
+
+
+def test_shared_data_over_quota_evicts_nothing(tmp_path):
+    write(str(tmp_path / "storage" / "Local Storage" / "leveldb" / "000003.log"),
+          3 * 1048576, 1000)
+    idb = tmp_path / "storage" / "IndexedDB" / "https_example.com_0.indexeddb.leveldb"
+    write(str(idb / "000001.ldb"), 1024, 2000)
+
+    usage = check(tmp_path, 1)
+
+    assert usage["pending"] == []
+    assert not os.path.exists(str(tmp_path / storage.PENDING_FILE))
+    assert storage.evict_pending(str(tmp_path)) == []
+    assert idb.exists()
+
+
+def test_least_recently_used_origins_are_evicted_at_next_start(tmp_path):
+    root = tmp_path / "storage" / "IndexedDB"
+    old = root / "https_old.example_0.indexeddb.leveldb"
+    open_tab = root / "https_open.example_0.indexeddb.leveldb"
+    new = root / "https_new.example_0.indexeddb.leveldb"
+    write(str(old / "000001.ldb"), 1048576, 1000)
+    write(str(open_tab / "000001.ldb"), 1048576, 500)
+    write(str(new / "000001.ldb"), 1048576, 3000)
+
+    usage = check(tmp_path, 2, ["https://open.example"])
+
+    assert usage["pending"] == ["https://old.example"]
+    # Nothing is removed while the browser runs
+    assert old.exists()
+    with open(str(tmp_path / storage.PENDING_FILE)) as pending:
+        assert list(json.load(pending)) == ["https://old.example"]
+
+    assert storage.evict_pending(str(tmp_path)) == ["https://old.example"]
+    assert not old.exists()
+    assert open_tab.exists() and new.exists()
+    assert not os.path.exists(str(tmp_path / storage.PENDING_FILE))
+
+
+def test_pick_evictions_skips_open_origins():
+    origins = {
+        "https://a": [10, 1, []],
+        "https://b": [10, 2, []],
+        "https://c": [10, 3, []],
+    }
+    assert storage.pick_evictions(origins, 20, {"https://a"}) == ["https://b"]
+    assert storage.pick_evictions(origins, 30) == []
@@ -0,0 +1,125 @@
+import pytest
+
+pytest.importorskip("PyQt5.QtWebEngineWidgets", exc_type=ImportError)
+
+from PyQt5.QtCore import QObject, QPoint, pyqtSignal  # noqa: E402
+from PyQt5.QtWebEngineWidgets import QWebEnginePage  # noqa: E402
+
+from tabs import TabLifecycleManager  # noqa: E402
+
+Active = QWebEnginePage.LifecycleState.Active
+Discarded = QWebEnginePage.LifecycleState.Discarded
+
+
+class Page:
+    # The parts of QWebEnginePage the lifecycle manager looks at
+    def __init__(self, audible=False):
+        self.state = Active
+        self.audible = audible
+
+    def lifecycleState(self):
+        return self.state
+
+    def setLifecycleState(self, state):
+        self.state = state
+
+    def devToolsPage(self):
+        return None
+
+    def inspectedPage(self):
+        return None
+
+    def recentlyAudible(self):
+        return self.audible
+
+    def scrollPosition(self):
+        return QPoint()
+
+    def renderProcessPid(self):
+        return 0
+
+
+class View(QObject):
+    loadFinished = pyqtSignal(bool)
+
+    def __init__(self, audible=False):
+        super().__init__()
+        self.web_page = Page(audible)
+
+    def page(self):
+        return self.web_page
+
+    def isVisible(self):
+        return False
+
+
+class Tabs(QObject):
+    currentChanged = pyqtSignal(int)
+
+    def __init__(self, views):
+        super().__init__()
+        self.views = views
+        self.current = 0
+
+    def widget(self, index):
+        return self.views[index]
+
+    def currentWidget(self):
+        return self.views[self.current]
+
+    def select(self, index):
+        self.current = index
+        self.currentChanged.emit(index)
+
+
+@pytest.fixture
+def tabs():
+    # Tab 2 plays audio; tabs were last used in the order 1, 2, 3, 0
+    views = [View(), View(), View(audible=True), View()]
+    tabs = Tabs(views)
+    manager = TabLifecycleManager(tabs, memory_budget_mb=0)
+    manager.timer.stop()
+    for view in views:
+        manager.track(view)
+    for index in (1, 2, 3, 0):
+        tabs.select(index)
+    manager.last_active.update(
+        {views[1]: -40.0, views[2]: -30.0, views[3]: -20.0, views[0]: -10.0}
+    )
+    return tabs, manager
+
+
+def test_least_recently_used_tab_is_discarded_first(tabs):
+    tabs, manager = tabs
+    views = tabs.views
+
+    assert manager.discard_oldest() is views[1]
+    assert views[1].page().lifecycleState() == Discarded
+    # The audible tab is skipped
+    assert manager.discard_oldest() is views[3]
+
+
+def test_active_and_audible_tabs_are_never_discarded(tabs):
+    tabs, manager = tabs
+    views = tabs.views
+
+    discarded = []
+    while True:
+        view = manager.discard_oldest()
+        if view is None:
+            break
+        discarded.append(view)
+
+    assert discarded == [views[1], views[3]]
+    assert views[0].page().lifecycleState() == Active
+    assert views[2].page().lifecycleState() == Active
+
+
+def test_switching_to_a_discarded_tab_reactivates_it(tabs):
+    tabs, manager = tabs
+    views = tabs.views
+    manager.discard_oldest()
+    tabs.select(1)
+
+    assert views[1].page().lifecycleState() == Active
+    assert manager.discard_oldest() is views[3]
@@ -0,0 +1,134 @@
+import json
+
+from PyQt5.QtWebEngineWidgets import QWebEngineScript
+
+from assets import cache as asset_cache
+
+STYLE_ID = "orbit-8bit-style"
+
+FONT_ASSET = "fonts/PressStart2P.ttf"
+# Served from the asset bundle by serve_font, so pages get the font without
+# a network fetch or a system-wide install
+FONT_URL = "orbit://" + FONT_ASSET
+
+# An installed copy of the font is used as it is, without the fetch
+FONT_FACE_CSS = """
+@font-face {
+    font-family: "Press Start 2P";
+    src: local("Press Start 2P"), local("PressStart2P-Regular"),
+        url("%s") format("truetype");
+    font-display: block;
+}
+""" % FONT_URL
+
+RETRO_CSS = FONT_FACE_CSS + """
+* {
+    font-family: "Press Start 2P", cursive !important;
+}
+"""
+
+
+def serve_font(url):
+    # orbit://fonts/<file>, the same bytes the UI registered
+    name = "fonts" + url.path()
+    if name != FONT_ASSET:
+        return None
+    data = asset_cache.data(name)
+    return (b"font/ttf", data) if data is not None else None
+
+
+# Adds the stylesheet once per document. At document creation there is no
+# <html> element yet, so wait for it instead of relying on document.head.
+APPLY_JS = """
+(function() {
+    // Per-site rules by host suffix, the most specific one wins
+    var rules = %(rules)s;
+    var labels = location.hostname.split(".");
+    for (var i = 0; i < labels.length; i++) {
+        var suffix = labels.slice(i).join(".");
+        if (rules.hasOwnProperty(suffix)) {
+            if (!rules[suffix]) {
+                return;
+            }
+            break;
+        }
+    }
+    function apply() {
+        if (document.getElementById(%(style_id)s)) {
+            return true;
+        }
+        var root = document.documentElement;
+        if (!root) {
+            return false;
+        }
+        var style = document.createElement("style");
+        style.id = %(style_id)s;
+        style.textContent = %(css)s;
+        root.appendChild(style);
+        return true;
+    }
+    if (!apply()) {
+        var observer = new MutationObserver(function() {
+            if (apply()) {
+                observer.disconnect();
+            }
+        });
+        observer.observe(document, {childList: true});
+    }
+})();
+"""
+
+REMOVE_JS = """
+(function() {
+    var style = document.getElementById(%(style_id)s);
+    if (style) {
+        style.remove();
+    }
+})();
+"""
+
+
+class RetroTheme:
+    # Registers the 8-bit stylesheet as a profile script that runs at
+    # document creation in every frame, instead of patching pages after load
+    def __init__(self, profile, rules=None):
+        self.profile = profile
+        # host suffix -> styled, see sitesettings.py
+        self.rules = dict(rules or {})
+        self.install()
+
+    def source(self, template):
+        return template % {
+            "rules": json.dumps(self.rules, sort_keys=True),
+            "style_id": json.dumps(STYLE_ID),
+            "css": json.dumps(RETRO_CSS),
+        }
+
+    def install(self):
+        self.uninstall()
+        script = QWebEngineScript()
+        script.setName(STYLE_ID)
+        script.setInjectionPoint(QWebEngineScript.DocumentCreation)
+        script.setRunsOnSubFrames(True)
+        # Page scripts can't see or undo what runs in the application world
+        script.setWorldId(QWebEngineScript.ApplicationWorld)
+        script.setSourceCode(self.source(APPLY_JS))
+        self.profile.scripts().insert(script)
+
+    def uninstall(self):
+        scripts = self.profile.scripts()
+        for script in scripts.findScripts(STYLE_ID):
+            scripts.remove(script)
+
+    def apply(self, page):
+        # Style an already loaded page right away (safe to repeat)
+        page.runJavaScript(self.source(APPLY_JS), QWebEngineScript.ApplicationWorld)
+
+    def remove(self, page):
+        page.runJavaScript(self.source(REMOVE_JS), QWebEngineScript.ApplicationWorld)
+
+    def set_rules(self, rules):
+        # The new script covers future documents, open pages are patched
+        # with apply and remove
+        self.rules = dict(rules)
+        self.install()